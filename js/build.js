@@ -605,8 +605,9 @@ function handleImportFile(event) {
             
             if (success) {
                 // Refresh the UI to show the imported build
-                refreshUIAfterImport();
-                alert('Build imported successfully!');
+                refreshUIAfterImport().then(() => {
+                    alert('Build imported successfully!');
+                });
             } else {
                 alert('Failed to import build. Please check the file format.');
             }
@@ -630,8 +631,9 @@ function handleImportFile(event) {
 /**
  * Refresh the UI after importing a build
  * This updates all the dropdowns, power lists, and other UI elements
+ * @returns {Promise} Resolves once the archetype's data is loaded and the UI is updated
  */
-function refreshUIAfterImport() {
+async function refreshUIAfterImport() {
     // Update build name
     const buildNameInput = document.getElementById('buildName');
     if (buildNameInput) {
@@ -642,8 +644,8 @@ function refreshUIAfterImport() {
     const archetypeSelect = document.getElementById('archetypeSelect');
     if (archetypeSelect && Build.archetype.id) {
         archetypeSelect.value = Build.archetype.id;
-        // This will trigger the change event which loads the powersets
-        onArchetypeChange();
+        // This loads the archetype's powersets and fills the powerset dropdowns
+        await onArchetypeChange();
     }
     
     // Update primary selection
@@ -51,6 +51,7 @@ function populateArchetypeDropdown() {
 
 /**
  * Handle archetype selection change
+ * @returns {Promise} Resolves once the archetype's powersets are loaded
  */
 function onArchetypeChange() {
     const archetypeSelect = document.getElementById('archetypeSelect');
@@ -61,7 +62,7 @@ function onArchetypeChange() {
         clearPowersetDropdowns();
         clearAvailablePowers();
         clearSelectedPowers();
-        return;
+        return Promise.resolve();
     }
     
     const archetype = ARCHETYPES[archetypeId];
@@ -74,9 +75,14 @@ function onArchetypeChange() {
         inherent: archetype.inherent
     };
     
-    // Populate primary/secondary dropdowns
-    populatePrimaryDropdown(archetype.primarySets);
-    populateSecondaryDropdown(archetype.secondarySets);
+    // Populate primary/secondary dropdowns once the archetype's data shard is in
+    setPowersetDropdownsLoading();
+    const loaded = loadArchetypeData(archetypeId).then(() => {
+        // Skip if another archetype was picked while this one loaded
+        if (archetypeSelect.value !== archetypeId) return;
+        populatePrimaryDropdown(archetype.primarySets);
+        populateSecondaryDropdown(archetype.secondarySets);
+    });
     
     // Initialize inherent powers
     Build.inherents = initializeInherentPowers(archetypeId);
@@ -96,6 +102,7 @@ function onArchetypeChange() {
     }
     
     console.log(`Selected archetype: ${archetype.name}`);
+    return loaded;
 }
 
 // ============================================
@@ -146,6 +153,20 @@ function populateSecondaryDropdown(powersetIds) {
     });
 }
 
+/**
+ * Disable powerset dropdowns while an archetype's data loads
+ */
+function setPowersetDropdownsLoading() {
+    const primarySelect = document.getElementById('primarySelect');
+    const secondarySelect = document.getElementById('secondarySelect');
+    
+    primarySelect.innerHTML = '<option value="">Loading...</option>';
+    primarySelect.disabled = true;
+    
+    secondarySelect.innerHTML = '<option value="">Loading...</option>';
+    secondarySelect.disabled = true;
+}
+
 /**
  * Clear powerset dropdowns
  */
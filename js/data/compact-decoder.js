@@ -0,0 +1,153 @@
+/**
+ * Compact Data Decoder
+ *
+ * Restores data files written in compact mode (tools/compact_data.py).
+ * A compact file holds interned string and list tables plus a map of which
+ * keys were interned; decoding puts the original values back so the result
+ * has the same shape as the pretty-printed output.
+ *
+ * Also restores per-level values written as Float32 columns
+ * (tools/level_columns.py): each array in effects.perLevel becomes a
+ * Float32Array view into one buffer decoded from base64.
+ *
+ * Also rebuilds powersets written as a shared base plus a per-archetype
+ * delta (tools/powerset_deltas.py).
+ */
+
+/**
+ * Decode a packed data object
+ * @param {Object} packed - {strings, lists, fields, data} as written by compact_data.py
+ * @returns {Object} The decoded data object
+ */
+function decodeCompactData(packed) {
+    const strings = packed.strings;
+    const lists = packed.lists.map(list => list.map(index => strings[index]));
+    const fields = packed.fields;
+
+    // Decode in place; the packed tables are dropped once this returns
+    function decode(value) {
+        if (Array.isArray(value)) {
+            for (let i = 0; i < value.length; i++) {
+                value[i] = decode(value[i]);
+            }
+        } else if (value !== null && typeof value === 'object') {
+            for (const key in value) {
+                const kind = fields[key];
+                if (kind === 's') {
+                    value[key] = strings[value[key]];
+                } else if (kind === 'l') {
+                    // Copy so powers never share one list
+                    value[key] = lists[value[key]].slice();
+                } else {
+                    value[key] = decode(value[key]);
+                }
+            }
+        }
+        return value;
+    }
+
+    return decode(packed.data);
+}
+
+/**
+ * Replace perLevel column indices with Float32Array views
+ * @param {Object} powerset - Powerset object whose powers carry column indices
+ * @param {string} columns - base64 of every column as little-endian float32
+ * @param {number} length - Values per column (one per level)
+ * @returns {Object} The powerset, updated in place
+ */
+function decodeLevelColumns(powerset, columns, length) {
+    const binary = atob(columns);
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i++) {
+        bytes[i] = binary.charCodeAt(i);
+    }
+    const values = new Float32Array(bytes.buffer);
+    const column = index => values.subarray(index * length, (index + 1) * length);
+
+    for (const power of powerset.powers) {
+        const perLevel = power.effects && power.effects.perLevel;
+        if (!perLevel) continue;
+        for (const key in perLevel) {
+            const value = perLevel[key];
+            if (typeof value === 'number') {
+                perLevel[key] = column(value);
+            } else {
+                for (const subKey in value) {
+                    value[subKey] = column(value[subKey]);
+                }
+            }
+        }
+    }
+    return powerset;
+}
+
+/**
+ * Rebuild an archetype's powerset from a shared base and its delta
+ * @param {Object} base - Shared base powerset (never modified)
+ * @param {Object} delta - Delta as written by powerset_deltas.py
+ * @returns {Object} A new powerset object
+ */
+function applyPowersetDelta(base, delta) {
+    // Copy value, multiplying non-integer numbers by ratio (if given)
+    function scale(value, ratio) {
+        if (Array.isArray(value)) {
+            return value.map(item => scale(item, ratio));
+        }
+        if (value !== null && typeof value === 'object') {
+            const copy = {};
+            for (const key in value) {
+                copy[key] = scale(value[key], ratio);
+            }
+            return copy;
+        }
+        if (ratio !== undefined && typeof value === 'number' && !Number.isInteger(value)) {
+            return value * ratio;
+        }
+        return value;
+    }
+
+    function apply(value, change) {
+        if (change === null || typeof change !== 'object') {
+            return change;
+        }
+        if ('$set' in change) {
+            return scale(change.$set);
+        }
+        if ('$edit' in change) {
+            const [prefix, text, suffix] = change.$edit;
+            return value.slice(0, prefix) + text + value.slice(value.length - suffix);
+        }
+        if ('$list' in change) {
+            return change.$list.map(item => typeof item === 'number' ? value[item] : item);
+        }
+        if ('$items' in change) {
+            return change.$items.map(item => {
+                if (typeof item === 'number') return scale(value[item]);
+                if (Array.isArray(item)) return apply(value[item[0]], item[1]);
+                return scale(item);
+            });
+        }
+
+        const source = scale(value, change.$scale);
+        const removed = new Set(change.$del || []);
+        const result = {};
+        for (const key in source) {
+            if (removed.has(key)) continue;
+            result[key] = key in change ? apply(source[key], change[key]) : source[key];
+        }
+        for (const key in change) {
+            if (key[0] !== '$' && !(key in source)) {
+                result[key] = apply(undefined, change[key]);
+            }
+        }
+        return result;
+    }
+
+    return apply(base, delta);
+}
+
+// Make available globally
+window.decodeCompactData = decodeCompactData;
+window.decodeLevelColumns = decodeLevelColumns;
+window.applyPowersetDelta = applyPowersetDelta;
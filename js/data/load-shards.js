@@ -0,0 +1,73 @@
+/**
+ * Archetype Data Loader
+ *
+ * Loads an archetype's powersets and epic pools on demand from the
+ * per-archetype shards listed in DATA_SHARDS (js/data/shards/manifest.js,
+ * generated by tools/build_shards.py). Only the selected archetype's data
+ * is downloaded and parsed. Shared powerset bases the shard needs (its
+ * requires list) are loaded first and reused by later archetypes.
+ */
+
+// archetypeId -> Promise for shards that are loading or loaded
+const loadedShards = {};
+
+// Shard file -> Promise resolving to true once the script has run
+const loadedShardFiles = {};
+
+/**
+ * Load a shard script once
+ * @param {string} file - Shard path relative to the site root
+ * @returns {Promise<boolean>} Resolves to false if the script failed to load
+ */
+function loadShardFile(file) {
+    if (loadedShardFiles[file]) {
+        return loadedShardFiles[file];
+    }
+
+    loadedShardFiles[file] = new Promise(resolve => {
+        const script = document.createElement('script');
+        script.src = file;
+        script.onload = () => resolve(true);
+        script.onerror = () => {
+            console.warn(`Failed to load data shard: ${file}`);
+            // Allow a retry on the next selection
+            delete loadedShardFiles[file];
+            resolve(false);
+        };
+        document.head.appendChild(script);
+    });
+    return loadedShardFiles[file];
+}
+
+/**
+ * Load an archetype's powersets and epic pools
+ * @param {string} archetypeId - The archetype ID (e.g., 'blaster')
+ * @returns {Promise} Resolves once the shard's data is registered
+ */
+function loadArchetypeData(archetypeId) {
+    if (loadedShards[archetypeId]) {
+        return loadedShards[archetypeId];
+    }
+
+    const shard = typeof DATA_SHARDS !== 'undefined' ? DATA_SHARDS[archetypeId] : null;
+    if (!shard) {
+        console.warn(`No data shard for archetype: ${archetypeId}`);
+        return Promise.resolve();
+    }
+
+    // Bases must run before the deltas in the archetype's shard use them
+    loadedShards[archetypeId] = Promise.all((shard.requires || []).map(loadShardFile))
+        .then(bases => bases.every(Boolean) && loadShardFile(shard.file))
+        .then(loaded => {
+            if (loaded) {
+                console.log(`Loaded ${archetypeId} data: ${shard.powersets.length} powersets, ${shard.epics.length} epic pools`);
+            } else {
+                // Allow a retry on the next selection
+                delete loadedShards[archetypeId];
+            }
+        });
+    return loadedShards[archetypeId];
+}
+
+// Make available globally
+window.loadArchetypeData = loadArchetypeData;
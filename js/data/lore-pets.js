@@ -0,0 +1,12 @@
+/**
+ * City of Heroes: Homecoming - Lore Pets
+ * Lore pets, their powers and per-tier aggregate stats
+ *
+ * Auto-generated from game data
+ * Source: incarnate_raw_data/lore, incarnate_raw_data/lore_pet_*
+ */
+
+const LORE_PETS = decodeCompactData({"strings":["Venom Burst","AoE","Ranged_Slow","Ranged_Debuff_Def","Toxic Claws","Cone","Claw Pierce","SingleTarget","Bash","Pulverize","Mace Beam","Mind Link","Melee_Buff_ToHit","Melee_Buff_Def","Melee_Res_Dmg","Soothe","Ranged_Heal","Mental Blast","Frigid Slam","Frigid Beam","Ranged_Res_Dmg","Frigid Blast","Ranged_Debuff_ToHit","Frigid Enervation","Frigid Slash","Frigid Slice","Frigid Burst","Enervating Storm","Melee_Debuff_Dam","Empowering Burst","Telekinetic Blast","Psionic Tornado","Tenebrous Tentacles","Ranged_Immobilize","Ranged_PvPMez","Hurl","Punch","Haymaker","Cauterize","Forge","Ranged_Buff_ToHit","Ranged_Buff_Dmg","Spit Fire","Push Back","Slash","Melee_Debuff_Def","Slice","Hack","Pilum","Healing Aura","Heal Other","Particle Blast","Anti-Matter Ray","Anti-Matter Beam","Particle Blast Barrage","Particle Stunner","Nano Repair","Field Projector","Ranged_Buff_Def","Come Hither","Ranged_Taunt","Blackclaw","Hellish Bolts","Fire Ball","Fire Smash","Fire Sword","Fire Blast","Chill of the Night","Melee_DeBuff_ToHit","Twilight Grasp","Ranged_Debuff_Dam","Gloom","Plasma Cannon Blast","Plasma Cannon Spray","Plasma Cannon Burst","Lightning Bolt","Charged Bolts","Ball Lightning","Short Circuit","O2 Boost","Ranged_Res_Boolean","Hurricane","Lore Evasion","Lore Protection","Lore Power","Lore Data Strength","Fly","Melee_Control","Melee_SpeedFlying","Melee_Friction","Super Leap","Melee_Leap","Melee_SpeedJumping","Melee_SpeedRunning","Essence","Plasma Punch","Plasma Vortex","Plasma Blast","Plasma Burst","Shield Generator","Deploy Stimulant","Melee_Heal","Melee_Res_Boolean","Focused Shot","Dual Shot","Weakening Shot","Ranged_Stun","Paralytic Shot","Shockwave Slice","Wearying Strike","Wrathful Blade","Melee_HealSelf","Guardianship","Rallying Cry","Melee_Buff_Dmg","Concussive Blow","Melee_Knockback","Melee_PvPMez","Melee_Slow","Northern Light's Bolt","Northern Light's Blast","Northern Light's Scatter","Northern Light's Detonation","Glowing Touch","Assault","Grenade","Energy Barrage","Ranged_Knockback","Burst","Slug","M30 Grenade","Pummel","Storm Cannon","Flamethrower","Explode","Lance Rifle","Lance","Triage","Nemesis Rifle","Greater Ice Sword","Fire Sword Circle","Adrenalin Boost","Greater Rikti Sword","Mesmerize","Ranged_Sleep","Total Domination","Rikti Sword","Rikti Pistol","Radiation Emission","Accelerate Metabolism","Quill Blast","Chomp","Paralytic Gaze","Optic Blast","Scatter Shards","Sinew","Crystal of Vigor","Energy Blast","Levitate","Dominate","Dominate Mind","Soothe Mind","Fortitude","Season's End","Harvest Blades","Seasonal Shift","Autumnal Equinox","Snap Shot","Ice Arrow","Screech","Soothing Song","Regenerating Song","Exhausting Song","Mercurial Blow","Precise Strike","Serpent's Reach","Eye of the Storm","Melee_Debuff_Res_Dmg","Hand Clap","Melee_Stun","Shuriken","Teleport","Location","Petrifying Gaze","Life Drain","Ranged_HealSelf","Freezing Sphere","Ice Blast","Ranged_EndDrain","Bayonet","Willie Pete Round","Swipe","Cross Cut","Plasma Eye Beams","Plasma Full Auto","Plasma Rifle Burst"],"lists":[],"fields":{"name":"s","effectArea":"s","table":"s"},"data":{"pets":{"arachnos_boss":{"powers":[{"name":0,"cast":1.7,"recharge":6,"range":60,"radius":10,"maxTargets":16,"effectArea":1,"damage":{"Ranged_Damage":{"Energy":0.5,"Toxic":0.9}},"debuffs":{"current":{"RunningSpeed:Ranged_Slow":{"scale":0.2,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.2,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.2,"table":2},"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3}},"strength":{"RechargeTime:Ranged_Slow":{"scale":0.1,"table":2},"JumpHeight:Ranged_Slow":{"scale":0.2,"table":2}}}},{"name":4,"cast":0.83,"recharge":10,"range":10,"radius":10,"maxTargets":16,"effectArea":5,"damage":{"Melee_Damage":{"Lethal":0.4,"Toxic":0.54}}},{"name":6,"cast":0.67,"recharge":4,"range":5,"effectArea":7,"damage":{"Melee_Damage":{"Lethal":0.7,"Toxic":0.44}}}]},"arachnos_lt":{"powers":[{"name":8,"cast":1.33,"recharge":4,"range":7,"effectArea":7,"damage":{"Melee_Damage":{"Smashing":1,"Toxic":0.2}}},{"name":9,"cast":1.5,"recharge":8,"range":7,"effectArea":7,"damage":{"Melee_Damage":{"Smashing":1.64,"Toxic":0.4}}},{"name":10,"cast":1.67,"recharge":6,"range":70,"effectArea":7,"damage":{"Ranged_Damage":{"Energy":1.32}}}]},"arachnos_support":{"powers":[{"name":11,"cast":2.97,"recharge":300,"radius":35,"maxTargets":16,"effectArea":1,"buffs":{"current":{"ToHit:Melee_Buff_ToHit":{"scale":0.5,"table":12},"Base_Defense:Melee_Buff_Def":{"scale":1,"table":13}},"resistance":{"Psionic_Dmg:Melee_Res_Dmg":{"scale":3,"table":14}}}},{"name":15,"cast":2.27,"recharge":6,"range":80,"effectArea":7,"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}}}}]},"arachnos_support_attack":{"powers":[{"name":17,"cast":1.67,"recharge":6,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Psionic":1.32}},"debuffs":{"strength":{"RechargeTime:Ranged_Slow":{"scale":0.3,"table":2}}}}]},"banished_boss":{"powers":[{"name":18,"cast":4.83,"recharge":4,"range":5,"effectArea":7,"damage":{"Melee_Damage":{"Cold":0.5,"Negative":1.5}},"debuffs":{"resistance":{"Cold_Dmg:Melee_Res_Dmg":{"scale":-2.5,"table":14},"Negative_Energy_Dmg:Melee_Res_Dmg":{"scale":-2.5,"table":14}}}},{"name":19,"cast":4,"recharge":12,"range":35,"radius":40,"maxTargets":10,"effectArea":5,"damage":{"Ranged_Damage":{"Cold":1,"Negative":0.75}},"debuffs":{"current":{"Endurance":-0.025},"resistance":{"Smashing_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Lethal_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Fire_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Cold_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Energy_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Negative_Energy_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Psionic_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Toxic_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20}}}},{"name":21,"cast":1.67,"recharge":4,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Cold":0.55,"Negative":0.45}},"debuffs":{"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":1,"table":22},"JumpHeight":-5,"RunningSpeed:Ranged_Slow":{"scale":0.2,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.2,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.2,"table":2}},"strength":{"RechargeTime:Ranged_Slow":{"scale":0.2,"table":2}}}},{"name":23,"cast":2.33,"recharge":18,"range":80,"radius":20,"maxTargets":16,"effectArea":1,"damage":{"Ranged_Damage":{"Cold":1,"Negative":0.5}},"debuffs":{"strength":{"EnduranceDiscount":-0.15},"current":{"Regeneration":-0.2,"Recovery":-0.2}}}]},"banished_lt":{"powers":[{"name":24,"cast":0.67,"recharge":4,"range":5,"effectArea":7,"damage":{"Melee_Damage":{"Cold":0.8,"Negative":0.2}},"debuffs":{"resistance":{"Cold_Dmg:Melee_Res_Dmg":{"scale":-1,"table":14},"Negative_Energy_Dmg:Melee_Res_Dmg":{"scale":-1,"table":14}}}},{"name":25,"cast":1.5,"recharge":6,"range":5,"radius":10,"maxTargets":10,"effectArea":5,"damage":{"Melee_Damage":{"Cold":0.45,"Negative":0.25}},"debuffs":{"resistance":{"Cold_Dmg:Melee_Res_Dmg":{"scale":-1,"table":14},"Negative_Energy_Dmg:Melee_Res_Dmg":{"scale":-1,"table":14}}}},{"name":26,"cast":2,"recharge":12,"range":60,"radius":30,"maxTargets":16,"effectArea":1,"damage":{"Ranged_Damage":{"Cold":0.7,"Negative":0.4}},"debuffs":{"current":{"Endurance":-0.02,"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3},"Regeneration":-0.05,"Recovery":-0.05}}}]},"banished_storm":{"powers":[{"name":27,"radius":30,"maxTargets":16,"effectArea":1,"damage":{"Melee_Damage":{"Cold":0.1,"Negative":0.05}},"buffs":{"strength":{"Smashing_Dmg:Melee_Debuff_Dam":{"scale":1.2,"table":28},"Lethal_Dmg:Melee_Debuff_Dam":{"scale":1.2,"table":28},"Fire_Dmg:Melee_Debuff_Dam":{"scale":1.2,"table":28},"Cold_Dmg:Melee_Debuff_Dam":{"scale":1.2,"table":28},"Energy_Dmg:Melee_Debuff_Dam":{"scale":1.2,"table":28},"Negative_Energy_Dmg:Melee_Debuff_Dam":{"scale":1.2,"table":28},"Psionic_Dmg:Melee_Debuff_Dam":{"scale":1.2,"table":28},"Toxic_Dmg:Melee_Debuff_Dam":{"scale":1.2,"table":28}}}}]},"banished_support":{"powers":[{"name":27,"cast":2.03,"recharge":16,"range":100,"effectArea":7},{"name":29,"cast":2.33,"recharge":60,"range":60,"radius":30,"maxTargets":16,"effectArea":1,"buffs":{"current":{"Regeneration":1,"Recovery":1,"Endurance":0.05},"strength":{"RechargeTime":0.25}}}]},"banished_support_attack":{"powers":[{"name":21,"cast":1.67,"recharge":12,"range":40,"radius":50,"maxTargets":10,"effectArea":5,"damage":{"Ranged_Damage":{"Cold":1,"Negative":0.4}},"debuffs":{"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":1,"table":22}},"resistance":{"Cold_Dmg:Ranged_Res_Dmg":{"scale":-1.25,"table":20},"Negative_Energy_Dmg:Ranged_Res_Dmg":{"scale":-1.25,"table":20}}}}]},"carnival_boss":{"powers":[{"name":30,"cast":1,"recharge":3,"range":100,"effectArea":7,"damage":{"Ranged_Damage":{"Smashing":0.3,"Psionic":1.1}}},{"name":17,"cast":1.67,"recharge":8,"range":100,"effectArea":7,"damage":{"Ranged_Damage":{"Psionic":3}},"debuffs":{"strength":{"RechargeTime:Ranged_Slow":{"scale":0.3,"table":2}}}},{"name":31,"cast":2.37,"recharge":20,"range":100,"radius":20,"maxTargets":16,"effectArea":1,"damage":{"Ranged_Damage":{"Psionic":1.32}},"debuffs":{"strength":{"RechargeTime:Ranged_Slow":{"scale":0.3,"table":2}}}},{"name":32,"cast":1.67,"recharge":10,"range":40,"radius":40,"maxTargets":10,"effectArea":5,"damage":{"Ranged_Damage":{"Negative":0.835}},"debuffs":{"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":0.75,"table":22},"Immobilized:Ranged_Immobilize":{"scale":45,"table":33},"Immobilized:Ranged_PvPMez":{"scale":3,"table":34}}}}]},"carnival_lt":{"powers":[{"name":35,"cast":2.5,"recharge":7,"range":80,"effectArea":7,"damage":{"Melee_Damage":{"Smashing":1.64}},"debuffs":{"current":{"Fly":-1}}},{"name":36,"cast":1.2,"recharge":3,"range":5,"effectArea":7,"damage":{"Melee_Damage":{"Smashing":1.1}}},{"name":37,"cast":1.5,"recharge":7,"range":5,"effectArea":7,"damage":{"Melee_Damage":{"Smashing":1.64}}}]},"carnival_support":{"powers":[{"name":38,"cast":2.27,"recharge":6,"range":80,"effectArea":7,"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}}}},{"name":39,"cast":2.27,"recharge":60,"range":80,"effectArea":7,"buffs":{"current":{"ToHit:Ranged_Buff_ToHit":{"scale":2,"table":40}},"strength":{"Smashing_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Lethal_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Fire_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Cold_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Energy_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Negative_Energy_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Psionic_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Toxic_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41}}}}]},"carnival_support_attack":{"powers":[{"name":42,"cast":3,"recharge":6,"range":90,"effectArea":7,"damage":{"Ranged_Damage":{"Fire":1}}}]},"cimeroran_boss":{"powers":[{"name":43,"cast":1.33,"recharge":15,"range":8,"radius":8,"maxTargets":16,"effectArea":5,"damage":{"Melee_Damage":{"Smashing":1}},"debuffs":{"current":{"Knockback":1.34}}},{"name":44,"cast":1.33,"recharge":5,"range":5,"effectArea":7,"damage":{"Melee_Damage":{"Lethal":0.8}},"debuffs":{"current":{"Base_Defense:Melee_Debuff_Def":{"scale":1,"table":45}}}},{"name":46,"cast":2,"recharge":16,"range":5,"radius":5,"maxTargets":16,"effectArea":5,"damage":{"Melee_Damage":{"Lethal":1.23}},"debuffs":{"current":{"Base_Defense:Melee_Debuff_Def":{"scale":1,"table":45}}}},{"name":47,"cast":1.33,"recharge":8,"range":5,"effectArea":7,"damage":{"Melee_Damage":{"Lethal":1.3}},"debuffs":{"current":{"Base_Defense:Melee_Debuff_Def":{"scale":1,"table":45}}}},{"name":48,"cast":2.5,"recharge":16,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Lethal":1.2}}}]},"cimeroran_lt":{"powers":[{"name":44,"cast":1.33,"recharge":5,"range":5,"effectArea":7,"damage":{"Melee_Damage":{"Lethal":0.8}},"debuffs":{"current":{"Base_Defense:Melee_Debuff_Def":{"scale":1,"table":45}}}},{"name":46,"cast":2,"recharge":16,"range":5,"radius":5,"maxTargets":16,"effectArea":5,"damage":{"Melee_Damage":{"Lethal":1.23}},"debuffs":{"current":{"Base_Defense:Melee_Debuff_Def":{"scale":1,"table":45}}}},{"name":47,"cast":1.33,"recharge":8,"range":5,"effectArea":7,"damage":{"Melee_Damage":{"Lethal":1.3}},"debuffs":{"current":{"Base_Defense:Melee_Debuff_Def":{"scale":1,"table":45}}}},{"name":48,"cast":2.5,"recharge":16,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Lethal":1.2}}}]},"cimeroran_support":{"powers":[{"name":49,"cast":2.03,"recharge":16,"radius":25,"maxTargets":16,"effectArea":1,"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1,"table":16}}}},{"name":50,"cast":2.27,"recharge":6,"range":80,"effectArea":7,"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}}}}]},"clockwork_boss":{"powers":[{"name":51,"cast":1.2,"recharge":4,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Energy":2.24}}},{"name":52,"cast":3.93,"recharge":6,"range":40,"effectArea":7},{"name":53,"cast":4.2,"recharge":16,"range":80,"radius":80,"maxTargets":3,"effectArea":5,"damage":{"Ranged_Damage":{"Energy":2.6}},"debuffs":{"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":2,"table":3}}}}]},"clockwork_lt":{"powers":[{"name":51,"cast":1.2,"recharge":6,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Energy":1.92}}},{"name":54,"cast":1.93,"recharge":9,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Energy":2.24}}},{"name":55,"cast":1,"recharge":16,"range":60,"effectArea":7,"damage":{"Ranged_Damage":{"Energy":0.6}},"debuffs":{"current":{"Stunned":24,"Stunned:Ranged_PvPMez":{"scale":3,"table":34}}}}]},"clockwork_support":{"powers":[{"name":56,"cast":2.27,"recharge":10,"range":80,"effectArea":7,"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":2.67,"table":16}}}},{"name":57,"cast":2.07,"recharge":6,"range":30,"effectArea":7,"buffs":{"current":{"Smashing:Ranged_Buff_Def":{"scale":0.75,"table":58},"Fire:Ranged_Buff_Def":{"scale":0.75,"table":58},"Cold:Ranged_Buff_Def":{"scale":0.75,"table":58},"Energy:Ranged_Buff_Def":{"scale":0.75,"table":58},"Negative_Energy:Ranged_Buff_Def":{"scale":0.75,"table":58},"Lethal:Ranged_Buff_Def":{"scale":0.75,"table":58},"Ranged:Ranged_Buff_Def":{"scale":0.5,"table":58},"Melee:Ranged_Buff_Def":{"scale":0.5,"table":58},"Area:Ranged_Buff_Def":{"scale":0.5,"table":58}}}}]},"demons_boss":{"powers":[{"name":59,"cast":1.53,"recharge":30,"range":80,"effectArea":7,"debuffs":{"absolute":{"Placate:Ranged_Taunt":{"scale":80,"table":60}},"current":{"Confused:Ranged_PvPMez":{"scale":3,"table":34},"Confused":15}}},{"name":61,"cast":1.03,"recharge":6,"range":5,"effectArea":7,"damage":{"Melee_Damage":{"Lethal":0.66,"Negative":0.66}}},{"name":62,"cast":1,"recharge":12,"range":80,"radius":80,"maxTargets":16,"effectArea":5,"damage":{"Ranged_Damage":{"Negative":0.6}}},{"name":63,"cast":1,"recharge":16,"range":100,"radius":15,"maxTargets":16,"effectArea":1,"damage":{"Ranged_Damage":{"Smashing":0.2,"Fire":1}}}]},"demons_lt":{"powers":[{"name":64,"cast":1.2,"recharge":4,"range":6,"effectArea":7,"damage":{"Melee_Damage":{"Smashing":1,"Fire":0.2}}},{"name":65,"cast":1.67,"recharge":6,"range":5,"effectArea":7,"damage":{"Melee_Damage":{"Lethal":0.5,"Fire":1.12}}},{"name":66,"cast":1.2,"recharge":4,"range":90,"effectArea":7,"damage":{"Ranged_Damage":{"Fire":1.3}}}]},"demons_support":{"powers":[{"name":67,"cast":3.17,"recharge":10,"radius":15,"maxTargets":16,"effectArea":1,"buffs":{"current":{"ToHit:Melee_DeBuff_ToHit":{"scale":3,"table":68}}}},{"name":69,"cast":2.37,"recharge":12,"range":80,"effectArea":7,"debuffs":{"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":0.5,"table":22},"Regeneration":-0.5},"strength":{"Smashing_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Lethal_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Fire_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Cold_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Energy_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Negative_Energy_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Psionic_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Toxic_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70}}}}]},"demons_support_attack":{"powers":[{"name":71,"cast":1.1,"recharge":4,"range":100,"effectArea":7,"damage":{"Ranged_Damage":{"Negative":1.4}},"debuffs":{"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":0.75,"table":22}}}}]},"drones_boss":{"powers":[{"name":72,"cast":1.33,"recharge":3,"range":120,"effectArea":7,"damage":{"Ranged_Damage":{"Energy":1.5}},"debuffs":{"current":{"Regeneration":-0.5}}},{"name":73,"cast":3.5,"recharge":8,"range":60,"radius":60,"maxTargets":16,"effectArea":5,"damage":{"Ranged_Damage":{"Energy":1.07}},"debuffs":{"current":{"Regeneration":-0.5}}},{"name":74,"cast":1.33,"recharge":8,"range":120,"effectArea":7,"damage":{"Ranged_Damage":{"Energy":0.82}},"debuffs":{"current":{"Regeneration":-0.5}}}]},"drones_lt":{"powers":[{"name":72,"cast":1.33,"recharge":3,"range":120,"effectArea":7,"damage":{"Ranged_Damage":{"Energy":1.5}},"debuffs":{"current":{"Regeneration":-0.5}}},{"name":73,"cast":3.5,"recharge":8,"range":60,"radius":60,"maxTargets":16,"effectArea":5,"damage":{"Ranged_Damage":{"Energy":1.07}},"debuffs":{"current":{"Regeneration":-0.5}}}]},"elementals_boss":{"powers":[{"name":75,"cast":1.67,"recharge":4,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Energy":1.64}},"debuffs":{"current":{"Endurance":-0.1}}},{"name":76,"cast":1,"recharge":2,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Energy":1.2}},"debuffs":{"current":{"Endurance":-0.07}}},{"name":77,"cast":1.07,"recharge":10,"range":80,"radius":15,"maxTargets":16,"effectArea":1,"damage":{"Ranged_Damage":{"Energy":0.84}},"debuffs":{"current":{"Endurance":-0.07}}},{"name":78,"cast":3,"recharge":20,"radius":20,"maxTargets":16,"effectArea":1,"damage":{"Ranged_Damage":{"Energy":1.22}},"buffs":{"current":{"Endurance":-0.35,"Recovery":-0.25}}}]},"elementals_lt":{"powers":[{"name":75,"cast":1.67,"recharge":8,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Energy":1.64}},"debuffs":{"current":{"Endurance":-0.1}}},{"name":76,"cast":1,"recharge":4,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Energy":1}},"debuffs":{"current":{"Endurance":-0.07}}},{"name":77,"cast":1.07,"recharge":10,"range":80,"radius":15,"maxTargets":16,"effectArea":1,"damage":{"Ranged_Damage":{"Energy":0.84}},"debuffs":{"current":{"Endurance":-0.07}}}]},"elementals_support":{"powers":[{"name":79,"cast":2.27,"recharge":4,"range":80,"effectArea":7,"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.32,"table":16}},"resistance":{"Endurance:Ranged_Res_Boolean":{"scale":2,"table":80},"Recovery:Ranged_Res_Boolean":{"scale":2,"table":80},"Sleep:Ranged_Res_Boolean":{"scale":6,"table":80},"PerceptionRadius:Ranged_Res_Boolean":{"scale":2.5,"table":80},"Stunned:Ranged_Res_Boolean":{"scale":2,"table":80}},"current":{"PerceptionRadius:Ranged_Res_Boolean":{"scale":2.5,"table":80},"Stunned:Ranged_Res_Boolean":{"scale":-20,"table":80},"Sleep:Ranged_Res_Boolean":{"scale":-20,"table":80}}}},{"name":81,"recharge":10,"radius":25,"maxTargets":16,"effectArea":1,"buffs":{"strength":{"Range":-0.6},"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":3,"table":22}}}}]},"generic":{"powers":[{"name":82,"effectArea":7,"buffs":{"current":{"Area":0.5},"resistance":{"Smashing_Dmg":0.25,"Lethal_Dmg":0.25,"Fire_Dmg":0.25,"Cold_Dmg":0.25,"Energy_Dmg":0.25,"Negative_Energy_Dmg":0.25,"Psionic_Dmg":0.25,"Toxic_Dmg":0.25}}},{"name":83,"effectArea":7,"buffs":{"current":{"Untouchable":10,"ThreatLevel":-100}}},{"name":84,"effectArea":7,"buffs":{"strength":{"Smashing_Dmg":0.25,"Lethal_Dmg":0.25,"Fire_Dmg":0.25,"Cold_Dmg":0.25,"Energy_Dmg":0.25,"Negative_Energy_Dmg":0.25,"Psionic_Dmg":0.25,"Toxic_Dmg":0.25}}},{"name":85,"effectArea":7,"buffs":{"strength":{"Smashing_Dmg":-0.5,"Lethal_Dmg":-0.5,"Fire_Dmg":-0.5,"Cold_Dmg":-0.5,"Energy_Dmg":-0.5,"Negative_Energy_Dmg":-0.5,"Psionic_Dmg":-0.5,"Toxic_Dmg":-0.5}}},{"name":86,"effectArea":7,"buffs":{"current":{"Fly":1,"MovementControl:Melee_Control":{"scale":2,"table":87},"FlyingSpeed:Melee_SpeedFlying":{"scale":1,"table":88},"MovementFriction:Melee_Friction":{"scale":2,"table":89}}}},{"name":90,"effectArea":7,"buffs":{"current":{"JumpHeight:Melee_Leap":{"scale":1,"table":91},"JumpingSpeed:Melee_SpeedJumping":{"scale":1,"table":92},"RunningSpeed:Melee_SpeedRunning":{"scale":0.1,"table":93},"MovementControl:Melee_Control":{"scale":10,"table":87},"MovementFriction:Melee_Friction":{"scale":10,"table":89}}}},{"name":94,"effectArea":7}]},"idf_boss":{"powers":[{"name":95,"cast":0.57,"recharge":4,"range":5,"effectArea":7,"damage":{"Melee_Damage":{"Smashing":0.4,"Energy":0.8}}},{"name":96,"cast":2.5,"recharge":9,"radius":8,"maxTargets":16,"effectArea":1,"damage":{"Melee_Damage":{"Smashing":0.4,"Energy":0.8}}},{"name":97,"cast":2.07,"recharge":4,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Energy":1.4}}}]},"idf_lt":{"powers":[{"name":97,"cast":2.07,"recharge":3,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Energy":1.4}}},{"name":98,"cast":1.67,"recharge":6,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Energy":1.64}}}]},"idf_support":{"powers":[{"name":99,"cast":2.03,"recharge":20,"radius":25,"maxTargets":16,"effectArea":1,"buffs":{"current":{"Ranged:Ranged_Buff_Def":{"scale":0.5,"table":58},"Melee:Ranged_Buff_Def":{"scale":0.5,"table":58},"Area:Ranged_Buff_Def":{"scale":0.5,"table":58},"Smashing:Ranged_Buff_Def":{"scale":0.5,"table":58},"Fire:Ranged_Buff_Def":{"scale":0.5,"table":58},"Cold:Ranged_Buff_Def":{"scale":0.5,"table":58},"Energy:Ranged_Buff_Def":{"scale":0.5,"table":58},"Negative_Energy:Ranged_Buff_Def":{"scale":0.5,"table":58},"Psionic:Ranged_Buff_Def":{"scale":0.5,"table":58},"Lethal:Ranged_Buff_Def":{"scale":0.5,"table":58},"Immobilized:Ranged_Res_Boolean":{"scale":-3,"table":80},"Stunned:Ranged_Res_Boolean":{"scale":-3,"table":80}}}},{"name":100,"cast":2.93,"recharge":8,"range":15,"effectArea":7,"buffs":{"absolute":{"Heal_Dmg:Melee_Heal":{"scale":1.96,"table":101}},"current":{"Held":-10,"Immobilized":-10,"Stunned":-10,"Sleep":-10,"Confused":-5,"Afraid":-5,"Terrorized":-5},"resistance":{"Held:Melee_Res_Boolean":{"scale":-1,"table":102},"Immobilized:Melee_Res_Boolean":{"scale":-1,"table":102},"Stunned:Melee_Res_Boolean":{"scale":-1,"table":102},"Sleep:Melee_Res_Boolean":{"scale":-1,"table":102},"Confused:Melee_Res_Boolean":{"scale":-0.5,"table":102},"Afraid:Melee_Res_Boolean":{"scale":-0.5,"table":102},"Terrorized:Melee_Res_Boolean":{"scale":-0.5,"table":102}}}}]},"knives_boss":{"powers":[{"name":103,"cast":1,"recharge":4,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Lethal":1,"Toxic":0.4}}},{"name":104,"cast":1.67,"recharge":6,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Lethal":1.2,"Toxic":0.5}},"debuffs":{"strength":{"Smashing_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Lethal_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Fire_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Cold_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Energy_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Negative_Energy_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Psionic_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Toxic_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70}}}},{"name":105,"cast":1.67,"recharge":30,"range":70,"effectArea":7,"damage":{"Ranged_Damage":{"Toxic":1.3}},"debuffs":{"strength":{"Smashing_Dmg:Ranged_Debuff_Dam":{"scale":3,"table":70},"Lethal_Dmg:Ranged_Debuff_Dam":{"scale":3,"table":70},"Fire_Dmg:Ranged_Debuff_Dam":{"scale":3,"table":70},"Cold_Dmg:Ranged_Debuff_Dam":{"scale":3,"table":70},"Energy_Dmg:Ranged_Debuff_Dam":{"scale":3,"table":70},"Negative_Energy_Dmg:Ranged_Debuff_Dam":{"scale":3,"table":70},"Psionic_Dmg:Ranged_Debuff_Dam":{"scale":3,"table":70},"Toxic_Dmg:Ranged_Debuff_Dam":{"scale":3,"table":70},"Ranged:Ranged_Stun":{"scale":-0.5,"table":106},"Melee:Ranged_Stun":{"scale":-0.5,"table":106},"Area:Ranged_Stun":{"scale":-0.5,"table":106},"Smashing:Ranged_Stun":{"scale":-0.5,"table":106},"Lethal:Ranged_Stun":{"scale":-0.5,"table":106},"Fire:Ranged_Stun":{"scale":-0.5,"table":106},"Cold:Ranged_Stun":{"scale":-0.5,"table":106},"Energy:Ranged_Stun":{"scale":-0.5,"table":106},"Negative_Energy:Ranged_Stun":{"scale":-0.5,"table":106},"Psionic:Ranged_Stun":{"scale":-0.5,"table":106},"Toxic:Ranged_Stun":{"scale":-0.5,"table":106},"Base_Defense:Ranged_Stun":{"scale":-0.5,"table":106},"Endurance:Ranged_Stun":{"scale":-0.5,"table":106},"ToHit:Ranged_Stun":{"scale":-0.5,"table":106},"RunningSpeed:Ranged_Stun":{"scale":-0.5,"table":106},"FlyingSpeed:Ranged_Stun":{"scale":-0.5,"table":106},"Confused:Ranged_Stun":{"scale":-0.5,"table":106},"Terrorized:Ranged_Stun":{"scale":-0.5,"table":106},"Held:Ranged_Stun":{"scale":-0.5,"table":106},"Immobilized:Ranged_Stun":{"scale":-0.5,"table":106},"Stunned:Ranged_Stun":{"scale":-0.5,"table":106},"Sleep:Ranged_Stun":{"scale":-0.5,"table":106},"Knockup:Ranged_Stun":{"scale":-0.5,"table":106},"Knockback:Ranged_Stun":{"scale":-0.5,"table":106},"Repel:Ranged_Stun":{"scale":-0.5,"table":106},"Heal_Dmg:Ranged_Stun":{"scale":-0.5,"table":106}},"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":1.5,"table":22},"Stunned:Ranged_PvPMez":{"scale":4,"table":34},"Stunned":16}}},{"name":107,"cast":1.67,"recharge":10,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Toxic":1.96}},"debuffs":{"current":{"Regeneration":-0.15,"Recovery":-0.15,"Held:Ranged_PvPMez":{"scale":4,"table":34},"Held:Ranged_Immobilize":{"scale":32,"table":33}}}}]},"knives_lt":{"powers":[{"name":108,"cast":2.33,"recharge":10,"range":30,"radius":30,"maxTargets":16,"effectArea":5,"damage":{"Ranged_Damage":{"Lethal":1.15}},"debuffs":{"current":{"Recovery":-0.05,"RunningSpeed:Ranged_Slow":{"scale":0.15,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.15,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.15,"table":2},"JumpHeight:Ranged_Slow":{"scale":0.15,"table":2}},"strength":{"RechargeTime:Ranged_Slow":{"scale":0.15,"table":2}}}},{"name":109,"cast":2.43,"recharge":8,"range":6,"effectArea":7,"damage":{"Melee_Damage":{"Lethal":1.025}},"debuffs":{"current":{"Regeneration":-0.1,"Recovery":-0.1}}},{"name":110,"cast":1.2,"recharge":4,"range":10,"effectArea":7,"damage":{"Melee_Damage":{"Lethal":0.9}},"buffs":{"absolute":{"Heal_Dmg:Melee_HealSelf":{"scale":1,"table":111}}},"debuffs":{"resistance":{"Heal_Dmg":0.5},"current":{"Regeneration":-0.15,"Recovery":-0.15}}}]},"knives_support":{"powers":[{"name":112,"cast":2.27,"recharge":260,"range":80,"effectArea":7,"buffs":{"current":{"Recovery":4,"Regeneration":2.5},"strength":{"Smashing_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Lethal_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Fire_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Cold_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Energy_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Negative_Energy_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Psionic_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Toxic_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41}}}},{"name":113,"cast":1.17,"recharge":90,"range":5,"radius":40,"maxTargets":16,"effectArea":1,"buffs":{"current":{"ToHit:Melee_Buff_ToHit":{"scale":2,"table":12},"Placate":-8,"Confused":-8,"Afraid":-8,"Terrorized":-8,"Held":-8,"Immobilized":-8,"Stunned":-8,"Sleep":-8,"Knockup":-8,"Knockback":-8,"Repel":-8},"strength":{"Smashing_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Lethal_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Fire_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Cold_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Energy_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Negative_Energy_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Psionic_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Toxic_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114}},"resistance":{"Teleport":1,"RunningSpeed":1,"JumpingSpeed":1,"JumpHeight":1,"Placate":1,"Confused":1,"Afraid":1,"Terrorized":1,"Held":1,"Immobilized":1,"Stunned":1,"Sleep":1,"Knockup":1,"Knockback":1,"Repel":1,"RechargeTime":1}}}]},"knives_support_attack":{"powers":[{"name":115,"cast":2.1,"recharge":20,"radius":20,"maxTargets":16,"effectArea":1,"damage":{"Melee_Damage":{"Smashing":0.65}},"buffs":{"current":{"Knockback:Melee_Knockback":{"scale":4,"table":116},"ToHit:Melee_DeBuff_ToHit":{"scale":0.5,"table":68},"Stunned:Melee_PvPMez":{"scale":4,"table":117},"Stunned":16},"strength":{"RechargeTime:Melee_Slow":{"scale":0.15,"table":118},"Smashing_Dmg:Melee_Debuff_Dam":{"scale":2,"table":28},"Lethal_Dmg:Melee_Debuff_Dam":{"scale":2,"table":28},"Fire_Dmg:Melee_Debuff_Dam":{"scale":2,"table":28},"Cold_Dmg:Melee_Debuff_Dam":{"scale":2,"table":28},"Energy_Dmg:Melee_Debuff_Dam":{"scale":2,"table":28},"Negative_Energy_Dmg:Melee_Debuff_Dam":{"scale":2,"table":28},"Psionic_Dmg:Melee_Debuff_Dam":{"scale":2,"table":28},"Toxic_Dmg:Melee_Debuff_Dam":{"scale":2,"table":28}}}}]},"lights_boss":{"powers":[{"name":119,"cast":1.5,"recharge":3,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Energy":1.3}},"debuffs":{"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3}}}},{"name":120,"cast":1.5,"recharge":5,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Energy":1.64}},"debuffs":{"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":2,"table":3}}}},{"name":121,"cast":1.5,"recharge":8,"range":60,"radius":60,"maxTargets":10,"effectArea":5,"damage":{"Ranged_Damage":{"Energy":1}},"debuffs":{"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3}}}},{"name":122,"cast":2.5,"recharge":16,"range":80,"radius":15,"maxTargets":16,"effectArea":1,"damage":{"Ranged_Damage":{"Energy":0.6,"Smashing":0.3}},"debuffs":{"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3}}}}]},"lights_lt":{"powers":[{"name":119,"cast":1.5,"recharge":3,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Energy":1.3}},"debuffs":{"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3}}}},{"name":121,"cast":1.5,"recharge":8,"range":60,"radius":60,"maxTargets":10,"effectArea":5,"damage":{"Ranged_Damage":{"Energy":1}},"debuffs":{"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3}}}}]},"lights_support":{"powers":[{"name":123,"cast":2.27,"recharge":6,"range":80,"effectArea":7,"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}}}},{"name":124,"cast":3.67,"recharge":15,"radius":60,"maxTargets":255,"effectArea":1,"buffs":{"strength":{"Smashing_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Lethal_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Fire_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Cold_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Energy_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Negative_Energy_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Psionic_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Toxic_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41}},"resistance":{"Taunt:Ranged_Res_Boolean":{"scale":1.75,"table":80},"Placate:Ranged_Res_Boolean":{"scale":1.75,"table":80}}}}]},"longbow_boss":{"powers":[{"name":125,"cast":2.67,"recharge":3,"range":70,"radius":10,"maxTargets":16,"effectArea":1,"damage":{"Ranged_Damage":{"Smashing":0.4,"Lethal":0.8}}},{"name":97,"cast":4,"recharge":10,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Energy":3.8}}},{"name":126,"cast":4,"recharge":12,"range":30,"radius":30,"maxTargets":8,"effectArea":5,"damage":{"Ranged_Damage":{"Smashing":1.8,"Energy":1.4}},"debuffs":{"current":{"Knockback:Ranged_Knockback":{"scale":6,"table":127}}}}]},"longbow_lt":{"powers":[{"name":128,"cast":1,"recharge":3,"range":85,"effectArea":7,"damage":{"Ranged_Damage":{"Lethal":0.99}},"debuffs":{"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3}}}},{"name":129,"cast":1.87,"recharge":8,"range":180,"effectArea":7,"damage":{"Ranged_Damage":{"Lethal":1.64}}},{"name":130,"cast":1.87,"recharge":16,"range":80,"radius":15,"maxTargets":16,"effectArea":1,"damage":{"Ranged_Damage":{"Smashing":0.3,"Lethal":0.6}}}]},"longbow_support":{"powers":[{"name":50,"cast":2.27,"recharge":6,"range":80,"effectArea":7,"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}}}},{"name":49,"cast":2.03,"recharge":16,"radius":25,"maxTargets":16,"effectArea":1,"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1,"table":16}}}}]},"nemesis_boss":{"powers":[{"name":131,"cast":0.67,"recharge":3,"range":7,"radius":7,"maxTargets":16,"effectArea":5,"damage":{"Melee_Damage":{"Lethal":1.32}}},{"name":132,"cast":2,"recharge":4,"range":80,"radius":15,"maxTargets":16,"effectArea":1,"damage":{"Ranged_Damage":{"Lethal":0.32,"Fire":1}}},{"name":133,"cast":2,"recharge":6,"range":40,"radius":40,"maxTargets":16,"effectArea":5,"damage":{"Ranged_Damage":{"Fire":1.435}}},{"name":134,"recharge":1000,"radius":25,"maxTargets":16,"effectArea":1,"damage":{"Melee_Damage":{"Lethal":0.75,"Fire":0.75}}}]},"nemesis_lt":{"powers":[{"name":135,"cast":2.17,"recharge":4,"range":150,"radius":15,"maxTargets":16,"effectArea":1,"damage":{"Ranged_Damage":{"Lethal":0.32,"Fire":1}}},{"name":136,"cast":1.67,"recharge":4,"range":7,"radius":10,"maxTargets":16,"effectArea":1,"damage":{"Melee_Damage":{"Lethal":1,"Fire":0.32}}}]},"nemesis_support":{"powers":[{"name":137,"cast":1.37,"recharge":10,"range":10,"effectArea":7,"buffs":{"absolute":{"Heal_Dmg:Melee_Heal":{"scale":1.96,"table":101}},"current":{"Confused:Melee_Res_Boolean":{"scale":-30,"table":102},"Terrorized:Melee_Res_Boolean":{"scale":-30,"table":102},"Held:Melee_Res_Boolean":{"scale":-30,"table":102},"Immobilized:Melee_Res_Boolean":{"scale":-30,"table":102},"Stunned:Melee_Res_Boolean":{"scale":-30,"table":102},"Sleep:Melee_Res_Boolean":{"scale":-30,"table":102}},"resistance":{"Confused:Melee_Res_Boolean":{"scale":3,"table":102},"Terrorized:Melee_Res_Boolean":{"scale":3,"table":102},"Held:Melee_Res_Boolean":{"scale":3,"table":102},"Immobilized:Melee_Res_Boolean":{"scale":3,"table":102},"Stunned:Melee_Res_Boolean":{"scale":3,"table":102},"Sleep:Melee_Res_Boolean":{"scale":3,"table":102}}}},{"name":49,"cast":2.03,"recharge":8,"radius":25,"maxTargets":16,"effectArea":1,"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1,"table":16}}}}]},"nemesis_support_attack":{"powers":[{"name":138,"cast":2.17,"recharge":2,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Lethal":1}}}]},"phantoms_boss":{"powers":[{"name":139,"cast":2.33,"recharge":10,"range":5,"effectArea":7,"damage":{"Melee_Damage":{"Lethal":0.96,"Cold":1}},"debuffs":{"strength":{"JumpHeight:Melee_Slow":{"scale":0.2,"table":118},"RechargeTime:Melee_Slow":{"scale":0.2,"table":118}},"current":{"RunningSpeed:Melee_Slow":{"scale":0.2,"table":118},"FlyingSpeed:Melee_Slow":{"scale":0.2,"table":118},"JumpingSpeed:Melee_Slow":{"scale":0.2,"table":118}}}},{"name":66,"cast":1.67,"recharge":5,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Fire":1.45}}},{"name":140,"cast":2.67,"recharge":20,"radius":10,"maxTargets":10,"effectArea":1,"damage":{"Melee_Damage":{"Lethal":0.775,"Fire":0.975}}}]},"phantoms_lt":{"powers":[{"name":66,"cast":1.67,"recharge":5,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Fire":1.45}}},{"name":65,"cast":1.33,"recharge":6,"range":7,"effectArea":7,"damage":{"Melee_Damage":{"Lethal":0.5,"Fire":1.12}}}]},"phantoms_support":{"powers":[{"name":50,"cast":2.27,"recharge":6,"range":80,"effectArea":7,"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}}}},{"name":141,"cast":2.27,"recharge":260,"range":80,"effectArea":7,"buffs":{"current":{"Recovery":4,"Regeneration":2.5},"strength":{"RechargeTime":0.5},"resistance":{"RunningSpeed":0.4,"FlyingSpeed":0.4,"JumpingSpeed":0.4,"JumpHeight":0.4,"RechargeTime":0.4}}}]},"rikti_boss":{"powers":[{"name":142,"cast":2.5,"recharge":8,"range":5,"effectArea":7,"damage":{"Melee_Damage":{"Lethal":1,"Energy":0.64}}},{"name":17,"cast":1.67,"recharge":4,"range":150,"effectArea":7,"damage":{"Ranged_Damage":{"Psionic":1.7}},"debuffs":{"strength":{"RechargeTime:Ranged_Slow":{"scale":0.15,"table":2}}}},{"name":143,"cast":1.67,"recharge":5,"range":100,"effectArea":7,"damage":{"Ranged_Damage":{"Psionic":1}},"debuffs":{"current":{"Sleep:Ranged_Sleep":{"scale":42,"table":144},"Sleep:Ranged_PvPMez":{"scale":3,"table":34}}}},{"name":145,"cast":2.03,"recharge":120,"range":80,"radius":25,"maxTargets":16,"effectArea":1,"debuffs":{"current":{"Held:Ranged_Immobilize":{"scale":36,"table":33},"Held:Ranged_PvPMez":{"scale":3,"table":34}}}}]},"rikti_lt":{"powers":[{"name":146,"cast":2.5,"recharge":5,"range":5,"effectArea":7,"damage":{"Melee_Damage":{"Lethal":1,"Energy":0.32}}},{"name":142,"cast":2.5,"recharge":8,"range":5,"effectArea":7,"damage":{"Melee_Damage":{"Lethal":1,"Energy":0.64}}},{"name":147,"cast":2.33,"recharge":4,"range":150,"effectArea":7,"damage":{"Ranged_Damage":{"Energy":1.32}}}]},"rikti_support":{"powers":[{"name":148,"cast":2.03,"recharge":16,"radius":25,"maxTargets":16,"effectArea":1,"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1,"table":16}}}},{"name":149,"cast":2.03,"recharge":240,"radius":25,"maxTargets":16,"effectArea":1,"buffs":{"strength":{"Smashing_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Lethal_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Fire_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Cold_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Energy_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Negative_Energy_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Psionic_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Toxic_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"RechargeTime":0.15},"resistance":{"Held:Melee_Res_Boolean":{"scale":2.5,"table":102},"Immobilized:Melee_Res_Boolean":{"scale":2.5,"table":102},"Stunned:Melee_Res_Boolean":{"scale":2.5,"table":102},"Sleep:Melee_Res_Boolean":{"scale":2.5,"table":102}},"current":{"RunningSpeed":0.15,"FlyingSpeed":0.15,"Recovery":0.15}}}]},"rularuu_boss":{"powers":[{"name":150,"cast":2,"recharge":12,"range":60,"radius":60,"maxTargets":16,"effectArea":5,"damage":{"Ranged_Damage":{"Lethal":1.2}}},{"name":151,"cast":1.5,"recharge":4,"range":5,"effectArea":7,"damage":{"Melee_Damage":{"Lethal":1.32}}},{"name":152,"cast":2.67,"recharge":16,"range":80,"effectArea":7,"debuffs":{"current":{"Held:Ranged_Immobilize":{"scale":30,"table":33},"Held:Ranged_PvPMez":{"scale":3,"table":34}}}},{"name":153,"cast":2.67,"recharge":4,"range":120,"effectArea":7,"damage":{"Ranged_Damage":{"Energy":1.32}},"debuffs":{"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":2,"table":3},"RunningSpeed:Ranged_Slow":{"scale":0.2,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.2,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.2,"table":2}},"strength":{"JumpHeight:Ranged_Slow":{"scale":0.2,"table":2},"RechargeTime:Ranged_Slow":{"scale":0.2,"table":2}}}}]},"rularuu_lt":{"powers":[{"name":131,"cast":0.67,"recharge":3,"range":5,"effectArea":7,"damage":{"Melee_Damage":{"Smashing":1.2}}},{"name":154,"cast":1.17,"recharge":4,"range":85,"effectArea":7,"damage":{"Ranged_Damage":{"Lethal":1.2}}},{"name":155,"cast":1.07,"recharge":16,"range":60,"effectArea":7,"debuffs":{"current":{"Held:Ranged_Immobilize":{"scale":30,"table":33},"Held:Ranged_PvPMez":{"scale":3,"table":34}}}}]},"rularuu_support":{"powers":[{"name":156,"cast":3.17,"recharge":240,"radius":35,"maxTargets":16,"effectArea":1,"buffs":{"strength":{"Smashing_Dmg":0.5,"Lethal_Dmg":0.5,"Fire_Dmg":0.5,"Cold_Dmg":0.5,"Energy_Dmg":0.5,"Negative_Energy_Dmg":0.5,"Psionic_Dmg":0.5,"Toxic_Dmg":0.5}}},{"name":50,"cast":1.83,"recharge":6,"range":80,"effectArea":7,"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}}}}]},"rularuu_support_attack":{"powers":[{"name":157,"cast":1.83,"recharge":4,"range":120,"effectArea":7,"damage":{"Ranged_Damage":{"Energy":1.32}}}]},"seers_boss":{"powers":[{"name":158,"cast":2,"recharge":4,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Smashing":1.32}},"debuffs":{"current":{"Knockup:Ranged_Knockback":{"scale":12,"table":127},"Fly":-1.6}}},{"name":17,"cast":2.67,"recharge":4,"range":100,"effectArea":7,"damage":{"Ranged_Damage":{"Psionic":1.3}},"debuffs":{"strength":{"RechargeTime:Ranged_Slow":{"scale":0.3,"table":2}}}},{"name":159,"cast":2.5,"recharge":8,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Psionic":1.64}},"debuffs":{"current":{"Held:Ranged_Immobilize":{"scale":36,"table":33},"Held:Ranged_PvPMez":{"scale":3,"table":34}}}}]},"seers_lt":{"powers":[{"name":17,"cast":2.67,"recharge":3,"range":100,"effectArea":7,"damage":{"Ranged_Damage":{"Psionic":1.3}},"debuffs":{"strength":{"RechargeTime:Ranged_Slow":{"scale":0.3,"table":2}}}},{"name":160,"cast":2.5,"recharge":6,"range":5,"effectArea":7,"damage":{"Melee_Damage":{"Psionic":1.32}}}]},"seers_support":{"powers":[{"name":161,"cast":2.67,"recharge":6,"range":80,"effectArea":7,"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}}}},{"name":162,"cast":2.67,"recharge":30,"range":80,"effectArea":7,"buffs":{"current":{"Ranged:Ranged_Buff_Def":{"scale":0.5,"table":58},"Melee:Ranged_Buff_Def":{"scale":0.5,"table":58},"Area:Ranged_Buff_Def":{"scale":0.5,"table":58},"Smashing:Ranged_Buff_Def":{"scale":0.5,"table":58},"Lethal:Ranged_Buff_Def":{"scale":0.5,"table":58},"Fire:Ranged_Buff_Def":{"scale":0.5,"table":58},"Cold:Ranged_Buff_Def":{"scale":0.5,"table":58},"Energy:Ranged_Buff_Def":{"scale":0.5,"table":58},"Negative_Energy:Ranged_Buff_Def":{"scale":0.5,"table":58},"Psionic:Ranged_Buff_Def":{"scale":0.5,"table":58},"Toxic:Ranged_Buff_Def":{"scale":0.5,"table":58},"ToHit:Ranged_Buff_Def":{"scale":0.5,"table":58}},"strength":{"Smashing_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Lethal_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Fire_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Cold_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Energy_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Negative_Energy_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Psionic_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Toxic_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41}}}}]},"talons_boss":{"powers":[{"name":163,"cast":3.3,"recharge":8,"range":8,"radius":7,"maxTargets":10,"effectArea":5,"damage":{"Melee_Damage":{"Fire":0.72,"Cold":0.6}},"debuffs":{"current":{"Knockback":1.34}}},{"name":164,"cast":1.23,"recharge":4,"range":7,"radius":15,"maxTargets":6,"effectArea":5,"damage":{"Melee_Damage":{"Fire":0.48,"Cold":0.28}},"debuffs":{"current":{"RunningSpeed:Melee_Slow":{"scale":0.1,"table":118},"FlyingSpeed:Melee_Slow":{"scale":0.1,"table":118},"JumpingSpeed:Melee_Slow":{"scale":0.1,"table":118},"JumpHeight:Melee_Slow":{"scale":0.1,"table":118}},"strength":{"RechargeTime:Melee_Slow":{"scale":0.1,"table":118}}}},{"name":165,"cast":3,"recharge":18,"radius":30,"maxTargets":255,"effectArea":1,"damage":{"Melee_Damage":{"Fire":1.1,"Cold":1.1}},"buffs":{"current":{"ToHit:Melee_DeBuff_ToHit":{"scale":0.8,"table":68},"RunningSpeed:Melee_Slow":{"scale":0.1,"table":118},"FlyingSpeed:Melee_Slow":{"scale":0.1,"table":118},"JumpingSpeed:Melee_Slow":{"scale":0.1,"table":118},"JumpHeight:Melee_Slow":{"scale":0.1,"table":118}},"strength":{"RechargeTime:Melee_Slow":{"scale":0.1,"table":118}}}},{"name":166,"cast":1.23,"recharge":8,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Cold":0.32,"Fire":0.24}},"debuffs":{"current":{"RunningSpeed:Ranged_Slow":{"scale":0.3,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.3,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.3,"table":2},"JumpHeight:Ranged_Slow":{"scale":0.3,"table":2},"Knockup":-100,"Knockback":-100,"Held:Ranged_PvPMez":{"scale":3,"table":34},"Held":6},"strength":{"RechargeTime:Ranged_Slow":{"scale":0.3,"table":2}},"resistance":{"Knockup":100,"Knockback":100}}}]},"talons_lt":{"powers":[{"name":167,"cast":1,"recharge":2,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Lethal":0.6}}},{"name":168,"cast":1.67,"recharge":8,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Cold":1.64}},"debuffs":{"current":{"RunningSpeed:Ranged_Slow":{"scale":0.1,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.1,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.1,"table":2},"JumpHeight:Ranged_Slow":{"scale":0.3,"table":2},"Knockup":-100,"Knockback":-100,"Held:Ranged_PvPMez":{"scale":3,"table":34},"Held:Ranged_Immobilize":{"scale":6,"table":33}},"strength":{"RechargeTime:Ranged_Slow":{"scale":0.3,"table":2}},"resistance":{"Knockup":100,"Knockback":100}}},{"name":169,"cast":1.5,"recharge":12,"range":60,"effectArea":7,"damage":{"Ranged_Damage":{"Smashing":0.912,"Energy":1.368}},"buffs":{"strength":{"Smashing_Dmg":0.1,"Lethal_Dmg":0.1,"Fire_Dmg":0.1,"Cold_Dmg":0.1,"Energy_Dmg":0.1,"Negative_Energy_Dmg":0.1,"Psionic_Dmg":0.1,"Toxic_Dmg":0.1}},"debuffs":{"resistance":{"Smashing_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Lethal_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Fire_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Cold_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Energy_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Negative_Energy_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Psionic_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Toxic_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20}},"current":{"Stunned:Ranged_PvPMez":{"scale":4,"table":34},"Stunned:Ranged_Stun":{"scale":24,"table":106}}}}]},"talons_support":{"powers":[{"name":170,"cast":2,"recharge":45,"radius":60,"maxTargets":16,"effectArea":1,"buffs":{"resistance":{"Heal_Dmg":-0.25,"Smashing_Dmg":0.1,"Lethal_Dmg":0.1,"Fire_Dmg":0.1,"Cold_Dmg":0.1,"Energy_Dmg":0.1,"Negative_Energy_Dmg":0.1,"Psionic_Dmg":0.1,"Toxic_Dmg":0.1},"current":{"Base_Defense":0.05}}},{"name":171,"cast":2.67,"recharge":8,"range":80,"effectArea":7,"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.44,"table":16}},"strength":{"RechargeTime":0.2},"current":{"Recovery":0.2}}}]},"talons_support_attack":{"powers":[{"name":172,"cast":1.67,"recharge":10,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Energy":1.1,"Lethal":0.45}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.25,"table":16}}}}]},"tsoo_boss":{"powers":[{"name":173,"cast":1,"recharge":3,"range":9,"effectArea":7,"damage":{"Melee_Damage":{"Smashing":0.84}},"debuffs":{"current":{"Base_Defense:Melee_Debuff_Def":{"scale":1,"table":45}}}},{"name":174,"cast":1.13,"recharge":6,"range":9,"effectArea":7,"damage":{"Melee_Damage":{"Smashing":1.32}}},{"name":175,"cast":1.77,"recharge":9,"range":40,"effectArea":7,"damage":{"Melee_Damage":{"Smashing":1.8}}},{"name":176,"cast":2.57,"recharge":17,"radius":10,"maxTargets":10,"effectArea":1,"damage":{"Melee_Damage":{"Smashing":1.517}},"buffs":{"resistance":{"Smashing_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Lethal_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Fire_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Cold_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Energy_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Negative_Energy_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Psionic_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Toxic_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177}}}}]},"tsoo_lt":{"powers":[{"name":178,"cast":1.23,"recharge":30,"radius":15,"maxTargets":16,"effectArea":1,"buffs":{"current":{"Knockback:Melee_Knockback":{"scale":4,"table":116},"Stunned:Melee_PvPMez":{"scale":2,"table":117},"Stunned:Melee_Stun":{"scale":16,"table":179}}}},{"name":36,"cast":1.2,"recharge":4,"range":7,"effectArea":7,"damage":{"Melee_Damage":{"Smashing":1}}},{"name":180,"cast":1.07,"recharge":3,"range":70,"effectArea":7,"damage":{"Ranged_Damage":{"Lethal":0.84}}}]},"tsoo_support":{"powers":[{"name":79,"cast":2.27,"recharge":4,"range":20,"effectArea":7,"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.32,"table":16}},"current":{"Stunned:Ranged_Res_Boolean":{"scale":-20,"table":80},"Sleep:Ranged_Res_Boolean":{"scale":-20,"table":80},"PerceptionRadius:Ranged_Res_Boolean":{"scale":2.5,"table":80}},"resistance":{"Sleep:Ranged_Res_Boolean":{"scale":4,"table":80},"Endurance:Ranged_Res_Boolean":{"scale":2,"table":80},"Recovery:Ranged_Res_Boolean":{"scale":2,"table":80},"PerceptionRadius:Ranged_Res_Boolean":{"scale":2.5,"table":80}}}},{"name":81,"radius":25,"maxTargets":16,"effectArea":1,"buffs":{"strength":{"Range":-0.6},"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":3,"table":22}}}},{"name":181,"cast":2,"recharge":4,"range":300,"effectArea":182,"buffs":{"current":{"Translucency":0,"Teleport":10}}}]},"tsoo_support_attack":{"powers":[{"name":183,"cast":1.67,"recharge":8,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Negative":1}},"debuffs":{"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":0.75,"table":22},"Held:Ranged_PvPMez":{"scale":3,"table":34},"Held:Ranged_Immobilize":{"scale":36,"table":33}}}}]},"vanguard_boss":{"powers":[{"name":184,"cast":2.5,"recharge":5,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Negative":2.14}},"buffs":{"absolute":{"Heal_Dmg:Ranged_HealSelf":{"scale":1.64,"table":185}}},"debuffs":{"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":0.325,"table":22}}}},{"name":186,"cast":2.5,"recharge":10,"range":80,"radius":10,"maxTargets":16,"effectArea":1,"damage":{"Ranged_Damage":{"Smashing":0.24,"Cold":0.5}},"debuffs":{"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":0.5,"table":22},"RunningSpeed:Ranged_Slow":{"scale":0.2,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.2,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.2,"table":2}},"strength":{"JumpHeight:Ranged_Slow":{"scale":0.2,"table":2},"RechargeTime:Ranged_Slow":{"scale":0.2,"table":2}}}},{"name":187,"cast":2.5,"recharge":5,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Smashing":0.64,"Cold":1.5}},"debuffs":{"strength":{"JumpHeight:Ranged_Slow":{"scale":0.1,"table":2},"RechargeTime:Ranged_Slow":{"scale":0.1,"table":2}},"current":{"RunningSpeed:Ranged_Slow":{"scale":0.1,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.1,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.1,"table":2}}}},{"name":77,"cast":2.5,"recharge":16,"range":80,"radius":15,"maxTargets":16,"effectArea":1,"damage":{"Ranged_Damage":{"Energy":1}},"debuffs":{"absolute":{"Endurance:Ranged_EndDrain":{"scale":-12,"table":188}},"current":{"Recovery":-0.2}}}]},"vanguard_lt":{"powers":[{"name":189,"cast":1.67,"recharge":6,"range":5,"effectArea":7,"damage":{"Melee_Damage":{"Lethal":0.6,"Energy":0.5}},"debuffs":{"resistance":{"Lethal_Dmg":-0.05,"Energy_Dmg":-0.05}}},{"name":128,"cast":1,"recharge":6,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Lethal":0.4,"Energy":0.4}},"debuffs":{"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3}}}},{"name":190,"cast":1.87,"recharge":10,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Lethal":1}}}]},"vanguard_support":{"powers":[{"name":124,"cast":3.67,"recharge":15,"radius":60,"maxTargets":255,"effectArea":1,"buffs":{"strength":{"Smashing_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Lethal_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Fire_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Cold_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Energy_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Negative_Energy_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Psionic_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Toxic_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41}},"resistance":{"Taunt:Ranged_Res_Boolean":{"scale":1.75,"table":80},"Placate:Ranged_Res_Boolean":{"scale":1.75,"table":80}}}},{"name":69,"cast":2.37,"recharge":12,"range":80,"effectArea":7,"debuffs":{"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":0.5,"table":22},"Regeneration":-0.5},"strength":{"Smashing_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Lethal_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Fire_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Cold_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Energy_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Negative_Energy_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Psionic_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Toxic_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70}}}}]},"warworks_boss":{"powers":[{"name":191,"cast":1.03,"recharge":4,"range":5,"effectArea":7,"damage":{"Melee_Damage":{"Lethal":0.4,"Energy":0.4}},"debuffs":{"current":{"Base_Defense:Melee_Debuff_Def":{"scale":1,"table":45}}}},{"name":192,"cast":1.4,"recharge":7,"range":5,"effectArea":7,"damage":{"Melee_Damage":{"Lethal":0.44,"Energy":0.44}},"debuffs":{"current":{"Base_Defense:Melee_Debuff_Def":{"scale":1,"table":45}}}},{"name":193,"cast":1.67,"recharge":8,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Energy":1.64}},"debuffs":{"current":{"Regeneration":-0.5}}}]},"warworks_lt":{"powers":[{"name":194,"cast":3.73,"recharge":12,"range":60,"radius":60,"maxTargets":16,"effectArea":5,"damage":{"Ranged_Damage":{"Energy":0.72}},"debuffs":{"current":{"Regeneration":-0.5}}},{"name":195,"cast":1.33,"recharge":4,"range":80,"effectArea":7,"damage":{"Ranged_Damage":{"Energy":1.5}},"debuffs":{"current":{"Regeneration":-0.5}}}]}},"lore":{"arachnos":{"t1":{"pets":["arachnos_lt"],"damage":{"Melee_Damage":{"Smashing":2.64,"Toxic":0.6},"Ranged_Damage":{"Energy":1.32}}},"t2_core":{"pets":["arachnos_boss"],"damage":{"Ranged_Damage":{"Energy":0.5,"Toxic":0.9},"Melee_Damage":{"Lethal":1.1,"Toxic":0.98}},"debuffs":{"current":{"RunningSpeed:Ranged_Slow":{"scale":0.2,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.2,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.2,"table":2},"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3}},"strength":{"RechargeTime:Ranged_Slow":{"scale":0.1,"table":2},"JumpHeight:Ranged_Slow":{"scale":0.2,"table":2}}}},"t2_radial":{"pets":["arachnos_lt","arachnos_support"],"damage":{"Melee_Damage":{"Smashing":2.64,"Toxic":0.6},"Ranged_Damage":{"Energy":1.32}},"buffs":{"current":{"ToHit:Melee_Buff_ToHit":{"scale":0.5,"table":12},"Base_Defense:Melee_Buff_Def":{"scale":1,"table":13}},"resistance":{"Psionic_Dmg:Melee_Res_Dmg":{"scale":3,"table":14}},"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}}}},"t3_core_1":{"pets":["arachnos_boss","arachnos_lt"],"damage":{"Ranged_Damage":{"Energy":1.82,"Toxic":0.9},"Melee_Damage":{"Lethal":1.1,"Toxic":1.58,"Smashing":2.64}},"debuffs":{"current":{"RunningSpeed:Ranged_Slow":{"scale":0.2,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.2,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.2,"table":2},"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3}},"strength":{"RechargeTime:Ranged_Slow":{"scale":0.1,"table":2},"JumpHeight:Ranged_Slow":{"scale":0.2,"table":2}}}},"t3_core_2":{"pets":["arachnos_boss","arachnos_support"],"damage":{"Ranged_Damage":{"Energy":0.5,"Toxic":0.9},"Melee_Damage":{"Lethal":1.1,"Toxic":0.98}},"buffs":{"current":{"ToHit:Melee_Buff_ToHit":{"scale":0.5,"table":12},"Base_Defense:Melee_Buff_Def":{"scale":1,"table":13}},"resistance":{"Psionic_Dmg:Melee_Res_Dmg":{"scale":3,"table":14}},"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}}},"debuffs":{"current":{"RunningSpeed:Ranged_Slow":{"scale":0.2,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.2,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.2,"table":2},"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3}},"strength":{"RechargeTime:Ranged_Slow":{"scale":0.1,"table":2},"JumpHeight:Ranged_Slow":{"scale":0.2,"table":2}}}},"t3_radial_1":{"pets":["arachnos_boss","arachnos_support"],"damage":{"Ranged_Damage":{"Energy":0.5,"Toxic":0.9},"Melee_Damage":{"Lethal":1.1,"Toxic":0.98}},"buffs":{"current":{"ToHit:Melee_Buff_ToHit":{"scale":0.5,"table":12},"Base_Defense:Melee_Buff_Def":{"scale":1,"table":13}},"resistance":{"Psionic_Dmg:Melee_Res_Dmg":{"scale":3,"table":14}},"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}}},"debuffs":{"current":{"RunningSpeed:Ranged_Slow":{"scale":0.2,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.2,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.2,"table":2},"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3}},"strength":{"RechargeTime:Ranged_Slow":{"scale":0.1,"table":2},"JumpHeight:Ranged_Slow":{"scale":0.2,"table":2}}}},"t3_radial_2":{"pets":["arachnos_lt","arachnos_support_attack"],"damage":{"Melee_Damage":{"Smashing":2.64,"Toxic":0.6},"Ranged_Damage":{"Energy":1.32,"Psionic":1.32}},"debuffs":{"strength":{"RechargeTime:Ranged_Slow":{"scale":0.3,"table":2}}}},"t4_core":{"pets":["arachnos_boss","arachnos_lt"],"damage":{"Ranged_Damage":{"Energy":1.82,"Toxic":0.9},"Melee_Damage":{"Lethal":1.1,"Toxic":1.58,"Smashing":2.64}},"debuffs":{"current":{"RunningSpeed:Ranged_Slow":{"scale":0.2,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.2,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.2,"table":2},"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3}},"strength":{"RechargeTime:Ranged_Slow":{"scale":0.1,"table":2},"JumpHeight:Ranged_Slow":{"scale":0.2,"table":2}}}},"t4_radial":{"pets":["arachnos_lt","arachnos_support"],"damage":{"Melee_Damage":{"Smashing":2.64,"Toxic":0.6},"Ranged_Damage":{"Energy":1.32}},"buffs":{"current":{"ToHit:Melee_Buff_ToHit":{"scale":0.5,"table":12},"Base_Defense:Melee_Buff_Def":{"scale":1,"table":13}},"resistance":{"Psionic_Dmg:Melee_Res_Dmg":{"scale":3,"table":14}},"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}}}}},"banished_pantheon":{"t1":{"pets":["banished_lt"],"damage":{"Melee_Damage":{"Cold":1.25,"Negative":0.45},"Ranged_Damage":{"Cold":0.7,"Negative":0.4}},"debuffs":{"resistance":{"Cold_Dmg:Melee_Res_Dmg":{"scale":-2,"table":14},"Negative_Energy_Dmg:Melee_Res_Dmg":{"scale":-2,"table":14}},"current":{"Endurance":-0.02,"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3},"Regeneration":-0.05,"Recovery":-0.05}}},"t2_core":{"pets":["banished_boss"],"damage":{"Melee_Damage":{"Cold":0.5,"Negative":1.5},"Ranged_Damage":{"Cold":2.55,"Negative":1.7}},"debuffs":{"resistance":{"Cold_Dmg:Melee_Res_Dmg":{"scale":-2.5,"table":14},"Negative_Energy_Dmg:Melee_Res_Dmg":{"scale":-2.5,"table":14},"Smashing_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Lethal_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Fire_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Cold_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Energy_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Negative_Energy_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Psionic_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Toxic_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20}},"current":{"Endurance":-0.025,"ToHit:Ranged_Debuff_ToHit":{"scale":1,"table":22},"JumpHeight":-5,"RunningSpeed:Ranged_Slow":{"scale":0.2,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.2,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.2,"table":2},"Regeneration":-0.2,"Recovery":-0.2},"strength":{"RechargeTime:Ranged_Slow":{"scale":0.2,"table":2},"EnduranceDiscount":-0.15}}},"t2_radial":{"pets":["banished_lt","banished_support"],"damage":{"Melee_Damage":{"Cold":1.25,"Negative":0.45},"Ranged_Damage":{"Cold":0.7,"Negative":0.4}},"buffs":{"current":{"Regeneration":1,"Recovery":1,"Endurance":0.05},"strength":{"RechargeTime":0.25}},"debuffs":{"resistance":{"Cold_Dmg:Melee_Res_Dmg":{"scale":-2,"table":14},"Negative_Energy_Dmg:Melee_Res_Dmg":{"scale":-2,"table":14}},"current":{"Endurance":-0.02,"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3},"Regeneration":-0.05,"Recovery":-0.05}}},"t3_core_1":{"pets":["banished_boss","banished_lt"],"damage":{"Melee_Damage":{"Cold":1.75,"Negative":1.95},"Ranged_Damage":{"Cold":3.25,"Negative":2.1}},"debuffs":{"resistance":{"Cold_Dmg:Melee_Res_Dmg":{"scale":-4.5,"table":14},"Negative_Energy_Dmg:Melee_Res_Dmg":{"scale":-4.5,"table":14},"Smashing_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Lethal_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Fire_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Cold_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Energy_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Negative_Energy_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Psionic_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Toxic_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20}},"current":{"Endurance":-0.045,"ToHit:Ranged_Debuff_ToHit":{"scale":1,"table":22},"JumpHeight":-5,"RunningSpeed:Ranged_Slow":{"scale":0.2,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.2,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.2,"table":2},"Regeneration":-0.25,"Recovery":-0.25,"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3}},"strength":{"RechargeTime:Ranged_Slow":{"scale":0.2,"table":2},"EnduranceDiscount":-0.15}}},"t3_core_2":{"pets":["banished_boss","banished_support"],"damage":{"Melee_Damage":{"Cold":0.5,"Negative":1.5},"Ranged_Damage":{"Cold":2.55,"Negative":1.7}},"buffs":{"current":{"Regeneration":1,"Recovery":1,"Endurance":0.05},"strength":{"RechargeTime":0.25}},"debuffs":{"resistance":{"Cold_Dmg:Melee_Res_Dmg":{"scale":-2.5,"table":14},"Negative_Energy_Dmg:Melee_Res_Dmg":{"scale":-2.5,"table":14},"Smashing_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Lethal_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Fire_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Cold_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Energy_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Negative_Energy_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Psionic_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Toxic_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20}},"current":{"Endurance":-0.025,"ToHit:Ranged_Debuff_ToHit":{"scale":1,"table":22},"JumpHeight":-5,"RunningSpeed:Ranged_Slow":{"scale":0.2,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.2,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.2,"table":2},"Regeneration":-0.2,"Recovery":-0.2},"strength":{"RechargeTime:Ranged_Slow":{"scale":0.2,"table":2},"EnduranceDiscount":-0.15}}},"t3_radial_1":{"pets":["banished_boss","banished_support"],"damage":{"Melee_Damage":{"Cold":0.5,"Negative":1.5},"Ranged_Damage":{"Cold":2.55,"Negative":1.7}},"buffs":{"current":{"Regeneration":1,"Recovery":1,"Endurance":0.05},"strength":{"RechargeTime":0.25}},"debuffs":{"resistance":{"Cold_Dmg:Melee_Res_Dmg":{"scale":-2.5,"table":14},"Negative_Energy_Dmg:Melee_Res_Dmg":{"scale":-2.5,"table":14},"Smashing_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Lethal_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Fire_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Cold_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Energy_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Negative_Energy_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Psionic_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Toxic_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20}},"current":{"Endurance":-0.025,"ToHit:Ranged_Debuff_ToHit":{"scale":1,"table":22},"JumpHeight":-5,"RunningSpeed:Ranged_Slow":{"scale":0.2,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.2,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.2,"table":2},"Regeneration":-0.2,"Recovery":-0.2},"strength":{"RechargeTime:Ranged_Slow":{"scale":0.2,"table":2},"EnduranceDiscount":-0.15}}},"t3_radial_2":{"pets":["banished_lt","banished_support_attack"],"damage":{"Melee_Damage":{"Cold":1.25,"Negative":0.45},"Ranged_Damage":{"Cold":1.7,"Negative":0.8}},"debuffs":{"resistance":{"Cold_Dmg:Melee_Res_Dmg":{"scale":-2,"table":14},"Negative_Energy_Dmg:Melee_Res_Dmg":{"scale":-2,"table":14},"Cold_Dmg:Ranged_Res_Dmg":{"scale":-1.25,"table":20},"Negative_Energy_Dmg:Ranged_Res_Dmg":{"scale":-1.25,"table":20}},"current":{"Endurance":-0.02,"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3},"Regeneration":-0.05,"Recovery":-0.05,"ToHit:Ranged_Debuff_ToHit":{"scale":1,"table":22}}}},"t4_core":{"pets":["banished_boss","banished_lt"],"damage":{"Melee_Damage":{"Cold":1.75,"Negative":1.95},"Ranged_Damage":{"Cold":3.25,"Negative":2.1}},"debuffs":{"resistance":{"Cold_Dmg:Melee_Res_Dmg":{"scale":-4.5,"table":14},"Negative_Energy_Dmg:Melee_Res_Dmg":{"scale":-4.5,"table":14},"Smashing_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Lethal_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Fire_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Cold_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Energy_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Negative_Energy_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Psionic_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20},"Toxic_Dmg:Ranged_Res_Dmg":{"scale":-3,"table":20}},"current":{"Endurance":-0.045,"ToHit:Ranged_Debuff_ToHit":{"scale":1,"table":22},"JumpHeight":-5,"RunningSpeed:Ranged_Slow":{"scale":0.2,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.2,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.2,"table":2},"Regeneration":-0.25,"Recovery":-0.25,"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3}},"strength":{"RechargeTime:Ranged_Slow":{"scale":0.2,"table":2},"EnduranceDiscount":-0.15}}},"t4_radial":{"pets":["banished_lt","banished_support"],"damage":{"Melee_Damage":{"Cold":1.25,"Negative":0.45},"Ranged_Damage":{"Cold":0.7,"Negative":0.4}},"buffs":{"current":{"Regeneration":1,"Recovery":1,"Endurance":0.05},"strength":{"RechargeTime":0.25}},"debuffs":{"resistance":{"Cold_Dmg:Melee_Res_Dmg":{"scale":-2,"table":14},"Negative_Energy_Dmg:Melee_Res_Dmg":{"scale":-2,"table":14}},"current":{"Endurance":-0.02,"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3},"Regeneration":-0.05,"Recovery":-0.05}}}},"carnival":{"t1":{"pets":["carnival_lt"],"damage":{"Melee_Damage":{"Smashing":4.38}},"debuffs":{"current":{"Fly":-1}}},"t2_core":{"pets":["carnival_boss"],"damage":{"Ranged_Damage":{"Smashing":0.3,"Psionic":5.42,"Negative":0.835}},"debuffs":{"strength":{"RechargeTime:Ranged_Slow":{"scale":0.6,"table":2}},"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":0.75,"table":22},"Immobilized:Ranged_Immobilize":{"scale":45,"table":33},"Immobilized:Ranged_PvPMez":{"scale":3,"table":34}}}},"t2_radial":{"pets":["carnival_lt","carnival_support"],"damage":{"Melee_Damage":{"Smashing":4.38}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}},"current":{"ToHit:Ranged_Buff_ToHit":{"scale":2,"table":40}},"strength":{"Smashing_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Lethal_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Fire_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Cold_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Energy_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Negative_Energy_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Psionic_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Toxic_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41}}},"debuffs":{"current":{"Fly":-1}}},"t3_core_1":{"pets":["carnival_boss","carnival_lt"],"damage":{"Ranged_Damage":{"Smashing":0.3,"Psionic":5.42,"Negative":0.835},"Melee_Damage":{"Smashing":4.38}},"debuffs":{"strength":{"RechargeTime:Ranged_Slow":{"scale":0.6,"table":2}},"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":0.75,"table":22},"Immobilized:Ranged_Immobilize":{"scale":45,"table":33},"Immobilized:Ranged_PvPMez":{"scale":3,"table":34},"Fly":-1}}},"t3_core_2":{"pets":["carnival_boss","carnival_support"],"damage":{"Ranged_Damage":{"Smashing":0.3,"Psionic":5.42,"Negative":0.835}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}},"current":{"ToHit:Ranged_Buff_ToHit":{"scale":2,"table":40}},"strength":{"Smashing_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Lethal_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Fire_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Cold_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Energy_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Negative_Energy_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Psionic_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Toxic_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41}}},"debuffs":{"strength":{"RechargeTime:Ranged_Slow":{"scale":0.6,"table":2}},"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":0.75,"table":22},"Immobilized:Ranged_Immobilize":{"scale":45,"table":33},"Immobilized:Ranged_PvPMez":{"scale":3,"table":34}}}},"t3_radial_1":{"pets":["carnival_boss","carnival_support"],"damage":{"Ranged_Damage":{"Smashing":0.3,"Psionic":5.42,"Negative":0.835}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}},"current":{"ToHit:Ranged_Buff_ToHit":{"scale":2,"table":40}},"strength":{"Smashing_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Lethal_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Fire_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Cold_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Energy_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Negative_Energy_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Psionic_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Toxic_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41}}},"debuffs":{"strength":{"RechargeTime:Ranged_Slow":{"scale":0.6,"table":2}},"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":0.75,"table":22},"Immobilized:Ranged_Immobilize":{"scale":45,"table":33},"Immobilized:Ranged_PvPMez":{"scale":3,"table":34}}}},"t3_radial_2":{"pets":["carnival_lt","carnival_support_attack"],"damage":{"Melee_Damage":{"Smashing":4.38},"Ranged_Damage":{"Fire":1}},"debuffs":{"current":{"Fly":-1}}},"t4_core":{"pets":["carnival_boss","carnival_lt"],"damage":{"Ranged_Damage":{"Smashing":0.3,"Psionic":5.42,"Negative":0.835},"Melee_Damage":{"Smashing":4.38}},"debuffs":{"strength":{"RechargeTime:Ranged_Slow":{"scale":0.6,"table":2}},"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":0.75,"table":22},"Immobilized:Ranged_Immobilize":{"scale":45,"table":33},"Immobilized:Ranged_PvPMez":{"scale":3,"table":34},"Fly":-1}}},"t4_radial":{"pets":["carnival_lt","carnival_support"],"damage":{"Melee_Damage":{"Smashing":4.38}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}},"current":{"ToHit:Ranged_Buff_ToHit":{"scale":2,"table":40}},"strength":{"Smashing_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Lethal_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Fire_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Cold_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Energy_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Negative_Energy_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Psionic_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Toxic_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41}}},"debuffs":{"current":{"Fly":-1}}}},"cimeroran":{"t1":{"pets":["cimeroran_lt"],"damage":{"Melee_Damage":{"Lethal":3.33},"Ranged_Damage":{"Lethal":1.2}},"debuffs":{"current":{"Base_Defense:Melee_Debuff_Def":{"scale":3,"table":45}}}},"t2_core":{"pets":["cimeroran_boss"],"damage":{"Melee_Damage":{"Smashing":1,"Lethal":3.33},"Ranged_Damage":{"Lethal":1.2}},"debuffs":{"current":{"Knockback":1.34,"Base_Defense:Melee_Debuff_Def":{"scale":3,"table":45}}}},"t2_radial":{"pets":["cimeroran_lt","cimeroran_support"],"damage":{"Melee_Damage":{"Lethal":3.33},"Ranged_Damage":{"Lethal":1.2}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":2.96,"table":16}}},"debuffs":{"current":{"Base_Defense:Melee_Debuff_Def":{"scale":3,"table":45}}}},"t3_core_1":{"pets":["cimeroran_boss","cimeroran_lt"],"damage":{"Melee_Damage":{"Smashing":1,"Lethal":6.66},"Ranged_Damage":{"Lethal":2.4}},"debuffs":{"current":{"Knockback":1.34,"Base_Defense:Melee_Debuff_Def":{"scale":6,"table":45}}}},"t3_core_2":{"pets":["cimeroran_boss","cimeroran_support"],"damage":{"Melee_Damage":{"Smashing":1,"Lethal":3.33},"Ranged_Damage":{"Lethal":1.2}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":2.96,"table":16}}},"debuffs":{"current":{"Knockback":1.34,"Base_Defense:Melee_Debuff_Def":{"scale":3,"table":45}}}},"t3_radial_1":{"pets":["cimeroran_boss","cimeroran_support"],"damage":{"Melee_Damage":{"Smashing":1,"Lethal":3.33},"Ranged_Damage":{"Lethal":1.2}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":2.96,"table":16}}},"debuffs":{"current":{"Knockback":1.34,"Base_Defense:Melee_Debuff_Def":{"scale":3,"table":45}}}},"t3_radial_2":{"pets":["cimeroran_lt","cimeroran_support"],"damage":{"Melee_Damage":{"Lethal":3.33},"Ranged_Damage":{"Lethal":1.2}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":2.96,"table":16}}},"debuffs":{"current":{"Base_Defense:Melee_Debuff_Def":{"scale":3,"table":45}}}},"t4_core":{"pets":["cimeroran_boss","cimeroran_lt"],"damage":{"Melee_Damage":{"Smashing":1,"Lethal":6.66},"Ranged_Damage":{"Lethal":2.4}},"debuffs":{"current":{"Knockback":1.34,"Base_Defense:Melee_Debuff_Def":{"scale":6,"table":45}}}},"t4_radial":{"pets":["cimeroran_lt","cimeroran_support"],"damage":{"Melee_Damage":{"Lethal":3.33},"Ranged_Damage":{"Lethal":1.2}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":2.96,"table":16}}},"debuffs":{"current":{"Base_Defense:Melee_Debuff_Def":{"scale":3,"table":45}}}}},"clockwork":{"t1":{"pets":["clockwork_lt"],"damage":{"Ranged_Damage":{"Energy":4.76}},"debuffs":{"current":{"Stunned":24,"Stunned:Ranged_PvPMez":{"scale":3,"table":34}}}},"t2_core":{"pets":["clockwork_boss"],"damage":{"Ranged_Damage":{"Energy":4.84}},"debuffs":{"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":2,"table":3}}}},"t2_radial":{"pets":["clockwork_lt","clockwork_support"],"damage":{"Ranged_Damage":{"Energy":4.76}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":2.67,"table":16}},"current":{"Smashing:Ranged_Buff_Def":{"scale":0.75,"table":58},"Fire:Ranged_Buff_Def":{"scale":0.75,"table":58},"Cold:Ranged_Buff_Def":{"scale":0.75,"table":58},"Energy:Ranged_Buff_Def":{"scale":0.75,"table":58},"Negative_Energy:Ranged_Buff_Def":{"scale":0.75,"table":58},"Lethal:Ranged_Buff_Def":{"scale":0.75,"table":58},"Ranged:Ranged_Buff_Def":{"scale":0.5,"table":58},"Melee:Ranged_Buff_Def":{"scale":0.5,"table":58},"Area:Ranged_Buff_Def":{"scale":0.5,"table":58}}},"debuffs":{"current":{"Stunned":24,"Stunned:Ranged_PvPMez":{"scale":3,"table":34}}}},"t3_core_1":{"pets":["clockwork_boss","clockwork_lt"],"damage":{"Ranged_Damage":{"Energy":9.6}},"debuffs":{"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":2,"table":3},"Stunned":24,"Stunned:Ranged_PvPMez":{"scale":3,"table":34}}}},"t3_core_2":{"pets":["clockwork_boss","clockwork_support"],"damage":{"Ranged_Damage":{"Energy":4.84}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":2.67,"table":16}},"current":{"Smashing:Ranged_Buff_Def":{"scale":0.75,"table":58},"Fire:Ranged_Buff_Def":{"scale":0.75,"table":58},"Cold:Ranged_Buff_Def":{"scale":0.75,"table":58},"Energy:Ranged_Buff_Def":{"scale":0.75,"table":58},"Negative_Energy:Ranged_Buff_Def":{"scale":0.75,"table":58},"Lethal:Ranged_Buff_Def":{"scale":0.75,"table":58},"Ranged:Ranged_Buff_Def":{"scale":0.5,"table":58},"Melee:Ranged_Buff_Def":{"scale":0.5,"table":58},"Area:Ranged_Buff_Def":{"scale":0.5,"table":58}}},"debuffs":{"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":2,"table":3}}}},"t3_radial_1":{"pets":["clockwork_boss","clockwork_support"],"damage":{"Ranged_Damage":{"Energy":4.84}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":2.67,"table":16}},"current":{"Smashing:Ranged_Buff_Def":{"scale":0.75,"table":58},"Fire:Ranged_Buff_Def":{"scale":0.75,"table":58},"Cold:Ranged_Buff_Def":{"scale":0.75,"table":58},"Energy:Ranged_Buff_Def":{"scale":0.75,"table":58},"Negative_Energy:Ranged_Buff_Def":{"scale":0.75,"table":58},"Lethal:Ranged_Buff_Def":{"scale":0.75,"table":58},"Ranged:Ranged_Buff_Def":{"scale":0.5,"table":58},"Melee:Ranged_Buff_Def":{"scale":0.5,"table":58},"Area:Ranged_Buff_Def":{"scale":0.5,"table":58}}},"debuffs":{"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":2,"table":3}}}},"t3_radial_2":{"pets":["clockwork_lt","clockwork_support"],"damage":{"Ranged_Damage":{"Energy":4.76}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":2.67,"table":16}},"current":{"Smashing:Ranged_Buff_Def":{"scale":0.75,"table":58},"Fire:Ranged_Buff_Def":{"scale":0.75,"table":58},"Cold:Ranged_Buff_Def":{"scale":0.75,"table":58},"Energy:Ranged_Buff_Def":{"scale":0.75,"table":58},"Negative_Energy:Ranged_Buff_Def":{"scale":0.75,"table":58},"Lethal:Ranged_Buff_Def":{"scale":0.75,"table":58},"Ranged:Ranged_Buff_Def":{"scale":0.5,"table":58},"Melee:Ranged_Buff_Def":{"scale":0.5,"table":58},"Area:Ranged_Buff_Def":{"scale":0.5,"table":58}}},"debuffs":{"current":{"Stunned":24,"Stunned:Ranged_PvPMez":{"scale":3,"table":34}}}},"t4_core":{"pets":["clockwork_boss","clockwork_lt"],"damage":{"Ranged_Damage":{"Energy":9.6}},"debuffs":{"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":2,"table":3},"Stunned":24,"Stunned:Ranged_PvPMez":{"scale":3,"table":34}}}},"t4_radial":{"pets":["clockwork_lt","clockwork_support"],"damage":{"Ranged_Damage":{"Energy":4.76}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":2.67,"table":16}},"current":{"Smashing:Ranged_Buff_Def":{"scale":0.75,"table":58},"Fire:Ranged_Buff_Def":{"scale":0.75,"table":58},"Cold:Ranged_Buff_Def":{"scale":0.75,"table":58},"Energy:Ranged_Buff_Def":{"scale":0.75,"table":58},"Negative_Energy:Ranged_Buff_Def":{"scale":0.75,"table":58},"Lethal:Ranged_Buff_Def":{"scale":0.75,"table":58},"Ranged:Ranged_Buff_Def":{"scale":0.5,"table":58},"Melee:Ranged_Buff_Def":{"scale":0.5,"table":58},"Area:Ranged_Buff_Def":{"scale":0.5,"table":58}}},"debuffs":{"current":{"Stunned":24,"Stunned:Ranged_PvPMez":{"scale":3,"table":34}}}}},"demons":{"t1":{"pets":["demons_lt"],"damage":{"Melee_Damage":{"Smashing":1,"Fire":1.32,"Lethal":0.5},"Ranged_Damage":{"Fire":1.3}}},"t2_core":{"pets":["demons_boss"],"damage":{"Melee_Damage":{"Lethal":0.66,"Negative":0.66},"Ranged_Damage":{"Negative":0.6,"Smashing":0.2,"Fire":1}},"debuffs":{"absolute":{"Placate:Ranged_Taunt":{"scale":80,"table":60}},"current":{"Confused:Ranged_PvPMez":{"scale":3,"table":34},"Confused":15}}},"t2_radial":{"pets":["demons_lt","demons_support"],"damage":{"Melee_Damage":{"Smashing":1,"Fire":1.32,"Lethal":0.5},"Ranged_Damage":{"Fire":1.3}},"buffs":{"current":{"ToHit:Melee_DeBuff_ToHit":{"scale":3,"table":68}}},"debuffs":{"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":0.5,"table":22},"Regeneration":-0.5},"strength":{"Smashing_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Lethal_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Fire_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Cold_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Energy_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Negative_Energy_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Psionic_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Toxic_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70}}}},"t3_core_1":{"pets":["demons_boss","demons_lt"],"damage":{"Melee_Damage":{"Lethal":1.16,"Negative":0.66,"Smashing":1,"Fire":1.32},"Ranged_Damage":{"Negative":0.6,"Smashing":0.2,"Fire":2.3}},"debuffs":{"absolute":{"Placate:Ranged_Taunt":{"scale":80,"table":60}},"current":{"Confused:Ranged_PvPMez":{"scale":3,"table":34},"Confused":15}}},"t3_core_2":{"pets":["demons_boss","demons_support"],"damage":{"Melee_Damage":{"Lethal":0.66,"Negative":0.66},"Ranged_Damage":{"Negative":0.6,"Smashing":0.2,"Fire":1}},"buffs":{"current":{"ToHit:Melee_DeBuff_ToHit":{"scale":3,"table":68}}},"debuffs":{"absolute":{"Placate:Ranged_Taunt":{"scale":80,"table":60}},"current":{"Confused:Ranged_PvPMez":{"scale":3,"table":34},"Confused":15,"ToHit:Ranged_Debuff_ToHit":{"scale":0.5,"table":22},"Regeneration":-0.5},"strength":{"Smashing_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Lethal_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Fire_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Cold_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Energy_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Negative_Energy_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Psionic_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Toxic_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70}}}},"t3_radial_1":{"pets":["demons_boss","demons_support"],"damage":{"Melee_Damage":{"Lethal":0.66,"Negative":0.66},"Ranged_Damage":{"Negative":0.6,"Smashing":0.2,"Fire":1}},"buffs":{"current":{"ToHit:Melee_DeBuff_ToHit":{"scale":3,"table":68}}},"debuffs":{"absolute":{"Placate:Ranged_Taunt":{"scale":80,"table":60}},"current":{"Confused:Ranged_PvPMez":{"scale":3,"table":34},"Confused":15,"ToHit:Ranged_Debuff_ToHit":{"scale":0.5,"table":22},"Regeneration":-0.5},"strength":{"Smashing_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Lethal_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Fire_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Cold_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Energy_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Negative_Energy_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Psionic_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Toxic_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70}}}},"t3_radial_2":{"pets":["demons_lt","demons_support_attack"],"damage":{"Melee_Damage":{"Smashing":1,"Fire":1.32,"Lethal":0.5},"Ranged_Damage":{"Fire":1.3,"Negative":1.4}},"debuffs":{"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":0.75,"table":22}}}},"t4_core":{"pets":["demons_boss","demons_lt"],"damage":{"Melee_Damage":{"Lethal":1.16,"Negative":0.66,"Smashing":1,"Fire":1.32},"Ranged_Damage":{"Negative":0.6,"Smashing":0.2,"Fire":2.3}},"debuffs":{"absolute":{"Placate:Ranged_Taunt":{"scale":80,"table":60}},"current":{"Confused:Ranged_PvPMez":{"scale":3,"table":34},"Confused":15}}},"t4_radial":{"pets":["demons_lt","demons_support"],"damage":{"Melee_Damage":{"Smashing":1,"Fire":1.32,"Lethal":0.5},"Ranged_Damage":{"Fire":1.3}},"buffs":{"current":{"ToHit:Melee_DeBuff_ToHit":{"scale":3,"table":68}}},"debuffs":{"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":0.5,"table":22},"Regeneration":-0.5},"strength":{"Smashing_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Lethal_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Fire_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Cold_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Energy_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Negative_Energy_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Psionic_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Toxic_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70}}}}},"idf":{"t1":{"pets":["idf_lt"],"damage":{"Ranged_Damage":{"Energy":3.04}}},"t2_core":{"pets":["idf_boss"],"damage":{"Melee_Damage":{"Smashing":0.8,"Energy":1.6},"Ranged_Damage":{"Energy":1.4}}},"t2_radial":{"pets":["idf_lt","idf_support"],"damage":{"Ranged_Damage":{"Energy":3.04}},"buffs":{"current":{"Ranged:Ranged_Buff_Def":{"scale":0.5,"table":58},"Melee:Ranged_Buff_Def":{"scale":0.5,"table":58},"Area:Ranged_Buff_Def":{"scale":0.5,"table":58},"Smashing:Ranged_Buff_Def":{"scale":0.5,"table":58},"Fire:Ranged_Buff_Def":{"scale":0.5,"table":58},"Cold:Ranged_Buff_Def":{"scale":0.5,"table":58},"Energy:Ranged_Buff_Def":{"scale":0.5,"table":58},"Negative_Energy:Ranged_Buff_Def":{"scale":0.5,"table":58},"Psionic:Ranged_Buff_Def":{"scale":0.5,"table":58},"Lethal:Ranged_Buff_Def":{"scale":0.5,"table":58},"Immobilized:Ranged_Res_Boolean":{"scale":-3,"table":80},"Stunned:Ranged_Res_Boolean":{"scale":-3,"table":80},"Held":-10,"Immobilized":-10,"Stunned":-10,"Sleep":-10,"Confused":-5,"Afraid":-5,"Terrorized":-5},"absolute":{"Heal_Dmg:Melee_Heal":{"scale":1.96,"table":101}},"resistance":{"Held:Melee_Res_Boolean":{"scale":-1,"table":102},"Immobilized:Melee_Res_Boolean":{"scale":-1,"table":102},"Stunned:Melee_Res_Boolean":{"scale":-1,"table":102},"Sleep:Melee_Res_Boolean":{"scale":-1,"table":102},"Confused:Melee_Res_Boolean":{"scale":-0.5,"table":102},"Afraid:Melee_Res_Boolean":{"scale":-0.5,"table":102},"Terrorized:Melee_Res_Boolean":{"scale":-0.5,"table":102}}}},"t3_core_1":{"pets":["idf_boss","idf_lt"],"damage":{"Melee_Damage":{"Smashing":0.8,"Energy":1.6},"Ranged_Damage":{"Energy":4.44}}},"t3_core_2":{"pets":["idf_boss","idf_support"],"damage":{"Melee_Damage":{"Smashing":0.8,"Energy":1.6},"Ranged_Damage":{"Energy":1.4}},"buffs":{"current":{"Ranged:Ranged_Buff_Def":{"scale":0.5,"table":58},"Melee:Ranged_Buff_Def":{"scale":0.5,"table":58},"Area:Ranged_Buff_Def":{"scale":0.5,"table":58},"Smashing:Ranged_Buff_Def":{"scale":0.5,"table":58},"Fire:Ranged_Buff_Def":{"scale":0.5,"table":58},"Cold:Ranged_Buff_Def":{"scale":0.5,"table":58},"Energy:Ranged_Buff_Def":{"scale":0.5,"table":58},"Negative_Energy:Ranged_Buff_Def":{"scale":0.5,"table":58},"Psionic:Ranged_Buff_Def":{"scale":0.5,"table":58},"Lethal:Ranged_Buff_Def":{"scale":0.5,"table":58},"Immobilized:Ranged_Res_Boolean":{"scale":-3,"table":80},"Stunned:Ranged_Res_Boolean":{"scale":-3,"table":80},"Held":-10,"Immobilized":-10,"Stunned":-10,"Sleep":-10,"Confused":-5,"Afraid":-5,"Terrorized":-5},"absolute":{"Heal_Dmg:Melee_Heal":{"scale":1.96,"table":101}},"resistance":{"Held:Melee_Res_Boolean":{"scale":-1,"table":102},"Immobilized:Melee_Res_Boolean":{"scale":-1,"table":102},"Stunned:Melee_Res_Boolean":{"scale":-1,"table":102},"Sleep:Melee_Res_Boolean":{"scale":-1,"table":102},"Confused:Melee_Res_Boolean":{"scale":-0.5,"table":102},"Afraid:Melee_Res_Boolean":{"scale":-0.5,"table":102},"Terrorized:Melee_Res_Boolean":{"scale":-0.5,"table":102}}}},"t3_radial_1":{"pets":["idf_boss","idf_support"],"damage":{"Melee_Damage":{"Smashing":0.8,"Energy":1.6},"Ranged_Damage":{"Energy":1.4}},"buffs":{"current":{"Ranged:Ranged_Buff_Def":{"scale":0.5,"table":58},"Melee:Ranged_Buff_Def":{"scale":0.5,"table":58},"Area:Ranged_Buff_Def":{"scale":0.5,"table":58},"Smashing:Ranged_Buff_Def":{"scale":0.5,"table":58},"Fire:Ranged_Buff_Def":{"scale":0.5,"table":58},"Cold:Ranged_Buff_Def":{"scale":0.5,"table":58},"Energy:Ranged_Buff_Def":{"scale":0.5,"table":58},"Negative_Energy:Ranged_Buff_Def":{"scale":0.5,"table":58},"Psionic:Ranged_Buff_Def":{"scale":0.5,"table":58},"Lethal:Ranged_Buff_Def":{"scale":0.5,"table":58},"Immobilized:Ranged_Res_Boolean":{"scale":-3,"table":80},"Stunned:Ranged_Res_Boolean":{"scale":-3,"table":80},"Held":-10,"Immobilized":-10,"Stunned":-10,"Sleep":-10,"Confused":-5,"Afraid":-5,"Terrorized":-5},"absolute":{"Heal_Dmg:Melee_Heal":{"scale":1.96,"table":101}},"resistance":{"Held:Melee_Res_Boolean":{"scale":-1,"table":102},"Immobilized:Melee_Res_Boolean":{"scale":-1,"table":102},"Stunned:Melee_Res_Boolean":{"scale":-1,"table":102},"Sleep:Melee_Res_Boolean":{"scale":-1,"table":102},"Confused:Melee_Res_Boolean":{"scale":-0.5,"table":102},"Afraid:Melee_Res_Boolean":{"scale":-0.5,"table":102},"Terrorized:Melee_Res_Boolean":{"scale":-0.5,"table":102}}}},"t3_radial_2":{"pets":["idf_lt","idf_support"],"damage":{"Ranged_Damage":{"Energy":3.04}},"buffs":{"current":{"Ranged:Ranged_Buff_Def":{"scale":0.5,"table":58},"Melee:Ranged_Buff_Def":{"scale":0.5,"table":58},"Area:Ranged_Buff_Def":{"scale":0.5,"table":58},"Smashing:Ranged_Buff_Def":{"scale":0.5,"table":58},"Fire:Ranged_Buff_Def":{"scale":0.5,"table":58},"Cold:Ranged_Buff_Def":{"scale":0.5,"table":58},"Energy:Ranged_Buff_Def":{"scale":0.5,"table":58},"Negative_Energy:Ranged_Buff_Def":{"scale":0.5,"table":58},"Psionic:Ranged_Buff_Def":{"scale":0.5,"table":58},"Lethal:Ranged_Buff_Def":{"scale":0.5,"table":58},"Immobilized:Ranged_Res_Boolean":{"scale":-3,"table":80},"Stunned:Ranged_Res_Boolean":{"scale":-3,"table":80},"Held":-10,"Immobilized":-10,"Stunned":-10,"Sleep":-10,"Confused":-5,"Afraid":-5,"Terrorized":-5},"absolute":{"Heal_Dmg:Melee_Heal":{"scale":1.96,"table":101}},"resistance":{"Held:Melee_Res_Boolean":{"scale":-1,"table":102},"Immobilized:Melee_Res_Boolean":{"scale":-1,"table":102},"Stunned:Melee_Res_Boolean":{"scale":-1,"table":102},"Sleep:Melee_Res_Boolean":{"scale":-1,"table":102},"Confused:Melee_Res_Boolean":{"scale":-0.5,"table":102},"Afraid:Melee_Res_Boolean":{"scale":-0.5,"table":102},"Terrorized:Melee_Res_Boolean":{"scale":-0.5,"table":102}}}},"t4_core":{"pets":["idf_boss","idf_lt"],"damage":{"Melee_Damage":{"Smashing":0.8,"Energy":1.6},"Ranged_Damage":{"Energy":4.44}}},"t4_radial":{"pets":["idf_lt","idf_support"],"damage":{"Ranged_Damage":{"Energy":3.04}},"buffs":{"current":{"Ranged:Ranged_Buff_Def":{"scale":0.5,"table":58},"Melee:Ranged_Buff_Def":{"scale":0.5,"table":58},"Area:Ranged_Buff_Def":{"scale":0.5,"table":58},"Smashing:Ranged_Buff_Def":{"scale":0.5,"table":58},"Fire:Ranged_Buff_Def":{"scale":0.5,"table":58},"Cold:Ranged_Buff_Def":{"scale":0.5,"table":58},"Energy:Ranged_Buff_Def":{"scale":0.5,"table":58},"Negative_Energy:Ranged_Buff_Def":{"scale":0.5,"table":58},"Psionic:Ranged_Buff_Def":{"scale":0.5,"table":58},"Lethal:Ranged_Buff_Def":{"scale":0.5,"table":58},"Immobilized:Ranged_Res_Boolean":{"scale":-3,"table":80},"Stunned:Ranged_Res_Boolean":{"scale":-3,"table":80},"Held":-10,"Immobilized":-10,"Stunned":-10,"Sleep":-10,"Confused":-5,"Afraid":-5,"Terrorized":-5},"absolute":{"Heal_Dmg:Melee_Heal":{"scale":1.96,"table":101}},"resistance":{"Held:Melee_Res_Boolean":{"scale":-1,"table":102},"Immobilized:Melee_Res_Boolean":{"scale":-1,"table":102},"Stunned:Melee_Res_Boolean":{"scale":-1,"table":102},"Sleep:Melee_Res_Boolean":{"scale":-1,"table":102},"Confused:Melee_Res_Boolean":{"scale":-0.5,"table":102},"Afraid:Melee_Res_Boolean":{"scale":-0.5,"table":102},"Terrorized:Melee_Res_Boolean":{"scale":-0.5,"table":102}}}}},"knives_of_vengeance":{"t1":{"pets":["knives_lt"],"damage":{"Ranged_Damage":{"Lethal":1.15},"Melee_Damage":{"Lethal":1.925}},"buffs":{"absolute":{"Heal_Dmg:Melee_HealSelf":{"scale":1,"table":111}}},"debuffs":{"current":{"Recovery":-0.3,"RunningSpeed:Ranged_Slow":{"scale":0.15,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.15,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.15,"table":2},"JumpHeight:Ranged_Slow":{"scale":0.15,"table":2},"Regeneration":-0.25},"strength":{"RechargeTime:Ranged_Slow":{"scale":0.15,"table":2}},"resistance":{"Heal_Dmg":0.5}}},"t2_core":{"pets":["knives_boss"],"damage":{"Ranged_Damage":{"Lethal":2.2,"Toxic":4.16}},"debuffs":{"strength":{"Smashing_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Lethal_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Fire_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Cold_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Energy_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Negative_Energy_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Psionic_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Toxic_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Ranged:Ranged_Stun":{"scale":-0.5,"table":106},"Melee:Ranged_Stun":{"scale":-0.5,"table":106},"Area:Ranged_Stun":{"scale":-0.5,"table":106},"Smashing:Ranged_Stun":{"scale":-0.5,"table":106},"Lethal:Ranged_Stun":{"scale":-0.5,"table":106},"Fire:Ranged_Stun":{"scale":-0.5,"table":106},"Cold:Ranged_Stun":{"scale":-0.5,"table":106},"Energy:Ranged_Stun":{"scale":-0.5,"table":106},"Negative_Energy:Ranged_Stun":{"scale":-0.5,"table":106},"Psionic:Ranged_Stun":{"scale":-0.5,"table":106},"Toxic:Ranged_Stun":{"scale":-0.5,"table":106},"Base_Defense:Ranged_Stun":{"scale":-0.5,"table":106},"Endurance:Ranged_Stun":{"scale":-0.5,"table":106},"ToHit:Ranged_Stun":{"scale":-0.5,"table":106},"RunningSpeed:Ranged_Stun":{"scale":-0.5,"table":106},"FlyingSpeed:Ranged_Stun":{"scale":-0.5,"table":106},"Confused:Ranged_Stun":{"scale":-0.5,"table":106},"Terrorized:Ranged_Stun":{"scale":-0.5,"table":106},"Held:Ranged_Stun":{"scale":-0.5,"table":106},"Immobilized:Ranged_Stun":{"scale":-0.5,"table":106},"Stunned:Ranged_Stun":{"scale":-0.5,"table":106},"Sleep:Ranged_Stun":{"scale":-0.5,"table":106},"Knockup:Ranged_Stun":{"scale":-0.5,"table":106},"Knockback:Ranged_Stun":{"scale":-0.5,"table":106},"Repel:Ranged_Stun":{"scale":-0.5,"table":106},"Heal_Dmg:Ranged_Stun":{"scale":-0.5,"table":106}},"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":1.5,"table":22},"Stunned:Ranged_PvPMez":{"scale":4,"table":34},"Stunned":16,"Regeneration":-0.15,"Recovery":-0.15,"Held:Ranged_PvPMez":{"scale":4,"table":34},"Held:Ranged_Immobilize":{"scale":32,"table":33}}}},"t2_radial":{"pets":["knives_lt","knives_support"],"damage":{"Ranged_Damage":{"Lethal":1.15},"Melee_Damage":{"Lethal":1.925}},"buffs":{"absolute":{"Heal_Dmg:Melee_HealSelf":{"scale":1,"table":111}},"current":{"Recovery":4,"Regeneration":2.5,"ToHit:Melee_Buff_ToHit":{"scale":2,"table":12},"Placate":-8,"Confused":-8,"Afraid":-8,"Terrorized":-8,"Held":-8,"Immobilized":-8,"Stunned":-8,"Sleep":-8,"Knockup":-8,"Knockback":-8,"Repel":-8},"strength":{"Smashing_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Lethal_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Fire_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Cold_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Energy_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Negative_Energy_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Psionic_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Toxic_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Smashing_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Lethal_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Fire_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Cold_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Energy_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Negative_Energy_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Psionic_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Toxic_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114}},"resistance":{"Teleport":1,"RunningSpeed":1,"JumpingSpeed":1,"JumpHeight":1,"Placate":1,"Confused":1,"Afraid":1,"Terrorized":1,"Held":1,"Immobilized":1,"Stunned":1,"Sleep":1,"Knockup":1,"Knockback":1,"Repel":1,"RechargeTime":1}},"debuffs":{"current":{"Recovery":-0.3,"RunningSpeed:Ranged_Slow":{"scale":0.15,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.15,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.15,"table":2},"JumpHeight:Ranged_Slow":{"scale":0.15,"table":2},"Regeneration":-0.25},"strength":{"RechargeTime:Ranged_Slow":{"scale":0.15,"table":2}},"resistance":{"Heal_Dmg":0.5}}},"t3_core_1":{"pets":["knives_boss","knives_lt"],"damage":{"Ranged_Damage":{"Lethal":3.35,"Toxic":4.16},"Melee_Damage":{"Lethal":1.925}},"buffs":{"absolute":{"Heal_Dmg:Melee_HealSelf":{"scale":1,"table":111}}},"debuffs":{"strength":{"Smashing_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Lethal_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Fire_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Cold_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Energy_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Negative_Energy_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Psionic_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Toxic_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Ranged:Ranged_Stun":{"scale":-0.5,"table":106},"Melee:Ranged_Stun":{"scale":-0.5,"table":106},"Area:Ranged_Stun":{"scale":-0.5,"table":106},"Smashing:Ranged_Stun":{"scale":-0.5,"table":106},"Lethal:Ranged_Stun":{"scale":-0.5,"table":106},"Fire:Ranged_Stun":{"scale":-0.5,"table":106},"Cold:Ranged_Stun":{"scale":-0.5,"table":106},"Energy:Ranged_Stun":{"scale":-0.5,"table":106},"Negative_Energy:Ranged_Stun":{"scale":-0.5,"table":106},"Psionic:Ranged_Stun":{"scale":-0.5,"table":106},"Toxic:Ranged_Stun":{"scale":-0.5,"table":106},"Base_Defense:Ranged_Stun":{"scale":-0.5,"table":106},"Endurance:Ranged_Stun":{"scale":-0.5,"table":106},"ToHit:Ranged_Stun":{"scale":-0.5,"table":106},"RunningSpeed:Ranged_Stun":{"scale":-0.5,"table":106},"FlyingSpeed:Ranged_Stun":{"scale":-0.5,"table":106},"Confused:Ranged_Stun":{"scale":-0.5,"table":106},"Terrorized:Ranged_Stun":{"scale":-0.5,"table":106},"Held:Ranged_Stun":{"scale":-0.5,"table":106},"Immobilized:Ranged_Stun":{"scale":-0.5,"table":106},"Stunned:Ranged_Stun":{"scale":-0.5,"table":106},"Sleep:Ranged_Stun":{"scale":-0.5,"table":106},"Knockup:Ranged_Stun":{"scale":-0.5,"table":106},"Knockback:Ranged_Stun":{"scale":-0.5,"table":106},"Repel:Ranged_Stun":{"scale":-0.5,"table":106},"Heal_Dmg:Ranged_Stun":{"scale":-0.5,"table":106},"RechargeTime:Ranged_Slow":{"scale":0.15,"table":2}},"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":1.5,"table":22},"Stunned:Ranged_PvPMez":{"scale":4,"table":34},"Stunned":16,"Regeneration":-0.4,"Recovery":-0.45,"Held:Ranged_PvPMez":{"scale":4,"table":34},"Held:Ranged_Immobilize":{"scale":32,"table":33},"RunningSpeed:Ranged_Slow":{"scale":0.15,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.15,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.15,"table":2},"JumpHeight:Ranged_Slow":{"scale":0.15,"table":2}},"resistance":{"Heal_Dmg":0.5}}},"t3_core_2":{"pets":["knives_boss","knives_support"],"damage":{"Ranged_Damage":{"Lethal":2.2,"Toxic":4.16}},"buffs":{"current":{"Recovery":4,"Regeneration":2.5,"ToHit:Melee_Buff_ToHit":{"scale":2,"table":12},"Placate":-8,"Confused":-8,"Afraid":-8,"Terrorized":-8,"Held":-8,"Immobilized":-8,"Stunned":-8,"Sleep":-8,"Knockup":-8,"Knockback":-8,"Repel":-8},"strength":{"Smashing_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Lethal_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Fire_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Cold_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Energy_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Negative_Energy_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Psionic_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Toxic_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Smashing_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Lethal_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Fire_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Cold_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Energy_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Negative_Energy_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Psionic_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Toxic_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114}},"resistance":{"Teleport":1,"RunningSpeed":1,"JumpingSpeed":1,"JumpHeight":1,"Placate":1,"Confused":1,"Afraid":1,"Terrorized":1,"Held":1,"Immobilized":1,"Stunned":1,"Sleep":1,"Knockup":1,"Knockback":1,"Repel":1,"RechargeTime":1}},"debuffs":{"strength":{"Smashing_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Lethal_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Fire_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Cold_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Energy_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Negative_Energy_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Psionic_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Toxic_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Ranged:Ranged_Stun":{"scale":-0.5,"table":106},"Melee:Ranged_Stun":{"scale":-0.5,"table":106},"Area:Ranged_Stun":{"scale":-0.5,"table":106},"Smashing:Ranged_Stun":{"scale":-0.5,"table":106},"Lethal:Ranged_Stun":{"scale":-0.5,"table":106},"Fire:Ranged_Stun":{"scale":-0.5,"table":106},"Cold:Ranged_Stun":{"scale":-0.5,"table":106},"Energy:Ranged_Stun":{"scale":-0.5,"table":106},"Negative_Energy:Ranged_Stun":{"scale":-0.5,"table":106},"Psionic:Ranged_Stun":{"scale":-0.5,"table":106},"Toxic:Ranged_Stun":{"scale":-0.5,"table":106},"Base_Defense:Ranged_Stun":{"scale":-0.5,"table":106},"Endurance:Ranged_Stun":{"scale":-0.5,"table":106},"ToHit:Ranged_Stun":{"scale":-0.5,"table":106},"RunningSpeed:Ranged_Stun":{"scale":-0.5,"table":106},"FlyingSpeed:Ranged_Stun":{"scale":-0.5,"table":106},"Confused:Ranged_Stun":{"scale":-0.5,"table":106},"Terrorized:Ranged_Stun":{"scale":-0.5,"table":106},"Held:Ranged_Stun":{"scale":-0.5,"table":106},"Immobilized:Ranged_Stun":{"scale":-0.5,"table":106},"Stunned:Ranged_Stun":{"scale":-0.5,"table":106},"Sleep:Ranged_Stun":{"scale":-0.5,"table":106},"Knockup:Ranged_Stun":{"scale":-0.5,"table":106},"Knockback:Ranged_Stun":{"scale":-0.5,"table":106},"Repel:Ranged_Stun":{"scale":-0.5,"table":106},"Heal_Dmg:Ranged_Stun":{"scale":-0.5,"table":106}},"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":1.5,"table":22},"Stunned:Ranged_PvPMez":{"scale":4,"table":34},"Stunned":16,"Regeneration":-0.15,"Recovery":-0.15,"Held:Ranged_PvPMez":{"scale":4,"table":34},"Held:Ranged_Immobilize":{"scale":32,"table":33}}}},"t3_radial_1":{"pets":["knives_boss","knives_support"],"damage":{"Ranged_Damage":{"Lethal":2.2,"Toxic":4.16}},"buffs":{"current":{"Recovery":4,"Regeneration":2.5,"ToHit:Melee_Buff_ToHit":{"scale":2,"table":12},"Placate":-8,"Confused":-8,"Afraid":-8,"Terrorized":-8,"Held":-8,"Immobilized":-8,"Stunned":-8,"Sleep":-8,"Knockup":-8,"Knockback":-8,"Repel":-8},"strength":{"Smashing_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Lethal_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Fire_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Cold_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Energy_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Negative_Energy_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Psionic_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Toxic_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Smashing_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Lethal_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Fire_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Cold_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Energy_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Negative_Energy_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Psionic_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Toxic_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114}},"resistance":{"Teleport":1,"RunningSpeed":1,"JumpingSpeed":1,"JumpHeight":1,"Placate":1,"Confused":1,"Afraid":1,"Terrorized":1,"Held":1,"Immobilized":1,"Stunned":1,"Sleep":1,"Knockup":1,"Knockback":1,"Repel":1,"RechargeTime":1}},"debuffs":{"strength":{"Smashing_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Lethal_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Fire_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Cold_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Energy_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Negative_Energy_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Psionic_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Toxic_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Ranged:Ranged_Stun":{"scale":-0.5,"table":106},"Melee:Ranged_Stun":{"scale":-0.5,"table":106},"Area:Ranged_Stun":{"scale":-0.5,"table":106},"Smashing:Ranged_Stun":{"scale":-0.5,"table":106},"Lethal:Ranged_Stun":{"scale":-0.5,"table":106},"Fire:Ranged_Stun":{"scale":-0.5,"table":106},"Cold:Ranged_Stun":{"scale":-0.5,"table":106},"Energy:Ranged_Stun":{"scale":-0.5,"table":106},"Negative_Energy:Ranged_Stun":{"scale":-0.5,"table":106},"Psionic:Ranged_Stun":{"scale":-0.5,"table":106},"Toxic:Ranged_Stun":{"scale":-0.5,"table":106},"Base_Defense:Ranged_Stun":{"scale":-0.5,"table":106},"Endurance:Ranged_Stun":{"scale":-0.5,"table":106},"ToHit:Ranged_Stun":{"scale":-0.5,"table":106},"RunningSpeed:Ranged_Stun":{"scale":-0.5,"table":106},"FlyingSpeed:Ranged_Stun":{"scale":-0.5,"table":106},"Confused:Ranged_Stun":{"scale":-0.5,"table":106},"Terrorized:Ranged_Stun":{"scale":-0.5,"table":106},"Held:Ranged_Stun":{"scale":-0.5,"table":106},"Immobilized:Ranged_Stun":{"scale":-0.5,"table":106},"Stunned:Ranged_Stun":{"scale":-0.5,"table":106},"Sleep:Ranged_Stun":{"scale":-0.5,"table":106},"Knockup:Ranged_Stun":{"scale":-0.5,"table":106},"Knockback:Ranged_Stun":{"scale":-0.5,"table":106},"Repel:Ranged_Stun":{"scale":-0.5,"table":106},"Heal_Dmg:Ranged_Stun":{"scale":-0.5,"table":106}},"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":1.5,"table":22},"Stunned:Ranged_PvPMez":{"scale":4,"table":34},"Stunned":16,"Regeneration":-0.15,"Recovery":-0.15,"Held:Ranged_PvPMez":{"scale":4,"table":34},"Held:Ranged_Immobilize":{"scale":32,"table":33}}}},"t3_radial_2":{"pets":["knives_lt","knives_support_attack"],"damage":{"Ranged_Damage":{"Lethal":1.15},"Melee_Damage":{"Lethal":1.925,"Smashing":0.65}},"buffs":{"absolute":{"Heal_Dmg:Melee_HealSelf":{"scale":1,"table":111}},"current":{"Knockback:Melee_Knockback":{"scale":4,"table":116},"ToHit:Melee_DeBuff_ToHit":{"scale":0.5,"table":68},"Stunned:Melee_PvPMez":{"scale":4,"table":117},"Stunned":16},"strength":{"RechargeTime:Melee_Slow":{"scale":0.15,"table":118},"Smashing_Dmg:Melee_Debuff_Dam":{"scale":2,"table":28},"Lethal_Dmg:Melee_Debuff_Dam":{"scale":2,"table":28},"Fire_Dmg:Melee_Debuff_Dam":{"scale":2,"table":28},"Cold_Dmg:Melee_Debuff_Dam":{"scale":2,"table":28},"Energy_Dmg:Melee_Debuff_Dam":{"scale":2,"table":28},"Negative_Energy_Dmg:Melee_Debuff_Dam":{"scale":2,"table":28},"Psionic_Dmg:Melee_Debuff_Dam":{"scale":2,"table":28},"Toxic_Dmg:Melee_Debuff_Dam":{"scale":2,"table":28}}},"debuffs":{"current":{"Recovery":-0.3,"RunningSpeed:Ranged_Slow":{"scale":0.15,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.15,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.15,"table":2},"JumpHeight:Ranged_Slow":{"scale":0.15,"table":2},"Regeneration":-0.25},"strength":{"RechargeTime:Ranged_Slow":{"scale":0.15,"table":2}},"resistance":{"Heal_Dmg":0.5}}},"t4_core":{"pets":["knives_boss","knives_lt"],"damage":{"Ranged_Damage":{"Lethal":3.35,"Toxic":4.16},"Melee_Damage":{"Lethal":1.925}},"buffs":{"absolute":{"Heal_Dmg:Melee_HealSelf":{"scale":1,"table":111}}},"debuffs":{"strength":{"Smashing_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Lethal_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Fire_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Cold_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Energy_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Negative_Energy_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Psionic_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Toxic_Dmg:Ranged_Debuff_Dam":{"scale":4,"table":70},"Ranged:Ranged_Stun":{"scale":-0.5,"table":106},"Melee:Ranged_Stun":{"scale":-0.5,"table":106},"Area:Ranged_Stun":{"scale":-0.5,"table":106},"Smashing:Ranged_Stun":{"scale":-0.5,"table":106},"Lethal:Ranged_Stun":{"scale":-0.5,"table":106},"Fire:Ranged_Stun":{"scale":-0.5,"table":106},"Cold:Ranged_Stun":{"scale":-0.5,"table":106},"Energy:Ranged_Stun":{"scale":-0.5,"table":106},"Negative_Energy:Ranged_Stun":{"scale":-0.5,"table":106},"Psionic:Ranged_Stun":{"scale":-0.5,"table":106},"Toxic:Ranged_Stun":{"scale":-0.5,"table":106},"Base_Defense:Ranged_Stun":{"scale":-0.5,"table":106},"Endurance:Ranged_Stun":{"scale":-0.5,"table":106},"ToHit:Ranged_Stun":{"scale":-0.5,"table":106},"RunningSpeed:Ranged_Stun":{"scale":-0.5,"table":106},"FlyingSpeed:Ranged_Stun":{"scale":-0.5,"table":106},"Confused:Ranged_Stun":{"scale":-0.5,"table":106},"Terrorized:Ranged_Stun":{"scale":-0.5,"table":106},"Held:Ranged_Stun":{"scale":-0.5,"table":106},"Immobilized:Ranged_Stun":{"scale":-0.5,"table":106},"Stunned:Ranged_Stun":{"scale":-0.5,"table":106},"Sleep:Ranged_Stun":{"scale":-0.5,"table":106},"Knockup:Ranged_Stun":{"scale":-0.5,"table":106},"Knockback:Ranged_Stun":{"scale":-0.5,"table":106},"Repel:Ranged_Stun":{"scale":-0.5,"table":106},"Heal_Dmg:Ranged_Stun":{"scale":-0.5,"table":106},"RechargeTime:Ranged_Slow":{"scale":0.15,"table":2}},"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":1.5,"table":22},"Stunned:Ranged_PvPMez":{"scale":4,"table":34},"Stunned":16,"Regeneration":-0.4,"Recovery":-0.45,"Held:Ranged_PvPMez":{"scale":4,"table":34},"Held:Ranged_Immobilize":{"scale":32,"table":33},"RunningSpeed:Ranged_Slow":{"scale":0.15,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.15,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.15,"table":2},"JumpHeight:Ranged_Slow":{"scale":0.15,"table":2}},"resistance":{"Heal_Dmg":0.5}}},"t4_radial":{"pets":["knives_lt","knives_support"],"damage":{"Ranged_Damage":{"Lethal":1.15},"Melee_Damage":{"Lethal":1.925}},"buffs":{"absolute":{"Heal_Dmg:Melee_HealSelf":{"scale":1,"table":111}},"current":{"Recovery":4,"Regeneration":2.5,"ToHit:Melee_Buff_ToHit":{"scale":2,"table":12},"Placate":-8,"Confused":-8,"Afraid":-8,"Terrorized":-8,"Held":-8,"Immobilized":-8,"Stunned":-8,"Sleep":-8,"Knockup":-8,"Knockback":-8,"Repel":-8},"strength":{"Smashing_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Lethal_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Fire_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Cold_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Energy_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Negative_Energy_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Psionic_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Toxic_Dmg:Ranged_Buff_Dmg":{"scale":3,"table":41},"Smashing_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Lethal_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Fire_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Cold_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Energy_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Negative_Energy_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Psionic_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114},"Toxic_Dmg:Melee_Buff_Dmg":{"scale":3,"table":114}},"resistance":{"Teleport":1,"RunningSpeed":1,"JumpingSpeed":1,"JumpHeight":1,"Placate":1,"Confused":1,"Afraid":1,"Terrorized":1,"Held":1,"Immobilized":1,"Stunned":1,"Sleep":1,"Knockup":1,"Knockback":1,"Repel":1,"RechargeTime":1}},"debuffs":{"current":{"Recovery":-0.3,"RunningSpeed:Ranged_Slow":{"scale":0.15,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.15,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.15,"table":2},"JumpHeight:Ranged_Slow":{"scale":0.15,"table":2},"Regeneration":-0.25},"strength":{"RechargeTime:Ranged_Slow":{"scale":0.15,"table":2}},"resistance":{"Heal_Dmg":0.5}}}},"longbow":{"t1":{"pets":["longbow_lt"],"damage":{"Ranged_Damage":{"Lethal":3.23,"Smashing":0.3}},"debuffs":{"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3}}}},"t2_core":{"pets":["longbow_boss"],"damage":{"Ranged_Damage":{"Smashing":2.2,"Lethal":0.8,"Energy":5.2}},"debuffs":{"current":{"Knockback:Ranged_Knockback":{"scale":6,"table":127}}}},"t2_radial":{"pets":["longbow_lt","longbow_support"],"damage":{"Ranged_Damage":{"Lethal":3.23,"Smashing":0.3}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":2.96,"table":16}}},"debuffs":{"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3}}}},"t3_core_1":{"pets":["longbow_boss","longbow_lt"],"damage":{"Ranged_Damage":{"Smashing":2.5,"Lethal":4.03,"Energy":5.2}},"debuffs":{"current":{"Knockback:Ranged_Knockback":{"scale":6,"table":127},"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3}}}},"t3_core_2":{"pets":["longbow_boss","longbow_support"],"damage":{"Ranged_Damage":{"Smashing":2.2,"Lethal":0.8,"Energy":5.2}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":2.96,"table":16}}},"debuffs":{"current":{"Knockback:Ranged_Knockback":{"scale":6,"table":127}}}},"t3_radial_1":{"pets":["longbow_boss","longbow_support"],"damage":{"Ranged_Damage":{"Smashing":2.2,"Lethal":0.8,"Energy":5.2}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":2.96,"table":16}}},"debuffs":{"current":{"Knockback:Ranged_Knockback":{"scale":6,"table":127}}}},"t3_radial_2":{"pets":["longbow_lt","longbow_support"],"damage":{"Ranged_Damage":{"Lethal":3.23,"Smashing":0.3}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":2.96,"table":16}}},"debuffs":{"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3}}}},"t4_core":{"pets":["longbow_boss","longbow_lt"],"damage":{"Ranged_Damage":{"Smashing":2.5,"Lethal":4.03,"Energy":5.2}},"debuffs":{"current":{"Knockback:Ranged_Knockback":{"scale":6,"table":127},"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3}}}},"t4_radial":{"pets":["longbow_lt","longbow_support"],"damage":{"Ranged_Damage":{"Lethal":3.23,"Smashing":0.3}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":2.96,"table":16}}},"debuffs":{"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3}}}}},"nemesis":{"t1":{"pets":["nemesis_lt"],"damage":{"Ranged_Damage":{"Lethal":0.32,"Fire":1},"Melee_Damage":{"Lethal":1,"Fire":0.32}}},"t2_core":{"pets":["nemesis_boss"],"damage":{"Melee_Damage":{"Lethal":2.07,"Fire":0.75},"Ranged_Damage":{"Lethal":0.32,"Fire":2.435}}},"t2_radial":{"pets":["nemesis_lt","nemesis_support"],"damage":{"Ranged_Damage":{"Lethal":0.32,"Fire":1},"Melee_Damage":{"Lethal":1,"Fire":0.32}},"buffs":{"absolute":{"Heal_Dmg:Melee_Heal":{"scale":1.96,"table":101},"Heal_Dmg:Ranged_Heal":{"scale":1,"table":16}},"current":{"Confused:Melee_Res_Boolean":{"scale":-30,"table":102},"Terrorized:Melee_Res_Boolean":{"scale":-30,"table":102},"Held:Melee_Res_Boolean":{"scale":-30,"table":102},"Immobilized:Melee_Res_Boolean":{"scale":-30,"table":102},"Stunned:Melee_Res_Boolean":{"scale":-30,"table":102},"Sleep:Melee_Res_Boolean":{"scale":-30,"table":102}},"resistance":{"Confused:Melee_Res_Boolean":{"scale":3,"table":102},"Terrorized:Melee_Res_Boolean":{"scale":3,"table":102},"Held:Melee_Res_Boolean":{"scale":3,"table":102},"Immobilized:Melee_Res_Boolean":{"scale":3,"table":102},"Stunned:Melee_Res_Boolean":{"scale":3,"table":102},"Sleep:Melee_Res_Boolean":{"scale":3,"table":102}}}},"t3_core_1":{"pets":["nemesis_boss","nemesis_lt"],"damage":{"Melee_Damage":{"Lethal":3.07,"Fire":1.07},"Ranged_Damage":{"Lethal":0.64,"Fire":3.435}}},"t3_core_2":{"pets":["nemesis_boss","nemesis_support"],"damage":{"Melee_Damage":{"Lethal":2.07,"Fire":0.75},"Ranged_Damage":{"Lethal":0.32,"Fire":2.435}},"buffs":{"absolute":{"Heal_Dmg:Melee_Heal":{"scale":1.96,"table":101},"Heal_Dmg:Ranged_Heal":{"scale":1,"table":16}},"current":{"Confused:Melee_Res_Boolean":{"scale":-30,"table":102},"Terrorized:Melee_Res_Boolean":{"scale":-30,"table":102},"Held:Melee_Res_Boolean":{"scale":-30,"table":102},"Immobilized:Melee_Res_Boolean":{"scale":-30,"table":102},"Stunned:Melee_Res_Boolean":{"scale":-30,"table":102},"Sleep:Melee_Res_Boolean":{"scale":-30,"table":102}},"resistance":{"Confused:Melee_Res_Boolean":{"scale":3,"table":102},"Terrorized:Melee_Res_Boolean":{"scale":3,"table":102},"Held:Melee_Res_Boolean":{"scale":3,"table":102},"Immobilized:Melee_Res_Boolean":{"scale":3,"table":102},"Stunned:Melee_Res_Boolean":{"scale":3,"table":102},"Sleep:Melee_Res_Boolean":{"scale":3,"table":102}}}},"t3_radial_1":{"pets":["nemesis_boss","nemesis_support"],"damage":{"Melee_Damage":{"Lethal":2.07,"Fire":0.75},"Ranged_Damage":{"Lethal":0.32,"Fire":2.435}},"buffs":{"absolute":{"Heal_Dmg:Melee_Heal":{"scale":1.96,"table":101},"Heal_Dmg:Ranged_Heal":{"scale":1,"table":16}},"current":{"Confused:Melee_Res_Boolean":{"scale":-30,"table":102},"Terrorized:Melee_Res_Boolean":{"scale":-30,"table":102},"Held:Melee_Res_Boolean":{"scale":-30,"table":102},"Immobilized:Melee_Res_Boolean":{"scale":-30,"table":102},"Stunned:Melee_Res_Boolean":{"scale":-30,"table":102},"Sleep:Melee_Res_Boolean":{"scale":-30,"table":102}},"resistance":{"Confused:Melee_Res_Boolean":{"scale":3,"table":102},"Terrorized:Melee_Res_Boolean":{"scale":3,"table":102},"Held:Melee_Res_Boolean":{"scale":3,"table":102},"Immobilized:Melee_Res_Boolean":{"scale":3,"table":102},"Stunned:Melee_Res_Boolean":{"scale":3,"table":102},"Sleep:Melee_Res_Boolean":{"scale":3,"table":102}}}},"t3_radial_2":{"pets":["nemesis_lt","nemesis_support_attack"],"damage":{"Ranged_Damage":{"Lethal":1.32,"Fire":1},"Melee_Damage":{"Lethal":1,"Fire":0.32}}},"t4_core":{"pets":["nemesis_boss","nemesis_lt"],"damage":{"Melee_Damage":{"Lethal":3.07,"Fire":1.07},"Ranged_Damage":{"Lethal":0.64,"Fire":3.435}}},"t4_radial":{"pets":["nemesis_lt","nemesis_support"],"damage":{"Ranged_Damage":{"Lethal":0.32,"Fire":1},"Melee_Damage":{"Lethal":1,"Fire":0.32}},"buffs":{"absolute":{"Heal_Dmg:Melee_Heal":{"scale":1.96,"table":101},"Heal_Dmg:Ranged_Heal":{"scale":1,"table":16}},"current":{"Confused:Melee_Res_Boolean":{"scale":-30,"table":102},"Terrorized:Melee_Res_Boolean":{"scale":-30,"table":102},"Held:Melee_Res_Boolean":{"scale":-30,"table":102},"Immobilized:Melee_Res_Boolean":{"scale":-30,"table":102},"Stunned:Melee_Res_Boolean":{"scale":-30,"table":102},"Sleep:Melee_Res_Boolean":{"scale":-30,"table":102}},"resistance":{"Confused:Melee_Res_Boolean":{"scale":3,"table":102},"Terrorized:Melee_Res_Boolean":{"scale":3,"table":102},"Held:Melee_Res_Boolean":{"scale":3,"table":102},"Immobilized:Melee_Res_Boolean":{"scale":3,"table":102},"Stunned:Melee_Res_Boolean":{"scale":3,"table":102},"Sleep:Melee_Res_Boolean":{"scale":3,"table":102}}}}},"phantom":{"t1":{"pets":["phantoms_lt"],"damage":{"Ranged_Damage":{"Fire":1.45},"Melee_Damage":{"Lethal":0.5,"Fire":1.12}}},"t2_core":{"pets":["phantoms_boss"],"damage":{"Melee_Damage":{"Lethal":1.735,"Cold":1,"Fire":0.975},"Ranged_Damage":{"Fire":1.45}},"debuffs":{"strength":{"JumpHeight:Melee_Slow":{"scale":0.2,"table":118},"RechargeTime:Melee_Slow":{"scale":0.2,"table":118}},"current":{"RunningSpeed:Melee_Slow":{"scale":0.2,"table":118},"FlyingSpeed:Melee_Slow":{"scale":0.2,"table":118},"JumpingSpeed:Melee_Slow":{"scale":0.2,"table":118}}}},"t2_radial":{"pets":["phantoms_lt","phantoms_support"],"damage":{"Ranged_Damage":{"Fire":1.45},"Melee_Damage":{"Lethal":0.5,"Fire":1.12}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}},"current":{"Recovery":4,"Regeneration":2.5},"strength":{"RechargeTime":0.5},"resistance":{"RunningSpeed":0.4,"FlyingSpeed":0.4,"JumpingSpeed":0.4,"JumpHeight":0.4,"RechargeTime":0.4}}},"t3_core_1":{"pets":["phantoms_boss","phantoms_lt"],"damage":{"Melee_Damage":{"Lethal":2.235,"Cold":1,"Fire":2.095},"Ranged_Damage":{"Fire":2.9}},"debuffs":{"strength":{"JumpHeight:Melee_Slow":{"scale":0.2,"table":118},"RechargeTime:Melee_Slow":{"scale":0.2,"table":118}},"current":{"RunningSpeed:Melee_Slow":{"scale":0.2,"table":118},"FlyingSpeed:Melee_Slow":{"scale":0.2,"table":118},"JumpingSpeed:Melee_Slow":{"scale":0.2,"table":118}}}},"t3_core_2":{"pets":["phantoms_boss","phantoms_support"],"damage":{"Melee_Damage":{"Lethal":1.735,"Cold":1,"Fire":0.975},"Ranged_Damage":{"Fire":1.45}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}},"current":{"Recovery":4,"Regeneration":2.5},"strength":{"RechargeTime":0.5},"resistance":{"RunningSpeed":0.4,"FlyingSpeed":0.4,"JumpingSpeed":0.4,"JumpHeight":0.4,"RechargeTime":0.4}},"debuffs":{"strength":{"JumpHeight:Melee_Slow":{"scale":0.2,"table":118},"RechargeTime:Melee_Slow":{"scale":0.2,"table":118}},"current":{"RunningSpeed:Melee_Slow":{"scale":0.2,"table":118},"FlyingSpeed:Melee_Slow":{"scale":0.2,"table":118},"JumpingSpeed:Melee_Slow":{"scale":0.2,"table":118}}}},"t3_radial_1":{"pets":["phantoms_boss","phantoms_support"],"damage":{"Melee_Damage":{"Lethal":1.735,"Cold":1,"Fire":0.975},"Ranged_Damage":{"Fire":1.45}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}},"current":{"Recovery":4,"Regeneration":2.5},"strength":{"RechargeTime":0.5},"resistance":{"RunningSpeed":0.4,"FlyingSpeed":0.4,"JumpingSpeed":0.4,"JumpHeight":0.4,"RechargeTime":0.4}},"debuffs":{"strength":{"JumpHeight:Melee_Slow":{"scale":0.2,"table":118},"RechargeTime:Melee_Slow":{"scale":0.2,"table":118}},"current":{"RunningSpeed:Melee_Slow":{"scale":0.2,"table":118},"FlyingSpeed:Melee_Slow":{"scale":0.2,"table":118},"JumpingSpeed:Melee_Slow":{"scale":0.2,"table":118}}}},"t3_radial_2":{"pets":["phantoms_lt","phantoms_support"],"damage":{"Ranged_Damage":{"Fire":1.45},"Melee_Damage":{"Lethal":0.5,"Fire":1.12}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}},"current":{"Recovery":4,"Regeneration":2.5},"strength":{"RechargeTime":0.5},"resistance":{"RunningSpeed":0.4,"FlyingSpeed":0.4,"JumpingSpeed":0.4,"JumpHeight":0.4,"RechargeTime":0.4}}},"t4_core":{"pets":["phantoms_boss","phantoms_lt"],"damage":{"Melee_Damage":{"Lethal":2.235,"Cold":1,"Fire":2.095},"Ranged_Damage":{"Fire":2.9}},"debuffs":{"strength":{"JumpHeight:Melee_Slow":{"scale":0.2,"table":118},"RechargeTime:Melee_Slow":{"scale":0.2,"table":118}},"current":{"RunningSpeed:Melee_Slow":{"scale":0.2,"table":118},"FlyingSpeed:Melee_Slow":{"scale":0.2,"table":118},"JumpingSpeed:Melee_Slow":{"scale":0.2,"table":118}}}},"t4_radial":{"pets":["phantoms_lt","phantoms_support"],"damage":{"Ranged_Damage":{"Fire":1.45},"Melee_Damage":{"Lethal":0.5,"Fire":1.12}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}},"current":{"Recovery":4,"Regeneration":2.5},"strength":{"RechargeTime":0.5},"resistance":{"RunningSpeed":0.4,"FlyingSpeed":0.4,"JumpingSpeed":0.4,"JumpHeight":0.4,"RechargeTime":0.4}}}},"polar_lights":{"t1":{"pets":["lights_lt"],"damage":{"Ranged_Damage":{"Energy":2.3}},"debuffs":{"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":2,"table":3}}}},"t2_core":{"pets":["lights_boss"],"damage":{"Ranged_Damage":{"Energy":4.54,"Smashing":0.3}},"debuffs":{"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":5,"table":3}}}},"t2_radial":{"pets":["lights_lt","lights_support"],"damage":{"Ranged_Damage":{"Energy":2.3}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}},"strength":{"Smashing_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Lethal_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Fire_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Cold_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Energy_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Negative_Energy_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Psionic_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Toxic_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41}},"resistance":{"Taunt:Ranged_Res_Boolean":{"scale":1.75,"table":80},"Placate:Ranged_Res_Boolean":{"scale":1.75,"table":80}}},"debuffs":{"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":2,"table":3}}}},"t3_core_1":{"pets":["lights_boss","lights_lt"],"damage":{"Ranged_Damage":{"Energy":6.84,"Smashing":0.3}},"debuffs":{"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":7,"table":3}}}},"t3_core_2":{"pets":["lights_boss","lights_support"],"damage":{"Ranged_Damage":{"Energy":4.54,"Smashing":0.3}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}},"strength":{"Smashing_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Lethal_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Fire_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Cold_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Energy_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Negative_Energy_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Psionic_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Toxic_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41}},"resistance":{"Taunt:Ranged_Res_Boolean":{"scale":1.75,"table":80},"Placate:Ranged_Res_Boolean":{"scale":1.75,"table":80}}},"debuffs":{"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":5,"table":3}}}},"t3_radial_1":{"pets":["lights_boss","lights_support"],"damage":{"Ranged_Damage":{"Energy":4.54,"Smashing":0.3}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}},"strength":{"Smashing_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Lethal_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Fire_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Cold_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Energy_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Negative_Energy_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Psionic_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Toxic_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41}},"resistance":{"Taunt:Ranged_Res_Boolean":{"scale":1.75,"table":80},"Placate:Ranged_Res_Boolean":{"scale":1.75,"table":80}}},"debuffs":{"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":5,"table":3}}}},"t3_radial_2":{"pets":["lights_lt","lights_support"],"damage":{"Ranged_Damage":{"Energy":2.3}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}},"strength":{"Smashing_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Lethal_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Fire_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Cold_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Energy_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Negative_Energy_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Psionic_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Toxic_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41}},"resistance":{"Taunt:Ranged_Res_Boolean":{"scale":1.75,"table":80},"Placate:Ranged_Res_Boolean":{"scale":1.75,"table":80}}},"debuffs":{"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":2,"table":3}}}},"t4_core":{"pets":["lights_boss","lights_lt"],"damage":{"Ranged_Damage":{"Energy":6.84,"Smashing":0.3}},"debuffs":{"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":7,"table":3}}}},"t4_radial":{"pets":["lights_lt","lights_support"],"damage":{"Ranged_Damage":{"Energy":2.3}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}},"strength":{"Smashing_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Lethal_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Fire_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Cold_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Energy_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Negative_Energy_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Psionic_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Toxic_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41}},"resistance":{"Taunt:Ranged_Res_Boolean":{"scale":1.75,"table":80},"Placate:Ranged_Res_Boolean":{"scale":1.75,"table":80}}},"debuffs":{"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":2,"table":3}}}}},"rikti":{"t1":{"pets":["rikti_lt"],"damage":{"Melee_Damage":{"Lethal":2,"Energy":0.96},"Ranged_Damage":{"Energy":1.32}}},"t2_core":{"pets":["rikti_boss"],"damage":{"Melee_Damage":{"Lethal":1,"Energy":0.64},"Ranged_Damage":{"Psionic":2.7}},"debuffs":{"strength":{"RechargeTime:Ranged_Slow":{"scale":0.15,"table":2}},"current":{"Sleep:Ranged_Sleep":{"scale":42,"table":144},"Sleep:Ranged_PvPMez":{"scale":3,"table":34},"Held:Ranged_Immobilize":{"scale":36,"table":33},"Held:Ranged_PvPMez":{"scale":3,"table":34}}}},"t2_radial":{"pets":["rikti_lt","rikti_support"],"damage":{"Melee_Damage":{"Lethal":2,"Energy":0.96},"Ranged_Damage":{"Energy":1.32}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1,"table":16}},"strength":{"Smashing_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Lethal_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Fire_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Cold_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Energy_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Negative_Energy_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Psionic_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Toxic_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"RechargeTime":0.15},"resistance":{"Held:Melee_Res_Boolean":{"scale":2.5,"table":102},"Immobilized:Melee_Res_Boolean":{"scale":2.5,"table":102},"Stunned:Melee_Res_Boolean":{"scale":2.5,"table":102},"Sleep:Melee_Res_Boolean":{"scale":2.5,"table":102}},"current":{"RunningSpeed":0.15,"FlyingSpeed":0.15,"Recovery":0.15}}},"t3_core_1":{"pets":["rikti_boss","rikti_lt"],"damage":{"Melee_Damage":{"Lethal":3,"Energy":1.6},"Ranged_Damage":{"Psionic":2.7,"Energy":1.32}},"debuffs":{"strength":{"RechargeTime:Ranged_Slow":{"scale":0.15,"table":2}},"current":{"Sleep:Ranged_Sleep":{"scale":42,"table":144},"Sleep:Ranged_PvPMez":{"scale":3,"table":34},"Held:Ranged_Immobilize":{"scale":36,"table":33},"Held:Ranged_PvPMez":{"scale":3,"table":34}}}},"t3_core_2":{"pets":["rikti_boss","rikti_support"],"damage":{"Melee_Damage":{"Lethal":1,"Energy":0.64},"Ranged_Damage":{"Psionic":2.7}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1,"table":16}},"strength":{"Smashing_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Lethal_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Fire_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Cold_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Energy_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Negative_Energy_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Psionic_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Toxic_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"RechargeTime":0.15},"resistance":{"Held:Melee_Res_Boolean":{"scale":2.5,"table":102},"Immobilized:Melee_Res_Boolean":{"scale":2.5,"table":102},"Stunned:Melee_Res_Boolean":{"scale":2.5,"table":102},"Sleep:Melee_Res_Boolean":{"scale":2.5,"table":102}},"current":{"RunningSpeed":0.15,"FlyingSpeed":0.15,"Recovery":0.15}},"debuffs":{"strength":{"RechargeTime:Ranged_Slow":{"scale":0.15,"table":2}},"current":{"Sleep:Ranged_Sleep":{"scale":42,"table":144},"Sleep:Ranged_PvPMez":{"scale":3,"table":34},"Held:Ranged_Immobilize":{"scale":36,"table":33},"Held:Ranged_PvPMez":{"scale":3,"table":34}}}},"t3_radial_1":{"pets":["rikti_boss","rikti_support"],"damage":{"Melee_Damage":{"Lethal":1,"Energy":0.64},"Ranged_Damage":{"Psionic":2.7}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1,"table":16}},"strength":{"Smashing_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Lethal_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Fire_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Cold_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Energy_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Negative_Energy_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Psionic_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Toxic_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"RechargeTime":0.15},"resistance":{"Held:Melee_Res_Boolean":{"scale":2.5,"table":102},"Immobilized:Melee_Res_Boolean":{"scale":2.5,"table":102},"Stunned:Melee_Res_Boolean":{"scale":2.5,"table":102},"Sleep:Melee_Res_Boolean":{"scale":2.5,"table":102}},"current":{"RunningSpeed":0.15,"FlyingSpeed":0.15,"Recovery":0.15}},"debuffs":{"strength":{"RechargeTime:Ranged_Slow":{"scale":0.15,"table":2}},"current":{"Sleep:Ranged_Sleep":{"scale":42,"table":144},"Sleep:Ranged_PvPMez":{"scale":3,"table":34},"Held:Ranged_Immobilize":{"scale":36,"table":33},"Held:Ranged_PvPMez":{"scale":3,"table":34}}}},"t3_radial_2":{"pets":["rikti_lt","rikti_support"],"damage":{"Melee_Damage":{"Lethal":2,"Energy":0.96},"Ranged_Damage":{"Energy":1.32}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1,"table":16}},"strength":{"Smashing_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Lethal_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Fire_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Cold_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Energy_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Negative_Energy_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Psionic_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Toxic_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"RechargeTime":0.15},"resistance":{"Held:Melee_Res_Boolean":{"scale":2.5,"table":102},"Immobilized:Melee_Res_Boolean":{"scale":2.5,"table":102},"Stunned:Melee_Res_Boolean":{"scale":2.5,"table":102},"Sleep:Melee_Res_Boolean":{"scale":2.5,"table":102}},"current":{"RunningSpeed":0.15,"FlyingSpeed":0.15,"Recovery":0.15}}},"t4_core":{"pets":["rikti_boss","rikti_lt"],"damage":{"Melee_Damage":{"Lethal":3,"Energy":1.6},"Ranged_Damage":{"Psionic":2.7,"Energy":1.32}},"debuffs":{"strength":{"RechargeTime:Ranged_Slow":{"scale":0.15,"table":2}},"current":{"Sleep:Ranged_Sleep":{"scale":42,"table":144},"Sleep:Ranged_PvPMez":{"scale":3,"table":34},"Held:Ranged_Immobilize":{"scale":36,"table":33},"Held:Ranged_PvPMez":{"scale":3,"table":34}}}},"t4_radial":{"pets":["rikti_lt","rikti_support"],"damage":{"Melee_Damage":{"Lethal":2,"Energy":0.96},"Ranged_Damage":{"Energy":1.32}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1,"table":16}},"strength":{"Smashing_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Lethal_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Fire_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Cold_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Energy_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Negative_Energy_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Psionic_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"Toxic_Dmg:Melee_Buff_Dmg":{"scale":1,"table":114},"RechargeTime":0.15},"resistance":{"Held:Melee_Res_Boolean":{"scale":2.5,"table":102},"Immobilized:Melee_Res_Boolean":{"scale":2.5,"table":102},"Stunned:Melee_Res_Boolean":{"scale":2.5,"table":102},"Sleep:Melee_Res_Boolean":{"scale":2.5,"table":102}},"current":{"RunningSpeed":0.15,"FlyingSpeed":0.15,"Recovery":0.15}}}},"robotic_drones":{"t1":{"pets":["drones_lt"],"damage":{"Ranged_Damage":{"Energy":2.57}},"debuffs":{"current":{"Regeneration":-1}}},"t2_core":{"pets":["drones_boss"],"damage":{"Ranged_Damage":{"Energy":3.39}},"debuffs":{"current":{"Regeneration":-1.5}}},"t2_radial":{"pets":["drones_lt"],"damage":{"Ranged_Damage":{"Energy":2.57}},"debuffs":{"current":{"Regeneration":-1}}},"t3_core_1":{"pets":["drones_boss","drones_lt"],"damage":{"Ranged_Damage":{"Energy":5.96}},"debuffs":{"current":{"Regeneration":-2.5}}},"t3_core_2":{"pets":["drones_boss"],"damage":{"Ranged_Damage":{"Energy":3.39}},"debuffs":{"current":{"Regeneration":-1.5}}},"t3_radial_1":{"pets":["drones_boss"],"damage":{"Ranged_Damage":{"Energy":3.39}},"debuffs":{"current":{"Regeneration":-1.5}}},"t3_radial_2":{"pets":["drones_lt"],"damage":{"Ranged_Damage":{"Energy":2.57}},"debuffs":{"current":{"Regeneration":-1}}},"t4_core":{"pets":["drones_boss","drones_lt"],"damage":{"Ranged_Damage":{"Energy":5.96}},"debuffs":{"current":{"Regeneration":-2.5}}},"t4_radial":{"pets":["drones_lt"],"damage":{"Ranged_Damage":{"Energy":2.57}},"debuffs":{"current":{"Regeneration":-1}}}},"rularuu":{"t1":{"pets":["rularuu_lt"],"damage":{"Melee_Damage":{"Smashing":1.2},"Ranged_Damage":{"Lethal":1.2}},"debuffs":{"current":{"Held:Ranged_Immobilize":{"scale":30,"table":33},"Held:Ranged_PvPMez":{"scale":3,"table":34}}}},"t2_core":{"pets":["rularuu_boss"],"damage":{"Ranged_Damage":{"Lethal":1.2,"Energy":1.32},"Melee_Damage":{"Lethal":1.32}},"debuffs":{"current":{"Held:Ranged_Immobilize":{"scale":30,"table":33},"Held:Ranged_PvPMez":{"scale":3,"table":34},"Base_Defense:Ranged_Debuff_Def":{"scale":2,"table":3},"RunningSpeed:Ranged_Slow":{"scale":0.2,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.2,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.2,"table":2}},"strength":{"JumpHeight:Ranged_Slow":{"scale":0.2,"table":2},"RechargeTime:Ranged_Slow":{"scale":0.2,"table":2}}}},"t2_radial":{"pets":["rularuu_lt","rularuu_support"],"damage":{"Melee_Damage":{"Smashing":1.2},"Ranged_Damage":{"Lethal":1.2}},"buffs":{"strength":{"Smashing_Dmg":0.5,"Lethal_Dmg":0.5,"Fire_Dmg":0.5,"Cold_Dmg":0.5,"Energy_Dmg":0.5,"Negative_Energy_Dmg":0.5,"Psionic_Dmg":0.5,"Toxic_Dmg":0.5},"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}}},"debuffs":{"current":{"Held:Ranged_Immobilize":{"scale":30,"table":33},"Held:Ranged_PvPMez":{"scale":3,"table":34}}}},"t3_core_1":{"pets":["rularuu_boss","rularuu_lt"],"damage":{"Ranged_Damage":{"Lethal":2.4,"Energy":1.32},"Melee_Damage":{"Lethal":1.32,"Smashing":1.2}},"debuffs":{"current":{"Held:Ranged_Immobilize":{"scale":60,"table":33},"Held:Ranged_PvPMez":{"scale":6,"table":34},"Base_Defense:Ranged_Debuff_Def":{"scale":2,"table":3},"RunningSpeed:Ranged_Slow":{"scale":0.2,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.2,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.2,"table":2}},"strength":{"JumpHeight:Ranged_Slow":{"scale":0.2,"table":2},"RechargeTime:Ranged_Slow":{"scale":0.2,"table":2}}}},"t3_core_2":{"pets":["rularuu_boss","rularuu_support"],"damage":{"Ranged_Damage":{"Lethal":1.2,"Energy":1.32},"Melee_Damage":{"Lethal":1.32}},"buffs":{"strength":{"Smashing_Dmg":0.5,"Lethal_Dmg":0.5,"Fire_Dmg":0.5,"Cold_Dmg":0.5,"Energy_Dmg":0.5,"Negative_Energy_Dmg":0.5,"Psionic_Dmg":0.5,"Toxic_Dmg":0.5},"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}}},"debuffs":{"current":{"Held:Ranged_Immobilize":{"scale":30,"table":33},"Held:Ranged_PvPMez":{"scale":3,"table":34},"Base_Defense:Ranged_Debuff_Def":{"scale":2,"table":3},"RunningSpeed:Ranged_Slow":{"scale":0.2,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.2,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.2,"table":2}},"strength":{"JumpHeight:Ranged_Slow":{"scale":0.2,"table":2},"RechargeTime:Ranged_Slow":{"scale":0.2,"table":2}}}},"t3_radial_1":{"pets":["rularuu_boss","rularuu_support"],"damage":{"Ranged_Damage":{"Lethal":1.2,"Energy":1.32},"Melee_Damage":{"Lethal":1.32}},"buffs":{"strength":{"Smashing_Dmg":0.5,"Lethal_Dmg":0.5,"Fire_Dmg":0.5,"Cold_Dmg":0.5,"Energy_Dmg":0.5,"Negative_Energy_Dmg":0.5,"Psionic_Dmg":0.5,"Toxic_Dmg":0.5},"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}}},"debuffs":{"current":{"Held:Ranged_Immobilize":{"scale":30,"table":33},"Held:Ranged_PvPMez":{"scale":3,"table":34},"Base_Defense:Ranged_Debuff_Def":{"scale":2,"table":3},"RunningSpeed:Ranged_Slow":{"scale":0.2,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.2,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.2,"table":2}},"strength":{"JumpHeight:Ranged_Slow":{"scale":0.2,"table":2},"RechargeTime:Ranged_Slow":{"scale":0.2,"table":2}}}},"t3_radial_2":{"pets":["rularuu_lt","rularuu_support_attack"],"damage":{"Melee_Damage":{"Smashing":1.2},"Ranged_Damage":{"Lethal":1.2,"Energy":1.32}},"debuffs":{"current":{"Held:Ranged_Immobilize":{"scale":30,"table":33},"Held:Ranged_PvPMez":{"scale":3,"table":34}}}},"t4_core":{"pets":["rularuu_boss","rularuu_lt"],"damage":{"Ranged_Damage":{"Lethal":2.4,"Energy":1.32},"Melee_Damage":{"Lethal":1.32,"Smashing":1.2}},"debuffs":{"current":{"Held:Ranged_Immobilize":{"scale":60,"table":33},"Held:Ranged_PvPMez":{"scale":6,"table":34},"Base_Defense:Ranged_Debuff_Def":{"scale":2,"table":3},"RunningSpeed:Ranged_Slow":{"scale":0.2,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.2,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.2,"table":2}},"strength":{"JumpHeight:Ranged_Slow":{"scale":0.2,"table":2},"RechargeTime:Ranged_Slow":{"scale":0.2,"table":2}}}},"t4_radial":{"pets":["rularuu_lt","rularuu_support"],"damage":{"Melee_Damage":{"Smashing":1.2},"Ranged_Damage":{"Lethal":1.2}},"buffs":{"strength":{"Smashing_Dmg":0.5,"Lethal_Dmg":0.5,"Fire_Dmg":0.5,"Cold_Dmg":0.5,"Energy_Dmg":0.5,"Negative_Energy_Dmg":0.5,"Psionic_Dmg":0.5,"Toxic_Dmg":0.5},"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}}},"debuffs":{"current":{"Held:Ranged_Immobilize":{"scale":30,"table":33},"Held:Ranged_PvPMez":{"scale":3,"table":34}}}}},"seers":{"t1":{"pets":["seers_lt"],"damage":{"Ranged_Damage":{"Psionic":1.3},"Melee_Damage":{"Psionic":1.32}},"debuffs":{"strength":{"RechargeTime:Ranged_Slow":{"scale":0.3,"table":2}}}},"t2_core":{"pets":["seers_boss"],"damage":{"Ranged_Damage":{"Smashing":1.32,"Psionic":2.94}},"debuffs":{"current":{"Knockup:Ranged_Knockback":{"scale":12,"table":127},"Fly":-1.6,"Held:Ranged_Immobilize":{"scale":36,"table":33},"Held:Ranged_PvPMez":{"scale":3,"table":34}},"strength":{"RechargeTime:Ranged_Slow":{"scale":0.3,"table":2}}}},"t2_radial":{"pets":["seers_lt","seers_support"],"damage":{"Ranged_Damage":{"Psionic":1.3},"Melee_Damage":{"Psionic":1.32}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}},"current":{"Ranged:Ranged_Buff_Def":{"scale":0.5,"table":58},"Melee:Ranged_Buff_Def":{"scale":0.5,"table":58},"Area:Ranged_Buff_Def":{"scale":0.5,"table":58},"Smashing:Ranged_Buff_Def":{"scale":0.5,"table":58},"Lethal:Ranged_Buff_Def":{"scale":0.5,"table":58},"Fire:Ranged_Buff_Def":{"scale":0.5,"table":58},"Cold:Ranged_Buff_Def":{"scale":0.5,"table":58},"Energy:Ranged_Buff_Def":{"scale":0.5,"table":58},"Negative_Energy:Ranged_Buff_Def":{"scale":0.5,"table":58},"Psionic:Ranged_Buff_Def":{"scale":0.5,"table":58},"Toxic:Ranged_Buff_Def":{"scale":0.5,"table":58},"ToHit:Ranged_Buff_Def":{"scale":0.5,"table":58}},"strength":{"Smashing_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Lethal_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Fire_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Cold_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Energy_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Negative_Energy_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Psionic_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Toxic_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41}}},"debuffs":{"strength":{"RechargeTime:Ranged_Slow":{"scale":0.3,"table":2}}}},"t3_core_1":{"pets":["seers_boss","seers_lt"],"damage":{"Ranged_Damage":{"Smashing":1.32,"Psionic":4.24},"Melee_Damage":{"Psionic":1.32}},"debuffs":{"current":{"Knockup:Ranged_Knockback":{"scale":12,"table":127},"Fly":-1.6,"Held:Ranged_Immobilize":{"scale":36,"table":33},"Held:Ranged_PvPMez":{"scale":3,"table":34}},"strength":{"RechargeTime:Ranged_Slow":{"scale":0.6,"table":2}}}},"t3_core_2":{"pets":["seers_boss","seers_support"],"damage":{"Ranged_Damage":{"Smashing":1.32,"Psionic":2.94}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}},"current":{"Ranged:Ranged_Buff_Def":{"scale":0.5,"table":58},"Melee:Ranged_Buff_Def":{"scale":0.5,"table":58},"Area:Ranged_Buff_Def":{"scale":0.5,"table":58},"Smashing:Ranged_Buff_Def":{"scale":0.5,"table":58},"Lethal:Ranged_Buff_Def":{"scale":0.5,"table":58},"Fire:Ranged_Buff_Def":{"scale":0.5,"table":58},"Cold:Ranged_Buff_Def":{"scale":0.5,"table":58},"Energy:Ranged_Buff_Def":{"scale":0.5,"table":58},"Negative_Energy:Ranged_Buff_Def":{"scale":0.5,"table":58},"Psionic:Ranged_Buff_Def":{"scale":0.5,"table":58},"Toxic:Ranged_Buff_Def":{"scale":0.5,"table":58},"ToHit:Ranged_Buff_Def":{"scale":0.5,"table":58}},"strength":{"Smashing_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Lethal_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Fire_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Cold_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Energy_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Negative_Energy_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Psionic_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Toxic_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41}}},"debuffs":{"current":{"Knockup:Ranged_Knockback":{"scale":12,"table":127},"Fly":-1.6,"Held:Ranged_Immobilize":{"scale":36,"table":33},"Held:Ranged_PvPMez":{"scale":3,"table":34}},"strength":{"RechargeTime:Ranged_Slow":{"scale":0.3,"table":2}}}},"t3_radial_1":{"pets":["seers_boss","seers_support"],"damage":{"Ranged_Damage":{"Smashing":1.32,"Psionic":2.94}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}},"current":{"Ranged:Ranged_Buff_Def":{"scale":0.5,"table":58},"Melee:Ranged_Buff_Def":{"scale":0.5,"table":58},"Area:Ranged_Buff_Def":{"scale":0.5,"table":58},"Smashing:Ranged_Buff_Def":{"scale":0.5,"table":58},"Lethal:Ranged_Buff_Def":{"scale":0.5,"table":58},"Fire:Ranged_Buff_Def":{"scale":0.5,"table":58},"Cold:Ranged_Buff_Def":{"scale":0.5,"table":58},"Energy:Ranged_Buff_Def":{"scale":0.5,"table":58},"Negative_Energy:Ranged_Buff_Def":{"scale":0.5,"table":58},"Psionic:Ranged_Buff_Def":{"scale":0.5,"table":58},"Toxic:Ranged_Buff_Def":{"scale":0.5,"table":58},"ToHit:Ranged_Buff_Def":{"scale":0.5,"table":58}},"strength":{"Smashing_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Lethal_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Fire_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Cold_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Energy_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Negative_Energy_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Psionic_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Toxic_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41}}},"debuffs":{"current":{"Knockup:Ranged_Knockback":{"scale":12,"table":127},"Fly":-1.6,"Held:Ranged_Immobilize":{"scale":36,"table":33},"Held:Ranged_PvPMez":{"scale":3,"table":34}},"strength":{"RechargeTime:Ranged_Slow":{"scale":0.3,"table":2}}}},"t3_radial_2":{"pets":["seers_lt","seers_support"],"damage":{"Ranged_Damage":{"Psionic":1.3},"Melee_Damage":{"Psionic":1.32}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}},"current":{"Ranged:Ranged_Buff_Def":{"scale":0.5,"table":58},"Melee:Ranged_Buff_Def":{"scale":0.5,"table":58},"Area:Ranged_Buff_Def":{"scale":0.5,"table":58},"Smashing:Ranged_Buff_Def":{"scale":0.5,"table":58},"Lethal:Ranged_Buff_Def":{"scale":0.5,"table":58},"Fire:Ranged_Buff_Def":{"scale":0.5,"table":58},"Cold:Ranged_Buff_Def":{"scale":0.5,"table":58},"Energy:Ranged_Buff_Def":{"scale":0.5,"table":58},"Negative_Energy:Ranged_Buff_Def":{"scale":0.5,"table":58},"Psionic:Ranged_Buff_Def":{"scale":0.5,"table":58},"Toxic:Ranged_Buff_Def":{"scale":0.5,"table":58},"ToHit:Ranged_Buff_Def":{"scale":0.5,"table":58}},"strength":{"Smashing_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Lethal_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Fire_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Cold_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Energy_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Negative_Energy_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Psionic_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Toxic_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41}}},"debuffs":{"strength":{"RechargeTime:Ranged_Slow":{"scale":0.3,"table":2}}}},"t4_core":{"pets":["seers_boss","seers_lt"],"damage":{"Ranged_Damage":{"Smashing":1.32,"Psionic":4.24},"Melee_Damage":{"Psionic":1.32}},"debuffs":{"current":{"Knockup:Ranged_Knockback":{"scale":12,"table":127},"Fly":-1.6,"Held:Ranged_Immobilize":{"scale":36,"table":33},"Held:Ranged_PvPMez":{"scale":3,"table":34}},"strength":{"RechargeTime:Ranged_Slow":{"scale":0.6,"table":2}}}},"t4_radial":{"pets":["seers_lt","seers_support"],"damage":{"Ranged_Damage":{"Psionic":1.3},"Melee_Damage":{"Psionic":1.32}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.96,"table":16}},"current":{"Ranged:Ranged_Buff_Def":{"scale":0.5,"table":58},"Melee:Ranged_Buff_Def":{"scale":0.5,"table":58},"Area:Ranged_Buff_Def":{"scale":0.5,"table":58},"Smashing:Ranged_Buff_Def":{"scale":0.5,"table":58},"Lethal:Ranged_Buff_Def":{"scale":0.5,"table":58},"Fire:Ranged_Buff_Def":{"scale":0.5,"table":58},"Cold:Ranged_Buff_Def":{"scale":0.5,"table":58},"Energy:Ranged_Buff_Def":{"scale":0.5,"table":58},"Negative_Energy:Ranged_Buff_Def":{"scale":0.5,"table":58},"Psionic:Ranged_Buff_Def":{"scale":0.5,"table":58},"Toxic:Ranged_Buff_Def":{"scale":0.5,"table":58},"ToHit:Ranged_Buff_Def":{"scale":0.5,"table":58}},"strength":{"Smashing_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Lethal_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Fire_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Cold_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Energy_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Negative_Energy_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Psionic_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41},"Toxic_Dmg:Ranged_Buff_Dmg":{"scale":1.5,"table":41}}},"debuffs":{"strength":{"RechargeTime:Ranged_Slow":{"scale":0.3,"table":2}}}}},"storm_elemental":{"t1":{"pets":["elementals_lt"],"damage":{"Ranged_Damage":{"Energy":3.48}},"debuffs":{"current":{"Endurance":-0.24}}},"t2_core":{"pets":["elementals_boss"],"damage":{"Ranged_Damage":{"Energy":4.9}},"buffs":{"current":{"Endurance":-0.35,"Recovery":-0.25}},"debuffs":{"current":{"Endurance":-0.24}}},"t2_radial":{"pets":["elementals_lt","elementals_support"],"damage":{"Ranged_Damage":{"Energy":3.48}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.32,"table":16}},"resistance":{"Endurance:Ranged_Res_Boolean":{"scale":2,"table":80},"Recovery:Ranged_Res_Boolean":{"scale":2,"table":80},"Sleep:Ranged_Res_Boolean":{"scale":6,"table":80},"PerceptionRadius:Ranged_Res_Boolean":{"scale":2.5,"table":80},"Stunned:Ranged_Res_Boolean":{"scale":2,"table":80}},"current":{"PerceptionRadius:Ranged_Res_Boolean":{"scale":2.5,"table":80},"Stunned:Ranged_Res_Boolean":{"scale":-20,"table":80},"Sleep:Ranged_Res_Boolean":{"scale":-20,"table":80},"ToHit:Ranged_Debuff_ToHit":{"scale":3,"table":22}},"strength":{"Range":-0.6}},"debuffs":{"current":{"Endurance":-0.24}}},"t3_core_1":{"pets":["elementals_boss","elementals_lt"],"damage":{"Ranged_Damage":{"Energy":8.38}},"buffs":{"current":{"Endurance":-0.35,"Recovery":-0.25}},"debuffs":{"current":{"Endurance":-0.48}}},"t3_core_2":{"pets":["elementals_boss","elementals_support"],"damage":{"Ranged_Damage":{"Energy":4.9}},"buffs":{"current":{"Endurance":-0.35,"Recovery":-0.25,"PerceptionRadius:Ranged_Res_Boolean":{"scale":2.5,"table":80},"Stunned:Ranged_Res_Boolean":{"scale":-20,"table":80},"Sleep:Ranged_Res_Boolean":{"scale":-20,"table":80},"ToHit:Ranged_Debuff_ToHit":{"scale":3,"table":22}},"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.32,"table":16}},"resistance":{"Endurance:Ranged_Res_Boolean":{"scale":2,"table":80},"Recovery:Ranged_Res_Boolean":{"scale":2,"table":80},"Sleep:Ranged_Res_Boolean":{"scale":6,"table":80},"PerceptionRadius:Ranged_Res_Boolean":{"scale":2.5,"table":80},"Stunned:Ranged_Res_Boolean":{"scale":2,"table":80}},"strength":{"Range":-0.6}},"debuffs":{"current":{"Endurance":-0.24}}},"t3_radial_1":{"pets":["elementals_boss","elementals_support"],"damage":{"Ranged_Damage":{"Energy":4.9}},"buffs":{"current":{"Endurance":-0.35,"Recovery":-0.25,"PerceptionRadius:Ranged_Res_Boolean":{"scale":2.5,"table":80},"Stunned:Ranged_Res_Boolean":{"scale":-20,"table":80},"Sleep:Ranged_Res_Boolean":{"scale":-20,"table":80},"ToHit:Ranged_Debuff_ToHit":{"scale":3,"table":22}},"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.32,"table":16}},"resistance":{"Endurance:Ranged_Res_Boolean":{"scale":2,"table":80},"Recovery:Ranged_Res_Boolean":{"scale":2,"table":80},"Sleep:Ranged_Res_Boolean":{"scale":6,"table":80},"PerceptionRadius:Ranged_Res_Boolean":{"scale":2.5,"table":80},"Stunned:Ranged_Res_Boolean":{"scale":2,"table":80}},"strength":{"Range":-0.6}},"debuffs":{"current":{"Endurance":-0.24}}},"t3_radial_2":{"pets":["elementals_lt","elementals_support"],"damage":{"Ranged_Damage":{"Energy":3.48}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.32,"table":16}},"resistance":{"Endurance:Ranged_Res_Boolean":{"scale":2,"table":80},"Recovery:Ranged_Res_Boolean":{"scale":2,"table":80},"Sleep:Ranged_Res_Boolean":{"scale":6,"table":80},"PerceptionRadius:Ranged_Res_Boolean":{"scale":2.5,"table":80},"Stunned:Ranged_Res_Boolean":{"scale":2,"table":80}},"current":{"PerceptionRadius:Ranged_Res_Boolean":{"scale":2.5,"table":80},"Stunned:Ranged_Res_Boolean":{"scale":-20,"table":80},"Sleep:Ranged_Res_Boolean":{"scale":-20,"table":80},"ToHit:Ranged_Debuff_ToHit":{"scale":3,"table":22}},"strength":{"Range":-0.6}},"debuffs":{"current":{"Endurance":-0.24}}},"t4_core":{"pets":["elementals_boss","elementals_lt"],"damage":{"Ranged_Damage":{"Energy":8.38}},"buffs":{"current":{"Endurance":-0.35,"Recovery":-0.25}},"debuffs":{"current":{"Endurance":-0.48}}},"t4_radial":{"pets":["elementals_lt","elementals_support"],"damage":{"Ranged_Damage":{"Energy":3.48}},"buffs":{"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.32,"table":16}},"resistance":{"Endurance:Ranged_Res_Boolean":{"scale":2,"table":80},"Recovery:Ranged_Res_Boolean":{"scale":2,"table":80},"Sleep:Ranged_Res_Boolean":{"scale":6,"table":80},"PerceptionRadius:Ranged_Res_Boolean":{"scale":2.5,"table":80},"Stunned:Ranged_Res_Boolean":{"scale":2,"table":80}},"current":{"PerceptionRadius:Ranged_Res_Boolean":{"scale":2.5,"table":80},"Stunned:Ranged_Res_Boolean":{"scale":-20,"table":80},"Sleep:Ranged_Res_Boolean":{"scale":-20,"table":80},"ToHit:Ranged_Debuff_ToHit":{"scale":3,"table":22}},"strength":{"Range":-0.6}},"debuffs":{"current":{"Endurance":-0.24}}}},"talons_of_vengeance":{"t1":{"pets":["talons_lt"],"damage":{"Ranged_Damage":{"Lethal":0.6,"Cold":1.64,"Smashing":0.912,"Energy":1.368}},"buffs":{"strength":{"Smashing_Dmg":0.1,"Lethal_Dmg":0.1,"Fire_Dmg":0.1,"Cold_Dmg":0.1,"Energy_Dmg":0.1,"Negative_Energy_Dmg":0.1,"Psionic_Dmg":0.1,"Toxic_Dmg":0.1}},"debuffs":{"current":{"RunningSpeed:Ranged_Slow":{"scale":0.1,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.1,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.1,"table":2},"JumpHeight:Ranged_Slow":{"scale":0.3,"table":2},"Knockup":-100,"Knockback":-100,"Held:Ranged_PvPMez":{"scale":3,"table":34},"Held:Ranged_Immobilize":{"scale":6,"table":33},"Stunned:Ranged_PvPMez":{"scale":4,"table":34},"Stunned:Ranged_Stun":{"scale":24,"table":106}},"strength":{"RechargeTime:Ranged_Slow":{"scale":0.3,"table":2}},"resistance":{"Knockup":100,"Knockback":100,"Smashing_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Lethal_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Fire_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Cold_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Energy_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Negative_Energy_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Psionic_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Toxic_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20}}}},"t2_core":{"pets":["talons_boss"],"damage":{"Melee_Damage":{"Fire":2.3,"Cold":1.98},"Ranged_Damage":{"Cold":0.32,"Fire":0.24}},"buffs":{"current":{"ToHit:Melee_DeBuff_ToHit":{"scale":0.8,"table":68},"RunningSpeed:Melee_Slow":{"scale":0.1,"table":118},"FlyingSpeed:Melee_Slow":{"scale":0.1,"table":118},"JumpingSpeed:Melee_Slow":{"scale":0.1,"table":118},"JumpHeight:Melee_Slow":{"scale":0.1,"table":118}},"strength":{"RechargeTime:Melee_Slow":{"scale":0.1,"table":118}}},"debuffs":{"current":{"Knockback":-98.66,"RunningSpeed:Melee_Slow":{"scale":0.1,"table":118},"FlyingSpeed:Melee_Slow":{"scale":0.1,"table":118},"JumpingSpeed:Melee_Slow":{"scale":0.1,"table":118},"JumpHeight:Melee_Slow":{"scale":0.1,"table":118},"RunningSpeed:Ranged_Slow":{"scale":0.3,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.3,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.3,"table":2},"JumpHeight:Ranged_Slow":{"scale":0.3,"table":2},"Knockup":-100,"Held:Ranged_PvPMez":{"scale":3,"table":34},"Held":6},"strength":{"RechargeTime:Melee_Slow":{"scale":0.1,"table":118},"RechargeTime:Ranged_Slow":{"scale":0.3,"table":2}},"resistance":{"Knockup":100,"Knockback":100}}},"t2_radial":{"pets":["talons_lt","talons_support"],"damage":{"Ranged_Damage":{"Lethal":0.6,"Cold":1.64,"Smashing":0.912,"Energy":1.368}},"buffs":{"strength":{"Smashing_Dmg":0.1,"Lethal_Dmg":0.1,"Fire_Dmg":0.1,"Cold_Dmg":0.1,"Energy_Dmg":0.1,"Negative_Energy_Dmg":0.1,"Psionic_Dmg":0.1,"Toxic_Dmg":0.1,"RechargeTime":0.2},"resistance":{"Heal_Dmg":-0.25,"Smashing_Dmg":0.1,"Lethal_Dmg":0.1,"Fire_Dmg":0.1,"Cold_Dmg":0.1,"Energy_Dmg":0.1,"Negative_Energy_Dmg":0.1,"Psionic_Dmg":0.1,"Toxic_Dmg":0.1},"current":{"Base_Defense":0.05,"Recovery":0.2},"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.44,"table":16}}},"debuffs":{"current":{"RunningSpeed:Ranged_Slow":{"scale":0.1,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.1,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.1,"table":2},"JumpHeight:Ranged_Slow":{"scale":0.3,"table":2},"Knockup":-100,"Knockback":-100,"Held:Ranged_PvPMez":{"scale":3,"table":34},"Held:Ranged_Immobilize":{"scale":6,"table":33},"Stunned:Ranged_PvPMez":{"scale":4,"table":34},"Stunned:Ranged_Stun":{"scale":24,"table":106}},"strength":{"RechargeTime:Ranged_Slow":{"scale":0.3,"table":2}},"resistance":{"Knockup":100,"Knockback":100,"Smashing_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Lethal_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Fire_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Cold_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Energy_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Negative_Energy_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Psionic_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Toxic_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20}}}},"t3_core_1":{"pets":["talons_boss","talons_lt"],"damage":{"Melee_Damage":{"Fire":2.3,"Cold":1.98},"Ranged_Damage":{"Cold":1.96,"Fire":0.24,"Lethal":0.6,"Smashing":0.912,"Energy":1.368}},"buffs":{"current":{"ToHit:Melee_DeBuff_ToHit":{"scale":0.8,"table":68},"RunningSpeed:Melee_Slow":{"scale":0.1,"table":118},"FlyingSpeed:Melee_Slow":{"scale":0.1,"table":118},"JumpingSpeed:Melee_Slow":{"scale":0.1,"table":118},"JumpHeight:Melee_Slow":{"scale":0.1,"table":118}},"strength":{"RechargeTime:Melee_Slow":{"scale":0.1,"table":118},"Smashing_Dmg":0.1,"Lethal_Dmg":0.1,"Fire_Dmg":0.1,"Cold_Dmg":0.1,"Energy_Dmg":0.1,"Negative_Energy_Dmg":0.1,"Psionic_Dmg":0.1,"Toxic_Dmg":0.1}},"debuffs":{"current":{"Knockback":-198.66,"RunningSpeed:Melee_Slow":{"scale":0.1,"table":118},"FlyingSpeed:Melee_Slow":{"scale":0.1,"table":118},"JumpingSpeed:Melee_Slow":{"scale":0.1,"table":118},"JumpHeight:Melee_Slow":{"scale":0.1,"table":118},"RunningSpeed:Ranged_Slow":{"scale":0.4,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.4,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.4,"table":2},"JumpHeight:Ranged_Slow":{"scale":0.6,"table":2},"Knockup":-200,"Held:Ranged_PvPMez":{"scale":6,"table":34},"Held":6,"Held:Ranged_Immobilize":{"scale":6,"table":33},"Stunned:Ranged_PvPMez":{"scale":4,"table":34},"Stunned:Ranged_Stun":{"scale":24,"table":106}},"strength":{"RechargeTime:Melee_Slow":{"scale":0.1,"table":118},"RechargeTime:Ranged_Slow":{"scale":0.6,"table":2}},"resistance":{"Knockup":200,"Knockback":200,"Smashing_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Lethal_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Fire_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Cold_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Energy_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Negative_Energy_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Psionic_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Toxic_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20}}}},"t3_core_2":{"pets":["talons_boss","talons_support"],"damage":{"Melee_Damage":{"Fire":2.3,"Cold":1.98},"Ranged_Damage":{"Cold":0.32,"Fire":0.24}},"buffs":{"current":{"ToHit:Melee_DeBuff_ToHit":{"scale":0.8,"table":68},"RunningSpeed:Melee_Slow":{"scale":0.1,"table":118},"FlyingSpeed:Melee_Slow":{"scale":0.1,"table":118},"JumpingSpeed:Melee_Slow":{"scale":0.1,"table":118},"JumpHeight:Melee_Slow":{"scale":0.1,"table":118},"Base_Defense":0.05,"Recovery":0.2},"strength":{"RechargeTime:Melee_Slow":{"scale":0.1,"table":118},"RechargeTime":0.2},"resistance":{"Heal_Dmg":-0.25,"Smashing_Dmg":0.1,"Lethal_Dmg":0.1,"Fire_Dmg":0.1,"Cold_Dmg":0.1,"Energy_Dmg":0.1,"Negative_Energy_Dmg":0.1,"Psionic_Dmg":0.1,"Toxic_Dmg":0.1},"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.44,"table":16}}},"debuffs":{"current":{"Knockback":-98.66,"RunningSpeed:Melee_Slow":{"scale":0.1,"table":118},"FlyingSpeed:Melee_Slow":{"scale":0.1,"table":118},"JumpingSpeed:Melee_Slow":{"scale":0.1,"table":118},"JumpHeight:Melee_Slow":{"scale":0.1,"table":118},"RunningSpeed:Ranged_Slow":{"scale":0.3,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.3,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.3,"table":2},"JumpHeight:Ranged_Slow":{"scale":0.3,"table":2},"Knockup":-100,"Held:Ranged_PvPMez":{"scale":3,"table":34},"Held":6},"strength":{"RechargeTime:Melee_Slow":{"scale":0.1,"table":118},"RechargeTime:Ranged_Slow":{"scale":0.3,"table":2}},"resistance":{"Knockup":100,"Knockback":100}}},"t3_radial_1":{"pets":["talons_boss","talons_support"],"damage":{"Melee_Damage":{"Fire":2.3,"Cold":1.98},"Ranged_Damage":{"Cold":0.32,"Fire":0.24}},"buffs":{"current":{"ToHit:Melee_DeBuff_ToHit":{"scale":0.8,"table":68},"RunningSpeed:Melee_Slow":{"scale":0.1,"table":118},"FlyingSpeed:Melee_Slow":{"scale":0.1,"table":118},"JumpingSpeed:Melee_Slow":{"scale":0.1,"table":118},"JumpHeight:Melee_Slow":{"scale":0.1,"table":118},"Base_Defense":0.05,"Recovery":0.2},"strength":{"RechargeTime:Melee_Slow":{"scale":0.1,"table":118},"RechargeTime":0.2},"resistance":{"Heal_Dmg":-0.25,"Smashing_Dmg":0.1,"Lethal_Dmg":0.1,"Fire_Dmg":0.1,"Cold_Dmg":0.1,"Energy_Dmg":0.1,"Negative_Energy_Dmg":0.1,"Psionic_Dmg":0.1,"Toxic_Dmg":0.1},"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.44,"table":16}}},"debuffs":{"current":{"Knockback":-98.66,"RunningSpeed:Melee_Slow":{"scale":0.1,"table":118},"FlyingSpeed:Melee_Slow":{"scale":0.1,"table":118},"JumpingSpeed:Melee_Slow":{"scale":0.1,"table":118},"JumpHeight:Melee_Slow":{"scale":0.1,"table":118},"RunningSpeed:Ranged_Slow":{"scale":0.3,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.3,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.3,"table":2},"JumpHeight:Ranged_Slow":{"scale":0.3,"table":2},"Knockup":-100,"Held:Ranged_PvPMez":{"scale":3,"table":34},"Held":6},"strength":{"RechargeTime:Melee_Slow":{"scale":0.1,"table":118},"RechargeTime:Ranged_Slow":{"scale":0.3,"table":2}},"resistance":{"Knockup":100,"Knockback":100}}},"t3_radial_2":{"pets":["talons_lt","talons_support_attack"],"damage":{"Ranged_Damage":{"Lethal":1.05,"Cold":1.64,"Smashing":0.912,"Energy":2.468}},"buffs":{"strength":{"Smashing_Dmg":0.1,"Lethal_Dmg":0.1,"Fire_Dmg":0.1,"Cold_Dmg":0.1,"Energy_Dmg":0.1,"Negative_Energy_Dmg":0.1,"Psionic_Dmg":0.1,"Toxic_Dmg":0.1},"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.25,"table":16}}},"debuffs":{"current":{"RunningSpeed:Ranged_Slow":{"scale":0.1,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.1,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.1,"table":2},"JumpHeight:Ranged_Slow":{"scale":0.3,"table":2},"Knockup":-100,"Knockback":-100,"Held:Ranged_PvPMez":{"scale":3,"table":34},"Held:Ranged_Immobilize":{"scale":6,"table":33},"Stunned:Ranged_PvPMez":{"scale":4,"table":34},"Stunned:Ranged_Stun":{"scale":24,"table":106}},"strength":{"RechargeTime:Ranged_Slow":{"scale":0.3,"table":2}},"resistance":{"Knockup":100,"Knockback":100,"Smashing_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Lethal_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Fire_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Cold_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Energy_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Negative_Energy_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Psionic_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Toxic_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20}}}},"t4_core":{"pets":["talons_boss","talons_lt"],"damage":{"Melee_Damage":{"Fire":2.3,"Cold":1.98},"Ranged_Damage":{"Cold":1.96,"Fire":0.24,"Lethal":0.6,"Smashing":0.912,"Energy":1.368}},"buffs":{"current":{"ToHit:Melee_DeBuff_ToHit":{"scale":0.8,"table":68},"RunningSpeed:Melee_Slow":{"scale":0.1,"table":118},"FlyingSpeed:Melee_Slow":{"scale":0.1,"table":118},"JumpingSpeed:Melee_Slow":{"scale":0.1,"table":118},"JumpHeight:Melee_Slow":{"scale":0.1,"table":118}},"strength":{"RechargeTime:Melee_Slow":{"scale":0.1,"table":118},"Smashing_Dmg":0.1,"Lethal_Dmg":0.1,"Fire_Dmg":0.1,"Cold_Dmg":0.1,"Energy_Dmg":0.1,"Negative_Energy_Dmg":0.1,"Psionic_Dmg":0.1,"Toxic_Dmg":0.1}},"debuffs":{"current":{"Knockback":-198.66,"RunningSpeed:Melee_Slow":{"scale":0.1,"table":118},"FlyingSpeed:Melee_Slow":{"scale":0.1,"table":118},"JumpingSpeed:Melee_Slow":{"scale":0.1,"table":118},"JumpHeight:Melee_Slow":{"scale":0.1,"table":118},"RunningSpeed:Ranged_Slow":{"scale":0.4,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.4,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.4,"table":2},"JumpHeight:Ranged_Slow":{"scale":0.6,"table":2},"Knockup":-200,"Held:Ranged_PvPMez":{"scale":6,"table":34},"Held":6,"Held:Ranged_Immobilize":{"scale":6,"table":33},"Stunned:Ranged_PvPMez":{"scale":4,"table":34},"Stunned:Ranged_Stun":{"scale":24,"table":106}},"strength":{"RechargeTime:Melee_Slow":{"scale":0.1,"table":118},"RechargeTime:Ranged_Slow":{"scale":0.6,"table":2}},"resistance":{"Knockup":200,"Knockback":200,"Smashing_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Lethal_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Fire_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Cold_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Energy_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Negative_Energy_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Psionic_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Toxic_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20}}}},"t4_radial":{"pets":["talons_lt","talons_support"],"damage":{"Ranged_Damage":{"Lethal":0.6,"Cold":1.64,"Smashing":0.912,"Energy":1.368}},"buffs":{"strength":{"Smashing_Dmg":0.1,"Lethal_Dmg":0.1,"Fire_Dmg":0.1,"Cold_Dmg":0.1,"Energy_Dmg":0.1,"Negative_Energy_Dmg":0.1,"Psionic_Dmg":0.1,"Toxic_Dmg":0.1,"RechargeTime":0.2},"resistance":{"Heal_Dmg":-0.25,"Smashing_Dmg":0.1,"Lethal_Dmg":0.1,"Fire_Dmg":0.1,"Cold_Dmg":0.1,"Energy_Dmg":0.1,"Negative_Energy_Dmg":0.1,"Psionic_Dmg":0.1,"Toxic_Dmg":0.1},"current":{"Base_Defense":0.05,"Recovery":0.2},"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.44,"table":16}}},"debuffs":{"current":{"RunningSpeed:Ranged_Slow":{"scale":0.1,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.1,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.1,"table":2},"JumpHeight:Ranged_Slow":{"scale":0.3,"table":2},"Knockup":-100,"Knockback":-100,"Held:Ranged_PvPMez":{"scale":3,"table":34},"Held:Ranged_Immobilize":{"scale":6,"table":33},"Stunned:Ranged_PvPMez":{"scale":4,"table":34},"Stunned:Ranged_Stun":{"scale":24,"table":106}},"strength":{"RechargeTime:Ranged_Slow":{"scale":0.3,"table":2}},"resistance":{"Knockup":100,"Knockback":100,"Smashing_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Lethal_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Fire_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Cold_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Energy_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Negative_Energy_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Psionic_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20},"Toxic_Dmg:Ranged_Res_Dmg":{"scale":-2,"table":20}}}}},"tsoo":{"t1":{"pets":["tsoo_lt"],"damage":{"Melee_Damage":{"Smashing":1},"Ranged_Damage":{"Lethal":0.84}},"buffs":{"current":{"Knockback:Melee_Knockback":{"scale":4,"table":116},"Stunned:Melee_PvPMez":{"scale":2,"table":117},"Stunned:Melee_Stun":{"scale":16,"table":179}}}},"t2_core":{"pets":["tsoo_boss"],"damage":{"Melee_Damage":{"Smashing":5.477}},"buffs":{"resistance":{"Smashing_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Lethal_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Fire_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Cold_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Energy_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Negative_Energy_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Psionic_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Toxic_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177}}},"debuffs":{"current":{"Base_Defense:Melee_Debuff_Def":{"scale":1,"table":45}}}},"t2_radial":{"pets":["tsoo_lt","tsoo_support"],"damage":{"Melee_Damage":{"Smashing":1},"Ranged_Damage":{"Lethal":0.84}},"buffs":{"current":{"Knockback:Melee_Knockback":{"scale":4,"table":116},"Stunned:Melee_PvPMez":{"scale":2,"table":117},"Stunned:Melee_Stun":{"scale":16,"table":179},"Stunned:Ranged_Res_Boolean":{"scale":-20,"table":80},"Sleep:Ranged_Res_Boolean":{"scale":-20,"table":80},"PerceptionRadius:Ranged_Res_Boolean":{"scale":2.5,"table":80},"ToHit:Ranged_Debuff_ToHit":{"scale":3,"table":22},"Translucency":0,"Teleport":10},"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.32,"table":16}},"resistance":{"Sleep:Ranged_Res_Boolean":{"scale":4,"table":80},"Endurance:Ranged_Res_Boolean":{"scale":2,"table":80},"Recovery:Ranged_Res_Boolean":{"scale":2,"table":80},"PerceptionRadius:Ranged_Res_Boolean":{"scale":2.5,"table":80}},"strength":{"Range":-0.6}}},"t3_core_1":{"pets":["tsoo_boss","tsoo_lt"],"damage":{"Melee_Damage":{"Smashing":6.477},"Ranged_Damage":{"Lethal":0.84}},"buffs":{"resistance":{"Smashing_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Lethal_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Fire_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Cold_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Energy_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Negative_Energy_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Psionic_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Toxic_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177}},"current":{"Knockback:Melee_Knockback":{"scale":4,"table":116},"Stunned:Melee_PvPMez":{"scale":2,"table":117},"Stunned:Melee_Stun":{"scale":16,"table":179}}},"debuffs":{"current":{"Base_Defense:Melee_Debuff_Def":{"scale":1,"table":45}}}},"t3_core_2":{"pets":["tsoo_boss","tsoo_support"],"damage":{"Melee_Damage":{"Smashing":5.477}},"buffs":{"resistance":{"Smashing_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Lethal_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Fire_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Cold_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Energy_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Negative_Energy_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Psionic_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Toxic_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Sleep:Ranged_Res_Boolean":{"scale":4,"table":80},"Endurance:Ranged_Res_Boolean":{"scale":2,"table":80},"Recovery:Ranged_Res_Boolean":{"scale":2,"table":80},"PerceptionRadius:Ranged_Res_Boolean":{"scale":2.5,"table":80}},"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.32,"table":16}},"current":{"Stunned:Ranged_Res_Boolean":{"scale":-20,"table":80},"Sleep:Ranged_Res_Boolean":{"scale":-20,"table":80},"PerceptionRadius:Ranged_Res_Boolean":{"scale":2.5,"table":80},"ToHit:Ranged_Debuff_ToHit":{"scale":3,"table":22},"Translucency":0,"Teleport":10},"strength":{"Range":-0.6}},"debuffs":{"current":{"Base_Defense:Melee_Debuff_Def":{"scale":1,"table":45}}}},"t3_radial_1":{"pets":["tsoo_boss","tsoo_support"],"damage":{"Melee_Damage":{"Smashing":5.477}},"buffs":{"resistance":{"Smashing_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Lethal_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Fire_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Cold_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Energy_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Negative_Energy_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Psionic_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Toxic_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Sleep:Ranged_Res_Boolean":{"scale":4,"table":80},"Endurance:Ranged_Res_Boolean":{"scale":2,"table":80},"Recovery:Ranged_Res_Boolean":{"scale":2,"table":80},"PerceptionRadius:Ranged_Res_Boolean":{"scale":2.5,"table":80}},"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.32,"table":16}},"current":{"Stunned:Ranged_Res_Boolean":{"scale":-20,"table":80},"Sleep:Ranged_Res_Boolean":{"scale":-20,"table":80},"PerceptionRadius:Ranged_Res_Boolean":{"scale":2.5,"table":80},"ToHit:Ranged_Debuff_ToHit":{"scale":3,"table":22},"Translucency":0,"Teleport":10},"strength":{"Range":-0.6}},"debuffs":{"current":{"Base_Defense:Melee_Debuff_Def":{"scale":1,"table":45}}}},"t3_radial_2":{"pets":["tsoo_lt","tsoo_support_attack"],"damage":{"Melee_Damage":{"Smashing":1},"Ranged_Damage":{"Lethal":0.84,"Negative":1}},"buffs":{"current":{"Knockback:Melee_Knockback":{"scale":4,"table":116},"Stunned:Melee_PvPMez":{"scale":2,"table":117},"Stunned:Melee_Stun":{"scale":16,"table":179}}},"debuffs":{"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":0.75,"table":22},"Held:Ranged_PvPMez":{"scale":3,"table":34},"Held:Ranged_Immobilize":{"scale":36,"table":33}}}},"t4_core":{"pets":["tsoo_boss","tsoo_lt"],"damage":{"Melee_Damage":{"Smashing":6.477},"Ranged_Damage":{"Lethal":0.84}},"buffs":{"resistance":{"Smashing_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Lethal_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Fire_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Cold_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Energy_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Negative_Energy_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Psionic_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177},"Toxic_Dmg:Melee_Debuff_Res_Dmg":{"scale":-1,"table":177}},"current":{"Knockback:Melee_Knockback":{"scale":4,"table":116},"Stunned:Melee_PvPMez":{"scale":2,"table":117},"Stunned:Melee_Stun":{"scale":16,"table":179}}},"debuffs":{"current":{"Base_Defense:Melee_Debuff_Def":{"scale":1,"table":45}}}},"t4_radial":{"pets":["tsoo_lt","tsoo_support"],"damage":{"Melee_Damage":{"Smashing":1},"Ranged_Damage":{"Lethal":0.84}},"buffs":{"current":{"Knockback:Melee_Knockback":{"scale":4,"table":116},"Stunned:Melee_PvPMez":{"scale":2,"table":117},"Stunned:Melee_Stun":{"scale":16,"table":179},"Stunned:Ranged_Res_Boolean":{"scale":-20,"table":80},"Sleep:Ranged_Res_Boolean":{"scale":-20,"table":80},"PerceptionRadius:Ranged_Res_Boolean":{"scale":2.5,"table":80},"ToHit:Ranged_Debuff_ToHit":{"scale":3,"table":22},"Translucency":0,"Teleport":10},"absolute":{"Heal_Dmg:Ranged_Heal":{"scale":1.32,"table":16}},"resistance":{"Sleep:Ranged_Res_Boolean":{"scale":4,"table":80},"Endurance:Ranged_Res_Boolean":{"scale":2,"table":80},"Recovery:Ranged_Res_Boolean":{"scale":2,"table":80},"PerceptionRadius:Ranged_Res_Boolean":{"scale":2.5,"table":80}},"strength":{"Range":-0.6}}}},"vanguard":{"t1":{"pets":["vanguard_lt"],"damage":{"Melee_Damage":{"Lethal":0.6,"Energy":0.5},"Ranged_Damage":{"Lethal":1.4,"Energy":0.4}},"debuffs":{"resistance":{"Lethal_Dmg":-0.05,"Energy_Dmg":-0.05},"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3}}}},"t2_core":{"pets":["vanguard_boss"],"damage":{"Ranged_Damage":{"Negative":2.14,"Smashing":0.88,"Cold":2,"Energy":1}},"buffs":{"absolute":{"Heal_Dmg:Ranged_HealSelf":{"scale":1.64,"table":185}}},"debuffs":{"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":0.825,"table":22},"RunningSpeed:Ranged_Slow":{"scale":0.3,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.3,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.3,"table":2},"Recovery":-0.2},"strength":{"JumpHeight:Ranged_Slow":{"scale":0.3,"table":2},"RechargeTime:Ranged_Slow":{"scale":0.3,"table":2}},"absolute":{"Endurance:Ranged_EndDrain":{"scale":-12,"table":188}}}},"t2_radial":{"pets":["vanguard_lt","vanguard_support"],"damage":{"Melee_Damage":{"Lethal":0.6,"Energy":0.5},"Ranged_Damage":{"Lethal":1.4,"Energy":0.4}},"buffs":{"strength":{"Smashing_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Lethal_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Fire_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Cold_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Energy_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Negative_Energy_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Psionic_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Toxic_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41}},"resistance":{"Taunt:Ranged_Res_Boolean":{"scale":1.75,"table":80},"Placate:Ranged_Res_Boolean":{"scale":1.75,"table":80}}},"debuffs":{"resistance":{"Lethal_Dmg":-0.05,"Energy_Dmg":-0.05},"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3},"ToHit:Ranged_Debuff_ToHit":{"scale":0.5,"table":22},"Regeneration":-0.5},"strength":{"Smashing_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Lethal_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Fire_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Cold_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Energy_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Negative_Energy_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Psionic_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Toxic_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70}}}},"t3_core_1":{"pets":["vanguard_boss","vanguard_lt"],"damage":{"Ranged_Damage":{"Negative":2.14,"Smashing":0.88,"Cold":2,"Energy":1.4,"Lethal":1.4},"Melee_Damage":{"Lethal":0.6,"Energy":0.5}},"buffs":{"absolute":{"Heal_Dmg:Ranged_HealSelf":{"scale":1.64,"table":185}}},"debuffs":{"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":0.825,"table":22},"RunningSpeed:Ranged_Slow":{"scale":0.3,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.3,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.3,"table":2},"Recovery":-0.2,"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3}},"strength":{"JumpHeight:Ranged_Slow":{"scale":0.3,"table":2},"RechargeTime:Ranged_Slow":{"scale":0.3,"table":2}},"absolute":{"Endurance:Ranged_EndDrain":{"scale":-12,"table":188}},"resistance":{"Lethal_Dmg":-0.05,"Energy_Dmg":-0.05}}},"t3_core_2":{"pets":["vanguard_boss","vanguard_support"],"damage":{"Ranged_Damage":{"Negative":2.14,"Smashing":0.88,"Cold":2,"Energy":1}},"buffs":{"absolute":{"Heal_Dmg:Ranged_HealSelf":{"scale":1.64,"table":185}},"strength":{"Smashing_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Lethal_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Fire_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Cold_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Energy_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Negative_Energy_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Psionic_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Toxic_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41}},"resistance":{"Taunt:Ranged_Res_Boolean":{"scale":1.75,"table":80},"Placate:Ranged_Res_Boolean":{"scale":1.75,"table":80}}},"debuffs":{"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":1.325,"table":22},"RunningSpeed:Ranged_Slow":{"scale":0.3,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.3,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.3,"table":2},"Recovery":-0.2,"Regeneration":-0.5},"strength":{"JumpHeight:Ranged_Slow":{"scale":0.3,"table":2},"RechargeTime:Ranged_Slow":{"scale":0.3,"table":2},"Smashing_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Lethal_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Fire_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Cold_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Energy_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Negative_Energy_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Psionic_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Toxic_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70}},"absolute":{"Endurance:Ranged_EndDrain":{"scale":-12,"table":188}}}},"t3_radial_1":{"pets":["vanguard_boss","vanguard_support"],"damage":{"Ranged_Damage":{"Negative":2.14,"Smashing":0.88,"Cold":2,"Energy":1}},"buffs":{"absolute":{"Heal_Dmg:Ranged_HealSelf":{"scale":1.64,"table":185}},"strength":{"Smashing_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Lethal_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Fire_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Cold_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Energy_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Negative_Energy_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Psionic_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Toxic_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41}},"resistance":{"Taunt:Ranged_Res_Boolean":{"scale":1.75,"table":80},"Placate:Ranged_Res_Boolean":{"scale":1.75,"table":80}}},"debuffs":{"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":1.325,"table":22},"RunningSpeed:Ranged_Slow":{"scale":0.3,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.3,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.3,"table":2},"Recovery":-0.2,"Regeneration":-0.5},"strength":{"JumpHeight:Ranged_Slow":{"scale":0.3,"table":2},"RechargeTime:Ranged_Slow":{"scale":0.3,"table":2},"Smashing_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Lethal_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Fire_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Cold_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Energy_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Negative_Energy_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Psionic_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Toxic_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70}},"absolute":{"Endurance:Ranged_EndDrain":{"scale":-12,"table":188}}}},"t3_radial_2":{"pets":["vanguard_lt","vanguard_support"],"damage":{"Melee_Damage":{"Lethal":0.6,"Energy":0.5},"Ranged_Damage":{"Lethal":1.4,"Energy":0.4}},"buffs":{"strength":{"Smashing_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Lethal_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Fire_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Cold_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Energy_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Negative_Energy_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Psionic_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Toxic_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41}},"resistance":{"Taunt:Ranged_Res_Boolean":{"scale":1.75,"table":80},"Placate:Ranged_Res_Boolean":{"scale":1.75,"table":80}}},"debuffs":{"resistance":{"Lethal_Dmg":-0.05,"Energy_Dmg":-0.05},"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3},"ToHit:Ranged_Debuff_ToHit":{"scale":0.5,"table":22},"Regeneration":-0.5},"strength":{"Smashing_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Lethal_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Fire_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Cold_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Energy_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Negative_Energy_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Psionic_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Toxic_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70}}}},"t4_core":{"pets":["vanguard_boss","vanguard_lt"],"damage":{"Ranged_Damage":{"Negative":2.14,"Smashing":0.88,"Cold":2,"Energy":1.4,"Lethal":1.4},"Melee_Damage":{"Lethal":0.6,"Energy":0.5}},"buffs":{"absolute":{"Heal_Dmg:Ranged_HealSelf":{"scale":1.64,"table":185}}},"debuffs":{"current":{"ToHit:Ranged_Debuff_ToHit":{"scale":0.825,"table":22},"RunningSpeed:Ranged_Slow":{"scale":0.3,"table":2},"FlyingSpeed:Ranged_Slow":{"scale":0.3,"table":2},"JumpingSpeed:Ranged_Slow":{"scale":0.3,"table":2},"Recovery":-0.2,"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3}},"strength":{"JumpHeight:Ranged_Slow":{"scale":0.3,"table":2},"RechargeTime:Ranged_Slow":{"scale":0.3,"table":2}},"absolute":{"Endurance:Ranged_EndDrain":{"scale":-12,"table":188}},"resistance":{"Lethal_Dmg":-0.05,"Energy_Dmg":-0.05}}},"t4_radial":{"pets":["vanguard_lt","vanguard_support"],"damage":{"Melee_Damage":{"Lethal":0.6,"Energy":0.5},"Ranged_Damage":{"Lethal":1.4,"Energy":0.4}},"buffs":{"strength":{"Smashing_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Lethal_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Fire_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Cold_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Energy_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Negative_Energy_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Psionic_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41},"Toxic_Dmg:Ranged_Buff_Dmg":{"scale":0.75,"table":41}},"resistance":{"Taunt:Ranged_Res_Boolean":{"scale":1.75,"table":80},"Placate:Ranged_Res_Boolean":{"scale":1.75,"table":80}}},"debuffs":{"resistance":{"Lethal_Dmg":-0.05,"Energy_Dmg":-0.05},"current":{"Base_Defense:Ranged_Debuff_Def":{"scale":1,"table":3},"ToHit:Ranged_Debuff_ToHit":{"scale":0.5,"table":22},"Regeneration":-0.5},"strength":{"Smashing_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Lethal_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Fire_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Cold_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Energy_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Negative_Energy_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Psionic_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70},"Toxic_Dmg:Ranged_Debuff_Dam":{"scale":1,"table":70}}}}},"warworks":{"t1":{"pets":["warworks_lt"],"damage":{"Ranged_Damage":{"Energy":2.22}},"debuffs":{"current":{"Regeneration":-1}}},"t2_core":{"pets":["warworks_boss"],"damage":{"Melee_Damage":{"Lethal":0.84,"Energy":0.84},"Ranged_Damage":{"Energy":1.64}},"debuffs":{"current":{"Base_Defense:Melee_Debuff_Def":{"scale":2,"table":45},"Regeneration":-0.5}}},"t2_radial":{"pets":["warworks_lt"],"damage":{"Ranged_Damage":{"Energy":2.22}},"debuffs":{"current":{"Regeneration":-1}}},"t3_core_1":{"pets":["warworks_boss","warworks_lt"],"damage":{"Melee_Damage":{"Lethal":0.84,"Energy":0.84},"Ranged_Damage":{"Energy":3.86}},"debuffs":{"current":{"Base_Defense:Melee_Debuff_Def":{"scale":2,"table":45},"Regeneration":-1.5}}},"t3_core_2":{"pets":["warworks_boss"],"damage":{"Melee_Damage":{"Lethal":0.84,"Energy":0.84},"Ranged_Damage":{"Energy":1.64}},"debuffs":{"current":{"Base_Defense:Melee_Debuff_Def":{"scale":2,"table":45},"Regeneration":-0.5}}},"t3_radial_1":{"pets":["warworks_boss"],"damage":{"Melee_Damage":{"Lethal":0.84,"Energy":0.84},"Ranged_Damage":{"Energy":1.64}},"debuffs":{"current":{"Base_Defense:Melee_Debuff_Def":{"scale":2,"table":45},"Regeneration":-0.5}}},"t3_radial_2":{"pets":["warworks_lt"],"damage":{"Ranged_Damage":{"Energy":2.22}},"debuffs":{"current":{"Regeneration":-1}}},"t4_core":{"pets":["warworks_boss","warworks_lt"],"damage":{"Melee_Damage":{"Lethal":0.84,"Energy":0.84},"Ranged_Damage":{"Energy":3.86}},"debuffs":{"current":{"Base_Defense:Melee_Debuff_Def":{"scale":2,"table":45},"Regeneration":-1.5}}},"t4_radial":{"pets":["warworks_lt"],"damage":{"Ranged_Damage":{"Energy":2.22}},"debuffs":{"current":{"Regeneration":-1}}}}}}});
+
+// Make available globally
+window.LORE_PETS = LORE_PETS;
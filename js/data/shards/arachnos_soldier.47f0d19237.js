@@ -0,0 +1,973 @@
+// ---- js/data/epics/arachnos_soldier/veat_leviathan_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Leviathan Mastery
+ * Archetype: Arachnos Soldier
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\veat_leviathan_mastery
+ */
+
+const EPIC_VEAT_LEVIATHAN_MASTERY = {
+  "id": "veat_leviathan_mastery",
+  "name": "Leviathan Mastery",
+  "displayName": "Leviathan Mastery",
+  "archetype": "arachnos_soldier",
+  "description": "Captain Mako has granted you access to the power of the Leviathan. The Leviathan is an ancient gargantuan entity who slumbers under Sharkhead Isle. Worshiped by the Coralax, the Leviathan has given Captain Mako many abilities and now he has taught you how to harness its power.",
+  "icon": "veat_leviathan_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Spirit Shark",
+      "fullName": "Epic.VEAT_Leviathan_Mastery.Spirit_Shark",
+      "rank": 1,
+      "available": 34,
+      "description": "You are empowered with the Spirit of the Mako Shark. You can project this spirit to attack and maul your opponent. The Shark Spirit will manifest and attack your foe, quickly dealing heavy lethal damage over time. The damage over time increases the more hunger stacks you have. All hunger Leviathan Hunger stacks are consumed when you successfully hit an enemy with this power. When you own this power, most actions that cost endurance will have a chance of granting a Leviathan Hunger stack.",
+      "shortHelp": "Ranged, DoT(Lethal), Foe Knockback, -Leviathan Hunger",
+      "icon": "arachnos_patron_targetedrangedhighdmg.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Arachnos_Soldier) || ($archetype == @Class_Arachnos_Widow))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 13.0,
+        "endurance": 9.1,
+        "activationTime": 2.0,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Lethal",
+          "scale": 1.0694,
+          "table": "Ranged_PvPDamage"
+        },
+        "protection": {
+          "knockback": 1.0
+        }
+      }
+    },
+    {
+      "name": "School of Sharks",
+      "fullName": "Epic.VEAT_Leviathan_Mastery.School_of_Sharks",
+      "rank": 2,
+      "available": 34,
+      "description": "You can call forth a school of vicious Shark Spirits that will swim out in a cone formation and will encircle your foes, draining their spirit energy. The encircling Shark Spirits will immobilize most foes while they deal negative energy damage over time. Both you and the target must be Near the Ground for this power to activate.",
+      "shortHelp": "Ranged (Cone), DoT(Negative), Foe Immobilize",
+      "icon": "arachnos_patron_coneimmobilize.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Arachnos_Soldier) || ($archetype == @Class_Arachnos_Widow))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Immobilize",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 50.0,
+        "recharge": 16.0,
+        "endurance": 10.751,
+        "activationTime": 2.37,
+        "effectArea": "Cone",
+        "radius": 50.0,
+        "arc": 0.5236,
+        "damage": {
+          "type": "Negative",
+          "scale": 0.1102,
+          "table": "Ranged_PvPDamage"
+        },
+        "protection": {
+          "immobilize": 3.0
+        },
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Bile Spray",
+      "fullName": "Epic.VEAT_Leviathan_Mastery.Chum_Spray",
+      "rank": 3,
+      "available": 37,
+      "description": "Sharks will eat anything, so their stomach acid must be powerful indeed. You can regurgitate this acid and spew a corrosive spray of bile at a foe. Affected foes in the cone area will take toxic damage over time. You must be level 38 and have one other Leviathan Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Cone), DoT(Toxic)",
+      "icon": "arachnos_patron_rangedconemoderatedmg.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 32.0,
+        "endurance": 18.98,
+        "activationTime": 1.6,
+        "effectArea": "Cone",
+        "radius": 60.0,
+        "arc": 0.5236,
+        "damage": {
+          "type": "Toxic",
+          "scale": 0.0682,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Arctic Breath",
+      "fullName": "Epic.VEAT_Leviathan_Mastery.Arctic_Breath",
+      "rank": 4,
+      "available": 40,
+      "description": "Sharks will eat anything, so their stomach acid must be powerful indeed. You can regurgitate this freezing acid and spew a corrosive spray of bile at a foe. Affected foes in the cone area will take cold damage over time, and have their damage resistance, Defense, movement rate, and recharge rate reduced. This ice will stick to foes, causing them to fall down occasionally. You must be level 41 and have one other Leviathan Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Cone), DoT(Cold), Foe -Speed, -Recharge, -DEF -Res, knock down",
+      "icon": "arachnos_patron_coneslow.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate Defense Debuff",
+        "Defense Debuff",
+        "Ranged AoE Damage",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 32.0,
+        "endurance": 18.98,
+        "activationTime": 2.33,
+        "effectArea": "Cone",
+        "radius": 60.0,
+        "arc": 0.5236,
+        "damage": {
+          "type": "Cold",
+          "scale": 0.1813,
+          "table": "Ranged_PvPDamage"
+        },
+        "protection": {
+          "knockback": 1.0
+        },
+        "resistance": {
+          "smashing": {
+            "scale": -1.5,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "lethal": {
+            "scale": -1.5,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "fire": {
+            "scale": -1.5,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "cold": {
+            "scale": -1.5,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "energy": {
+            "scale": -1.5,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "negative": {
+            "scale": -1.5,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "psionic": {
+            "scale": -1.5,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "toxic": {
+            "scale": -1.5,
+            "table": "Ranged_Debuff_Res_Dmg"
+          }
+        },
+        "defense": {
+          "all": {
+            "scale": 1.5,
+            "table": "Ranged_Debuff_Def"
+          }
+        }
+      }
+    },
+    {
+      "name": "Summon Guardian",
+      "fullName": "Epic.VEAT_Leviathan_Mastery.Summon_Guardian",
+      "rank": 5,
+      "available": 43,
+      "description": "Captain Mako has shown you how to summon a Coralax Guardian Sentinel to do your bidding. These creatures are composed of living coral made from the sea-goddess Merulina. Your access to this Guardian is very limited. You can only summon it once every 15 minutes and it will leave after 4 minutes, or if you exit a zone or mission. You must be level 44 and have two other Leviathan Mastery Powers before selecting this power.",
+      "shortHelp": "Summon Sentinel: Ranged Moderate DMG(Smashing)",
+      "icon": "arachnos_patron_summononepet.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Immobilize",
+        "Knockback",
+        "Pet Damage",
+        "Recharge Intensive Pets",
+        "Slow Movement",
+        "Stuns",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 900.0,
+        "endurance": 26.0,
+        "activationTime": 3.2,
+        "effectArea": "Location"
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['veat_leviathan_mastery'] = EPIC_VEAT_LEVIATHAN_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/arachnos_soldier/veat_mace_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Mace Mastery
+ * Archetype: Arachnos Soldier
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\veat_mace_mastery
+ */
+
+const EPIC_VEAT_MACE_MASTERY = {
+  "id": "veat_mace_mastery",
+  "name": "Mace Mastery",
+  "displayName": "Mace Mastery",
+  "archetype": "arachnos_soldier",
+  "description": "Black Scorpion has granted you access to the advanced technology of the Executioner's Mace. The signature weapon of the Bane Spider Executioner, it is not a typical clumsy mace. The Executioner's Mace is capable of firing a variety of energy projectiles and grenades. It can even be modified to summon and command some or Black Scorpion's RV technologies.",
+  "icon": "veat_mace_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Mace Blast",
+      "fullName": "Epic.VEAT_Mace_Mastery.Mace_Blast",
+      "rank": 1,
+      "available": 34,
+      "description": "The Executioner's Mace is capable of firing a powerful bolt of kinetic energy. The blast is powerful enough that it may knock some foes back. Arachnos Bane Spider Troopers call this the Power Blast. The Arbiters who invented it scoff at this simple term.",
+      "shortHelp": "Ranged, DMG(Energy), Foe Knockback",
+      "icon": "arachnos_patron_targetedrangedhighdmg.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Arachnos_Soldier) || ($archetype == @Class_Arachnos_Widow))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 80.0,
+        "recharge": 12.0,
+        "endurance": 8.58,
+        "activationTime": 2.0,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Energy",
+          "scale": 2.16,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Web Envelope",
+      "fullName": "Epic.VEAT_Mace_Mastery.Web_Envelope",
+      "rank": 2,
+      "available": 34,
+      "description": "The Executioner's Mace can lob a modified Web Grenade. Upon impact, the Web Grenade expels a strong, tenuous, and very sticky substance that can Immobilize most targets in a wide area. This device deals toxic damage over time and does not prevent targets from attacking, although their attack rate is Slowed. The Web can bring down flying entities and halts jumping.",
+      "shortHelp": "Ranged (Targeted AoE) DoT(Toxic), Immobilize, -Recharge, -Fly, -Jump",
+      "icon": "arachnos_patron_rangedaoeimmobilize.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Arachnos_Soldier) || ($archetype == @Class_Arachnos_Widow))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Immobilize",
+        "Ranged AoE Damage",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 50.0,
+        "recharge": 16.0,
+        "endurance": 10.751,
+        "activationTime": 2.0,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "protection": {
+          "immobilize": 3.0
+        },
+        "damage": {
+          "type": "Toxic",
+          "scale": 0.2503,
+          "table": "Ranged_PvPDamage"
+        },
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Disruptor Blast",
+      "fullName": "Epic.VEAT_Mace_Mastery.Disruptor_Blast",
+      "rank": 3,
+      "available": 37,
+      "description": "Fires a tremendous charge of kinetic energy from your Executioner's Mace. This charge is so powerful it will explode on impact, blasting all nearby foes. Some affected foes may be knocked back by the force of the blast. Your access to this Adept is very limited. You must be level 38 and have one other Mace Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Targeted AoE), DMG(Energy), Foe Knockback",
+      "icon": "arachnos_patron_rangedaoemoderatedmg.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 80.0,
+        "recharge": 32.0,
+        "endurance": 18.98,
+        "activationTime": 2.0,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "damage": {
+          "type": "Energy",
+          "scale": 0.9477,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Shatter Armor",
+      "fullName": "Epic.VEAT_Mace_Mastery.Focused_Accuracy",
+      "rank": 4,
+      "available": 40,
+      "description": "You deliver a punishing blow with your Arachnos Mace dealing superior damage and reducing the target's resistance to damage for a short time. You must be level 41 and have one other Mace Mastery Powers before selecting this power.",
+      "shortHelp": "Melee, DMG(Smash), Foe -Res",
+      "icon": "arachnos_patron_targeteddebuffdefense.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Melee Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 7.0,
+        "recharge": 30.0,
+        "endurance": 17.94,
+        "activationTime": 2.33,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Smashing",
+          "scale": 3.231,
+          "table": "Melee_PvPDamage"
+        },
+        "resistance": {
+          "smashing": {
+            "scale": -2.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": -2.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": -2.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": -2.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": -2.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": -2.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "psionic": {
+            "scale": -2.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": -2.0,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Summon Blaster",
+      "fullName": "Epic.VEAT_Mace_Mastery.Summon_Blaster",
+      "rank": 5,
+      "available": 43,
+      "description": "Black Scorpion has granted you an Arachnobot Blaster for you to command. Arachnobot Blasters were created by Arachnos Orb Weavers to take down particularly powerful super-powered threats. Your access to this Arachnobot is very limited. You must be level 44 and have two other Mace Mastery Powers before selecting this power.",
+      "shortHelp": "Summon Arachnobot: Ranged DMG(Energy)",
+      "icon": "arachnos_patron_summononepet.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Immobilize",
+        "Knockback",
+        "Pet Damage",
+        "Recharge Intensive Pets",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 900.0,
+        "endurance": 26.0,
+        "activationTime": 3.03,
+        "effectArea": "Location"
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['veat_mace_mastery'] = EPIC_VEAT_MACE_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/arachnos_soldier/veat_mu_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Mu Mastery
+ * Archetype: Arachnos Soldier
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\veat_mu_mastery
+ */
+
+const EPIC_VEAT_MU_MASTERY = {
+  "id": "veat_mu_mastery",
+  "name": "Mu Mastery",
+  "displayName": "Mu Mastery",
+  "archetype": "arachnos_soldier",
+  "description": "Scirocco has taught you the ancient powers of the Mu. In their eternal struggle against the Oranbega, the Mu have unlocked many mystical powers, including their very signature crimson lightning. Now you possess their secrets.",
+  "icon": "veat_mu_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Mu Lightning",
+      "fullName": "Epic.VEAT_Mu_Mastery.Mu_Lightning",
+      "rank": 1,
+      "available": 34,
+      "description": "You can send a large blast of Mu electrical energy at a foe, dealing heavy damage and draining some Endurance. Some of this Endurance may transfer back to you.",
+      "shortHelp": "Ranged, DMG(Energy), Foe -End",
+      "icon": "arachnos_patron_targetedrangedhighdmg.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Arachnos_Soldier) || ($archetype == @Class_Arachnos_Widow))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 12.0,
+        "endurance": 8.58,
+        "activationTime": 1.17,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Energy",
+          "scale": 1.579,
+          "table": "Melee_PvPDamage"
+        },
+        "recovery": {
+          "scale": -3.0,
+          "table": "Melee_Ones"
+        }
+      }
+    },
+    {
+      "name": "Electrifying Fences",
+      "fullName": "Epic.VEAT_Mu_Mastery.Electrifying_Fences",
+      "rank": 2,
+      "available": 34,
+      "description": "The Electrifying Fences attempts to Immobilize a group of foes in an area. This power deals some energy damage over time as it slowly drains some Endurance.",
+      "shortHelp": "Ranged (Targeted AoE), DoT(Energy), Foe Immobilize, -END",
+      "icon": "arachnos_patron_rangedaoeimmobilize.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Arachnos_Soldier) || ($archetype == @Class_Arachnos_Widow))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Immobilize",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 50.0,
+        "recharge": 16.0,
+        "endurance": 10.751,
+        "activationTime": 1.17,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "damage": {
+          "type": "Energy",
+          "scale": 0.0929,
+          "table": "Melee_PvPDamage"
+        },
+        "protection": {
+          "immobilize": 3.0
+        },
+        "resistance": {},
+        "recovery": {
+          "scale": -1.0,
+          "table": "Melee_Ones"
+        }
+      }
+    },
+    {
+      "name": "Ball Lightning",
+      "fullName": "Epic.VEAT_Mu_Mastery.Ball_Lightning",
+      "rank": 3,
+      "available": 37,
+      "description": "Hurls a highly charged ball of Mu lightning that explodes on contact. Ball Lightning deals good damage in an area of effect, and drains some Endurance from each target it hits. You must be level 38 and have one other Mu Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Targeted AoE), DoT(Energy), Foe -End",
+      "icon": "arachnos_patron_rangedaoemoderatedmg.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 32.0,
+        "endurance": 18.98,
+        "activationTime": 1.07,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "damage": {
+          "type": "Energy",
+          "scale": 0.1046,
+          "table": "Melee_PvPDamage"
+        },
+        "recovery": {
+          "scale": -1.0,
+          "table": "Melee_Ones"
+        }
+      }
+    },
+    {
+      "name": "Static Discharge",
+      "fullName": "Epic.VEAT_Mu_Mastery.Static_Discharge",
+      "rank": 4,
+      "available": 40,
+      "description": "Hurls multiple bolts of Mu Electricity in an arc that deals damage and drains Endurance from all affected foes in the area. You must be level 41 and have one other Mu Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Cone), DMG(Energy), -END",
+      "icon": "arachnos_patron_rangedconemoderatedmg.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 40.0,
+        "recharge": 24.0,
+        "endurance": 18.98,
+        "activationTime": 2.07,
+        "effectArea": "Cone",
+        "radius": 40.0,
+        "arc": 0.7854,
+        "damage": {
+          "type": "Energy",
+          "scale": 1.1803,
+          "table": "Ranged_PvPDamage"
+        },
+        "recovery": {
+          "scale": -1.0,
+          "table": "Ranged_Ones"
+        }
+      }
+    },
+    {
+      "name": "Summon Striker",
+      "fullName": "Epic.VEAT_Mu_Mastery.Summon_Striker",
+      "rank": 5,
+      "available": 43,
+      "description": "Scirocco has shown you how to call upon a mystical Mu Striker to assist you. The Mu pulse with the blood of their slaughtered ancestors in their veins, and are well practiced in the dark arts. Your access to this Striker is very limited. You must be level 44 and have two other Mu Mastery Powers before selecting this power.",
+      "shortHelp": "Summon Mu Strike: Ranged DMG(Energy)",
+      "icon": "arachnos_patron_summononepet.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "Hold",
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Holds",
+        "Pet Damage",
+        "Recharge Intensive Pets",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 900.0,
+        "endurance": 26.0,
+        "activationTime": 1.17,
+        "effectArea": "Location"
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['veat_mu_mastery'] = EPIC_VEAT_MU_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/arachnos_soldier/veat_soul_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Soul Mastery
+ * Archetype: Arachnos Soldier
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\veat_soul_mastery
+ */
+
+const EPIC_VEAT_SOUL_MASTERY = {
+  "id": "veat_soul_mastery",
+  "name": "Soul Mastery",
+  "displayName": "Soul Mastery",
+  "archetype": "arachnos_soldier",
+  "description": "Ghost Widow has granted you access to the power of darkness and souls. She has shown you how to use the souls of your victims to destroy your enemies. This has granted you access to powers and abilities you have never had before.",
+  "icon": "veat_soul_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Gloom",
+      "fullName": "Epic.VEAT_Soul_Mastery.Gloom",
+      "rank": 1,
+      "available": 34,
+      "description": "Gloom slowly drains a target of life, while reducing his Accuracy. Slower than Dark Blast, but deals more damage over time.",
+      "shortHelp": "Ranged, DoT(Negative), Foe -ACC",
+      "icon": "arachnos_patron_targetedrangedhighdmg.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Arachnos_Soldier) || ($archetype == @Class_Arachnos_Widow))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate To-Hit Debuff",
+        "Ranged Damage",
+        "To Hit Debuff",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 16.0,
+        "endurance": 10.66,
+        "activationTime": 1.1,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Negative",
+          "scale": 0.1833,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Soul Tentacles",
+      "fullName": "Epic.VEAT_Soul_Mastery.Soul_Tentacles",
+      "rank": 2,
+      "available": 34,
+      "description": "You can create a cone shaped rift to the Netherworld that allows the souls of the damned to slip into our reality. These Soul Tentacles will snare all foes within range, Immobilizing them while they drain their life.",
+      "shortHelp": "Ranged (Cone), DMG(Negative), Foe Immobilize",
+      "icon": "arachnos_patron_coneimmobilize.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Arachnos_Soldier) || ($archetype == @Class_Arachnos_Widow))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Immobilize",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 50.0,
+        "recharge": 16.0,
+        "endurance": 10.751,
+        "activationTime": 1.67,
+        "effectArea": "Cone",
+        "radius": 50.0,
+        "arc": 0.5236,
+        "damage": {
+          "type": "Negative",
+          "scale": 0.1588,
+          "table": "Ranged_PvPDamage"
+        },
+        "protection": {
+          "immobilize": 3.0
+        },
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Dark Obliteration",
+      "fullName": "Epic.VEAT_Soul_Mastery.Dark_Obliteration",
+      "rank": 3,
+      "available": 37,
+      "description": "You hurl a large blast of negative energy that violently explodes on impact, exposing the dark power of the Netherworld to all foes near the target. Dark Obliteration can reduce the Accuracy of all affected targets. You must be level 38 and have one other Soul Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Targeted AoE), DMG(Negative), Foe -ACC",
+      "icon": "arachnos_patron_rangedaoemoderatedmg.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate To-Hit Debuff",
+        "Ranged AoE Damage",
+        "To Hit Debuff",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 32.0,
+        "endurance": 18.98,
+        "activationTime": 1.0,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "damage": {
+          "type": "Negative",
+          "scale": 0.7323,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Darkest Night",
+      "fullName": "Epic.VEAT_Soul_Mastery.Darkest_Night",
+      "rank": 4,
+      "available": 40,
+      "description": "While active, you channel Negative Energy onto a targeted foe. Darkest Night decreases the damage potential and chance to hit of the target, and all foes nearby, as long as you keep the power active. You must be level 41 and have one other Soul Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Ranged (Targeted AoE), Foe -DMG -To Hit",
+      "icon": "arachnos_patron_aoedamagedebuff.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "To Hit Debuff"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 70.0,
+        "recharge": 20.0,
+        "endurance": 0.325,
+        "activationTime": 2.37,
+        "effectArea": "AoE",
+        "radius": 15.0
+      }
+    },
+    {
+      "name": "Summon Widow",
+      "fullName": "Epic.VEAT_Soul_Mastery.Summon_Widow",
+      "rank": 5,
+      "available": 43,
+      "description": "Ghost Widow has assigned a beautiful but deadly Blood Widow assassins for you to command. Their weapons of choice include wrist retractable mounted razors and darts, all tipped in deadly poison. Your access to this Blood Widow is very limited, and you can only summon her once every 15 minutes and she will leave after 4 minutes, until defeated, or until you leave a zone or mission. You must be level 44 and have two other Soul Mastery Powers before selecting this power.",
+      "shortHelp": "Summon Blood Widow: Melee DMG(Lethal)",
+      "icon": "arachnos_patron_summononepet.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Pet Damage",
+        "Recharge Intensive Pets",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 900.0,
+        "endurance": 26.0,
+        "activationTime": 3.2,
+        "effectArea": "Location"
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['veat_soul_mastery'] = EPIC_VEAT_SOUL_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
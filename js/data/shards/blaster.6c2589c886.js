@@ -0,0 +1,10303 @@
+// ---- js/data/powersets/blaster/archery.js ----
+;/**
+ * Archery
+ * Character Level: 50
+ * Archetype: blaster
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BLASTER_ARCHERY_POWERSET = {
+    name: "Archery",
+    category: "Unknown",
+    description: "Archery powerset",
+    icon: "archery_set.png",
+    powers: [
+        {
+            name: "Aimed Shot",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged Damage", "Universal Damage Sets"],
+            description: "Though it takes longer to execute, your Aimed Shot deals greater damage than Snap Shot.",
+            shortHelp: "Ranged, DMG(Lethal)",
+            icon: "archery_mediumarrow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.155,
+                range: 80.0,
+                recharge: 6.0,
+                endurance: 5.2,
+                cast: 1.67,
+                damage: {
+                    type: "Lethal",
+                    scale: 3.1292
+                },
+                buffDuration: 9.17
+            }
+        },
+        {
+            name: "Snap Shot",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged Damage", "Universal Damage Sets"],
+            description: "A quick attack that fires an arrow at your foe after only minimal aiming. Fast, but little damage.",
+            shortHelp: "Ranged, DMG(Lethal)",
+            icon: "archery_quickarrow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.155,
+                range: 80.0,
+                recharge: 2.0,
+                endurance: 3.536,
+                cast: 1.0,
+                damage: {
+                    type: "Lethal",
+                    scale: 2.0202
+                },
+                buffDuration: 8.5
+            }
+        },
+        {
+            name: "Fistful of Arrows",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You fire a fistful of arrows at foes in a cone in front of you. Good at close range.",
+            shortHelp: "Ranged (Cone), DMG(Lethal)",
+            icon: "archery_conearrow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.155,
+                range: 50.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.17,
+                damage: {
+                    type: "Lethal",
+                    scale: 1.5382
+                },
+                buffDuration: 8.67
+            }
+        },
+        {
+            name: "Blazing Arrow",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged Damage", "Universal Damage Sets"],
+            description: "You fire a Blazing Arrow at your foe, dealing some Lethal damage and causing them to catch on fire and burn.",
+            shortHelp: "Ranged, DMG(Lethal), DoT(Fire)",
+            icon: "archery_flamingarrow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.155,
+                range: 80.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.83,
+                damage: {
+                    type: "Lethal",
+                    scale: 4.0413
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.125,
+                    ticks: 4
+                },
+                buffDuration: 4.125
+            }
+        },
+        {
+            name: "Aim",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the chance to hit of your attacks for a few seconds. Slightly increases damage.",
+            shortHelp: "Self +To Hit, +DMG",
+            icon: "archery_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.625,
+                damageBuff: 0.425,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Explosive Arrow",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You fire a grenade-tipped arrow at long range. This explosion affects all within the blast radius, and can knock them back.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Lethal/Fire), Knockback",
+            icon: "archery_explodingarrow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.155,
+                range: 80.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 1.9633999999999998
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 1.2067
+                        }
+                    ],
+                    scale: 3.1700999999999997
+                },
+                buffDuration: 8.5
+            }
+        },
+        {
+            name: "Ranged Shot",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged Damage", "Sniper Attacks", "Universal Damage Sets"],
+            description: "A long range shot that blasts your foes. Like most sniper attacks, this power has a bonus to Accuracy, but is best fired from a distance as it can be interrupted. If you are engaged in battle this attack becomes instant-cast. If you are not engaged, it will do bonus damage.",
+            shortHelp: "Sniper, DMG(Lethal), Self +Range",
+            icon: "archery_sniperarrow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.155,
+                range: 150.0,
+                recharge: 12.0,
+                endurance: 14.352,
+                cast: 1.67
+            }
+        },
+        {
+            name: "Stunning Shot",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged Damage", "Stuns", "Universal Damage Sets"],
+            description: "You fire a blunt, weighted arrow at your target's chest. The Stunning Shot has a good chance of stunning your foe.",
+            shortHelp: "Ranged Disorient, DMG(Smashing)",
+            icon: "archery_stunarrow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.155,
+                range: 60.0,
+                recharge: 20.0,
+                endurance: 10.192,
+                cast: 1.0,
+                damage: {
+                    type: "Smashing",
+                    scale: 0.25
+                },
+                buffDuration: 8.5,
+                stun: 3.0
+            }
+        },
+        {
+            name: "Rain of Arrows",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You unleash a Rain of Arrows on a targeted location, damaging foes within a large area.",
+            shortHelp: "Ranged (Location AoE), DoT(Lethal)",
+            icon: "archery_rainofarrows.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 90.0,
+                recharge: 65.0,
+                endurance: 20.8,
+                cast: 2.0,
+                buffDuration: 3.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['blaster/archery'] = BLASTER_ARCHERY_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BLASTER_ARCHERY_POWERSET = BLASTER_ARCHERY_POWERSET;
+}
+
+// ---- js/data/powersets/blaster/assault-rifle.js ----
+;/**
+ * Assault Rifle
+ * Character Level: 50
+ * Archetype: blaster
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BLASTER_ASSAULT_RIFLE_POWERSET = {
+    name: "Assault Rifle",
+    category: "Unknown",
+    description: "Assault Rifle powerset",
+    icon: "assault-rifle_set.png",
+    powers: [
+        {
+            name: "Burst",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Ranged Damage", "Universal Damage Sets"],
+            description: "Quickly fires a Burst of rounds at a single target at very long range. Damage is average, but the fire rate is fast. Can also reduce the target's defense.",
+            shortHelp: "Ranged, DMG(Lethal), Foe -DEF",
+            icon: "assaultweapons_arburst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 90.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                dotDamage: {
+                    type: "Lethal",
+                    scale: 0.6859,
+                    ticks: 3
+                },
+                buffDuration: 0.91,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Slug",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "Fires a single Slug at a targeted foe. Firing a single Slug is slower than firing a Burst, but deals more damage, is longer range, and can knock down foes.",
+            shortHelp: "Ranged, DMG(Lethal), Foe Knockback",
+            icon: "assaultweapons_shotgunslug.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 100.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.4,
+                damage: {
+                    type: "Lethal",
+                    scale: 3.3402
+                }
+            }
+        },
+        {
+            name: "Buckshot",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Good at close range. Fires a cone of Buckshot pellets and can knock some foes down.",
+            shortHelp: "Ranged (Cone), DMG(Lethal), Foe Knockback",
+            icon: "assaultweapons_shotgunbuckshot.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.05,
+                range: 40.0,
+                recharge: 8.0,
+                endurance: 10.192,
+                cast: 0.9,
+                damage: {
+                    type: "Lethal",
+                    scale: 1.5351
+                }
+            }
+        },
+        {
+            name: "M30 Grenade",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Launches a Grenade at long range from beneath the barrel of your Assault Rifle. This explosion affects all within the blast radius, and can knock them back.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Lethal/Fire), Knockback",
+            icon: "assaultweapons_arm30grenade.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.05,
+                range: 80.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 2.0032
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 1.7788
+                        }
+                    ],
+                    scale: 3.782
+                }
+            }
+        },
+        {
+            name: "Beanbag",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged Damage", "Stuns", "Universal Damage Sets"],
+            description: "Fires a single non lethal Beanbag that can seriously Disorient a target. Deals little damage and takes a long time to reload, but renders most targets unable to attack for a good while.",
+            shortHelp: "Ranged, Minor DMG(Smash), Foe Disorient",
+            icon: "assaultweapons_shotgunbeanbag.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 60.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 0.9,
+                damage: {
+                    type: "Smashing",
+                    scale: 2.41
+                },
+                stun: 3.0
+            }
+        },
+        {
+            name: "Sniper Rifle",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Ranged Damage", "Sniper Attacks", "Universal Damage Sets"],
+            description: "Sniper Rifle is a powerful piece of hardware. It is very accurate and has a very long range. The impressive round can knock down its target. Like most sniper attacks, you must take your time to aim, so this attack can be interrupted. If you are engaged in battle this attack becomes instant-cast. If you are not engaged, it will do bonus damage.",
+            shortHelp: "Sniper, DMG(Lethal), Foe Knockback, Self +Range",
+            icon: "assaultweapons_sniperrifle.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 150.0,
+                recharge: 12.0,
+                endurance: 14.352,
+                cast: 1.17
+            }
+        },
+        {
+            name: "Flamethrower",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Spews forth a cone of flames from underneath the barrel of your assault rifle, setting foes on fire. Very accurate and very deadly at medium range.",
+            shortHelp: "Ranged (Cone), DoT(Fire)",
+            icon: "assaultweapons_arflamethrower.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.7854,
+            effects: {
+                accuracy: 1.3,
+                range: 40.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 2.33,
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.6251,
+                    ticks: 4
+                },
+                buffDuration: 4.7
+            }
+        },
+        {
+            name: "Ignite",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Sprays a target with accelerant from your flamethrower, igniting it and causing extreme damage over time. Also sets the location on fire if the target is grounded, inflicting damage to additional foes that step in the area.",
+            shortHelp: "Ranged, DoT(Fire)",
+            icon: "assaultweapons_dot.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.15,
+                range: 60.0,
+                recharge: 14.0,
+                endurance: 13.52,
+                cast: 2.0,
+                damage: {
+                    type: "Fire",
+                    scale: 1.9077
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.19490000000000002,
+                    ticks: 21
+                },
+                buffDuration: 5.25
+            }
+        },
+        {
+            name: "Full Auto",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Opens up your assault rifle on Full Auto to lay down a massive spray of bullets at your target. Although very slow to reload, damage from this attack is massive, shredding all targets within the cone of effect. There's a chance you may land a lucky shot for extra damage.",
+            shortHelp: "Ranged (Cone), DMG(Lethal), +Special",
+            icon: "assaultweapons_arfullauto.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.35,
+                range: 80.0,
+                recharge: 60.0,
+                endurance: 15.6,
+                cast: 2.5,
+                damage: {
+                    type: "Lethal",
+                    scale: 1.0
+                },
+                dotDamage: {
+                    type: "Lethal",
+                    scale: 0.4386,
+                    ticks: 10
+                },
+                buffDuration: 2.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['blaster/assault-rifle'] = BLASTER_ASSAULT_RIFLE_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BLASTER_ASSAULT_RIFLE_POWERSET = BLASTER_ASSAULT_RIFLE_POWERSET;
+}
+
+// ---- js/data/powersets/blaster/beam-rifle.js ----
+;/**
+ * Beam Rifle
+ * Character Level: 50
+ * Archetype: blaster
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BLASTER_BEAM_RIFLE_POWERSET = {
+    name: "Beam Rifle",
+    category: "Unknown",
+    description: "Beam Rifle powerset",
+    icon: "beam-rifle_set.png",
+    powers: [
+        {
+            name: "Charged Shot",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "By charging up your Beam Rifle, you're able to launch a concentrated blast of energy at your foe to cause High Energy damage. The impact strikes with such force that it can knock your target off of their feet. Charge Shot causes additional damage if the target is suffering from the Disintegrating effect. In addition, targets already affected by the Disintegrating effect have a chance to spread to 3 nearby targets. This Disintegrate Spread effect can only hit targets that aren't already affected by the Disintegrating effect. Disintegrate Spread causes Minor Energy damage over time.",
+            shortHelp: "Ranged, DMG(Energy), Foe Knockdown, Special",
+            icon: "beamrifle_chargedshot.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    type: "Energy",
+                    scale: 4.0586
+                }
+            }
+        },
+        {
+            name: "Single Shot",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "You fire a single blast from your Beam Rifle which deals Moderate Energy damage and has a chance to knock the target down. If the target is suffering from the Disintegrating effect, Single Shot will reduce the target's regeneration rate slightly. In addition, targets already affected by the Disintegrating effect have a chance to spread to 3 nearby targets. This Disintegrate Spread effect can only hit targets that aren't already affected by the Disintegrating effect. Disintegrate Spread causes Minor Energy damage over time.",
+            shortHelp: "Ranged, DMG(Energy), Foe Knockdown, Special",
+            icon: "beamrifle_singleshot.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    type: "Energy",
+                    scale: 2.2602
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Cutting Beam",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You fire a constant stream of energy from your weapon and sweep it in a broad arc blasting all foes in a wide cone in front of you. Cutting beam deals Moderate Energy damage and reduces the targets' Defense. This power will cause Minor Energy damage over time if the target is suffering from the Disintegrating effect.",
+            shortHelp: "Ranged (Cone), DMG(Energy), Foe -Def(All), Special",
+            icon: "beamrifle_cuttingbeam.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.05,
+                range: 50.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.9,
+                damage: {
+                    type: "Energy",
+                    scale: 1.7885
+                },
+                dotDamage: {
+                    type: "Energy",
+                    scale: 0.1966,
+                    ticks: 2
+                },
+                buffDuration: 2.1,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Disintegrate",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged Damage", "Universal Damage Sets"],
+            description: "You fire a stream of energy at your foe which causes them to slowly disintegrate and suffer High Energy damage over time. Even after the damage over time effect wears off the target will have their regeneration rate reduced and suffer from the Disintegration effect for an additional period of time. Using Beam Rifle powers on targets affected by Disintegrate will inflict additional effects. Additionally if Single Shot, Charged Shot, Lancer Shot and Penetrating Ray are used on a target suffering from Disintegrating, they have a chance to cause this effect to spread to up 3 nearby targets that aren't already suffering from Disintegrating. Targets affected by this Disintegrate Spread will also suffer some Minor Energy damage over time.",
+            shortHelp: "Ranged, DoT(Energy), Foe -Regen, Special",
+            icon: "beamrifle_disintegrate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.1,
+                range: 80.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.9,
+                dotDamage: {
+                    type: "Energy",
+                    scale: 0.45030000000000003,
+                    ticks: 9
+                },
+                buffDuration: 10.5
+            }
+        },
+        {
+            name: "Aim",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the chance to hit of your attacks for a few seconds. Slightly increases damage.",
+            shortHelp: "Self +To-hit, +DMG",
+            icon: "beamrifle_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.625,
+                damageBuff: 0.425,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Lancer Shot",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged Damage", "Stuns", "Universal Damage Sets"],
+            description: "You charge up your Beam Rifle and deliver an incredibly focused ray of energy at a nearby foe that deals Superior Energy damage and will briefly stun the target. Lancer Shot will cause additional damage if the target is suffering from the Disintegrating effect. In addition, targets already affected by the Disintegrating effect have a chance to spread to 3 nearby targets. This Disintegrate Spread effect can only hit targets that aren't already affected by the Disintegration effect. Disintegrate Spread causes Minor Energy damage over time.",
+            shortHelp: "Ranged, DMG(Energy), Foe Stun, Special",
+            icon: "beamrifle_lancershot.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 80.0,
+                recharge: 11.0,
+                endurance: 11.024,
+                cast: 1.9,
+                damage: {
+                    type: "Energy",
+                    scale: 5.1484000000000005
+                },
+                stun: 3.0
+            }
+        },
+        {
+            name: "Penetrating Ray",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Ranged Damage", "Sniper Attacks", "Universal Damage Sets"],
+            description: "You take careful aim at your target and deliver a punishing supercharged shot from your Beam Rifle. This causes Extreme Energy damage and may knock the target off their feet. If the target is also suffering from the Disintegrating effect it will also suffer additional damage over time. Like all Sniper attacks it will be interrupted if you're attacked. In addition, targets already affected by the Disintegrating effect will cause this effect to spread to 3 nearby targets. This Disintegrate Spread effect can only hit targets that aren't already affected by the Disintegrating effect. Disintegrate Spread causes Minor Energy damage over time. If you are engaged in battle this attack becomes instant-cast. If you are not engaged, it will do bonus damage.",
+            shortHelp: "Sniper, DMG(Energy), Self +Range, Foe Knockdown, Special",
+            icon: "beamrifle_penetratingray.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 150.0,
+                recharge: 12.0,
+                endurance: 14.352,
+                cast: 1.67
+            }
+        },
+        {
+            name: "Piercing Beam",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You release a supercharged beam in a narrow cone of energy that pierces through up to 3 enemies. Piercing Beam deals High Energy damage and briefly reduces their damage resistance. If a target struck by Piercing Beam is suffering from the Disintegrating effect it will immediately suffer additional damage.",
+            shortHelp: "Narrow Ranged (Cone), DMG(Energy), Foes -Res, Special",
+            icon: "beamrifle_piercingbeam.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 3,
+            arc: 0.0873,
+            effects: {
+                accuracy: 1.05,
+                range: 80.0,
+                recharge: 14.0,
+                endurance: 13.52,
+                cast: 2.33,
+                damage: {
+                    type: "Energy",
+                    scale: 5.9524
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Overcharge",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Ranged AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "You overcharge your Beam Rifle and release a massive blast of energy at a group of distant foes causing Extreme Energy damage, causing Minor Energy damage over time, reducing the defense of all affected foes and potentially stunning affected foes. If Overcharge strikes a target suffering from the Disintegrating effect they will be affected by a longer stun.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Energy), Foe Minor DoT (Energy), -Def(All), Disorient, Special",
+            icon: "beamrifle_overcharge.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.4,
+                range: 80.0,
+                recharge: 125.0,
+                endurance: 20.8,
+                cast: 2.9,
+                damage: {
+                    type: "Energy",
+                    scale: 4.2381
+                },
+                dotDamage: {
+                    type: "Energy",
+                    scale: 0.1,
+                    ticks: 4
+                },
+                buffDuration: 4.1,
+                defenseDebuff: 1.5,
+                stun: 3.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['blaster/beam-rifle'] = BLASTER_BEAM_RIFLE_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BLASTER_BEAM_RIFLE_POWERSET = BLASTER_BEAM_RIFLE_POWERSET;
+}
+
+// ---- js/data/powersets/blaster/dark-blast.js ----
+;/**
+ * Dark Blast
+ * Character Level: 50
+ * Archetype: blaster
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BLASTER_DARK_BLAST_POWERSET = {
+    name: "Dark Blast",
+    category: "Unknown",
+    description: "Dark Blast powerset",
+    icon: "dark-blast_set.png",
+    powers: [
+        {
+            name: "Dark Blast",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Blaster Archetype Sets", "Ranged Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "A long range blast of dark energy. Deals moderate Negative Energy damage and reduces the target's chance to hit.",
+            shortHelp: "Ranged, DMG(Negative), Foe -To Hit",
+            icon: "darkcast_darkblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    type: "Negative",
+                    scale: 2.2602
+                },
+                tohitDebuff: 0.75,
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Gloom",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Blaster Archetype Sets", "Ranged Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "Gloom slowly drains a target of life, while reducing their chance to hit. Slower than Dark Blast, but deals more damage over time.",
+            shortHelp: "Ranged, DoT(Negative), Foe -To Hit",
+            icon: "darkcast_souldrain.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.1,
+                dotDamage: {
+                    type: "Negative",
+                    scale: 0.4063,
+                    ticks: 7
+                },
+                buffDuration: 3.6,
+                tohitDebuff: 0.75
+            }
+        },
+        {
+            name: "Umbral Torrent",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Blaster Archetype Sets", "Knockback", "Ranged AoE Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You summon a wave of mire that sweeps away foes within its arc. This attack deals moderate Negative Energy damage to foes, reduces their chance to hit and sends them flying.",
+            shortHelp: "Ranged (Cone), DMG(Negative), Foe -To Hit, Knockback",
+            icon: "darkcast_torrent.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 1.03,
+                damage: {
+                    type: "Negative",
+                    scale: 1.4784
+                },
+                tohitDebuff: 0.75,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Aim",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the chance to hit of your attacks for a few seconds. Slightly increases damage.",
+            shortHelp: "Self +To-hit, +DMG",
+            icon: "darkcast_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.625,
+                damageBuff: 0.425,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Moonbeam",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Blaster Archetype Sets", "Ranged Damage", "Sniper Attacks", "To Hit Debuff", "Universal Damage Sets"],
+            description: "An extremely long range and accurate beam of Negative Energy that deals tremendous damage and reduces the target's chance to hit. This is a sniper attack, and like most sniper attacks, is best fired from a distance as it can be interrupted. If you are engaged in battle this attack becomes instant-cast. If you are not engaged, it will do bonus damage.",
+            shortHelp: "Sniper, DMG(Negative), Target -To Hit, Self +Range",
+            icon: "darkcast_moonbeam.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 150.0,
+                recharge: 12.0,
+                endurance: 14.352,
+                cast: 1.33
+            }
+        },
+        {
+            name: "Tenebrous Tentacles",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Blaster Archetype Sets", "Immobilize", "Ranged AoE Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You can create a cone shaped rift to the Netherworld that allows its native creatures to slip their oily Tentacles into our reality. These creatures will snare all foes within range, Immobilizing them while the Tentacles drain their life and reduce their chance to hit.",
+            shortHelp: "Ranged (Cone), DMG(Negative), Foe Immobilize, -To Hit",
+            icon: "darkcast_tenebroustentacles.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.6981,
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.67,
+                damage: {
+                    type: "Negative",
+                    scale: 1.2743
+                },
+                dotDamage: {
+                    type: "Negative",
+                    scale: 0.3104,
+                    ticks: 7
+                },
+                buffDuration: 7.1,
+                tohitDebuff: 0.75
+            }
+        },
+        {
+            name: "Abyssal Gaze",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Blaster Archetype Sets", "Holds", "Ranged Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You gaze into your foe's eyes giving them a glimpse into the terrifying netherworld rendering them held, reducing their chance to hit and dealing High Negative Energy damage over the next couple of seconds.",
+            shortHelp: "Ranged, DoT(Negative), Foe Hold, -To Hit",
+            icon: "darkcast_abyssalgaze.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 11.0,
+                endurance: 11.024,
+                cast: 1.67,
+                dotDamage: {
+                    type: "Negative",
+                    scale: 1.3767,
+                    ticks: 2
+                },
+                tohitDebuff: 0.75,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Life Drain",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Accurate To-Hit Debuff", "Blaster Archetype Sets", "Healing", "Ranged Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You can tap the power of the Netherworld to steal some life from a target foe and reduce their chance to hit. Some of that stolen life is transferred to you in the form of Hit Points.",
+            shortHelp: "Ranged, DMG(Negative), Target -To Hit, Self +HP",
+            icon: "darkcast_lifedrain.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.93,
+                damage: {
+                    type: "Negative",
+                    scale: 3.7112999999999996
+                },
+                healing: {
+                    scale: 120.4759,
+                    perTarget: true
+                },
+                tohitDebuff: 0.75,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Blackstar",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Blaster Archetype Sets", "Melee AoE Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You can unleash a devastating blast of Negative Energy around yourself, dealing massive Negative Energy and Smashing damage and severely reducing affected foes' chance to hit.",
+            shortHelp: "PBAoE, DMG(Negative), Foe -To Hit",
+            icon: "darkcast_blackstar.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.4,
+                recharge: 145.0,
+                endurance: 27.7316,
+                cast: 3.0,
+                damage: {
+                    type: "Negative",
+                    scale: 5.4065
+                },
+                tohitDebuff: 5.0,
+                buffDuration: 20.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['blaster/dark-blast'] = BLASTER_DARK_BLAST_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BLASTER_DARK_BLAST_POWERSET = BLASTER_DARK_BLAST_POWERSET;
+}
+
+// ---- js/data/powersets/blaster/darkness-manipulation.js ----
+;/**
+ * Darkness Manipulation
+ * Character Level: 50
+ * Archetype: blaster
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BLASTER_DARKNESS_MANIPULATION_POWERSET = {
+    name: "Darkness Manipulation",
+    category: "Unknown",
+    description: "Darkness Manipulation powerset",
+    icon: "darkness-manipulation_set.png",
+    powers: [
+        {
+            name: "Penumbral Grasp",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Blaster Archetype Sets", "Immobilize", "Ranged Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "Penumbral Grasp deals moderate Negative Energy damage, reduces their chance to hit and may leave the targeted foe Immobilized for a brief time. Immobilized foes cannot move but can still attack.",
+            shortHelp: "Ranged, Moderate DOT(Negative), Foe Immobilize, -To Hit",
+            icon: "darknessmanipulation_penumbralgrasp.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.67,
+                dotDamage: {
+                    type: "Negative",
+                    scale: 0.5458000000000001,
+                    ticks: 4
+                },
+                buffDuration: 9.2,
+                tohitDebuff: 0.75
+            }
+        },
+        {
+            name: "Smite",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Blaster Archetype Sets", "Melee Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You wrap your fists with Negative Energy channeled from the Netherworlds, then perform a Smite that deals High negative energy damage. Smite clouds the target's vision, lowering its chance to hit for a short time.",
+            shortHelp: "Melee, High DMG(Smash/Negative), Foe -To Hit",
+            icon: "darknessmanipulation_smite.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 0.97,
+                damage: {
+                    types: [
+                        {
+                            type: "Negative",
+                            scale: 2.5791
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.8596999999999999
+                        }
+                    ],
+                    scale: 3.4387999999999996
+                },
+                tohitDebuff: 0.75,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Death Shroud",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You become a focus point for the Netherworld, allowing its Negative Energy to seep from your body. This will continuously damage all foes in melee range.",
+            shortHelp: "Toggle: PBAoE Minor DoT(Negative)",
+            icon: "darknessmanipulation_deathshroud.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 1.04,
+                cast: 2.47,
+                damage: {
+                    type: "Negative",
+                    scale: 0.2
+                }
+            }
+        },
+        {
+            name: "Shadow Maul",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Blaster Archetype Sets", "Melee AoE Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You wrap your entire arms with Negative Energy channeled from the Netherworlds, then perform a series of blows that deal a lot of damage over a short period of time to multiple targets in front of you. These blows cloud your target's vision, lowering his chance to hit for a short time.",
+            shortHelp: "Melee (Cone), Superior DoT(Smash/Negative), Foe -To Hit",
+            icon: "darknessmanipulation_shadowmaul.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 0.7854,
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 14.0,
+                endurance: 13.52,
+                cast: 3.07,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 0.7136,
+                            ticks: 3
+                        },
+                        {
+                            type: "Negative",
+                            scale: 0.7136,
+                            ticks: 3
+                        }
+                    ]
+                },
+                buffDuration: 2.0,
+                tohitDebuff: 0.75
+            }
+        },
+        {
+            name: "Soul Drain",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Melee AoE Damage", "To Hit Buff", "Universal Damage Sets"],
+            description: "Using this power, you can drain the essence of all nearby foes' souls, thus increasing your own strength. Each affected foe will lose some Hit Points and add to your Damage and chance to hit.",
+            shortHelp: "PBAoE Light DMG(Negative), Self +DMG, +To Hit",
+            icon: "darknessmanipulation_souldrain.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.2,
+                recharge: 120.0,
+                endurance: 15.6,
+                cast: 2.37,
+                damage: {
+                    type: "Negative",
+                    scale: 1.0
+                },
+                tohitBuff: 1.0,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Touch of the Beyond",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Fear", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Endurance Modification", "Fear", "Healing", "To Hit Debuff"],
+            description: "The Netherworld is one scary place, and with but a touch, you can give your enemy a glimpse into this dark world. This will cause them to helplessly tremble in Fear. Foes in this state of panic have reduced chance to hit. Additionally, drawing upon this connection to the Netherworld causes you to rapidly regenerate health and recover endurance for a short time.<br><br><color #fcfc95>Notes: Touch of the Beyond is unaffected by Range changes.</color>",
+            shortHelp: "Fear, Foe -To Hit, Self +Regeneration, +Recovery, +Res(Fear)",
+            icon: "darknessmanipulation_touchoffear.png",
+            powerType: "Click",
+            targetType: "Anything",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 10.0,
+                endurance: 5.2,
+                cast: 1.17
+            }
+        },
+        {
+            name: "Dark Consumption",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Endurance Modification", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "The dark power of the Netherworld allows you to tap the essence of your foe's soul and transfer it to yourself. This will drain the Hit Points of your enemy and add to your Endurance.",
+            shortHelp: "PBAoE Minor DMG(Negative), Self +End",
+            icon: "darknessmanipulation_darkconsumption.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 180.0,
+                endurance: 0.52,
+                cast: 1.03,
+                damage: {
+                    type: "Negative",
+                    scale: 0.8
+                },
+                buffDuration: 8.53
+            }
+        },
+        {
+            name: "Dark Pit",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Stuns"],
+            description: "Envelops a targeted foe and any nearby enemies in a pit of Negative Energy. The attack deals no damage, but Disorients all affected foes for a good while.",
+            shortHelp: "Ranged (Targeted AoE), Foe Disorient",
+            icon: "darknessmanipulation_darkpit.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 0.8,
+                range: 70.0,
+                recharge: 90.0,
+                endurance: 20.18,
+                cast: 1.07,
+                stun: 3.0,
+                buffDuration: 8.57
+            }
+        },
+        {
+            name: "Midnight Grasp",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Blaster Archetype Sets", "Immobilize", "Melee Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "Mastery over the forces of the Netherworld allows you to create dark tentacles that can Immobilize a foe and continuously drain his life force.",
+            shortHelp: "Melee, Superior DMG(Negative), Foe Immobilize, -To Hit",
+            icon: "darknessmanipulation_midnightgrasp.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 18.0,
+                endurance: 11.96,
+                cast: 2.07,
+                damage: {
+                    type: "Negative",
+                    scale: 4.902100000000001
+                },
+                dotDamage: {
+                    type: "Negative",
+                    scale: 0.18130000000000002,
+                    ticks: 4
+                },
+                buffDuration: 3.1,
+                tohitDebuff: 0.75
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['blaster/darkness-manipulation'] = BLASTER_DARKNESS_MANIPULATION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BLASTER_DARKNESS_MANIPULATION_POWERSET = BLASTER_DARKNESS_MANIPULATION_POWERSET;
+}
+
+// ---- js/data/powersets/blaster/dual-pistols.js ----
+;/**
+ * Dual Pistols
+ * Character Level: 50
+ * Archetype: blaster
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BLASTER_DUAL_PISTOLS_POWERSET = {
+    name: "Dual Pistols",
+    category: "Unknown",
+    description: "Dual Pistols powerset",
+    icon: "dual-pistols_set.png",
+    powers: [
+        {
+            name: "Chemical Ammunition",
+            available: -1,
+            tier: 2,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "While this toggle is active you will be equipped with 'Chemical Rounds.' Most of your Dual Pistol attacks will have their secondary damage converted to toxic damage and inflict a minor damage debuff effect on the target.<br><br>In order to earn this power, you must purchase the Swap Ammo power.",
+            shortHelp: "Toggle: Ammo Change (Toxic), Special",
+            icon: "dualpistols_chemicalammo.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                cast: 0.63,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Cryo Ammunition",
+            available: -1,
+            tier: 2,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "While this toggle is active you will be equipped with 'Cryo Rounds'. Most of your Dual Pistol attacks will have their secondary damage converted to cold damage and inflict a minor slow effect on the target.<br><br>In order to earn this power, you must purchase the Swap Ammo power.",
+            shortHelp: "Toggle: Ammo Change (Cold), Special",
+            icon: "dualpistols_cryoammo.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                cast: 0.63,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Incendiary Ammunition",
+            available: -1,
+            tier: 2,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "While this toggle is active you will be equipped with 'Incendiary Rounds.' Most of your Dual Pistol attacks will have their secondary damage converted to fire damage and inflict a minor damage over time effect.<br><br>In order to earn this power, you must purchase the Swap Ammo power.",
+            shortHelp: "Toggle: Ammo Change (Fire), Special",
+            icon: "dualpistols_incendiaryammo.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                cast: 0.63,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Dual Pistols",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "You're a master of akimbo pistols, wielding a high caliber firearm in each hand. Your attacks primarily deal lethal damage and you have a wide variety of attacks, however your strength lies within your ability to use your \"Swap Ammo\" power to change out your ammo mid-battle. Doing so can change your secondary damage type and effects making you an incredibly versatile ranged combatant.",
+            shortHelp: "Dual Pistols",
+            icon: "dual_pistols_set.png"
+        },
+        {
+            name: "Dual Wield",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Dual Wield fires both pistols in rapid succession at its desired target. This power is slower than Pistols, but deals more damage, and the target may get knocked back by the force of the impact.<br><br>Changing your ammo type with the 'Swap Ammo' power will change your secondary damage from lethal to cold, fire or toxic.<br><br>Additionally, changing your ammunition type will also change the secondary effect of this attack from Knockback to:<br><br><color #9bfafa>*A minor attack speed and movement speed debuff if 'Cryo Ammo' is loaded.</color><br><color #fac39b>*A minor damage over time effect if 'Incendiary Ammo' is loaded.</color><br><color #9efa9b>*A -damage effect if 'Chemical Ammo' is loaded.</color>",
+            shortHelp: "Ranged, DMG(Lethal/Special), Foe Knockback/Special",
+            icon: "dualpistols_dualwield.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.1,
+                range: 80.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 3.1292999999999997
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.9388
+                        },
+                        {
+                            type: "Cold",
+                            scale: 0.9388
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 0.9388
+                        }
+                    ],
+                    scale: 5.9456999999999995
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.113,
+                    ticks: 3
+                },
+                buffDuration: 3.1
+            }
+        },
+        {
+            name: "Pistols",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Ranged Damage", "Universal Damage Sets"],
+            description: "Quickly fires a round from one of your heavy automatic pistols. Damage is average, but the fire rate is very fast. If standard ammo is used, Pistols will also reduce the target's Defense.<br><br>Changing your ammo type with the 'Swap Ammo' power will change your secondary damage from lethal to cold, fire or toxic.<br><br>Additionally, changing your ammunition type will also change the secondary effect of this attack from -Defense to:<br><br><color #9bfafa>*A -minor attack speed and movement speed debuff if 'Cryo Ammo' is loaded.</color><br><color #fac39b>*A -minor damage over time effect if 'Incendiary Ammo' is loaded.</color><br><color #9efa9b>*A -damage debuff effect if 'Chemical Ammo' is loaded.</color>",
+            shortHelp: "Ranged, DMG(Lethal/Special), Foe -Defense",
+            icon: "dualpistols_pistols.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.1,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 2.2601
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.6779999999999999
+                        },
+                        {
+                            type: "Cold",
+                            scale: 0.6779999999999999
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 0.6779999999999999
+                        }
+                    ],
+                    scale: 4.2941
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.113,
+                    ticks: 2
+                },
+                buffDuration: 2.1,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Empty Clips",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Knockback", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You empty the clips of both your pistols in an arc of suppression fire. This attack can blast multiple foes in the affected cone area, and has a small chance of knocking some foes down. Affected targets will have their defense reduced slightly as well if Standard Ammo is equipped.<br><br>Changing your ammo type with the 'Swap Ammo' power will change your secondary damage from lethal to cold, fire or toxic.<br><br>Additionally, changing your ammunition type will also change the secondary effect of this attack from Knockdown to:<br><br><color #9bfafa>*A minor attack speed and movement speed debuff if 'Cryo Ammo' is loaded.</color><br><color #fac39b>*A minor damage over time effect if 'Incendiary Ammo' is loaded.</color><br><color #9efa9b>*A -damage effect if 'Chemical Ammo' is loaded.</color>",
+            shortHelp: "Ranged (Cone), DMG(Lethal/Special), Foe -Defense, Knockdown/Special",
+            icon: "dualpistols_emptyclips.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.1,
+                range: 40.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.67,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 0.48790000000000006,
+                            ticks: 3
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.2594,
+                            ticks: 3
+                        },
+                        {
+                            type: "Cold",
+                            scale: 0.1464,
+                            ticks: 3
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 0.1464,
+                            ticks: 3
+                        }
+                    ]
+                },
+                buffDuration: 1.6,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Swap Ammo",
+            available: 5,
+            tier: 3,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "By purchasing this power, you will be granted the Cryo Ammunition, Incendiary Ammunition and Chemical Ammunition toggles. Activating these toggles will change your secondary damage type on most Dual Pistols attacks from lethal (Standard Rounds) to cold (Cryo Rounds), fire (Incendiary Rounds) or toxic (Chemical Rounds).<br><br>These toggles are mutually exclusive and only one can be active at a time. If no Swap Ammo toggles are active, the player will revert to Standard Ammunition.<br><br>Different ammo types also have different secondary effects. Examine your Dual Pistols powers for more information.",
+            shortHelp: "Change Secondary Damage/Effects",
+            icon: "dualpistols_swapammo.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                buffDuration: 2.25
+            }
+        },
+        {
+            name: "Bullet Rain",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You fire your pistols faster than the human eye can follow, causing your bullet trajectory to arc, dealing moderate Lethal damage and possibly knocking your foes back.<br><br>Changing your ammo type with the 'Swap Ammo' power will change your secondary damage from lethal to cold, fire or toxic.<br><br>Additionally, changing your ammunition type will also change the secondary effect of this attack from Knockback to:<br><br><color #9bfafa>*A minor attack speed and movement speed debuff if 'Cryo Ammo' is loaded.</color><br><color #fac39b>*A minor damage over time effect if 'Incendiary Ammo' is loaded.</color><br><color #9efa9b>*A -damage effect if 'Chemical Ammo' is loaded.</color>",
+            shortHelp: "Ranged (Targeted AoE), DMG(Lethal/Special), Knockback/Special",
+            icon: "dualpistols_explosiveclip.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.1,
+                range: 80.0,
+                recharge: 18.0,
+                endurance: 16.848,
+                cast: 1.67,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 1.0957,
+                            ticks: 2
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.2831,
+                            ticks: 2
+                        },
+                        {
+                            type: "Cold",
+                            scale: 0.1701,
+                            ticks: 2
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 0.1701,
+                            ticks: 2
+                        }
+                    ]
+                },
+                buffDuration: 1.1
+            }
+        },
+        {
+            name: "Suppressive Fire",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Holds", "Ranged Damage", "Stuns", "Universal Damage Sets"],
+            description: "Suppressive Fire allows the user to quickly stun their target for a short time and deal a very minor amount of Lethal damage.<br><br>Changing your ammo type with the 'Swap Ammo' power will change your secondary damage from lethal to cold, fire or toxic.<br><br>Additionally, changing your ammunition type will lower the power's base recharge to 8 seconds and change the secondary effect of this attack from Disorient effect to a Hold effect if <color #9bfafa>'Cryo Ammo'</color>, <color #fac39b>'Incendiary Ammo'</color> or <color #9efa9b>'Chemical Ammo'</color> are loaded.<br><br><color #9bfafa>*Significantly higher damage and boss-stopping hold if 'Cryo Ammo' is loaded.</color><br><color #fac39b>*Significantly higher damage and minor hold if 'Incendiary Ammo' is loaded.</color><br><color #9efa9b>*Somewhat increased damage and long duration hold if 'Chemical Ammo' is loaded.</color>",
+            shortHelp: "Ranged, DMG(Lethal/Special), Foe Disorient/Special",
+            icon: "dualpistols_suppressivefire.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.1,
+                range: 60.0,
+                recharge: 20.0,
+                endurance: 10.192,
+                cast: 1.5
+            }
+        },
+        {
+            name: "Executioner's Shot",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Knockback", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Executioner's Shot is a deadly ranged attack. Foes struck by this attack will suffer lethal damage and will likely be knocked back by the impact of this attack. Targets struck by Executioner's Shot while no special ammunition is equipped will have their defenses reduced for a short time.<br><br>Changing your ammo type with the 'Swap Ammo' power will change your secondary damage from lethal to cold, fire or toxic.<br><br>Additionally, changing your ammunition type will also change the secondary effect of this attack from Knockback to:<br><br><color #9bfafa>*A minor attack speed and movement speed debuff if 'Cryo Ammo' is loaded.</color><br><color #fac39b>*A minor damage over time effect if 'Incendiary Ammo' is loaded.</color><br><color #9efa9b>*A -damage effect if 'Chemical Ammo' is loaded.</color>",
+            shortHelp: "Ranged, DMG(Lethal/Special), Foe -Defense, Knockback/Special",
+            icon: "dualpistols_executionersshot.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.25,
+                range: 80.0,
+                recharge: 10.0,
+                endurance: 10.4,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 4.0893
+                        },
+                        {
+                            type: "Fire",
+                            scale: 1.2268
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.2268
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 1.2268
+                        }
+                    ],
+                    scale: 7.769699999999999
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.169,
+                    ticks: 3
+                },
+                buffDuration: 3.1,
+                defenseDebuff: 1.25
+            }
+        },
+        {
+            name: "Piercing Rounds",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You fire your pistols with deadly precision in a very narrow cone, piercing up to three enemies. Piercing Rounds deals Superior lethal damage and reduces targets' Damage Resistance for a short time.<br><br>Changing your ammo type with the 'Swap Ammo' power will change your secondary damage from lethal to cold, fire or toxic, and a secondary effect will be included in this attack:<br><br><color #9bfafa>*A minor attack speed and movement speed debuff if 'Cryo Ammo' is loaded.</color><br><color #fac39b>*A minor damage over time effect if 'Incendiary Ammo' is loaded.</color><br><color #9efa9b>*A -damage effect if 'Chemical Ammo' is loaded.</color><br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Narrow Ranged (Cone), DMG(Lethal/Special), Foes -Res(All)/Special",
+            icon: "dualpistols_piercingrounds.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 3,
+            arc: 0.0873,
+            effects: {
+                accuracy: 1.1,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 2.5,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 4.5920000000000005
+                        },
+                        {
+                            type: "Fire",
+                            scale: 1.3776
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.3776
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 1.3026
+                        }
+                    ],
+                    scale: 8.6498
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.169,
+                    ticks: 2
+                },
+                buffDuration: 2.1
+            }
+        },
+        {
+            name: "Hail of Bullets",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Melee AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You fire a hail of bullets at all enemies around you dealing Extreme lethal damage. Enemies that are struck have a chance to be knocked down. Having Standard Rounds will dramatically increase this chance to knockdown your foes. If you hit at least one target you will gain a moderate melee, ranged and AoE Defense bonus for a brief period.<br><br>Changing your ammo type with the 'Swap Ammo' power will change your secondary damage from lethal to cold, fire or toxic.<br><br>Additionally, changing your ammunition type will also change the secondary effect of this attack from a guaranteed knockdown effect to:<br><br><color #9bfafa>*A minor attack speed and movement speed debuff if 'Cryo Ammo' is loaded.</color><br><color #fac39b>*A minor damage over time effect if 'Incendiary Ammo' is loaded.</color><br><color #9efa9b>*A -damage effect if 'Chemical Ammo' is loaded.</color>",
+            shortHelp: "PBAoE, DMG(Lethal/Special), Self +Def(Melee, Ranged, AoE), Foe Knockdown/Special",
+            icon: "dualpistols_hailofbullets.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.4,
+                recharge: 105.0,
+                endurance: 20.8,
+                cast: 2.47,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 0.6443,
+                            ticks: 11
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.393,
+                            ticks: 11
+                        },
+                        {
+                            type: "Cold",
+                            scale: 0.193,
+                            ticks: 11
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 0.193,
+                            ticks: 11
+                        }
+                    ]
+                },
+                buffDuration: 2.3
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['blaster/dual-pistols'] = BLASTER_DUAL_PISTOLS_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BLASTER_DUAL_PISTOLS_POWERSET = BLASTER_DUAL_PISTOLS_POWERSET;
+}
+
+// ---- js/data/powersets/blaster/earth-manipulation.js ----
+;/**
+ * Earth Manipulation
+ * Character Level: 50
+ * Archetype: blaster
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BLASTER_EARTH_MANIPULATION_POWERSET = {
+    name: "Earth Manipulation",
+    category: "Unknown",
+    description: "Earth Manipulation powerset",
+    icon: "earth-manipulation_set.png",
+    powers: [
+        {
+            name: "Heavy Mallet",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Melee Damage", "Universal Damage Sets"],
+            description: "Your control over the earth allows you to form a mallet of solid stone. This Stone Mallet deals high damage and can knock down weak foes.<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee, High DMG(Smashing), Knockback",
+            icon: "earthmanip_heavymallet.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 1.33,
+                damage: {
+                    type: "Smashing",
+                    scale: 4.0908999999999995
+                }
+            }
+        },
+        {
+            name: "Stone Prison",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Immobilize", "Ranged Damage", "Universal Damage Sets"],
+            description: "Immobilizes a single target within an earthy formation and deals some Smashing damage over time. Some more resilient foes may require multiple attacks to Immobilize. Stone Prison can also reduce a target's Defense.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, Moderate DoT(Smash), Foe Immobilize, -DEF, -Fly",
+            icon: "earthmanip_stoneprison.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.23,
+                dotDamage: {
+                    type: "Smashing",
+                    scale: 0.4842,
+                    ticks: 4
+                },
+                buffDuration: 9.2,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Salt Crystals",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Sleep", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Sleep"],
+            description: "Attempts to encrust all nearby foes in a Pillar of Salt. The victims will remain encased within the salt for quite a while, but will automatically break free if attacked. Affected targets have reduced defense for a while, even if they break free.<br><br><color #fcfc95>Notes: The Sleep component of this power is Auto Hit against regular enemies, but a To Hit check is required against AVs and players, as well as to make secondary effects apply.</color><br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE, Foe Sleep, -DEF",
+            icon: "earthmanip_saltcrystals.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 15.6,
+                cast: 1.07,
+                defenseDebuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Build Up",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your chance to hit.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "earthmanip_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Tremor",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You can cause a localized earthquake immediately around you. This will deal moderate damage to every foe in melee range, while knocking them back.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE, Light DMG(Smashing), Knockback",
+            icon: "earthmanip_tremor.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 14.0,
+                endurance: 13.52,
+                cast: 2.53,
+                damage: {
+                    type: "Smashing",
+                    scale: 2.1324
+                }
+            }
+        },
+        {
+            name: "Mud Bath",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing", "Slow Movement"],
+            description: "While this power is active, you draw upon the geothermal power of the Earth to create a bubbling pool of hot mud around you. All foes in melee range will become snared and entrapped in the mud, slowing them down. You recover a small amount of health every few seconds while this power is active.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: PBAoE, -SPD, Self +Heal Over Time, +Recovery",
+            icon: "earthmanip_mudbath.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                cast: 2.03,
+                buffDuration: 5.0
+            }
+        },
+        {
+            name: "Beryl Crystals",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "Activating this power summons several rare Beryl Crystals to orbit around you. These Crystals can bring clarity of the mind and increase your Accuracy, Perception to see hidden foes, and grant resistance to Confusion, Perception and ToHit debuffs.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self Res(Confuse, Perception, ToHit), +Perception, Accuracy",
+            icon: "earthmanip_beryl.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.13,
+                cast: 0.73,
+                protection: {
+                    confuse: 7.266
+                },
+                buffDuration: 0.75,
+                tohitBuff: 1.0
+            }
+        },
+        {
+            name: "Fracture",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Stuns"],
+            description: "You can Fracture the ground around an enemy, disorienting all affected targets for a good while. You must be on the ground to activate this power.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged (Targeted AoE), Foe Disorient, -DEF",
+            icon: "earthmanip_fracture.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 0.8,
+                range: 70.0,
+                recharge: 90.0,
+                endurance: 10.4,
+                cast: 1.0,
+                defenseDebuff: 1.0,
+                buffDuration: 10.0,
+                stun: 3.0
+            }
+        },
+        {
+            name: "Seismic Smash",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Holds", "Melee Damage", "Universal Damage Sets"],
+            description: "This massive attack hits with all the force of the Earth itself. It deals tremendous amounts of damage and may Hold the target if they are not defeated outright.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee, Extreme DMG(Smashing), Foe Hold",
+            icon: "earthmanip_seismicsmash.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 1.5,
+                damage: {
+                    type: "Smashing",
+                    scale: 5.8099
+                }
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['blaster/earth-manipulation'] = BLASTER_EARTH_MANIPULATION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BLASTER_EARTH_MANIPULATION_POWERSET = BLASTER_EARTH_MANIPULATION_POWERSET;
+}
+
+// ---- js/data/powersets/blaster/electrical-blast.js ----
+;/**
+ * Electrical Blast
+ * Character Level: 50
+ * Archetype: blaster
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BLASTER_ELECTRICAL_BLAST_POWERSET = {
+    name: "Electrical Blast",
+    category: "Unknown",
+    description: "Electrical Blast powerset",
+    icon: "electrical-blast_set.png",
+    powers: [
+        {
+            name: "Charged Bolts",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Endurance Modification", "Ranged Damage", "Universal Damage Sets"],
+            description: "You can quickly hurl small bolts of electricity at foes, dealing some damage and draining some Endurance. Some of this Endurance may transfer back to you. Charged Bolts deals light damage but recharges quickly.",
+            shortHelp: "Ranged, DMG(Energy), Foe -End",
+            icon: "electricalbolt_chargedbolts.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    type: "Energy",
+                    scale: 2.2602
+                }
+            }
+        },
+        {
+            name: "Lightning Bolt",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Endurance Modification", "Ranged Damage", "Universal Damage Sets"],
+            description: "You can send a large blast of electrical energy at a foe, dealing heavy damage and draining some Endurance. Some of this Endurance may transfer back to you. Lightning Bolt deals more damage than Charged Bolts, but recharges more slowly.",
+            shortHelp: "Ranged, DMG(Energy), Foe -End",
+            icon: "electricalbolt_lightningbolt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    type: "Energy",
+                    scale: 3.5292
+                }
+            }
+        },
+        {
+            name: "Ball Lightning",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Endurance Modification", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Hurls a highly charged ball of lightning that explodes on contact. Ball Lightning deals good damage in an area of effect, and drains some Endurance from each target it hits.",
+            shortHelp: "Ranged (Targeted AoE), DoT(Energy), Foe -End",
+            icon: "electricalbolt_balllightning.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.07,
+                damage: {
+                    type: "Energy",
+                    scale: 1.0431
+                },
+                dotDamage: {
+                    type: "Energy",
+                    scale: 0.1288,
+                    ticks: 3
+                },
+                buffDuration: 2.2
+            }
+        },
+        {
+            name: "Short Circuit",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Endurance Modification", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "Releases a burst of electrical energy around you, shocking all nearby foes. This highly accurate discharge deals Moderate damage over time, drains a lot of Endurance from the targets and renders them unable to recover Endurance for quite a while. Additionally, Short Circuit deals extra damage to most robots and mechanical foes. Short Circuit is very effective when used with your other Endurance draining powers.",
+            shortHelp: "PBAoE, DoT(Energy), Foe -End, -Recovery",
+            icon: "electricalbolt_shortcircuit.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.3,
+                recharge: 20.0,
+                endurance: 15.6,
+                cast: 2.5,
+                dotDamage: {
+                    type: "Energy",
+                    scale: 0.3373,
+                    ticks: 4
+                },
+                buffDuration: 1.5
+            }
+        },
+        {
+            name: "Charge Up",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the chance to hit of your attacks for a few seconds. Slightly increases damage and endurance modification.",
+            shortHelp: "Self +To Hit, +DMG, +End Mod",
+            icon: "electricalbolt_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 4.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Zapp",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Endurance Modification", "Ranged Damage", "Sniper Attacks", "Universal Damage Sets"],
+            description: "A focused electrical blast that can travel great distances with high Accuracy. Zapp drains Endurance, and is best fired from a distance, as it can be interrupted. Some of the Endurance you drain may transfer back to you. If you are engaged in battle this attack becomes instant-cast. If you are not engaged, it will do bonus damage.",
+            shortHelp: "Sniper, DMG(Energy), Foe -End, Self +Range",
+            icon: "electricalbolt_zapp.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 150.0,
+                recharge: 12.0,
+                endurance: 14.352,
+                cast: 1.33
+            }
+        },
+        {
+            name: "Tesla Cage",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Endurance Modification", "Holds", "Ranged Damage", "Universal Damage Sets"],
+            description: "Tesla Cage confines the target in an electrical prison. The target is overwhelmed by the electrical charge and is left helpless and can be attacked. The target is drained of some Endurance and some of that Endurance may be transferred back to you.<br><br>Taking this power allows you to build Static with each activation of other electrical blast attacks. As Static builds, you can unleash it with Tesla Cage as electricity will jump off your main target and shock others nearby!",
+            shortHelp: "Ranged, DMG(Energy), Foe Hold, -End",
+            icon: "electricalbolt_telsacage.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Chain",
+            maxTargets: 1,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 10.0,
+                endurance: 6.864,
+                cast: 2.17,
+                damage: {
+                    type: "Energy",
+                    scale: 0.18130000000000002
+                },
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Voltaic Sentinel",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Endurance Modification", "Pet Damage", "Recharge Intensive Pets", "Universal Damage Sets"],
+            description: "You can manifest a polarized electricity field that hovers above the ground and hurls bolts of electricity at nearby foes. Any enemy that passes near this Sentinel risks serious injury. The Sentinel is not alive and cannot be targeted or attacked by enemies. The Sentinel can fly and will follow you.",
+            shortHelp: "Summon Sentinel: Ranged, DMG(Energy), Foe -End",
+            icon: "electricalbolt_voltaicsentinal.png",
+            powerType: "Toggle",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 2.0,
+                range: 60.0,
+                recharge: 10.0,
+                endurance: 0.52,
+                cast: 3.1
+            }
+        },
+        {
+            name: "Thunderous Blast",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Endurance Modification", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You hurl a tremendously powerful bolt of lightning at a target, devastating all nearby foes. Thunderous Blast deals extreme Energy and Smashing damage and drains a lot of Endurance from nearby foes.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Energy), Foe -End, -Recovery",
+            icon: "electricalbolt_thunderouseblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.4,
+                range: 60.0,
+                recharge: 170.0,
+                endurance: 27.7316,
+                cast: 2.93,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 4.9475999999999996
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.0
+                        }
+                    ],
+                    scale: 5.9475999999999996
+                },
+                buffDuration: 20.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['blaster/electrical-blast'] = BLASTER_ELECTRICAL_BLAST_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BLASTER_ELECTRICAL_BLAST_POWERSET = BLASTER_ELECTRICAL_BLAST_POWERSET;
+}
+
+// ---- js/data/powersets/blaster/electricity-manipulation.js ----
+;/**
+ * Electricity Manipulation
+ * Character Level: 50
+ * Archetype: blaster
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BLASTER_ELECTRICITY_MANIPULATION_POWERSET = {
+    name: "Electricity Manipulation",
+    category: "Unknown",
+    description: "Electricity Manipulation powerset",
+    icon: "electricity-manipulation_set.png",
+    powers: [
+        {
+            name: "Charged Brawl",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Endurance Modification", "Melee Damage", "Sleep", "Universal Damage Sets"],
+            description: "Your fists become electrically charged and deliver a powerful punch. Charged Brawl can drain some Endurance from the target and may overload their synapses, leaving them writhing for a moment. A portion of drained Endurance may be returned to you. Disturbing an overloaded target will disperse the electrical charge and release them.",
+            shortHelp: "Melee, DMG(Smash/Energy), Target Sleep, -End",
+            icon: "electricitymanipulation_chargedbrawl.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 0.83,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 2.3810000000000002
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.96
+                        }
+                    ],
+                    scale: 3.341
+                },
+                buffDuration: 2.0
+            }
+        },
+        {
+            name: "Electric Fence",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Endurance Modification", "Immobilize", "Ranged Damage", "Universal Damage Sets"],
+            description: "Surrounds and Immobilizes a single target in an Electric Fence. Deals some damage over time and slowly drains some Endurance. Useful for keeping villains at bay.",
+            shortHelp: "Ranged, DoT (Energy), Foe Immobilize, -End",
+            icon: "electricitymanipulation_electricfence.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.17,
+                dotDamage: {
+                    type: "Energy",
+                    scale: 0.4758,
+                    ticks: 4
+                },
+                buffDuration: 8.2
+            }
+        },
+        {
+            name: "Build Up",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly boosts your attacks for a few seconds. Slightly increases chance to hit.",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "electricitymanipulation_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Havoc Punch",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Endurance Modification", "Knockback", "Melee Damage", "Sleep", "Universal Damage Sets"],
+            description: "The Havoc Punch is a slower attack than Charged Brawl, but makes up for it with greater damage. Havoc Punch can knock down targets, drain some Endurance from your target, or even overload their synapses, leaving them writhing for a moment. A portion of the drained Endurance may be given back to you. Disturbing an overloaded target will disperse the electrical charge and release them.",
+            shortHelp: "Melee, DMG(Smash/Energy), Foe Sleep, -End, Knock back",
+            icon: "electricitymanipulation_havokpunch.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 14.0,
+                endurance: 13.52,
+                cast: 1.5,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 4.01
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.6
+                        }
+                    ],
+                    scale: 4.609999999999999
+                },
+                buffDuration: 4.0
+            }
+        },
+        {
+            name: "Thunder Strike",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Melee AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "A massive attack. You smash your foes with all the power of a lightning bolt. The pummeled victim takes tremendous damage and may be Disoriented. Any nearby foes may be knocked down and take some damage from the shockwave.",
+            shortHelp: "Melee (AoE), DMG(Smash/Energy), Foe Disorient, Knockback",
+            icon: "electricitymanipulation_thunderstrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 2.53,
+                buffDuration: 10.8
+            }
+        },
+        {
+            name: "Dynamo",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Endurance Modification", "Healing", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "While active, you regenerate health and recover endurance very quickly. Overflow energy generated by this power can damage all nearby foes.",
+            shortHelp: "Toggle: PBAoE, DoT (Energy), Foe -End",
+            icon: "electricitymanipulation_lightningfield.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                cast: 2.03,
+                damage: {
+                    type: "Energy",
+                    scale: 0.30820000000000003
+                }
+            }
+        },
+        {
+            name: "Power Sink",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "Power Sink leeches energy directly from the bodies of all nearby foes, draining their Endurance. Each foe you draw energy from increases your Endurance. If there are no foes within range, you will not gain any Endurance.",
+            shortHelp: "PBAoE, Self +End, Foe -End",
+            icon: "electricitymanipulation_powersink.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 60.0,
+                endurance: 13.0,
+                cast: 2.03,
+                buffDuration: 4.0
+            }
+        },
+        {
+            name: "Force of Thunder",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Stuns"],
+            description: "You can channel the raw force of a thunderbolt through you knocking enemies back and potentially disorienting them.",
+            shortHelp: "PBAoE, Foe Disorient, Knockback",
+            icon: "electricitymanipulation_lightningclap.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 0.8,
+                recharge: 30.0,
+                endurance: 14.0,
+                cast: 1.23,
+                buffDuration: 8.73
+            }
+        },
+        {
+            name: "Shocking Grasp",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Endurance Modification", "Holds", "Melee Damage", "Universal Damage Sets"],
+            description: "Shocking Grasp causes the target to be overcome with a violent electrical charge. The seized target is left writhing in agony and is unable to defend themselves. Shocking Grasp also drains a significant amount of Endurance from the target and may return a portion of it to you.",
+            shortHelp: "Melee, DoT (Energy), Target Hold, -End",
+            icon: "electricitymanipulation_shockinggrasp.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 15.0,
+                endurance: 18.2,
+                cast: 1.0,
+                dotDamage: {
+                    type: "Energy",
+                    scale: 0.5832999999999999,
+                    ticks: 5
+                },
+                buffDuration: 5.1
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['blaster/electricity-manipulation'] = BLASTER_ELECTRICITY_MANIPULATION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BLASTER_ELECTRICITY_MANIPULATION_POWERSET = BLASTER_ELECTRICITY_MANIPULATION_POWERSET;
+}
+
+// ---- js/data/powersets/blaster/energy-blast.js ----
+;/**
+ * Energy Blast
+ * Character Level: 50
+ * Archetype: blaster
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BLASTER_ENERGY_BLAST_POWERSET = {
+    name: "Energy Blast",
+    category: "Unknown",
+    description: "Energy Blast powerset",
+    icon: "energy-blast_set.png",
+    powers: [
+        {
+            name: "Power Blast",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "A much more powerful, yet slower version of Power Bolt. Power Blast sends a focused beam of energy at a foe that can knock them back.",
+            shortHelp: "Ranged, DMG(Energy/Smash), Foe Knockback",
+            icon: "powerblast_powerblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 2.8891999999999998
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.64
+                        }
+                    ],
+                    scale: 3.5292
+                }
+            }
+        },
+        {
+            name: "Power Bolt",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "A quick attack that rapidly hurls small bolts of energy at foes, sometimes knocking them down. Fast, but little damage.",
+            shortHelp: "Ranged, DMG(Energy/Smash), Foe Knockback",
+            icon: "powerblast_powerbolts.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 2.0602
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.2
+                        }
+                    ],
+                    scale: 2.2602
+                }
+            }
+        },
+        {
+            name: "Energy Torrent",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Energy Torrent unleashes a cone of powerful energy that can smash foes and possibly send them flying.",
+            shortHelp: "Ranged (Cone), DMG(Energy/Smash), Foe Knockback",
+            icon: "powerblast_energytorrent.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.7854,
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 1.07,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 1.3445
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.3
+                        }
+                    ],
+                    scale: 1.6445
+                }
+            }
+        },
+        {
+            name: "Power Burst",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "A devastating attack, Power Burst unleashes a massive amount of energy dealing very high damage at short distances. The impact from this burst often knocks back most foes.",
+            shortHelp: "Ranged, DMG(Energy/Smash), Foe Knockback",
+            icon: "powerblast_powerburst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 10.0,
+                endurance: 10.4,
+                cast: 2.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 3.3203
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.0
+                        }
+                    ],
+                    scale: 4.3203
+                }
+            }
+        },
+        {
+            name: "Sniper Blast",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Ranged Damage", "Sniper Attacks", "Universal Damage Sets"],
+            description: "A focused blast that can travel great distances with high Accuracy. This is a sniper attack, and is best fired from a distance, as it can be interrupted. Sniper Blast may knock targets backwards. If you are engaged in battle this attack becomes instant-cast. If you are not engaged, it will do bonus damage.",
+            shortHelp: "Sniper, DMG(Energy/Smash), Foe Knockback, Self +Range",
+            icon: "powerblast_sniperblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 150.0,
+                recharge: 12.0,
+                endurance: 14.352,
+                cast: 1.33
+            }
+        },
+        {
+            name: "Aim",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the chance to hit of your attacks for a few seconds. Slightly increases damage.",
+            shortHelp: "Self +To Hit, +DMG",
+            icon: "powerblast_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.625,
+                damageBuff: 0.425,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Power Push",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "This ranged attack deals little damage, but sends the target flying for a great distance.",
+            shortHelp: "Ranged DMG(Energy/Smash), Foe High Knockback",
+            icon: "powerblast_powerpush.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.4,
+                range: 70.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.1,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 0.33
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.156
+                        }
+                    ],
+                    scale: 0.486
+                }
+            }
+        },
+        {
+            name: "Explosive Blast",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You hurl a blast of charged energy that violently explodes on impact, damaging all foes near the target. Explosive Blast may knock targets backwards.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Smash/Energy), Foe Knockback",
+            icon: "powerblast_explosion.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 3.2887
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.5
+                        }
+                    ],
+                    scale: 3.7887
+                }
+            }
+        },
+        {
+            name: "Nova",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You can explode in a tremendous blast of energy, sending nearby foes flying. The Nova deals extreme Energy and Smashing damage to all nearby foes.",
+            shortHelp: "PBAoE, DMG(Energy), Foe Knockback",
+            icon: "powerblast_novablast.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.4,
+                recharge: 145.0,
+                endurance: 27.716,
+                cast: 3.0,
+                damage: {
+                    type: "Energy",
+                    scale: 5.4065
+                }
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['blaster/energy-blast'] = BLASTER_ENERGY_BLAST_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BLASTER_ENERGY_BLAST_POWERSET = BLASTER_ENERGY_BLAST_POWERSET;
+}
+
+// ---- js/data/powersets/blaster/energy-manipulation.js ----
+;/**
+ * Energy Manipulation
+ * Character Level: 50
+ * Archetype: blaster
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BLASTER_ENERGY_MANIPULATION_POWERSET = {
+    name: "Energy Manipulation",
+    category: "Unknown",
+    description: "Energy Manipulation powerset",
+    icon: "energy-manipulation_set.png",
+    powers: [
+        {
+            name: "Energy Punch",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Melee Damage", "Stuns", "Universal Damage Sets"],
+            description: "Powerful focused punch that may Disorient your opponent!<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Melee, High DMG(Smash/Energy), Foe Disorient",
+            icon: "energymanipulation_energypunch.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 0.83,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 1.7046000000000001
+                        },
+                        {
+                            type: "Energy",
+                            scale: 1.6364
+                        }
+                    ],
+                    scale: 3.341
+                },
+                stun: 2.0
+            }
+        },
+        {
+            name: "Power Thrust",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Melee Damage", "Universal Damage Sets"],
+            description: "A focused attack that violently shoves the target and sends them flying. Deals minimal damage, but can be very effective.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Melee, Minor DMG(Energy/Smash), Foe Knockback",
+            icon: "energymanipulation_powerthrust.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 1.7399
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.4
+                        }
+                    ],
+                    scale: 2.1399
+                }
+            }
+        },
+        {
+            name: "Build Up",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your chance to hit.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "energymanipulation_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Bone Smasher",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Melee Damage", "Stuns", "Universal Damage Sets"],
+            description: "The Bone Smasher is a slow attack, but makes up for it with a good amount of damage. Has a greater chance to Disorient than Energy Punch.<br><br><color #fcfc95>Damage: Superior.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee, Superior DMG(Smash/Energy), Foe Disorient",
+            icon: "energymanipulation_bonesmasher.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 14.0,
+                endurance: 13.52,
+                cast: 1.5,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 3.2270000000000003
+                        },
+                        {
+                            type: "Energy",
+                            scale: 1.383
+                        }
+                    ],
+                    scale: 4.61
+                },
+                stun: 3.0
+            }
+        },
+        {
+            name: "Energize",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You can channel a tremendous amount of energy through your body for a short period of time. Doing so will heal some hit points, reduce the endurance cost of your powers, boost your regeneration dramatically, and make you resistant to Stuns for a short time.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self Endurance Discount, Heal, +Regen, Res(Stun)",
+            icon: "energymanipulation_conservepower.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 120.0,
+                endurance: 5.2,
+                cast: 1.17,
+                protection: {
+                    stun: 8.304
+                },
+                healing: {
+                    scale: 120.4759,
+                    perTarget: true
+                },
+                buffDuration: 60.0,
+                stun: 1.0,
+                stunDuration: 60.0
+            }
+        },
+        {
+            name: "Stun",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Melee Damage", "Stuns", "Universal Damage Sets"],
+            description: "Stun deals a little bit of damage, but Disorients its target a great deal. This attack can Disorient most opponents. If this power is used under the effects of Boost Range, this power will become a ranged stun instead. If this power is used under the effect of Power Boost, it will become an AoE stun, but it will recharge in 90 seconds instead of 12. Both these effects can be combined for the power to become a ranged AoE stun.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee, Minor DMG(Energy/Smashing), Foe Disorient, Special",
+            icon: "energymanipulation_stun.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 12.0,
+                endurance: 10.192,
+                cast: 1.8
+            }
+        },
+        {
+            name: "Power Boost",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "Greatly boosts the secondary effects of your powers. Your powers effects like Heals, Defense Buffs, Endurance Drains, Disorients, Holds, Immobilizes, Knockbacks and more, are all improved. The effects of Power Boost last a short while, and only the next couple of attacks will be boosted.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Self +Special",
+            icon: "energymanipulation_powerboost.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 60.0,
+                endurance: 7.8,
+                cast: 1.17,
+                buffDuration: 15.0,
+                stun: 1.0,
+                stunDuration: 15.0,
+                tohitBuff: 0.66,
+                defenseBuff: 0.66
+            }
+        },
+        {
+            name: "Boost Range",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "You can boost your powers to increase the range of your next few attacks.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Self Range Increase",
+            icon: "energymanipulation_boostrange.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 60.0,
+                endurance: 13.0,
+                cast: 1.17,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Total Focus",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Melee Damage", "Stuns", "Universal Damage Sets"],
+            description: "Total Focus is complete mastery over Energy Melee. This is a very slow, but incredibly devastating attack that can knock out most opponents, leaving them Disoriented. Due to the exhausting nature of Total Focus, recharge time is very long.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee, Extreme DMG(Energy/Smash), Foe Disorient",
+            icon: "energymanipulation_totalfocus.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 2.53,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 4.696400000000001
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.8346
+                        }
+                    ],
+                    scale: 6.531000000000001
+                },
+                stun: 3.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['blaster/energy-manipulation'] = BLASTER_ENERGY_MANIPULATION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BLASTER_ENERGY_MANIPULATION_POWERSET = BLASTER_ENERGY_MANIPULATION_POWERSET;
+}
+
+// ---- js/data/powersets/blaster/fire-blast.js ----
+;/**
+ * Fire Blast
+ * Character Level: 50
+ * Archetype: blaster
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BLASTER_FIRE_BLAST_POWERSET = {
+    name: "Fire Blast",
+    category: "Unknown",
+    description: "Fire Blast powerset",
+    icon: "fire-blast_set.png",
+    powers: [
+        {
+            name: "Fire Blast",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged Damage", "Universal Damage Sets"],
+            description: "Sends a Blast of Fire at a targeted foe and sets the target on fire for a short period of time. Slower recharge rate than Flares, but more damage.",
+            shortHelp: "Ranged, DMG(Fire)",
+            icon: "fireblast_fireblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.2,
+                damage: {
+                    type: "Fire",
+                    scale: 2.4002
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.15,
+                    ticks: 3
+                },
+                buffDuration: 3.1
+            }
+        },
+        {
+            name: "Flares",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged Damage", "Universal Damage Sets"],
+            description: "A quick attack that throws Flares at the target. Little damage, but very fast.",
+            shortHelp: "Ranged, DMG(Fire)",
+            icon: "fireblast_flare.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 2.18,
+                endurance: 3.692,
+                cast: 1.0,
+                damage: {
+                    type: "Fire",
+                    scale: 1.8974
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.15,
+                    ticks: 3
+                },
+                buffDuration: 3.1
+            }
+        },
+        {
+            name: "Fire Ball",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Hurls an exploding Fireball that consumes a targeted foe, and all nearby enemies. Anyone in that explosion is burned and set ablaze.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Fire/Smash)",
+            icon: "fireblast_fireball.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 1.1641
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.2
+                        }
+                    ],
+                    scale: 1.3640999999999999
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.15,
+                    ticks: 2
+                },
+                buffDuration: 2.1
+            }
+        },
+        {
+            name: "Rain of Fire",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Summons a Rain of Fire over a targeted location, burning foes and reducing their movement speed within a large area.",
+            shortHelp: "Ranged (Location AoE), DoT(Fire), -SPD",
+            icon: "fireblast_rainoffire.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                endurance: 26.0,
+                cast: 2.03,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Fire Breath",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You can breathe forth a torrent of fire that burns all foes within its narrow cone. Very accurate and very deadly at medium range.",
+            shortHelp: "Close (Cone), DoT(Fire)",
+            icon: "fireblast_arcoffire.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.2,
+                range: 40.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 2.67,
+                dotDamage: {
+                    type: "Fire",
+                    scale: 2.0037000000000003,
+                    ticks: 2
+                },
+                buffDuration: 2.1
+            }
+        },
+        {
+            name: "Aim",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the chance to hit of your attacks for a few seconds. Slightly increases damage.",
+            shortHelp: "Self +To Hit, +DMG",
+            icon: "fireblast_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.625,
+                damageBuff: 0.425,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Blaze",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged Damage", "Universal Damage Sets"],
+            description: "A devastating flame attack.",
+            shortHelp: "Ranged, DMG(Fire)",
+            icon: "fireblast_blaze.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 10.0,
+                endurance: 10.4,
+                cast: 1.0,
+                damage: {
+                    type: "Fire",
+                    scale: 3.6202
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.225,
+                    ticks: 4
+                },
+                buffDuration: 4.1
+            }
+        },
+        {
+            name: "Blazing Bolt",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged Damage", "Sniper Attacks", "Universal Damage Sets"],
+            description: "A long range beam of fire that blasts your foes. Like most sniper attacks, this power has a bonus to Accuracy, but is best fired from a distance as it can be interrupted. If you are engaged in battle this attack becomes instant-cast. If you are not engaged, it will do bonus damage.",
+            shortHelp: "Sniper, DMG(Fire), Self +Range",
+            icon: "fireblast_blazingbolt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 150.0,
+                recharge: 12.0,
+                endurance: 14.352,
+                cast: 1.67
+            }
+        },
+        {
+            name: "Inferno",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "Unleashes a massive fiery explosion to devastate all nearby enemies and set them ablaze. Inferno deals Extreme Fire damage to all nearby foes and inflicts Moderate Fire damage over time.",
+            shortHelp: "PBAoE, DMG(Fire/Smash), Foe DoT(Fire)",
+            icon: "fireblast_inferno.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.4,
+                recharge: 145.0,
+                endurance: 27.716,
+                cast: 3.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 4.4065
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.0
+                        }
+                    ],
+                    scale: 5.4065
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.3,
+                    ticks: 8
+                },
+                buffDuration: 8.1
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['blaster/fire-blast'] = BLASTER_FIRE_BLAST_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BLASTER_FIRE_BLAST_POWERSET = BLASTER_FIRE_BLAST_POWERSET;
+}
+
+// ---- js/data/powersets/blaster/fire-manipulation.js ----
+;/**
+ * Fire Manipulation
+ * Character Level: 50
+ * Archetype: blaster
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BLASTER_FIRE_MANIPULATION_POWERSET = {
+    name: "Fire Manipulation",
+    category: "Unknown",
+    description: "Fire Manipulation powerset",
+    icon: "fire-manipulation_set.png",
+    powers: [
+        {
+            name: "Fire Sword",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Melee Damage", "Universal Damage Sets"],
+            description: "Through concentration, you can create a Sword of Fire that sets foes ablaze. Successful attacks from the Fire Sword will cut through your target defenses and ignite them, dealing damage over time.",
+            shortHelp: "Melee, Moderate DMG(Fire), -Defense",
+            icon: "firemanipulation_firesword.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.33,
+                damage: {
+                    type: "Fire",
+                    scale: 3.691
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.1,
+                    ticks: 4
+                },
+                buffDuration: 3.1,
+                defenseDebuff: 0.5
+            }
+        },
+        {
+            name: "Ring of Fire",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Immobilize", "Ranged Damage", "Universal Damage Sets"],
+            description: "Immobilizes your target in a Ring of Fire. Deals some damage over time. Useful for keeping villains at bay.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, DoT (Fire), Foe Immobilize",
+            icon: "firemanipulation_ringoffire.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 6.0,
+                endurance: 7.8,
+                cast: 1.17,
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.4632,
+                    ticks: 6
+                },
+                buffDuration: 9.2
+            }
+        },
+        {
+            name: "Combustion",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "Your mastery of fire allows you to violently raise the temperature around yourself in an attempt to spontaneously combust any nearby foes and set them ablaze, dealing damage over time.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee (AoE), DoT (Fire)",
+            icon: "firemanipulation_combustion.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 15.0,
+                endurance: 13.0,
+                cast: 2.4,
+                damage: {
+                    type: "Fire",
+                    scale: 0.9855
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.1971,
+                    ticks: 9
+                },
+                buffDuration: 7.1
+            }
+        },
+        {
+            name: "Fire Sword Circle",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "Mastery of your Fire Sword has enabled you to make an attack on every foe within melee distance. This will slash and burn your enemies, dealing minor damage and setting them ablaze.",
+            shortHelp: "PBAoE Melee, DMG(Fire/Lethal)",
+            icon: "firemanipulation_fireswordcircle.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 2.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 2.5085
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 0.755
+                        }
+                    ],
+                    scale: 3.2635
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.1,
+                    ticks: 2
+                },
+                buffDuration: 2.1
+            }
+        },
+        {
+            name: "Build Up",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly boosts your attacks for a few seconds. Slightly increases chance to hit.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +DMG +To Hit",
+            icon: "firemanipulation_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Cauterizing Aura",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Blaster Archetype Sets", "Endurance Modification", "Healing", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "While active, you are surrounded by flames that continuously burn all foes that attempt to enter melee range. In addition, you recover a small amount of health every few seconds.<br><br><color #fcfc95>Damage: Minor(DoT).</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: PBAoE, DoT (Fire), Self +Heal Over Time, +Recovery",
+            icon: "firemanipulation_blazingaura.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                cast: 2.03,
+                damage: {
+                    type: "Fire",
+                    scale: 0.36260000000000003
+                }
+            }
+        },
+        {
+            name: "Consume",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Endurance Modification", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You can Consume some fuel from your nearby enemies to recover Endurance.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE, DMG(Fire), Self +End",
+            icon: "firemanipulation_consume.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 180.0,
+                endurance: 0.52,
+                cast: 2.03,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Burn",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You can ignite the ground beneath you, freeing yourself from Immobilization effects. Foes that enter the flames you leave behind will take damage. You must be near the ground to activate this power.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Location (PBAoE), DoT (Fire), Self Res(Immobilize)",
+            icon: "firemanipulation_burn.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                recharge: 25.0,
+                endurance: 5.2,
+                cast: 2.03,
+                damage: {
+                    type: "Fire",
+                    scale: 1.44
+                }
+            }
+        },
+        {
+            name: "Hot Feet",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Melee AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "While active, you heat the earth in a large area around yourself. Enemy movement is Slowed as they attempt to flee the immediate area. All foes in the affected area may also suffer some damage over time. You cannot fly and must be near the ground to use this power.<br><br><color #fcfc95>Damage: Minor(DoT).</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Toggle: PBAoE, DoT (Fire), Foe -SPD",
+            icon: "firemanipulation_hotfeet.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 2.08,
+                cast: 1.47,
+                damage: {
+                    type: "Fire",
+                    scale: 0.45330000000000004
+                },
+                buffDuration: 15.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['blaster/fire-manipulation'] = BLASTER_FIRE_MANIPULATION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BLASTER_FIRE_MANIPULATION_POWERSET = BLASTER_FIRE_MANIPULATION_POWERSET;
+}
+
+// ---- js/data/powersets/blaster/gadgets.js ----
+;/**
+ * Gadgets
+ * Character Level: 50
+ * Archetype: blaster
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BLASTER_GADGETS_POWERSET = {
+    name: "Gadgets",
+    category: "Unknown",
+    description: "Gadgets powerset",
+    icon: "gadgets_set.png",
+    powers: [
+        {
+            name: "Caltrops",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You toss a handful of Caltrops at a targeted location and spread the tiny metal spikes over a large area. Any villains that pass over the Caltrops will be forced to move at a slower rate. They will also take some trivial Lethal damage over time.<br><br><color #fcfc95>Damage: Minor(DoT).</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Location AoE), Minor DoT(Lethal), Foe -Speed",
+            icon: "gadgets_caltrops.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 25.0,
+                recharge: 45.0,
+                endurance: 7.8,
+                cast: 1.07,
+                buffDuration: 45.0
+            }
+        },
+        {
+            name: "Toxic Web Grenade",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Immobilize", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Upon impact, the Toxic Web Grenade expels a strong, tenuous, and very sticky substance that can Immobilize and corrode most targets, dealing moderate Toxic damage. This device does not prevent targets from attacking, although their attack rate is Slowed. The Web can bring down flying entities and halts jumping.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, Moderate DoT(Toxic), Target Immobilize, -Recharge, -Fly",
+            icon: "gadgets_webgrenade.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.37,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.5038,
+                    ticks: 4
+                },
+                buffDuration: 8.2
+            }
+        },
+        {
+            name: "Taser",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged Damage", "Stuns", "Universal Damage Sets"],
+            description: "The High Voltage Taser is an overcharged stun-gun, releasing a high-voltage, high-amperage electrical charge that can Disorient most opponents with major tissue damage. The Taser has a very short range.<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Melee, High DMG(Energy), Foe Disorient",
+            icon: "gadgets_taser.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 20.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.0,
+                damage: {
+                    type: "Energy",
+                    scale: 3.46
+                },
+                stun: 3.0
+            }
+        },
+        {
+            name: "Targeting Drone",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "When this device is activated, the small Targeting Drone hovers around your head and emits targeting laser sights. The lasers can dramatically improve your chance to hit, slightly increase the damage you deal, and increase your perception, allowing you to better see stealthy foes. If not engaged in combat, this power will give a large damage buff to your opening attack. Targeting Drone also grants you resistance to powers that debuff your chance to hit.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Self +To Hit, +Damage, +Perception, Res(DeBuff To Hit)",
+            icon: "gadgets_targetingdrone.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.156,
+                cast: 1.17,
+                buffDuration: 0.6,
+                tohitBuff: 2.0
+            }
+        },
+        {
+            name: "Smoke Grenade",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["To Hit Debuff"],
+            description: "The Smoke Grenade envelops all those in the affected area in a cloud of smoke. Most villains will not be able to see past normal melee range, although some may have better perception. If the villains are attacked, they will be alerted to your presence, but will suffer a penalty to their chance to hit.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Target AoE), Foe -Perception, -To Hit",
+            icon: "gadgets_smokegrenade.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 7.8,
+                cast: 1.37,
+                tohitDebuff: 0.7,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Field Operative",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge"],
+            allowedSetCategories: ["Defense Sets", "Endurance Modification", "Healing"],
+            description: "Through a mixture of combat training and highly sophisticated devices you are considered a Field Operative. You use an LCD body coating to become partially invisible. While concealed you can only be seen at very close range. If you attack while concealed, you will be discovered. Even if discovered, you are hard to see but will retain some of your Defense bonus to all attacks. Unlike some stealth powers, Field Operative has no movement penalty. This power's stealth component will not work with any other form of Concealment power such as Shadow Fall or Steamy Mist. In addition to being stealthy, your training also allows you to regenerate health and recovery endurance at an accelerated rate while this power is active. However, only half of this regeneration bonus is enhanceable.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Toggle: Self Stealth, +DEF(All), +Special, +Regeneration, +Recovery",
+            icon: "gadgets_cloak.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                cast: 0.73,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Trip Mine",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You can place a Trip Mine on the ground. Any villains that pass near the Trip Mine will cause it to explode, severely damaging all nearby foes and sending them flying. The Trip Mine is almost impossible to detect, but it is fragile and may be set off by an enemy's explosion. Even if destroyed, the Trip Mine will detonate.<br><br><color #fcfc95>Damage: Superior.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Place Mine: PBAoE, Superior DMG(Lethal/Fire), Foe Knockback",
+            icon: "gadgets_mine.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 30.0,
+                endurance: 13.0,
+                cast: 2.77,
+                buffDuration: 260.0
+            }
+        },
+        {
+            name: "Remote Bomb",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You can place a Remote Bomb on the ground. The Remote Bomb will detonate once the power is activated a second time, resulting in a massive explosion that can devastate all nearby foes and send them flying. If used while targeting an enemy in melee range, you can attach the Remote Bomb to them instead!<br><br>The Remote Bomb is small, and almost impossible to detect.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Place Bomb: PBAoE, Extreme DMG(Lethal/Fire), Foe Knockback",
+            icon: "gadgets_remotebomb.png",
+            powerType: "Click",
+            targetType: "Anything",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 2.0
+            }
+        },
+        {
+            name: "Gun Drone",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged Damage", "Recharge Intensive Pets", "Threat Duration", "Universal Damage Sets"],
+            description: "You can summon a Gun Drone. The Drone has an extremely fast fire rate and is equipped with a customized tracking system. Once locked on, the Drone will continue to unload a volley of lead into the target until it is destroyed. Enemies hit by the drone, as well as those near it, will prioritize attacking it over it's owner. The Drone is armored, but can be destroyed.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Build Turret: Ranged, Moderate DMG(Lethal)",
+            icon: "gadgets_turret.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                recharge: 180.0,
+                endurance: 39.0,
+                cast: 1.0,
+                buffDuration: 90.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['blaster/gadgets'] = BLASTER_GADGETS_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BLASTER_GADGETS_POWERSET = BLASTER_GADGETS_POWERSET;
+}
+
+// ---- js/data/powersets/blaster/ice-blast.js ----
+;/**
+ * Ice Blast
+ * Character Level: 50
+ * Archetype: blaster
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BLASTER_ICE_BLAST_POWERSET = {
+    name: "Ice Blast",
+    category: "Unknown",
+    description: "Ice Blast powerset",
+    icon: "ice-blast_set.png",
+    powers: [
+        {
+            name: "Ice Blast",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Ice Blast hurls shards of ice at foes and Slows their attacks and movement for a time. Slower recharge than Ice Bolt, but more damage.",
+            shortHelp: "Ranged, DMG(Cold), Foe -Recharge, -SPD",
+            icon: "iceblast_iceblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    type: "Cold",
+                    scale: 3.5292
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Ice Bolt",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Ice Bolt quickly pelts an enemy with small icy daggers; their chill Slows a foe's attacks and movement for a time. Fast, but little damage.",
+            shortHelp: "Ranged, DMG(Cold), Foe -Recharge, -SPD",
+            icon: "iceblast_bolt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    type: "Cold",
+                    scale: 2.2602
+                },
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Frost Breath",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Unleashes a cone of frosty breath that can Slow your opponents' movement and attacks. Very accurate and very deadly at medium range.",
+            shortHelp: "Close (Cone), DoT(Cold), Foe -Recharge, -SPD",
+            icon: "iceblast_frostbreath.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.2,
+                range: 40.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 2.67,
+                dotDamage: {
+                    type: "Cold",
+                    scale: 2.828,
+                    ticks: 1
+                },
+                buffDuration: 0.6
+            }
+        },
+        {
+            name: "Aim",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the chance to hit of your attacks for a few seconds. Slightly increases damage.",
+            shortHelp: "Self +To Hit, +DMG",
+            icon: "iceblast_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.625,
+                damageBuff: 0.425,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Freeze Ray",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Holds", "Ranged Damage", "Universal Damage Sets"],
+            description: "Freeze Ray encases your foe in a block of ice, holding them helpless in place for a while. While frozen, your foe will take Cold damage over time.",
+            shortHelp: "Ranged, DMG(Cold), Foe Hold",
+            icon: "iceblast_freezeray.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.0,
+                dotDamage: {
+                    type: "Cold",
+                    scale: 0.2,
+                    ticks: 10
+                },
+                buffDuration: 2.0
+            }
+        },
+        {
+            name: "Ice Storm",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Shred your foes with this Ice Storm. This power deals a lot of damage in a large area and can Slow all affected targets movement and attack speed.",
+            shortHelp: "Ranged (Location AoE), DoT(Cold, Lethal), Foe -Recharge, -SPD",
+            icon: "iceblast_freezingrain.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                endurance: 15.6,
+                cast: 2.03,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Bitter Ice Blast",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Blaster Archetype Sets", "Ranged Damage", "Slow Movement", "To Hit Debuff", "Universal Damage Sets"],
+            description: "A slower yet more powerful version of Ice Blast, Bitter Ice Blast deals much more damage and can also reduce your enemy's chance to hit. Like other Ice Blast powers, Bitter Ice Blast can Slow a target's movement and attack speed.",
+            shortHelp: "Ranged, DMG(Cold), Foe -Recharge, -SPD, -To Hit",
+            icon: "iceblast_bitterfrostblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 1.07,
+                damage: {
+                    type: "Cold",
+                    scale: 3.9092
+                },
+                tohitDebuff: 1.0,
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Bitter Freeze Ray",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Holds", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "This power can Hold your opponent frozen solid in a block of ice. The victim can be attacked and will remain frozen and helpless. After the ice thaws, the victim emerges chilled and Slowed.",
+            shortHelp: "Ranged, DMG(Cold), Foe Hold",
+            icon: "iceblast_bitterfreezeray.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 2.5,
+                damage: {
+                    type: "Cold",
+                    scale: 5.5100999999999996
+                },
+                buffDuration: 18.0
+            }
+        },
+        {
+            name: "Blizzard",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Blaster Archetype Sets", "Ranged AoE Damage", "Slow Movement", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You can conjure a Blizzard that inflicts Extreme Cold and Lethal damage over time and can Slow the attack rate of all your opponents in a large area, reducing their chance to hit and possibly knocking them back.",
+            shortHelp: "Ranged (Location AoE), DoT(Cold), Foe -To Hit, -SPD, -Recharge, Knockback",
+            icon: "iceblast_blizzard.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 2.0,
+                range: 60.0,
+                recharge: 170.0,
+                endurance: 27.716,
+                cast: 2.03,
+                buffDuration: 15.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['blaster/ice-blast'] = BLASTER_ICE_BLAST_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BLASTER_ICE_BLAST_POWERSET = BLASTER_ICE_BLAST_POWERSET;
+}
+
+// ---- js/data/powersets/blaster/ice-manipulation.js ----
+;/**
+ * Ice Manipulation
+ * Character Level: 50
+ * Archetype: blaster
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BLASTER_ICE_MANIPULATION_POWERSET = {
+    name: "Ice Manipulation",
+    category: "Unknown",
+    description: "Ice Manipulation powerset",
+    icon: "ice-manipulation_set.png",
+    powers: [
+        {
+            name: "Chilblain",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Immobilize", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Immobilizes your target in an icy trap. Deals some damage over time and slightly Slows the target's attack and movement speed. Useful for keeping villains at bay.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, Moderate DoT(Cold), Foe Immobilize, -SPD, -Recharge",
+            icon: "icemanipulation_chillblains.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.17,
+                dotDamage: {
+                    type: "Cold",
+                    scale: 0.4758,
+                    ticks: 4
+                },
+                buffDuration: 9.2
+            }
+        },
+        {
+            name: "Frozen Fists",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Melee Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Frozen Fists encrusts your hands in ice, giving them the ability to quickly inflict moderate damage on villains. The foe's attack and movement speed is Slowed, due to the chills caused by the cold blows.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Melee, Moderate DMG(Cold/Smash), Foe -Recharge, -SPD",
+            icon: "icemanipulation_frozenfist.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.33,
+                damage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 2.2908
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.0
+                        }
+                    ],
+                    scale: 3.2908
+                },
+                buffDuration: 5.0
+            }
+        },
+        {
+            name: "Ice Sword",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Melee Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You create a blade of solid ice that deals higher damage then Frozen Fists. Being hit by this Ice Sword will Slow a target's movement and attack speed, due to the intense chill.<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Melee, High DMG(Cold/Lethal), Foe -Recharge, -SPD",
+            icon: "icemanipulation_icesword.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.33,
+                damage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 2.7308
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 0.96
+                        }
+                    ],
+                    scale: 3.6908
+                },
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Frigid Protection",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "Recharge"],
+            allowedSetCategories: ["Accurate Healing", "Endurance Modification", "Healing", "Slow Movement"],
+            description: "While active, you dramatically lower the temperature around yourself, Slowing the attack rate of all nearby foes, as well as their movement speed and damage. The air around your body becomes so cold that attacks deflect off of it, granting you absorption, while your body becomes extremely energy efficient, granting you bonus Recovery.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: PBAoE, Foe -Recharge, -Speed, -DMG, Self +Absorb over Time, +Recovery",
+            icon: "icemanipulation_chillingembrace.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                cast: 0.73,
+                buffDuration: 5.0
+            }
+        },
+        {
+            name: "Build Up",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly boosts your attacks for a few seconds. Slightly increases chance to hit.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "icemanipulation_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Ice Patch",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "You emanate a patch of ice around you, which causes foes that step onto it to slip and fall down. This effect lasts until the ice melts. You must be near the ground to activate this power.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Location (PBAoE), Foe Knockdown",
+            icon: "icemanipulation_icepatch.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 2.0,
+                recharge: 35.0,
+                endurance: 10.4,
+                cast: 1.57,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Shiver",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "You can blast forth a wide cone of chilling air that dramatically Slows the movement and attack rate of nearby foes.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Cone), Foe -SPD, -Recharge",
+            icon: "icemanipulation_shiver.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 2.3562,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 12.0,
+                endurance: 10.4,
+                cast: 2.17,
+                buffDuration: 18.0
+            }
+        },
+        {
+            name: "Freezing Touch",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Holds", "Melee Damage", "Universal Damage Sets"],
+            description: "This Freezing Touch will encase a single foe in a block of ice. This will deal minor damage as well as freezing them in their tracks, leaving them cold and helpless.<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Melee, High DMG(Cold), Foe Hold",
+            icon: "icemanipulation_freezingtouch.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.0,
+                damage: {
+                    type: "Cold",
+                    scale: 0.75
+                },
+                dotDamage: {
+                    type: "Cold",
+                    scale: 0.2582,
+                    ticks: 10
+                },
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Frozen Aura",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Melee AoE Damage", "Sleep", "Universal Damage Sets"],
+            description: "Your mastery of cold enables you to dramatically lower the temperature immediately around you. Foes near you when you perform a Frozen Aura will be caught in a fragile casing of ice. Frozen foes will break free if attacked. Frozen Aura deals no significant damage.<br><br><color #fcfc95>Notes: The Sleep component of this power is Auto Hit against regular enemies, but a To Hit check is required to against AVs and players, as well as to make secondary effects apply.</color><br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE Melee, Moderate DMG(Smashing), Foe Sleep",
+            icon: "icemanipulation_frozenaura.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 2.1,
+                damage: {
+                    type: "Cold",
+                    scale: 1.068
+                }
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['blaster/ice-manipulation'] = BLASTER_ICE_MANIPULATION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BLASTER_ICE_MANIPULATION_POWERSET = BLASTER_ICE_MANIPULATION_POWERSET;
+}
+
+// ---- js/data/powersets/blaster/martial-manipulation.js ----
+;/**
+ * Martial Manipulation
+ * Character Level: 50
+ * Archetype: blaster
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BLASTER_MARTIAL_MANIPULATION_POWERSET = {
+    name: "Martial Combat",
+    category: "Unknown",
+    description: "Martial Combat powerset",
+    icon: "martial-manipulation_set.png",
+    powers: [
+        {
+            name: "Ki Push",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Melee Damage", "Universal Damage Sets"],
+            description: "You smash your foe with a burst of Ki Energy, sending them flying through the air in slow motion.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Melee, Light DMG(Smash), Foe Repel, KB",
+            icon: "martialmanipulation_kipush.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 0.83,
+                damage: {
+                    type: "Smashing",
+                    scale: 2.1409000000000002
+                },
+                buffDuration: 2.0
+            }
+        },
+        {
+            name: "Storm Kick",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Melee Damage", "Universal Damage Sets"],
+            description: "You can unleash a roundhouse kick that pummels your foe for moderate damage, knocking them down. Storm Kick has an additional chance to cause your target to bleed for Lethal damage over time.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Melee, Moderate DMG(Smash), DoT(Lethal), Foe Knockdown",
+            icon: "martialmanipulation_stormkick.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.07,
+                damage: {
+                    type: "Smashing",
+                    scale: 2.4311
+                },
+                dotDamage: {
+                    type: "Lethal",
+                    scale: 0.1926,
+                    ticks: 3
+                },
+                buffDuration: 1.5
+            }
+        },
+        {
+            name: "Reach for the Limit",
+            available: 3,
+            tier: 2,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "You are constantly looking for vulnerabilities in your foes' stances and positioning. Whenever you attack, you have a chance to gain a moderate +ToHit and +Damage bonus for a short duration.",
+            shortHelp: "All Attacks: Chance for +ToHit, +DMG(All)",
+            icon: "martialmanipulation_reachforthelimit.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Burst of Speed",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Melee AoE Damage", "Teleport", "Universal Damage Sets", "Universal Travel"],
+            description: "Channeling physical Ki inwards, you move more quickly than can be seen for an instant, allowing you to move instantly to a targeted location and strike at targets within melee range. You can use this Burst of Speed up to 3 times before it needs to recharge.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Location AoE Moderate DMG (Smash), Self Teleport",
+            icon: "martialmanipulation_burstofspeed.png",
+            powerType: "Click",
+            targetType: "Location (Teleport)",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 200.0,
+                recharge: 90.0,
+                endurance: 13.52,
+                cast: 1.0,
+                buffDuration: 2.0
+            }
+        },
+        {
+            name: "Dragon's Tail",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "This low spinning kick deals moderate damage, but has a chance to hit all enemies in melee range. Successful hits may trip and knock down your opponents.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE Melee, Light DMG(Smash), Foe Knockdown",
+            icon: "martialmanipulation_dragonstail.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.05,
+                recharge: 14.0,
+                endurance: 13.52,
+                cast: 1.5,
+                damage: {
+                    type: "Smashing",
+                    scale: 2.0936
+                },
+                buffDuration: 9.0
+            }
+        },
+        {
+            name: "Reaction Time",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing", "Slow Movement"],
+            description: "You attune yourself to the world around you, moving with preternatural speed. All enemies nearby move slowly and have reduced recharge, and you can absorb small amounts of damage every 2 seconds. When Reaction Time is deactivated, you gain a burst of speed for a short duration, increasing your own recharge and move speed.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle (PBAoE), Self Absorb over Time, +Recovery, Foe –Rech, - Move, Special",
+            icon: "martialmanipulation_reactiontime.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                cast: 1.83,
+                buffDuration: 5.0
+            }
+        },
+        {
+            name: "Inner Will",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "When pushed to your limit, you can tap into an inner reserve of power, allowing you to overcome impossible odds. When you are below half health, below half endurance, or the victim of any status effect, you may activate Inner Will. Inner Will cancels any status effects currently affecting you, increases your resistance to status effects by 100%, and increases the power of your own status effect-inducing powers. Inner Will also heals you for a moderate amount when activated.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self Heal, Special",
+            icon: "martialmanipulation_innerwill.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 180.0,
+                cast: 1.03,
+                stun: 1.0,
+                stunDuration: 30.0,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Throw Sand",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Stuns"],
+            description: "You grab some nearby debris and fling it towards a nearby foe, obstructing their vision and dazing them.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged (Cone), Foe Disorient, -Perception",
+            icon: "martialmanipulations_throwsand.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.7854,
+            effects: {
+                accuracy: 0.8,
+                range: 40.0,
+                recharge: 90.0,
+                endurance: 20.18,
+                cast: 1.07,
+                stun: 3.0,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Eagles Claw",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Melee Damage", "Stuns", "Universal Damage Sets"],
+            description: "You can perform a devastating kick that can severely Disorient most opponents. Eagle's Claw strikes so powerfully that it weakens your target's resolve, reducing their Range and Recharge for several seconds after attacking, and has an additional chance to cause your target to bleed for Lethal damage over time.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee, Extreme DMG(Smash), DoT(Lethal), Foe Minor Disorient, +Special",
+            icon: "martialmanipulation_eaglesclaw.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 18.0,
+                endurance: 16.848,
+                cast: 2.53,
+                damage: {
+                    type: "Smashing",
+                    scale: 6.1307
+                },
+                dotDamage: {
+                    type: "Lethal",
+                    scale: 0.5,
+                    ticks: 10
+                },
+                buffDuration: 5.0,
+                stun: 3.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['blaster/martial-manipulation'] = BLASTER_MARTIAL_MANIPULATION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BLASTER_MARTIAL_MANIPULATION_POWERSET = BLASTER_MARTIAL_MANIPULATION_POWERSET;
+}
+
+// ---- js/data/powersets/blaster/mental-manipulation.js ----
+;/**
+ * Mental Manipulation
+ * Character Level: 50
+ * Archetype: blaster
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BLASTER_MENTAL_MANIPULATION_POWERSET = {
+    name: "Mental Manipulation",
+    category: "Unknown",
+    description: "Mental Manipulation powerset",
+    icon: "mental-manipulation_set.png",
+    powers: [
+        {
+            name: "Mind Probe",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Melee Damage", "Universal Damage Sets"],
+            description: "Grip the minds of your foe with a Mind Probe. You must be in close proximity to pull off this attack that wrecks havoc on your foes synapses, dealing moderate Psionic Damage while reducing their attack speed.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Melee, Moderate DMG(Psionic), Target -Recharge",
+            icon: "psionicassault_mindprobe.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.17,
+                damage: {
+                    type: "Psionic",
+                    scale: 3.1788999999999996
+                },
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Subdual",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Immobilize", "Ranged Damage", "Universal Damage Sets"],
+            description: "Subdual deals moderate Psionic damage and may leave the targeted foe Immobilized for a brief time. Immobilized foes cannot move but can still attack.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, Moderate DOT(Psionic), Foe Immobilize",
+            icon: "mentalcontrol_subdue.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.67,
+                dotDamage: {
+                    type: "Psionic",
+                    scale: 0.5458000000000001,
+                    ticks: 4
+                },
+                buffDuration: 9.2
+            }
+        },
+        {
+            name: "World of Confusion",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Confuse", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "This toggle power allows you to cause psionic damage and cause confusion within a group of foes, creating chaos. The chance of confusing an enemy is lower than then chance of damaging them, and it may take multiple hits to affect stronger opponents. All affected foes within the area will turn and attack each other, ignoring all heroes. You will not receive any Experience Points for foes defeated by Confused enemies.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: PBAoE, Minor DoT(Psionic), Foe Confuse",
+            icon: "mentalcontrol_worldofconfusion.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.52,
+                cast: 1.67,
+                damage: {
+                    type: "Psionic",
+                    scale: 0.12
+                }
+            }
+        },
+        {
+            name: "Psychic Scream",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "This howl of Psionic energy resonates in the minds of all foes within its conical area of effect, inflicting moderate damage.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Cone), Light DMG(Psionic), Foe -Recharge",
+            icon: "psionicassault_psychicscream.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 2.67,
+                damage: {
+                    type: "Psionic",
+                    scale: 2.0434
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Concentration",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly boosts your attacks for a few seconds. Slightly increases chance to hit.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "mentalcontrol_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 2.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Drain Psyche",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Endurance Modification", "Healing"],
+            description: "You Drain the Psyche of nearby foes, thus weakening their Hit Point Regeneration and Endurance Recovery and boosting your own.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE Foe -Regen, -Recovery; Self +Regen, +Recovery",
+            icon: "psionicassault_psychicsiphon.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 120.0,
+                endurance: 13.0,
+                cast: 1.33,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Scare",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Fear", "Accuracy"],
+            allowedSetCategories: ["Fear"],
+            description: "You entwine a single foe within their deepest fears and cause them to helplessly tremble for a brief while.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Foe Fear",
+            icon: "mentalcontrol_scare.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 20.0,
+                endurance: 10.4,
+                cast: 2.67,
+                buffDuration: 10.17
+            }
+        },
+        {
+            name: "Psychic Shockwave",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Melee AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "Psychic Shockwave is a devastating Psionic attack that wracks the minds of all nearby foes. Affected foes may have a reduced attack rate and may be left Disoriented.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Close (AoE), Light DMG(Psionic), Foe Disorient -Recharge",
+            icon: "psionicassault_psionicshockwave.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 1.97,
+                damage: {
+                    type: "Psionic",
+                    scale: 1.8370000000000002
+                },
+                stun: 2.0,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Telekinetic Thrust",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Melee Damage", "Universal Damage Sets"],
+            description: "A focused attack of intense mental power that violently sends a nearby foe flying. Deals minimal damage, but can be very effective.<br><br><color #fcfc95>Damage: Superior.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee, Superior DMG(Psionic/Smash), Foe Knockback",
+            icon: "psionicassault_telekineticthrust.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Psionic",
+                            scale: 3.6688
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.46
+                        }
+                    ],
+                    scale: 5.1288
+                },
+                buffDuration: 9.57
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['blaster/mental-manipulation'] = BLASTER_MENTAL_MANIPULATION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BLASTER_MENTAL_MANIPULATION_POWERSET = BLASTER_MENTAL_MANIPULATION_POWERSET;
+}
+
+// ---- js/data/powersets/blaster/ninja-training.js ----
+;/**
+ * Ninja Training
+ * Character Level: 50
+ * Archetype: blaster
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BLASTER_NINJA_TRAINING_POWERSET = {
+    name: "Ninja Training",
+    category: "Unknown",
+    description: "Ninja Training powerset",
+    icon: "ninja-training_set.png",
+    powers: [
+        {
+            name: "Immobilizing Dart",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Immobilize", "Ranged Damage", "Universal Damage Sets"],
+            description: "Immobilizing Darts do minor toxic damage over time and weakens your foe's legs. They will either be entirely unable to move, or severely slowed down.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, Minor DoT(Toxic), Foe Immobilize",
+            icon: "ninjatools_immob.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 60.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.5,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.522,
+                    ticks: 3
+                },
+                buffDuration: 3.1
+            }
+        },
+        {
+            name: "Sting of the Wasp",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Melee Damage", "Universal Damage Sets"],
+            description: "You perform a standard attack with your Ninja Blade. Sting of the Wasp can reduce a target's Defense, making them easier to hit.<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Melee, High DMG(Lethal), Foe -Def",
+            icon: "ninjatools_katanalight.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 10.0,
+                endurance: 6.03,
+                cast: 1.17,
+                damage: {
+                    type: "Lethal",
+                    scale: 3.5789999999999997
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Choking Powder",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Holds", "Ranged Damage", "Universal Damage Sets"],
+            description: "Toss a fistful of toxic powder at an enemy’s face. This powder will temporarily close the affected foe’s throat making them choke and struggle to grasp for air.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Moderate DoT(Toxic), Foe Hold",
+            icon: "ninjatools_hold.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 60.0,
+                recharge: 16.0,
+                endurance: 11.388,
+                cast: 1.07,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.3548,
+                    ticks: 4
+                },
+                buffDuration: 4.2
+            }
+        },
+        {
+            name: "Shinobi",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "To Hit Buff"],
+            description: "A shinobi is a master of stealth and assassination. While this power is active you will be very hard to detect, and your first strike out of the shadows will deal extra damage. Even while detected, a shinobi is a deadly foe and able to deal lethal critical strikes.",
+            shortHelp: "Toggle: Self Stealth, +DEF(All), +Special",
+            icon: "ninjatools_assassin.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.13,
+                buffDuration: 0.75,
+                tohitBuff: 0.5
+            }
+        },
+        {
+            name: "The Lotus Drops",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You perform The Lotus Drops maneuver, attacking all foes in melee range. This attack wounds your opponents, causing them to take moderate damage over time and reduces their Defense.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE Melee, Moderate DMG(Lethal), Foe -Def",
+            icon: "ninjatools_katanaaoe.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.05,
+                recharge: 14.0,
+                endurance: 13.0,
+                cast: 1.83,
+                damage: {
+                    type: "Lethal",
+                    scale: 2.0835999999999997
+                },
+                dotDamage: {
+                    type: "Lethal",
+                    scale: 0.25,
+                    ticks: 2
+                },
+                buffDuration: 2.1,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Kuji-In Toh",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing", "Resist Damage"],
+            description: "Kuji-In Toh invokes the power of Toh, or harmony with the universe. Focusing your inner power, you can make your body regenerate and recover endurance for a while. You also gain resistance to psionic attacks and fear protection.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +Regen, +Recovery, Res(Psionic, Fear)",
+            icon: "ninjatools_toh.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 200.0,
+                endurance: 5.2,
+                cast: 1.0,
+                dotDamage: {
+                    type: "Psionic",
+                    scale: 1.0,
+                    ticks: 105
+                },
+                protection: {
+                    fear: 8.304
+                },
+                resistance: {
+                    psionic: 0.07
+                },
+                buffDuration: 210.0
+            }
+        },
+        {
+            name: "Smoke Flash",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "You throw a smoke bomb at your feet. The resulting flash of light and smoke can briefly distract your foes and Placate them so they can no longer find or target you. Enemies will be distracted and confused, making them more vulnerable to attacks for a short time.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE, Foe Placate, -Res",
+            icon: "ninjatools_placate.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.4,
+                recharge: 90.0,
+                endurance: 2.6,
+                cast: 1.83,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Blinding Powder",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Confuse", "To Hit Debuff"],
+            description: "You throw a handful of Blinding powder in a wide arc at your foes. Most foes will be blinded, and unable to see. Some affected targets may be overcome by the powder that they may start attacking their own allies. If you attack the blinded foes, they will be alerted to your presence, but will continue to suffer a penalty to their chance to hit.<br><br><color #fcfc95>Notes: The Sleep component of this power is Auto Hit against regular enemies, but a To Hit check is required to against AVs and players, as well as to make secondary effects apply.</color><br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged (Cone), Foe -To Hit, Sleep, Confuse, -Perception",
+            icon: "ninjatools_blindingpowder.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.7854,
+            effects: {
+                accuracy: 0.8,
+                range: 25.0,
+                recharge: 90.0,
+                endurance: 7.8,
+                cast: 1.07,
+                tohitDebuff: 1.0,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Golden Dragonfly",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Knockback", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You perform a devastating Golden Dragonfly attack that deals a massive amount of damage and can even knock a foe down to the ground and reduce their Defense. The power of this attack can actually extend a short distance through multiple foes.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee, Extreme DMG(Lethal), Foe Knockback, -DEF",
+            icon: "ninjatools_goldendragonfly.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.3491,
+            effects: {
+                accuracy: 1.05,
+                range: 10.0,
+                recharge: 20.0,
+                endurance: 11.856,
+                cast: 1.83,
+                damage: {
+                    type: "Lethal",
+                    scale: 6.041
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 10.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['blaster/ninja-training'] = BLASTER_NINJA_TRAINING_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BLASTER_NINJA_TRAINING_POWERSET = BLASTER_NINJA_TRAINING_POWERSET;
+}
+
+// ---- js/data/powersets/blaster/plant-manipulation.js ----
+;/**
+ * Plant Manipulation
+ * Character Level: 50
+ * Archetype: blaster
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BLASTER_PLANT_MANIPULATION_POWERSET = {
+    name: "Plant Manipulation",
+    category: "Unknown",
+    description: "Plant Manipulation powerset",
+    icon: "plant-manipulation_set.png",
+    powers: [
+        {
+            name: "Entangle",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Immobilize", "Ranged Damage", "Universal Damage Sets"],
+            description: "Immobilizes your target by Entangling their feet in a twisted mass of thorny roots. The roots do smashing and lethal damage to the target over time. More resilient foes may require multiple applications to Immobilize. Entangle can immobilize flying targets, if they are near the ground when attacked.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, DoT(Smash/Lethal), Foe Immobilize, -Fly",
+            icon: "plantmanipulation_entangle.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 60.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.2,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 0.24000000000000002,
+                            ticks: 4
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 0.24000000000000002,
+                            ticks: 4
+                        }
+                    ]
+                },
+                buffDuration: 9.2
+            }
+        },
+        {
+            name: "Skewer",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Melee Damage", "Universal Damage Sets"],
+            description: "You lunge forward with this melee attack and Skewer your foe with the large Thorn on your arm. Deals high damage and poisons your foe. Poison from the Thorns deals additional Toxic damage and can reduce your foes Defense.<br><br><color #fcfc95>Damage: Superior.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Melee, DMG(Lethal), DoT(Toxic), Foe -DEF",
+            icon: "plantmanipulation_skewer.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.23,
+                damage: {
+                    type: "Lethal",
+                    scale: 3.6208
+                },
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.1,
+                    ticks: 3
+                },
+                buffDuration: 3.1,
+                defenseDebuff: 2.0
+            }
+        },
+        {
+            name: "Strangler",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Holds", "Ranged Damage", "Universal Damage Sets"],
+            description: "Holds a distant foe by Strangling him with massive root-like vines. The target is held helpless, while he is slowly crushed by the vines.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, DoT(Smash), Foe Hold",
+            icon: "plantmanipulation_strangler.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 60.0,
+                recharge: 16.0,
+                endurance: 11.388,
+                cast: 2.07,
+                dotDamage: {
+                    type: "Smashing",
+                    scale: 0.7179,
+                    ticks: 4
+                },
+                buffDuration: 4.2
+            }
+        },
+        {
+            name: "Toxins",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "You use your power over plants to coat all your attacks with powerful toxins for a few seconds, all your attacks will now do extra toxic damage and be more accurate.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +ToHit, +DMG(Special)",
+            icon: "plantmanipulation_toxins.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 2.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Spore Cloud",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["To Hit Debuff"],
+            description: "You create a large cloud of toxic spores around your targeted foe. The target and all nearby foes will have their damage output, chance to hit and regeneration rate reduced.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Ranged (Targeted AoE), Foe -DMG, -ToHit, -Regen",
+            icon: "natureaffinity_sporecloud.png",
+            powerType: "Toggle",
+            targetType: "Foe",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 8.0,
+                endurance: 0.26,
+                cast: 3.1,
+                tohitDebuff: 0.75,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Wild Fortress",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing", "Resist Damage"],
+            description: "You encase yourself in a protective barrier that will absorb a moderate amount of damage. Additionally, you will recover endurance faster and be resistant to toxic damage and have confusion protection.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Self +Absorb, +Recovery, +Resist(Toxic, Confuse)",
+            icon: "plantmanipulation_wildfortress.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                cast: 2.27,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 2.0,
+                    ticks: 1
+                },
+                protection: {
+                    confuse: 7.266
+                },
+                resistance: {
+                    toxic: 0.13
+                },
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Ripper",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Knockback", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You can unleash a spectacular slashing maneuver that attacks all foes in a wide arc directly in front of you. Ripper deals massive damage and poisons multiple targets. It can even knock foes down. Thorn poison deals additional Toxic damage and can reduce your foes Defense.<br><br><color #fcfc95>Damage: Superior.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee (Cone), DMG(Lethal), DoT(Toxic), Foe Knockdown, -DEF",
+            icon: "plantmanipulation_ripper.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 13.0,
+                endurance: 12.688,
+                cast: 2.33,
+                damage: {
+                    type: "Lethal",
+                    scale: 3.9827000000000004
+                },
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.2,
+                    ticks: 4
+                },
+                buffDuration: 4.1,
+                defenseDebuff: 3.0
+            }
+        },
+        {
+            name: "Vines",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Holds", "Immobilize"],
+            description: "Creates a field of Strangler Vines that can Hold multiple foes at range. The affected targets are held helpless by the massive root-like vines. Some are likely to free their arms and attack, but will still be unable to move. Unlike the power Strangler, this power does not deal any damage, but it can Hold multiple foes at once.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged (Targeted AoE), Foe Hold, Immobilize",
+            icon: "plantmanipulation_vines.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 0.8,
+                range: 80.0,
+                recharge: 90.0,
+                endurance: 20.18,
+                cast: 1.17
+            }
+        },
+        {
+            name: "Thorn Burst",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You can explode dozens of Thorns in all directions around you. These Thorns only travel a short distance, but they can deal moderate damage and poison any target close to you. Toxic damage from the thorns can reduce the Defense of affected foes.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE Melee, DMG(Lethal), DoT(Toxic), Foe -DEF",
+            icon: "plantmanipulation_thornburst.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 17.0,
+                endurance: 16.016,
+                cast: 2.0,
+                damage: {
+                    type: "Lethal",
+                    scale: 2.367
+                },
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.1,
+                    ticks: 3
+                },
+                buffDuration: 3.1,
+                defenseDebuff: 3.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['blaster/plant-manipulation'] = BLASTER_PLANT_MANIPULATION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BLASTER_PLANT_MANIPULATION_POWERSET = BLASTER_PLANT_MANIPULATION_POWERSET;
+}
+
+// ---- js/data/powersets/blaster/psychic-blast.js ----
+;/**
+ * Psychic Blast
+ * Character Level: 50
+ * Archetype: blaster
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BLASTER_PSYCHIC_BLAST_POWERSET = {
+    name: "Psychic Blast",
+    category: "Unknown",
+    description: "Psychic Blast powerset",
+    icon: "psychic-blast_set.png",
+    powers: [
+        {
+            name: "Dominate Will",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged Damage", "Sleep", "Universal Damage Sets"],
+            description: "This attack deals Psionic damage, and is capable of rendering its target unconscious. The victim is asleep, and will wake if disturbed.",
+            shortHelp: "Ranged, DMG(Psionic), Foe Sleep",
+            icon: "psychicblast_willdomination.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 100.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    type: "Psionic",
+                    scale: 2.2602
+                }
+            }
+        },
+        {
+            name: "Mental Blast",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged Damage", "Universal Damage Sets"],
+            description: "This basic attack does high Psionic damage, and can slightly reduce a target's attack speed.",
+            shortHelp: "Ranged, DMG(Psionic), Target -Recharge",
+            icon: "psychicblast_mentalblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 100.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    type: "Psionic",
+                    scale: 3.5292
+                },
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Telekinetic Blast",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "You can use Telekinesis to Blast a targeted foe with the power of your mind. This attack deals Smashing and Psionic damage, and can knock your opponent back.",
+            shortHelp: "Ranged, DMG(Smash/Psionic), Foe Knockback",
+            icon: "psychicblast_telekineticblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 100.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Psionic",
+                            scale: 3.0002
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.46
+                        }
+                    ],
+                    scale: 3.4602
+                }
+            }
+        },
+        {
+            name: "Psionic Darts",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "This basic attack does moderate Psionic damage, and can slightly reduce a target's attack speed, but has a very fast attack rate.",
+            shortHelp: "Ranged, DMG(Psionic), Target -Recharge",
+            icon: "psychicblast_psychicscream.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 1.0,
+                damage: {
+                    type: "Psionic",
+                    scale: 1.4087999999999998
+                },
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Psychic Focus",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the chance to hit of your attacks for a few seconds. Slightly increases damage.",
+            shortHelp: "Self +To Hit, +DMG",
+            icon: "psychicblast_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 5.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Psionic Lance",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged Damage", "Sniper Attacks", "Universal Damage Sets"],
+            description: "This extremely long range Psionic attack has a bonus to Accuracy, and can Slow a target's attack rate. This is a sniper attack, and is best fired from a distance as it can be interrupted. If you are engaged in battle this attack becomes instant-cast. If you are not engaged, it will do bonus damage.",
+            shortHelp: "Sniper, DMG(Psionic), Target -Recharge, Self +Range",
+            icon: "psychicblast_psioniclance.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 175.0,
+                recharge: 12.0,
+                endurance: 14.352,
+                cast: 1.33
+            }
+        },
+        {
+            name: "Psionic Tornado",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Unleashes a whirlwind of Psionic energy on a target, tossing nearby foes into the air. The Psionic Tornado damages foes and Slows their attack speed.",
+            shortHelp: "Ranged (Targeted AoE), Dmg(Psionic), Foe Knockback",
+            icon: "psychicblast_psionictornado.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 100.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 1.83,
+                damage: {
+                    type: "Psionic",
+                    scale: 1.8634
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Scramble Minds",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "Painfully scrambles the synapses of a targeted foe, leaving them dramatically Disoriented for a short duration. The effects of this power can jump from one foe to another in a chain dealing damage and applying a random mental effects to each target.",
+            shortHelp: "Chain, DMG(Psionic), Foe Disorient",
+            icon: "psychicblast_scrambleminds.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Chain",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                range: 100.0,
+                recharge: 14.0,
+                endurance: 13.52,
+                cast: 2.0,
+                damage: {
+                    type: "Psionic",
+                    scale: 4.0862
+                }
+            }
+        },
+        {
+            name: "Psychic Wail",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Melee AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "Psychic Wail is a devastating Psionic attack that wracks the minds of all nearby foes which deals Extreme Psionic damage. Those that survive will have a severely reduced attack rate and may be left Disoriented.",
+            shortHelp: "PBAoE, DMG(Psionic), Foe Disorient -Recharge",
+            icon: "psychicblast_psychicwail.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.5,
+                recharge: 145.0,
+                endurance: 27.716,
+                cast: 1.97,
+                damage: {
+                    type: "Psionic",
+                    scale: 5.4065
+                },
+                stun: 3.0,
+                buffDuration: 20.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['blaster/psychic-blast'] = BLASTER_PSYCHIC_BLAST_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BLASTER_PSYCHIC_BLAST_POWERSET = BLASTER_PSYCHIC_BLAST_POWERSET;
+}
+
+// ---- js/data/powersets/blaster/radiation-blast.js ----
+;/**
+ * Radiation Blast
+ * Character Level: 50
+ * Archetype: blaster
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BLASTER_RADIATION_BLAST_POWERSET = {
+    name: "Radiation Blast",
+    category: "Unknown",
+    description: "Radiation Blast powerset",
+    icon: "radiation-blast_set.png",
+    powers: [
+        {
+            name: "Neutrino Bolt",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Ranged Damage", "Universal Damage Sets"],
+            description: "A very quick, but low damage attack. Neutrino Bolt can reduce the target's Defense.",
+            shortHelp: "Ranged, DMG(Energy), Foe -DEF",
+            icon: "radiationburst_neutrinoblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    type: "Energy",
+                    scale: 2.2602
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 3.0
+            }
+        },
+        {
+            name: "X-Ray Beam",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Ranged Damage", "Universal Damage Sets"],
+            description: "You can emit a beam of X-Ray energy from your eyes, dealing moderate Energy damage. This attack can bypass some defenses and can reduce the target's Defense.",
+            shortHelp: "Ranged, DMG(Energy), Foe -DEF",
+            icon: "radiationburst_xraybeam.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.1,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    type: "Energy",
+                    scale: 3.5292
+                },
+                defenseDebuff: 2.0,
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Irradiate",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You can emit lethal amounts of radiation in all directions, damaging all nearby foes for a short time. Like other Radiation attacks, this power can bypass some of a target's defenses. Irradiate severely reduces the target's Defense.",
+            shortHelp: "Close (AoE), DoT(Energy), Foe -DEF",
+            icon: "radiationburst_irradiate.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.1,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 1.07,
+                dotDamage: {
+                    type: "Energy",
+                    scale: 0.1287,
+                    ticks: 9
+                },
+                buffDuration: 4.6,
+                defenseDebuff: 3.0
+            }
+        },
+        {
+            name: "Electron Haze",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "A short range conical blast of free electrons. This attack can bypass some of a target's defenses and reduce the target's Defense. It can also knock some targets down.",
+            shortHelp: "Close, DMG(Energy), Foe -DEF, Knockback",
+            icon: "radiationburst_electronhaze.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.1,
+                range: 40.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 2.37,
+                damage: {
+                    type: "Energy",
+                    scale: 5.2985
+                },
+                defenseDebuff: 2.0,
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Aim",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the chance to hit of your attacks for a few seconds. Slightly increases damage.",
+            shortHelp: "Self +To-hit, +DMG",
+            icon: "radiationburst_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.625,
+                damageBuff: 0.425,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Proton Volley",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Ranged Damage", "Sniper Attacks", "Universal Damage Sets"],
+            description: "Hurls a volley of alpha particles over an extremely long range. Proton Volley can bypass some of a target's defenses and reduce the target's Defense. This is a sniper attack, and is best fired from a distance as it can be interrupted. If you are engaged in battle this attack becomes instant-cast. If you are not engaged, it will do bonus damage.",
+            shortHelp: "Sniper, DMG(Energy), Foe -DEF, Self +Range",
+            icon: "radiationburst_protonvolley.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 150.0,
+                recharge: 12.0,
+                endurance: 14.352,
+                cast: 1.33
+            }
+        },
+        {
+            name: "Cosmic Burst",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Ranged Damage", "Stuns", "Universal Damage Sets"],
+            description: "Cosmic Burst smashes the target with cosmic particles. The attack is devastating and can leave most targets Disoriented and with reduced Defense.",
+            shortHelp: "Ranged, DMG(Energy), Foe Disorient, -DEF",
+            icon: "radiationburst_cosmicburst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 10.0,
+                endurance: 10.4,
+                cast: 2.07,
+                damage: {
+                    type: "Energy",
+                    scale: 4.3693
+                },
+                stun: 3.0,
+                defenseDebuff: 3.0,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Neutron Bomb",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "This devastating attack lobs an explosive sphere of deadly radiation, damaging the target and all nearby foes. Neutron Bomb can bypass some of a target's defenses and reduce the target's Defense.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Energy), Foe -DEF",
+            icon: "radiationburst_radiationblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.1,
+                range: 80.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.67,
+                damage: {
+                    type: "Energy",
+                    scale: 1.5798
+                },
+                defenseDebuff: 2.0,
+                buffDuration: 16.0
+            }
+        },
+        {
+            name: "Atomic Blast",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "This attack taps most of your stored energy to deal a devastating Atomic Blast which deals Extreme Energy and Smashing damage. Any foes left standing will have their Defense greatly reduced and may be left helplessly choking on toxic vapors.",
+            shortHelp: "PBAoE, DMG(Energy/Smash), Foe Hold, -DEF",
+            icon: "radiationburst_atomicblast.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.4,
+                recharge: 145.0,
+                endurance: 27.716,
+                cast: 2.93,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 3.9424
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.4641
+                        }
+                    ],
+                    scale: 5.4065
+                },
+                defenseDebuff: 4.0,
+                buffDuration: 20.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['blaster/radiation-blast'] = BLASTER_RADIATION_BLAST_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BLASTER_RADIATION_BLAST_POWERSET = BLASTER_RADIATION_BLAST_POWERSET;
+}
+
+// ---- js/data/powersets/blaster/radiation-manipulation.js ----
+;/**
+ * Radiation Manipulation
+ * Character Level: 50
+ * Archetype: blaster
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BLASTER_RADIATION_MANIPULATION_POWERSET = {
+    name: "Radiation Manipulation",
+    category: "Unknown",
+    description: "Radiation Manipulation powerset",
+    icon: "radiation-manipulation_set.png",
+    powers: [
+        {
+            name: "Electron Shackles",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Immobilize", "Ranged Damage", "Universal Damage Sets"],
+            description: "Immobilizes a single target and deals some energy damage over time. Some more resilient foes may require multiple attacks to Immobilize. Electron Shackles can also reduce a target's Defense and will surround it in negatively charged particles. Hitting a foe that has positive charged particles will trigger a Gamma Burst.",
+            shortHelp: "Ranged, DoT(Energy), Foe Immobilize, -DEF, +Negatrons",
+            icon: "atomicmanipulation_immob.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.17
+            }
+        },
+        {
+            name: "Negatron Slam",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Knockback", "Melee Damage", "Universal Damage Sets"],
+            description: "You channel a greater amount of radiation into your fists and deliver a hard-hitting blow that deals Energy and Smashing damage to the target as well as reduce their Defense for a short time. The affected target will also be surrounded in negatively charged particles. Hitting a foe that has positive charged particles will trigger a Gamma Burst.",
+            shortHelp: "Melee, DMG(Energy/Smash), Foe Knockdown, -DEF, Special, +Negatrons",
+            icon: "atomicmanipulation_weakpunch.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.5
+            }
+        },
+        {
+            name: "Positron Cell",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Holds", "Ranged Damage", "Universal Damage Sets"],
+            description: "Encases a single target in a cage made of positrons. The radiation emitted slowly hurts the victim, inflicting energy damage over time. The encased victim is held helpless and unable to defend themselves in addition to being surrounded by positively charged particles. Hitting a foe that has negatively charged particles will trigger a Gamma Burst.",
+            shortHelp: "Ranged, DoT(Energy), Foe Hold, -DEF, +Positrons",
+            icon: "atomicmanipulation_hold.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 60.0,
+                recharge: 16.0,
+                endurance: 11.388,
+                cast: 1.67
+            }
+        },
+        {
+            name: "Ionize",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your chance to hit.",
+            shortHelp: "Self +DMG, +ToHit",
+            icon: "atomicmanipulation_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 2.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Beta Decay",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Debuff", "To Hit Debuff"],
+            description: "While Beta Decay is active, nearby foes will have their chance to hit and defense decreased slightly. You will gain a recharge bonus per nearby target up to 10 targets. The first target grants the largest benefit.",
+            shortHelp: "Toggle: PBAoE, Foe -ToHit, -DEF, Self +Recharge(Special)",
+            icon: "atomicmanipulation_decay.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.208,
+                cast: 0.67,
+                tohitDebuff: 0.75,
+                buffDuration: 1.25,
+                defenseDebuff: 1.5
+            }
+        },
+        {
+            name: "Metabolic Acceleration",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "You cloak yourself in a field of radiation that increases your attack speed, Endurance recovery and Regeneration rate. However, only half of this regeneration bonus is enhanceable. Your metabolism is increased so much that you become resistant to effects such as Sleep, Hold, Disorient, Immobilization and Endurance Drain.",
+            shortHelp: "Toggle: Self +Recharge, +Regeneration, +Recovery, +Resist(Hold, Immobilize, Disorient, Sleep, End Drain)",
+            icon: "atomicmanipulation_metabolism.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                cast: 0.73,
+                buffDuration: 0.75,
+                stun: 1.0,
+                stunDuration: 0.75
+            }
+        },
+        {
+            name: "Atom Smasher",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Melee AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "You charge up a dangerously unstable amount of radioactive energy into a single fist before driving it into the ground and causing a small explosion. Foes caught in the blast will suffer Energy and Toxic damage and have their defense reduced.",
+            shortHelp: "PBAoE, DMG(Toxic/Energy), Foe Disorient, -DEF, Special",
+            icon: "atomicmanipulation_atomsmasher.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 22.0,
+                endurance: 20.176,
+                cast: 2.93
+            }
+        },
+        {
+            name: "Radioactive Cloud",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Holds"],
+            description: "When activated, you generate toxic radioactive gas around yourself. Any nearby foes may be overcome by the gas, leaving them choking or barfing helplessly. Choking foes might temporarily snap out of it when hit, barfing foes are more likely to be too sick to counterattack.",
+            shortHelp: "PBAoE, Foe Hold, Immobilize",
+            icon: "atomicmanipulation_holdpbaoe.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 0.8,
+                recharge: 90.0,
+                endurance: 20.18,
+                cast: 1.07
+            }
+        },
+        {
+            name: "Positronic Fist",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Melee Damage", "Stuns", "Universal Damage Sets"],
+            description: "You hammer your foe with a brutal smashing attack charged with a lethal dose of radiation. Your target will suffer Energy and Smashing damage, will have its defense reduced and will be disoriented for a short time in addition to being surrounded by positively charged particles. Hitting a foe that has negatively charged particles will trigger a Gamma Burst.",
+            shortHelp: "Melee, DMG(Energy/Smash), Foe Disorient, -DEF, +Positrons",
+            icon: "atomicmanipulation_heavypunch.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 2.67
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['blaster/radiation-manipulation'] = BLASTER_RADIATION_MANIPULATION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BLASTER_RADIATION_MANIPULATION_POWERSET = BLASTER_RADIATION_MANIPULATION_POWERSET;
+}
+
+// ---- js/data/powersets/blaster/seismic-blast.js ----
+;/**
+ * Seismic Blast
+ * Character Level: 50
+ * Archetype: blaster
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BLASTER_SEISMIC_BLAST_POWERSET = {
+    name: "Seismic Blast",
+    category: "Unknown",
+    description: "Seismic Blast powerset",
+    icon: "seismic-blast_set.png",
+    powers: [
+        {
+            name: "Encase",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Ranged Damage", "Universal Damage Sets"],
+            description: "Encase a foe in stone for a short moment, dealing damage and lowering their defense. The enemy will also become heavy, limiting their ability to jump and fly for a short time. <br><br>Encase grants two stacks of Seismic Pressure.",
+            shortHelp: "Ranged, DMG(Smash), Foe -Jump, -Fly, -DEF",
+            icon: "seismicblast_shatter.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    type: "Smashing",
+                    scale: 2.26
+                },
+                defenseDebuff: 0.5,
+                buffDuration: 3.0
+            }
+        },
+        {
+            name: "Seismic Shockwaves",
+            available: 0,
+            tier: 1,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "While on the ground, nearby enemies might be knocked down and some of your attacks are empowered.<br><br>This power is only for short periods of times after being triggered by Seismic Pressure.",
+            shortHelp: "Foe Knock Down, Self Special",
+            icon: "seismic_power.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 1,
+            effects: {
+                accuracy: 0.8
+            }
+        },
+        {
+            name: "Shatter",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Ranged Damage", "Universal Damage Sets"],
+            description: "Cover a foe in stone shards and shatter them, inflicting light damage and lowering their defense. They will also become heavy, limiting their ability to jump and fly for a short time. <br><br>Shatter grants two stacks of Seismic Pressure.",
+            shortHelp: "Ranged, DMG(Smash), Foe -Jump, -Fly, -DEF",
+            icon: "seismicblast_encase.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 7.0,
+                endurance: 7.696,
+                cast: 1.33,
+                damage: {
+                    type: "Smashing",
+                    scale: 3.091
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Rock Shards",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You launch a volley of stone shards at your target in a sweeping cone. These shards stab into the target, causing lethal damage. They will also continue to suffer additional lethal damage over time.<br><br>If affected by Seismic Shockwaves, this power will halt the shockwaves, the up front damage will be increased and damage over time accelerated, foes will be knocked down, range will be increased to 60ft and arc to 40 degrees.<br><br>Rock Shards grants two stacks of Seismic Pressure.",
+            shortHelp: "Ranged Cone, DMG(Smash), -Defense, Special",
+            icon: "seismicblast_rockshards.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.07
+            }
+        },
+        {
+            name: "Entomb",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Ranged Damage", "Universal Damage Sets"],
+            description: "Entomb foes in a giant boulder, dealing high damage and lowering their defense. They will also become heavy, limiting their ability to jump and fly for a short time. <br><br>Entomb grants two stacks of Seismic Pressure.",
+            shortHelp: "Ranged, DMG(Smash), Foe -Jump, -Fly, -DEF",
+            icon: "seismicblast_entomb.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 11.0,
+                endurance: 11.024,
+                cast: 2.07,
+                damage: {
+                    type: "Smashing",
+                    scale: 4.4089
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Seismic Force",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases your attacks' chance to hit for a few seconds. Slightly increases damage.<br><br>If affected by Seismic Shockwaves, this power will halt the shockwaves and will decrease the cooldown of all recharging Seismic Blast attacks by a moderate amount.",
+            shortHelp: "Self +To Hit, +DMG, +Special",
+            icon: "seismicblast_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 5.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Upthrust",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You channel seismic energy into the earth, causing a micro-fault to erupt under your target. This causes a shard of rock to thrust upward out of the ground, dealing smashing damage and lowering their defense. Affected foes will become heavy, limiting their ability to jump and fly for a short time. The force of the eruption can knockback enemies.<br><br>Upthrust grants two stacks of Seismic Pressure.",
+            shortHelp: "Targeted AoE, DMG(Smash), -Fly, -Defense, Chance to Knockback",
+            icon: "seismicblast_upthrust.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.2,
+                damage: {
+                    type: "Smashing",
+                    scale: 2.7785
+                },
+                defenseDebuff: 0.7,
+                buffDuration: 16.0
+            }
+        },
+        {
+            name: "Tombstone",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged Damage", "Sniper Attacks", "Universal Damage Sets"],
+            description: "Create a giant pillar of stone, creating a Tombstone around your target, dealing extreme damage and limiting their ability to jump and fly for a short time. <br><br>This is a sniper attack, and is best fired from a distance as it can be interrupted. If you are engaged in battle, this attack becomes instant-cast. If you are not engaged, it will do bonus damage.<br><br>Tombstone grants two stacks of Seismic Pressure.",
+            shortHelp: "Sniper, DMG(Smash), Foe -Jump, -Fly",
+            icon: "seismicblast_snipe.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 150.0,
+                recharge: 12.0,
+                endurance: 14.352,
+                cast: 1.67
+            }
+        },
+        {
+            name: "Stalagmite",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged Damage", "Stuns", "Universal Damage Sets"],
+            description: "You can cause a Stalagmite to erupt under an enemy dealing minimal Lethal damage, and Disorienting them for a good while. You must be on the ground to activate this power.<br><br>If affected by Seismic Shockwaves, this power will halt the shockwaves and deal extreme damage.<br><br>Stalagmite grants two stacks of Seismic Pressure.",
+            shortHelp: "Ranged, DMG(Smash), Foe Disorient, Special",
+            icon: "seismicblast_stalagmite.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 10.192,
+                cast: 1.0
+            }
+        },
+        {
+            name: "Meteor",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You call down a meteor strike from the sky at a specified location. All targets within 30' are caught in the blast radius, taking extreme damage and being knocked back.",
+            shortHelp: "Ranged (Location AoE), DMG(Smash/Fire), Foe Knockback",
+            icon: "seismicblast_meteor.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 90.0,
+                recharge: 170.0,
+                endurance: 27.7316,
+                cast: 2.57,
+                buffDuration: 10.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['blaster/seismic-blast'] = BLASTER_SEISMIC_BLAST_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BLASTER_SEISMIC_BLAST_POWERSET = BLASTER_SEISMIC_BLAST_POWERSET;
+}
+
+// ---- js/data/powersets/blaster/sonic-attack.js ----
+;/**
+ * Sonic Attack
+ * Character Level: 50
+ * Archetype: blaster
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BLASTER_SONIC_ATTACK_POWERSET = {
+    name: "Sonic Attack",
+    category: "Unknown",
+    description: "Sonic Attack powerset",
+    icon: "sonic-attack_set.png",
+    powers: [
+        {
+            name: "Scream",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged Damage", "Universal Damage Sets"],
+            description: "Your Scream can cause serious damage to a target.",
+            shortHelp: "Ranged, DoT(Smashing/Energy), -Res",
+            icon: "sonicblast_medium.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.47,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 0.4658,
+                            ticks: 4
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.132,
+                            ticks: 4
+                        }
+                    ]
+                },
+                buffDuration: 1.05
+            }
+        },
+        {
+            name: "Shriek",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged Damage", "Universal Damage Sets"],
+            description: "You let forth a quick Shriek, damaging your target.",
+            shortHelp: "Ranged, DMG(Smashing/Energy), Foe -Resist",
+            icon: "sonicblast_quick.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 1.64
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.42
+                        }
+                    ],
+                    scale: 2.06
+                },
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Howl",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "A short ranged sonic attack that can hit multiple enemies in an arc in front of you.",
+            shortHelp: "Ranged Cone, DMG(Smashing/Energy), Foe -Res(All)",
+            icon: "sonicblast_cone.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.6,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 2.9257999999999997
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.3347
+                        }
+                    ],
+                    scale: 3.2604999999999995
+                },
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Shockwave",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You can call forth a tremendous Shockwave that knocks back foes and deals Smashing damage in a wide cone area.",
+            shortHelp: "Ranged (Cone), DMG(Smashing/Energy), Foe Knockback",
+            icon: "sonicblast_knockback.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 11.0,
+                endurance: 11.024,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 0.8426
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.8426
+                        }
+                    ],
+                    scale: 1.6852
+                }
+            }
+        },
+        {
+            name: "Shout",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged Damage", "Universal Damage Sets"],
+            description: "You blast your foe with a tremendous Shout, damaging them.",
+            shortHelp: "Ranged, DMG(Smashing/Energy), Foe -Res(All)",
+            icon: "sonicblast_heavy.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 2.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.08
+                        },
+                        {
+                            type: "Energy",
+                            scale: 2.08
+                        }
+                    ],
+                    scale: 4.16
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Amplify",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases your chance to hit with attacks for a few seconds. Slightly increases damage.",
+            shortHelp: "Self +To Hit, +DMG",
+            icon: "sonicblast_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 5.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Sirens Song",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged AoE Damage", "Sleep", "Universal Damage Sets"],
+            description: "You send forth a subsonic pulse which causes your foes to fall unconscious and take energy damage. Your foes will remain unconscious for a good while, but will awaken if disturbed.<br><br><color #fcfc95>Notes: The Sleep component of this power is Auto Hit against regular enemies, but a To Hit check is required against AVs and players, as well as to make secondary effects apply.</color>",
+            shortHelp: "Ranged (Cone), DMG(Energy), Foe Sleep",
+            icon: "sonicblast_sleep.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 0.8727,
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.86,
+                damage: {
+                    type: "Energy",
+                    scale: 0.9546
+                }
+            }
+        },
+        {
+            name: "Screech",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged Damage", "Stuns", "Universal Damage Sets"],
+            description: "By bursting forth with this hypersonic Screech, you can inflict high damage and disorient a target.",
+            shortHelp: "Ranged, DMG(Smashing/Energy), Foe Disorient, -Res(All)",
+            icon: "sonicblast_stun.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 1.5,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.105
+                        },
+                        {
+                            type: "Energy",
+                            scale: 2.105
+                        }
+                    ],
+                    scale: 4.21
+                },
+                stun: 3.0,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Dreadful Wail",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Melee AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "Your Dreadful Wail is so strong that most foes will be defeated by being subjected to it. Dreadful Wail deals Extreme Smashing and Energy damage to all nearby foes in addition to disorienting them for a good while.",
+            shortHelp: "PBAoE, DMG(Energy/Smash), Foe Disorient, -Res(All)",
+            icon: "sonicblast_massivedamage.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.4,
+                recharge: 145.0,
+                endurance: 27.716,
+                cast: 1.97,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 3.4065000000000003
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 2.0
+                        }
+                    ],
+                    scale: 5.4065
+                },
+                stun: 3.0,
+                buffDuration: 20.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['blaster/sonic-attack'] = BLASTER_SONIC_ATTACK_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BLASTER_SONIC_ATTACK_POWERSET = BLASTER_SONIC_ATTACK_POWERSET;
+}
+
+// ---- js/data/powersets/blaster/sonic-manipulation.js ----
+;/**
+ * Sonic Manipulation
+ * Character Level: 50
+ * Archetype: blaster
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BLASTER_SONIC_MANIPULATION_POWERSET = {
+    name: "Sonic Manipulation",
+    category: "Unknown",
+    description: "Sonic Manipulation powerset",
+    icon: "sonic-manipulation_set.png",
+    powers: [
+        {
+            name: "Sonic Thrust",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Melee Damage", "Universal Damage Sets"],
+            description: "A focused attack of intense sonic power that violently sends a nearby foe flying. Deals minimal damage, but can be very effective.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Melee, DMG(Energy/Smash), Foe Knockback/Repel",
+            icon: "sonicmanipulation_sonicthrust.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 0.8061
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.8061
+                        }
+                    ],
+                    scale: 1.6122
+                },
+                buffDuration: 2.0
+            }
+        },
+        {
+            name: "Strident Echo",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Holds", "Melee Damage", "Universal Damage Sets"],
+            description: "Strident Echo deals minor damage over time. It has a low chance of causing a migraine, leaving the target shaking in pain and helpless.<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee, DMG(Energy/Smash), Foe Chance for Hold",
+            icon: "sonicmanipulation_stridentecho.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 11.0,
+                endurance: 11.024,
+                cast: 1.67,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 0.34409999999999996,
+                            ticks: 5
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.34409999999999996,
+                            ticks: 5
+                        }
+                    ]
+                },
+                buffDuration: 2.1
+            }
+        },
+        {
+            name: "Echo Chamber",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Holds", "Ranged Damage", "Universal Damage Sets"],
+            description: "Encases the target in a field of sonic waves, dealing energy damage and holding them in place.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, DMG(Energy), Foe Hold",
+            icon: "sonicmanipulation_echochamber.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 16.0,
+                endurance: 11.388,
+                cast: 1.67,
+                damage: {
+                    type: "Energy",
+                    scale: 2.729
+                }
+            }
+        },
+        {
+            name: "Sound Booster",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly boosts your attacks for a few seconds. Slightly increases chance to hit. Moderately increases the duration of mez effects. Moderately increases the chance for Sound Manipulation powers to induce migraines.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +DMG, +To Hit, +Special",
+            icon: "sonicmanipulation_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 2.0,
+                buffDuration: 10.0,
+                stun: 1.0,
+                stunDuration: 10.0
+            }
+        },
+        {
+            name: "Deafening Wave",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Holds", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You create a large field of sonic waves, causing damage to all foes around you. It has a moderate chance of causing migraines, leaving them shaking in pain and helpless.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE Melee, DMG(Energy/Smash), Foe Chance for Hold",
+            icon: "sonicmanipulation_deafeningcry.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 2.03,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 0.9509
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.9509
+                        }
+                    ],
+                    scale: 1.9018
+                }
+            }
+        },
+        {
+            name: "Sound Barrier",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing", "Resist Damage"],
+            description: "Creates a barrier around the caster which reduces incoming energy and smashing damage, provides protection against sleep effects and grants an absorption shield. Recovery is also increased.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Self +Absorb, +Recovery, +Res(Smashing, Energy, Sleep)",
+            icon: "sonicmanipulation_soundbarrier.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                cast: 2.7,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 1.0,
+                            ticks: 1
+                        },
+                        {
+                            type: "Energy",
+                            scale: 1.0,
+                            ticks: 1
+                        }
+                    ]
+                },
+                protection: {
+                    sleep: 8.304
+                },
+                resistance: {
+                    smashing: 0.07,
+                    energy: 0.07
+                },
+                buffDuration: 2.25
+            }
+        },
+        {
+            name: "Disruption Aura",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "You emit a constant wave of sonic energy around yourself, weakening the Damage Resistance of all nearby foes.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: PBAoE, Foe -Res(All)",
+            icon: "sonicmanipulation_disruptionaura.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 1.04,
+                cast: 1.97,
+                buffDuration: 2.25
+            }
+        },
+        {
+            name: "Sound Cannon",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Stuns"],
+            description: "You generate a powerful sonic wave that will knock back and disorient foes in front of you for a short time.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged (Cone), Foe Disorient, Knockback",
+            icon: "sonicmanipulation_soundcannon.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 1.5708,
+            effects: {
+                accuracy: 0.8,
+                range: 45.0,
+                recharge: 90.0,
+                endurance: 20.18,
+                cast: 1.5,
+                stun: 3.0
+            }
+        },
+        {
+            name: "Earsplitter",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Holds", "Melee Damage", "Universal Damage Sets"],
+            description: "You generate an earsplitting sound wave right in the face of your foe, inflicting great damage. It has a good chance of causing a migraine, leaving them shaking in pain and helpless.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee, DMG(Energy/Smash), Foe Chance for Hold",
+            icon: "sonicmanipulation_earsplitter.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 1.97,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 3.0695
+                        },
+                        {
+                            type: "Energy",
+                            scale: 3.0695
+                        }
+                    ],
+                    scale: 6.139
+                }
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['blaster/sonic-manipulation'] = BLASTER_SONIC_MANIPULATION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BLASTER_SONIC_MANIPULATION_POWERSET = BLASTER_SONIC_MANIPULATION_POWERSET;
+}
+
+// ---- js/data/powersets/blaster/storm-blast.js ----
+;/**
+ * Storm Blast
+ * Character Level: 50
+ * Archetype: blaster
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BLASTER_STORM_BLAST_POWERSET = {
+    name: "Storm Blast",
+    category: "Unknown",
+    description: "Storm Blast powerset",
+    icon: "storm-blast_set.png",
+    powers: [
+        {
+            name: "Gust",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged Damage", "Universal Damage Sets"],
+            description: "You create a chaotic change in atmospheric pressure, causing a sudden gust of wind to deliver a small amount of Smashing damage and knock your foe out of the sky. <br><br>While in a <color #fcfc95>Storm Cell</color>, targets experience additional Smashing damage over time.",
+            shortHelp: "Ranged, DMG(Smash), -Fly",
+            icon: "stormblast_gust.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.17,
+                damage: {
+                    type: "Smashing",
+                    scale: 2.379
+                },
+                buffDuration: 4.0
+            }
+        },
+        {
+            name: "Hailstones",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "You cause the air around the foe to rapidly condense, causing hailstones to crash down, dealing Cold damage. There is a chance that an especially large chunk of hail will form, knocking the target down. <br><br>While in a <color #fcfc95>Storm Cell</color>, targets are much more likely to get knocked down by large chunks of hail.",
+            shortHelp: "Ranged, DMG(Cold), Chance for Knockdown",
+            icon: "stormblast_hailstones.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    type: "Cold",
+                    scale: 2.529
+                },
+                dotDamage: {
+                    type: "Cold",
+                    scale: 0.25,
+                    ticks: 3
+                },
+                buffDuration: 1.0
+            }
+        },
+        {
+            name: "Jet Stream",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You call forth a cone of rapidly moving air that repels enemies, causing Smashing damage. <br><br>Enemies who are within a <color #fcfc95>Storm Cell</color> will not be repelled, but instead will be knocked down.",
+            shortHelp: "Ranged (Cone), DMG(Smashing), Foe Knockdown or Repel",
+            icon: "stormblast_jetstream.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.67,
+                damage: {
+                    type: "Smashing",
+                    scale: 1.6037
+                }
+            }
+        },
+        {
+            name: "Storm Cell",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Endurance Modification", "Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You conjure a storm in the area that defines the boundaries of your stormy powers. Rain from this power will slightly lower a foe's movement and chance to hit. The use of your Storm Blast attacks may create high winds and lightning within the storm cell, delivering stronger debuffs and causing damage. Additionally, Storm Blast attacks will be enhanced when used against foes victimized by Storm Cell.",
+            shortHelp: "Ranged (Location AoE), Foe -Recharge, -SPD, +Wet, Special",
+            icon: "stormblast_stormcell.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                endurance: 15.6,
+                cast: 2.03,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Intensify",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the chance to hit of your attacks, and slightly increases damage for a few seconds. Moderately increases the chance for Storm Blast powers to summon high winds and lightning from your Storm Cell and Category Five while active.",
+            shortHelp: "Self +To Hit, +DMG, Special",
+            icon: "stormblast_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 5.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Direct Strike",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Endurance Modification", "Ranged Damage", "Sniper Attacks", "Universal Damage Sets"],
+            description: "You channel your storm powers into a direct hit, jolting the enemy with a bolt of lightning that deals Energy damage and saps some endurance. If fired outside of combat, it can be interrupted by enemies, but will do bonus damage. If you are engaged in battle, this attack becomes instant-cast. <br><br>While in a <color #fcfc95>Storm Cell</color>, targets have a chance to be stunned. The odds of creating High Winds and Lightning are much greater when Direct Strike is cast out of combat.",
+            shortHelp: "Sniper, DMG(Energy), Foe -End, Special",
+            icon: "stormblast_directstrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 150.0,
+                recharge: 12.0,
+                endurance: 14.352,
+                cast: 1.33
+            }
+        },
+        {
+            name: "Chain Lightning",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Endurance Modification", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Calls a bolt of lightning from the clouds to strike your target, which then chains outward to additional enemies. Creatures unfortunate enough to be struck will be dealt Energy damage and be sapped of some endurance.<br><br>While in a <color #fcfc95>Storm Cell</color>, the main target of Chain Lightning will experience additional endurance drain over time.",
+            shortHelp: "Ranged Chain, DoT(Energy), Foe -End",
+            icon: "stormblast_chainlightning.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Chain",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.15,
+                range: 80.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.17,
+                damage: {
+                    type: "Energy",
+                    scale: 1.324
+                },
+                dotDamage: {
+                    type: "Energy",
+                    scale: 0.08,
+                    ticks: 3
+                },
+                buffDuration: 2.1
+            }
+        },
+        {
+            name: "Cloudburst",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged Damage", "Universal Damage Sets"],
+            description: "Unleashes a cloud that drops a torrent of freezing rain on your target, causing Cold damage. <br><br>While in a <color #fcfc95>Storm Cell</color>, targets experience Recharge, ToHit, and Movement speed debuffs.",
+            shortHelp: "Ranged, DoT(Cold), +Wet, Special",
+            icon: "stormblast_cloudburst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 11.0,
+                endurance: 11.024,
+                cast: 1.67,
+                dotDamage: {
+                    type: "Cold",
+                    scale: 0.4285,
+                    ticks: 9
+                },
+                buffDuration: 2.9
+            }
+        },
+        {
+            name: "Category Five",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Summons a severe storm that begins light, but grows in power until it becomes a raging engine of destruction. Left on its own, the Category Five storm is capable of delivering moderate damage. As it grows in power, foes may begin to fling through the air. <br><br>In addition, each use of your Storm Blast powers is capable of delivering lightning attacks within the Category Five storm, delivering energy damage.",
+            shortHelp: "Ranged (Location AoE), DoT(Energy), +Wet",
+            icon: "stormblast_categoryfive.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 2.0,
+                range: 60.0,
+                recharge: 170.0,
+                endurance: 27.716,
+                cast: 2.5,
+                buffDuration: 30.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['blaster/storm-blast'] = BLASTER_STORM_BLAST_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BLASTER_STORM_BLAST_POWERSET = BLASTER_STORM_BLAST_POWERSET;
+}
+
+// ---- js/data/powersets/blaster/tactical-arrow.js ----
+;/**
+ * Tactical Arrow
+ * Character Level: 50
+ * Archetype: blaster
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BLASTER_TACTICAL_ARROW_POWERSET = {
+    name: "Tactical Arrow",
+    category: "Unknown",
+    description: "Tactical Arrow powerset",
+    icon: "tactical-arrow_set.png",
+    powers: [
+        {
+            name: "Electrified Net Arrow",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Immobilize", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Upon impact, the Electrified Net Arrow releases an electrically charged net that can Immobilize most targets. This device deals electric damage over time but does not prevent targets from attacking. The Electrified Net Arrow can bring down flying entities, halts jumping and slows all of their actions.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, DoT(Energy), Foe Immobilize, -Fly, -Recharge, -SPD, -Jump",
+            icon: "tacticalarrow_immobilize.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 60.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.0,
+                dotDamage: {
+                    type: "Energy",
+                    scale: 0.452,
+                    ticks: 4
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Glue Arrow",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "This arrow carries a cartridge of intensely sticky glue, which explodes on impact. The glue slows the movement and attack rates of any foes in the area.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged (Targeted AoE), DoT(Toxic), Foe -SPD, -Recharge, -Fly, -Jump",
+            icon: "tacticalarrow_slow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 45.0,
+                endurance: 7.8,
+                cast: 1.16
+            }
+        },
+        {
+            name: "Ice Arrow",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Holds", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "This arrow can freeze a single foe in a block of ice. The target is frozen solid, helpless, and can be attacked. More powerful foes may not be Held, but all affected targets will be Slowed.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, DoT(Cold), Foe Hold, -SPD, -Recharge",
+            icon: "tacticalarrow_hold.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 16.0,
+                endurance: 11.388,
+                cast: 1.67,
+                dotDamage: {
+                    type: "Cold",
+                    scale: 0.05,
+                    ticks: 8
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Upshot",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly boosts your attacks for a few seconds. Slightly increases chance to hit and recharge time of all your powers for 10 seconds.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +DMG, +ToHit, +Recharge",
+            icon: "tacticalarrow_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 1.5,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Flash Arrow",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "To Hit Debuff"],
+            description: "This arrow explodes in a dazzling flash of light and sound. The targets are so blinded that they can hardly see a thing. Most villains will not be able to see past normal melee range, although some may have better perception. If the villains are attacked, they will be alerted to your presence, but will suffer a penalty to their chance to hit.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Targeted AoE), Foe -Perception, -ToHit",
+            icon: "tacticalarrow_blind.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 7.8,
+                cast: 1.0,
+                buffDuration: 60.0,
+                tohitDebuff: 0.7
+            }
+        },
+        {
+            name: "Eagle Eye",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "You have developed an incredible eyesight. Your accuracy is dramatically improved and your perception increased allowing you to better see distant and stealthy foes. You have also become resistant to powers that debuff your accuracy or chance to hit. In addition to being more accurate, your training also allows you to regenerate health and recovery endurance at an accelerated rate while this power is active. However, only half of this regeneration bonus is enhanceable.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Self +ACC, +Perception, +Res(DeBuff ToHit), +Regeneration, +Recovery",
+            icon: "tacticalarrow_eagleeye.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                cast: 1.17,
+                tohitBuff: 2.0,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Gymnastics",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Leaping", "Leaping & Sprints", "Running", "Running & Sprints", "Universal Travel"],
+            description: "Years of training have made you extremely agile and quick on your feet. This power slightly increases your defense, attack rate and movement speed, in addition of protecting you from knockback.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Self +Recharge, +DEF(All), +SPD, +Res(Slow, Knockback)",
+            icon: "tacticalarrow_quickness.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.13,
+                debuffResistance: {
+                    recharge: 0.4,
+                    movement: 0.4
+                },
+                buffDuration: 0.5
+            }
+        },
+        {
+            name: "ESD Arrow",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Holds", "Stuns"],
+            description: "This arrow can unleash a massive electrostatic discharge on impact. This ESD can affect machines, and is even powerful enough to affect synaptic brain patterns. It will stun all foes in its radius. Additionally, most machines and robots will be held and take moderate high damage.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged (Targeted AoE), Foe Disorient, -End, Special vs. Robots",
+            icon: "tacticalarrow_stun.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 0.8,
+                range: 70.0,
+                recharge: 90.0,
+                endurance: 20.18,
+                cast: 1.83,
+                damage: {
+                    type: "Energy",
+                    scale: 1.64
+                },
+                stun: 3.0
+            }
+        },
+        {
+            name: "Oil Slick Arrow",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "On impact, this arrow creates an oil slick that Slows foes in the area and may cause them to slip and fall. The oil slick is very flammable and may burst into flames if fire is used near it.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged (Location AoE), Foe Knockdown, -SPD, -Jump, +Special",
+            icon: "tacticalarrow_knockdown.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 1.16,
+                buffDuration: 30.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['blaster/tactical-arrow'] = BLASTER_TACTICAL_ARROW_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BLASTER_TACTICAL_ARROW_POWERSET = BLASTER_TACTICAL_ARROW_POWERSET;
+}
+
+// ---- js/data/powersets/blaster/time-manipulation.js ----
+;/**
+ * Time Manipulation
+ * Character Level: 50
+ * Archetype: blaster
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BLASTER_TIME_MANIPULATION_POWERSET = {
+    name: "Time Manipulation",
+    category: "Unknown",
+    description: "Time Manipulation powerset",
+    icon: "time-manipulation_set.png",
+    powers: [
+        {
+            name: "Aging Touch",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Melee Damage", "Universal Damage Sets"],
+            description: "You touch an enemy and accelerate their aging process causing exhaustion and psionic damage. Affected enemies will continue to age for a limited time, and suffering psionic damage over time. Targets affected by the Delayed effect will suffer from additional psionic damage over time.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Melee, DMG(Psionic), DoT(Psionic), Foe -End Over Time",
+            icon: "timemanipulation_agingtouch.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.0,
+                damage: {
+                    type: "Psionic",
+                    scale: 2.3599
+                },
+                dotDamage: {
+                    type: "Psionic",
+                    scale: 0.2,
+                    ticks: 2
+                },
+                buffDuration: 2.1
+            }
+        },
+        {
+            name: "Time Wall",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Immobilize", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You create a time barrier to immobilize a single enemy. Enemies behind this barrier will have time slow down around them reducing their attack rate. Enemies that are strong enough to cross the barrier will still have their movement speed reduced. Time is slowed to such an extreme that their wounds will take longer to heal, reducing their regeneration rate. Time Wall applies the Delayed effect on its target. Damage, debuff and control effects from other Temporal Manipulation powers are increased on targets affected by Delayed.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, DMG(Energy), Foe Immobilize, -SPD, -Recharge, -Regen, Special",
+            icon: "timemanipulation_timewall.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.6,
+                damage: {
+                    type: "Energy",
+                    scale: 2.6799999999999997
+                },
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Time Stop",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Holds"],
+            description: "You trap your target within the flow of time causing them to be held helpless. Even those resistant to the effects of Time Stop's hold will still have their regeneration rate and healing effects reduced for a brief period. Targets affected by the Delayed effect will suffer from a more powerful hold, however its benefits are brief.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Foe Hold, -Regen, -Heal",
+            icon: "timemanipulation_timestop.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 16.0,
+                endurance: 11.388,
+                cast: 2.17,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Chronos",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "You distort time around you, selecting a period of time where your abilities are at your highest. Your damage, attack rate and chance to hit are dramatically increased for a brief period. This power places the Accelerated effect on you. While this is in effect, the target has any healing and healing over time effects from Temporal Healing or Time Lord significantly increased.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +DMG, +Recharge, +ToHit, Special",
+            icon: "timemanipulation_chronologicalselection.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 10.4,
+                cast: 1.17,
+                buffDuration: 10.0,
+                tohitBuff: 2.0
+            }
+        },
+        {
+            name: "End of Time",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You open a gate in time that can suck in enemies and send them into a distant unknown future. The affected enemies will be quickly returned to the present time, but not before being temporarily exposed to radiation and the bitter cold of an empty void, reducing their regeneration rate. Targets affected by the Delayed effect will suffer bonus damage.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE, DMG(Cold/Energy), Foe -Regen",
+            icon: "timemanipulation_endoftime.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 17.0,
+                endurance: 16.016,
+                cast: 2.03,
+                damage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 1.6742
+                        },
+                        {
+                            type: "Energy",
+                            scale: 1.1162
+                        }
+                    ],
+                    scale: 2.7904
+                },
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Temporal Healing",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "You mend your wounds by placing your bodies in a past or future state where they are far less injured. Temporal Mending will immediately absorb damage as it's inflicted. Additionally, you will gain some resistance to slow effects and regeneration debuffs. If you are affected by the Accelerated effect, you absorb even more damage from this power.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Self +Absorb, +Recovery, +Resist(Slow, Regen Debuff)",
+            icon: "timemanipulation_temporalhealing.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                cast: 2.03,
+                buffDuration: 2.25
+            }
+        },
+        {
+            name: "Future Pain",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Fear", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Fear", "Melee Damage", "Universal Damage Sets"],
+            description: "You lay your hands on your foe dig into his future timeline for the most painful experience the foe will ever go through and plant those memories on his present mind inflicting great psionic damage. The visions of this pain may be enough to make your foe cower in fear. Targets affected by the Delayed effect will suffer a more terrifying experience.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee, DMG(Psionic), Foe Fear",
+            icon: "timemanipulation_futurepain.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 18.0,
+                endurance: 16.848,
+                cast: 1.67,
+                damage: {
+                    type: "Psionic",
+                    scale: 5.5262
+                },
+                buffDuration: 9.17
+            }
+        },
+        {
+            name: "Time Shift",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Slow Movement", "Stuns", "To Hit Debuff"],
+            description: "You shift time on an area, replacing your foes with future or past versions of themselves. This shift can be very disorienting and will incapacitate affected foes. Stronger foes may be able to resist the effect, but they still will have their movement speed and accuracy reduced. Targets affected by the Delayed effect will suffer from a more powerful disorientation, however its benefits are brief.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged (Targeted AoE), Foe Disorient, -SPD, -ToHit",
+            icon: "timemanipulation_timeshift.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 0.8,
+                range: 70.0,
+                recharge: 90.0,
+                endurance: 20.18,
+                cast: 2.03,
+                stun: 1.0,
+                tohitDebuff: 0.5,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Time Lord",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You are a time lord, for you time is just a small hurdle that can easily be overcome or ignored. As a time lord, all your attacks recharge faster and you are resistant to energy attacks in addition to disorient effects, movement debuffs and recharge debuffs. If you are affected by the Accelerated effect, your powers will recharge even faster and you will become nearly immune to recharge debuffs. This power is always on and cost no endurance.",
+            shortHelp: "Auto: Self +Recharge, +Resist(Energy, Disorient, Slow)",
+            icon: "timemanipulation_timelord.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                resistance: {
+                    energy: 0.035
+                },
+                debuffResistance: {
+                    recharge: 0.6,
+                    movement: 0.6
+                },
+                buffDuration: 0.75,
+                stun: 1.0,
+                stunDuration: 0.5
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['blaster/time-manipulation'] = BLASTER_TIME_MANIPULATION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BLASTER_TIME_MANIPULATION_POWERSET = BLASTER_TIME_MANIPULATION_POWERSET;
+}
+
+// ---- js/data/powersets/blaster/water-blast.js ----
+;/**
+ * Water Blast
+ * Character Level: 50
+ * Archetype: blaster
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BLASTER_WATER_BLAST_POWERSET = {
+    name: "Water Blast",
+    category: "Unknown",
+    description: "Water Blast powerset",
+    icon: "water-blast_set.png",
+    powers: [
+        {
+            name: "Aqua Bolt",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Ranged Damage", "Universal Damage Sets"],
+            description: "You strike your foe with a rapid blast of freezing cold water causing Cold and Smashing damage as well as reducing their defense. Aqua Bolt builds 1 Tidal Power.",
+            shortHelp: "Ranged, DMG(Cold/Smash), Foe -Def, +Wet, Self +Tidal Power",
+            icon: "waterblast_aquabolt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 1.5451000000000001
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.515
+                        }
+                    ],
+                    scale: 2.0601000000000003
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Hydro Blast",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You briefly focus before releasing an intense blast of chilling water at your foe that causes Cold and Smashing damage. Affected foes will have their movement speed reduced briefly and have a chance to be knocked down. Hydro Blast builds 1 Tidal Power.",
+            shortHelp: "Ranged, DMG(Cold/Smash), Foe -Speed, Knockdown, +Wet, Self +Tidal Power",
+            icon: "waterblast_hydroblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 7.0,
+                endurance: 7.696,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 2.4969
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.8323
+                        }
+                    ],
+                    scale: 3.3292
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Water Burst",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You cause water to violently explode from beneath your target's feet blasting all foes nearby with freezing cold water. Affected targets will suffer Cold and Smashing damage, have their movement speed reduced and may be knocked down by the force of the blast. Water Burst consumes all Tidal Power. It will deal additional cold damage and have a greater chance to knockdown for each stack of Tidal Power. If you have 3 stacks of Tidal Power Water Burst will have a 100% chance to knock the targets into the air.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Cold/Smash), Foe -Speed, Knockdown, +Wet, Self -Tidal Power",
+            icon: "waterblast_waterburst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.73,
+                damage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 1.8634000000000002
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.3982
+                        }
+                    ],
+                    scale: 2.2616
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Whirlpool",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You create a violent whirlpool at the target location causing Cold damage over time, reducing the targets' speed and defense for a short time. Whirlpool grants 1 stack of Tidal Power.",
+            shortHelp: "Ranged (Location AoE), DoT(Cold), -Speed, -Defense, +Wet, Self +Tidal Power",
+            icon: "waterblast_whirlpool.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                endurance: 15.6,
+                cast: 2.03,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Tidal Forces",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "You draw tidal energies into yourself thus boosting your chance to hit significantly, slightly boosting your damage and granting yourself +3 Tidal Power.",
+            shortHelp: "Self +To Hit, +DMG",
+            icon: "waterblast_tidalforces.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 5.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Dehydrate",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Accurate Healing", "Blaster Archetype Sets", "Defense Debuff", "Healing", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You rapidly dehydrate your target, causing Cold and Smashing damage, reducing their movement speed and defense as well as causing a measure of Cold damage over time. You are then healed over time for a moderate amount of health. Dehydrate grants 1 stack of Tidal Power if you have 2 or less. Dehydrate will consume all stacks of Tidal Power if you have 3, but the power's heal over time effect is increased by 50%.",
+            shortHelp: "Ranged, DMG(Cold/Smash), Foe -Speed, -Defense, DoT(Cold), Self +Heal Over Time, +/- Tidal Power",
+            icon: "waterblast_dehydrate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.87,
+                damage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 2.2719
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.7573
+                        }
+                    ],
+                    scale: 3.0292
+                },
+                dotDamage: {
+                    type: "Cold",
+                    scale: 0.2698,
+                    ticks: 4
+                },
+                healing: {
+                    scale: 49.69630874999999,
+                    perTarget: true
+                },
+                buffDuration: 4.1,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Water Jet",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You spray a concentrated torrent of water toward your target that causes Cold and Smashing damage as well as reducing your target's movement speed. If you have 2 or less Tidal Power, you will gain a stack of Tidal Power. If you have 3 Tidal Power and you activate this power, it will have an enhanced effect causing Water Jet to cast slightly faster and immediately reset the recharge of Water Jet. Water Jet's enhanced effect can be used once every 8 seconds.",
+            shortHelp: "Ranged, DMG(Cold/Smash), Foe -Speed, +Wet, Self +/-Tidal Power",
+            icon: "waterblast_waterjet.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.43
+            }
+        },
+        {
+            name: "Steam Spray",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Blaster Archetype Sets", "Defense Debuff", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You spray scalding hot steam in a cone in front of you badly burning affected targets. Steam Spray causes Fire damage, Fire damage over time and reduces the target's Defense slightly. Steam Spray grants 1 stack of Tidal Power.",
+            shortHelp: "Ranged (Cone), DMG(Fire), Foe -Defense, DoT(Fire), +Wet, Self +Tidal Power",
+            icon: "waterblast_steamspray.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.8727,
+            effects: {
+                accuracy: 1.2,
+                range: 40.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 2.53,
+                dotDamage: {
+                    type: "Fire",
+                    scale: 3.0260000000000002,
+                    ticks: 1
+                },
+                buffDuration: 0.6,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Geyser",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Blaster Archetype Sets", "Knockback", "Ranged AoE Damage", "Slow Movement", "Stuns", "Universal Damage Sets"],
+            description: "You cause the earth to erupt beneath your target's feet as a Geyser of scalding hot water burns your foes and tosses them violently into the air. Geyser causes Fire and Smashing damage before causing Fire damage over time as well as reducing their movement speed. Geyser consumes all Tidal Power. Both the initial damage and damage over time portions of this power will be increased and have a scaling chance to disorient for each stack of Tidal Power. If you have 3 stacks of Tidal Power, Geyser will have a 100% chance to disorient affected targets.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Fire/Smash), Foe DoT(Fire), +Wet, -Speed, Knock Up, Disorient, Self -Tidal Power",
+            icon: "waterblast_geyser.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.4,
+                range: 80.0,
+                recharge: 125.0,
+                endurance: 20.8,
+                cast: 2.93,
+                damage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 4.1755
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.8922
+                        }
+                    ],
+                    scale: 5.0677
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.6028,
+                    ticks: 10
+                },
+                stun: 3.0,
+                buffDuration: 5.1
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['blaster/water-blast'] = BLASTER_WATER_BLAST_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BLASTER_WATER_BLAST_POWERSET = BLASTER_WATER_BLAST_POWERSET;
+}
+
+// ---- js/data/epics/blaster/blaster_dark_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Dark Mastery
+ * Archetype: Blaster
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\blaster_dark_mastery
+ */
+
+const EPIC_BLASTER_DARK_MASTERY = {
+  "id": "blaster_dark_mastery",
+  "name": "Dark Mastery",
+  "displayName": "Dark Mastery",
+  "archetype": "blaster",
+  "description": "You have Mastery over Darkness to control and blast your foes.",
+  "icon": "sentinel_dark_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Murky Cloud",
+      "fullName": "Epic.Blaster_Dark_Mastery.Murky_Cloud",
+      "rank": 1,
+      "available": 34,
+      "description": "You create a Murky Cloud enshrouding you. This cloud can absorb all forms of energy, making you more resistant to Fire, Cold, Energy, and Negative Energy attacks.",
+      "shortHelp": "Toggle: Self +Res(Fire, Cold, Energy, Negative)",
+      "icon": "dark_mastery_murkycloud.png",
+      "powerType": "Toggle",
+      "requires": "$archetype == @Class_Blaster",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 1.17,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "fire": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "smashing": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "psionic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Fearsome Stare",
+      "fullName": "Epic.Blaster_Dark_Mastery.Fearsome_Stare",
+      "rank": 2,
+      "available": 34,
+      "description": "Instills tremendous Fear within a cone area in front of you, causing all affected targets to tremble in Terror uncontrollably.",
+      "shortHelp": "Ranged (Cone), Foe Fear, -To Hit",
+      "icon": "dark_mastery_fearsomestare.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Blaster",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Fear",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate To-Hit Debuff",
+        "Fear",
+        "To Hit Debuff"
+      ],
+      "effects": {
+        "accuracy": 0.8,
+        "range": 50.0,
+        "recharge": 100.0,
+        "endurance": 10.66,
+        "activationTime": 2.03,
+        "effectArea": "Cone",
+        "radius": 50.0,
+        "arc": 0.7854,
+        "protection": {
+          "fear": 3.0
+        }
+      }
+    },
+    {
+      "name": "Possess",
+      "fullName": "Epic.Blaster_Dark_Mastery.Possess",
+      "rank": 3,
+      "available": 37,
+      "description": "You cause your targeted foe to be possessed by a dark entity from the Netherworld causing them to be confused for a short period of time. While confused they will be unable to tell the difference between friend or foe and will attack nearby allies. Possess will also hinder the target's abilities, lowering their chance ToHit, Damage, Healing, and the strength of their buffs, You must be level 41 and have one other Dark Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged, Target Confuse, -ToHit, -Damage, -Healing, -Special",
+      "icon": "dark_mastery_possess.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Confuse",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Confuse"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 2.33,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "confuse": 3.0
+        }
+      }
+    },
+    {
+      "name": "Black Hole",
+      "fullName": "Epic.Blaster_Dark_Mastery.Black_Hole",
+      "rank": 4,
+      "available": 40,
+      "description": "Opens up a Black Hole to the Netherworld that temporarily pulls in all foes within its grasp. Victims that are immune to the pull become phase shifted and are completely intangible. They are hard to see, and cannot affect or be affected by those in normal space. You must be level 41 and have one other Dark Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Targeted AoE), Foe Intangible",
+      "icon": "dark_mastery_blackhole.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 50.0,
+        "recharge": 240.0,
+        "endurance": 16.25,
+        "activationTime": 1.03,
+        "effectArea": "AoE",
+        "radius": 10.0
+      }
+    },
+    {
+      "name": "Soul Consumption",
+      "fullName": "Epic.Blaster_Dark_Mastery.Soul_Consumption",
+      "rank": 5,
+      "available": 43,
+      "description": "You consume life and soul from all enemies nearby, thus siginficantly increasing your maximum hitpoints and endurance. The more foes affected, the stronger the effect. You must be level 44 and have two other Dark Mastery Powers before selecting this power.",
+      "shortHelp": "PBAoE Self +Max HP, +Max End, Foe: -Max HP, -Max End",
+      "icon": "dark_mastery_soulconsumption.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Recharge",
+        "Heal",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate Healing",
+        "Endurance Modification",
+        "Healing"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 15.0,
+        "recharge": 600.0,
+        "endurance": 0.65,
+        "activationTime": 1.17,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "regeneration": {
+          "scale": -0.6,
+          "table": "Melee_Ones"
+        },
+        "damage": {
+          "type": "Heal",
+          "scale": 0.4,
+          "table": "Melee_HealSelf"
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['blaster_dark_mastery'] = EPIC_BLASTER_DARK_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/blaster/blaster_mace_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Mace Mastery
+ * Archetype: Blaster
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\blaster_mace_mastery
+ */
+
+const EPIC_BLASTER_MACE_MASTERY = {
+  "id": "blaster_mace_mastery",
+  "name": "Mace Mastery",
+  "displayName": "Mace Mastery",
+  "archetype": "blaster",
+  "description": "Black Scorpion has granted you access to the advanced technology of the Nullifier Mace. The signature weapon of the Wolf Spider TacOps troops, it is not a typical clumsy mace. The Nullifier Mace is capable of firing a variety of energy projectiles and grenades. It can even be modified to summon and command some or Black Scorpion's RV technologies.",
+  "icon": "blaster_mace_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Web Envelope",
+      "fullName": "Epic.Blaster_Mace_Mastery.Web_Envelope",
+      "rank": 1,
+      "available": 34,
+      "description": "The Nullifier Mace can lob a modified Web Grenade. Upon impact, the Web Grenade expels a strong, tenuous, and very sticky substance that can Immobilize most targets in a wide area. This device deals toxic damage over time and does not prevent targets from attacking, although their attack rate is Slowed. The Web can bring down flying entities and halts jumping.",
+      "shortHelp": "Ranged (Targeted AoE) DoT(Toxic), Immobilize, -Recharge, -Fly, -Jump",
+      "icon": "arachnos_patron_rangedaoeimmobilize.png",
+      "powerType": "Click",
+      "requires": "($archetype == @Class_Blaster) && (Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Immobilize",
+        "Ranged AoE Damage",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 50.0,
+        "recharge": 16.0,
+        "endurance": 10.751,
+        "activationTime": 2.0,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "protection": {
+          "immobilize": 3.0
+        },
+        "damage": {
+          "type": "Toxic",
+          "scale": 0.2503,
+          "table": "Ranged_PvPDamage"
+        },
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Scorpion Shield",
+      "fullName": "Epic.Blaster_Mace_Mastery.Scorpion_Shield",
+      "rank": 2,
+      "available": 34,
+      "description": "Black Scorpion's technologies are impressive indeed. This energy shield grants you Defense to Lethal, Smashing and Energy attacks, as well as improves your damage resistance to Toxic damage.",
+      "shortHelp": "Toggle: Self, +Def(Smash,Lethal,Energy), +Res(Toxic)",
+      "icon": "arachnos_patron_defensebuff.png",
+      "powerType": "Toggle",
+      "requires": "($archetype == @Class_Blaster) && (Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Defense Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 2.0,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Mace Beam Volley",
+      "fullName": "Epic.Blaster_Mace_Mastery.Mace_Beam_Volley",
+      "rank": 3,
+      "available": 37,
+      "description": "Fires a volley of multiple kinetic energy blasts from your Nullifier Mace. These blast spread out in a wide cone and are powerful enough to knock down some foes. You must be level 38 and have one other Mace Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Cone), DMG(Energy), Foe Knockback",
+      "icon": "arachnos_patron_rangedconemoderatedmg.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 50.0,
+        "recharge": 32.0,
+        "endurance": 18.98,
+        "activationTime": 2.0,
+        "effectArea": "Cone",
+        "radius": 50.0,
+        "arc": 0.6109,
+        "damage": {
+          "type": "Energy",
+          "scale": 1.2118,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Summon Spiderlings",
+      "fullName": "Epic.Blaster_Mace_Mastery.Power_Boost",
+      "rank": 4,
+      "available": 40,
+      "description": "Black Scorpion has granted you access to a small squadron of Arachnobot Spiderlings. Three Spiderlings that are one level less than you will show up when summoned. Your access to these Arachnobots is very limited. You must be level 41 and have one other Mace Mastery Powers before selecting this power.",
+      "shortHelp": "Summon Spiderlings: Ranged DMG(Lethal)",
+      "icon": "arachnos_patron_summononepet.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate Defense Debuff",
+        "Defense Debuff",
+        "Pet Damage",
+        "Recharge Intensive Pets",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 900.0,
+        "endurance": 26.0,
+        "activationTime": 3.03,
+        "effectArea": "Location"
+      }
+    },
+    {
+      "name": "Web Cocoon",
+      "fullName": "Epic.Blaster_Mace_Mastery.Web_Cocoon",
+      "rank": 5,
+      "available": 43,
+      "description": "The Bane Mace can fire a more powerful version the common web grenade. The sinewy fibers of this grenade are strong enough to completely Hold one target. Targets able to resist the Hold are still likely to have their attack and movement speed dramatically slowed. Web Cocoon can also bring down flying targets and prevent foes from jumping. You must be level 44 and have two other Mace Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged, Foe Hold, -Recharge, -Fly, -Jump, Slow, DoT(Toxic)",
+      "icon": "arachnos_patron_targetedhold.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Hold",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Holds",
+        "Ranged Damage",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 60.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 2.0,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "hold": 3.0
+        },
+        "damage": {
+          "type": "Toxic",
+          "scale": 0.345,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['blaster_mace_mastery'] = EPIC_BLASTER_MACE_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/blaster/blaster_mu_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Mu Mastery
+ * Archetype: Blaster
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\blaster_mu_mastery
+ */
+
+const EPIC_BLASTER_MU_MASTERY = {
+  "id": "blaster_mu_mastery",
+  "name": "Mu Mastery",
+  "displayName": "Mu Mastery",
+  "archetype": "blaster",
+  "description": "Scirocco has taught you the ancient powers of the Mu. In their eternal struggle against the Oranbega, the Mu have unlocked many mystical powers, including their very signature crimson lightning. Now you possess their secrets.",
+  "icon": "blaster_mu_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Static Discharge",
+      "fullName": "Epic.Blaster_Mu_Mastery.Static_Discharge",
+      "rank": 1,
+      "available": 34,
+      "description": "Hurls multiple bolts of Mu Electricity in an arc that deals damage and drains Endurance from all affected foes in the area.",
+      "shortHelp": "Ranged (Cone), DMG(Energy), -END",
+      "icon": "arachnos_patron_rangedconemoderatedmg.png",
+      "powerType": "Click",
+      "requires": "($archetype == @Class_Blaster) && (Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 40.0,
+        "recharge": 24.0,
+        "endurance": 18.98,
+        "activationTime": 2.07,
+        "effectArea": "Cone",
+        "radius": 40.0,
+        "arc": 0.7854,
+        "damage": {
+          "type": "Energy",
+          "scale": 1.3147,
+          "table": "Ranged_PvPDamage"
+        },
+        "recovery": {
+          "scale": -1.0,
+          "table": "Ranged_Ones"
+        }
+      }
+    },
+    {
+      "name": "Charged Armor",
+      "fullName": "Epic.Blaster_Mu_Mastery.Charged_Armor",
+      "rank": 2,
+      "available": 34,
+      "description": "When you toggle on this power, you are surrounded in a charged field that makes you highly resistant to Smashing, Lethal and Energy damage.<br><br><color #fcfc95>Recharge: Fast.</color>",
+      "shortHelp": "Toggle: Self +Res(Smash, Lethal, Energy)",
+      "icon": "arachnos_patron_resistbuff.png",
+      "powerType": "Toggle",
+      "requires": "($archetype == @Class_Blaster) && (Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 0.67,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "smashing": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "psionic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Summon Adept",
+      "fullName": "Epic.Blaster_Mu_Mastery.Thunder_Strike",
+      "rank": 3,
+      "available": 37,
+      "description": "Scirocco has shown you how to call upon a mystical Mu Adept to assist you. The Mu pulse with the blood of their slaughtered ancestors in their veins, and are well practiced in the dark arts. Your access to this Adept is very limited. You must be level 38 and have one other Mu Mastery Powers before selecting this power.",
+      "shortHelp": "Summon Mu Adept: Ranged DMG(Energy)",
+      "icon": "arachnos_patron_summononepet.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "Hold",
+        "EnduranceReduction",
+        "Sleep",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Holds",
+        "Pet Damage",
+        "Recharge Intensive Pets",
+        "Sleep",
+        "Stuns",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 900.0,
+        "endurance": 26.0,
+        "activationTime": 1.17,
+        "effectArea": "Location"
+      }
+    },
+    {
+      "name": "Electrifying Fences",
+      "fullName": "Epic.Blaster_Mu_Mastery.Electrifying_Fences",
+      "rank": 4,
+      "available": 40,
+      "description": "The Electrifying Fences attempts to Immobilize a group of foes in an area. This power deals some energy damage over time as it slowly drains some Endurance. You must be level 41 and have one other Mu Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Targeted AoE), DoT(Energy), Foe Immobilize, -END",
+      "icon": "arachnos_patron_rangedaoeimmobilize.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Immobilize",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 50.0,
+        "recharge": 16.0,
+        "endurance": 10.751,
+        "activationTime": 1.17,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "damage": {
+          "type": "Energy",
+          "scale": 0.0929,
+          "table": "Ranged_PvPDamage"
+        },
+        "protection": {
+          "immobilize": 3.0
+        },
+        "resistance": {},
+        "recovery": {
+          "scale": -1.0,
+          "table": "Ranged_Ones"
+        }
+      }
+    },
+    {
+      "name": "Electric Shackles",
+      "fullName": "Epic.Blaster_Mu_Mastery.Electric_Shackles",
+      "rank": 5,
+      "available": 43,
+      "description": "Electric Shackles binds a foes limbs, leaving the target held and helpless. The target is drained of some Endurance and some of that Endurance may be transferred back to you. You must be level 44 and have two other Mu Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged, DMG(Energy), Foe Hold, -End",
+      "icon": "arachnos_patron_targetedhold.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "Hold",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Holds",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 2.17,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "hold": 3.0
+        },
+        "damage": {
+          "type": "Energy",
+          "scale": 0.4113,
+          "table": "Ranged_PvPDamage"
+        },
+        "recovery": {
+          "scale": -1.0,
+          "table": "Ranged_Ones"
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['blaster_mu_mastery'] = EPIC_BLASTER_MU_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/blaster/cold_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Ice Mastery
+ * Archetype: Blaster
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\cold_mastery
+ */
+
+const EPIC_COLD_MASTERY = {
+  "id": "cold_mastery",
+  "name": "Ice Mastery",
+  "displayName": "Ice Mastery",
+  "archetype": "blaster",
+  "description": "You have Mastery over Ice and Cold to control your foes and to add some much needed armor and defense.",
+  "icon": "cold_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Snow Storm",
+      "fullName": "Epic.Cold_Mastery.Snow_Storm",
+      "rank": 1,
+      "available": 34,
+      "description": "While active, the chill from this Snow Storm can dramatically Slow the attack and movement speed of the target and all nearby foes.",
+      "shortHelp": "Toggle: Ranged (Targeted AoE), Foe -Speed, -Recharge",
+      "icon": "ice_mastery_snowstorm.png",
+      "powerType": "Toggle",
+      "requires": "$archetype == @Class_Blaster",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Slow Movement"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 20.0,
+        "endurance": 0.325,
+        "activationTime": 2.03,
+        "effectArea": "AoE",
+        "radius": 25.0
+      }
+    },
+    {
+      "name": "Flash Freeze",
+      "fullName": "Epic.Cold_Mastery.Flash_Freeze",
+      "rank": 2,
+      "available": 34,
+      "description": "You can Flash Freeze a large patch of ground beneath a targeted foe, instantly forming dozens of deadly ice shards that do Cold damage to all enemies in the area. The victims are left trapped within the icicles, but can break free if disturbed. Only targets near the ground can be affected.<br><br><color #fcfc95>Notes:<br>The Sleep component of this power is Auto Hit against regular enemies, but a To Hit check is required to against AVs and players, as well as to make secondary effects apply.</color>",
+      "shortHelp": "Ranged (Targeted AoE), DMG(Cold/Lethal), Foe Sleep",
+      "icon": "ice_mastery_flashfreeze.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Blaster",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Sleep",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Ranged AoE Damage",
+        "Sleep",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 90.0,
+        "endurance": 19.5,
+        "activationTime": 2.37,
+        "effectArea": "AoE",
+        "radius": 25.0,
+        "protection": {
+          "sleep": 3.0
+        },
+        "damage": {
+          "type": "Cold",
+          "scale": 0.5957,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Hoarfrost",
+      "fullName": "Epic.Cold_Mastery.Hoarfrost",
+      "rank": 3,
+      "available": 37,
+      "description": "Activating this power covers you in a thick layer of Hoarfrost. The frost can absorb the impact from enemy attacks, effectively increasing your maximum Hit Points for a short time. Hoarfrost also grants you resistance to Toxic Damage. You must be level 38 and have one other Ice Mastery Powers before selecting this power.",
+      "shortHelp": "Self Heal, +Max HP, Res(Toxic)",
+      "icon": "ice_mastery_hoarfrost.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge",
+        "Heal"
+      ],
+      "allowedSetCategories": [
+        "Healing",
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 540.0,
+        "endurance": 18.2,
+        "activationTime": 0.73,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "toxic": {
+            "scale": 1.5,
+            "table": "Melee_Res_Dmg"
+          }
+        },
+        "damage": {
+          "type": "Heal",
+          "scale": 3.0,
+          "table": "Melee_HealSelf"
+        }
+      }
+    },
+    {
+      "name": "Frozen Armor",
+      "fullName": "Epic.Cold_Mastery.Frozen_Armor",
+      "rank": 4,
+      "available": 40,
+      "description": "While this power is active, you coat yourself in rock hard Frozen Armor. The hardness of the Frozen Armor offers good defense to Smashing and Lethal attack as well as reduces Cold damage. Also, Fire attacks deal slightly less damage. You must be level 41 and have one other Ice Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Self +Def(Smash, Lethal), +Res(Cold, Fire)",
+      "icon": "ice_mastery_frozenarmor.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Defense Sets",
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 0.73,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "cold": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 1.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Hibernate",
+      "fullName": "Epic.Cold_Mastery.Hibernate",
+      "rank": 5,
+      "available": 43,
+      "description": "When you activate this power, you encase yourself in a block of solid ice, making yourself invulnerable, though you are frozen solid and cannot act. While Hibernating within this block of ice, you heal damage and recover endurance at an incredible rate. You can emerge at will by deactivating the power, but you cannot Hibernate for more than 30 seconds. If you activate this power while in the air, you will fall. You must be level 44 and have two other Ice Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Self +Regeneration, +Recovery, Invulnerable; Self Hold",
+      "icon": "ice_mastery_hibernate.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Recharge",
+        "Heal"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Healing"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 240.0,
+        "endurance": 0.1625,
+        "activationTime": 0.07,
+        "effectArea": "SingleTarget",
+        "regeneration": {
+          "scale": 10.0,
+          "table": "Melee_Ones"
+        },
+        "recovery": {
+          "scale": 4.0,
+          "table": "Melee_Ones"
+        },
+        "resistance": {},
+        "protection": {
+          "knockup": 1.0,
+          "knockback": 1.0,
+          "immobilize": 1000.0
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['cold_mastery'] = EPIC_COLD_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/blaster/electrical_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Electricity Mastery
+ * Archetype: Blaster
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\electrical_mastery
+ */
+
+const EPIC_ELECTRICAL_MASTERY = {
+  "id": "electrical_mastery",
+  "name": "Electricity Mastery",
+  "displayName": "Electricity Mastery",
+  "archetype": "blaster",
+  "description": "You have Mastery over Electricity to defeat your foes, and to add some much needed armor and defense.",
+  "icon": "electrical_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Static Discharge",
+      "fullName": "Epic.Electrical_Mastery.Static_Discharge",
+      "rank": 1,
+      "available": 34,
+      "description": "Discharges a cone of Static Electricity that deals damage and drains Endurance from all affected foes in the area.",
+      "shortHelp": "Ranged (Cone), DMG(Energy), -END",
+      "icon": "electrical_mastery_static_discharge.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Blaster",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 40.0,
+        "recharge": 24.0,
+        "endurance": 18.98,
+        "activationTime": 2.17,
+        "effectArea": "Cone",
+        "radius": 40.0,
+        "arc": 0.7854,
+        "damage": {
+          "type": "Energy",
+          "scale": 1.008,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Shocking Bolt",
+      "fullName": "Epic.Electrical_Mastery.Shocking_Bolt",
+      "rank": 2,
+      "available": 34,
+      "description": "Holds a distant foe by shocking him with electricity. The seized target is left writhing in agony and is unable to defend himself. Shocking Bolt also drains some Endurance from the target over time. A portion of drained Endurance may be returned to you.",
+      "shortHelp": "Ranged, DoT(Energy), Foe Hold, -END",
+      "icon": "electrical_mastery_shocking_bolt.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Blaster",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "Hold",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Holds",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 2.0,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "hold": 3.0
+        },
+        "damage": {
+          "type": "Energy",
+          "scale": 0.552,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Charged Armor",
+      "fullName": "Epic.Electrical_Mastery.Charged_Armor",
+      "rank": 3,
+      "available": 37,
+      "description": "When you toggle on this power, you are surrounded in a charged field that makes you highly resistant to Smashing, Lethal and Energy damage. You must be level 38 and have one other Electricity Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Self +Res(Smash, Lethal, Energy)",
+      "icon": "electrical_mastery_charged_armor.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 0.67,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "smashing": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "psionic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Surge of Power",
+      "fullName": "Epic.Electrical_Mastery.Surge_of_Power",
+      "rank": 4,
+      "available": 40,
+      "description": "When you activate this power, you transform your body into living Electricity and become extremely resistant to all damage but Psionics. However, expending all this energy will leave you exhausted, and drained of all endurance. You must be level 41 and have one other Electricity Mastery Powers before selecting this power.",
+      "shortHelp": "Self, +Res(Special)",
+      "icon": "electrical_mastery_powersurge.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 1000.0,
+        "endurance": 3.25,
+        "activationTime": 1.96,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "smashing": {
+            "scale": 5.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 5.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 5.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 5.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 5.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 6.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 4.0,
+            "table": "Melee_Res_Dmg"
+          }
+        },
+        "recovery": {
+          "scale": -100.0,
+          "table": "Melee_Ones"
+        }
+      }
+    },
+    {
+      "name": "EM Pulse",
+      "fullName": "Epic.Electrical_Mastery.EM_Pulse",
+      "rank": 5,
+      "available": 43,
+      "description": "You can unleash a massive pulse of electromagnetic energy. This EMP will drain the endurance and HP regeneration of all affected targets and leave them incapacitated and Disoriented for a while. Additionally, most machines and robots will take moderate high damage. However, this power uses a lot of endurance and leaves you unable to recover endurance for a while. You must be level 44 and have two other Electricity Mastery Powers before selecting this power.",
+      "shortHelp": "PBAoE, Foe Disorient, -END, -Regen, Special vs. Robots; Self -Recovery",
+      "icon": "electrical_mastery_em_pulse.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Recharge",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Stuns"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 800.0,
+        "endurance": 26.0,
+        "activationTime": 2.93,
+        "effectArea": "AoE",
+        "radius": 40.0,
+        "protection": {
+          "stun": 3.0
+        },
+        "regeneration": {
+          "scale": -30.0,
+          "table": "Ranged_Res_Boolean"
+        },
+        "damage": {
+          "type": "Energy",
+          "scale": 1.64,
+          "table": "Ranged_Damage"
+        },
+        "recovery": {
+          "scale": -1.0,
+          "table": "Ranged_Ones"
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['electrical_mastery'] = EPIC_ELECTRICAL_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/blaster/flame_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Fire Mastery
+ * Archetype: Blaster
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\flame_mastery
+ */
+
+const EPIC_FLAME_MASTERY = {
+  "id": "flame_mastery",
+  "name": "Fire Mastery",
+  "displayName": "Fire Mastery",
+  "archetype": "blaster",
+  "description": "You have Mastery over Fire and Flame to control your foes and to add some much needed armor and defense.",
+  "icon": "flame_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Bonfire",
+      "fullName": "Epic.Flame_Mastery.Bonfire",
+      "rank": 1,
+      "available": 34,
+      "description": "You can create a Bonfire that knocks back and burns any foes who try to pass through it.",
+      "shortHelp": "Ranged (Location AoE), DMG(Fire), Foe Knockback",
+      "icon": "flamemastery_bonfire.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Blaster",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 70.0,
+        "recharge": 120.0,
+        "endurance": 16.25,
+        "activationTime": 3.07,
+        "effectArea": "Location"
+      }
+    },
+    {
+      "name": "Char",
+      "fullName": "Epic.Flame_Mastery.Char",
+      "rank": 2,
+      "available": 34,
+      "description": "Incapacitates a distant foe by Charring him with smoldering soot and cinders. The target is left helpless, choking on the soot.",
+      "shortHelp": "Ranged, DoT(Fire), Foe Hold",
+      "icon": "flamemastery_soot.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Blaster",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Hold",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Holds",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 1.07,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "hold": 3.0
+        },
+        "damage": {
+          "type": "Fire",
+          "scale": 0.4218,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Fire Shield",
+      "fullName": "Epic.Flame_Mastery.Fire_Shield",
+      "rank": 3,
+      "available": 37,
+      "description": "While this power is active, you get a good resistance to Lethal, Smashing and Fire damage. Fire Shield also provides minimal resistance to Cold damage. You must be level 38 and have one other Fire Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Self +Res(Fire, Lethal, Smash, Cold)",
+      "icon": "flamingshield_flamingshield.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 1.67,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "smashing": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "psionic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Melt Armor",
+      "fullName": "Epic.Flame_Mastery.Melt_Armor",
+      "rank": 4,
+      "available": 40,
+      "description": "The searing heat from this power is enough to melt the armor and defenses of all targets in the affected area. Melt Armor significantly weakens the Defense and Damage Resistance of the affected targets. You must be level 41 and have one other Fire Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Targeted AoE), Foe -Res, -DEF",
+      "icon": "flamemastery_meltarmor.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate Defense Debuff",
+        "Defense Debuff"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 70.0,
+        "recharge": 200.0,
+        "endurance": 22.75,
+        "activationTime": 1.5,
+        "effectArea": "AoE",
+        "radius": 10.0,
+        "defense": {
+          "all": {
+            "scale": 2.0,
+            "table": "Ranged_Debuff_Def"
+          }
+        },
+        "resistance": {
+          "smashing": {
+            "scale": -3.0,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "lethal": {
+            "scale": -3.0,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "fire": {
+            "scale": -3.0,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "cold": {
+            "scale": -3.0,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "energy": {
+            "scale": -3.0,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "negative": {
+            "scale": -3.0,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "psionic": {
+            "scale": -3.0,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "toxic": {
+            "scale": -3.0,
+            "table": "Ranged_Debuff_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Rise of the Phoenix",
+      "fullName": "Epic.Flame_Mastery.Rise_of_the_Phoenix",
+      "rank": 5,
+      "available": 43,
+      "description": "If you are defeated, you can rise from the ashes. The fiery resurrection blasts nearby foes with an explosion and knocks them down. You will revive with about half of your Hit Points and Endurance. Rise of the Phoenix will actually leave you invulnerable for a brief time and protected from XP Debt for 20 seconds. You must be level 44 and have two other Fire Mastery Powers before selecting this power.",
+      "shortHelp": "Self Rez, Special",
+      "icon": "flamingshield_riseofthephoenix.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "Recharge",
+        "Heal",
+        "Damage"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Healing",
+        "Melee AoE Damage",
+        "Stuns",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 300.0,
+        "activationTime": 1.5,
+        "effectArea": "Location",
+        "damage": {
+          "type": "Heal",
+          "scale": 5.0,
+          "table": "Melee_HealSelf"
+        },
+        "protection": {
+          "immobilize": 50.0
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['flame_mastery'] = EPIC_FLAME_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/blaster/force_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Force Mastery
+ * Archetype: Blaster
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\force_mastery
+ */
+
+const EPIC_FORCE_MASTERY = {
+  "id": "force_mastery",
+  "name": "Force Mastery",
+  "displayName": "Force Mastery",
+  "archetype": "blaster",
+  "description": "You have Mastery over Energy and Force to protect yourself and defeat your foes.",
+  "icon": "force_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Personal Force Field",
+      "fullName": "Epic.Force_Mastery.Personal_Force_Field",
+      "rank": 1,
+      "available": 34,
+      "description": "The Personal Force Field is almost impenetrable to all attacks, even Psionics and Enemy Teleportation, although attacks from more powerful foes may get through more easily. Personal Force Field will also reduce the damage of almost any attacks that do get through. The Personal Force Field works both ways; while it is active, you can only use powers that affect yourself. Cannot be used with Rest.",
+      "shortHelp": "Toggle: Self +Def, Res(All)",
+      "icon": "forcefield_personalforcefield.png",
+      "powerType": "Toggle",
+      "requires": "$archetype == @Class_Blaster",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Defense Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 30.0,
+        "endurance": 0.1625,
+        "activationTime": 2.03,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "smashing": {
+            "scale": 4.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 4.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 4.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 4.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 4.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 4.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "psionic": {
+            "scale": 4.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 4.0,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Repulsion Field",
+      "fullName": "Epic.Force_Mastery.Repulsion_Field",
+      "rank": 2,
+      "available": 34,
+      "description": "This Toggle power creates a field that violently repels nearby foes. Each villain that is repelled costs you additional Endurance.",
+      "shortHelp": "Toggle: PBAoE Knockback",
+      "icon": "forcefield_repulsionfield.png",
+      "powerType": "Toggle",
+      "requires": "$archetype == @Class_Blaster",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Knockback"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 40.0,
+        "endurance": 0.4875,
+        "activationTime": 2.03,
+        "effectArea": "AoE",
+        "radius": 9.0
+      }
+    },
+    {
+      "name": "Temp Invulnerability",
+      "fullName": "Epic.Force_Mastery.Temp_Invulnerability",
+      "rank": 3,
+      "available": 37,
+      "description": "When you toggle on this power, you become highly resistant to Smashing and Lethal damage. You must be level 38 and have one other Force Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Self +Res(Smash, Lethal)",
+      "icon": "forcemastery_temporaryinvulnerabilty.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 0.67,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "smashing": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "psionic": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Force Bomb",
+      "fullName": "Epic.Force_Mastery.Repulsion_Bomb",
+      "rank": 4,
+      "available": 40,
+      "description": "A powerful Force Bomb is hurled at your foes dealing a moderate amount of damage and knocking them off of their feet. Foes struck by Repulsion Bomb have a chance to become disoriented, and the force of the blow will leave their armor shattered, lowering their damage resistance. You must be level 41 and have one other Force Mastery Powers before selecting this power.<br>",
+      "shortHelp": "Ranged (Targeted AoE), DMG(Smash), Foe -Res, Knockdown, Disorient",
+      "icon": "forcefield_repulsionbomb.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged AoE Damage",
+        "Stuns",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.2,
+        "range": 70.0,
+        "recharge": 60.0,
+        "endurance": 21.125,
+        "activationTime": 1.67,
+        "effectArea": "AoE",
+        "radius": 10.0,
+        "damage": {
+          "type": "Smashing",
+          "scale": 0.7818,
+          "table": "Ranged_Damage"
+        },
+        "protection": {
+          "knockback": 1.0
+        }
+      }
+    },
+    {
+      "name": "Force of Nature",
+      "fullName": "Epic.Force_Mastery.Foce_of_Nature",
+      "rank": 5,
+      "available": 43,
+      "description": "When you activate this power, you become highly resistant to all damage types except psionics. Your endurance recovery is also increased. Force of Nature costs little endurance to activate, but when it wears off you are left exhausted, and drained of almost all endurance, and unable to recover endurance for a short while. You must be level 44 and have two other Force Mastery Powers before selecting this power.",
+      "shortHelp": "Self, +Res(All DMG but Psionics)",
+      "icon": "forcemastery_unstoppable.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 1000.0,
+        "endurance": 3.25,
+        "activationTime": 3.1,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "smashing": {
+            "scale": 5.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 5.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 5.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 5.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 5.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 5.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 5.0,
+            "table": "Melee_Res_Dmg"
+          }
+        },
+        "recovery": {
+          "scale": -1.0,
+          "table": "Melee_Ones"
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['force_mastery'] = EPIC_FORCE_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/blaster/munitions_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Arsenal Mastery
+ * Archetype: Blaster
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\munitions_mastery
+ */
+
+const EPIC_MUNITIONS_MASTERY = {
+  "id": "munitions_mastery",
+  "name": "Arsenal Mastery",
+  "displayName": "Arsenal Mastery",
+  "archetype": "blaster",
+  "description": "You have Mastery of a wide arsenal of weapons, giving you access to uncommon payloads and equipment.",
+  "icon": "munitions_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Body Armor",
+      "fullName": "Epic.Munitions_Mastery.Body_Armor",
+      "rank": 1,
+      "available": 34,
+      "description": "You have Body Armor that will reduce all damage except Psionic. This power is always on, and costs no Endurance.",
+      "shortHelp": "Auto: Self +Res (All but Psionic)",
+      "icon": "munitionsmastery_bodyarmor.png",
+      "powerType": "Auto",
+      "requires": "$archetype == @Class_Blaster",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance"
+      ],
+      "allowedSetCategories": [
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "smashing": {
+            "scale": 1.25,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 1.25,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 1.25,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 1.25,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 1.25,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 1.25,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 1.25,
+            "table": "Melee_Res_Dmg"
+          },
+          "psionic": {
+            "scale": 1.25,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Cryo Freeze Ray",
+      "fullName": "Epic.Munitions_Mastery.Cryo_Freeze_Ray",
+      "rank": 2,
+      "available": 34,
+      "description": "Although this weapon deals very little damage, the Cryo Freeze Ray encases your foe in a block of ice, holding him helpless in place for a while.",
+      "shortHelp": "Ranged, DMG(Cold), Foe Hold, -SPD, -Recharge",
+      "icon": "munitionsmastery_cryofreezeray.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Blaster",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Hold",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Holds",
+        "Ranged Damage",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 60.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 1.67,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "hold": 3.0
+        },
+        "damage": {
+          "type": "Cold",
+          "scale": 2.529,
+          "table": "Ranged_PvPDamage"
+        },
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Sleep Grenade",
+      "fullName": "Epic.Munitions_Mastery.Sleep_Grenade",
+      "rank": 3,
+      "available": 37,
+      "description": "The Sleep Grenade can be launched at long range from beneath the barrel of your Assault Rifle. It releases a cloud of gas that will make enemies fall asleep. You must be level 35 and have one other Arsenal Mastery powers before selecting this power.<br><br><color #fcfc95>Notes: The Sleep component of this power is Auto Hit against regular enemies, but a To Hit check is required to against AVs and players, as well as to make secondary effects apply.</color>",
+      "shortHelp": "Ranged (Targeted AoE), Minor DMG(Smash), Foe Sleep",
+      "icon": "munitionsmastery_sleepgrenade.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Sleep",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Ranged AoE Damage",
+        "Sleep",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 80.0,
+        "recharge": 90.0,
+        "endurance": 19.5,
+        "activationTime": 1.87,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "protection": {
+          "sleep": 3.0
+        },
+        "damage": {
+          "type": "Smashing",
+          "scale": 0.1,
+          "table": "Ranged_Damage"
+        }
+      }
+    },
+    {
+      "name": "Surveillance",
+      "fullName": "Epic.Munitions_Mastery.Surveillance",
+      "rank": 4,
+      "available": 40,
+      "description": "When this power is activated, you focus your senses to analyze your target's defensive capabilities and discover their weaknesses. By sharing your knowledge of the target's weaknesses with your team mates, you effectively reduce their defense and resistance to damage. Your Combat Attributes Window will also show the combat attributes of the target. You must be level 41 and have one other Arsenal Mastery powers before selecting this power.",
+      "shortHelp": "Ranged Foe -DEF, -RES (All)",
+      "icon": "munitionsmastery_surveillance.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate Defense Debuff",
+        "Defense Debuff"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 80.0,
+        "recharge": 45.0,
+        "endurance": 10.66,
+        "activationTime": 1.5,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "smashing": {
+            "scale": -2.0,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "lethal": {
+            "scale": -2.0,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "fire": {
+            "scale": -2.0,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "cold": {
+            "scale": -2.0,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "energy": {
+            "scale": -2.0,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "negative": {
+            "scale": -2.0,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "psionic": {
+            "scale": -2.0,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "toxic": {
+            "scale": -2.0,
+            "table": "Ranged_Debuff_Res_Dmg"
+          }
+        },
+        "defense": {
+          "all": {
+            "scale": 2.0,
+            "table": "Melee_Debuff_Def"
+          }
+        }
+      }
+    },
+    {
+      "name": "LRM Rocket",
+      "fullName": "Epic.Munitions_Mastery.LRM_Rocket",
+      "rank": 5,
+      "available": 43,
+      "description": "The LRM Rocket is a powerful piece of hardware. It is very accurate and has a very long range. The impressive round can knock down its target. The LRM Rocket is bulky, awkward to use and you must take your time to aim, so this attack can be interrupted. You must be level 44 and have two other Arsenal Mastery Powers before selecting this power. If you are engaged in battle this attack becomes instant-cast, but inflicts lower damage on a reduced area and range.",
+      "shortHelp": "Interruptible (Targeted AoE), DMG(Lethal/Smash), Foe Knockback",
+      "icon": "munitionsmastery_lrmrocket.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "InterruptReduction",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 150.0,
+        "recharge": 240.0,
+        "endurance": 22.75,
+        "activationTime": 3.87,
+        "effectArea": "AoE",
+        "radius": 20.0
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['munitions_mastery'] = EPIC_MUNITIONS_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
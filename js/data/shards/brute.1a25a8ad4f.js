@@ -0,0 +1,12377 @@
+// ---- js/data/powersets/brute/battle-axe.js ----
+;/**
+ * Battle Axe
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_BATTLE_AXE_POWERSET = {
+    name: "Battle Axe",
+    category: "Unknown",
+    description: "Battle Axe powerset",
+    icon: "battle-axe_set.png",
+    powers: [
+        {
+            name: "Beheader",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Knockback", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "This is an attempt to remove your opponent's head from his neck with your Battle Axe. This attack is fairly quick for such a large weapon, and has a chance to cut through your foe's defense and knock them down.",
+            shortHelp: "Melee, DMG(Lethal), Foe Knockdown, -Defense",
+            icon: "battleaxe_chop.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.15,
+                range: 7.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    type: "Lethal",
+                    scale: 2.26
+                }
+            }
+        },
+        {
+            name: "Chop",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Knockback", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "Chop deals heavy damage with your Battle Axe, although it is much slower than Gash. This attack has a chance to cut through your target's defense and knock them down.",
+            shortHelp: "Melee, DMG(Lethal), Foe Knockdown, -Defense",
+            icon: "battleaxe_gash.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.15,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.2,
+                damage: {
+                    type: "Lethal",
+                    scale: 3.2
+                }
+            }
+        },
+        {
+            name: "Gash",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "Gashes your opponent with your Battle Axe dealing superior damage. This attack is very slow, but can deal a lot damage and knock the target down.",
+            shortHelp: "Melee, DMG(Lethal), Foe Knockdown",
+            icon: "battleaxe_beheader.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.27,
+                damage: {
+                    type: "Lethal",
+                    scale: 3.649
+                }
+            }
+        },
+        {
+            name: "Build Up",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your chance to hit.",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "battleaxe_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Pendulum",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "This attack swings your Battle Axe directly in front of you. Foes struck by this attack are dealt heavy damage, and may be knocked down.",
+            shortHelp: "Melee (Targeted AoE), DMG(Lethal), Foe Knockdown",
+            icon: "battleaxe_taoe.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 2.0,
+                damage: {
+                    type: "Lethal",
+                    scale: 2.5170000000000003
+                }
+            }
+        },
+        {
+            name: "Taunt",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Taunt foes to attack you. Useful to pull enemies off allies and keep them attacking you to raise your Fury. A To Hit check is required to Taunt enemy players, but is not needed against critter targets.",
+            shortHelp: "Ranged (Targeted AoE), Foe Taunt",
+            icon: "battleaxe_taunt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 10.0,
+                cast: 1.67,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Swoop",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "A Swoop of your Battle Axe deals a superior amount of damage, and can send your target flying upwards.",
+            shortHelp: "Melee, DMG(Lethal), Foe Knockup",
+            icon: "battleaxe_swoop.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 1.37,
+                damage: {
+                    type: "Lethal",
+                    scale: 4.119
+                }
+            }
+        },
+        {
+            name: "Axe Cyclone",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You spin your Battle Axe in a huge circle, attacking all nearby foes. This attack deals moderate damage to any foe it hits, draws them into melee range and can knock them down.",
+            shortHelp: "PBAoE Melee, DMG(Lethal), Foe Knockdown",
+            icon: "battleaxe_whirlingaxe.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.05,
+                recharge: 18.0,
+                endurance: 16.848,
+                cast: 2.1,
+                buffDuration: 0.15
+            }
+        },
+        {
+            name: "Cleave",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "This is an attempt to split your opponent in two with one fell swoop of your Battle Axe. It is an extremely devastating attack that deals massive damage and can knock foes to the ground. The power of this attack can actually extend a short distance through multiple foes.<br><br><color #fcfc95>Notes: Cleave is unaffected by Range and Radius changes.</color>",
+            shortHelp: "Ranged, DMG(Lethal), Foe Knockdown",
+            icon: "battleaxe_cleaveplayer.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.05,
+                range: 40.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 2.33,
+                damage: {
+                    type: "Lethal",
+                    scale: 4.5745
+                }
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/battle-axe'] = BRUTE_BATTLE_AXE_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_BATTLE_AXE_POWERSET = BRUTE_BATTLE_AXE_POWERSET;
+}
+
+// ---- js/data/powersets/brute/bio-organic-armor.js ----
+;/**
+ * Bio Organic Armor
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_BIO_ORGANIC_ARMOR_POWERSET = {
+    name: "Bio Organic Armor",
+    category: "Unknown",
+    description: "Bio Organic Armor powerset",
+    icon: "bio-organic-armor_set.png",
+    powers: [
+        {
+            name: "Defensive Adaptation",
+            available: -1,
+            tier: 2,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "By activating this power you cause your Bio Armor to spontaneously mutate, causing it to become dense and durable. While active Hardened Carapace grants additional resistance to Lethal, Smashing and Toxic damage, Inexhaustible grants additional Maximum HP, Environmental Modification grants additional defense and also grants a small amount of Maximum HP, Evolving Armor grants additional resistance and a small amount of defense per nearby target but loses the resistance debuff effect, Ablative Carapace grants additional damage absorption, DNA Siphon grants additional health per target hit and Parasitic Aura grants additional damage absorption per target hit. Additionally, many of your damaging attacks will heal you for a minor amount of health. However, the bulkiness of this adaptation reduces your damage moderately. Defensive Adaptation costs no endurance.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Bio Armor Defensive Mode",
+            icon: "bioorganicarmor_defensiveadaptation.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                cast: 1.0,
+                buffDuration: 1.1
+            }
+        },
+        {
+            name: "Efficient Adaptation",
+            available: -1,
+            tier: 2,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "By activating this power you cause your Bio Armor to spontaneously mutate, causing it to become evenly distributed along your body. While active Hardened Carapace grants a minor Endurance Discount, Inexhaustible grants additional regeneration and recovery, Ablative Carapace grants a bonus to regeneration, Evolving Armor grants additional regeneration and recovery for nearby targets, and both DNA Siphon and Parasitic Aura grant increased regeneration and recovery. Efficient Adaptation costs no endurance.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Bio Armor Efficient Mode",
+            icon: "bioorganicarmor_efficientadaptation.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                cast: 0.67,
+                buffDuration: 1.1
+            }
+        },
+        {
+            name: "Offensive Adaptation",
+            available: -1,
+            tier: 2,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "By activating this power you cause your Bio Armor to spontaneously mutate, causing it to sprout spines and become much lighter. While active Hardened Carapace increases your damage slightly, Environmental Modification grants you a moderate to hit buff, Evolving Armor has an improved Damage Resistance debuff, and debuff effects from DNA Siphon, Genetic Contamination and Parasitic Aura are increased moderately. Additionally, many of your damaging powers will inflict a minor amount of additional Toxic damage. While Offensive Adaptation is active your Defense and Damage Resistance is reduced slightly. Offensive Adaptation costs no endurance.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Bio Armor Offensive Mode",
+            icon: "bioorganicarmor_offensiveadaptation.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                cast: 0.67,
+                resistance: {
+                    smashing: -0.075,
+                    lethal: -0.075,
+                    fire: -0.075,
+                    cold: -0.075,
+                    energy: -0.075,
+                    negative: -0.075,
+                    psionic: -0.075,
+                    toxic: -0.075
+                },
+                buffDuration: 1.1
+            }
+        },
+        {
+            name: "Hardened Carapace",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "With a little concentration you can cause your skin to become hard as stone, boosting your constitution to reject toxins and recovering from wounds more quickly. While active, this power will boost your resistance to Lethal, Smashing and Toxic damage, grant a minor amount of regeneration, and protection from Disorient and Sleep effects. If Efficient Adaptation is active, Hardened Carapace will grant an Endurance Discount. If Defensive Adaptation is active, Hardened Carapace will grant additional resistance to Lethal, Smashing and Toxic damage. While Offensive Adaptation is active, this power will grant a minor boost to damage. Bonuses granted from Adaptations are unenhanceable.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Self Toggle, +Res(Lethal, Smash, Toxic, Disorient, Sleep), +Special",
+            icon: "bioorganicarmor_hardenedskin.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.67,
+                protection: {
+                    stun: 10.379999999999999,
+                    sleep: 10.379999999999999
+                },
+                resistance: {
+                    smashing: 0.1875,
+                    lethal: 0.1875,
+                    toxic: 0.1875
+                },
+                buffDuration: 0.75,
+                stun: 1.0,
+                stunDuration: 0.75
+            }
+        },
+        {
+            name: "Inexhaustible",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "Your body is constantly evolving and adapting based on your surroundings. As a result you receive a moderate bonus to maximum hit points, regeneration, recovery as well as gaining a measure of Slow and Endurance Drain Resistance. Half of this power's maximum hit point increase is unenhanceable. While Efficient Adaptation is active, this power grants a small bonus to recovery and regeneration. While Defensive Adaptation is active you gain a small amount of additional maximum hit points. This power doesn't grant any bonuses to Offensive Adaptation. These special bonuses are unenhanceable. Inexhaustible is always active.",
+            shortHelp: "Auto: +Max HP, +Regen, +Recovery, +Res(Slow, End Drain), +Special",
+            icon: "bioorganicarmor_inexhaustible.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                debuffResistance: {
+                    endurance: 0.692,
+                    recharge: 0.3,
+                    movement: 0.3
+                },
+                buffDuration: 5.25
+            }
+        },
+        {
+            name: "Environmental Modification",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Your body can spontaneously adapt to its surroundings and your mind has learned to shield itself from harmful effects by constant exposure to these dangers. While active you gain moderate defense to Fire, Cold, Energy and Negative Energy damage, and a small amount of defense to Psionic damage. Additionally you are protected against hold, knockdown and immobilize effects. While Defensive Adaptation is active you gain a minor amount of Lethal, Smashing, Fire, Cold, Energy, Negative Energy and Psionic defense, as well as a minor amount of maximum hit points. If Offensive Adaptation is active you'll gain a moderate To Hit bonus. These special bonuses are unenhanceable.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Self Toggle, +Res(Hold, Knockdown, Immobilize), +Def(Energy, Negative, Fire, Cold, Psionic), +Special",
+            icon: "bioorganicarmor_environmentalmodification.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.73,
+                protection: {
+                    hold: 10.379999999999999,
+                    immobilize: 10.379999999999999
+                },
+                defense: {
+                    fire: 0.11249999999999999,
+                    cold: 0.11249999999999999,
+                    energy: 0.11249999999999999,
+                    negative: 0.11249999999999999,
+                    psionic: 0.056249999999999994,
+                    smashing: 0.03375,
+                    lethal: 0.03375
+                },
+                buffDuration: 0.75,
+                tohitBuff: 0.75
+            }
+        },
+        {
+            name: "Adaptation",
+            available: 9,
+            tier: 3,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "By purchasing this power you gain access to three mutually exclusive toggle powers: Efficient Adaptation, Defensive Adaptation and Offensive Adaptation. If Defensive Adaptation is active you gain improved damage resistance from Hardened Carapace and Evolving Armor, additional defense from Environmental Modification and Evolving Armor, and increased Maximum HP from Environmental Modification and Inexhaustible. If Offensive Adaptation is active you gain bonus damage from Hardened Carapace, additional To Hit from Environmental Modification, empowered -resistance debuff from Evolving Armor, and your debuff effects from DNA Siphon, Genetic Contamination and Parasitic Aura are increased. While Efficient Adaptation is active Hardened Carapace will provide a moderate endurance discount, Inexhaustible has increased Regeneration and Recovery, Evolving Armor grants additional regeneration and recovery per nearby target, DNA Siphon grants additional regeneration and recovery for each defeated target and Parasitic Aura grants additional regeneration and recovery for each nearby target.",
+            shortHelp: "Gain Efficient, Defensive and Offensive Adaptations",
+            icon: "bioorganicarmor_adaptation.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0
+            }
+        },
+        {
+            name: "Ablative Carapace",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "When needed, you're able to cause your Bio Armor to gain a thick, but brittle outer layer that will absorb a large amount of damage before breaking off. Ablative Carapace will grant a moderate amount of damage absorption and a high amount of regeneration for a short time. While Efficient Adaptation is active, this power grants a slightly larger regeneration buff. While Defensive Adaptation is active, this power grants a bonus to damage absorption.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self, +Absorption, +Regeneration",
+            icon: "bioorganicarmor_ablativecarapace.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 10.4,
+                cast: 2.03,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Evolving Armor",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage", "Threat Duration"],
+            description: "When faced with danger, your Bio Armor reacts by becoming incredibly durable as well as infecting nearby enemies, lowering their resistance to damage. While active, Evolving Armor will grant you small amount of damage resistance, plus an additional amount for each nearby target. Nearby foes will also be taunted and have their damage resistance reduced. While Efficient Adaptation is active, this power grants a moderate bonus to Regeneration and Recovery plus a tiny amount of both for each nearby foe up to 10 foes. While Defensive Adaptation is active you gain a very minor amount of defense and damage resistance for each nearby foe, however you lose the benefit of this power's resistance debuff. If Offensive Adaptation is active this power's damage resistance debuff is increased. These special bonuses are unenhanceable.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Self Toggle, +Res(All), Foe -Res(All), Taunt, +Special",
+            icon: "bioorganicarmor_evolution.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.26,
+                cast: 2.93,
+                defense: {
+                    smashing: 0.028124999999999997,
+                    lethal: 0.028124999999999997,
+                    fire: 0.021,
+                    cold: 0.021,
+                    energy: 0.021,
+                    negative: 0.021,
+                    psionic: 0.015
+                },
+                resistance: {
+                    fire: 0.028124999999999997,
+                    cold: 0.028124999999999997,
+                    energy: 0.028124999999999997,
+                    negative: 0.028124999999999997,
+                    psionic: 0.0225,
+                    smashing: 0.0375,
+                    lethal: 0.0375,
+                    toxic: 0.0375
+                },
+                buffDuration: 1.125
+            }
+        },
+        {
+            name: "DNA Siphon",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Brute Archetype Sets", "Endurance Modification", "Healing", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You can siphon genetic material from nearby enemies, causing a minor amount of Lethal damage and a minor amount of Toxic damage over time. Living enemies will provide the user with a small boost to health and endurance. These foes will have their regeneration rate reduced for a short period of time. Defeated enemies provide a weaker sample of material and thus will boost recovery and regeneration for a short while. While Efficient Adaptation is active, this power will grant bonus regeneration and recovery per defeated target hit. While Defensive Adaptation is active, this power will grant bonus health per living target hit. While Offensive Adaptation is active this power's regeneration debuff is increased in effectiveness.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Click, PBAoE Minor DMG(Lethal/Toxic) Foe -Regen, Taunt, Self +HP, +End, +Special",
+            icon: "bioorganicarmor_dnasiphon.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 13.0,
+                cast: 1.67,
+                damage: {
+                    type: "Lethal",
+                    scale: 0.2
+                },
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.1,
+                    ticks: 2
+                },
+                healing: {
+                    scale: 56.2220625,
+                    perTarget: true
+                },
+                buffDuration: 2.0
+            }
+        },
+        {
+            name: "Genetic Contamination",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You're capable of breaking down the genetic material of your foes with a powerful toxin that is produced by your Bio Armor. Nearby foes affected by this poison will suffer toxic damage over time as well as dealing reduced damage. While Defensive Adaptation is active this power's damage debuff is increased in effectiveness.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: PBAoE, Minor DoT(Toxic), -Damage(All)",
+            icon: "bioorganicarmor_geneticcontamination.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 1.04,
+                cast: 1.07,
+                damage: {
+                    type: "Toxic",
+                    scale: 0.15
+                },
+                buffDuration: 5.0
+            }
+        },
+        {
+            name: "Parasitic Aura",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Endurance Modification", "Healing", "Threat Duration"],
+            description: "You release a cloud of parasites around you that draw out your enemies' genetic material. These parasites dramatically increase your survivability by gaining damage absorption while boosting your regeneration and recovery rate for a short time. Affected foes will be infected and deal reduced damage for a short while. While Efficient Adaptation is active, this power will grant additional regeneration and recovery per target hit. While Defensive Adaptation is active, this power will grant a small amount of additional damage absorption and increase the effectiveness of this power's damage debuff.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "PBAoE, Self +Absorb, +Regeneration, +Recovery, Foe -DMG",
+            icon: "bioorganicarmor_parasiticaura.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.5,
+                recharge: 270.0,
+                endurance: 18.2,
+                cast: 1.87,
+                buffDuration: 45.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/bio-organic-armor'] = BRUTE_BIO_ORGANIC_ARMOR_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_BIO_ORGANIC_ARMOR_POWERSET = BRUTE_BIO_ORGANIC_ARMOR_POWERSET;
+}
+
+// ---- js/data/powersets/brute/brawling.js ----
+;/**
+ * Brawling
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_BRAWLING_POWERSET = {
+    name: "Brawling",
+    category: "Unknown",
+    description: "Brawling powerset",
+    icon: "brawling_set.png",
+    powers: [
+        {
+            name: "Heavy Blow",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You strike your foe with a powerful punch dealing Moderate Smashing damage. Heavy Blow has a fair chance to knock the target off its feet. Heavy Blow is a Combo Builder and adds 1 Combo Level.",
+            shortHelp: "Melee, DMG(Smash), Foe Knockdown, Combo Builder",
+            icon: "brawling_heavyblow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 5.0,
+                endurance: 6.032,
+                cast: 1.07
+            }
+        },
+        {
+            name: "Initial Strike",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "You deliver a pair of lightning fast blows to your opponent in an effort to throw them off balance. Initial Strike deals Light Smashing damage and has a small chance to disorient your target. Initial Strike is a Combo Builder and adds 1 Combo Level.",
+            shortHelp: "Melee, DMG(Smash), Foe Disorient, Combo Builder",
+            icon: "brawling_initialstrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 0.8
+            }
+        },
+        {
+            name: "Sweeping Cross",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee AoE Damage", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "You execute a sweeping right hook that can strike multiple targets in your frontal arc. Sweeping Cross deals High Smashing damage and can disorient foes. Sweeping Cross is a Finisher and resets your current Combo Level to 0. It will deal additional damage and will have a greater chance to disorient dependent upon the current Combo Level. At Combo Level 3, Sweeping Cross will also have a chance to knock down the affected targets.",
+            shortHelp: "Melee (Cone), DMG(Smash), Foe Disorient, Finisher",
+            icon: "brawling_sweepingcross.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 1.309,
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67
+            }
+        },
+        {
+            name: "Combat Readiness",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Activating this power will increase your chance to hit and the amount of damage you deal for a short amount of time as well as setting your current Combo Level to 3.",
+            shortHelp: "Self, +DMG, +To Hit, Special",
+            icon: "brawling_combatreadiness.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 2.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Rib Cracker",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You deftly strike your foe in a very vulnerable location. Rib Cracker deals Moderate Damage but reduces your foe's Damage and Resistance moderately for a short time. Rib Cracker is a Combo Builder and adds 1 Combo Level.",
+            shortHelp: "Melee, DMG(Smash), Foe -Res (All), -Dmg, Combo Builder",
+            icon: "brawling_throatstrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.33,
+                damage: {
+                    type: "Smashing",
+                    scale: 1.571
+                },
+                buffDuration: 5.0
+            }
+        },
+        {
+            name: "Taunt",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Taunt foes to attack you. Useful to pull enemies off allies and keep them attacking you to raise your Fury. A To-Hit check is required to Taunt enemy players, but is not needed against critter targets.",
+            shortHelp: "Ranged (Targeted AoE), Foe Taunt",
+            icon: "brawling_taunt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 10.0,
+                cast: 1.67,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Spinning Strike",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Ranged AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You execute a spinning attack that first strikes with your fist and finally your heel hitting your foe and all enemies immediately nearby. Spinning Strike deals Heavy Smashing damage and has a high chance to knockdown foes. Spinning Strike is a Finisher and sets your Combo Level to 0. It will deal additional damage and will have a greater chance to knockdown dependent upon the current Combo Level. At Combo Level 3, Spinning Strike also has a moderate chance to briefly inflict Terrorize in nearby foes.",
+            shortHelp: "Melee (Targeted AoE), DMG(Smash), Foe Knockdown, Finisher",
+            icon: "brawling_spinningstrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.8
+            }
+        },
+        {
+            name: "Shin Breaker",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Defense Debuff", "Melee Damage", "Slow Movement", "Threat Duration", "Universal Damage Sets"],
+            description: "You execute a quick but powerful kick targeting your foe's leg in an attempt to cripple their movement. Shin Breaker deals Superior Smashing damage and moderately reduces your target's movement speed and defense for a short time. Shin Breaker is a Combo Builder and adds 1 Combo Level.",
+            shortHelp: "Melee, DMG(Smashing), Foe -Speed, -Defense, Combo Builder",
+            icon: "brawling_lowkick.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.33,
+                damage: {
+                    type: "Smashing",
+                    scale: 1.651
+                },
+                buffDuration: 8.0,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Crushing Uppercut",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Holds", "Knockback", "Melee Damage", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "You perform a jaw breaking Crushing Uppercut on your target inflicting Extreme Smashing damage and knocking them into the air. Crushing Uppercut will leave the target disoriented for a short time. Crushing Uppercut is a Finisher and will set your Combo Level to 0. It will deal additional damage and have a longer disorient duration dependent upon the current Combo Level. At Combo Level 3, Crushing Uppercut will have its disorient effect upgraded to a Hold effect.",
+            shortHelp: "Melee, DMG(Smash), Foe Knock Up, Disorient, Finisher",
+            icon: "brawling_crushinguppercut.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 13.0,
+                recharge: 25.0,
+                endurance: 14.352,
+                cast: 2.17
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/brawling'] = BRUTE_BRAWLING_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_BRAWLING_POWERSET = BRUTE_BRAWLING_POWERSET;
+}
+
+// ---- js/data/powersets/brute/broad-sword.js ----
+;/**
+ * Broad Sword
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_BROAD_SWORD_POWERSET = {
+    name: "Broad Sword",
+    category: "Unknown",
+    description: "Broad Sword powerset",
+    icon: "broad-sword_set.png",
+    powers: [
+        {
+            name: "Hack",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You Hack your opponent for a high amount of damage. This attack can reduce a target's Defense, making him easier to hit.",
+            shortHelp: "Melee, DMG(Lethal), Foe -DEF",
+            icon: "sword_hack.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.33,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 3.291
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.738
+                        }
+                    ],
+                    scale: 4.029
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Slash",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You perform a quick Slash that can reduce a target's Defense, making him easier to hit. This attack causes moderate damage, but has a quick recharge time.",
+            shortHelp: "Melee, DMG(Lethal), Foe -DEF",
+            icon: "sword_slash.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.33,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 2.491
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.45
+                        }
+                    ],
+                    scale: 2.9410000000000003
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Slice",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You Slice your sword in a wide arc, attacking all enemies in front of you. Slice does less damage than Hack but can hit multiple foes and reduce their defense.",
+            shortHelp: "Melee (Cone), DMG(Lethal), Foe -DEF",
+            icon: "sword_slice.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 2.2689,
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 2.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 2.826
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.5535
+                        }
+                    ],
+                    scale: 3.3795
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Build Up",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your chance to hit.",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "sword_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Parry",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Defense Sets", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You can use this power to Parry incoming melee attacks. The Parry itself does minor damage, but every successful hit will increase your Defense against melee and lethal attacks for a short while.",
+            shortHelp: "Melee, DMG(Lethal), Self +DEF(Melee,Lethal)",
+            icon: "sword_parry.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 1.33,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 2.291
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.378
+                        }
+                    ],
+                    scale: 2.669
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Taunt",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Taunt foes to attack you. Useful to pull enemies off allies and keep them attacking you to raise your Fury. A To-Hit check is required to Taunt enemy players, but is not needed against critter targets.",
+            shortHelp: "Ranged (Targeted AoE), Foe Taunt",
+            icon: "broadsword_taunt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 10.0,
+                cast: 1.67,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Whirling Sword",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You perform a Whirling Sword maneuver, attacking all foes in melee range. This attack wounds your opponents, causing them to take minor damage over time and reduces their defense.",
+            shortHelp: "PBAoE Melee, DMG(Lethal), Foe -Def",
+            icon: "sword_whirlingsword.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.05,
+                recharge: 14.0,
+                endurance: 13.52,
+                cast: 2.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 2.7965
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.45
+                        }
+                    ],
+                    scale: 3.2465
+                },
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 0.1,
+                            ticks: 2
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.045,
+                            ticks: 2
+                        }
+                    ]
+                },
+                buffDuration: 2.1,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Disembowel",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Knockback", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You perform a powerful Disemboweling maneuver that deals a great amount of damage, and can knock a target up into the air. This attack can reduce a target's Defense, making him easier to hit.",
+            shortHelp: "Melee, DMG(Lethal), Knockup, Foe -DEF",
+            icon: "sword_disembowel.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.8,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 4.0199
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.882
+                        }
+                    ],
+                    scale: 4.9018999999999995
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Head Splitter",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Knockback", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You perform a devastating Head Splitter attack that deals a massive amount of damage and can even knock a foe down to the ground and reduce its Defense. The power of this attack can actually extend a short distance through multiple foes.",
+            shortHelp: "Melee, DMG(Lethal), Foe Knockback, -DEF",
+            icon: "sword_headsplitter.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 0.3491,
+            effects: {
+                accuracy: 1.05,
+                range: 10.0,
+                recharge: 14.0,
+                endurance: 13.52,
+                cast: 2.33,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 5.1909
+                        },
+                        {
+                            type: "Fire",
+                            scale: 1.17
+                        }
+                    ],
+                    scale: 6.3609
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 10.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/broad-sword'] = BRUTE_BROAD_SWORD_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_BROAD_SWORD_POWERSET = BRUTE_BROAD_SWORD_POWERSET;
+}
+
+// ---- js/data/powersets/brute/claws.js ----
+;/**
+ * Claws
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_CLAWS_POWERSET = {
+    name: "Claws",
+    category: "Unknown",
+    description: "Claws powerset",
+    icon: "claws_set.png",
+    powers: [
+        {
+            name: "Strike",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You perform a deadly Strike with your claws. This is a basic attack that deals a moderate amount of lethal damage.",
+            shortHelp: "Melee, DMG(Lethal)",
+            icon: "claws_clawsstrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 4.8,
+                endurance: 5.4912,
+                cast: 1.17,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 2.651
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.558
+                        }
+                    ],
+                    scale: 3.2089999999999996
+                }
+            }
+        },
+        {
+            name: "Swipe",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "A quick Swipe with your claws. Does minor lethal damage, but has a quick recharge rate.",
+            shortHelp: "Melee, DMG(Lethal)",
+            icon: "claws_clawsswipe.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 2.4,
+                endurance: 3.4944,
+                cast: 0.83,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 1.907
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.3735
+                        }
+                    ],
+                    scale: 2.2805
+                }
+            }
+        },
+        {
+            name: "Slash",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You Slash at your foe with your claws, dealing a good amount of lethal damage, but with a longer recharge rate than Swipe or Strike . This attack can reduce a target's Defense, making him easier to hit.",
+            shortHelp: "Melee, DMG(Lethal), Foe -DEF",
+            icon: "claws_slash.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 6.4,
+                endurance: 6.8224,
+                cast: 1.33,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 3.0669999999999997
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.666
+                        }
+                    ],
+                    scale: 3.7329999999999997
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Spin",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You spin around in a circle, attacking everyone within melee range with a Strike attack.",
+            shortHelp: "PBAoE Melee, DMG(Lethal)",
+            icon: "claws_spinningclawsattack.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 14.0,
+                endurance: 13.1456,
+                cast: 2.5,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 3.2039
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.8505
+                        }
+                    ],
+                    scale: 4.0544
+                }
+            }
+        },
+        {
+            name: "Follow Up",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Threat Duration", "To Hit Buff", "Universal Damage Sets"],
+            description: "You perform a feint attack that deals moderate damage. After this attack hits, it gives you a large bonus Damage and chance to hit for a brief time.",
+            shortHelp: "Melee, DMG(Lethal), Self +DMG +To-hit",
+            icon: "claws_feint.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 12.0,
+                endurance: 7.8,
+                cast: 0.83,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 2.261
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.36
+                        }
+                    ],
+                    scale: 2.621
+                },
+                tohitBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Taunt",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Taunt foes to attack you. Useful to pull enemies off allies and keep them attacking you to raise your Fury. A To-Hit check is required to Taunt enemy players, but is not needed against critter targets.",
+            shortHelp: "Ranged (Targeted AoE), Foe Taunt",
+            icon: "claws_tauntaoe.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 10.0,
+                cast: 1.67,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Focus",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Ranged Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "Projects a burst of focused power over a short distance. Focus deals high damage and can possibly knock down your foe.",
+            shortHelp: "Ranged, DMG(Lethal), Knockback",
+            icon: "claws_focus.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 8.0,
+                endurance: 8.1536,
+                cast: 1.17,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 2.5545999999999998
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.6795
+                        }
+                    ],
+                    scale: 3.2340999999999998
+                }
+            }
+        },
+        {
+            name: "Eviscerate",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You spin and slash violently, Eviscerating all foes in a wide arc in front of you.",
+            shortHelp: "Melee (Cone), DMG(Lethal), Foe -DEF",
+            icon: "claws_evicerate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 12.0,
+                endurance: 11.4816,
+                cast: 2.33,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 4.1818
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.9815
+                        }
+                    ],
+                    scale: 5.1633
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Shockwave",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Ranged AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "Projects a Shockwave of focused power that can travel a short distance. Shockwave travels in a wide arc in front of you dealing moderate damage and, possibly knocking back foes.",
+            shortHelp: "Melee (Cone), DMG(Lethal), Foe Knockback",
+            icon: "claws_wave.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.0,
+                range: 30.0,
+                recharge: 14.4,
+                endurance: 13.4784,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 1.7925
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.5085
+                        }
+                    ],
+                    scale: 2.301
+                }
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/claws'] = BRUTE_CLAWS_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_CLAWS_POWERSET = BRUTE_CLAWS_POWERSET;
+}
+
+// ---- js/data/powersets/brute/dark-armor.js ----
+;/**
+ * Dark Armor
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_DARK_ARMOR_POWERSET = {
+    name: "Dark Armor",
+    category: "Unknown",
+    description: "Dark Armor powerset",
+    icon: "dark-armor_set.png",
+    powers: [
+        {
+            name: "Dark Embrace",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You tap into the energy of the Netherworld to protect yourself from damage. This Dark Embrace shrouds you and grants resistance to Lethal, Smashing, Negative Energy and Toxic damage.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +Res(Smash, Lethal, Negative, Toxic)",
+            icon: "darkarmor_darkembrace.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.104,
+                cast: 0.67,
+                resistance: {
+                    smashing: 0.22499999999999998,
+                    lethal: 0.22499999999999998,
+                    negative: 0.15,
+                    toxic: 0.15
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Death Shroud",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You become a focus point for the Netherworld, allowing its Negative Energy to seep from your body. This will continuously damage all foes in melee range.<br><br><color #fcfc95>Damage: Minor(DoT).</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: PBAoE Minor DoT(Negative)",
+            icon: "darkarmor_touchofdeath.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 1.04,
+                cast: 2.47,
+                damage: {
+                    type: "Negative",
+                    scale: 0.2
+                }
+            }
+        },
+        {
+            name: "Murky Cloud",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You create a Murky Cloud enshrouding you. This cloud can absorb all forms of energy, making you more resistant to Fire, Cold, Energy, and Negative Energy attacks, as well as Endurance Drain effects.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +Res(Fire, Cold, Energy, Negative, End Drain)",
+            icon: "darkarmor_defractingcloud.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.104,
+                cast: 1.17,
+                resistance: {
+                    fire: 0.22499999999999998,
+                    cold: 0.22499999999999998,
+                    energy: 0.15,
+                    negative: 0.15
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Obsidian Shield",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You can create a special Obsidian Shield that grants good resistance to Psionic damage. With your mind enshrouded in darkness you are protected from Sleep, Fear, Hold and Disorient attacks.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +Res(Psionic, Sleep, Hold, Disorient, Fear)",
+            icon: "darkarmor_obsidianshield.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 1.17,
+                protection: {
+                    hold: 10.379999999999999,
+                    stun: 10.379999999999999,
+                    sleep: 10.379999999999999,
+                    fear: 10.379999999999999
+                },
+                resistance: {
+                    psionic: 0.375
+                },
+                debuffResistance: {
+                    tohit: 0.3,
+                    defense: 0.3,
+                    recharge: 0.3,
+                    movement: 0.5
+                },
+                buffDuration: 0.75,
+                stun: 1.0,
+                stunDuration: 0.75,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Dark Regeneration",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Brute Archetype Sets", "Healing", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You can tap the dark essence of the Netherworld to drain a small amount of life from all enemies nearby, thus healing yourself. The more foes affected, the more you will be healed.<br><br>This power is mutually exclusive from Obscure Sustenance.",
+            shortHelp: "PBAoE DMG(Negative), Self +HP",
+            icon: "darkarmor_darkregeneration.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 30.0,
+                endurance: 33.8,
+                cast: 1.17,
+                damage: {
+                    type: "Negative",
+                    scale: 0.2
+                },
+                healing: {
+                    scale: 449.7765,
+                    perTarget: true
+                }
+            }
+        },
+        {
+            name: "Obscure Sustenance",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You can tap the dark essence of the Netherworld increase your regeneration and recovery rate, as well as making you resistance to -ToHit and -Regeneration debuffs.<br><br>This power is mutually exclusive from Dark Regeneration.",
+            shortHelp: "Self Heal, +Regen, Res(-ToHit, -Regeneration), +Recovery(Special)",
+            icon: "darkarmor_darkregeneration.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 2.0,
+                recharge: 60.0,
+                endurance: 10.4,
+                cast: 1.93,
+                debuffResistance: {
+                    tohit: 0.25949999999999995,
+                    regeneration: 0.25949999999999995
+                },
+                healing: {
+                    scale: 374.81375,
+                    perTarget: true
+                },
+                buffDuration: 10.0,
+                tohitBuff: 0.75
+            }
+        },
+        {
+            name: "Cloak of Darkness",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "A shroud of Netherworld darkness envelops you, making you difficult to spot at a distance. You can be seen only at close range, or if you attack a target. Even if seen, the Cloak of Darkness grants you a bonus to Defense to all attacks and some protection from Immobilization. This Netherworld Cloak also allows you to see things in a new light, allowing you to better see stealthy foes.",
+            shortHelp: "Toggle: Self Stealth, +DEF, +Perception, Res (Immobilize)",
+            icon: "darkarmor_cloakofdarkness.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 1.17,
+                protection: {
+                    immobilize: 10.379999999999999
+                },
+                defense: {
+                    smashing: 0.0375,
+                    lethal: 0.0375,
+                    fire: 0.0375,
+                    cold: 0.0375,
+                    energy: 0.0375,
+                    negative: 0.0375,
+                    psionic: 0.0375,
+                    toxic: 0.0375
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Cloak of Fear",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Fear", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Fear", "Threat Duration", "To Hit Debuff"],
+            description: "You can wrap yourself in a nightmarish Cloak of Fear. Foes close to you are treated to visions most horrific, lowering their damage ouptupt and forcing them to tremble in terror, only attacking if attacked, and even then, with a reduced chance to hit. Feeding on your enemies fear will increase your protection against knockback effects.<br><br><color #fcfc95>Notes: Mez enhancements on this power enhance its magnitude instead of its duration.</color>",
+            shortHelp: "Toggle: PBAoE Self +Res(Knockback), Foe Fear, -ACC",
+            icon: "darkarmor_fearfulaura.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 0.8,
+                recharge: 4.0,
+                endurance: 0.26,
+                cast: 1.17
+            }
+        },
+        {
+            name: "Oppressive Gloom",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Stuns", "Threat Duration"],
+            description: "The Netherworld has many mutable properties, such as the Oppressive Gloom. This power allows you to use your own Hit Points to keep enemies near you Disoriented and unable to use any powers. Endurance cost for this is minimal, but the power can be dangerous to use.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: PBAoE, Foe Disorient, Self -HP",
+            icon: "darkarmor_oppressivegloom.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 8.0,
+                endurance: 0.156,
+                cast: 1.17,
+                stun: 2.0
+            }
+        },
+        {
+            name: "Soul Transfer",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Endurance Modification", "Healing", "Melee AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "You transfer the souls of nearby enemies into yourself, stunning them while making you able to absorb some damage. This will also make you resistant to control effects, -ToHit debuffs and endurance drain for a short time. You can use this power while concious or after defeat. If used while concious and are defeated soon after, you will automatically bounce back into the fight. If used after defeat, Soul Transfer will also inflict damage as you suck the life force of all foes around you and bring yourself back from the brink of death. This form of the power is much more likely to stun foes.<br><br><color #fcfc95>Notes: This power recharges in <color #FF7F27>10</color> seconds if no foes are hit. Otherwise, it recharges in <color #FF7F27>300</color> seconds.</color>",
+            shortHelp: "Self Rez, +Absorb, +Res(Disorient, Sleep, Hold, Immobilize, Knockback, -ToHit, -Endurance), +Special, Foe Disorient",
+            icon: "darkarmor_soultransfer.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 10.4,
+                cast: 1.17
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/dark-armor'] = BRUTE_DARK_ARMOR_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_DARK_ARMOR_POWERSET = BRUTE_DARK_ARMOR_POWERSET;
+}
+
+// ---- js/data/powersets/brute/dark-melee.js ----
+;/**
+ * Dark Melee
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_DARK_MELEE_POWERSET = {
+    name: "Dark Melee",
+    category: "Unknown",
+    description: "Dark Melee powerset",
+    icon: "dark-melee_set.png",
+    powers: [
+        {
+            name: "Shadow Punch",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Brute Archetype Sets", "Melee Damage", "Threat Duration", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You wrap your fists with Negative Energy channeled from the Netherworlds, then perform a quick punch that deals minor damage. Shadow Punches cloud the target's vision, lowering his chance to hit for a short time.",
+            shortHelp: "Melee, DMG(Smash/Negative), Foe -To Hit",
+            icon: "shadowfighting_shadowpunch.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 0.83,
+                damage: {
+                    types: [
+                        {
+                            type: "Negative",
+                            scale: 1.1606
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.7804
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.378
+                        }
+                    ],
+                    scale: 2.319
+                },
+                tohitDebuff: 0.75,
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Smite",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Brute Archetype Sets", "Melee Damage", "Threat Duration", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You wrap your fists with Negative Energy channeled from the Netherworlds, then perform a Smite that deals more damage than Shadow Punch, but has a longer recharge time. Smite clouds the target's vision, lowering their chance to hit for a short time.",
+            shortHelp: "Melee, DMG(Smash/Negative), Foe -To Hit",
+            icon: "shadowfighting_smite.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 0.97,
+                damage: {
+                    types: [
+                        {
+                            type: "Negative",
+                            scale: 1.9891999999999999
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.6496999999999999
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.594
+                        }
+                    ],
+                    scale: 3.2329
+                },
+                tohitDebuff: 0.75,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Shadow Maul",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Brute Archetype Sets", "Melee AoE Damage", "Threat Duration", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You wrap your entire arms with Negative Energy channeled from the Netherworlds, then perform a series of blows that deal a lot of damage over a short period of time to multiple targets in front of you. These blows cloud your target's vision, lowering his chance to hit for a short time.",
+            shortHelp: "Melee (Cone), DoT(Smash/Negative), Foe -To Hit",
+            icon: "shadowfighting_shadowmaul.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 2.0944,
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 11.0,
+                endurance: 11.024,
+                cast: 2.37,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 0.44079999999999997,
+                            ticks: 3
+                        },
+                        {
+                            type: "Negative",
+                            scale: 0.44079999999999997,
+                            ticks: 3
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.1821,
+                            ticks: 3
+                        }
+                    ]
+                },
+                buffDuration: 2.0,
+                tohitDebuff: 0.75
+            }
+        },
+        {
+            name: "Touch of Fear",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Fear", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Brute Archetype Sets", "Fear", "Melee AoE Damage", "Threat Duration", "To Hit Debuff", "Universal Damage Sets"],
+            description: "The Netherworld is one scary place, and with but a touch, you can give your enemy a glimpse into this dark world. This will cause them to helplessly tremble in Fear. Foes in this state of panic have their chance to hit reduced.",
+            shortHelp: "Melee (Targeted AoE), DMG(Negative), Fear, Foe -To Hit",
+            icon: "shadowfighting_touchoffearaoe.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.97
+            }
+        },
+        {
+            name: "Siphon Life",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Accurate To-Hit Debuff", "Brute Archetype Sets", "Healing", "Melee Damage", "Threat Duration", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You tap the power of the Netherworld and create a life transferring conduit between a foe and yourself. This will transfer Hit Points from your enemy to yourself. Foes Siphoned in this manner have their chance to hit reduced.",
+            shortHelp: "Melee, DMG(Negative), Foe -To Hit, Self +HP",
+            icon: "shadowfighting_siphonlife.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.93,
+                damage: {
+                    types: [
+                        {
+                            type: "Negative",
+                            scale: 4.1109
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.882
+                        }
+                    ],
+                    scale: 4.9929
+                },
+                healing: {
+                    scale: 149.9255,
+                    perTarget: true
+                },
+                tohitDebuff: 0.75,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Taunt",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Taunt foes to attack you. Useful to pull enemies off allies and keep them attacking you to raise your Fury. A To Hit check is required to Taunt enemy players, but is not needed against critter targets.",
+            shortHelp: "Ranged (Targeted AoE), Foe Taunt",
+            icon: "shadowfighting_taunt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 10.0,
+                cast: 1.67,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Dark Consumption",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Endurance Modification", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "The dark power of the Netherworld allows you to tap the essence of your foe's soul and transfer it to yourself. This will drain the Hit Points of your enemy and add to your Endurance.",
+            shortHelp: "PBAoE DMG(Negative), Self +End",
+            icon: "shadowfighting_darkconsumption.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 180.0,
+                endurance: 0.52,
+                cast: 1.03,
+                damage: {
+                    types: [
+                        {
+                            type: "Negative",
+                            scale: 0.8
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.36
+                        }
+                    ],
+                    scale: 1.1600000000000001
+                }
+            }
+        },
+        {
+            name: "Soul Drain",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee AoE Damage", "Threat Duration", "To Hit Buff", "Universal Damage Sets"],
+            description: "Using this power, you can drain the essence of all nearby foes' souls, thus increasing your own strength. Each affected foe will lose some Hit Points and add to your Damage and chance to hit.",
+            shortHelp: "PBAoE DMG(Negative), Self +DMG, +To Hit",
+            icon: "shadowfighting_stealpower.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.2,
+                recharge: 120.0,
+                endurance: 15.6,
+                cast: 2.37,
+                damage: {
+                    types: [
+                        {
+                            type: "Negative",
+                            scale: 1.0
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.45
+                        }
+                    ],
+                    scale: 1.45
+                },
+                tohitBuff: 1.0,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Midnight Grasp",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Brute Archetype Sets", "Immobilize", "Melee Damage", "Threat Duration", "To Hit Debuff", "Universal Damage Sets"],
+            description: "Mastery over the forces of the Netherworld allows you to create dark tentacles that can Immobilize a foe, reduce their chance to hit and continuously drain their life force.",
+            shortHelp: "Melee, DMG(Negative), Foe Immobilize, -To Hit",
+            icon: "shadowfighting_midnightgrasp.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 15.0,
+                endurance: 11.96,
+                cast: 2.07,
+                damage: {
+                    types: [
+                        {
+                            type: "Negative",
+                            scale: 4.2893
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.9945
+                        }
+                    ],
+                    scale: 5.2838
+                },
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Negative",
+                            scale: 0.11,
+                            ticks: 4
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.0495,
+                            ticks: 4
+                        }
+                    ]
+                },
+                tohitDebuff: 0.75,
+                buffDuration: 20.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/dark-melee'] = BRUTE_DARK_MELEE_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_DARK_MELEE_POWERSET = BRUTE_DARK_MELEE_POWERSET;
+}
+
+// ---- js/data/powersets/brute/dual-blades.js ----
+;/**
+ * Dual Blades
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_DUAL_BLADES_POWERSET = {
+    name: "Dual Blades",
+    category: "Unknown",
+    description: "Dual Blades powerset",
+    icon: "dual-blades_set.png",
+    powers: [
+        {
+            name: "Nimble Slash",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "A quick swipe with your blades. Does minor lethal damage, but has a quick recharge rate. This attack begins both the Empower and Weaken combination attacks.<br><br><color #ff7f00>Empower: Nimble Slash > Ablating Strike > Blinding Feint.</color><br><color #ff7f00>Weaken: Nimble Slash > Ablating Strike > Typhoon's Edge.</color>",
+            shortHelp: "Melee, DMG(Lethal)",
+            icon: "dualblades_lightopening.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 1.03,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 1.0405,
+                            ticks: 1
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.189,
+                            ticks: 1
+                        }
+                    ]
+                },
+                buffDuration: 0.5
+            }
+        },
+        {
+            name: "Power Slice",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You perform a deadly Strike with your blades. This is a basic attack that deals a moderate amount of lethal damage. This power is needed for the Sweep combination attack.<br><br><color #ff7f00>Sweep: One Thousand Cuts > Power Slice > Typhoon's Edge.</color>",
+            shortHelp: "Melee, DMG(Lethal)",
+            icon: "dualblades_moderateopening.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 5.0,
+                endurance: 6.032,
+                cast: 1.4,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 0.9080999999999999,
+                            ticks: 2
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.174,
+                            ticks: 2
+                        }
+                    ]
+                },
+                buffDuration: 1.0
+            }
+        },
+        {
+            name: "Ablating Strike",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You Slash at your foe with your blades, dealing a good amount of lethal damage. This attack can reduce a target's Defense, making him easier to hit. This power is needed for the Empower and Weaken combination attacks, and is the beginning of the Attack Vitals combination attack.<br><br><color #ff7f00>Empower: Nimble Slash > Ablating Strike > Blinding Feint.</color><br><color #ff7f00>Weaken: Nimble Slash > Ablating Strike > Typhoon's Edge.</color><br><color #ff7f00>Attack Vitals: Ablating Strike > Vengeful Slice > Sweeping Strike.</color>",
+            shortHelp: "Melee, DMG(Lethal), Foe -DEF",
+            icon: "dualblades_moderatebridge.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.03,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 1.3405,
+                            ticks: 1
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.297,
+                            ticks: 1
+                        }
+                    ]
+                },
+                buffDuration: 0.6,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Typhoon's Edge",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You spin around in a circle, attacking everyone within melee range with a striking attack. This attack is the finishing move in both the Weaken and Sweep combination attacks.<br><br><color #ff7f00>Weaken: Nimble Slash > Ablating Strike > Typhoon's Edge.</color><br><color #ff7f00>Sweep: One Thousand Cuts > Power Slice > Typhoon's Edge.</color>",
+            shortHelp: "PBAoE Melee, DMG(Lethal)",
+            icon: "dualblades_aoebridge.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 2.27,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 0.57
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.2565
+                        }
+                    ],
+                    scale: 0.8265
+                },
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 1.2753999999999999,
+                            ticks: 1
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.2565,
+                            ticks: 1
+                        }
+                    ]
+                },
+                buffDuration: 0.6,
+                defenseDebuff: 1.0,
+                tohitDebuff: 1.0
+            }
+        },
+        {
+            name: "Blinding Feint",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Threat Duration", "To Hit Buff", "Universal Damage Sets"],
+            description: "You perform a feint attack that deals light damage. After this attack hits, it gives you a large bonus to your chance to hit and damage for a brief time. This power is the finishing move in the Empower combination attack.<br><br><color #ff7f00>Empower: Nimble Slash > Ablating Strike > Blinding Feint.</color>",
+            shortHelp: "Melee, DMG(Lethal), Self +DMG, +To Hit",
+            icon: "dualblades_followup.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 12.0,
+                endurance: 7.8,
+                cast: 1.2,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 2.52
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.36
+                        }
+                    ],
+                    scale: 2.88
+                },
+                tohitBuff: 0.33,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Taunt",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Taunt foes to attack you. Useful to pull enemies off allies and keep them attacking you to raise your Fury. A To Hit check is required to Taunt enemy players, but is not needed against critter targets.",
+            shortHelp: "Ranged (Targeted AoE), Foe Taunt",
+            icon: "dualblades_taunt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 10.0,
+                cast: 1.93,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Vengeful Slice",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "Unleashes a series of strong attacks on your foe, dealing high lethal damage and knocking them down. This power is needed for the Attack Vitals combination attack.<br><br><color #ff7f00>Attack Vitals: Ablating Strike > Vengeful Slice > Sweeping Strike.</color>",
+            shortHelp: "Melee, DMG(Lethal), Knockdown",
+            icon: "dualblades_special1.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 2.43,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 4.0607999999999995
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.738
+                        }
+                    ],
+                    scale: 4.7988
+                }
+            }
+        },
+        {
+            name: "Sweeping Strike",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You make a sweeping strike with your blades, hitting all foes in a cone in front of you and dealing superior lethal damage to each. This power is the finishing move for the Attack Vitals combination attack.<br><br><color #ff7f00>Attack Vitals: Ablating Strike > Vengeful Slice > Sweeping Strike.</color>",
+            shortHelp: "Melee (Cone), DMG(Lethal)",
+            icon: "dualblades_special2.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 11.0,
+                endurance: 11.024,
+                cast: 1.23,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 3.0553999999999997
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.765
+                        }
+                    ],
+                    scale: 3.8204
+                },
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 0.2,
+                            ticks: 4
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.09,
+                            ticks: 4
+                        }
+                    ]
+                },
+                buffDuration: 4.1
+            }
+        },
+        {
+            name: "One Thousand Cuts",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "Unleashes a flurry of attacks on all foes in a cone in front of you, dealing moderate lethal damage to each foe hit. This power is the opening move for the Sweep combination attack.<br><br><color #ff7f00>Sweep: One Thousand Cuts > Power Slice > Typhoon's Edge.</color>",
+            shortHelp: "Melee (Cone), DMG(Lethal), Foe Knockback",
+            icon: "dualblades_highlow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 3.3,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 0.9944999999999999
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.315
+                        }
+                    ],
+                    scale: 1.3094999999999999
+                },
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 0.364,
+                            ticks: 10
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.068,
+                            ticks: 10
+                        }
+                    ]
+                },
+                buffDuration: 2.05
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/dual-blades'] = BRUTE_DUAL_BLADES_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_DUAL_BLADES_POWERSET = BRUTE_DUAL_BLADES_POWERSET;
+}
+
+// ---- js/data/powersets/brute/electric-armor.js ----
+;/**
+ * Electric Armor
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_ELECTRIC_ARMOR_POWERSET = {
+    name: "Electric Armor",
+    category: "Unknown",
+    description: "Electric Armor powerset",
+    icon: "electric-armor_set.png",
+    powers: [
+        {
+            name: "Charged Armor",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "When you toggle on this power, you are surrounded in a charged field that makes you highly resistant to Smashing, Lethal and Energy damage.",
+            shortHelp: "Toggle: Self +Res(Smash, Lethal, Energy)",
+            icon: "electricarmor_selfbuffdefensephysical.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.67,
+                resistance: {
+                    smashing: 0.2625,
+                    lethal: 0.2625,
+                    energy: 0.2625
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Lightning Field",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Endurance Modification", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "While active, you emit a storm of electricity that constantly damages all nearby foes.",
+            shortHelp: "Toggle: PBAoE, Minor DoT(Energy), Foe -End",
+            icon: "electricarmor_pbaoeminordamage.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 1.04,
+                cast: 2.03,
+                damage: {
+                    type: "Energy",
+                    scale: 0.2
+                }
+            }
+        },
+        {
+            name: "Conductive Shield",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "When you toggle on this power, you are surrounded in a Conductive Shield that will conduct many sorts of energy away from your body. Conductive Shield grants high resistant to Fire, Cold, and Energy damage, as well as good resistance to Negative Energy damage.",
+            shortHelp: "Toggle: Self +Res(Fire, Cold, Energy, Negative)",
+            icon: "electricarmor_selfresistelements.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.67,
+                resistance: {
+                    fire: 0.2625,
+                    cold: 0.2625,
+                    energy: 0.2625,
+                    negative: 0.15
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Static Shield",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You can create a field of Static Electricity around your body. This Static Shield protects you from Hold, Sleep, and Disorient effects as well as Endurance Drain, Recovery DeBuffs and enemy Teleportation. Static Shield can also help normalize your synaptic activity, granting you good resistance to Psionic Damage.",
+            shortHelp: "Toggle: Self +Res(Hold, Sleep, Disorient, End Drain, Recovery DeBuff, Psionic, Toxic, Teleport)",
+            icon: "electricarmor_selfresistmez.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 1.17
+            }
+        },
+        {
+            name: "Grounded",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You are Grounded and naturally very resistant to Energy and Negative Energy damage. You also have added resistance to Endurance Drain effects. Additionally, Grounded provides Immobilize, Knockback protection and the Grounded status, but only for up to 10 seconds after being near the ground. This power is always on and costs no Endurance.",
+            shortHelp: "Auto: Self +Res (All DMG but Toxic and Psionics, End Drain, Immobilize, KB)",
+            icon: "electricarmor_selfresistenergies.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0
+            }
+        },
+        {
+            name: "Lightning Reflexes",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "Your Lightning Reflexes allow you to move faster than normal, as well as resist slow effects. This power is always on and permanently increases your attack rate and movement speed.",
+            shortHelp: "Auto: Self +Recharge, +SPD, Res (Slow)",
+            icon: "electricarmor_selfbuffrunspeed.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                debuffResistance: {
+                    recharge: 0.4,
+                    movement: 0.4
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Energize",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You can channel a tremendous amount of electricity through your body for a short period of time. Doing so will heal some hit points, reduce the endurance cost of your powers and boost your regeneration for a short time.",
+            shortHelp: "Self Endurance Discount, Heal, +Regen",
+            icon: "electricarmor_energize.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 120.0,
+                endurance: 10.4,
+                cast: 1.17,
+                healing: {
+                    scale: 374.81375,
+                    perTarget: true
+                },
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Power Sink",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing", "Threat Duration"],
+            description: "Power Sink leeches energy directly from the bodies of all nearby foes, draining their Endurance. Each foe you draw energy from increases your Endurance and regeneration rate. If there are no foes within range, you will not gain any Endurance.",
+            shortHelp: "PBAoE, Self +End, +Regen, Foe -End",
+            icon: "electricarmor_pbaoeendurancedrain.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 60.0,
+                endurance: 13.0,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Power Surge",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Healing", "Holds", "Resist Damage"],
+            description: "When you activate this power, you transform your body into living Electricity and become extremely resistant to all damage but Psionics, as well as Disorient, Sleep, Hold, Immobilize, Knockback, End Drain, Recovery DeBuff, and enemy Teleportation. Your Regeneration rate and Endurance recovery are also increased. As Power Surge wears off, the charge in your body explodes in a massive EMP pulse.",
+            shortHelp: "Self +Res(All DMG, but Psionics), +Res(Knockback, Repel, Disorient, Hold, Immobilize, Sleep), +Regen, +Recovery, +Special",
+            icon: "electricarmor_selfbuffdefense.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 350.0,
+                endurance: 2.6,
+                cast: 1.96
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/electric-armor'] = BRUTE_ELECTRIC_ARMOR_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_ELECTRIC_ARMOR_POWERSET = BRUTE_ELECTRIC_ARMOR_POWERSET;
+}
+
+// ---- js/data/powersets/brute/electrical-melee.js ----
+;/**
+ * Electrical Melee
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_ELECTRICAL_MELEE_POWERSET = {
+    name: "Electrical Melee",
+    category: "Unknown",
+    description: "Electrical Melee powerset",
+    icon: "electrical-melee_set.png",
+    powers: [
+        {
+            name: "Charged Brawl",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Endurance Modification", "Melee Damage", "Sleep", "Threat Duration", "Universal Damage Sets"],
+            description: "Your fists become electrically charged and deliver a powerful punch. Charged Brawl can drain some Endurance from the target and may overload their synapses, leaving them writhing for a moment. A portion of drained Endurance may be returned to you. Disturbing an overloaded target will disperse the electrical charge and release them.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Melee, DMG(Smash/Energy), Target Sleep, -End",
+            icon: "electricmelee_targetedminordmg.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 0.83,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 1.1606
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.7804
+                        }
+                    ],
+                    scale: 1.941
+                },
+                buffDuration: 2.0
+            }
+        },
+        {
+            name: "Havoc Punch",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Endurance Modification", "Melee Damage", "Sleep", "Threat Duration", "Universal Damage Sets"],
+            description: "The Havoc Punch is a slower attack than Charged Brawl, but makes up for it with a greater damage. Havoc Punch can drain some Endurance from your target and may overload their synapses, leaving him writhing for a moment. A portion of the drained Endurance may be given back to you. Disturbing an overloaded target will disperse the electrical charge and release him.",
+            shortHelp: "Melee, DMG(Smash/Energy), Foe Sleep, -End",
+            icon: "electricmelee_targetedmoderatedmg.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.5,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 1.814
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.1960000000000002
+                        }
+                    ],
+                    scale: 3.0100000000000002
+                },
+                buffDuration: 4.0
+            }
+        },
+        {
+            name: "Jacobs Ladder",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Endurance Modification", "Melee AoE Damage", "Sleep", "Threat Duration", "Universal Damage Sets"],
+            description: "You are able to generate a strong current between your arms and snap a powerful bolt of electricity in an arc in front of you. This melee attack can electrocute all foes within the arc dealing High energy damage. Jacobs Ladder can drain some Endurance from your target and may overload their synapses, leaving him writhing for a moment. Disturbing an overloaded target will disperse the electrical charge and release him.",
+            shortHelp: "Melee (Cone), DMG(Energy), Foe Sleep, -End",
+            icon: "electricmelee_conemoderatedmg.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 0.8727,
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 3.0986000000000002
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.675
+                        }
+                    ],
+                    scale: 3.7736
+                },
+                buffDuration: 2.0
+            }
+        },
+        {
+            name: "Build Up",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your chance to hit.",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "electricmelee_selfbuffdmg.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Thunder Strike",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee AoE Damage", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "A massive attack. You smash your foes with all the power of a lightning bolt. The pummeled victim takes tremendous damage and may be Disoriented. Any nearby foes may be knocked down and take some damage from the shockwave as well as have some endurance drained.",
+            shortHelp: "Melee (AoE), DMG(Energy), Foe Disorient, Knockback, -End",
+            icon: "electricmelee_targetedaoeheavydmg.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 2.53
+            }
+        },
+        {
+            name: "Taunt",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Taunt foes to attack you. Useful to pull enemies off allies and keep them attacking you to raise your Fury. A To Hit check is required to Taunt enemy players, but is not needed against critter targets.",
+            shortHelp: "Ranged (Targeted AoE), Foe Taunt",
+            icon: "electricmelee_targetedtaunt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 10.0,
+                cast: 1.67,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Chain Induction",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Endurance Modification", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "This Electric Melee attack deals moderate Smashing and Energy damage and may drain some of the targets Endurance. However, this attack also induces an unstable electric charge that may jump to another enemy target. The charge will jump to the closest enemy in range that has not been previously hit, until it inevitably dissipates. Enhancements and Fury will boost the effectiveness of the initial attack as well as the jumping charge.",
+            shortHelp: "Melee, DMG(Energy), Foe -End +Special",
+            icon: "electricmelee_targetedchaininduction.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 14.0,
+                endurance: 10.192,
+                cast: 1.0,
+                damage: {
+                    type: "Energy",
+                    scale: 2.98
+                },
+                buffDuration: 2.0
+            }
+        },
+        {
+            name: "Lightning Clap",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Stuns", "Threat Duration"],
+            description: "You can clap your hands together to release a violent Lightning Clap. The Lightning Clap can knock down most nearby foes, Disorienting many of them. Lightning Clap deals no damage.",
+            shortHelp: "PBAoE, Foe Disorient, Knockback",
+            icon: "electricmelee_pbaoestun.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 0.8,
+                recharge: 30.0,
+                endurance: 13.0,
+                cast: 1.23,
+                stun: 2.0
+            }
+        },
+        {
+            name: "Lightning Rod",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You can polarize your body and become a living Lightning Rod. This power calls forth a massive lightning bolt from the sky to strike you. You can then ride this bolt and instantly Teleport a short distance. You rematerialize in a massive bolt of electricity, dealing massive damage and knocking down all nearby foes. Damage from the lightning bolt is superior.",
+            shortHelp: "PBAoE, Foe Knockback; Self Teleport;",
+            icon: "electricmelee_pbaoeteleport.png",
+            powerType: "Click",
+            targetType: "Location (Teleport)",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 90.0,
+                endurance: 13.52,
+                cast: 2.57,
+                buffDuration: 4.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/electrical-melee'] = BRUTE_ELECTRICAL_MELEE_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_ELECTRICAL_MELEE_POWERSET = BRUTE_ELECTRICAL_MELEE_POWERSET;
+}
+
+// ---- js/data/powersets/brute/energy-aura.js ----
+;/**
+ * Energy Aura
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_ENERGY_AURA_POWERSET = {
+    name: "Energy Aura",
+    category: "Unknown",
+    description: "Energy Aura powerset",
+    icon: "energy-aura_set.png",
+    powers: [
+        {
+            name: "Dampening Field",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "Your body resonates a mild Dampening Field that absorbs kinetic energy from physical weapons as well as Energy damage. This auto power permanently reduces all incoming Smashing, Lethal and Energy damage as well as providing a minor amount of resistance to Endurance Drain effects. This power is always on and costs no Endurance.",
+            shortHelp: "Auto: Self +Res (Smashing, Lethal, Energy, Endurance Drain)",
+            icon: "energyaura_powershield.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 1.25,
+                            ticks: 5
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 1.25,
+                            ticks: 5
+                        },
+                        {
+                            type: "Energy",
+                            scale: 1.0,
+                            ticks: 5
+                        }
+                    ]
+                },
+                resistance: {
+                    smashing: 0.09375,
+                    lethal: 0.09375,
+                    energy: 0.075
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Kinetic Shield",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Kinetic Shield creates a harmonic Energy Aura that can deflect physical attacks. Your Defense to Smashing and Lethal attacks is increased as weapons and powers like bullets, blades and punches tend to deflect off the shield. Kinetic Shield also grants you good resistance to Defense Debuffs. The Energy based nature of Kinetic Shield also offers some minimal Defense to Energy attacks. Kinetic Shield also adds an Elusivity defense bonus to Smashing, Lethal, and Energy Attacks in PVP zones.",
+            shortHelp: "Toggle: Self +DEF(Smashing, Lethal, Energy), Res(DeBuff DEF)",
+            icon: "energyaura_kineticshield.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.13,
+                cast: 0.73,
+                defense: {
+                    smashing: 0.1275,
+                    lethal: 0.1275,
+                    energy: 0.01875
+                },
+                debuffResistance: {
+                    defense: 0.173
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Power Shield",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "This Power Shield creates a Electro-Magnetic shield around you that can deflect non-physical attacks. Your Defense to Fire, Cold, Energy and Negative Energy attacks is increased as these attacks are reflected or refracted off the shield. Power Shield also grants you good resistance to Defense Debuffs. Power Shield also adds Psionic Defense and an Elusivity defense bonus to Fire, Cold, Energy and Psionic Attacks in PVP zones.",
+            shortHelp: "Toggle: Self +DEF(Fire, Cold, Energy, Negative), Res(DeBuff DEF)",
+            icon: "energyaura_powershield.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.13,
+                cast: 1.67,
+                defense: {
+                    energy: 0.15,
+                    fire: 0.15,
+                    cold: 0.15,
+                    negative: 0.15,
+                    psionic: 0.15
+                },
+                debuffResistance: {
+                    defense: 0.173
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Entropic Aura",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Entropic Aura diminishes and dampens the energy of controlling type effects. The shield makes you resistant to Knockback, Repel, Disorient, Hold, Sleep, Immobilization, and enemy Teleportation for as long as you can keep this toggle power active. Entropic Aura also grants you good resistance to Defense Debuffs as well as providing you a recharge bonus for each foe in melee, up to the first 10 foes. Foes that get close to the user will have their own recharge rate reduced and may be taunted.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Self +Res(Knockback, Repel, Disorient, Hold, Sleep, Immobilize, Teleport, DeBuff DEF), Self +Recharge, Foe -Recharge",
+            icon: "energyaura_entropy.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.52,
+                cast: 0.73,
+                buffDuration: 2.0
+            }
+        },
+        {
+            name: "Energy Protection",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "Your ability to channel energy makes you naturally resistant to Energy, Negative Energy, Psionic and Toxic damage. Additionally, this power grants some resistance to both recharge and movement slowing effects. This power is always on and costs no Endurance.",
+            shortHelp: "Auto: Self +Res (Energy, Negative, Toxic, Psionic, Slow)",
+            icon: "energyaura_protection.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 1.25,
+                            ticks: 5
+                        },
+                        {
+                            type: "Negative",
+                            scale: 1.25,
+                            ticks: 5
+                        },
+                        {
+                            type: "Psionic",
+                            scale: 1.25,
+                            ticks: 5
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 1.25,
+                            ticks: 5
+                        }
+                    ]
+                },
+                resistance: {
+                    energy: 0.09375,
+                    negative: 0.09375,
+                    psionic: 0.09375,
+                    toxic: 0.09375
+                },
+                debuffResistance: {
+                    recharge: 0.2,
+                    movement: 0.2
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Energy Cloak",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "The Energy Cloak bends light around you so you become partially invisible. While Cloaked you can only be seen at very close range. If you attack while Cloaked, you will be discovered. Even if discovered, you still maintain a Defense bonus to all attacks.",
+            shortHelp: "Toggle: Self Stealth, +DEF",
+            icon: "energyaura_cloak.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.73,
+                defense: {
+                    smashing: 0.0375,
+                    lethal: 0.0375,
+                    fire: 0.0375,
+                    cold: 0.0375,
+                    energy: 0.0375,
+                    negative: 0.0375,
+                    psionic: 0.0375,
+                    toxic: 0.0375
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Energy Drain",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Endurance Modification", "Threat Duration"],
+            description: "Energy Drain leeches energy directly from the bodies of all nearby foes, draining their Endurance. Each foe you draw energy from increases your Endurance and Defense. If there are no foes within range, you will not gain any Endurance or Defense.",
+            shortHelp: "PBAoE, Self +End, +Def, Foe -End",
+            icon: "energyaura_drain.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 60.0,
+                endurance: 13.0,
+                cast: 2.37
+            }
+        },
+        {
+            name: "Energize",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You can channel a tremendous amount of energy through your body for a short period of time. Doing so will heal some hit points, reduce the endurance cost of your powers and boost your regeneration for a short time.",
+            shortHelp: "Self Endurance Discount, Heal, +Regen",
+            icon: "energyaura_energize.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 120.0,
+                endurance: 10.4,
+                cast: 1.17,
+                healing: {
+                    scale: 374.81375,
+                    perTarget: true
+                },
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Overload",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Endurance Modification", "Healing"],
+            description: "You can Overload your Energy Aura and dramatically improve your defense to all attack types. Overload also grants you high resistance to Defense Debuffs. This Energy Aura is so powerful, that it can even absorb some damage, effectively increasing your Max Hit Points. However, when Overload wears off, you are left drained of all Endurance and unable to recover Endurance for a while. Overload also adds a moderate Elusivity defense bonus to all attacks in PVP zones.",
+            shortHelp: "Self +DEF(All), +Recovery, +Max HP, Res(DeBuff DEF), +Special",
+            icon: "energyaura_overload.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 1000.0,
+                endurance: 2.6,
+                cast: 3.0,
+                defense: {
+                    smashing: 0.44999999999999996,
+                    lethal: 0.44999999999999996,
+                    fire: 0.44999999999999996,
+                    cold: 0.44999999999999996,
+                    energy: 0.44999999999999996,
+                    negative: 0.44999999999999996,
+                    psionic: 0.33749999999999997,
+                    toxic: 0.33749999999999997
+                },
+                debuffResistance: {
+                    defense: 0.346
+                },
+                buffDuration: 180.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/energy-aura'] = BRUTE_ENERGY_AURA_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_ENERGY_AURA_POWERSET = BRUTE_ENERGY_AURA_POWERSET;
+}
+
+// ---- js/data/powersets/brute/energy-melee.js ----
+;/**
+ * Energy Melee
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_ENERGY_MELEE_POWERSET = {
+    name: "Energy Melee",
+    category: "Unknown",
+    description: "Energy Melee powerset",
+    icon: "energy-melee_set.png",
+    powers: [
+        {
+            name: "Barrage",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "You perform a quick punch that deals moderate damage. Coupled with other energy punches, Barrage can Disorient a foe. This power will have a 100% chance to stun and weaken the target's secondary effects and regeneration rate if used while in Energy Focus mode.",
+            shortHelp: "Melee, DMG(Smash/Energy), Foe Disorient, Special",
+            icon: "powerpunch_quick.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.33,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 1.0891,
+                            ticks: 1
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.3564,
+                            ticks: 1
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.297,
+                            ticks: 1
+                        }
+                    ]
+                },
+                buffDuration: 0.3
+            }
+        },
+        {
+            name: "Energy Punch",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "You perform a powerful Energy Punch that deals moderate damage. When used with other Energy Melee attacks, Energy Punch can Disorient your opponent.",
+            shortHelp: "Melee, DMG(Smash/Energy), Foe Disorient",
+            icon: "powerpunch_energypunch.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 5.0,
+                endurance: 6.032,
+                cast: 0.83,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 1.6387
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.7022999999999999
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.522
+                        }
+                    ],
+                    scale: 2.863
+                }
+            }
+        },
+        {
+            name: "Bone Smasher",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "This melee attack deals a good amount of damage and has a good chance to Disorient the target.",
+            shortHelp: "Melee, DMG(Smash/Energy), Disorient",
+            icon: "powerpunch_bonesmasher.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.27,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 2.0780000000000003
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.171
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.738
+                        }
+                    ],
+                    scale: 3.987
+                }
+            }
+        },
+        {
+            name: "Build Up",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your chance to hit.",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "powerpunch_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Whirling Hands",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee AoE Damage", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "By focusing your energy into the muscles in your arms, you can launch a dizzying flurry of attacks against every foe in melee range. Some foes may be hit hard enough to be Disoriented as well.",
+            shortHelp: "PBAoE Melee, DMG(Smash/Energy)",
+            icon: "powerpunch_flurry.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 14.0,
+                endurance: 13.0,
+                cast: 2.5,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 1.4
+                        },
+                        {
+                            type: "Energy",
+                            scale: 1.0138
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.5318
+                        }
+                    ],
+                    scale: 2.9455999999999998
+                }
+            }
+        },
+        {
+            name: "Taunt",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Taunt foes to attack you. Useful to pull enemies off allies and keep them attacking you to raise your Fury. A To Hit check is required to Taunt enemy players, but is not needed against critter targets.",
+            shortHelp: "Ranged (Targeted AoE), Foe Taunt",
+            icon: "powerpunch_taunt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 10.0,
+                cast: 1.67,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Total Focus",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "Total Focus is complete mastery over Energy Melee. This melee attack is a very slow, but incredibly devastating attack that can knock out most opponents, leaving them Disoriented. Due to the exhausting nature of Total Focus, recharge time is very long. This power will enter Energy Focus mode.",
+            shortHelp: "Melee, DMG(Smash/Energy), Foe Disorient, +Energy Focus",
+            icon: "powerpunch_totalfocus.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 2.53,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 4.6396
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.8913
+                        }
+                    ],
+                    scale: 6.5309
+                },
+                stun: 3.0
+            }
+        },
+        {
+            name: "Power Crash",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee AoE Damage", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "You focus your internal energy on your fists and release it once you hit your target unleashing an energy wave that hurts and disorients multiple enemies. This power will hit up to 5 additional foes if used while in Energy Focus mode.<br><br><color #fcfc95>Notes: Power Crash is unaffected by Arc changes.</color>",
+            shortHelp: "Melee (Cone), DMG(Smash/Energy), Foe Disorient, Special",
+            icon: "powerpunch_powercrash.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 2.0944,
+            effects: {
+                accuracy: 1.0,
+                range: 10.0,
+                recharge: 9.0,
+                endurance: 9.36,
+                cast: 1.8,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 1.4809
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.0725
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.5414
+                        }
+                    ],
+                    scale: 3.0948
+                }
+            }
+        },
+        {
+            name: "Energy Transfer",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "Mastery of Energy Melee culminates with the ability to transfer your own Hit Points into a punch that deals extreme damage. Energy Transfer has a good chance of Disorienting the target. This power will execute extremely quickly if under Energy Focus mode.",
+            shortHelp: "Melee, DMG(Energy), Foe Disorient, Self -HP, Special",
+            icon: "powerpunch_energytransfer.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 10.0,
+                cast: 2.67
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/energy-melee'] = BRUTE_ENERGY_MELEE_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_ENERGY_MELEE_POWERSET = BRUTE_ENERGY_MELEE_POWERSET;
+}
+
+// ---- js/data/powersets/brute/fiery-aura.js ----
+;/**
+ * Fiery Aura
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_FIERY_AURA_POWERSET = {
+    name: "Fiery Aura",
+    category: "Unknown",
+    description: "Fiery Aura powerset",
+    icon: "fiery-aura_set.png",
+    powers: [
+        {
+            name: "Blazing Aura",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "While active, you are surrounded by flames that burn all foes that attempt to enter melee range.<br><br><color #fcfc95>Damage: Minor(DoT).</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: PBAoE, DoT (Fire)",
+            icon: "flamingshield_fieryaura.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 1.04,
+                cast: 2.03,
+                damage: {
+                    type: "Fire",
+                    scale: 0.319
+                }
+            }
+        },
+        {
+            name: "Fire Shield",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "While this power is active, Fire Shield gives you good resistance to Lethal, Smashing and Fire damage. Fire Shield also provides minimal resistance to Cold damage as well as protection from Disorient effects.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Toggle: Self +Res(Fire, Lethal, Smash, Cold, Disorient)",
+            icon: "flamingshield_flamingshield.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 1.67,
+                protection: {
+                    stun: 10.379999999999999
+                },
+                resistance: {
+                    smashing: 0.22499999999999998,
+                    lethal: 0.22499999999999998,
+                    fire: 0.22499999999999998,
+                    cold: 0.075
+                },
+                buffDuration: 0.75,
+                stun: 1.0,
+                stunDuration: 0.75
+            }
+        },
+        {
+            name: "Phoenix Rising",
+            available: 0,
+            tier: 1,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "If you are defeated, you can rise from the ashes. The fiery resurrection blasts nearby foes with an explosion and knocks them down and Disorients them. You will revive with about half of your Hit Points and Endurance. Gift of the Phoenix will leave you invulnerable for a brief time, and protected from XP Debt for 90 seconds.<br><br>You can also use this power even if you have not been defeated, with weakend effects. The closer you are to being defeated, the stronger the effects will be. You need to be under 75% health to activate this power.",
+            shortHelp: "Self Rez, Special",
+            icon: "flamingshield_temperatureprotection.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                buffDuration: 0.5
+            }
+        },
+        {
+            name: "Healing Flames",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing", "Resist Damage"],
+            description: "You can concentrate for a few moments to heal yourself. The power of the flames can also protect you from Toxic Damage for a while.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Self Heal, +Res(Toxic)",
+            icon: "flamingshield_healingflames.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 40.0,
+                endurance: 10.4,
+                cast: 0.73,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 2.0,
+                    ticks: 30
+                },
+                resistance: {
+                    toxic: 0.15
+                },
+                healing: {
+                    scale: 374.81375,
+                    perTarget: true
+                },
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Temperature Protection",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "Temperature Protection gives you strong resistance to Fire damage, some resistance to Cold damage and slow effects, and grants minor, unenhanceable regeneration as well as provide very minor Knockback Protection. This power is always on and costs no Endurance.",
+            shortHelp: "Auto: Self +Res(Fire, Cold, Slow, Knock), +Regen",
+            icon: "flamingshield_temperatureprotection.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 3.0,
+                            ticks: 5
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.0,
+                            ticks: 5
+                        }
+                    ]
+                },
+                resistance: {
+                    cold: 0.075,
+                    fire: 0.22499999999999998
+                },
+                debuffResistance: {
+                    recharge: 0.2,
+                    movement: 0.2
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Plasma Shield",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "While this power is active, you are surrounded by pure plasma. The Plasma Shield gives you resistance to Energy, Negative Energy, and Fire damage. Plasma Shield also gives your protection from Sleep and Hold effects.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Toggle: Self +Res(Energy, Negative, Fire, Hold, Sleep)",
+            icon: "flamingshield_plasmasheild.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 3.0,
+                protection: {
+                    hold: 10.379999999999999,
+                    sleep: 10.379999999999999
+                },
+                resistance: {
+                    fire: 0.22499999999999998,
+                    energy: 0.22499999999999998,
+                    negative: 0.22499999999999998,
+                    psionic: 0.22499999999999998
+                },
+                debuffResistance: {
+                    tohit: 0.3,
+                    defense: 0.3,
+                    recharge: 0.3,
+                    movement: 0.5
+                },
+                buffDuration: 0.75,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Consume",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Endurance Modification", "Healing", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You can drain body heat from all nearby foes, and even from the air itself, increasing your health, resistance against endurance drain, as well as replenishing your own Endurance. The more foes affected, the more Endurance is gained. Foes suffer minimal Fire damage.<br><br>HP and End Drain resistance do not scale with enemy count, but will be granted even if there are no enemies nearby.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE, DMG(Fire), Self +End, +Max HP",
+            icon: "flamingshield_consume.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 180.0,
+                endurance: 0.52,
+                cast: 2.03,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Burn",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You can ignite the ground beneath you, freeing yourself from Immobilization effects. Foes that enter the flames you leave behind will take damage. You must be near the ground to activate this power.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Location (PBAoE), DoT (Fire), Self Res(Immobilize)",
+            icon: "flamingshield_burn.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                recharge: 25.0,
+                endurance: 5.2,
+                cast: 2.03,
+                damage: {
+                    type: "Fire",
+                    scale: 1.44
+                }
+            }
+        },
+        {
+            name: "Fiery Embrace",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "Fiery Embrace causes all your damaging powers to do bonus fire damage.<br><br>In PvP, this power significantly boosts the damage of all your Fire attacks for quite a while. Also increases the damage of all your other non-fire based attacks for a short while.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +DMG",
+            icon: "flamingshield_fieryembrace.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 180.0,
+                endurance: 7.8,
+                cast: 0.73,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Phoenix Rising",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge", "Damage"],
+            allowedSetCategories: ["Brute Archetype Sets", "Endurance Modification", "Healing", "Melee AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "If you are defeated, you can rise from the ashes. The fiery resurrection blasts nearby foes with an explosion and knocks them down and Disorients them. You will revive with about half of your Hit Points and Endurance. Gift of the Phoenix will leave you invulnerable for a brief time, and protected from XP Debt for 90 seconds.<br><br>You can also use this power even if you have not been defeated, with weakend effects. The closer you are to being defeated, the stronger the effects will be. You need to be under 75% health to activate this power.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Self Rez, Special",
+            icon: "flamingshield_riseofthephoenix.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 300.0,
+                cast: 2.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/fiery-aura'] = BRUTE_FIERY_AURA_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_FIERY_AURA_POWERSET = BRUTE_FIERY_AURA_POWERSET;
+}
+
+// ---- js/data/powersets/brute/fiery-melee.js ----
+;/**
+ * Fiery Melee
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_FIERY_MELEE_POWERSET = {
+    name: "Fiery Melee",
+    category: "Unknown",
+    description: "Fiery Melee powerset",
+    icon: "fiery-melee_set.png",
+    powers: [
+        {
+            name: "Fire Sword",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "Through concentration, you can create a Sword of Fire that sets foes ablaze. Successful attacks from the Fire Sword will cut through your target defenses and ignite them, dealing damage over time.",
+            shortHelp: "Melee, DMG(Fire), -Defense",
+            icon: "fieryfray_firesword.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.33,
+                damage: {
+                    type: "Fire",
+                    scale: 2.891
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.1,
+                    ticks: 3
+                },
+                buffDuration: 3.1,
+                defenseDebuff: 0.5
+            }
+        },
+        {
+            name: "Scorch",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "This power engulfs your hands in flames, and can ignite the target of your Scorching attack. Once on fire, the target will suffer damage over time.",
+            shortHelp: "Melee, DMG(Fire)",
+            icon: "fieryfray_targetedlightmelee.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 1.0,
+                damage: {
+                    type: "Fire",
+                    scale: 2.06
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.1,
+                    ticks: 2
+                },
+                buffDuration: 2.1
+            }
+        },
+        {
+            name: "Cremate",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "A slow but devastating attack. Cremate clobbers your foes with a massive 2 handed fiery smash knocks down and leaves your foe on fire.",
+            shortHelp: "Melee, DMG(Fire), Knockup",
+            icon: "fieryfray_scorch.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.5,
+                damage: {
+                    type: "Fire",
+                    scale: 3.41
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.1,
+                    ticks: 3
+                },
+                buffDuration: 3.1
+            }
+        },
+        {
+            name: "Build Up",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your chance to hit.",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "fieryfray_followup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Incinerate",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "Intense concentration can allow you to Incinerate an opponent. This will set your foe ablaze, dealing very high damage over a short time.",
+            shortHelp: "Melee, DoT (Fire)",
+            icon: "fieryfray_incinerate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 10.0,
+                endurance: 6.864,
+                cast: 1.67,
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.44689999999999996,
+                    ticks: 9
+                },
+                buffDuration: 4.6
+            }
+        },
+        {
+            name: "Taunt",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Taunt foes to attack you. Useful to pull enemies off allies and keep them attacking you to raise your Fury. A To Hit check is required to Taunt enemy players, but is not needed against critter targets.",
+            shortHelp: "Ranged (Targeted AoE), Foe Taunt",
+            icon: "fieryfray_willowisp.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 10.0,
+                cast: 1.67,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Breath of Fire",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "This allows you to spew forth fire from your mouth, burning all foes within its narrow cone. This is a very accurate attack that can deal good damage at a close range.",
+            shortHelp: "Close (Cone) DoT (Fire)",
+            icon: "fieryfray_breathingfire.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.2,
+                range: 15.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 2.67,
+                dotDamage: {
+                    type: "Fire",
+                    scale: 1.8491,
+                    ticks: 1
+                },
+                buffDuration: 0.6
+            }
+        },
+        {
+            name: "Fire Sword Circle",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "Mastery of your Fire Sword has enabled you to make an attack on every foe within melee distance. This will slash burn and cut through the defenses of your enemies, dealing moderate damage and setting them ablaze.",
+            shortHelp: "PBAoE Melee, DMG(Fire), -Defense",
+            icon: "fieryfray_fireswordcircle.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 2.67,
+                damage: {
+                    type: "Fire",
+                    scale: 2.6516
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.1,
+                    ticks: 3
+                },
+                buffDuration: 3.1,
+                defenseDebuff: 0.5
+            }
+        },
+        {
+            name: "Greater Fire Sword",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "Your mastery of fire allows you to create an enhanced Sword of Fire that can set foes ablaze and cut through their defenses. Successful attacks from the Greater Fire Sword will ignite your target, dealing damage over time.",
+            shortHelp: "Melee, DMG(Fire), -Defense",
+            icon: "fieryfray_greaterfiresword.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 12.0,
+                endurance: 12.688,
+                cast: 1.37,
+                damage: {
+                    type: "Fire",
+                    scale: 4.279
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.2,
+                    ticks: 4
+                },
+                buffDuration: 4.1,
+                defenseDebuff: 0.5
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/fiery-melee'] = BRUTE_FIERY_MELEE_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_FIERY_MELEE_POWERSET = BRUTE_FIERY_MELEE_POWERSET;
+}
+
+// ---- js/data/powersets/brute/ice-armor.js ----
+;/**
+ * Ice Armor
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_ICE_ARMOR_POWERSET = {
+    name: "Ice Armor",
+    category: "Unknown",
+    description: "Ice Armor powerset",
+    icon: "ice-armor_set.png",
+    powers: [
+        {
+            name: "Frozen Armor",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "While this power is active, you coat yourself in rock hard Frozen Armor. The hardness of the Frozen Armor offers good defense to Smashing and Lethal attack as well as reduces Cold damage. Also, Fire attacks deal slightly less damage and you can resist Defense DeBuffs.",
+            shortHelp: "Self, +Def(Smash, Lethal), +Res(Cold, Fire, DeBuff DEF)",
+            icon: "icearmor_icearmor.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.73,
+                defense: {
+                    smashing: 0.1275,
+                    lethal: 0.1275
+                },
+                resistance: {
+                    cold: 0.22499999999999998,
+                    fire: 0.09375
+                },
+                debuffResistance: {
+                    defense: 0.1384
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Hoarfrost",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing", "Resist Damage"],
+            description: "Activating this power covers you in a thick layer of Hoarfrost. The frost can absorb the impact from enemy attacks, effectively increasing your maximum Hit Points for a short time. Hoarfrost also grants you resistance to Toxic Damage.<br><br>This power is mutually exclusive from Rime",
+            shortHelp: "Self Heal, +Max HP, Res(Toxic)",
+            icon: "icearmor_hp.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 360.0,
+                endurance: 14.56,
+                cast: 0.73,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 2.0,
+                    ticks: 60
+                },
+                resistance: {
+                    toxic: 0.15
+                },
+                healing: {
+                    scale: 599.702,
+                    perTarget: true
+                },
+                buffDuration: 120.0
+            }
+        },
+        {
+            name: "Rime",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing", "Resist Damage"],
+            description: "Activating this power covers you in a thick layer of rime. The rime can absorb the impact of a limited number of enemy attacks, the lingering moisture increasing your regeneration rate. Rime also grants you resistance to Toxic Damage.<br><br>This power is mutually exclusive from Hoarfrost",
+            shortHelp: "Self +Regen, +Absorb, Res(Toxic)",
+            icon: "icearmor_rime.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 10.4,
+                cast: 0.73,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 2.0,
+                    ticks: 30
+                },
+                resistance: {
+                    toxic: 0.15
+                },
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Chilling Embrace",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Slow Movement", "Threat Duration"],
+            description: "While active, you dramatically lower the temperature around yourself, Slowing the attack rate of all nearby foes, as well as their movement speed and damage.",
+            shortHelp: "Toggle: PBAoE, Foe -Recharge, -Speed, -DMG",
+            icon: "icearmor_chillingembrace.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.73,
+                buffDuration: 5.0
+            }
+        },
+        {
+            name: "Wet Ice",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "When you activate this power, you cover yourself in a thick coating of slick, melting ice. This makes you slippery, leaving you nearly immune to Disorient, Immobilization, Hold, Sleep, Slow and Knockback effects. This power also adds a slight increase to your defense to all attacks. Wet Ice also reduces Cold damage and grants you resistance to Defense DeBuffs.",
+            shortHelp: "Self, +DEF(All), +Res(Cold, Disorient, Immobilize, Hold, Sleep, Slow, Knockback, DeBuff DEF)",
+            icon: "icearmor_wetice.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.73,
+                protection: {
+                    hold: 10.379999999999999,
+                    stun: 10.379999999999999,
+                    sleep: 10.379999999999999,
+                    immobilize: 10.379999999999999
+                },
+                defense: {
+                    smashing: 0.0075,
+                    lethal: 0.0075,
+                    fire: 0.0075,
+                    cold: 0.0075,
+                    energy: 0.0075,
+                    negative: 0.0075,
+                    psionic: 0.0075,
+                    toxic: 0.0075
+                },
+                resistance: {
+                    cold: 0.22499999999999998
+                },
+                debuffResistance: {
+                    recharge: 0.6,
+                    movement: 0.6,
+                    tohit: 0.3,
+                    defense: 0.3
+                },
+                buffDuration: 0.75,
+                stun: 1.0,
+                stunDuration: 0.75,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Glacial Armor",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "When you activate this power you cover yourself in Glacial ice. The crystalline matrix of the armor has refracting properties that make Energy and Negative Energy attacks less likely to land, and acts as a lens to increase your Perception to see hidden foes. The bitter cold of Glacial Armor also reduces Cold damage and also you to resist Defense DeBuffs.",
+            shortHelp: "Toggle: Self +DEF(Energy, Negative), Res (Cold, DeBuff DEF), +Perception",
+            icon: "icearmor_glacialarmor.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 2.03,
+                defense: {
+                    energy: 0.1275,
+                    negative: 0.1275,
+                    psionic: 0.1275
+                },
+                resistance: {
+                    cold: 0.22499999999999998
+                },
+                debuffResistance: {
+                    defense: 0.1384
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Energy Absorption",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Endurance Modification", "Threat Duration"],
+            description: "Activating this power draws moisture directly from the bodies of all nearby foes, draining their Endurance. Each foe you draw moisture from adds to your own Endurance as well as Defense to all attacks. The first foe you absorb grants the highest Defense bonus, and you can absorb up to 10 foes. In addition to Defense, Energy Absorption also grants you resistance to Slow effects. If there are no foes within range, this power will fail.",
+            shortHelp: "PBAoE, Self +End, +DEF(All), Res (Slow), Foe -End",
+            icon: "icearmor_energyabsorption.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 60.0,
+                endurance: 13.0,
+                cast: 1.33
+            }
+        },
+        {
+            name: "Permafrost",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "Your body temperature permanently lowers to 33 degrees Fahrenheit. Permafrost gives you strong resistance to Cold damage, some resistance to Fire damage and minor Smashing, Lethal, Energy, Negative Energy, Toxic and Psionic resistance as well. You also gain an inherent resistance to Slow effects. This power is always on and does not cost Endurance.",
+            shortHelp: "Auto: Self +Res(All damage, Slow)",
+            icon: "icearmor_permafrost.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 3.0,
+                            ticks: 5
+                        },
+                        {
+                            type: "Fire",
+                            scale: 1.25,
+                            ticks: 5
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.5,
+                            ticks: 5
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 0.5,
+                            ticks: 5
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.5,
+                            ticks: 5
+                        },
+                        {
+                            type: "Negative",
+                            scale: 0.5,
+                            ticks: 5
+                        },
+                        {
+                            type: "Psionic",
+                            scale: 0.5,
+                            ticks: 5
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 0.5,
+                            ticks: 5
+                        }
+                    ]
+                },
+                resistance: {
+                    cold: 0.22499999999999998,
+                    fire: 0.09375,
+                    smashing: 0.0375,
+                    lethal: 0.0375,
+                    energy: 0.0375,
+                    negative: 0.0375,
+                    psionic: 0.0375,
+                    toxic: 0.0375
+                },
+                debuffResistance: {
+                    recharge: 0.2,
+                    movement: 0.2
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Icicles",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "While active, you form sharp icicles on your body that continuously cut all foes that attempt to enter melee range.",
+            shortHelp: "Toggle: PBAoE, DoT(Cold)",
+            icon: "icearmor_icicles.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 1.04,
+                cast: 1.67,
+                damage: {
+                    type: "Cold",
+                    scale: 0.2
+                }
+            }
+        },
+        {
+            name: "Icy Bastion",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing", "Resist Damage"],
+            description: "You encase yourself in a block of solid ice, rendering yourself invulnerable but unable to act. While the power is active you heal damage and recover endurance at an incredible rate. You can remain in this state for up to 30 seconds. Should you deactivate the power earlier, some of the resistance to damage and other effects will remain until the full 30 seconds window is over. <br><br><color #fcfc95>Notes:If you are under the effects of No Phase, this power will instantly deactivate and leave you only with the lingering effects for 30 seconds.</color>",
+            shortHelp: "Toggle: Self +Res(All DMG, but Psionics), +Res(Knockback, Repel, Disorient, Hold, Immobilize, Sleep), +Regen, +Recovery, Invulnerable; Self Hold",
+            icon: "icearmor_hybernate.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 300.0,
+                endurance: 0.1085
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/ice-armor'] = BRUTE_ICE_ARMOR_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_ICE_ARMOR_POWERSET = BRUTE_ICE_ARMOR_POWERSET;
+}
+
+// ---- js/data/powersets/brute/ice-melee.js ----
+;/**
+ * Ice Melee
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_ICE_MELEE_POWERSET = {
+    name: "Ice Melee",
+    category: "Unknown",
+    description: "Ice Melee powerset",
+    icon: "ice-melee_set.png",
+    powers: [
+        {
+            name: "Frozen Fists",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Slow Movement", "Threat Duration", "Universal Damage Sets"],
+            description: "Frozen Fists encrusts your hands in ice, giving them the ability to quickly inflict minor damage on villains. The foe's attack and movement speed is Slowed, due to the chills caused by the cold blows.",
+            shortHelp: "Melee, DMG(Cold/Smash), Foe -Recharge, -SPD",
+            icon: "icyonslaught_frozenfist.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 1.33,
+                damage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 1.1027
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.3482
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.225
+                        }
+                    ],
+                    scale: 1.6759
+                },
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 0.4,
+                            ticks: 1
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.1,
+                            ticks: 1
+                        }
+                    ]
+                },
+                buffDuration: 0.3
+            }
+        },
+        {
+            name: "Ice Sword",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Slow Movement", "Threat Duration", "Universal Damage Sets"],
+            description: "You create a blade of solid ice that deals good damage. Being hit by this Ice Sword will Slow a target's movement and attack speed, due to the intense chill.",
+            shortHelp: "Melee, DMG(Cold/Lethal), Foe -Recharge, -SPD",
+            icon: "icyonslaught_icesword.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.33,
+                damage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 1.794
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 1.097
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.594
+                        }
+                    ],
+                    scale: 3.485
+                },
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Frost",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Ranged AoE Damage", "Slow Movement", "Threat Duration", "Universal Damage Sets"],
+            description: "You create a short cone of Frost in front of you that can deal some damage and Slow a foe's speed, due to their uncontrollable shivering.",
+            shortHelp: "Close (Cone), DoT(Cold), Foe -Recharge, -SPD",
+            icon: "icyonslaught_frost.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.0,
+                range: 10.0,
+                recharge: 11.0,
+                endurance: 11.024,
+                cast: 2.27,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 0.5575,
+                            ticks: 5
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.1215,
+                            ticks: 5
+                        }
+                    ]
+                },
+                buffDuration: 1.1
+            }
+        },
+        {
+            name: "Build Up",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your Accuracy.",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "icyonslaught_followup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Ice Patch",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "You emanate a Patch of Ice around you. Foes that step onto the Ice Patch will slip and fall down. This effect lasts until the ice melts. You must be near the ground to activate this power.",
+            shortHelp: "Location (PBAoE), Foe Knockdown",
+            icon: "icyonslaught_icepatch.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 2.0,
+                recharge: 35.0,
+                endurance: 10.4,
+                cast: 1.57,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Taunt",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Taunt foes to attack you. Useful to pull enemies off allies and keep them attacking you to raise your Fury. A To Hit check is required to Taunt enemy players, but is not needed against critter targets.",
+            shortHelp: "Ranged (Targeted AoE), Foe Taunt",
+            icon: "icyonslaught_taunt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 10.0,
+                cast: 1.67,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Greater Ice Sword",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Slow Movement", "Threat Duration", "Universal Damage Sets"],
+            description: "Your mastery of Ice allows you to create an enhanced blade of solid ice that deals above average damage. Being hit by the Greater Ice Sword will Slow a villain's attack and movement speed, due to the intense chill.",
+            shortHelp: "Melee, DMG(Cold/Lethal), Foe -Recharge, -SPD",
+            icon: "icyonslaught_greatericesword.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 2.33,
+                damage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 2.2398
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 2.1512000000000002
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.882
+                        }
+                    ],
+                    scale: 5.273
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Freezing Touch",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Holds", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "This Freezing Touch will encase a single foe in a block of ice. This will deal high damage over time, as well as freezing him in his tracks, leaving him cold and helpless.",
+            shortHelp: "Melee, DoT(Cold), Foe Hold",
+            icon: "icyonslaught_freezingtouch.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 16.0,
+                endurance: 10.192,
+                cast: 1.0,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 0.4232,
+                            ticks: 10
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.1193,
+                            ticks: 10
+                        }
+                    ]
+                },
+                buffDuration: 2.6
+            }
+        },
+        {
+            name: "Frozen Aura",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee AoE Damage", "Sleep", "Threat Duration", "Universal Damage Sets"],
+            description: "Your mastery of cold enables you to dramatically lower the temperature immediately around you. When you perform a Frozen Aura, nearby foes will be frozen within a fragile casing of ice and suffer a moderate amount of cold damage. These frozen foes will break free if attacked. Frozen Aura deals moderate damage.<br><br><color #fcfc95>Notes: The Sleep component of this power is Auto Hit against regular enemies, but a To Hit check is required to against AVs and players, as well as to make secondary effects apply.</color>",
+            shortHelp: "PBAoE, DMG(Cold), Foe Sleep",
+            icon: "icyonslaught_frozenaura.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 2.1,
+                damage: {
+                    type: "Cold",
+                    scale: 1.5257
+                }
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/ice-melee'] = BRUTE_ICE_MELEE_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_ICE_MELEE_POWERSET = BRUTE_ICE_MELEE_POWERSET;
+}
+
+// ---- js/data/powersets/brute/invulnerability.js ----
+;/**
+ * Invulnerability
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_INVULNERABILITY_POWERSET = {
+    name: "Invulnerability",
+    category: "Unknown",
+    description: "Invulnerability powerset",
+    icon: "invulnerability_set.png",
+    powers: [
+        {
+            name: "Resist Physical Damage",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You are naturally tough and inherently resistant to Smashing and Lethal damage as well as Defense Debuff effects. This power is always on, and costs no Endurance.",
+            shortHelp: "Auto: Self +Res (Smash, Lethal, DeBuff DEF)",
+            icon: "invulnerability_restophysicaldmg.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 1.0,
+                            ticks: 5
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 1.0,
+                            ticks: 5
+                        }
+                    ]
+                },
+                resistance: {
+                    smashing: 0.075,
+                    lethal: 0.075
+                },
+                debuffResistance: {
+                    defense: 0.25
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Temp Invulnerability",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "When you toggle on this power, you become highly resistant to Smashing and Lethal damage.",
+            shortHelp: "Toggle: Self +Res(Smash, Lethal)",
+            icon: "invulnerability_temporaryinvulnerabilty.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.67,
+                resistance: {
+                    smashing: 0.22499999999999998,
+                    lethal: 0.22499999999999998,
+                    psionic: 0.22499999999999998
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Dull Pain",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You can activate this power to increase your maximum Hit Points for a short time.",
+            shortHelp: "Self Heal, +Max HP",
+            icon: "invulnerability_dullpain.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 360.0,
+                endurance: 10.4,
+                cast: 0.73,
+                healing: {
+                    scale: 599.702,
+                    perTarget: true
+                },
+                buffDuration: 120.0
+            }
+        },
+        {
+            name: "Resist Elements",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You are naturally resistant to the elements and always take less Fire, Cold and Toxic Damage. You are also resistant to Slow effects. This power is always on and costs no Endurance.",
+            shortHelp: "Auto: Self +Res(Fire, Cold, Toxic, Slow)",
+            icon: "invulnerability_restospecialdmg.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 1.0,
+                            ticks: 5
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.0,
+                            ticks: 5
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 1.0,
+                            ticks: 5
+                        }
+                    ]
+                },
+                resistance: {
+                    fire: 0.075,
+                    cold: 0.075,
+                    toxic: 0.075
+                },
+                debuffResistance: {
+                    recharge: 0.2,
+                    movement: 0.2
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Unyielding",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "When you toggle on this power, you become Unyielding. You are resistant to all damage, as well as Knockback, Sleep, Hold, Immobilize, Disorient effects.",
+            shortHelp: "Toggle: Self +Res(All DMG; Knockback, Sleep, Disorient, Hold, Immobilize)",
+            icon: "invulnerability_unyeildlingstance.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.13,
+                cast: 2.33,
+                protection: {
+                    hold: 10.379999999999999,
+                    stun: 10.379999999999999,
+                    sleep: 10.379999999999999,
+                    immobilize: 10.379999999999999
+                },
+                resistance: {
+                    smashing: 0.0375,
+                    lethal: 0.0375,
+                    psionic: 0.0375,
+                    fire: 0.075,
+                    cold: 0.075,
+                    energy: 0.075,
+                    negative: 0.075,
+                    toxic: 0.075
+                },
+                debuffResistance: {
+                    tohit: 0.3,
+                    defense: 0.3,
+                    recharge: 0.3,
+                    movement: 0.5
+                },
+                buffDuration: 0.75,
+                stun: 1.0,
+                stunDuration: 0.75,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Resist Energies",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You are naturally resistant to Psionic, Energy and Negative Energy damage, as well as Debuff effects which reduce your endurance or recovery. This power is always on and costs no Endurance.",
+            shortHelp: "Auto: Self +Res (Energy, Negative, Endurance, Psionic)",
+            icon: "invulnerability_restocosmicdmag.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 1.0,
+                            ticks: 5
+                        },
+                        {
+                            type: "Negative",
+                            scale: 1.0,
+                            ticks: 5
+                        },
+                        {
+                            type: "Psionic",
+                            scale: 1.0,
+                            ticks: 5
+                        }
+                    ]
+                },
+                resistance: {
+                    energy: 0.075,
+                    negative: 0.075,
+                    psionic: 0.075
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Invincibility",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Threat Duration", "To Hit Buff"],
+            description: "While this power is active, for each nearby foe in melee range you receive a bonus to Defense against all attacks and a bonus to your chance to hit. This power is most effective while fighting multiple opponents. The first foe you engage in melee grants the highest Defense bonus, and up to 10 foes can contribute to you Defense and ToHit Bonus.",
+            shortHelp: "Toggle: Self +DEF(All), +To Hit",
+            icon: "invulnerability_invincibility.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.208,
+                cast: 3.0,
+                defense: {
+                    smashing: 0.0375,
+                    lethal: 0.0375,
+                    fire: 0.0375,
+                    cold: 0.0375,
+                    energy: 0.0375,
+                    negative: 0.0375,
+                    psionic: 0.012502499999999998,
+                    toxic: 0.012502499999999998
+                },
+                tohitBuff: 0.2,
+                buffDuration: 1.0
+            }
+        },
+        {
+            name: "Tough Hide",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Your thickened skin makes you much tougher to hit and resistant to Defense Debuff effects. This power is always on and costs no Endurance. Tough Hide offers no protection to Psionic Attacks.",
+            shortHelp: "Auto: Self +DEF(All but Psionics), +RES (Debuff DEF)",
+            icon: "invulnerability_toughhide.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                defense: {
+                    smashing: 0.0375,
+                    lethal: 0.0375,
+                    fire: 0.0375,
+                    cold: 0.0375,
+                    energy: 0.0375,
+                    negative: 0.0375,
+                    psionic: 0.0375,
+                    toxic: 0.0375
+                },
+                debuffResistance: {
+                    defense: 0.25
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Unstoppable",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "When you activate this power, you not only become extremely resistant to most damage, but also to Disorient, Immobilization, Hold, Knockback and Sleep effects. Endurance recovery is also increased. Unstoppable costs little Endurance to activate, but when it wears off you are left exhausted, and drained of almost all Health and Endurance.",
+            shortHelp: "Self, +Res(Disorient, Sleep, Hold, Immobilize, Knockback, All DMG)",
+            icon: "invulnerability_unstoppable.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 1000.0,
+                endurance: 2.6,
+                cast: 3.1,
+                dotDamage: {
+                    type: "Psionic",
+                    scale: 4.5,
+                    ticks: 90
+                },
+                protection: {
+                    hold: 17.299999999999997,
+                    stun: 17.299999999999997,
+                    sleep: 17.299999999999997,
+                    immobilize: 17.299999999999997
+                },
+                resistance: {
+                    smashing: 0.525,
+                    lethal: 0.525,
+                    fire: 0.525,
+                    cold: 0.525,
+                    energy: 0.525,
+                    negative: 0.525,
+                    toxic: 0.525,
+                    psionic: 0.33749999999999997
+                },
+                buffDuration: 180.0,
+                stun: 1.0,
+                stunDuration: 180.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/invulnerability'] = BRUTE_INVULNERABILITY_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_INVULNERABILITY_POWERSET = BRUTE_INVULNERABILITY_POWERSET;
+}
+
+// ---- js/data/powersets/brute/katana.js ----
+;/**
+ * Katana
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_KATANA_POWERSET = {
+    name: "Katana",
+    category: "Unknown",
+    description: "Katana powerset",
+    icon: "katana_set.png",
+    powers: [
+        {
+            name: "Gambler's Cut",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You perform a quick slash with your katana. This attack is very fast, but deals only minor damage. This attack can reduce a target's Defense, making them easier to hit.",
+            shortHelp: "Melee, DMG(Lethal), Foe -Def",
+            icon: "katana_slash.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 0.67,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 0.9145,
+                            ticks: 1
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.189,
+                            ticks: 1
+                        }
+                    ]
+                },
+                buffDuration: 0.3,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Sting of the Wasp",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You perform a standard attack with your katana. This attack is slower than Gambler's Cut, but deals more damage. Sting of the Wasp can reduce a target's Defense, making them easier to hit.",
+            shortHelp: "Melee, DMG(Lethal), Foe -Def",
+            icon: "katana_hack.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 5.0,
+                endurance: 6.032,
+                cast: 1.17,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 2.5789999999999997
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.522
+                        }
+                    ],
+                    scale: 3.101
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Flashing Steel",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You swing your katana in a wide arc in front of you, slicing multiple foes. This attack can reduce a target's Defense, making them easier to hit.",
+            shortHelp: "Melee (Cone), DMG(Lethal), Foe -Def",
+            icon: "katana_slice.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 2.2689,
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 6.0,
+                endurance: 6.032,
+                cast: 1.17,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 2.0884
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.4455
+                        }
+                    ],
+                    scale: 2.5339
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Build Up",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your chance to hit.",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "katana_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Divine Avalanche",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Defense Sets", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You can use your katana to parry incoming melee attacks and then quickly return the favor. Divine Avalanche does minor damage, but every successful hit will increase your Defense against melee and lethal attacks for a short while.",
+            shortHelp: "Melee, DMG(Lethal), Self +DEF (Melee, Lethal)",
+            icon: "katana_parry.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 1.33,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 2.291
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.378
+                        }
+                    ],
+                    scale: 2.669
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Dragon's Roar",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Taunt foes to attack you. Useful to pull enemies off allies and keep them attacking you to raise your Fury. A To Hit check is required to Taunt enemy players, but is not needed against critter targets.",
+            shortHelp: "Ranged (Targeted AoE), Foe Taunt",
+            icon: "katana_tauntaoe.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 10.0,
+                cast: 1.67,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "The Lotus Drops",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You perform The Lotus Drops maneuver, attacking all foes in melee range. This attack wounds your opponents, causing them to take moderate damage over time and reduces their Defense.",
+            shortHelp: "PBAoE Melee, Moderate DMG(Lethal), Foe -Def",
+            icon: "katana_whirlingsword.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.05,
+                recharge: 14.0,
+                endurance: 13.0,
+                cast: 1.83,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 2.2805
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.45
+                        }
+                    ],
+                    scale: 2.7305
+                },
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 0.12,
+                            ticks: 2
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.054,
+                            ticks: 2
+                        }
+                    ]
+                },
+                buffDuration: 2.1,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Soaring Dragon",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Knockback", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You perform a powerful Soaring Dragon maneuver that deals a great amount of damage, and can knock a target up into the air. This attack can reduce a target's Defense, making them easier to hit.",
+            shortHelp: "Melee, DMG(Lethal), Foe Knockup, -DEF",
+            icon: "katana_disembowel.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 9.0,
+                endurance: 9.36,
+                cast: 1.33,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 3.491
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.81
+                        }
+                    ],
+                    scale: 4.301
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Golden Dragonfly",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Knockback", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You perform a devastating Golden Dragonfly attack that deals a massive amount of damage and can even knock a foe down to the ground and reduce their Defense. The power of this attack can actually extend a short distance through multiple foes.",
+            shortHelp: "Melee, DMG(Lethal), Foe Knockback, -DEF",
+            icon: "katana_headsplitter.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 0.3491,
+            effects: {
+                accuracy: 1.05,
+                range: 10.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 1.83,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 4.441
+                        },
+                        {
+                            type: "Fire",
+                            scale: 1.026
+                        }
+                    ],
+                    scale: 5.467
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 10.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/katana'] = BRUTE_KATANA_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_KATANA_POWERSET = BRUTE_KATANA_POWERSET;
+}
+
+// ---- js/data/powersets/brute/kinetic-attack.js ----
+;/**
+ * Kinetic Attack
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_KINETIC_ATTACK_POWERSET = {
+    name: "Kinetic Attack",
+    category: "Unknown",
+    description: "Kinetic Attack powerset",
+    icon: "kinetic-attack_set.png",
+    powers: [
+        {
+            name: "Body Blow",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "A much more powerful, yet slower version of Quick Strike. Body Blow is capable of stunning an opponent occasionally.",
+            shortHelp: "Melee, DMG(Smash/Energy), Foe Disorient",
+            icon: "kineticattack_bodyblow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 5.0,
+                endurance: 6.032,
+                cast: 1.07,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 1.8143
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.6947
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.522
+                        }
+                    ],
+                    scale: 3.031
+                },
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 0.85,
+                            ticks: 2
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 0.85,
+                            ticks: 2
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.85,
+                            ticks: 2
+                        },
+                        {
+                            type: "Cold",
+                            scale: 0.85,
+                            ticks: 2
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.85,
+                            ticks: 2
+                        },
+                        {
+                            type: "Negative",
+                            scale: 0.85,
+                            ticks: 2
+                        }
+                    ]
+                },
+                stun: 3.0,
+                buffDuration: 5.0
+            }
+        },
+        {
+            name: "Quick Strike",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "A quick attack that sometimes knock foes down. Fast, but low damage.",
+            shortHelp: "Melee, DMG(Smash/Energy), Foe -DMG, Knockdown",
+            icon: "kineticattack_quickstrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 0.83,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 1.4007
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.5403
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.378
+                        }
+                    ],
+                    scale: 2.319
+                },
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 0.85,
+                            ticks: 2
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 0.85,
+                            ticks: 2
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.85,
+                            ticks: 2
+                        },
+                        {
+                            type: "Cold",
+                            scale: 0.85,
+                            ticks: 2
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.85,
+                            ticks: 2
+                        },
+                        {
+                            type: "Negative",
+                            scale: 0.85,
+                            ticks: 2
+                        }
+                    ]
+                },
+                buffDuration: 4.0
+            }
+        },
+        {
+            name: "Smashing Blow",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "Smashing Blow is a slow attack, but makes up for it with a good amount of damage. Has a greater chance to stun than body blow.",
+            shortHelp: "Melee, DMG(Smash/Energy), Foe Disorient",
+            icon: "kineticattack_smashingblow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 7.0,
+                endurance: 7.696,
+                cast: 1.2,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.064
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.9359999999999999
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.666
+                        }
+                    ],
+                    scale: 3.666
+                },
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 0.85,
+                            ticks: 2
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 0.85,
+                            ticks: 2
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.85,
+                            ticks: 2
+                        },
+                        {
+                            type: "Cold",
+                            scale: 0.85,
+                            ticks: 2
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.85,
+                            ticks: 2
+                        },
+                        {
+                            type: "Negative",
+                            scale: 0.85,
+                            ticks: 2
+                        }
+                    ]
+                },
+                stun: 3.0,
+                buffDuration: 5.0
+            }
+        },
+        {
+            name: "Power Siphon",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Power Siphon adds a small bonus to hit and modifies your other Kinetic Attack powers, so they are now capable of draining the strength of your enemies and adding that strength to you. This effect will stack up to 5 times.",
+            shortHelp: "Self: +ToHit, +Special",
+            icon: "kineticattack_powersiphon.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                recharge: 120.0,
+                endurance: 5.2,
+                cast: 1.93,
+                buffDuration: 20.0,
+                tohitBuff: 0.75
+            }
+        },
+        {
+            name: "Repulsing Torrent",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Ranged AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "Repulsing Torrent unleashes a cone of powerful energy that can smash foes and possibly send them flying.",
+            shortHelp: "Ranged (Cone), DMG(Energy/Smash), Foe Knockback",
+            icon: "kineticattack_repulsingtorrent.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.7854,
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 2.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 1.5434999999999999
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.5145
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.495
+                        }
+                    ],
+                    scale: 2.553
+                }
+            }
+        },
+        {
+            name: "Taunt",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Taunt foes to attack you. Useful to pull enemies off allies and keep them attacking you to raise your Fury. A To Hit check is required to Taunt enemy players, but is not needed against critter targets.",
+            shortHelp: "Ranged (Targeted AoE), Foe Taunt",
+            icon: "kineticattack_taunt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 10.0,
+                cast: 1.67,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Burst",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "By focusing your energy into the muscles in your arms, you can launch a dizzying flurry of attacks against every foe in melee range. Some foes may be hit hard enough to be knocked down as well.",
+            shortHelp: "PBAoE Melee, DMG(Smash/Energy), Foe Knockdown",
+            icon: "kineticattack_burst.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 2.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 1.7281
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.8260000000000001
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.5625
+                        }
+                    ],
+                    scale: 3.1166
+                },
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 1.7,
+                            ticks: 3
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 1.7,
+                            ticks: 3
+                        },
+                        {
+                            type: "Fire",
+                            scale: 1.7,
+                            ticks: 3
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.7,
+                            ticks: 3
+                        },
+                        {
+                            type: "Energy",
+                            scale: 1.7,
+                            ticks: 3
+                        },
+                        {
+                            type: "Negative",
+                            scale: 1.7,
+                            ticks: 3
+                        }
+                    ]
+                },
+                buffDuration: 7.0
+            }
+        },
+        {
+            name: "Focused Burst",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Ranged Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "Projects a burst of focused power over a short distance. Focused Burst deals high damage and can possibly knock down your foe.",
+            shortHelp: "Ranged, DMG(Smash/Energy), Foe Knockdown",
+            icon: "kineticattack_focusedburst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 2.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.8200000000000003
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.94
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.738
+                        }
+                    ],
+                    scale: 4.498
+                },
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 0.85,
+                            ticks: 3
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 0.85,
+                            ticks: 3
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.85,
+                            ticks: 3
+                        },
+                        {
+                            type: "Cold",
+                            scale: 0.85,
+                            ticks: 3
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.85,
+                            ticks: 3
+                        },
+                        {
+                            type: "Negative",
+                            scale: 0.85,
+                            ticks: 3
+                        }
+                    ]
+                },
+                buffDuration: 7.0
+            }
+        },
+        {
+            name: "Concentrated Strike",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "Concentrated Strike is a slow, but incredibly devastating attack that can knock out most opponents, leaving them Disoriented. Due to the exhausting nature of Concentrated Strike, its recharge time is very long.",
+            shortHelp: "Melee, DMG(Energy/Smash), Foe Disorient",
+            icon: "kineticattack_totalfocus.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 2.83,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 4.7867
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.9543
+                        },
+                        {
+                            type: "Fire",
+                            scale: 1.602
+                        }
+                    ],
+                    scale: 8.343
+                },
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 0.85,
+                            ticks: 4
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 0.85,
+                            ticks: 4
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.85,
+                            ticks: 4
+                        },
+                        {
+                            type: "Cold",
+                            scale: 0.85,
+                            ticks: 4
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.85,
+                            ticks: 4
+                        },
+                        {
+                            type: "Negative",
+                            scale: 0.85,
+                            ticks: 4
+                        }
+                    ]
+                },
+                stun: 3.0,
+                buffDuration: 8.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/kinetic-attack'] = BRUTE_KINETIC_ATTACK_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_KINETIC_ATTACK_POWERSET = BRUTE_KINETIC_ATTACK_POWERSET;
+}
+
+// ---- js/data/powersets/brute/martial-arts.js ----
+;/**
+ * Martial Arts
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_MARTIAL_ARTS_POWERSET = {
+    name: "Martial Arts",
+    category: "Unknown",
+    description: "Martial Arts powerset",
+    icon: "martial-arts_set.png",
+    powers: [
+        {
+            name: "Storm Kick",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You can unleash a roundhouse kick that pummels your foe for moderate damage. Storm Kick boosts the Tanker's defense against melee, ranged and area of effect damage slightly for a short period of time after hitting their foe. This bonus defense doesn't stack with itself and is unenhanceable.",
+            shortHelp: "Melee, DMG(Smash), Self +Defense(Melee, Ranged, AoE)",
+            icon: "martialarts_stormkick.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 0.83,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.5410000000000004
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.594
+                        }
+                    ],
+                    scale: 3.1350000000000002
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Thunder Kick",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "You can perform a strong Thunder Kick that hits so hard it can Disorient your target.",
+            shortHelp: "Melee, DMG(Smash), Minor Disorient",
+            icon: "martialarts_thunderkick.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 0.83,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 1.9409999999999998
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.378
+                        }
+                    ],
+                    scale: 2.319
+                },
+                stun: 2.0
+            }
+        },
+        {
+            name: "Cobra Strike",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "Using intense martial arts focus, you can perform a Cobra Strike that deals high damage, but has a great chance of Disorienting your target.",
+            shortHelp: "Melee, DMG(Smash), Foe Disorient",
+            icon: "martialarts_cobrastrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 3.9289
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.882
+                        }
+                    ],
+                    scale: 4.8109
+                },
+                stun: 3.0
+            }
+        },
+        {
+            name: "Focus Chi",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Tapping into your inner Chi greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your chance to hit.",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "martialarts_focuschi.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 2.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Crane Kick",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You can perform a slow, high damage kick that will likely knock your target back.",
+            shortHelp: "Melee, DMG(Smash), Knockback",
+            icon: "martialarts_cranekick.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 3.9289
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.882
+                        }
+                    ],
+                    scale: 4.8109
+                }
+            }
+        },
+        {
+            name: "Warrior's Provocation",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Taunt foes to attack you. Useful to pull enemies off allies and keep them attacking you to raise your Fury. A To Hit check is required to Taunt enemy players, but is not needed against critter targets.",
+            shortHelp: "Ranged (Targeted AoE), Foe Taunt",
+            icon: "martialarts_warriorsprovocation.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 10.0,
+                cast: 1.67,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Crippling Axe Kick",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Immobilize", "Melee Damage", "Slow Movement", "Threat Duration", "Universal Damage Sets"],
+            description: "You can perform a Crippling Axe Kick that deals superior smashing damage, reduces the targets defense, may Immobilize, and Slowing their run speed. Crippling Axe Kick may also knock some flying entities out of the sky.",
+            shortHelp: "Melee, DMG(Smash), Foe Immobilize, -SPD, -Fly, -DEF",
+            icon: "martialarts_cripplinghookkick.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 11.0,
+                endurance: 11.024,
+                cast: 1.6,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 4.0799
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.954
+                        }
+                    ],
+                    scale: 5.0339
+                },
+                buffDuration: 8.0,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Dragon's Tail",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "This low spinning kick deals slightly more damage than Thunder Kick, but has a chance to hit all enemies in melee range. Successful hits may trip and knock down your opponents.",
+            shortHelp: "PBAoE Melee, DMG(Smash), Foe Knockback",
+            icon: "martialarts_monkeysweep.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.05,
+                recharge: 14.0,
+                endurance: 13.52,
+                cast: 1.5,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.0953999999999997
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.5319
+                        }
+                    ],
+                    scale: 2.6273
+                }
+            }
+        },
+        {
+            name: "Eagles Claw",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "You can perform a devastating kick that can severely Disorient most opponents. After using Eagle's Claw your damage will be increased for a brief moment allowing the next attack or two to cause additional damage.",
+            shortHelp: "Melee, DMG(Smash), Foe Minor Disorient, +DMG(All)",
+            icon: "martialarts_eaglesclaw.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 2.53,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 4.930999999999999
+                        },
+                        {
+                            type: "Fire",
+                            scale: 1.026
+                        }
+                    ],
+                    scale: 5.956999999999999
+                },
+                stun: 3.0,
+                buffDuration: 3.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/martial-arts'] = BRUTE_MARTIAL_ARTS_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_MARTIAL_ARTS_POWERSET = BRUTE_MARTIAL_ARTS_POWERSET;
+}
+
+// ---- js/data/powersets/brute/psionic-armor.js ----
+;/**
+ * Psionic Armor
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_PSIONIC_ARMOR_POWERSET = {
+    name: "Psionic Armor",
+    category: "Unknown",
+    description: "Psionic Armor powerset",
+    icon: "psionic-armor_set.png",
+    powers: [
+        {
+            name: "Psionic Shield",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "This power generates a psionic shield that dampens most energy and elemental damage types while also reducing the effect of endurance drain effects.",
+            shortHelp: "Toggle: Self +Res(Fire, Cold, Energy, Negative, Toxic, End Drain)",
+            icon: "psionicarmor_psionicshield.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.104,
+                cast: 1.17
+            }
+        },
+        {
+            name: "Psychic Wall",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You focus to create a psychic wall that dampens the smashing, lethal and psionic damage.",
+            shortHelp: "Toggle: Self +Res(Smash, Lethal, Psionic)",
+            icon: "psionicarmor_psychicwall.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.104,
+                cast: 0.67,
+                resistance: {
+                    smashing: 0.22499999999999998,
+                    psionic: 0.22499999999999998,
+                    lethal: 0.15
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Impenetrable Mind",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "When you toggle on this power, it grants protection from Sleep, Disorient, Fear, Immobilize, Confusion, Knockback and Hold effects. Impenetrable Mind also grants moderate resistance to Psionic based attacks.",
+            shortHelp: "Toggle: Self Res (Psionics, Disorient, Hold, Immobilize, Sleep, Fear, Confuse, Knockback)",
+            icon: "psionicarmor_impenetrablemind.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 0.73
+            }
+        },
+        {
+            name: "Consume Psyche",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing", "Threat Duration"],
+            description: "You Consume the Psyche of nearby foes, thus weakening their Hit Point Regeneration and Endurance Recovery and boosting your own. Hitting any foe with this power will refresh all existing stacks you currently have.<br><br><color #fcfc95>Notes: This power has adaptive recharge. It has a base recharge of <color #FF7F27>5</color> seconds and each affected foe will increase the recharge by <color #FF7F27>5.5</color> seconds for a maximum total of <color #FF7F27>60</color> seconds.</color>",
+            shortHelp: "PBAoE Foe -Regen, -Heal, -Recovery; Self +Regen, +Recovery",
+            icon: "psionicarmor_consumepsyche.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 60.0,
+                endurance: 10.5,
+                cast: 1.33
+            }
+        },
+        {
+            name: "Impose Presence",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Threat Duration", "To Hit Buff"],
+            description: "Impose your presence on nearby enemies, slowing their attack rate down and increasing your defense and chance to hit.",
+            shortHelp: "Toggle: Self +DEF(Melee, Ranged), +To Hit, Foe -Recharge",
+            icon: "psionicarmor_imposepresence.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.208,
+                cast: 0.73,
+                tohitBuff: 0.2,
+                buffDuration: 1.0
+            }
+        },
+        {
+            name: "Psychokinetic Barrier",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You can erect a temporary wall of crystalized psionic energy that will absorb a large amount of damage before breaking off. Psychokinetic Barrier will grant a moderate amount of absorption and reduce the effect debuffs have on you.",
+            shortHelp: "Self, +Absorb, +MaxHP, +Regeneration, +Res(-Regeneration, -Recovery, -Recharge, -Endurance)",
+            icon: "psionicarmor_psychokineticbarrier.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 60.0,
+                endurance: 10.4,
+                cast: 1.17,
+                debuffResistance: {
+                    recharge: 0.2,
+                    regeneration: 0.2,
+                    recovery: 0.2,
+                    endurance: 0.2
+                },
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Precognition",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Precognition allows you to read your enemies' minds, letting you see their attacks before they happen and increasing your perception. This power is always on and costs no Endurance.",
+            shortHelp: "Auto: Self +DEF(Melee, Ranged, AoE, Psionic), Res(DeBuff DEF), +Perception",
+            icon: "psionicarmor_precognition.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                defense: {
+                    psionic: 0.0375
+                },
+                debuffResistance: {
+                    defense: 0.07999519999999999
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Aura of Insanity",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "Sleep", "Recharge", "Fear", "Damage", "Accuracy"],
+            allowedSetCategories: ["Confuse", "Fear", "Holds", "Melee AoE Damage", "Sleep", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "You emit a powerful psychic aura that causes the minds of those around you to become weak and distracted. Foes may be stunned, held, terrified or even confused in your presence, in addition to suffering a debuff derived from the applied control effect. Those that resist these effects will suffer damage over time. This power allows you to use your own Hit Points to keep enemies near you disabled. The power costs no endurance but can be dangerous to use.<br><br><color #fcfc95>Notes: Mez enhancements on this power enhance its magnitude instead of its duration.</color>",
+            shortHelp: "Toggle: PBAoE, Foe Confuse, Disorient, Sleep, Hold, Fear, DoT(Psionic), +Special",
+            icon: "psionicarmor_worldofconfusion.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 0.8,
+                recharge: 10.0,
+                cast: 1.67
+            }
+        },
+        {
+            name: "Memento Mori",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge", "Fear"],
+            allowedSetCategories: ["Endurance Modification", "Fear", "Healing"],
+            description: "Terrify your foes projecting images of their own impending demise into their minds. Memento Mori inflicts fear on targets while healing you even if you have been defeated. Each affected foe will increase your maximum hit points and heal you. Using this power while conscious will give you one opportunity to get back up should you be defeated while its effects are active.<br><br><color #fcfc95>Notes: This power recharges in <color #FF7F27>10</color> seconds if no foes are hit. Otherwise, it recharges in <color #FF7F27>300</color> seconds.</color>",
+            shortHelp: "Self Rez, +Max HP, Special",
+            icon: "psionicarmor_mementomori.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.2,
+                recharge: 300.0,
+                endurance: 10.4,
+                cast: 1.33
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/psionic-armor'] = BRUTE_PSIONIC_ARMOR_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_PSIONIC_ARMOR_POWERSET = BRUTE_PSIONIC_ARMOR_POWERSET;
+}
+
+// ---- js/data/powersets/brute/psionic-melee.js ----
+;/**
+ * Psionic Melee
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_PSIONIC_MELEE_POWERSET = {
+    name: "Psionic Melee",
+    category: "Unknown",
+    description: "Psionic Melee powerset",
+    icon: "psionic-melee_set.png",
+    powers: [
+        {
+            name: "Mental Strike",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You project psionic energy around your fist and strike at your foe dealing light Psionic and Smashing damage. Affected foes will have their recharge rate reduced. Mental Strike has a small chance to grant you Insight. While you have Insight, Mental Strike will deal additional minor psionic damage over time.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Melee, Light DMG(Psionic/Smash), Foe -Rech; Self +Insight",
+            icon: "psionicmelee_mentalstrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Psionic",
+                            scale: 1.545
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.515
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.378
+                        }
+                    ],
+                    scale: 2.4379999999999997
+                },
+                dotDamage: {
+                    type: "Psionic",
+                    scale: 0.084,
+                    ticks: 3
+                },
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Psi Blade",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You lash at your foe's mind with a mentally projected blade of psychic energy to deal moderate Psionic and Lethal damage. Affected foes will have their recharge rate reduced. Psi Blade has a moderate chance to grant you Insight. While you have Insight, Psi Blade will deal additional minor psionic damage over time.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Melee, Moderate DMG(Psionic/Lethal), Foe -Rech, Self +Insight",
+            icon: "psionicmelee_psiblade.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 5.0,
+                endurance: 5.928,
+                cast: 1.33,
+                damage: {
+                    types: [
+                        {
+                            type: "Psionic",
+                            scale: 2.0032
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 0.6677
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.513
+                        }
+                    ],
+                    scale: 3.1839
+                },
+                dotDamage: {
+                    type: "Psionic",
+                    scale: 0.2285,
+                    ticks: 3
+                },
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Telekinetic Blow",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You project telekinetic energy around your fist before delivering a shattering uppercut to your foe dealing high Psionic and Smashing damage and sending them flying into the air. Telekinetic Blow has a high chance of granting you Insight. While you have Insight, Telekinetic Blow will deal additional minor psionic damage over time.",
+            shortHelp: "Melee, DMG(Psionic/Smash), Foe Knock Up, Self +Insight",
+            icon: "psionicmelee_telekineticblow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 9.0,
+                endurance: 9.36,
+                cast: 1.47,
+                damage: {
+                    types: [
+                        {
+                            type: "Psionic",
+                            scale: 2.6917
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.8972
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.81
+                        }
+                    ],
+                    scale: 4.3989
+                },
+                dotDamage: {
+                    type: "Psionic",
+                    scale: 0.18,
+                    ticks: 3
+                },
+                buffDuration: 3.1
+            }
+        },
+        {
+            name: "Concentration",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly boosts your attacks for a few seconds. Slightly increases chance to hit.",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "psionicmelee_concentration.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 2.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Psi Blade Sweep",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee AoE Damage", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "You project a Psi Blade and swing it in a broad arc hitting all foes within a wide cone in front of you for high Psionic and Lethal damage. Foes struck by this power have their recharge reduced and have chance to become disoriented for a short time. Psi Blade Sweep has a high chance of granting you Insight. While you have Insight, Psi Blade Sweep will deal additional minor psionic damage over time and has a greater chance to disorient foes.",
+            shortHelp: "Melee (Cone), DMG(Psionic/Lethal), Foe Disorient, -Rech; Self +Insight",
+            icon: "psionicmelee_psibladesweep.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 1.2217,
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.77,
+                damage: {
+                    types: [
+                        {
+                            type: "Psionic",
+                            scale: 2.286
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 0.762
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.648
+                        }
+                    ],
+                    scale: 3.696
+                },
+                dotDamage: {
+                    type: "Psionic",
+                    scale: 0.236,
+                    ticks: 3
+                },
+                buffDuration: 6.0,
+                stun: 3.0
+            }
+        },
+        {
+            name: "Taunt",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Taunt foes to attack you. Useful to pull enemies off allies and keep them attacking you to raise your Fury. A To Hit check is required to Taunt enemy players, but is not needed against critter targets.",
+            shortHelp: "Ranged (Targeted AoE), Foe Taunt",
+            icon: "psionicmelee_taunt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 10.0,
+                cast: 1.67,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Boggle",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Confuse"],
+            description: "You flood your foe's mind with doubt causing them to become confused for a brief time. Confused foes will attack their allies. Boggle will also place the \"Boggled\" effect on your target for a short time. Attacking a Boggled target will increase your chance of gaining Insight.",
+            shortHelp: "Short Ranged, Target Confuse, +Special",
+            icon: "psionicmelee_boggle.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 20.0,
+                endurance: 7.8,
+                cast: 2.0
+            }
+        },
+        {
+            name: "Greater Psi Blade",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Holds", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You focus and create a more powerful Psi Blade projection before slashing at your foe to deal superior Psionic and Lethal damage. The affected foe will have their recharge reduced moderately and be left held for a short time. Greater Psi Blade will cause additional damage and cause this power's hold to last for a longer duration if you have Insight. Using this power removes Insight.",
+            shortHelp: "Melee, DMG(Psionic/Lethal), Foe -Rech, Hold; Self -Insight",
+            icon: "psionicmelee_greaterpsiblade.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 2.5,
+                damage: {
+                    types: [
+                        {
+                            type: "Psionic",
+                            scale: 6.7862
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 1.3775
+                        },
+                        {
+                            type: "Fire",
+                            scale: 1.2116
+                        }
+                    ],
+                    scale: 9.3753
+                },
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Mass Levitate",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You build up a large amount of telekinetic energy and release it causing nearby foes to be flung into the air. Affected foes will suffer high Smashing damage. If the caster has Insight when this power is used Mass Levitate will also cause a moderate amount of Psionic damage over time.",
+            shortHelp: "PBAoE, DMG(Smash), Foe Knock Up, +Insight",
+            icon: "psionicmelee_masslevitate.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 2.5,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.5999999999999996
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.639
+                        }
+                    ],
+                    scale: 3.239
+                },
+                dotDamage: {
+                    type: "Psionic",
+                    scale: 0.142,
+                    ticks: 3
+                },
+                buffDuration: 3.1
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/psionic-melee'] = BRUTE_PSIONIC_MELEE_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_PSIONIC_MELEE_POWERSET = BRUTE_PSIONIC_MELEE_POWERSET;
+}
+
+// ---- js/data/powersets/brute/radiation-armor.js ----
+;/**
+ * Radiation Armor
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_RADIATION_ARMOR_POWERSET = {
+    name: "Radiation Armor",
+    category: "Unknown",
+    description: "Radiation Armor powerset",
+    icon: "radiation-armor_set.png",
+    powers: [
+        {
+            name: "Alpha Barrier",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You cloak yourself in a field of protective radiation that grants you a good deal of resistance to Lethal, Smashing and Toxic damage.",
+            shortHelp: "Toggle: Self +Res(Lethal, Smash, Toxic)",
+            icon: "radiationarmor_alphabarrier.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.67,
+                resistance: {
+                    smashing: 0.22499999999999998,
+                    lethal: 0.22499999999999998,
+                    toxic: 0.2625
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Gamma Boost",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "Gamma Boost grants you a passive boost to both regeneration and recovery. The lower your current health is, the greater the regeneration bonus you'll receive from Gamma Boost. The higher your current health is, the greater the recovery bonus you'll receive from Gamma Boost. This power is always active.",
+            shortHelp: "Auto: Self +Regen, +Recovery, Special",
+            icon: "radiationarmor_gammaboost.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                debuffResistance: {
+                    regeneration: 0.173
+                },
+                buffDuration: 1.25
+            }
+        },
+        {
+            name: "Proton Armor",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "When active, your body is encased in a shield-like radiation barrier that gives you good resistance to Energy and Fire damage and moderate resistance to Cold and Negative Energy attacks.",
+            shortHelp: "Toggle: Self, +Res(Energy, Fire, Cold and Negative)",
+            icon: "radiationarmor_protonarmor.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.67,
+                resistance: {
+                    energy: 0.3,
+                    fire: 0.22499999999999998,
+                    negative: 0.22499999999999998,
+                    cold: 0.056249999999999994
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Fallout Shelter",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "While active you are protected from recharge, movement, hold, sleep, immobilize, stun and knockdown effects. Additionally Fallout Shelter grants you minor resistance to toxic and psionic damage as well as a measure of resistance against slow effects.",
+            shortHelp: "Toggle: Self +Res(Hold, Sleep, Immobilize, Stun, Knockdown, Toxic, Psi, Slow)",
+            icon: "radiationarmor_falloutshelter.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 0.73,
+                protection: {
+                    hold: 10.379999999999999,
+                    stun: 10.379999999999999,
+                    sleep: 10.379999999999999,
+                    immobilize: 10.379999999999999
+                },
+                resistance: {
+                    fire: 0.0375,
+                    energy: 0.0375,
+                    negative: 0.0375,
+                    psionic: 0.11249999999999999,
+                    toxic: 0.11249999999999999
+                },
+                debuffResistance: {
+                    recharge: 0.3633,
+                    movement: 0.3633,
+                    tohit: 0.3
+                },
+                stun: 1.0,
+                stunDuration: 0.75,
+                buffDuration: 0.75,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Radiation Therapy",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Brute Archetype Sets", "Endurance Modification", "Healing", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You channel a tremendous amount of radiation into a barrier around you. For a short time you will have a strong absorption shield in addition to a regeneration and recovery buff.<br><br><br><color #fcfc95>Notes: This power has adaptive recharge. It has a base recharge of <color #FF7F27>15</color> </color> seconds and each affected foe will increase the recharge by a varying amount. First target adds <color #FF7F27>12</color> seconds for a maximum total of <color #FF7F27>60</color> seconds.</color>",
+            shortHelp: "PBAoE, Minor DMG(Energy), Minor DoT(Toxic), Foe -Regen, Self +HP, +End, Res(-Regen)",
+            icon: "radiationarmor_radiationtherapy.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.2,
+                recharge: 60.0,
+                endurance: 13.0,
+                cast: 1.03
+            }
+        },
+        {
+            name: "Beta Decay",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Debuff", "Threat Duration", "To Hit Debuff"],
+            description: "While Beta Decay is active, nearby foes will have their chance to hit and defense decreased slightly and will be taunted. You will gain a recharge bonus per nearby target up to 10 targets. The first target grants the largest benefit.",
+            shortHelp: "Toggle: Foe, Taunt, -To Hit, -Defense, Self +Recharge",
+            icon: "radiationarmor_betadecay.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.208,
+                cast: 0.67,
+                tohitDebuff: 0.75,
+                buffDuration: 1.0
+            }
+        },
+        {
+            name: "Particle Shielding",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You channel a tremendous amount of radiation into a barrier around you. For a short time you will have a strong absorption shield in addition to a regeneration and recovery buff.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self, +Absorb, +Regeneration",
+            icon: "radiationarmor_particleshielding.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 120.0,
+                endurance: 10.4,
+                cast: 0.73,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Ground Zero",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Healing", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You release a mixture of radiation into the area. Nearby foes will be barraged with harmful radiation and will suffer Moderate Energy damage immediately, followed by moderate toxic damage over time. Affected foes will also have their defense reduced. Nearby allies will be healed for a moderate amount and will recover health over time. This power can affect a total of 30 targets. This includes both friends and foes. Ground Zero has no effect on the caster, only nearby allies and enemies.",
+            shortHelp: "PBAoE, Foe DMG(Energy), DoT (Toxic), -DEF(All), Ally +HP, +Heal over time",
+            icon: "radiationarmor_groundzero.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.2,
+                recharge: 90.0,
+                endurance: 13.0,
+                cast: 3.0
+            }
+        },
+        {
+            name: "Meltdown",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Resist Damage"],
+            description: "After building up a dangerous amount of radiation you release it to both shield and empower yourself. While active you will gain a good amount of damage resistance to all types of damage, recover endurance more quickly and deal more damage for a short time. When this power wears off you will lose a small amount of endurance.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Self, +Res(All), +Recovery, +DMG(All)",
+            icon: "radiationarmor_meltdown.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 480.0,
+                endurance: 2.6,
+                cast: 2.93,
+                resistance: {
+                    smashing: 0.15,
+                    lethal: 0.15,
+                    fire: 0.15,
+                    cold: 0.15,
+                    energy: 0.15,
+                    negative: 0.15,
+                    psionic: 0.15,
+                    toxic: 0.15
+                },
+                debuffResistance: {
+                    recovery: 1.0
+                },
+                buffDuration: 60.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/radiation-armor'] = BRUTE_RADIATION_ARMOR_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_RADIATION_ARMOR_POWERSET = BRUTE_RADIATION_ARMOR_POWERSET;
+}
+
+// ---- js/data/powersets/brute/radiation-melee.js ----
+;/**
+ * Radiation Melee
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_RADIATION_MELEE_POWERSET = {
+    name: "Radiation Melee",
+    category: "Unknown",
+    description: "Radiation Melee powerset",
+    icon: "radiation-melee_set.png",
+    powers: [
+        {
+            name: "Contaminated Strike",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You charge your fist with harmful radioactive particles and quickly strike your foe dealing Light Energy and Smashing damage as well as reducing their defense. Affected enemies have a small chance to be affected by the Contaminated effect. Hitting Contaminated foes with single target Radiation Melee powers cause a small burst of damage to foes near the target.",
+            shortHelp: "Melee, DMG(Energy/Smash), Foe -Def, Special",
+            icon: "radiationmelee_contaminatedstrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 0.83,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 1.4557
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.48519999999999996
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.378
+                        }
+                    ],
+                    scale: 2.3189
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Radioactive Smash",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Knockback", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You channel a greater amount of radiation into your fists and deliver a hard hitting blow that deals Moderate Energy and Smashing damage to the target as well as reducing their Defense for a short time. Affected targets also have a chance to be knocked down and have a moderate chance to be affected by the Contaminated effect. Hitting Contaminated foes with single target Radiation Melee powers cause a small burst of damage to foes near the target.",
+            shortHelp: "Melee, DMG(Energy/Smash), Foe -Def, Knockdown, Special",
+            icon: "radiationmelee_radioactivesmash.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 7.0,
+                endurance: 7.696,
+                cast: 1.5,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 2.4075
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.8025
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.666
+                        }
+                    ],
+                    scale: 3.8760000000000003
+                },
+                defenseDebuff: 1.5,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Proton Sweep",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You release a cloud of deadly radioactive particles in front of you inflicting Moderate Energy and Toxic damage over a short time as well as reducing the targets' defense. Affected enemies have a moderate chance to be affected by the Contaminated effect. Hitting Contaminated foes with single target Radiation Melee powers cause a small burst of damage to foes near the target.",
+            shortHelp: "Melee Cone, DoT(Energy/Toxic), Foe -Def, Special",
+            icon: "radiationmelee_protonsweep.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 1.309,
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Toxic",
+                            scale: 0.5374,
+                            ticks: 3
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.20479999999999998,
+                            ticks: 3
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.1609,
+                            ticks: 3
+                        }
+                    ]
+                },
+                buffDuration: 3.1,
+                defenseDebuff: 1.2
+            }
+        },
+        {
+            name: "Fusion",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Fusion boosts your damage and chance to hit moderately and also causes your next few attacks to have a 100% chance to inflict Contaminated on your enemies.",
+            shortHelp: "Self +DMG, +To Hit, Special",
+            icon: "radiationmelee_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 2.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Radiation Siphon",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Accurate Healing", "Brute Archetype Sets", "Defense Debuff", "Healing", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You pummel your foe with a deadly smashing attack dealing High Energy and Smashing damage and reducing their defense. Hitting Contaminated targets will also heal you for a large amount of health over 3 seconds and remove the Contaminated effect from the target. However, uncontaminated targets have a moderate chance to be affected by the Contaminated effect. Hitting Contaminated foes with single target Radiation Melee powers cause a small burst of damage to foes near the target.",
+            shortHelp: "Melee, DMG(Energy/Smash), Foe, -Def, -Contaminated, Special",
+            icon: "radiationmelee_radiationsiphon.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 2.23,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 3.2407
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.0802
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.882
+                        }
+                    ],
+                    scale: 5.2029
+                },
+                healing: {
+                    scale: 99.95533085,
+                    perTarget: true
+                },
+                defenseDebuff: 1.5,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Taunt",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Taunts a foe, and some nearby foes, to attack you. Useful for pulling villains off an ally who find themselves in over their head. Taunted foes tend to ignore other Heroes and focus on you for quite a while, so use this power cautiously. A To Hit check is required to Taunt enemy players, but is not needed against critter targets.",
+            shortHelp: "Ranged (Targeted AoE), Foe Taunt",
+            icon: "radiationmelee_taunt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 10.0,
+                cast: 1.67,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Irradiated Ground",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "While active you will scorch the earth beneath you leaving toxic clouds of radioactive gas in your wake. Foes that enter these clouds will suffer Minor Toxic damage, have their defense reduced and also have a tiny chance of being Contaminated. Hitting Contaminated foes with single target Radiation Melee powers cause a small burst of damage to foes near the target.",
+            shortHelp: "Toggle, DoT(Toxic) Patch, Foe -Def, Special",
+            icon: "radiationmelee_irradiatedground.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 2.6,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Devastating Blow",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Melee Damage", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "You hammer your foe with a brutal smashing attack charged with a lethal dose of radiation. Your target will suffer Extreme Energy and Smashing damage, will have its defense reduced and will be disoriented for a short time. Affected enemies will be affected by the Contaminated effect. Hitting Contaminated foes with single target Radiation Melee powers cause a small burst of damage to foes near the target.",
+            shortHelp: "Melee, DMG(Energy/Smash), Foe -Def, Disorient, Special",
+            icon: "radiationmelee_devastatingblow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 17.0,
+                endurance: 16.016,
+                cast: 2.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 4.5217
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.5072
+                        },
+                        {
+                            type: "Fire",
+                            scale: 1.386
+                        }
+                    ],
+                    scale: 7.4149
+                },
+                defenseDebuff: 2.0,
+                buffDuration: 10.0,
+                stun: 3.0
+            }
+        },
+        {
+            name: "Atom Smasher",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Melee AoE Damage", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "You charge up a dangerously unstable amount of radioactive energy into a single fist before driving it into the ground and causing a small explosion. Foes caught in the blast will suffer High Energy and Toxic damage and have their defense reduced. Enemies also have a moderate chance to be disoriented for a short time. Affected enemies have a small chance to be affected by the Contaminated effect. Hitting Contaminated foes with single target Radiation Melee powers cause a small burst of damage to foes near the target.",
+            shortHelp: "PBAoE, DMG(Energy/Toxic), Foe -Def, Disorient, Special",
+            icon: "radiationmelee_atomsmasher.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 22.0,
+                endurance: 20.176,
+                cast: 2.93,
+                damage: {
+                    types: [
+                        {
+                            type: "Toxic",
+                            scale: 2.1618
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.7206
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.6975
+                        }
+                    ],
+                    scale: 3.5799
+                },
+                defenseDebuff: 1.2,
+                buffDuration: 10.0,
+                stun: 2.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/radiation-melee'] = BRUTE_RADIATION_MELEE_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_RADIATION_MELEE_POWERSET = BRUTE_RADIATION_MELEE_POWERSET;
+}
+
+// ---- js/data/powersets/brute/regeneration.js ----
+;/**
+ * Regeneration
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_REGENERATION_POWERSET = {
+    name: "Regeneration",
+    category: "Unknown",
+    description: "Regeneration powerset",
+    icon: "regeneration_set.png",
+    powers: [
+        {
+            name: "Fast Healing",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Healing"],
+            description: "You heal Hit Points at a faster rate than normal. This power is always on.",
+            shortHelp: "Auto: Self +Regeneration",
+            icon: "regeneration_fasthealing.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                debuffResistance: {
+                    regeneration: 0.2
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Reconstruction",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing", "Resist Damage"],
+            description: "Through perfect control of your body, you can concentrate for a few moments and heal yourself. The effects of Reconstruction also leaves you resistant to Toxic damage for a while.",
+            shortHelp: "Self Heal, Res(Toxic)",
+            icon: "regeneration_reconstruction.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 60.0,
+                endurance: 10.4,
+                cast: 0.73,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 2.0,
+                    ticks: 30
+                },
+                resistance: {
+                    toxic: 0.15
+                },
+                healing: {
+                    scale: 374.81375,
+                    perTarget: true
+                },
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Quick Recovery",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "You recover Endurance at a faster rate than normal. This power is always on.",
+            shortHelp: "Auto: Self +Recovery",
+            icon: "regeneration_quickrecovery.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                debuffResistance: {
+                    recovery: 0.2
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Ailment Resistance",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Healing"],
+            description: "Your superior immune system makes you resilient to disease and multiple ailments. Healing techniques also become more effective. This power is always on.",
+            shortHelp: "Auto: Self +Max HP, -Res(Heal), Res(-Defense, -Endurance, -Speed, -Regeneration, -Recovery, -Recharge, -Range, -ToHit)",
+            icon: "regeneration_resiststun.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 360.0,
+                debuffResistance: {
+                    tohit: 0.2,
+                    defense: 0.2,
+                    recharge: 0.2,
+                    movement: 0.2,
+                    regeneration: 0.2,
+                    recovery: 0.2,
+                    endurance: 0.2
+                },
+                buffDuration: 10.3,
+                tohitBuff: 0.2
+            }
+        },
+        {
+            name: "Integration",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing", "Threat Duration"],
+            description: "You can Integrate your mind and body, making you resistant to Knockback, Disorient, Hold, Sleep, and Immobilization effects, as well as increase your regeneration rate, for as long as you can keep this toggle power active. Integration also taunts nearby foes.",
+            shortHelp: "Toggle: Self +Res(Knockback, Disorient, Hold, Sleep, Immobilize), +Regeneration, Taunt",
+            icon: "regeneration_integration.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.52,
+                cast: 3.1,
+                protection: {
+                    hold: 10.379999999999999,
+                    stun: 10.379999999999999,
+                    sleep: 10.379999999999999,
+                    immobilize: 10.379999999999999
+                },
+                debuffResistance: {
+                    tohit: 0.3,
+                    defense: 0.3,
+                    recharge: 0.3,
+                    movement: 0.5
+                },
+                buffDuration: 2.25,
+                stun: 1.0,
+                stunDuration: 2.25,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Resilience",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You are more Resilient. This power allows you to build up a resistance to Disorientation effects. You tend not to get Disoriented, and if you do, it wears off quickly. This resistance to Disorientation gets stronger as you go up in level. Resilience also grants some resistance to all types of damage. This power is always on.",
+            shortHelp: "Auto: Self +Res(Disorient, All DMG)",
+            icon: "regeneration_resist.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                protection: {
+                    stun: 5.1899999999999995
+                },
+                resistance: {
+                    smashing: 0.09375,
+                    lethal: 0.09375,
+                    fire: 0.09375,
+                    cold: 0.09375,
+                    energy: 0.09375,
+                    negative: 0.09375,
+                    psionic: 0.09375,
+                    toxic: 0.09375
+                },
+                stun: 1.0,
+                stunDuration: 10.25,
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Instant Healing",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "When you activate this power, you can regenerate your health at an astounding rate. This boost to your Regeneration Rate lasts about a minute and takes a long time to recharge once used.<br><br>This power is mutually exclusive from Reactive Regeneration.",
+            shortHelp: "Click: Self +Regeneration",
+            icon: "regeneration_instanthealing.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 650.0,
+                endurance: 10.4,
+                cast: 1.17,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Reactive Regeneration",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "When you activate this power, you can regenerate your health at an astounding rate. This boost becomes stronger every time you take damage, as it scales you also become resistant to regeneration and recovery debuffs as well as endurance drain.<br><br>This power is mutually exclusive from Instant Healing.",
+            shortHelp: "Toggle: Self +Regeneration, +Res(-Regeneration, -End, -Recovery)",
+            icon: "regeneration_instanthealing.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.52,
+                cast: 1.17
+            }
+        },
+        {
+            name: "Second Wind",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "When you use this power you will recover a percentage of your missing health, in addition to increasing your maximum hit points. Should you fall in battle after using this power, you can stand up and fight again. If used while defeated, you will enter stand back up and be protected from XP Debt for 90 seconds and immune to most damage for 15 seconds.<br><br><color #fcfc95>Note: the self resurect granted if this power is activated while alive can not be enhanced.</color>",
+            shortHelp: "Self +Max HP, Rez(Special)",
+            icon: "regeneration_dullpain.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 360.0,
+                endurance: 10.4,
+                cast: 0.73
+            }
+        },
+        {
+            name: "Moment of Glory",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Endurance Modification", "Resist Damage"],
+            description: "When you activate this power, you deal increased damage, recover Endurance more quickly, gain Resistance and Defense to all damage types, and are highly resistant to Knock Back, Sleep, Disorient, Immobilization, and Hold effects.",
+            shortHelp: "Self +DMG, +Res(All DMG, Knock Back, Repel, Stun, Hold, Sleep, Immobilize), +DEF(All DMG), +Recovery",
+            icon: "regeneration_momentofglory.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 240.0,
+                endurance: 2.6,
+                cast: 1.5,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 9.5,
+                            ticks: 7
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 9.5,
+                            ticks: 7
+                        },
+                        {
+                            type: "Fire",
+                            scale: 9.5,
+                            ticks: 7
+                        },
+                        {
+                            type: "Cold",
+                            scale: 9.5,
+                            ticks: 7
+                        },
+                        {
+                            type: "Energy",
+                            scale: 9.5,
+                            ticks: 7
+                        },
+                        {
+                            type: "Negative",
+                            scale: 9.5,
+                            ticks: 7
+                        },
+                        {
+                            type: "Psionic",
+                            scale: 1.0,
+                            ticks: 7
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 1.0,
+                            ticks: 7
+                        }
+                    ]
+                },
+                protection: {
+                    hold: 17.299999999999997,
+                    stun: 17.299999999999997,
+                    sleep: 17.299999999999997,
+                    immobilize: 17.299999999999997
+                },
+                defense: {
+                    smashing: 0.7125,
+                    lethal: 0.7125,
+                    fire: 0.7125,
+                    cold: 0.7125,
+                    energy: 0.7125,
+                    negative: 0.7125,
+                    psionic: 0.7125,
+                    toxic: 0.7125
+                },
+                resistance: {
+                    smashing: 0.7125,
+                    lethal: 0.7125,
+                    fire: 0.7125,
+                    cold: 0.7125,
+                    energy: 0.7125,
+                    negative: 0.7125,
+                    psionic: 0.7125,
+                    toxic: 0.7125
+                },
+                buffDuration: 15.0,
+                stun: 1.0,
+                stunDuration: 15.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/regeneration'] = BRUTE_REGENERATION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_REGENERATION_POWERSET = BRUTE_REGENERATION_POWERSET;
+}
+
+// ---- js/data/powersets/brute/savage-melee.js ----
+;/**
+ * Savage Melee
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_SAVAGE_MELEE_POWERSET = {
+    name: "Savage Melee",
+    category: "Unknown",
+    description: "Savage Melee powerset",
+    icon: "savage-melee_set.png",
+    powers: [
+        {
+            name: "Maiming Slash",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Slow Movement", "Threat Duration", "Universal Damage Sets"],
+            description: "You execute a savage slash at your foe's lower body causing moderate lethal damage and minor damage over time. The foe will also have their movement speed reduced moderately. Maiming Slash grants 1 stack of Blood Frenzy.",
+            shortHelp: "Melee, DMG(Lethal), DoT (Lethal), Foe -Speed, Self +1 Blood Frenzy",
+            icon: "savagemelee_maimingslash.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 5.0,
+                endurance: 6.03,
+                cast: 1.17,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 2.5788
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.522
+                        }
+                    ],
+                    scale: 3.1008000000000004
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Savage Strike",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You quickly tear at your foe dealing minor lethal damage and causing minor lethal damage over time. Savage Strikes grants you 1 stack of Blood Frenzy.",
+            shortHelp: "Melee, DMG(Lethal), Foe DoT (Lethal), Self +1 Blood Frenzy",
+            icon: "savagemelee_savagestrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 2.5,
+                endurance: 3.95,
+                cast: 0.8,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 0.9101,
+                            ticks: 1
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.171,
+                            ticks: 1
+                        }
+                    ]
+                },
+                buffDuration: 0.4
+            }
+        },
+        {
+            name: "Shred",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You rapidly slash at your foes several times causing a moderate amount of damage to all enemies in front of you and reduce their defense. Shred also causes minor lethal damage over time. This power grants 1 stack of Blood Frenzy.",
+            shortHelp: "Melee (Cone), Foe DoT (Lethal), -Def(All), Self +1 Blood Frenzy",
+            icon: "savagemelee_shred.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 1.3963,
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 7.5,
+                endurance: 8.11,
+                cast: 2.17,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 0.5091,
+                            ticks: 5
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.0946,
+                            ticks: 5
+                        }
+                    ]
+                },
+                buffDuration: 2.0,
+                defenseDebuff: 1.2
+            }
+        },
+        {
+            name: "Blood Thirst",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "You unleash your frenzy, increasing your chance to inflict Bleed to 100% as well as increasing your damage and chance to hit moderately. Blood Thirst also grants 5 stacks of Frenzy Fury.",
+            shortHelp: "Self +DMG, +To Hit, +Special, +5 Blood Frenzy",
+            icon: "savagemelee_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 7.8,
+                cast: 2.0,
+                tohitBuff: 1.0,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Vicious Slash",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You tear at your foe with both hands dealing high lethal damage and causing minor lethal damage over time. Foes struck by this attack have a high chance to be knocked down.",
+            shortHelp: "Melee, DMG(Lethal), Foe DoT (Lethal), Knockdown, Self +2 Blood Frenzy",
+            icon: "savagemelee_viciousslash.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 9.0,
+                endurance: 9.36,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 3.7289000000000003
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.81
+                        }
+                    ],
+                    scale: 4.5389
+                }
+            }
+        },
+        {
+            name: "Taunt",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Taunts a foe, and some nearby foes, to attack you. Useful for pulling villains off an ally who find themselves in over their head. Taunted foes tend to ignore other Heroes and focus on you for quite a while, so use this power cautiously. A To Hit check is required to Taunt enemy players, but is not needed against critter targets.",
+            shortHelp: "Ranged (Targeted AoE), Foe Taunt",
+            icon: "savagemelee_taunt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 10.0,
+                cast: 1.67,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Rending Flurry",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You wildly slash at nearby foes to deal moderate lethal damage and cause minor lethal damage over time. This power consumes all Blood Frenzy and will deal additional damage per stack of Blood Frenzy consumed. If you have 5 stacks of Blood Frenzy while activating this power, its radius is greatly increased, but causes you to become Exhausted for a short time. While exhausted you cannot gain Blood Frenzy.",
+            shortHelp: "PBAoE, DMG(Lethal), Foe DoT (Lethal), -Blood Frenzy",
+            icon: "savagemelee_rendingflurry.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 14.0,
+                endurance: 13.52,
+                cast: 2.17
+            }
+        },
+        {
+            name: "Hemorrhage",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You viciously tear at your foe causing a light amount of lethal damage. Additionally, the target will suffer from lethal damage over time. Hemorrhage consumes all stacks of Blood Frenzy. This power's damage over time effect will scale with the number of stacks of Blood Frenzy. Using this power with 5 stacks of Blood Frenzy causes you to become Exhausted for a short time, but the duration of Hemorrhage's damage over time effect is increased. While exhausted you cannot gain Blood Frenzy.",
+            shortHelp: "Melee, DMG(Lethal), Foe Special DoT (Lethal), -Blood Frenzy",
+            icon: "savagemelee_hemorrhage.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 14.0,
+                endurance: 13.52,
+                cast: 2.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 1.7344
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.351
+                        }
+                    ],
+                    scale: 2.0854
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.1638,
+                    ticks: 4
+                },
+                buffDuration: 4.1
+            }
+        },
+        {
+            name: "Savage Leap",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee AoE Damage", "Teleport", "Threat Duration", "Universal Damage Sets", "Universal Travel"],
+            description: "You throw yourself at your distant foes while slashing and tearing wildly dealing moderate lethal damage and causing your foes to suffer from additional minor lethal damage over time. The damage of this power can increase based on how far away you leap from, with up to double damage dealt at its strongest. Savage Leap build 1 stacks of Blood Frenzy for every 20 ft in between your target and you, up to 3 stacks.",
+            shortHelp: "PBAoE, DMG(Lethal), Foe DoT (Lethal), Self 1 to 3 Blood Frenzy, Teleport",
+            icon: "savagemelee_savageleap.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 40.0,
+                endurance: 17.58,
+                cast: 1.17
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/savage-melee'] = BRUTE_SAVAGE_MELEE_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_SAVAGE_MELEE_POWERSET = BRUTE_SAVAGE_MELEE_POWERSET;
+}
+
+// ---- js/data/powersets/brute/shield-defense.js ----
+;/**
+ * Shield Defense
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_SHIELD_DEFENSE_POWERSET = {
+    name: "Shield Defense",
+    category: "Unknown",
+    description: "Shield Defense powerset",
+    icon: "shield-defense_set.png",
+    powers: [
+        {
+            name: "Battle Agility",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Your incredible agility allows you to position your shield to protect yourself from incoming ranged damage. While Battle Agility is active you will benefit from increased Ranged and AoE defense as well as some moderate protection from Defense Debuffs. Battle Agility also adds an Elusivity defense bonus to Ranged and AOE Attacks in PVP zones.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +DEF(Ranged, AoE), +Res(Defense Debuff)",
+            icon: "shielddefense_deflection.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 1.5,
+                debuffResistance: {
+                    defense: 0.1384
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Deflection",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Resist Damage"],
+            description: "Your mastery of the shield allows you to easily deflect melee attacks, and attacks that do get through your ironclad defenses tend to do less damage. While Deflection is active the user will gain defense to melee attacks and some minor resistance to lethal and smashing damage. Deflection also adds Psionic Defense and an Elusivity defense bonus to Psionic and Melee Attacks in PVP zones.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +DEF(Melee), +Res(Lethal, Smashing)",
+            icon: "shielddefense_activedefense.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 1.5,
+                defense: {
+                    psionic: 0.11249999999999999
+                },
+                resistance: {
+                    smashing: 0.11249999999999999,
+                    lethal: 0.11249999999999999
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "True Grit",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Healing", "Resist Damage"],
+            description: "Your intense training has left you tougher than even the hardiest of heroes. You gain additional hit points and resistance to fire, cold, energy, negative energy and toxic damage sources. This power is always on and costs no Endurance.",
+            shortHelp: "Auto: Self +Res (Cold, Energy, Fire, Negative Energy, Toxic), +MaxHealth",
+            icon: "shielddefense_truegrit.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 1.5,
+                            ticks: 5
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.5,
+                            ticks: 5
+                        },
+                        {
+                            type: "Energy",
+                            scale: 1.5,
+                            ticks: 5
+                        },
+                        {
+                            type: "Negative",
+                            scale: 1.5,
+                            ticks: 5
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 1.5,
+                            ticks: 5
+                        }
+                    ]
+                },
+                resistance: {
+                    fire: 0.11249999999999999,
+                    cold: 0.11249999999999999,
+                    energy: 0.11249999999999999,
+                    negative: 0.11249999999999999,
+                    toxic: 0.11249999999999999
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Active Defense",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "When you activate this power, it grants protection from Sleep, Disorient, Fear, Immobilize, Confusion, Repel, Knockback, Hold and Defense Debuff effects for a short duration.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self Res (Disorient, Hold, Immobilize, Sleep, Fear, Confuse, Repel, Knockback, Defense Debuff)",
+            icon: "shielddefense_battleagility.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 200.0,
+                endurance: 10.4,
+                cast: 1.5,
+                protection: {
+                    hold: 10.379999999999999,
+                    stun: 10.379999999999999,
+                    sleep: 10.379999999999999,
+                    fear: 10.379999999999999,
+                    confuse: 10.379999999999999,
+                    immobilize: 10.379999999999999
+                },
+                debuffResistance: {
+                    tohit: 0.3,
+                    defense: 0.3,
+                    recharge: 0.3,
+                    movement: 0.5
+                },
+                stun: 1.0,
+                stunDuration: 120.0,
+                buffDuration: 120.0,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Against All Odds",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "The harder pressed you are in combat the greater your offensive abilities become. Each enemy that stands toe-to-toe with you in combat will grant you a damage bonus. The first foe you engage in melee grants the highest damage bonus, and up to 10 foes can contribute to this effect. Each foe in melee range also suffers from reduced damage as your shield deflects a portion of their damage.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Self +DMG, Foe -DMG",
+            icon: "shielddefense_againstallodds.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.208,
+                cast: 2.5,
+                buffDuration: 1.25
+            }
+        },
+        {
+            name: "Phalanx Fighting",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Fighting very near your allies allows you to deflect attacks much easier. You will gain a small bonus to your melee, ranged and area of effect defense. This bonus grows for each ally near you. This power is always on and costs no endurance.",
+            shortHelp: "Auto: Self Special +DEF(Melee, Ranged, AoE)",
+            icon: "shielddefense_phalanxfighting.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 3,
+            effects: {
+                accuracy: 1.0,
+                buffDuration: 1.0
+            }
+        },
+        {
+            name: "Grant Cover",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "You are able to use your shield to defend nearby allies. Any teammates who remain nearby gain a bonus to their defense. Additionally, while this power is active, the user will gain some resistance to defense debuffs.<br><br><color #fcfc95>Notes: The defense bonus from this power is only applied to nearby team mates, but not yourself.</color><br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "PBAoE, Team (but not self) +DEF(All but Psionic), Self +RES(Defense Debuff)",
+            icon: "shielddefense_grantcover.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.312,
+                cast: 2.5,
+                buffDuration: 2.25
+            }
+        },
+        {
+            name: "Shield Charge",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You can throw all of your might behind your shield and charge through ranks of foes in the blink of an eye. Using this power allows you to teleport to a selected area to deal significant smashing damage to all foes near the location you teleport to, most foes that are struck by your Shield Charge will be knocked down.<br><br><color #fcfc95>Damage: Superior.</color><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE Superior DMG(Smashing), Foe Knockdown; Self Teleport",
+            icon: "shielddefense_shieldcharge.png",
+            powerType: "Click",
+            targetType: "Location (Teleport)",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 90.0,
+                endurance: 13.52,
+                cast: 1.5,
+                buffDuration: 4.0
+            }
+        },
+        {
+            name: "One with the Shield",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction"],
+            allowedSetCategories: ["Endurance Modification", "Healing", "Resist Damage"],
+            description: "When you activate this power, you gain strong resistance against most types of damage and also to Disorient, Immobilization, Hold, Knockback, Repel and Sleep effects. One with the Shield costs little Endurance to activate and increases your recovery and maximum hit points for its duration, but when it wears off you are left exhausted, and substantially drained of Endurance.<br><br><color #fcfc95>Notes: One with the Shield is unaffected by Recharge Time changes.</color><br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Self, +Res(Disorient, Sleep, Hold, Immobilize, Repel, Knockback, All DMG but Psi), +Recovery, +Max HP",
+            icon: "shielddefense_onewiththeshield.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 360.0,
+                endurance: 2.6,
+                cast: 2.5,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 3.0,
+                            ticks: 60
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 3.0,
+                            ticks: 60
+                        },
+                        {
+                            type: "Fire",
+                            scale: 1.5,
+                            ticks: 60
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.5,
+                            ticks: 60
+                        },
+                        {
+                            type: "Energy",
+                            scale: 1.5,
+                            ticks: 60
+                        },
+                        {
+                            type: "Negative",
+                            scale: 1.5,
+                            ticks: 60
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 1.5,
+                            ticks: 60
+                        }
+                    ]
+                },
+                protection: {
+                    hold: 17.299999999999997,
+                    stun: 17.299999999999997,
+                    sleep: 17.299999999999997,
+                    immobilize: 17.299999999999997
+                },
+                resistance: {
+                    smashing: 0.22499999999999998,
+                    lethal: 0.22499999999999998,
+                    fire: 0.11249999999999999,
+                    cold: 0.11249999999999999,
+                    energy: 0.11249999999999999,
+                    negative: 0.11249999999999999,
+                    toxic: 0.11249999999999999
+                },
+                buffDuration: 120.0,
+                stun: 1.0,
+                stunDuration: 120.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/shield-defense'] = BRUTE_SHIELD_DEFENSE_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_SHIELD_DEFENSE_POWERSET = BRUTE_SHIELD_DEFENSE_POWERSET;
+}
+
+// ---- js/data/powersets/brute/spines.js ----
+;/**
+ * Spines
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_SPINES_POWERSET = {
+    name: "Spines",
+    category: "Unknown",
+    description: "Spines powerset",
+    icon: "spines_set.png",
+    powers: [
+        {
+            name: "Barb Swipe",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Slow Movement", "Threat Duration", "Universal Damage Sets"],
+            description: "Shred your opponent with several quick Swipes from your Spines. Barb Swipe deals Light Lethal damage and a minor amount of additional Toxic damage over time and Slows affected foes.",
+            shortHelp: "Melee, DMG(Lethal), DoT(Toxic), -SPD, -Recharge",
+            icon: "quills_swipe.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 0.83,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 1.9409999999999998
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.378
+                        }
+                    ],
+                    scale: 2.319
+                },
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.1,
+                    ticks: 2
+                },
+                buffDuration: 4.0
+            }
+        },
+        {
+            name: "Lunge",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Slow Movement", "Threat Duration", "Universal Damage Sets"],
+            description: "You can lunge forward, stabbing and poisoning a foe with the large Spine on your arm. Lunge deals moderate damage. Spine poison deals additional Toxic damage and Slows affected foes.",
+            shortHelp: "Melee, DMG(Lethal), DoT(Toxic) -SPD, -Recharge",
+            icon: "quills_lunge.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.63,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 3.101
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.594
+                        }
+                    ],
+                    scale: 3.695
+                },
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.1,
+                    ticks: 3
+                },
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Spine Burst",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee AoE Damage", "Slow Movement", "Threat Duration", "Universal Damage Sets"],
+            description: "You can fling dozens of Spines in all directions. These Spines only travel a short distance, but they can deal moderate damage and poison any target close to you. Spine poison deals additional Toxic damage and Slows affected foes.",
+            shortHelp: "PBAoE Melee, DMG(Lethal), DoT(Toxic), -SPD, -Recharge",
+            icon: "quills_flingquills.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 3.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 1.8662
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.405
+                        }
+                    ],
+                    scale: 2.2712000000000003
+                },
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.1,
+                    ticks: 3
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Build Up",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your chance to hit.",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "quills_bristle.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 0.73,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Impale",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Immobilize", "Ranged Damage", "Slow Movement", "Threat Duration", "Universal Damage Sets"],
+            description: "You can throw a single large Spine at a targeted foe. This Spine does only moderate damage, but carries a large amount of the Spine toxin. A successful attack can completely Immobilize most foes, as well as Slowing them and dealing Toxic poison damage. Impale can also bring down flying entities.",
+            shortHelp: "Ranged, DMG(Lethal), DoT(Toxic), Immobilize, -Recharge, -Fly",
+            icon: "quills_impale.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 2.43,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 4.061
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.738
+                        }
+                    ],
+                    scale: 4.7989999999999995
+                },
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.1,
+                    ticks: 4
+                },
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Taunt",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Taunt foes to attack you. Useful to pull enemies off allies and keep them attacking you to raise your Fury. A To Hit check is required to Taunt enemy players, but is not needed against critter targets.",
+            shortHelp: "Ranged (Targeted AoE), Foe Taunt",
+            icon: "spines_taunt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 10.0,
+                cast: 1.67,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Quills",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "While this power is active, you will constantly fire dozens of Spines in all directions. These Spines do minor damage, but can poison all foes in close range. Spine poison Slows affected foes.",
+            shortHelp: "Toggle: PBAoE, DoT(Lethal), Foe -Speed, -Recharge",
+            icon: "quills_quills.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 15.0,
+                endurance: 1.04,
+                cast: 0.73,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 0.15
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.0675
+                        }
+                    ],
+                    scale: 0.2175
+                },
+                buffDuration: 3.0
+            }
+        },
+        {
+            name: "Ripper",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee AoE Damage", "Slow Movement", "Threat Duration", "Universal Damage Sets"],
+            description: "You can unleash a spectacular slashing maneuver that attacks all villains in a wide arc in front of you. Ripper deals massive damage and poisons multiple targets. It can even knock foes down. Spine poison Slows affected targets and deals additional Toxic damage.",
+            shortHelp: "Melee (Cone), DMG(Lethal), DoT(Toxic), Knockback, -SPD, -Recharge",
+            icon: "quills_bonesword.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 11.0,
+                endurance: 11.024,
+                cast: 2.33,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 3.6689
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.765
+                        }
+                    ],
+                    scale: 4.4338999999999995
+                },
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.2,
+                    ticks: 4
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Throw Spines",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Ranged AoE Damage", "Slow Movement", "Threat Duration", "Universal Damage Sets"],
+            description: "You can throw dozens of Spines in a wide cone in front of you, impaling foes caught within the range. Spine throwing deals moderate damage, and poisons any targets it hits. Spine poison deals additional Toxic damage and Slows affected foes.",
+            shortHelp: "Ranged (Cone), DMG(Lethal), DoT(Toxic), -SPD, -Recharge",
+            icon: "quills_quillthrowing.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.0,
+                range: 30.0,
+                recharge: 12.0,
+                endurance: 13.0,
+                cast: 1.63,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 1.8888
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.4905
+                        }
+                    ],
+                    scale: 2.3793
+                },
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.1,
+                    ticks: 4
+                },
+                buffDuration: 15.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/spines'] = BRUTE_SPINES_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_SPINES_POWERSET = BRUTE_SPINES_POWERSET;
+}
+
+// ---- js/data/powersets/brute/staff-fighting.js ----
+;/**
+ * Staff Fighting
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_STAFF_FIGHTING_POWERSET = {
+    name: "Staff Fighting",
+    category: "Unknown",
+    description: "Staff Fighting powerset",
+    icon: "staff-fighting_set.png",
+    powers: [
+        {
+            name: "Form of the Body",
+            available: -1,
+            tier: 2,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "This power is obtained by purchasing Staff Mastery. All Staff Fighting attacks will build a level of Perfection of Body while this toggle is active. Each level will boost the user's damage output slightly. Once the user has built up 3 levels of Perfection of Body and they execute Eye of the Storm, the attack will reduce the targets' damage resistance slightly and will deal additional smashing damage. Executing Sky Splitter with three 3 levels of Perfection of Body will deal additional smashing damage and grant the user a moderate resistance buff for a short time.",
+            shortHelp: "Toggle: Grants Perfection of Body levels",
+            icon: "stafffighting_formofthebody.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                cast: 0.63,
+                buffDuration: 1.25
+            }
+        },
+        {
+            name: "Form of the Mind",
+            available: -1,
+            tier: 2,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "This power is obtained by purchasing Staff Mastery. All Staff Fighting attacks will build a level of Perfection of Mind while this toggle is active. Each level will boost the user's recharge rate slightly. Once the user has built up 3 levels of Perfection of Mind and they execute Eye of the Storm, the attack will slow the targets slightly and will deal additional psychic damage. Executing Sky Splitter with three 3 levels of Perfection of Mind will deal additional psychic damage and grant the user a moderate to hit buff for a short time.",
+            shortHelp: "Toggle: Grants Perfection of Mind levels",
+            icon: "stafffighting_formofthemind.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                cast: 0.63,
+                buffDuration: 1.25
+            }
+        },
+        {
+            name: "Form of the Soul",
+            available: -1,
+            tier: 2,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "This power is obtained by purchasing Staff Mastery. All Staff Fighting attacks will build a level of Perfection of Soul while this toggle is active. Each level will grant the user an Endurance Discount. Once the user has built up 3 levels of Perfection of Soul and they execute Eye of the Storm, the attack will reduce targets' defense slightly and will deal additional energy damage. Executing Sky Splitter with three 3 levels of Perfection of Soul will deal additional energy damage and grant the user a moderate regeneration and recovery buff for a short time.",
+            shortHelp: "Toggle: Grants Perfection of Soul levels",
+            icon: "stafffighting_formofthesoul.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                cast: 0.63,
+                buffDuration: 1.25
+            }
+        },
+        {
+            name: "Mercurial Blow",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You strike your foe with a lightning fast blow from your staff dealing Smashing damage. The attack is so unexpected that the target's defenses are reduced slightly for a short time. While a form is active, this power will build one level of Perfection.",
+            shortHelp: "Melee, DMG(Smash), Foe -Def",
+            icon: "stafffighting_mercurialblow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 9.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 1.0,
+                damage: {
+                    type: "Smashing",
+                    scale: 1.22
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Precise Strike",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "You attempt to daze your foe with a heavy staff blow to their head. Precise Strike has a higher chance to hit than normal, deals Smashing damage, and has a small chance to disorient the target briefly. While a form is active, this power will build one level of Perfection.",
+            shortHelp: "Melee, DMG(Smash), Foe Disorient",
+            icon: "stafffighting_precisestrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.1,
+                range: 9.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.13
+            }
+        },
+        {
+            name: "Guarded Spin",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Defense Sets", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You spin your staff like a propeller in front of you dealing Smashing damage to enemies in your frontal arc and deflecting any incoming attacks, thus boosting your Melee and Lethal defense briefly. While a form is active, this power will build one level of Perfection.",
+            shortHelp: "Melee (Cone), DMG(Smash), Self +Def(Melee, Lethal)",
+            icon: "stafffighting_guardedspin.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.05,
+                range: 9.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.83,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Eye of the Storm",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "With a lightning fast series of spins of your staff you strike at all nearby foes dealing damage with a chance of knocking foes down. While a form is active, this power will build one level of Perfection if the user has two or less levels, if the user has three levels of Perfection it will consume them and gain some benefit. 3 Levels of Perfection of Body will cause additional smashing damage and reduce damage resistance slightly for a short time. 3 Levels of Perfection of Mind will cause additional psionic damage and reduce attack and movement speed for a short time. 3 Levels of Perfection of Soul will cause additional energy damage and reduce defense for a short time.",
+            shortHelp: "PBAoE Melee, DMG(Smash), Foe Knockdown, Consumes Perfection",
+            icon: "stafffighting_eyeofthestorm.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.05,
+                recharge: 17.0,
+                endurance: 16.016,
+                cast: 2.57
+            }
+        },
+        {
+            name: "Staff Mastery",
+            available: 7,
+            tier: 3,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "By Purchasing this power, you will gain access to the following powers: Form of the Body, Form of the Mind and Form of the Soul. Each of these toggle powers will allow the user to build up levels of Perfection, which grant the user a stacking short duration buff. Each buff is unique to the active form, and only one form can be active at a time. Perfection can be released by executing Eye of the Storm or Sky Splitter. When either of these attacks are empowered with Perfection they will have additional effects that are unique to each form. See Forms for additional details.",
+            shortHelp: "Change Stances/Special",
+            icon: "stafffighting_staffmastery.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Taunt",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Taunt foes to attack you. Useful to pull enemies off allies and keep them attacking you to raise your Fury. A To Hit check is required to Taunt enemy players, but is not needed against critter targets.",
+            shortHelp: "Ranged (Targeted AoE), Foe Taunt",
+            icon: "stafffighting_taunt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 10.0,
+                cast: 2.0,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Serpent's Reach",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Ranged Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You fully extend your staff and release a burst of energy to lash out at a distant target and deal Smashing damage with a good chance to knock your target down. While a form is active, this power will build one level of Perfection.",
+            shortHelp: "Ranged, DMG(Smash), Foe Knockdown",
+            icon: "stafffighting_serpentsreach.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 40.0,
+                recharge: 9.0,
+                endurance: 9.36,
+                cast: 1.77,
+                damage: {
+                    type: "Smashing",
+                    scale: 1.9989
+                }
+            }
+        },
+        {
+            name: "Innocuous Strikes",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Immobilize", "Melee AoE Damage", "Slow Movement", "Threat Duration", "Universal Damage Sets"],
+            description: "You repeatedly batter your foes' feet and legs with a flurry of sweeps of your staff. This attack deals Smashing damage to all foes within its cone. All affected targets will have their movement speed reduced, with a chance of being immobilized briefly. While a form is active, this power will build one level of Perfection.",
+            shortHelp: "Melee (Cone), DMG(Smash), Foe Immobilize, -Speed",
+            icon: "stafffighting_innocuousstrikes.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.05,
+                range: 9.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 2.17
+            }
+        },
+        {
+            name: "Sky Splitter",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee Damage", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "You leap into the air and hammer your foe with an overhead bash from your staff. Sky Splitter deals Smashing damage, will knock the target into the air and will briefly disorient your target. While a form is active, this power will build one level of Perfection if the user has two or less levels, if the user has three levels of Perfection it will consume them and gain some benefit. 3 Levels of Perfection of Body will cause additional smashing damage and grant the user a bonus to damage resistance a short time. 3 Levels of Perfection of Mind will cause additional psionic damage and boost the user's chance to hit for a short time. 3 Levels of Perfection of Soul will cause additional energy damage and increase the user's regeneration and recovery rate briefly.",
+            shortHelp: "Melee, DMG(Smash), Foe Knock Up, Disorient, -Fly, Consumes Perfection",
+            icon: "stafffighting_skysplitter.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 9.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 2.83
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/staff-fighting'] = BRUTE_STAFF_FIGHTING_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_STAFF_FIGHTING_POWERSET = BRUTE_STAFF_FIGHTING_POWERSET;
+}
+
+// ---- js/data/powersets/brute/stone-armor.js ----
+;/**
+ * Stone Armor
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_STONE_ARMOR_POWERSET = {
+    name: "Stone Armor",
+    category: "Unknown",
+    description: "Stone Armor powerset",
+    icon: "stone-armor_set.png",
+    powers: [
+        {
+            name: "Rock Armor",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Your skin becomes stone while this power is active. Stone Armor protects you from Smashing and Lethal attacks. They are less likely to land and affect you. Stone Armor also grants you resistance to Defense DeBuffs.<br><br>Stone Armor also adds an Elusivity defense bonus to Smashing and Lethal Attacks in PVP zones.<br><br>Cannot be active at the same time as Granite Armor.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +DEF(Lethal, Smashing), Res(DeBuff DEF)",
+            icon: "stonearmor_stonearmor.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 0.73,
+                defense: {
+                    smashing: 0.12,
+                    lethal: 0.12
+                },
+                debuffResistance: {
+                    defense: 0.1384
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Stone Skin",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Defense Sets", "Resist Damage"],
+            description: "Your tough skin is naturally resistant to most types of damage. This power is always on and costs no Endurance.",
+            shortHelp: "Auto: Self +Res(All but Psionics), +DEF(All but Psionics)",
+            icon: "stonearmor_stoneskin.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                dotDamage: {
+                    type: "Psionic",
+                    scale: 1.0,
+                    ticks: 5
+                },
+                defense: {
+                    smashing: 0.0375,
+                    lethal: 0.0375,
+                    fire: 0.0375,
+                    cold: 0.0375,
+                    energy: 0.0375,
+                    negative: 0.0375,
+                    psionic: 0.0375,
+                    toxic: 0.0375
+                },
+                resistance: {
+                    smashing: 0.075,
+                    lethal: 0.075,
+                    fire: 0.075,
+                    cold: 0.075,
+                    energy: 0.075,
+                    negative: 0.075,
+                    toxic: 0.075,
+                    psionic: 0.075
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Earth's Embrace",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing", "Resist Damage"],
+            description: "You are so connected to the Earth, you can draw upon its power to add to your health. Activating this power increases your maximum Hit Points and grants you resistance to Toxic Damage.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +HP, Res(Toxic)",
+            icon: "stonearmor_earthsembrace.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 120.0,
+                endurance: 10.4,
+                cast: 1.0,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 2.0,
+                    ticks: 30
+                },
+                resistance: {
+                    toxic: 0.15
+                },
+                healing: {
+                    scale: 202.399425,
+                    perTarget: true
+                },
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Mud Pots",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee AoE Damage", "Slow Movement", "Threat Duration", "Universal Damage Sets"],
+            description: "While this power is active, you draw upon the geothermal power of the Earth to create a bubbling pool of hot mud around you. All foes in melee range will become snared and entrapped in the mud, Immobilizing some and slowing others. The boiling heat from Mud Pots may also deal some damage over time to the snared foes.<br><br><color #fcfc95>Damage: Minor(DoT).</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: PBAoE, Minor DoT(Fire), Foe Immobilize, -SPD",
+            icon: "stonearmor_clay.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 1.04,
+                cast: 2.03,
+                damage: {
+                    type: "Fire",
+                    scale: 0.18
+                },
+                buffDuration: 5.0
+            }
+        },
+        {
+            name: "Rooted",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "While this power is active, you merge with the Earth and draw forth its power to become resistant to Knockback, Sleep, Hold, Disorient and Endurance Drain effects, and increase your Hit Point Regeneration rate. Rooted also grants you resistance to Defense DeBuffs.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +Res(Knockback, Sleep, Disorient, Hold, End Drain, DeBuff DEF), +Regeneration",
+            icon: "stonearmor_rooted.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 1.17,
+                protection: {
+                    hold: 10.379999999999999,
+                    stun: 10.379999999999999,
+                    sleep: 10.379999999999999,
+                    immobilize: 10.379999999999999
+                },
+                debuffResistance: {
+                    tohit: 0.3,
+                    defense: 0.3,
+                    recharge: 0.3,
+                    movement: 0.5
+                },
+                buffDuration: 0.75,
+                stun: 1.0,
+                stunDuration: 0.75,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Crystal Armor",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Endurance Modification"],
+            description: "While this power is active, your skin becomes encrusted in various quartz crystals. Crystal Armor makes Energy and Negative Energy attacks less likely to hit. This power also grants you an Endurance recovery buff and resistance to Defense DeBuffs.<br><br>Crystal Armor also adds an Elusivity defense bonus to Energy and Negative Energy Attacks in PVP zones.<br><br>Cannot be active at the same time as Granite Armor.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +Recovery, +DEF(Energy, Negative), Res(DeBuff DEF)",
+            icon: "stonearmor_crystalarmor.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 1.0,
+                defense: {
+                    energy: 0.12,
+                    negative: 0.12
+                },
+                debuffResistance: {
+                    defense: 0.1384
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Minerals",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Activating this power summons several rare earth rock Minerals to orbit around you. These Minerals can disperse thought patterns and make Psionic attacks less likely to hit. They also bring clarity of the mind reducing the recharge time of your powers, increasing your Perception, and making you resistant to Confusion.<br><br>Cannot be active at the same time as Granite Armor.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +Recharge, +DEF(Psionic), Res(Confuse), +Perception",
+            icon: "stonearmor_mineralcrust.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 0.73,
+                protection: {
+                    confuse: 30.0
+                },
+                defense: {
+                    psionic: 0.1875
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Brimstone Armor",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "While this power is active, your skin becomes encrusted in cracked magma. Brimstone Armor makes you highly resistant to Fire, Cold and Toxic damage, and helps your attacks set enemies on fire, delivering damage over time.<br><br>Cannot be active at the same time as Granite Armor.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +Res(Fire, Cold, Toxic), +Special",
+            icon: "stonearmor_magmaarmor.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 0.73,
+                resistance: {
+                    fire: 0.22499999999999998,
+                    cold: 0.22499999999999998,
+                    toxic: 0.15
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Granite Armor",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Resist Damage"],
+            description: "When you activate this power, you are transformed into a massive bulk of unyielding Granite. Your incredible mass makes you almost completely invulnerable and resistant to most effects, including Defense DeBuffs. However, you also become quite heavy, cannot fly, your attack and movement speed are Slowed and you do less damage.<br><br>Cannot be active at the same time as other Armors in this set, Fly powers, Sprint, Super Speed, or Jump powers.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Self, +Res(All but Psionics), +DEF(All but Psionics), -SPD, -Recharge, -DMG, -Special",
+            icon: "stonearmor_granite.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.13,
+                cast: 0.73,
+                protection: {
+                    hold: 17.299999999999997,
+                    stun: 17.299999999999997,
+                    sleep: 17.299999999999997,
+                    immobilize: 17.299999999999997
+                },
+                defense: {
+                    smashing: 0.11249999999999999,
+                    lethal: 0.11249999999999999,
+                    fire: 0.11249999999999999,
+                    cold: 0.11249999999999999,
+                    energy: 0.11249999999999999,
+                    negative: 0.11249999999999999,
+                    psionic: 0.11249999999999999
+                },
+                resistance: {
+                    smashing: 0.375,
+                    lethal: 0.375,
+                    fire: 0.3,
+                    cold: 0.3,
+                    energy: 0.3,
+                    negative: 0.3,
+                    toxic: 0.3
+                },
+                debuffResistance: {
+                    defense: 0.346
+                },
+                buffDuration: 0.75,
+                stun: 1.0,
+                stunDuration: 0.75
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/stone-armor'] = BRUTE_STONE_ARMOR_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_STONE_ARMOR_POWERSET = BRUTE_STONE_ARMOR_POWERSET;
+}
+
+// ---- js/data/powersets/brute/stone-melee.js ----
+;/**
+ * Stone Melee
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_STONE_MELEE_POWERSET = {
+    name: "Stone Melee",
+    category: "Unknown",
+    description: "Stone Melee powerset",
+    icon: "stone-melee_set.png",
+    powers: [
+        {
+            name: "Stone Fist",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "Your stone covered fists attack swiftly for moderate damage, and may Disorient your opponent.",
+            shortHelp: "Melee DMG(Smashing), Foe Minor Disorient",
+            icon: "stonemelee_stonefist.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 0.83,
+                damage: {
+                    type: "Smashing",
+                    scale: 2.141
+                }
+            }
+        },
+        {
+            name: "Stone Mallet",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "Your control over the earth allows you to form a mallet of solid stone. This Stone Mallet deals heavy damage, and can knock down weak foes.",
+            shortHelp: "Melee, DMG(Smashing), Knockback",
+            icon: "stonemelee_stonemallet.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.61,
+                damage: {
+                    type: "Smashing",
+                    scale: 3.4869
+                }
+            }
+        },
+        {
+            name: "Heavy Mallet",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "A more impressive form of Stone Mallet, the Heavy Mallet deals more damage, but is slower to swing. It has a greater chance of knocking down opponents.",
+            shortHelp: "Melee, DMG(Smashing), Knockback",
+            icon: "stonemelee_heavymallet.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 1.63,
+                damage: {
+                    type: "Smashing",
+                    scale: 4.3009
+                }
+            }
+        },
+        {
+            name: "Build Up",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your chance to hit.",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "stonemelee_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Fault",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Ranged AoE Damage", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "This powerful stomp can cause a seismic disturbance. This will crack the Earth itself and send a Fault towards a targeted foe, throwing him and nearby enemies into the air and possibly Disorienting them. Fault has a chance of dealing damage to foes in between you and your target.",
+            shortHelp: "Close (Targeted AoE), DMG(Smashing), Foe Knockback, Disorient",
+            icon: "stonemelee_fault.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 0.8,
+                range: 20.0,
+                recharge: 20.0,
+                endurance: 10.192,
+                cast: 2.1
+            }
+        },
+        {
+            name: "Taunt",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Taunt foes to attack you. Useful to pull enemies off allies and keep them attacking you to raise your Fury. A To Hit check is required to Taunt enemy players, but is not needed against critter targets.",
+            shortHelp: "Ranged (Targeted AoE), Foe Taunt",
+            icon: "stonemelee_taunt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 10.0,
+                cast: 1.67,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Seismic Smash",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Holds", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "This massive attack hits with all the force of the Earth itself. It deals tremendous amounts of damage, and may Hold the target if they are not defeated outright.",
+            shortHelp: "Melee, DMG(Smashing), Foe Hold",
+            icon: "stonemelee_seismicsmash.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 1.5,
+                damage: {
+                    type: "Smashing",
+                    scale: 5.8099
+                }
+            }
+        },
+        {
+            name: "Hurl Boulder",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Ranged Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You are able to tear up a chunk of ground beneath your feet and Hurl it at an enemy. This attack deals high damage, and can knock foes back and even drop them out of the air if they are flying.",
+            shortHelp: "Ranged, DMG(Smashing), Foe Knockback, -Fly",
+            icon: "stonemelee_hurlboulder.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 9.36,
+                cast: 2.5,
+                damage: {
+                    type: "Smashing",
+                    scale: 3.6159
+                },
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Tremor",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You can cause a localized earthquake immediately around you. This will deal moderate damage to every foe in melee range, while knocking them back.",
+            shortHelp: "PBAoE, DMG(Smashing), Knockback",
+            icon: "stonemelee_tremor.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 14.0,
+                endurance: 13.52,
+                cast: 2.53,
+                damage: {
+                    type: "Smashing",
+                    scale: 2.1324
+                }
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/stone-melee'] = BRUTE_STONE_MELEE_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_STONE_MELEE_POWERSET = BRUTE_STONE_MELEE_POWERSET;
+}
+
+// ---- js/data/powersets/brute/super-reflexes.js ----
+;/**
+ * Super Reflexes
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_SUPER_REFLEXES_POWERSET = {
+    name: "Super Reflexes",
+    category: "Unknown",
+    description: "Super Reflexes powerset",
+    icon: "super-reflexes_set.png",
+    powers: [
+        {
+            name: "Focused Fighting",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "You become more evasive to melee attacks while you have Focused Fighting activated. This will increase your Defense versus melee as long as it is active. Your Focus also offers you resistance to Confuse effects and DeBuffs to Defense. Focused Fighting also adds an Elusivity defense bonus to Melee Attacks in PVP zones.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +DEF(Melee), Res(Confuse, DeBuff DEF)",
+            icon: "superreflexes_focusedfighting.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.13,
+                cast: 0.67,
+                protection: {
+                    confuse: 10.379999999999999
+                },
+                debuffResistance: {
+                    defense: 0.1384
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Focused Senses",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "You become more evasive against ranged attacks while you have Focused Senses activated. This will increase your Defense versus ranged attacks as long as it is active. Your Improved Senses also allow you to perceive stealthy foes as well as resist Defense DeBuffs. Focused Senses also adds Psionic Defense and an Elusivity defense bonus to Psionic and Ranged Attacks in PVP zones.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +DEF(Ranged), +Perception, Res(DeBuff DEF)",
+            icon: "superreflexes_focusedsenses.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.13,
+                cast: 2.03,
+                defense: {
+                    psionic: 0.13875
+                },
+                debuffResistance: {
+                    defense: 0.1384
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Agile",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "You become innately more Agile, and are able to naturally avoid some ranged attacks and resist Defense DeBuffs. Your Agility also grants you minor Damage Resistance to all damage except Toxic and Psionic. This Damage Resistance is only available as you lose Health but it improves as your HP declines. This power is always on, and will permanently increase your Defense versus ranged attacks.",
+            shortHelp: "Auto: Self +DEF(Ranged), Res(DeBuff DEF), Res(All DMG, Special)",
+            icon: "superreflexes_agile.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                resistance: {
+                    smashing: 0.0,
+                    lethal: 0.0,
+                    fire: 0.0,
+                    cold: 0.0,
+                    energy: 0.0,
+                    negative: 0.0,
+                    toxic: 0.0
+                },
+                debuffResistance: {
+                    defense: 0.0692
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Practiced Brawler",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "Your training has allowed you to become a Practiced Brawler, tuning you into a perfect fighting machine. You gain a resistance to Knockback, Disorient, Hold, Sleep, and Immobilization powers for a short duration.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +Res(Knockback, Disorient, Hold, Sleep, Immobilize)",
+            icon: "superreflexes_practicedbrawler.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 200.0,
+                endurance: 10.4,
+                cast: 1.53,
+                protection: {
+                    hold: 10.379999999999999,
+                    stun: 10.379999999999999,
+                    sleep: 10.379999999999999,
+                    immobilize: 10.379999999999999
+                },
+                debuffResistance: {
+                    tohit: 0.3,
+                    defense: 0.3,
+                    recharge: 0.3,
+                    movement: 0.5
+                },
+                buffDuration: 120.0,
+                stun: 1.0,
+                stunDuration: 120.0,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Dodge",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "You have the ability to innately Dodge some melee attacks and you resist Defense DeBuffs. Dodge also grants you minor Damage Resistance to all damage except Toxic and Psionic. This Damage Resistance is only available as you lose Health but it improves as your HP declines. This power is always on, and will permanently increase your Defense versus melee attacks.",
+            shortHelp: "Auto: Self +DEF(Melee), Res(DeBuff DEF), Res(DMG, Special)",
+            icon: "superreflexes_dodge.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                resistance: {
+                    smashing: 0.0,
+                    lethal: 0.0,
+                    fire: 0.0,
+                    cold: 0.0,
+                    energy: 0.0,
+                    negative: 0.0,
+                    toxic: 0.0
+                },
+                debuffResistance: {
+                    defense: 0.0692
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Evasion",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Threat Duration"],
+            description: "You are Evasive against area effect and cone shaped attacks. This power increases your Defense versus such attacks as long as it is active. Evasion also helps you resist Defense DeBuffs. Evasion also adds an Elusivity defense bonus to AOE Attacks in PVP zones.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +DEF(vs. AoE), Res(DeBuff DEF)",
+            icon: "superreflexes_evasion.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.52,
+                cast: 3.0,
+                debuffResistance: {
+                    defense: 0.1384
+                },
+                buffDuration: 2.25
+            }
+        },
+        {
+            name: "Lucky",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Your superior reflexes make you seem incredibly Lucky. Lucky improves your Defense to Area of Effect attacks and grants you resistance to Defense DeBuffs. Lucky also grants you minor Damage Resistance to all damage except Toxic and Psionic. This Damage Resistance is only available as you lose Health but it improves as your HP declines. This power is always on, and permanently increases your chance to evade area effects and cone shaped attacks.",
+            shortHelp: "Auto: Self +DEF(vs. AoE), Res(DeBuff DEF), Res(All DMG, Special)",
+            icon: "superreflexes_lucky.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                resistance: {
+                    smashing: 0.0,
+                    lethal: 0.0,
+                    fire: 0.0,
+                    cold: 0.0,
+                    energy: 0.0,
+                    negative: 0.0,
+                    toxic: 0.0
+                },
+                debuffResistance: {
+                    defense: 0.0692
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Quickness",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "Your Quick reflexes allow you to move faster than normal, as well as resist slow effects. This power is always on and permanently increases your attack rate and movement speed.",
+            shortHelp: "Auto: Self +Recharge, +SPD, Res (Slow)",
+            icon: "superreflexes_quickness.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                debuffResistance: {
+                    recharge: 0.4,
+                    movement: 0.4
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Elude",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Endurance Modification", "Running", "Running & Sprints", "Universal Travel"],
+            description: "You can improve your reflexes, making yourself so quick you can Elude almost any attack, be it ranged, melee, or area effect. Your running speed, jumping height, and Endurance Recovery are also increased. Elude also grants you high resistance to Defense DeBuffs. When Elude wears off, you are left drained of all Endurance and unable to recover Endurance for a while.<br><br><color #fcfc95>Recharge: Extremely Long.</color>",
+            shortHelp: "Self +DEF, + SPD, +Recovery, Res(DeBuff DEF), +Special",
+            icon: "superreflexes_elude.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 1000.0,
+                endurance: 2.6,
+                cast: 2.0,
+                debuffResistance: {
+                    defense: 0.346
+                },
+                buffDuration: 180.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/super-reflexes'] = BRUTE_SUPER_REFLEXES_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_SUPER_REFLEXES_POWERSET = BRUTE_SUPER_REFLEXES_POWERSET;
+}
+
+// ---- js/data/powersets/brute/super-strength.js ----
+;/**
+ * Super Strength
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_SUPER_STRENGTH_POWERSET = {
+    name: "Super Strength",
+    category: "Unknown",
+    description: "Super Strength powerset",
+    icon: "super-strength_set.png",
+    powers: [
+        {
+            name: "Jab",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "A quick jab that deals minor damage, but has a chance of Disorienting the target, especially if coupled with other attacks.",
+            shortHelp: "Melee, DMG(Smashing), Minor Disorient",
+            icon: "superstrength_jab.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 2.0,
+                endurance: 3.536,
+                cast: 1.07,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 1.9090000000000003
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.306
+                        }
+                    ],
+                    scale: 2.2150000000000003
+                },
+                stun: 2.0
+            }
+        },
+        {
+            name: "Punch",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "Your Super Strength Punch can deal a moderate amount of damage, but most of all can knock your opponent off their feet, unable to attack again until they stand up.",
+            shortHelp: "Melee, DMG(Smashing), Knockback",
+            icon: "superstrength_punch.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.2,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.4
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.45
+                        }
+                    ],
+                    scale: 2.85
+                }
+            }
+        },
+        {
+            name: "Haymaker",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "A slow but devastating attack, the Haymaker has a great chance of knocking your opponent down.",
+            shortHelp: "Melee, DMG(Smashing), Knockback",
+            icon: "superstrength_haymaker.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.5,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 3.41
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.738
+                        }
+                    ],
+                    scale: 4.148
+                }
+            }
+        },
+        {
+            name: "Hand Clap",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Stuns", "Threat Duration"],
+            description: "You can clap your hands together with such force that you create a deafening shockwave. This shockwave can knock back nearby foes, and they have a chance to become Disoriented due to the shock to the inner ear. Hand Clap deals no damage.",
+            shortHelp: "PBAoE, Foe Disorient, Knockback",
+            icon: "superstrength_handclap.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 0.8,
+                recharge: 30.0,
+                endurance: 13.0,
+                cast: 1.23,
+                damage: {
+                    type: "Fire",
+                    scale: 0.4871
+                },
+                stun: 2.0
+            }
+        },
+        {
+            name: "Knockout Blow",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Holds", "Knockback", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You can perform a Knockout Blow on your opponent. This punch does Superior damage, and has a great chance of Holding your target.",
+            shortHelp: "Melee, DMG(Smashing), Foe Hold",
+            icon: "superstrength_knockoutblow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 13.2,
+                recharge: 25.0,
+                endurance: 18.512,
+                cast: 2.23,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 6.5209
+                        },
+                        {
+                            type: "Fire",
+                            scale: 1.602
+                        }
+                    ],
+                    scale: 8.1229
+                }
+            }
+        },
+        {
+            name: "Taunt",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Taunt foes to attack you. Useful to pull enemies off allies and keep them attacking you to raise your Fury. A To Hit check is required to Taunt enemy players, but is not needed against critter targets.",
+            shortHelp: "Ranged (Targeted AoE), Foe Taunt",
+            icon: "superstrength_taunt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 10.0,
+                cast: 1.67,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Rage",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "A Rage comes over you, sending you into a berserker fury. While Raging, your damage and chance to hit is dramatically increased. However, when your Rage subsides, you are left with reduced Defense, drained of some of your Endurance, and your attacks are substantially weakened.",
+            shortHelp: "Self +DMG, +To Hit, Delayed Self(Weaken, Special)",
+            icon: "superstrength_rage.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 1.0,
+                recharge: 240.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 2.0,
+                buffDuration: 120.0,
+                defenseBuff: 0.2
+            }
+        },
+        {
+            name: "Hurl",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Ranged Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You are able to tear up a chunk of ground beneath your feet and Hurl it at an enemy. This attack deals high damage, and can knock foes back and even drop them out of the air if they are flying.",
+            shortHelp: "Ranged, DMG(Smashing), Knockback, -Fly",
+            icon: "superstrength_hurl.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 9.36,
+                cast: 2.5,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 3.6159
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.738
+                        }
+                    ],
+                    scale: 4.353899999999999
+                },
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Foot Stomp",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "Using your superior leg strength, you can Stomp your foot to the ground, quaking the earth itself. This is a localized attack against everything in melee range.",
+            shortHelp: "PBAoE Melee, DMG(Smashing), Knockback",
+            icon: "superstrength_footstomp.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 2.1,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.9457
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.639
+                        }
+                    ],
+                    scale: 3.5846999999999998
+                }
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/super-strength'] = BRUTE_SUPER_STRENGTH_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_SUPER_STRENGTH_POWERSET = BRUTE_SUPER_STRENGTH_POWERSET;
+}
+
+// ---- js/data/powersets/brute/titan-weapons.js ----
+;/**
+ * Titan Weapons
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_TITAN_WEAPONS_POWERSET = {
+    name: "Titan Weapons",
+    category: "Unknown",
+    description: "Titan Weapons powerset",
+    icon: "titan-weapons_set.png",
+    powers: [
+        {
+            name: "Crushing Blow",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You swing a mighty crushing blow at your opponent dealing High Smashing damage and reducing their defense.",
+            shortHelp: "Melee, DMG(Smashing), -DEF",
+            icon: "titanweapons_crushingblow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 9.0,
+                recharge: 8.0,
+                endurance: 8.7838,
+                cast: 2.0
+            }
+        },
+        {
+            name: "Defensive Sweep",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Defense Sets", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You take a defensive stance and strike your opponents. Successfully executing this attack will cause light smashing damage to nearby foes, while giving you increased defense against their melee and smashing attacks.<br><br><color #fcfc95>Notes: Defensive Sweep is unaffected by Arc changes.</color>",
+            shortHelp: "Melee(Cone), DMG(Smashing), Self +DEF(Melee, Smash)",
+            icon: "titanweapons_defensivesweep.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 2.0944,
+            effects: {
+                accuracy: 1.0,
+                range: 10.0,
+                recharge: 4.0,
+                endurance: 5.356,
+                cast: 2.2
+            }
+        },
+        {
+            name: "Titan Sweep",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You make a sweeping slash with your weapon, causing high damage and possibly knocking your opponent down.<br><br><color #fcfc95>Notes: Titan Sweep is unaffected by Arc changes.</color>",
+            shortHelp: "Melee (Cone), DMG(Smashing), Foe Knockdown",
+            icon: "titanweapons_sweepingstrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 2.0944,
+            effects: {
+                accuracy: 1.0,
+                range: 10.0,
+                recharge: 10.0,
+                endurance: 10.4978,
+                cast: 2.43
+            }
+        },
+        {
+            name: "Build Momentum",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Grants you momentum, moderately increases the amount of damage you deal for a few seconds and slightly increases your chance to hit. Build Momentum grants you Momentum for 10 seconds and it replaces any remaining Momentum you may still have.",
+            shortHelp: "Self +DMG, +To Hit, +Momentum",
+            icon: "titanweapons_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 2.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Follow Through",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee Damage", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "You Follow Through with a massive attack dealing Superior Smashing damage, knocking your opponent down and possibly stunning them.<br><br><color #fcfc95>Notes: Follow Through requires Momentum in order to be activated.</color>",
+            shortHelp: "Melee, DMG(Smashing), Knockdown, Stun, Requires Momentum",
+            icon: "titanweapons_followthrough.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 9.0,
+                recharge: 10.0,
+                endurance: 10.4978,
+                cast: 1.1,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 3.5300000000000002
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.9702
+                        }
+                    ],
+                    scale: 4.5002
+                },
+                stun: 3.0
+            }
+        },
+        {
+            name: "Taunt",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Taunts a foe, and some nearby foes, to attack you. Useful for pulling villains off an ally who find themselves in over their head. Taunted foes tend to ignore other Heroes and focus on you for quite a while, so use this power cautiously. An Accuracy check required to Taunt enemy players, but is not needed against critter targets.",
+            shortHelp: "Ranged (Targeted AoE), Foe Taunt",
+            icon: "titanweapons_taunt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 10.0,
+                cast: 1.67,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Rend Armor",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Brute Archetype Sets", "Defense Debuff", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You batter your enemy with your mighty weapon dealing Extreme Smashing damage and reducing their resistance to damage as well as their defense to all types of attacks for a short time.",
+            shortHelp: "Melee, DMG(Smashing), Foe -Def(All), -Res(All)",
+            icon: "titanweapons_shatterarmor.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 9.0,
+                recharge: 16.0,
+                endurance: 15.6395,
+                cast: 2.3
+            }
+        },
+        {
+            name: "Whirling Smash",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You perform a powerful Whirling Smash that deals Moderate Smashing damage, and can knock an opponent down.<br><br><color #fcfc95>Notes: Whirling Smash requires Momentum in order to be activated.</color>",
+            shortHelp: "PBAoE Melee, DMG(Smashing), Knockdown, Requires Momentum",
+            icon: "titanweapons_whirlingslice.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 14.0,
+                endurance: 13.9256,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 1.7040000000000002
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.6727
+                        }
+                    ],
+                    scale: 2.3767
+                }
+            }
+        },
+        {
+            name: "Arc of Destruction",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You swing your weapon in a devastating Arc of Destruction that deals Superior Smashing damage and has a good chance to knock foes down. Arc of Destruction may only be used while on the ground.<br><br><color #fcfc95>Notes: Arc of Destruction is unaffected by Arc changes.</color>",
+            shortHelp: "Melee (Cone), DMG(Smashing), Foe Knockback",
+            icon: "titanweapons_arcofdestruction.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 2.0944,
+            effects: {
+                accuracy: 1.0,
+                range: 10.0,
+                recharge: 16.0,
+                endurance: 15.6395,
+                cast: 2.7
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/titan-weapons'] = BRUTE_TITAN_WEAPONS_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_TITAN_WEAPONS_POWERSET = BRUTE_TITAN_WEAPONS_POWERSET;
+}
+
+// ---- js/data/powersets/brute/war-mace.js ----
+;/**
+ * War Mace
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_WAR_MACE_POWERSET = {
+    name: "War Mace",
+    category: "Unknown",
+    description: "War Mace powerset",
+    icon: "war-mace_set.png",
+    powers: [
+        {
+            name: "Bash",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "You perform a Bashing attack with your mace that deals moderate damage, and can sometimes Disorient your opponent.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Melee, Light DMG(Smashing), Minor Disorient",
+            icon: "mace_bash.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.33,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.491
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.45
+                        }
+                    ],
+                    scale: 2.9410000000000003
+                },
+                stun: 2.0
+            }
+        },
+        {
+            name: "Pulverize",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "You attempt to Pulverize your opponent. This attack is slower than Bash but causes more damage. It also has a chance of Disorienting your opponent for a brief time.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Melee, Moderate DMG(Smashing), Minor Disorient",
+            icon: "mace_pulverize.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.5,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 3.41
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.738
+                        }
+                    ],
+                    scale: 4.148
+                },
+                stun: 2.0
+            }
+        },
+        {
+            name: "Jawbreaker",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "This upward swing attempts to shatter your opponent's jaw, and has a chance to send him flying upwards into the air.<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Melee, High DMG(Smashing), Knockup",
+            icon: "mace_jawbreaker.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.83,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 4.040900000000001
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.882
+                        }
+                    ],
+                    scale: 4.9229
+                }
+            }
+        },
+        {
+            name: "Build Up",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your chance to hit.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "mace_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Clobber",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee Damage", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "You Clobber your foe with a massive swing of your mace. This attack deals exceptional damage and can leave most opponents disoriented for a period of time.<br><br><color #fcfc95>Damage: Superior.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee, Superior DMG(Smashing), Disorient",
+            icon: "mace_clobber.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.23,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 4.8209
+                        },
+                        {
+                            type: "Fire",
+                            scale: 1.314
+                        }
+                    ],
+                    scale: 6.1349
+                },
+                stun: 3.0
+            }
+        },
+        {
+            name: "Taunt",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Taunt foes to attack you. Useful to pull enemies off allies and keep them attacking you to raise your Fury. A To Hit check is required to Taunt enemy players, but is not needed against critter targets.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged (Targeted AoE), Foe Taunt",
+            icon: "mace_taunt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 10.0,
+                cast: 1.67,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Whirling Mace",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Melee AoE Damage", "Stuns", "Threat Duration", "Universal Damage Sets"],
+            description: "You swing your mace in a circle all around you, attacking everyone in melee range. Your Whirling Mace deals moderate damage, and has a chance to Disorient every foe you hit.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE Melee, Light DMG(Smashing), Minor Disorient",
+            icon: "mace_whirlingmace.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.05,
+                recharge: 14.0,
+                endurance: 13.0,
+                cast: 2.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.7365000000000004
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.504
+                        }
+                    ],
+                    scale: 3.2405000000000004
+                },
+                stun: 2.0
+            }
+        },
+        {
+            name: "Shatter",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You attempt to Shatter the bones of your opponent by striking them with all your might. This attack will deal great damage and can knock foes back a great ways. The power of this attack can actually extend a short distance through multiple foes.<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee (Cone), DMG(Smashing), Knockback",
+            icon: "mace_shatter.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 0.7854,
+            effects: {
+                accuracy: 1.05,
+                range: 8.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 2.33,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 4.3604
+                        },
+                        {
+                            type: "Fire",
+                            scale: 1.026
+                        }
+                    ],
+                    scale: 5.3864
+                }
+            }
+        },
+        {
+            name: "Crowd Control",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Brute Archetype Sets", "Knockback", "Melee AoE Damage", "Threat Duration", "Universal Damage Sets"],
+            description: "You swing your mace in a wide arc in front of you. This attack strikes all foes within melee range, deals them serious damage, and knocks them down.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee (Cone), Moderate DMG(Smashing), Knockback",
+            icon: "mace_crowdcontrol.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 3.1416,
+            effects: {
+                accuracy: 1.05,
+                range: 8.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 2.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 3.1260000000000003
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.7245
+                        }
+                    ],
+                    scale: 3.8505000000000003
+                }
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/war-mace'] = BRUTE_WAR_MACE_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_WAR_MACE_POWERSET = BRUTE_WAR_MACE_POWERSET;
+}
+
+// ---- js/data/powersets/brute/willpower.js ----
+;/**
+ * Willpower
+ * Character Level: 50
+ * Archetype: brute
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const BRUTE_WILLPOWER_POWERSET = {
+    name: "Willpower",
+    category: "Unknown",
+    description: "Willpower powerset",
+    icon: "willpower_set.png",
+    powers: [
+        {
+            name: "High Pain Tolerance",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Healing", "Resist Damage"],
+            description: "You have a greater tolerance to pain than others. You are also slightly resistant to all types of damage. This power is always on and costs no Endurance.",
+            shortHelp: "Auto: Self +Res (All), +MaxHealth",
+            icon: "willpower_highpaintolerance.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                resistance: {
+                    smashing: 0.056249999999999994,
+                    lethal: 0.056249999999999994,
+                    fire: 0.056249999999999994,
+                    cold: 0.056249999999999994,
+                    energy: 0.056249999999999994,
+                    negative: 0.056249999999999994,
+                    psionic: 0.056249999999999994,
+                    toxic: 0.056249999999999994
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Mind Over Body",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "When you toggle on this power, you empower your Mind Over Body to become highly resistant to Smashing, Lethal and Psionic damage.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Toggle: Self +Res(Smash, Lethal, Psionics)",
+            icon: "willpower_mindoverbody.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.104,
+                cast: 0.67,
+                resistance: {
+                    smashing: 0.16874999999999998,
+                    lethal: 0.16874999999999998,
+                    psionic: 0.15
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Fast Healing",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Healing"],
+            description: "You heal Hit Points at a faster rate than normal. This power is always on.",
+            shortHelp: "Auto: Self +Regeneration",
+            icon: "willpower_fasthealing.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                debuffResistance: {
+                    regeneration: 0.25949999999999995
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Indomitable Will",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "When you toggle on this power, it grants protection from Sleep, Disorient, Fear, Immobilize, Confusions, Repel, Knockback and Hold effects. Indomitable Will also grants a moderate defense to Psionic based attacks.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self Res (Disorient, Hold, Immobilize, Sleep, Fear, Confuse, Repel, Knockback). DEF(Psionics)",
+            icon: "willpower_indomitablewill.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 0.73,
+                protection: {
+                    hold: 10.379999999999999,
+                    stun: 10.379999999999999,
+                    immobilize: 10.379999999999999,
+                    fear: 10.379999999999999,
+                    confuse: 10.379999999999999,
+                    sleep: 10.379999999999999
+                },
+                defense: {
+                    psionic: 0.075
+                },
+                debuffResistance: {
+                    tohit: 0.3,
+                    defense: 0.3,
+                    recharge: 0.3,
+                    movement: 0.5
+                },
+                stun: 1.0,
+                stunDuration: 0.75,
+                buffDuration: 0.75,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Rise to the Challenge",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing", "Threat Duration", "To Hit Debuff"],
+            description: "The more the odds are against you, the more determined you become. When surrounded by foes, your ability to regenerate health increases greatly. Additionally, your resolve and the look in your eye is enough to leave most foes shaken, so their attacks are less accurate. The first foe you engage in melee grants the highest regeneration bonus, and up to 10 foes can contribute to this effect.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Self +Regen, Foe -To Hit",
+            icon: "willpower_risetothechallenge.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.208,
+                cast: 3.0,
+                tohitDebuff: 0.5,
+                buffDuration: 1.0
+            }
+        },
+        {
+            name: "Quick Recovery",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "You recover Endurance at a faster rate than normal. This power is always on.",
+            shortHelp: "Auto: Self +Recovery",
+            icon: "willpower_quickrecovery.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Heightened Senses",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "You become more aware of your environment and its hazards while this power is activated. This will increase your Defense versus environmental damage as long as it is active. Your Heightened Senses also allow you to perceive stealthy foes and resist Defense DeBuffs.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Toggle: Self +DEF(Smash, Lethal, Fire, Cold, Energy, Negative Energy), +Per",
+            icon: "willpower_heightenedsenses.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.104,
+                cast: 0.67,
+                defense: {
+                    smashing: 0.02475,
+                    lethal: 0.02475,
+                    fire: 0.0975,
+                    cold: 0.0975,
+                    energy: 0.0975,
+                    negative: 0.0975
+                },
+                debuffResistance: {
+                    defense: 0.173
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Resurgence",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "Should you fall in battle, you can Revive yourself from the brink of death. You will revive with most of your Hit Points and half your Endurance and be protected from XP Debt for 20 seconds. Additionally, for 90 seconds, your damage, attack rate, endurance recovery and chance to hit will be improved, then for another 45 seconds, your damage and chance to hit will be diminished. You will also have 15 seconds of immunity to most damage.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Self Rez, Special",
+            icon: "willpower_resurgence.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 300.0,
+                cast: 1.5,
+                buffDuration: 0.5,
+                tohitBuff: 3.0,
+                tohitDebuff: 3.0
+            }
+        },
+        {
+            name: "Strength of Will",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "When you activate this power, you not only become extremely resistant to most damage, but also to Disorient, Immobilization, Hold, Knockback, Repel and Sleep effects. Strength of Will costs little Endurance to activate and increases your recovery for its duration, but when it wears off you are left exhausted, and substantially drained of Endurance.<br><br><color #fcfc95>Notes: Strength of Will is unaffected by Recharge Time changes.</color><br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Self, +Res(Disorient, Sleep, Hold, Immobilize, Repel, Knockback, All DMG), +Recovery",
+            icon: "willpower_strengthofwill.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 300.0,
+                endurance: 2.6,
+                cast: 3.1,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.5,
+                            ticks: 60
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 2.5,
+                            ticks: 60
+                        },
+                        {
+                            type: "Fire",
+                            scale: 1.25,
+                            ticks: 60
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.25,
+                            ticks: 60
+                        },
+                        {
+                            type: "Energy",
+                            scale: 1.25,
+                            ticks: 60
+                        },
+                        {
+                            type: "Negative",
+                            scale: 1.25,
+                            ticks: 60
+                        },
+                        {
+                            type: "Psionic",
+                            scale: 1.25,
+                            ticks: 60
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 1.25,
+                            ticks: 60
+                        }
+                    ]
+                },
+                protection: {
+                    stun: 17.299999999999997,
+                    sleep: 17.299999999999997,
+                    immobilize: 17.299999999999997,
+                    hold: 17.299999999999997
+                },
+                resistance: {
+                    smashing: 0.1875,
+                    lethal: 0.1875,
+                    fire: 0.09375,
+                    cold: 0.09375,
+                    energy: 0.09375,
+                    negative: 0.09375,
+                    psionic: 0.09375,
+                    toxic: 0.09375
+                },
+                buffDuration: 120.0,
+                stun: 1.0,
+                stunDuration: 120.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['brute/willpower'] = BRUTE_WILLPOWER_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.BRUTE_WILLPOWER_POWERSET = BRUTE_WILLPOWER_POWERSET;
+}
+
+// ---- js/data/epics/brute/brute_leviathan_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Leviathan Mastery
+ * Archetype: Brute
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\brute_leviathan_mastery
+ */
+
+const EPIC_BRUTE_LEVIATHAN_MASTERY = {
+  "id": "brute_leviathan_mastery",
+  "name": "Leviathan Mastery",
+  "displayName": "Leviathan Mastery",
+  "archetype": "brute",
+  "description": "Captain Mako has granted you access to the power of the Leviathan. The Leviathan is an ancient gargantuan entity who slumbers under Sharkhead Isle. Worshiped by the Coralax, the Leviathan has given Captain Mako many abilities and now he has taught you how to harness its power.",
+  "icon": "brute_leviathan_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Spirit Shark",
+      "fullName": "Epic.Brute_Leviathan_Mastery.Spirit_Shark",
+      "rank": 1,
+      "available": 34,
+      "description": "You are empowered with the Spirit of the Mako Shark. You can project this spirit to attack and maul your opponent. The Shark Spirit will manifest and attack your foe, quickly dealing heavy lethal damage over time. The damage over time increases the more hunger stacks you have. All hunger Leviathan Hunger stacks are consumed when you successfully hit an enemy with this power. When you own this power, most actions that cost endurance will have a chance of granting a Leviathan Hunger stack.",
+      "shortHelp": "Ranged, DoT(Lethal), Foe Knockback, -Leviathan Hunger",
+      "icon": "arachnos_patron_targetedrangedhighdmg.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Brute) || ($archetype == @Class_Tanker))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 13.0,
+        "endurance": 9.1,
+        "activationTime": 2.0,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Fire",
+          "scale": 0.063,
+          "table": "Ranged_Damage"
+        },
+        "protection": {
+          "knockback": 1.0
+        }
+      }
+    },
+    {
+      "name": "School of Sharks",
+      "fullName": "Epic.Brute_Leviathan_Mastery.School_of_Sharks",
+      "rank": 2,
+      "available": 34,
+      "description": "You can call forth a school of vicious Shark Spirits that will swim out in a cone formation and will encircle your foes, draining their spirit energy. The encircling Shark Spirits will immobilize most foes while they deal negative energy damage over time. Both you and the target must be Near the Ground for this power to activate.",
+      "shortHelp": "Ranged (Cone), DoT(Negative), Foe Immobilize",
+      "icon": "arachnos_patron_coneimmobilize.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Brute) || ($archetype == @Class_Tanker))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Immobilize",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 50.0,
+        "recharge": 16.0,
+        "endurance": 10.751,
+        "activationTime": 2.37,
+        "effectArea": "Cone",
+        "radius": 50.0,
+        "arc": 0.5236,
+        "damage": {
+          "type": "Fire",
+          "scale": 0.0377,
+          "table": "Ranged_Damage"
+        },
+        "protection": {
+          "immobilize": 3.0
+        },
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Bile Spray",
+      "fullName": "Epic.Brute_Leviathan_Mastery.Chum_Spray",
+      "rank": 3,
+      "available": 37,
+      "description": "Sharks will eat anything, so their stomach acid must be powerful indeed. You can regurgitate this acid and spew a corrosive spray of bile at a foe. Affected foes in the cone area will take toxic damage over time. You must be level 38 and have one other Leviathan Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Cone), DoT(Toxic)",
+      "icon": "arachnos_patron_rangedconemoderatedmg.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 32.0,
+        "endurance": 18.98,
+        "activationTime": 1.6,
+        "effectArea": "Cone",
+        "radius": 60.0,
+        "arc": 0.5236,
+        "damage": {
+          "type": "Fire",
+          "scale": 0.045,
+          "table": "Ranged_Damage"
+        }
+      }
+    },
+    {
+      "name": "Arctic Breath",
+      "fullName": "Epic.Brute_Leviathan_Mastery.Arctic_Breath",
+      "rank": 4,
+      "available": 40,
+      "description": "Sharks will eat anything, so their stomach acid must be powerful indeed. You can regurgitate this freezing acid and spew a corrosive spray of bile at a foe. Affected foes in the cone area will take cold damage over time, and have their damage resistance, Defense, movement rate, and recharge rate reduced. This ice will stick to foes, causing them to fall down occasionally. You must be level 41 and have one other Leviathan Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Cone), DoT(Cold), Foe -Speed, -Recharge, -DEF -Res, knock down",
+      "icon": "arachnos_patron_coneslow.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate Defense Debuff",
+        "Defense Debuff",
+        "Ranged AoE Damage",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 32.0,
+        "endurance": 18.98,
+        "activationTime": 2.33,
+        "effectArea": "Cone",
+        "radius": 60.0,
+        "arc": 0.5236,
+        "damage": {
+          "type": "Fire",
+          "scale": 0.045,
+          "table": "Ranged_Damage"
+        },
+        "protection": {
+          "knockback": 1.0
+        },
+        "resistance": {
+          "smashing": {
+            "scale": -1.5,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "lethal": {
+            "scale": -1.5,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "fire": {
+            "scale": -1.5,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "cold": {
+            "scale": -1.5,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "energy": {
+            "scale": -1.5,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "negative": {
+            "scale": -1.5,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "psionic": {
+            "scale": -1.5,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "toxic": {
+            "scale": -1.5,
+            "table": "Ranged_Debuff_Res_Dmg"
+          }
+        },
+        "defense": {
+          "all": {
+            "scale": 1.5,
+            "table": "Ranged_Debuff_Def"
+          }
+        }
+      }
+    },
+    {
+      "name": "Summon Guardian",
+      "fullName": "Epic.Brute_Leviathan_Mastery.Summon_Guardian",
+      "rank": 5,
+      "available": 43,
+      "description": "Captain Mako has shown you how to summon a Coralax Guardian Sentinel to do your bidding. These creatures are composed of living coral made from the sea-goddess Merulina. Your access to this Guardian is very limited. You can only summon it once every 15 minutes and it will leave after 4 minutes, or if you exit a zone or mission. You must be level 44 and have two other Leviathan Mastery Powers before selecting this power.",
+      "shortHelp": "Summon Sentinel: Ranged DMG(Smashing)",
+      "icon": "arachnos_patron_summononepet.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Immobilize",
+        "Knockback",
+        "Pet Damage",
+        "Recharge Intensive Pets",
+        "Slow Movement",
+        "Stuns",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 900.0,
+        "endurance": 26.0,
+        "activationTime": 3.2,
+        "effectArea": "Location"
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['brute_leviathan_mastery'] = EPIC_BRUTE_LEVIATHAN_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/brute/brute_mace_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Mace Mastery
+ * Archetype: Brute
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\brute_mace_mastery
+ */
+
+const EPIC_BRUTE_MACE_MASTERY = {
+  "id": "brute_mace_mastery",
+  "name": "Mace Mastery",
+  "displayName": "Mace Mastery",
+  "archetype": "brute",
+  "description": "Black Scorpion has granted you access to the advanced technology of the Executioner's Mace. The signature weapon of the Bane Spider Executioner, it is not a typical clumsy mace. The Executioner's Mace is capable of firing a variety of energy projectiles and grenades. It can even be modified to summon and command some or Black Scorpion's RV technologies.",
+  "icon": "brute_mace_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Mace Blast",
+      "fullName": "Epic.Brute_Mace_Mastery.Mace_Blast",
+      "rank": 1,
+      "available": 34,
+      "description": "The Executioner's Mace is capable of firing a powerful bolt of kinetic energy. The blast is powerful enough that it may knock some foes back. Arachnos Bane Spider Troopers call this the Power Blast. The Arbiters who invented it scoff at this simple term.",
+      "shortHelp": "Ranged, DMG(Energy), Foe Knockback",
+      "icon": "arachnos_patron_targetedrangedhighdmg.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Brute) || ($archetype == @Class_Tanker))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 80.0,
+        "recharge": 12.0,
+        "endurance": 8.58,
+        "activationTime": 2.0,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Energy",
+          "scale": 2.16,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Web Envelope",
+      "fullName": "Epic.Brute_Mace_Mastery.Web_Envelope",
+      "rank": 2,
+      "available": 34,
+      "description": "The Executioner's Mace can lob a modified Web Grenade. Upon impact, the Web Grenade expels a strong, tenuous, and very sticky substance that can Immobilize most targets in a wide area. This device deals toxic damage over time and does not prevent targets from attacking, although their attack rate is Slowed. The Web can bring down flying entities and halts jumping.",
+      "shortHelp": "Ranged (Targeted AoE) DoT(Toxic), Immobilize, -Recharge, -Fly, -Jump",
+      "icon": "arachnos_patron_rangedaoeimmobilize.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Brute) || ($archetype == @Class_Tanker))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Immobilize",
+        "Ranged AoE Damage",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 50.0,
+        "recharge": 16.0,
+        "endurance": 10.751,
+        "activationTime": 2.0,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "protection": {
+          "immobilize": 3.0
+        },
+        "damage": {
+          "type": "Toxic",
+          "scale": 0.2503,
+          "table": "Ranged_PvPDamage"
+        },
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Focused Accuracy",
+      "fullName": "Epic.Brute_Mace_Mastery.Focused_Accuracy",
+      "rank": 3,
+      "available": 37,
+      "description": "When this power is activated, the Villain focuses their senses to dramatically improve their accuracy. Additionally, Focused Accuracy increase your Perception, allowing you to better see stealthy foes. It also grants you resistance to powers that DeBuff your Accuracy. Focused Accuracy is a toggle power and must be activated and deactivated manually. Like all toggle powers, while active, Focused Accuracy drains Endurance while active. You must be level 38 and have one other Mace Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Self +To Hit, +ACC, +Perception, Res(DeBuff To Hit)",
+      "icon": "arachnos_patron_selftohitbuff.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "To Hit Buff"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 10.0,
+        "endurance": 0.195,
+        "activationTime": 1.17,
+        "effectArea": "SingleTarget",
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Disruptor Blast",
+      "fullName": "Epic.Brute_Mace_Mastery.Disruptor_Blast",
+      "rank": 4,
+      "available": 40,
+      "description": "Fires a tremendous charge of kinetic energy from your Executioner's Mace. This charge is so powerful it will explode on impact, blasting all nearby foes. Some affected foes may be knocked back by the force of the blast. You must be level 41 and have one other Mace Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Targeted AoE), DMG(Energy), Foe Knockback",
+      "icon": "arachnos_patron_rangedaoemoderatedmg.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 80.0,
+        "recharge": 32.0,
+        "endurance": 18.98,
+        "activationTime": 2.0,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "damage": {
+          "type": "Energy",
+          "scale": 0.9477,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Summon Blaster",
+      "fullName": "Epic.Brute_Mace_Mastery.Summon_Blaster",
+      "rank": 5,
+      "available": 43,
+      "description": "Black Scorpion has granted you an Arachnobot Blaster for you to command. Arachnobot Blasters were created by Arachnos Orb Weavers to take down particularly powerful super-powered threats. Your access to this Arachnobot is very limited. You must be level 44 and have two other Mace Mastery Powers before selecting this power.",
+      "shortHelp": "Summon Arachnobot: Ranged DMG(Energy)",
+      "icon": "arachnos_patron_summononepet.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Immobilize",
+        "Knockback",
+        "Pet Damage",
+        "Recharge Intensive Pets",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 900.0,
+        "endurance": 26.0,
+        "activationTime": 3.03,
+        "effectArea": "Location"
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['brute_mace_mastery'] = EPIC_BRUTE_MACE_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/brute/brute_mu_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Mu Mastery
+ * Archetype: Brute
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\brute_mu_mastery
+ */
+
+const EPIC_BRUTE_MU_MASTERY = {
+  "id": "brute_mu_mastery",
+  "name": "Mu Mastery",
+  "displayName": "Mu Mastery",
+  "archetype": "brute",
+  "description": "Scirocco has taught you the ancient powers of the Mu. In their eternal struggle against the Oranbega, the Mu have unlocked many mystical powers, including their very signature crimson lightning. Now you possess their secrets.",
+  "icon": "brute_mu_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Mu Lightning",
+      "fullName": "Epic.Brute_Mu_Mastery.Mu_Lightning",
+      "rank": 1,
+      "available": 34,
+      "description": "You can send a large blast of Mu electrical energy at a foe, dealing heavy damage and draining some Endurance. Some of this Endurance may transfer back to you.",
+      "shortHelp": "Ranged, DMG(Energy), Foe -End",
+      "icon": "arachnos_patron_targetedrangedhighdmg.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Brute) || ($archetype == @Class_Tanker))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 12.0,
+        "endurance": 8.58,
+        "activationTime": 1.17,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Fire",
+          "scale": 0.594,
+          "table": "Ranged_Damage"
+        },
+        "recovery": {
+          "scale": -3.0,
+          "table": "Ranged_Ones"
+        }
+      }
+    },
+    {
+      "name": "Electrifying Fences",
+      "fullName": "Epic.Brute_Mu_Mastery.Electrifying_Fences",
+      "rank": 2,
+      "available": 34,
+      "description": "The Electrifying Fences attempts to Immobilize a group of foes in an area. This power deals some energy damage over time as it slowly drains some Endurance.",
+      "shortHelp": "Ranged (Targeted AoE), DoT(Energy), Foe Immobilize, -END",
+      "icon": "arachnos_patron_rangedaoeimmobilize.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Brute) || ($archetype == @Class_Tanker))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Immobilize",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 50.0,
+        "recharge": 16.0,
+        "endurance": 10.751,
+        "activationTime": 1.17,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "damage": {
+          "type": "Fire",
+          "scale": 0.0377,
+          "table": "Ranged_Damage"
+        },
+        "protection": {
+          "immobilize": 3.0
+        },
+        "resistance": {},
+        "recovery": {
+          "scale": -1.0,
+          "table": "Ranged_Ones"
+        }
+      }
+    },
+    {
+      "name": "Ball Lightning",
+      "fullName": "Epic.Brute_Mu_Mastery.Ball_Lightning",
+      "rank": 3,
+      "available": 37,
+      "description": "Hurls a highly charged ball of Mu lightning that explodes on contact. Ball Lightning deals good damage in an area of effect, and drains some Endurance from each target it hits. You must be level 38 and have one other Mu Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Targeted AoE), DoT(Energy), Foe -End",
+      "icon": "arachnos_patron_rangedaoemoderatedmg.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 32.0,
+        "endurance": 18.98,
+        "activationTime": 1.07,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "damage": {
+          "type": "Fire",
+          "scale": 0.081,
+          "table": "Ranged_Damage"
+        },
+        "recovery": {
+          "scale": -1.0,
+          "table": "Ranged_Ones"
+        }
+      }
+    },
+    {
+      "name": "Static Discharge",
+      "fullName": "Epic.Brute_Mu_Mastery.Static_Discharge",
+      "rank": 4,
+      "available": 40,
+      "description": "Hurls multiple bolts of Mu Electricity in an arc that deals damage and drains Endurance from all affected foes in the area. You must be level 41 and have one other Mu Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Cone), DMG(Energy), -END",
+      "icon": "arachnos_patron_rangedconemoderatedmg.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 40.0,
+        "recharge": 24.0,
+        "endurance": 18.98,
+        "activationTime": 2.07,
+        "effectArea": "Cone",
+        "radius": 40.0,
+        "arc": 0.7854,
+        "damage": {
+          "type": "Fire",
+          "scale": 0.432,
+          "table": "Ranged_Damage"
+        },
+        "recovery": {
+          "scale": -1.0,
+          "table": "Ranged_Ones"
+        }
+      }
+    },
+    {
+      "name": "Summon Striker",
+      "fullName": "Epic.Brute_Mu_Mastery.Summon_Striker",
+      "rank": 5,
+      "available": 43,
+      "description": "Scirocco has shown you how to call upon a mystical Mu Striker to assist you. The Mu pulse with the blood of their slaughtered ancestors in their veins, and are well practiced in the dark arts. Your access to this Striker is very limited. You must be level 44 and have two other Mu Mastery Powers before selecting this power.",
+      "shortHelp": "Summon Mu Strike: Ranged DMG(Energy)",
+      "icon": "arachnos_patron_summononepet.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "Hold",
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Holds",
+        "Pet Damage",
+        "Recharge Intensive Pets",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 900.0,
+        "endurance": 26.0,
+        "activationTime": 1.17,
+        "effectArea": "Location"
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['brute_mu_mastery'] = EPIC_BRUTE_MU_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/brute/brute_soul_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Soul Mastery
+ * Archetype: Brute
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\brute_soul_mastery
+ */
+
+const EPIC_BRUTE_SOUL_MASTERY = {
+  "id": "brute_soul_mastery",
+  "name": "Soul Mastery",
+  "displayName": "Soul Mastery",
+  "archetype": "brute",
+  "description": "Ghost Widow has granted you access to the power of darkness and souls. She has shown you how to use the souls of your victims to destroy your enemies. This has granted you access to powers and abilities you have never had before.",
+  "icon": "brute_soul_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Gloom",
+      "fullName": "Epic.Brute_Soul_Mastery.Gloom",
+      "rank": 1,
+      "available": 34,
+      "description": "Gloom slowly drains a target of life, while reducing his Accuracy. Slower than Dark Blast, but deals more damage over time.",
+      "shortHelp": "Ranged, DoT(Negative), Foe -ACC",
+      "icon": "arachnos_patron_targetedrangedhighdmg.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Brute) || ($archetype == @Class_Tanker))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate To-Hit Debuff",
+        "Ranged Damage",
+        "To Hit Debuff",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 16.0,
+        "endurance": 10.66,
+        "activationTime": 1.1,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Fire",
+          "scale": 0.099,
+          "table": "Ranged_Damage"
+        }
+      }
+    },
+    {
+      "name": "Soul Tentacles",
+      "fullName": "Epic.Brute_Soul_Mastery.Soul_Tentacles",
+      "rank": 2,
+      "available": 34,
+      "description": "You can create a cone shaped rift to the Netherworld that allows the souls of the damned to slip into our reality. These Soul Tentacles will snare all foes within range, Immobilizing them while they drain their life.",
+      "shortHelp": "Ranged (Cone), DMG(Negative), Foe Immobilize",
+      "icon": "arachnos_patron_coneimmobilize.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Brute) || ($archetype == @Class_Tanker))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Immobilize",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 50.0,
+        "recharge": 20.0,
+        "endurance": 12.74,
+        "activationTime": 1.67,
+        "effectArea": "Cone",
+        "radius": 50.0,
+        "arc": 0.5236,
+        "damage": {
+          "type": "Fire",
+          "scale": 0.045,
+          "table": "Ranged_Damage"
+        },
+        "protection": {
+          "immobilize": 3.0
+        },
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Darkest Night",
+      "fullName": "Epic.Brute_Soul_Mastery.Darkest_Night",
+      "rank": 3,
+      "available": 37,
+      "description": "While active, you channel Negative Energy onto a targeted foe. Darkest Night decreases the damage potential and chance to hit of the target, and all foes nearby, as long as you keep the power active. You must be level 38 and have one other Soul Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Ranged (Targeted AoE), Foe -DMG -To Hit",
+      "icon": "arachnos_patron_aoedamagedebuff.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "To Hit Debuff"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 70.0,
+        "recharge": 20.0,
+        "endurance": 0.325,
+        "activationTime": 2.37,
+        "effectArea": "AoE",
+        "radius": 15.0
+      }
+    },
+    {
+      "name": "Dark Obliteration",
+      "fullName": "Epic.Brute_Soul_Mastery.Dark_Obliteration",
+      "rank": 4,
+      "available": 40,
+      "description": "You hurl a large blast of negative energy that violently explodes on impact, exposing the dark power of the Netherworld to all foes near the target. Dark Obliteration can reduce the Accuracy of all affected targets. You must be level 41 and have one other Soul Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Targeted AoE), DMG(Negative), Foe -ACC",
+      "icon": "arachnos_patron_rangedaoemoderatedmg.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate To-Hit Debuff",
+        "Ranged AoE Damage",
+        "To Hit Debuff",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 32.0,
+        "endurance": 18.98,
+        "activationTime": 1.0,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "damage": {
+          "type": "Fire",
+          "scale": 0.405,
+          "table": "Ranged_Damage"
+        }
+      }
+    },
+    {
+      "name": "Summon Widow",
+      "fullName": "Epic.Brute_Soul_Mastery.Summon_Widow",
+      "rank": 5,
+      "available": 43,
+      "description": "Ghost Widow has assigned a beautiful but deadly Blood Widow assassins for you to command. Their weapons of choice include wrist retractable mounted razors and darts, all tipped in deadly poison. Your access to this Blood Widow is very limited, and you can only summon her once every 15 minutes and she will leave after 4 minutes, until defeated, or until you leave a zone or mission. You must be level 44 and have two other Soul Mastery Powers before selecting this power.",
+      "shortHelp": "Summon Blood Widow: Melee DMG(Lethal)",
+      "icon": "arachnos_patron_summononepet.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Pet Damage",
+        "Recharge Intensive Pets",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 900.0,
+        "endurance": 26.0,
+        "activationTime": 3.2,
+        "effectArea": "Location"
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['brute_soul_mastery'] = EPIC_BRUTE_SOUL_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/brute/energy_mastery_brute.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Energy Mastery
+ * Archetype: Brute
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\energy_mastery_brute
+ */
+
+const EPIC_ENERGY_MASTERY_BRUTE = {
+  "id": "energy_mastery_brute",
+  "name": "Energy Mastery",
+  "displayName": "Energy Mastery",
+  "archetype": "brute",
+  "description": "You have Mastery over your bodies Energy to increase your power and even hurl energy at your foes.",
+  "icon": "energy_mastery_brute_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Superior Conditioning",
+      "fullName": "Epic.Energy_Mastery_Brute.Conserve_Power",
+      "rank": 1,
+      "available": 34,
+      "description": "Your Superior Condition has increased your maximum endurance by 5%.",
+      "shortHelp": "Self +Endurance",
+      "icon": "energymastery_conservepower.png",
+      "powerType": "Auto",
+      "requires": "$archetype == @Class_Brute",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 10.0,
+        "effectArea": "SingleTarget"
+      }
+    },
+    {
+      "name": "Focused Accuracy",
+      "fullName": "Epic.Energy_Mastery_Brute.Focused_Accuracy",
+      "rank": 2,
+      "available": 34,
+      "description": "When this power is activated, the Hero focuses his senses to dramatically improve his accuracy. Additionally, Focused Accuracy increase your Perception, allowing you to better see stealthy foes. It also grants you resistance to powers that DeBuff your Accuracy. Focused Accuracy is a toggle power and must be activated and deactivated manually. Like all toggle powers, while active, Focused Accuracy drains Endurance while active.",
+      "shortHelp": "Toggle: Self +To Hit, +ACC, +Perception, Res(DeBuff To Hit)",
+      "icon": "energymastery_focusedaccuracy.png",
+      "powerType": "Toggle",
+      "requires": "$archetype == @Class_Brute",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "To Hit Buff"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 10.0,
+        "endurance": 0.195,
+        "activationTime": 1.17,
+        "effectArea": "SingleTarget",
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Laser Beam Eyes",
+      "fullName": "Epic.Energy_Mastery_Brute.Laser_Beam_Eyes",
+      "rank": 3,
+      "available": 37,
+      "description": "You can emit Laser Beams from your eyes, dealing moderate Energy damage. This attack can not miss and will reduce the target's Defense. Damage inflicted will fluctuate the current hit roll. You must be level 38 and have one other Energy Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged, DMG(Energy), Foe -DEF",
+      "icon": "energymastery_laserbeameyes.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate Defense Debuff",
+        "Defense Debuff",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 8.0,
+        "endurance": 6.5,
+        "activationTime": 1.67,
+        "effectArea": "SingleTarget"
+      }
+    },
+    {
+      "name": "Physical Perfection",
+      "fullName": "Epic.Energy_Mastery_Brute.Physical_Perfection",
+      "rank": 4,
+      "available": 40,
+      "description": "By achieving perfect harmony of body, mind and spirit you are able to regenerate health and endurance slightly faster than normal. This power is always active and consumes no endurance. You must be level 41 and have one other Energy Mastery Powers before selecting this power.<br>",
+      "shortHelp": "Auto: Self, +Regeneration, +Recovery",
+      "icon": "energymastery_physicalperfection.png",
+      "powerType": "Auto",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "Heal"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Healing"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "effectArea": "SingleTarget",
+        "regeneration": {
+          "scale": 0.2,
+          "table": "Melee_Ones"
+        },
+        "recovery": {
+          "scale": 0.125,
+          "table": "Melee_Ones"
+        }
+      }
+    },
+    {
+      "name": "Energy Torrent",
+      "fullName": "Epic.Energy_Mastery_Brute.Energy_Torrent",
+      "rank": 5,
+      "available": 43,
+      "description": "Energy Torrent unleashes a cone of powerful energy that can smash foes and possibly send them flying. You must be level 44 and have two other Energy Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Cone), DMG(Energy/Smash), Foe Knockback",
+      "icon": "powerblast_energytorrent.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 40.0,
+        "recharge": 24.0,
+        "endurance": 14.82,
+        "activationTime": 1.07,
+        "effectArea": "Cone",
+        "radius": 40.0,
+        "arc": 0.7854,
+        "damage": {
+          "type": "Fire",
+          "scale": 0.432,
+          "table": "Melee_Damage"
+        },
+        "protection": {
+          "knockback": 1.0
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['energy_mastery_brute'] = EPIC_ENERGY_MASTERY_BRUTE;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
@@ -0,0 +1,8964 @@
+// ---- js/data/powersets/controller/arsenal-control.js ----
+;/**
+ * Arsenal Control
+ * Character Level: 50
+ * Archetype: controller
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CONTROLLER_ARSENAL_CONTROL_POWERSET = {
+    name: "Arsenal Control",
+    category: "Unknown",
+    description: "Arsenal Control powerset",
+    icon: "arsenal-control_set.png",
+    powers: [
+        {
+            name: "Cryo Freeze Ray",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Holds", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "The Cryo Freeze Ray encases your foe in a block of ice, holding him helpless in place for a while and dealing some cold damage.",
+            shortHelp: "Ranged, DMG(Cold), Foe Hold, -SPD, -Recharge, -Fly",
+            icon: "arsenalcontrol_beanbag.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.25,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    type: "Cold",
+                    scale: 2.8890000000000002
+                },
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Tranquilizer",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Ranged Damage", "Sleep", "Slow Movement", "Universal Damage Sets"],
+            description: "The Tranquilizing Dart is the perfect tool to sideline a single foe. It deals some toxic damage and can render the target unconscious, allowing you to focus on more important targets. The target remains asleep for some time, but will awaken if attacked.<br><br><color #fcfc95>Notes: Although this power is Auto Hit, it requires a To Hit check to apply Deep Sleep. If The Hit check is missed, and the target is not an AV, the weaker form of Sleep will be applied.</color>",
+            shortHelp: "Ranged, DMG(Toxic), Foe Deep Sleep, -SPD",
+            icon: "arsenalcontrol_tranquilizer.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.15,
+                range: 80.0,
+                recharge: 6.0,
+                endurance: 5.2,
+                cast: 1.4,
+                damage: {
+                    type: "Toxic",
+                    scale: 1.54
+                },
+                buffDuration: 5.0
+            }
+        },
+        {
+            name: "Sleep Grenade",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Ranged AoE Damage", "Sleep", "Slow Movement", "Universal Damage Sets"],
+            description: "The Sleep Grenade can be launched at long range from beneath the barrel of your Assault Rifle. It releases a cloud of gas that will make enemies drowsy, slow, and fall asleep.",
+            shortHelp: "Ranged (Location AoE), DMG(Toxic), Foe Sleep, -SPD, -Recharge, -Fly",
+            icon: "arsenalcontrol_sleepgrenade.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.05,
+                range: 80.0,
+                recharge: 45.0,
+                endurance: 15.6,
+                cast: 1.87,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Liquid Nitrogen",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "The Liquid Nitrogen dispenser can spray a target location with liquid nitrogen creating a large patch of ice. Those caught in the patch of ice are dramatically slowed, tend to fall down taking damage, and will be unable to jump.",
+            shortHelp: "Ranged (Location AoE), DoT(Cold), Knockdown, -SPD",
+            icon: "arsenalcontrol_liquidnitrogen.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 90.0,
+                endurance: 10.4,
+                cast: 2.0,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Cloaking Device",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "This Cloaking Device is the ultimate in infiltration technology. It uses an LCD body coating to become all but impossible to detect. While concealed you can only be seen at very close range. If you attack while concealed, you will be discovered. Even if discovered, you are hard to see but will retain some of your Defense bonus to all attacks.",
+            shortHelp: "Toggle: Self Stealth, +DEF(All)",
+            icon: "arsenalcontrol_cloakingdevice.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.182,
+                cast: 0.73,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Smoke Canister",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Confuse", "Controller Archetype Sets", "To Hit Debuff"],
+            description: "The Smoke Canister is a powerful infiltration tool. Fling it at a target location and it will quickly cover the area in smoke. While engulfed within this smoke, most enemies will not be able to see past normal melee range, although some may have better perception. If the foes are attacked, they will become confused and might attack their allies.",
+            shortHelp: "Ranged (Location AoE), Foe -Perception, -To Hit, Confuse",
+            icon: "arsenalcontrol_smokegrenade.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.05,
+                range: 80.0,
+                recharge: 90.0,
+                endurance: 16.64,
+                cast: 1.4,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Flash Bang",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Controller Archetype Sets", "Ranged AoE Damage", "Stuns", "To Hit Debuff", "Universal Damage Sets"],
+            description: "The Flash Bang Grenade is ideal to disorient a group of enemies. Even enemies that are not disoriented will have their chance to hit reduced.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Energy), Disorient, -To Hit",
+            icon: "arsenalcontrol_flashbang.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.85,
+                range: 70.0,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 1.87,
+                damage: {
+                    type: "Energy",
+                    scale: 0.25
+                },
+                tohitDebuff: 0.5,
+                buffDuration: 20.0,
+                stun: 4.0
+            }
+        },
+        {
+            name: "Tear Gas",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Holds", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "The Tear Gas canister serves as the ultimate crowd control tool, rendering enemies incapacitated and choking, thereby preventing them from taking any action while also debuffing their damage output.",
+            shortHelp: "Ranged (Location AoE), DoT(Toxic), Foe Hold, -DMG",
+            icon: "arsenalcontrol_teargas.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 0.85,
+                range: 80.0,
+                recharge: 180.0,
+                endurance: 15.6,
+                cast: 1.87,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Tri-Cannon",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Pet Damage", "Recharge Intensive Pets", "Threat Duration", "Universal Damage Sets"],
+            description: "The Tri-Cannon is the perfect companion in the field. It has an extremely fast fire rate and is equipped with a customized tracking system. Once locked on, it will continue to unload a volley of lead into the target until it is destroyed. Enemies around the Tri-Cannon, as well as those hit by it, will prioritize attacking it over its owner. It is armored and can take significant amounts of damage.",
+            shortHelp: "Build Tri-Cannon: Ranged, DMG(Lethal)",
+            icon: "arsenalcontrol_gunturret.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 240.0,
+                endurance: 26.0,
+                cast: 1.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['controller/arsenal-control'] = CONTROLLER_ARSENAL_CONTROL_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CONTROLLER_ARSENAL_CONTROL_POWERSET = CONTROLLER_ARSENAL_CONTROL_POWERSET;
+}
+
+// ---- js/data/powersets/controller/cold-domination.js ----
+;/**
+ * Cold Domination
+ * Character Level: 50
+ * Archetype: controller
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CONTROLLER_COLD_DOMINATION_POWERSET = {
+    name: "Cold Domination",
+    category: "Unknown",
+    description: "Cold Domination powerset",
+    icon: "cold-domination_set.png",
+    powers: [
+        {
+            name: "Ice Shield",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Resist Damage"],
+            description: "Casts a rock hard Ice Shield on one of your allies and grants them Defense to Melee, Lethal attacks and damage resistance to Cold and Fire damage. You cannot stack multiple Ice Shields on the same target, however the shield can be improved by another ally using the same power. Can also be used in conjunction with your Glacial Shield. You cannot use this power on yourself.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Ranged, Ally +DEF(Melee, Smash, Lethal), Res(Cold, Fire)",
+            icon: "colddomination_iceshield.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 2.0,
+                endurance: 7.8,
+                cast: 1.17,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 1.25,
+                            ticks: 120
+                        },
+                        {
+                            type: "Fire",
+                            scale: 1.0,
+                            ticks: 120
+                        }
+                    ]
+                },
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Infrigidate",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Slow Movement"],
+            description: "Fires a frigid beam of cold at a single target. This beam dramatically reduces the targets attack rate, movement speed and Defense. Infrigidate draws so much heat out of the target that the damage of any of its Fire attacks will be reduced.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged Foe -Speed, -Recharge, -DEF, -DMG (Fire)",
+            icon: "colddomination_infrigidate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 10.4,
+                cast: 1.0,
+                dotDamage: {
+                    type: "Fire",
+                    scale: 3.0,
+                    ticks: 10
+                },
+                buffDuration: 20.0,
+                defenseDebuff: 2.5
+            }
+        },
+        {
+            name: "Snow Storm",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "While active, the chill from this Snow Storm can dramatically Slow the attack and movement speed of the target and all nearby foes. The torrent winds of the Snow Storm are enough to bring down flying foes.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Ranged (Targeted AoE), Foe -Speed, -Recharge, -Fly",
+            icon: "colddomination_snowstorm.png",
+            powerType: "Toggle",
+            targetType: "Foe",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 10.0,
+                endurance: 0.26,
+                cast: 2.03,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Glacial Shield",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Resist Damage"],
+            description: "Envelopes an ally in gleaming Glacial Ice. Its crystalline structure has refracting properties that grants the target good Defense against Area Effect, Ranged, Energy and Negative Energy attacks. Glacial Shield also grants the target some damage resistance to Cold. You cannot stack multiple Glacial Shields on the same target, however the shield can be improved by another ally using the same power. Can also be used in conjunction with your Ice Shield. You cannot use this power on yourself.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Ranged, Ally +DEF(Ranged, AoE, Energy, Negative), Res(Cold)",
+            icon: "colddomination_glaciate.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 2.0,
+                endurance: 7.8,
+                cast: 1.17,
+                dotDamage: {
+                    type: "Cold",
+                    scale: 1.25,
+                    ticks: 120
+                },
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Frostwork",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Covers an ally in a thick layer of Frost. The frost can absorb the impact from enemy attacks, effectively increasing your ally's maximum Hit Points for a short time. Frostwork also grants your ally resistance to Toxic Damage.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Target +Max HP, Res(Toxic)",
+            icon: "colddomination_frostwork.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 60.0,
+                endurance: 14.56,
+                cast: 1.17,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 2.0,
+                    ticks: 60
+                },
+                buffDuration: 120.0
+            }
+        },
+        {
+            name: "Arctic Fog",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Resist Damage"],
+            description: "Your mastery of Cold allows you to hide yourself and all nearby allies within thick Arctic Fog. Arctic Fog makes you and your allies harder to see and increases your Defense to area effect, melee and ranged attacks, as well as your resistance to Slow, Fire, Cold, and Energy damage.",
+            shortHelp: "Toggle: PBAoE, Team Stealth, +DEF, +Res(Fire, Cold, Energy, Slow)",
+            icon: "colddomination_arcticfog.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 15.0,
+                endurance: 0.26,
+                cast: 1.87,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Benumb",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: [],
+            description: "Numbs a single target to its very core. Benumb reduces the target's core body temperature, dramatically weakening them. A Benumbed target's Damage and Regeneration Rate are greatly reduced. Additionally, the affected target's secondary power effects are all weakened. The target's powers' effects like Heals, Defense Buffs, Endurance Drains, Disorients, Holds, Immobilizes, Knockbacks and more, are all weakened.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged Foe -DMG, -END, -Regeneration, -Special",
+            icon: "colddomination_benumb.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 120.0,
+                endurance: 13.0,
+                cast: 2.07,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Sleet",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Summons a Sleet Storm at a targeted location. Sleet deals minimal Cold damage to anything that passes through the storm. It also Slows the affected foes and severely reduces their Defense and resistance to damage. Many foes may even slip and fall trying to escape the storm.<br><br><color #fcfc95>Damage: Minor(DoT).</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Location AoE), Minor DoT(Cold), Foe -Speed, -Recharge, -DEF -Res",
+            icon: "colddomination_sleet.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                endurance: 18.2,
+                cast: 2.03,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Heat Loss",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Slow Movement"],
+            description: "Heat Loss drains the heat from your enemies and transfers that energy to your allies in the form of Endurance. All foes near the selected target may experience a Heat Loss, which will drain their Endurance, Slow them, and reduce their Damage Resistance. Each enemy target that is successfully drained of Heat will expel that energy to all your nearby allies, granting them Endurance and a boost to their Endurance Recovery. Some Endurance and Recovery will also be transferred directly to you and any allies near you.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Ranged (Foe AoE), Foe -RES, -END, Slow; Team +END, +Recovery",
+            icon: "colddomination_heatloss.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 360.0,
+                endurance: 15.6,
+                cast: 2.17
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['controller/cold-domination'] = CONTROLLER_COLD_DOMINATION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CONTROLLER_COLD_DOMINATION_POWERSET = CONTROLLER_COLD_DOMINATION_POWERSET;
+}
+
+// ---- js/data/powersets/controller/darkness-affinity.js ----
+;/**
+ * Darkness Affinity
+ * Character Level: 50
+ * Archetype: controller
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CONTROLLER_DARKNESS_AFFINITY_POWERSET = {
+    name: "Darkness Affinity",
+    category: "Unknown",
+    description: "Darkness Affinity powerset",
+    icon: "darkness-affinity_set.png",
+    powers: [
+        {
+            name: "Tar Patch",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "Drops a large patch of viscous Negative Energy which dramatically slows down enemies that run through it and reduces their damage resistance. Affected targets stuck in the Tar Patch cannot jump or fly.",
+            shortHelp: "Ranged (Location AoE), Target -Speed, -Res, -Fly",
+            icon: "darkmiasma_tarpatch.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 90.0,
+                recharge: 90.0,
+                endurance: 7.8,
+                cast: 3.1,
+                buffDuration: 45.0
+            }
+        },
+        {
+            name: "Twilight Grasp",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Accurate To-Hit Debuff", "Healing", "To Hit Debuff"],
+            description: "You channel Negative Energy from the Netherworld through yourself to a targeted foe. Twilight Grasp drains the power from that target and slowly transfers it to you and all nearby allies. The targeted foe's chance to hit, damage and regeneration rate are reduced, while you and your nearby allies are healed.",
+            shortHelp: "Ranged, Foe -To Hit, -DMG, -Regen, Team Heal",
+            icon: "darkmiasma_twilightgrasp.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 7.8,
+                cast: 2.37,
+                tohitDebuff: 0.5,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Darkest Night",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["To Hit Debuff"],
+            description: "While active, you channel Negative Energy onto a targeted foe. While Darkest Night is active the target, and all foes nearby, will have their chance to hit and Damage potential reduced as long as you keep the power active.",
+            shortHelp: "Toggle: Ranged (Targeted AoE), Foe -DMG, -To Hit",
+            icon: "darkmiasma_darkestnight.png",
+            powerType: "Toggle",
+            targetType: "Foe",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 10.0,
+                endurance: 0.26,
+                cast: 3.17,
+                buffDuration: 0.75,
+                tohitDebuff: 1.5
+            }
+        },
+        {
+            name: "Howling Twilight",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage"],
+            allowedSetCategories: ["Ranged AoE Damage", "Slow Movement", "Stuns", "Universal Damage Sets"],
+            description: "Activating this power channels the power of the Netherworld to weaken your foes, in an attempt to revive all nearby fallen allies. You must stand near your defeated allies to revive them, then select a foe. The selected foe and all nearby foes will be Slowed, Disoriented, have their Regeneration rate reduced and drained of some life. Revived allies will have full Hit Points and Endurance and will be protected from XP Debt for 90 seconds.",
+            shortHelp: "Ranged (AoE), Minor DMG(Negative), Target Slow, -Recharge, -Regen, Disorient, Ally Rez",
+            icon: "darkmiasma_howlingtwilight.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 180.0,
+                endurance: 26.0,
+                cast: 3.17,
+                damage: {
+                    type: "Negative",
+                    scale: 0.25
+                },
+                buffDuration: 30.0,
+                stun: 3.0
+            }
+        },
+        {
+            name: "Shadow Fall",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Resist Damage"],
+            description: "Envelops you and your nearby teammates in a shroud of darkness. Shadow Fall does not grant Invisibility, but it does make you harder to detect. Even if you are discovered, Shadow Fall grants a bonus to Defense bonus to all attacks and Resistance to Fear, while reducing Energy, Negative Energy, and Psionic Damage.",
+            shortHelp: "Toggle: PBAoE, Team Stealth, +DEF(All), +Res(Energy, Negative, Psionics, Fear)",
+            icon: "darkmiasma_shadowfall.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 15.0,
+                endurance: 0.26,
+                cast: 2.03,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Fade",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Resist Damage"],
+            description: "You partially bring yourself and all nearby allies into the Netherworld vastly increasing their Defense to all attacks and resistance to lethal, smashing, negative energy and psionic damage for a very short period of time as well as dramatically increasing their resistance to Defense Debuffs. This power is best used to help counter a dangerous situation.",
+            shortHelp: "PBAoE Ally, +Defense(All), +Res(Defense Debuffs, Lethal, Smash, Negative, Psionic)",
+            icon: "darknessaffinity_fade.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 210.0,
+                endurance: 7.8,
+                cast: 2.03,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 1.25,
+                            ticks: 30
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 1.25,
+                            ticks: 30
+                        },
+                        {
+                            type: "Negative",
+                            scale: 1.25,
+                            ticks: 30
+                        },
+                        {
+                            type: "Psionic",
+                            scale: 1.25,
+                            ticks: 30
+                        }
+                    ]
+                },
+                buffDuration: 60.0,
+                defenseBuff: 1.0
+            }
+        },
+        {
+            name: "Soul Absorption",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Endurance Modification", "Healing", "To Hit Debuff"],
+            description: "You drain the essence of both nearby conscious and defeated foes to cause you and your allies to regenerate and recovery much more quickly. The more defeated foes affected, the more powerful the regeneration and recovery effect will be.",
+            shortHelp: "PBAoE Team +Regen, +Recovery, Foe -To Hit",
+            icon: "darknessaffinity_soulabsorption.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.2,
+                recharge: 160.0,
+                cast: 3.0,
+                buffDuration: 1.0,
+                tohitDebuff: 1.0
+            }
+        },
+        {
+            name: "Black Hole",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: [],
+            description: "Opens up a Black Hole to the Netherworld that temporarily pulls in all foes within its grasp. Victims that are immune to the pull become phase shifted and are completely intangible. They are hard to see, and cannot affect or be affected by those in normal space.",
+            shortHelp: "Ranged (Targeted AoE), Foe Intangible",
+            icon: "darkmiasma_blackhole.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 120.0,
+                endurance: 13.0,
+                cast: 1.03
+            }
+        },
+        {
+            name: "Dark Servant",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Accurate To-Hit Debuff", "Healing", "Holds", "Immobilize", "To Hit Debuff"],
+            description: "Summons a Dark Servant to your aid. The Dark Servant possesses an assortment of dark powers to weaken your foes. The summoned entity is not a willing servant, and it is only your power that binds it in this realm. The Dark Servant can be buffed and healed.",
+            shortHelp: "Summon Dark Servant: Ranged Debuff Special",
+            icon: "darkmiasma_darkservant.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 240.0,
+                endurance: 26.0,
+                cast: 3.17,
+                buffDuration: 240.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['controller/darkness-affinity'] = CONTROLLER_DARKNESS_AFFINITY_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CONTROLLER_DARKNESS_AFFINITY_POWERSET = CONTROLLER_DARKNESS_AFFINITY_POWERSET;
+}
+
+// ---- js/data/powersets/controller/darkness-control.js ----
+;/**
+ * Darkness Control
+ * Character Level: 50
+ * Archetype: controller
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CONTROLLER_DARKNESS_CONTROL_POWERSET = {
+    name: "Darkness Control",
+    category: "Unknown",
+    description: "Darkness Control powerset",
+    icon: "darkness-control_set.png",
+    powers: [
+        {
+            name: "Dark Grasp",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Controller Archetype Sets", "Holds", "Ranged Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You cause your target's shadow to wholly envelop them, leaving them held and rendered helpless while suffering from moderate negative energy damage. Even if the target is powerful enough to resist the power's hold effect they will have their chance to hit reduced.<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged, High DMG(Negative), Foe Hold, -To Hit",
+            icon: "darknesscontrol_darkgrasp.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    type: "Negative",
+                    scale: 4.8335
+                },
+                tohitDebuff: 0.75,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Shadowy Binds",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Controller Archetype Sets", "Immobilize", "Ranged Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You take control of your victim's shadow causing it to entangle and bind its owner thus leaving them immobilized and suffering from negative energy damage over time and reducing their chance to hit. Immobilized foes cannot move but can still attack.<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, Moderate DoT(Negative), Foe Immobilize, -To Hit, -Fly",
+            icon: "darknesscontrol_shadowybinds.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.2,
+                dotDamage: {
+                    type: "Negative",
+                    scale: 0.7200000000000001,
+                    ticks: 4
+                },
+                buffDuration: 9.2,
+                tohitDebuff: 0.75
+            }
+        },
+        {
+            name: "Living Shadows",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Controller Archetype Sets", "Immobilize", "Ranged AoE Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You extend and animate your own shadow causing it to entangle all foes within a long cone pattern in front of you, rendering all affected foes immobilized.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged (Cone), Minor DoT(Negative), Foe Immobilize, -To Hit, -Fly",
+            icon: "darknesscontrol_livingshadows.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 1.0472,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 8.0,
+                endurance: 13.0,
+                cast: 1.67,
+                dotDamage: {
+                    type: "Negative",
+                    scale: 0.3429,
+                    ticks: 2
+                },
+                buffDuration: 5.2,
+                tohitDebuff: 0.75
+            }
+        },
+        {
+            name: "Possess",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Confuse", "Controller Archetype Sets"],
+            description: "You cause your targeted foe to be possessed by a dark entity from the Netherworld causing them to be confused for a short period of time. While confused they will be unable to tell the difference between friend or foe and will attack nearby allies.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged, Target Confuse",
+            icon: "darknesscontrol_possess.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 2.33
+            }
+        },
+        {
+            name: "Fearsome Stare",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Fear", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Controller Archetype Sets", "Fear", "To Hit Debuff"],
+            description: "Instills tremendous Fear within a cone area in front of you, causing all affected targets to tremble in Terror uncontrollably.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Cone), Foe Fear, -To Hit",
+            icon: "darknesscontrol_fearsomestare.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 0.7854,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 40.0,
+                endurance: 8.528,
+                cast: 2.03,
+                tohitDebuff: 1.5,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Heart of Darkness",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Controller Archetype Sets", "Melee AoE Damage", "Stuns", "To Hit Debuff", "Universal Damage Sets"],
+            description: "In a burst of negative energy you overwhelm the minds of those around you causing them to be disoriented and suffer minor negative energy damage over a short time. Affected targets will also have their chance to hit reduced.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE, Foe Disorient, -To Hit, Minor DoT(Negative)",
+            icon: "darknesscontrol_heartofdarkness.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.8,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 1.67,
+                dotDamage: {
+                    type: "Negative",
+                    scale: 0.42200000000000004,
+                    ticks: 4
+                },
+                buffDuration: 4.1,
+                stun: 1.0,
+                tohitDebuff: 0.75
+            }
+        },
+        {
+            name: "Haunt",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Fear", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Fear", "Pet Damage", "Recharge Intensive Pets", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You summon a pair of Shades from the Netherworld to harass your target foe. Shades deal moderate damage and they terrorize their victims.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Foe Targeted, Summon Shades",
+            icon: "darknesscontrol_haunt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 210.0,
+                endurance: 10.4,
+                cast: 2.33,
+                buffDuration: 1.0
+            }
+        },
+        {
+            name: "Shadow Field",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Controller Archetype Sets", "Holds", "To Hit Debuff"],
+            description: "You blanket a targeted area in darkness immediately holding foes within the field. Any foe who enters this area will have their chance to hit reduced and has a chance to be held for a short period of time.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Target (Location AoE), Foe Hold, -To Hit",
+            icon: "darknesscontrol_shadowfield.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 240.0,
+                endurance: 15.6,
+                cast: 2.67,
+                buffDuration: 45.0
+            }
+        },
+        {
+            name: "Umbra Beast",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Fear", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Fear", "Immobilize", "Pet Damage", "Recharge Intensive Pets", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You conjure up one of the most fearsome creatures of the Netherworld, the Umbra Beast. This creature will fight beside its summoner using its brutal claw, bite and darkness attacks.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Summon Umbra Beast",
+            icon: "darknesscontrol_umbrabeast.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 240.0,
+                endurance: 26.0,
+                cast: 2.33
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['controller/darkness-control'] = CONTROLLER_DARKNESS_CONTROL_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CONTROLLER_DARKNESS_CONTROL_POWERSET = CONTROLLER_DARKNESS_CONTROL_POWERSET;
+}
+
+// ---- js/data/powersets/controller/earth-control.js ----
+;/**
+ * Earth Control
+ * Character Level: 50
+ * Archetype: controller
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CONTROLLER_EARTH_CONTROL_POWERSET = {
+    name: "Earth Control",
+    category: "Unknown",
+    description: "Earth Control powerset",
+    icon: "earth-control_set.png",
+    powers: [
+        {
+            name: "Fossilize",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Holds", "Ranged Damage", "Universal Damage Sets"],
+            description: "Encases a single target within solid stone. The stone slowly crushes the victim, dealing Smashing damage. The Fossilized victim is held helpless and unable to defend themselves. Damage, Moderate.",
+            shortHelp: "Ranged, DMG(Smash), Foe Hold, -DEF",
+            icon: "earthgrasp_fossilize.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 2.07,
+                damage: {
+                    type: "Smashing",
+                    scale: 5.2536000000000005
+                },
+                defenseDebuff: 2.0,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Stone Prison",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Immobilize", "Ranged Damage", "Universal Damage Sets"],
+            description: "Immobilizes a single target within an earthy formation and deals some Smashing damage over time. Some more resilient foes may require multiple attacks to Immobilize. Stone Prison can also reduce a target's Defense.",
+            shortHelp: "Ranged, DoT(Smash), Foe Immobilize, -DEF, -Fly",
+            icon: "earthgrasp_stoneprison.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.23,
+                dotDamage: {
+                    type: "Smashing",
+                    scale: 0.8263,
+                    ticks: 4
+                },
+                buffDuration: 9.2,
+                defenseDebuff: 2.0
+            }
+        },
+        {
+            name: "Stone Cages",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Immobilize", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Immobilizes a group of foes within earthy formations and deals some Smashing damage over time. Slower and less damaging than Stone Prison, but can capture multiple targets. Stone Cages can also reduce a target's Defense.",
+            shortHelp: "Ranged AoE, DMG(Smash), Foe Immobilize, -Fly, -DEF",
+            icon: "earthgrasp_stonecages.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.9,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 15.6,
+                cast: 1.17,
+                dotDamage: {
+                    type: "Smashing",
+                    scale: 0.3385,
+                    ticks: 2
+                },
+                buffDuration: 5.2,
+                defenseDebuff: 2.0
+            }
+        },
+        {
+            name: "Quicksand",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "You can cause the ground to liquefy like Quicksand at a targeted location. Any foes that pass through the Quicksand will become snared, their movement will be dramatically Slowed, and their Defense reduced. Foes trapped in the Quicksand cannot jump or Fly.",
+            shortHelp: "Ranged (Location AoE), Foe -Speed, -Jump, -Fly, -DEF",
+            icon: "earthgrasp_quicksand.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 90.0,
+                recharge: 30.0,
+                endurance: 7.8,
+                cast: 3.1,
+                buffDuration: 45.0
+            }
+        },
+        {
+            name: "Salt Crystals",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Sleep", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Sleep"],
+            description: "Attempts to encrust all nearby foes in a Pillar of Salt. The victims will remain encased within the salt for quite a while, but will automatically break free if attacked. Affected targets have reduced defense for a while, even if they break free.<br><br><color #fcfc95>Notes: Although this power is Auto Hit, it requires a To Hit check to apply Deep Sleep. If The Hit check is missed, and the target is not an AV, the weaker form of Sleep will be applied.</color>",
+            shortHelp: "PBAoE, Foe Deep Sleep, -DEF",
+            icon: "earthgrasp_saltpillars.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 45.0,
+                endurance: 15.6,
+                cast: 1.07,
+                defenseDebuff: 2.0,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Stalagmites",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Ranged AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "You can cause Stalagmites to erupt all around an enemy, damaging all nearby foes. The Stalagmites deal minimal Lethal damage, and can Disorient all affected targets for a good while, as well as reduce their Defense. You must be on the ground to activate this power.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Lethal), Foe Disorient, -DEF",
+            icon: "earthgrasp_stalagmites.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.8,
+                range: 70.0,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 1.0,
+                damage: {
+                    type: "Lethal",
+                    scale: 0.5641
+                },
+                stun: 4.0,
+                defenseDebuff: 2.0,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Earthquake",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Defense Debuff", "Knockback", "To Hit Debuff"],
+            description: "Generates a powerful, localized Earthquake. Most foes that pass through the location will fall down. The violent shaking also reduces their chance to hit and Defense.",
+            shortHelp: "Ranged (Location AoE), Foe Knockback, -To Hit, -Def",
+            icon: "earthgrasp_earthquake.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 90.0,
+                endurance: 10.4,
+                cast: 2.03,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Volcanic Gasses",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Holds", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You can tap into the geothermal power of the Earth and focus it at a targeted location. Foes that pass near a thermal vent will take minor Fire damage and be overcome by the gasses, leaving them choking and helpless.",
+            shortHelp: "Ranged (Location AoE), Foe Hold, DoT(Fire), Special",
+            icon: "earthgrasp_volcanicgasses.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.4,
+                range: 60.0,
+                recharge: 240.0,
+                endurance: 18.2,
+                cast: 1.17,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Animate Stone",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Pet Damage", "Recharge Intensive Pets", "Universal Damage Sets"],
+            description: "Earth and stone coalesce to form an incredibly tough entity that can attack your foes. The Animated Stone is not alive and is immune to Psionic damage. It is also virtually immune to Sleep, Immobilize, Disorient, and Hold effects. The entity can be healed and buffed like any teammate. Type ''/release_pets'' in the chat window to release all your pets.",
+            shortHelp: "Summon Golem: Melee DMG(Smashing)",
+            icon: "earthgrasp_animatestone.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 240.0,
+                endurance: 20.8,
+                cast: 3.2
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['controller/earth-control'] = CONTROLLER_EARTH_CONTROL_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CONTROLLER_EARTH_CONTROL_POWERSET = CONTROLLER_EARTH_CONTROL_POWERSET;
+}
+
+// ---- js/data/powersets/controller/electric-control.js ----
+;/**
+ * Electric Control
+ * Character Level: 50
+ * Archetype: controller
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CONTROLLER_ELECTRIC_CONTROL_POWERSET = {
+    name: "Electric Control",
+    category: "Unknown",
+    description: "Electric Control powerset",
+    icon: "electric-control_set.png",
+    powers: [
+        {
+            name: "Electric Fence",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Endurance Modification", "Immobilize", "Ranged Damage", "Universal Damage Sets"],
+            description: "Surrounds and Immobilizes a single target in an Electric Fence. Deals some damage over time and slowly drains some Endurance. Useful for keeping villains at bay and bringing down fliers.",
+            shortHelp: "Ranged, DoT(Energy), Foe Immobilize, -End, -Fly, -Knockback",
+            icon: "electriccontrol_electricfence.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.67,
+                dotDamage: {
+                    type: "Energy",
+                    scale: 0.9187000000000001,
+                    ticks: 4
+                },
+                buffDuration: 9.2
+            }
+        },
+        {
+            name: "Tesla Cage",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Endurance Modification", "Holds", "Ranged Damage", "Universal Damage Sets"],
+            description: "Tesla Cage confines the target in an electrical prison. The target is overwhelmed by the electrical charge and is left helpless and can be attacked. The target is drained of some Endurance and some of that Endurance may be transferred back to you.",
+            shortHelp: "Ranged, DMG(Energy), Foe Hold, -End",
+            icon: "electriccontrol_teslacage.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    type: "Energy",
+                    scale: 4.8336
+                },
+                buffDuration: 4.0
+            }
+        },
+        {
+            name: "Chain Fences",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Endurance Modification", "Immobilize", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You can immobilize multiple foes in a chain of electricity, dealing minor damage to all foes in range and draining some endurance. This power also reduces Flight capacity in targets.",
+            shortHelp: "Ranged AoE, DMG(Energy), Foe Immobilize, -End, -Fly",
+            icon: "electriccontrol_chainfences.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.9,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 15.6,
+                cast: 1.17,
+                damage: {
+                    type: "Energy",
+                    scale: 1.0196999999999998
+                },
+                dotDamage: {
+                    type: "Energy",
+                    scale: 0.2,
+                    ticks: 2
+                },
+                buffDuration: 5.2
+            }
+        },
+        {
+            name: "Jolting Chain",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "You can send a bolt of electricity through multiple opponents, causing a muscle spasm and dealing minor damage. Each foe is knocked down, and the electric charge can fork several times, jumping to several opponents rapidly.",
+            shortHelp: "Ranged Chain AoE, DMG(Energy), Foe Knockdown, -End",
+            icon: "electriccontrol_joltingchain.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Chain",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 10.4,
+                cast: 2.07,
+                damage: {
+                    type: "Energy",
+                    scale: 3.8544
+                },
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Conductive Aura",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "While this power is active, the air around you becomes charged with electricity, leaping out and shocking foes that get too close. Foes will lose some endurance, while you gain Recovery and Regeneration per target hit.",
+            shortHelp: "Toggle: PBAoE, Foe -End, Self +Rec, +Regen",
+            icon: "electriccontrol_stunningaura.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 15.0,
+                cast: 2.03,
+                buffDuration: 2.25
+            }
+        },
+        {
+            name: "Static Field",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Sleep", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Endurance Modification", "Sleep", "Slow Movement"],
+            description: "You can build up a Static Field at a nearby location. Any foes in the field may lose control of their muscles due to the static charge, and will shake violently. Foes may also be drained of some endurance, and some of that endurance may be transferred to nearby allies. Any attack will interrupt the effect temporarily and foes will re-gain control, although their movement and attack rates will be reduced. This effect can last for some time, and will continue to paralyze foes in the field.",
+            shortHelp: "Target (Location AoE), Foe Sleep, -End",
+            icon: "electriccontrol_staticfield.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 40.0,
+                endurance: 15.6,
+                cast: 2.03,
+                buffDuration: 25.0
+            }
+        },
+        {
+            name: "Tesla Coil",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Holds", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Summoning a large amount of energy that periodically jolts at nearby enemies dealing energy damage and paralizing them for a short time. These foes may be drained of some endurance as well.",
+            shortHelp: "Ranged (Targeted AoE), Foe DMG(Energy), Hold, -End, -Fly, -Jump, -Recharge",
+            icon: "electriccontrol_paralyzingblastpatch.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 0.8,
+                range: 80.0,
+                recharge: 240.0,
+                endurance: 15.6,
+                cast: 1.67
+            }
+        },
+        {
+            name: "Synaptic Overload",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Confuse", "Controller Archetype Sets"],
+            description: "This power can subtly scramble the synapses of any target affected, causing hallucinations and confusion amongst foes. The electric charge lasts for some time, and will jump slowly to other opponents causing wide spread confusion. Foes may not be aware that this has happened, and will not be alerted to your presence. You will also not receive experience for any damage dealt by confused opponents.<br><br><color #fcfc95>Notes: This power has adaptive recharge. It has a base recharge of <color #FF7F27>6</color> seconds and each affected foe will increase the recharge by <color #FF7F27>6.5</color> seconds for a maximum total of <color #FF7F27>110</color> seconds.</color>",
+            shortHelp: "Ranged Chain AoE, Foe Confuse, -End",
+            icon: "electriccontrol_synapticoverload.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Chain",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 6.0,
+                endurance: 15.6,
+                cast: 2.0,
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Gremlins",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Pet Damage", "Recharge Intensive Pets", "Universal Damage Sets"],
+            description: "Mastery over electricity allows you to create almost sentient elementals of lightning. These elementals are mischievous in nature, and enjoy creating havoc and interfering with electronic equipment or magical cantrips. They also never work alone, where there is one Gremlin, there is often another nearby.",
+            shortHelp: "Summon Gremlins: Minor DMG(Energy)",
+            icon: "electriccontrol_gremlins.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 240.0,
+                endurance: 26.0,
+                cast: 2.03
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['controller/electric-control'] = CONTROLLER_ELECTRIC_CONTROL_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CONTROLLER_ELECTRIC_CONTROL_POWERSET = CONTROLLER_ELECTRIC_CONTROL_POWERSET;
+}
+
+// ---- js/data/powersets/controller/empathy.js ----
+;/**
+ * Empathy
+ * Character Level: 50
+ * Archetype: controller
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CONTROLLER_EMPATHY_POWERSET = {
+    name: "Empathy",
+    category: "Unknown",
+    description: "Empathy powerset",
+    icon: "empathy_set.png",
+    powers: [
+        {
+            name: "Heal Other",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Heals a single targeted ally. You cannot use this power to heal yourself.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ally Heal",
+            icon: "empathy_healother.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 13.0,
+                cast: 2.27
+            }
+        },
+        {
+            name: "Healing Aura",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Healing Aura restores some Hit Points to you and all nearby heroes. Healing Aura is not as potent as Heal Other, but can heal multiple targets at once.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "PBAoE, Team +Heal",
+            icon: "empathy_healingaura.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 8.0,
+                endurance: 13.0,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Absorb Pain",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Dramatically heals an ally's wounds. This power has only a tiny Endurance cost, but it requires you to sacrifice some of your Hit Points. Absorbing someone's pain can be quite dramatic, and afterwards you will be briefly unable to heal your own wounds by any means.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ally Strong Heal, Self Moderate DMG(Special)",
+            icon: "empathy_absorbpain.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 0.52,
+                cast: 2.27,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Resurrect",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: [],
+            description: "Resurrects a fallen ally with full Hit Points and Endurance. The Resurrected target is left protected from XP Debt for 90 seconds.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ally Rez",
+            icon: "empathy_resurrect.png",
+            powerType: "Click",
+            targetType: "Player Ally (Dead)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 15.0,
+                recharge: 180.0,
+                endurance: 26.0,
+                cast: 3.2,
+                buffDuration: 0.5
+            }
+        },
+        {
+            name: "Clear Mind",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: [],
+            description: "Frees an ally from any Disorient, Hold, Sleep, Fear, Confuse and Immobilize effects and leaves them resistant to such effects for a good while. Also, grants target clearer Perception to see hidden foes. Protection will improve with Multiple applications and as you advance in level.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ally +Res(Disorient, Hold, Sleep, Immobilize, Fear, Confuse), +Perception",
+            icon: "empathy_mindwall.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                stun: 1.0,
+                stunDuration: 90.0,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Fortitude",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "To Hit Buff"],
+            description: "Fortitude immensely enhances a single ally's chance to hit, Damage, and Defense to all attacks.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ally +DEF(All), +DMG, +To Hit",
+            icon: "empathy_fortitude.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 60.0,
+                endurance: 10.4,
+                cast: 2.27,
+                tohitBuff: 1.5,
+                buffDuration: 120.0
+            }
+        },
+        {
+            name: "Recovery Aura",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "The Recovery Aura dramatically increases the Endurance recovery rate of all nearby heroes for a limited time. Emitting this Aura costs you a lot of Endurance, and it takes a long time to recharge.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "PBAoE, Ally +Recovery",
+            icon: "empathy_recoveryaura.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 500.0,
+                endurance: 26.0,
+                cast: 2.03,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Regeneration Aura",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "The Regeneration Aura dramatically increases the healing rate of all nearby heroes for a limited time. Emitting this Aura costs you a lot of Endurance, and it takes a long time to recharge.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "PBAoE, Ally +Regeneration",
+            icon: "empathy_regenerationaura.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 500.0,
+                endurance: 26.0,
+                cast: 2.03,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Adrenalin Boost",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "Dramatically increases an ally's Endurance Recovery, Hit Point Regeneration and attack rate for 90 seconds. Also grants the target high resistance to slow effects.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Ranged, Ally +End, +Regeneration, +Recharge, Res (Slow)",
+            icon: "empathy_adrenalinboost.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 300.0,
+                endurance: 10.4,
+                cast: 2.27,
+                buffDuration: 90.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['controller/empathy'] = CONTROLLER_EMPATHY_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CONTROLLER_EMPATHY_POWERSET = CONTROLLER_EMPATHY_POWERSET;
+}
+
+// ---- js/data/powersets/controller/fire-control.js ----
+;/**
+ * Fire Control
+ * Character Level: 50
+ * Archetype: controller
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CONTROLLER_FIRE_CONTROL_POWERSET = {
+    name: "Fire Control",
+    category: "Unknown",
+    description: "Fire Control powerset",
+    icon: "fire-control_set.png",
+    powers: [
+        {
+            name: "Char",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Holds", "Ranged Damage", "Universal Damage Sets"],
+            description: "Incapacitates a distant foe by Charring them with smoldering soot and cinders. The target is left helpless, choking on the soot.",
+            shortHelp: "Ranged, Moderate DoT(Fire), Foe Hold",
+            icon: "firetrap_soot.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.07,
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.8807,
+                    ticks: 4
+                },
+                buffDuration: 4.2
+            }
+        },
+        {
+            name: "Ring of Fire",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Immobilize", "Ranged Damage", "Universal Damage Sets"],
+            description: "Immobilizes your target in a Ring of Fire, dealing Fire damage over time. More resilient foes may require multiple Fire Rings to Immobilize.",
+            shortHelp: "Ranged, Moderate DoT(Fire), Foe Immobilize",
+            icon: "firetrap_ringoffire.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.17,
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.8537,
+                    ticks: 4
+                },
+                buffDuration: 9.2
+            }
+        },
+        {
+            name: "Fire Cages",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Immobilize", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Immobilizes a group of foes in Fire Cages, dealing Fire damage over time. More resilient foes may require multiple Fire Cages to Immobilize. Fire Cages is slower and less damaging than Ring of Fire, but can capture multiple targets.",
+            shortHelp: "Ranged (Targeted AoE), Minor DoT(Fire), Foe Immobilize",
+            icon: "firetrap_firecage.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.9,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 15.6,
+                cast: 1.03,
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.3497,
+                    ticks: 2
+                },
+                buffDuration: 5.2
+            }
+        },
+        {
+            name: "Smoke",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["To Hit Debuff"],
+            description: "Covers all foes near your target in clouds of Smoke. The villains are so blinded that they can hardly see a thing. Most villains will not be able to see past normal melee range, although some may have better perception. If the villains are attacked, they will be alerted to your presence, but will suffer a penalty to their chance to hit.",
+            shortHelp: "Ranged (Targeted AoE), Foe -Perception, -To Hit",
+            icon: "firetrap_smoke.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 7.8,
+                cast: 1.17,
+                buffDuration: 60.0,
+                tohitDebuff: 0.5
+            }
+        },
+        {
+            name: "Hot Feet",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "While active, you heat the earth in a large area around yourself. Enemy movement is Slowed as they attempt to flee the immediate area. All foes in the affected area may also suffer some damage over time. You cannot fly and must be near the ground to use this power.",
+            shortHelp: "Toggle: PBAoE, Minor DoT(Fire), Foe -SPD",
+            icon: "firetrap_hotfeet.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 2.08,
+                cast: 1.47,
+                damage: {
+                    type: "Fire",
+                    scale: 0.5746
+                },
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Flashfire",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Ranged AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "You can bring forth a Flashfire to Disorient a group of foes and deal some damage over time. Target must be on the ground to activate Flashfire.",
+            shortHelp: "Ranged (Targeted AoE), Minor DMG(Fire), Foe Disorient",
+            icon: "firetrap_flashfire.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.8,
+                range: 70.0,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 2.37,
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.1379,
+                    ticks: 4
+                },
+                buffDuration: 4.0,
+                stun: 4.0
+            }
+        },
+        {
+            name: "Cinders",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Holds"],
+            description: "Incapacitates foes around the caster by whirling Cinders around them. The targets are left helpless, choking on the soot.<br><br><color #fcfc95>Notes: This power has adaptive recharge. It has a base recharge of <color #FF7F27>8</color> seconds and each affected foe will increase the recharge by <color #FF7F27>14.5</color> seconds for a maximum total of <color #FF7F27>240</color> seconds.</color>",
+            shortHelp: "PBAoE, Foe Hold",
+            icon: "firetrap_cinders.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.8,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.07
+            }
+        },
+        {
+            name: "Bonfire",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You can create a Bonfire that knocks back and burns any foes who try to pass through it.",
+            shortHelp: "Ranged (Location AoE), Minor DMG(Fire), Foe Knockback",
+            icon: "firetrap_bonfire.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 60.0,
+                endurance: 13.0,
+                cast: 3.07,
+                buffDuration: 45.0
+            }
+        },
+        {
+            name: "Fire Imps",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Pet Damage", "Recharge Intensive Pets", "Universal Damage Sets"],
+            description: "You can craft 3 small Fire Imps out of pure flame in a targeted location. Fire Imps will viciously attack any nearby foes, but they only possess the most basic instincts. Fire Imps can be healed and buffed like any teammate. Type ''/release_pets'' in the chat window to release all your pets.",
+            shortHelp: "Summon Imps: Melee Minor DMG(Fire)",
+            icon: "firetrap_fireimps.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.2,
+                range: 60.0,
+                recharge: 240.0,
+                endurance: 26.0,
+                cast: 2.03
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['controller/fire-control'] = CONTROLLER_FIRE_CONTROL_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CONTROLLER_FIRE_CONTROL_POWERSET = CONTROLLER_FIRE_CONTROL_POWERSET;
+}
+
+// ---- js/data/powersets/controller/force-field.js ----
+;/**
+ * Force Field
+ * Character Level: 50
+ * Archetype: controller
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CONTROLLER_FORCE_FIELD_POWERSET = {
+    name: "Force Field",
+    category: "Unknown",
+    description: "Force Field powerset",
+    icon: "force-field_set.png",
+    powers: [
+        {
+            name: "Deflection Shield",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Dramatically protects an ally from Smashing, Lethal and all Melee attacks for a limited time. Also reduces Toxic damage. You cannot stack multiple Deflection Shields on the same target; however, the shield can be improved by another ally using the same power. Can also be used in conjunction with your Insulation Shield. You cannot use this power on yourself.",
+            shortHelp: "Ranged, Ally +DEF(Smash, Lethal, Melee), Res(Toxic)",
+            icon: "forcefield_deflectionshield.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 2.0,
+                endurance: 7.8,
+                cast: 2.07,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 4.0,
+                    ticks: 120
+                },
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Personal Force Field",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "The Personal Force Field is almost impenetrable to all attacks, even Psionics and Enemy Teleportation, although attacks from more powerful foes may get through more easily. Personal Force Field will also reduce the damage of almost any attacks that do get through. The Personal Force Field works both ways; while it is active, you can only use powers that affect yourself. Cannot be used with Rest.",
+            shortHelp: "Toggle: Self +Def, Res(All except Toxic)",
+            icon: "forcefield_personalforcefield.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 15.0,
+                endurance: 0.13,
+                cast: 2.03,
+                resistance: {
+                    smashing: 0.4,
+                    lethal: 0.4,
+                    fire: 0.4,
+                    cold: 0.4,
+                    energy: 0.4,
+                    negative: 0.4,
+                    psionic: 0.4,
+                    toxic: 0.4
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Repulsion Bolt",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "Discharges a bolt of force that knocks down foes and deals some Smashing Damage. Foes struck will have their armor shattered by the force of the impact, leaving them with lowered damage resistance.",
+            shortHelp: "Ranged, DMG(Smash), Foe Knockback",
+            icon: "forcefield_forcebolt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.4,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 10.192,
+                cast: 1.1,
+                damage: {
+                    type: "Smashing",
+                    scale: 0.4
+                },
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Insulation Shield",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Dramatically protects an ally from Fire, Cold, Energy, Negative Energy, Ranged and AoE attacks for a limited time. The Insulation also protects the target from Endurance Draining effects. You cannot stack multiple Insulation Shields on the same target; however, the shield can be improved by another ally using the same power. Can also be used in conjunction with your Deflection Shield. In PvP, this power also grants a small amount of Mez Protection to its primary target. You cannot use this power on yourself.",
+            shortHelp: "Ranged, Ally +DEF(Fire, Cold, Energy, Negative, Ranged, AoE), Res (End Drain)",
+            icon: "forcefield_insulationshield.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 2.0,
+                endurance: 7.8,
+                cast: 2.07,
+                buffDuration: 240.0,
+                stun: 1.0,
+                stunDuration: 90.0
+            }
+        },
+        {
+            name: "Detention Field",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: [],
+            description: "Encases a targeted foe in a Detention Force Field. The captured target cannot be harmed, is Immobilized, and cannot attack or aid their allies. The target can, however, use powers on themselves.",
+            shortHelp: "Ranged, Foe Capture (Special)",
+            icon: "forcefield_refractionshield.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.4,
+                range: 80.0,
+                recharge: 60.0,
+                endurance: 10.4,
+                cast: 2.07,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Dispersion Bubble",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Creates a large bubble which protects all allies inside. While active, the Dispersion Bubble gives all allies within increased Defense against all attack types. The Dispersion Bubble also protects allies from Immobilization, Disorient, and Hold effects.<br><br>Allies will retain bonuses from the bubble for some after leaving the bubble's area.",
+            shortHelp: "Toggle: PBAoE, Team +Res(Hold, Immobilize, Disorient) +DEF(All)",
+            icon: "forcefield_dispersionbubble.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 15.0,
+                endurance: 1.04,
+                cast: 1.07,
+                buffDuration: 15.0,
+                stun: 1.0,
+                stunDuration: 15.0
+            }
+        },
+        {
+            name: "Repulsion Field",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Knockback"],
+            description: "This Toggle power creates a field that keeps all foes at bay, protecting all allies inside from melee or short ranged attacks. More powerful foes may be able to penetrate the Repulsion Field, but may slip and get knocked down and forced back if they try.<br><br>Enemies that get too close will be violently knocked away. In PvP, Each villain that is knocked away costs you additional Endurance.<br><br><color #fcfc95>Note: Slotting Knockback to Knockdown enhancement in this power will disable Repel.</color>",
+            shortHelp: "Toggle: PBAoE Knockback",
+            icon: "forcefield_repulsionfield.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 0.1625,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Force Bomb",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "A powerful Force Bomb is hurled at your foes dealing a moderate amount of damage and knocking them off of their feet. Foes struck by Repulsion Bomb have a chance to become disoriented, and the force of the blow will leave their armor shattered, lowering their damage resistance.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Smash), Foe Knockdown, Disorient",
+            icon: "forcefield_repulsionbomb.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 30.0,
+                endurance: 16.9,
+                cast: 1.67,
+                damage: {
+                    type: "Smashing",
+                    scale: 0.6
+                },
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Damping Bubble",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Creates a large bubble at your location which protects all allies inside. While active, this power will grant resistance to Accuracy, Defense, Regeneration, Perception, and Slow debuffs on yourself and allies. Foes within this bubble will have the strength of their Accuracy, Defense, Regeneration, Perception, and Speed debuff powers weakened directly.",
+            shortHelp: "Location (PBAoE), Team +Res(Accuracy, Defense, Perception, Recharge, Regen, Speed, ToHit), Foe -Str(Defense, Perception, Regen, Speed, ToHit)",
+            icon: "forcefield_dampeningbubble.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.07,
+                buffDuration: 45.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['controller/force-field'] = CONTROLLER_FORCE_FIELD_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CONTROLLER_FORCE_FIELD_POWERSET = CONTROLLER_FORCE_FIELD_POWERSET;
+}
+
+// ---- js/data/powersets/controller/gravity-control.js ----
+;/**
+ * Gravity Control
+ * Character Level: 50
+ * Archetype: controller
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CONTROLLER_GRAVITY_CONTROL_POWERSET = {
+    name: "Gravity Control",
+    category: "Unknown",
+    description: "Gravity Control powerset",
+    icon: "gravity-control_set.png",
+    powers: [
+        {
+            name: "Crush",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Immobilize", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Creates a localized gravitational field strong enough to Immobilize a single foe. Crush can also bring down flying entities. This power deals Smashing damage over time and can Slow the movement of targets that escape its grasp.",
+            shortHelp: "Ranged, DoT(Smash), Foe Immobilize, -Fly",
+            icon: "gravitycontrol_crush.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.33,
+                dotDamage: {
+                    type: "Smashing",
+                    scale: 0.8473,
+                    ticks: 4
+                },
+                buffDuration: 9.2
+            }
+        },
+        {
+            name: "Lift",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "Negates the gravity around a single target. Lift violently sends an enemy straight into the air, then slams them to the ground for Smashing damage. This power can bring flying foes to the ground, and can deal bonus damage when used against targets under the effects of Gravity Distortion.",
+            shortHelp: "Ranged, DMG(Smash)",
+            icon: "gravitycontrol_lift.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.03,
+                damage: {
+                    type: "Smashing",
+                    scale: 5.011500000000001
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Gravity Distortion",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Holds", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Causes a single foe to be trapped in a misshapen gravity field, rendering him unable to take action. Gravity Distortion applies the Gravity Distortion effect and deals Smashing damage to the target.",
+            shortHelp: "Ranged, DoT(Smash), Foe Hold, -Fly, +Gravity Distortion",
+            icon: "gravitycontrol_gravitydistortion.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.83,
+                dotDamage: {
+                    type: "Smashing",
+                    scale: 1.0403,
+                    ticks: 4
+                },
+                buffDuration: 4.2
+            }
+        },
+        {
+            name: "Propel",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "You can open a gravitational rift and retrieve a heavy object, then Propel it at your foes for Smashing Damage. This power can deal bonus damage when used against targets under the effects of Gravity Distortion. This attack's force is so strong that it can knockback additional nearby enemies.",
+            shortHelp: "Ranged, DMG(Smash), Foe Knockback",
+            icon: "gravitycontrol_propel.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 4,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 8.0,
+                endurance: 9.36,
+                cast: 2.07,
+                damage: {
+                    type: "Smashing",
+                    scale: 5.5635
+                }
+            }
+        },
+        {
+            name: "Crushing Field",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Immobilize", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Creates a large gravitational field strong enough to Immobilize multiple foes. Crushing Field can also bring down flying entities. Slower and less damaging than Crush, but can capture multiple targets. Crushing Field deals Smashing damage over time and can Slow the movement of targets that escape its grasp.",
+            shortHelp: "Ranged (Targeted AoE), DoT(Smash), Foe Immobilize, -Fly",
+            icon: "gravitycontrol_crushingfield.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.9,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 15.6,
+                cast: 1.33,
+                dotDamage: {
+                    type: "Smashing",
+                    scale: 0.3486,
+                    ticks: 2
+                },
+                buffDuration: 5.2
+            }
+        },
+        {
+            name: "Dimension Shift",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Controller Archetype Sets", "Immobilize"],
+            description: "Location-targeted AoE toggle. This power folds space in an area, immobilizing and phasing all targets within the sphere. Enemies who enter the area become immobilized and phased for the duration of the effect. Allies who enter the sphere's area of effect will enter the phase as well, allowing them to combat phased enemies. Detoggling this power ends the effect, bringing the phased creatures back into the physical world. Maintaining this dimensional distortion is taxing on the user, and cannot be done for more than 20 seconds.<br>",
+            shortHelp: "Toggle, Ranged (Location AoE), Foe Intangible",
+            icon: "gravitycontrol_dimensionshift2.png",
+            powerType: "Toggle",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 60.0,
+                endurance: 15.6,
+                cast: 1.17,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Gravity Distortion Field",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Holds", "Slow Movement"],
+            description: "Creates a large, intensely misshapen Gravity Distortion Field that encompasses several foes, rendering them unable to take any action. Enemies in the area of effect will be affected by the Gravity Distortion effect.",
+            shortHelp: "Ranged (Targeted AoE), Foe Hold, Damage(Smashing), +Gravity Distortion",
+            icon: "gravitycontrol_gravitydistortion.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 0.8,
+                range: 80.0,
+                recharge: 240.0,
+                endurance: 15.6,
+                cast: 1.83
+            }
+        },
+        {
+            name: "Wormhole",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Knockback", "Stuns", "Teleport", "Universal Travel"],
+            description: "You can open a gravitational Wormhole behind a targeted foe and violently push them, and all nearby foes, through it. The victims are sent flying out the other end of the Wormhole and are left Disoriented. You determine the location of the Wormhole's end, and can place it high in the air if desired. More powerful foes may be resistant to the Wormhole effects.",
+            shortHelp: "Ranged (Targeted AoE), Foe Teleport, Disorient, Knockback",
+            icon: "gravitycontrol_wormhole.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 3.0,
+                buffDuration: 1.5,
+                stun: 4.0
+            }
+        },
+        {
+            name: "Singularity",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Knockback", "Pet Damage", "Recharge Intensive Pets", "Universal Damage Sets"],
+            description: "You can create a very powerful Gravitational Singularity. The Singularity will engage your foes, assaulting them with various gravity powers. Any foes that attempt to approach the Singularity will be violently hurled away. The Singularity cannot be healed, but is highly resistant to all forms of damage and nearly impervious to Controlling type powers. Type ''/release_pets'' in the chat window to release all your pets.",
+            shortHelp: "Summon Singularity: Ranged Control Special",
+            icon: "gravitycontrol_singularity.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 240.0,
+                endurance: 20.8,
+                cast: 2.03
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['controller/gravity-control'] = CONTROLLER_GRAVITY_CONTROL_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CONTROLLER_GRAVITY_CONTROL_POWERSET = CONTROLLER_GRAVITY_CONTROL_POWERSET;
+}
+
+// ---- js/data/powersets/controller/ice-control.js ----
+;/**
+ * Ice Control
+ * Character Level: 50
+ * Archetype: controller
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CONTROLLER_ICE_CONTROL_POWERSET = {
+    name: "Ice Control",
+    category: "Unknown",
+    description: "Ice Control powerset",
+    icon: "ice-control_set.png",
+    powers: [
+        {
+            name: "Block of Ice",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Holds", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You can freeze a single foe in a Block of Ice. The target is frozen solid, helpless, and can be attacked. More powerful foes may not be held, but all affected targets will be Slowed and take some Cold damage.",
+            shortHelp: "Ranged, DMG(Cold), Foe Hold, -SPD, -Recharge",
+            icon: "iceformation_blockofice.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.87,
+                damage: {
+                    type: "Cold",
+                    scale: 3.0291
+                },
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Chilblain",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Immobilize", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Immobilizes your target in an icy trap, dealing some Cold damage over time as well as slightly slowing the target's attack and movement speed. It can also cause flying targets to be grounded.",
+            shortHelp: "Ranged, DoT (Cold), Foe Immobilize, -SPD, -Recharge, -Fly",
+            icon: "iceformation_chillblains.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.17,
+                dotDamage: {
+                    type: "Cold",
+                    scale: 0.4758,
+                    ticks: 4
+                },
+                buffDuration: 9.2
+            }
+        },
+        {
+            name: "Frostbite",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Immobilize", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Immobilizes a group of foes in icy traps. Deals minimal Cold damage over time and slightly Slows the targets. Slower and less damaging than Chilblain, but can capture multiple targets. More resilient foes may only be Slowed.",
+            shortHelp: "Ranged (Targeted AoE), DoT (Cold), Foe Immobilize, -SPD, -Recharge",
+            icon: "iceformation_frostbite.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.9,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 15.6,
+                cast: 2.07,
+                dotDamage: {
+                    type: "Cold",
+                    scale: 0.1,
+                    ticks: 2
+                },
+                buffDuration: 5.2
+            }
+        },
+        {
+            name: "Arctic Air",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Confuse", "Controller Archetype Sets", "Slow Movement"],
+            description: "While this power is active, you are surrounded in a fog of Arctic Air that dramatically slows the attack and movement speed of nearby foes. The chill of Arctic Air is so bitter that many foes are forced to flee, albeit very slowly, from the immediate area. Others may attack their own allies, as the fog from the Arctic Air is thick and can cause much confusion. The cold air can also reduced the stealth capability of affected foes.",
+            shortHelp: "Toggle: PBAoE, Foe Confuse(Special), -SPD, -Recharge, -Stealth",
+            icon: "iceformation_articair.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 15.0,
+                endurance: 2.08,
+                cast: 2.03,
+                buffDuration: 2.25
+            }
+        },
+        {
+            name: "Cold Snap",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Fear", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Fear", "Slow Movement"],
+            description: "You blast forth a wide cone of chilling air that dramatically slows the enemies' movement and attack rate and might leave nearby foes trembling.<br><br><color #fcfc95>Notes: The Fear component applies only to enemies in the center area of effect.</color>",
+            shortHelp: "Ranged (Cone), Foe Fear, -SPD, -Recharge",
+            icon: "iceformation_shiver.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 2.3562,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 40.0,
+                endurance: 10.4,
+                cast: 2.17,
+                buffDuration: 18.0
+            }
+        },
+        {
+            name: "Ice Slick",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You can create a large patch of ice at a targeted area, causing all foes that pass through it to lose their footing. Those caught in the Ice Slick are dramatically slowed, take cold damage over time, tend to fall down and will be unable to jump.",
+            shortHelp: "Target (Location AoE), Foe DoT (Cold), Knockdown, -SPD",
+            icon: "iceformation_iceslick.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 90.0,
+                endurance: 10.4,
+                cast: 1.67,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Flash Freeze",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Ranged AoE Damage", "Sleep", "Universal Damage Sets"],
+            description: "You can Flash Freeze a large patch of ground beneath a targeted foe, instantly forming dozens of deadly ice shards that do Cold damage to all enemies in the area. The victims are left trapped within the icicles, but can break free if disturbed. Only targets near the ground can be affected.<br><br><color #fcfc95>Notes: Although this power is Auto Hit, it requires a To Hit check to apply Deep Sleep. If The Hit check is missed, and the target is not an AV, the weaker form of Sleep will be applied.</color>",
+            shortHelp: "Ranged (Targeted AoE), DMG(Cold), Foe Deep Sleep",
+            icon: "iceformation_flashfreeze.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 45.0,
+                endurance: 15.6,
+                cast: 2.37,
+                damage: {
+                    type: "Cold",
+                    scale: 0.2
+                }
+            }
+        },
+        {
+            name: "Glacier",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "Slow", "EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Holds", "Slow Movement"],
+            description: "You can freeze all foes around yourself in blocks of Glacial ice. The targets are frozen solid, helpless, and can be attacked. Even after the victims emerge, they remain chilled and their attack and movement speed is Slowed for a while. This power can only be cast near the ground.<br><br><color #fcfc95>Notes: This power has adaptive recharge. It has a base recharge of <color #FF7F27>8</color> seconds and each affected foe will increase the recharge by <color #FF7F27>14.5</color> seconds for a maximum total of <color #FF7F27>240</color> seconds.</color>",
+            shortHelp: "PBAoE, Foe Hold, -Recharge, -SPD",
+            icon: "iceformation_glacier.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.8,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 2.03,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Jack Frost",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Pet Damage", "Recharge Intensive Pets", "Universal Damage Sets"],
+            description: "You can create a very powerful entity of animated ice at a targeted location. Jack Frost possesses several ice powers to attack any nearby foes and can be healed and buffed like any teammate. Type ''/release_pets'' in the chat window to release all your pets.",
+            shortHelp: "Summon Jack Frost: Melee DMG(Lethal/Cold)",
+            icon: "iceformation_jackfrost.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 240.0,
+                endurance: 20.8,
+                cast: 1.87
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['controller/ice-control'] = CONTROLLER_ICE_CONTROL_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CONTROLLER_ICE_CONTROL_POWERSET = CONTROLLER_ICE_CONTROL_POWERSET;
+}
+
+// ---- js/data/powersets/controller/illusion-control.js ----
+;/**
+ * Illusion Control
+ * Character Level: 50
+ * Archetype: controller
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CONTROLLER_ILLUSION_CONTROL_POWERSET = {
+    name: "Illusion Control",
+    category: "Unknown",
+    description: "Illusion Control powerset",
+    icon: "illusion-control_set.png",
+    powers: [
+        {
+            name: "Blind",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Holds", "Ranged Damage", "Sleep", "Universal Damage Sets"],
+            description: "Painfully Blinds a single targeted foe so severely that they are rendered helpless. Blind is so bright that additional foes may also be blinded, though they will not take any damage, and attacking them will free them from the effects.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Psionic), Foe Hold/Sleep",
+            icon: "illusions_blind.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.1,
+                range: 80.0,
+                recharge: 9.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    type: "Psionic",
+                    scale: 4.8936
+                }
+            }
+        },
+        {
+            name: "Spectral Wounds",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Universal Damage Sets"],
+            description: "Spectral Wounds convinces the target that they have taken severe damage. The illusion is so convincing that the victim can fall from the Spectral Wounds. However, the damage is not real, and if the victim survives long enough, the illusion will fade and some of the wounds will heal.",
+            shortHelp: "Ranged, DMG(Psionic/Special), +Special",
+            icon: "illusions_spectralwounds.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.1,
+                range: 80.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.07,
+                damage: {
+                    type: "Psionic",
+                    scale: 4.7235
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Deceive",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Confuse", "Controller Archetype Sets"],
+            description: "You can Deceive an enemy into believing their friends are not who they appear to be. If successful, the enemy will ignore you and attack their own allies. If you Deceive someone before they have noticed you, your presence will continue to be masked. Damage done by a Deceived enemy will reduce the total amount of Experience Points awarded when a foe is defeated.",
+            shortHelp: "Ranged, Foe Confuse",
+            icon: "illusions_decieve.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 2.0
+            }
+        },
+        {
+            name: "Flash",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Holds"],
+            description: "Generates a brilliant flash of light around you that blinds nearby foes. Flashed foes are rendered helpless and unable to defend themselves.<br><br><color #fcfc95>Notes: This power has adaptive recharge. It has a base recharge of <color #FF7F27>8</color> seconds and each affected foe will increase the recharge by <color #FF7F27>14.5</color> seconds for a maximum total of <color #FF7F27>240</color> seconds.</color>",
+            shortHelp: "PBAoE, Foe Hold",
+            icon: "illusions_flash.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.8,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 3.0
+            }
+        },
+        {
+            name: "Superior Invisibility",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "You can bend light around yourself to become completely Invisible. While this power is active, you are all but impossible to detect, and have an extremely high Defense bonus to all attacks. Superior Invisibility is the only toggle invisibility power that allows you to attack while it is active, although you will lose some of your defense bonus if you do so.",
+            shortHelp: "Toggle: Self Stealth, +DEF(All)",
+            icon: "illusions_invisibility.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.182,
+                cast: 0.73,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Group Invisibility",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Makes you and all teammates around you Invisible. While Invisible, you and your teammates are almost impossible to detect. Even if discovered, Group Invisibility grants a bonus to your Defense to all attacks, although you will lose some of your defense bonus if you attack. Group Invisibility has no movement penalty.",
+            shortHelp: "PBAoE, Team Stealth, +DEF(All)",
+            icon: "illusions_giveinvisibility.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 240.0,
+                endurance: 10.4,
+                cast: 2.03,
+                buffDuration: 120.0
+            }
+        },
+        {
+            name: "Phantom Army",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Pet Damage", "Recharge Intensive Pets", "Universal Damage Sets"],
+            description: "You can fabricate 3 Phantom heroes around a targeted foe. These Phantoms are not real, and are indestructible. Their attacks are similar to Spectral Wounds. Though they deal damage, it is illusory and will heal if the victim survives long enough. Phantoms are short lived and cannot be buffed or healed.",
+            shortHelp: "Summon Decoys: Ranged DMG(Psionic)",
+            icon: "illusions_phantomarmy.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 240.0,
+                endurance: 26.0,
+                cast: 3.1,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Spectral Terror",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Fear", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Controller Archetype Sets", "Fear", "To Hit Debuff"],
+            description: "You can create an illusion of unspeakable Terror. The manifestation is so horrible that it caused most foes to tremble helplessly in terror. The Spectral Terror may also Terrify individual foes, causing them to run away in panic.",
+            shortHelp: "Summon Terror: Ranged Fear, -ToHit",
+            icon: "illusions_spectralterror.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 45.0,
+                endurance: 16.64,
+                cast: 3.2,
+                buffDuration: 45.0
+            }
+        },
+        {
+            name: "Phantasm",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Pet Damage", "Recharge Intensive Pets", "Universal Damage Sets"],
+            description: "You can construct a powerful entity composed of pure light. Although made of light, the Phantasm is tangible and has powerful Energy attacks. The Phantasm can also fly and summon duplicates of itself. The duplicates are intangible, and cannot be harmed. The duplicates' attacks deal illusory damage similar to that dealt by Spectral Wounds. Only the original Phantasm can be healed and buffed. Type ''/release_pets'' in the chat window to release all your pets.",
+            shortHelp: "Summon Phantasm: Ranged, DMG(Smash/Energy/Psionic)",
+            icon: "illusions_phantasm.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 240.0,
+                endurance: 26.0,
+                cast: 2.03
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['controller/illusion-control'] = CONTROLLER_ILLUSION_CONTROL_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CONTROLLER_ILLUSION_CONTROL_POWERSET = CONTROLLER_ILLUSION_CONTROL_POWERSET;
+}
+
+// ---- js/data/powersets/controller/kinetics.js ----
+;/**
+ * Kinetics
+ * Character Level: 50
+ * Archetype: controller
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CONTROLLER_KINETICS_POWERSET = {
+    name: "Kinetics",
+    category: "Unknown",
+    description: "Kinetics powerset",
+    icon: "kinetics_set.png",
+    powers: [
+        {
+            name: "Siphon Power",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: [],
+            description: "You can Siphon the Power from a targeted foe, reducing their damage potential. The power is transferred back to you, increasing your own damage potential and that of all nearby allies.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Foe -DMG, Team +DMG",
+            icon: "kineticboost_siphonpower.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 20.0,
+                endurance: 10.4,
+                cast: 1.93,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Transfusion",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Endurance Modification", "Healing"],
+            description: "Transfusion drains an enemy of some Endurance and reduces the target's Regeneration rate, and transfers that energy, in the form of Hit Points, to all allies near the affected foe. You can use Transfusion to heal yourself as well as your allies.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged, Foe -End, -Regen, Team Heal",
+            icon: "kineticboost_transfusion.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 60.0,
+                recharge: 8.0,
+                endurance: 7.8,
+                cast: 1.17,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Repel",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Knockback"],
+            description: "Repel creates a zone of kinetic energy that violently repels nearby foes. Each villain that is repelled costs additional Endurance.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Toggle: Self AoE Knockback",
+            icon: "kineticboost_repel.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 0.325,
+                cast: 1.07,
+                buffDuration: 0.5
+            }
+        },
+        {
+            name: "Siphon Speed",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "You can Siphon the speed from a targeted foe, Slowing their movement and attack rate while boosting your own.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Foe -Speed, -Recharge, Self +Speed, +Recharge",
+            icon: "kineticboost_siphonspeed.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 60.0,
+                endurance: 7.8,
+                cast: 1.93,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Increase Density",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "Increases an ally's mass, freeing them from any Disorient, Immobilization, or Hold effects and leaving them resistant to such effects for a while. Increase Density also protects the target from Knockback, Repel and enemy Teleportation, as well as Smashing and Energy damage. Because the target grows more dense, their movement speed is Slowed. Although the Damage Resistance and slowing effect will not stack with multiple applications, the rest of the effects of Increase Density will. You cannot use this power on yourself.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Ranged, Ally Special",
+            icon: "kineticboost_increasedensity.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 3.0,
+                endurance: 5.2,
+                cast: 2.07,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.5,
+                            ticks: 30
+                        },
+                        {
+                            type: "Energy",
+                            scale: 2.5,
+                            ticks: 30
+                        }
+                    ]
+                },
+                buffDuration: 60.0,
+                stun: 1.0,
+                stunDuration: 60.0
+            }
+        },
+        {
+            name: "Speed Boost",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Running", "Running & Sprints", "Universal Travel"],
+            description: "You can hasten a targeted ally and its nearby allies. The allies' movement speed, attack rate, and Endurance recovery are all greatly increased and they gain resistance to Slow effects. You cannot use this power on yourself.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Ranged, Allies +SPD, +Recharge, +Recovery, Res Slow",
+            icon: "kineticboost_speedboost.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 2.0,
+                endurance: 7.8,
+                cast: 1.0,
+                buffDuration: 120.0
+            }
+        },
+        {
+            name: "Inertial Reduction",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Leaping", "Leaping & Sprints", "Universal Travel"],
+            description: "You can reduce your Inertia, along with that of all nearby allies. The affected heroes can then jump incredible distances for a while.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE, Allies +Jump",
+            icon: "kineticboost_initialreductions.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 60.0,
+                endurance: 23.4,
+                cast: 2.03,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Transference",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "Transference drains an enemy of some of their Endurance and transfers that Endurance to all allies near the affected foe. You can use Transference to recover Endurance for yourself as well as your allies.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Targeted AoE), Target -End, Team +Recovery, Special",
+            icon: "kineticboost_transferance.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.1,
+                range: 60.0,
+                recharge: 30.0,
+                endurance: 2.6,
+                cast: 2.27
+            }
+        },
+        {
+            name: "Fulcrum Shift",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: [],
+            description: "Fulcrum Shift drains the power of a targeted foe and all foes nearby, transferring it to all adjacent allies, the caster, and those near the caster. Affected foes will deal less damage, while your affected allies will deal more. The more foes that are affected, the more power your allies receive. Fulcrum Shift can dramatically turn the tide of a melee battle.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Foe AoE), Foe -DMG, Team +DMG",
+            icon: "kineticboost_kinetictransfer.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 60.0,
+                endurance: 15.6,
+                cast: 2.17
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['controller/kinetics'] = CONTROLLER_KINETICS_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CONTROLLER_KINETICS_POWERSET = CONTROLLER_KINETICS_POWERSET;
+}
+
+// ---- js/data/powersets/controller/marine-affinity.js ----
+;/**
+ * Marine Affinity
+ * Character Level: 50
+ * Archetype: controller
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CONTROLLER_MARINE_AFFINITY_POWERSET = {
+    name: "Marine Affinity",
+    category: "Unknown",
+    description: "Marine Affinity powerset",
+    icon: "marine-affinity_set.png",
+    powers: [
+        {
+            name: "Shoal Rush",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Slow Movement"],
+            description: "By sensing the water in an area, you can direct a shoal of marine life to harass your foes. This lowers the defense and movement speed of all enemies struck.<br><br>If you direct a Shoal Rush on targets inside a <color #fcfc95>Tide Pool</color>, the marine life present will be thrown into a brief frenzy! While frenzied, the Tide Pool has a chance to knock over enemies and the damage buff and debuff is stronger.",
+            shortHelp: "Ranged (Targeted AoE), Foe -DEF, -SPD, Special",
+            icon: "marineaffinity_shoalrush.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 10.4,
+                cast: 2.17,
+                defenseDebuff: 1.6,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Soothing Wave",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Send forth a calming wave of water, washing over friend and foe alike. Allies will be healed by this power, while enemies will have their offensive power watered down.",
+            shortHelp: "Ranged (Facing Cone), Foe -DMG, Team Heal",
+            icon: "marineaffinity_soothingwave.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "Cone",
+            maxTargets: 255,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.0,
+                range: 45.0,
+                recharge: 10.0,
+                endurance: 13.52,
+                cast: 2.0
+            }
+        },
+        {
+            name: "Toroidal Bubble",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Leaping", "Leaping & Sprints", "Resist Damage", "Universal Travel"],
+            description: "You create a ring of Bubbles that surrounds your allies, hydrating them to replenish endurance and reducing the effects of endurance drain. The bubble also reduces all incoming damage, providing extra resistance to Smashing and Fire damage, and also increases jump height thanks to added buoyancy.",
+            shortHelp: "PBAoE, Team +Res(All DMG, End Drain), +End, +Recovery, +Jump",
+            icon: "marineaffinity_toroidalbubble.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 60.0,
+                endurance: 8.0,
+                cast: 1.77,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.5,
+                            ticks: 30
+                        },
+                        {
+                            type: "Fire",
+                            scale: 2.5,
+                            ticks: 30
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 1.25,
+                            ticks: 30
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.25,
+                            ticks: 30
+                        },
+                        {
+                            type: "Energy",
+                            scale: 1.25,
+                            ticks: 30
+                        },
+                        {
+                            type: "Negative",
+                            scale: 1.25,
+                            ticks: 30
+                        },
+                        {
+                            type: "Psionic",
+                            scale: 1.25,
+                            ticks: 30
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 1.25,
+                            ticks: 30
+                        }
+                    ]
+                },
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Whitecap",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You summon a burst of water underfoot that hurls from your present location to a location of your choosing. When you splash down, any enemies in the surrounding area will be swept off their feet, and will experience a damage resistance debuff for a period of time. Enemies close to where you splash down will receive harsher debuffs for a brief time.<br><br>If you direct a Whitecap on targets inside a <color #fcfc95>Tide Pool</color>, the marine life present will be thrown into a brief frenzy! While frenzied, the Tide Pool has a chance to knock over enemies and the damage buff and debuff is stronger.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Cold), Foe Knockdown, -Resist(All), Self Teleport, Special",
+            icon: "marineaffinity_whitecap.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 30.0,
+                endurance: 18.0,
+                cast: 2.0
+            }
+        },
+        {
+            name: "Tide Pool",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "You summon a large pool of water at a targeted location to swell the damage that your allies deal, while reducing the damage, movement speeds, and stealth of enemies within the Tide Pool. <br><br>If an enemy is <color #fcfc95>defeated</color> in the pool, the marine life present will be thrown into a brief frenzy! While frenzied, the Tide Pool has a chance to knock over enemies and the damage buff and debuff is stronger.",
+            shortHelp: "Ranged (Location AoE), Team +DMG, Foe -DMG, -SPD, -Jump, -Stealth, Special",
+            icon: "marineaffinity_tidepool.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 10.0,
+                endurance: 13.0,
+                cast: 2.33,
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Brine",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing"],
+            description: "You coat an enemy in an extremely salinated layer of deep-sea brine that reduces your foe's resistance to damage and maximum hitpoints.<br><br>If <color #fcfc95>Shifting Tides</color> is active, Brine will consume up to <color #fcfc95>3</color> stacks upon use to reduce its base recharge by 15 seconds per stack.",
+            shortHelp: "Ranged, Foe -Resist(All), -MaxHP",
+            icon: "marineaffinity_brine.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 60.0,
+                endurance: 7.0,
+                cast: 2.07,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Shifting Tides",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage"],
+            allowedSetCategories: ["Ranged AoE Damage", "To Hit Buff", "Universal Damage Sets"],
+            description: "Select either a friend or foe to create a field of shifting tides around them.<br><br>When attacked, foes within the shifting tides will provide you and your allies a stacking Rising Tide buff that increases ToHit, Damage, and Recharge. Enemies may also take bonus damage, with the odds increasing per stack.",
+            shortHelp: "Toggle: Ranged (Targeted AoE), Team +DMG, +ToHit, +Recharge, Special Damage",
+            icon: "marineaffinity_shiftingtides.png",
+            powerType: "Toggle",
+            targetType: "Any",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 0.078,
+                cast: 1.17,
+                damage: {
+                    type: "Cold",
+                    scale: 0.5
+                },
+                buffDuration: 2.0
+            }
+        },
+        {
+            name: "Barrier Reef",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Healing"],
+            description: "Create a Barrier Reef teeming with life at your target location. The Barrier Reef will emit an aura that washes over allies in range, providing them with a defensive cover of water that will absorb and deflect some damage.",
+            shortHelp: "Summon Barrier Reef: Team +Absorb, +DEF(All)",
+            icon: "marineaffinity_wellspring.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 30.0,
+                endurance: 13.52,
+                cast: 2.37,
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Power of the Depths",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "Becoming a conduit of the ocean itself, you acclimate your allies to the incredible forces of the deep! This boosts the maximum hit points, maximum endurance, regeneration, and attack range of all nearby allies. Some of these effects will decay over time to a lower value.<br><br>If Power of the Depths is activated inside a <color #fcfc95>Tide Pool</color>, the marine life present will be thrown into a brief frenzy! While frenzied, the Tide Pool has a chance to knock over enemies and the damage buff and debuff is stronger.",
+            shortHelp: "PBAoE, Team +MaxHP, +MaxEnd, +Regen, +Range",
+            icon: "marineaffinity_powerofthedepths.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 240.0,
+                endurance: 26.0,
+                cast: 3.0,
+                buffDuration: 60.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['controller/marine-affinity'] = CONTROLLER_MARINE_AFFINITY_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CONTROLLER_MARINE_AFFINITY_POWERSET = CONTROLLER_MARINE_AFFINITY_POWERSET;
+}
+
+// ---- js/data/powersets/controller/mind-control.js ----
+;/**
+ * Mind Control
+ * Character Level: 50
+ * Archetype: controller
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CONTROLLER_MIND_CONTROL_POWERSET = {
+    name: "Mind Control",
+    category: "Unknown",
+    description: "Mind Control powerset",
+    icon: "mind-control_set.png",
+    powers: [
+        {
+            name: "Levitate",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "You can send a single target violently into the air, then slam them to the ground for Smashing damage. This power can bring flying foes to the ground. This power will affect enemies around your primary target, should it be used on the primary target of your Telekinesis.",
+            shortHelp: "Ranged, DMG(Smash)",
+            icon: "mentalcontrol_levitate.png",
+            powerType: "Click",
+            targetType: "Foe",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.87,
+                damage: {
+                    type: "Smashing",
+                    scale: 3.2691
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Mesmerize",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Ranged Damage", "Sleep", "Universal Damage Sets"],
+            description: "Mesmerize painfully assails a target with psychic energy, rendering them unconscious. The target will remain asleep for some time, but will awaken if attacked.<br><br><color #fcfc95>Notes: Although this power is Auto Hit, it requires a To Hit check to apply Deep Sleep. If The Hit check is missed, and the target is not an AV, the weaker form of Sleep will be applied.</color>",
+            shortHelp: "Ranged, DMG(Psionic), Foe Deep Sleep",
+            icon: "mentalcontrol_hypnotize.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.1,
+                range: 100.0,
+                recharge: 6.0,
+                endurance: 5.2,
+                cast: 1.67,
+                damage: {
+                    type: "Psionic",
+                    scale: 1.809
+                }
+            }
+        },
+        {
+            name: "Dominate",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Holds", "Ranged Damage", "Universal Damage Sets"],
+            description: "Painfully tears at the mind of a single foe. Dominate deals Psionic damage and renders a foe helpless, lost in their own mind and unable to defend themselves.",
+            shortHelp: "Ranged, DMG(Psionic), Foe Hold",
+            icon: "mentalcontrol_command.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.1,
+                damage: {
+                    type: "Psionic",
+                    scale: 1.745
+                }
+            }
+        },
+        {
+            name: "Confuse",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Confuse", "Controller Archetype Sets"],
+            description: "You can Confuse an enemy, forcing that foe to believe their friends are not who they appear to be. If successful, the enemy will ignore you and attack their own allies. If you Confuse someone before they have noticed you, your presence will continue to be masked. You will not receive any Experience Points for foes defeated by a Confused enemy.",
+            shortHelp: "Ranged, Target Confuse",
+            icon: "mentalcontrol_mindcontrol.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 2.0
+            }
+        },
+        {
+            name: "Mass Hypnosis",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Sleep", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Sleep"],
+            description: "Hypnotizes a group of foes at a distance and puts them to Sleep. The targets will remain asleep for some time, but will awaken if attacked. This power deals no damage, but if done discreetly, the targets will never be aware of your presence.<br><br><color #fcfc95>Notes: Although this power is Auto Hit, it requires a To Hit check to apply Deep Sleep. If The Hit check is missed, and the target is not an AV, the weaker form of Sleep will be applied.</color>",
+            shortHelp: "Ranged (Targeted AoE), Foe Deep Sleep",
+            icon: "mentalcontrol_masshypnosis.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 45.0,
+                endurance: 15.6,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Telekinesis",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Immobilize"],
+            description: "Lifts a foe, and any nearby foes, off the ground and repels them. The targets are helpless, unable to move, and will continue to hover away, picking up any passing targets, as long as you keep this power active. Keeping up this level of concentration costs a lot of Endurance. Note despite this power being auto-hit, it still requires a ToHit check.",
+            shortHelp: "Toggle: Ranged (Targeted AoE), Foe Immobilize, Repel",
+            icon: "mentalcontrol_telekinesis.png",
+            powerType: "Toggle",
+            targetType: "Foe",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 90.0,
+                endurance: 0.26,
+                cast: 1.13,
+                buffDuration: 1.5
+            }
+        },
+        {
+            name: "Total Domination",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Holds"],
+            description: "Tears at the mind of a target foe and those near him. Total Domination renders all affected foes helpless, lost in their own minds and unable to defend themselves.<br><br><color #fcfc95>Notes: This power has adaptive recharge. It has a base recharge of <color #FF7F27>8</color> seconds and each affected foe will increase the recharge by <color #FF7F27>14.5</color> seconds for a maximum total of <color #FF7F27>240</color> seconds.</color>",
+            shortHelp: "Ranged (Targeted AoE), Foe Hold",
+            icon: "mentalcontrol_freeze.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.8,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Terrify",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Fear", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Fear", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "This power Terrifies foes within a cone area in front of you, causing them to tremble in Fear uncontrollably. The affect is so frightening and overwhelming, that the target takes real damage from the physiological response to this Psionic attack.",
+            shortHelp: "Ranged (Cone), DMG(Psionic), Foe Fear(Special)",
+            icon: "mentalcontrol_terrify.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 40.0,
+                endurance: 20.8,
+                cast: 2.03,
+                damage: {
+                    type: "Psionic",
+                    scale: 1.7437
+                }
+            }
+        },
+        {
+            name: "Mass Confusion",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Confuse", "Controller Archetype Sets"],
+            description: "You can cause Mass Confusion within a group of foes, creating chaos. All affected foes within the area will turn and attack each other, ignoring all your allies. If you Confuse your foes before they noticed you, your presence will continue to go unnoticed.<br><br><color #fcfc95>Notes: <br>You will receive diminishedany Experience Points for foes defeated entirely by Confused enemies. <br><br>This power has adaptive recharge. It has a base recharge of <color #FF7F27>8</color> seconds and each affected foe will increase the recharge by <color #FF7F27>14.5</color> seconds for a maximum total of <color #FF7F27>240</color> seconds.</color>",
+            shortHelp: "Ranged (Targeted AoE), Foe Confuse",
+            icon: "mentalcontrol_confuse.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['controller/mind-control'] = CONTROLLER_MIND_CONTROL_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CONTROLLER_MIND_CONTROL_POWERSET = CONTROLLER_MIND_CONTROL_POWERSET;
+}
+
+// ---- js/data/powersets/controller/nature-affinity.js ----
+;/**
+ * Nature Affinity
+ * Character Level: 50
+ * Archetype: controller
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CONTROLLER_NATURE_AFFINITY_POWERSET = {
+    name: "Nature Affinity",
+    category: "Unknown",
+    description: "Nature Affinity powerset",
+    icon: "nature-affinity_set.png",
+    powers: [
+        {
+            name: "Corrosive Enzymes",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: [],
+            description: "You spray a target with toxic, corrosive Enzymes reducing the damage they deal as well as their damage resistance.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Foe -Res(All), -DMG(All)",
+            icon: "natureaffinity_corrosivesap.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 16.0,
+                endurance: 8.528,
+                cast: 1.0,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Regrowth",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "By channeling the energies present in nature you are able to immediately heal yourself and allies in front of you for a small amount of health and cause them to recover a small amount of health over time. Regrowth places a stack of Bloom on its target.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged Facing Cone, Minor Ally Heal, Ally Moderate Healing Over Time, +1 Bloom",
+            icon: "natureaffinity_regrowth.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "Cone",
+            maxTargets: 255,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.0,
+                range: 45.0,
+                recharge: 10.0,
+                endurance: 13.52,
+                cast: 2.0,
+                buffDuration: 4.1
+            }
+        },
+        {
+            name: "Wild Growth",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing", "Resist Damage"],
+            description: "You channel the power of nature into your allies allowing them to more easily shrug off damage and causing their wounds to heal more quickly. Wild Growth increases the damage resistance and boosts the regeneration rate of all affected allies. This power also grants 2 stacks of Bloom.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE, Team +Res(All), +Regen, +2 Bloom",
+            icon: "natureaffinity_wildgrowth.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 225.0,
+                endurance: 15.6,
+                cast: 2.17,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Spore Cloud",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["To Hit Debuff"],
+            description: "You create a large cloud of toxic spores around your targeted foe. The target and all nearby foes will have their damage output, chance to hit and regeneration rate reduced.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle (Targeted AoE), Foe -Dmg(All), -To Hit, -Regen",
+            icon: "natureaffinity_sporecloud.png",
+            powerType: "Toggle",
+            targetType: "Foe",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 8.0,
+                endurance: 0.26,
+                cast: 3.1,
+                tohitDebuff: 1.5,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Lifegiving Spores",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "When activating this power you cause all allies at a selected location to recover a small amount of health and endurance every few seconds as long as they remain within the Lifegiving Spores.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle (Location AoE), PBAoE +Minor Heal Over Time, +Endurance",
+            icon: "natureaffinity_lifegivingspores.png",
+            powerType: "Toggle",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 4.0,
+                endurance: 0.26,
+                cast: 2.33
+            }
+        },
+        {
+            name: "Wild Bastion",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You encase yourself and nearby allies in a protective barrier that will absorb a moderate amount of damage. Additionally, affected allies will heal for a portion of their health over time. Wild Bastion places 3 stacks of Bloom on all affected targets.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE, Team +Absorb, +Heal Over Time, +3 Bloom",
+            icon: "natureaffinity_wildbastion.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 240.0,
+                endurance: 13.0,
+                cast: 2.27,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Rebirth",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "Rebirth can either greatly heal a conscious ally for a large amount of health over time or it can revive a fallen ally with a large amount of health and endurance and cause them to recover health over time. This power also grants 3 stacks of Bloom.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged, Ally Rez, +Heal Over Time, Special, +3 Bloom",
+            icon: "natureaffinity_rebirth.png",
+            powerType: "Click",
+            targetType: "Leaguemate",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 45.0,
+                recharge: 180.0,
+                endurance: 26.0,
+                cast: 3.0
+            }
+        },
+        {
+            name: "Entangling Aura",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Controller Archetype Sets", "Holds"],
+            description: "While this power is active there is a high chance that entangling vines will grasp nearby foes and render them held for a short time.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Toggle, Foe Hold",
+            icon: "natureaffinity_ragingtempest.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 1.3,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Overgrowth",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Becoming a conduit of nature itself, you greatly boost the damage, to hit and endurance discount of nearby allies for a long period of time. Overgrowth also grants the affected targets 5 stacks of Bloom.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "PBAoE, Team +Damage, +To Hit, +Endurance Discount, +5 Bloom",
+            icon: "natureaffinity_overgrowth.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 255.0,
+                endurance: 26.0,
+                cast: 3.0,
+                tohitBuff: 1.0,
+                buffDuration: 60.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['controller/nature-affinity'] = CONTROLLER_NATURE_AFFINITY_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CONTROLLER_NATURE_AFFINITY_POWERSET = CONTROLLER_NATURE_AFFINITY_POWERSET;
+}
+
+// ---- js/data/powersets/controller/pain-domination.js ----
+;/**
+ * Pain Domination
+ * Character Level: 50
+ * Archetype: controller
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CONTROLLER_PAIN_DOMINATION_POWERSET = {
+    name: "Pain Domination",
+    category: "Unknown",
+    description: "Pain Domination powerset",
+    icon: "pain-domination_set.png",
+    powers: [
+        {
+            name: "Nullify Pain",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Nullify Pain will heal nearby allies for some hit points by numbing the pain caused by their wounds. Nullify Pain is not as potent as Soothe, but can heal multiple targets at once.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "PBAoE, Team +Heal",
+            icon: "paindomination_nullifypain.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 8.0,
+                endurance: 13.0,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Soothe",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You heal an ally by numbing their pain and calming their mind. You cannot use this power on yourself.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ally Heal",
+            icon: "paindomination_soothe.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 13.0,
+                cast: 2.27
+            }
+        },
+        {
+            name: "Share Pain",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Share Pain draws away some of an ally's anguish caused by their wounds, but damages the user. The pain caused by this power causes the user to go into a frenzy, briefly increasing their damage output, however the user cannot be healed and will have their regeneration rate greatly diminished for a short time.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ally Strong Heal, Self Moderate DMG(Special), +DMG",
+            icon: "paindomination_sharepain.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 0.52,
+                cast: 2.27,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Conduit of Pain",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "You revive a fallen ally by becoming a Conduit of Pain and transferring the pain that was inflicted upon them back upon your enemies. This will briefly empower you increasing your damage output, recovery rate, attack rate and chance to hit. After a minute the effect will wear off leaving you weakened for 30 seconds. Your damage, attack rate and chance to hit will all be reduced during this period.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ally Rez, Self +DMG, +Recharge, +Recovery, +To Hit, +Special",
+            icon: "paindomination_conduitofpain.png",
+            powerType: "Click",
+            targetType: "Player Ally (Dead)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 15.0,
+                recharge: 180.0,
+                endurance: 26.0,
+                cast: 3.2,
+                buffDuration: 0.5,
+                tohitBuff: 2.0,
+                tohitDebuff: 2.0
+            }
+        },
+        {
+            name: "Enforced Morale",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: [],
+            description: "Enforced Morale frees an ally from any Disorient, Hold, Sleep, Fear, Confuse and Immobilize effects and leaves them resistant to such effects for a good while. Also, Enforced Morale grants the target clearer Perception to see hidden foes, and a minor recharge and movement speed boost. The Protection and Movement boosts will improve with multiple applications and as you advance in level, although the Recharge and Movement boosts will only apply for the first few applications. If the ally is not damaged, Enforced Morale will cause them some pain before granting its benefits.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ally +Res(Disorient, Hold, Sleep, Immobilize, Fear, Confuse), +Perception, +Recharge, +Speed, Light DMG",
+            icon: "paindomination_enforcedmorale.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                stun: 1.0,
+                stunDuration: 90.0,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Soothing Aura",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "While this power is active all nearby allies will be healed by Soothing Aura every couple of seconds for a small portion of their health.<br><br><color #fcfc95>Notes: While on PvP maps this power will grant affected targets a regeneration effect instead of a periodic heal.).</color><br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: PBAoE, Team Minor Periodic Heal",
+            icon: "paindomination_soothingaura.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.78,
+                cast: 1.67
+            }
+        },
+        {
+            name: "World of Pain",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge"],
+            allowedSetCategories: ["Resist Damage", "To Hit Buff"],
+            description: "When this power is activated the user and all nearby team members will gain a moderate damage, resistance, and To Hit bonus. Additionally those affected by this power will also be protected from Placate effects.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE Team +To Hit, +DMG, +RES(All DMG, Placate)",
+            icon: "paindomination_worldofpain.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 240.0,
+                endurance: 10.192,
+                cast: 2.03,
+                tohitBuff: 1.0,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Anguishing Cry",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff"],
+            description: "You let out an Anguishing Cry causing a great deal of pain in your foes reducing their resistance and defense to damage for a short time.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE, Foe -RES(All), -DEF(All)",
+            icon: "paindomination_anguishingcry.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 120.0,
+                endurance: 13.0,
+                cast: 1.97,
+                defenseDebuff: 3.0,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Painbringer",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "You transform an ally to pain incarnate turning them into an inexhaustible killing machine. While the character is imbued with this power they will benefit from incredible health regeneration, endurance recovery and improved damage potential for a short time.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Ally, +Regeneration, +Recovery, +DMG",
+            icon: "paindomination_painbringer.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 300.0,
+                endurance: 10.4,
+                cast: 2.27,
+                buffDuration: 90.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['controller/pain-domination'] = CONTROLLER_PAIN_DOMINATION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CONTROLLER_PAIN_DOMINATION_POWERSET = CONTROLLER_PAIN_DOMINATION_POWERSET;
+}
+
+// ---- js/data/powersets/controller/plant-control.js ----
+;/**
+ * Plant Control
+ * Character Level: 50
+ * Archetype: controller
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CONTROLLER_PLANT_CONTROL_POWERSET = {
+    name: "Plant Control",
+    category: "Unknown",
+    description: "Plant Control powerset",
+    icon: "plant-control_set.png",
+    powers: [
+        {
+            name: "Entangle",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Immobilize", "Ranged Damage", "Universal Damage Sets"],
+            description: "Immobilizes your target by Entangling their feet in a twisted mass of thorny roots. The roots do smashing and lethal damage to the target over time. More resilient foes may require multiple applications to Immobilize. Entangle can immobilize flying targets, if they are near the ground when attacked.",
+            shortHelp: "Ranged, DoT(Smashing, Lethal), Foe Immobilize",
+            icon: "plantcontrol_entangle.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.2,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 0.51,
+                            ticks: 4
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.31000000000000005,
+                            ticks: 4
+                        }
+                    ]
+                },
+                buffDuration: 9.2
+            }
+        },
+        {
+            name: "Strangler",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Holds", "Ranged Damage", "Universal Damage Sets"],
+            description: "Holds a distant foe by Strangling them with massive root-like vines. The target is held helpless, while they is slowly crushed by the vines.",
+            shortHelp: "Ranged, DoT(Smashing), Foe Hold",
+            icon: "plantcontrol_strangler.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 2.07,
+                dotDamage: {
+                    type: "Smashing",
+                    scale: 1.0907,
+                    ticks: 4
+                },
+                buffDuration: 4.2
+            }
+        },
+        {
+            name: "Roots",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Immobilize", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Immobilizes a group of foes by entangling their feet in a twisted mass of thorny Roots. Roots is slower and does less damage than Entangle, but it can capture multiple foes in one attack. Like Entangle, Roots can immobilize flying targets, if they are near the ground when attacked.",
+            shortHelp: "Ranged (Targeted AoE), DoT(Smashing, Lethal), Foe Immobilize",
+            icon: "plantcontrol_roots.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.9,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 13.0,
+                cast: 1.67,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 0.385,
+                            ticks: 2
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.185,
+                            ticks: 2
+                        }
+                    ]
+                },
+                buffDuration: 5.2
+            }
+        },
+        {
+            name: "Spore Burst",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Sleep", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Sleep"],
+            description: "You hurl a large fungi pod at your foes. This pod is full of Spores that burst on impact, engulfing the target and all those around them. All affected targets may succumb to the narcotic effect of the Spores and will fall asleep. The targets will remain asleep for some time, but will awaken if attacked.<br><br><color #fcfc95>Notes: Although this power is Auto Hit, it requires a To Hit check to apply Deep Sleep. If The Hit check is missed, and the target is not an AV, the weaker form of Sleep will be applied.</color>",
+            shortHelp: "Ranged (Targeted AoE), Foe Deep Sleep",
+            icon: "plantcontrol_sporeburst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 45.0,
+                endurance: 13.0,
+                cast: 1.37
+            }
+        },
+        {
+            name: "Seeds of Confusion",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Confuse", "Controller Archetype Sets"],
+            description: "You throw a handful of seeds from a rare Baffle plant at your foes. The seeds spread out in a wide cone and release a dusty chaff that contain a number of alkaloids and hallucinogenic compounds. Foes that come into contact with these seeds become violently confused and will turn and attack each other, ignoring you and all your allies. You will not receive any Experience Points for foes defeated entirely by Confused enemies.<br><br><color #fcfc95>Notes: This power has adaptive recharge. It has a base recharge of <color #FF7F27>6</color> seconds and each affected foe will increase the recharge by <color #FF7F27>6.5</color> seconds for a maximum total of <color #FF7F27>110</color> seconds.</color>",
+            shortHelp: "Ranged (Cone), Foe Confuse",
+            icon: "plantcontrol_seedsconfusion.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 1.0472,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 6.0,
+                endurance: 15.6,
+                cast: 1.07
+            }
+        },
+        {
+            name: "Spirit Tree",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing", "Threat Duration"],
+            description: "You can tap into the elusive and powerful energy of the World Tree and extract a Spirit Tree at a targeted location. The Sprit Tree is immobile, but possesses incredible rejuvenating powers. The Regeneration Rate of you, or your allies, will be greatly increased as long as you are near the Spirit Tree. The tree will also distract some enemies, taunting them to attack it instead of you.",
+            shortHelp: "Place Tree: PBAoE +Regen",
+            icon: "plantcontrol_spirittree.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 120.0,
+                endurance: 13.0,
+                cast: 1.67,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Vines",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Holds", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Creates a field of Strangler Vines that can Hold multiple foes at range. The affected targets are held helpless by the massive root-like vines. Vines lowers damage output of targets and deals toxic damage over time if they are held.",
+            shortHelp: "Ranged (Targeted AoE), Foe Hold, -DMG, -DoT(Toxic)",
+            icon: "plantcontrol_vines.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 0.8,
+                range: 80.0,
+                recharge: 240.0,
+                endurance: 15.6,
+                cast: 2.1
+            }
+        },
+        {
+            name: "Carrion Creepers",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Immobilize", "Knockback", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You can create a Creeper patch at a targeted location. The patch will snag foes, slowing their movement, and preventing them from jumping or flying. Additionally, a Creeper Vine will burst from under each live and defeated foe in the area and start attacking your enemies. Creeper Vines do minimal damage, but they can knock down your enemies and its poisonous thorns can slow your foes. Any foes that are defeated in the Creeper patch will also produce a growth of Entangle Roots that will Immobilize any enemies near the defeated foe.",
+            shortHelp: "Summon Creepers, Ranged (Location AoE), Target -Speed, -Fly, -Jump,",
+            icon: "plantcontrol_carrioncreeper.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 360.0,
+                endurance: 26.0,
+                cast: 1.17,
+                buffDuration: 120.0
+            }
+        },
+        {
+            name: "Fly Trap",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Pet Damage", "Recharge Intensive Pets", "Universal Damage Sets"],
+            description: "You can summon a giant carnivorous Fly Trap plant beast. Fly Trap may be an understatement, as this plant beast has a taste for flesh. The Fly Trap will viciously attack any nearby foes; biting, hurling poisonous Thorns and even casting its own Entangle Roots. The Fly Trap will fight by your side and can be healed and buffed like any teammate.",
+            shortHelp: "Summon Fly Trap: Ranged Control Special",
+            icon: "plantcontrol_venusflytrap.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 240.0,
+                endurance: 26.0,
+                cast: 1.17
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['controller/plant-control'] = CONTROLLER_PLANT_CONTROL_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CONTROLLER_PLANT_CONTROL_POWERSET = CONTROLLER_PLANT_CONTROL_POWERSET;
+}
+
+// ---- js/data/powersets/controller/poison.js ----
+;/**
+ * Poison
+ * Character Level: 50
+ * Archetype: controller
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CONTROLLER_POISON_POWERSET = {
+    name: "Poison",
+    category: "Unknown",
+    description: "Poison powerset",
+    icon: "poison_set.png",
+    powers: [
+        {
+            name: "Alkaloid",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "When used correctly, poisons can be used to heal, as well as harm. Alkaloid consists of just the right amount of amino acids to safely heal a single targeted ally. The healed target is also left with some resistance to Toxic Damage (This Toxic Damage Resistance cannot be Enhanced). You cannot use this power to heal yourself.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ally Heal, +Res(Toxic)",
+            icon: "poison_alkaloid.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 13.0,
+                cast: 1.53,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 2.0,
+                    ticks: 30
+                },
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Envenom",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff"],
+            description: "You Envenom your foe with a nasty poison, the poison then spreads to nearby foes. The toxin directly attacks the immune system, reducing the affected target's Defense, Damage Resistance and Hit Point Regeneration Rate. The poison is so potent, that the target actually responds less to Healing while affected by the poison. Secondary foes struck by this power will have a lesser effect placed on them while the primary target receives the full effectiveness of the power.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Targeted AoE), Foe -RES, -DEF, -Regen, -Heal",
+            icon: "poison_envenomaoe.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 12.0,
+                endurance: 10.4,
+                cast: 1.33,
+                defenseDebuff: 1.5,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Weaken",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "To Hit Debuff"],
+            description: "You poison a single foe with a venom that significantly Weakens their strength and and that of nearby foes. The affected primary target's chance to hit and Damage output is severely reduced Additionally, the affected targets secondary power effects are all weakened. The targets power effects like Heals, Defense Buffs, Endurance Drains, Disorients, Holds, Immobilizes, Knockbacks and more, are all weakened. Secondary foes struck by this power will have a lesser effect placed on them while the primary target receives the full effectiveness of the power.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Targeted AoE) Foe -DMG -To Hit, -Special",
+            icon: "poison_weakenaoe.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 16.0,
+                endurance: 10.4,
+                cast: 2.07,
+                buffDuration: 30.0,
+                tohitDebuff: 0.75
+            }
+        },
+        {
+            name: "Neurotoxic Breath",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "You can breath a cone of Neurotoxin gas that quickly start to anesthetize any nearby foes. Affected targets may choke on the gas as their movement and attack rate are severely reduced.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Cone), Foe -SPD, -Recharge",
+            icon: "poison_neurotoxicbreath.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 30.0,
+                endurance: 10.4,
+                cast: 2.67,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Elixir of Life",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Resist Damage"],
+            description: "With this Elixir, you can revive a fallen ally and turn him into a killing machine. The revived target has increased damage, chance to hit, Endurance recovery, and attack speed, and gains a resistance to Toxic damage. A brew of this sort is not without its side effects. The revived target will soon become very sick and severely weak after about 90 seconds. All effects of the Elixir will eventually wear off. Elixir of Life can only be used on Players and cannot be used on your Henchmen.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Close, Ally Rez, Special",
+            icon: "poison_elixiroflife.png",
+            powerType: "Click",
+            targetType: "Player Ally (Dead)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 15.0,
+                recharge: 180.0,
+                endurance: 26.0,
+                cast: 1.83,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 2.0,
+                    ticks: 45
+                },
+                buffDuration: 0.5,
+                tohitBuff: 3.0,
+                tohitDebuff: 3.0
+            }
+        },
+        {
+            name: "Antidote",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "This Antidote can free an ally from any Disorient, Hold, Sleep, Slow, Confuse, Fear and Immobilize effects and leaves them resistant to such effects for a good while. The Antidote also grants the target some resistance to Cold and Toxic damage. Some of the effects of this power will improve with Multiple applications and as you advance in level.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ally +Res(Disorient, Hold, Sleep, Immobilize, Confuse, Fear, Slow, Cold, Toxic)",
+            icon: "poison_antidote.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.53,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Toxic",
+                            scale: 2.0,
+                            ticks: 45
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.0,
+                            ticks: 45
+                        }
+                    ]
+                },
+                stun: 1.0,
+                stunDuration: 90.0,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Paralytic Poison",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Holds"],
+            description: "This Paralytic Poison viciously attacks a foe's nervous system and can leave an affected target completely Held and defenseless.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged Hold",
+            icon: "poison_paralytic.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 16.0,
+                endurance: 7.8,
+                cast: 2.0
+            }
+        },
+        {
+            name: "Poison Trap",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Endurance Modification", "Holds", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You can build a Poison Trap on the ground. Any foes that pass near the Poison Trap will cause it to detonate and release its toxic vapors. The poison is a highly toxic nerve gas, and any foes in the affected area may be drained of much of their Endurance and quickly Held or begin choking while suffering a minor amount of Toxic damage over time. The trap is almost impossible to detect, but it is fragile and may be set off by an enemy's explosion. Even if destroyed, the Trap will detonate.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Place Trap: PBAoE Foe Hold, -END, -Recovery, Chance to Hold, Minor DoT(Toxic)",
+            icon: "poison_poison_trap.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 60.0,
+                endurance: 10.4,
+                cast: 1.0,
+                buffDuration: 260.0
+            }
+        },
+        {
+            name: "Venomous Gas",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Defense Debuff", "To Hit Debuff"],
+            description: "You surround yourself in a cloud of toxic vapors that significantly weaken any enemies that get near you. Affected foes have their defense, damage resistance, damage and chance to hit reduced moderately.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: PBAoE, Foe -Res(All), -DMG(All), -Def(All), -To(Hit)",
+            icon: "poison_venomousgas.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 8.0,
+                endurance: 0.26,
+                cast: 2.03,
+                buffDuration: 0.75,
+                defenseDebuff: 1.0,
+                tohitDebuff: 1.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['controller/poison'] = CONTROLLER_POISON_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CONTROLLER_POISON_POWERSET = CONTROLLER_POISON_POWERSET;
+}
+
+// ---- js/data/powersets/controller/pyrotechnic-control.js ----
+;/**
+ * Pyrotechnic Control
+ * Character Level: 50
+ * Archetype: controller
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CONTROLLER_PYROTECHNIC_CONTROL_POWERSET = {
+    name: "Pyrotechnic Control",
+    category: "Unknown",
+    description: "Pyrotechnic Control powerset",
+    icon: "pyrotechnic-control_set.png",
+    powers: [
+        {
+            name: "Dazzle",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Holds", "Ranged Damage", "Universal Damage Sets"],
+            description: "Incapacitates a distant foe with a brilliant explosion of pyrotechnic energy. The target is left helpless for the duration.<br><br>This power has a chance of Blasting Off targets into the air.",
+            shortHelp: "Ranged, Moderate DMG (Fire, Energy), Foe Hold, Chance for Blast Off",
+            icon: "pyrotechnic_dazzle.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.07,
+                damage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 1.6268000000000002
+                        },
+                        {
+                            type: "Energy",
+                            scale: 1.6268000000000002
+                        }
+                    ],
+                    scale: 3.2536000000000005
+                }
+            }
+        },
+        {
+            name: "Sparkling Cage",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Immobilize", "Ranged Damage", "Universal Damage Sets"],
+            description: "Immobilizes your target in a ring of pyrotechnic energy, dealing Fire and Energy damage over time. More resilient foes may require multiple Sparkling Cages to Immobilize.<br><br>This power has a chance of Blasting Off targets into the air.",
+            shortHelp: "Ranged, Moderate DoT(Fire, Energy), Foe Immobilize, Chance for Blast Off",
+            icon: "pyrotechnic_sparklingcage.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.17,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 0.358,
+                            ticks: 4
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.358,
+                            ticks: 4
+                        }
+                    ]
+                },
+                buffDuration: 9.2
+            }
+        },
+        {
+            name: "Sparkling Chain",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Immobilize", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Immobilizes a group of foes one by one in a chain formation, dealing Fire and Energy damage over time to each enemy in the chain. More resilient foes may require multiple casts to Immobilize. Sparkling Chain is slower and less damaging than Sparkling Cage, but can capture multiple targets.<br><br>This power has a chance of Blasting Off targets into the air. This chance is greater on the initial target of Sparkling Chain.",
+            shortHelp: "Ranged Chain AoE, Minor DoT(Fire, Energy), Foe Immobilize, Chance for Blast Off",
+            icon: "pyrotechnic_sparklingfield.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Chain",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.9,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 13.0,
+                cast: 1.03,
+                buffDuration: 1.1
+            }
+        },
+        {
+            name: "Glittering Column",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Ranged AoE Damage", "Threat Duration", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You summon a column of brilliant, glittering energy that is sure to capture foes' attention. The column will reduce the ToHit of any foe within a short range, while also Taunting them, forcing them to direct their attacks in its direction. <br><br>When the Glittering Column expires, it explodes, Blasting Off nearby enemies into the air.",
+            shortHelp: "Summon Glittering Column: Taunt, -ToHit, AoE DMG (Fire, Energy), Blast Off",
+            icon: "pyrotechnic_glitteringcolumn.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 40.0,
+                endurance: 7.8,
+                cast: 1.17,
+                buffDuration: 7.0
+            }
+        },
+        {
+            name: "Hypnotizing Lights",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Confuse", "Controller Archetype Sets", "Ranged AoE Damage", "Sleep", "Universal Damage Sets"],
+            description: "You conjure a whirl of lights with differing effects depending on the distance from which it is viewed. Most all targets within the area will be placed into a sleep like trance. <br><br>Up to five enemies within 20 feet of the display are Confused and receive Psionic damage over time.<br><br><color #fcfc95>Notes: Although this power is Auto Hit, it requires a To Hit check to apply Deep Sleep. If the Hit check is missed, and the target is not an AV, the weaker form of Sleep will be applied.</color>",
+            shortHelp: "Ranged (Cone), Foe Sleep, Foe Confuse (Within 20ft), Moderate DoT (Psionic), Foe Deep Sleep",
+            icon: "pyrotechnic_hypnotizinglights.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 0.7854,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 45.0,
+                endurance: 8.582,
+                cast: 1.67
+            }
+        },
+        {
+            name: "Brilliant Barrage",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Fear", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Fear", "Ranged AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "With a single gesture, you conjure pyrotechnic missiles to assault two locations at once. First, select a target for the first missile and then a location for the second. <br><br>Enemies near the target you have selected will be bombarded with miniature missiles and Stunned. Meanwhile, enemies near the location you have selected on the ground will be hit by a shrill noisemaking rocket and become Terrified.",
+            shortHelp: "Ranged (AoE), Foe Stun, Foe Terrorize, Minor DMG (Fire, Energy)",
+            icon: "pyrotechnic_multipurposemissiles.png",
+            powerType: "Click",
+            targetType: "Foe",
+            effectArea: "AoE",
+            maxTargets: 8,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 1.67
+            }
+        },
+        {
+            name: "Incendiary Aura",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Debuff", "To Hit Debuff"],
+            description: "You create an aura of pyrotechnic energy around yourself that has combustible properties. Enemies within range of the power have a persistent chance of Blasting Off into the air, as well as suffer from reduced ToHit and Defense.",
+            shortHelp: "Toggle: PBAoE, Chance for Blast Off. -ToHit, -Defense",
+            icon: "pyrotechnic_incendiaryaura.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 0.08,
+                cast: 1.47,
+                tohitDebuff: 1.25,
+                buffDuration: 0.45,
+                defenseDebuff: 0.75
+            }
+        },
+        {
+            name: "Explosive Bouquet",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Holds"],
+            description: "You create an explosion of light and sound in a flower formation. Foes inside the blast radius will be Held and Blasted Off into the air.<br><br><color #fcfc95>Notes: This power has adaptive recharge. It has a base recharge of <color #FF7F27>8</color> seconds and each affected foe will increase the recharge by <color #FF7F27>14.5</color> seconds for a maximum total of <color #FF7F27>240</color> seconds.</color>",
+            shortHelp: "Ranged (AoE), Foe Hold, Blast Off",
+            icon: "pyrotechnic_explosivebouquet.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.8,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 2.93
+            }
+        },
+        {
+            name: "Catherine Wheel",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Pet Damage", "Recharge Intensive Pets", "Universal Damage Sets"],
+            description: "You can craft a wheel of pure pyrotechnic energy to assist you in battle. The Catherine Wheel employs a variety of pyrotechnic powers to damage and distract enemies. If an enemy becomes affected by the Blast Off effect from one of your powers, the Catherine Wheel may Intercept the enemy with an attack, dealing additional damage.",
+            shortHelp: "Summon Catherine Wheel: Ranged DMG (Fire, Energy), Special",
+            icon: "pyrotechnic_catherinewheel.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.2,
+                range: 60.0,
+                recharge: 240.0,
+                endurance: 26.0,
+                cast: 2.03
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['controller/pyrotechnic-control'] = CONTROLLER_PYROTECHNIC_CONTROL_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CONTROLLER_PYROTECHNIC_CONTROL_POWERSET = CONTROLLER_PYROTECHNIC_CONTROL_POWERSET;
+}
+
+// ---- js/data/powersets/controller/radiation-emission.js ----
+;/**
+ * Radiation Emission
+ * Character Level: 50
+ * Archetype: controller
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CONTROLLER_RADIATION_EMISSION_POWERSET = {
+    name: "Radiation Emission",
+    category: "Unknown",
+    description: "Radiation Emission powerset",
+    icon: "radiation-emission_set.png",
+    powers: [
+        {
+            name: "Radiant Aura",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You can use Radiant Aura to heal some of your wounds, and the wounds of your group. This power has a small radius, so your allies need to be near you if they wish to be affected.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "PBAoE, Ally +Heal",
+            icon: "radiationpoisoning_radiationemission.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 8.0,
+                endurance: 13.0,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Radiation Infection",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Defense Debuff", "To Hit Debuff"],
+            description: "Infects a targeted foe with deadly radiation, severely reducing their chance to hit and Defense. All foes that come near the target will also become infected. The Radiation Infection will last until you deactivate it, or until the original target is defeated.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Ranged (Targeted AoE), Foe -DEF, -To Hit",
+            icon: "radiationpoisoning_enervatingfield.png",
+            powerType: "Toggle",
+            targetType: "Foe",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 8.0,
+                endurance: 0.26,
+                cast: 1.5,
+                tohitDebuff: 2.5,
+                buffDuration: 0.75,
+                defenseDebuff: 2.5
+            }
+        },
+        {
+            name: "Accelerate Metabolism",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Running", "Running & Sprints", "Universal Travel"],
+            description: "Activating this power emits radiation that increases the running speed, attack speed, Endurance recovery, and damage potential of all nearby allies. Affected heroes' metabolisms are increased so much that they become resistant to effects such as Sleep, Hold, Disorient, Immobilization and Endurance Drain.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Close (AoE), Ally +SPD, +Recharge, +Recovery, +DMG +Res(Effects)",
+            icon: "radiationpoisoning_acceleratemetabolism.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 422.0,
+                endurance: 15.6,
+                cast: 2.03,
+                buffDuration: 120.0,
+                stun: 1.0,
+                stunDuration: 120.0
+            }
+        },
+        {
+            name: "Enervating Field",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: [],
+            description: "While this power is active, you irradiate a targeted foe, and all foes nearby, with a deadly dose of radiation. This radiation weakens exposed targets, decreasing the damage of their attacks. It also significantly weakens their resistance, so they will take much more damage from other attacks.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Ranged (Targeted AoE), Foe -DMG, -Res",
+            icon: "radiationpoisoning_radiationinfection.png",
+            powerType: "Toggle",
+            targetType: "Foe",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 8.0,
+                endurance: 0.26,
+                cast: 1.5,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Mutation",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "Using a concentrated burst of radiation, you can revive a fallen hero and Mutate them into a killing machine. The Mutated hero has increased damage, chance to hit, Endurance recovery, and attack speed and is protected from XP Debt for 90 seconds. The entire experience is very taxing on the Mutated hero, and they will soon be severely weakened. All effects of the Mutation will eventually wear off.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Close, Ally Rez, Special",
+            icon: "radiationpoisoning_mutation.png",
+            powerType: "Click",
+            targetType: "Player Ally (Dead)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 15.0,
+                recharge: 180.0,
+                endurance: 26.0,
+                cast: 3.2,
+                buffDuration: 0.5,
+                tohitBuff: 3.0,
+                tohitDebuff: 3.0
+            }
+        },
+        {
+            name: "Lingering Radiation",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "You can emit Lingering Radiation that reduces the attack rate, movement speed, and Regeneration rate of the target, and all nearby foes.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged (Targeted AoE), Foe -Speed, -Recharge, -Regen",
+            icon: "radiationpoisoning_lingeringradiation.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 1.5,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Choking Cloud",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Controller Archetype Sets", "Holds"],
+            description: "While active, you generate toxic radioactive gas around yourself. Any nearby foes may be overcome by the gas, leaving them choking and helpless.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Toggle: PBAoE, Foe Hold",
+            icon: "radiationpoisoning_chokingcloud.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 1.3,
+                cast: 1.0
+            }
+        },
+        {
+            name: "Fallout",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Accurate To-Hit Debuff", "Defense Debuff", "Ranged AoE Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "After an ally falls in battle, you can activate this power to extract the energy from their body to deal a massive amount of Energy damage to any nearby foes. All affected foes are extremely weakened by the Fallout, and their chance to hit, Defense, Damage and Damage Resistance is severely reduced.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Post-Defeat: PBAoE, Extreme DMG(Energy), Foe -To Hit, -DEF, -DMG, -Res(All)",
+            icon: "radiationpoisoning_fallout.png",
+            powerType: "Click",
+            targetType: "Leaguemate (Dead)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 300.0,
+                endurance: 20.8,
+                cast: 3.2,
+                buffDuration: 1.0
+            }
+        },
+        {
+            name: "EM Pulse",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Endurance Modification", "Holds"],
+            description: "You can unleash a massive pulse of electromagnetic energy. This EMP can affect machines, and is even powerful enough to affect synaptic brain patterns. It will drain the Endurance and HP Regeneration of all affected targets and leave them incapacitated and Held for a long while. Additionally, most machines and robots will take moderate high damage. However, this power uses a lot of Endurance and leaves you unable to recover Endurance for a while.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "PBAoE, Foe Hold, -END, -Regen, Special vs. Robots; Self -Recovery",
+            icon: "radiationpoisoning_emppulse.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 300.0,
+                endurance: 20.8,
+                cast: 2.93,
+                damage: {
+                    type: "Energy",
+                    scale: 1.64
+                },
+                buffDuration: 15.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['controller/radiation-emission'] = CONTROLLER_RADIATION_EMISSION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CONTROLLER_RADIATION_EMISSION_POWERSET = CONTROLLER_RADIATION_EMISSION_POWERSET;
+}
+
+// ---- js/data/powersets/controller/shock-therapy.js ----
+;/**
+ * Shock Therapy
+ * Character Level: 50
+ * Archetype: controller
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CONTROLLER_SHOCK_THERAPY_POWERSET = {
+    name: "Shock Therapy",
+    category: "Unknown",
+    description: "Shock Therapy powerset",
+    icon: "shock-therapy_set.png",
+    powers: [
+        {
+            name: "Rejuvenating Circuit",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Create a circuit of healing energy between several nearby allies, healing them for a small amount. Every stack of Static you have will cause this power to chain to additional allies. The first few targets in the chain receive a more potent effect. Rejuvenating Circuit grants 1 stack of Static.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged (Chain), Ally Heal, Self +Static",
+            icon: "shocktherapy_rejuvenatingcircuit.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "Chain",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 13.0,
+                cast: 1.17
+            }
+        },
+        {
+            name: "Shock",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "Strike a single foe with a highly-charged electrical shock, draining some endurance and moderately reducing their recovery, regeneration and damage output.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Foe -DMG, -End, -Recovery, -Regen",
+            icon: "shocktherapy_shock.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 12.0,
+                endurance: 8.528,
+                cast: 2.0,
+                buffDuration: 25.0
+            }
+        },
+        {
+            name: "Galvanic Sentinel",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "Summons a Galvanic Sentinel to your aid. The Galvanic Sentinel shocks and weakens your foes, draining some endurance and reducing their regeneration, recovery, and damage output. The Galvanic Sentinel can be buffed and healed, and may be targeted with your Circuit powers.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Summon Galvanic Sentinel: Ranged Debuff Special",
+            icon: "shocktherapy_galvanicsentinel.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 60.0,
+                endurance: 25.0,
+                cast: 2.03,
+                buffDuration: 120.0
+            }
+        },
+        {
+            name: "Energizing Circuit",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "Create a circuit of pure energy between several nearby allies, restoring a small amount of their endurance and significantly increasing their attack rate for a short time. Every stack of Static you have will cause this power to chain to additional allies. The first few targets in the chain receive a more potent effect. Energizing Circuit grants 1 stack of Static.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Chain), Ally +End, +Recharge, Self +Static",
+            icon: "shocktherapy_energizingcircuit.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "Chain",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 35.0,
+                endurance: 13.0,
+                cast: 1.67,
+                buffDuration: 5.0
+            }
+        },
+        {
+            name: "Faraday Cage",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "Create a large energy barrier at your location which provides all allies within resistance to all damage except Toxic. They are also protected from status effects, knockbacks, endurance drain, recovery debuffs and recharge debuffs. Casting this power again will move the energy barrier to your location. Standing inside your own Faraday Cage will grant you a stack of Static every 5 seconds.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Location (PBAoE), Team +Res(All DMG but Toxic, Status, Knockback, -Rech, -Rec, -End)",
+            icon: "shocktherapy_faradaycage.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 25.0,
+                recharge: 10.0,
+                endurance: 13.0,
+                cast: 1.07,
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Empowering Circuit",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Create a circuit of empowering energy between several nearby allies, increasing their damage output and chance to hit for a short time. Every stack of Static you have will cause this power to chain to additional allies. The first few targets in the chain receive a more potent effect. Empowering Circuit grants 1 stack of Static.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Chain), Ally +DMG, +Tohit, Self +Static",
+            icon: "shocktherapy_empoweringcircuit.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "Chain",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 13.0,
+                cast: 1.0,
+                buffDuration: 60.0,
+                tohitBuff: 1.2
+            }
+        },
+        {
+            name: "Defibrillate",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Sleep", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Sleep"],
+            description: "Strike a target with a highly-charged jolt of electricity, reviving all nearby allies and draining all nearby foes. Any enemies affected will be drained of some endurance, have their recovery reduced and be put to sleep for a short time. Defibrillate consumes all stacks of Static, and the strength of the offensive component of this power scales with the number of stacks consumed. Allies will always be revived with full health and endurance regardless of the number of Static stacks consumed.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Melee (Targeted AoE), Ally Rez, Foe Sleep, -End, -Recovery",
+            icon: "shocktherapy_defibrillate.png",
+            powerType: "Click",
+            targetType: "Any",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 120.0,
+                endurance: 26.0,
+                cast: 3.3
+            }
+        },
+        {
+            name: "Insulating Circuit",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Create a circuit of protective energy between several nearby allies, granting them a small protective shield. Every stack of Static you have will cause this power to chain to additional allies. The first few targets in the chain receive a more potent effect. Insulating Circuit grants 1 stack of Static.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Chain), Ally +Absorb, Self +Static",
+            icon: "shocktherapy_insulatingcircuit.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "Chain",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 20.0,
+                endurance: 13.0,
+                cast: 1.0,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Amp Up",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: [],
+            description: "Empower an ally with raw energy, causing all of their abilities to unleash chained bolts of electricity at nearby foes. These bolts drain a small amount of endurance and have a chance to knock up the target. Amp Up also moderately increases their attack rate and greatly boosts the secondary effects of their powers. Their power effects like heals, defense debuffs, endurance drains, disorients, holds, immobilizes and more, are all improved.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Ranged, Ally +Special, +Recharge",
+            icon: "shocktherapy_ampup.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 300.0,
+                endurance: 10.4,
+                cast: 2.57,
+                buffDuration: 90.0,
+                stun: 1.0,
+                stunDuration: 90.0,
+                tohitBuff: 3.6,
+                defenseBuff: 3.6
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['controller/shock-therapy'] = CONTROLLER_SHOCK_THERAPY_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CONTROLLER_SHOCK_THERAPY_POWERSET = CONTROLLER_SHOCK_THERAPY_POWERSET;
+}
+
+// ---- js/data/powersets/controller/sonic-debuff.js ----
+;/**
+ * Sonic Debuff
+ * Character Level: 50
+ * Archetype: controller
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CONTROLLER_SONIC_DEBUFF_POWERSET = {
+    name: "Sonic Debuff",
+    category: "Unknown",
+    description: "Sonic Debuff powerset",
+    icon: "sonic-debuff_set.png",
+    powers: [
+        {
+            name: "Sonic Barrier",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "This shield dramatically reduces the damage an ally takes from Smashing, Lethal, and Toxic attacks for a limited time. You cannot stack multiple Sonic Barriers on the same target; however, the shield can be improved by another ally using the same power. Can also be used in conjunction with your Sonic Haven. You cannot use this power on yourself.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Ranged, Ally +Res(Smash, Lethal, Toxic)",
+            icon: "sonicdebuff_protectphysical.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 2.0,
+                endurance: 7.8,
+                cast: 1.33,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.0,
+                            ticks: 120
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 2.0,
+                            ticks: 120
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 2.0,
+                            ticks: 120
+                        }
+                    ]
+                },
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Sonic Siphon",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: [],
+            description: "By setting up a constant vibration within the body of your foe, you weaken their Damage Resistance. Affected targets will take more damage from successful attacks.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Foe -Res(All)",
+            icon: "sonicdebuff_debuffdamres.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 16.0,
+                endurance: 8.528,
+                cast: 2.17,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Sonic Haven",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "This shield dramatically reduces the damage an ally takes from Fire, Cold, Energy, and Negative Energy attacks for a limited time. You cannot stack multiple Sonic Havens on the same target; however, the shield can be improved by another ally using the same power. Can also be used in conjunction with your Sonic Barrier. You cannot use this power on yourself.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Ranged, Ally +Res(Fire, Cold, Energy, Negative Energy)",
+            icon: "sonicdebuff_protectelements.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 2.0,
+                endurance: 7.8,
+                cast: 1.33,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 2.0,
+                            ticks: 120
+                        },
+                        {
+                            type: "Cold",
+                            scale: 2.0,
+                            ticks: 120
+                        },
+                        {
+                            type: "Energy",
+                            scale: 2.0,
+                            ticks: 120
+                        },
+                        {
+                            type: "Negative",
+                            scale: 2.0,
+                            ticks: 120
+                        }
+                    ]
+                },
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Sonic Cage",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: [],
+            description: "Encases the target in an impenetrable field of sonic waves. The target cannot attack or be attacked.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Foe Capture (Special)",
+            icon: "sonicdebuff_hold.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.4,
+                range: 80.0,
+                recharge: 60.0,
+                endurance: 12.48,
+                cast: 1.67,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Disruption Field",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "You set up a constant wave of sonic energy around an ally, weakening the Damage Resistance of all nearby foes.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Ranged (Target Ally AoE), Foe -Res",
+            icon: "sonicdebuff_teamdebuffdamres.png",
+            powerType: "Toggle",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 8.0,
+                endurance: 0.26,
+                cast: 2.7,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Sonic Dispersion",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You create a large field of sonic waves, protecting all allies inside. The Sonic Dispersion gives all allies within increased Resistance against all damage except Psionic. The Sonic Bubble also protects allies from Immobilization, Disorient, and Hold effects.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Toggle: PBAoE, Ally +Res(All DMG except Psionic, Hold, Immobilize, Disorient)",
+            icon: "sonicdebuff_buffdamageres.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 15.0,
+                endurance: 1.04,
+                cast: 2.03,
+                dotDamage: {
+                    type: "Psionic",
+                    scale: 1.5,
+                    ticks: 1
+                },
+                resistance: {
+                    psionic: 0.11249999999999999
+                },
+                buffDuration: 2.25,
+                stun: 1.0,
+                stunDuration: 2.25
+            }
+        },
+        {
+            name: "Sonic Repulsion",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Knockback"],
+            description: "You create a powerful sonic resonance around an ally, repelling all foes nearby. You will lose endurance for each target repelled.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Ranged (Target Ally AoE), Foe Knockback",
+            icon: "sonicdebuff_teamknockback.png",
+            powerType: "Toggle",
+            targetType: "Leaguemate (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 8.0,
+                endurance: 0.325,
+                cast: 2.33,
+                buffDuration: 0.5
+            }
+        },
+        {
+            name: "Clarity",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: [],
+            description: "By bouncing a carefully pitched sound wave off an ally's ear drum, you can free them from any Disorient, Hold, Sleep, Confusion, Fear, or Immobilize effects, and leave them resistant to such effects for a good while. Protection will improve with multiple applications and as you advance in level. Clarity also provides your ally enhanced perception.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ally +Res(Disorient, Hold, Sleep, Immobilize, Terrorize, Confusion), +Perception",
+            icon: "sonicdebuff_dispel.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.5,
+                stun: 1.0,
+                stunDuration: 90.0,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Liquefy",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Accurate To-Hit Debuff", "Defense Debuff", "Holds", "Ranged AoE Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You unleash a barrage of sonic waves on the Earth itself, generating a powerful, localized earthquake. The impact of the sonic shockwave may Hold some foes and deal some minor damage. Most foes that pass through the location will fall down. The violent shaking also reduces their chance to hit and Defense.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Ranged (Location AoE), Minor DMG(Smashing/Energy), Foe Hold, Knockdown, -To Hit, -DEF",
+            icon: "sonicdebuff_dropknockback.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 150.0,
+                endurance: 23.4,
+                cast: 2.67,
+                buffDuration: 30.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['controller/sonic-debuff'] = CONTROLLER_SONIC_DEBUFF_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CONTROLLER_SONIC_DEBUFF_POWERSET = CONTROLLER_SONIC_DEBUFF_POWERSET;
+}
+
+// ---- js/data/powersets/controller/storm-summoning.js ----
+;/**
+ * Storm Summoning
+ * Character Level: 50
+ * Archetype: controller
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CONTROLLER_STORM_SUMMONING_POWERSET = {
+    name: "Storm Summoning",
+    category: "Unknown",
+    description: "Storm Summoning powerset",
+    icon: "storm-summoning_set.png",
+    powers: [
+        {
+            name: "Gale",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You can call forth a tremendous gust of Gale force winds that knock down foes and deal some Smashing damage in a wide cone area.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged (Cone), Minor DMG(Smash), Foe Knockback",
+            icon: "stormsummoning_gale.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 1.3963,
+            effects: {
+                accuracy: 0.9,
+                range: 50.0,
+                recharge: 8.0,
+                endurance: 7.8,
+                cast: 2.17,
+                damage: {
+                    type: "Smashing",
+                    scale: 0.2
+                }
+            }
+        },
+        {
+            name: "O2 Boost",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Saturates the air around a targeted ally with rich oxygen, healing their wounds. The O2 Boost can protect a targeted ally from Sleep, Stun and Endurance Drain effects as well as increase perception. You cannot use this power on yourself.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ally Heal, +Res(Disorient, Sleep, End Drain), +Perception",
+            icon: "stormsummoning_o2boost.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 13.0,
+                cast: 2.27,
+                buffDuration: 60.0,
+                stun: 1.0,
+                stunDuration: 60.0
+            }
+        },
+        {
+            name: "Snow Storm",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "While active, the chill from this Snow Storm can dramatically Slow the attack and movement speed of the target and all nearby foes. The torrent winds of the Snow Storm are enough to bring down flying foes.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Ranged (Targeted AoE), Foe -Speed, -Recharge, -Fly",
+            icon: "stormsummoning_snowstorm.png",
+            powerType: "Toggle",
+            targetType: "Foe",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 10.0,
+                endurance: 0.26,
+                cast: 2.03,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Steamy Mist",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Resist Damage"],
+            description: "Your mastery of the elements allows you to hide yourself and all nearby allies within a Steamy Mist. Steamy Mist makes you and your allies harder to see and increases your Defense bonus to all attacks, while reducing Fire, Cold, and Energy damage, as well as your Foes ability to Confuse you.",
+            shortHelp: "Toggle: PBAoE, Team Stealth, +DEF(All), +Res(Fire, Cold, Energy, Confuse)",
+            icon: "stormsummoning_fog.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 15.0,
+                endurance: 0.26,
+                cast: 1.87,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Freezing Rain",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Summons Freezing Rain at a targeted location. Freezing Rain deals minimal Cold damage to anything that passes through the storm. It also Slows the affected foes and severely reduces their Defense and resistance to damage. Many foes may even slip and fall trying to escape the storm.<br><br><color #fcfc95>Damage: Minor(DoT).</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Location AoE), Minor DoT(Cold), Foe -Speed, -Recharge, -DEF -Res",
+            icon: "stormsummoning_freezingrain.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                endurance: 18.2,
+                cast: 2.03,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Hurricane",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Knockback", "To Hit Debuff"],
+            description: "You can summon a Hurricane. The wind and rain from this massive storm reduce the range and chance to hit of nearby foes. The massive winds of this storm continuously force foes away from you.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: PBAoE, Foe -Range, -To Hit, Repel, Knockback",
+            icon: "stormsummoning_hurricane.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.1625,
+                cast: 2.03,
+                buffDuration: 10.0,
+                tohitDebuff: 3.0
+            }
+        },
+        {
+            name: "Thunder Clap",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Stuns"],
+            description: "You can call forth a tremendous Thunder Clap that will Disorient most foes in a large area around you.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE, Foe Disorient",
+            icon: "stormsummoning_thunderclap.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.8,
+                recharge: 45.0,
+                endurance: 10.4,
+                cast: 2.37,
+                stun: 2.0
+            }
+        },
+        {
+            name: "Tornado",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Controller Archetype Sets", "Defense Debuff", "Knockback", "Pet Damage", "Recharge Intensive Pets", "Stuns", "Universal Damage Sets"],
+            description: "Conjures up a funnel cloud at a targeted location. The Tornado will chase down your foes, tossing them into the air and hurling them great distances. The victims are left Disoriented and with reduced Defense. The Tornado is a menacing sight, and can even cause panic among your foes.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Summon Tornado: PBAoE Minor DMG(Smash), Foe Knockback, Fear, Disorient",
+            icon: "stormsummoning_tornado.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.3,
+                range: 60.0,
+                recharge: 60.0,
+                endurance: 20.8,
+                cast: 1.17,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Lightning Storm",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "You can create a massive Lightning Storm that will strike any foe that approaches you. Lightning from this storm can knock down and damage all nearby foes, and can even instill panic. Lightning bolts will continue to fall as long as the storm remains.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Create Storm: Ranged, High DMG(Energy), Foe -End",
+            icon: "stormsummoning_lightningstorm.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.4,
+                recharge: 90.0,
+                endurance: 31.2,
+                cast: 2.03,
+                buffDuration: 60.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['controller/storm-summoning'] = CONTROLLER_STORM_SUMMONING_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CONTROLLER_STORM_SUMMONING_POWERSET = CONTROLLER_STORM_SUMMONING_POWERSET;
+}
+
+// ---- js/data/powersets/controller/symphony-control.js ----
+;/**
+ * Symphony Control
+ * Character Level: 50
+ * Archetype: controller
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CONTROLLER_SYMPHONY_CONTROL_POWERSET = {
+    name: "Symphony Control",
+    category: "Unknown",
+    description: "Symphony Control powerset",
+    icon: "symphony-control_set.png",
+    powers: [
+        {
+            name: "Hymn of Dissonance",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Holds", "Ranged Damage", "Universal Damage Sets"],
+            description: "Hymn of Dissonance causes pain on its listener, disruptive enough to hold them in place. Stronger foes might persist, but will still attack at a reduced speed.",
+            shortHelp: "Ranged, DMG(Psionic), Foe Hold, -Recharge",
+            icon: "symphonycontrol_holdst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    type: "Psionic",
+                    scale: 2.8890000000000002
+                },
+                buffDuration: 18.0
+            }
+        },
+        {
+            name: "Melodic Binding",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Immobilize", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Melodic Binding immobilizes your target in place and inflict psionic damage. Stronger foes might still be able to move, but will do so at a reduced speed.",
+            shortHelp: "Ranged, DMG(Psionic), Foe Immobilize, -SPD",
+            icon: "symphonycontrol_immobst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.5,
+                damage: {
+                    type: "Psionic",
+                    scale: 2.6100000000000003
+                },
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Aria of Stasis",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Immobilize", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Aria of Stasis roots your audience in place and causes psionic damage. Stronger foes might still be able to move, but will do so at a reduced speed.",
+            shortHelp: "Ranged (Cone), DMG(Psionic), Foe Immobilize, -SPD",
+            icon: "symphonycontrol_immobaoe.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 1.0472,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 8.0,
+                endurance: 13.0,
+                cast: 1.5,
+                damage: {
+                    type: "Psionic",
+                    scale: 1.003
+                },
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Impassioned Serenade",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Confuse", "Controller Archetype Sets", "Ranged Damage", "Universal Damage Sets"],
+            description: "You serenade your target with an impassioned song, charming them into fighting for you.<br><br><color #fcfc95>Note: this power inflicts damage over time for up to 30 seconds as long as the target is confused.</color>",
+            shortHelp: "Ranged, DoT(Psionic), Foe Confuse",
+            icon: "symphonycontrol_confusest.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 2.0,
+                damage: {
+                    type: "Psionic",
+                    scale: 0.65
+                },
+                dotDamage: {
+                    type: "Psionic",
+                    scale: 0.04,
+                    ticks: 30
+                },
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Dreadful Discord",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Fear", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Fear", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Dreadful Discord is a terrifying song that will leave your audience shaking in fear.",
+            shortHelp: "Ranged (Cone), DMG(Psionic), Foe Fear",
+            icon: "symphonycontrol_fearaoe.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 0.7854,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 40.0,
+                endurance: 8.528,
+                cast: 2.17,
+                damage: {
+                    type: "Psionic",
+                    scale: 1.2437
+                }
+            }
+        },
+        {
+            name: "Enfeebling Lullaby",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Ranged AoE Damage", "Sleep", "Universal Damage Sets"],
+            description: "A song that will put even elephants to sleep. Enfeebling Lullaby will relax foes, causing them to sleep and their attacks will do reduced damage for some time.<br><br><color #fcfc95>Notes: Although this power is Auto Hit, it requires a To Hit check to apply Deep Sleep. If The Hit check is missed, and the target is not an AV, the weaker form of Sleep will be applied.</color>",
+            shortHelp: "Ranged (Cone), DMG(Psionic), Foe Deep Sleep, -DMG",
+            icon: "symphonycontrol_sleepst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 0.7854,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 45.0,
+                endurance: 15.6,
+                cast: 2.67,
+                damage: {
+                    type: "Psionic",
+                    scale: 0.2
+                },
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Confounding Chant",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Ranged AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "Confounding Chant will disorient anyone that hears it, while dealing psionic damage over time. <br><br><color #fcfc95>Note: this power's damage over time will extend its duration but only inflict its damage if the foe is stunned.</color>",
+            shortHelp: "Ranged (Cone), DoT(Psionic), Foe Disorient",
+            icon: "symphonycontrol_stunaoe.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 0.7854,
+            effects: {
+                accuracy: 0.8,
+                range: 70.0,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 2.33,
+                stun: 3.0
+            }
+        },
+        {
+            name: "Chords of Despair",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Holds"],
+            description: "Your audience falls into deep despair, incapacitating them.<br><br><color #fcfc95>Notes: This power has adaptive recharge. It has a base recharge of <color #FF7F27>8</color> seconds and each affected foe will increase the recharge by <color #FF7F27>14.5</color> seconds for a maximum total of <color #FF7F27>240</color> seconds.</color>",
+            shortHelp: "Ranged (Targeted AoE), Foe Hold",
+            icon: "symphonycontrol_holdaoe.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.8,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 2.67
+            }
+        },
+        {
+            name: "Reverberant",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Sleep", "Recharge", "Fear", "Damage", "Accuracy"],
+            allowedSetCategories: ["Confuse", "Fear", "Holds", "Immobilize", "Pet Damage", "Recharge Intensive Pets", "Sleep", "Stuns", "Universal Damage Sets"],
+            description: "You summon an entity capable of repeating your songs a short while after you have executed them. <br><br><color #fcfc95>Note: This entity will execute weaker versions of your songs. Type ''/release_pets'' in the chat window to release all your pets.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Summon Reverberant: Ranged Control Special",
+            icon: "symphonycontrol_pet.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 240.0,
+                endurance: 20.8,
+                cast: 2.03
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['controller/symphony-control'] = CONTROLLER_SYMPHONY_CONTROL_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CONTROLLER_SYMPHONY_CONTROL_POWERSET = CONTROLLER_SYMPHONY_CONTROL_POWERSET;
+}
+
+// ---- js/data/powersets/controller/thermal-radiation.js ----
+;/**
+ * Thermal Radiation
+ * Character Level: 50
+ * Archetype: controller
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CONTROLLER_THERMAL_RADIATION_POWERSET = {
+    name: "Thermal Radiation",
+    category: "Unknown",
+    description: "Thermal Radiation powerset",
+    icon: "thermal-radiation_set.png",
+    powers: [
+        {
+            name: "Thermal Shield",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "Casts a Thermal Shield on one of your allies and grants them damage resistance to Lethal, Smashing and Fire damage. Thermal Shield also provides minimal resistance to Cold damage. You cannot stack multiple Thermal Shields on the same target, however the shield can be improved by another ally using the same power. Can also be used in conjunction with your Plasma Shield. You cannot use this power on yourself.",
+            shortHelp: "Ranged, Ally +Res(Fire, Lethal, Smash, Cold)",
+            icon: "thermalradiation_fireshield.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 2.0,
+                endurance: 7.8,
+                cast: 1.17,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.0,
+                            ticks: 120
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 2.0,
+                            ticks: 120
+                        },
+                        {
+                            type: "Fire",
+                            scale: 2.0,
+                            ticks: 120
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.0,
+                            ticks: 120
+                        }
+                    ]
+                },
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Warmth",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You can use your Warmth to heal some of your wounds, and the wounds of your group. This power has a small radius, so your allies need to be near you if they wish to be affected.",
+            shortHelp: "PBAoE, Team +Heal",
+            icon: "thermalradiation_warmth.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 8.0,
+                endurance: 13.0,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Cauterize",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Heals a single targeted ally by cauterizing their wounds. You cannot use this power to heal yourself.",
+            shortHelp: "Ally Heal",
+            icon: "thermalradiation_cauterize.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 13.0,
+                cast: 2.27
+            }
+        },
+        {
+            name: "Plasma Shield",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "Envelope an ally in pure plasma. The Plasma Shield gives your ally resistance to Energy, Negative Energy, and Fire damage. You cannot stack multiple Plasma Shields on the same target, however the shield can be improved by another ally using the same power. Can also be used in conjunction with your Fire Shield. You cannot use this power on yourself.",
+            shortHelp: "Ranged, Ally +Res(Energy, Negative, Fire)",
+            icon: "thermalradiation_plasmashield.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 2.0,
+                endurance: 7.8,
+                cast: 1.17,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 2.0,
+                            ticks: 120
+                        },
+                        {
+                            type: "Energy",
+                            scale: 2.0,
+                            ticks: 120
+                        },
+                        {
+                            type: "Negative",
+                            scale: 2.0,
+                            ticks: 120
+                        }
+                    ]
+                },
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Power of the Phoenix",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage"],
+            allowedSetCategories: ["Endurance Modification", "Healing", "Ranged AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "Revives a fallen ally. The fiery resurrection blasts nearby foes with an explosion and knocks them down and Disorients them. Your ally will revive with most of their Hit Points and Endurance. They will also be invulnerable for a brief time, as well as protected from XPDebt for 90 seconds.",
+            shortHelp: "Ally Rez, Special",
+            icon: "thermalradiation_phoenix.png",
+            powerType: "Click",
+            targetType: "Player Ally (Dead)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 15.0,
+                recharge: 300.0,
+                endurance: 49.4,
+                cast: 1.67,
+                buffDuration: 0.5
+            }
+        },
+        {
+            name: "Thaw",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "Warms an ally and frees them from any Disorient, Hold, Sleep, Confuse, Fear, Slow and Immobilize effects and leaves them resistant to such effects for a good while. Thaw also grants the target some resistance to Cold damage. Some of the effects of this power will improve with multiple applications and as you advance in level.",
+            shortHelp: "Ally +Res(Disorient, Hold, Sleep, Immobilize, Confuse, Fear, Cold, Slow)",
+            icon: "thermalradiation_thaw.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 2.17,
+                dotDamage: {
+                    type: "Cold",
+                    scale: 1.0,
+                    ticks: 45
+                },
+                stun: 1.0,
+                stunDuration: 90.0,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Forge",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Forge a single ally target into a killing machine. Forge immensely enhances a single ally's Damage and chance to hit.",
+            shortHelp: "Ally +DMG, +To Hit",
+            icon: "thermalradiation_forge.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 60.0,
+                endurance: 10.4,
+                cast: 2.27,
+                tohitBuff: 2.0,
+                buffDuration: 120.0
+            }
+        },
+        {
+            name: "Heat Exhaustion",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: [],
+            description: "Overwhelm a single foe with waves of exhausting heat. The initial effect will drain the target of some Endurance, but the heat is so overwhelming that the affected target will be weakened. Their Damage output, Endurance Recovery and Hit Point Regeneration will all be reduced.",
+            shortHelp: "Ranged Foe -DMG, -END, -Recovery, -Regeneration",
+            icon: "thermalradiation_heatexhaustion.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 120.0,
+                endurance: 13.0,
+                cast: 2.07,
+                buffDuration: 40.0
+            }
+        },
+        {
+            name: "Melt Armor",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff"],
+            description: "The searing heat from this power is enough to melt the armor and defenses of all targets in the affected area. Melt Armor significantly weakens the Defense and Damage Resistance of the affected targets.",
+            shortHelp: "Ranged (Targeted AoE), Foe -Res, -DEF",
+            icon: "thermalradiation_meltarmor.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 100.0,
+                endurance: 18.2,
+                cast: 1.5,
+                defenseDebuff: 2.0,
+                buffDuration: 40.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['controller/thermal-radiation'] = CONTROLLER_THERMAL_RADIATION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CONTROLLER_THERMAL_RADIATION_POWERSET = CONTROLLER_THERMAL_RADIATION_POWERSET;
+}
+
+// ---- js/data/powersets/controller/time-manipulation.js ----
+;/**
+ * Time Manipulation
+ * Character Level: 50
+ * Archetype: controller
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CONTROLLER_TIME_MANIPULATION_POWERSET = {
+    name: "Time Manipulation",
+    category: "Unknown",
+    description: "Time Manipulation powerset",
+    icon: "time-manipulation_set.png",
+    powers: [
+        {
+            name: "Temporal Mending",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You mend the wounds of yourself and nearby allies by placing your bodies in a past or future state where they are far less injured. Temporal Mending will immediately heal its targets and continue to heal them for an equal amount over the next 6 seconds. Additionally, affected allies will gain some resistance to slow effects and regeneration debuffs. Allies affected by the Accelerated effect will receive additional healing from this power.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE, Ally +Heal, Heal Over Time, +Res(Slow, Regen Debuff)",
+            icon: "timemanipulation_temporalmending.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 18.0,
+                endurance: 13.0,
+                cast: 2.03,
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Time Crawl",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "You're able to dramatically slow the time around a single enemy, reducing their movement speed and attack rate. Time is slowed to such an extreme that their wounds will take longer to heal, reducing their regeneration rate. Time Crawl applies the Delayed effect on its target. Debuff and control effects from other Time Manipulation powers are increased on targets affected by Delayed.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged Foe, -Speed, -Recharge, -Regen, Special",
+            icon: "timemanipulation_timecrawl.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 10.4,
+                cast: 1.6,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Time's Juncture",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Slow Movement", "To Hit Debuff"],
+            description: "You create a time dilation field around you causing enemies who get too close to be slowed to a crawl, their movement speed, damage and chance to hit will be decreased substantially. Enemies affected by Delayed have these affects increased.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: PBAoE Foe (-Damage, -Speed, -To Hit)",
+            icon: "timemanipulation_timesjuncture.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.39,
+                cast: 0.67,
+                tohitDebuff: 1.5,
+                buffDuration: 1.0
+            }
+        },
+        {
+            name: "Temporal Selection",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You distort time around an ally, selecting a period of time where their abilities are at their highest. Their damage, attack rate and regeneration rates are dramatically increased for a brief period. This power places the Accelerated effect on the target. While this is in effect, the target has any healing and healing over time effects from Temporal Mending or Chrono Shift significantly increased.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ally +Damage, +Recharge, +Regeneration",
+            icon: "timemanipulation_temporalselection.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 120.0,
+                endurance: 10.4,
+                cast: 2.27,
+                buffDuration: 120.0
+            }
+        },
+        {
+            name: "Distortion Field",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "Slow", "EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Controller Archetype Sets", "Holds", "Slow Movement"],
+            description: "You can choose an area to slow the flow of time down to a crawl. Enemies who enter the field will have their attack rate and speed slowed dramatically. In addition, affected enemies might become held as they are frozen in time. Targets affected by Time Crawl will have the chance to be held increased.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Location AoE), Foe(-Recharge, -Speed), Chance for Hold",
+            icon: "timemanipulation_distortionfield.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 60.0,
+                endurance: 14.56,
+                cast: 2.03,
+                buffDuration: 45.0
+            }
+        },
+        {
+            name: "Time Stop",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Holds"],
+            description: "You trap your target within the flow of time causing them to be held helpless. Even those resistant to the effects of Time Stop's hold will still have their regeneration rate and healing effects reduced for a brief period. Targets affected by Time Crawl will suffer from a more powerful hold, however its benefits are brief.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged Hold, Foe -Regen, -Heal",
+            icon: "timemanipulation_timestop.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 16.0,
+                endurance: 8.84,
+                cast: 2.17,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Farsight",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "To Hit Buff"],
+            description: "You give your allies a brief glimpse of the future and what is to come. This provides you and your team a moderate increase to your chance to hit and defense for a short period of time.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE Team, +To-Hit, +Defense(All), +Perception",
+            icon: "timemanipulation_farsight.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 240.0,
+                endurance: 15.6,
+                cast: 2.03,
+                buffDuration: 120.0,
+                tohitBuff: 1.0
+            }
+        },
+        {
+            name: "Slowed Response",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff"],
+            description: "You manipulate time around a targeted foe causing their reflexes to become slowed and sluggish. This causes them to have decreased defense and damage resistance. A target affected by Time Crawl will suffer from a more powerful effect.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged (Targeted AoE), Foe -Defense, -Resistance",
+            icon: "timemanipulation_slowedresponse.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 2.27,
+                buffDuration: 30.0,
+                defenseDebuff: 2.5
+            }
+        },
+        {
+            name: "Chrono Shift",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "You cause nearby allies to act more quickly by allowing them to slip through the time stream seamlessly. When Chrono Shift is activated, you and nearby allies will immediately recover a portion of your health and endurance. Chrono Shift will greatly increase the Recharge Speed of nearby allies for the duration of the power, additionally for a short while the flow of time will constantly undo a portion of your allies' wounds causing them to periodically recover health and recover endurance. An ally affected by Temporal Selection will recover additional health from Chrono Shift.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "PBAoE, Team +Recharge, Heal, +End, Moderate Healing over Time, +Recovery",
+            icon: "timemanipulation_chronoshift.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 360.0,
+                endurance: 20.8,
+                cast: 2.03,
+                buffDuration: 30.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['controller/time-manipulation'] = CONTROLLER_TIME_MANIPULATION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CONTROLLER_TIME_MANIPULATION_POWERSET = CONTROLLER_TIME_MANIPULATION_POWERSET;
+}
+
+// ---- js/data/powersets/controller/traps.js ----
+;/**
+ * Traps
+ * Character Level: 50
+ * Archetype: controller
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CONTROLLER_TRAPS_POWERSET = {
+    name: "Traps",
+    category: "Unknown",
+    description: "Traps powerset",
+    icon: "traps_set.png",
+    powers: [
+        {
+            name: "Caltrops",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage"],
+            allowedSetCategories: ["Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You toss a handful of Caltrops at a targeted location and spread the tiny metal spikes over a large area. Any enemy that pass over the Caltrops will be forced to move at a slower rate. They will also take some trivial Lethal damage over time.",
+            shortHelp: "Ranged (Location AoE), DoT(Lethal), Foe -Speed",
+            icon: "traps_droppedaoedebuffrunspeed.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 25.0,
+                recharge: 45.0,
+                endurance: 7.8,
+                cast: 1.07,
+                buffDuration: 45.0
+            }
+        },
+        {
+            name: "Web Grenade",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Immobilize", "Slow Movement"],
+            description: "Upon impact, the Web Grenade expels a strong, tenuous, and very sticky substance that can Immobilize most targets. This non-lethal device deals no damage and does not prevent targets from attacking, although their attack rate is Slowed. The Web can bring down flying entities and halts jumping.",
+            shortHelp: "Ranged, Target Immobilize, -Recharge, -Fly",
+            icon: "traps_targetedimmoblize.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.37,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Triage Beacon",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You can plant a Triage Beacon into the ground. The Beacon is immobile, but it emits a powerful healing aura. The Regeneration Rate of you, or your allies, will be greatly increased as long as you are near the Triage Beacon. The Beacon is invulnerable.<br>",
+            shortHelp: "Place Beacon: PBAoE +Regen",
+            icon: "traps_droppedaoebuffregen.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 200.0,
+                endurance: 13.0,
+                cast: 2.77,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Acid Mortar",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged Damage", "Universal Damage Sets"],
+            description: "You can place a small Mortar on the ground. If an enemy passes nearby, the Mortar will fire an Acid grenade at the target. The grenade will explodes in a small shower of acid on impact. This acid eats through armor, causing minor damage over time. It reduces the target's Defense as well as his Damage Resistance. The mortar will last up to 60 seconds and will fire up to 10 grenades. It can be destroyed by your foes.",
+            shortHelp: "Place Trap: Ranged (AoE), DoT(Toxic), Foe -Res(All), -DEF",
+            icon: "traps_droppedaoedebuffdefense.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 13.0,
+                cast: 2.77,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Force Field Generator",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "You can build a Force Field Generator Drone. The Drone will generate a Dispersion Bubble that gives all nearby allies increased Defense against all attacks including Psionic. The Dispersion Bubble also protects allies from Immobilization, Disorient, and Hold effects. The Done will follow you and can be buffed and healed or even destroyed like any friendly entity. However, the Drone is not a Henchman and cannot be given commands. You can only ever have one Force Field Generator.<br>",
+            shortHelp: "Place Drone: PBAoE, Team +DEF, +Res(Hold, Immobilize, Disorient)",
+            icon: "traps_droppedaoebuffdefense.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 20.0,
+                recharge: 15.0,
+                endurance: 13.0,
+                cast: 2.03,
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Poison Trap",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Holds"],
+            description: "You can build a Poison Gas Trap on the ground. Any foes that pass near the Poison Trap will cause it to detonate and release its toxic vapors. The poison is a very noxious gas, and any foes in the affected area may start to choke or even vomit. Affected Foes Regeneration rate and attack rate will be reduced as well. The trap is almost impossible to detect, but it is fragile and may be set off by an enemy's explosion. Even if destroyed, the Trap will detonate.",
+            shortHelp: "Place Trap: PBAoE Foe Choke, Vomit, -Regen, -Recharge",
+            icon: "traps_droppedaoedebuffattackspeed.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 13.0,
+                cast: 2.77,
+                buffDuration: 260.0
+            }
+        },
+        {
+            name: "Seeker Drones",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Controller Archetype Sets", "Pet Damage", "Stuns", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You create two Seeker Drones. These Seeker Drones will follow you until they detect an enemy and then they will zero in on their targets and detonate on impact. The small explosive flash of energy does only minor damage, but the concussion can weaken foes. Affected targets will have reduced Damage, Accuracy and Perception and may even be Disoriented for a short while. You can only ever have Two Seeker Drones out at one time and they can be destroyed by your foes.",
+            shortHelp: "Summon Seekers: Ranged Disorient, -DMG, -ACC, -Perception, DMG(Energy)",
+            icon: "traps_droppedaoedebuffdamage.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.2,
+                range: 60.0,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 2.03,
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Trip Mine",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You can place a Trip Mine on the ground. Any foes that pass near the Trip Mine will cause it to explode, severely damaging all nearby foes and sending them flying. The Trip Mine is almost impossible to detect, but it is fragile and may be set off by an enemy's explosion. Even if destroyed, the Trip Mine will detonate. Setting a mine is delicate work, and if you are interrupted, you will fail.",
+            shortHelp: "Place Mine: PBAoE, DMG(Lethal/Fire), Foe Knockback",
+            icon: "traps_droppedaoedamage.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                recharge: 20.0,
+                endurance: 13.0,
+                cast: 5.0,
+                buffDuration: 260.0
+            }
+        },
+        {
+            name: "Temporal Bomb",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Knockback", "Melee AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You can place a Temporal Bomb on the ground. The Temporal Bomb will detonate once the power is activated a second time, resulting in a massive explosion that can damage all nearby foes and send them flying, as well as create a Temporal Bubble that speeds up yourself and allies, while slowing down all enemies inside. If used while targeting an enemy in melee range, you can attach the Temporal Bomb to them instead!<br><br>The Temporal Bomb is small, and almost impossible to detect.",
+            shortHelp: "Place Bomb: PBAoE, DMG(Lethal/Fire), Foe Knockback, Special",
+            icon: "traps_remotebomb.png",
+            powerType: "Click",
+            targetType: "Anything",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 2.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['controller/traps'] = CONTROLLER_TRAPS_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CONTROLLER_TRAPS_POWERSET = CONTROLLER_TRAPS_POWERSET;
+}
+
+// ---- js/data/powersets/controller/trick-arrow.js ----
+;/**
+ * Trick Arrow
+ * Character Level: 50
+ * Archetype: controller
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CONTROLLER_TRICK_ARROW_POWERSET = {
+    name: "Trick Arrow",
+    category: "Unknown",
+    description: "Trick Arrow powerset",
+    icon: "trick-arrow_set.png",
+    powers: [
+        {
+            name: "Entangling Arrow",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Immobilize", "Slow Movement"],
+            description: "You entangle a targeted foe causing their reflexes to become slowed and sluggish. This grounds them and causes them to have decreased movement speed and damage resistance. Weaker foes will also be immobilized.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, Target Immobilize, -Res(All), -Fly, Slow",
+            icon: "trickarrow_immobilize.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Flash Arrow",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "To Hit Debuff"],
+            description: "This arrow explodes in a dazzling flash of light and sound. The targets are so blinded that they can hardly see a thing. Most villains will not be able to see past normal melee range, although some may have better perception. If the villains are attacked, they will be alerted to your presence, but will suffer a penalty to chance to hit.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Targeted AoE), Foe -Visibility, -To Hit",
+            icon: "trickarrow_blind.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 7.8,
+                cast: 1.0,
+                tohitDebuff: 0.5,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Glue Arrow",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "This arrow carries a cartridge of intensely sticky glue, which explodes on impact. The glue Slows the movement and attack rates of any foes in the area.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Location AoE), Foe -Speed, -Recharge",
+            icon: "trickarrow_slow.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                endurance: 7.8,
+                cast: 1.16,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Ice Arrow",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Holds", "Slow Movement"],
+            description: "This arrow can freeze a single foe in a block of ice. The target is frozen solid, helpless, and can be attacked. More powerful foes may not be Held, but all affected targets will be Slowed, have their secondary effects weakened, and damage output reduced.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Foe Hold, -SPD, -Recharge, -DMG, -Special",
+            icon: "trickarrow_hold.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 18.0,
+                endurance: 8.528,
+                cast: 1.67,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Poison Gas Arrow",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Sleep", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Sleep"],
+            description: "This arrow carries a capsule cloud of poisonous gas, which explodes on impact and weakens all foes in its vicinity. Affected foes damage potential will be severely reduced. Some foes will react badly to the poison and choke for a time, though they will react if attacked.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged AoE, Foe -DMG, Sleep",
+            icon: "trickarrow_debuffdamage.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.5,
+                range: 70.0,
+                recharge: 45.0,
+                endurance: 10.4,
+                cast: 1.16,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Acid Arrow",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "This arrow explodes in a small shower of acid on impact. This acid eats through armor, causing damage over time, reducing target's Defense as well as their resistance to debuffs, while making it harder for them to be healed.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged AoE Minor DoT(Toxic), Foe -Res(Special), Res(Heal), -DEF",
+            icon: "trickarrow_debuffdefense.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 20.0,
+                endurance: 7.8,
+                cast: 1.83,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.01,
+                    ticks: 20
+                },
+                buffDuration: 20.0,
+                defenseDebuff: 2.0
+            }
+        },
+        {
+            name: "Disruption Arrow",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "This arrow plants a sonic resonator at a target location. The vibrations of the resonator weaken the Damage Resistance and Max Endurance of all nearby foes.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Location AoE), -Res(All), -MaxEnd",
+            icon: "trickarrow_debuffdamres.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 30.0,
+                endurance: 14.56,
+                cast: 1.16,
+                buffDuration: 45.0
+            }
+        },
+        {
+            name: "Oil Slick Arrow",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage"],
+            allowedSetCategories: ["Defense Debuff", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "On impact, this arrow creates an oil slick that Slows foes in the area and may cause them to slip and fall. The oil slick is very flammable and may burst into flames if fire is used near it.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged (Location AoE), Knockdown, -Speed, -DEF, +Special",
+            icon: "trickarrow_knockdown.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 180.0,
+                endurance: 15.6,
+                cast: 1.16,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "EMP Arrow",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Endurance Modification", "Holds"],
+            description: "EMP Arrow unleashes a massive pulse of electromagnetic energy on impact. Allies that enter the field will see an increase to their damage resistances against all damage except Toxic. They are also protected from status effects, knockbacks, endurance drain, recovery debuffs and recharge debuffs. Only one EMP Field can be sustained at once. This EMP will affect enemy machines adversively, and is even powerful enough to affect synaptic brain patterns. It will incapacitate all foes in its radius. Machines and robots are more likely to take high damage.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "AoE, Foe Hold, Special",
+            icon: "trickarrow_stun.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 300.0,
+                endurance: 23.4,
+                cast: 1.83,
+                buffDuration: 240.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['controller/trick-arrow'] = CONTROLLER_TRICK_ARROW_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CONTROLLER_TRICK_ARROW_POWERSET = CONTROLLER_TRICK_ARROW_POWERSET;
+}
+
+// ---- js/data/powersets/controller/wind-control.js ----
+;/**
+ * Wind Control
+ * Character Level: 50
+ * Archetype: controller
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CONTROLLER_WIND_CONTROL_POWERSET = {
+    name: "Wind Control",
+    category: "Unknown",
+    description: "Wind Control powerset",
+    icon: "wind-control_set.png",
+    powers: [
+        {
+            name: "Clear Skies",
+            available: 0,
+            tier: 1,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "When training yourself in the creation of a Vortex, you also learn how to create the Clear Skies effect. If you use Vacuum on your own Vortex, you will gain a boost to your chance to hit foes, your attack speed and your recovery. Additionally, the endurance cost of all your powers will be reduced. While the strength of the Clear Skies effect cannot be stacked and cannot be increased, the duration of the effect can be extended from the minimum duration of 30 seconds. The more Pressure you consume when you execute Vacuum, the greater the duration of the Clear Skies bonuses, up to a maximum of 60 seconds. When the bonuses of Clear Skies end, you will be under the Clouded Skies effect, which prevents another Clear Skies buff from applying, for several minutes. Clear Skies is granted automatically when both Vacuum and Vortex have been trained.",
+            shortHelp: "Self (Auto), +ToHit, +Rech, +Rec, -EndCost",
+            icon: "windcontrol_clearskies.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                tohitBuff: 2.5,
+                buffDuration: 2.1
+            }
+        },
+        {
+            name: "Downdraft",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Holds", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You gather air above your target before forcefully pressurizing it into a downward flowing vortex. The force of the downdraft prevents your target from moving, effectively holding them in place and preventing flight. The force of the downdraft leaves the target winded, reducing their movement and attack speeds for a short time while they recover. This power builds Pressure.<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged, Hold(Foe), -Movement(Foe), -Rech(Foe), -Fly(Foe), Pressure Builder (Self)",
+            icon: "windcontrol_downdraft.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.87,
+                damage: {
+                    type: "Smashing",
+                    scale: 5.0436
+                },
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Updraft",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "You gather air at the feet of your target before forcefully pressurizing it into an upward flowing vortex. The force of the updraft pulls your target into the sky. When the updraft dissipates, your target falls to the ground and suffers moderate smashing damage. The affected target is also unable to fly for a short time. This power builds Pressure.<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, High DMG(Smashing), Knockup(Foe), -Fly(Foe), Pressure Builder (Self)",
+            icon: "windcontrol_updraft.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.03,
+                damage: {
+                    type: "Smashing",
+                    scale: 3.9214999999999995
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Breathless",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Controller Archetype Sets", "Immobilize", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You release all available Pressure to create a localized high pressure sphere at a location of your choosing. This high pressure crushes foes continually while they remain within the sphere, causing lethal damage over time. Affected foes will be immobilized and suffer from a reduced attack speed. In normal combat, affected foes will also suffer reduced damage potential, while in PvP, affected foes will suffer from increased endurance cost of their powers. The damage done increases in proportion to the amount of Pressure released when using this power. Also, Breathless can reduce the damage potential of all targets, in PvE or PvP, if used at the lowest levels of Pressure accumulation.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged (Targeted AoE), Minor DMG(Lethal), Immobilize (Foe), -DMG(Foe, All), +EndCost(Foe, PvP), Consumes Pressure",
+            icon: "windcontrol_breathless.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.9,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 15.6,
+                cast: 2.07,
+                damage: {
+                    type: "Lethal",
+                    scale: 1.1916
+                },
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Wind Shear",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Controller Archetype Sets", "Slow Movement", "To Hit Debuff"],
+            description: "You create a sphere of high speed winds around yourself. This significantly slows the movement of any enemies caught within the sphere and makes their attacks less likely to hit. Damage potential is also reduced. Flying foes are brought to the ground. This power neither builds nor releases Pressure, but does have a continuous Endurance cost.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE (Toggle), -Speed (Foe, All), -Fly(Foe), -ToHit(Foe), -DMG(Foe, All)",
+            icon: "windcontrol_windshear.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 15.0,
+                endurance: 2.08,
+                cast: 2.03,
+                tohitDebuff: 0.75,
+                buffDuration: 2.1
+            }
+        },
+        {
+            name: "Thundergust",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Knockback", "Ranged AoE Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You unleash a powerful gust of wind in the direction of your foes. This gust has enough force to deal minor smashing damage to your foes and knock them to the ground. The debris blown at your opponent temporarily blinds them, reducing their chance to hit. This power builds Pressure.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Cone), Minor DMG(Smashing), Knockdown(Foe), -ToHit(Foe), Pressure Builder (Self)",
+            icon: "windcontrol_thundergust.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 0.6981,
+            effects: {
+                accuracy: 1.0,
+                recharge: 30.0,
+                endurance: 10.4,
+                cast: 2.17,
+                damage: {
+                    type: "Smashing",
+                    scale: 1.21
+                },
+                tohitDebuff: 1.5,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Microburst",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Controller Archetype Sets", "Defense Debuff", "Ranged AoE Damage", "Slow Movement", "Stuns", "Universal Damage Sets"],
+            description: "You release all available Pressure to create an extremely powerful blast of air that descends from the skies and spreads out over a large radius. Any foes caught within the burst are immediately stunned by the force of the wind and suffer smashing damage.Flying foes are knocked out of the sky, while all foes suffer reduced movement speed that lingers for some time. The damage done increases in proportion to the amount of Pressure released when using this power. Also, Microburst can reduce your target's defenses at the when the highest levels of Pressure are released.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged (Targeted AoE), Minor DMG(Smashing), Stun(Foe), -Speed(Foe, All), -Fly(Foe), -Rech(Foe), Chance for -DEF(Foe, All), Consumes Pressure",
+            icon: "windcontrol_microburst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 2.37,
+                damage: {
+                    type: "Smashing",
+                    scale: 0.5789
+                },
+                stun: 1.0,
+                buffDuration: 12.0,
+                defenseDebuff: 2.5
+            }
+        },
+        {
+            name: "Keening Winds",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Confuse", "Controller Archetype Sets", "Endurance Modification"],
+            description: "You create a sphere of variable speed winds that generate strong friction within the turbulence of the air. This creates odd echoes and sounds that confuse foes caught within the burst. The loss of confidence your foes suffer due their confusion causes them to lose endurance over a few seconds, while you gain endurance due to a boost in confidence you enjoy from seeing your foes struggle. This power builds Pressure.<br><br><color #fcfc95>Damage: None.</color><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged (Targeted AoE), Confuse(Foe), EndDrain(Foe), +End(Self)",
+            icon: "windcontrol_keeningwinds.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 0.8,
+                range: 80.0,
+                recharge: 120.0,
+                endurance: 10.4,
+                cast: 1.67,
+                buffDuration: 2.1
+            }
+        },
+        {
+            name: "Vacuum",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Controller Archetype Sets", "Holds", "Ranged AoE Damage", "Slow Movement", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You release all Pressure to create a vacuum space around a target. With a foe target, the foe is held. Nearby foes may also be held. Foes in the field suffer lethal damage and persistent movement, attack speed, and chance to hit debuffs that grow stronger the longer they are in the field. If centered on an ally, the main target is not held, but foes are affected as normal. For each Pressure released, the Vacuum field persists for 2 seconds more. At your highest Pressure level, the main target will take extra damage and the field will persist long enough to reapply its hold. If Vacuum is targeted on your Vortex, you will gain the Clear Skies boon, but at the expense of using the power to harm foes. The boon lasts 5 seconds more for each Pressure released. Both Vacuum and Vortex are required to unlock Clear Skies.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged (Targeted AoE), Hold (Foe), Moderate DoT (Lethal), -Movement(Foe), -Rech(Foe), -ToHit(Foe), Special(Pet), Pressure Consumer (Self)",
+            icon: "windcontrol_vacuum.png",
+            powerType: "Click",
+            targetType: "Any (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 240.0,
+                endurance: 15.6,
+                cast: 2.03,
+                damage: {
+                    type: "Lethal",
+                    scale: 0.4789
+                },
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Vortex",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Pet Damage", "Recharge Intensive Pets", "Slow Movement", "Stuns", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You can create a true Vortex cloud to assist you in battle. This Vortex will build Pressure along with you as you use your powers. This will allow its attacks to have a chance, proportional to current pressure, for critical damage. However, at higher pressures, the Vortex will be unable to use some of its powers. The Manipulation of Pressure on this pet through the use of Vacuum upon it will grant you the Clear Skies buff. Both this power and Vacuum are required to automatically unlock Clear Skies.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Summon Vortex",
+            icon: "windcontrol_vortex.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 240.0,
+                endurance: 20.8,
+                cast: 1.87
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['controller/wind-control'] = CONTROLLER_WIND_CONTROL_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CONTROLLER_WIND_CONTROL_POWERSET = CONTROLLER_WIND_CONTROL_POWERSET;
+}
+
+// ---- js/data/epics/controller/controller_dark_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Dark Mastery
+ * Archetype: Controller
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\controller_dark_mastery
+ */
+
+const EPIC_CONTROLLER_DARK_MASTERY = {
+  "id": "controller_dark_mastery",
+  "name": "Dark Mastery",
+  "displayName": "Dark Mastery",
+  "archetype": "controller",
+  "description": "You have Mastery over Darkness to control and blast your foes.",
+  "icon": "sentinel_dark_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Murky Cloud",
+      "fullName": "Epic.Controller_Dark_Mastery.Murky_Cloud",
+      "rank": 1,
+      "available": 34,
+      "description": "You create a Murky Cloud enshrouding you. This cloud can absorb all forms of energy, making you more resistant to Fire, Cold, Energy, and Negative Energy attacks.",
+      "shortHelp": "Toggle: Self +Res(Fire, Cold, Energy, Negative)",
+      "icon": "dark_mastery_murkycloud.png",
+      "powerType": "Toggle",
+      "requires": "$archetype == @Class_Controller",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 1.17,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "fire": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "smashing": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "psionic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Dark Blast",
+      "fullName": "Epic.Controller_Dark_Mastery.Dark_Blast",
+      "rank": 2,
+      "available": 34,
+      "description": "A long range blast of dark energy. Deals moderate Negative Energy damage and reduces the target's Accuracy.",
+      "shortHelp": "Ranged, DMG(Negative), Foe -ACC",
+      "icon": "dark_mastery_darkblast.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Controller",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate To-Hit Debuff",
+        "Ranged Damage",
+        "To Hit Debuff",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 8.0,
+        "endurance": 6.5,
+        "activationTime": 1.0,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Negative",
+          "scale": 1.42,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Umbral Torrent",
+      "fullName": "Epic.Controller_Dark_Mastery.Torrent",
+      "rank": 3,
+      "available": 37,
+      "description": "You summon a wave of mire that sweeps away foes within its arc. The attack deals minimal Negative Energy damage, but sends foes flying and reduces their chance to hit. You must be level 38 and have one other Dark Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Cone), DMG(Smashing), Foe -To Hit, Knockback",
+      "icon": "dark_mastery_umbraltorrent.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate To-Hit Debuff",
+        "Knockback",
+        "Ranged AoE Damage",
+        "To Hit Debuff",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 30.0,
+        "endurance": 17.94,
+        "activationTime": 1.03,
+        "effectArea": "Cone",
+        "radius": 60.0,
+        "arc": 0.5236,
+        "damage": {
+          "type": "Negative",
+          "scale": 0.8471,
+          "table": "Melee_PvPDamage"
+        },
+        "protection": {
+          "knockback": 1.0
+        }
+      }
+    },
+    {
+      "name": "Midnight Grasp",
+      "fullName": "Epic.Controller_Dark_Mastery.Gather_Shadows",
+      "rank": 4,
+      "available": 40,
+      "description": "Mastery over the forces of the Netherworld allows you to create dark tentacles that can Immobilize a foe, reduce their chance to hit and continuously drain their life force. You must be level 41 and have one other Dark Mastery Powers before selecting this power.",
+      "shortHelp": "Melee, Superior DMG(Negative), Foe Immobilize, -To Hit",
+      "icon": "dark_mastery_midnightgrasp.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate To-Hit Debuff",
+        "Immobilize",
+        "Melee Damage",
+        "To Hit Debuff",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 7.0,
+        "recharge": 30.0,
+        "endurance": 17.94,
+        "activationTime": 2.07,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Negative",
+          "scale": 0.11,
+          "table": "Melee_Damage"
+        },
+        "protection": {
+          "immobilize": 3.0
+        }
+      }
+    },
+    {
+      "name": "Soul Consumption",
+      "fullName": "Epic.Controller_Dark_Mastery.Soul_Consumption",
+      "rank": 5,
+      "available": 43,
+      "description": "You consume life and soul from all enemies nearby, thus siginficantly increasing your maximum hitpoints and endurance. The more foes affected, the stronger the effect. You must be level 44 and have two other Dark Mastery Powers before selecting this power.",
+      "shortHelp": "PBAoE Self +Max HP, +Max End, Foe: -Max HP, -Max End",
+      "icon": "dark_mastery_soulconsumption.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Recharge",
+        "Heal",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate Healing",
+        "Endurance Modification",
+        "Healing"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 15.0,
+        "recharge": 1000.0,
+        "endurance": 3.25,
+        "activationTime": 1.17,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "regeneration": {
+          "scale": -0.6,
+          "table": "Melee_Ones"
+        },
+        "damage": {
+          "type": "Heal",
+          "scale": 0.4,
+          "table": "Melee_HealSelf"
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['controller_dark_mastery'] = EPIC_CONTROLLER_DARK_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/controller/controller_mace_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Mace Mastery
+ * Archetype: Controller
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\controller_mace_mastery
+ */
+
+const EPIC_CONTROLLER_MACE_MASTERY = {
+  "id": "controller_mace_mastery",
+  "name": "Mace Mastery",
+  "displayName": "Mace Mastery",
+  "archetype": "controller",
+  "description": "Black Scorpion has granted you access to the advanced technology of the Nullifier Mace. The signature weapon of the Bane Spider Commandos, it is not a typical clumsy mace. The Bane Mace is capable of firing a variety of energy projectiles and grenades. It can even be modified to summon and command some or Black Scorpion's RV technologies.",
+  "icon": "controller_mace_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Poisonous Ray",
+      "fullName": "Epic.Controller_Mace_Mastery.Poisonous_Ray",
+      "rank": 1,
+      "available": 34,
+      "description": "The Bane Mace can fire a nasty Poison Ray. This toxin is suspended in a polarized plasma field and delivered like an energy blast. Upon impact, the toxin directly attacks the immune system, reducing the affected targets Defense and Damage Resistance as it deals toxic damage.",
+      "shortHelp": "Ranged DoT(Poison), Foe -RES, -DEF",
+      "icon": "arachnos_patron_targeteddebuffdefense.png",
+      "powerType": "Click",
+      "requires": "($archetype == @Class_Controller) && (Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate Defense Debuff",
+        "Defense Debuff",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 80.0,
+        "recharge": 24.0,
+        "endurance": 13.0,
+        "activationTime": 2.0,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Energy",
+          "scale": 2.76,
+          "table": "Ranged_PvPDamage"
+        },
+        "defense": {
+          "all": {
+            "scale": 2.0,
+            "table": "Ranged_Debuff_Def"
+          }
+        },
+        "resistance": {
+          "smashing": {
+            "scale": -2.5,
+            "table": "Ranged_Res_Dmg"
+          },
+          "lethal": {
+            "scale": -2.5,
+            "table": "Ranged_Res_Dmg"
+          },
+          "fire": {
+            "scale": -2.5,
+            "table": "Ranged_Res_Dmg"
+          },
+          "cold": {
+            "scale": -2.5,
+            "table": "Ranged_Res_Dmg"
+          },
+          "energy": {
+            "scale": -2.5,
+            "table": "Ranged_Res_Dmg"
+          },
+          "negative": {
+            "scale": -2.5,
+            "table": "Ranged_Res_Dmg"
+          },
+          "psionic": {
+            "scale": -2.5,
+            "table": "Ranged_Res_Dmg"
+          },
+          "toxic": {
+            "scale": -2.5,
+            "table": "Ranged_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Scorpion Shield",
+      "fullName": "Epic.Controller_Mace_Mastery.Scorpion_Shield",
+      "rank": 2,
+      "available": 34,
+      "description": "Black Scorpion's technologies are impressive indeed. This energy shield grants you Defense to Lethal, Smashing and Energy attacks, as well as improves your damage resistance to Toxic damage.",
+      "shortHelp": "Toggle: Self, +Def(Smash,Lethal,Energy), +Res(Toxic)",
+      "icon": "arachnos_patron_defensebuff.png",
+      "powerType": "Toggle",
+      "requires": "($archetype == @Class_Controller) && (Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Defense Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 2.0,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Disruptor Blast",
+      "fullName": "Epic.Controller_Mace_Mastery.Disruptor_Blast",
+      "rank": 3,
+      "available": 37,
+      "description": "Fires a tremendous charge of kinetic energy from your Bane Mace. This charge is so powerful it will explode on impact, blasting all nearby foes. Some affected foes may be knocked back by the force of the blast. You must be level 38 and have one other Mace Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Targeted AoE), DMG(Smashing/Energy), Foe Knockback",
+      "icon": "arachnos_patron_rangedaoemoderatedmg.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 80.0,
+        "recharge": 32.0,
+        "endurance": 18.98,
+        "activationTime": 2.0,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "damage": {
+          "type": "Energy",
+          "scale": 0.9477,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Focused Accuracy",
+      "fullName": "Epic.Controller_Mace_Mastery.Personal_Force_Field",
+      "rank": 4,
+      "available": 40,
+      "description": "When this power is activated, the Villain focuses their senses to dramatically improve their range and accuracy. Additionally, Focused Accuracy increase your Perception, allowing you to better see stealthy foes. It also grants you resistance to powers that DeBuff your Accuracy. Focused Accuracy is a toggle power and must be activated and deactivated manually. Like all toggle powers, while active, Focused Accuracy drains Endurance while active. You must be level 41 and have one other Mace Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Self +To Hit, +ACC, +Perception, Res(DeBuff To Hit)",
+      "icon": "arachnos_patron_selftohitbuff.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "To Hit Buff"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 10.0,
+        "endurance": 0.195,
+        "activationTime": 1.17,
+        "effectArea": "SingleTarget",
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Summon Tarantula",
+      "fullName": "Epic.Controller_Mace_Mastery.Summon_Tarantula",
+      "rank": 5,
+      "available": 43,
+      "description": "Black Scorpion has granted you an Toxic Tarantula for you to command. Weaver One developed the Tarantula Exoskeleton Armor, which so radically transforms an Arachnos troop that hardly anything human is recognizable. Your access to this Tarantula is very limited. You must be level 44 and have two other Mace Mastery Powers before selecting this power.",
+      "shortHelp": "Summon Tarantula: Ranged DMG(Toxic)",
+      "icon": "arachnos_patron_summononepet.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate Defense Debuff",
+        "Defense Debuff",
+        "Immobilize",
+        "Pet Damage",
+        "Recharge Intensive Pets",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 900.0,
+        "endurance": 26.0,
+        "activationTime": 3.03,
+        "effectArea": "Location"
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['controller_mace_mastery'] = EPIC_CONTROLLER_MACE_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/controller/fire_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Fire Mastery
+ * Archetype: Controller
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\fire_mastery
+ */
+
+const EPIC_FIRE_MASTERY = {
+  "id": "fire_mastery",
+  "name": "Fire Mastery",
+  "displayName": "Fire Mastery",
+  "archetype": "controller",
+  "description": "You have Mastery over Fire to blast your foes and to add some much needed armor and defense.",
+  "icon": "fire_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Fire Blast",
+      "fullName": "Epic.Fire_Mastery.Fire_Blast",
+      "rank": 1,
+      "available": 34,
+      "description": "Sends a Blast of Fire at a targeted foe and sets the target on fire for a short period of time. Slower recharge rate than Flares, but more damage.",
+      "shortHelp": "Ranged, DMG(Fire)",
+      "icon": "fireblast_fireblast.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Controller",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 8.0,
+        "endurance": 6.5,
+        "activationTime": 1.67,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Fire",
+          "scale": 1.889,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Fire Ball",
+      "fullName": "Epic.Fire_Mastery.Fire_Ball",
+      "rank": 2,
+      "available": 34,
+      "description": "Hurls an exploding Fireball that consumes a targeted foe, and all nearby enemies. Anyone in that explosion is burned and set ablaze.",
+      "shortHelp": "Ranged (Targeted AoE), DMG(Fire/Smash)",
+      "icon": "fireblast_fireball.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Controller",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 32.0,
+        "endurance": 18.98,
+        "activationTime": 1.0,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "damage": {
+          "type": "Fire",
+          "scale": 0.1,
+          "table": "Ranged_Damage"
+        }
+      }
+    },
+    {
+      "name": "Fire Shield",
+      "fullName": "Epic.Fire_Mastery.Fire_Shield",
+      "rank": 3,
+      "available": 37,
+      "description": "While this power is active, you get a good resistance to Lethal, Smashing and Fire damage. Fire Shield also provides minimal resistance to Cold damage. You must be level 38 and have one other Fire Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Self +Res(Fire, Lethal, Smash, Cold)",
+      "icon": "firemastery_flamingshield.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 1.67,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "smashing": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "psionic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Rise of the Phoenix",
+      "fullName": "Epic.Fire_Mastery.Rise_of_the_Phoenix",
+      "rank": 4,
+      "available": 40,
+      "description": "If you are defeated, you can rise from the ashes. The fiery resurrection blasts nearby foes with an explosion and knocks them down. You will revive with about half of your Hit Points and Endurance. Rise of the Phoenix will actually leave you invulnerable for a brief time and protected from XP Debt for 20 seconds. You must be level 41 and have one other Fire Mastery Powers before selecting this power.",
+      "shortHelp": "Self Rez, Special",
+      "icon": "firemastery_riseofthephoenix.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "Recharge",
+        "Heal",
+        "Damage"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Healing",
+        "Melee AoE Damage",
+        "Stuns",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 300.0,
+        "activationTime": 1.5,
+        "effectArea": "Location",
+        "damage": {
+          "type": "Heal",
+          "scale": 5.0,
+          "table": "Melee_HealSelf"
+        },
+        "protection": {
+          "immobilize": 50.0
+        }
+      }
+    },
+    {
+      "name": "Consume",
+      "fullName": "Epic.Fire_Mastery.Consume",
+      "rank": 5,
+      "available": 43,
+      "description": "You can drain body heat from all nearby foes in order to replenish your own Endurance. The more foes affected, the more Endurance is gained. Foes suffer minimal Fire damage. You must be level 44 and have two other Fire Mastery Powers before selecting this power.",
+      "shortHelp": "PBAoE, DMG(Fire), Self +End",
+      "icon": "firemastery_consume.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Melee AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 360.0,
+        "endurance": 0.65,
+        "activationTime": 2.03,
+        "effectArea": "AoE",
+        "radius": 20.0,
+        "recovery": {
+          "scale": 0.05,
+          "table": "Melee_Ones"
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['fire_mastery'] = EPIC_FIRE_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/controller/ice_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Ice Mastery
+ * Archetype: Controller
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\ice_mastery
+ */
+
+const EPIC_ICE_MASTERY = {
+  "id": "ice_mastery",
+  "name": "Ice Mastery",
+  "displayName": "Ice Mastery",
+  "archetype": "controller",
+  "description": "You have Mastery over Ice to blast your foes and to add some much needed armor and defense.",
+  "icon": "ice_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Ice Blast",
+      "fullName": "Epic.Ice_Mastery.Ice_Blast",
+      "rank": 1,
+      "available": 34,
+      "description": "Ice Blast hurls shards of ice at foes and Slows their attacks and movement for a time. Slower recharge than Ice Bolt, but more damage.",
+      "shortHelp": "Ranged, DMG(Cold), Foe -Recharge, -SPD",
+      "icon": "ice_mastery_iceblast.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Controller",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Ranged Damage",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 8.0,
+        "endurance": 6.5,
+        "activationTime": 1.67,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Cold",
+          "scale": 1.889,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Hibernate",
+      "fullName": "Epic.Ice_Mastery.Hibernate",
+      "rank": 2,
+      "available": 34,
+      "description": "When you activate this power, you encase yourself in a block of solid ice, making yourself invulnerable, though you are frozen solid and cannot act. While Hibernating within this block of ice, you heal damage and recover endurance at an incredible rate. You can emerge at will by deactivating the power, but you cannot Hibernate for more than 30 seconds. If you activate this power while in the air, you will fall.",
+      "shortHelp": "Toggle: Self +Regeneration, +Recovery, Invulnerable; Self Hold",
+      "icon": "ice_mastery_hibernate.png",
+      "powerType": "Toggle",
+      "requires": "$archetype == @Class_Controller",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Recharge",
+        "Heal"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Healing"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 240.0,
+        "endurance": 0.1625,
+        "activationTime": 0.07,
+        "effectArea": "SingleTarget",
+        "regeneration": {
+          "scale": 10.0,
+          "table": "Melee_Ones"
+        },
+        "recovery": {
+          "scale": 4.0,
+          "table": "Melee_Ones"
+        },
+        "resistance": {},
+        "protection": {
+          "knockup": 1.0,
+          "knockback": 1.0,
+          "immobilize": 1000.0
+        }
+      }
+    },
+    {
+      "name": "Frozen Armor",
+      "fullName": "Epic.Ice_Mastery.Frozen_Armor",
+      "rank": 3,
+      "available": 37,
+      "description": "While this power is active, you coat yourself in rock hard Frozen Armor. The hardness of the Frozen Armor offers good defense to Smashing and Lethal attack as well as reduces Cold damage. Also, Fire attacks deal slightly less damage. You must be level 38 and have one other Ice Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Self +Def(Smash, Lethal), +Res(Cold, Fire)",
+      "icon": "ice_mastery_frozenarmor.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Defense Sets",
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 0.73,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "cold": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Frost Breath",
+      "fullName": "Epic.Ice_Mastery.Frost_Breath",
+      "rank": 4,
+      "available": 40,
+      "description": "Unleashes a cone of frosty breath that can Slow your opponents' movement and attacks. Very accurate and very deadly at medium range. You must have two other Ice Mastery power to select this power. You must be level 41 and have one other Ice Mastery Powers before selecting this power.",
+      "shortHelp": "Close (Cone), DoT(Cold), Foe -Recharge, -SPD",
+      "icon": "ice_mastery_frostbreath.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Ranged AoE Damage",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.2,
+        "range": 40.0,
+        "recharge": 32.0,
+        "endurance": 18.98,
+        "activationTime": 2.67,
+        "effectArea": "Cone",
+        "radius": 40.0,
+        "arc": 0.5236,
+        "damage": {
+          "type": "Cold",
+          "scale": 0.5477,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Ice Storm",
+      "fullName": "Epic.Ice_Mastery.Ice_Storm",
+      "rank": 5,
+      "available": 43,
+      "description": "Shred your foes with this Ice Storm. This power deals a lot of damage in a large area and can Slow all affected targets movement and attack speed. You must be level 44 and have two other Ice Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Location AoE), DoT(Cold), Foe -Recharge, -SPD",
+      "icon": "ice_mastery_icestorm.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage"
+      ],
+      "allowedSetCategories": [
+        "Ranged AoE Damage",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 2.0,
+        "range": 60.0,
+        "recharge": 120.0,
+        "endurance": 19.5,
+        "activationTime": 2.03,
+        "effectArea": "Location"
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['ice_mastery'] = EPIC_ICE_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/controller/primal_forces_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Energy Mastery
+ * Archetype: Controller
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\primal_forces_mastery
+ */
+
+const EPIC_PRIMAL_FORCES_MASTERY = {
+  "id": "primal_forces_mastery",
+  "name": "Energy Mastery",
+  "displayName": "Energy Mastery",
+  "archetype": "controller",
+  "description": "You have Mastery over Primal Forces and energy to blast your foes, increase your power, and to add some much needed armor and defense.",
+  "icon": "primal_forces_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Power Blast",
+      "fullName": "Epic.Primal_Forces_Mastery.Power_Blast",
+      "rank": 1,
+      "available": 34,
+      "description": "A much more powerful, yet slower version of Power Bolt. Power Blast sends a focused beam of energy at a foe that can knock him back.",
+      "shortHelp": "Ranged, DMG(Energy/Smash), Foe Knockback",
+      "icon": "powerblast_powerblast.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Controller",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 8.0,
+        "endurance": 10.66,
+        "activationTime": 1.67,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Energy",
+          "scale": 1.889,
+          "table": "Ranged_PvPDamage"
+        },
+        "protection": {
+          "knockback": 1.0
+        }
+      }
+    },
+    {
+      "name": "Conserve Power",
+      "fullName": "Epic.Primal_Forces_Mastery.Conserve_Power",
+      "rank": 2,
+      "available": 34,
+      "description": "You can focus for a moment to conserve your Endurance. After activating this power, you expend less Endurance on all other powers for a while.",
+      "shortHelp": "Self Endurance Discount",
+      "icon": "primalforcesmastery_conservepower.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Controller",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 600.0,
+        "endurance": 9.75,
+        "activationTime": 1.17,
+        "effectArea": "SingleTarget"
+      }
+    },
+    {
+      "name": "Temp Invulnerability",
+      "fullName": "Epic.Primal_Forces_Mastery.Temp_Invulnerability",
+      "rank": 3,
+      "available": 37,
+      "description": "When you toggle on this power, you become highly resistant to Smashing and Lethal damage. You must be level 38 and have one other Energy Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Self +Res(Smash, Lethal)",
+      "icon": "primalforcesmastery_temporaryinvulnerabilty.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 0.67,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "smashing": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "psionic": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Energy Torrent",
+      "fullName": "Epic.Primal_Forces_Mastery.Energy_Torrent",
+      "rank": 4,
+      "available": 40,
+      "description": "Energy Torrent unleashes a cone of powerful energy that can smash foes and possibly send them flying. You must be level 41 and have one other Energy Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Cone), DMG(Energy/Smash), Foe Knockback",
+      "icon": "primalforcesmastery_energytorrent.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 40.0,
+        "recharge": 24.0,
+        "endurance": 14.82,
+        "activationTime": 1.07,
+        "effectArea": "Cone",
+        "radius": 40.0,
+        "arc": 0.7854,
+        "damage": {
+          "type": "Energy",
+          "scale": 0.8861,
+          "table": "Ranged_PvPDamage"
+        },
+        "protection": {
+          "knockback": 1.0
+        }
+      }
+    },
+    {
+      "name": "Power Boost",
+      "fullName": "Epic.Primal_Forces_Mastery.Power_Boost",
+      "rank": 5,
+      "available": 43,
+      "description": "Greatly boosts the secondary effects of your powers. Your powers effects like Disorients, Holds, Immobilizes, Heals, Defense Buffs, Endurance Drains, Knockbacks and more, are all improved. The effects of Power Boost last a short while, and only the next couple of attacks will be boosted. You must be level 44 and have two other Energy Mastery Powers before selecting this power.",
+      "shortHelp": "Self +Special",
+      "icon": "primalforcesmastery_powerboost.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 120.0,
+        "endurance": 9.75,
+        "activationTime": 1.17,
+        "effectArea": "SingleTarget"
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['primal_forces_mastery'] = EPIC_PRIMAL_FORCES_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/controller/psionic_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Psionic Mastery
+ * Archetype: Controller
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\psionic_mastery
+ */
+
+const EPIC_PSIONIC_MASTERY = {
+  "id": "psionic_mastery",
+  "name": "Psionic Mastery",
+  "displayName": "Psionic Mastery",
+  "archetype": "controller",
+  "description": "You have Mastery over Psionics and the mind to blast your foes, increase your power, and to add some much needed armor and defense.",
+  "icon": "psionic_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Mental Blast",
+      "fullName": "Epic.Psionic_Mastery.Mental_Blast",
+      "rank": 1,
+      "available": 34,
+      "description": "This basic attack does moderate Psionic damage, and can slightly reduce a target's attack speed.",
+      "shortHelp": "Ranged, DMG(Psionic), Target -Recharge",
+      "icon": "psychicblast_mentalblast.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Controller",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 100.0,
+        "recharge": 8.0,
+        "endurance": 6.5,
+        "activationTime": 1.67,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Psionic",
+          "scale": 1.889,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Indomitable Will",
+      "fullName": "Epic.Psionic_Mastery.Indomitable_Will",
+      "rank": 2,
+      "available": 34,
+      "description": "Activating this power greatly boosts your resistance to Sleep, Disorient, Fear and Hold effects for 90 seconds. Indomitable Will also grants a high defense to Psionic based attacks.",
+      "shortHelp": "Self Res(Disorient, Hold, Sleep, Fear). DEF(Psionics)",
+      "icon": "psionicmastery_indomitablewill.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Controller",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Defense Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 360.0,
+        "endurance": 19.5,
+        "activationTime": 0.73,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "confuse": 1.0,
+          "fear": 1.0,
+          "hold": 1.0,
+          "stun": 1.0,
+          "sleep": 1.0
+        },
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Mind Over Body",
+      "fullName": "Epic.Psionic_Mastery.Mind_Over_Body",
+      "rank": 3,
+      "available": 37,
+      "description": "When you toggle on this power, you empower your Mind Over Body to become highly resistant to Smashing, Lethal and Psionic damage. You must be level 38 and have one other Psionic Mastery Powers before selecting this power.<br>",
+      "shortHelp": "Toggle: Self +Res(Smash, Lethal, Psionics)",
+      "icon": "psionicmastery_mindoverbody.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 0.67,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "smashing": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "psionic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "World of Confusion",
+      "fullName": "Epic.Psionic_Mastery.World_of_Confusion",
+      "rank": 4,
+      "available": 40,
+      "description": "This toggle power allows you to cause psionic damage and cause confusion within a group of foes, creating chaos. The chance of confusing an enemy is lower than then chance of damaging them, and it may take multiple hits to affect stronger opponents. All affected foes within the area will turn and attack each other, ignoring all heroes. You will not receive any Experience Points for foes defeated by Confused enemies. You must be level 41 and have one other Psionic Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: PBAoE, DoT(Psionic), Foe Confuse",
+      "icon": "psionicmastery_worldofconfusion.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Confuse",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Confuse",
+        "Melee AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 15.0,
+        "endurance": 0.65,
+        "activationTime": 1.67,
+        "effectArea": "AoE",
+        "radius": 8.0,
+        "protection": {
+          "confuse": 1.0
+        },
+        "damage": {
+          "type": "Psionic",
+          "scale": 0.12,
+          "table": "Ranged_Damage"
+        }
+      }
+    },
+    {
+      "name": "Psionic Tornado",
+      "fullName": "Epic.Psionic_Mastery.Psionic_Tornado",
+      "rank": 5,
+      "available": 43,
+      "description": "Unleashes a whirlwind of Psionic energy on a target, tossing nearby foes into the air. The Psionic Tornado damages foes and Slows their attack speed. You must be level 44 and have two other Psionic Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Targeted AoE), DoT(Psionic), Foe Knockback",
+      "icon": "psychicblast_psionictornado.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 100.0,
+        "recharge": 40.0,
+        "endurance": 23.14,
+        "activationTime": 1.83,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "damage": {
+          "type": "Psionic",
+          "scale": 0.8409,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['psionic_mastery'] = EPIC_PSIONIC_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/controller/stone_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Earth Mastery
+ * Archetype: Controller
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\stone_mastery
+ */
+
+const EPIC_STONE_MASTERY = {
+  "id": "stone_mastery",
+  "name": "Earth Mastery",
+  "displayName": "Earth Mastery",
+  "archetype": "controller",
+  "description": "You have Mastery over Earth and Stone to attack your foes and to add some much needed armor and defense.",
+  "icon": "stone_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Hurl Boulder",
+      "fullName": "Epic.Stone_Mastery.Hurl_Boulder",
+      "rank": 1,
+      "available": 34,
+      "description": "You are able to tear up a chunk of ground beneath your feet and Hurl it at an enemy. This attack is close ranged, deals high damage, and can knock foes back.",
+      "shortHelp": "Ranged, DMG(Smash), Foe Knockback",
+      "icon": "earth_mastery_hurlboulder.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Controller",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 16.0,
+        "endurance": 10.66,
+        "activationTime": 2.0,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Smashing",
+          "scale": 2.44,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Fissure",
+      "fullName": "Epic.Stone_Mastery.Fissure",
+      "rank": 2,
+      "available": 34,
+      "description": "This powerful stomp can cause a seismic disturbance. This will crack the Earth itself and send a Fault towards a targeted foe. Affected targets take moderate damage and may be thrown in the air and possibly Disoriented.",
+      "shortHelp": "Close (Targeted AoE), DMG(Lethal/Smash), Foe Knockback, Disorient",
+      "icon": "earth_mastery_fissure.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Controller",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged AoE Damage",
+        "Stuns",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 20.0,
+        "recharge": 20.0,
+        "endurance": 12.74,
+        "activationTime": 2.1,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "damage": {
+          "type": "Smashing",
+          "scale": 0.8215,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Rock Armor",
+      "fullName": "Epic.Stone_Mastery.Stone_Armor",
+      "rank": 3,
+      "available": 37,
+      "description": "Your skin becomes stone while this power is active. Stone Armor makes you highly resistant to Smashing and Lethal attacks. They are less likely to land and affect you. You must be level 38 and have one other Earth Mastery Powers before selecting this power.<br>",
+      "shortHelp": "Toggle: Self +DEF(Lethal, Smashing)",
+      "icon": "earth_mastery_rockarmor.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Defense Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 4.0,
+        "endurance": 0.1625,
+        "activationTime": 0.73,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Seismic Smash",
+      "fullName": "Epic.Stone_Mastery.Seismic_Smash",
+      "rank": 4,
+      "available": 40,
+      "description": "This massive attack hits with all the force of the Earth itself. It deals tremendous amounts of damage, and may Hold the target if they are not defeated outright. You must be level 41 and have one other Earth Mastery Powers before selecting this power.",
+      "shortHelp": "Melee, DMG(Smash), Foe Hold",
+      "icon": "earth_mastery_seismicsmash.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Hold",
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Holds",
+        "Melee Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.2,
+        "range": 7.0,
+        "recharge": 28.0,
+        "endurance": 18.512,
+        "activationTime": 1.5,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Smashing",
+          "scale": 2.57,
+          "table": "Melee_PvPDamage"
+        },
+        "protection": {
+          "hold": 4.0
+        }
+      }
+    },
+    {
+      "name": "Embrace of the Earth",
+      "fullName": "Epic.Stone_Mastery.Earths_Embrace",
+      "rank": 5,
+      "available": 43,
+      "description": "You are so connected to the Earth, you can draw upon its power to add to your own health. Activating this power increases your maximum Hit Points, and grants you resistance to Toxic Damage. You must be level 44 and have two other Earth Mastery Powers before selecting this power.",
+      "shortHelp": "Self +HP",
+      "icon": "earth_mastery_earthsembrace.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge",
+        "Heal"
+      ],
+      "allowedSetCategories": [
+        "Healing",
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 360.0,
+        "endurance": 13.0,
+        "activationTime": 2.03,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Heal",
+          "scale": 4.0,
+          "table": "Melee_HealSelf"
+        },
+        "resistance": {
+          "toxic": {
+            "scale": 2.0,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['stone_mastery'] = EPIC_STONE_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
@@ -0,0 +1,9632 @@
+// ---- js/data/powersets/corruptor/archery.js ----
+;/**
+ * Archery
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_ARCHERY_POWERSET = {
+    name: "Archery",
+    category: "Unknown",
+    description: "Archery powerset",
+    icon: "archery_set.png",
+    powers: [
+        {
+            name: "Aimed Shot",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged Damage", "Universal Damage Sets"],
+            description: "Though it takes longer to execute, your Aimed Shot deals greater damage than Snap Shot.<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, High DMG(Lethal)",
+            icon: "archery_mediumarrow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.155,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    type: "Lethal",
+                    scale: 4.5198
+                }
+            }
+        },
+        {
+            name: "Snap Shot",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged Damage", "Universal Damage Sets"],
+            description: "A quick attack that fires an arrow at your foe after only minimal aiming. Fast, but little damage.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Ranged, Moderate DMG(Lethal)",
+            icon: "archery_quickarrow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.155,
+                range: 80.0,
+                recharge: 2.0,
+                endurance: 3.536,
+                cast: 1.0,
+                damage: {
+                    type: "Lethal",
+                    scale: 3.7198
+                }
+            }
+        },
+        {
+            name: "Fistful of Arrows",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You fire a fistful of arrows at foes in a cone in front of you. Good at close range.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged (Cone), Moderate DMG(Lethal)",
+            icon: "archery_conearrow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.155,
+                range: 40.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.17,
+                damage: {
+                    type: "Lethal",
+                    scale: 3.245
+                }
+            }
+        },
+        {
+            name: "Blazing Arrow",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged Damage", "Universal Damage Sets"],
+            description: "You fire a Blazing Arrow at your foe, dealing some Lethal damage and causing them to catch on fire and burn.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged, Extreme DMG(Lethal), Minor DoT(Fire)",
+            icon: "archery_flamingarrow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.155,
+                range: 80.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.83,
+                damage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 4.1618
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 3.92
+                        }
+                    ],
+                    scale: 8.081800000000001
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.125,
+                    ticks: 4
+                },
+                buffDuration: 4.125
+            }
+        },
+        {
+            name: "Aim",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the chance to hit of your attacks for a few seconds. Slightly increases damage.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +To-hit, +DMG",
+            icon: "archery_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.625,
+                damageBuff: 0.425,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Explosive Arrow",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You fire a grenade-tipped arrow at long range. This explosion affects all within the blast radius, and can knock them back.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Targeted AoE), Moderate DMG(Lethal/Fire), Knockback",
+            icon: "archery_explodingarrow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.155,
+                range: 80.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 3.4023000000000003
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 1.2085
+                        }
+                    ],
+                    scale: 4.6108
+                }
+            }
+        },
+        {
+            name: "Ranged Shot",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged Damage", "Sniper Attacks", "Universal Damage Sets"],
+            description: "A long range shot that blasts your foes. Like most sniper attacks, this power has a bonus to Accuracy, but is best fired from a distance as it can be interrupted. If you are engaged in battle this attack becomes instant-cast. If you are not engaged, it will do bonus damage.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Sniper, Extreme DMG(Lethal)",
+            icon: "archery_sniperarrow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.155,
+                range: 150.0,
+                recharge: 12.0,
+                endurance: 14.352,
+                cast: 1.67
+            }
+        },
+        {
+            name: "Stunning Shot",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged Damage", "Stuns", "Universal Damage Sets"],
+            description: "You fire a blunt, weighted arrow at your target's chest. The Stunning Shot has a good chance of stunning your foe.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged Disorient, Minor DMG(Smashing)",
+            icon: "archery_stunarrow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.155,
+                range: 60.0,
+                recharge: 20.0,
+                endurance: 10.192,
+                cast: 1.0,
+                damage: {
+                    type: "Smashing",
+                    scale: 0.6848
+                },
+                stun: 3.0
+            }
+        },
+        {
+            name: "Rain of Arrows",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You unleash a Rain of Arrows on a targeted location, damaging foes within a large area.",
+            shortHelp: "Ranged (Location AoE), DoT(Lethal)",
+            icon: "archery_rainofarrows.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 90.0,
+                recharge: 65.0,
+                endurance: 20.8,
+                cast: 2.0,
+                buffDuration: 3.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/archery'] = CORRUPTOR_ARCHERY_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_ARCHERY_POWERSET = CORRUPTOR_ARCHERY_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/assault-rifle.js ----
+;/**
+ * Assault Rifle
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_ASSAULT_RIFLE_POWERSET = {
+    name: "Assault Rifle",
+    category: "Unknown",
+    description: "Assault Rifle powerset",
+    icon: "assault-rifle_set.png",
+    powers: [
+        {
+            name: "Burst",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Corruptor Archetype Sets", "Defense Debuff", "Ranged Damage", "Universal Damage Sets"],
+            description: "Quickly fires a Burst of rounds at a single target at very long range. Damage is average, but the fire rate is fast. Can also reduce the target's defense.",
+            shortHelp: "Ranged, DMG(Lethal), Foe -DEF",
+            icon: "assaultweapons_arburst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 90.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                dotDamage: {
+                    type: "Lethal",
+                    scale: 0.585,
+                    ticks: 3
+                },
+                buffDuration: 0.91,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Slug",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "Fires a single Slug at a targeted foe. Firing a single Slug is slower than firing a Burst, but deals more damage, is longer range, and can knock down foes.",
+            shortHelp: "Ranged, DMG(Lethal), Foe Knockback",
+            icon: "assaultweapons_shotgunslug.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 100.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.4,
+                damage: {
+                    type: "Lethal",
+                    scale: 3.3399
+                }
+            }
+        },
+        {
+            name: "Buckshot",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Good at close range. Fires a cone of Buckshot pellets and can knock some foes down.",
+            shortHelp: "Ranged (Cone), DMG(Lethal), Foe Knockback",
+            icon: "assaultweapons_shotgunbuckshot.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.05,
+                range: 40.0,
+                recharge: 8.0,
+                endurance: 10.192,
+                cast: 0.9,
+                damage: {
+                    type: "Lethal",
+                    scale: 1.5350000000000001
+                }
+            }
+        },
+        {
+            name: "M30 Grenade",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Launches a Grenade at long range from beneath the barrel of your Assault Rifle. This explosion affects all within the blast radius, and can knock them back.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Lethal/Fire), Knockback",
+            icon: "assaultweapons_arm30grenade.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.05,
+                range: 80.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 2.0031
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 1.7788
+                        }
+                    ],
+                    scale: 3.7819
+                }
+            }
+        },
+        {
+            name: "Beanbag",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged Damage", "Stuns", "Universal Damage Sets"],
+            description: "Fires a single non lethal Beanbag that can seriously Disorient a target. Deals little damage and takes a long time to reload, but renders most targets unable to attack for a good while.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Minor DMG(Smash), Foe Disorient",
+            icon: "assaultweapons_shotgunbeanbag.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 60.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 0.9,
+                damage: {
+                    type: "Smashing",
+                    scale: 4.82
+                },
+                stun: 3.0
+            }
+        },
+        {
+            name: "Sniper Rifle",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Ranged Damage", "Sniper Attacks", "Universal Damage Sets"],
+            description: "Sniper Rifle is a powerful piece of hardware. It is very accurate and has a very long range. The impressive round can knock down its target. Like most sniper attacks, you must take your time to aim, so this attack can be interrupted. If you are engaged in battle this attack becomes instant-cast. If you are not engaged, it will do bonus damage.",
+            shortHelp: "Sniper, DMG(Lethal), Foe Knockback",
+            icon: "assaultweapons_sniperrifle.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 150.0,
+                recharge: 12.0,
+                endurance: 14.352,
+                cast: 1.17
+            }
+        },
+        {
+            name: "Flamethrower",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Spews forth a cone of flames from underneath the barrel of your assault rifle, setting foes on fire. Very accurate and very deadly at medium range.",
+            shortHelp: "Ranged (Cone), DoT(Fire)",
+            icon: "assaultweapons_arflamethrower.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.7854,
+            effects: {
+                accuracy: 1.3,
+                range: 40.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 2.33,
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.6251,
+                    ticks: 4
+                },
+                buffDuration: 4.7
+            }
+        },
+        {
+            name: "Ignite",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Sprays a target with accelerant from your flamethrower, igniting it and causing extreme damage over time. Also sets the location on fire if the target is grounded, inflicting damage to additional foes that step in the area.",
+            shortHelp: "Ranged, DoT(Fire)",
+            icon: "assaultweapons_dot.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.15,
+                range: 60.0,
+                recharge: 14.0,
+                endurance: 13.52,
+                cast: 2.0,
+                damage: {
+                    type: "Fire",
+                    scale: 1.9077
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.19490000000000002,
+                    ticks: 21
+                },
+                buffDuration: 5.25
+            }
+        },
+        {
+            name: "Full Auto",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Opens up your assault rifle on Full Auto to lay down a massive spray of bullets at your target. Although very slow to reload, damage from this attack is massive, shredding all targets within the cone of effect. There's a chance you may land a lucky shot for extra damage.",
+            shortHelp: "Ranged (Cone), DMG(Lethal), +Special",
+            icon: "assaultweapons_arfullauto.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.35,
+                range: 80.0,
+                recharge: 60.0,
+                endurance: 15.6,
+                cast: 2.5,
+                damage: {
+                    type: "Lethal",
+                    scale: 0.5958
+                },
+                dotDamage: {
+                    type: "Lethal",
+                    scale: 0.4386,
+                    ticks: 10
+                },
+                buffDuration: 2.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/assault-rifle'] = CORRUPTOR_ASSAULT_RIFLE_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_ASSAULT_RIFLE_POWERSET = CORRUPTOR_ASSAULT_RIFLE_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/beam-rifle.js ----
+;/**
+ * Beam Rifle
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_BEAM_RIFLE_POWERSET = {
+    name: "Beam Rifle",
+    category: "Unknown",
+    description: "Beam Rifle powerset",
+    icon: "beam-rifle_set.png",
+    powers: [
+        {
+            name: "Charged Shot",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "By charging up your Beam Rifle, you're able to launch a concentrated blast of energy at your foe to cause High Energy damage. The impact strikes with such force that it can knock your target off of their feet. Charge Shot causes additional damage if the target is suffering from the Disintegrating effect. In addition, targets already affected by the Disintegrating effect have a chance to spread to 3 nearby targets. This Disintegrate Spread effect can only hit targets that aren't already affected by the Disintegrating effect. Disintegrate Spread causes Minor Energy damage over time.",
+            shortHelp: "Ranged, DMG(Energy), Foe Knockdown, Special",
+            icon: "beamrifle_chargedshot.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    type: "Energy",
+                    scale: 7.5870999999999995
+                }
+            }
+        },
+        {
+            name: "Single Shot",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "You fire a single blast from your Beam Rifle which deals Moderate Energy damage and has a chance to knock the target down. If the target is suffering from the Disintegrating effect, Single Shot will reduce the target's regeneration rate slightly. In addition, targets already affected by the Disintegrating effect have a chance to spread to 3 nearby targets. This Disintegrate Spread effect can only hit targets that aren't already affected by the Disintegrating effect. Disintegrate Spread causes Minor Energy damage over time.",
+            shortHelp: "Ranged, DMG(Energy), Foe Knockdown, Special",
+            icon: "beamrifle_singleshot.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    type: "Energy",
+                    scale: 4.5198
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Cutting Beam",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Corruptor Archetype Sets", "Defense Debuff", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You fire a constant stream of energy from your weapon and sweep it in a broad arc blasting all foes in a wide cone in front of you. Cutting beam deals Moderate Energy damage and reduces the targets' Defense. This power will cause Minor Energy damage over time if the target is suffering from the Disintegrating effect.",
+            shortHelp: "Ranged (Cone), DMG(Energy), Foe -Def(All), Special",
+            icon: "beamrifle_cuttingbeam.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.05,
+                range: 50.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.9,
+                damage: {
+                    type: "Energy",
+                    scale: 3.5766
+                },
+                dotDamage: {
+                    type: "Energy",
+                    scale: 0.1966,
+                    ticks: 2
+                },
+                buffDuration: 2.1,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Disintegrate",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged Damage", "Universal Damage Sets"],
+            description: "You fire a stream of energy at your foe which causes them to slowly disintegrate and suffer High Energy damage over time. Even after the damage over time effect wears off the target will have their regeneration rate reduced and suffer from the Disintegration effect for an additional period of time. Using Beam Rifle powers on targets affected by Disintegrate will inflict additional effects. Additionally if Single Shot, Charged Shot, Lancer Shot and Penetrating Ray are used on a target suffering from Disintegrating, they have a chance to cause this effect to spread to up 3 nearby targets that aren't already suffering from Disintegrating. Targets affected by this Disintegrate Spread will also suffer some Minor Energy damage over time.",
+            shortHelp: "Ranged, DoT(Energy), Foe -Regen, Special",
+            icon: "beamrifle_disintegrate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.1,
+                range: 80.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.9,
+                damage: {
+                    type: "Energy",
+                    scale: 3.8059000000000003
+                },
+                dotDamage: {
+                    type: "Energy",
+                    scale: 0.45030000000000003,
+                    ticks: 9
+                },
+                buffDuration: 10.5
+            }
+        },
+        {
+            name: "Aim",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the chance to hit of your attacks for a few seconds. Slightly increases damage.",
+            shortHelp: "Self +To-hit, +DMG",
+            icon: "beamrifle_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.625,
+                damageBuff: 0.425,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Lancer Shot",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged Damage", "Stuns", "Universal Damage Sets"],
+            description: "You charge up your Beam Rifle and deliver an incredibly focused ray of energy at a nearby foe that deals Superior Energy damage and will briefly stun the target. Lancer Shot will cause additional damage if the target is suffering from the Disintegrating effect. In addition, targets already affected by the Disintegrating effect have a chance to spread to 3 nearby targets. This Disintegrate Spread effect can only hit targets that aren't already affected by the Disintegration effect. Disintegrate Spread causes Minor Energy damage over time.",
+            shortHelp: "Ranged, DMG(Energy), Foe Stun, Special",
+            icon: "beamrifle_lancershot.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 80.0,
+                recharge: 11.0,
+                endurance: 11.024,
+                cast: 1.9,
+                damage: {
+                    type: "Energy",
+                    scale: 9.4378
+                },
+                stun: 3.0
+            }
+        },
+        {
+            name: "Penetrating Ray",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Ranged Damage", "Sniper Attacks", "Universal Damage Sets"],
+            description: "You take careful aim at your target and deliver a punishing supercharged shot from your Beam Rifle. This causes Extreme Energy damage and may knock the target off their feet. If the target is also suffering from the Disintegrating effect it will also suffer additional damage over time. Like all Sniper attacks it will be interrupted if you're attacked. In addition, targets already affected by the Disintegrating effect will cause this effect to spread to 3 nearby targets. This Disintegrate Spread effect can only hit targets that aren't already affected by the Disintegrating effect. Disintegrate Spread causes Minor Energy damage over time. If you are engaged in battle this attack becomes instant-cast. If you are not engaged, it will do bonus damage.",
+            shortHelp: "Sniper, DMG(Energy), Foe Knockdown, Special",
+            icon: "beamrifle_penetratingray.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 150.0,
+                recharge: 12.0,
+                endurance: 14.352,
+                cast: 1.67
+            }
+        },
+        {
+            name: "Piercing Beam",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You release a supercharged beam in a narrow cone of energy that pierces through up to 3 enemies. Piercing Beam deals High Energy damage and briefly reduces their damage resistance. If a target struck by Piercing Beam is suffering from the Disintegrating effect it will immediately suffer additional damage.",
+            shortHelp: "Narrow Ranged (Cone), DMG(Energy), Foes -Res, Special",
+            icon: "beamrifle_piercingbeam.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 3,
+            arc: 0.0873,
+            effects: {
+                accuracy: 1.05,
+                range: 80.0,
+                recharge: 14.0,
+                endurance: 13.52,
+                cast: 2.33,
+                damage: {
+                    type: "Energy",
+                    scale: 10.7133
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Overcharge",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Corruptor Archetype Sets", "Defense Debuff", "Ranged AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "You overcharge your Beam Rifle and release a massive blast of energy at a group of distant foes causing Extreme Energy damage, causing Minor Energy damage over time, reducing the defense of all affected foes and potentially stunning affected foes. If Overcharge strikes a target suffering from the Disintegrating effect they will be affected by a longer stun.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Energy), Foe Minor DoT (Energy), -Def(All), Disorient, Special",
+            icon: "beamrifle_overcharge.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.4,
+                range: 80.0,
+                recharge: 125.0,
+                endurance: 20.8,
+                cast: 2.9,
+                damage: {
+                    type: "Energy",
+                    scale: 6.3566
+                },
+                dotDamage: {
+                    type: "Energy",
+                    scale: 0.1,
+                    ticks: 4
+                },
+                buffDuration: 4.1,
+                defenseDebuff: 1.5,
+                stun: 3.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/beam-rifle'] = CORRUPTOR_BEAM_RIFLE_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_BEAM_RIFLE_POWERSET = CORRUPTOR_BEAM_RIFLE_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/cold-domination.js ----
+;/**
+ * Cold Domination
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_COLD_DOMINATION_POWERSET = {
+    name: "Cold Domination",
+    category: "Unknown",
+    description: "Cold Domination powerset",
+    icon: "cold-domination_set.png",
+    powers: [
+        {
+            name: "Ice Shield",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Resist Damage"],
+            description: "Casts a rock hard Ice Shield on one of your allies and grants him Defense to Melee, Lethal and Smashing attacks and damage resistance to Cold and Fire damage. You cannot stack multiple Ice Shields on the same target, however the shield can be improved by another ally using the same power. Can also be used in conjunction with your Glacial Shield. You cannot use this power on yourself.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Ranged, Ally +DEF(Melee, Smash, Lethal), Res(Cold, Fire)",
+            icon: "colddomination_iceshield.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 2.0,
+                endurance: 7.8,
+                cast: 1.17,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 1.25,
+                            ticks: 120
+                        },
+                        {
+                            type: "Fire",
+                            scale: 1.0,
+                            ticks: 120
+                        }
+                    ]
+                },
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Infrigidate",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Slow Movement"],
+            description: "Fires a frigid beam of cold at a single target. This beam dramatically reduces the target's attack rate, movement speed and Defense. Infrigidate draws so much heat out of the target that the damage of any of its Fire attacks will be reduced.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged Foe -Speed, -Recharge, -DEF, -DMG (Fire)",
+            icon: "colddomination_infrigidate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 10.4,
+                cast: 1.0,
+                dotDamage: {
+                    type: "Fire",
+                    scale: 3.0,
+                    ticks: 10
+                },
+                buffDuration: 20.0,
+                defenseDebuff: 2.5
+            }
+        },
+        {
+            name: "Snow Storm",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "While active, the chill from this Snow Storm can dramatically Slow the attack and movement speed of the target and all nearby foes. The torrent winds of the Snow Storm are enough to bring down flying foes.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Ranged (Targeted AoE), Foe -Speed, -Recharge, -Fly",
+            icon: "colddomination_snowstorm.png",
+            powerType: "Toggle",
+            targetType: "Foe",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 10.0,
+                endurance: 0.26,
+                cast: 2.03,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Glacial Shield",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Resist Damage"],
+            description: "Envelopes an ally in gleaming Glacial Ice. Its crystalline structure has refracting properties that grants the target good Defense against Area Effect, Ranged, Energy and Negative Energy attacks. Glacial Shield also grants the target some damage resistance to Cold. You cannot stack multiple Glacial Shields on the same target, however the shield can be improved by another ally using the same power. Can also be used in conjunction with your Ice Shield. You cannot use this power on yourself.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Ranged, Ally +DEF(Ranged, AoE, Energy, Negative), Res(Cold)",
+            icon: "colddomination_glaciate.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 2.0,
+                endurance: 7.8,
+                cast: 1.17,
+                dotDamage: {
+                    type: "Cold",
+                    scale: 1.25,
+                    ticks: 120
+                },
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Frostwork",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Covers an ally in a thick layer of Frost. The frost can absorb the impact from enemy attacks, effectively increasing your ally's maximum Hit Points for a short time. Frostwork also grants your ally resistance to Toxic Damage.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Target +Max HP, Res(Toxic)",
+            icon: "colddomination_frostwork.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 60.0,
+                endurance: 14.56,
+                cast: 1.17,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 2.0,
+                    ticks: 60
+                },
+                buffDuration: 120.0
+            }
+        },
+        {
+            name: "Arctic Fog",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Resist Damage"],
+            description: "Your mastery of Cold allows you to hide yourself and all nearby allies within thick Arctic Fog. Arctic Fog makes you and your allies harder to see and increases your Defense to area effect, melee and ranged attacks, as well as your resistance to Slow, Fire, Cold, and Energy damage.",
+            shortHelp: "Toggle: PBAoE, Team Stealth, +DEF, +Res(Fire, Cold, Energy, Slow)",
+            icon: "colddomination_arcticfog.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 15.0,
+                endurance: 0.26,
+                cast: 1.87,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Benumb",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: [],
+            description: "Numbs a single target to its very core. Benumb reduces the target's core body temperature, dramatically weakening him. A Benumbed target's Damage and Regeneration Rate are greatly reduced. Additionally, the affected target's secondary power effects are all weakened. The target's power effects like Heals, Defense Buffs, Endurance Drains, Disorients, Holds, Immobilizes, Knockbacks and more, are all weakened.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged Foe -DMG, -END, -Regeneration, -Special",
+            icon: "colddomination_benumb.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 120.0,
+                endurance: 13.0,
+                cast: 2.07,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Sleet",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Corruptor Archetype Sets", "Defense Debuff", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Summons a Sleet Storm at a targeted location. Sleet deals minimal Cold damage to anything that passes through the storm. It also Slows the affected foes and severely reduces their Defense and resistance to damage. Many foes may even slip and fall trying to escape the storm.<br><br><color #fcfc95>Damage: Minor(DoT).</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Location AoE), Minor DoT(Cold), Foe -Speed, -Recharge, -DEF, -Res (All), Knockdown",
+            icon: "colddomination_sleet.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                endurance: 18.2,
+                cast: 2.03,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Heat Loss",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Slow Movement"],
+            description: "Heat Loss drains the heat from your enemies and transfers that energy to your allies in the form of Endurance. All foes near the selected target may experience a Heat Loss, which will drain their Endurance, Slow them, and reduce their Damage Resistance. Allies near the target are granted Endurance and a boost to their Recovery. Some Endurance and Recovery will also be transferred directly to you and any allies near you.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Ranged (Foe AoE), Foe -RES, -END, Slow; Team +END, +Recovery",
+            icon: "colddomination_heatloss.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 360.0,
+                endurance: 15.6,
+                cast: 2.17
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/cold-domination'] = CORRUPTOR_COLD_DOMINATION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_COLD_DOMINATION_POWERSET = CORRUPTOR_COLD_DOMINATION_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/dark-blast.js ----
+;/**
+ * Dark Blast
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_DARK_BLAST_POWERSET = {
+    name: "Dark Blast",
+    category: "Unknown",
+    description: "Dark Blast powerset",
+    icon: "dark-blast_set.png",
+    powers: [
+        {
+            name: "Dark Blast",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Corruptor Archetype Sets", "Ranged Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "A long range blast of dark energy. Deals moderate Negative Energy damage and reduces the target's chance to hit.",
+            shortHelp: "Ranged, DMG(Negative), Foe -To Hit",
+            icon: "darkcast_darkblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    type: "Negative",
+                    scale: 2.2599
+                },
+                tohitDebuff: 0.75,
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Gloom",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Corruptor Archetype Sets", "Ranged Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "Gloom slowly drains a target of life, while reducing their chance to hit. Slower than Dark Blast, but deals more damage over time.",
+            shortHelp: "Ranged, DoT(Negative), Foe -To Hit",
+            icon: "darkcast_souldrain.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.1,
+                dotDamage: {
+                    type: "Negative",
+                    scale: 0.4062,
+                    ticks: 7
+                },
+                buffDuration: 3.6,
+                tohitDebuff: 0.75
+            }
+        },
+        {
+            name: "Moonbeam",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Corruptor Archetype Sets", "Ranged Damage", "Sniper Attacks", "To Hit Debuff", "Universal Damage Sets"],
+            description: "An extremely long range and accurate beam of Negative Energy that deals tremendous damage and reduces the target's chance to hit. This is a sniper attack, and like most sniper attacks, is best fired from a distance as it can be interrupted. If you are engaged in battle this attack becomes instant-cast. If you are not engaged, it will do bonus damage.",
+            shortHelp: "Sniper, DMG(Negative), Target -To Hit",
+            icon: "darkcast_moonbeam.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 150.0,
+                recharge: 12.0,
+                endurance: 14.352,
+                cast: 1.33
+            }
+        },
+        {
+            name: "Dark Pit",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Stuns"],
+            description: "Envelops a targeted foe and any nearby enemies in a pit of Negative Energy. The attack deals no damage, but Disorients all affected foes for a good while.",
+            shortHelp: "Ranged (Targeted AoE), Foe Disorient",
+            icon: "darkcast_darkpit.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 0.8,
+                range: 70.0,
+                recharge: 60.0,
+                endurance: 13.0,
+                cast: 1.07,
+                stun: 2.0
+            }
+        },
+        {
+            name: "Tenebrous Tentacles",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Corruptor Archetype Sets", "Immobilize", "Ranged AoE Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You can create a cone shaped rift to the Netherworld that allows its native creatures to slip their oily Tentacles into our reality. These creatures will snare all foes within range, Immobilizing them while the Tentacles drain their life and reduce their chance to hit.",
+            shortHelp: "Ranged (Cone), DMG(Negative), Foe Immobilize, -To Hit",
+            icon: "darkcast_tenebroustentacles.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.6981,
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.67,
+                damage: {
+                    type: "Negative",
+                    scale: 1.1658
+                },
+                dotDamage: {
+                    type: "Negative",
+                    scale: 0.2697,
+                    ticks: 7
+                },
+                buffDuration: 7.1,
+                tohitDebuff: 0.75
+            }
+        },
+        {
+            name: "Night Fall",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Corruptor Archetype Sets", "Ranged AoE Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "Unleashes a cone shaped burst of particles from the Netherworld. All targets within the modest range of this power take Negative Energy damage and have a reduced chance to hit.",
+            shortHelp: "Ranged (Cone), DMG(Negative), Foe -To Hit",
+            icon: "darkcast_nightfall.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.3491,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 10.0,
+                endurance: 13.104,
+                cast: 2.0,
+                dotDamage: {
+                    type: "Negative",
+                    scale: 0.1973,
+                    ticks: 9
+                },
+                buffDuration: 2.8,
+                tohitDebuff: 0.75
+            }
+        },
+        {
+            name: "Torrent",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Corruptor Archetype Sets", "Knockback", "Ranged AoE Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You summon a wave of mire that sweeps away foes within its arc. The attack deals minimal Negative Energy damage, but sends foes flying and reduces their chance to hit.",
+            shortHelp: "Ranged (Cone), DMG(Negative), Foe -To Hit, Knockback",
+            icon: "darkcast_torrent.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 1.03,
+                damage: {
+                    type: "Negative",
+                    scale: 0.4
+                },
+                tohitDebuff: 0.75,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Life Drain",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Accurate To-Hit Debuff", "Corruptor Archetype Sets", "Healing", "Ranged Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You can tap the power of the Netherworld to steal some life from a target foe and reduce their chance to hit. Some of that stolen life is transferred to you in the form of Hit Points.",
+            shortHelp: "Ranged, DMG(Negative), Target -To Hit, Self +HP",
+            icon: "darkcast_lifedrain.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.93,
+                damage: {
+                    type: "Negative",
+                    scale: 3.7108999999999996
+                },
+                healing: {
+                    scale: 107.0897,
+                    perTarget: true
+                },
+                tohitDebuff: 0.75,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Blackstar",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Corruptor Archetype Sets", "Melee AoE Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You can unleash a devastating blast of Negative Energy around yourself, dealing massive Negative Energy and Smashing damage and severely reducing affected foes' chance to hit.",
+            shortHelp: "PBAoE, DMG(Negative/Smash), Foe -To Hit",
+            icon: "darkcast_blackstar.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.4,
+                recharge: 145.0,
+                endurance: 27.7316,
+                cast: 3.0,
+                damage: {
+                    type: "Negative",
+                    scale: 5.7473
+                },
+                tohitDebuff: 5.0,
+                buffDuration: 20.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/dark-blast'] = CORRUPTOR_DARK_BLAST_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_DARK_BLAST_POWERSET = CORRUPTOR_DARK_BLAST_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/dark-miasma.js ----
+;/**
+ * Dark Miasma
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_DARK_MIASMA_POWERSET = {
+    name: "Dark Miasma",
+    category: "Unknown",
+    description: "Dark Miasma powerset",
+    icon: "dark-miasma_set.png",
+    powers: [
+        {
+            name: "Tar Patch",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "Drops a large patch of viscous Negative Energy which dramatically slows down enemies that run through it and reduces their damage resistance. Affected targets stuck in the Tar Patch cannot jump or fly.",
+            shortHelp: "Ranged (Location AoE), Target -Speed, -Res, -Fly",
+            icon: "darkmiasma_tarpatch.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 90.0,
+                recharge: 90.0,
+                endurance: 7.8,
+                cast: 3.1,
+                buffDuration: 45.0
+            }
+        },
+        {
+            name: "Twilight Grasp",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Accurate To-Hit Debuff", "Healing", "To Hit Debuff"],
+            description: "You channel Negative Energy from the Netherworld through yourself to a targeted foe. Twilight Grasp drains the power from that target and slowly transfers it to you and all nearby allies. The targeted foe's chance to hit, damage and regeneration rate are reduced, while you and your nearby allies are healed.",
+            shortHelp: "Ranged, Foe -To Hit, -DMG, -Regen, Team Heal",
+            icon: "darkmiasma_twilightgrasp.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 7.8,
+                cast: 2.37,
+                tohitDebuff: 0.5,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Darkest Night",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["To Hit Debuff"],
+            description: "While active, you channel Negative Energy onto a targeted foe. While Darkest Night is active the target, and all foes nearby, will have their chance to hit and Damage potential reduced as long as you keep the power active.",
+            shortHelp: "Toggle: Ranged (Targeted AoE), Foe -DMG, -To Hit",
+            icon: "darkmiasma_darkestnight.png",
+            powerType: "Toggle",
+            targetType: "Foe",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 10.0,
+                endurance: 0.26,
+                cast: 3.17,
+                buffDuration: 0.75,
+                tohitDebuff: 1.5
+            }
+        },
+        {
+            name: "Howling Twilight",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage"],
+            allowedSetCategories: ["Ranged AoE Damage", "Slow Movement", "Stuns", "Universal Damage Sets"],
+            description: "Activating this power channels the power of the Netherworld to weaken your foes, in an attempt to revive all nearby fallen allies. You must stand near your defeated allies to revive them, then select a foe. The selected foe and all nearby foes will be Slowed, Disoriented, have their Regeneration rate reduced and drained of some life. Revived allies will have full Hit Points and Endurance and will be protected from XP Debt for 90 seconds.",
+            shortHelp: "Ranged (AoE), Minor DMG(Negative), Target Slow, -Recharge, -Regen, Disorient, Ally Rez",
+            icon: "darkmiasma_howlingtwilight.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 180.0,
+                endurance: 26.0,
+                cast: 3.17,
+                damage: {
+                    type: "Negative",
+                    scale: 0.25
+                },
+                buffDuration: 30.0,
+                stun: 3.0
+            }
+        },
+        {
+            name: "Shadow Fall",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Resist Damage"],
+            description: "Envelops you and your nearby teammates in a shroud of darkness. Shadow Fall does not grant Invisibility, but it does make you harder to detect. Even if you are discovered, Shadow Fall grants a bonus to Defense bonus to all attacks and Resistance to Fear, while reducing Energy, Negative Energy, and Psionic Damage.",
+            shortHelp: "Toggle: PBAoE, Team Stealth, +DEF(All), +Res(Energy, Negative, Psionics, Fear)",
+            icon: "darkmiasma_shadowfall.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 15.0,
+                endurance: 0.26,
+                cast: 2.03,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Fearsome Stare",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Fear", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Fear", "To Hit Debuff"],
+            description: "Instills tremendous Fear within a cone area in front of you, causing all affected targets to tremble in Terror uncontrollably, attacking only when attacked and even then with a reduced chance to hit.",
+            shortHelp: "Ranged (Cone), Foe Fear, -To Hit",
+            icon: "darkmiasma_fearsomeaura.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 0.7854,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 40.0,
+                endurance: 8.528,
+                cast: 2.03,
+                tohitDebuff: 1.5,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Petrifying Gaze",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Holds"],
+            description: "Petrifies a single targeted foe with a terrifying gaze. The victim is Held and defenseless.",
+            shortHelp: "Ranged Hold",
+            icon: "darkmiasma_petrifyinggaze.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 16.0,
+                endurance: 7.8,
+                cast: 1.67
+            }
+        },
+        {
+            name: "Black Hole",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: [],
+            description: "Opens up a Black Hole to the Netherworld that temporarily pulls in all foes within its grasp. Victims that are immune to the pull become phase shifted and are completely intangible. They are hard to see, and cannot affect or be affected by those in normal space.",
+            shortHelp: "Ranged (Targeted AoE), Foe Intangible",
+            icon: "darkmiasma_blackhole.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 120.0,
+                endurance: 13.0,
+                cast: 1.03
+            }
+        },
+        {
+            name: "Dark Servant",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Accurate To-Hit Debuff", "Healing", "Holds", "Immobilize", "To Hit Debuff"],
+            description: "Summons a Dark Servant to your aid. The Dark Servant possesses an assortment of dark powers to weaken your foes. The summoned entity is not a willing servant, and it is only your power that binds it in this realm. The Dark Servant can be buffed and healed.",
+            shortHelp: "Summon Dark Servant: Ranged Debuff Special",
+            icon: "darkmiasma_darkservant.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 240.0,
+                endurance: 26.0,
+                cast: 3.17,
+                buffDuration: 240.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/dark-miasma'] = CORRUPTOR_DARK_MIASMA_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_DARK_MIASMA_POWERSET = CORRUPTOR_DARK_MIASMA_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/dual-pistols.js ----
+;/**
+ * Dual Pistols
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_DUAL_PISTOLS_POWERSET = {
+    name: "Dual Pistols",
+    category: "Unknown",
+    description: "Dual Pistols powerset",
+    icon: "dual-pistols_set.png",
+    powers: [
+        {
+            name: "Chemical Ammunition",
+            available: -1,
+            tier: 2,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "While this toggle is active you will be equipped with 'Chemical Rounds.' Most of your Dual Pistol attacks will have their secondary damage converted to toxic damage and inflict a minor damage debuff effect on the target.<br><br>In order to earn this power, you must purchase the Swap Ammo power.",
+            shortHelp: "Toggle: Ammo Change (Toxic), Special",
+            icon: "dualpistols_chemicalammo.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                cast: 0.63,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Cryo Ammunition",
+            available: -1,
+            tier: 2,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "While this toggle is active you will be equipped with 'Cryo Rounds'. Most of your Dual Pistol attacks will have their secondary damage converted to cold damage and inflict a minor slow effect on the target.<br><br>In order to earn this power, you must purchase the Swap Ammo power.",
+            shortHelp: "Toggle: Ammo Change (Cold), Special",
+            icon: "dualpistols_cryoammo.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                cast: 0.63,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Incendiary Ammunition",
+            available: -1,
+            tier: 2,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "While this toggle is active you will be equipped with 'Incendiary Rounds.' Most of your Dual Pistol attacks will have their secondary damage converted to fire damage and inflict a minor damage over time effect.<br><br>In order to earn this power, you must purchase the Swap Ammo power.",
+            shortHelp: "Toggle: Ammo Change (Fire), Special",
+            icon: "dualpistols_incendiaryammo.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                cast: 0.63,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Dual Pistols",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "You're a master of akimbo pistols, wielding a high caliber firearm in each hand. Your attacks primarily deal lethal damage and you have a wide variety of attacks, however your strength lies within your ability to use your \"Swap Ammo\" power to change out your ammo mid-battle. Doing so can change your secondary damage type and effects making you an incredibly versatile ranged combatant.",
+            shortHelp: "Dual Pistols",
+            icon: "dual_pistols_set.png"
+        },
+        {
+            name: "Dual Wield",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Dual Wield fires both pistols in rapid succession at its desired target. This power is slower than Pistols, but deals more damage, and the target may get knocked back by the force of the impact.<br><br>Changing your ammo type with the 'Swap Ammo' power will change your secondary damage from lethal to cold, fire or toxic.<br><br>Additionally, changing your ammunition type will also change the secondary effect of this attack from Knockback to:<br><br><color #9bfafa>*A minor attack speed and movement speed debuff if 'Cryo Ammo' is loaded.</color><br><color #fac39b>*A minor damage over time effect if 'Incendiary Ammo' is loaded.</color><br><color #9efa9b>*A -damage effect if 'Chemical Ammo' is loaded.</color>",
+            shortHelp: "Ranged, DMG(Lethal/Special), Foe Knockback/Special",
+            icon: "dualpistols_dualwield.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.1,
+                range: 80.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 6.2578000000000005
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.9387
+                        },
+                        {
+                            type: "Cold",
+                            scale: 0.9387
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 0.9387
+                        }
+                    ],
+                    scale: 9.0739
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.113,
+                    ticks: 3
+                },
+                buffDuration: 3.1
+            }
+        },
+        {
+            name: "Pistols",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Corruptor Archetype Sets", "Defense Debuff", "Ranged Damage", "Universal Damage Sets"],
+            description: "Quickly fires a round from one of your heavy automatic pistols. Damage is average, but the fire rate is very fast. If standard ammo is used, Pistols will also reduce the target's Defense.<br><br>Changing your ammo type with the 'Swap Ammo' power will change your secondary damage from lethal to cold, fire or toxic.<br><br>Additionally, changing your ammunition type will also change the secondary effect of this attack from -Defense to:<br><br><color #9bfafa>*A -minor attack speed and movement speed debuff if 'Cryo Ammo' is loaded.</color><br><color #fac39b>*A -minor damage over time effect if 'Incendiary Ammo' is loaded.</color><br><color #9efa9b>*A -damage debuff effect if 'Chemical Ammo' is loaded.</color><br>",
+            shortHelp: "Ranged, DMG(Lethal/Special)",
+            icon: "dualpistols_pistols.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.1,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 4.52
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.6779999999999999
+                        },
+                        {
+                            type: "Cold",
+                            scale: 0.6779999999999999
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 0.6779999999999999
+                        }
+                    ],
+                    scale: 6.553999999999999
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.113,
+                    ticks: 2
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Empty Clips",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Corruptor Archetype Sets", "Defense Debuff", "Knockback", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You empty the clips of both your pistols in an arc of suppression fire. This attack can blast multiple foes in the affected cone area, and has a small chance of knocking some foes down. Affected targets will have their defense reduced slightly as well if Standard Ammo is equipped.<br><br>Changing your ammo type with the 'Swap Ammo' power will change your secondary damage from lethal to cold, fire or toxic.<br><br>Additionally, changing your ammunition type will also change the secondary effect of this attack from Knockdown to:<br><br><color #9bfafa>*A minor attack speed and movement speed debuff if 'Cryo Ammo' is loaded.</color><br><color #fac39b>*A minor damage over time effect if 'Incendiary Ammo' is loaded.</color><br><color #9efa9b>*A -damage effect if 'Chemical Ammo' is loaded.</color>",
+            shortHelp: "Ranged (Cone), DMG(Lethal/Special), Foe -Defense, Knockdown/Special",
+            icon: "dualpistols_emptyclips.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.1,
+                range: 40.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.67,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 1.0424,
+                            ticks: 3
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.2694,
+                            ticks: 3
+                        },
+                        {
+                            type: "Cold",
+                            scale: 0.15639999999999998,
+                            ticks: 3
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 0.15639999999999998,
+                            ticks: 3
+                        }
+                    ]
+                },
+                buffDuration: 1.6,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Swap Ammo",
+            available: 5,
+            tier: 3,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "By purchasing this power, you will be granted the Cryo Ammunition, Incendiary Ammunition and Chemical Ammunition toggles. Activating these toggles will change your secondary damage type on most Dual Pistols attacks from lethal (Standard Rounds) to cold (Cryo Rounds), fire (Incendiary Rounds) or toxic (Chemical Rounds).<br><br>These toggles are mutually exclusive and only one can be active at a time. If no Swap Ammo toggles are active, the player will revert to Standard Ammunition.<br><br>Different ammo types also have different secondary effects. Examine your Dual Pistols powers for more information.",
+            shortHelp: "Change Secondary Damage/Effects",
+            icon: "dualpistols_swapammo.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                buffDuration: 2.25
+            }
+        },
+        {
+            name: "Bullet Rain",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You fire your pistols faster than the human eye can follow, causing your bullet trajectory to arc, dealing moderate Lethal damage and possibly knocking your foes back.<br><br>Changing your ammo type with the 'Swap Ammo' power will change your secondary damage from lethal to cold, fire or toxic.<br><br>Additionally, changing your ammunition type will also change the secondary effect of this attack from Knockback to:<br><br><color #9bfafa>*A minor attack speed and movement speed debuff if 'Cryo Ammo' is loaded.</color><br><color #fac39b>*A minor damage over time effect if 'Incendiary Ammo' is loaded.</color><br><color #9efa9b>*A -damage effect if 'Chemical Ammo' is loaded.</color>",
+            shortHelp: "Ranged (Targeted AoE), DMG(Lethal/Special), Knockback/Special",
+            icon: "dualpistols_explosiveclip.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.1,
+                range: 80.0,
+                recharge: 18.0,
+                endurance: 16.848,
+                cast: 1.67,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 1.6637,
+                            ticks: 2
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.2834,
+                            ticks: 2
+                        },
+                        {
+                            type: "Cold",
+                            scale: 0.1704,
+                            ticks: 2
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 0.1704,
+                            ticks: 2
+                        }
+                    ]
+                },
+                buffDuration: 1.1
+            }
+        },
+        {
+            name: "Suppressive Fire",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Holds", "Ranged Damage", "Stuns", "Universal Damage Sets"],
+            description: "Suppressive Fire allows the user to quickly stun their target for a short time and deal a very minor amount of Lethal damage.<br><br>Changing your ammo type with the 'Swap Ammo' power will change your secondary damage from lethal to cold, fire or toxic.<br><br>Additionally, changing your ammunition type will lower the power's base recharge to 8 seconds and change the secondary effect of this attack from Disorient effect to a Hold effect if <color #9bfafa>'Cryo Ammo'</color>, <color #fac39b>'Incendiary Ammo'</color> or <color #9efa9b>'Chemical Ammo'</color> are loaded.<br><br><color #9bfafa>*Significantly higher damage and boss-stopping hold if 'Cryo Ammo' is loaded.</color><br><color #fac39b>*Significantly higher damage and minor hold if 'Incendiary Ammo' is loaded.</color><br><color #9efa9b>*Somewhat increased damage and long duration hold if 'Chemical Ammo' is loaded.</color>",
+            shortHelp: "Ranged, DMG(Lethal/Special), Foe Disorient/Special",
+            icon: "dualpistols_suppressivefire.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.1,
+                range: 60.0,
+                recharge: 20.0,
+                endurance: 10.192,
+                cast: 1.5
+            }
+        },
+        {
+            name: "Executioner's Shot",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Corruptor Archetype Sets", "Defense Debuff", "Knockback", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Executioner's Shot is a deadly ranged attack. Foes struck by this attack will suffer lethal damage and will likely be knocked back by the impact of this attack. Targets struck by Executioner's Shot while no special ammunition is equipped will have their defenses reduced for a short time.<br><br>Changing your ammo type with the 'Swap Ammo' power will change your secondary damage from lethal to cold, fire or toxic.<br><br>Additionally, changing your ammunition type will also change the secondary effect of this attack from Knockback to:<br><br><color #9bfafa>*A minor attack speed and movement speed debuff if 'Cryo Ammo' is loaded.</color><br><color #fac39b>*A minor damage over time effect if 'Incendiary Ammo' is loaded.</color><br><color #9efa9b>*A -damage effect if 'Chemical Ammo' is loaded.</color>",
+            shortHelp: "Ranged, DMG(Lethal/Special), Foe -Defense, Knockback/Special",
+            icon: "dualpistols_executionersshot.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.25,
+                range: 80.0,
+                recharge: 10.0,
+                endurance: 10.4,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 8.129900000000001
+                        },
+                        {
+                            type: "Fire",
+                            scale: 1.2267000000000001
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.2267000000000001
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 1.2267000000000001
+                        }
+                    ],
+                    scale: 11.810000000000002
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.169,
+                    ticks: 3
+                },
+                defenseDebuff: 1.125,
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Piercing Rounds",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You fire your pistols with deadly precision in a very narrow cone, piercing up to three enemies. Piercing Rounds deals Superior lethal damage and reduces targets' Damage Resistance for a short time.<br><br>Changing your ammo type with the 'Swap Ammo' power will change your secondary damage from lethal to cold, fire or toxic, and a secondary effect will be included in this attack:<br><br><color #9bfafa>*A minor attack speed and movement speed debuff if 'Cryo Ammo' is loaded.</color><br><color #fac39b>*A minor damage over time effect if 'Incendiary Ammo' is loaded.</color><br><color #9efa9b>*A -damage effect if 'Chemical Ammo' is loaded.</color><br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Narrow Ranged (Cone), DMG(Lethal/Special), Foes -Res(All)/Special",
+            icon: "dualpistols_piercingrounds.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 3,
+            arc: 0.0873,
+            effects: {
+                accuracy: 1.1,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 2.5,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 9.1832
+                        },
+                        {
+                            type: "Fire",
+                            scale: 1.3775
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.3775
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 1.3775
+                        }
+                    ],
+                    scale: 13.3157
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.169,
+                    ticks: 2
+                },
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Hail of Bullets",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Melee AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You fire a hail of bullets at all enemies around you dealing Extreme lethal damage. Enemies that are struck have a chance to be knocked down. Having Standard Rounds will dramatically increase this chance to knockdown your foes. If you hit at least one target you will gain a moderate melee, ranged and AoE Defense bonus for a brief period.<br><br>Changing your ammo type with the 'Swap Ammo' power will change your secondary damage from lethal to cold, fire or toxic.<br><br>Additionally, changing your ammunition type will also change the secondary effect of this attack from a guaranteed knockdown effect to:<br><br><color #9bfafa>*A minor attack speed and movement speed debuff if 'Cryo Ammo' is loaded.</color><br><color #fac39b>*A minor damage over time effect if 'Incendiary Ammo' is loaded.</color><br><color #9efa9b>*A -damage effect if 'Chemical Ammo' is loaded.</color>",
+            shortHelp: "PBAoE, DMG(Lethal/Special), Self +Def(Melee, Ranged, AoE), Foe Knockdown/Special",
+            icon: "dualpistols_hailofbullets.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.4,
+                recharge: 105.0,
+                endurance: 20.8,
+                cast: 2.47,
+                damage: {
+                    type: "Lethal",
+                    scale: 1.6223
+                },
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 0.6444000000000001,
+                            ticks: 11
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.39339999999999997,
+                            ticks: 11
+                        },
+                        {
+                            type: "Cold",
+                            scale: 0.1934,
+                            ticks: 11
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 0.1934,
+                            ticks: 11
+                        }
+                    ]
+                },
+                buffDuration: 2.3
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/dual-pistols'] = CORRUPTOR_DUAL_PISTOLS_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_DUAL_PISTOLS_POWERSET = CORRUPTOR_DUAL_PISTOLS_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/electrical-blast.js ----
+;/**
+ * Electrical Blast
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_ELECTRICAL_BLAST_POWERSET = {
+    name: "Electrical Blast",
+    category: "Unknown",
+    description: "Electrical Blast powerset",
+    icon: "electrical-blast_set.png",
+    powers: [
+        {
+            name: "Charged Bolts",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Endurance Modification", "Ranged Damage", "Universal Damage Sets"],
+            description: "You can quickly hurl small bolts of electricity at foes, dealing some damage and draining some Endurance. Some of this Endurance may transfer back to you. Charged Bolts deals light damage but recharges quickly.",
+            shortHelp: "Ranged, DMG(Energy), Foe -End",
+            icon: "electricalbolt_chargedbolts.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    type: "Energy",
+                    scale: 2.2599
+                }
+            }
+        },
+        {
+            name: "Lightning Bolt",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Endurance Modification", "Ranged Damage", "Universal Damage Sets"],
+            description: "You can send a large blast of electrical energy at a foe, dealing heavy damage and draining some Endurance. Some of this Endurance may transfer back to you. Lightning Bolt deals more damage than Charged Bolts, but recharges more slowly.",
+            shortHelp: "Ranged, DMG(Energy), Foe -End",
+            icon: "electricalbolt_lightningbolt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    type: "Energy",
+                    scale: 3.5289
+                }
+            }
+        },
+        {
+            name: "Ball Lightning",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Endurance Modification", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Hurls a highly charged ball of lightning that explodes on contact. Ball Lightning deals good damage in an area of effect, and drains some Endurance from each target it hits.",
+            shortHelp: "Ranged (Targeted AoE), DoT(Energy), Foe -End",
+            icon: "electricalbolt_balllightning.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.07,
+                damage: {
+                    type: "Energy",
+                    scale: 0.9
+                },
+                dotDamage: {
+                    type: "Energy",
+                    scale: 0.3736,
+                    ticks: 3
+                },
+                buffDuration: 2.2
+            }
+        },
+        {
+            name: "Short Circuit",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Endurance Modification", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "Releases a burst of electrical energy around you, shocking all nearby foes. This highly accurate discharge deals Moderate damage over time, drains a lot of Endurance from the targets and renders them unable to recover Endurance for quite a while. Additionally, Short Circuit deals extra damage to most robots and mechanical foes. Short Circuit is very effective when used with your other Endurance draining powers.",
+            shortHelp: "PBAoE, DoT(Energy), Foe -End, -Recovery",
+            icon: "electricalbolt_shortcircuit.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.3,
+                recharge: 20.0,
+                endurance: 15.6,
+                cast: 2.5,
+                dotDamage: {
+                    type: "Energy",
+                    scale: 0.3275,
+                    ticks: 4
+                },
+                buffDuration: 1.5
+            }
+        },
+        {
+            name: "Charge Up",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the chance to hit of your attacks for a few seconds. Slightly increases damage and endurance modification.",
+            shortHelp: "Self +To Hit, +DMG, +End Mod",
+            icon: "electricalbolt_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 4.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Zapp",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Endurance Modification", "Ranged Damage", "Sniper Attacks", "Universal Damage Sets"],
+            description: "A focused electrical blast that can travel great distances with high Accuracy. Zapp drains Endurance, and is best fired from a distance, as it can be interrupted. Some of the Endurance you drain may transfer back to you. If you are engaged in battle this attack becomes instant-cast. If you are not engaged, it will do bonus damage.",
+            shortHelp: "Sniper, DMG(Energy), Foe -End",
+            icon: "electricalbolt_zapp.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 150.0,
+                recharge: 12.0,
+                endurance: 14.352,
+                cast: 1.33
+            }
+        },
+        {
+            name: "Tesla Cage",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Endurance Modification", "Holds", "Ranged Damage", "Universal Damage Sets"],
+            description: "Tesla Cage confines the target in an electrical prison. The target is overwhelmed by the electrical charge and is left helpless and can be attacked. The target is drained of some Endurance and some of that Endurance may be transferred back to you.<br><br>Taking this power allows you to build Static with each activation of other electrical blast attacks. As Static builds, you can unleash it with Tesla Cage as electricity will jump off your main target and shock others nearby!",
+            shortHelp: "Ranged, DMG(Energy), Foe Hold, -End",
+            icon: "electricalbolt_telsacage.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Chain",
+            maxTargets: 1,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 10.0,
+                endurance: 6.864,
+                cast: 2.17,
+                damage: {
+                    type: "Energy",
+                    scale: 0.18130000000000002
+                },
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Voltaic Sentinel",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Endurance Modification", "Pet Damage", "Recharge Intensive Pets", "Universal Damage Sets"],
+            description: "You can manifest a polarized electricity field that hovers above the ground and hurls bolts of electricity at nearby foes. Any enemy that passes near this Sentinel risks serious injury. The Sentinel is not alive and cannot be targeted or attacked by enemies. The Sentinel can fly and will follow you.",
+            shortHelp: "Summon Sentinel: Ranged, Moderate DMG(Energy), Foe -End",
+            icon: "electricalbolt_voltaicsentinal.png",
+            powerType: "Toggle",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 2.0,
+                range: 60.0,
+                recharge: 10.0,
+                endurance: 0.52,
+                cast: 3.1
+            }
+        },
+        {
+            name: "Thunderous Blast",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Endurance Modification", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You hurl a tremendously powerful bolt of lightning at a target, devastating all nearby foes. Thunderous Blast deals extreme Energy and Smashing damage and drains a lot of Endurance from nearby foes.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Energy), Foe -End, -Recovery",
+            icon: "electricalbolt_thunderouseblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.4,
+                range: 60.0,
+                recharge: 170.0,
+                endurance: 27.7316,
+                cast: 2.93,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 4.9475999999999996
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.0
+                        }
+                    ],
+                    scale: 5.9475999999999996
+                },
+                buffDuration: 20.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/electrical-blast'] = CORRUPTOR_ELECTRICAL_BLAST_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_ELECTRICAL_BLAST_POWERSET = CORRUPTOR_ELECTRICAL_BLAST_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/empathy.js ----
+;/**
+ * Empathy
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_EMPATHY_POWERSET = {
+    name: "Empathy",
+    category: "Unknown",
+    description: "Empathy powerset",
+    icon: "empathy_set.png",
+    powers: [
+        {
+            name: "Heal Other",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Heals a single targeted ally. You cannot use this power to heal yourself.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ally Heal",
+            icon: "empathy_healother.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 13.0,
+                cast: 2.27
+            }
+        },
+        {
+            name: "Healing Aura",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Healing Aura restores some Hit Points to you and all nearby heroes. Healing Aura is not as potent as Heal Other, but can heal multiple targets at once.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "PBAoE, Team +Heal",
+            icon: "empathy_healingaura.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 8.0,
+                endurance: 13.0,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Absorb Pain",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Dramatically heals an ally's wounds. This power has only a tiny Endurance cost, but it requires you to sacrifice some of your Hit Points. Absorbing someone's pain can be quite dramatic, and afterwards you will be briefly unable to heal your own wounds by any means.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ally Strong Heal, Self Moderate DMG(Special)",
+            icon: "empathy_absorbpain.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 0.52,
+                cast: 2.27,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Resurrect",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: [],
+            description: "Resurrects a fallen ally with full Hit Points and Endurance. The Resurrected target is left protected from XP Debt for 90 seconds.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ally Rez",
+            icon: "empathy_resurrect.png",
+            powerType: "Click",
+            targetType: "Player Ally (Dead)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 15.0,
+                recharge: 180.0,
+                endurance: 26.0,
+                cast: 3.2,
+                buffDuration: 0.5
+            }
+        },
+        {
+            name: "Clear Mind",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: [],
+            description: "Frees an ally from any Disorient, Hold, Sleep, Fear, Confuse and Immobilize effects and leaves them resistant to such effects for a good while. Also, grants target clearer Perception to see hidden foes. Protection will improve with Multiple applications and as you advance in level.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ally +Res(Disorient, Hold, Sleep, Immobilize, Fear, Confuse), +Perception",
+            icon: "empathy_mindwall.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                stun: 1.0,
+                stunDuration: 90.0,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Fortitude",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "To Hit Buff"],
+            description: "Fortitude immensely enhances a single ally's chance to hit, Damage, and Defense to all attacks.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ally +DEF(All), +DMG, +To Hit",
+            icon: "empathy_fortitude.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 60.0,
+                endurance: 10.4,
+                cast: 2.27,
+                tohitBuff: 1.5,
+                buffDuration: 120.0
+            }
+        },
+        {
+            name: "Recovery Aura",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "The Recovery Aura dramatically increases the Endurance recovery rate of all nearby heroes for a limited time. Emitting this Aura costs you a lot of Endurance, and it takes a long time to recharge.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "PBAoE, Ally +Recovery",
+            icon: "empathy_recoveryaura.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 500.0,
+                endurance: 26.0,
+                cast: 2.03,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Regeneration Aura",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "The Regeneration Aura dramatically increases the healing rate of all nearby heroes for a limited time. Emitting this Aura costs you a lot of Endurance, and it takes a long time to recharge.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "PBAoE, Ally +Regeneration",
+            icon: "empathy_regenerationaura.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 500.0,
+                endurance: 26.0,
+                cast: 2.03,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Adrenalin Boost",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "Dramatically increases an ally's Endurance Recovery, Hit Point Regeneration and attack rate for 90 seconds. Also grants the target high resistance to slow effects.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Ranged, Ally +End, +Regeneration, +Recharge, Res (Slow)",
+            icon: "empathy_adrenalinboost.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 300.0,
+                endurance: 10.4,
+                cast: 2.27,
+                buffDuration: 90.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/empathy'] = CORRUPTOR_EMPATHY_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_EMPATHY_POWERSET = CORRUPTOR_EMPATHY_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/energy-blast.js ----
+;/**
+ * Energy Blast
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_ENERGY_BLAST_POWERSET = {
+    name: "Energy Blast",
+    category: "Unknown",
+    description: "Energy Blast powerset",
+    icon: "energy-blast_set.png",
+    powers: [
+        {
+            name: "Power Blast",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "A much more powerful, yet slower version of Power Bolt. Power Blast sends a focused beam of energy at a foe that can knock him back.",
+            shortHelp: "Ranged, DMG(Energy/Smash), Foe Knockback",
+            icon: "powerblast_powerblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 2.1521999999999997
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.3767
+                        }
+                    ],
+                    scale: 3.5288999999999997
+                }
+            }
+        },
+        {
+            name: "Power Bolt",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "A quick attack that rapidly hurls small bolts of energy at foes, sometimes knocking them down. Fast, but little damage.",
+            shortHelp: "Ranged, DMG(Energy/Smash), Foe Knockback",
+            icon: "powerblast_powerbolts.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 1.808
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.452
+                        }
+                    ],
+                    scale: 2.2600000000000002
+                }
+            }
+        },
+        {
+            name: "Energy Torrent",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Energy Torrent unleashes a cone of powerful energy that can smash foes and possibly send them flying.",
+            shortHelp: "Ranged (Cone), DMG(Energy/Smash), Foe Knockback",
+            icon: "powerblast_energytorrent.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.7854,
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 1.07,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 1.1323
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.5122
+                        }
+                    ],
+                    scale: 1.6445
+                }
+            }
+        },
+        {
+            name: "Power Burst",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "A devastating attack, Power Burst unleashes a massive amount of energy dealing very high damage at short distances. The impact from this burst often knocks back most foes.",
+            shortHelp: "Ranged, DMG(Energy/Smash), Foe Knockback",
+            icon: "powerblast_powerburst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 10.0,
+                endurance: 10.4,
+                cast: 2.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 2.2859
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 2.034
+                        }
+                    ],
+                    scale: 4.3199
+                }
+            }
+        },
+        {
+            name: "Sniper Blast",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Ranged Damage", "Sniper Attacks", "Universal Damage Sets"],
+            description: "A focused blast that can travel great distances with high Accuracy. This is a sniper attack, and is best fired from a distance, as it can be interrupted. Sniper Blast may knock targets backwards. If you are engaged in battle this attack becomes instant-cast. If you are not engaged, it will do bonus damage.",
+            shortHelp: "Sniper, DMG(Energy/Smash), Foe Knockback",
+            icon: "powerblast_sniperblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 150.0,
+                recharge: 12.0,
+                endurance: 14.352,
+                cast: 1.33
+            }
+        },
+        {
+            name: "Aim",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases your chance to hit with attacks for a few seconds. Slightly increases damage.",
+            shortHelp: "Self +To Hit, +DMG",
+            icon: "powerblast_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.625,
+                damageBuff: 0.425,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Power Push",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "This ranged attack deals little damage, but sends the target flying for a great distance.",
+            shortHelp: "Ranged DMG(Energy/Smash), Foe High Knockback",
+            icon: "powerblast_powerpush.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.4,
+                range: 70.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.1,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 0.6722
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.4326
+                        }
+                    ],
+                    scale: 1.1048
+                }
+            }
+        },
+        {
+            name: "Explosive Blast",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You hurl a blast of charged energy that violently explodes on impact, damaging all foes near the target. Explosive Blast may knock targets backwards.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Smash/Energy), Foe Knockback",
+            icon: "powerblast_explosion.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 4.868399999999999
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.5
+                        }
+                    ],
+                    scale: 5.368399999999999
+                }
+            }
+        },
+        {
+            name: "Nova",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You can explode in a tremendous blast of energy, sending nearby foes flying. The Nova deals extreme Energy and Smashing damage to all nearby foes.",
+            shortHelp: "PBAoE, DMG(Energy), Foe Knockback",
+            icon: "powerblast_novablast.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.4,
+                recharge: 145.0,
+                endurance: 27.7316,
+                cast: 3.0,
+                damage: {
+                    type: "Energy",
+                    scale: 8.6209
+                }
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/energy-blast'] = CORRUPTOR_ENERGY_BLAST_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_ENERGY_BLAST_POWERSET = CORRUPTOR_ENERGY_BLAST_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/fire-blast.js ----
+;/**
+ * Fire Blast
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_FIRE_BLAST_POWERSET = {
+    name: "Fire Blast",
+    category: "Unknown",
+    description: "Fire Blast powerset",
+    icon: "fire-blast_set.png",
+    powers: [
+        {
+            name: "Fire Blast",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged Damage", "Universal Damage Sets"],
+            description: "Sends a Blast of Fire at a targeted foe and sets the target on fire for a short period of time. Slower recharge rate than Flares, but more damage.",
+            shortHelp: "Ranged, DMG(Fire)",
+            icon: "fireblast_fireblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.2,
+                damage: {
+                    type: "Fire",
+                    scale: 4.799799999999999
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.15,
+                    ticks: 3
+                },
+                buffDuration: 3.1
+            }
+        },
+        {
+            name: "Flares",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged Damage", "Universal Damage Sets"],
+            description: "A quick attack that throws Flares at the target. Little damage, but very fast.",
+            shortHelp: "Ranged, DMG(Fire)",
+            icon: "fireblast_flare.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 2.18,
+                endurance: 3.692,
+                cast: 1.0,
+                damage: {
+                    type: "Fire",
+                    scale: 3.7942
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.15,
+                    ticks: 3
+                },
+                buffDuration: 3.1
+            }
+        },
+        {
+            name: "Fire Ball",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Hurls an exploding Fireball that consumes a targeted foe, and all nearby enemies. Anyone in that explosion is burned and set ablaze.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Fire/Smash)",
+            icon: "fireblast_fireball.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 2.5519
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.31880000000000003
+                        }
+                    ],
+                    scale: 2.8707
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.15,
+                    ticks: 2
+                },
+                buffDuration: 2.1
+            }
+        },
+        {
+            name: "Rain of Fire",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Summons a Rain of Fire over a targeted location, burning foes and reducing their movement speed within a large area.",
+            shortHelp: "Ranged (Location AoE), DoT(Fire), -SPD",
+            icon: "fireblast_rainoffire.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                endurance: 26.0,
+                cast: 2.03,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Fire Breath",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You can breathe forth a torrent of fire that burns all foes within its narrow cone. Very accurate and very deadly at medium range.",
+            shortHelp: "Close (Cone), DoT(Fire)",
+            icon: "fireblast_arcoffire.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.2,
+                range: 40.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 2.67,
+                dotDamage: {
+                    type: "Fire",
+                    scale: 3.0284999999999997,
+                    ticks: 2
+                },
+                buffDuration: 2.1
+            }
+        },
+        {
+            name: "Aim",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases your chance to hit with attacks for a few seconds. Slightly increases damage.",
+            shortHelp: "Self +To Hit, +DMG",
+            icon: "fireblast_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.625,
+                damageBuff: 0.425,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Blaze",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged Damage", "Universal Damage Sets"],
+            description: "A devastating flame attack.",
+            shortHelp: "Ranged, DMG(Fire)",
+            icon: "fireblast_blaze.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 10.0,
+                endurance: 10.4,
+                cast: 1.0,
+                damage: {
+                    type: "Fire",
+                    scale: 7.239800000000001
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.225,
+                    ticks: 4
+                },
+                buffDuration: 4.1
+            }
+        },
+        {
+            name: "Blazing Bolt",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged Damage", "Sniper Attacks", "Universal Damage Sets"],
+            description: "A long range beam of fire that blasts your foes. Like most sniper attacks, this power has a bonus to Accuracy, but is best fired from a distance as it can be interrupted. If you are engaged in battle this attack becomes instant-cast. If you are not engaged, it will do bonus damage.",
+            shortHelp: "Sniper, DMG(Fire)",
+            icon: "fireblast_blazingbolt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 150.0,
+                recharge: 12.0,
+                endurance: 14.352,
+                cast: 1.67
+            }
+        },
+        {
+            name: "Inferno",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "Unleashes a massive fiery explosion to devastate all nearby enemies and set them ablaze. Inferno deals Extreme Fire damage to all nearby foes and inflicts Moderate Fire damage over time.",
+            shortHelp: "PBAoE, DMG(Fire/Smash), Foe DoT(Fire)",
+            icon: "fireblast_inferno.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.4,
+                recharge: 145.0,
+                endurance: 27.7316,
+                cast: 3.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 7.6209
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.0
+                        }
+                    ],
+                    scale: 8.620899999999999
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.3,
+                    ticks: 8
+                },
+                buffDuration: 8.1
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/fire-blast'] = CORRUPTOR_FIRE_BLAST_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_FIRE_BLAST_POWERSET = CORRUPTOR_FIRE_BLAST_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/force-field.js ----
+;/**
+ * Force Field
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_FORCE_FIELD_POWERSET = {
+    name: "Force Field",
+    category: "Unknown",
+    description: "Force Field powerset",
+    icon: "force-field_set.png",
+    powers: [
+        {
+            name: "Deflection Shield",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Dramatically protects an ally from Smashing, Lethal and all Melee attacks for a limited time. Also reduces Toxic damage. You cannot stack multiple Deflection Shields on the same target; however, the shield can be improved by another ally using the same power. Can also be used in conjunction with your Insulation Shield. You cannot use this power on yourself.",
+            shortHelp: "Ranged, Ally +DEF(Smash, Lethal, Melee), Res(Toxic)",
+            icon: "forcefield_deflectionshield.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 2.0,
+                endurance: 7.8,
+                cast: 2.07,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 4.0,
+                    ticks: 120
+                },
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Personal Force Field",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "The Personal Force Field is almost impenetrable to all attacks, even Psionics and Enemy Teleportation, although attacks from more powerful foes may get through more easily. Personal Force Field will also reduce the damage of almost any attacks that do get through. The Personal Force Field works both ways; while it is active, you can only use powers that affect yourself. Cannot be used with Rest.",
+            shortHelp: "Toggle: Self +Def, Res(All except Toxic)",
+            icon: "forcefield_personalforcefield.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 15.0,
+                endurance: 0.13,
+                cast: 2.03,
+                resistance: {
+                    smashing: 0.3,
+                    lethal: 0.3,
+                    fire: 0.3,
+                    cold: 0.3,
+                    energy: 0.3,
+                    negative: 0.3,
+                    psionic: 0.3,
+                    toxic: 0.3
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Repulsion Bolt",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "Discharges a bolt of force that knocks down foes and deals some Smashing Damage. Foes struck will have their armor shattered by the force of the impact, leaving them with lowered damage resistance.",
+            shortHelp: "Ranged, DMG(Smash), Foe Knockback",
+            icon: "forcefield_forcebolt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.4,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 10.192,
+                cast: 1.1,
+                damage: {
+                    type: "Smashing",
+                    scale: 0.4
+                },
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Insulation Shield",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Dramatically protects an ally from Fire, Cold, Energy, Negative Energy, Ranged and AoE attacks for a limited time. The Insulation also protects the target from Endurance Draining effects. You cannot stack multiple Insulation Shields on the same target; however, the shield can be improved by another ally using the same power. Can also be used in conjunction with your Deflection Shield. In PvP, this power also grants a small amount of Mez Protection to its primary target. You cannot use this power on yourself.",
+            shortHelp: "Ranged, Ally +DEF(Fire, Cold, Energy, Negative, Ranged, AoE), Res (End Drain)",
+            icon: "forcefield_insulationshield.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 2.0,
+                endurance: 7.8,
+                cast: 2.07,
+                buffDuration: 240.0,
+                stun: 1.0,
+                stunDuration: 90.0
+            }
+        },
+        {
+            name: "Detention Field",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: [],
+            description: "Encases a targeted foe in a Detention Force Field. The captured target cannot be harmed, is Immobilized, and cannot attack or aid their allies. The target can, however, use powers on themselves.",
+            shortHelp: "Ranged, Foe Capture (Special)",
+            icon: "forcefield_refractionshield.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.4,
+                range: 80.0,
+                recharge: 60.0,
+                endurance: 10.4,
+                cast: 2.07,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Dispersion Bubble",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Creates a large bubble which protects all allies inside. While active, the Dispersion Bubble gives all allies within increased Defense against all attack types. The Dispersion Bubble also protects allies from Immobilization, Disorient, and Hold effects.<br><br>Allies will retain bonuses from the bubble for some after leaving the bubble's area.",
+            shortHelp: "Toggle: PBAoE, Team +Res(Hold, Immobilize, Disorient) +DEF(All)",
+            icon: "forcefield_dispersionbubble.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 15.0,
+                endurance: 1.04,
+                cast: 1.07,
+                buffDuration: 15.0,
+                stun: 1.0,
+                stunDuration: 15.0
+            }
+        },
+        {
+            name: "Repulsion Field",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Knockback"],
+            description: "This Toggle power creates a field that keeps all foes at bay, protecting all allies inside from melee or short ranged attacks. More powerful foes may be able to penetrate the Repulsion Field, but may slip and get knocked down and forced back if they try.<br><br>Enemies that get too close will be violently knocked away. In PvP, Each villain that is knocked away costs you additional Endurance.<br><br><color #fcfc95>Note: Slotting Knockback to Knockdown enhancement in this power will disable Repel.</color>",
+            shortHelp: "Toggle: PBAoE Knockback",
+            icon: "forcefield_repulsionfield.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 0.1625,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Force Bomb",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Ranged AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "A powerful Force Bomb is hurled at your foes dealing a moderate amount of damage and knocking them off of their feet. Foes struck by Repulsion Bomb have a chance to become disoriented, and the force of the blow will leave their armor shattered, lowering their damage resistance.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Smash), Foe Knockdown, Disorient",
+            icon: "forcefield_repulsionbomb.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 30.0,
+                endurance: 16.9,
+                cast: 1.67,
+                damage: {
+                    type: "Smashing",
+                    scale: 0.6
+                },
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Damping Bubble",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Creates a large bubble at your location which protects all allies inside. While active, this power will grant resistance to Accuracy, Defense, Regeneration, Perception, and Slow debuffs on yourself and allies. Foes within this bubble will have the strength of their Accuracy, Defense, Regeneration, Perception, and Speed debuff powers weakened directly.",
+            shortHelp: "Location (PBAoE), Team +Res(Accuracy, Defense, Perception, Recharge, Regen, Speed, ToHit), Foe -Str(Defense, Perception, Regen, Speed, ToHit)",
+            icon: "forcefield_dampeningbubble.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.07,
+                buffDuration: 45.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/force-field'] = CORRUPTOR_FORCE_FIELD_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_FORCE_FIELD_POWERSET = CORRUPTOR_FORCE_FIELD_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/ice-blast.js ----
+;/**
+ * Ice Blast
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_ICE_BLAST_POWERSET = {
+    name: "Ice Blast",
+    category: "Unknown",
+    description: "Ice Blast powerset",
+    icon: "ice-blast_set.png",
+    powers: [
+        {
+            name: "Ice Blast",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Ice Blast hurls shards of ice at foes and Slows their attacks and movement for a time. Slower recharge than Ice Bolt, but more damage.",
+            shortHelp: "Ranged, DMG(Cold), Foe -Recharge, -SPD",
+            icon: "iceblast_iceblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    type: "Cold",
+                    scale: 3.529
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Ice Bolt",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Ice Bolt quickly pelts an enemy with small icy daggers; their chill Slows a foe's attacks and movement for a time. Fast, but little damage.",
+            shortHelp: "Ranged, DMG(Cold), Foe -Recharge, -SPD",
+            icon: "iceblast_bolt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    type: "Cold",
+                    scale: 2.26
+                },
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Frost Breath",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Unleashes a cone of frosty breath that can Slow your opponents' movement and attacks. Very accurate and very deadly at medium range.",
+            shortHelp: "Close (Cone), DoT(Cold), Foe -Recharge, -SPD",
+            icon: "iceblast_frostbreath.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.2,
+                range: 40.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 2.67,
+                dotDamage: {
+                    type: "Cold",
+                    scale: 2.8278,
+                    ticks: 1
+                },
+                buffDuration: 0.6
+            }
+        },
+        {
+            name: "Aim",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases your chance to hit with attacks for a few seconds. Slightly increases damage.",
+            shortHelp: "Self +To Hit, +DMG",
+            icon: "iceblast_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.625,
+                damageBuff: 0.425,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Freeze Ray",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Holds", "Ranged Damage", "Universal Damage Sets"],
+            description: "Freeze Ray encases your foe in a block of ice, holding him helpless in place for a while. While frozen, your foe will take Cold damage over time.",
+            shortHelp: "Ranged, DMG(Cold), Foe Hold",
+            icon: "iceblast_freezeray.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.0,
+                dotDamage: {
+                    type: "Cold",
+                    scale: 0.3531,
+                    ticks: 10
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Ice Storm",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Shred your foes with this Ice Storm. This power deals a lot of damage in a large area and can Slow all affected targets' movement and attack speed.",
+            shortHelp: "Ranged (Location AoE), DoT(Cold, Lethal), Foe -Recharge, -SPD",
+            icon: "iceblast_freezingrain.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                endurance: 15.6,
+                cast: 2.03,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Bitter Ice Blast",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Corruptor Archetype Sets", "Ranged Damage", "Slow Movement", "To Hit Debuff", "Universal Damage Sets"],
+            description: "A slower yet more powerful version of Ice Blast, Bitter Ice Blast deals much more damage and can also reduce your enemy's chance to hit. Like other Ice Blast powers, Bitter Ice Blast can Slow a target's movement and attack speed.",
+            shortHelp: "Ranged, DMG(Cold), Foe -Recharge, -SPD, -To Hit",
+            icon: "iceblast_bitterfrostblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 1.07,
+                damage: {
+                    type: "Cold",
+                    scale: 3.909
+                },
+                tohitDebuff: 1.0,
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Bitter Freeze Ray",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Holds", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "This power can Hold your opponent frozen solid in a block of ice. The victim can be attacked and will remain frozen and helpless. After the ice thaws, the victim emerges chilled and Slowed. Bitter Freeze Ray deals medium damage.",
+            shortHelp: "Ranged, DMG(Cold), Foe Hold",
+            icon: "iceblast_bitterfreezeray.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 2.5,
+                damage: {
+                    type: "Cold",
+                    scale: 5.5099
+                },
+                buffDuration: 18.0
+            }
+        },
+        {
+            name: "Blizzard",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Corruptor Archetype Sets", "Ranged AoE Damage", "Slow Movement", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You can conjure a Blizzard that inflicts Extreme Cold and Lethal damage over time and can Slow the attack rate of all your opponents in a large area, reducing their chance to hit and possibly knocking them back.",
+            shortHelp: "Ranged (Location AoE), DoT(Cold), Foe -To Hit, -SPD, -Recharge, Knockback",
+            icon: "iceblast_blizzard.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 2.0,
+                range: 60.0,
+                recharge: 170.0,
+                endurance: 27.7316,
+                cast: 2.03,
+                buffDuration: 15.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/ice-blast'] = CORRUPTOR_ICE_BLAST_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_ICE_BLAST_POWERSET = CORRUPTOR_ICE_BLAST_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/kinetics.js ----
+;/**
+ * Kinetics
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_KINETICS_POWERSET = {
+    name: "Kinetics",
+    category: "Unknown",
+    description: "Kinetics powerset",
+    icon: "kinetics_set.png",
+    powers: [
+        {
+            name: "Siphon Power",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: [],
+            description: "You can Siphon the Power from a targeted foe, reducing his damage potential. The power is transferred back to you, increasing your own damage potential and that of all nearby allies.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Foe -DMG, Team +DMG",
+            icon: "kineticboost_siphonpower.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 20.0,
+                endurance: 10.4,
+                cast: 1.93,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Transfusion",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Endurance Modification", "Healing"],
+            description: "Transfusion drains an enemy of some Endurance and reduces the target's Regeneration rate, and transfers that energy, in the form of Hit Points, to all allies near the affected foe. You can use Transfusion to heal yourself as well as your allies.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged, Foe -End, -Regen, Team Heal",
+            icon: "kineticboost_transfusion.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 60.0,
+                recharge: 8.0,
+                endurance: 7.8,
+                cast: 1.17,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Repel",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Knockback"],
+            description: "Repel creates a zone of kinetic energy that violently repels nearby foes. Each foe that is repelled costs additional Endurance.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Toggle: Self AoE Knockback",
+            icon: "kineticboost_repel.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 0.325,
+                cast: 1.07,
+                buffDuration: 0.5
+            }
+        },
+        {
+            name: "Siphon Speed",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "You can Siphon the speed from a targeted foe, Slowing his movement and attack rate while boosting your own.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Foe -Speed, -Rech, Self +Speed, +Rech",
+            icon: "kineticboost_siphonspeed.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 60.0,
+                endurance: 7.8,
+                cast: 1.93,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Increase Density",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "Increases an ally's mass, freeing him from any Disorient, Immobilization, or Hold effects and leaving him resistant to such effects for a while. Increase Density also protects the target from Knockback, Repel and enemy Teleportation, as well as Smashing and Energy damage. Because the target grows more dense, their movement speed is Slowed. Although the Damage Resistance and slowing effect will not stack with multiple applications, the rest of the effects of Increase Density will. You cannot use this power on yourself.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Ranged, Ally Special",
+            icon: "kineticboost_increasedensity.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 3.0,
+                endurance: 5.2,
+                cast: 2.07,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.5,
+                            ticks: 30
+                        },
+                        {
+                            type: "Energy",
+                            scale: 2.5,
+                            ticks: 30
+                        }
+                    ]
+                },
+                buffDuration: 60.0,
+                stun: 1.0,
+                stunDuration: 60.0
+            }
+        },
+        {
+            name: "Speed Boost",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Running", "Running & Sprints", "Universal Travel"],
+            description: "You can hasten a targeted ally and its nearby allies. The allies' movement speed, attack rate, and Endurance recovery are all greatly increased and they gain resistance to Slow effects. You cannot use this power on yourself.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Ranged, Allies +SPD, +Recharge, +Recovery, Res Slow",
+            icon: "kineticboost_speedboost.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 2.0,
+                endurance: 7.8,
+                cast: 1.0,
+                buffDuration: 120.0
+            }
+        },
+        {
+            name: "Inertial Reduction",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Leaping", "Leaping & Sprints", "Universal Travel"],
+            description: "You can reduce your Inertia, along with that of all nearby allies. The affected allies can then jump incredible distances for a while.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE, Allies +Jump",
+            icon: "kineticboost_initialreductions.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 60.0,
+                endurance: 23.4,
+                cast: 2.03,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Transference",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "Transference drains an enemy of some of their Endurance and transfers that Endurance to all allies near the affected foe. You can use Transference to recover Endurance for yourself as well as your allies.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Targeted AoE), Target -End, Team +Recovery, Special",
+            icon: "kineticboost_transferance.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.1,
+                range: 60.0,
+                recharge: 30.0,
+                endurance: 2.6,
+                cast: 2.27
+            }
+        },
+        {
+            name: "Fulcrum Shift",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: [],
+            description: "Fulcrum Shift drains the power of a targeted foe and all foes nearby, transferring it to all adjacent allies, you, and those near you. Affected foes will deal less damage, while your affected allies will deal more. The more foes that are affected, the more power you and your allies receive. Fulcrum Shift can dramatically turn the tide of a battle.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Foe AoE), Foe -DMG, Team +DMG",
+            icon: "kineticboost_kinetictransfer.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 60.0,
+                endurance: 15.6,
+                cast: 2.17
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/kinetics'] = CORRUPTOR_KINETICS_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_KINETICS_POWERSET = CORRUPTOR_KINETICS_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/marine-affinity.js ----
+;/**
+ * Marine Affinity
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_MARINE_AFFINITY_POWERSET = {
+    name: "Marine Affinity",
+    category: "Unknown",
+    description: "Marine Affinity powerset",
+    icon: "marine-affinity_set.png",
+    powers: [
+        {
+            name: "Shoal Rush",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Slow Movement"],
+            description: "By sensing the water in an area, you can direct a shoal of marine life to harass your foes. This lowers the defense and movement speed of all enemies struck.<br><br>If you direct a Shoal Rush on targets inside a <color #fcfc95>Tide Pool</color>, the marine life present will be thrown into a brief frenzy! While frenzied, the Tide Pool has a chance to knock over enemies and the damage buff and debuff is stronger.",
+            shortHelp: "Ranged (Targeted AoE), Foe -DEF, -SPD, Special",
+            icon: "marineaffinity_shoalrush.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 10.4,
+                cast: 2.17,
+                defenseDebuff: 1.6,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Soothing Wave",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Send forth a calming wave of water, washing over friend and foe alike. Allies will be healed by this power, while enemies will have their offensive power watered down.",
+            shortHelp: "Ranged (Facing Cone), Foe -DMG, Team Heal",
+            icon: "marineaffinity_soothingwave.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "Cone",
+            maxTargets: 255,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.0,
+                range: 45.0,
+                recharge: 10.0,
+                endurance: 13.52,
+                cast: 2.0
+            }
+        },
+        {
+            name: "Toroidal Bubble",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Leaping", "Leaping & Sprints", "Resist Damage", "Universal Travel"],
+            description: "You create a ring of Bubbles that surrounds your allies, hydrating them to replenish endurance and reducing the effects of endurance drain. The bubble also reduces all incoming damage, providing extra resistance to Smashing and Fire damage, and also increases jump height thanks to added buoyancy.",
+            shortHelp: "PBAoE, Team +Res(All DMG, End Drain), +End, +Recovery, +Jump",
+            icon: "marineaffinity_toroidalbubble.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 60.0,
+                endurance: 8.0,
+                cast: 1.77,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.5,
+                            ticks: 30
+                        },
+                        {
+                            type: "Fire",
+                            scale: 2.5,
+                            ticks: 30
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 1.25,
+                            ticks: 30
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.25,
+                            ticks: 30
+                        },
+                        {
+                            type: "Energy",
+                            scale: 1.25,
+                            ticks: 30
+                        },
+                        {
+                            type: "Negative",
+                            scale: 1.25,
+                            ticks: 30
+                        },
+                        {
+                            type: "Psionic",
+                            scale: 1.25,
+                            ticks: 30
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 1.25,
+                            ticks: 30
+                        }
+                    ]
+                },
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Whitecap",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You summon a burst of water underfoot that hurls from your present location to a location of your choosing. When you splash down, any enemies in the surrounding area will be swept off their feet, and will experience a damage resistance debuff for a period of time. Enemies close to where you splash down will receive harsher debuffs for a brief time.<br><br>If you direct a Whitecap on targets inside a <color #fcfc95>Tide Pool</color>, the marine life present will be thrown into a brief frenzy! While frenzied, the Tide Pool has a chance to knock over enemies and the damage buff and debuff is stronger.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Cold), Foe Knockdown, -Resist(All), Self Teleport, Special",
+            icon: "marineaffinity_whitecap.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 30.0,
+                endurance: 18.0,
+                cast: 2.0
+            }
+        },
+        {
+            name: "Tide Pool",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "You summon a large pool of water at a targeted location to swell the damage that your allies deal, while reducing the damage, movement speeds, and stealth of enemies within the Tide Pool. <br><br>If an enemy is <color #fcfc95>defeated</color> in the pool, the marine life present will be thrown into a brief frenzy! While frenzied, the Tide Pool has a chance to knock over enemies and the damage buff and debuff is stronger.",
+            shortHelp: "Ranged (Location AoE), Team +DMG, Foe -DMG, -SPD, -Jump, -Stealth, Special",
+            icon: "marineaffinity_tidepool.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 10.0,
+                endurance: 13.0,
+                cast: 2.33,
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Brine",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing"],
+            description: "You coat an enemy in an extremely salinated layer of deep-sea brine that reduces your foe's resistance to damage and maximum hitpoints.<br><br>If <color #fcfc95>Shifting Tides</color> is active, Brine will consume up to <color #fcfc95>3</color> stacks upon use to reduce its base recharge by 15 seconds per stack.",
+            shortHelp: "Ranged, Foe -Resist(All), -MaxHP",
+            icon: "marineaffinity_brine.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 60.0,
+                endurance: 7.0,
+                cast: 2.07,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Shifting Tides",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged AoE Damage", "To Hit Buff", "Universal Damage Sets"],
+            description: "Select either a friend or foe to create a field of shifting tides around them.<br><br>When attacked, foes within the shifting tides will provide you and your allies a stacking Rising Tide buff that increases ToHit, Damage, and Recharge. Enemies may also take bonus damage, with the odds increasing per stack.",
+            shortHelp: "Toggle: Ranged (Targeted AoE), Team +DMG, +ToHit, +Recharge, Special Damage",
+            icon: "marineaffinity_shiftingtides.png",
+            powerType: "Toggle",
+            targetType: "Any",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 0.078,
+                cast: 1.17,
+                damage: {
+                    type: "Cold",
+                    scale: 0.5
+                },
+                buffDuration: 2.0
+            }
+        },
+        {
+            name: "Barrier Reef",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Healing"],
+            description: "Create a Barrier Reef teeming with life at your target location. The Barrier Reef will emit an aura that washes over allies in range, providing them with a defensive cover of water that will absorb and deflect some damage.",
+            shortHelp: "Summon Barrier Reef: Team +Absorb, +DEF(All)",
+            icon: "marineaffinity_wellspring.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 30.0,
+                endurance: 13.52,
+                cast: 2.37,
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Power of the Depths",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "Becoming a conduit of the ocean itself, you acclimate your allies to the incredible forces of the deep! This boosts the maximum hit points, maximum endurance, regeneration, and attack range of all nearby allies. Some of these effects will decay over time to a lower value.<br><br>If Power of the Depths is activated inside a <color #fcfc95>Tide Pool</color>, the marine life present will be thrown into a brief frenzy! While frenzied, the Tide Pool has a chance to knock over enemies and the damage buff and debuff is stronger.",
+            shortHelp: "PBAoE, Team +MaxHP, +MaxEnd, +Regen, +Range",
+            icon: "marineaffinity_powerofthedepths.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 240.0,
+                endurance: 26.0,
+                cast: 3.0,
+                buffDuration: 60.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/marine-affinity'] = CORRUPTOR_MARINE_AFFINITY_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_MARINE_AFFINITY_POWERSET = CORRUPTOR_MARINE_AFFINITY_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/nature-affinity.js ----
+;/**
+ * Nature Affinity
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_NATURE_AFFINITY_POWERSET = {
+    name: "Nature Affinity",
+    category: "Unknown",
+    description: "Nature Affinity powerset",
+    icon: "nature-affinity_set.png",
+    powers: [
+        {
+            name: "Corrosive Enzymes",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: [],
+            description: "You spray a target with toxic, corrosive Enzymes reducing the damage they deal as well as their damage resistance.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Foe -Res(All), -DMG(All)",
+            icon: "natureaffinity_corrosivesap.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 16.0,
+                endurance: 8.528,
+                cast: 1.0,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Regrowth",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "By channeling the energies present in nature you are able to immediately heal yourself and allies in front of you for a small amount of health and cause them to recover a small amount of health over time. Regrowth places a stack of Bloom on its target.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged Facing Cone, Minor Ally Heal, Ally Moderate Healing Over Time, +1 Bloom",
+            icon: "natureaffinity_regrowth.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "Cone",
+            maxTargets: 255,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.0,
+                range: 45.0,
+                recharge: 10.0,
+                endurance: 13.52,
+                cast: 2.0,
+                buffDuration: 4.1
+            }
+        },
+        {
+            name: "Wild Growth",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing", "Resist Damage"],
+            description: "You channel the power of nature into your allies allowing them to more easily shrug off damage and causing their wounds to heal more quickly. Wild Growth increases the damage resistance and boosts the regeneration rate of all affected allies. This power also grants 2 stacks of Bloom.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE, Team +Res(All), +Regen, +2 Bloom",
+            icon: "natureaffinity_wildgrowth.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 225.0,
+                endurance: 15.6,
+                cast: 2.17,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Spore Cloud",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["To Hit Debuff"],
+            description: "You create a large cloud of toxic spores around your targeted foe. The target and all nearby foes will have their damage output, chance to hit and regeneration rate reduced.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle (Targeted AoE), Foe -Dmg(All), -To Hit, -Regen",
+            icon: "natureaffinity_sporecloud.png",
+            powerType: "Toggle",
+            targetType: "Foe",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 8.0,
+                endurance: 0.26,
+                cast: 3.1,
+                tohitDebuff: 1.5,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Lifegiving Spores",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "When activating this power you cause all allies at a selected location to recover a small amount of health and endurance every few seconds as long as they remain within the Lifegiving Spores.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle (Location AoE), PBAoE +Minor Heal Over Time, +Endurance",
+            icon: "natureaffinity_lifegivingspores.png",
+            powerType: "Toggle",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 4.0,
+                endurance: 0.26,
+                cast: 2.33
+            }
+        },
+        {
+            name: "Wild Bastion",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You encase yourself and nearby allies in a protective barrier that will absorb a moderate amount of damage. Additionally, affected allies will heal for a portion of their health over time. Wild Bastion places 3 stacks of Bloom on all affected targets.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE, Team +Absorb, +Heal Over Time, +3 Bloom",
+            icon: "natureaffinity_wildbastion.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 240.0,
+                endurance: 13.0,
+                cast: 2.27,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Rebirth",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "Rebirth can either greatly heal a conscious ally for a large amount of health over time or it can revive a fallen ally with a large amount of health and endurance and cause them to recover health over time. This power also grants 3 stacks of Bloom.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged, Ally Rez, +Heal Over Time, Special, +3 Bloom",
+            icon: "natureaffinity_rebirth.png",
+            powerType: "Click",
+            targetType: "Leaguemate",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 45.0,
+                recharge: 180.0,
+                endurance: 26.0,
+                cast: 3.0
+            }
+        },
+        {
+            name: "Entangling Aura",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Holds"],
+            description: "While this power is active there is a high chance that entangling vines will grasp nearby foes and render them held for a short time.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Toggle, Foe Hold",
+            icon: "natureaffinity_ragingtempest.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 1.3,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Overgrowth",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Becoming a conduit of nature itself, you greatly boost the damage, to hit and endurance discount of nearby allies for a long period of time. Overgrowth also grants the affected targets 5 stacks of Bloom.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "PBAoE, Team +Damage, +To Hit, +Endurance Discount, +5 Bloom",
+            icon: "natureaffinity_overgrowth.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 255.0,
+                endurance: 26.0,
+                cast: 3.0,
+                tohitBuff: 1.0,
+                buffDuration: 60.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/nature-affinity'] = CORRUPTOR_NATURE_AFFINITY_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_NATURE_AFFINITY_POWERSET = CORRUPTOR_NATURE_AFFINITY_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/pain-domination.js ----
+;/**
+ * Pain Domination
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_PAIN_DOMINATION_POWERSET = {
+    name: "Pain Domination",
+    category: "Unknown",
+    description: "Pain Domination powerset",
+    icon: "pain-domination_set.png",
+    powers: [
+        {
+            name: "Nullify Pain",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Nullify Pain will heal nearby allies for some hit points by numbing the pain caused by their wounds. Nullify Pain is not as potent as Soothe, but can heal multiple targets at once.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "PBAoE, Team +Heal",
+            icon: "paindomination_nullifypain.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 8.0,
+                endurance: 13.0,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Soothe",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You heal an ally by numbing their pain and calming their mind. You cannot use this power on yourself.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ally Heal",
+            icon: "paindomination_soothe.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 13.0,
+                cast: 2.27
+            }
+        },
+        {
+            name: "Share Pain",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Share Pain draws away some of an ally's anguish caused by their wounds, but damages the user. The pain caused by this power causes the user to go into a frenzy, briefly increasing their damage output, however the user cannot be healed and will have their regeneration rate greatly diminished for a short time.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ally Strong Heal, Self Moderate DMG(Special), +DMG",
+            icon: "paindomination_sharepain.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 0.52,
+                cast: 2.27,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Conduit of Pain",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "You revive a fallen ally by becoming a Conduit of Pain and transferring the pain that was inflicted upon them back upon your enemies. This will briefly empower you increasing your damage output, recovery rate, attack rate and chance to hit. After a minute the effect will wear off leaving you weakened for 30 seconds. Your damage, attack rate and chance to hit will all be reduced during this period.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ally Rez, Self +DMG, +Recharge, +Recovery, +To Hit, +Special",
+            icon: "paindomination_conduitofpain.png",
+            powerType: "Click",
+            targetType: "Player Ally (Dead)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 15.0,
+                recharge: 180.0,
+                endurance: 26.0,
+                cast: 3.2,
+                buffDuration: 0.5,
+                tohitBuff: 2.0,
+                tohitDebuff: 2.0
+            }
+        },
+        {
+            name: "Enforced Morale",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: [],
+            description: "Enforced Morale frees an ally from any Disorient, Hold, Sleep, Fear, Confuse and Immobilize effects and leaves them resistant to such effects for a good while. Also, Enforced Morale grants the target clearer Perception to see hidden foes, and a minor recharge and movement speed boost. The Protection and Movement boosts will improve with multiple applications and as you advance in level, although the Recharge and Movement boosts will only apply for the first few applications. If the ally is not damaged, Enforced Morale will cause them some pain before granting its benefits.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ally +Res(Disorient, Hold, Sleep, Immobilize, Fear, Confuse), +Perception, +Recharge, +Speed, Light DMG",
+            icon: "paindomination_enforcedmorale.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                stun: 1.0,
+                stunDuration: 90.0,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Soothing Aura",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "While this power is active all nearby allies will be healed by Soothing Aura every couple of seconds for a small portion of their health.<br><br><color #fcfc95>Notes: While on PvP maps this power will grant affected targets a regeneration effect instead of a periodic heal.).</color><br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: PBAoE, Team Minor Periodic Heal",
+            icon: "paindomination_soothingaura.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.78,
+                cast: 1.67
+            }
+        },
+        {
+            name: "World of Pain",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge"],
+            allowedSetCategories: ["Resist Damage", "To Hit Buff"],
+            description: "When this power is activated the user and all nearby team members will gain a moderate damage, resistance, and To Hit bonus. Additionally those affected by this power will also be protected from Placate effects.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE Team +To Hit, +DMG, +RES(All DMG, Placate)",
+            icon: "paindomination_worldofpain.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 240.0,
+                endurance: 10.192,
+                cast: 2.03,
+                tohitBuff: 1.0,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Anguishing Cry",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff"],
+            description: "You let out an Anguishing Cry causing a great deal of pain in your foes reducing their resistance and defense to damage for a short time.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE, Foe -RES(All), -DEF(All)",
+            icon: "paindomination_anguishingcry.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 120.0,
+                endurance: 13.0,
+                cast: 1.97,
+                defenseDebuff: 3.0,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Painbringer",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "You transform an ally to pain incarnate turning them into an inexhaustible killing machine. While the character is imbued with this power they will benefit from incredible health regeneration, endurance recovery and improved damage potential for a short time.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Ally, +Regeneration, +Recovery, +DMG",
+            icon: "paindomination_painbringer.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 300.0,
+                endurance: 10.4,
+                cast: 2.27,
+                buffDuration: 90.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/pain-domination'] = CORRUPTOR_PAIN_DOMINATION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_PAIN_DOMINATION_POWERSET = CORRUPTOR_PAIN_DOMINATION_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/poison.js ----
+;/**
+ * Poison
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_POISON_POWERSET = {
+    name: "Poison",
+    category: "Unknown",
+    description: "Poison powerset",
+    icon: "poison_set.png",
+    powers: [
+        {
+            name: "Alkaloid",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "When used correctly, poisons can be used to heal, as well as harm. Alkaloid consists of just the right amount of amino acids to safely heal a single targeted ally. The healed target is also left with some resistance to Toxic Damage (This Toxic Damage Resistance cannot be Enhanced). You cannot use this power to heal yourself.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ally Heal, +Res(Toxic)",
+            icon: "poison_alkaloid.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 13.0,
+                cast: 1.53,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 2.0,
+                    ticks: 30
+                },
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Envenom",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff"],
+            description: "You Envenom your foe with a nasty poison, the poison then spreads to nearby foes. The toxin directly attacks the immune system, reducing the affected target's Defense, Damage Resistance and Hit Point Regeneration Rate. The poison is so potent, that the target actually responds less to Healing while affected by the poison. Secondary foes struck by this power will have a lesser effect placed on them while the primary target receives the full effectiveness of the power.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Targeted AoE), Foe -RES, -DEF, -Regen, -Heal",
+            icon: "poison_envenomaoe.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 12.0,
+                endurance: 10.4,
+                cast: 1.33,
+                defenseDebuff: 1.5,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Weaken",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "To Hit Debuff"],
+            description: "You poison a single foe with a venom that significantly Weakens their strength and and that of nearby foes. The affected primary target's chance to hit and Damage output is severely reduced Additionally, the affected targets secondary power effects are all weakened. The targets power effects like Heals, Defense Buffs, Endurance Drains, Disorients, Holds, Immobilizes, Knockbacks and more, are all weakened. Secondary foes struck by this power will have a lesser effect placed on them while the primary target receives the full effectiveness of the power.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Targeted AoE) Foe -DMG -To Hit, -Special",
+            icon: "poison_weakenaoe.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 16.0,
+                endurance: 10.4,
+                cast: 2.07,
+                buffDuration: 30.0,
+                tohitDebuff: 0.75
+            }
+        },
+        {
+            name: "Neurotoxic Breath",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "You can breath a cone of Neurotoxin gas that quickly start to anesthetize any nearby foes. Affected targets may choke on the gas as their movement and attack rate are severely reduced.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Cone), Foe -SPD, -Recharge",
+            icon: "poison_neurotoxicbreath.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 30.0,
+                endurance: 10.4,
+                cast: 2.67,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Elixir of Life",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Resist Damage"],
+            description: "With this Elixir, you can revive a fallen ally and turn him into a killing machine. The revived target has increased damage, chance to hit, Endurance recovery, and attack speed, and gains a resistance to Toxic damage. A brew of this sort is not without its side effects. The revived target will soon become very sick and severely weak after about 90 seconds. All effects of the Elixir will eventually wear off. Elixir of Life can only be used on Players.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Close, Ally Rez, Special",
+            icon: "poison_elixiroflife.png",
+            powerType: "Click",
+            targetType: "Player Ally (Dead)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 15.0,
+                recharge: 180.0,
+                endurance: 26.0,
+                cast: 1.83,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 2.0,
+                    ticks: 45
+                },
+                buffDuration: 0.5,
+                tohitBuff: 3.0,
+                tohitDebuff: 3.0
+            }
+        },
+        {
+            name: "Antidote",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "This Antidote can free an ally from any Disorient, Hold, Sleep, Slow, Confuse, Fear and Immobilize effects and leaves them resistant to such effects for a good while. The Antidote also grants the target some resistance to Cold and Toxic damage. Some of the effects of this power will improve with Multiple applications and as you advance in level.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ally +Res(Disorient, Hold, Sleep, Immobilize, Confuse, Fear, Slow, Cold, Toxic)",
+            icon: "poison_antidote.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.53,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Toxic",
+                            scale: 2.0,
+                            ticks: 45
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.0,
+                            ticks: 45
+                        }
+                    ]
+                },
+                stun: 1.0,
+                stunDuration: 90.0,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Paralytic Poison",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Holds"],
+            description: "This Paralytic Poison viciously attacks a foe's nervous system and can leave an affected target completely Held and defenseless.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged Hold",
+            icon: "poison_paralytic.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 16.0,
+                endurance: 7.8,
+                cast: 2.0
+            }
+        },
+        {
+            name: "Poison Trap",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Endurance Modification", "Holds", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You can build a Poison Trap on the ground. Any foes that pass near the Poison Trap will cause it to detonate and release its toxic vapors. The poison is a highly toxic nerve gas, and any foes in the affected area may be drained of much of their Endurance and quickly Held or begin choking while suffering a minor amount of Toxic damage over time. The trap is almost impossible to detect, but it is fragile and may be set off by an enemy's explosion. Even if destroyed, the Trap will detonate.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Place Trap: PBAoE Foe Hold, -END, -Recovery, Chance to Hold, Minor DoT(Toxic)",
+            icon: "poison_poison_trap.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 60.0,
+                endurance: 10.4,
+                cast: 1.0,
+                buffDuration: 260.0
+            }
+        },
+        {
+            name: "Venomous Gas",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Defense Debuff", "To Hit Debuff"],
+            description: "You surround yourself in a cloud of toxic vapors that significantly weaken any enemies that get near you. Affected foes have their defense, damage resistance, damage and chance to hit reduced moderately.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: PBAoE, Foe -Res(All), -DMG(All), -Def(All), -To(Hit)",
+            icon: "poison_venomousgas.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 8.0,
+                endurance: 0.26,
+                cast: 2.03,
+                buffDuration: 0.75,
+                defenseDebuff: 1.0,
+                tohitDebuff: 1.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/poison'] = CORRUPTOR_POISON_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_POISON_POWERSET = CORRUPTOR_POISON_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/psychic-blast.js ----
+;/**
+ * Psychic Blast
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_PSYCHIC_BLAST_POWERSET = {
+    name: "Psychic Blast",
+    category: "Unknown",
+    description: "Psychic Blast powerset",
+    icon: "psychic-blast_set.png",
+    powers: [
+        {
+            name: "Mental Blast",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged Damage", "Universal Damage Sets"],
+            description: "This basic attack does moderate Psionic damage, and can slightly reduce a target's attack speed.",
+            shortHelp: "Ranged, DMG(Psionic), Target -Recharge",
+            icon: "psychicblast_mentalblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 100.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.67,
+                damage: {
+                    type: "Psionic",
+                    scale: 6.2578
+                },
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Subdue",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Immobilize", "Ranged Damage", "Universal Damage Sets"],
+            description: "Subdue deals moderate Psionic damage and may leave the targeted foe Immobilized for a brief time. Immobilized foes cannot move but can still attack.",
+            shortHelp: "Ranged, DMG(Psionic), Foe Immobilize",
+            icon: "psychicblast_subdue.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 100.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    type: "Psionic",
+                    scale: 4.5198
+                }
+            }
+        },
+        {
+            name: "Telekinetic Blast",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "You can use Telekinesis to Blast a targeted foe with the power of your mind. This attack deals Smashing and Psionic damage, and can knock your opponent back.",
+            shortHelp: "Ranged, DMG(Smash/Psionic), Foe Knockback",
+            icon: "psychicblast_telekineticblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 100.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Psionic",
+                            scale: 2.42
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.64
+                        }
+                    ],
+                    scale: 3.06
+                }
+            }
+        },
+        {
+            name: "Psychic Scream",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "This howl of Psionic energy resonates in the minds of all foes within its conical area of effect, inflicting moderate damage.",
+            shortHelp: "Ranged (Cone), DMG(Psionic), Foe -Recharge",
+            icon: "psychicblast_psychicscream.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 1.87,
+                damage: {
+                    type: "Psionic",
+                    scale: 3.6776
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Will Domination",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged Damage", "Sleep", "Universal Damage Sets"],
+            description: "This powerful attack deals Psionic damage, and is so painful it usually renders its target unconscious. The victim is asleep, and will wake if disturbed.",
+            shortHelp: "Ranged, DMG(Psionic), Foe Sleep",
+            icon: "psychicblast_willdomination.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 100.0,
+                recharge: 10.0,
+                endurance: 11.856,
+                cast: 1.1,
+                damage: {
+                    type: "Psionic",
+                    scale: 3.5300000000000002
+                }
+            }
+        },
+        {
+            name: "Psionic Lance",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged Damage", "Sniper Attacks", "Universal Damage Sets"],
+            description: "This extremely long range Psionic attack has a bonus to Accuracy, and can Slow a target's attack rate. This is a sniper attack, and is best fired from a distance as it can be interrupted. If you are engaged in battle this attack becomes instant-cast. If you are not engaged, it will do bonus damage.",
+            shortHelp: "Sniper, DMG(Psionic), Target -Recharge",
+            icon: "psychicblast_psioniclance.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 175.0,
+                recharge: 12.0,
+                endurance: 14.352,
+                cast: 1.33
+            }
+        },
+        {
+            name: "Psionic Tornado",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Unleashes a whirlwind of Psionic energy on a target, tossing nearby foes into the air. The Psionic Tornado damages foes and Slows their attack speed.",
+            shortHelp: "Ranged (Targeted AoE), Dmg(Psionic), Foe Knockback",
+            icon: "psychicblast_psionictornado.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 100.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 1.83,
+                damage: {
+                    type: "Psionic",
+                    scale: 1.8634
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Scramble Minds",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "Painfully scrambles the synapses of a targeted foe, leaving them dramatically Disoriented for a short duration. The effects of this power can jump from one foe to another in a chain dealing damage and applying a random mental effects to each target.",
+            shortHelp: "Ranged, DMG(Psionic), Foe Disorient",
+            icon: "psychicblast_scrambleminds.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Chain",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                range: 100.0,
+                recharge: 20.0,
+                endurance: 10.4,
+                cast: 2.0,
+                damage: {
+                    type: "Psionic",
+                    scale: 4.0862
+                }
+            }
+        },
+        {
+            name: "Psychic Wail",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Melee AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "Psychic Wail is a devastating Psionic attack that wracks the minds of all nearby foes which deals Extreme Psionic damage. Those that survive will have a severely reduced attack rate and may be left Disoriented.",
+            shortHelp: "PBAoE, DMG(Psionic), Foe Disorient -Recharge",
+            icon: "psychicblast_psychicwail.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.5,
+                recharge: 145.0,
+                endurance: 27.7316,
+                cast: 1.97,
+                damage: {
+                    type: "Psionic",
+                    scale: 5.5954999999999995
+                },
+                stun: 3.0,
+                buffDuration: 20.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/psychic-blast'] = CORRUPTOR_PSYCHIC_BLAST_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_PSYCHIC_BLAST_POWERSET = CORRUPTOR_PSYCHIC_BLAST_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/radiation-blast.js ----
+;/**
+ * Radiation Blast
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_RADIATION_BLAST_POWERSET = {
+    name: "Radiation Blast",
+    category: "Unknown",
+    description: "Radiation Blast powerset",
+    icon: "radiation-blast_set.png",
+    powers: [
+        {
+            name: "Neutrino Bolt",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Corruptor Archetype Sets", "Defense Debuff", "Ranged Damage", "Universal Damage Sets"],
+            description: "A very quick, but low damage attack. Neutrino Bolt can reduce the target's Defense.",
+            shortHelp: "Ranged, DMG(Energy), Foe -DEF",
+            icon: "radiationburst_neutrinoblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 1.5,
+                endurance: 3.12,
+                cast: 1.0,
+                damage: {
+                    type: "Energy",
+                    scale: 3.5197999999999996
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 3.0
+            }
+        },
+        {
+            name: "X-Ray Beam",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Corruptor Archetype Sets", "Defense Debuff", "Ranged Damage", "Universal Damage Sets"],
+            description: "You can emit a beam of X-Ray energy from your eyes, dealing moderate Energy damage. This attack can bypass some defenses and can reduce the target's Defense.",
+            shortHelp: "Ranged, DMG(Energy), Foe -DEF",
+            icon: "radiationburst_xraybeam.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.1,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.67,
+                damage: {
+                    type: "Energy",
+                    scale: 5.457800000000001
+                },
+                defenseDebuff: 2.0,
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Irradiate",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Corruptor Archetype Sets", "Defense Debuff", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You can emit lethal amounts of radiation in all directions, damaging all nearby foes for a short time. Like other Radiation attacks, this power can bypass some of a target's defenses. Irradiate severely reduces the target's Defense.",
+            shortHelp: "Close (AoE), DoT(Energy), Foe -DEF",
+            icon: "radiationburst_irradiate.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.1,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 1.07,
+                dotDamage: {
+                    type: "Energy",
+                    scale: 0.2974,
+                    ticks: 9
+                },
+                buffDuration: 4.6,
+                defenseDebuff: 3.0
+            }
+        },
+        {
+            name: "Electron Haze",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Corruptor Archetype Sets", "Defense Debuff", "Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "A short range conical blast of free electrons. This attack can bypass some of a target's defenses and reduce the target's Defense. It can also knock some targets down.",
+            shortHelp: "Close, Cone DMG(Energy), Foe -DEF, Knockback",
+            icon: "radiationburst_electronhaze.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.1,
+                range: 40.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 2.37,
+                damage: {
+                    type: "Energy",
+                    scale: 7.898000000000001
+                },
+                defenseDebuff: 2.0,
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Proton Volley",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Corruptor Archetype Sets", "Defense Debuff", "Ranged Damage", "Sniper Attacks", "Universal Damage Sets"],
+            description: "Hurls a volley of alpha particles over an extremely long range. Proton Volley can bypass some of a target's defenses and reduce the target's Defense. This is a sniper attack, and is best fired from a distance as it can be interrupted. If you are engaged in battle this attack becomes instant-cast. If you are not engaged, it will do bonus damage.",
+            shortHelp: "Sniper, DMG(Energy), Foe -DEF",
+            icon: "radiationburst_protonvolley.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 150.0,
+                recharge: 12.0,
+                endurance: 14.352,
+                cast: 1.33
+            }
+        },
+        {
+            name: "Aim",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases your chance to hit with attacks for a few seconds. Slightly increases damage.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +To Hit, +DMG",
+            icon: "radiationburst_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.625,
+                damageBuff: 0.425,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Cosmic Burst",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Corruptor Archetype Sets", "Defense Debuff", "Ranged Damage", "Stuns", "Universal Damage Sets"],
+            description: "Cosmic Burst smashes the target with cosmic particles. The attack is devastating and can leave most targets Disoriented and with reduced Defense.",
+            shortHelp: "Ranged, DMG(Energy), Foe Disorient, -DEF",
+            icon: "radiationburst_cosmicburst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 10.0,
+                endurance: 10.4,
+                cast: 2.07,
+                damage: {
+                    type: "Energy",
+                    scale: 8.7378
+                },
+                stun: 3.0,
+                defenseDebuff: 3.0,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Neutron Bomb",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Corruptor Archetype Sets", "Defense Debuff", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "This devastating attack lobs an explosive sphere of deadly radiation, damaging the target and all nearby foes. Neutron Bomb can bypass some of a target's defenses and reduce the target's Defense.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Energy), Foe -DEF",
+            icon: "radiationburst_radiationblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.1,
+                range: 80.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.67,
+                damage: {
+                    type: "Energy",
+                    scale: 3.1635999999999997
+                },
+                defenseDebuff: 2.0,
+                buffDuration: 16.0
+            }
+        },
+        {
+            name: "Atomic Blast",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Corruptor Archetype Sets", "Defense Debuff", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "This attack taps most of your stored energy to deal a devastating Atomic Blast which deals Extreme Energy and Smashing damage. Any foes left standing will have their Defense greatly reduced and may be left helplessly choking on toxic vapors.",
+            shortHelp: "PBAoE, DMG(Energy/Smash), Foe Hold, -DEF",
+            icon: "radiationburst_atomicblast.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.4,
+                recharge: 145.0,
+                endurance: 27.7316,
+                cast: 2.93,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 7.6055
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.0
+                        }
+                    ],
+                    scale: 8.6055
+                },
+                defenseDebuff: 4.0,
+                buffDuration: 20.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/radiation-blast'] = CORRUPTOR_RADIATION_BLAST_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_RADIATION_BLAST_POWERSET = CORRUPTOR_RADIATION_BLAST_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/radiation-emission.js ----
+;/**
+ * Radiation Emission
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_RADIATION_EMISSION_POWERSET = {
+    name: "Radiation Emission",
+    category: "Unknown",
+    description: "Radiation Emission powerset",
+    icon: "radiation-emission_set.png",
+    powers: [
+        {
+            name: "Radiant Aura",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You can use Radiant Aura to heal some of your wounds, and the wounds of your group. This power has a small radius, so your allies need to be near you if they wish to be affected.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "PBAoE, Ally +Heal",
+            icon: "radiationpoisoning_radiationemission.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 8.0,
+                endurance: 13.0,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Radiation Infection",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Defense Debuff", "To Hit Debuff"],
+            description: "Infects a targeted foe with deadly radiation, severely reducing his Accuracy and Defense. All foes that come near the target will also become infected. The Radiation Infection will last until you deactivate it, or until the original target is defeated.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Ranged (Targeted AoE), Foe -DEF, -To Hit",
+            icon: "radiationpoisoning_enervatingfield.png",
+            powerType: "Toggle",
+            targetType: "Foe",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 8.0,
+                endurance: 0.26,
+                cast: 1.5,
+                tohitDebuff: 2.5,
+                buffDuration: 0.75,
+                defenseDebuff: 2.5
+            }
+        },
+        {
+            name: "Accelerate Metabolism",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Running", "Running & Sprints", "Universal Travel"],
+            description: "Activating this power emits radiation that increases the running speed, attack speed, Endurance recovery, and damage potential of all nearby allies. Affected allies' metabolisms are increased so much that they become resistant to effects such as Sleep, Hold, Disorient, Immobilization and Endurance Drain.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "PBAoE, Ally +SPD, +Recharge, +Recovery, +DMG(All) +Res(Effects)",
+            icon: "radiationpoisoning_acceleratemetabolism.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 422.0,
+                endurance: 15.6,
+                cast: 2.03,
+                buffDuration: 120.0,
+                stun: 1.0,
+                stunDuration: 120.0
+            }
+        },
+        {
+            name: "Enervating Field",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: [],
+            description: "While this power is active, you irradiate a targeted foe, and all foes nearby, with a deadly dose of radiation. This radiation weakens exposed targets, decreasing the damage of their attacks. It also significantly weakens their resistance, so they will take much more damage from other attacks.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Ranged (Targeted AoE), Foe -DMG, -Res",
+            icon: "radiationpoisoning_radiationinfection.png",
+            powerType: "Toggle",
+            targetType: "Foe",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 8.0,
+                endurance: 0.26,
+                cast: 1.5,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Mutation",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "Using a concentrated burst of radiation, you can revive a fallen ally and Mutate them into a killing machine. The Mutated target has increased damage, chance to hit, Endurance recovery, and attack speed and is protected from XP Debt for 90 seconds. The entire experience is very taxing on your ally, and they will soon be severely weakened. All effects of the Mutation will eventually wear off.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Close, Ally Rez, Special",
+            icon: "radiationpoisoning_mutation.png",
+            powerType: "Click",
+            targetType: "Player Ally (Dead)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 15.0,
+                recharge: 180.0,
+                endurance: 26.0,
+                cast: 3.2,
+                buffDuration: 0.5,
+                tohitBuff: 3.0,
+                tohitDebuff: 3.0
+            }
+        },
+        {
+            name: "Lingering Radiation",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "You can emit Lingering Radiation that reduces the attack rate, movement speed, and Regeneration rate of the target, and all nearby foes.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged (Targeted AoE), Foe -Speed, -Recharge, -Regen",
+            icon: "radiationpoisoning_lingeringradiation.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 1.5,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Choking Cloud",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Holds"],
+            description: "While active, you generate toxic radioactive gas around yourself. Any nearby foes may be overcome by the gas, leaving them choking and helpless.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Toggle: PBAoE, Foe Hold",
+            icon: "radiationpoisoning_chokingcloud.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 1.3,
+                cast: 1.0
+            }
+        },
+        {
+            name: "Fallout",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Accurate To-Hit Debuff", "Defense Debuff", "Ranged AoE Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "After an ally falls in battle, you can activate this power to extract the energy from their body to deal a massive amount of Energy damage to any nearby foes. All affected foes are extremely weakened by the Fallout, and their Accuracy, Defense, Damage and Damage Resistance is severely reduced.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Post-Defeat: PBAoE, Extreme DMG(Energy), Foe -To Hit, -DEF, -DMG, -Res(All)",
+            icon: "radiationpoisoning_fallout.png",
+            powerType: "Click",
+            targetType: "Leaguemate (Dead)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 300.0,
+                endurance: 20.8,
+                cast: 3.2,
+                buffDuration: 1.0
+            }
+        },
+        {
+            name: "EM Pulse",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Holds"],
+            description: "You can unleash a massive pulse of electromagnetic energy. This EMP can affect machines, and is even powerful enough to affect synaptic brain patterns. It will drain the Endurance, and HP Regeneration of all affected targets and leave them incapacitate and Held for a long while. Additionally, most machines and robots will take moderate high damage. However, this power uses a lot of Endurance and leaves you unable to recover Endurance for a while.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "PBAoE, Foe Hold, -END, -Regen, Special vs. Robots; Self -Recovery",
+            icon: "radiationpoisoning_emppulse.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 300.0,
+                endurance: 20.8,
+                cast: 2.93,
+                damage: {
+                    type: "Energy",
+                    scale: 1.64
+                },
+                buffDuration: 15.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/radiation-emission'] = CORRUPTOR_RADIATION_EMISSION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_RADIATION_EMISSION_POWERSET = CORRUPTOR_RADIATION_EMISSION_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/seismic-blast.js ----
+;/**
+ * Seismic Blast
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_SEISMIC_BLAST_POWERSET = {
+    name: "Seismic Blast",
+    category: "Unknown",
+    description: "Seismic Blast powerset",
+    icon: "seismic-blast_set.png",
+    powers: [
+        {
+            name: "Encase",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Corruptor Archetype Sets", "Defense Debuff", "Ranged Damage", "Universal Damage Sets"],
+            description: "Encase a foe in stone for a short moment, dealing damage and lowering their defense. The enemy will also become heavy, limiting their ability to jump and fly for a short time. <br><br>Encase grants two stacks of Seismic Pressure.",
+            shortHelp: "Ranged, DMG(Smash), Foe -Jump, -Fly, -DEF",
+            icon: "seismicblast_shatter.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    type: "Smashing",
+                    scale: 2.26
+                },
+                defenseDebuff: 0.5,
+                buffDuration: 3.0
+            }
+        },
+        {
+            name: "Seismic Shockwaves",
+            available: 0,
+            tier: 1,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "While on the ground, nearby enemies might be knocked down and some of your attacks are empowered.<br><br>This power is only for short periods of times after being triggered by Seismic Pressure.",
+            shortHelp: "Foe Knock Down, Self Special",
+            icon: "seismic_power.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 1,
+            effects: {
+                accuracy: 0.8
+            }
+        },
+        {
+            name: "Shatter",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Corruptor Archetype Sets", "Defense Debuff", "Ranged Damage", "Universal Damage Sets"],
+            description: "Cover a foe in stone shards and shatter them, inflicting light damage and lowering their defense. They will also become heavy, limiting their ability to jump and fly for a short time. <br><br>Shatter grants two stacks of Seismic Pressure.",
+            shortHelp: "Ranged, DMG(Smash), Foe -Jump, -Fly, -DEF",
+            icon: "seismicblast_encase.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 7.0,
+                endurance: 7.696,
+                cast: 1.33,
+                damage: {
+                    type: "Smashing",
+                    scale: 3.091
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Rock Shards",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Corruptor Archetype Sets", "Defense Debuff", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You launch a volley of stone shards at your target in a sweeping cone. These shards stab into the target, causing lethal damage. They will also continue to suffer additional lethal damage over time.<br><br>If affected by Seismic Shockwaves, this power will halt the shockwaves, the up front damage will be increased and damage over time accelerated, foes will be knocked down, range will be increased to 60ft and arc to 40 degrees.<br><br>Rock Shards grants two stacks of Seismic Pressure.",
+            shortHelp: "Ranged Cone, DMG(Smash/Lethal), -Defense, Special",
+            icon: "seismicblast_rockshards.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.07
+            }
+        },
+        {
+            name: "Entomb",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Corruptor Archetype Sets", "Defense Debuff", "Ranged Damage", "Universal Damage Sets"],
+            description: "Entomb foes in a giant boulder, dealing high damage and lowering their defense. They will also become heavy, limiting their ability to jump and fly for a short time. <br><br>Entomb grants two stacks of Seismic Pressure.",
+            shortHelp: "Ranged, DMG(Smash), Foe -Jump, -Fly, -DEF",
+            icon: "seismicblast_entomb.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 11.0,
+                endurance: 11.024,
+                cast: 2.07,
+                damage: {
+                    type: "Smashing",
+                    scale: 4.4089
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Seismic Force",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases your attacks' chance to hit for a few seconds. Slightly increases damage.<br><br>If affected by Seismic Shockwaves, this power will halt the shockwaves and will decrease the cooldown of all recharging Seismic Blast attacks by a moderate amount.",
+            shortHelp: "Self +To Hit, +DMG, +Special",
+            icon: "seismicblast_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 5.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Upthrust",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Corruptor Archetype Sets", "Defense Debuff", "Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You channel seismic energy into the earth, causing a micro-fault to erupt under your target. This causes a shard of rock to thrust upward out of the ground, dealing smashing damage and lowering their defense. Affected foes will become heavy, limiting their ability to jump and fly for a short time. The force of the eruption can knock back enemies.<br><br>Upthrust grants two stacks of Seismic Pressure.",
+            shortHelp: "Targeted AoE, DMG(Smash), -Fly, -Defense, Chance to Knockback",
+            icon: "seismicblast_upthrust.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.2,
+                damage: {
+                    type: "Smashing",
+                    scale: 2.7785
+                },
+                defenseDebuff: 0.7,
+                buffDuration: 16.0
+            }
+        },
+        {
+            name: "Tombstone",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged Damage", "Sniper Attacks", "Universal Damage Sets"],
+            description: "Create a giant pillar of stone, creating a Tombstone around your target, dealing extreme damage and limiting their ability to jump and fly for a short time. <br><br>This is a sniper attack, and is best fired from a distance as it can be interrupted. If you are engaged in battle this attack becomes instant-cast. If you are not engaged, it will do bonus damage.<br><br>Tombstone grants two stacks of Seismic Pressure.",
+            shortHelp: "Sniper, DMG(Smash), Foe -Jump, -Fly",
+            icon: "seismicblast_snipe.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 150.0,
+                recharge: 12.0,
+                endurance: 14.352,
+                cast: 1.67
+            }
+        },
+        {
+            name: "Stalagmite",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged Damage", "Stuns", "Universal Damage Sets"],
+            description: "You can cause a Stalagmite to erupt under an enemy dealing minimal Lethal damage, and Disorienting them for a good while. You must be on the ground to activate this power.<br><br>If affected by Seismic Shockwaves, this power will halt the shockwaves and deal extreme damage.<br><br>Stalagmite grants two stacks of Seismic Pressure.",
+            shortHelp: "Ranged, DMG(Smash), Foe Disorient, Special",
+            icon: "seismicblast_stalagmite.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 10.192,
+                cast: 1.0
+            }
+        },
+        {
+            name: "Meteor",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You call down a meteor strike from the sky at a specified location. All targets within 30' are caught in the blast radius, taking extreme damage and being knocked back. <br><br>This power needs to target a ground location.",
+            shortHelp: "Ranged (Location AoE), DMG(Smash/Fire), Foe Knockback",
+            icon: "seismicblast_meteor.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 90.0,
+                recharge: 170.0,
+                endurance: 27.7316,
+                cast: 2.57,
+                buffDuration: 10.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/seismic-blast'] = CORRUPTOR_SEISMIC_BLAST_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_SEISMIC_BLAST_POWERSET = CORRUPTOR_SEISMIC_BLAST_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/shock-therapy.js ----
+;/**
+ * Shock Therapy
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_SHOCK_THERAPY_POWERSET = {
+    name: "Shock Therapy",
+    category: "Unknown",
+    description: "Shock Therapy powerset",
+    icon: "shock-therapy_set.png",
+    powers: [
+        {
+            name: "Rejuvenating Circuit",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Create a circuit of healing energy between several nearby allies, healing them for a small amount. Every stack of Static you have will cause this power to chain to additional allies. The first few targets in the chain receive a more potent effect. Rejuvenating Circuit grants 1 stack of Static.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged (Chain), Ally Heal, Self +Static",
+            icon: "shocktherapy_rejuvenatingcircuit.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "Chain",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 13.0,
+                cast: 1.17
+            }
+        },
+        {
+            name: "Shock",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "Strike a single foe with a highly-charged electrical shock, draining some endurance and moderately reducing their recovery, regeneration and damage output.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Foe -DMG, -End, -Recovery, -Regen",
+            icon: "shocktherapy_shock.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 12.0,
+                endurance: 8.528,
+                cast: 2.0,
+                buffDuration: 25.0
+            }
+        },
+        {
+            name: "Galvanic Sentinel",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "Summons a Galvanic Sentinel to your aid. The Galvanic Sentinel shocks and weakens your foes, draining some endurance and reducing their regeneration, recovery, and damage output. The Galvanic Sentinel can be buffed and healed, and may be targeted with your Circuit powers.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Summon Galvanic Sentinel: Ranged Debuff Special",
+            icon: "shocktherapy_galvanicsentinel.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 60.0,
+                endurance: 25.0,
+                cast: 2.03,
+                buffDuration: 120.0
+            }
+        },
+        {
+            name: "Energizing Circuit",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "Create a circuit of pure energy between several nearby allies, restoring a small amount of their endurance and significantly increasing their attack rate for a short time. Every stack of Static you have will cause this power to chain to additional allies. The first few targets in the chain receive a more potent effect. Energizing Circuit grants 1 stack of Static.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Chain), Ally +End, +Recharge, Self +Static",
+            icon: "shocktherapy_energizingcircuit.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "Chain",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 35.0,
+                endurance: 13.0,
+                cast: 1.67,
+                buffDuration: 5.0
+            }
+        },
+        {
+            name: "Faraday Cage",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "Create a large energy barrier at your location which provides all allies within resistance to all damage except Toxic. They are also protected from status effects, knockbacks, endurance drain, recovery debuffs and recharge debuffs. Casting this power again will move the energy barrier to your location. Standing inside your own Faraday Cage will grant you a stack of Static every 5 seconds.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Location (PBAoE), Team +Res(All DMG but Toxic, Status, Knockback, -Rech, -Rec, -End)",
+            icon: "shocktherapy_faradaycage.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 25.0,
+                recharge: 10.0,
+                endurance: 13.0,
+                cast: 1.07,
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Empowering Circuit",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Create a circuit of empowering energy between several nearby allies, increasing their damage output and chance to hit for a short time. Every stack of Static you have will cause this power to chain to additional allies. The first few targets in the chain receive a more potent effect. Empowering Circuit grants 1 stack of Static.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Chain), Ally +DMG, +Tohit, Self +Static",
+            icon: "shocktherapy_empoweringcircuit.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "Chain",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 13.0,
+                cast: 1.0,
+                buffDuration: 60.0,
+                tohitBuff: 1.2
+            }
+        },
+        {
+            name: "Defibrillate",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Sleep", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Sleep"],
+            description: "Strike a target with a highly-charged jolt of electricity, reviving all nearby allies and draining all nearby foes. Any enemies affected will be drained of some endurance, have their recovery reduced and be put to sleep for a short time. Defibrillate consumes all stacks of Static, and the strength of the offensive component of this power scales with the number of stacks consumed. Allies will always be revived with full health and endurance regardless of the number of Static stacks consumed.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Melee (Targeted AoE), Ally Rez, Foe Sleep, -End, -Recovery",
+            icon: "shocktherapy_defibrillate.png",
+            powerType: "Click",
+            targetType: "Any",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 120.0,
+                endurance: 26.0,
+                cast: 3.3
+            }
+        },
+        {
+            name: "Insulating Circuit",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Create a circuit of protective energy between several nearby allies, granting them a small protective shield. Every stack of Static you have will cause this power to chain to additional allies. The first few targets in the chain receive a more potent effect. Insulating Circuit grants 1 stack of Static.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Chain), Ally +Absorb, Self +Static",
+            icon: "shocktherapy_insulatingcircuit.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "Chain",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 20.0,
+                endurance: 13.0,
+                cast: 1.0,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Amp Up",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: [],
+            description: "Empower an ally with raw energy, causing all of their abilities to unleash chained bolts of electricity at nearby foes. These bolts drain a small amount of endurance and have a chance to knock up the target. Amp Up also moderately increases their attack rate and greatly boosts the secondary effects of their powers. Their power effects like heals, defense debuffs, endurance drains, disorients, holds, immobilizes and more, are all improved.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Ranged, Ally +Special, +Recharge",
+            icon: "shocktherapy_ampup.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 300.0,
+                endurance: 10.4,
+                cast: 2.57,
+                buffDuration: 90.0,
+                stun: 1.0,
+                stunDuration: 90.0,
+                tohitBuff: 3.6,
+                defenseBuff: 3.6
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/shock-therapy'] = CORRUPTOR_SHOCK_THERAPY_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_SHOCK_THERAPY_POWERSET = CORRUPTOR_SHOCK_THERAPY_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/sonic-attack.js ----
+;/**
+ * Sonic Attack
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_SONIC_ATTACK_POWERSET = {
+    name: "Sonic Attack",
+    category: "Unknown",
+    description: "Sonic Attack powerset",
+    icon: "sonic-attack_set.png",
+    powers: [
+        {
+            name: "Scream",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged Damage", "Universal Damage Sets"],
+            description: "Your Scream can cause serious damage to a target.",
+            shortHelp: "Ranged, Moderate DoT(Smashing/Energy), -Res",
+            icon: "sonicblast_medium.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.47,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 0.2989,
+                            ticks: 4
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.2989,
+                            ticks: 4
+                        }
+                    ]
+                },
+                buffDuration: 1.05
+            }
+        },
+        {
+            name: "Shriek",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged Damage", "Universal Damage Sets"],
+            description: "You let forth a quick Shriek, damaging your target.",
+            shortHelp: "Ranged, Light DMG(Smashing/Energy), Foe -Res(All)",
+            icon: "sonicblast_quick.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 1.03
+                        },
+                        {
+                            type: "Energy",
+                            scale: 1.03
+                        }
+                    ],
+                    scale: 2.06
+                },
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Howl",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "A short ranged sonic attack that can hit multiple enemies in an arc in front of you.",
+            shortHelp: "Ranged Cone, Minor DMG(Smashing/Energy), Foe -Res(All)",
+            icon: "sonicblast_cone.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.6,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 2.9257999999999997
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.3347
+                        }
+                    ],
+                    scale: 3.2604999999999995
+                },
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Shockwave",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You can call forth a tremendous Shockwave that knocks back foes and deals Smashing damage in a wide cone area.",
+            shortHelp: "Ranged (Cone), Light DMG(Smashing/Energy), Foe Knockback",
+            icon: "sonicblast_knockback.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 11.0,
+                endurance: 11.024,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 0.8426
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.8426
+                        }
+                    ],
+                    scale: 1.6852
+                }
+            }
+        },
+        {
+            name: "Shout",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged Damage", "Universal Damage Sets"],
+            description: "You blast your foe with a tremendous Shout, damaging them.",
+            shortHelp: "Ranged, High DMG(Smashing/Energy), Foe -Res(All)",
+            icon: "sonicblast_heavy.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 2.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.08
+                        },
+                        {
+                            type: "Energy",
+                            scale: 2.08
+                        }
+                    ],
+                    scale: 4.16
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Amplify",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases your chance to hit with attacks for a few seconds. Slightly increases damage.",
+            shortHelp: "Self +To Hit, +DMG",
+            icon: "sonicblast_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 5.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Sirens Song",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged AoE Damage", "Sleep", "Universal Damage Sets"],
+            description: "You send forth a subsonic pulse which causes your foes to fall unconscious and take energy damage. Your foes will remain unconscious for a good while, but will awaken if disturbed.<br><br><color #fcfc95>Notes: The Sleep component of this power is Auto Hit against regular enemies, but a To Hit check is required against AVs and players, as well as to make secondary effects apply.</color>",
+            shortHelp: "Ranged (Cone), Light DMG(Energy), Foe Sleep",
+            icon: "sonicblast_sleep.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 0.8727,
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.86,
+                damage: {
+                    type: "Energy",
+                    scale: 0.9546
+                }
+            }
+        },
+        {
+            name: "Screech",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged Damage", "Stuns", "Universal Damage Sets"],
+            description: "By bursting forth with this hypersonic Screech, you can inflict high damage and disorient a target.",
+            shortHelp: "Ranged, High DMG(Smashing/Energy), Foe Disorient, -Res(All)",
+            icon: "sonicblast_stun.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 1.5,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.105
+                        },
+                        {
+                            type: "Energy",
+                            scale: 2.105
+                        }
+                    ],
+                    scale: 4.21
+                },
+                stun: 3.0,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Dreadful Wail",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Melee AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "Your Dreadful Wail is so strong that most foes will be defeated by being subjected to it. Dreadful Wail deals Extreme Smashing and Energy damage to all nearby foes in addition to disorienting them for a good while.",
+            shortHelp: "PBAoE, Extreme DMG(Energy/Smash), Foe Disorient, -Res(All)",
+            icon: "sonicblast_massivedamage.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.4,
+                recharge: 145.0,
+                endurance: 27.716,
+                cast: 1.97,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.7978
+                        },
+                        {
+                            type: "Energy",
+                            scale: 2.7978
+                        }
+                    ],
+                    scale: 5.5956
+                },
+                stun: 3.0,
+                buffDuration: 20.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/sonic-attack'] = CORRUPTOR_SONIC_ATTACK_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_SONIC_ATTACK_POWERSET = CORRUPTOR_SONIC_ATTACK_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/sonic-resonance.js ----
+;/**
+ * Sonic Resonance
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_SONIC_RESONANCE_POWERSET = {
+    name: "Sonic Resonance",
+    category: "Unknown",
+    description: "Sonic Resonance powerset",
+    icon: "sonic-resonance_set.png",
+    powers: [
+        {
+            name: "Sonic Barrier",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "This shield dramatically reduces the damage an ally takes from Smashing, Lethal, and Toxic attacks for a limited time. You cannot stack multiple Sonic Barriers on the same target, however the shield can be improved by another ally using the same power. Can also be used in conjunction with your Sonic Haven. You cannot use this power on yourself.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Ranged, Ally +Res(Smash, Lethal, Toxic)",
+            icon: "sonicdebuff_protectphysical.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 2.0,
+                endurance: 7.8,
+                cast: 1.33,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.0,
+                            ticks: 120
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 2.0,
+                            ticks: 120
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 2.0,
+                            ticks: 120
+                        }
+                    ]
+                },
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Sonic Siphon",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: [],
+            description: "By setting up a constant vibration within the body of your foe, you weaken their Damage Resistance. Affected targets will take more damage from successful attacks.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Foe -Res(All)",
+            icon: "sonicdebuff_debuffdamres.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 16.0,
+                endurance: 8.528,
+                cast: 2.17,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Sonic Haven",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "This shield dramatically reduces the damage an ally takes from Fire, Cold, Energy, and Negative Energy attacks for a limited time. You cannot stack multiple Sonic Havens on the same target, however the shield can be improved by another ally using the same power. Can also be used in conjunction with your Sonic Barrier. You cannot use this power on yourself.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Ranged, Ally +Res(Fire, Cold, Energy, Negative Energy)",
+            icon: "sonicdebuff_protectelements.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 2.0,
+                endurance: 7.8,
+                cast: 1.33,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 2.0,
+                            ticks: 120
+                        },
+                        {
+                            type: "Cold",
+                            scale: 2.0,
+                            ticks: 120
+                        },
+                        {
+                            type: "Energy",
+                            scale: 2.0,
+                            ticks: 120
+                        },
+                        {
+                            type: "Negative",
+                            scale: 2.0,
+                            ticks: 120
+                        }
+                    ]
+                },
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Sonic Cage",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: [],
+            description: "Encases the target in an impenetrable field of sonic waves. The target cannot attack or be attacked.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Foe Capture (Special)",
+            icon: "sonicdebuff_hold.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.4,
+                range: 80.0,
+                recharge: 60.0,
+                endurance: 12.48,
+                cast: 1.67,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Disruption Field",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "You set up a constant wave of sonic energy around an ally, weakening the Damage Resistance of all nearby foes.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Ranged (Target Ally AoE), Foe -Res",
+            icon: "sonicdebuff_teamdebuffdamres.png",
+            powerType: "Toggle",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 8.0,
+                endurance: 0.26,
+                cast: 2.7,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Sonic Dispersion",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You create a large field of sonic waves, protecting all allies inside. The Sonic Dispersion gives all allies within increased Resistance against all damage except Psionic. The Sonic Bubble also protects allies from Immobilization, Disorient, and Hold effects.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Toggle: PBAoE, Ally +Res(All DMG except Psionic, Hold, Immobilize, Disorient)",
+            icon: "sonicdebuff_buffdamageres.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 15.0,
+                endurance: 1.04,
+                cast: 2.03,
+                buffDuration: 2.25,
+                stun: 1.0,
+                stunDuration: 2.25
+            }
+        },
+        {
+            name: "Sonic Repulsion",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Knockback"],
+            description: "You create a powerful sonic resonance around an ally, repelling all foes nearby. You will lose endurance for each target repelled.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Ranged (Target Ally AoE), Foe Knockback",
+            icon: "sonicdebuff_teamknockback.png",
+            powerType: "Toggle",
+            targetType: "Leaguemate (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 8.0,
+                endurance: 0.325,
+                cast: 2.33,
+                buffDuration: 0.5
+            }
+        },
+        {
+            name: "Clarity",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: [],
+            description: "By bouncing a carefully pitched sound wave off an ally's ear drum, you can free him from any Disorient, Hold, Sleep, Confusion, Fear, and Immobilize effects, and leave them resistant to such effects for a good while. Protection will improve with multiple applications and as you advance in level. Clarity also provides your ally's enhanced perception.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ally +Res(Disorient, Hold, Sleep, Immobilize, Fear, Confusion), +Perception",
+            icon: "sonicdebuff_dispel.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.5,
+                stun: 1.0,
+                stunDuration: 90.0,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Liquefy",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Accurate To-Hit Debuff", "Corruptor Archetype Sets", "Defense Debuff", "Holds", "Knockback", "Ranged AoE Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You unleash a barrage of sonic waves on the Earth itself, generating a powerful, localized earthquake. Most foes that pass through the location will fall down. The violent shaking also reduces their chance to hit and Defense.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Ranged (Location AoE), Foe Knockback, Hold, -To Hit, -DEF",
+            icon: "sonicdebuff_dropknockback.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 150.0,
+                endurance: 23.4,
+                cast: 2.67,
+                buffDuration: 30.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/sonic-resonance'] = CORRUPTOR_SONIC_RESONANCE_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_SONIC_RESONANCE_POWERSET = CORRUPTOR_SONIC_RESONANCE_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/storm-blast.js ----
+;/**
+ * Storm Blast
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_STORM_BLAST_POWERSET = {
+    name: "Storm Blast",
+    category: "Unknown",
+    description: "Storm Blast powerset",
+    icon: "storm-blast_set.png",
+    powers: [
+        {
+            name: "Gust",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged Damage", "Universal Damage Sets"],
+            description: "You create a chaotic change in atmospheric pressure, causing a sudden gust of wind to deliver a small amount of Smashing damage and knock your foe out of the sky. <br><br>While in a <color #fcfc95>Storm Cell</color>, targets experience additional Smashing damage over time.",
+            shortHelp: "Ranged, DMG(Smash), -Fly",
+            icon: "stormblast_gust.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.17,
+                damage: {
+                    type: "Smashing",
+                    scale: 2.379
+                },
+                buffDuration: 4.0
+            }
+        },
+        {
+            name: "Hailstones",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "You cause the air around the foe to rapidly condense, causing hailstones to crash down, dealing Cold damage. There is a chance that an especially large chunk of hail will form, knocking the target down. <br><br>While in a <color #fcfc95>Storm Cell</color>, targets are much more likely to get knocked down by large chunks of hail.",
+            shortHelp: "Ranged, DMG(Cold), Chance for Knockdown",
+            icon: "stormblast_hailstones.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    type: "Cold",
+                    scale: 2.529
+                },
+                dotDamage: {
+                    type: "Cold",
+                    scale: 0.25,
+                    ticks: 3
+                },
+                buffDuration: 1.0
+            }
+        },
+        {
+            name: "Jet Stream",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You call forth a cone of rapidly moving air that repels enemies, causing Smashing damage. <br><br>Enemies who are within a <color #fcfc95>Storm Cell</color> will not be repelled, but instead will be knocked down.",
+            shortHelp: "Ranged (Cone), DMG(Smashing), Foe Knockdown or Repel",
+            icon: "stormblast_jetstream.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.67,
+                damage: {
+                    type: "Smashing",
+                    scale: 1.6037
+                }
+            }
+        },
+        {
+            name: "Storm Cell",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Endurance Modification", "Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You conjure a storm in the area that defines the boundaries of your stormy powers. Rain from this power will slightly lower a foe's movement and chance to hit. The use of your Storm Blast attacks may create high winds and lightning within the storm cell, delivering stronger debuffs and causing damage. Additionally, Storm Blast attacks will be enhanced when used against foes victimized by Storm Cell.",
+            shortHelp: "Ranged (Location AoE), Foe -Recharge, -SPD, +Wet, Special",
+            icon: "stormblast_stormcell.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                endurance: 15.6,
+                cast: 2.03,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Intensify",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the chance to hit of your attacks, and slightly increases damage for a few seconds. Moderately increases the chance for Storm Blast powers to summon high winds and lightning from your Storm Cell and Category Five while active.",
+            shortHelp: "Self +To Hit, +DMG, Special",
+            icon: "stormblast_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 5.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Direct Strike",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Endurance Modification", "Ranged Damage", "Sniper Attacks", "Universal Damage Sets"],
+            description: "You channel your storm powers into a direct hit, jolting the enemy with a bolt of lightning that deals Energy damage and saps some endurance. If fired outside of combat, it can be interrupted by enemies, but will do bonus damage. If you are engaged in battle, this attack becomes instant-cast. <br><br>While in a <color #fcfc95>Storm Cell</color>, targets have a chance to be stunned. The odds of creating High Winds and Lightning are much greater when Direct Strike is cast out of combat.",
+            shortHelp: "Sniper, DMG(Energy), Foe -End, Special",
+            icon: "stormblast_directstrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 150.0,
+                recharge: 12.0,
+                endurance: 14.352,
+                cast: 1.33
+            }
+        },
+        {
+            name: "Chain Lightning",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Endurance Modification", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Calls a bolt of lightning from the clouds to strike your target, which then chains outward to additional enemies. Creatures unfortunate enough to be struck will be dealt Energy damage and be sapped of some endurance.<br><br>While in a <color #fcfc95>Storm Cell</color>, the main target of Chain Lightning will experience additional endurance drain over time.",
+            shortHelp: "Ranged Chain, DoT(Energy), Foe -End",
+            icon: "stormblast_chainlightning.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Chain",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.15,
+                range: 80.0,
+                recharge: 16.0,
+                endurance: 15.18,
+                cast: 1.17,
+                damage: {
+                    type: "Energy",
+                    scale: 1.324
+                },
+                dotDamage: {
+                    type: "Energy",
+                    scale: 0.08,
+                    ticks: 3
+                },
+                buffDuration: 2.1
+            }
+        },
+        {
+            name: "Cloudburst",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged Damage", "Universal Damage Sets"],
+            description: "Unleashes a cloud that drops a torrent of freezing rain on your target, causing Cold damage. <br><br>While in a <color #fcfc95>Storm Cell</color>, targets experience Recharge, ToHit, and Movement speed debuffs.",
+            shortHelp: "Ranged, DoT(Cold), +Wet, Special",
+            icon: "stormblast_cloudburst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 11.0,
+                endurance: 11.024,
+                cast: 1.67,
+                dotDamage: {
+                    type: "Cold",
+                    scale: 0.4285,
+                    ticks: 9
+                },
+                buffDuration: 2.9
+            }
+        },
+        {
+            name: "Category Five",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Summons a severe storm that begins light, but grows in power until it becomes a raging engine of destruction. Left on its own, the Category Five storm is capable of delivering moderate damage. As it grows in power, foes may begin to fling through the air. <br><br>In addition, each use of your Storm Blast powers is capable of delivering lightning attacks within the Category Five storm, delivering energy damage.",
+            shortHelp: "Ranged (Location AoE), DoT(Energy), +Wet",
+            icon: "stormblast_categoryfive.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 2.0,
+                range: 60.0,
+                recharge: 170.0,
+                endurance: 27.716,
+                cast: 2.5,
+                buffDuration: 30.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/storm-blast'] = CORRUPTOR_STORM_BLAST_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_STORM_BLAST_POWERSET = CORRUPTOR_STORM_BLAST_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/storm-summoning.js ----
+;/**
+ * Storm Summoning
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_STORM_SUMMONING_POWERSET = {
+    name: "Storm Summoning",
+    category: "Unknown",
+    description: "Storm Summoning powerset",
+    icon: "storm-summoning_set.png",
+    powers: [
+        {
+            name: "Gale",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You can call forth a tremendous gust of Gale force winds that knock down foes and deal some Smashing damage in a wide cone area.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged (Cone), Minor DMG(Smash), Foe Knockback",
+            icon: "stormsummoning_gale.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 1.3963,
+            effects: {
+                accuracy: 0.9,
+                range: 50.0,
+                recharge: 8.0,
+                endurance: 7.8,
+                cast: 2.17,
+                damage: {
+                    type: "Smashing",
+                    scale: 0.27390000000000003
+                }
+            }
+        },
+        {
+            name: "O2 Boost",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Saturates the air around a targeted ally with rich oxygen, healing their wounds. The O2 Boost can protect a targeted ally from Sleep, Stun and Endurance Drain effects as well as increase perception. You cannot use this power on yourself.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ally Heal, +Res(Disorient, Sleep, End Drain), +Perception",
+            icon: "stormsummoning_o2boost.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 13.0,
+                cast: 2.27,
+                buffDuration: 60.0,
+                stun: 1.0,
+                stunDuration: 60.0
+            }
+        },
+        {
+            name: "Snow Storm",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "While active, the chill from this Snow Storm can dramatically Slow the attack and movement speed of the target and all nearby foes. The torrent winds of the Snow Storm are enough to bring down flying foes.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Ranged (Targeted AoE), Foe -Speed, -Recharge, -Fly",
+            icon: "stormsummoning_snowstorm.png",
+            powerType: "Toggle",
+            targetType: "Foe",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 10.0,
+                endurance: 0.26,
+                cast: 2.03,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Steamy Mist",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Resist Damage"],
+            description: "Your mastery of the elements allows you to hide yourself and all nearby allies within a Steamy Mist. Steamy Mist makes you and your allies harder to see and increases your Defense bonus to all attacks, while reducing Fire, Cold, and Energy damage, as well as your Foes ability to Confuse you.",
+            shortHelp: "Toggle: PBAoE, Team Stealth, +DEF(All), +Res(Fire, Cold, Energy, Confuse)",
+            icon: "stormsummoning_fog.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 15.0,
+                endurance: 0.26,
+                cast: 1.87,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Freezing Rain",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Corruptor Archetype Sets", "Defense Debuff", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Summons Freezing Rain at a targeted location. Freezing Rain deals minimal Cold damage to anything that passes through the storm. It also Slows the affected foes and severely reduces their Defense and resistance to damage. Many foes may even slip and fall trying to escape the storm.<br><br><color #fcfc95>Damage: Minor(DoT).</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Location AoE), Minor DoT(Cold), Foe -Speed, -Recharge, -DEF, -Res",
+            icon: "stormsummoning_freezingrain.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                endurance: 18.2,
+                cast: 2.03,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Hurricane",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Knockback", "To Hit Debuff"],
+            description: "You can summon a Hurricane. The wind and rain from this massive storm reduces the range and chance to hit of nearby foes. The massive winds of this storm continuously force foes away from you.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: PBAoE, Foe -Range, -To Hit, Repel, Knockback",
+            icon: "stormsummoning_hurricane.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.1625,
+                cast: 2.03,
+                buffDuration: 10.0,
+                tohitDebuff: 3.0
+            }
+        },
+        {
+            name: "Thunder Clap",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Stuns"],
+            description: "You can call forth a tremendous Thunder Clap that will Disorient most foes in a large area around you.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE, Foe Disorient",
+            icon: "stormsummoning_thunderclap.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.8,
+                recharge: 45.0,
+                endurance: 10.4,
+                cast: 2.37,
+                stun: 2.0
+            }
+        },
+        {
+            name: "Tornado",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Corruptor Archetype Sets", "Defense Debuff", "Knockback", "Pet Damage", "Recharge Intensive Pets", "Stuns", "Universal Damage Sets"],
+            description: "Conjures up a funnel cloud at a targeted location. The Tornado will chase down your foes, tossing them into the air and hurling them great distances. The victims are left Disoriented and with reduced Defense. The Tornado is a menacing sight, and can even cause panic among your foes.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Summon Tornado: PBAoE Minor DMG(Smash), Foe Knockback, Fear, Disorient",
+            icon: "stormsummoning_tornado.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.3,
+                range: 60.0,
+                recharge: 60.0,
+                endurance: 20.8,
+                cast: 1.17,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Lightning Storm",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Endurance Modification", "Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "You can create a massive Lightning Storm that will strike any foe that approaches you. Lightning from this storm can knock down and damage all nearby foes, and can even instill panic. Lightning bolts will continue to fall as long as the storm remains.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Create Storm: Ranged, High DMG(Energy), Foe -End",
+            icon: "stormsummoning_lightningstorm.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.4,
+                recharge: 90.0,
+                endurance: 31.2,
+                cast: 2.03,
+                buffDuration: 60.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/storm-summoning'] = CORRUPTOR_STORM_SUMMONING_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_STORM_SUMMONING_POWERSET = CORRUPTOR_STORM_SUMMONING_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/thermal-radiation.js ----
+;/**
+ * Thermal Radiation
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_THERMAL_RADIATION_POWERSET = {
+    name: "Thermal Radiation",
+    category: "Unknown",
+    description: "Thermal Radiation powerset",
+    icon: "thermal-radiation_set.png",
+    powers: [
+        {
+            name: "Fire Shield",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "Casts a Fire Shield on one of your allies and grants him damage resistance to Lethal, Smashing and Fire damage. Fire Shield also provides minimal resistance to Cold damage. You cannot stack multiple Fire Shields on the same target, however the shield can be improved by another ally using the same power. Can also be used in conjunction with your Plasma Shield. You cannot use this power on yourself.",
+            shortHelp: "Ranged, Ally +Res(Fire, Lethal, Smash, Cold)",
+            icon: "thermalradiation_fireshield.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 2.0,
+                endurance: 7.8,
+                cast: 1.17,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.0,
+                            ticks: 120
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 2.0,
+                            ticks: 120
+                        },
+                        {
+                            type: "Fire",
+                            scale: 2.0,
+                            ticks: 120
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.0,
+                            ticks: 120
+                        }
+                    ]
+                },
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Warmth",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You can use your Warmth to heal some of your wounds, and the wounds of your group. This power has a small radius, so your allies need to be near you if they wish to be affected.",
+            shortHelp: "PBAoE, Team +Heal",
+            icon: "thermalradiation_warmth.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 8.0,
+                endurance: 13.0,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Cauterize",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Heals a single targeted ally by cauterizing their wounds. You cannot use this power to heal yourself.",
+            shortHelp: "Ally Heal",
+            icon: "thermalradiation_cauterize.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 13.0,
+                cast: 2.27
+            }
+        },
+        {
+            name: "Plasma Shield",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "Envelope an ally in pure plasma. The Plasma Shield gives your ally resistance to Energy, Negative Energy, and Fire damage. You cannot stack multiple Plasma Shields on the same target, however the shield can be improved by another ally using the same power. Can also be used in conjunction with your Fire Shield. You cannot use this power on yourself.",
+            shortHelp: "Ranged, Ally +Res(Energy, Negative, Fire)",
+            icon: "thermalradiation_plasmashield.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 2.0,
+                endurance: 7.8,
+                cast: 1.17,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 2.0,
+                            ticks: 120
+                        },
+                        {
+                            type: "Energy",
+                            scale: 2.0,
+                            ticks: 120
+                        },
+                        {
+                            type: "Negative",
+                            scale: 2.0,
+                            ticks: 120
+                        }
+                    ]
+                },
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Power of the Phoenix",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Endurance Modification", "Healing", "Ranged AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "Revives a fallen ally. The fiery resurrection blasts nearby foes with an explosion and knocks them down and Disorients them. Your ally will revive with most of their Hit Points and Endurance. He will also be invulnerable for a brief time, as well as protected from XPDebt for 90 seconds.",
+            shortHelp: "Ally Rez, Special",
+            icon: "thermalradiation_phoenix.png",
+            powerType: "Click",
+            targetType: "Player Ally (Dead)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 15.0,
+                recharge: 300.0,
+                endurance: 49.4,
+                cast: 1.67,
+                buffDuration: 0.5
+            }
+        },
+        {
+            name: "Thaw",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "Warms an ally and frees him from any Disorient, Hold, Sleep, Slow, Confuse, Fear and Immobilize effects and leaves them resistant to such effects for a good while. Thaw also grants the target some resistance to Cold damage. Some of the effects of this power will improve with Multiple applications and as you advance in level.",
+            shortHelp: "Ally +Res(Disorient, Hold, Sleep, Immobilize, Confuse, Fear, Cold, Slow)",
+            icon: "thermalradiation_thaw.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 2.17,
+                dotDamage: {
+                    type: "Cold",
+                    scale: 1.0,
+                    ticks: 45
+                },
+                stun: 1.0,
+                stunDuration: 90.0,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Forge",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Forge a single ally target into a killing machine. Forge immensely enhances a single ally's Damage and chance to hit.",
+            shortHelp: "Ally +DMG, +To Hit",
+            icon: "thermalradiation_forge.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 60.0,
+                endurance: 10.4,
+                cast: 2.27,
+                tohitBuff: 2.0,
+                buffDuration: 120.0
+            }
+        },
+        {
+            name: "Heat Exhaustion",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: [],
+            description: "Overwhelm a single foe with waves of exhausting heat. The initial effect will drain the target of some Endurance, but the heat is so overwhelming that the affected target will be weakened. His Damage output, Endurance Recovery and Hit Point Regeneration will all be reduced.",
+            shortHelp: "Ranged Foe -DMG, -END, -Recovery, -Regeneration",
+            icon: "thermalradiation_heatexhaustion.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 120.0,
+                endurance: 13.0,
+                cast: 2.07,
+                buffDuration: 40.0
+            }
+        },
+        {
+            name: "Melt Armor",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff"],
+            description: "The searing heat from this power is enough to melt the armor and defenses of all targets in the affected area. Melt Armor significantly weakens the Defense and Damage Resistance of the affected targets.",
+            shortHelp: "Ranged (Targeted AoE), Foe -Res, -DEF",
+            icon: "thermalradiation_meltarmor.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 100.0,
+                endurance: 18.2,
+                cast: 1.5,
+                defenseDebuff: 2.0,
+                buffDuration: 40.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/thermal-radiation'] = CORRUPTOR_THERMAL_RADIATION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_THERMAL_RADIATION_POWERSET = CORRUPTOR_THERMAL_RADIATION_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/time-manipulation.js ----
+;/**
+ * Time Manipulation
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_TIME_MANIPULATION_POWERSET = {
+    name: "Time Manipulation",
+    category: "Unknown",
+    description: "Time Manipulation powerset",
+    icon: "time-manipulation_set.png",
+    powers: [
+        {
+            name: "Temporal Mending",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You mend the wounds of yourself and nearby allies by placing your bodies in a past or future state where they are far less injured. Temporal Mending will immediately heal its targets and continue to heal them for an equal amount over the next 6 seconds. Additionally, affected allies will gain some resistance to slow effects and regeneration debuffs. Allies affected by the Accelerated effect will receive additional healing from this power.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE, Ally +Heal, Heal Over Time, +Res(Slow, Regen Debuff)",
+            icon: "timemanipulation_temporalmending.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 18.0,
+                endurance: 13.0,
+                cast: 2.03,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Time Crawl",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "You're able to dramatically slow the time around a single enemy, reducing their movement speed and attack rate. Time is slowed to such an extreme that their wounds will take longer to heal, reducing their regeneration rate. Time Crawl applies the Delayed effect on its target. Debuff and control effects from other Time Manipulation powers are increased on targets affected by Delayed.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged Foe, -Speed, -Recharge, -Regen, Special",
+            icon: "timemanipulation_timecrawl.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 10.4,
+                cast: 1.6,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Time's Juncture",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Slow Movement", "To Hit Debuff"],
+            description: "You create a time dilation field around you causing enemies who get too close to be slowed to a crawl, their movement speed, damage and chance to hit will be decreased substantially. Enemies affected by Delayed have these affects increased.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: PBAoE Foe (-Damage, -Speed, -To Hit)",
+            icon: "timemanipulation_timesjuncture.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.39,
+                cast: 0.67,
+                tohitDebuff: 1.5,
+                buffDuration: 1.0
+            }
+        },
+        {
+            name: "Temporal Selection",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You distort time around an ally, selecting a period of time where their abilities are at their highest. Their damage, attack rate and regeneration rates are dramatically increased for a brief period. This power places the Accelerated effect on the target. While this is in effect, the target has any healing and healing over time effects from Temporal Mending or Chrono Shift significantly increased.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ally +Damage, +Recharge, +Regeneration",
+            icon: "timemanipulation_temporalselection.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 120.0,
+                endurance: 10.4,
+                cast: 2.27,
+                buffDuration: 120.0
+            }
+        },
+        {
+            name: "Distortion Field",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "Slow", "EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Holds", "Slow Movement"],
+            description: "You can choose an area to slow the flow of time down to a crawl. Enemies who enter the field will have their attack rate and speed slowed dramatically. In addition, affected enemies might become held as they are frozen in time. Targets affected by Time Crawl will have the chance to be held increased.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Location AoE), Foe(-Recharge, -Speed), Chance for Hold",
+            icon: "timemanipulation_distortionfield.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 60.0,
+                endurance: 14.56,
+                cast: 2.03,
+                buffDuration: 45.0
+            }
+        },
+        {
+            name: "Time Stop",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Holds"],
+            description: "You trap your target within the flow of time causing them to be held helpless. Even those resistant to the effects of Time Stop's hold will still have their regeneration rate and healing effects reduced for a brief period. Targets affected by Time Crawl will suffer from a more powerful hold, however its benefits are brief.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged Hold, Foe -Regen, -Heal",
+            icon: "timemanipulation_timestop.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 16.0,
+                endurance: 8.84,
+                cast: 2.17,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Farsight",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "To Hit Buff"],
+            description: "You give your allies a brief glimpse of the future and what is to come. This provides you and your team a moderate increase to your chance to hit and defense for a short period of time.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE Team, +To-Hit, +Defense(All), +Perception",
+            icon: "timemanipulation_farsight.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 240.0,
+                endurance: 15.6,
+                cast: 2.03,
+                buffDuration: 120.0,
+                tohitBuff: 1.0
+            }
+        },
+        {
+            name: "Slowed Response",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff"],
+            description: "You manipulate time around a targeted foe causing their reflexes to become slowed and sluggish. This causes them to have decreased defense and damage resistance. A target affected by Time Crawl will suffer from a more powerful effect.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged (Targeted AoE), Foe -Defense, -Resistance",
+            icon: "timemanipulation_slowedresponse.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 2.27,
+                buffDuration: 30.0,
+                defenseDebuff: 2.5
+            }
+        },
+        {
+            name: "Chrono Shift",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "You cause nearby allies to act more quickly by allowing them to slip through the time stream seamlessly. When Chrono Shift is activated, you and nearby allies will immediately recover a portion of your health and endurance. Chrono Shift will greatly increase the Recharge Speed of nearby allies for the duration of the power, additionally for a short while the flow of time will constantly undo a portion of your allies' wounds causing them to periodically recover health and recover endurance. An ally affected by Temporal Selection will recover additional health from Chrono Shift.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "PBAoE, Team +Recharge, Heal, +End, Moderate Healing over Time, +Recovery",
+            icon: "timemanipulation_chronoshift.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 360.0,
+                endurance: 20.8,
+                cast: 2.03,
+                buffDuration: 30.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/time-manipulation'] = CORRUPTOR_TIME_MANIPULATION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_TIME_MANIPULATION_POWERSET = CORRUPTOR_TIME_MANIPULATION_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/traps.js ----
+;/**
+ * Traps
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_TRAPS_POWERSET = {
+    name: "Traps",
+    category: "Unknown",
+    description: "Traps powerset",
+    icon: "traps_set.png",
+    powers: [
+        {
+            name: "Caltrops",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You toss a handful of Caltrops at a targeted location and spread the tiny metal spikes over a large area. Any enemy that pass over the Caltrops will be forced to move at a slower rate. They will also take some trivial Lethal damage over time.",
+            shortHelp: "Ranged (Location AoE), DoT(Lethal), Foe -Speed",
+            icon: "traps_droppedaoedebuffrunspeed.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 25.0,
+                recharge: 45.0,
+                endurance: 7.8,
+                cast: 1.07,
+                buffDuration: 45.0
+            }
+        },
+        {
+            name: "Web Grenade",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Immobilize", "Slow Movement"],
+            description: "Upon impact, the Web Grenade expels a strong, tenuous, and very sticky substance that can Immobilize most targets. This non-lethal device deals no damage and does not prevent targets from attacking, although their attack rate is Slowed. The Web can bring down flying entities and halts jumping.",
+            shortHelp: "Ranged, Target Immobilize, -Recharge, -Fly",
+            icon: "traps_targetedimmoblize.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.37,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Triage Beacon",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You can plant a Triage Beacon into the ground. The Beacon is immobile, but it emits a powerful healing aura. The Regeneration Rate of you, or your allies, will be greatly increased as long as you are near the Triage Beacon. The Beacon is invulnerable.",
+            shortHelp: "Place Beacon: PBAoE +Regen",
+            icon: "traps_droppedaoebuffregen.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 200.0,
+                endurance: 13.0,
+                cast: 2.77,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Acid Mortar",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Corruptor Archetype Sets", "Defense Debuff", "Ranged Damage", "Universal Damage Sets"],
+            description: "You can place a small Mortar on the ground. If an enemy passes nearby, the Mortar will fire an Acid grenade at the target. The grenade will explodes in a small shower of acid on impact. This acid eats through armor, causing minor damage over time. It reduces the target's Defense as well as his Damage Resistance. The mortar will last up to 60 seconds and will fire up to 10 grenades. It can be destroyed by your foes.<br>",
+            shortHelp: "Place Trap: Ranged (AoE), DoT(Toxic), Foe -Res(All), -DEF",
+            icon: "traps_droppedaoedebuffdefense.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 13.0,
+                cast: 2.77,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Force Field Generator",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "You can build a Force Field Generator Drone. The Drone will generate a Dispersion Bubble that gives all nearby allies increased Defense against all attacks including Psionic. The Dispersion Bubble also protects allies from Immobilization, Disorient, and Hold effects. The Done will follow you and can be buffed and healed or even destroyed like any friendly entity. However, the Drone is not a Henchman and cannot be given commands. You can only ever have one Force Field Generator.<br>",
+            shortHelp: "Place Drone: PBAoE, Team +DEF, +Res(Hold, Immobilize, Disorient)",
+            icon: "traps_droppedaoebuffdefense.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 20.0,
+                recharge: 15.0,
+                endurance: 13.0,
+                cast: 2.03,
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Poison Trap",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Holds"],
+            description: "You can build a Poison Gas Trap on the ground. Any foes that pass near the Poison Trap will cause it to detonate and release its toxic vapors. The poison is a very noxious gas, and any foes in the affected area may start to choke or even vomit. Affected Foes Regeneration rate and attack rate will be reduced as well. The trap is almost impossible to detect, but it is fragile and may be set off by an enemy's explosion. Even if destroyed, the Trap will detonate.<br>",
+            shortHelp: "Place Trap: PBAoE Foe Choke, Vomit, -Regen, -Recharge",
+            icon: "traps_droppedaoedebuffattackspeed.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 13.0,
+                cast: 2.77,
+                buffDuration: 260.0
+            }
+        },
+        {
+            name: "Seeker Drones",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Corruptor Archetype Sets", "Pet Damage", "Stuns", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You create two Seeker Drones. These Seeker Drones will follow you until they detect an enemy and then they will zero in on their targets and detonate on impact. The small explosive flash of energy does only minor damage, but the concussion can weaken foes. Affected targets will have reduced Damage, Accuracy and Perception and may even be Disoriented for a short while. You can only ever have Two Seeker Drones out at one time and they can be destroyed by your foes.<br>",
+            shortHelp: "Summon Seekers: Ranged Disorient, -DMG, -ACC, -Perception, DMG(Energy)",
+            icon: "traps_droppedaoedebuffdamage.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.2,
+                range: 60.0,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 2.03,
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Trip Mine",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You can place a Trip Mine on the ground. Any foes that pass near the Trip Mine will cause it to explode, severely damaging all nearby foes and sending them flying. The Trip Mine is almost impossible to detect, but it is fragile and may be set off by an enemy's explosion. Even if destroyed, the Trip Mine will detonate. Setting a mine is delicate work, and if you are interrupted, you will fail.",
+            shortHelp: "Place Mine: PBAoE, DMG(Lethal/Fire), Foe Knockback",
+            icon: "traps_droppedaoedamage.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                recharge: 20.0,
+                endurance: 13.0,
+                cast: 5.0,
+                buffDuration: 260.0
+            }
+        },
+        {
+            name: "Temporal Bomb",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Endurance Modification", "Knockback", "Melee AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You can place a Temporal Bomb on the ground. The Temporal Bomb will detonate once the power is activated a second time, resulting in a massive explosion that can damage all nearby foes and send them flying, as well as create a Temporal Bubble that speeds up yourself and allies, while slowing down all enemies inside. If used while targeting an enemy in melee range, you can attach the Temporal Bomb to them instead!<br><br>The Temporal Bomb is small, and almost impossible to detect.",
+            shortHelp: "Place Bomb: PBAoE, DMG(Lethal/Fire), Foe Knockback, Special",
+            icon: "traps_remotebomb.png",
+            powerType: "Click",
+            targetType: "Anything",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 2.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/traps'] = CORRUPTOR_TRAPS_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_TRAPS_POWERSET = CORRUPTOR_TRAPS_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/trick-arrow.js ----
+;/**
+ * Trick Arrow
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_TRICK_ARROW_POWERSET = {
+    name: "Trick Arrow",
+    category: "Unknown",
+    description: "Trick Arrow powerset",
+    icon: "trick-arrow_set.png",
+    powers: [
+        {
+            name: "Entangling Arrow",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Immobilize", "Slow Movement"],
+            description: "You entangle a targeted foe causing their reflexes to become slowed and sluggish. This grounds them and causes them to have decreased movement speed and damage resistance. Weaker foes will also be immobilized.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, Target Immobilize, -Res(All), -Fly, Slow",
+            icon: "trickarrow_immobilize.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Flash Arrow",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "To Hit Debuff"],
+            description: "This arrow explodes in a dazzling flash of light and sound. The targets are so blinded that they can hardly see a thing. Most villains will not be able to see past normal melee range, although some may have better perception. If the villains are attacked, they will be alerted to your presence, but will suffer a penalty to chance to hit.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Targeted AoE), Foe -Visibility, -To Hit",
+            icon: "trickarrow_blind.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 7.8,
+                cast: 1.0,
+                tohitDebuff: 0.5,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Glue Arrow",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "This arrow carries a cartridge of intensely sticky glue, which explodes on impact. The glue Slows the movement and attack rates of any foes in the area.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Location AoE), Foe -Speed, -Recharge",
+            icon: "trickarrow_slow.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                endurance: 7.8,
+                cast: 1.16,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Ice Arrow",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Holds", "Slow Movement"],
+            description: "This arrow can freeze a single foe in a block of ice. The target is frozen solid, helpless, and can be attacked. More powerful foes may not be Held, but all affected targets will be Slowed, have their secondary effects weakened, and damage output reduced.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Foe Hold, -SPD, -Recharge, -DMG, -Special",
+            icon: "trickarrow_hold.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 18.0,
+                endurance: 8.528,
+                cast: 1.67,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Poison Gas Arrow",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Sleep", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Sleep"],
+            description: "This arrow carries a capsule cloud of poisonous gas, which explodes on impact and weakens all foes in its vicinity. Affected foes damage potential will be severely reduced. Some foes will react badly to the poison and choke for a time, though they will react if attacked.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged AoE, Foe -DMG, Sleep",
+            icon: "trickarrow_debuffdamage.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.5,
+                range: 70.0,
+                recharge: 45.0,
+                endurance: 10.4,
+                cast: 1.16,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Acid Arrow",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Corruptor Archetype Sets", "Defense Debuff", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "This arrow explodes in a small shower of acid on impact. This acid eats through armor, causing damage over time, reducing target's Defense as well as their resistance to debuffs, while making it harder for them to be healed.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged AoE Minor DoT(Toxic), Foe -Res(Special), Res(Heal), -DEF",
+            icon: "trickarrow_debuffdefense.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 20.0,
+                endurance: 7.8,
+                cast: 1.83,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.01,
+                    ticks: 20
+                },
+                buffDuration: 20.0,
+                defenseDebuff: 2.0
+            }
+        },
+        {
+            name: "Disruption Arrow",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "This arrow plants a sonic resonator at a target location. The vibrations of the resonator weaken the Damage Resistance and Max Endurance of all nearby foes.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Location AoE), -Res(All), -MaxEnd",
+            icon: "trickarrow_debuffdamres.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 30.0,
+                endurance: 14.56,
+                cast: 1.16,
+                buffDuration: 45.0
+            }
+        },
+        {
+            name: "Oil Slick Arrow",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Defense Debuff", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "On impact, this arrow creates an oil slick that Slows foes in the area and may cause them to slip and fall. The oil slick is very flammable and may burst into flames if fire is used near it.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged (Location AoE), Knockdown, -Speed, -DEF, +Special",
+            icon: "trickarrow_knockdown.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 180.0,
+                endurance: 15.6,
+                cast: 1.16,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "EMP Arrow",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Holds"],
+            description: "EMP Arrow unleashes a massive pulse of electromagnetic energy on impact. Allies that enter the field will see an increase to their damage resistances against all damage except Toxic. They are also protected from status effects, knockbacks, endurance drain, recovery debuffs and recharge debuffs. Only one EMP Field can be sustained at once. This EMP will affect enemy machines adversively, and is even powerful enough to affect synaptic brain patterns. It will incapacitate all foes in its radius. Machines and robots are more likely to take high damage.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "AoE, Foe Hold, Special",
+            icon: "trickarrow_stun.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 300.0,
+                endurance: 23.4,
+                cast: 1.83,
+                buffDuration: 240.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/trick-arrow'] = CORRUPTOR_TRICK_ARROW_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_TRICK_ARROW_POWERSET = CORRUPTOR_TRICK_ARROW_POWERSET;
+}
+
+// ---- js/data/powersets/corruptor/water-blast.js ----
+;/**
+ * Water Blast
+ * Character Level: 50
+ * Archetype: corruptor
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const CORRUPTOR_WATER_BLAST_POWERSET = {
+    name: "Water Blast",
+    category: "Unknown",
+    description: "Water Blast powerset",
+    icon: "water-blast_set.png",
+    powers: [
+        {
+            name: "Aqua Bolt",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Corruptor Archetype Sets", "Defense Debuff", "Ranged Damage", "Universal Damage Sets"],
+            description: "You strike your foe with a rapid blast of freezing cold water causing Cold and Smashing damage as well as reducing their defense. Aqua Bolt builds 1 Tidal Power.",
+            shortHelp: "Ranged, DMG(Cold/Smash), Foe -Def, +Wet, Self +Tidal Power",
+            icon: "waterblast_aquabolt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 3.6048999999999998
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.515
+                        }
+                    ],
+                    scale: 4.1198999999999995
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Hydro Blast",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You briefly focus before releasing an intense blast of chilling water at your foe that causes Cold and Smashing damage. Affected foes will have their movement speed reduced briefly and have a chance to be knocked down. Hydro Blast builds 1 Tidal Power.",
+            shortHelp: "Ranged, DMG(Cold/Smash), Foe -Speed, Knockdown, +Wet, Self +Tidal Power",
+            icon: "waterblast_hydroblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 7.0,
+                endurance: 7.696,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 5.8256
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.8322
+                        }
+                    ],
+                    scale: 6.6578
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Water Burst",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You cause water to violently explode from beneath your target's feet blasting all foes nearby with freezing cold water. Affected targets will suffer Cold and Smashing damage, have their movement speed reduced and may be knocked down by the force of the blast. Water Burst consumes all Tidal Power. It will deal additional cold damage and have a greater chance to knockdown for each stack of Tidal Power. If you have 3 stacks of Tidal Power Water Burst will have a 100% chance to knock the targets into the air.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Cold/Smash), Foe -Speed, Knockdown, +Wet, Self -Tidal Power",
+            icon: "waterblast_waterburst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.73,
+                damage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 3.4558
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.3981
+                        }
+                    ],
+                    scale: 3.8539
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Whirlpool",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Corruptor Archetype Sets", "Defense Debuff", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You create a violent whirlpool at the target location causing Cold damage over time, reducing the targets' speed and defense for a short time. Whirlpool grants 1 stack of Tidal Power.",
+            shortHelp: "Ranged (Location AoE), DoT(Cold), -Speed, -Defense, Self +Tidal Power",
+            icon: "waterblast_whirlpool.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                endurance: 15.6,
+                cast: 2.03,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Tidal Forces",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "You draw tidal energies into yourself thus boosting your chance to hit significantly, slightly boosting your damage and granting yourself +3 Tidal Power.",
+            shortHelp: "Self +To Hit, +DMG",
+            icon: "waterblast_tidalforces.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 5.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Dehydrate",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Accurate Healing", "Corruptor Archetype Sets", "Defense Debuff", "Healing", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You rapidly dehydrate your target, causing Cold and Smashing damage, reducing their movement speed and defense as well as causing a measure of Cold damage over time. You are then healed over time for a moderate amount of health. Dehydrate grants 1 stack of Tidal Power if you have 2 or less. Dehydrate will consume all stacks of Tidal Power if you have 3, but the power's heal over time effect is increased by 50%.",
+            shortHelp: "Ranged, DMG(Cold/Smash), Foe -Speed, -Defense, DoT(Cold), Self +Heal Over Time, +/- Tidal Power",
+            icon: "waterblast_dehydrate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.87,
+                damage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 5.9406
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.7572
+                        }
+                    ],
+                    scale: 6.6978
+                },
+                dotDamage: {
+                    type: "Cold",
+                    scale: 0.2589,
+                    ticks: 4
+                },
+                healing: {
+                    scale: 44.17450124999999,
+                    perTarget: true
+                },
+                buffDuration: 4.1,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Water Jet",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You spray a concentrated torrent of water toward your target that causes Cold and Smashing damage as well as reducing your target's movement speed. If you have 2 or less Tidal Power, you will gain a stack of Tidal Power. If you have 3 Tidal Power and you activate this power, it will have an enhanced effect causing Water Jet to cast slightly faster and immediately reset the recharge of Water Jet. Water Jet's enhanced effect can be used once every 8 seconds.",
+            shortHelp: "Ranged, DMG(Cold/Smash), Foe -Speed, +Wet, Self +/-Tidal Power",
+            icon: "waterblast_waterjet.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.43
+            }
+        },
+        {
+            name: "Steam Spray",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Corruptor Archetype Sets", "Defense Debuff", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You spray scalding hot steam in a cone in front of you badly burning affected targets. Steam Spray causes Fire damage, Fire damage over time and reduces the target's Defense slightly. Steam Spray grants 1 stack of Tidal Power.",
+            shortHelp: "Ranged (Cone), DMG(Fire), Foe -Defense, DoT(Fire), +Wet, Self +Tidal Power",
+            icon: "waterblast_steamspray.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.8727,
+            effects: {
+                accuracy: 1.2,
+                range: 40.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 2.53,
+                damage: {
+                    type: "Fire",
+                    scale: 2.8810000000000002
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 3.0260000000000002,
+                    ticks: 1
+                },
+                buffDuration: 0.6,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Geyser",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Corruptor Archetype Sets", "Knockback", "Ranged AoE Damage", "Slow Movement", "Stuns", "Universal Damage Sets"],
+            description: "You cause the earth to erupt beneath your target's feet as a Geyser of scalding hot water burns your foes and tosses them violently into the air. Geyser causes Fire and Smashing damage before causing Fire damage over time as well as reducing their movement speed. Geyser consumes all Tidal Power. Both the initial damage and damage over time portions of this power will be increased and have a scaling chance to disorient for each stack of Tidal Power. If you have 3 stacks of Tidal Power, Geyser will have a 100% chance to disorient affected targets.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Fire/Smash), Foe DoT(Fire), +Wet, -Speed, Knock Up, Disorient, Self -Tidal Power",
+            icon: "waterblast_geyser.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.4,
+                range: 80.0,
+                recharge: 125.0,
+                endurance: 20.8,
+                cast: 2.93,
+                damage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 7.5684000000000005
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.8921
+                        }
+                    ],
+                    scale: 8.4605
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.6028,
+                    ticks: 10
+                },
+                stun: 3.0,
+                buffDuration: 5.1
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['corruptor/water-blast'] = CORRUPTOR_WATER_BLAST_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.CORRUPTOR_WATER_BLAST_POWERSET = CORRUPTOR_WATER_BLAST_POWERSET;
+}
+
+// ---- js/data/epics/corruptor/corruptor_fire_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Fire Mastery
+ * Archetype: Corruptor
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\corruptor_fire_mastery
+ */
+
+const EPIC_CORRUPTOR_FIRE_MASTERY = {
+  "id": "corruptor_fire_mastery",
+  "name": "Fire Mastery",
+  "displayName": "Fire Mastery",
+  "archetype": "corruptor",
+  "description": "You have Mastery over Fire and Flame to control your foes and to add some much needed armor and defense.",
+  "icon": "flame_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Consume",
+      "fullName": "Epic.Corruptor_Fire_Mastery.Consume",
+      "rank": 1,
+      "available": 34,
+      "description": "You can drain body heat from all nearby foes in order to replenish your own Endurance. The more foes affected, the more Endurance is gained. Foes suffer minimal Fire damage",
+      "shortHelp": "PBAoE, DMG(Fire), Self +End",
+      "icon": "flamingshield_consume.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Corruptor",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Melee AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 360.0,
+        "endurance": 0.65,
+        "activationTime": 2.03,
+        "effectArea": "AoE",
+        "radius": 20.0,
+        "recovery": {
+          "scale": 0.05,
+          "table": "Melee_Ones"
+        }
+      }
+    },
+    {
+      "name": "Char",
+      "fullName": "Epic.Corruptor_Fire_Mastery.Char",
+      "rank": 2,
+      "available": 34,
+      "description": "Incapacitates a distant foe by Charring him with smoldering soot and cinders. The target is left helpless, choking on the soot.",
+      "shortHelp": "Ranged, DoT (Fire), Foe Hold",
+      "icon": "flamemastery_soot.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Corruptor",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Hold",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Holds",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 1.07,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "hold": 3.0
+        },
+        "damage": {
+          "type": "Fire",
+          "scale": 0.4218,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Fire Shield",
+      "fullName": "Epic.Corruptor_Fire_Mastery.Fire_Shield",
+      "rank": 3,
+      "available": 37,
+      "description": "While this power is active, you get a good resistance to Lethal, Smashing and Fire damage. Fire Shield also provides minimal resistance to Cold damage. You must be level 38 and have one other Fire Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Self +Res(Fire, Lethal, Smash, Cold)",
+      "icon": "flamingshield_flamingshield.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 1.67,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "smashing": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "psionic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Rise of the Phoenix",
+      "fullName": "Epic.Corruptor_Fire_Mastery.Rise_of_the_Phoenix",
+      "rank": 4,
+      "available": 40,
+      "description": "If you are defeated, you can rise from the ashes. The fiery resurrection blasts nearby foes with an explosion and knocks them down. You will revive with about half of your Hit Points and Endurance. Rise of the Phoenix will actually leave you invulnerable for a brief time and protected from XP Debt for 20 seconds. You must be level 41 and have one other Fire Mastery Powers before selecting this power.<br>",
+      "shortHelp": "Self Rez, Special",
+      "icon": "flamingshield_riseofthephoenix.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "Recharge",
+        "Heal",
+        "Damage"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Healing",
+        "Melee AoE Damage",
+        "Stuns",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 300.0,
+        "activationTime": 1.5,
+        "effectArea": "Location",
+        "damage": {
+          "type": "Heal",
+          "scale": 5.0,
+          "table": "Melee_HealSelf"
+        },
+        "protection": {
+          "immobilize": 50.0
+        }
+      }
+    },
+    {
+      "name": "Greater Fire Sword",
+      "fullName": "Epic.Corruptor_Fire_Mastery.Greater_Fire_Sword",
+      "rank": 5,
+      "available": 43,
+      "description": "Your mastery of fire allows you to create an enhanced Sword of Fire that can set foes ablaze. Successful attacks from the Greater Fire Sword will ignite your target, dealing damage over time. You must be level 44 and have two other Fire Mastery Powers before selecting this power.",
+      "shortHelp": "Melee, DMG(Fire)",
+      "icon": "firemastery_greaterfiresword.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Melee Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.2,
+        "range": 7.0,
+        "recharge": 24.0,
+        "endurance": 19.825,
+        "activationTime": 1.37,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Fire",
+          "scale": 0.2,
+          "table": "Melee_Damage"
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['corruptor_fire_mastery'] = EPIC_CORRUPTOR_FIRE_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/corruptor/corruptor_leviathan_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Leviathan Mastery
+ * Archetype: Corruptor
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\corruptor_leviathan_mastery
+ */
+
+const EPIC_CORRUPTOR_LEVIATHAN_MASTERY = {
+  "id": "corruptor_leviathan_mastery",
+  "name": "Leviathan Mastery",
+  "displayName": "Leviathan Mastery",
+  "archetype": "corruptor",
+  "description": "Captain Mako has granted you access to the power of the Leviathan. The Leviathan is an ancient gargantuan entity who slumbers under Sharkhead Isle. Worshiped by the Coralax, the Leviathan has given Captain Mako many abilities and now he has taught you ho",
+  "icon": "corruptor_leviathan_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "School of Sharks",
+      "fullName": "Epic.Corruptor_Leviathan_Mastery.School_of_Sharks",
+      "rank": 1,
+      "available": 34,
+      "description": "You can call forth a school of vicious Shark Spirits that will swim out in a cone formation and will encircle your foes, draining their spirit energy. The encircling Shark Spirits will immobilize most foes while they deal negative energy damage over time.",
+      "shortHelp": "Ranged (Cone), DoT(Negative), Foe Immobilize",
+      "icon": "arachnos_patron_coneimmobilize.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Corruptor) || ($archetype == @Class_Defender))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Immobilize",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 50.0,
+        "recharge": 16.0,
+        "endurance": 10.751,
+        "activationTime": 2.37,
+        "effectArea": "Cone",
+        "radius": 50.0,
+        "arc": 0.5236,
+        "damage": {
+          "type": "Lethal",
+          "scale": 0.124,
+          "table": "Ranged_PvPDamage"
+        },
+        "protection": {
+          "immobilize": 3.0
+        },
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Shark Skin",
+      "fullName": "Epic.Corruptor_Leviathan_Mastery.Shark_Skin",
+      "rank": 2,
+      "available": 34,
+      "description": "The power of the Leviathan Mako has shown you seems to have no end. Shark Skin improves your damage resistance to Lethal, Smashing and cold damage.",
+      "shortHelp": "Toggle: Self +Res(Smash, Lethal, Cold)",
+      "icon": "arachnos_patron_resistbuff.png",
+      "powerType": "Toggle",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Corruptor) || ($archetype == @Class_Defender))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 0.67,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "smashing": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "psionic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Hibernate",
+      "fullName": "Epic.Corruptor_Leviathan_Mastery.Hibernate",
+      "rank": 3,
+      "available": 37,
+      "description": "When you activate this power, you encase yourself in a block of solid ice, making yourself invulnerable, though you are frozen solid and cannot act. While Hibernating within this block of ice, you heal damage and recover endurance at an incredible rate. You can emerge at will by deactivating the power, but you cannot Hibernate for more than 30 seconds. If you activate this power while in the air, you will fall. You must be level 38 and have one other Leviathan Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Self +Regeneration, +Recovery, Invulnerable; Self Hold",
+      "icon": "arachnos_patron_selfbuffresistancephysical.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Recharge",
+        "Heal"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Healing"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 240.0,
+        "endurance": 0.1625,
+        "activationTime": 0.07,
+        "effectArea": "SingleTarget",
+        "regeneration": {
+          "scale": 10.0,
+          "table": "Melee_Ones"
+        },
+        "recovery": {
+          "scale": 4.0,
+          "table": "Melee_Ones"
+        },
+        "resistance": {},
+        "protection": {
+          "knockup": 1.0,
+          "knockback": 1.0,
+          "immobilize": 1000.0
+        }
+      }
+    },
+    {
+      "name": "Spirit Shark Jaws",
+      "fullName": "Epic.Corruptor_Leviathan_Mastery.Spirit_Shark_Jaws",
+      "rank": 4,
+      "available": 40,
+      "description": "You can summon a massive Spirit Shark that will attack your foe from below. The Shark will grip your foe with its massive jaws and attempt to hold the target while it mauls it, dealing lethal Damage over Time. Flying Targets will likely be pulled to the ground. You must be level 41 and have one other Leviathan Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged, DoT(Lethal), Foe Hold, -Fly",
+      "icon": "arachnos_patron_targetedhold.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Hold",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Holds",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 1.87,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "hold": 3.0
+        },
+        "damage": {
+          "type": "Lethal",
+          "scale": 0.2604,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Summon Coralax",
+      "fullName": "Epic.Corruptor_Leviathan_Mastery.Summon_Coralax",
+      "rank": 5,
+      "available": 43,
+      "description": "Captain Mako has shown you how to summon a Coralax Red Hybrid to do your bidding. The Coralax are humans who have been infected with living coral. Your access to this Hybrid is very limited. You can only summon it once every 15 minutes and it will leave after 4 minutes, or if you exit a zone or mission. You must be level 44 and have two other Leviathan Mastery Powers before selecting this power.",
+      "shortHelp": "Summon Hybrid: Ranged DMG(Psionic)",
+      "icon": "arachnos_patron_summononepet.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Immobilize",
+        "Knockback",
+        "Pet Damage",
+        "Recharge Intensive Pets",
+        "Slow Movement",
+        "Stuns",
+        "To Hit Debuff",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 900.0,
+        "endurance": 26.0,
+        "activationTime": 3.2,
+        "effectArea": "Location"
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['corruptor_leviathan_mastery'] = EPIC_CORRUPTOR_LEVIATHAN_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/corruptor/corruptor_mace_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Mace Mastery
+ * Archetype: Corruptor
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\corruptor_mace_mastery
+ */
+
+const EPIC_CORRUPTOR_MACE_MASTERY = {
+  "id": "corruptor_mace_mastery",
+  "name": "Mace Mastery",
+  "displayName": "Mace Mastery",
+  "archetype": "corruptor",
+  "description": "Black Scorpion has granted you access to the advanced technology of the Nullifier Mace. The signature weapon of the Bane Spider Commandos, it is not a typical clumsy mace. The Bane Mace is capable of firing a variety of energy projectiles and grenades. It can even be modified to summon and command some or Black Scorpion's RV technologies.",
+  "icon": "corruptor_mace_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Web Envelope",
+      "fullName": "Epic.Corruptor_Mace_Mastery.Web_Envelope",
+      "rank": 1,
+      "available": 34,
+      "description": "The Executioner's Mace can lob a modified Web Grenade. Upon impact, the Web Grenade expels a strong, tenuous, and very sticky substance that can Immobilize most targets in a wide area. This device deals toxic damage over time and does not prevent targets from attacking, although their attack rate is Slowed. The Web can bring down flying entities and halts jumping.",
+      "shortHelp": "Ranged (Targeted AoE) DoT(Toxic), Immobilize, -Recharge, -Fly, -Jump",
+      "icon": "arachnos_patron_rangedaoeimmobilize.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Corruptor) || ($archetype == @Class_Defender))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Immobilize",
+        "Ranged AoE Damage",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 50.0,
+        "recharge": 16.0,
+        "endurance": 10.751,
+        "activationTime": 2.0,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "protection": {
+          "immobilize": 3.0
+        },
+        "damage": {
+          "type": "Toxic",
+          "scale": 0.2503,
+          "table": "Ranged_PvPDamage"
+        },
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Scorpion Shield",
+      "fullName": "Epic.Corruptor_Mace_Mastery.Scorpion_Shield",
+      "rank": 2,
+      "available": 34,
+      "description": "Black Scorpion's technologies are impressive indeed. This energy shield grants you Defense to Lethal, Smashing and Energy attacks, as well as improves your damage resistance to Toxic damage.",
+      "shortHelp": "Toggle: Self, +Def(Smash,Lethal,Energy), +Res(Toxic)",
+      "icon": "arachnos_patron_defensebuff.png",
+      "powerType": "Toggle",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Corruptor) || ($archetype == @Class_Defender))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Defense Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 2.0,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Focused Accuracy",
+      "fullName": "Epic.Corruptor_Mace_Mastery.Focused_Accuracy",
+      "rank": 3,
+      "available": 37,
+      "description": "When this power is activated, the Villain focuses their senses to dramatically improve their range and accuracy. Additionally, Focused Accuracy increase your Perception, allowing you to better see stealthy foes. It also grants you resistance to powers that DeBuff your Accuracy. Focused Accuracy is a toggle power and must be activated and deactivated manually. Like all toggle powers, while active, Focused Accuracy drains Endurance while active. You must be level 38 and have one other Mace Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Self +To Hit, +ACC, +Perception, Res(DeBuff To Hit)",
+      "icon": "arachnos_patron_selftohitbuff.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "To Hit Buff"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 10.0,
+        "endurance": 0.195,
+        "activationTime": 1.17,
+        "effectArea": "SingleTarget",
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Web Cocoon",
+      "fullName": "Epic.Corruptor_Mace_Mastery.Web_Cocoon",
+      "rank": 4,
+      "available": 40,
+      "description": "The Bane Mace can fire a more powerful version the common web grenade. The sinewy fibers of this grenade are strong enough to completely Hold one target. Targets able to resist the Hold are still likely to have their attack and movement speed dramatically slowed. Web Cocoon can also bring down flying targets and prevent foes from jumping. You must be level 41 and have one other Mace Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged, Foe Hold, -Recharge, -Fly, -Jump, Slow, DoT(Toxic)",
+      "icon": "arachnos_patron_targetedhold.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Hold",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Holds",
+        "Ranged Damage",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 60.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 2.0,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "hold": 3.0
+        },
+        "damage": {
+          "type": "Toxic",
+          "scale": 0.345,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Summon Disruptor",
+      "fullName": "Epic.Corruptor_Mace_Mastery.Summon_Disruptor",
+      "rank": 5,
+      "available": 43,
+      "description": "Black Scorpion has granted you an Arachnobot Disruptor for you to command. Arachnobots were created by Arachnos Orb Weavers to take down particularly powerful super-powered threats. Your access to this Arachnobot is very limited. You must be level 44 and have two other Mace Mastery Powers before selecting this power.",
+      "shortHelp": "Summon Arachnobot: Ranged DMG(Energy)",
+      "icon": "arachnos_patron_summononepet.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "Hold",
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Holds",
+        "Immobilize",
+        "Pet Damage",
+        "Recharge Intensive Pets",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 900.0,
+        "endurance": 26.0,
+        "activationTime": 3.03,
+        "effectArea": "Location"
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['corruptor_mace_mastery'] = EPIC_CORRUPTOR_MACE_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/corruptor/corruptor_mu_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Mu Mastery
+ * Archetype: Corruptor
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\corruptor_mu_mastery
+ */
+
+const EPIC_CORRUPTOR_MU_MASTERY = {
+  "id": "corruptor_mu_mastery",
+  "name": "Mu Mastery",
+  "displayName": "Mu Mastery",
+  "archetype": "corruptor",
+  "description": "Scirocco has taught you the ancient powers of the Mu. In their eternal struggle against the Oranbega, the Mu have unlocked many mystical powers, including their very signature crimson lightning. Now you possess their secrets.",
+  "icon": "corruptor_mu_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Power Sink",
+      "fullName": "Epic.Corruptor_Mu_Mastery.Power_Sink",
+      "rank": 1,
+      "available": 34,
+      "description": "Power Sink leeches energy directly from the bodies of all nearby foes, draining their Endurance. Each foe you draw energy from increases your Endurance. If there are no foes within range, you will not gain any Endurance.",
+      "shortHelp": "PBAoE, Self +End, Foe -End",
+      "icon": "arachnos_patron_pbaoedrain.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Corruptor) || ($archetype == @Class_Defender))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 120.0,
+        "endurance": 16.25,
+        "activationTime": 2.03,
+        "effectArea": "AoE",
+        "radius": 10.0,
+        "recovery": {
+          "scale": -1.0,
+          "table": "Melee_Ones"
+        }
+      }
+    },
+    {
+      "name": "Charged Armor",
+      "fullName": "Epic.Corruptor_Mu_Mastery.Charged_Armor",
+      "rank": 2,
+      "available": 34,
+      "description": "When you toggle on this power, you are surrounded in a charged field that makes you highly resistant to Smashing, Lethal and Energy damage.",
+      "shortHelp": "Toggle: Self +Res(Smash, Lethal, Energy)",
+      "icon": "arachnos_patron_resistbuff.png",
+      "powerType": "Toggle",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Corruptor) || ($archetype == @Class_Defender))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 0.67,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "smashing": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "psionic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Electric Shackles",
+      "fullName": "Epic.Corruptor_Mu_Mastery.Electric_Shackles",
+      "rank": 3,
+      "available": 37,
+      "description": "Electric Shackles binds a foes limbs, leaving the target held and helpless. The target is drained of some Endurance and some of that Endurance may be transferred back to you. You must be level 38 and have one other Mu Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged, DMG(Energy), Foe Hold, -End",
+      "icon": "arachnos_patron_targetedhold.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "Hold",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Holds",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 2.17,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "hold": 3.0
+        },
+        "damage": {
+          "type": "Energy",
+          "scale": 0.4113,
+          "table": "Ranged_PvPDamage"
+        },
+        "recovery": {
+          "scale": -1.0,
+          "table": "Ranged_Ones"
+        }
+      }
+    },
+    {
+      "name": "Energize",
+      "fullName": "Epic.Corruptor_Mu_Mastery.Conserve_Power",
+      "rank": 4,
+      "available": 40,
+      "description": "You can channel a tremendous amount of electricity through your body for a short period of time. Doing so will heal some hit points, reduce the endurance cost of your powers and boost your regeneration for a short time. You must be level 41 and have one other Mu Mastery Powers before selecting this power.",
+      "shortHelp": "Self Endurance Discount, Heal, +Regen",
+      "icon": "arachnos_patron_conservepower.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Heal"
+      ],
+      "allowedSetCategories": [
+        "Healing"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 240.0,
+        "endurance": 12.714,
+        "activationTime": 1.17,
+        "effectArea": "SingleTarget",
+        "regeneration": {
+          "scale": 1.0,
+          "table": "Melee_Ones"
+        },
+        "damage": {
+          "type": "Heal",
+          "scale": 2.5,
+          "table": "Melee_HealSelf"
+        }
+      }
+    },
+    {
+      "name": "Summon Adept",
+      "fullName": "Epic.Corruptor_Mu_Mastery.Summon_Adept",
+      "rank": 5,
+      "available": 43,
+      "description": "Scirocco has shown you how to call upon a mystical Mu Adept to assist you. The Mu pulse with the blood of their slaughtered ancestors in their veins, and are well practiced in the dark arts. Your access to this Adept is very limited. You must be level 44 and have two other Mu Mastery Powers before selecting this power.",
+      "shortHelp": "Summon Mu Adept: Ranged DMG(Energy)",
+      "icon": "arachnos_patron_summononepet.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "Hold",
+        "EnduranceReduction",
+        "Sleep",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Holds",
+        "Pet Damage",
+        "Recharge Intensive Pets",
+        "Sleep",
+        "Stuns",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 900.0,
+        "endurance": 26.0,
+        "activationTime": 1.17,
+        "effectArea": "Location"
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['corruptor_mu_mastery'] = EPIC_CORRUPTOR_MU_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/corruptor/corruptor_soul_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Soul Mastery
+ * Archetype: Corruptor
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\corruptor_soul_mastery
+ */
+
+const EPIC_CORRUPTOR_SOUL_MASTERY = {
+  "id": "corruptor_soul_mastery",
+  "name": "Soul Mastery",
+  "displayName": "Soul Mastery",
+  "archetype": "corruptor",
+  "description": "Ghost Widow has granted you access to the power of darkness and souls. She has shown you how to use the souls of your victims to destroy your enemies. This has granted you access to powers and abilities you have never had before.",
+  "icon": "corruptor_soul_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Soul Storm",
+      "fullName": "Epic.Corruptor_Soul_Mastery.Soul_Storm",
+      "rank": 1,
+      "available": 34,
+      "description": "Like Ghost Widow, you can summon the souls of your victims to do your bidding. Soul Storm enraptures a single target Holding them while their life-force is drained from their body. You must be level 41 and have Soul Drain or Dark Embrace before selecting this power.",
+      "shortHelp": "Ranged, DoT(Negative), Foe Hold",
+      "icon": "arachnos_patron_targetedhold.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Corruptor) || ($archetype == @Class_Defender))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Hold",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Holds",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 2.17,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "hold": 3.0
+        },
+        "damage": {
+          "type": "Negative",
+          "scale": 0.2879,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Dark Embrace",
+      "fullName": "Epic.Corruptor_Soul_Mastery.Dark_Embrace",
+      "rank": 2,
+      "available": 34,
+      "description": "You tap into the energy of the Netherworld to protect yourself from damage. This Dark Embrace shrouds you and grants resistance to Lethal, Smashing, Negative Energy and Toxic damage.",
+      "shortHelp": "Toggle: Self +Res(Smash, Lethal, Negative, Toxic)",
+      "icon": "arachnos_patron_resistbuff.png",
+      "powerType": "Toggle",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Corruptor) || ($archetype == @Class_Defender))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 0.67,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "smashing": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "psionic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Power Boost",
+      "fullName": "Epic.Corruptor_Soul_Mastery.Power_Boost",
+      "rank": 3,
+      "available": 37,
+      "description": "Greatly boosts the secondary effects of your powers. Your powers effects like Disorients, Holds, Immobilizes, Heals, Defense Buffs, Endurance Drains, Knockbacks and more, are all improved. The effects of Power Boost last a short while, and only the next couple of attacks will be boosted. You must be level 38 and have one other Soul Mastery Powers before selecting this power.",
+      "shortHelp": "Self +Special",
+      "icon": "arachnos_patron_powerboost.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 120.0,
+        "endurance": 9.75,
+        "activationTime": 1.17,
+        "effectArea": "SingleTarget"
+      }
+    },
+    {
+      "name": "Soul Drain",
+      "fullName": "Epic.Corruptor_Soul_Mastery.Soul_Drain",
+      "rank": 4,
+      "available": 40,
+      "description": "Using this power, you can drain the essence of all nearby foes' souls, thus increasing your own strength. Each affected foe will lose some Hit Points and add to your Damage and Accuracy. You must be level 41 and have one other Soul Mastery Powers before selecting this power.",
+      "shortHelp": "PBAoE DMG(Negative), Self +DMG, +ACC",
+      "icon": "arachnos_patron_pbaoebuffdamage.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Melee AoE Damage",
+        "To Hit Buff",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.2,
+        "recharge": 240.0,
+        "endurance": 19.5,
+        "activationTime": 2.37,
+        "effectArea": "AoE",
+        "radius": 10.0,
+        "damage": {
+          "type": "Negative",
+          "scale": 0.6408,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Summon Mistress",
+      "fullName": "Epic.Corruptor_Soul_Mastery.Summon_Mistress",
+      "rank": 5,
+      "available": 43,
+      "description": "Ghost Widow has assigned a Fortunata Mistress for you to command. Arguably, the most powerful of the Fortunatas, these rare few have mastered numerous psychic abilities and risen to the top of Lord Recluse's beautiful Black Widows. Your access to this Fortunata is very limited. You can only summon her once every 15 minutes and she will leave after 4 minutes, or if you exit a zone or mission. You must be level 44 and have two other Soul Mastery Powers before selecting this power.",
+      "shortHelp": "Summon Fortunata Mistress: Ranged DMG(Psionic)",
+      "icon": "arachnos_patron_summononepet.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Sleep",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Immobilize",
+        "Knockback",
+        "Pet Damage",
+        "Recharge Intensive Pets",
+        "Sleep",
+        "Stuns",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 900.0,
+        "endurance": 26.0,
+        "activationTime": 3.2,
+        "effectArea": "Location"
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['corruptor_soul_mastery'] = EPIC_CORRUPTOR_SOUL_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
@@ -0,0 +1,9055 @@
+// ---- js/data/powersets/dominator/arsenal-assault.js ----
+;/**
+ * Arsenal Assault
+ * Character Level: 50
+ * Archetype: dominator
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const DOMINATOR_ARSENAL_ASSAULT_POWERSET = {
+    name: "Arsenal Assault",
+    category: "Unknown",
+    description: "Arsenal Assault powerset",
+    icon: "arsenal-assault_set.png",
+    powers: [
+        {
+            name: "Burst",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged Damage", "Universal Damage Sets"],
+            description: "Quickly fires a Burst of rounds at a single target at very long range. Damage is average, but the fire rate is fast. Can also reduce the target's defense.",
+            shortHelp: "Ranged, DMG(Lethal), Foe -DEF",
+            icon: "assaultweapons_arburst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 90.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                dotDamage: {
+                    type: "Lethal",
+                    scale: 0.6859,
+                    ticks: 3
+                },
+                buffDuration: 0.91,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Buttstroke",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Melee Damage", "Stuns", "Universal Damage Sets"],
+            description: "A smash with the butt of your rifle with a high chance of disorienting.",
+            shortHelp: "Melee, DMG(Smash), Foe Disorient",
+            icon: "assaultweapons_riflebutt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.17,
+                damage: {
+                    type: "Smashing",
+                    scale: 3.179
+                }
+            }
+        },
+        {
+            name: "Buckshot",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Good at close range. Fires a cone of Buckshot pellets and can knock some foes down.",
+            shortHelp: "Ranged (Cone), DMG(Lethal), Foe Knockback",
+            icon: "assaultweapons_shotgunbuckshot.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.05,
+                range: 40.0,
+                recharge: 8.0,
+                endurance: 10.192,
+                cast: 0.9,
+                damage: {
+                    type: "Lethal",
+                    scale: 1.5351
+                }
+            }
+        },
+        {
+            name: "Elbow Strike",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee Damage", "Universal Damage Sets"],
+            description: "You strike your foe with a powerful punch dealing Smashing damage and knocking the target back.",
+            shortHelp: "Melee, DMG(Smash), Foe Knockback",
+            icon: "assaultweapons_heavyblow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 1.07,
+                damage: {
+                    type: "Smashing",
+                    scale: 3.909
+                }
+            }
+        },
+        {
+            name: "Power Up",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "Boosts the damage and secondary effects of your powers. Your powers' effects like Heals, Defense Buffs, Endurance Drains, Disorients, Holds, Immobilizes and more, are all improved. The effects of Power Up last a short while, and only the next couple of attacks will be boosted.",
+            shortHelp: "Self +Special, +Dmg(All)",
+            icon: "assaultweapons_powerup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 7.8,
+                cast: 1.17,
+                buffDuration: 10.0,
+                stun: 1.0,
+                stunDuration: 10.0,
+                tohitBuff: 0.5,
+                defenseBuff: 0.5
+            }
+        },
+        {
+            name: "Trip Mine",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You can place a Trip Mine on the ground. Any villains that pass near the Trip Mine will cause it to explode, damaging all nearby foes and sending them flying.",
+            shortHelp: "Place Mine: PBAoE, DMG(Fire), Foe Knockback",
+            icon: "assaultweapons_tripmine.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 1.93,
+                buffDuration: 170.0
+            }
+        },
+        {
+            name: "Targeting Drone",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "When this device is activated, the small Targeting Drone hovers around your head and emits targeting laser sights. The lasers can dramatically improve your chance to hit, and increase your perception, allowing you to better see stealthy foes. Targeting Drone also grants you resistance to powers that debuff your chance to hit.",
+            shortHelp: "Toggle: Self +To Hit, +Perception, Res(DeBuff To Hit)",
+            icon: "assaultweapons_targetingdrone.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.156,
+                cast: 1.17,
+                tohitBuff: 2.0,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Sniper Rifle",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Sniper Attacks", "Universal Damage Sets"],
+            description: "Sniper Rifle is a powerful piece of hardware. It is very accurate and has a very long range. The impressive round can knock down its target. Like most sniper attacks, you must take your time to aim, so this attack can be interrupted. If you are engaged in battle this attack becomes instant-cast. If you are not engaged, it will do bonus damage.",
+            shortHelp: "Sniper, DMG(Lethal), Foe Knockback",
+            icon: "assaultweapons_sniperrifle.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 150.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 1.17
+            }
+        },
+        {
+            name: "Ignite",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Sprays a target with accelerant from your flamethrower, igniting it and causing extreme damage over time. Also sets the location on fire if the target is grounded, inflicting damage to additional foes that step in the area.",
+            shortHelp: "Ranged, DoT(Fire)",
+            icon: "assaultweapons_dot.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.15,
+                range: 60.0,
+                recharge: 12.0,
+                endurance: 11.865,
+                cast: 2.0,
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.2508,
+                    ticks: 22
+                },
+                buffDuration: 5.5
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['dominator/arsenal-assault'] = DOMINATOR_ARSENAL_ASSAULT_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.DOMINATOR_ARSENAL_ASSAULT_POWERSET = DOMINATOR_ARSENAL_ASSAULT_POWERSET;
+}
+
+// ---- js/data/powersets/dominator/arsenal-control.js ----
+;/**
+ * Arsenal Control
+ * Character Level: 50
+ * Archetype: dominator
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const DOMINATOR_ARSENAL_CONTROL_POWERSET = {
+    name: "Arsenal Control",
+    category: "Unknown",
+    description: "Arsenal Control powerset",
+    icon: "arsenal-control_set.png",
+    powers: [
+        {
+            name: "Cryo Freeze Ray",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Holds", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "The Cryo Freeze Ray encases your foe in a block of ice, holding him helpless in place for a while and dealing some cold damage.",
+            shortHelp: "Ranged, DMG(Cold), Foe Hold, -SPD, -Recharge, -Fly",
+            icon: "arsenalcontrol_beanbag.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.25,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    type: "Cold",
+                    scale: 2.8890000000000002
+                },
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Tranquilizer",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Ranged Damage", "Sleep", "Slow Movement", "Universal Damage Sets"],
+            description: "The Tranquilizing Dart is the perfect tool to sideline a single foe. It deals some toxic damage and can render the target unconscious, allowing you to focus on more important targets. The target remains asleep for some time, but will awaken if attacked.<br><br><color #fcfc95>Notes: The Sleep component of this power is Auto Hit against regular enemies, but a To Hit check is required to against AVs and players, as well as to make secondary effects apply.</color>",
+            shortHelp: "Ranged, DMG(Toxic), Foe Sleep, -SPD",
+            icon: "arsenalcontrol_tranquilizer.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.15,
+                range: 80.0,
+                recharge: 6.0,
+                endurance: 5.2,
+                cast: 1.4,
+                damage: {
+                    type: "Toxic",
+                    scale: 1.54
+                },
+                buffDuration: 5.0
+            }
+        },
+        {
+            name: "Sleep Grenade",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Ranged AoE Damage", "Sleep", "Slow Movement", "Universal Damage Sets"],
+            description: "The Sleep Grenade can be launched at long range from beneath the barrel of your Assault Rifle. It releases a cloud of gas that will make enemies drowsy, slow, and fall asleep.",
+            shortHelp: "Ranged (Location AoE), DMG(Toxic), Foe Sleep, -SPD, -Recharge, -Fly",
+            icon: "arsenalcontrol_sleepgrenade.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.05,
+                range: 80.0,
+                recharge: 45.0,
+                endurance: 15.6,
+                cast: 1.87,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Liquid Nitrogen",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "The Liquid Nitrogen dispenser can spray a target location with liquid nitrogen creating a large patch of ice. Those caught in the patch of ice are dramatically slowed, tend to fall down taking damage, and will be unable to jump.",
+            shortHelp: "Ranged (Location AoE), DoT(Cold), Knockdown, -SPD",
+            icon: "arsenalcontrol_liquidnitrogen.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 90.0,
+                endurance: 10.4,
+                cast: 2.0,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Cloaking Device",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "This Cloaking Device is the ultimate in infiltration technology. It uses an LCD body coating to become all but impossible to detect. While concealed you can only be seen at very close range. If you attack while concealed, you will be discovered. Even if discovered, you are hard to see but will retain some of your Defense bonus to all attacks.",
+            shortHelp: "Toggle: Self Stealth, +DEF(All)",
+            icon: "arsenalcontrol_cloakingdevice.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.182,
+                cast: 0.73,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Smoke Canister",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Confuse", "Dominator Archetype Sets", "To Hit Debuff"],
+            description: "The Smoke Canister is a powerful infiltration tool. Fling it at a target location and it will quickly cover the area in smoke. While engulfed within this smoke, most enemies will not be able to see past normal melee range, although some may have better perception. If the foes are attacked, they will become confused and might attack their allies.",
+            shortHelp: "Ranged (Location AoE), Foe -Perception, -To Hit, Confuse",
+            icon: "arsenalcontrol_smokegrenade.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.05,
+                range: 80.0,
+                recharge: 90.0,
+                endurance: 16.64,
+                cast: 1.4,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Flash Bang",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Dominator Archetype Sets", "Ranged AoE Damage", "Stuns", "To Hit Debuff", "Universal Damage Sets"],
+            description: "The Flash Bang Grenade is ideal to disorient a group of enemies. Even enemies that are not disoriented will have their chance to hit reduced.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Energy), Disorient, -To Hit",
+            icon: "arsenalcontrol_flashbang.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.85,
+                range: 70.0,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 1.87,
+                damage: {
+                    type: "Energy",
+                    scale: 0.25
+                },
+                tohitDebuff: 0.5,
+                buffDuration: 20.0,
+                stun: 4.0
+            }
+        },
+        {
+            name: "Tear Gas",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Holds", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "The Tear Gas canister serves as the ultimate crowd control tool, rendering enemies incapacitated and choking, thereby preventing them from taking any action while also debuffing their damage output.",
+            shortHelp: "Ranged (Location AoE), DoT(Toxic), Foe Hold -DMG",
+            icon: "arsenalcontrol_teargas.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 180.0,
+                endurance: 15.6,
+                cast: 1.87,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Tri-Cannon",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Pet Damage", "Recharge Intensive Pets", "Threat Duration", "Universal Damage Sets"],
+            description: "The Tri-Cannon is the perfect companion in the field. It has an extremely fast fire rate and is equipped with a customized tracking system. Once locked on, it will continue to unload a volley of lead into the target until it is destroyed. Enemies around the Tri-Cannon, as well as those hit by it, will prioritize attacking it over its owner. It is armored and can take significant amounts of damage.",
+            shortHelp: "Build Tri-Cannon: Ranged, DMG(Lethal)",
+            icon: "arsenalcontrol_gunturret.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 240.0,
+                endurance: 26.0,
+                cast: 1.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['dominator/arsenal-control'] = DOMINATOR_ARSENAL_CONTROL_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.DOMINATOR_ARSENAL_CONTROL_POWERSET = DOMINATOR_ARSENAL_CONTROL_POWERSET;
+}
+
+// ---- js/data/powersets/dominator/dark-assault.js ----
+;/**
+ * Dark Assault
+ * Character Level: 50
+ * Archetype: dominator
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const DOMINATOR_DARK_ASSAULT_POWERSET = {
+    name: "Dark Assault",
+    category: "Unknown",
+    description: "Dark Assault powerset",
+    icon: "dark-assault_set.png",
+    powers: [
+        {
+            name: "Dark Blast",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Ranged Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "A long range blast of dark energy. Deals moderate Negative Energy damage and reduces the target's chance to hit.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, Light DMG(Negative), Foe -To Hit",
+            icon: "darknessassault_darkblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    type: "Negative",
+                    scale: 2.26
+                },
+                tohitDebuff: 0.75,
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Smite",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Melee Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You wrap your fists with Negative Energy channeled from the Netherworld and Smite your foe with a powerful blow. Smite clouds the target's vision, lowering their chance to hit for a short time.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Melee, Moderate DMG(Smash/Negative), Foe -To Hit",
+            icon: "darknessassault_smite.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 0.97,
+                damage: {
+                    types: [
+                        {
+                            type: "Negative",
+                            scale: 2.2892
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.7497
+                        }
+                    ],
+                    scale: 3.0389
+                },
+                tohitDebuff: 0.75,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Gloom",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Ranged Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "Gloom slowly drains a target of life, while reducing their chance to hit. Slower than Dark Blast, but deals more damage over time.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged, High DoT(Negative), Foe -To Hit",
+            icon: "darknessassault_gloom.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.1,
+                dotDamage: {
+                    type: "Negative",
+                    scale: 0.4063,
+                    ticks: 7
+                },
+                buffDuration: 3.6,
+                tohitDebuff: 0.75
+            }
+        },
+        {
+            name: "Night Fall",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Ranged AoE Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "Unleashes a cone shaped burst of particles from the Netherworld. All targets within the modest range of this power take Negative Energy damage and have a reduced chance to hit.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Cone), Moderate DMG(Negative), Foe -To Hit",
+            icon: "darknessassault_nightfall.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.3491,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 14.0,
+                endurance: 17.3829,
+                cast: 2.0,
+                dotDamage: {
+                    type: "Negative",
+                    scale: 0.2395,
+                    ticks: 9
+                },
+                buffDuration: 2.8,
+                tohitDebuff: 0.75
+            }
+        },
+        {
+            name: "Gather Shadows",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "By collecting shadows from your surroundings you boost your damage and the secondary effects of your powers. Your powers' effects like Heals, Defense Buffs, Endurance Drains, Disorients, Holds, Immobilizes, Knockbacks and more, are all improved. The effects of Gather Shadows last a short while, and only the next couple of attacks will be boosted.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +Special, +Dmg(All)",
+            icon: "darknessassault_gathershadows.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 7.8,
+                cast: 1.17,
+                buffDuration: 10.0,
+                stun: 1.0,
+                stunDuration: 10.0,
+                tohitBuff: 0.5,
+                defenseBuff: 0.5
+            }
+        },
+        {
+            name: "Engulfing Darkness",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Melee AoE Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You release a burst of negative energy to foes around you dealing moderate Negative Energy damage, reducing their chance to hit and sapping their health over time.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE, Light DMG(Negative), Foe -To Hit, Minor DoT(Negative)",
+            icon: "darknessassault_deathshroud.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 18.0,
+                endurance: 16.848,
+                cast: 2.0,
+                damage: {
+                    type: "Negative",
+                    scale: 1.8639999999999999
+                },
+                dotDamage: {
+                    type: "Negative",
+                    scale: 0.1,
+                    ticks: 3
+                },
+                buffDuration: 3.1,
+                tohitDebuff: 0.75
+            }
+        },
+        {
+            name: "Life Drain",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Accurate To-Hit Debuff", "Healing", "Ranged Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You can tap the power of the Netherworld to steal some life from a target foe and reduce their chance to hit. Some of that stolen life is transferred to you in the form of Hit Points.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged, Moderate DMG(Negative), Target -To Hit, Self +HP",
+            icon: "darknessassault_lifedrain.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.93,
+                damage: {
+                    type: "Negative",
+                    scale: 3.4101
+                },
+                healing: {
+                    scale: 101.7352,
+                    perTarget: true
+                },
+                tohitDebuff: 0.75,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Moon Beam",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Ranged Damage", "Sniper Attacks", "To Hit Debuff", "Universal Damage Sets"],
+            description: "An extremely long range and accurate beam of Negative Energy that deals tremendous damage and reduces the target's chance to hit. This is a sniper attack, and is best fired from a distance, as it can be interrupted. If you are engaged in battle this attack becomes instant-cast. If you are not engaged, it will do bonus damage.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Sniper, Extreme DMG(Negative), Target -To Hit",
+            icon: "darknessassault_moonbeam.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 150.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 1.33
+            }
+        },
+        {
+            name: "Midnight Grasp",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Dominator Archetype Sets", "Immobilize", "Melee Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "Mastery over the forces of the Netherworld allows you to create dark tentacles that can Immobilize a foe, reduce their chance to hit and continuously drain their life force.<br><br><color #fcfc95>Damage: Superior.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee, Superior DMG(Negative), Foe Immobilize, -To Hit",
+            icon: "darknessassault_midnightgrasp.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 15.0,
+                endurance: 11.96,
+                cast: 2.07,
+                damage: {
+                    type: "Negative",
+                    scale: 4.3018
+                },
+                dotDamage: {
+                    type: "Negative",
+                    scale: 0.11,
+                    ticks: 4
+                },
+                tohitDebuff: 0.75,
+                buffDuration: 20.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['dominator/dark-assault'] = DOMINATOR_DARK_ASSAULT_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.DOMINATOR_DARK_ASSAULT_POWERSET = DOMINATOR_DARK_ASSAULT_POWERSET;
+}
+
+// ---- js/data/powersets/dominator/darkness-control.js ----
+;/**
+ * Darkness Control
+ * Character Level: 50
+ * Archetype: dominator
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const DOMINATOR_DARKNESS_CONTROL_POWERSET = {
+    name: "Darkness Control",
+    category: "Unknown",
+    description: "Darkness Control powerset",
+    icon: "darkness-control_set.png",
+    powers: [
+        {
+            name: "Dark Grasp",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Dominator Archetype Sets", "Holds", "Ranged Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You cause your target's shadow to wholly envelop them, leaving them held and rendered helpless while suffering from moderate negative energy damage. Even if the target is powerful enough to resist the power's hold effect they will have their chance to hit reduced.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged, Light DMG(Negative), Foe Hold, -To Hit",
+            icon: "darknesscontrol_darkgrasp.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    type: "Negative",
+                    scale: 2.8891
+                },
+                tohitDebuff: 0.75,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Shadowy Binds",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Dominator Archetype Sets", "Immobilize", "Ranged Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You take control of your victim's shadow causing it to entangle and bind its owner thus leaving them immobilized and suffering from negative energy damage over time and reducing their chance to hit. Immobilized foes cannot move but can still attack.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, Moderate DoT(Negative), Foe Immobilize, -To Hit, -Fly",
+            icon: "darknesscontrol_shadowybinds.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.2,
+                dotDamage: {
+                    type: "Negative",
+                    scale: 0.48000000000000004,
+                    ticks: 4
+                },
+                buffDuration: 9.2,
+                tohitDebuff: 0.75
+            }
+        },
+        {
+            name: "Living Shadows",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Dominator Archetype Sets", "Immobilize", "Ranged AoE Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You extend and animate your own shadow causing it to entangle all foes within a long cone pattern in front of you, rendering all affected foes immobilized.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged (Cone), Minor DoT(Negative), Foe Immobilize, -To Hit, -Fly",
+            icon: "darknesscontrol_livingshadows.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 1.0472,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 8.0,
+                endurance: 13.0,
+                cast: 1.67,
+                dotDamage: {
+                    type: "Negative",
+                    scale: 0.3429,
+                    ticks: 2
+                },
+                buffDuration: 5.2,
+                tohitDebuff: 0.75
+            }
+        },
+        {
+            name: "Possess",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Confuse", "Dominator Archetype Sets"],
+            description: "You cause your targeted foe to be possessed by a dark entity from the Netherworld causing them to be confused for a short period of time. While confused they will be unable to tell the difference between friend or foe and will attack nearby allies.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged, Target Confuse",
+            icon: "darknesscontrol_possess.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 2.33
+            }
+        },
+        {
+            name: "Fearsome Stare",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Fear", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Dominator Archetype Sets", "Fear", "To Hit Debuff"],
+            description: "Instills tremendous Fear within a cone area in front of you, causing all affected targets to tremble in Terror uncontrollably.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Cone), Foe Fear, -To Hit",
+            icon: "darknesscontrol_fearsomestare.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 0.7854,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 40.0,
+                endurance: 8.528,
+                cast: 2.03,
+                tohitDebuff: 1.5,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Heart of Darkness",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Dominator Archetype Sets", "Melee AoE Damage", "Stuns", "To Hit Debuff", "Universal Damage Sets"],
+            description: "In a burst of negative energy you overwhelm the minds of those around you causing them to be disoriented and suffer minor negative energy damage over a short time. Affected targets will also have their chance to hit reduced.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE, Foe Disorient, -To Hit, Minor DoT(Negative)",
+            icon: "darknesscontrol_heartofdarkness.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.8,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 1.67,
+                dotDamage: {
+                    type: "Negative",
+                    scale: 0.258,
+                    ticks: 4
+                },
+                buffDuration: 4.1,
+                stun: 1.0,
+                tohitDebuff: 0.75
+            }
+        },
+        {
+            name: "Haunt",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Fear", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Fear", "Pet Damage", "Recharge Intensive Pets", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You summon a pair of Shades from the Netherworld to harass your target foe. Shades deal moderate damage and they terrorize their victims.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Foe Targeted, Summon Shades",
+            icon: "darknesscontrol_haunt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 210.0,
+                endurance: 10.4,
+                cast: 2.33,
+                buffDuration: 1.0
+            }
+        },
+        {
+            name: "Shadow Field",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Dominator Archetype Sets", "Holds", "To Hit Debuff"],
+            description: "You blanket a targeted area in darkness immediately holding foes within the field. Any foe who enters this area will have their chance to hit reduced and has a chance to be held for a short period of time.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Target (Location AoE), Foe Hold, -To Hit",
+            icon: "darknesscontrol_shadowfield.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 240.0,
+                endurance: 15.6,
+                cast: 2.67,
+                buffDuration: 45.0
+            }
+        },
+        {
+            name: "Umbra Beast",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Fear", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Fear", "Immobilize", "Pet Damage", "Recharge Intensive Pets", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You conjure up one of the most fearsome creatures of the Netherworld, the Umbra Beast. This creature will fight beside its summoner using its brutal claw, bite and darkness attacks.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Summon Umbra Beast",
+            icon: "darknesscontrol_umbrabeast.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 240.0,
+                endurance: 26.0,
+                cast: 2.33
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['dominator/darkness-control'] = DOMINATOR_DARKNESS_CONTROL_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.DOMINATOR_DARKNESS_CONTROL_POWERSET = DOMINATOR_DARKNESS_CONTROL_POWERSET;
+}
+
+// ---- js/data/powersets/dominator/earth-assault.js ----
+;/**
+ * Earth Assault
+ * Character Level: 50
+ * Archetype: dominator
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const DOMINATOR_EARTH_ASSAULT_POWERSET = {
+    name: "Earth Assault",
+    category: "Unknown",
+    description: "Earth Assault powerset",
+    icon: "earth-assault_set.png",
+    powers: [
+        {
+            name: "Stone Mallet",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee Damage", "Universal Damage Sets"],
+            description: "Your control over the earth allows you to form a mallet of solid stone. This Stone Mallet deals heavy damage, and can knock down weak foes.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Melee, Moderate DMG(Smash), Knockback",
+            icon: "earthassault_stonemallet.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.6,
+                damage: {
+                    type: "Smashing",
+                    scale: 3.48
+                }
+            }
+        },
+        {
+            name: "Stone Spears",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "Stone Spears erupt from the ground at the feet of your target. This attack can only be used against targets on the ground, and does moderate lethal damage.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, Light DMG(Lethal), Foe Knock Up",
+            icon: "earthassault_stonespears.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    type: "Lethal",
+                    scale: 2.2601
+                }
+            }
+        },
+        {
+            name: "Tremor",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You can cause a localized earthquake immediately around you. This will deal moderate damage to every foe in melee range, while knocking them back.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE, Light DMG(Smash), Knockback",
+            icon: "earthassault_tremor.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 18.0,
+                endurance: 16.848,
+                cast: 2.53,
+                damage: {
+                    type: "Smashing",
+                    scale: 1.9881
+                }
+            }
+        },
+        {
+            name: "Hurl Boulder",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "You are able to tear up a chunk of ground beneath your feet and Hurl it at an enemy. This attack deals moderate damage, and can knock foes back and even drop them out of the air if they are flying.<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, High DMG(Smash), Foe Knockback, -Fly",
+            icon: "earthassault_hurlboulder.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 1.5,
+                damage: {
+                    type: "Smashing",
+                    scale: 4.2101
+                },
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Power Up",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "Boosts the damage and secondary effects of your powers. Your powers' effects like Heals, Defense Buffs, Endurance Drains, Disorients, Holds, Immobilizes and more, are all improved. The effects of Power Up last a short while, and only the next couple of attacks will be boosted.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +Special, +Dmg(All)",
+            icon: "earthassault_powerboost.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 7.8,
+                cast: 1.17,
+                buffDuration: 10.0,
+                stun: 1.0,
+                stunDuration: 10.0,
+                tohitBuff: 0.5,
+                defenseBuff: 0.5
+            }
+        },
+        {
+            name: "Heavy Mallet",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee Damage", "Universal Damage Sets"],
+            description: "A more impressive form of Stone Mallet, the Heavy Mallet deals more damage, but is slower to swing. It has a greater chance of knocking down opponents.<br><br><color #fcfc95>Damage: Superior.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee, Superior DMG(Smash), Knockback",
+            icon: "earthassault_heavymallet.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 1.63,
+                damage: {
+                    type: "Smashing",
+                    scale: 4.901
+                }
+            }
+        },
+        {
+            name: "Seismic Smash",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Holds", "Melee Damage", "Universal Damage Sets"],
+            description: "This massive attack hits with all the force of the Earth itself. It deals tremendous amounts of damage, and may Hold the target if they are not defeated outright.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee, Extreme DMG(Smash), Foe Hold",
+            icon: "earthassault_seismicsmash.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 1.5,
+                damage: {
+                    type: "Smashing",
+                    scale: 5.8100000000000005
+                }
+            }
+        },
+        {
+            name: "Mud Pots",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "While this power is active, you draw upon the geothermal power of the Earth to create a bubbling pool of hot mud around yourself. All foes in melee range will become snared and entrapped in the mud, Immobilizing some and slowing others. The boiling heat from Mud Pots may also deal some damage over time to the snared foes.<br><br><color #fcfc95>Damage: Minor(DoT).</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: PBAoE, Minor DoT(Fire), Foe Immobilize, -SPD",
+            icon: "earthassault_mudpots.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 1.04,
+                cast: 2.03,
+                damage: {
+                    type: "Fire",
+                    scale: 0.13
+                },
+                buffDuration: 5.0
+            }
+        },
+        {
+            name: "Fissure",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Knockback", "Ranged AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "This powerful stomp can crack the earth itself, damaging a nearby targeted foe and any foes around it. This Fissure can only affect foes on the ground, dealing moderate smashing damage and possibly throwing them into the air or disorienting them.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Close (Targeted AoE), Light DMG(Smash), Foe Knockback, Disorient",
+            icon: "earthassault_fissure.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                range: 20.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 2.1,
+                damage: {
+                    type: "Smashing",
+                    scale: 2.0305999999999997
+                },
+                stun: 1.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['dominator/earth-assault'] = DOMINATOR_EARTH_ASSAULT_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.DOMINATOR_EARTH_ASSAULT_POWERSET = DOMINATOR_EARTH_ASSAULT_POWERSET;
+}
+
+// ---- js/data/powersets/dominator/earth-control.js ----
+;/**
+ * Earth Control
+ * Character Level: 50
+ * Archetype: dominator
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const DOMINATOR_EARTH_CONTROL_POWERSET = {
+    name: "Earth Control",
+    category: "Unknown",
+    description: "Earth Control powerset",
+    icon: "earth-control_set.png",
+    powers: [
+        {
+            name: "Fossilize",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Holds", "Ranged Damage", "Universal Damage Sets"],
+            description: "Encases a single target within solid stone. The stone slowly crushes the victim, dealing Smashing damage. The Fossilized victim is held helpless and unable to defend himself. Damage, Moderate.",
+            shortHelp: "Ranged, DMG(Smash), Foe Hold, -DEF",
+            icon: "earthgrasp_fossilize.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 2.07,
+                damage: {
+                    type: "Smashing",
+                    scale: 3.1691
+                },
+                defenseDebuff: 2.0,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Stone Prison",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Immobilize", "Ranged Damage", "Universal Damage Sets"],
+            description: "Immobilizes a single target within an earthy formation and deals some Smashing damage over time. Some more resilient foes may require multiple attacks to Immobilize. Stone Prison can also reduce a target's Defense.",
+            shortHelp: "Ranged, DoT(Smash), Foe Immobilize, -DEF, -Fly",
+            icon: "earthgrasp_stoneprison.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.23,
+                dotDamage: {
+                    type: "Smashing",
+                    scale: 0.4842,
+                    ticks: 4
+                },
+                buffDuration: 9.2,
+                defenseDebuff: 2.0
+            }
+        },
+        {
+            name: "Stone Cages",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Immobilize", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Immobilizes a group of foes within earthy formations and deals some Smashing damage over time. Slower and less damaging than Stone Prison, but can capture multiple targets. Stone Cages can also reduce a target's Defense.",
+            shortHelp: "Ranged AoE, DMG(Smash), Foe Immobilize, -Fly, -DEF",
+            icon: "earthgrasp_stonecages.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.9,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 15.6,
+                cast: 1.17,
+                dotDamage: {
+                    type: "Smashing",
+                    scale: 0.1923,
+                    ticks: 2
+                },
+                buffDuration: 5.2,
+                defenseDebuff: 2.0
+            }
+        },
+        {
+            name: "Quicksand",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "You can cause the ground to liquefy like Quicksand at a targeted location. Any foes that pass through the Quicksand will become snared, their movement will be dramatically Slowed, and their Defense reduced. Foes trapped in the Quicksand cannot jump or Fly.",
+            shortHelp: "Ranged (Location AoE), Foe -Speed, -Jump, -Fly, -DEF",
+            icon: "earthgrasp_quicksand.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 90.0,
+                recharge: 30.0,
+                endurance: 7.8,
+                cast: 3.1,
+                buffDuration: 45.0
+            }
+        },
+        {
+            name: "Salt Crystals",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Sleep", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Sleep"],
+            description: "Attempts to encrust all nearby foes in a Pillar of Salt. The victims will remain encased within the salt for quite a while, but will automatically break free if attacked. Affected targets have reduced defense for a while, even if they break free.<br><br><color #fcfc95>Notes: Although this power is Auto Hit, it requires a To Hit check to apply Deep Sleep. If The Hit check is missed, and the target is not an AV, the weaker form of Sleep will be applied.</color>",
+            shortHelp: "PBAoE, Foe Deep Sleep, -DEF",
+            icon: "earthgrasp_saltpillars.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 45.0,
+                endurance: 15.6,
+                cast: 1.07,
+                defenseDebuff: 2.0,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Stalagmites",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Ranged AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "You can cause Stalagmites to erupt all around an enemy, damaging all nearby foes. The Stalagmites deal minimal Lethal damage, and can Disorient all affected targets for a good while, as well as reduce their Defense. You must be on the ground to activate this power.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Lethal), Foe Disorient, -DEF",
+            icon: "earthgrasp_stalagmites.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.8,
+                range: 70.0,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 1.0,
+                damage: {
+                    type: "Lethal",
+                    scale: 0.25
+                },
+                stun: 1.0,
+                defenseDebuff: 2.0,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Earthquake",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Defense Debuff", "Knockback", "To Hit Debuff"],
+            description: "Generates a powerful, localized Earthquake. Most foes that pass through the location will fall down. The violent shaking also reduces their chance to hit and Defense.",
+            shortHelp: "Ranged (Location AoE), Foe Knockback, -DEF, -To Hit",
+            icon: "earthgrasp_earthquake.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 90.0,
+                endurance: 10.4,
+                cast: 2.03,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Volcanic Gasses",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Holds", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You can tap into the geothermal power of the Earth and focus it at a targeted location. Foes that pass near a thermal vent will take minor Fire damage and be overcome by the gasses, leaving them choking and helpless.",
+            shortHelp: "Ranged (Location AoE), Foe Hold, DoT(Fire), Special",
+            icon: "earthgrasp_volcanicgasses.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.4,
+                range: 60.0,
+                recharge: 240.0,
+                endurance: 18.2,
+                cast: 1.17,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Animate Stone",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Pet Damage", "Recharge Intensive Pets", "Universal Damage Sets"],
+            description: "Earth and stone coalesce to form an incredibly tough entity that can attack your foes. The Animated Stone is not alive and is immune to Psionic damage. It is also virtually immune to Sleep, Immobilize, Disorient, and Hold effects. The entity can be healed and buffed like any teammate. Type ''/release_pets'' in the chat window to release all your pets.",
+            shortHelp: "Summon Golem: Melee DMG(Smashing)",
+            icon: "earthgrasp_animatestone.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 240.0,
+                endurance: 20.8,
+                cast: 3.2
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['dominator/earth-control'] = DOMINATOR_EARTH_CONTROL_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.DOMINATOR_EARTH_CONTROL_POWERSET = DOMINATOR_EARTH_CONTROL_POWERSET;
+}
+
+// ---- js/data/powersets/dominator/electric-control.js ----
+;/**
+ * Electric Control
+ * Character Level: 50
+ * Archetype: dominator
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const DOMINATOR_ELECTRIC_CONTROL_POWERSET = {
+    name: "Electric Control",
+    category: "Unknown",
+    description: "Electric Control powerset",
+    icon: "electric-control_set.png",
+    powers: [
+        {
+            name: "Electric Fence",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Endurance Modification", "Immobilize", "Ranged Damage", "Universal Damage Sets"],
+            description: "Surrounds and Immobilizes a single target in an Electric Fence. Deals some damage over time and slowly drains some Endurance. Useful for keeping villains at bay and bringing down fliers.",
+            shortHelp: "Ranged, DoT(Energy), Foe Immobilize, -End, -Fly, -Knockback",
+            icon: "electriccontrol_electricfence.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.67,
+                dotDamage: {
+                    type: "Energy",
+                    scale: 0.5458000000000001,
+                    ticks: 4
+                },
+                buffDuration: 9.2
+            }
+        },
+        {
+            name: "Tesla Cage",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Endurance Modification", "Holds", "Ranged Damage", "Universal Damage Sets"],
+            description: "Tesla Cage confines the target in an electrical prison. The target is overwhelmed by the electrical charge and is left helpless and can be attacked. The target is drained of some Endurance and some of that Endurance may be transferred back to you.",
+            shortHelp: "Ranged, DMG(Energy), Foe Hold, -End",
+            icon: "electriccontrol_teslacage.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 1.8891
+                        },
+                        {
+                            type: "Energy",
+                            scale: 1.0
+                        }
+                    ],
+                    scale: 2.8891
+                },
+                buffDuration: 4.0
+            }
+        },
+        {
+            name: "Chain Fences",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Endurance Modification", "Immobilize", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You can immobilize multiple foes in a chain of electricity, dealing minor damage to all foes in range and draining some endurance. This power also reduces Flight capacity in targets.",
+            shortHelp: "Ranged AoE, DMG(Energy), Foe Immobilize, -End, -Fly",
+            icon: "electriccontrol_chainfences.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.9,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 15.6,
+                cast: 1.17,
+                damage: {
+                    type: "Energy",
+                    scale: 1.839
+                },
+                dotDamage: {
+                    type: "Energy",
+                    scale: 0.1,
+                    ticks: 2
+                },
+                buffDuration: 5.2
+            }
+        },
+        {
+            name: "Jolting Chain",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "You can send a bolt of electricity through multiple opponents, causing a muscle spasm and dealing minor damage. Each foe is knocked down, and the electric charge can fork several times, jumping to several opponents rapidly.",
+            shortHelp: "Ranged Chain AoE, DMG(Energy), Foe Knockdown, -End",
+            icon: "electriccontrol_joltingchain.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Chain",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 10.4,
+                cast: 2.07,
+                damage: {
+                    type: "Energy",
+                    scale: 1.9272
+                },
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Conductive Aura",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "While this power is active, the air around you becomes charged with electricity, leaping out and shocking foes that get too close. Foes will lose some endurance, while you gain Recovery and Regeneration per target hit.",
+            shortHelp: "Toggle: PBAoE, Foe -End, Self +Rec, +Regen",
+            icon: "electriccontrol_stunningaura.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 15.0,
+                cast: 2.03,
+                buffDuration: 2.25
+            }
+        },
+        {
+            name: "Static Field",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Sleep", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Endurance Modification", "Sleep", "Slow Movement"],
+            description: "You can build up a Static Field at a nearby location. Any foes in the field may lose control of their muscles due to the static charge, and will shake violently. Foes may also be drained of some endurance, and some of that endurance may be transferred to nearby allies. Any attack will interrupt the effect temporarily and foes will re-gain control, although their movement and attack rates will be reduced. This effect can last for some time, and will continue to paralyze foes in the field.",
+            shortHelp: "Target (Location AoE), Foe Sleep, -End, -Speed, -Recharge",
+            icon: "electriccontrol_staticfield.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 40.0,
+                endurance: 15.6,
+                cast: 2.03,
+                buffDuration: 25.0
+            }
+        },
+        {
+            name: "Tesla Coil",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Holds", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Summoning a large amount of energy that periodically jolts at nearby enemies dealing energy damage and paralizing them for a short time. These foes may be drained of some endurance as well.",
+            shortHelp: "Ranged (Targeted AoE), Foe DMG(Energy), Hold, -End, -Fly, -Jump, -Recharge",
+            icon: "electriccontrol_paralyzingblastpatch.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 0.8,
+                range: 80.0,
+                recharge: 240.0,
+                endurance: 15.6,
+                cast: 1.67
+            }
+        },
+        {
+            name: "Synaptic Overload",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Confuse", "Dominator Archetype Sets"],
+            description: "This power can subtly scramble the synapses of any target affected, causing hallucinations and confusion amongst foes. The electric charge lasts for some time, and will jump slowly to other opponents causing wide spread confusion. Foes may not be aware that this has happened, and will not be alerted to your presence. You will also not receive experience for any damage dealt by confused opponents.<br><br><color #fcfc95>Notes: This power has adaptive recharge. It has a base recharge of <color #FF7F27>6</color> seconds and each affected foe will increase the recharge by <color #FF7F27>6.5</color> seconds for a maximum total of <color #FF7F27>110</color> seconds.</color>",
+            shortHelp: "Ranged Chain AoE, Foe Confuse, -End",
+            icon: "electriccontrol_synapticoverload.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Chain",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 6.0,
+                endurance: 15.6,
+                cast: 2.0,
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Gremlins",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Pet Damage", "Recharge Intensive Pets", "Universal Damage Sets"],
+            description: "Mastery over electricity allows you to create almost sentient elementals of lightning. These elementals are mischievous in nature, and enjoy creating havoc and interfering with electronic equipment or magical cantrips. They also never work alone, where there is one Gremlin, there is often another nearby.",
+            shortHelp: "Summon Gremlins: Melee DMG(Energy)",
+            icon: "electriccontrol_gremlins.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 240.0,
+                endurance: 26.0,
+                cast: 2.03
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['dominator/electric-control'] = DOMINATOR_ELECTRIC_CONTROL_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.DOMINATOR_ELECTRIC_CONTROL_POWERSET = DOMINATOR_ELECTRIC_CONTROL_POWERSET;
+}
+
+// ---- js/data/powersets/dominator/electricity-manipulation.js ----
+;/**
+ * Electricity Manipulation
+ * Character Level: 50
+ * Archetype: dominator
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const DOMINATOR_ELECTRICITY_MANIPULATION_POWERSET = {
+    name: "Electricity Manipulation",
+    category: "Unknown",
+    description: "Electricity Manipulation powerset",
+    icon: "electricity-manipulation_set.png",
+    powers: [
+        {
+            name: "Charged Bolts",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Ranged Damage", "Universal Damage Sets"],
+            description: "You can quickly hurl small bolts of electricity at foes, dealing some damage and draining some Endurance. Some of this Endurance may transfer back to you. Charged Bolts deals light damage but recharges quickly.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, Light DMG(Energy), Foe -End",
+            icon: "electricalassault_chargedbolts.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    type: "Energy",
+                    scale: 2.26
+                },
+                buffDuration: 2.0
+            }
+        },
+        {
+            name: "Charged Brawl",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Melee Damage", "Sleep", "Universal Damage Sets"],
+            description: "Your fists become electrically charged and deliver a powerful punch. Charged Brawl can drain some Endurance from the target and may overload their synapses, leaving it writhing for a moment. A portion of drained Endurance may be returned to you. Disturbing an overloaded target will disperse the electrical charge and release the target.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Melee, Light DMG(Smash/Energy), Target Sleep, -End",
+            icon: "electricalassault_chargedbrawl.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 0.83,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 1.2837
+                        },
+                        {
+                            type: "Energy",
+                            scale: 1.2573
+                        }
+                    ],
+                    scale: 2.5410000000000004
+                },
+                buffDuration: 2.0
+            }
+        },
+        {
+            name: "Lightning Bolt",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Ranged Damage", "Universal Damage Sets"],
+            description: "You can send a large blast of electrical energy at a foe, dealing high damage and draining some Endurance. Some of this Endurance may transfer back to you. Lightning Bolt deals more damage than Charged Bolts, but recharges more slowly.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged, Moderate DMG(Energy), Foe -End",
+            icon: "electricalassault_lightningbolt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    type: "Energy",
+                    scale: 3.5290999999999997
+                },
+                buffDuration: 4.0
+            }
+        },
+        {
+            name: "Havoc Punch",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Knockback", "Melee Damage", "Sleep", "Universal Damage Sets"],
+            description: "The Havoc Punch is a slower attack than Charged Brawl, but makes up for it with greater damage and a chance to knock the target off their feet. Havoc Punch can drain some Endurance from your target and may overload its synapses, leaving them writhing for a moment. A portion of the drained Endurance may be given back to you. Disturbing an overloaded target will disperse the electrical charge and release him.<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Melee, High DMG(Smash/Energy), Foe Sleep, -End, Knock Back",
+            icon: "electricalassault_havocpunch.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.5,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.9152
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.8948
+                        }
+                    ],
+                    scale: 3.81
+                },
+                buffDuration: 4.0
+            }
+        },
+        {
+            name: "Build Up",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly boosts your attacks for a few seconds. Slightly increases chance to hit.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "electricalassault_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Zapp",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Ranged Damage", "Sniper Attacks", "Universal Damage Sets"],
+            description: "A focused electrical blast that can travel great distances with high Accuracy. Zapp drains Endurance, some of which may transfer back to you. This is a sniper attack, and is best fired from a distance, as it can be interrupted. If you are engaged in battle this attack becomes instant-cast. If you are not engaged, it will do bonus damage.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Sniper, Extreme DMG(Energy), Foe -End",
+            icon: "electricalassault_zapp.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 150.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 1.33
+            }
+        },
+        {
+            name: "Static Discharge",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Discharges a cone of Static Electricity that deals damage and drains Endurance from all affected foes in the area.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Cone), Light DMG(Energy), -END",
+            icon: "electricalassault_staticdischarge.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.7854,
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 2.07,
+                damage: {
+                    type: "Energy",
+                    scale: 2.2758000000000003
+                },
+                buffDuration: 4.0
+            }
+        },
+        {
+            name: "Thunder Strike",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Knockback", "Melee AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "A massive attack. You smash your foes with all the power of a lightning bolt. The pummeled victim takes tremendous damage and may be Disoriented. Any nearby foes may be knocked down and take some damage from the shockwave.<br><br><color #fcfc95>Damage: Superior.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee (AoE), Superior DMG(Smash, Energy), Foe Disorient, Knockback",
+            icon: "electricalassault_thunderstrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 2.53,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 3.997
+                        },
+                        {
+                            type: "Energy",
+                            scale: 1.713
+                        }
+                    ],
+                    scale: 5.71
+                },
+                stun: 1.0,
+                buffDuration: 4.0
+            }
+        },
+        {
+            name: "Voltaic Sentinel",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Pet Damage", "Recharge Intensive Pets", "Universal Damage Sets"],
+            description: "You can manifest a polarized electricity field that hovers above the ground and hurls bolts of electricity at nearby foes. Any enemy that passes near this Sentinel risks serious injury. The Sentinel is not alive and cannot be targeted or attacked by enemies. The Sentinel can fly and will follow you.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Summon Sentinel: Ranged, Moderate DMG(Energy), Foe -End",
+            icon: "electricalassault_voltaicsentinel.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 2.0,
+                range: 60.0,
+                recharge: 60.0,
+                endurance: 26.0,
+                cast: 3.1,
+                buffDuration: 60.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['dominator/electricity-manipulation'] = DOMINATOR_ELECTRICITY_MANIPULATION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.DOMINATOR_ELECTRICITY_MANIPULATION_POWERSET = DOMINATOR_ELECTRICITY_MANIPULATION_POWERSET;
+}
+
+// ---- js/data/powersets/dominator/energy-assault.js ----
+;/**
+ * Energy Assault
+ * Character Level: 50
+ * Archetype: dominator
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const DOMINATOR_ENERGY_ASSAULT_POWERSET = {
+    name: "Energy Assault",
+    category: "Unknown",
+    description: "Energy Assault powerset",
+    icon: "energy-assault_set.png",
+    powers: [
+        {
+            name: "Bone Smasher",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Melee Damage", "Stuns", "Universal Damage Sets"],
+            description: "This melee attack can be slow, but it compensates by dealing a good amount of damage and having a good chance to Disorient the target. If used against a Disoriented foe, there is a small chance to enter Energy Focus mode. This power will weaken the target's secondary effects if used while in Energy Focus mode.<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Melee, High DMG(Smash/Energy), Disorient, Special, Chance for Energy Focus",
+            icon: "energyassault_bonesmasher.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.5,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 2.286
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.524
+                        }
+                    ],
+                    scale: 3.81
+                },
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Power Bolt",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "A quick attack that rapidly hurls small bolts of energy at foes, sometimes knocking them down. If used against a Disoriented foe, there is a small chance to enter Energy Focus mode.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, Light DMG(Energy/Smash), Foe Knockback, Chance for Energy Focus",
+            icon: "energyassault_powerbolt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 1.3559999999999999
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.904
+                        }
+                    ],
+                    scale: 2.26
+                }
+            }
+        },
+        {
+            name: "Power Push",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "Power Push deals a high amount of Energy and Smashing damage and sends the target flying for a great distance. If used against a Disoriented foe, there is a small chance to enter Energy Focus mode.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged Moderate DMG(Energy/Smash), Foe High Knockback, Chance for Energy Focus",
+            icon: "energyassault_powerpush.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.4,
+                range: 70.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.1,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 1.8780000000000001
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.252
+                        }
+                    ],
+                    scale: 3.13
+                }
+            }
+        },
+        {
+            name: "Power Blast",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "A much more powerful, yet slower version of Power Bolt. Power Blast sends a focused beam of energy at a foe that can knock them back. If used against a Disoriented foe, there is a small chance to enter Energy Focus mode.<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged, High DMG(Energy/Smash), Foe Knockback, Chance for Energy Focus",
+            icon: "energyassault_powerblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 2.9467999999999996
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.9823
+                        }
+                    ],
+                    scale: 3.9290999999999996
+                }
+            }
+        },
+        {
+            name: "Power Up",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "Boosts the damage and secondary effects of your powers. Your powers' effects like Heals, Defense Buffs, Endurance Drains, Disorients, Holds, Immobilizes and more, are all improved. The effects of Power Up last a short while, and only the next couple of attacks will be boosted.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +Special, +Dmg(All)",
+            icon: "energyassault_powerboost.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 7.8,
+                cast: 1.17,
+                buffDuration: 10.0,
+                stun: 1.0,
+                stunDuration: 10.0,
+                tohitBuff: 0.5,
+                defenseBuff: 0.5
+            }
+        },
+        {
+            name: "Whirling Hands",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Melee AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "By focusing your energy into the muscles in your arms, you can launch a dizzying flurry of attacks against every foe in melee range. Some foes may be hit hard enough to be Disoriented as well. This power will recharge instantly if used while in Energy Focus mode.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE Melee, Light DMG(Smash/Energy), Special",
+            icon: "energyassault_whirlinghands.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 2.5,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 1.7015000000000002
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.1344
+                        }
+                    ],
+                    scale: 2.8359000000000005
+                }
+            }
+        },
+        {
+            name: "Total Focus",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Melee Damage", "Stuns", "Universal Damage Sets"],
+            description: "Total Focus is complete mastery over Energy Melee. This melee attack is a very slow, but incredibly devastating attack that can knock out most opponents, leaving them Disoriented. Due to the exhausting nature of Total Focus, recharge time is very long. This power will enter Energy Focus mode.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee, Extreme DMG(Energy/Smash), Foe Disorient, +Energy Focus",
+            icon: "energyassault_totalfocus.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 22.0,
+                endurance: 20.176,
+                cast: 2.53,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 4.1586
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 2.7724
+                        }
+                    ],
+                    scale: 6.931
+                },
+                stun: 3.0
+            }
+        },
+        {
+            name: "Sniper Blast",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Sniper Attacks", "Universal Damage Sets"],
+            description: "A focused blast that can travel great distances with high Accuracy. This is a sniper attack, and is best fired from a distance, as it can be interrupted. If you are engaged in battle this attack becomes instant-cast. If you are not engaged, it will do bonus damage. If used against a Disoriented foe, there is a small chance to enter Energy Focus mode.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Sniper, Extreme DMG(Energy/Smash), Foe Knockback",
+            icon: "energyassault_sniperblaster.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 150.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 1.33
+            }
+        },
+        {
+            name: "Power Burst",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "A devastating attack that can knock your target off their feet. This power will inflict bonus damage if used while in Energy Focus mode.<br><br><color #fcfc95>Damage: Superior.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Superior DMG(Energy/Smash), Foe Knockback, Special",
+            icon: "energyassault_powerburst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 14.0,
+                endurance: 13.52,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 3.0974000000000004
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.6316000000000002
+                        }
+                    ],
+                    scale: 4.729000000000001
+                }
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['dominator/energy-assault'] = DOMINATOR_ENERGY_ASSAULT_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.DOMINATOR_ENERGY_ASSAULT_POWERSET = DOMINATOR_ENERGY_ASSAULT_POWERSET;
+}
+
+// ---- js/data/powersets/dominator/fiery-assault.js ----
+;/**
+ * Fiery Assault
+ * Character Level: 50
+ * Archetype: dominator
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const DOMINATOR_FIERY_ASSAULT_POWERSET = {
+    name: "Fiery Assault",
+    category: "Unknown",
+    description: "Fiery Assault powerset",
+    icon: "fiery-assault_set.png",
+    powers: [
+        {
+            name: "Flares",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Universal Damage Sets"],
+            description: "A quick attack that throws Flares at the target.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Ranged, Light DMG(Fire)",
+            icon: "fireassault_flare.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 1.0,
+                damage: {
+                    type: "Fire",
+                    scale: 2.0978
+                }
+            }
+        },
+        {
+            name: "Incinerate",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Universal Damage Sets"],
+            description: "Intense concentration can allow you to Incinerate an opponent at melee range. This will set your foe ablaze, dealing damage over time.<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Melee, High DoT(Fire)",
+            icon: "fireassault_incinerate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.67,
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.4089,
+                    ticks: 9
+                },
+                buffDuration: 4.6
+            }
+        },
+        {
+            name: "Fire Breath",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You can breathe forth a torrent of fire that burns all foes within its narrow cone. Very accurate and very deadly at medium range.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Close (Cone), Moderate DoT(Fire)",
+            icon: "fireassault_breathoffire.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.2,
+                range: 40.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 2.67,
+                dotDamage: {
+                    type: "Fire",
+                    scale: 1.2584,
+                    ticks: 2
+                },
+                buffDuration: 2.1
+            }
+        },
+        {
+            name: "Fire Blast",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Universal Damage Sets"],
+            description: "Sends a Blast of Fire at a targeted foe and sets the target on fire for a short period of time. Slower recharge rate than Flares, but more damage.<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged, High DMG(Fire)",
+            icon: "fireassault_fireblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.2,
+                damage: {
+                    type: "Fire",
+                    scale: 3.2
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.15,
+                    ticks: 3
+                },
+                buffDuration: 3.1
+            }
+        },
+        {
+            name: "Embrace of Fire",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "Significantly boosts the damage of all your Fire attacks for quite a while. Also increases the damage of all your other non-fire based attacks for a short while.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +DMG",
+            icon: "fireassault_fieryembrace.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 180.0,
+                endurance: 7.8,
+                cast: 0.73,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Combustion",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee AoE Damage", "Universal Damage Sets"],
+            description: "Your mastery of fire allows you to violently raise the temperature around yourself in an attempt to spontaneously combust any nearby foes and set them ablaze, dealing damage over time.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE, Moderate DoT(Fire)",
+            icon: "fireassault_combustion.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 17.0,
+                endurance: 15.964,
+                cast: 3.0,
+                damage: {
+                    type: "Fire",
+                    scale: 1.46
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.1,
+                    ticks: 7
+                },
+                buffDuration: 7.1
+            }
+        },
+        {
+            name: "Consume",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You can drain body heat from all nearby foes in order to replenish your own Endurance. The more foes affected, the more Endurance is gained. Foes suffer minimal Fire damage.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE DMG(Fire), Self +End",
+            icon: "fireassault_consume.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 180.0,
+                endurance: 0.52,
+                cast: 2.03,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Blazing Bolt",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Sniper Attacks", "Universal Damage Sets"],
+            description: "A long range beam of fire that blasts your foes. This is a sniper attack, and is best fired from a distance, as it can be interrupted. If you are engaged in battle this attack becomes instant-cast. If you are not engaged, it will do bonus damage.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Sniper, Extreme DMG(Fire)",
+            icon: "fireassault_blazingbolt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 150.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 1.67
+            }
+        },
+        {
+            name: "Blaze",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Universal Damage Sets"],
+            description: "A devastating flame attack.<br><br><color #fcfc95>Damage: Superior.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Superior DMG(Fire)",
+            icon: "fireassault_blaze.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 1.0,
+                damage: {
+                    type: "Fire",
+                    scale: 3.86
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.225,
+                    ticks: 4
+                },
+                buffDuration: 4.1
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['dominator/fiery-assault'] = DOMINATOR_FIERY_ASSAULT_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.DOMINATOR_FIERY_ASSAULT_POWERSET = DOMINATOR_FIERY_ASSAULT_POWERSET;
+}
+
+// ---- js/data/powersets/dominator/fire-control.js ----
+;/**
+ * Fire Control
+ * Character Level: 50
+ * Archetype: dominator
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const DOMINATOR_FIRE_CONTROL_POWERSET = {
+    name: "Fire Control",
+    category: "Unknown",
+    description: "Fire Control powerset",
+    icon: "fire-control_set.png",
+    powers: [
+        {
+            name: "Char",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Holds", "Ranged Damage", "Universal Damage Sets"],
+            description: "Incapacitates a distant foe by Charring him with smoldering soot and cinders. The target is left helpless, choking on the soot.",
+            shortHelp: "Ranged, Moderate DoT(Fire), Foe Hold",
+            icon: "firetrap_soot.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.07,
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.5138,
+                    ticks: 4
+                },
+                buffDuration: 4.2
+            }
+        },
+        {
+            name: "Ring of Fire",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Immobilize", "Ranged Damage", "Universal Damage Sets"],
+            description: "Immobilizes your target in a Ring of Fire, dealing Fire damage over time. More resilient foes may require multiple Fire Rings to Immobilize.",
+            shortHelp: "Ranged, Moderate DoT(Fire), Foe Immobilize",
+            icon: "firetrap_ringoffire.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.17,
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.4958,
+                    ticks: 4
+                },
+                buffDuration: 9.2
+            }
+        },
+        {
+            name: "Fire Cages",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Immobilize", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Immobilizes a group of foes in Fire Cages, dealing Fire damage over time. More resilient foes may require multiple Fire Cages to Immobilize. Fire Cages is slower and less damaging than Ring of Fire, but can capture multiple targets.",
+            shortHelp: "Ranged (Targeted AoE), Minor DoT(Fire), Foe Immobilize",
+            icon: "firetrap_firecage.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.9,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 15.6,
+                cast: 1.03,
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.1965,
+                    ticks: 2
+                },
+                buffDuration: 5.2
+            }
+        },
+        {
+            name: "Smoke",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["To Hit Debuff"],
+            description: "Covers all foes near your target in clouds of Smoke. Your enemies are so blinded that they can hardly see a thing. Most foes will not be able to see past normal melee range, although some may have better perception. If the affected targets are attacked, they will be alerted to your presence, but will suffer a penalty to their chance to hit.",
+            shortHelp: "Ranged (Targeted AoE), Foe -Perception, -To Hit",
+            icon: "firetrap_smoke.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 7.8,
+                cast: 1.17,
+                buffDuration: 60.0,
+                tohitDebuff: 0.5
+            }
+        },
+        {
+            name: "Hot Feet",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "While active, you heat the earth in a large area around yourself. Enemy movement is Slowed as they attempt to flee the immediate area. All foes in the affected area may suffer some damage over time. You cannot fly and must be near the ground to use this power.",
+            shortHelp: "Toggle: PBAoE, Minor DoT(Fire), Foe -SPD",
+            icon: "firetrap_hotfeet.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 2.08,
+                cast: 1.47,
+                damage: {
+                    type: "Fire",
+                    scale: 0.25
+                },
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Flashfire",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Ranged AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "You can bring forth a Flashfire to Disorient a group of foes and deal some damage over time. Target must be on the ground to activate Flashfire.",
+            shortHelp: "Ranged (Targeted AoE), Minor DoT(Fire), Foe Disorient",
+            icon: "firetrap_flashfire.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.8,
+                range: 70.0,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 2.37,
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.06,
+                    ticks: 4
+                },
+                buffDuration: 4.0,
+                stun: 1.0
+            }
+        },
+        {
+            name: "Cinders",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Holds"],
+            description: "Incapacitates foes around the caster by whirling Cinders around them. The targets are left helpless, choking on the soot.<br><br><color #fcfc95>Notes: This power has adaptive recharge. It has a base recharge of <color #FF7F27>8</color> seconds and each affected foe will increase the recharge by <color #FF7F27>14.5</color> seconds for a maximum total of <color #FF7F27>240</color> seconds.</color>",
+            shortHelp: "PBAoE, Foe Hold",
+            icon: "firetrap_cinders.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.8,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.07
+            }
+        },
+        {
+            name: "Bonfire",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You can create a Bonfire that knocks back and burns any foes who try to pass through it.",
+            shortHelp: "Ranged (Location AoE), Minor DMG(Fire), Foe Knockback",
+            icon: "firetrap_bonfire.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 60.0,
+                endurance: 13.0,
+                cast: 3.07,
+                buffDuration: 45.0
+            }
+        },
+        {
+            name: "Fire Imps",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Pet Damage", "Recharge Intensive Pets", "Universal Damage Sets"],
+            description: "You can craft 3 small Fire Imps out of pure flame in a targeted location. Fire Imps will viciously attack any nearby foes, but they only possess the most basic instincts. Fire Imps can be healed and buffed like any teammate.",
+            shortHelp: "Summon Imps: Melee Minor DMG(Fire)",
+            icon: "firetrap_fireimps.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.2,
+                range: 60.0,
+                recharge: 240.0,
+                endurance: 26.0,
+                cast: 2.03
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['dominator/fire-control'] = DOMINATOR_FIRE_CONTROL_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.DOMINATOR_FIRE_CONTROL_POWERSET = DOMINATOR_FIRE_CONTROL_POWERSET;
+}
+
+// ---- js/data/powersets/dominator/gravity-control.js ----
+;/**
+ * Gravity Control
+ * Character Level: 50
+ * Archetype: dominator
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const DOMINATOR_GRAVITY_CONTROL_POWERSET = {
+    name: "Gravity Control",
+    category: "Unknown",
+    description: "Gravity Control powerset",
+    icon: "gravity-control_set.png",
+    powers: [
+        {
+            name: "Crush",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Immobilize", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Creates a localized gravitational field strong enough to Immobilize a single foe. Crush can also bring down flying entities. This power deals Smashing damage over time and can Slow the movement of targets that escape its grasp.",
+            shortHelp: "Ranged, DoT(Smash), Foe Immobilize, -Fly",
+            icon: "gravitycontrol_crush.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.33,
+                dotDamage: {
+                    type: "Smashing",
+                    scale: 0.49820000000000003,
+                    ticks: 4
+                },
+                buffDuration: 9.2
+            }
+        },
+        {
+            name: "Lift",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "Negates the gravity around a single target. Lift violently sends an enemy straight into the air, then slams them to the ground for Smashing damage. This power can bring flying foes to the ground, and can deal bonus damage when used against targets under the effects of Gravity Distortion.",
+            shortHelp: "Ranged, DMG(Smash), Foe Knock Up",
+            icon: "gravitycontrol_lift.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.03,
+                damage: {
+                    type: "Smashing",
+                    scale: 3.011
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Gravity Distortion",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Holds", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Causes a single foe to be trapped in a misshapen gravity field, rendering him unable to take action. Gravity Distortion applies the Gravity Distortion effect and deals Smashing damage to the target.",
+            shortHelp: "Ranged, DoT(Smash), Foe Hold, -Fly, +Gravity Distortion",
+            icon: "gravitycontrol_gravitydistortion.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.83,
+                dotDamage: {
+                    type: "Smashing",
+                    scale: 0.6202,
+                    ticks: 4
+                },
+                buffDuration: 4.2
+            }
+        },
+        {
+            name: "Propel",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "You can open a gravitational rift and retrieve a heavy object, then Propel it at your foes for Smashing Damage. This power can deal bonus damage when used against targets under the effects of Gravity Distortion. This attack's force is so strong that it can knockback additional nearby enemies.",
+            shortHelp: "Ranged, DMG(Smash), Foe Knockback",
+            icon: "gravitycontrol_propel.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 4,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 8.0,
+                endurance: 9.36,
+                cast: 2.07,
+                damage: {
+                    type: "Smashing",
+                    scale: 3.2190000000000003
+                }
+            }
+        },
+        {
+            name: "Crushing Field",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Immobilize", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Creates a large gravitational field strong enough to Immobilize multiple foes. Crushing Field can also bring down flying entities. Slower and less damaging than Crush, but can capture multiple targets. Crushing Field deals Smashing damage over time and can Slow the movement of targets that escape its grasp.",
+            shortHelp: "Ranged (Targeted AoE), DoT(Smash), Foe Immobilize, -Fly",
+            icon: "gravitycontrol_crushingfield.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.9,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 15.6,
+                cast: 1.33,
+                dotDamage: {
+                    type: "Smashing",
+                    scale: 0.1991,
+                    ticks: 2
+                },
+                buffDuration: 5.2
+            }
+        },
+        {
+            name: "Dimension Shift",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Immobilize"],
+            description: "Location-targeted AoE toggle. This power folds space in an area, immobilizing and phasing all targets within the sphere. Enemies who enter the area become immobilized and phased for the duration of the effect. Allies who enter the sphere's area of effect will enter the phase as well, allowing them to combat phased enemies. Detoggling this power ends the effect, bringing the phased creatures back into the physical world. Maintaining this dimensional distortion is taxing on the user, and cannot be done for more than 20 seconds.",
+            shortHelp: "Toggle, Ranged (Location AoE), Foe Intangible",
+            icon: "gravitycontrol_dimensionshift2.png",
+            powerType: "Toggle",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 60.0,
+                endurance: 15.6,
+                cast: 1.17,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Gravity Distortion Field",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Holds", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Creates a large, intensely misshapen Gravity Distortion Field that encompasses several foes, rendering them unable to take any action. Enemies in the area of effect will be affected by the Gravity Distortion effect.",
+            shortHelp: "Ranged (Targeted AoE), Foe Hold, Damage(Smashing), +Gravity Distortion",
+            icon: "gravitycontrol_gravitydistortion.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 0.8,
+                range: 80.0,
+                recharge: 240.0,
+                endurance: 15.6,
+                cast: 1.83
+            }
+        },
+        {
+            name: "Wormhole",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Knockback", "Stuns", "Teleport", "Universal Travel"],
+            description: "You can open a gravitational Wormhole behind a targeted foe and violently push him, and all nearby foes, through it. The victims are sent flying out the other end of the Wormhole and are left Disoriented. You determine the location of the Wormhole's end, and can place it high in the air if desired. More powerful foes may be resistant to the Wormhole effects.",
+            shortHelp: "Ranged (Targeted AoE), Foe Teleport, Disorient, Knockback",
+            icon: "gravitycontrol_wormhole.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 3.0,
+                buffDuration: 1.5,
+                stun: 1.0
+            }
+        },
+        {
+            name: "Singularity",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Pet Damage", "Recharge Intensive Pets", "Universal Damage Sets"],
+            description: "You can create a very powerful Gravitational Singularity. The Singularity will engage your foes, assaulting them with various gravity powers. Any foes that attempt to approach the Singularity will be violently hurled away. The Singularity cannot be healed, but is highly resistant to all forms of damage and nearly impervious to Controlling type powers.",
+            shortHelp: "Summon Singularity: Ranged Control Special",
+            icon: "gravitycontrol_singularity.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 240.0,
+                endurance: 20.8,
+                cast: 2.03
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['dominator/gravity-control'] = DOMINATOR_GRAVITY_CONTROL_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.DOMINATOR_GRAVITY_CONTROL_POWERSET = DOMINATOR_GRAVITY_CONTROL_POWERSET;
+}
+
+// ---- js/data/powersets/dominator/ice-control.js ----
+;/**
+ * Ice Control
+ * Character Level: 50
+ * Archetype: dominator
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const DOMINATOR_ICE_CONTROL_POWERSET = {
+    name: "Ice Control",
+    category: "Unknown",
+    description: "Ice Control powerset",
+    icon: "ice-control_set.png",
+    powers: [
+        {
+            name: "Block of Ice",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Holds", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You can freeze a single foe in a Block of Ice. The target is frozen solid, helpless, and can be attacked. More powerful foes may not be held, but all affected targets will be Slowed and take some Cold damage.",
+            shortHelp: "Ranged, DMG(Cold), Foe Hold, -SPD, -Recharge",
+            icon: "iceformation_blockofice.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.87,
+                damage: {
+                    type: "Cold",
+                    scale: 3.0291
+                },
+                buffDuration: 18.0
+            }
+        },
+        {
+            name: "Chilblain",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Immobilize", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Immobilizes your target in an icy trap, dealing some Cold damage over time as well as slightly slowing the target's attack and movement speed.",
+            shortHelp: "Ranged, DoT (Cold), Foe Immobilize, -SPD, -Recharge",
+            icon: "iceformation_chillblains.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.17,
+                dotDamage: {
+                    type: "Cold",
+                    scale: 0.4758,
+                    ticks: 4
+                },
+                buffDuration: 9.2
+            }
+        },
+        {
+            name: "Frostbite",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Immobilize", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Immobilizes a group of foes in icy traps. Deals minimal Cold damage over time and slightly Slows the targets. Slower and less damaging than Chilblain, but can capture multiple targets. More resilient foes may only be Slowed.",
+            shortHelp: "Ranged (Targeted AoE), DoT (Cold), Foe Immobilize, -SPD, -Recharge",
+            icon: "iceformation_frostbite.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.9,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 15.6,
+                cast: 2.07,
+                dotDamage: {
+                    type: "Cold",
+                    scale: 0.2301,
+                    ticks: 2
+                },
+                buffDuration: 5.2
+            }
+        },
+        {
+            name: "Arctic Air",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Confuse", "Dominator Archetype Sets", "Slow Movement"],
+            description: "While this power is active, you are surrounded in a fog of Arctic Air that dramatically slows the attack and movement speed of nearby foes. The chill of Arctic Air is so bitter that many foes are forced to flee, albeit very slowly, from the immediate area. Others may attack their own allies, as the fog from the Arctic Air is thick and can cause much confusion. The cold air can also reduce the stealth capability of affected foes.",
+            shortHelp: "Toggle: PBAoE, Foe Confuse(Special), -SPD, -Recharge, -Stealth",
+            icon: "iceformation_articair.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 15.0,
+                endurance: 2.08,
+                cast: 2.03,
+                buffDuration: 2.25
+            }
+        },
+        {
+            name: "Cold Snap",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Fear", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Fear", "Slow Movement"],
+            description: "You blast forth a wide cone of chilling air that dramatically slows the enemies' movement and attack rate and might leave nearby foes trembling.<br><br><color #fcfc95>Notes: The Fear component applies only to enemies in the center area of effect.</color>",
+            shortHelp: "Ranged (Cone), Foe Fear, -SPD, -Recharge",
+            icon: "iceformation_shiver.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 2.3562,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 40.0,
+                endurance: 10.4,
+                cast: 2.17,
+                buffDuration: 18.0
+            }
+        },
+        {
+            name: "Ice Slick",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You can create a large patch of ice at a targeted area, causing all foes that pass through it to lose their footing. Those caught in the Ice Slick are dramatically slowed, take cold damage over time, tend to fall down and will be unable to jump.",
+            shortHelp: "Target (Location AoE), Foe DoT (Cold), Knockdown, -SPD",
+            icon: "iceformation_iceslick.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 90.0,
+                endurance: 10.4,
+                cast: 1.67,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Flash Freeze",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Ranged AoE Damage", "Sleep", "Universal Damage Sets"],
+            description: "You can Flash Freeze a large patch of ground beneath a targeted foe, instantly forming dozens of deadly ice shards that do Cold damage to all enemies in the area. The victims are left trapped within the icicles, but can break free if disturbed. Only targets near the ground can be affected.<br><br><color #fcfc95>Notes: Although this power is Auto Hit, it requires a To Hit check to apply Deep Sleep. If The Hit check is missed, and the target is not an AV, the weaker form of Sleep will be applied.</color>",
+            shortHelp: "Ranged (Targeted AoE), DMG(Cold), Foe Deep Sleep",
+            icon: "iceformation_flashfreeze.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 45.0,
+                endurance: 15.6,
+                cast: 2.37,
+                damage: {
+                    type: "Cold",
+                    scale: 0.2
+                }
+            }
+        },
+        {
+            name: "Glacier",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "Slow", "EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Holds", "Slow Movement"],
+            description: "You can freeze all foes around yourself in blocks of Glacial ice. The targets are frozen solid, helpless, and can be attacked. Even after the victims emerge, they remain chilled and their attack and movement speed is Slowed for a while. This power can only be cast near the ground.<br><br><color #fcfc95>Notes: This power has adaptive recharge. It has a base recharge of <color #FF7F27>8</color> seconds and each affected foe will increase the recharge by <color #FF7F27>14.5</color> seconds for a maximum total of <color #FF7F27>240</color> seconds.</color>",
+            shortHelp: "PBAoE, Foe Hold, -Recharge, -SPD",
+            icon: "iceformation_glacier.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.8,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 2.03,
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Jack Frost",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Pet Damage", "Recharge Intensive Pets", "Universal Damage Sets"],
+            description: "You can create a very powerful entity of animated ice at a targeted location. Jack Frost possesses several ice powers to attack any nearby foes and can be healed and buffed like any teammate.",
+            shortHelp: "Summon Jack Frost: Melee DMG(Lethal/Cold)",
+            icon: "iceformation_jackfrost.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 240.0,
+                endurance: 20.8,
+                cast: 1.87
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['dominator/ice-control'] = DOMINATOR_ICE_CONTROL_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.DOMINATOR_ICE_CONTROL_POWERSET = DOMINATOR_ICE_CONTROL_POWERSET;
+}
+
+// ---- js/data/powersets/dominator/icy-assault.js ----
+;/**
+ * Icy Assault
+ * Character Level: 50
+ * Archetype: dominator
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const DOMINATOR_ICY_ASSAULT_POWERSET = {
+    name: "Icy Assault",
+    category: "Unknown",
+    description: "Icy Assault powerset",
+    icon: "icy-assault_set.png",
+    powers: [
+        {
+            name: "Ice Bolt",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Ice Bolt quickly pelts an enemy with small icy daggers; their chill Slows a foe's attacks and movement for a time. Fast, but little damage.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, Light DMG(Cold/Smash), Foe -Recharge, -SPD",
+            icon: "iceassault_bolt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 5.0,
+                endurance: 6.032,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 1.968
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.492
+                        }
+                    ],
+                    scale: 2.46
+                },
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Ice Sword",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You create a blade of solid ice that deals good damage. Being hit by this Ice Sword will Slow a target's movement and attack speed, due to the intense chill.<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Melee, High DMG(Cold/Lethal), Foe -Recharge, -SPD",
+            icon: "iceassault_icesword.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.33,
+                damage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 2.2337
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 1.4573
+                        }
+                    ],
+                    scale: 3.691
+                },
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Ice Sword Circle",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Mastery of your Ice Sword has enabled you to make an attack on every foe within melee distance. This will slash and chill your enemies, dealing moderate damage and slowing all affected targets' movement and attack speed.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE Melee, Light DMG(Cold/Lethal), Foe -Recharge, -SPD",
+            icon: "iceassault_iceswordcircle.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 22.0,
+                endurance: 20.176,
+                cast: 2.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 1.4947
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.4947
+                        }
+                    ],
+                    scale: 2.9894
+                },
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Ice Blast",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Ice Blast hurls shards of ice at foes and Slows their attacks and movement for a time. Slower recharge than Ice Bolt, but more damage.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, Light DMG(Cold/Smash), Foe -Recharge, -SPD",
+            icon: "iceassault_iceblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 2.005
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.655
+                        }
+                    ],
+                    scale: 2.66
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Power Up",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "Boosts the damage and secondary effects of your powers. Your powers' effects like Heals, Defense Buffs, Endurance Drains, Disorients, Holds, Immobilizes and more, are all improved. The effects of Power Up last a short while, and only the next couple of attacks will be boosted.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +Special, +Dmg(All)",
+            icon: "iceassault_powerboost.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 7.8,
+                cast: 1.17,
+                buffDuration: 10.0,
+                stun: 1.0,
+                stunDuration: 10.0,
+                tohitBuff: 0.5,
+                defenseBuff: 0.5
+            }
+        },
+        {
+            name: "Frost Breath",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Unleashes a cone of frosty breath that can Slow your opponents' movement and attacks. Very accurate and very deadly at medium range.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Close (Cone), Moderate DoT(Cold), Foe -Recharge, -SPD",
+            icon: "iceassault_frost.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.2,
+                range: 40.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 2.67,
+                dotDamage: {
+                    type: "Cold",
+                    scale: 1.3734,
+                    ticks: 1
+                },
+                buffDuration: 0.6
+            }
+        },
+        {
+            name: "Chilling Embrace",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "While active, you dramatically lower the temperature around yourself, Slowing the attack rate of all nearby foes, as well as their damage and movement speed. The low air temperatures may also deal some damage over time to the snared foes.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Toggle: PBAoE, Minor DoT(Cold), Foe -Recharge, -Speed",
+            icon: "iceassault_chillingembrace.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.52,
+                cast: 0.73,
+                damage: {
+                    type: "Cold",
+                    scale: 0.14
+                },
+                buffDuration: 5.0
+            }
+        },
+        {
+            name: "Ice Slash",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Ice Slash allows the user to create a blade of solid ice and strike a foe for high damage. Being hit by Ice Slash will Slow a foes' attack and movement speed, due to the intense chill.<br><br><color #fcfc95>Damage: Superior.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee, Superior DMG(Cold/Lethal), Foe -Recharge, -SPD",
+            icon: "iceassault_iceswordcleave.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 17.0,
+                endurance: 16.016,
+                cast: 1.83,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 2.7205000000000004
+                        },
+                        {
+                            type: "Cold",
+                            scale: 2.7205000000000004
+                        }
+                    ],
+                    scale: 5.441000000000001
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Bitter Ice Blast",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Ranged Damage", "Slow Movement", "To Hit Debuff", "Universal Damage Sets"],
+            description: "A slower yet more powerful version of Ice Blast, Bitter Ice Blast deals much more damage and can also reduce your enemy's chance to hit. Like other Ice Blast powers, Bitter Ice Blast can Slow a target's movement and attack speed.<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, High DMG(Cold/Smash), Foe -Recharge, -SPD, -To Hit",
+            icon: "iceassault_bitterblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 1.07,
+                damage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 2.2086
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.7005
+                        }
+                    ],
+                    scale: 3.9091
+                },
+                tohitDebuff: 1.0,
+                buffDuration: 6.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['dominator/icy-assault'] = DOMINATOR_ICY_ASSAULT_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.DOMINATOR_ICY_ASSAULT_POWERSET = DOMINATOR_ICY_ASSAULT_POWERSET;
+}
+
+// ---- js/data/powersets/dominator/illusion-control.js ----
+;/**
+ * Illusion Control
+ * Character Level: 50
+ * Archetype: dominator
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const DOMINATOR_ILLUSION_CONTROL_POWERSET = {
+    name: "Illusion Control",
+    category: "Unknown",
+    description: "Illusion Control powerset",
+    icon: "illusion-control_set.png",
+    powers: [
+        {
+            name: "Blind",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Holds", "Ranged Damage", "Sleep", "Universal Damage Sets"],
+            description: "Painfully Blinds a single targeted foe so severely that they are rendered helpless. Blind is so bright that additional foes may also be blinded, though they will not take any damage, and attacking them will free them from the effects.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Psionic), Foe Hold/Sleep",
+            icon: "illusions_blind.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.1,
+                range: 80.0,
+                recharge: 9.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    type: "Psionic",
+                    scale: 2.9291
+                }
+            }
+        },
+        {
+            name: "Spectral Wall",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Dominator Archetype Sets", "Immobilize", "Ranged Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "Creates an illusionary wall of specters that prevents enemies from moving. As the foe is surrounded, they take psionic damage over time.",
+            shortHelp: "Ranged, DoT (Psionic), Foe Immobilize, -ToHit",
+            icon: "illusions_immob.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.33,
+                dotDamage: {
+                    type: "Psionic",
+                    scale: 0.49820000000000003,
+                    ticks: 4
+                },
+                buffDuration: 9.2,
+                tohitDebuff: 0.75
+            }
+        },
+        {
+            name: "Deceive",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Confuse", "Dominator Archetype Sets"],
+            description: "You can Deceive an enemy into believing their friends are not who they appear to be. If successful, the enemy will ignore you and attack their own allies. If you Deceive someone before they have noticed you, your presence will continue to be masked. Damage done by a Deceived enemy will reduce the total amount of Experience Points awarded when a foe is defeated.",
+            shortHelp: "Ranged, Foe Confuse",
+            icon: "illusions_decieve.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 2.0
+            }
+        },
+        {
+            name: "Spectral Terror",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Fear", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Dominator Archetype Sets", "Fear", "To Hit Debuff"],
+            description: "You can create an illusion of unspeakable Terror. The manifestation is so horrible that it caused most foes to tremble helplessly in terror. The Spectral Terror may also Terrify individual foes, causing them to run away in panic.",
+            shortHelp: "Summon Terror: Ranged Fear, -ToHit",
+            icon: "illusions_spectralterror.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 45.0,
+                endurance: 16.64,
+                cast: 3.2,
+                buffDuration: 45.0
+            }
+        },
+        {
+            name: "Superior Invisibility",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "You can bend light around yourself to become completely Invisible. While this power is active, you are all but impossible to detect, and have an extremely high Defense bonus to all attacks. Superior Invisibility is the only toggle invisibility power that allows you to attack while it is active, although you will lose some of your defense bonus if you do so.",
+            shortHelp: "Toggle: Self Stealth, +DEF(All)",
+            icon: "illusions_invisibility.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.182,
+                cast: 0.73,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Gleam",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Ranged AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "Multiple flashing lights go off around enemies, disorienting and damaging them. Gleam deals minimal Psionic damage, and can Disorient all affected targets for a good while.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Psionic), Foe Disorient",
+            icon: "illusions_stun.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            arc: 1.5708,
+            effects: {
+                accuracy: 0.8,
+                range: 70.0,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 1.5,
+                damage: {
+                    type: "Psionic",
+                    scale: 0.5
+                },
+                stun: 4.0
+            }
+        },
+        {
+            name: "Phantom Army",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Pet Damage", "Recharge Intensive Pets", "Universal Damage Sets"],
+            description: "You can fabricate 3 Phantom heroes around a targeted foe. These Phantoms are not real, and are indestructible. Though they deal damage, it is illusory and will heal if the victim survives long enough. Phantoms are short lived and cannot be buffed or healed.",
+            shortHelp: "Summon Decoys: Ranged DMG(Psionic)",
+            icon: "illusions_phantomarmy2.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 240.0,
+                endurance: 26.0,
+                cast: 3.1,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Flash",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Holds"],
+            description: "Generates a brilliant flash of light around you that blinds nearby foes. Flashed foes are rendered helpless and unable to defend themselves.<br><br><color #fcfc95>Notes: This power has adaptive recharge. It has a base recharge of <color #FF7F27>8</color> seconds and each affected foe will increase the recharge by <color #FF7F27>14.5</color> seconds for a maximum total of <color #FF7F27>240</color> seconds.</color>",
+            shortHelp: "PBAoE, Foe Hold",
+            icon: "illusions_flash.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.8,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 3.0
+            }
+        },
+        {
+            name: "Phantasm",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Pet Damage", "Recharge Intensive Pets", "Universal Damage Sets"],
+            description: "You can construct a powerful entity composed of pure light. Although made of light, the Phantasm is tangible and has powerful Energy attacks. The Phantasm can also fly and summon duplicates of itself. The duplicates are intangible, and cannot be harmed. The duplicates' attacks deal illusory damage similar to that dealt by Spectral Wounds. Only the original Phantasm can be healed and buffed. Type ''/release_pets'' in the chat window to release all your pets.",
+            shortHelp: "Summon Phantasm: Ranged, DMG(Smash/Energy/Psionic)",
+            icon: "illusions_phantasm.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 240.0,
+                endurance: 26.0,
+                cast: 2.03
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['dominator/illusion-control'] = DOMINATOR_ILLUSION_CONTROL_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.DOMINATOR_ILLUSION_CONTROL_POWERSET = DOMINATOR_ILLUSION_CONTROL_POWERSET;
+}
+
+// ---- js/data/powersets/dominator/martial-assault.js ----
+;/**
+ * Martial Assault
+ * Character Level: 50
+ * Archetype: dominator
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const DOMINATOR_MARTIAL_ASSAULT_POWERSET = {
+    name: "Martial Assault",
+    category: "Unknown",
+    description: "Martial Assault powerset",
+    icon: "martial-assault_set.png",
+    powers: [
+        {
+            name: "Shuriken Throw",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Universal Damage Sets"],
+            description: "You impale your foe with a thrown shuriken, dealing moderate Lethal damage.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, Light DMG(Lethal)",
+            icon: "martialassault_shurikenthrow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    type: "Lethal",
+                    scale: 2.26
+                }
+            }
+        },
+        {
+            name: "Thunder Kick",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Melee Damage", "Stuns", "Universal Damage Sets"],
+            description: "You can perform a strong Thunder Kick that hits so hard it can Disorient your target.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Melee, Moderate DMG(Smash), Minor Disorient",
+            icon: "martialassault_thunderkick.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 7.0,
+                endurance: 7.696,
+                cast: 0.83,
+                damage: {
+                    type: "Smashing",
+                    scale: 2.6220999999999997
+                },
+                stun: 3.0
+            }
+        },
+        {
+            name: "Trick Shot",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Universal Damage Sets"],
+            description: "You take careful aim and bounce a thrown shuriken between multiple targets.<br><br><color #fcfc95>Notes: Trick Shot is unaffected by Range changes.</color><br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged, Chain Light DMG(Lethal)",
+            icon: "martialassault_trickshot.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Chain",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.07,
+                damage: {
+                    type: "Lethal",
+                    scale: 2.5
+                }
+            }
+        },
+        {
+            name: "Spinning Kick",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You perform a high spinning reverse roundhouse kick, smashing anything in front of you with devastating force. You can activate this ability at any time, no matter what you have targeted; it will strike enemies directly in front of your character, rather than enemies near your target.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Melee Cone, Light DMG(Smash), Knockdown",
+            icon: "martialassault_spinningkick.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.05,
+                range: 9.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.07,
+                damage: {
+                    type: "Smashing",
+                    scale: 2.7464
+                }
+            }
+        },
+        {
+            name: "Envenomed Blades",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "You add a toxic venom to all of your attacks for a moderate duration. All damaging powers gain bonus Toxic damage. You also gain a moderate bonus to your chance to hit.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +Toxic Damage on all attacks, +ToHit",
+            icon: "martialassault_envenomedblades.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 160.0,
+                endurance: 7.8,
+                cast: 1.17,
+                tohitBuff: 0.12,
+                buffDuration: 40.0
+            }
+        },
+        {
+            name: "Dragon's Tail",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "This low spinning kick deals less damage than Thunder Kick, but has a chance to hit all enemies in melee range. Successful hits may trip and knock down your opponents.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE Melee, Light DMG(Smash), Foe Knockdown",
+            icon: "martialmanipulation_dragonstail.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.05,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.5,
+                damage: {
+                    type: "Smashing",
+                    scale: 2.7914
+                }
+            }
+        },
+        {
+            name: "Caltrops",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage"],
+            allowedSetCategories: ["Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You toss a handful of Caltrops at a targeted location and spread the tiny metal spikes over a large area. Any villains that pass over the Caltrops will be forced to move at a slower rate. They will also take some trivial Lethal damage over time.<br><br><color #fcfc95>Damage: Minor(DoT).</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Location AoE), Minor DoT(Lethal), Foe -Speed",
+            icon: "martialassault_caltrops.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 25.0,
+                recharge: 45.0,
+                endurance: 7.8,
+                cast: 1.07,
+                buffDuration: 45.0
+            }
+        },
+        {
+            name: "Masterful Throw",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Ranged Damage", "Sniper Attacks", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You take careful aim and let loose an extremely accurate, extremely forceful blade. This is a sniper attack, and is best fired from a distance, as it can be interrupted. If you are engaged in battle this attack becomes instant-cast. If you are not engaged, it will do bonus damage.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Sniper, Extreme DMG(Lethal), Foe -To Hit",
+            icon: "martialassault_masterfulthrow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 150.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 1.33
+            }
+        },
+        {
+            name: "Explosive Shuriken",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Universal Damage Sets"],
+            description: "You rig a shuriken with a powerful explosive, then send it flying towards your enemies.<br><br><color #fcfc95>Damage: Superior.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Superior DMG(Fire), Minor Splash Damage (Fire DoT)",
+            icon: "martialassault_explosiveshuriken.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 1.67,
+                damage: {
+                    type: "Fire",
+                    scale: 4.329
+                }
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['dominator/martial-assault'] = DOMINATOR_MARTIAL_ASSAULT_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.DOMINATOR_MARTIAL_ASSAULT_POWERSET = DOMINATOR_MARTIAL_ASSAULT_POWERSET;
+}
+
+// ---- js/data/powersets/dominator/mind-control.js ----
+;/**
+ * Mind Control
+ * Character Level: 50
+ * Archetype: dominator
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const DOMINATOR_MIND_CONTROL_POWERSET = {
+    name: "Mind Control",
+    category: "Unknown",
+    description: "Mind Control powerset",
+    icon: "mind-control_set.png",
+    powers: [
+        {
+            name: "Levitate",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "You can send a single target violently into the air, then slam them to the ground for Smashing damage. This power can bring flying foes to the ground. This power will affect enemies around your primary target, should it be used on the primary target of your Telekinesis.",
+            shortHelp: "Ranged, Light DMG(Smash), Foe Knock Up",
+            icon: "mentalcontrol_levitate.png",
+            powerType: "Click",
+            targetType: "Foe",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.87,
+                damage: {
+                    type: "Smashing",
+                    scale: 3.2691
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Mesmerize",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Ranged Damage", "Sleep", "Universal Damage Sets"],
+            description: "Mesmerize painfully assails a target with psychic energy, rendering him unconscious. The target will remain asleep for some time, but will awaken if attacked.<br><br><color #fcfc95>Notes: The Sleep component of this power is Auto Hit against regular enemies, but a To Hit check is required to against AVs and players, as well as to make secondary effects apply.</color>",
+            shortHelp: "Ranged, Light DMG(Psionic), Foe Deep Sleep",
+            icon: "mentalcontrol_hypnotize.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.1,
+                range: 100.0,
+                recharge: 6.0,
+                endurance: 5.2,
+                cast: 1.67,
+                damage: {
+                    type: "Psionic",
+                    scale: 1.8091
+                }
+            }
+        },
+        {
+            name: "Dominate",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Holds", "Ranged Damage", "Universal Damage Sets"],
+            description: "Painfully tears at the mind of a single foe. Dominate deals Psionic damage and renders a foe helpless, lost in their own mind and unable to defend themself.",
+            shortHelp: "Ranged, Light DMG(Psionic), Foe Hold",
+            icon: "mentalcontrol_command.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.1,
+                damage: {
+                    type: "Psionic",
+                    scale: 2.49
+                }
+            }
+        },
+        {
+            name: "Confuse",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Confuse", "Dominator Archetype Sets"],
+            description: "You can Confuse an enemy, forcing it to believe their friends are not who they appear to be. If successful, the enemy will ignore you and attack their own allies. If you Confuse a target before they notice you, your presence will continue to be masked. You will not receive any Experience Points for foes defeated entirely by a Confused enemy.",
+            shortHelp: "Ranged, Target Confuse",
+            icon: "mentalcontrol_mindcontrol.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 2.0
+            }
+        },
+        {
+            name: "Mass Hypnosis",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Sleep", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Sleep"],
+            description: "Hypnotizes a group of foes at a distance and puts them to Sleep. The targets will remain asleep for some time, but will awaken if attacked. This power deals no damage, but if done discreetly, the targets will never be aware of your presence.<br><br><color #fcfc95>Notes: Although this power is Auto Hit, it requires a To Hit check to apply Deep Sleep. If The Hit check is missed, and the target is not an AV, the weaker form of Sleep will be applied.</color>",
+            shortHelp: "Ranged (Targeted AoE), Foe Deep Sleep",
+            icon: "mentalcontrol_masshypnosis.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 45.0,
+                endurance: 15.6,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Telekinesis",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Immobilize"],
+            description: "Lifts a foe, and any nearby foes, off the ground and repels them. The targets are helpless, unable to move, and will continue to hover away, picking up any passing targets, as long as you keep this power active. Keeping up this level of concentration costs a lot of Endurance. Note despite this power being auto-hit, it still requires a ToHit check.",
+            shortHelp: "Toggle: Ranged (Targeted AoE), Foe Immobilize, Repel",
+            icon: "mentalcontrol_telekinesis.png",
+            powerType: "Toggle",
+            targetType: "Foe",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 90.0,
+                endurance: 0.26,
+                cast: 1.13,
+                buffDuration: 1.5
+            }
+        },
+        {
+            name: "Total Domination",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Holds"],
+            description: "Tears at the mind of a target foe and those near him. Total Domination renders all affected foes helpless, lost in their own minds and unable to defend themselves.<br><br><color #fcfc95>Notes: This power has adaptive recharge. It has a base recharge of <color #FF7F27>8</color> seconds and each affected foe will increase the recharge by <color #FF7F27>14.5</color> seconds for a maximum total of <color #FF7F27>240</color> seconds.</color>",
+            shortHelp: "Ranged (Targeted AoE), Foe Hold",
+            icon: "mentalcontrol_freeze.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.8,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Terrify",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Fear", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Fear", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "This power Terrifies foes within a cone area in front of you, causing them to tremble in Fear uncontrollably. The effect is so frightening and overwhelming, that the target takes real damage from the physiological response to this Psionic attack.",
+            shortHelp: "Ranged (Cone), Light DMG(Psionic), Foe Fear(Special)",
+            icon: "mentalcontrol_terrify.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 40.0,
+                endurance: 20.8,
+                cast: 2.03,
+                damage: {
+                    type: "Psionic",
+                    scale: 1.8426
+                }
+            }
+        },
+        {
+            name: "Mass Confusion",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Confuse", "Dominator Archetype Sets"],
+            description: "You can cause Mass Confusion within a group of foes, creating chaos. All affected foes within the area will turn and attack each other, ignoring all your allies. If you Confuse your foes before they noticed you, your presence will continue to go unnoticed.<br><br><color #fcfc95>Notes: This power has adaptive recharge. It has a base recharge of <color #FF7F27>8</color> seconds and each affected foe will increase the recharge by <color #FF7F27>14.5</color> seconds for a maximum total of <color #FF7F27>240</color> seconds.</color>",
+            shortHelp: "Ranged (Targeted AoE), Foe Confuse",
+            icon: "mentalcontrol_confuse.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['dominator/mind-control'] = DOMINATOR_MIND_CONTROL_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.DOMINATOR_MIND_CONTROL_POWERSET = DOMINATOR_MIND_CONTROL_POWERSET;
+}
+
+// ---- js/data/powersets/dominator/plant-control.js ----
+;/**
+ * Plant Control
+ * Character Level: 50
+ * Archetype: dominator
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const DOMINATOR_PLANT_CONTROL_POWERSET = {
+    name: "Plant Control",
+    category: "Unknown",
+    description: "Plant Control powerset",
+    icon: "plant-control_set.png",
+    powers: [
+        {
+            name: "Entangle",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Immobilize", "Ranged Damage", "Universal Damage Sets"],
+            description: "Immobilizes your target by Entangling their feet in a twisted mass of thorny roots. The roots do smashing and lethal damage to the target over time. More resilient foes may require multiple applications to Immobilize. Entangle can immobilize flying targets, if they are near the ground when attacked.",
+            shortHelp: "Ranged, DoT(Smashing, Lethal), Foe Immobilize",
+            icon: "plantcontrol_entangle.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.2,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 0.24000000000000002,
+                            ticks: 4
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 0.24000000000000002,
+                            ticks: 4
+                        }
+                    ]
+                },
+                buffDuration: 9.2
+            }
+        },
+        {
+            name: "Strangler",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Holds", "Ranged Damage", "Universal Damage Sets"],
+            description: "Holds a distant foe by Strangling him with massive root-like vines. The target is held helpless, while he is slowly crushed by the vines.",
+            shortHelp: "Ranged, DoT(Smashing), Foe Hold",
+            icon: "plantcontrol_strangler.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 2.07,
+                dotDamage: {
+                    type: "Smashing",
+                    scale: 0.6538,
+                    ticks: 4
+                },
+                buffDuration: 4.2
+            }
+        },
+        {
+            name: "Roots",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Immobilize", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Immobilizes a group of foes by entangling their feet in a twisted mass of thorny Roots. Roots is slower and does less damage than Entangle, but it can capture multiple foes in one attack. Like Entangle, Roots can immobilize flying targets, if they are near the ground when attacked.",
+            shortHelp: "Ranged (Targeted AoE), DoT(Smashing, Lethal), Foe Immobilize",
+            icon: "plantcontrol_roots.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.9,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 13.0,
+                cast: 1.67,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 0.16510000000000002,
+                            ticks: 2
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 0.16510000000000002,
+                            ticks: 2
+                        }
+                    ]
+                },
+                buffDuration: 5.2
+            }
+        },
+        {
+            name: "Spore Burst",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Sleep", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Sleep"],
+            description: "You hurl a large fungi pod at your foes. This pod is full of Spores that burst on impact, engulfing the target and all those around him. All affected targets may succumb to the narcotic effect of the Spores and will fall asleep. The targets will remain asleep for some time, but will awaken if attacked.<br><br><color #fcfc95>Notes: Although this power is Auto Hit, it requires a To Hit check to apply Deep Sleep. If The Hit check is missed, and the target is not an AV, the weaker form of Sleep will be applied.</color>",
+            shortHelp: "Ranged (Targeted AoE), Foe Deep Sleep",
+            icon: "plantcontrol_sporeburst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 45.0,
+                endurance: 13.0,
+                cast: 1.37
+            }
+        },
+        {
+            name: "Seeds of Confusion",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Confuse", "Dominator Archetype Sets"],
+            description: "You throw a handful of seeds from a rare Baffle plant at your foes. The seeds spread out in a wide cone and release a dusty chaff that contain a number of alkaloids and hallucinogenic compounds. Foes that come into contact with these seeds become violently confused and will turn and attack each other, ignoring you and all your allies. You will not receive any Experience Points for foes defeated entirely by Confused enemies.<br><br><color #fcfc95>Notes: This power has adaptive recharge. It has a base recharge of <color #FF7F27>6</color> seconds and each affected foe will increase the recharge by <color #FF7F27>6.5</color> seconds for a maximum total of <color #FF7F27>110</color> seconds.</color>",
+            shortHelp: "Ranged (Cone), Foe Confuse",
+            icon: "plantcontrol_seedsconfusion.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 1.0472,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 6.0,
+                endurance: 15.6,
+                cast: 1.07
+            }
+        },
+        {
+            name: "Spirit Tree",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing", "Threat Duration"],
+            description: "You can tap into the elusive and powerful energy of the World Tree and extract a Spirit Tree at a targeted location. The Sprit Tree is immobile, but possesses incredible rejuvenating powers. The Regeneration Rate of you, or your allies, will be greatly increased as long as you are near the Spirit Tree. The tree will also distract some enemies, taunting them to attack it instead of you.",
+            shortHelp: "Place Tree: PBAoE +Regen",
+            icon: "plantcontrol_spirittree.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 120.0,
+                endurance: 13.0,
+                cast: 1.67,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Vines",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Holds", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Creates a field of Strangler Vines that can Hold multiple foes at range. The affected targets are held helpless by the massive root-like vines. Vines lowers damage output of targets and deals toxic damage over time if they are held.",
+            shortHelp: "Ranged (Targeted AoE), Foe Hold, -DMG, -DoT(Toxic)",
+            icon: "plantcontrol_vines.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 0.8,
+                range: 80.0,
+                recharge: 240.0,
+                endurance: 15.6,
+                cast: 2.1
+            }
+        },
+        {
+            name: "Carrion Creepers",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Immobilize", "Knockback", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You can create a Creeper patch at a targeted location. The patch will snag foes, slowing their movement, and preventing them from jumping or flying. Additionally, a Creeper Vine will burst from under each live and defeated foe in the area and start attacking your enemies. Creeper Vines do minimal damage, but they can knock down your enemies and its poisonous thorns can slow your foes. Any foes that are defeated in the Creeper patch will also produce a growth of Entangle Roots that will Immobilize any enemies near the defeated foe.",
+            shortHelp: "Summon Creepers, Ranged (Location AoE), Target -Speed, -Fly, -Jump,",
+            icon: "plantcontrol_carrioncreeper.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 360.0,
+                endurance: 26.0,
+                cast: 1.17,
+                buffDuration: 120.0
+            }
+        },
+        {
+            name: "Fly Trap",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Pet Damage", "Recharge Intensive Pets", "Universal Damage Sets"],
+            description: "You can summon a giant carnivorous Fly Trap plant beast. Fly Trap may be an understatement, as this plant beast has a taste for flesh. The Fly Trap will viciously attack any nearby foes; biting, hurling poisonous Thorns and even casting its own Entangle Roots. The Fly Trap will fight by your side and can be healed and buffed like any teammate.",
+            shortHelp: "Summon Fly Trap: Ranged Control Special",
+            icon: "plantcontrol_venusflytrap.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 240.0,
+                endurance: 26.0,
+                cast: 1.17
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['dominator/plant-control'] = DOMINATOR_PLANT_CONTROL_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.DOMINATOR_PLANT_CONTROL_POWERSET = DOMINATOR_PLANT_CONTROL_POWERSET;
+}
+
+// ---- js/data/powersets/dominator/psionic-assault.js ----
+;/**
+ * Psionic Assault
+ * Character Level: 50
+ * Archetype: dominator
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const DOMINATOR_PSIONIC_ASSAULT_POWERSET = {
+    name: "Psionic Assault",
+    category: "Unknown",
+    description: "Psionic Assault powerset",
+    icon: "psionic-assault_set.png",
+    powers: [
+        {
+            name: "Mind Probe",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Universal Damage Sets"],
+            description: "Grip the minds of your foe with a Mind Probe. You must be in close proximity to pull off this attack that wrecks havoc on your foes synapses, dealing high Psionic Damage while reducing their attack speed.<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Melee, High DMG(Psionic), Target -Recharge",
+            icon: "psionicassault_mindprobe.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.17,
+                damage: {
+                    type: "Psionic",
+                    scale: 3.5789999999999997
+                },
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Psionic Dart",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Universal Damage Sets"],
+            description: "This basic attack does moderate Psionic damage, and can slightly reduce a target's attack speed.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Ranged, Light DMG(Psionic), Target -Recharge",
+            icon: "psionicassault_mentaldart.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 100.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 0.83,
+                damage: {
+                    type: "Psionic",
+                    scale: 1.9409999999999998
+                },
+                buffDuration: 5.0
+            }
+        },
+        {
+            name: "Telekinetic Thrust",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee Damage", "Universal Damage Sets"],
+            description: "A focused attack of intense mental power that violently sends a nearby foe flying and deals a high amount of Psionic and Smashing damage.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Melee, Moderate DMG(Psionic/Smash), Foe Knockback",
+            icon: "psionicassault_telekineticthrust.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 7.0,
+                endurance: 7.696,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Psionic",
+                            scale: 2.145
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.715
+                        }
+                    ],
+                    scale: 2.86
+                }
+            }
+        },
+        {
+            name: "Mental Blast",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Universal Damage Sets"],
+            description: "This basic attack does high Psionic damage, and can slightly reduce a target's attack speed.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged, Moderate DMG(Psionic), Target -Recharge",
+            icon: "psionicassault_mentalblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 100.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    type: "Psionic",
+                    scale: 3.5290999999999997
+                },
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Psychic Scream",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged AoE Damage", "Universal Damage Sets"],
+            description: "This howl of Psionic energy resonates in the minds of all foes within its conical area of effect, inflicting moderate damage.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Cone), Light DMG(Psionic), Foe -Recharge",
+            icon: "psionicassault_psychicscream.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 2.67,
+                damage: {
+                    type: "Psionic",
+                    scale: 2.3617
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Drain Psyche",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Endurance Modification", "Healing"],
+            description: "You Drain the Psyche of nearby foes, thus weakening their Hit Point Regeneration and Endurance Recovery and boosting your own.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE Foe -Regen, -Recovery; Self +Regen, +Recovery",
+            icon: "psionicassault_psychicsiphon.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 120.0,
+                endurance: 13.0,
+                cast: 1.33,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Subdue",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Immobilize", "Ranged Damage", "Universal Damage Sets"],
+            description: "Subdue deals high Psionic damage and may leave the targeted foe Immobilized for a brief time. Immobilized foes cannot move but can still attack.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged, Moderate DMG(Psionic), Foe Immobilize",
+            icon: "psionicassault_subdue.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 100.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    type: "Psionic",
+                    scale: 3.5476
+                }
+            }
+        },
+        {
+            name: "Psionic Lance",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Sniper Attacks", "Universal Damage Sets"],
+            description: "This extremely long range Psionic attack has a bonus to Accuracy, and can Slow a target's attack rate. This is a sniper attack, and is best fired from a distance, as it can be interrupted. If you are engaged in battle this attack becomes instant-cast. If you are not engaged, it will do bonus damage.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Sniper, Extreme DMG(Psionic), Target -Recharge",
+            icon: "psionicassault_psioniclance.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 175.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 1.33
+            }
+        },
+        {
+            name: "Psychic Shockwave",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Melee AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "Psychic Shockwave is a devastating Psionic attack that wracks the minds of all nearby foes. Affected foes may have a reduced attack rate and may be left Disoriented.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE, Light DMG(Psionic), Foe Disorient -Recharge",
+            icon: "psionicassault_psionicshockwave.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 1.97,
+                damage: {
+                    type: "Psionic",
+                    scale: 2.5690999999999997
+                },
+                stun: 1.0,
+                buffDuration: 20.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['dominator/psionic-assault'] = DOMINATOR_PSIONIC_ASSAULT_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.DOMINATOR_PSIONIC_ASSAULT_POWERSET = DOMINATOR_PSIONIC_ASSAULT_POWERSET;
+}
+
+// ---- js/data/powersets/dominator/pyrotechnic-control.js ----
+;/**
+ * Pyrotechnic Control
+ * Character Level: 50
+ * Archetype: dominator
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const DOMINATOR_PYROTECHNIC_CONTROL_POWERSET = {
+    name: "Pyrotechnic Control",
+    category: "Unknown",
+    description: "Pyrotechnic Control powerset",
+    icon: "pyrotechnic-control_set.png",
+    powers: [
+        {
+            name: "Dazzle",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Holds", "Ranged Damage", "Universal Damage Sets"],
+            description: "Incapacitates a distant foe with a brilliant explosion of pyrotechnic energy. The target is left helpless for the duration.<br><br>This power has a chance of Blasting Off targets into the air.",
+            shortHelp: "Ranged, Moderate DMG (Fire, Energy), Foe Hold, Chance for Blast Off",
+            icon: "pyrotechnic_dazzle.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.07,
+                damage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 0.8134
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.8134
+                        }
+                    ],
+                    scale: 1.6268
+                }
+            }
+        },
+        {
+            name: "Sparkling Cage",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Immobilize", "Ranged Damage", "Universal Damage Sets"],
+            description: "Immobilizes your target in a ring of pyrotechnic energy, dealing Fire and Energy damage over time. More resilient foes may require multiple Sparkling Cages to Immobilize.<br><br>This power has a chance of Blasting Off targets into the air.",
+            shortHelp: "Ranged, Moderate DoT(Fire, Energy), Foe Immobilize,Chance for Blast Off",
+            icon: "pyrotechnic_sparklingcage.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.17,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 0.179,
+                            ticks: 4
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.179,
+                            ticks: 4
+                        }
+                    ]
+                },
+                buffDuration: 9.2
+            }
+        },
+        {
+            name: "Sparkling Chain",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Immobilize", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Immobilizes a group of foes one by one in a chain formation, dealing Fire and Energy damage over time to each enemy in the chain. More resilient foes may require multiple casts to Immobilize. Sparkling Chain is slower and less damaging than Sparkling Cage, but can capture multiple targets.<br><br>This power has a chance of Blasting Off targets into the air. This chance is greater on the initial target of Sparkling Chain.",
+            shortHelp: "Ranged Chain AoE, Minor DoT(Fire, Energy), Foe Immobilize,Chance for Blast Off",
+            icon: "pyrotechnic_sparklingfield.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Chain",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.9,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 13.0,
+                cast: 1.03,
+                buffDuration: 1.1
+            }
+        },
+        {
+            name: "Glittering Column",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Ranged AoE Damage", "Threat Duration", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You summon a column of brilliant, glittering energy that is sure to capture foes' attention. The column will reduce the ToHit of any foe within a short range, while also Taunting them, forcing them to direct their attacks in its direction. <br><br>When the Glittering Column expires, it explodes, Blasting Off nearby enemies into the air.",
+            shortHelp: "Summon Glittering Column: Taunt, -ToHit, AoE DMG (Fire, Energy), Blast Off",
+            icon: "pyrotechnic_glitteringcolumn.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 40.0,
+                endurance: 7.8,
+                cast: 1.17,
+                buffDuration: 7.0
+            }
+        },
+        {
+            name: "Hypnotizing Lights",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Confuse", "Dominator Archetype Sets", "Ranged AoE Damage", "Sleep", "Universal Damage Sets"],
+            description: "You conjure a whirl of lights with differing effects depending on the distance from which it is viewed. Most all targets within the area will be placed into a sleep like trance. <br><br>Up to five enemies within 20 feet of the display are Confused and receive Psionic damage over time.<br><br><color #fcfc95>Notes: Although this power is Auto Hit, it requires a To Hit check to apply Deep Sleep. If the Hit check is missed, and the target is not an AV, the weaker form of Sleep will be applied.</color>",
+            shortHelp: "Ranged (Cone), Foe Sleep, Foe Confuse (Within 20ft), Moderate DoT (Psionic), Foe Deep Sleep",
+            icon: "pyrotechnic_hypnotizinglights.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 0.7854,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 45.0,
+                endurance: 8.528,
+                cast: 1.67
+            }
+        },
+        {
+            name: "Brilliant Barrage",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Fear", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Fear", "Ranged AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "With a single gesture, you conjure pyrotechnic missiles to assault two locations at once. First, select a target for the first missile and then a location for the second. <br><br>Enemies near the target you have selected will be bombarded with miniature missiles and Stunned. Meanwhile, enemies near the location you have selected on the ground will be hit by a shrill noisemaking rocket and become Terrified.",
+            shortHelp: "Ranged (AoE), Foe Stun, Foe Terrorize, Minor DMG (Fire, Energy)",
+            icon: "pyrotechnic_multipurposemissiles.png",
+            powerType: "Click",
+            targetType: "Foe",
+            effectArea: "AoE",
+            maxTargets: 8,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 1.67
+            }
+        },
+        {
+            name: "Incendiary Aura",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Debuff", "To Hit Debuff"],
+            description: "You create an aura of pyrotechnic energy around yourself that has combustible properties. Enemies within range of the power have a persistent chance of Blasting Off into the air, as well as suffer from reduced ToHit and Defense.",
+            shortHelp: "Toggle: PBAoE, Chance for Blast Off. -ToHit, -Defense",
+            icon: "pyrotechnic_incendiaryaura.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 0.08,
+                cast: 1.47,
+                tohitDebuff: 1.25,
+                buffDuration: 0.45,
+                defenseDebuff: 0.75
+            }
+        },
+        {
+            name: "Explosive Bouquet",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Holds"],
+            description: "You create an explosion of light and sound in a flower formation. Foes inside the blast radius will be Held and Blasted Off into the air.<br><br><color #fcfc95>Notes: This power has adaptive recharge. It has a base recharge of <color #FF7F27>8</color> seconds and each affected foe will increase the recharge by <color #FF7F27>14.5</color> seconds for a maximum total of <color #FF7F27>240</color> seconds.</color>",
+            shortHelp: "Ranged (AoE), Foe Hold, Blast Off",
+            icon: "pyrotechnic_explosivebouquet.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.8,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 2.93
+            }
+        },
+        {
+            name: "Catherine Wheel",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Pet Damage", "Recharge Intensive Pets", "Universal Damage Sets"],
+            description: "You can craft a wheel of pure pyrotechnic energy to assist you in battle. The Catherine Wheel employs a variety of pyrotechnic powers to damage and distract enemies. If an enemy becomes affected by the Blast Off effect from one of your powers, the Catherine Wheel may Intercept the enemy with an attack, dealing additional damage.",
+            shortHelp: "Summon Catherine Wheel: Ranged DMG (Fire, Energy), Special",
+            icon: "pyrotechnic_catherinewheel.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.2,
+                range: 60.0,
+                recharge: 240.0,
+                endurance: 26.0,
+                cast: 2.03
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['dominator/pyrotechnic-control'] = DOMINATOR_PYROTECHNIC_CONTROL_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.DOMINATOR_PYROTECHNIC_CONTROL_POWERSET = DOMINATOR_PYROTECHNIC_CONTROL_POWERSET;
+}
+
+// ---- js/data/powersets/dominator/radioactive-assault.js ----
+;/**
+ * Radioactive Assault
+ * Character Level: 50
+ * Archetype: dominator
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const DOMINATOR_RADIOACTIVE_ASSAULT_POWERSET = {
+    name: "Radioactive Assault",
+    category: "Unknown",
+    description: "Radioactive Assault powerset",
+    icon: "radioactive-assault_set.png",
+    powers: [
+        {
+            name: "Contaminated Strike",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Melee Damage", "Universal Damage Sets"],
+            description: "You charge your fist with harmful radioactive particles and quickly strike your foe dealing Light Energy and Smashing damage as well as reducing their defense. Affected enemies have a small chance to be affected by the Contaminated effect. Hitting Contaminated foes with single target Radioactive Assault powers cause a small burst of damage to foes near the target.<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Melee, High DMG(Energy/Smash), Foe -Def, Special",
+            icon: "radioactiveassault_contaminatedstrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 0.83,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 2.2058
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.7353
+                        }
+                    ],
+                    scale: 2.9411
+                },
+                defenseDebuff: 1.39,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Neutrino Bolt",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged Damage", "Universal Damage Sets"],
+            description: "A very quick, but low damage attack. Neutrino Bolt can reduce the target's Defense. Affected enemies have a small chance to be affected by the Contaminated effect. Hitting Contaminated foes with single target Radioactive Assault powers cause a small burst of damage to foes near the target.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, Light DMG(Energy), Foe -DEF",
+            icon: "radioactiveassault_neutrinoblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    type: "Energy",
+                    scale: 2.2572
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 3.0
+            }
+        },
+        {
+            name: "X-Ray Beam",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged Damage", "Universal Damage Sets"],
+            description: "You can emit a beam of X-Ray energy from your eyes, dealing moderate Energy damage. This attack can bypass some defenses and can reduce the target's Defense. Affected enemies have a small chance to be affected by the Contaminated effect. Hitting Contaminated foes with single target Radioactive Assault powers cause a small burst of damage to foes near the target.<br><br><color #fcfc95>Damage: Superior.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Superior DMG(Energy), Foe -DEF",
+            icon: "radioactiveassault_xraybeam.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 11.0,
+                endurance: 11.024,
+                cast: 1.67,
+                damage: {
+                    type: "Energy",
+                    scale: 4.131600000000001
+                },
+                defenseDebuff: 2.0,
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Electron Haze",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "A short range conical blast of free electrons. This attack can bypass some of a target's defenses and reduce the target's Defense. It can also knock some targets down. Affected enemies have a small chance to be affected by the Contaminated effect. Hitting Contaminated foes with single target Radioactive Assault powers cause a small burst of damage to foes near the target.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Close, Moderate Moderate DMG(Energy), Foe -DEF, Knockback",
+            icon: "radioactiveassault_electronhaze.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 2.37,
+                damage: {
+                    type: "Energy",
+                    scale: 2.6
+                },
+                defenseDebuff: 2.0,
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Fusion",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Fusion boosts your damage and chance to hit moderately and also causes your next few attacks to have a 100% chance to inflict Contaminated on your enemies.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +DMG, +To Hit, Special",
+            icon: "radioactiveassault_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 2.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Radiation Siphon",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Accurate Healing", "Defense Debuff", "Healing", "Knockback", "Melee Damage", "Universal Damage Sets"],
+            description: "You pummel your foe with a deadly smashing attack dealing High Energy and Smashing damage and reducing their defense. Hitting Contaminated targets will also heal you for a large amount of health over 3 seconds and remove the Contaminated effect from the target. However, uncontaminated targets have a moderate chance to be affected by the Contaminated effect. Hitting Contaminated foes with single target Radioactive Assault powers cause a small burst of damage to foes near the target.<br><br><color #fcfc95>Damage: Superior.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee, Superior DMG(Energy/Smash), Foe, -Def, -Contaminated, Special",
+            icon: "radioactiveassault_radiationsiphon.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 12.0,
+                endurance: 10.192,
+                cast: 2.23,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 3.5385999999999997
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.1770999999999998
+                        }
+                    ],
+                    scale: 4.7157
+                },
+                healing: {
+                    scale: 68.16258400000001,
+                    perTarget: true
+                },
+                defenseDebuff: 1.5,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Atom Smasher",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Dominator Archetype Sets", "Melee AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "You charge up a dangerously unstable amount of radioactive energy into a single fist before driving it into the ground and causing a small explosion. Foes caught in the blast will suffer High Energy and Toxic damage and have their defense reduced. Enemies also have a moderate chance to be disoriented for a short time. Affected enemies have a small chance to be affected by the Contaminated effect. Hitting Contaminated foes with single target Radioactive Assault powers cause a small burst of damage to foes near the target.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE, Moderate DMG(Energy/Toxic), Foe -Def, Disorient, Special",
+            icon: "radioactiveassault_atomsmasher.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 22.0,
+                endurance: 20.176,
+                cast: 2.93,
+                damage: {
+                    types: [
+                        {
+                            type: "Toxic",
+                            scale: 2.16
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.7257
+                        }
+                    ],
+                    scale: 2.8857
+                },
+                defenseDebuff: 1.2,
+                buffDuration: 10.0,
+                stun: 2.0
+            }
+        },
+        {
+            name: "Proton Volley",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged Damage", "Sniper Attacks", "Universal Damage Sets"],
+            description: "Hurls a volley of alpha particles over an extremely long range. Proton Volley can bypass some of a target's defenses and reduce the target's Defense. This is a sniper attack, and is best fired from a distance as it can be interrupted. If you are engaged in battle this attack becomes instant-cast. If you are not engaged, it will do bonus damage. Affected enemies have a small chance to be affected by the Contaminated effect. Hitting Contaminated foes with single target Radioactive Assault powers cause a small burst of damage to foes near the target.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Sniper, Extreme DMG(Energy), Foe -DEF",
+            icon: "radioactiveassault_protonvolley.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 150.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 1.33
+            }
+        },
+        {
+            name: "Devastating Blow",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Dominator Archetype Sets", "Melee Damage", "Stuns", "Universal Damage Sets"],
+            description: "You hammer your foe with a brutal smashing attack charged with a lethal dose of radiation. Your target will suffer Extreme Energy and Smashing damage, will have its defense reduced and will be disoriented for a short time. Devastating Blow has an increased change to critically hit. Affected enemies will be affected by the Contaminated effect. Hitting Contaminated foes with single target Radioactive Assault powers cause a small burst of damage to foes near the target.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee, Extreme DMG(Energy/Smash), Foe -Def, Disorient, Special",
+            icon: "radioactiveassault_devastatingblow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 2.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 4.972799999999999
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.6601
+                        }
+                    ],
+                    scale: 6.632899999999999
+                },
+                defenseDebuff: 2.0,
+                buffDuration: 10.0,
+                stun: 3.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['dominator/radioactive-assault'] = DOMINATOR_RADIOACTIVE_ASSAULT_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.DOMINATOR_RADIOACTIVE_ASSAULT_POWERSET = DOMINATOR_RADIOACTIVE_ASSAULT_POWERSET;
+}
+
+// ---- js/data/powersets/dominator/savage-assault.js ----
+;/**
+ * Savage Assault
+ * Character Level: 50
+ * Archetype: dominator
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const DOMINATOR_SAVAGE_ASSAULT_POWERSET = {
+    name: "Savage Assault",
+    category: "Unknown",
+    description: "Savage Assault powerset",
+    icon: "savage-assault_set.png",
+    powers: [
+        {
+            name: "Call Swarm",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You summon a swarm of stinging insects to harass your foe causing Light Lethal damage over time and reducing both their movement speed and defense. This power grants 1 stack of Blood Frenzy.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, DoT (Lethal), Foe -Defense, -Speed, +1 Blood Frenzy",
+            icon: "savagemelee_callswarm.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.46,
+                cast: 1.0,
+                dotDamage: {
+                    type: "Lethal",
+                    scale: 0.47219999999999995,
+                    ticks: 4
+                },
+                buffDuration: 3.1,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Maiming Slash",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You execute a savage slash at your foe's lower body causing moderate lethal damage and minor damage over time. The foe will also have their movement speed reduced moderately. Maiming Slash grants 1 stack of Blood Frenzy.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Melee, DMG(Lethal), DoT (Lethal), Foe -Speed, +1 Blood Frenzy",
+            icon: "savagemelee_maimingslash.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 5.0,
+                endurance: 6.03,
+                cast: 1.17,
+                damage: {
+                    type: "Lethal",
+                    scale: 2.5793
+                },
+                dotDamage: {
+                    type: "Lethal",
+                    scale: 0.3226,
+                    ticks: 3
+                },
+                buffDuration: 3.1
+            }
+        },
+        {
+            name: "Vicious Slash",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Knockback", "Melee Damage", "Universal Damage Sets"],
+            description: "You tear at your foe with both hands dealing high lethal damage and causing minor lethal damage over time. Foes struck by this attack have a high chance to be knocked down. Vicious Slash grants 2 stacks of Blood Frenzy.<br><br><color #fcfc95>Damage: Superior.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee, DMG(Lethal), Foe DoT (Lethal), Knockdown, Self +2 Blood Frenzy",
+            icon: "savagemelee_viciousslash.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 11.0,
+                endurance: 11.024,
+                cast: 1.67,
+                damage: {
+                    type: "Lethal",
+                    scale: 4.129300000000001
+                },
+                dotDamage: {
+                    type: "Lethal",
+                    scale: 0.5423,
+                    ticks: 3
+                },
+                buffDuration: 3.1
+            }
+        },
+        {
+            name: "Unkindness",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "With a mighty roar, you command an unkindness of ravens to quickly assault and harass your foes. Your foes will suffer Moderate Lethal damage over time and have their speed and defense reduced. The power inflicts lethal damage over time that scales in strength with the number Blood Frenzy stacks. This power grants 2 stacks of Blood Frenzy.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Cone), DoT (Lethal), Foe -Speed, -Defense, -Fly, +2 Blood Frenzy",
+            icon: "savagemelee_callravens.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.155,
+                range: 40.0,
+                recharge: 14.0,
+                endurance: 16.9,
+                cast: 2.0,
+                dotDamage: {
+                    type: "Lethal",
+                    scale: 0.4924,
+                    ticks: 4
+                },
+                buffDuration: 3.1,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Spot Prey",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly boosts your attacks for a few seconds. Slightly increases perception and chance to hit.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +DMG, +To Hit, +Perception",
+            icon: "savagemelee_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 5.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Rending Flurry",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee AoE Damage", "Universal Damage Sets"],
+            description: "You wildly slash at nearby foes to deal moderate lethal damage and cause minor lethal damage over time. This power consumes all Blood Frenzy and will deal additional damage per stack of Blood Frenzy consumed. If you have 5 stacks of Blood Frenzy while activating this power, its radius is greatly increased, but causes you to become Exhausted for a short time. While exhausted you cannot gain Blood Frenzy.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE, DMG(Lethal), Foe DoT (Lethal), -Blood Frenzy",
+            icon: "savagemelee_rendingflurry.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 14.0,
+                endurance: 13.52,
+                cast: 2.17
+            }
+        },
+        {
+            name: "Blood Craze",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You go into a blood craze, making you quickly shrug aside some of the damage received. Blood Craze will immediately heal you for a small amount and cause you to heal for a moderate amount of health over time.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +HP, +Health over Time",
+            icon: "savagemelee_bloodthirst.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 180.0,
+                endurance: 7.8,
+                cast: 2.0,
+                healing: {
+                    scale: 101.7352,
+                    perTarget: true
+                },
+                buffDuration: 9.1
+            }
+        },
+        {
+            name: "Call Hawk",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "You call forth a hawk ally to swoop in and viciously peck at your target causing High Lethal damage. The attack often catches foes off their guard and can knock them down as well as reducing their chance to hit. This power's damage over time effect will scale with the number of stacks of Blood Frenzy. Using this power with 5 stacks of Blood Frenzy causes you to become Exhausted for a short time, but the duration of its damage over time effect is increased. While exhausted you cannot gain Blood Frenzy.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Foe DoT (Lethal), -To Hit, Knockdown, -Fly",
+            icon: "savagemelee_callhawk.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 14.0,
+                endurance: 10.9702,
+                cast: 1.67,
+                dotDamage: {
+                    type: "Lethal",
+                    scale: 1.4855,
+                    ticks: 4
+                },
+                buffDuration: 1.3,
+                tohitDebuff: 0.75
+            }
+        },
+        {
+            name: "Feral Charge",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee Damage", "Teleport", "Universal Damage Sets", "Universal Travel"],
+            description: "You throw yourself at your target while slashing and tearing wildly dealing moderate lethal damage and causing it to suffer from additional minor lethal damage over time. The damage of this power can increase based on how far away you charge from, with up to double damage dealt at its strongest. Feral Charge builds 1 stacks of Blood Frenzy for every 20 ft in between your target and you, up to 3 stacks.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Melee, DMG(Lethal), Foe DoT (Lethal), +3 Blood Frenzy, Self Teleport",
+            icon: "savagemelee_feralcharge.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 10.0,
+                endurance: 10.19,
+                cast: 1.1667
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['dominator/savage-assault'] = DOMINATOR_SAVAGE_ASSAULT_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.DOMINATOR_SAVAGE_ASSAULT_POWERSET = DOMINATOR_SAVAGE_ASSAULT_POWERSET;
+}
+
+// ---- js/data/powersets/dominator/sonic-assault.js ----
+;/**
+ * Sonic Assault
+ * Character Level: 50
+ * Archetype: dominator
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const DOMINATOR_SONIC_ASSAULT_POWERSET = {
+    name: "Sonic Assault",
+    category: "Unknown",
+    description: "Sonic Assault powerset",
+    icon: "sonic-assault_set.png",
+    powers: [
+        {
+            name: "Shriek",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Universal Damage Sets"],
+            description: "You let forth a quick Shriek, damaging your target. This power applies <color #ffd9b3>Short Sonic Vibrations</color> that lower resistance for 8s.",
+            shortHelp: "Ranged, DMG(Energy/Smash), Foe -Res(All)",
+            icon: "sonicmanipulation_shriek.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 1.64
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.42
+                        }
+                    ],
+                    scale: 2.06
+                }
+            }
+        },
+        {
+            name: "Strident Echo",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Holds", "Melee Damage", "Universal Damage Sets"],
+            description: "Strident Echo deals minor damage over time. It has a low chance of causing a migraine, leaving the target shaking in pain and helpless.",
+            shortHelp: "Melee, DMG(Energy/Smash), Foe Chance for Hold",
+            icon: "sonicmanipulation_stridentecho.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 1.67,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 0.3607,
+                            ticks: 5
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.3607,
+                            ticks: 5
+                        }
+                    ]
+                },
+                buffDuration: 2.1
+            }
+        },
+        {
+            name: "Scream",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Universal Damage Sets"],
+            description: "Your Scream can cause serious damage to a target. This power applies <color #ffd9b3>Lingering Sonic Vibrations</color> that lower resistance for 10s.",
+            shortHelp: "Ranged, DMG(Energy/Smash), Foe -Res(All)",
+            icon: "sonicmanipulation_scream.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.47,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 0.4658,
+                            ticks: 4
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.132,
+                            ticks: 4
+                        }
+                    ]
+                },
+                buffDuration: 1.05
+            }
+        },
+        {
+            name: "Shockwave",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You can call forth a tremendous Shockwave that knocks back foes and deals Smashing damage in a wide cone area.",
+            shortHelp: "Ranged (Cone), DMG(Energy/Smash), Foe Knockback",
+            icon: "sonicmanipulation_shockwave.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 13.0,
+                endurance: 12.688,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 0.9263
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.9263
+                        }
+                    ],
+                    scale: 1.8526
+                }
+            }
+        },
+        {
+            name: "Bass Boost",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "Boosts the damage and secondary effects of your powers. Your powers' effects like Heals, Defense Buffs, Endurance Drains, Disorients, Holds, Immobilizes and more, are all improved. The effects of Power Up last a short while, and only the next couple of attacks will be boosted.",
+            shortHelp: "Self +Special, +Dmg(All)",
+            icon: "sonicmanipulation_powerup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 7.8,
+                cast: 1.17,
+                buffDuration: 10.0,
+                stun: 1.0,
+                stunDuration: 10.0,
+                tohitBuff: 0.5,
+                defenseBuff: 0.5
+            }
+        },
+        {
+            name: "Deafening Wave",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Holds", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You create a large field of sonic waves, causing damage to all foes around you. It has a moderate chance of causing migraines, leaving them shaking in pain and helpless.",
+            shortHelp: "PBAoE Melee, DMG(Energy/Smash), Foe Chance for Hold",
+            icon: "sonicmanipulation_deafeningcry.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 2.03,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 0.9509
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.9509
+                        }
+                    ],
+                    scale: 1.9018
+                }
+            }
+        },
+        {
+            name: "Disruption Aura",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "You emit a constant wave of sonic energy around yourself, weakening the Damage Resistance of all nearby foes.",
+            shortHelp: "Toggle: PBAoE, Foe -Res(All)",
+            icon: "sonicmanipulation_disruptionaura.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 1.04,
+                cast: 1.97,
+                buffDuration: 2.25
+            }
+        },
+        {
+            name: "Shout",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Universal Damage Sets"],
+            description: "You blast your foe with a tremendous Shout, damaging them. This power applies <color #ffd9b3>Extended Sonic Vibrations</color> that lower resistance for 12s.",
+            shortHelp: "Ranged, DMG(Energy/Smash), Foe -Res(All)",
+            icon: "sonicmanipulation_shout.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 14.0,
+                endurance: 13.52,
+                cast: 2.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 3.6603000000000003
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.3
+                        }
+                    ],
+                    scale: 4.9603
+                }
+            }
+        },
+        {
+            name: "Earsplitter",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Holds", "Melee Damage", "Universal Damage Sets"],
+            description: "You generate an earsplitting sound wave right in the face of your foe, inflicting great damage. It has a good chance of causing a migraine, leaving them shaking in pain and helpless.",
+            shortHelp: "Melee, DMG(Energy/Smash), Foe Chance for Hold",
+            icon: "sonicmanipulation_earsplitter.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 1.97,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 3.0695
+                        },
+                        {
+                            type: "Energy",
+                            scale: 3.0695
+                        }
+                    ],
+                    scale: 6.139
+                }
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['dominator/sonic-assault'] = DOMINATOR_SONIC_ASSAULT_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.DOMINATOR_SONIC_ASSAULT_POWERSET = DOMINATOR_SONIC_ASSAULT_POWERSET;
+}
+
+// ---- js/data/powersets/dominator/symphony-control.js ----
+;/**
+ * Symphony Control
+ * Character Level: 50
+ * Archetype: dominator
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const DOMINATOR_SYMPHONY_CONTROL_POWERSET = {
+    name: "Symphony Control",
+    category: "Unknown",
+    description: "Symphony Control powerset",
+    icon: "symphony-control_set.png",
+    powers: [
+        {
+            name: "Hymn of Dissonance",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Holds", "Ranged Damage", "Universal Damage Sets"],
+            description: "Hymn of Dissonance causes pain on its listener, disruptive enough to hold them in place. Stronger foes might persist, but will still attack at a reduced speed.",
+            shortHelp: "Ranged, DMG(Psionic), Foe Hold, -Recharge",
+            icon: "symphonycontrol_holdst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    type: "Psionic",
+                    scale: 2.8890000000000002
+                },
+                buffDuration: 18.0
+            }
+        },
+        {
+            name: "Melodic Binding",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Immobilize", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Melodic Binding immobilizes your target in place and inflict psionic damage. Stronger foes might still be able to move, but will do so at a reduced speed.",
+            shortHelp: "Ranged, DMG(Psionic), Foe Immobilize, -SPD",
+            icon: "symphonycontrol_immobst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 7.8,
+                cast: 1.5,
+                damage: {
+                    type: "Psionic",
+                    scale: 2.6100000000000003
+                },
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Aria of Stasis",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Immobilize", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Aria of Stasis roots your audience in place and causes psionic damage. Stronger foes might still be able to move, but will do so at a reduced speed.",
+            shortHelp: "Ranged (Cone), DMG(Psionic), Foe Immobilize, -SPD",
+            icon: "symphonycontrol_immobaoe.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 1.0472,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 8.0,
+                endurance: 13.0,
+                cast: 1.5,
+                damage: {
+                    type: "Psionic",
+                    scale: 1.003
+                },
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Impassioned Serenade",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Confuse", "Dominator Archetype Sets", "Ranged Damage", "Universal Damage Sets"],
+            description: "You serenade your target with an impassioned song, charming them into fighting for you.<br><br><color #fcfc95>Note: this power inflicts damage over time for up to 30 seconds as long as the target is confused.</color>",
+            shortHelp: "Ranged, DoT(Psionic), Foe Confuse",
+            icon: "symphonycontrol_confusest.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 2.0,
+                damage: {
+                    type: "Psionic",
+                    scale: 0.65
+                },
+                dotDamage: {
+                    type: "Psionic",
+                    scale: 0.04,
+                    ticks: 30
+                },
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Dreadful Discord",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Fear", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Fear", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Dreadful Discord is a terrifying song that will leave your audience shaking in fear.",
+            shortHelp: "Ranged (Cone), DMG(Psionic), Foe Fear",
+            icon: "symphonycontrol_fearaoe.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 0.7854,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 40.0,
+                endurance: 8.528,
+                cast: 2.17,
+                damage: {
+                    type: "Psionic",
+                    scale: 1.2437
+                }
+            }
+        },
+        {
+            name: "Enfeebling Lullaby",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Ranged AoE Damage", "Sleep", "Universal Damage Sets"],
+            description: "A song that will put even elephants to sleep. Enfeebling Lullaby will relax foes, causing them to sleep and their attacks will do reduced damage for some time.<br><br><color #fcfc95>Notes: Although this power is Auto Hit, it requires a To Hit check to apply Deep Sleep. If The Hit check is missed, and the target is not an AV, the weaker form of Sleep will be applied.</color>",
+            shortHelp: "Ranged (Cone), DMG(Psionic), Foe Deep Sleep, -DMG",
+            icon: "symphonycontrol_sleepst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 0.7854,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 45.0,
+                endurance: 15.6,
+                cast: 2.67,
+                damage: {
+                    type: "Psionic",
+                    scale: 0.2
+                },
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Confounding Chant",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Ranged AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "Confounding Chant will disorient anyone that hears it, while dealing psionic damage over time. <br><br><color #fcfc95>Note: this power's damage over time will extend its duration but only inflict its damage if the foe is stunned.</color>",
+            shortHelp: "Ranged (Cone), DoT(Psionic), Foe Disorient",
+            icon: "symphonycontrol_stunaoe.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 0.7854,
+            effects: {
+                accuracy: 0.8,
+                range: 70.0,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 2.33,
+                stun: 3.0
+            }
+        },
+        {
+            name: "Chords of Despair",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Holds"],
+            description: "Your audience falls into deep despair, incapacitating them.<br><br><color #fcfc95>Notes: This power has adaptive recharge. It has a base recharge of <color #FF7F27>8</color> seconds and each affected foe will increase the recharge by <color #FF7F27>14.5</color> seconds for a maximum total of <color #FF7F27>240</color> seconds.</color>",
+            shortHelp: "Ranged (Targeted AoE), Foe Hold",
+            icon: "symphonycontrol_holdaoe.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.8,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 2.67
+            }
+        },
+        {
+            name: "Reverberant",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Sleep", "Recharge", "Fear", "Damage", "Accuracy"],
+            allowedSetCategories: ["Confuse", "Fear", "Holds", "Immobilize", "Pet Damage", "Recharge Intensive Pets", "Sleep", "Stuns", "Universal Damage Sets"],
+            description: "You summon an entity capable of repeating your songs a short while after you have executed them. <br><br><color #fcfc95>Note: This entity will execute weaker versions of your songs. Type ''/release_pets'' in the chat window to release all your pets.",
+            shortHelp: "Summon Reverberant: Ranged Control Special",
+            icon: "symphonycontrol_pet.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 240.0,
+                endurance: 20.8,
+                cast: 2.03
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['dominator/symphony-control'] = DOMINATOR_SYMPHONY_CONTROL_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.DOMINATOR_SYMPHONY_CONTROL_POWERSET = DOMINATOR_SYMPHONY_CONTROL_POWERSET;
+}
+
+// ---- js/data/powersets/dominator/thorny-assault.js ----
+;/**
+ * Thorny Assault
+ * Character Level: 50
+ * Archetype: dominator
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const DOMINATOR_THORNY_ASSAULT_POWERSET = {
+    name: "Thorny Assault",
+    category: "Unknown",
+    description: "Thorny Assault powerset",
+    icon: "thorny-assault_set.png",
+    powers: [
+        {
+            name: "Skewer",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Melee Damage", "Universal Damage Sets"],
+            description: "You lunge forward with this melee attack and Skewer your foe with the large Thorn on your arm. Deals high damage and poisons your foe. Poison from the Thorns deals additional Toxic damage and can reduce your foes Defense.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Melee, Moderate DMG(Lethal), DoT(Toxic) -DEF",
+            icon: "thornyassault_skewer.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 0.83,
+                damage: {
+                    type: "Lethal",
+                    scale: 2.4628
+                },
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.0805,
+                    ticks: 3
+                },
+                buffDuration: 3.1,
+                defenseDebuff: 2.0
+            }
+        },
+        {
+            name: "Thorny Darts",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged Damage", "Universal Damage Sets"],
+            description: "Hurls small Thorny Darts at your foes. Thorny Darts deal moderate damage. Poison from the Darts deals additional Toxic damage and can reduce your foes Defense.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, Light DMG(Lethal), DoT(Toxic) -DEF",
+            icon: "thornyassault_darts.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.33,
+                damage: {
+                    type: "Lethal",
+                    scale: 2.7733
+                },
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.0595,
+                    ticks: 3
+                },
+                buffDuration: 3.1,
+                defenseDebuff: 2.0
+            }
+        },
+        {
+            name: "Fling Thorns",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You can throw dozens of Thorns in a wide cone in front of you, impaling foes caught within the area. These Thorns deals moderate damage, and poisons any targets it hits. Thorn poison deals additional Toxic damage and can reduce your foes' Defense.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged (Cone), Light DMG(Lethal), DoT(Toxic) -DEF",
+            icon: "thornyassault_flingthorns.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.0,
+                range: 30.0,
+                recharge: 10.0,
+                endurance: 11.1754,
+                cast: 1.63,
+                damage: {
+                    type: "Lethal",
+                    scale: 2.7158
+                },
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.086,
+                    ticks: 4
+                },
+                buffDuration: 4.1,
+                defenseDebuff: 2.0
+            }
+        },
+        {
+            name: "Impale",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Dominator Archetype Sets", "Immobilize", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You can throw a small cluster of large Thorns at a targeted foe. These Thorns carry a large amount of the toxin. In addition to dealing Toxic damage, a successful attack can slow a target, preventing Running, Jumping or Flying. Most foes will likely be completely Immobilized, unable to run.<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged, High DMG(Lethal), DoT(Toxic), Immobilize, -DEF, -SPD, -Fly, -Jump",
+            icon: "thornyassault_impale.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.433,
+                damage: {
+                    type: "Lethal",
+                    scale: 3.4348
+                },
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.1195,
+                    ticks: 6
+                },
+                buffDuration: 15.0,
+                defenseDebuff: 3.0
+            }
+        },
+        {
+            name: "Build Up",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly boosts your attacks for a few seconds. Slightly increases chance to hit.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "thornyassault_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Thorn Burst",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You can explode dozens of Thorns in all directions around you. These Thorns only travel a short distance, but they can deal moderate damage and poison any target close to you. Toxic damage from the thorns can reduce the Defense of affected foes.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE Melee, Light DMG(Lethal), DoT(Toxic) -DEF",
+            icon: "thornyassault_thornburst.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 17.0,
+                endurance: 16.016,
+                cast: 3.0,
+                damage: {
+                    type: "Lethal",
+                    scale: 2.7671
+                },
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.1,
+                    ticks: 3
+                },
+                buffDuration: 3.1,
+                defenseDebuff: 3.0
+            }
+        },
+        {
+            name: "Thorntrops",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage"],
+            allowedSetCategories: ["Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You fling dozens of Thorns into the ground at a targeted location. The small Thorns pepper the ground over a large area. Any enemy that pass over the Thorntrops will be forced to move at a slower rate. They will also take some trivial Lethal damage over time.<br><br><color #fcfc95>Damage: Minor(DoT).</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Location AoE), Minor DoT(Lethal), Foe -Speed",
+            icon: "thornyassault_thorntrops.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 25.0,
+                recharge: 45.0,
+                endurance: 7.8,
+                cast: 1.63,
+                buffDuration: 45.0
+            }
+        },
+        {
+            name: "Ripper",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Knockback", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You can unleash a spectacular slashing maneuver that attacks all foes in a wide arc directly in front of you. Ripper deals massive damage and poisons multiple targets. It can even knock foes down. Thorn poison deals additional Toxic damage and can reduce your foes Defense.<br><br><color #fcfc95>Damage: Superior.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee (Cone), Superior DMG(Lethal), DoT(Toxic) -DEF, Knockback, -SPD",
+            icon: "thornyassault_ripper.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 1.0472,
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 2.33,
+                damage: {
+                    type: "Lethal",
+                    scale: 4.4925
+                },
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.2,
+                    ticks: 4
+                },
+                buffDuration: 4.1,
+                defenseDebuff: 3.0
+            }
+        },
+        {
+            name: "Thorn Barrage",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "A devastating attack, Thorn Barrage unleashes your Thorns at high velocity causing severe damage at range. The impact of this attack can knock most foes on their back. Thorn poison deals additional Toxic damage and can reduce your foes Defense.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Extreme DMG(Lethal), DoT(Toxic) -DEF",
+            icon: "thornyassault_thornbarrage.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 18.0,
+                endurance: 15.5765,
+                cast: 2.0,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 1.4401000000000002,
+                            ticks: 3
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 0.1529,
+                            ticks: 3
+                        }
+                    ]
+                },
+                buffDuration: 1.75,
+                defenseDebuff: 3.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['dominator/thorny-assault'] = DOMINATOR_THORNY_ASSAULT_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.DOMINATOR_THORNY_ASSAULT_POWERSET = DOMINATOR_THORNY_ASSAULT_POWERSET;
+}
+
+// ---- js/data/powersets/dominator/wind-control.js ----
+;/**
+ * Wind Control
+ * Character Level: 50
+ * Archetype: dominator
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const DOMINATOR_WIND_CONTROL_POWERSET = {
+    name: "Wind Control",
+    category: "Unknown",
+    description: "Wind Control powerset",
+    icon: "wind-control_set.png",
+    powers: [
+        {
+            name: "Clear Skies",
+            available: 0,
+            tier: 1,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "When training yourself in the creation of a Vortex, you also learn how to create the Clear Skies effect. If you use Vacuum on your own Vortex, you will gain a boost to your chance to hit foes, your attack speed and your recovery. Additionally, the endurance cost of all your powers will be reduced. While the strength of the Clear Skies effect cannot be stacked and cannot be increased, the duration of the effect can be extended from the minimum duration of 30 seconds. The more Pressure you consume when you execute Vacuum, the greater the duration of the Clear Skies bonuses, up to a maximum of 60 seconds. When the bonuses of Clear Skies end, you will be under the Clouded Skies effect, which prevents another Clear Skies buff from applying, for several minutes. Clear Skies is granted automatically when both Vacuum and Vortex have been trained.",
+            shortHelp: "Self (Auto), +ToHit, +Rech, +Rec, -EndCost",
+            icon: "windcontrol_clearskies.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                tohitBuff: 2.5,
+                buffDuration: 2.1
+            }
+        },
+        {
+            name: "Downdraft",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Holds", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You gather air above your target before forcefully pressurizing it into a downward flowing vortex. The force of the downdraft prevents your target from moving, effectively holding them in place and preventing flight. The force of the downdraft leaves the target winded, reducing their movement and attack speeds for a short time while they recover. This power builds Pressure.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged, Hold(Foe), -Movement(Foe), -Rech(Foe), -Fly(Foe), Pressure Builder (Self)",
+            icon: "windcontrol_downdraft.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 10.66,
+                cast: 1.87,
+                damage: {
+                    type: "Smashing",
+                    scale: 3.0291
+                },
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Updraft",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "You gather air at the feet of your target before forcefully pressurizing it into an upward flowing vortex. The force of the updraft pulls your target into the sky. When the updraft dissipates, your target falls to the ground and suffers moderate smashing damage. The affected target is also unable to fly for a short time. This power builds Pressure.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, Light DMG(Smashing), Knockup(Foe), -Fly(Foe), Pressure Builder (Self)",
+            icon: "windcontrol_updraft.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 6.5,
+                cast: 1.03,
+                damage: {
+                    type: "Smashing",
+                    scale: 2.5342000000000002
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Breathless",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Immobilize", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You release all available Pressure to create a localized high pressure sphere at a location of your choosing. This high pressure crushes foes continually while they remain within the sphere, causing lethal damage over time. Affected foes will be immobilized and suffer from a reduced attack speed. In normal combat, affected foes will also suffer reduced damage potential, while in PvP, affected foes will suffer from increased endurance cost of their powers. The damage done increases in proportion to the amount of Pressure released when using this power. Also, Breathless can reduce the damage potential of all targets, in PvE or PvP, if used at the lowest levels of Pressure accumulation.<br><br><color #fcfc95>Damage: Variable.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged (Targeted AoE), Variable DMG(Lethal), Immobilize (Foe), -DMG(Foe, All), +EndCost(Foe, PvP), Consumes Pressure",
+            icon: "windcontrol_breathless.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.9,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 19.5,
+                cast: 2.07,
+                damage: {
+                    type: "Lethal",
+                    scale: 0.6943999999999999
+                },
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Wind Shear",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Dominator Archetype Sets", "Slow Movement", "To Hit Debuff"],
+            description: "You create a sphere of high speed winds around yourself. This significantly slows the movement of any enemies caught within the sphere and makes their attacks less likely to hit. Damage potential is also reduced. Flying foes are brought to the ground. This power neither builds nor releases Pressure, but does have a continuous Endurance cost.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE (Toggle), -Speed (Foe, All), -Fly(Foe), -ToHit(Foe), -DMG(Foe, All)",
+            icon: "windcontrol_windshear.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 15.0,
+                endurance: 2.6,
+                cast: 2.03,
+                tohitDebuff: 0.75,
+                buffDuration: 2.1
+            }
+        },
+        {
+            name: "Thundergust",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Knockback", "Ranged AoE Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You unleash a powerful gust of wind in the direction of your foes. This gust has enough force to deal minor smashing damage to your foes and knock them to the ground. The debris blown at your opponent temporarily blinds them, reducing their chance to hit. This power builds Pressure.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Cone), Minor DMG(Smashing), Knockdown(Foe), -ToHit(Foe), Pressure Builder (Self)",
+            icon: "windcontrol_thundergust.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 0.6981,
+            effects: {
+                accuracy: 1.0,
+                recharge: 30.0,
+                endurance: 13.0,
+                cast: 2.17,
+                damage: {
+                    type: "Smashing",
+                    scale: 0.8229
+                },
+                tohitDebuff: 1.5,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Microburst",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Dominator Archetype Sets", "Ranged AoE Damage", "Slow Movement", "Stuns", "Universal Damage Sets"],
+            description: "You release all available Pressure to create an extremely powerful blast of air that descends from the skies and spreads out over a large radius. Any foes caught within the burst are immediately stunned by the force of the wind and suffer smashing damage.Flying foes are knocked out of the sky, while all foes suffer reduced movement speed that lingers for some time. The damage done increases in proportion to the amount of Pressure released when using this power. Also, Microburst can reduce your target's defenses at the when the highest levels of Pressure are released.<br><br><color #fcfc95>Damage: Variable.</color><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged (Targeted AoE), Variable DMG(Smashing), Stun(Foe), -Speed(Foe, All), -Fly(Foe), -Rech(Foe), Chance for -DEF(Foe, All), Consumes Pressure",
+            icon: "windcontrol_microburst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 90.0,
+                endurance: 19.5,
+                cast: 2.37,
+                damage: {
+                    type: "Smashing",
+                    scale: 0.3429
+                },
+                stun: 1.0,
+                buffDuration: 12.0,
+                defenseDebuff: 2.5
+            }
+        },
+        {
+            name: "Keening Winds",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Confuse", "Dominator Archetype Sets", "Endurance Modification"],
+            description: "You create a sphere of variable speed winds that generate strong friction within the turbulence of the air. This creates odd echoes and sounds that confuse foes caught within the burst. The loss of confidence your foes suffer due their confusion causes them to lose endurance over a few seconds, while you gain endurance due to a boost in confidence you enjoy from seeing your foes struggle. This power builds Pressure.<br><br><color #fcfc95>Damage: None.</color><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged (Targeted AoE), Confuse(Foe), EndDrain(Foe), +End(Self)",
+            icon: "windcontrol_keeningwinds.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 0.8,
+                range: 80.0,
+                recharge: 120.0,
+                endurance: 13.0,
+                cast: 1.67,
+                buffDuration: 2.1
+            }
+        },
+        {
+            name: "Vacuum",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Dominator Archetype Sets", "Holds", "Ranged AoE Damage", "Slow Movement", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You release all Pressure to create a vacuum space around a target. With a foe target, the foe is held. Nearby foes may also be held. Foes in the field suffer lethal damage and persistent movement, attack speed, and chance to hit debuffs that grow stronger the longer they are in the field. If centered on an ally, the main target is not held, but foes are affected as normal. For each Pressure released, the Vacuum field persists for 2 seconds more. At your highest Pressure level, the main target will take extra damage and the field will persist long enough to reapply its hold. If Vacuum is targeted on your Vortex, you will gain the Clear Skies boon, but at the expense of using the power to harm foes. The boon lasts 5 seconds more for each Pressure released. Both Vacuum and Vortex are required to unlock Clear Skies.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged (Targeted AoE), Hold (Foe), Moderate DoT (Lethal), -Movement(Foe), -Rech(Foe), -ToHit(Foe), Special(Pet), Pressure Consumer (Self)",
+            icon: "windcontrol_vacuum.png",
+            powerType: "Click",
+            targetType: "Any (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 240.0,
+                endurance: 19.5,
+                cast: 2.03,
+                damage: {
+                    type: "Lethal",
+                    scale: 0.3429
+                },
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Vortex",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Pet Damage", "Recharge Intensive Pets", "Slow Movement", "Stuns", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You can create a true Vortex cloud to assist you in battle. This Vortex will build Pressure along with you as you use your powers. This will allow its attacks to have a chance, proportional to current pressure, for critical damage. However, at higher pressures, the Vortex will be unable to use some of its powers. The Manipulation of Pressure on this pet through the use of Vacuum upon it will grant you the Clear Skies buff. Both this power and Vacuum are required to automatically unlock Clear Skies.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Summon Vortex",
+            icon: "windcontrol_vortex.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 240.0,
+                endurance: 26.0,
+                cast: 1.87
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['dominator/wind-control'] = DOMINATOR_WIND_CONTROL_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.DOMINATOR_WIND_CONTROL_POWERSET = DOMINATOR_WIND_CONTROL_POWERSET;
+}
+
+// ---- js/data/epics/dominator/dominator_dark_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Dark Mastery
+ * Archetype: Dominator
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\dominator_dark_mastery
+ */
+
+const EPIC_DOMINATOR_DARK_MASTERY = {
+  "id": "dominator_dark_mastery",
+  "name": "Dark Mastery",
+  "displayName": "Dark Mastery",
+  "archetype": "dominator",
+  "description": "You have Mastery over Darkness to control and blast your foes.",
+  "icon": "sentinel_dark_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Murky Cloud",
+      "fullName": "Epic.Dominator_Dark_Mastery.Murky_Cloud",
+      "rank": 1,
+      "available": 34,
+      "description": "You create a Murky Cloud enshrouding you. This cloud can absorb all forms of energy, making you more resistant to Fire, Cold, Energy, and Negative Energy attacks.",
+      "shortHelp": "Toggle: Self +Res(Fire, Cold, Energy, Negative)",
+      "icon": "dark_mastery_murkycloud.png",
+      "powerType": "Toggle",
+      "requires": "$archetype == @Class_Dominator",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 1.17,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "fire": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "smashing": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "psionic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Tar Patch",
+      "fullName": "Epic.Dominator_Dark_Mastery.Tar_Patch",
+      "rank": 2,
+      "available": 34,
+      "description": "Drops a large patch of viscous Negative Energy which dramatically slows down enemies that run through it and reduces their damage resistance. Affected targets stuck in the Tar Patch cannot jump or fly.",
+      "shortHelp": "Ranged (Location AoE), Target -Speed, -Res, -Fly",
+      "icon": "dark_mastery_tarpatch.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Dominator",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Slow Movement"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 180.0,
+        "endurance": 9.75,
+        "activationTime": 3.1,
+        "effectArea": "Location"
+      }
+    },
+    {
+      "name": "Darkest Night",
+      "fullName": "Epic.Dominator_Dark_Mastery.Darkest_Night",
+      "rank": 3,
+      "available": 37,
+      "description": "While active, you channel Negative Energy onto a targeted foe. Darkest Night decreases the damage potential and chance to hit of the target, and all foes nearby, as long as you keep the power active. You must be level 38 and have one other Dark Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Ranged (Targeted AoE), Foe -DMG -To Hit",
+      "icon": "dark_mastery_darkestnight.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "To Hit Debuff"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 70.0,
+        "recharge": 20.0,
+        "endurance": 0.325,
+        "activationTime": 3.17,
+        "effectArea": "AoE",
+        "radius": 15.0
+      }
+    },
+    {
+      "name": "Umbral Torrent",
+      "fullName": "Epic.Dominator_Dark_Mastery.Torrent",
+      "rank": 4,
+      "available": 40,
+      "description": "You summon a wave of mire that sweeps away foes within its arc. The attack deals minimal Negative Energy damage, but sends foes flying and reduces their chance to hit. You must be level 41 and have one other Dark Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Cone), DMG(Smashing), Foe -To Hit, Knockback",
+      "icon": "dark_mastery_umbraltorrent.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate To-Hit Debuff",
+        "Knockback",
+        "Ranged AoE Damage",
+        "To Hit Debuff",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 30.0,
+        "endurance": 17.94,
+        "activationTime": 1.03,
+        "effectArea": "Cone",
+        "radius": 60.0,
+        "arc": 0.5236,
+        "damage": {
+          "type": "Negative",
+          "scale": 0.8471,
+          "table": "Melee_PvPDamage"
+        },
+        "protection": {
+          "knockback": 1.0
+        }
+      }
+    },
+    {
+      "name": "Soul Consumption",
+      "fullName": "Epic.Dominator_Dark_Mastery.Soul_Consumption",
+      "rank": 5,
+      "available": 43,
+      "description": "You consume life and soul from all enemies nearby, thus siginficantly increasing your maximum hitpoints and endurance. The more foes affected, the stronger the effect. You must be level 44 and have two other Dark Mastery Powers before selecting this power.",
+      "shortHelp": "PBAoE Self +Max HP, +Max End, Foe: -Max HP, -Max End",
+      "icon": "dark_mastery_soulconsumption.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Recharge",
+        "Heal",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate Healing",
+        "Endurance Modification",
+        "Healing"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 15.0,
+        "recharge": 600.0,
+        "endurance": 0.65,
+        "activationTime": 1.17,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "regeneration": {
+          "scale": -0.6,
+          "table": "Melee_Ones"
+        },
+        "damage": {
+          "type": "Heal",
+          "scale": 0.4,
+          "table": "Melee_HealSelf"
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['dominator_dark_mastery'] = EPIC_DOMINATOR_DARK_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/dominator/dominator_leviathan_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Leviathan Mastery
+ * Archetype: Dominator
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\dominator_leviathan_mastery
+ */
+
+const EPIC_DOMINATOR_LEVIATHAN_MASTERY = {
+  "id": "dominator_leviathan_mastery",
+  "name": "Leviathan Mastery",
+  "displayName": "Leviathan Mastery",
+  "archetype": "dominator",
+  "description": "Captain Mako has granted you access to the power of the Leviathan. The Leviathan is an ancient gargantuan entity who slumbers under Sharkhead Isle. Worshiped by the Coralax, the Leviathan has given Captain Mako many abilities and now he has taught you how to harness its power.",
+  "icon": "dominator_leviathan_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Water Spout",
+      "fullName": "Epic.Dominator_Leviathan_Mastery.Water_Spout",
+      "rank": 1,
+      "available": 34,
+      "description": "Conjures up a Water Spout at a targeted location. The Water Spout will chase down your foes, tossing them into the air and hurling them great distances. The victims are left Disoriented and with reduced Defense. The Water Spout is a menacing sight, and can even cause panic among your foes.",
+      "shortHelp": "Summon Water Spout: PBAoE DMG(Smash), Foe Knockback, Fear, Disorient, +Wet",
+      "icon": "arachnos_patron_dropknockback.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Controller) || ($archetype == @Class_Dominator))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage"
+      ],
+      "allowedSetCategories": [
+        "Defense Debuff",
+        "Knockback",
+        "Ranged AoE Damage",
+        "Stuns",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.3,
+        "range": 60.0,
+        "recharge": 180.0,
+        "endurance": 26.0,
+        "activationTime": 1.17,
+        "effectArea": "Location"
+      }
+    },
+    {
+      "name": "Bile Spray",
+      "fullName": "Epic.Dominator_Leviathan_Mastery.Chum_Spray",
+      "rank": 2,
+      "available": 34,
+      "description": "Sharks will eat anything, so their stomach acid must be powerful indeed. You can regurgitate this acid and spew a corrosive spray of bile at a foe. Affected foes in the cone area will take toxic damage over time.",
+      "shortHelp": "Ranged (Cone), DoT(Toxic)",
+      "icon": "arachnos_patron_rangedconemoderatedmg.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Controller) || ($archetype == @Class_Dominator))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 32.0,
+        "endurance": 18.98,
+        "activationTime": 1.6,
+        "effectArea": "Cone",
+        "radius": 60.0,
+        "arc": 0.5236,
+        "damage": {
+          "type": "Toxic",
+          "scale": 1.0219,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Hibernate",
+      "fullName": "Epic.Dominator_Leviathan_Mastery.Hibernate",
+      "rank": 3,
+      "available": 37,
+      "description": "When you activate this power, you encase yourself in a block of solid ice, making yourself invulnerable, though you are frozen solid and cannot act. While Hibernating within this block of ice, you heal damage and recover endurance at an incredible rate. You can emerge at will by deactivating the power, but you cannot Hibernate for more than 30 seconds. If you activate this power while in the air, you will fall. You must be level 38 and have one other Leviathan Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Self +Regeneration, +Recovery, Invulnerable; Self Hold",
+      "icon": "arachnos_patron_selfbuffresistancephysical.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Recharge",
+        "Heal"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Healing"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 240.0,
+        "endurance": 0.1625,
+        "activationTime": 0.07,
+        "effectArea": "SingleTarget",
+        "regeneration": {
+          "scale": 10.0,
+          "table": "Melee_Ones"
+        },
+        "recovery": {
+          "scale": 4.0,
+          "table": "Melee_Ones"
+        },
+        "resistance": {},
+        "protection": {
+          "knockup": 1.0,
+          "knockback": 1.0,
+          "immobilize": 1000.0
+        }
+      }
+    },
+    {
+      "name": "Shark Skin",
+      "fullName": "Epic.Dominator_Leviathan_Mastery.Shark_Skin",
+      "rank": 4,
+      "available": 40,
+      "description": "The power of the Leviathan Mako has shown you seems to have no end. Shark Skin improves your damage resistance to Lethal, Smashing and cold damage. You must be level 41 and have one other Leviathan Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Self +Res(Smash, Lethal, Cold)",
+      "icon": "arachnos_patron_resistbuff.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 0.67,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "smashing": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "psionic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Summon Coralax",
+      "fullName": "Epic.Dominator_Leviathan_Mastery.Summon_Coralax",
+      "rank": 5,
+      "available": 43,
+      "description": "Captain Mako has shown you how to summon a Coralax Blue Hybrid to do your bidding. The Coralax are humans who have been infected with living coral. Your access to this Hybrid is very limited. You can only summon it once every 15 minutes and it will leave after 4 minutes, or if you exit a zone or mission. You must be level 44 and have two other Leviathan Mastery Powers before selecting this power.",
+      "shortHelp": "Summon Hybrid: Ranged DMG(Lethal)",
+      "icon": "arachnos_patron_summononepet.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Pet Damage",
+        "Recharge Intensive Pets",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 900.0,
+        "endurance": 26.0,
+        "activationTime": 3.2,
+        "effectArea": "Location"
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['dominator_leviathan_mastery'] = EPIC_DOMINATOR_LEVIATHAN_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/dominator/dominator_mace_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Mace Mastery
+ * Archetype: Dominator
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\dominator_mace_mastery
+ */
+
+const EPIC_DOMINATOR_MACE_MASTERY = {
+  "id": "dominator_mace_mastery",
+  "name": "Mace Mastery",
+  "displayName": "Mace Mastery",
+  "archetype": "dominator",
+  "description": "Black Scorpion has granted you access to the advanced technology of the Nullifier Mace. The signature weapon of the Bane Spider Commandos, it is not a typical clumsy mace. The Bane Mace is capable of firing a variety of energy projectiles and grenades. It can even be modified to summon and command some or Black Scorpion's RV technologies.",
+  "icon": "dominator_mace_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Poisonous Ray",
+      "fullName": "Epic.Dominator_Mace_Mastery.Poisonous_Ray",
+      "rank": 1,
+      "available": 34,
+      "description": "The Bane Mace can fire a nasty Poison Ray. This toxin is suspended in a polarized plasma field and delivered like an energy blast. Upon impact, the toxin directly attacks the immune system, reducing the affected targets Defense and Damage Resistance as it deals toxic damage.",
+      "shortHelp": "Ranged DoT(Poison), Foe -RES, -DEF",
+      "icon": "arachnos_patron_targeteddebuffdefense.png",
+      "powerType": "Click",
+      "requires": "($archetype == @Class_Dominator) && (Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate Defense Debuff",
+        "Defense Debuff",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 80.0,
+        "recharge": 24.0,
+        "endurance": 13.0,
+        "activationTime": 2.0,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Toxic",
+          "scale": 0.1255,
+          "table": "Ranged_PvPDamage"
+        },
+        "defense": {
+          "all": {
+            "scale": 2.0,
+            "table": "Ranged_Debuff_Def"
+          }
+        },
+        "resistance": {
+          "smashing": {
+            "scale": -2.5,
+            "table": "Ranged_Res_Dmg"
+          },
+          "lethal": {
+            "scale": -2.5,
+            "table": "Ranged_Res_Dmg"
+          },
+          "fire": {
+            "scale": -2.5,
+            "table": "Ranged_Res_Dmg"
+          },
+          "cold": {
+            "scale": -2.5,
+            "table": "Ranged_Res_Dmg"
+          },
+          "energy": {
+            "scale": -2.5,
+            "table": "Ranged_Res_Dmg"
+          },
+          "negative": {
+            "scale": -2.5,
+            "table": "Ranged_Res_Dmg"
+          },
+          "psionic": {
+            "scale": -2.5,
+            "table": "Ranged_Res_Dmg"
+          },
+          "toxic": {
+            "scale": -2.5,
+            "table": "Ranged_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Scorpion Shield",
+      "fullName": "Epic.Dominator_Mace_Mastery.Scorpion_Shield",
+      "rank": 2,
+      "available": 34,
+      "description": "Black Scorpion's technologies are impressive indeed. This energy shield grants you Defense to Lethal, Smashing and Energy attacks, as well as improves your damage resistance to Toxic damage.<br><br><color #fcfc95>Recharge: Fast.</color>",
+      "shortHelp": "Toggle: Self, +Def(Smash,Lethal,Energy), +Res(Toxic)",
+      "icon": "arachnos_patron_defensebuff.png",
+      "powerType": "Toggle",
+      "requires": "($archetype == @Class_Dominator) && (Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Defense Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 2.0,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Disruptor Blast",
+      "fullName": "Epic.Dominator_Mace_Mastery.Disruptor_Blast",
+      "rank": 3,
+      "available": 37,
+      "description": "Fires a tremendous charge of kinetic energy from your Bane Mace. This charge is so powerful it will explode on impact, blasting all nearby foes. Some affected foes may be knocked back by the force of the blast. You must be level 38 and have one other Mace Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Targeted AoE), DMG(Smashing/Energy), Foe Knockback",
+      "icon": "arachnos_patron_rangedaoemoderatedmg.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 80.0,
+        "recharge": 32.0,
+        "endurance": 18.98,
+        "activationTime": 2.0,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "damage": {
+          "type": "Energy",
+          "scale": 0.9477,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Personal Force Field",
+      "fullName": "Epic.Dominator_Mace_Mastery.Personal_Force_Field",
+      "rank": 4,
+      "available": 40,
+      "description": "The Personal Force Field is almost impenetrable to all attacks, even Psionics and Enemy Teleportation, although attacks from more powerful foes may get through more easily. Personal Force Field will also reduce the damage of almost any attacks that do get through. The Personal Force Field works both ways; while it is active, you can only use powers that affect yourself. Cannot be used with Rest. You must be level 41 and have one other Mace Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Self +Def, Res(All)",
+      "icon": "arachnos_patron_megabuff.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Defense Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 30.0,
+        "endurance": 0.1625,
+        "activationTime": 2.03,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "smashing": {
+            "scale": 4.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 4.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 4.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 4.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 4.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 4.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "psionic": {
+            "scale": 4.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 4.0,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Summon Tarantula",
+      "fullName": "Epic.Dominator_Mace_Mastery.Summon_Tarantula",
+      "rank": 5,
+      "available": 43,
+      "description": "Black Scorpion has granted you an Toxic Tarantula for you to command. Weaver One developed the Tarantula Exoskeleton Armor, which so radically transforms an Arachnos troop that hardly anything human is recognizable. Your access to this Tarantula is very limited. You must be level 44 and have two other Mace Mastery Powers before selecting this power.",
+      "shortHelp": "Summon Tarantula: Ranged DMG(Toxic)",
+      "icon": "arachnos_patron_summononepet.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate Defense Debuff",
+        "Defense Debuff",
+        "Immobilize",
+        "Pet Damage",
+        "Recharge Intensive Pets",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 900.0,
+        "endurance": 26.0,
+        "activationTime": 3.03,
+        "effectArea": "Location"
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['dominator_mace_mastery'] = EPIC_DOMINATOR_MACE_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/dominator/dominator_mu_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Mu Mastery
+ * Archetype: Dominator
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\dominator_mu_mastery
+ */
+
+const EPIC_DOMINATOR_MU_MASTERY = {
+  "id": "dominator_mu_mastery",
+  "name": "Mu Mastery",
+  "displayName": "Mu Mastery",
+  "archetype": "dominator",
+  "description": "Scirocco has taught you the ancient powers of the Mu. In their eternal struggle against the Oranbega, the Mu have unlocked many mystical powers, including their very signature crimson lightning. Now you possess their secrets.",
+  "icon": "dominator_mu_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Power Sink",
+      "fullName": "Epic.Dominator_Mu_Mastery.Power_Sink",
+      "rank": 1,
+      "available": 34,
+      "description": "Power Sink leeches energy directly from the bodies of all nearby foes, draining their Endurance. Each foe you draw energy from increases your Endurance. If there are no foes within range, you will not gain any Endurance.",
+      "shortHelp": "PBAoE, Self +End, Foe -End",
+      "icon": "arachnos_patron_pbaoedrain.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Controller) || ($archetype == @Class_Dominator))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 120.0,
+        "endurance": 16.25,
+        "activationTime": 2.03,
+        "effectArea": "AoE",
+        "radius": 10.0,
+        "recovery": {
+          "scale": -1.0,
+          "table": "Melee_Ones"
+        }
+      }
+    },
+    {
+      "name": "Charged Armor",
+      "fullName": "Epic.Dominator_Mu_Mastery.Charged_Armor",
+      "rank": 2,
+      "available": 34,
+      "description": "When you toggle on this power, you are surrounded in a charged field that makes you highly resistant to Smashing, Lethal and Energy damage.",
+      "shortHelp": "Toggle: Self +Res(Smash, Lethal, Energy)",
+      "icon": "arachnos_patron_resistbuff.png",
+      "powerType": "Toggle",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Controller) || ($archetype == @Class_Dominator))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 0.67,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "smashing": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "psionic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Ball Lightning",
+      "fullName": "Epic.Dominator_Mu_Mastery.Ball_Lightning",
+      "rank": 3,
+      "available": 37,
+      "description": "Hurls a highly charged ball of Mu lightning that explodes on contact. Ball Lightning deals good damage in an area of effect, and drains some Endurance from each target it hits. You must be level 38 and have one other Mu Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Targeted AoE), DoT(Energy), Foe -End",
+      "icon": "arachnos_patron_rangedaoemoderatedmg.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 32.0,
+        "endurance": 18.98,
+        "activationTime": 1.07,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "damage": {
+          "type": "Energy",
+          "scale": 0.7474,
+          "table": "Ranged_PvPDamage"
+        },
+        "recovery": {
+          "scale": -1.0,
+          "table": "Ranged_Ones"
+        }
+      }
+    },
+    {
+      "name": "Surge of Power",
+      "fullName": "Epic.Dominator_Mu_Mastery.Surge_of_Power",
+      "rank": 4,
+      "available": 40,
+      "description": "When you activate this power, you transform your body into living Electricity and become extremely resistant to all damage but Psionics, and your endurance recovery is also increased. Expending all this energy will leave you exhausted, drained of all your endurance and unable to recover endurance for a short time. You must be level 41 and have one other Mu Mastery Powers before selecting this power.",
+      "shortHelp": "Self, +Res(Special)",
+      "icon": "arachnos_patron_selfbuffresistancephysical.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 1000.0,
+        "endurance": 3.25,
+        "activationTime": 1.96,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "smashing": {
+            "scale": 5.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 5.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 5.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 5.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 5.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 6.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 4.0,
+            "table": "Melee_Res_Dmg"
+          }
+        },
+        "recovery": {
+          "scale": -100.0,
+          "table": "Melee_Ones"
+        }
+      }
+    },
+    {
+      "name": "Summon Guardian",
+      "fullName": "Epic.Dominator_Mu_Mastery.Summon_Guardian",
+      "rank": 5,
+      "available": 43,
+      "description": "Scirocco has shown you how to call upon a mystical Mu Guardian to assist you. The Mu pulse with the blood of their slaughtered ancestors in their veins, and are well practiced in the dark arts. Your access to this Guardian is very limited. You must be level 44 and have two other Mu Mastery Powers before selecting this power.",
+      "shortHelp": "Summon Mu Guardian: Ranged DMG(Energy)",
+      "icon": "arachnos_patron_summononepet.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "Hold",
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Healing",
+        "Holds",
+        "Pet Damage",
+        "Recharge Intensive Pets",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 900.0,
+        "endurance": 26.0,
+        "activationTime": 1.17,
+        "effectArea": "Location"
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['dominator_mu_mastery'] = EPIC_DOMINATOR_MU_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/dominator/dominator_soul_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Soul Mastery
+ * Archetype: Dominator
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\dominator_soul_mastery
+ */
+
+const EPIC_DOMINATOR_SOUL_MASTERY = {
+  "id": "dominator_soul_mastery",
+  "name": "Soul Mastery",
+  "displayName": "Soul Mastery",
+  "archetype": "dominator",
+  "description": "Ghost Widow has granted you access to the power of darkness and souls. She has shown you how to use the souls of your victims to destroy your enemies. This has granted you access to powers and abilities you have never had before.",
+  "icon": "dominator_soul_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Dark Consumption",
+      "fullName": "Epic.Dominator_Soul_Mastery.Dark_Consumption",
+      "rank": 1,
+      "available": 34,
+      "description": "The dark power of the Netherworld allows you to tap the essence of your foe's soul and transfer it to yourself. This will drain the Hit Points of your enemy and add to your Endurance.",
+      "shortHelp": "PBAoE DMG(Negative), Self +End",
+      "icon": "arachnos_patron_pbaoedrain.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Controller) || ($archetype == @Class_Dominator))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Melee AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 360.0,
+        "endurance": 0.65,
+        "activationTime": 1.03,
+        "effectArea": "AoE",
+        "radius": 8.0,
+        "damage": {
+          "type": "Negative",
+          "scale": 0.9553,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Dark Embrace",
+      "fullName": "Epic.Dominator_Soul_Mastery.Dark_Embrace",
+      "rank": 2,
+      "available": 34,
+      "description": "You tap into the energy of the Netherworld to protect yourself from damage. This Dark Embrace shrouds you and grants resistance to Lethal, Smashing, Negative Energy and Toxic damage.",
+      "shortHelp": "Toggle: Self +Res(Smash, Lethal, Negative, Toxic)",
+      "icon": "arachnos_patron_resistbuff.png",
+      "powerType": "Toggle",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Controller) || ($archetype == @Class_Dominator))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 0.67,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "smashing": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "psionic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Dark Obliteration",
+      "fullName": "Epic.Dominator_Soul_Mastery.Dark_Obliteration",
+      "rank": 3,
+      "available": 37,
+      "description": "You hurl a large blast of negative energy that violently explodes on impact, exposing the dark power of the Netherworld to all foes near the target. Dark Obliteration can reduce the Accuracy of all affected targets. You must be level 38 and have one other Soul Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Targeted AoE), DMG(Negative), Foe -ACC",
+      "icon": "arachnos_patron_rangedaoemoderatedmg.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate To-Hit Debuff",
+        "Ranged AoE Damage",
+        "To Hit Debuff",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 32.0,
+        "endurance": 18.98,
+        "activationTime": 1.0,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "damage": {
+          "type": "Negative",
+          "scale": 0.5299,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Soul Drain",
+      "fullName": "Epic.Dominator_Soul_Mastery.Soul_Drain",
+      "rank": 4,
+      "available": 40,
+      "description": "Using this power, you can drain the essence of all nearby foes' souls, thus increasing your own strength. Each affected foe will lose some Hit Points and add to your Damage and Accuracy. You must be level 41 and have one other Soul Mastery Powers before selecting this power.",
+      "shortHelp": "PBAoE DMG(Negative), Self +DMG, +ACC",
+      "icon": "arachnos_patron_pbaoebuffdamage.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Melee AoE Damage",
+        "To Hit Buff",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.2,
+        "recharge": 240.0,
+        "endurance": 19.5,
+        "activationTime": 2.37,
+        "effectArea": "AoE",
+        "radius": 10.0,
+        "damage": {
+          "type": "Negative",
+          "scale": 0.5192,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Summon Seer",
+      "fullName": "Epic.Dominator_Soul_Mastery.Summon_Seer",
+      "rank": 5,
+      "available": 43,
+      "description": "Ghost Widow has assigned a Fortunata Seer for you to command. Fortunata Seers can glimpse moments into the future. They use this ability to increase the Perception of their teammate. Your access to this Fortunata Seer is very limited. You can only summon her once every 15 minutes and she will leave after 4 minutes, or if you exit a zone or mission. You must be level 44 and have two other Soul Mastery Powers before selecting this power.",
+      "shortHelp": "Summon Fortunata Seer: Ranged DMG(Psionic)",
+      "icon": "arachnos_patron_summononepet.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Immobilize",
+        "Pet Damage",
+        "Recharge Intensive Pets",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 900.0,
+        "endurance": 26.0,
+        "activationTime": 3.2,
+        "effectArea": "Location"
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['dominator_soul_mastery'] = EPIC_DOMINATOR_SOUL_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/dominator/fire_mastery_dominator.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Fire Mastery
+ * Archetype: Dominator
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\fire_mastery_dominator
+ */
+
+const EPIC_FIRE_MASTERY_DOMINATOR = {
+  "id": "fire_mastery_dominator",
+  "name": "Fire Mastery",
+  "displayName": "Fire Mastery",
+  "archetype": "dominator",
+  "description": "You have Mastery over Fire to blast your foes and to add some much needed armor and defense.",
+  "icon": "fire_mastery_dominator_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Rain of Fire",
+      "fullName": "Epic.Fire_Mastery_Dominator.Fire_Blast",
+      "rank": 1,
+      "available": 34,
+      "description": "Summons a Rain of Fire over a targeted location, burning foes and reducing their movement speed within a large area.",
+      "shortHelp": "Ranged (Location AoE), DoT(Fire), -SPD",
+      "icon": "fireblast_rainoffire.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Dominator",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 120.0,
+        "endurance": 32.5,
+        "activationTime": 2.03,
+        "effectArea": "Location"
+      }
+    },
+    {
+      "name": "Fire Ball",
+      "fullName": "Epic.Fire_Mastery_Dominator.Fire_Ball",
+      "rank": 2,
+      "available": 34,
+      "description": "Hurls an exploding Fireball that consumes a targeted foe, and all nearby enemies. Anyone in that explosion is burned and set ablaze.",
+      "shortHelp": "Ranged (Targeted AoE), DMG(Fire/Smash)",
+      "icon": "fireblast_fireball.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Dominator",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 32.0,
+        "endurance": 18.98,
+        "activationTime": 1.0,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "damage": {
+          "type": "Fire",
+          "scale": 0.1,
+          "table": "Ranged_Damage"
+        }
+      }
+    },
+    {
+      "name": "Fire Shield",
+      "fullName": "Epic.Fire_Mastery_Dominator.Fire_Shield",
+      "rank": 3,
+      "available": 37,
+      "description": "While this power is active, you get a good resistance to Lethal, Smashing and Fire damage. Fire Shield also provides minimal resistance to Cold damage. You must be level 38 and have one other Fire Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Self +Res(Fire, Lethal, Smash, Cold)",
+      "icon": "firemastery_flamingshield.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 1.67,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "smashing": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "psionic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Rise of the Phoenix",
+      "fullName": "Epic.Fire_Mastery_Dominator.Rise_of_the_Phoenix",
+      "rank": 4,
+      "available": 40,
+      "description": "If you are defeated, you can rise from the ashes. The fiery resurrection blasts nearby foes with an explosion and knocks them down. You will revive with about half of your Hit Points and Endurance. Rise of the Phoenix will actually leave you invulnerable for a brief time and protected from XP Debt for 20 seconds. You must be level 41 and have one other Fire Mastery Powers before selecting this power.",
+      "shortHelp": "Self Rez, Special",
+      "icon": "firemastery_riseofthephoenix.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "Recharge",
+        "Heal",
+        "Damage"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Healing",
+        "Melee AoE Damage",
+        "Stuns",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 300.0,
+        "activationTime": 1.5,
+        "effectArea": "Location",
+        "damage": {
+          "type": "Heal",
+          "scale": 5.0,
+          "table": "Melee_HealSelf"
+        },
+        "protection": {
+          "immobilize": 50.0
+        }
+      }
+    },
+    {
+      "name": "Melt Armor",
+      "fullName": "Epic.Fire_Mastery_Dominator.Consume",
+      "rank": 5,
+      "available": 43,
+      "description": "The searing heat from this power is enough to melt the armor and defenses of all targets in the affected area. Melt Armor significantly weakens the Defense and Damage Resistance of the affected targets. You must be level 44 and have two other Fire Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Targeted AoE), Foe -Res, -DEF",
+      "icon": "pyremastery_meltarmor.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate Defense Debuff",
+        "Defense Debuff"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 70.0,
+        "recharge": 200.0,
+        "endurance": 22.75,
+        "activationTime": 1.5,
+        "effectArea": "AoE",
+        "radius": 10.0,
+        "defense": {
+          "all": {
+            "scale": 2.0,
+            "table": "Ranged_Debuff_Def"
+          }
+        },
+        "resistance": {
+          "smashing": {
+            "scale": -3.0,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "lethal": {
+            "scale": -3.0,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "fire": {
+            "scale": -3.0,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "cold": {
+            "scale": -3.0,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "energy": {
+            "scale": -3.0,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "negative": {
+            "scale": -3.0,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "psionic": {
+            "scale": -3.0,
+            "table": "Ranged_Debuff_Res_Dmg"
+          },
+          "toxic": {
+            "scale": -3.0,
+            "table": "Ranged_Debuff_Res_Dmg"
+          }
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['fire_mastery_dominator'] = EPIC_FIRE_MASTERY_DOMINATOR;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/dominator/ice_mastery_dominator.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Ice Mastery
+ * Archetype: Dominator
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\ice_mastery_dominator
+ */
+
+const EPIC_ICE_MASTERY_DOMINATOR = {
+  "id": "ice_mastery_dominator",
+  "name": "Ice Mastery",
+  "displayName": "Ice Mastery",
+  "archetype": "dominator",
+  "description": "You have Mastery over Ice to blast your foes and to add some much needed armor and defense.",
+  "icon": "ice_mastery_dominator_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Sleet",
+      "fullName": "Epic.Ice_Mastery_Dominator.Ice_Blast",
+      "rank": 1,
+      "available": 34,
+      "description": "Summons a Sleet Storm at a targeted location. Sleet deals minimal Cold damage to anything that passes through the storm. It also Slows the affected foes and severely reduces their Defense and resistance to damage. Many foes may even slip and fall trying to escape the storm.",
+      "shortHelp": "Ranged (Location AoE), Minor DoT(Cold), Foe -Speed, -Recharge, -DEF -Res",
+      "icon": "ice_mastery_sleet.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Dominator",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate Defense Debuff",
+        "Defense Debuff",
+        "Ranged AoE Damage",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 120.0,
+        "endurance": 22.659,
+        "activationTime": 2.03,
+        "effectArea": "Location"
+      }
+    },
+    {
+      "name": "Hibernate",
+      "fullName": "Epic.Ice_Mastery_Dominator.Hibernate",
+      "rank": 2,
+      "available": 34,
+      "description": "When you activate this power, you encase yourself in a block of solid ice, making yourself invulnerable, though you are frozen solid and cannot act. While Hibernating within this block of ice, you heal damage and recover endurance at an incredible rate. You can emerge at will by deactivating the power, but you cannot Hibernate for more than 30 seconds. If you activate this power while in the air, you will fall.",
+      "shortHelp": "Toggle: Self +Regeneration, +Recovery, Invulnerable; Self Hold",
+      "icon": "ice_mastery_hibernate.png",
+      "powerType": "Toggle",
+      "requires": "$archetype == @Class_Dominator",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Recharge",
+        "Heal"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Healing"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 240.0,
+        "endurance": 0.1625,
+        "activationTime": 0.07,
+        "effectArea": "SingleTarget",
+        "regeneration": {
+          "scale": 10.0,
+          "table": "Melee_Ones"
+        },
+        "recovery": {
+          "scale": 4.0,
+          "table": "Melee_Ones"
+        },
+        "resistance": {},
+        "protection": {
+          "knockup": 1.0,
+          "knockback": 1.0,
+          "immobilize": 1000.0
+        }
+      }
+    },
+    {
+      "name": "Frozen Armor",
+      "fullName": "Epic.Ice_Mastery_Dominator.Frozen_Armor",
+      "rank": 3,
+      "available": 37,
+      "description": "While this power is active, you coat yourself in rock hard Frozen Armor. The hardness of the Frozen Armor offers good defense to Smashing and Lethal attack as well as reduces Cold damage. Also, Fire attacks deal slightly less damage. You must be level 38 and have one other Ice Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Self +Def(Smash, Lethal), +Res(Cold, Fire)",
+      "icon": "ice_mastery_frozenarmor.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Defense Sets",
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 0.73,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "cold": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Hoarfrost",
+      "fullName": "Epic.Ice_Mastery_Dominator.Frost_Breath",
+      "rank": 4,
+      "available": 40,
+      "description": "Activating this power covers you in a thick layer of Hoarfrost. The frost can absorb the impact from enemy attacks, effectively increasing your maximum Hit Points for a short time. Hoarfrost also grants you resistance to Toxic Damage. You must be level 41 and have one other Ice Mastery Powers before selecting this power.",
+      "shortHelp": "Self Heal, +Max HP, Res(Toxic)",
+      "icon": "ice_mastery_hoarfrost.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge",
+        "Heal"
+      ],
+      "allowedSetCategories": [
+        "Healing",
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 540.0,
+        "endurance": 18.2,
+        "activationTime": 0.73,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "toxic": {
+            "scale": 1.5,
+            "table": "Melee_Res_Dmg"
+          }
+        },
+        "damage": {
+          "type": "Heal",
+          "scale": 3.0,
+          "table": "Melee_HealSelf"
+        }
+      }
+    },
+    {
+      "name": "Ice Storm",
+      "fullName": "Epic.Ice_Mastery_Dominator.Ice_Storm",
+      "rank": 5,
+      "available": 43,
+      "description": "Shred your foes with this Ice Storm. This power deals a lot of damage in a large area and can Slow all affected targets movement and attack speed. You must be level 44 and have two other Ice Mastery Powers before selecting this power. You must be level 44 and have two other Ice Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Location AoE), DoT(Cold), Foe -Recharge, -SPD",
+      "icon": "ice_mastery_icestorm.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage"
+      ],
+      "allowedSetCategories": [
+        "Ranged AoE Damage",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 2.0,
+        "range": 60.0,
+        "recharge": 120.0,
+        "endurance": 19.5,
+        "activationTime": 2.03,
+        "effectArea": "Location"
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['ice_mastery_dominator'] = EPIC_ICE_MASTERY_DOMINATOR;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/dominator/primal_forces_mastery_dominator.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Energy Mastery
+ * Archetype: Dominator
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\primal_forces_mastery_dominator
+ */
+
+const EPIC_PRIMAL_FORCES_MASTERY_DOMINATOR = {
+  "id": "primal_forces_mastery_dominator",
+  "name": "Energy Mastery",
+  "displayName": "Energy Mastery",
+  "archetype": "dominator",
+  "description": "You have Mastery over Primal Forces and energy to blast your foes, increase your power, and to add some much needed armor and defense.",
+  "icon": "primal_forces_mastery_dominator_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Energy Transfer",
+      "fullName": "Epic.Primal_Forces_Mastery_Dominator.Energy_Transfer",
+      "rank": 1,
+      "available": 34,
+      "description": "Mastery of Energy Melee begins with the ability to transfer your own Hit Points into a punch that deals extreme damage. Energy Transfer has a good chance of Disorienting the target.",
+      "shortHelp": "Melee, DMG(Energy/Smash), Foe Disorient, Self -HP",
+      "icon": "primalforcesmasterydominator_energytransfer.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Dominator",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Melee Damage",
+        "Stuns",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.2,
+        "range": 7.0,
+        "recharge": 20.0,
+        "endurance": 19.11,
+        "activationTime": 2.67,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Special",
+          "scale": 3.0,
+          "table": "Melee_Damage"
+        },
+        "protection": {
+          "stun": 3.0
+        }
+      }
+    },
+    {
+      "name": "Conserve Power",
+      "fullName": "Epic.Primal_Forces_Mastery_Dominator.Conserve_Power",
+      "rank": 2,
+      "available": 34,
+      "description": "You can focus for a moment to conserve your Endurance. After activating this power, you expend less Endurance on all other powers for a while.",
+      "shortHelp": "Self Endurance Discount",
+      "icon": "primalforcesmastery_conservepower.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Dominator",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 600.0,
+        "endurance": 9.75,
+        "activationTime": 1.17,
+        "effectArea": "SingleTarget"
+      }
+    },
+    {
+      "name": "Temp Invulnerability",
+      "fullName": "Epic.Primal_Forces_Mastery_Dominator.Temp_Invulnerability",
+      "rank": 3,
+      "available": 37,
+      "description": "When you toggle on this power, you become highly resistant to Smashing and Lethal damage. You must be level 38 and have one other Energy Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Self +Res(Smash, Lethal)",
+      "icon": "primalforcesmastery_temporaryinvulnerabilty.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 0.67,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "smashing": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "psionic": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Energy Torrent",
+      "fullName": "Epic.Primal_Forces_Mastery_Dominator.Energy_Torrent",
+      "rank": 4,
+      "available": 40,
+      "description": "Energy Torrent unleashes a cone of powerful energy that can smash foes and possibly send them flying. You must be level 41 and have one other Energy Mastery Powers before selecting this power.<br>",
+      "shortHelp": "Ranged (Cone), Light DMG(Energy/Smash), Foe Knockback",
+      "icon": "primalforcesmastery_energytorrent.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 40.0,
+        "recharge": 24.0,
+        "endurance": 14.82,
+        "activationTime": 1.07,
+        "effectArea": "Cone",
+        "radius": 40.0,
+        "arc": 0.7854,
+        "damage": {
+          "type": "Energy",
+          "scale": 0.8861,
+          "table": "Ranged_PvPDamage"
+        },
+        "protection": {
+          "knockback": 1.0
+        }
+      }
+    },
+    {
+      "name": "Explosive Blast",
+      "fullName": "Epic.Primal_Forces_Mastery_Dominator.Explosive_Blast",
+      "rank": 5,
+      "available": 43,
+      "description": "You hurl a blast of charged energy that violently explodes on impact, damaging all foes near the target. Explosive Blast may knock targets backwards. You must be level 44 and have two other Energy Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Targeted AoE), DMG(Smash/Energy), Foe Knockback",
+      "icon": "primalforcesmasterydominator_explosiveblast.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 32.0,
+        "endurance": 18.98,
+        "activationTime": 1.67,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "damage": {
+          "type": "Energy",
+          "scale": 0.6797,
+          "table": "Ranged_PvPDamage"
+        },
+        "protection": {
+          "knockback": 1.0
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['primal_forces_mastery_dominator'] = EPIC_PRIMAL_FORCES_MASTERY_DOMINATOR;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/dominator/psionic_mastery_domingator.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Psionic Mastery
+ * Archetype: Dominator
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\psionic_mastery_domingator
+ */
+
+const EPIC_PSIONIC_MASTERY_DOMINGATOR = {
+  "id": "psionic_mastery_domingator",
+  "name": "Psionic Mastery",
+  "displayName": "Psionic Mastery",
+  "archetype": "dominator",
+  "description": "You have Mastery over Psionics and the mind to blast your foes, increase your power, and to add some much needed armor and defense.",
+  "icon": "psionic_mastery_domingator_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Link Minds",
+      "fullName": "Epic.Psionic_Mastery_Domingator.Link_Minds",
+      "rank": 1,
+      "available": 34,
+      "description": "Your Mind Link Power will enable you to link the minds of all your teammates who are near you for the next 90 seconds. This shared link improves your team's chance to hit foes, your defensive abilities and dramatically reduces psionic damage.",
+      "shortHelp": "PBAoE Team +To Hit, +DEF (All), +RES (Psionic)",
+      "icon": "psionicmastery_linkminds.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Dominator",
+      "maxSlots": 6,
+      "allowedEnhancements": [],
+      "allowedSetCategories": [
+        "Defense Sets",
+        "To Hit Buff"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 300.0,
+        "endurance": 15.288,
+        "activationTime": 3.67,
+        "effectArea": "AoE",
+        "radius": 35.0,
+        "resistance": {
+          "psionic": {
+            "scale": 2.0,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Indomitable Will",
+      "fullName": "Epic.Psionic_Mastery_Domingator.Indomitable_Will",
+      "rank": 2,
+      "available": 34,
+      "description": "Activating this power greatly boosts your resistance to Sleep, Disorient, Fear and Hold effects for 90 seconds. Indomitable Will also grants a high defense to Psionic based attacks.",
+      "shortHelp": "Self Res( Disorient, Hold, Sleep, Fear). DEF(Psionics)",
+      "icon": "psionicmastery_indomitablewill.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Dominator",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Defense Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 360.0,
+        "endurance": 19.5,
+        "activationTime": 0.73,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "confuse": 1.0,
+          "fear": 1.0,
+          "hold": 1.0,
+          "stun": 1.0,
+          "sleep": 1.0
+        },
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Mind Over Body",
+      "fullName": "Epic.Psionic_Mastery_Domingator.Mind_Over_Body",
+      "rank": 3,
+      "available": 37,
+      "description": "When you toggle on this power, you empower your Mind Over Body to become highly resistant to Smashing, Lethal and Psionic damage. You must be level 38 and have one other Psionic Mastery Powers before selecting this power.<br>",
+      "shortHelp": "Toggle: Self +Res(Smash, Lethal, Psionics)",
+      "icon": "psionicmastery_mindoverbody.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 0.67,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "smashing": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "psionic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "World of Confusion",
+      "fullName": "Epic.Psionic_Mastery_Domingator.World_of_Confusion",
+      "rank": 4,
+      "available": 40,
+      "description": "This toggle power allows you to cause psionic damage and cause confusion within a group of foes, creating chaos. The chance of confusing an enemy is lower than then chance of damaging them, and it may take multiple hits to affect stronger opponents. All affected foes within the area will turn and attack each other, ignoring all heroes. You will not receive any Experience Points for foes defeated by Confused enemies. You must be level 41 and have one other Psionic Mastery Powers before selecting this power.<br>",
+      "shortHelp": "Toggle: PBAoE, DoT(Psionic), Foe Confuse",
+      "icon": "psionicmastery_worldofconfusion.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Confuse",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Confuse",
+        "Melee AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 15.0,
+        "endurance": 0.65,
+        "activationTime": 1.67,
+        "effectArea": "AoE",
+        "radius": 8.0,
+        "damage": {
+          "type": "Psionic",
+          "scale": 0.12,
+          "table": "Ranged_Damage"
+        }
+      }
+    },
+    {
+      "name": "Psionic Tornado",
+      "fullName": "Epic.Psionic_Mastery_Domingator.Psionic_Tornado",
+      "rank": 5,
+      "available": 43,
+      "description": "Unleashes a whirlwind of Psionic energy on a target, tossing nearby foes into the air. The Psionic Tornado damages foes and Slows their attack speed. You must be level 44 and have two other Psionic Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Targeted AoE), DoT(Psionic), Foe Knockback",
+      "icon": "psychicblast_psionictornado.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 100.0,
+        "recharge": 40.0,
+        "endurance": 23.14,
+        "activationTime": 1.83,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "damage": {
+          "type": "Psionic",
+          "scale": 0.8409,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['psionic_mastery_domingator'] = EPIC_PSIONIC_MASTERY_DOMINGATOR;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
@@ -0,0 +1,542 @@
+/**
+ * City of Heroes: Homecoming - Data Shard Manifest
+ *
+ * Auto-generated by tools/build_shards.py
+ * One shard per archetype holding its powersets and epic pools;
+ * requires lists the shared base shards to load first
+ */
+
+const DATA_SHARDS = {
+  "blaster": {
+    "file": "js/data/shards/blaster.6c2589c886.js",
+    "bytes": 428792,
+    "powersets": [
+      "blaster/archery",
+      "blaster/assault-rifle",
+      "blaster/beam-rifle",
+      "blaster/dark-blast",
+      "blaster/darkness-manipulation",
+      "blaster/dual-pistols",
+      "blaster/earth-manipulation",
+      "blaster/electrical-blast",
+      "blaster/electricity-manipulation",
+      "blaster/energy-blast",
+      "blaster/energy-manipulation",
+      "blaster/fire-blast",
+      "blaster/fire-manipulation",
+      "blaster/gadgets",
+      "blaster/ice-blast",
+      "blaster/ice-manipulation",
+      "blaster/martial-manipulation",
+      "blaster/mental-manipulation",
+      "blaster/ninja-training",
+      "blaster/plant-manipulation",
+      "blaster/psychic-blast",
+      "blaster/radiation-blast",
+      "blaster/radiation-manipulation",
+      "blaster/seismic-blast",
+      "blaster/sonic-attack",
+      "blaster/sonic-manipulation",
+      "blaster/storm-blast",
+      "blaster/tactical-arrow",
+      "blaster/time-manipulation",
+      "blaster/water-blast"
+    ],
+    "epics": [
+      "blaster_dark_mastery",
+      "blaster_mace_mastery",
+      "blaster_mu_mastery",
+      "cold_mastery",
+      "electrical_mastery",
+      "flame_mastery",
+      "force_mastery",
+      "munitions_mastery"
+    ],
+    "requires": []
+  },
+  "brute": {
+    "file": "js/data/shards/brute.1a25a8ad4f.js",
+    "bytes": 517676,
+    "powersets": [
+      "brute/battle-axe",
+      "brute/bio-organic-armor",
+      "brute/brawling",
+      "brute/broad-sword",
+      "brute/claws",
+      "brute/dark-armor",
+      "brute/dark-melee",
+      "brute/dual-blades",
+      "brute/electric-armor",
+      "brute/electrical-melee",
+      "brute/energy-aura",
+      "brute/energy-melee",
+      "brute/fiery-aura",
+      "brute/fiery-melee",
+      "brute/ice-armor",
+      "brute/ice-melee",
+      "brute/invulnerability",
+      "brute/katana",
+      "brute/kinetic-attack",
+      "brute/martial-arts",
+      "brute/psionic-armor",
+      "brute/psionic-melee",
+      "brute/radiation-armor",
+      "brute/radiation-melee",
+      "brute/regeneration",
+      "brute/savage-melee",
+      "brute/shield-defense",
+      "brute/spines",
+      "brute/staff-fighting",
+      "brute/stone-armor",
+      "brute/stone-melee",
+      "brute/super-reflexes",
+      "brute/super-strength",
+      "brute/titan-weapons",
+      "brute/war-mace",
+      "brute/willpower"
+    ],
+    "epics": [
+      "brute_leviathan_mastery",
+      "brute_mace_mastery",
+      "brute_mu_mastery",
+      "brute_soul_mastery",
+      "energy_mastery_brute"
+    ],
+    "requires": []
+  },
+  "controller": {
+    "file": "js/data/shards/controller.169e95ec2f.js",
+    "bytes": 393641,
+    "powersets": [
+      "controller/arsenal-control",
+      "controller/cold-domination",
+      "controller/darkness-affinity",
+      "controller/darkness-control",
+      "controller/earth-control",
+      "controller/electric-control",
+      "controller/empathy",
+      "controller/fire-control",
+      "controller/force-field",
+      "controller/gravity-control",
+      "controller/ice-control",
+      "controller/illusion-control",
+      "controller/kinetics",
+      "controller/marine-affinity",
+      "controller/mind-control",
+      "controller/nature-affinity",
+      "controller/pain-domination",
+      "controller/plant-control",
+      "controller/poison",
+      "controller/pyrotechnic-control",
+      "controller/radiation-emission",
+      "controller/shock-therapy",
+      "controller/sonic-debuff",
+      "controller/storm-summoning",
+      "controller/symphony-control",
+      "controller/thermal-radiation",
+      "controller/time-manipulation",
+      "controller/traps",
+      "controller/trick-arrow",
+      "controller/wind-control"
+    ],
+    "epics": [
+      "controller_dark_mastery",
+      "controller_mace_mastery",
+      "fire_mastery",
+      "ice_mastery",
+      "primal_forces_mastery",
+      "psionic_mastery",
+      "stone_mastery"
+    ],
+    "requires": []
+  },
+  "corruptor": {
+    "file": "js/data/shards/corruptor.804a294bbb.js",
+    "bytes": 418564,
+    "powersets": [
+      "corruptor/archery",
+      "corruptor/assault-rifle",
+      "corruptor/beam-rifle",
+      "corruptor/cold-domination",
+      "corruptor/dark-blast",
+      "corruptor/dark-miasma",
+      "corruptor/dual-pistols",
+      "corruptor/electrical-blast",
+      "corruptor/empathy",
+      "corruptor/energy-blast",
+      "corruptor/fire-blast",
+      "corruptor/force-field",
+      "corruptor/ice-blast",
+      "corruptor/kinetics",
+      "corruptor/marine-affinity",
+      "corruptor/nature-affinity",
+      "corruptor/pain-domination",
+      "corruptor/poison",
+      "corruptor/psychic-blast",
+      "corruptor/radiation-blast",
+      "corruptor/radiation-emission",
+      "corruptor/seismic-blast",
+      "corruptor/shock-therapy",
+      "corruptor/sonic-attack",
+      "corruptor/sonic-resonance",
+      "corruptor/storm-blast",
+      "corruptor/storm-summoning",
+      "corruptor/thermal-radiation",
+      "corruptor/time-manipulation",
+      "corruptor/traps",
+      "corruptor/trick-arrow",
+      "corruptor/water-blast"
+    ],
+    "epics": [
+      "corruptor_fire_mastery",
+      "corruptor_leviathan_mastery",
+      "corruptor_mace_mastery",
+      "corruptor_mu_mastery",
+      "corruptor_soul_mastery"
+    ],
+    "requires": []
+  },
+  "defender": {
+    "file": "js/data/shards/defender.b32cc8dfc2.js",
+    "bytes": 423386,
+    "powersets": [
+      "defender/archery",
+      "defender/assault-rifle",
+      "defender/beam-rifle",
+      "defender/cold-domination",
+      "defender/dark-blast",
+      "defender/dark-miasma",
+      "defender/dual-pistols",
+      "defender/electrical-blast",
+      "defender/empathy",
+      "defender/energy-blast",
+      "defender/fire-blast",
+      "defender/force-field",
+      "defender/ice-blast",
+      "defender/kinetics",
+      "defender/marine-affinity",
+      "defender/nature-affinity",
+      "defender/pain-domination",
+      "defender/poison",
+      "defender/psychic-blast",
+      "defender/radiation-blast",
+      "defender/radiation-emission",
+      "defender/seismic-blast",
+      "defender/shock-therapy",
+      "defender/sonic-attack",
+      "defender/sonic-debuff",
+      "defender/storm-blast",
+      "defender/storm-summoning",
+      "defender/thermal-radiation",
+      "defender/time-manipulation",
+      "defender/traps",
+      "defender/trick-arrow",
+      "defender/water-blast"
+    ],
+    "epics": [
+      "dark_mastery",
+      "defender_fire_mastery",
+      "defender_ice_mastery",
+      "electricity_mastery",
+      "power_mastery",
+      "psychic_mastery"
+    ],
+    "requires": []
+  },
+  "dominator": {
+    "file": "js/data/shards/dominator.acfa6cee74.js",
+    "bytes": 385428,
+    "powersets": [
+      "dominator/arsenal-assault",
+      "dominator/arsenal-control",
+      "dominator/dark-assault",
+      "dominator/darkness-control",
+      "dominator/earth-assault",
+      "dominator/earth-control",
+      "dominator/electric-control",
+      "dominator/electricity-manipulation",
+      "dominator/energy-assault",
+      "dominator/fiery-assault",
+      "dominator/fire-control",
+      "dominator/gravity-control",
+      "dominator/ice-control",
+      "dominator/icy-assault",
+      "dominator/illusion-control",
+      "dominator/martial-assault",
+      "dominator/mind-control",
+      "dominator/plant-control",
+      "dominator/psionic-assault",
+      "dominator/pyrotechnic-control",
+      "dominator/radioactive-assault",
+      "dominator/savage-assault",
+      "dominator/sonic-assault",
+      "dominator/symphony-control",
+      "dominator/thorny-assault",
+      "dominator/wind-control"
+    ],
+    "epics": [
+      "dominator_dark_mastery",
+      "dominator_leviathan_mastery",
+      "dominator_mace_mastery",
+      "dominator_mu_mastery",
+      "dominator_soul_mastery",
+      "fire_mastery_dominator",
+      "ice_mastery_dominator",
+      "primal_forces_mastery_dominator",
+      "psionic_mastery_domingator"
+    ],
+    "requires": []
+  },
+  "mastermind": {
+    "file": "js/data/shards/mastermind.3d2c96c263.js",
+    "bytes": 346251,
+    "powersets": [
+      "mastermind/beast-mastery",
+      "mastermind/cold-domination",
+      "mastermind/dark-miasma",
+      "mastermind/demon-summoning",
+      "mastermind/empathy",
+      "mastermind/force-field",
+      "mastermind/kinetics",
+      "mastermind/marine-affinity",
+      "mastermind/mercenaries",
+      "mastermind/nature-affinity",
+      "mastermind/necromancy",
+      "mastermind/ninjas",
+      "mastermind/pain-domination",
+      "mastermind/poison",
+      "mastermind/radiation-emission",
+      "mastermind/robotics",
+      "mastermind/shock-therapy",
+      "mastermind/sonic-resonance",
+      "mastermind/storm-summoning",
+      "mastermind/thermal-radiation",
+      "mastermind/thugs",
+      "mastermind/time-manipulation",
+      "mastermind/traps",
+      "mastermind/trick-arrow"
+    ],
+    "epics": [
+      "charge_mastery",
+      "chill_mastery",
+      "field_mastery",
+      "heat_mastery_stalker",
+      "mastermind_dark_mastery",
+      "mastermind_leviathan_mastery",
+      "mastermind_mace_mastery",
+      "mastermind_mu_mastery",
+      "mastermind_soul_mastery"
+    ],
+    "requires": []
+  },
+  "scrapper": {
+    "file": "js/data/shards/scrapper.373ef7be45.js",
+    "bytes": 511505,
+    "powersets": [
+      "scrapper/battle-axe",
+      "scrapper/bio-organic-armor",
+      "scrapper/brawling",
+      "scrapper/broad-sword",
+      "scrapper/claws",
+      "scrapper/dark-armor",
+      "scrapper/dark-melee",
+      "scrapper/dual-blades",
+      "scrapper/electric-armor",
+      "scrapper/electrical-melee",
+      "scrapper/energy-aura",
+      "scrapper/energy-melee",
+      "scrapper/fiery-aura",
+      "scrapper/fiery-melee",
+      "scrapper/ice-armor",
+      "scrapper/ice-melee",
+      "scrapper/invulnerability",
+      "scrapper/katana",
+      "scrapper/kinetic-attack",
+      "scrapper/martial-arts",
+      "scrapper/ninjitsu",
+      "scrapper/psionic-armor",
+      "scrapper/psionic-melee",
+      "scrapper/quills",
+      "scrapper/radiation-armor",
+      "scrapper/radiation-melee",
+      "scrapper/regeneration",
+      "scrapper/savage-melee",
+      "scrapper/shield-defense",
+      "scrapper/staff-fighting",
+      "scrapper/stone-armor",
+      "scrapper/stone-melee",
+      "scrapper/super-reflexes",
+      "scrapper/titan-weapons",
+      "scrapper/war-mace",
+      "scrapper/willpower"
+    ],
+    "epics": [
+      "blaze_mastery",
+      "body_mastery",
+      "darkness_mastery",
+      "melee_psionic_mastery",
+      "scrapper_ice_mastery",
+      "weapon_mastery"
+    ],
+    "requires": []
+  },
+  "sentinel": {
+    "file": "js/data/shards/sentinel.af3c0f9a6b.js",
+    "bytes": 450552,
+    "powersets": [
+      "sentinel/archery",
+      "sentinel/assault-rifle",
+      "sentinel/beam-rifle",
+      "sentinel/bio-organic-armor",
+      "sentinel/dark-armor",
+      "sentinel/dark-blast",
+      "sentinel/dual-pistols",
+      "sentinel/electric-armor",
+      "sentinel/electrical-blast",
+      "sentinel/energy-aura",
+      "sentinel/energy-blast",
+      "sentinel/fiery-aura",
+      "sentinel/fire-blast",
+      "sentinel/ice-armor",
+      "sentinel/ice-blast",
+      "sentinel/invulnerability",
+      "sentinel/ninjitsu",
+      "sentinel/psionic-armor",
+      "sentinel/psychic-blast",
+      "sentinel/radiation-armor",
+      "sentinel/radiation-blast",
+      "sentinel/regeneration",
+      "sentinel/seismic-blast",
+      "sentinel/sonic-attack",
+      "sentinel/stone-armor",
+      "sentinel/storm-blast",
+      "sentinel/super-reflexes",
+      "sentinel/water-blast",
+      "sentinel/willpower"
+    ],
+    "epics": [
+      "sentinel_dark_mastery",
+      "sentinel_electricity_mastery",
+      "sentinel_fire_mastery",
+      "sentinel_ice_mastery",
+      "sentinel_leviathan_mastery",
+      "sentinel_mace_mastery",
+      "sentinel_mu_mastery",
+      "sentinel_ninja_mastery",
+      "sentinel_psionic_mastery",
+      "sentinel_soul_mastery"
+    ],
+    "requires": []
+  },
+  "stalker": {
+    "file": "js/data/shards/stalker.091683cb2d.js",
+    "bytes": 465789,
+    "powersets": [
+      "stalker/bio-organic-armor",
+      "stalker/brawling",
+      "stalker/broad-sword",
+      "stalker/claws",
+      "stalker/dark-armor",
+      "stalker/dark-melee",
+      "stalker/dual-blades",
+      "stalker/electric-armor",
+      "stalker/electrical-melee",
+      "stalker/energy-aura",
+      "stalker/energy-melee",
+      "stalker/fiery-aura",
+      "stalker/fiery-melee",
+      "stalker/ice-armor",
+      "stalker/ice-melee",
+      "stalker/invulnerability",
+      "stalker/kinetic-attack",
+      "stalker/martial-arts",
+      "stalker/ninja-sword",
+      "stalker/ninjitsu",
+      "stalker/psionic-armor",
+      "stalker/psionic-melee",
+      "stalker/radiation-armor",
+      "stalker/radiation-melee",
+      "stalker/regeneration",
+      "stalker/savage-melee",
+      "stalker/shield-defense",
+      "stalker/spines",
+      "stalker/staff-fighting",
+      "stalker/stone-armor",
+      "stalker/stone-melee",
+      "stalker/super-reflexes",
+      "stalker/willpower"
+    ],
+    "epics": [
+      "body_mastery_stalker",
+      "stalker_leviathan_mastery",
+      "stalker_mace_mastery",
+      "stalker_mu_mastery",
+      "stalker_soul_mastery",
+      "weapon_mastery_stalker"
+    ],
+    "requires": []
+  },
+  "tanker": {
+    "file": "js/data/shards/tanker.34eea576de.js",
+    "bytes": 516783,
+    "powersets": [
+      "tanker/battle-axe",
+      "tanker/bio-organic-armor",
+      "tanker/brawling",
+      "tanker/broad-sword",
+      "tanker/claws",
+      "tanker/dark-armor",
+      "tanker/dark-melee",
+      "tanker/dual-blades",
+      "tanker/electric-armor",
+      "tanker/electrical-melee",
+      "tanker/energy-aura",
+      "tanker/energy-melee",
+      "tanker/fiery-aura",
+      "tanker/fiery-melee",
+      "tanker/ice-armor",
+      "tanker/ice-melee",
+      "tanker/invulnerability",
+      "tanker/katana",
+      "tanker/kinetic-attack",
+      "tanker/martial-arts",
+      "tanker/psionic-armor",
+      "tanker/psionic-melee",
+      "tanker/radiation-armor",
+      "tanker/radiation-melee",
+      "tanker/regeneration",
+      "tanker/savage-melee",
+      "tanker/shield-defense",
+      "tanker/spines",
+      "tanker/staff-fighting",
+      "tanker/stone-armor",
+      "tanker/stone-melee",
+      "tanker/super-reflexes",
+      "tanker/super-strength",
+      "tanker/titan-weapons",
+      "tanker/war-mace",
+      "tanker/willpower"
+    ],
+    "epics": [
+      "arctic_mastery",
+      "earth_mastery",
+      "energy_mastery",
+      "pyre_mastery",
+      "tank_dark_mastery",
+      "tank_psionic_mastery"
+    ],
+    "requires": []
+  },
+  "arachnos_soldier": {
+    "file": "js/data/shards/arachnos_soldier.47f0d19237.js",
+    "bytes": 34150,
+    "powersets": [],
+    "epics": [
+      "veat_leviathan_mastery",
+      "veat_mace_mastery",
+      "veat_mu_mastery",
+      "veat_soul_mastery"
+    ],
+    "requires": []
+  }
+};
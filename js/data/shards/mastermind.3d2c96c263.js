@@ -0,0 +1,7971 @@
+// ---- js/data/powersets/mastermind/beast-mastery.js ----
+;/**
+ * Beast Mastery
+ * Character Level: 50
+ * Archetype: mastermind
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const MASTERMIND_BEAST_MASTERY_POWERSET = {
+    name: "Beast Mastery",
+    category: "Unknown",
+    description: "Beast Mastery powerset",
+    icon: "beast-mastery_set.png",
+    powers: [
+        {
+            name: "Call Swarm",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You summon a swarm of stinging insects to harass your foe causing Light Lethal damage over time and reducing both their movement speed and defense. This power has a moderate chance at granting your pets a stack of Pack Mentality.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Ranged, Light DoT(Lethal), Foe -Defense, -Speed",
+            icon: "beastmastery_callswarm.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 3.0,
+                endurance: 5.46,
+                cast: 1.0,
+                dotDamage: {
+                    type: "Lethal",
+                    scale: 0.42879999999999996,
+                    ticks: 4
+                },
+                buffDuration: 3.1,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Summon Wolves",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Accurate To-Hit Debuff", "Defense Debuff", "Healing", "Knockback", "Mastermind Archetype Sets", "Pet Damage", "Recharge Intensive Pets", "Running", "Running & Sprints", "To Hit Buff", "To Hit Debuff", "Universal Damage Sets"],
+            description: "Calls forth one to three Wolves to do your bidding. The third one summoned will be an Alpha Wolf, which grants some leadership bonuses to the pack. Wolves have no ranged attacks, but can quickly close in on their prey.<br><br>You may only have 3 Wolves under your control at any given time. If you attempt to call more Wolves, you can only replace the ones you have lost in battle. If you already have three, the power will fail.<br><br>Wolf attacks have a chance to build a charge of Pack Mentality. Pack Mentality is a Damage buff aura that radiates from the Mastermind and can stack up to 10 times.<br><br><color #fcfc95>Notes: Summon Wolves is unaffected by Recharge Time changes.</color><br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Summon Wolves",
+            icon: "beastmastery_summonwolves.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 5.0,
+                endurance: 5.46,
+                cast: 1.97
+            }
+        },
+        {
+            name: "Call Hawk",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Knockback", "Ranged Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You call forth a hawk ally to swoop in and viciously peck at your target causing High Lethal damage. The attack often catches foes off their guard and can knock them down as well as reducing their chance to hit. This power has a good chance at granting your pets a stack of Pack Mentality.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, Moderate DMG(Lethal), Foe -To Hit, Knockdown, -Fly",
+            icon: "beastmastery_callhawk.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 6.0,
+                endurance: 9.62,
+                cast: 1.67,
+                dotDamage: {
+                    type: "Lethal",
+                    scale: 0.7236,
+                    ticks: 4
+                },
+                buffDuration: 1.3,
+                tohitDebuff: 0.75
+            }
+        },
+        {
+            name: "Train Beasts",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: [],
+            description: "Train your Beast Henchmen to more effectively attack your foes. This power permanently bestows new powers and abilities to all of your Beast Henchmen. The powers gained are unique and dependent upon the type of Beast Henchman.<br><br>This power only works on your Beast Henchmen and you can only Train your Beast Henchmen once with this power.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, Train Beast Henchmen",
+            icon: "beastmastery_trainbeasts.png",
+            powerType: "Click",
+            targetType: "Own Pet (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 6.0,
+                endurance: 11.375,
+                cast: 1.67
+            }
+        },
+        {
+            name: "Call Ravens",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You command an unkindness of ravens to quickly assault and harass your foes. Your foes will suffer Moderate Lethal damage over time and have their speed and defense reduced. This power has a high chance at granting your pets a stack of Pack Mentality.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Cone), Moderate DoT(Lethal), Foe -Speed, -Defense, -Fly",
+            icon: "beastmastery_calllocusts.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.155,
+                range: 40.0,
+                recharge: 14.0,
+                endurance: 16.9,
+                cast: 2.17,
+                dotDamage: {
+                    type: "Lethal",
+                    scale: 0.5673999999999999,
+                    ticks: 4
+                },
+                buffDuration: 3.1,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Summon Lions",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Damage", "Accuracy"],
+            allowedSetCategories: ["Defense Sets", "Healing", "Mastermind Archetype Sets", "Pet Damage", "Recharge Intensive Pets", "Running", "Running & Sprints", "Stuns", "Universal Damage Sets"],
+            description: "You can summon one to two mighty lions (depending on your level). Lions are one of the most deadly predators on the planet and possess vicious claw and bite attacks as well as growl and roar buffs and debuffs. Like all Henchmen, Lions can be trained to be even more powerful.<br><br>You may only have 2 Lions under your control at any given time. If you attempt to summon more Lions, you can only replace the ones you have lost in battle. If you already have two, the power will fail.<br><br>Lion attacks have a chance to build a charge of Pack Mentality. Pack Mentality is a Damage buff aura that radiates from the Mastermind and can stack up to 10 times.<br><br><color #fcfc95>Notes: Summon Lions is unaffected by Recharge Time changes.</color><br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Summon Lions",
+            icon: "beastmastery_summonlions.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 10.0,
+                endurance: 9.62,
+                cast: 2.0
+            }
+        },
+        {
+            name: "Fortify Pack",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Healing"],
+            description: "You command your beasts to fight more defensively. Using Fortify Pack will prevent your pets from benefiting from Pack Mentality for 60 seconds. The number of charges of Pack Mentality you own when activating this power will determine the potency of the Defense and Regeneration buff that will be granted to your pack. Additionally, simply owning this power grants your beast pets attacks a chance to critically hit that scales with the amount of Pack Mentality owned by the Mastermind.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE, Pets +Defense, +Regeneration, consumes all charges of Pack Mentality",
+            icon: "beastmastery_fortifypack.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 240.0,
+                endurance: 16.25,
+                cast: 2.27,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Summon Dire Wolf",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Fear", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Fear", "Healing", "Mastermind Archetype Sets", "Pet Damage", "Recharge Intensive Pets", "Resist Damage", "Running", "Running & Sprints", "Slow Movement", "Universal Damage Sets"],
+            description: "You call upon the aid of the fabled Dire Wolf. It has powerful bite and breath attacks. Unlike wolves and lions, the Dire Wolf has some limited ranged attacks. The Dire Wolf has good defense to Melee, Ranged and AoE attacks and good resistance to Cold damage.<br><br>You may only have 1 Dire Wolf under your control at any given time. If you attempt to summon another Dire Wolf the power will fail.<br><br>Dire Wolf attacks have a chance to build a charge of Pack Mentality. Pack Mentality is a Damage buff aura that radiates from the Mastermind and can stack up to 10 times.<br><br><color #fcfc95>Notes: Summon Dire Wolf is unaffected by Recharge Time changes.</color><br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Summon Dire Wolf",
+            icon: "beastmastery_summondirewolves.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 15.0,
+                endurance: 13.18,
+                cast: 2.0
+            }
+        },
+        {
+            name: "Tame Beasts",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: [],
+            description: "Tame Beasts will permanently teach the most deadly and ferocious powers to all of your Beast Henchmen. The Tamed Beasts will gain new abilities and powers. The powers gained are unique and dependent upon the type of Beast Henchman that is Tamed.<br><br>Tame Beasts only works on your Beast Henchmen and you can only Tame your Beast Henchmen once with this power.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged, Upgrade Beast Henchmen",
+            icon: "beastmastery_tamebeasts.png",
+            powerType: "Click",
+            targetType: "Own Pet (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 30.0,
+                recharge: 10.0,
+                endurance: 11.375,
+                cast: 1.07
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['mastermind/beast-mastery'] = MASTERMIND_BEAST_MASTERY_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.MASTERMIND_BEAST_MASTERY_POWERSET = MASTERMIND_BEAST_MASTERY_POWERSET;
+}
+
+// ---- js/data/powersets/mastermind/cold-domination.js ----
+;/**
+ * Cold Domination
+ * Character Level: 50
+ * Archetype: mastermind
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const MASTERMIND_COLD_DOMINATION_POWERSET = {
+    name: "Cold Domination",
+    category: "Unknown",
+    description: "Cold Domination powerset",
+    icon: "cold-domination_set.png",
+    powers: [
+        {
+            name: "Ice Shield",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Resist Damage"],
+            description: "Casts a rock hard Ice Shield on one of your allies and grants them Defense to Melee, Lethal attacks and damage resistance to Cold and Fire damage. You cannot stack multiple Ice Shields on the same target, however the shield can be improved by another ally using the same power. Can also be used in conjunction with your Glacial Shield. You cannot use this power on yourself.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Ranged, Ally +DEF(Melee, Smash, Lethal), Res(Cold, Fire)",
+            icon: "colddomination_iceshield.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 2.0,
+                endurance: 9.75,
+                cast: 1.17,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 1.25,
+                            ticks: 120
+                        },
+                        {
+                            type: "Fire",
+                            scale: 1.0,
+                            ticks: 120
+                        }
+                    ]
+                },
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Infrigidate",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Slow Movement"],
+            description: "Fires a frigid beam of cold at a single target. This beam dramatically reduces the targets attack rate, movement speed and Defense. Infrigidate draws so much heat out of the target that the damage of any of its Fire attacks will be reduced.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged Foe -Speed, -Recharge, -DEF, -DMG (Fire)",
+            icon: "colddomination_infrigidate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 13.0,
+                cast: 1.0,
+                dotDamage: {
+                    type: "Fire",
+                    scale: 3.0,
+                    ticks: 10
+                },
+                buffDuration: 20.0,
+                defenseDebuff: 2.5
+            }
+        },
+        {
+            name: "Snow Storm",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "While active, the chill from this Snow Storm can dramatically Slow the attack and movement speed of the target and all nearby foes. The torrent winds of the Snow Storm are enough to bring down flying foes.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Ranged (Targeted AoE), Foe -Speed, -Recharge, -Fly",
+            icon: "colddomination_snowstorm.png",
+            powerType: "Toggle",
+            targetType: "Foe",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 10.0,
+                endurance: 0.325,
+                cast: 2.03,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Glacial Shield",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Resist Damage"],
+            description: "Envelopes an ally in gleaming Glacial Ice. Its crystalline structure has refracting properties that grants the target good Defense against Area Effect, Ranged, Energy and Negative Energy attacks. Glacial Shield also grants the target some damage resistance to Cold. You cannot stack multiple Glacial Shields on the same target, however the shield can be improved by another ally using the same power. Can also be used in conjunction with your Ice Shield. You cannot use this power on yourself.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Ranged, Ally +DEF(Ranged, AoE, Energy, Negative), Res(Cold)",
+            icon: "colddomination_glaciate.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 2.0,
+                endurance: 9.75,
+                cast: 1.17,
+                dotDamage: {
+                    type: "Cold",
+                    scale: 1.25,
+                    ticks: 120
+                },
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Frostwork",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Covers an ally in a thick layer of Frost. The frost can absorb the impact from enemy attacks, effectively increasing your ally's maximum Hit Points for a short time. Frostwork also grants your ally resistance to Toxic Damage.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Target +Max HP, Res(Toxic)",
+            icon: "colddomination_frostwork.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 60.0,
+                endurance: 18.2,
+                cast: 1.17,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 2.0,
+                    ticks: 60
+                },
+                buffDuration: 120.0
+            }
+        },
+        {
+            name: "Arctic Fog",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Resist Damage"],
+            description: "Your mastery of Cold allows you to hide yourself and all nearby allies within thick Arctic Fog. Arctic Fog makes you and your allies harder to see and increases your Defense to area effect, melee and ranged attacks, as well as your resistance to Slow, Fire, Cold, and Energy damage.",
+            shortHelp: "Toggle: PBAoE, Team Stealth, +DEF, +Res(Fire, Cold, Energy, Slow)",
+            icon: "colddomination_arcticfog.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 15.0,
+                endurance: 0.325,
+                cast: 1.87,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Benumb",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: [],
+            description: "Numbs a single target to its very core. Benumb reduces the target's core body temperature, dramatically weakening them. A Benumbed target's Damage and Regeneration Rate are greatly reduced. Additionally, the affected target's secondary power effects are all weakened. The target's powers' effects like Heals, Defense Buffs, Endurance Drains, Disorients, Holds, Immobilizes, Knockbacks and more, are all weakened.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged Foe -DMG, -END, -Regeneration, -Special",
+            icon: "colddomination_benumb.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 120.0,
+                endurance: 16.25,
+                cast: 2.07,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Sleet",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Summons a Sleet Storm at a targeted location. Sleet deals minimal Cold damage to anything that passes through the storm. It also Slows the affected foes and severely reduces their Defense and resistance to damage. Many foes may even slip and fall trying to escape the storm.<br><br><color #fcfc95>Damage: Minor(DoT).</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Location AoE), Minor DoT(Cold), Foe -Speed, -Recharge, -DEF -Res",
+            icon: "colddomination_sleet.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                endurance: 22.75,
+                cast: 2.03,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Heat Loss",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Slow Movement"],
+            description: "Heat Loss drains the heat from your enemies and transfers that energy to your allies in the form of Endurance. All foes near the selected target may experience a Heat Loss, which will drain their Endurance, Slow them, and reduce their Damage Resistance. Each enemy target that is successfully drained of Heat will expel that energy to all your nearby allies, granting them Endurance and a boost to their Endurance Recovery. Some Endurance and Recovery will also be transferred directly to you and any allies near you.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Ranged (Foe AoE), Foe -RES, -END, Slow; Team +END, +Recovery",
+            icon: "colddomination_heatloss.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 360.0,
+                endurance: 19.5,
+                cast: 2.17
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['mastermind/cold-domination'] = MASTERMIND_COLD_DOMINATION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.MASTERMIND_COLD_DOMINATION_POWERSET = MASTERMIND_COLD_DOMINATION_POWERSET;
+}
+
+// ---- js/data/powersets/mastermind/dark-miasma.js ----
+;/**
+ * Dark Miasma
+ * Character Level: 50
+ * Archetype: mastermind
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const MASTERMIND_DARK_MIASMA_POWERSET = {
+    name: "Dark Miasma",
+    category: "Unknown",
+    description: "Dark Miasma powerset",
+    icon: "dark-miasma_set.png",
+    powers: [
+        {
+            name: "Tar Patch",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "Drops a large patch of viscous Negative Energy which dramatically slows down enemies that run through it and reduces their damage resistance. Affected targets stuck in the Tar Patch cannot jump or fly.",
+            shortHelp: "Ranged (Location AoE), Target -Speed, -Res, -Fly",
+            icon: "darkmiasma_tarpatch.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 90.0,
+                recharge: 90.0,
+                endurance: 9.75,
+                cast: 3.1,
+                buffDuration: 45.0
+            }
+        },
+        {
+            name: "Twilight Grasp",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Accurate To-Hit Debuff", "Healing", "To Hit Debuff"],
+            description: "You channel Negative Energy from the Netherworld through yourself to a targeted foe. Twilight Grasp drains the power from that target and slowly transfers it to you and all nearby allies. The targeted foe's chance to hit, damage and regeneration rate are reduced, while you and your nearby allies are healed.",
+            shortHelp: "Ranged, Foe -To Hit, -DMG, -Regen, Team Heal",
+            icon: "darkmiasma_twilightgrasp.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 9.75,
+                cast: 2.37,
+                tohitDebuff: 0.5,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Darkest Night",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "To Hit Debuff"],
+            description: "While active, you channel Negative Energy onto a targeted foe. While Darkest Night is active the target, and all foes nearby, will have their chance to hit and Damage potential reduced as long as you keep the power active.",
+            shortHelp: "Toggle: Ranged (Targeted AoE), Foe -DMG, -To Hit",
+            icon: "darkmiasma_darkestnight.png",
+            powerType: "Toggle",
+            targetType: "Foe",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 10.0,
+                endurance: 0.325,
+                cast: 3.17,
+                buffDuration: 0.75,
+                tohitDebuff: 1.5
+            }
+        },
+        {
+            name: "Howling Twilight",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage"],
+            allowedSetCategories: ["Ranged AoE Damage", "Slow Movement", "Stuns", "Universal Damage Sets"],
+            description: "Activating this power channels the power of the Netherworld to weaken your foes, in an attempt to revive all nearby fallen allies. You must stand near your defeated allies to revive them, then select a foe. The selected foe and all nearby foes will be Slowed, Disoriented, have their Regeneration rate reduced and drained of some life. Revived allies will have full Hit Points and Endurance and will be protected from XP Debt for 90 seconds.",
+            shortHelp: "Ranged (AoE), Minor DMG(Negative), Target Slow, -Recharge, -Regen, Disorient, Ally Rez",
+            icon: "darkmiasma_howlingtwilight.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 180.0,
+                endurance: 32.5,
+                cast: 3.17,
+                damage: {
+                    type: "Negative",
+                    scale: 0.25
+                },
+                buffDuration: 30.0,
+                stun: 3.0
+            }
+        },
+        {
+            name: "Shadow Fall",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Resist Damage"],
+            description: "Envelops you and your nearby teammates in a shroud of darkness. Shadow Fall does not grant Invisibility, but it does make you harder to detect. Even if you are discovered, Shadow Fall grants a bonus to Defense bonus to all attacks and Resistance to Fear, while reducing Energy, Negative Energy, and Psionic Damage.",
+            shortHelp: "Toggle: PBAoE, Team Stealth, +DEF(All), +Res(Energy, Negative, Psionics, Fear)",
+            icon: "darkmiasma_shadowfall.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 15.0,
+                endurance: 0.325,
+                cast: 2.03,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Fearsome Stare",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Fear", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Fear", "To Hit Debuff"],
+            description: "Instills tremendous Fear within a cone area in front of you, causing all affected targets to tremble in Terror uncontrollably, attacking only when attacked and even then with a reduced chance to hit.",
+            shortHelp: "Ranged (Cone), Foe Fear, -To Hit",
+            icon: "darkmiasma_fearsomeaura.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 40.0,
+                endurance: 10.66,
+                cast: 2.03,
+                tohitDebuff: 1.5,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Petrifying Gaze",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Holds"],
+            description: "Petrifies a single targeted foe with a terrifying gaze. The victim is Held and defenseless.",
+            shortHelp: "Ranged Hold",
+            icon: "darkmiasma_petrifyinggaze.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 16.0,
+                endurance: 9.75,
+                cast: 1.67
+            }
+        },
+        {
+            name: "Black Hole",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: [],
+            description: "Opens up a Black Hole to the Netherworld that temporarily pulls in all foes within its grasp. Victims that are immune to the pull become phase shifted and are completely intangible. They are hard to see, and cannot affect or be affected by those in normal space.",
+            shortHelp: "Ranged (Targeted AoE), Foe Intangible",
+            icon: "darkmiasma_blackhole.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 120.0,
+                endurance: 16.25,
+                cast: 1.03
+            }
+        },
+        {
+            name: "Dark Servant",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Accurate To-Hit Debuff", "Healing", "Holds", "Immobilize", "To Hit Debuff"],
+            description: "Summons a Dark Servant to your aid. The Dark Servant possesses an assortment of dark powers to weaken your foes. The summoned entity is not a willing servant, and it is only your power that binds it in this realm. The Dark Servant can be buffed and healed.",
+            shortHelp: "Summon Dark Servant: Ranged Debuff Special",
+            icon: "darkmiasma_darkservant.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 500.0,
+                endurance: 32.5,
+                cast: 3.17,
+                buffDuration: 240.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['mastermind/dark-miasma'] = MASTERMIND_DARK_MIASMA_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.MASTERMIND_DARK_MIASMA_POWERSET = MASTERMIND_DARK_MIASMA_POWERSET;
+}
+
+// ---- js/data/powersets/mastermind/demon-summoning.js ----
+;/**
+ * Demon Summoning
+ * Character Level: 50
+ * Archetype: mastermind
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const MASTERMIND_DEMON_SUMMONING_POWERSET = {
+    name: "Demon Summoning",
+    category: "Unknown",
+    description: "Demon Summoning powerset",
+    icon: "demon-summoning_set.png",
+    powers: [
+        {
+            name: "Corruption",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Universal Damage Sets"],
+            description: "You lash out with your whip, firing a bolt of hellfire and corrupting your victim's very living essence. This attack deals minor fire damage, causes minor toxic damage over time, and reduces their damage resistance for a short time.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, Light DMG(Fire), Foe Minor DoT (Toxic), -Res",
+            icon: "demonsummoning_corruption.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 6.5,
+                cast: 1.23,
+                damage: {
+                    type: "Fire",
+                    scale: 2.181
+                },
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.15,
+                    ticks: 3
+                },
+                buffDuration: 3.1
+            }
+        },
+        {
+            name: "Summon Demonlings",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Damage", "Accuracy"],
+            allowedSetCategories: ["Mastermind Archetype Sets", "Pet Damage", "Recharge Intensive Pets", "Slow Movement", "Universal Damage Sets"],
+            description: "Call forth up to three demonlings (depending on your level) to do your bidding. The first demonling is adept at manipulating fire, the second blasts your foes with cold attacks and the third is able to wield hellfire to deal fire/toxic damage.<br><br>You may only have three demonlings under your command at any given time. If you attempt to summon more demonlings, you can only replace those that have been lost in battle. If you already have your maximum allowed amount, the power will fail.<br><br><color #fcfc95>Notes: Summon Demonlings is unaffected by Recharge Time changes.</color><br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Summon Demonlings",
+            icon: "demonsummoning_summondemonlings.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 5.0,
+                endurance: 5.46,
+                cast: 2.0
+            }
+        },
+        {
+            name: "Lash",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee Damage", "Universal Damage Sets"],
+            description: "You channel unholy energies into your whip and Lash out at your foe dealing high fire damage causing toxic damage over time. Lash has longer range than most melee attacks will reduce the target's damage resistance and also has a chance to knockdown your target.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Close, Moderate DMG(Fire), Foe -Res, Knockdown, Minor DoT(Toxic)",
+            icon: "demonsummoning_lash.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 20.0,
+                recharge: 8.0,
+                endurance: 10.66,
+                cast: 1.8,
+                damage: {
+                    type: "Fire",
+                    scale: 3.044
+                },
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.21,
+                    ticks: 3
+                },
+                buffDuration: 3.1
+            }
+        },
+        {
+            name: "Enchant Demon",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: [],
+            description: "Enchant Demon will permanently bestow new powers and abilities to all of your Demon Henchman. The powers gained are unique and dependent upon the type of Demon Henchman that is Enchanted.<br><br>Enchant Demon only works on your Demon Henchmen and you can only Enchant your Demon Henchmen once with this power.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, Enchant Demon Henchman",
+            icon: "demonsummoning_enchantdemon.png",
+            powerType: "Click",
+            targetType: "Own Pet (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 6.0,
+                endurance: 11.375,
+                cast: 2.17
+            }
+        },
+        {
+            name: "Crack Whip",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You channel hellfire into your whip and make an impressive sweep causing high fire damage to enemies within a wide cone and also cause some toxic damage over time. Whip Crack has a larger range than most melee cones. Targets that are struck will also have their resistance to damage reduced for a short time, may suffer toxic damage over time and may be knocked down.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Short Ranged (Cone), Moderate DMG(Fire), Foe -Res, Knockdown, DoT(Toxic)",
+            icon: "demonsummoning_crackwhip.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.0,
+                range: 30.0,
+                recharge: 15.0,
+                endurance: 17.94,
+                cast: 2.33,
+                damage: {
+                    type: "Fire",
+                    scale: 2.537
+                },
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.222,
+                    ticks: 2
+                },
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Summon Demons",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Damage", "Accuracy"],
+            allowedSetCategories: ["Healing", "Knockback", "Mastermind Archetype Sets", "Pet Damage", "Recharge Intensive Pets", "Resist Damage", "Universal Damage Sets"],
+            description: "Summons forth one to two Demons (depending on your level) to do your bidding. One is cloaked in hellfire and has skin as hard as stone while the other manipulates flame.<br><br>You may only have 2 Demons under your control at any given time. If you attempt to call more Demons, you can only replace the ones you have lost in battle. If you already have your maximum allowed number, the power will fail.<br><br><color #fcfc95>Notes: Summon Demons is unaffected by Recharge Time changes.</color><br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Summon Demons",
+            icon: "demonsummoning_summondemons.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 10.0,
+                endurance: 9.62,
+                cast: 2.0
+            }
+        },
+        {
+            name: "Hell on Earth",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Mastermind Archetype Sets", "Pet Damage", "Recharge Intensive Pets", "Universal Damage Sets"],
+            description: "A dark blessing is placed upon a selected Demon henchman which will increase its damage and chance to hit for 90 seconds. While this is in effect living hellfire may spawn every 15 seconds at the affected Demon henchman's location. The creatures summoned will have a very weak tie to the material plane and will return to Abyss after a short time.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Ranged, Pet +Dmg, +To Hit, Summon Living Hellfire",
+            icon: "demonsummoning_hellonearth.png",
+            powerType: "Click",
+            targetType: "Own Pet (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 600.0,
+                endurance: 16.25,
+                cast: 2.03,
+                tohitBuff: 1.0,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Summon Demon Prince",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "Slow", "EnduranceReduction", "Sleep", "Damage", "Accuracy"],
+            allowedSetCategories: ["Holds", "Mastermind Archetype Sets", "Pet Damage", "Recharge Intensive Pets", "Sleep", "Slow Movement", "Universal Damage Sets"],
+            description: "Summons forth a foul Demon Prince from the deepest reaches of the Abyss. The Demon Prince is mighty among its kind and is a master of cold powers. It serves the conjuror only so that it may wreak havoc upon the material plane. The Demon has some defense versus lethal, smashing, fire and cold attacks.<br><br>You may only have 1 Demon Prince under your control at any given time. If you attempt to summon another Demon Prince the power will fail.<br><br><color #fcfc95>Notes: Summon Demon Prince is unaffected by Recharge Time changes.</color><br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Summon Demon Prince",
+            icon: "demonsummoning_summondemonprince.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 15.0,
+                endurance: 13.18,
+                cast: 2.0
+            }
+        },
+        {
+            name: "Abyssal Empowerment",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: [],
+            description: "Abyssal Empowerment will permanently unseal the most powerful powers in your Demon Henchmen's infernal repertoire. The Empowered Demons will gain new abilities and powers. The powers gained are unique and dependent upon the type of Demon Henchman that is Empowered.<br><br>Abyssal Empowerment only works on your Demon Henchmen and you can only Empower your Demon Henchmen once with this power.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged, Empower Demon Henchman",
+            icon: "demonsummoning_abyssalempowerment.png",
+            powerType: "Click",
+            targetType: "Own Pet (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 30.0,
+                recharge: 10.0,
+                endurance: 11.375,
+                cast: 2.07
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['mastermind/demon-summoning'] = MASTERMIND_DEMON_SUMMONING_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.MASTERMIND_DEMON_SUMMONING_POWERSET = MASTERMIND_DEMON_SUMMONING_POWERSET;
+}
+
+// ---- js/data/powersets/mastermind/empathy.js ----
+;/**
+ * Empathy
+ * Character Level: 50
+ * Archetype: mastermind
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const MASTERMIND_EMPATHY_POWERSET = {
+    name: "Empathy",
+    category: "Unknown",
+    description: "Empathy powerset",
+    icon: "empathy_set.png",
+    powers: [
+        {
+            name: "Heal Other",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Heals a single targeted ally. You cannot use this power to heal yourself.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ally Heal",
+            icon: "empathy_healother.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 16.25,
+                cast: 2.27
+            }
+        },
+        {
+            name: "Healing Aura",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Healing Aura restores some Hit Points to you and all nearby heroes. Healing Aura is not as potent as Heal Other, but can heal multiple targets at once.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "PBAoE, Team +Heal",
+            icon: "empathy_healingaura.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 8.0,
+                endurance: 16.25,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Absorb Pain",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Dramatically heals an ally's wounds. This power has only a tiny Endurance cost, but it requires you to sacrifice some of your Hit Points. Absorbing someone's pain can be quite dramatic, and afterwards you will be briefly unable to heal your own wounds by any means.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ally Strong Heal, Self Moderate DMG(Special)",
+            icon: "empathy_absorbpain.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 0.65,
+                cast: 2.27,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Resurrect",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: [],
+            description: "Resurrects a fallen ally with full Hit Points and Endurance. The Resurrected target is left protected from XP Debt for 90 seconds.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ally Rez",
+            icon: "empathy_resurrect.png",
+            powerType: "Click",
+            targetType: "Player Ally (Dead)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 15.0,
+                recharge: 180.0,
+                endurance: 32.5,
+                cast: 3.2,
+                buffDuration: 0.5
+            }
+        },
+        {
+            name: "Clear Mind",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: [],
+            description: "Frees an ally from any Disorient, Hold, Sleep, Fear, Confuse and Immobilize effects and leaves them resistant to such effects for a good while. Also, grants target clearer Perception to see hidden foes. Protection will improve with Multiple applications and as you advance in level.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ally +Res(Disorient, Hold, Sleep, Immobilize, Fear, Confuse), +Perception",
+            icon: "empathy_mindwall.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 4.0,
+                endurance: 6.5,
+                cast: 1.0,
+                stun: 1.0,
+                stunDuration: 90.0,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Fortitude",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "To Hit Buff"],
+            description: "Fortitude immensely enhances a single ally's chance to hit, Damage, and Defense to all attacks.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ally +DEF(All), +DMG, +To Hit",
+            icon: "empathy_fortitude.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 60.0,
+                endurance: 13.0,
+                cast: 2.27,
+                tohitBuff: 1.5,
+                buffDuration: 120.0
+            }
+        },
+        {
+            name: "Recovery Aura",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "The Recovery Aura dramatically increases the Endurance recovery rate of all nearby heroes for a limited time. Emitting this Aura costs you a lot of Endurance, and it takes a long time to recharge.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "PBAoE, Ally +Recovery",
+            icon: "empathy_recoveryaura.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 500.0,
+                endurance: 32.5,
+                cast: 2.03,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Regeneration Aura",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "The Regeneration Aura dramatically increases the healing rate of all nearby heroes for a limited time. Emitting this Aura costs you a lot of Endurance, and it takes a long time to recharge.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "PBAoE, Ally +Regeneration",
+            icon: "empathy_regenerationaura.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 500.0,
+                endurance: 32.5,
+                cast: 2.03,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Adrenalin Boost",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "Dramatically increases an ally's Endurance Recovery, Hit Point Regeneration and attack rate for 90 seconds. Also grants the target high resistance to slow effects.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Ranged, Ally +End, +Regeneration, +Recharge, Res (Slow)",
+            icon: "empathy_adrenalinboost.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 300.0,
+                endurance: 13.0,
+                cast: 2.27,
+                buffDuration: 90.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['mastermind/empathy'] = MASTERMIND_EMPATHY_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.MASTERMIND_EMPATHY_POWERSET = MASTERMIND_EMPATHY_POWERSET;
+}
+
+// ---- js/data/powersets/mastermind/force-field.js ----
+;/**
+ * Force Field
+ * Character Level: 50
+ * Archetype: mastermind
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const MASTERMIND_FORCE_FIELD_POWERSET = {
+    name: "Force Field",
+    category: "Unknown",
+    description: "Force Field powerset",
+    icon: "force-field_set.png",
+    powers: [
+        {
+            name: "Deflection Shield",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Dramatically protects an ally from Smashing, Lethal and all Melee attacks for a limited time. Also reduces Toxic damage. You cannot stack multiple Deflection Shields on the same target; however, the shield can be improved by another ally using the same power. Can also be used in conjunction with your Insulation Shield. You cannot use this power on yourself.",
+            shortHelp: "Ranged, Ally +DEF(Smash, Lethal, Melee), Res(Toxic)",
+            icon: "forcefield_deflectionshield.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 2.0,
+                endurance: 9.75,
+                cast: 2.07,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 4.0,
+                    ticks: 120
+                },
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Repulsion Bolt",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "Discharges a bolt of force that knocks down foes and deals some Smashing Damage. Foes struck will have their armor shattered by the force of the impact, leaving them with lowered damage resistance.",
+            shortHelp: "Ranged, DMG(Smash), Foe Knockback",
+            icon: "forcefield_forcebolt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 12.74,
+                cast: 1.1,
+                damage: {
+                    type: "Smashing",
+                    scale: 0.2
+                },
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Insulation Shield",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Dramatically protects an ally from Fire, Cold, Energy, Negative Energy, Ranged and AoE attacks for a limited time. The Insulation also protects the target from Endurance Draining effects. You cannot stack multiple Insulation Shields on the same target; however, the shield can be improved by another ally using the same power. Can also be used in conjunction with your Deflection Shield. In PvP, this power also grants a small amount of Mez Protection to its primary target. You cannot use this power on yourself.",
+            shortHelp: "Ranged, Ally +DEF(Fire, Cold, Energy, Negative, Ranged, AoE), Res (End Drain)",
+            icon: "forcefield_insulationshield.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 2.0,
+                endurance: 9.75,
+                cast: 2.07,
+                buffDuration: 240.0,
+                stun: 1.0,
+                stunDuration: 90.0
+            }
+        },
+        {
+            name: "Detention Field",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: [],
+            description: "Encases a targeted foe in a Detention Force Field. The captured target cannot be harmed, is Immobilized, and cannot attack or aid their allies. The target can, however, use powers on themselves.",
+            shortHelp: "Ranged, Foe Capture (Special)",
+            icon: "forcefield_refractionshield.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 60.0,
+                endurance: 13.0,
+                cast: 2.07,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Personal Force Field",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "The Personal Force Field is almost impenetrable to all attacks, even Psionics and Enemy Teleportation, although attacks from more powerful foes may get through more easily. Personal Force Field will also reduce the damage of almost any attacks that do get through. The Personal Force Field works both ways; while it is active, you can only use powers that affect yourself. Cannot be used with Rest.",
+            shortHelp: "Toggle: Self +Def, Res(All except Toxic)",
+            icon: "forcefield_personalforcefield.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 120.0,
+                endurance: 0.1625,
+                cast: 2.03,
+                resistance: {
+                    smashing: 0.4,
+                    lethal: 0.4,
+                    fire: 0.4,
+                    cold: 0.4,
+                    energy: 0.4,
+                    negative: 0.4,
+                    psionic: 0.4,
+                    toxic: 0.4
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Dispersion Bubble",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Creates a large bubble which protects all allies inside. While active, the Dispersion Bubble gives all allies within increased Defense against all attack types. The Dispersion Bubble also protects allies from Immobilization, Disorient, and Hold effects.<br><br>Allies will retain bonuses from the bubble for some after leaving the bubble's area.",
+            shortHelp: "Toggle: PBAoE, Team +Res(Hold, Immobilize, Disorient) +DEF(All)",
+            icon: "forcefield_dispersionbubble.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 15.0,
+                endurance: 1.3,
+                cast: 1.07,
+                buffDuration: 15.0,
+                stun: 1.0,
+                stunDuration: 15.0
+            }
+        },
+        {
+            name: "Repulsion Field",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Knockback"],
+            description: "This Toggle power creates a field that keeps all foes at bay, protecting all allies inside from melee or short ranged attacks. More powerful foes may be able to penetrate the Repulsion Field, but may slip and get knocked down and forced back if they try.<br><br>Enemies that get too close will be violently knocked away. In PvP, Each villain that is knocked away costs you additional Endurance.<br><br><color #fcfc95>Note: Slotting Knockback to Knockdown enhancement in this power will disable Repel.</color>",
+            shortHelp: "Toggle: PBAoE Knockback",
+            icon: "forcefield_repulsionfield.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 0.2031,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Force Bomb",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "A powerful Force Bomb is hurled at your foes dealing a moderate amount of damage and knocking them off of their feet. Foes struck by Repulsion Bomb have a chance to become disoriented, and the force of the blow will leave their armor shattered, lowering their damage resistance.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Smash), Foe Knockdown, Disorient",
+            icon: "forcefield_repulsionbomb.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.2,
+                range: 70.0,
+                recharge: 30.0,
+                endurance: 21.125,
+                cast: 1.67,
+                damage: {
+                    type: "Smashing",
+                    scale: 0.6
+                },
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Damping Bubble",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Creates a large bubble at your location which protects all allies inside. While active, this power will grant resistance to Accuracy, Defense, Regeneration, Perception, and Slow debuffs on yourself and allies. Foes within this bubble will have the strength of their Accuracy, Defense, Regeneration, Perception, and Speed debuff powers weakened directly.",
+            shortHelp: "Location (PBAoE), Team +Res(Accuracy, Defense, Perception, Recharge, Regen, Speed, ToHit), Foe -Str(Defense, Perception, Regen, Speed, ToHit)",
+            icon: "forcefield_dampeningbubble.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 6.5,
+                cast: 1.07,
+                buffDuration: 45.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['mastermind/force-field'] = MASTERMIND_FORCE_FIELD_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.MASTERMIND_FORCE_FIELD_POWERSET = MASTERMIND_FORCE_FIELD_POWERSET;
+}
+
+// ---- js/data/powersets/mastermind/kinetics.js ----
+;/**
+ * Kinetics
+ * Character Level: 50
+ * Archetype: mastermind
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const MASTERMIND_KINETICS_POWERSET = {
+    name: "Kinetics",
+    category: "Unknown",
+    description: "Kinetics powerset",
+    icon: "kinetics_set.png",
+    powers: [
+        {
+            name: "Siphon Power",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: [],
+            description: "You can Siphon the Power from a targeted foe, reducing his damage potential. The power is transferred back to you, increasing your own damage potential and that of all nearby allies.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Foe -DMG, Team +DMG",
+            icon: "kineticboost_siphonpower.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 20.0,
+                endurance: 13.0,
+                cast: 1.93,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Transfusion",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Endurance Modification", "Healing"],
+            description: "Transfusion drains an enemy of some Endurance and reduces the target's Regeneration rate, and transfers that energy, in the form of Hit Points, to all allies near the affected foe. You can use Transfusion to heal yourself as well as your allies.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged, Foe -End, -Regen, Team Heal",
+            icon: "kineticboost_transfusion.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 60.0,
+                recharge: 8.0,
+                endurance: 9.75,
+                cast: 1.17,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Repel",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Knockback"],
+            description: "Repel creates a zone of kinetic energy that violently repels nearby foes. Each foe that is repelled costs additional Endurance.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Toggle: Self AoE Knockback",
+            icon: "kineticboost_repel.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 0.4063,
+                cast: 1.07,
+                buffDuration: 0.5
+            }
+        },
+        {
+            name: "Siphon Speed",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "You can Siphon the speed from a targeted foe, Slowing his movement and attack rate while boosting your own.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Foe -Speed, -Rech, Self +Speed, +Rech",
+            icon: "kineticboost_siphonspeed.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 60.0,
+                endurance: 9.75,
+                cast: 1.93,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Increase Density",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "Increases an ally's mass, freeing him from any Disorient, Immobilization, or Hold effects and leaving him resistant to such effects for a while. Increase Density also protects the target from Knockback, Repel and enemy Teleportation, as well as Smashing and Energy damage. Because the target grows more dense, their movement speed is Slowed. Although the Damage Resistance and slowing effect will not stack with multiple applications, the rest of the effects of Increase Density will. You cannot use this power on yourself.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Ranged, Ally Special",
+            icon: "kineticboost_increasedensity.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 3.0,
+                endurance: 6.5,
+                cast: 2.07,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.5,
+                            ticks: 30
+                        },
+                        {
+                            type: "Energy",
+                            scale: 2.5,
+                            ticks: 30
+                        }
+                    ]
+                },
+                buffDuration: 60.0,
+                stun: 1.0,
+                stunDuration: 60.0
+            }
+        },
+        {
+            name: "Speed Boost",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Running", "Running & Sprints", "Universal Travel"],
+            description: "You can hasten a targeted ally and its nearby allies. The allies' movement speed, attack rate, and Endurance recovery are all greatly increased and they gain resistance to Slow effects. You cannot use this power on yourself.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Ranged, Allies +SPD, +Recharge, +Recovery, Res Slow",
+            icon: "kineticboost_speedboost.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 2.0,
+                endurance: 9.75,
+                cast: 1.0,
+                buffDuration: 120.0
+            }
+        },
+        {
+            name: "Inertial Reduction",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Leaping", "Leaping & Sprints", "Universal Travel"],
+            description: "You can reduce your Inertia, along with that of all nearby allies. The affected allies can then jump incredible distances for a while.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE, Allies +Jump",
+            icon: "kineticboost_initialreductions.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 60.0,
+                endurance: 29.25,
+                cast: 2.03,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Transference",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "Transference drains an enemy of some of their Endurance and transfers that Endurance to all allies near the affected foe. You can use Transference to recover Endurance for yourself as well as your allies.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Targeted AoE), Target -End, Team +Recovery, Special",
+            icon: "kineticboost_transferance.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.1,
+                range: 60.0,
+                recharge: 30.0,
+                endurance: 3.25,
+                cast: 2.27
+            }
+        },
+        {
+            name: "Fulcrum Shift",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: [],
+            description: "Fulcrum Shift drains the power of a targeted foe and all foes nearby, transferring it to all adjacent allies, you, and those near you. Affected foes will deal less damage, while your affected allies will deal more. The more foes that are affected, the more power you and your allies receive. Fulcrum Shift can dramatically turn the tide of a battle.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Foe AoE), Foe -DMG, Team +DMG",
+            icon: "kineticboost_kinetictransfer.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 60.0,
+                endurance: 19.5,
+                cast: 2.17
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['mastermind/kinetics'] = MASTERMIND_KINETICS_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.MASTERMIND_KINETICS_POWERSET = MASTERMIND_KINETICS_POWERSET;
+}
+
+// ---- js/data/powersets/mastermind/marine-affinity.js ----
+;/**
+ * Marine Affinity
+ * Character Level: 50
+ * Archetype: mastermind
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const MASTERMIND_MARINE_AFFINITY_POWERSET = {
+    name: "Marine Affinity",
+    category: "Unknown",
+    description: "Marine Affinity powerset",
+    icon: "marine-affinity_set.png",
+    powers: [
+        {
+            name: "Shoal Rush",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Slow Movement"],
+            description: "By sensing the water in an area, you can direct a shoal of marine life to harass your foes. This lowers the defense and movement speed of all enemies struck.<br><br>If you direct a Shoal Rush on targets inside a <color #fcfc95>Tide Pool</color>, the marine life present will be thrown into a brief frenzy! While frenzied, the Tide Pool has a chance to knock over enemies and the damage buff and debuff is stronger.",
+            shortHelp: "Ranged (Targeted AoE), Foe -DEF, -SPD, Special",
+            icon: "marineaffinity_shoalrush.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 13.0,
+                cast: 2.17,
+                defenseDebuff: 1.6,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Soothing Wave",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Send forth a calming wave of water, washing over friend and foe alike. Allies will be healed by this power, while enemies will have their offensive power watered down.",
+            shortHelp: "Ranged (Facing Cone), Foe -DMG, Team Heal",
+            icon: "marineaffinity_soothingwave.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "Cone",
+            maxTargets: 255,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.0,
+                range: 45.0,
+                recharge: 10.0,
+                endurance: 16.9,
+                cast: 2.0
+            }
+        },
+        {
+            name: "Toroidal Bubble",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Leaping", "Leaping & Sprints", "Resist Damage", "Universal Travel"],
+            description: "You create a ring of Bubbles that surrounds your allies, hydrating them to replenish endurance and reducing the effects of endurance drain. The bubble also reduces all incoming damage, providing extra resistance to Smashing and Fire damage, and also increases jump height thanks to added buoyancy.",
+            shortHelp: "PBAoE, Team +Res(All DMG, End Drain), +End, +Recovery, +Jump",
+            icon: "marineaffinity_toroidalbubble.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 60.0,
+                endurance: 10.0,
+                cast: 1.77,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.5,
+                            ticks: 30
+                        },
+                        {
+                            type: "Fire",
+                            scale: 2.5,
+                            ticks: 30
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 1.25,
+                            ticks: 30
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.25,
+                            ticks: 30
+                        },
+                        {
+                            type: "Energy",
+                            scale: 1.25,
+                            ticks: 30
+                        },
+                        {
+                            type: "Negative",
+                            scale: 1.25,
+                            ticks: 30
+                        },
+                        {
+                            type: "Psionic",
+                            scale: 1.25,
+                            ticks: 30
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 1.25,
+                            ticks: 30
+                        }
+                    ]
+                },
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Whitecap",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You summon a burst of water underfoot that hurls from your present location to a location of your choosing. When you splash down, any enemies in the surrounding area will be swept off their feet, and will experience a damage resistance debuff for a period of time. Enemies close to where you splash down will receive harsher debuffs for a brief time.<br><br>If you direct a Whitecap on targets inside a <color #fcfc95>Tide Pool</color>, the marine life present will be thrown into a brief frenzy! While frenzied, the Tide Pool has a chance to knock over enemies and the damage buff and debuff is stronger.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Cold), Foe Knockdown, -Resist(All), Self Teleport, Special",
+            icon: "marineaffinity_whitecap.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 30.0,
+                endurance: 22.5,
+                cast: 2.0
+            }
+        },
+        {
+            name: "Tide Pool",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "You summon a large pool of water at a targeted location to swell the damage that your allies deal, while reducing the damage, movement speeds, and stealth of enemies within the Tide Pool. <br><br>If an enemy is <color #fcfc95>defeated</color> in the pool, the marine life present will be thrown into a brief frenzy! While frenzied, the Tide Pool has a chance to knock over enemies and the damage buff and debuff is stronger.",
+            shortHelp: "Ranged (Location AoE), Team +DMG, Foe -DMG, -SPD, -Jump, -Stealth, Special",
+            icon: "marineaffinity_tidepool.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 10.0,
+                endurance: 16.25,
+                cast: 2.33,
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Brine",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing"],
+            description: "You coat an enemy in an extremely salinated layer of deep-sea brine that reduces your foe's resistance to damage and maximum hitpoints.<br><br>If <color #fcfc95>Shifting Tides</color> is active, Brine will consume up to <color #fcfc95>3</color> stacks upon use to reduce its base recharge by 15 seconds per stack.",
+            shortHelp: "Ranged, Foe -Resist(All), -MaxHP",
+            icon: "marineaffinity_brine.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 60.0,
+                endurance: 8.75,
+                cast: 2.07,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Shifting Tides",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage"],
+            allowedSetCategories: ["Ranged AoE Damage", "To Hit Buff", "Universal Damage Sets"],
+            description: "Select either a friend or foe to create a field of shifting tides around them.<br><br>When attacked, foes within the shifting tides will provide you and your allies a stacking Rising Tide buff that increases ToHit, Damage, and Recharge. Enemies may also take bonus damage, with the odds increasing per stack.",
+            shortHelp: "Toggle: Ranged (Targeted AoE), Team +DMG, +ToHit, +Recharge, Special Damage",
+            icon: "marineaffinity_shiftingtides.png",
+            powerType: "Toggle",
+            targetType: "Any",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 0.0975,
+                cast: 1.17,
+                damage: {
+                    type: "Cold",
+                    scale: 0.5
+                },
+                buffDuration: 2.0
+            }
+        },
+        {
+            name: "Barrier Reef",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Healing"],
+            description: "Create a Barrier Reef teeming with life at your target location. The Barrier Reef will emit an aura that washes over allies in range, providing them with a defensive cover of water that will absorb and deflect some damage.",
+            shortHelp: "Summon Barrier Reef: Team +Absorb, +DEF(All)",
+            icon: "marineaffinity_wellspring.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 30.0,
+                endurance: 16.9,
+                cast: 2.37,
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Power of the Depths",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "Becoming a conduit of the ocean itself, you acclimate your allies to the incredible forces of the deep! This boosts the maximum hit points, maximum endurance, regeneration, and attack range of all nearby allies. Some of these effects will decay over time to a lower value.<br><br>If Power of the Depths is activated inside a <color #fcfc95>Tide Pool</color>, the marine life present will be thrown into a brief frenzy! While frenzied, the Tide Pool has a chance to knock over enemies and the damage buff and debuff is stronger.",
+            shortHelp: "PBAoE, Team +MaxHP, +MaxEnd, +Regen, +Range",
+            icon: "marineaffinity_powerofthedepths.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 240.0,
+                endurance: 32.5,
+                cast: 3.0,
+                buffDuration: 60.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['mastermind/marine-affinity'] = MASTERMIND_MARINE_AFFINITY_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.MASTERMIND_MARINE_AFFINITY_POWERSET = MASTERMIND_MARINE_AFFINITY_POWERSET;
+}
+
+// ---- js/data/powersets/mastermind/mercenaries.js ----
+;/**
+ * Mercenaries
+ * Character Level: 50
+ * Archetype: mastermind
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const MASTERMIND_MERCENARIES_POWERSET = {
+    name: "Mercenaries",
+    category: "Unknown",
+    description: "Mercenaries powerset",
+    icon: "mercenaries_set.png",
+    powers: [
+        {
+            name: "Burst",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged Damage", "Universal Damage Sets"],
+            description: "Quickly fires a Burst of rounds at a single target at very long range. Damage is average, but the fire rate is fast. Can also reduce the target's defense.<br><br><color #fcfc95>Focus Fire:</color><br>The target struck by this attack will take 3.33% increased damage from any Mercenary Henchmen regardless of their owners for 30 seconds. This does effect does not stack from the same power or from multiple Masterminds.",
+            shortHelp: "Ranged, DoT (Lethal) Foe -DEF",
+            icon: "paramilitary_assaultrifleburst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 90.0,
+                recharge: 4.0,
+                endurance: 6.5,
+                cast: 1.0,
+                dotDamage: {
+                    type: "Lethal",
+                    scale: 0.585,
+                    ticks: 3
+                },
+                buffDuration: 0.91,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Soldiers",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Healing", "Knockback", "Mastermind Archetype Sets", "Pet Damage", "Recharge Intensive Pets", "Universal Damage Sets"],
+            description: "Calls forth one to three Mercenary Soldiers (depending on your level) to do your bidding. The third Soldier you gain will be a Medic. All Soldiers use Sub Machine Guns, but these can be upgraded.<br><br>You may only have 3 Soldiers under your control at any given time. If you attempt to call more Soldiers, you can only replace the ones you have lost in battle. If you already have three, the power will fail.<br><br><color #fcfc95>Notes: Soldiers is unaffected by Recharge Time changes.</color>",
+            shortHelp: "Summon Soldier",
+            icon: "paramilitary_draftarmy.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 5.0,
+                endurance: 5.46,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Slug",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "Fires a single Slug at a targeted foe. Firing a single Slug is slower than firing a Burst, but deals more damage, is longer range, and can knock down foes.<br><br><color #fcfc95>Focus Fire:</color><br>The target struck by this attack will take 3.33% increased damage from any Mercenary Henchmen regardless of their owners for 30 seconds. This does effect does not stack from the same power or from multiple Masterminds.",
+            shortHelp: "Ranged, DMG(Lethal), Foe Knockback",
+            icon: "paramilitary_assaultrifleslug.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 100.0,
+                recharge: 8.0,
+                endurance: 10.66,
+                cast: 1.67,
+                damage: {
+                    type: "Lethal",
+                    scale: 3.529
+                },
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Equip Mercenary",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "Equip your Mercenary Henchmen with more advanced munitions and weaponry. This power permanently bestows new weapons and abilities to all Mercenary Henchman. The powers gained are unique and dependent upon the type of Mercenary Henchman.<br><br>Your Mercenary Henchmen will also become more resistant to damage. This power only works on your Mercenary Henchmen and you can only Equip your Mercenary Henchmen once with this power.",
+            shortHelp: "Ranged, Equip Mercenary Henchman",
+            icon: "paramilitary_equipsoldier.png",
+            powerType: "Click",
+            targetType: "Own Pet (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 6.0,
+                endurance: 11.375,
+                cast: 1.3,
+                buffDuration: 3.5
+            }
+        },
+        {
+            name: "M30 Grenade",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "Launches a Grenade at long range from beneath the barrel of your Assault Rifle. This explosion affects all within the blast radius, and can knock them back.<br><br><color #fcfc95>Focus Fire:</color><br>The main target struck by this attack will take 3.33% increased damage from any Mercenary Henchmen regardless of their owners for 30 seconds. This does effect does not stack from the same power or from multiple Masterminds.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Lethal/Fire), Knockback",
+            icon: "paramilitary_assaultriflegrenade.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.05,
+                range: 80.0,
+                recharge: 16.0,
+                endurance: 18.98,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 1.0574
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 0.5207999999999999
+                        }
+                    ],
+                    scale: 1.5781999999999998
+                },
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Spec Ops",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Accurate To-Hit Debuff", "Defense Debuff", "Holds", "Immobilize", "Mastermind Archetype Sets", "Pet Damage", "Recharge Intensive Pets", "Stuns", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You can enlist one to two highly skilled Spec Ops Mercenary (depending on your level). Spec Ops weapons are highly accurate and long ranged, and they are adept in many different tactical weapons. Like all Henchmen, Spec Ops can be equipped with even deadlier munitions.<br><br>You may only have 2 Spec Ops under your control at any given time. If you attempt to summon more Spec Ops, you can only replace the ones you have lost in battle. If you already have two, the power will fail.<br><br><color #fcfc95>Notes: Spec Ops is unaffected by Recharge Time changes.</color>",
+            shortHelp: "Summon Spec Ops",
+            icon: "paramilitary_enlistspecialforces.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 10.0,
+                endurance: 9.62,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Serum",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Resist Damage", "To Hit Buff"],
+            description: "You can use a special Serum to turn your Mercenaries into a virtually Unstoppable killing machines for a short time. The Serum, will increase their Damage, chance to hit, Endurance Recovery, and Damage Resistance to all damage except Psionics. They will also be virtually immune to controlling effects including Disorient, Sleep, Hold, Immobilize and Knockback. The effects will start to slowly fade away over 60 seconds.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Buff Mercenaries +DMG, +RES(All except Psionic), +To Hit, +Recovery",
+            icon: "paramilitary_serum.png",
+            powerType: "Click",
+            targetType: "Own Pet (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 100.0,
+                recharge: 250.0,
+                endurance: 15.0,
+                cast: 1.3,
+                buffDuration: 60.0,
+                stun: 1.0,
+                stunDuration: 60.0,
+                tohitBuff: 1.0
+            }
+        },
+        {
+            name: "Commando",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Knockback", "Mastermind Archetype Sets", "Pet Damage", "Recharge Intensive Pets", "Universal Damage Sets"],
+            description: "Enlists one highly trained Commando. The Commando is a seasoned professional who favors heavy assault weapons. He is simply a one man army that can leave a wake of destruction in his path. In addition to standard Soldier resistance, the Commandos experience also makes him resistant to Fear and his rugged advanced training makes him slightly resistant to Fire, Cold and Toxic Damage.<br><br>You may only have 1 Commando under your control at any given time. If you attempt to summon another Commando, the power will fail.<br><br><color #fcfc95>Notes: Commando is unaffected by Recharge Time changes.</color>",
+            shortHelp: "Summon Commando",
+            icon: "paramilitary_supersoldier.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 15.0,
+                endurance: 13.18,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Tactical Upgrade",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Permanently Upgrade the most advanced tactical weapons and gear to all of your Mercenary Henchman. The Tactically Upgraded Mercenaries will gain powers, weapons and munitions. The powers gained are unique and dependent upon the type of Mercenary Henchman that is Upgraded.<br><br>Your Mercenary Henchmen will also become more evasive towards Ranged and AoE attacks. This power only works on your Mercenary Henchmen and you can only Upgrade your Mercenary Henchmen once with this power.",
+            shortHelp: "Ranged, Upgrade Mercenary Henchman",
+            icon: "paramilitary_tacticalupgrade.png",
+            powerType: "Click",
+            targetType: "Own Pet (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 10.0,
+                endurance: 11.375,
+                cast: 2.03,
+                buffDuration: 11.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['mastermind/mercenaries'] = MASTERMIND_MERCENARIES_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.MASTERMIND_MERCENARIES_POWERSET = MASTERMIND_MERCENARIES_POWERSET;
+}
+
+// ---- js/data/powersets/mastermind/nature-affinity.js ----
+;/**
+ * Nature Affinity
+ * Character Level: 50
+ * Archetype: mastermind
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const MASTERMIND_NATURE_AFFINITY_POWERSET = {
+    name: "Nature Affinity",
+    category: "Unknown",
+    description: "Nature Affinity powerset",
+    icon: "nature-affinity_set.png",
+    powers: [
+        {
+            name: "Corrosive Enzymes",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: [],
+            description: "You spray a target with toxic, corrosive Enzymes reducing the damage they deal as well as their damage resistance.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Foe -Res(All), -DMG(All)",
+            icon: "natureaffinity_corrosivesap.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 16.0,
+                endurance: 10.66,
+                cast: 1.0,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Regrowth",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "By channeling the energies present in nature you are able to immediately heal yourself and allies in front of you for a small amount of health and cause them to recover a small amount of health over time. Regrowth places a stack of Bloom on its target.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged Facing Cone, Minor Ally Heal, Ally Moderate Healing Over Time, +1 Bloom",
+            icon: "natureaffinity_regrowth.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "Cone",
+            maxTargets: 255,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.0,
+                range: 45.0,
+                recharge: 10.0,
+                endurance: 16.9,
+                cast: 2.0,
+                buffDuration: 4.1
+            }
+        },
+        {
+            name: "Wild Growth",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing", "Resist Damage"],
+            description: "You channel the power of nature into your allies allowing them to more easily shrug off damage and causing their wounds to heal more quickly. Wild Growth increases the damage resistance and boosts the regeneration rate of all affected allies. This power also grants 2 stacks of Bloom.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE, Team +Res(All), +Regen, +2 Bloom",
+            icon: "natureaffinity_wildgrowth.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 225.0,
+                endurance: 19.5,
+                cast: 2.17,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Spore Cloud",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["To Hit Debuff"],
+            description: "You create a large cloud of toxic spores around your targeted foe. The target and all nearby foes will have their damage output, chance to hit and regeneration rate reduced.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle (Targeted AoE), Foe -Dmg(All), -To Hit, -Regen",
+            icon: "natureaffinity_sporecloud.png",
+            powerType: "Toggle",
+            targetType: "Foe",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 8.0,
+                endurance: 0.325,
+                cast: 3.1,
+                tohitDebuff: 1.5,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Lifegiving Spores",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "When activating this power you cause all allies at a selected location to recover a small amount of health and endurance every few seconds as long as they remain within the Lifegiving Spores.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle (Location AoE), PBAoE +Minor Heal Over Time, +Endurance",
+            icon: "natureaffinity_lifegivingspores.png",
+            powerType: "Toggle",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 4.0,
+                endurance: 0.325,
+                cast: 2.33
+            }
+        },
+        {
+            name: "Wild Bastion",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You encase yourself and nearby allies in a protective barrier that will absorb a moderate amount of damage. Additionally, affected allies will heal for a portion of their health over time. Wild Bastion places 3 stacks of Bloom on all affected targets.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE, Team +Absorb, +Heal Over Time, +3 Bloom",
+            icon: "natureaffinity_wildbastion.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 240.0,
+                endurance: 16.25,
+                cast: 2.27,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Rebirth",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "Rebirth can either greatly heal a conscious ally for a large amount of health over time or it can revive a fallen ally with a large amount of health and endurance and cause them to recover health over time. This power also grants 3 stacks of Bloom.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged, Ally Rez, +Heal Over Time, Special, +3 Bloom",
+            icon: "natureaffinity_rebirth.png",
+            powerType: "Click",
+            targetType: "Leaguemate",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 45.0,
+                recharge: 180.0,
+                endurance: 32.5,
+                cast: 3.0
+            }
+        },
+        {
+            name: "Entangling Aura",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Holds"],
+            description: "While this power is active there is a high chance that entangling vines will grasp nearby foes and render them held for a short time.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Toggle, Foe Hold",
+            icon: "natureaffinity_ragingtempest.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 1.625,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Overgrowth",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Becoming a conduit of nature itself, you greatly boost the damage, to hit and endurance discount of nearby allies for a long period of time. Overgrowth also grants the affected targets 5 stacks of Bloom.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "PBAoE, Team +Damage, +To Hit, +Endurance Discount, +5 Bloom",
+            icon: "natureaffinity_overgrowth.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 255.0,
+                endurance: 32.5,
+                cast: 3.0,
+                tohitBuff: 1.0,
+                buffDuration: 60.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['mastermind/nature-affinity'] = MASTERMIND_NATURE_AFFINITY_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.MASTERMIND_NATURE_AFFINITY_POWERSET = MASTERMIND_NATURE_AFFINITY_POWERSET;
+}
+
+// ---- js/data/powersets/mastermind/necromancy.js ----
+;/**
+ * Necromancy
+ * Character Level: 50
+ * Archetype: mastermind
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const MASTERMIND_NECROMANCY_POWERSET = {
+    name: "Necromancy",
+    category: "Unknown",
+    description: "Necromancy powerset",
+    icon: "necromancy_set.png",
+    powers: [
+        {
+            name: "Dark Blast",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Ranged Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "A long range blast of dark energy. Deals moderate Negative Energy damage and reduces the target's chance to hit.<br><br><color #fcfc95>Spectral Forces:</color><br>Activating this power has a chance to summon a Specter to your side! Specters slowly fade away over 90 seconds, even faster when attacking. They cannot be healed, regenerate, upgraded, or commanded, but provide a good distraction. <br><br>Enhancements in this power will also enhance the stats of summoned Specters. You may only have 1 Specter active per Necromancy attack.",
+            shortHelp: "Ranged, DMG(Negative), Foe -To Hit",
+            icon: "necromancy_darkblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 6.5,
+                cast: 1.0,
+                damage: {
+                    type: "Negative",
+                    scale: 2.26
+                },
+                tohitDebuff: 0.75,
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Zombie Horde",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Mastermind Archetype Sets", "Pet Damage", "Recharge Intensive Pets", "To Hit Debuff", "Universal Damage Sets"],
+            description: "Summons one to three Zombies (depending on your level) to do your bidding. Zombies are very tough but can be slow and stupid. They start out with only rudimentary melee attacks, but can be empowered with range and even life draining powers.<br><br>You may only have 3 Zombies under your control at any given time. If you attempt to summon more Zombies, you can only replace the ones you have lost in battle. If you already have three, the power will fail.<br><br><color #fcfc95>Notes: Zombie Horde is unaffected by Recharge Time changes.</color>",
+            shortHelp: "Summon Zombies",
+            icon: "necromancy_callzombiehorde.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 5.0,
+                endurance: 5.46,
+                cast: 3.1
+            }
+        },
+        {
+            name: "Gloom",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Ranged Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "Gloom slowly drains a target of life, while reducing their chance to hit Slower than Dark Blast, but deals more damage over time.<br><br><color #fcfc95>Spectral Forces:</color><br>Activating this power has a chance to summon a Specter to your side! Specters slowly fade away over 90 seconds, even faster when attacking. They cannot be healed, regenerate, upgraded, or commanded, but provide a good distraction. <br><br>Enhancements in this power will also enhance the stats of summoned Specters. You may only have 1 Specter active per Necromancy attack.",
+            shortHelp: "Ranged, DoT (Negative), Foe -To Hit",
+            icon: "necromancy_gloom.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 10.66,
+                cast: 1.1,
+                dotDamage: {
+                    type: "Negative",
+                    scale: 0.4063,
+                    ticks: 7
+                },
+                buffDuration: 3.6,
+                tohitDebuff: 0.75
+            }
+        },
+        {
+            name: "Enchant Undead",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "Enchant Undead will permanently bestow new powers and abilities to all of your Undead Henchman. The powers gained are unique and dependent upon the type of Undead Henchman that is Enchanted, but all henchmen will gain Resistances to most forms of crowd control and a variety of damage types.<br><br>Enchant Undead only works on your Undead Henchmen and you can only Enchant your Undead Henchmen once with this power.",
+            shortHelp: "Ranged, Enchant Undead Henchman",
+            icon: "necromancy_enchantundead.png",
+            powerType: "Click",
+            targetType: "Own Pet (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 6.0,
+                endurance: 11.375,
+                cast: 2.07
+            }
+        },
+        {
+            name: "Life Drain",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Accurate To-Hit Debuff", "Healing", "Ranged Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You can tap the power of the Netherworld to steal some life from a target foe and reduce their chance to hit. Some of that stolen life is transferred to you in the form of Hit Points.<br><br><color #fcfc95>Spectral Forces:</color><br>Activating this power has a chance to summon a Specter to your side! Specters slowly fade away over 90 seconds, even faster when attacking. They cannot be healed, regenerate, upgraded, or commanded, but provide a good distraction. <br><br>Enhancements in this power will also enhance the stats of summoned Specters. You may only have 1 Specter active per Necromancy attack.",
+            shortHelp: "Ranged, DMG(Negative), Target -To Hit, Self +HP",
+            icon: "necromancy_lifedrain.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 8.0,
+                endurance: 10.66,
+                cast: 1.93,
+                damage: {
+                    type: "Negative",
+                    scale: 3.7110000000000003
+                },
+                healing: {
+                    scale: 80.3173,
+                    perTarget: true
+                },
+                tohitDebuff: 0.75,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Grave Knight",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Knockback", "Mastermind Archetype Sets", "Pet Damage", "Recharge Intensive Pets", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You can summon one to two powerful Grave Knights (depending on your level) to do your bidding. Grave Knights come well equipped with several attack powers and can be empowered with even more.<br><br>You may only have 2 Grave Knights under your control at any given time. If you attempt to summon more Grave Knights, you can only replace the ones you have lost in battle. If you already have two, the power will fail.<br><br><color #fcfc95>Notes: Grave Knight is unaffected by Recharge Time changes.</color>",
+            shortHelp: "Summon Grave Knight",
+            icon: "necromancy_summonskeletonwarrior.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 10.0,
+                endurance: 9.62,
+                cast: 1.07
+            }
+        },
+        {
+            name: "Soul Extraction",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Accurate To-Hit Debuff", "Healing", "Holds", "Mastermind Archetype Sets", "Pet Damage", "Recharge Intensive Pets", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You can extract the souls from your Undead Henchmen and summon their spectral essence to do your bidding. The power of each soul is dependent upon the type of undead Henchman you extract it from, however it will always be one level lower than you. Unlike your other Henchman, these extracted Souls are only loosely bound to your control and will quickly move on to the next world. <br><br>These Souls cannot gain new powers with Enchanted Undead or Dark Empowerment. If a Soul's original body is defeated then the Soul will also be defeated. If you activate Soul Extraction again while a Soul is active, it will simply be replaced.",
+            shortHelp: "Summon Ghost (Special)",
+            icon: "necromancy_soulextraction.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 150.0,
+                endurance: 15.0,
+                cast: 2.03,
+                buffDuration: 0.5
+            }
+        },
+        {
+            name: "Lich",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Fear", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Fear", "Holds", "Immobilize", "Knockback", "Mastermind Archetype Sets", "Pet Damage", "Recharge Intensive Pets", "To Hit Debuff", "Universal Damage Sets"],
+            description: "Summons a dark and powerful Lich. The lich is an undead entity that, when alive, possessed many dark powers of his own. Perhaps it was a dark wizard, or powerful arch villain. Perhaps it was even a Necromancer. Now it only hungers for the souls of the living, and is quite good at feeding itself. The Lich specializes in dark control and draining powers.<br><br>You may only have 1 Lich under your control at any given time. If you attempt to summon another Lich, the power will fail.<br><br><color #fcfc95>Notes: Lich is unaffected by Recharge Time changes.</color>",
+            shortHelp: "Summon Lich",
+            icon: "necromancy_summonlitch.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 15.0,
+                endurance: 13.18,
+                cast: 3.17
+            }
+        },
+        {
+            name: "Dark Empowerment",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Dark Empowerment will permanently bestow the most powerful and darkest new powers and abilities to all of your Undead Henchman. The Empowered Undead will gain new abilities and powers. The powers gained are unique and dependent upon the type of Undead Henchman that is Empowered, but all Henchmen will gain additional Hit Points, and the power to steal life force from enemies they attack!<br><br>Dark Empowerment only works on your Undead Henchmen and you can only Empower your Undead Henchmen once with this power.",
+            shortHelp: "Ranged, Empower Undead Henchman",
+            icon: "necromancy_darkempowerment.png",
+            powerType: "Click",
+            targetType: "Own Pet (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 10.0,
+                endurance: 11.375,
+                cast: 2.07
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['mastermind/necromancy'] = MASTERMIND_NECROMANCY_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.MASTERMIND_NECROMANCY_POWERSET = MASTERMIND_NECROMANCY_POWERSET;
+}
+
+// ---- js/data/powersets/mastermind/ninjas.js ----
+;/**
+ * Ninjas
+ * Character Level: 50
+ * Archetype: mastermind
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const MASTERMIND_NINJAS_POWERSET = {
+    name: "Ninjas",
+    category: "Unknown",
+    description: "Ninjas powerset",
+    icon: "ninjas_set.png",
+    powers: [
+        {
+            name: "Call Genin",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Mastermind Archetype Sets", "Pet Damage", "Recharge Intensive Pets", "Stuns", "Universal Damage Sets"],
+            description: "Calls forth one to three Genin Ninja (depending on your level) to do your bidding. Genin have good reflexes and jumping skill, but they are still the lowest rank Ninja and only possess the most rudimentary skills, However, they can be trained in more advanced techniques and weapons.<br><br>You may only have 3 Genin under your control at any given time. If you attempt to call Genin, you can only replace the ones you have lost in battle. If you already have three, the power will fail.<br><br><color #fcfc95>Notes: Call Genin is unaffected by Recharge Time changes.</color>",
+            shortHelp: "Summon Genin",
+            icon: "ninjas_callgenin.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 5.0,
+                endurance: 5.46,
+                cast: 1.7
+            }
+        },
+        {
+            name: "Snap Shot",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Universal Damage Sets"],
+            description: "A quick attack that fires an arrow at your foe after only minimal aiming. Fast, but little damage.<br><br><color #fcfc95>Sensei's Guidance:</color><br>Hitting with this power will grant your Ninja Henchman +3% Critical Hit chance for 30 seconds. This does not stack from the same power.",
+            shortHelp: "Ranged, DMG(Lethal)",
+            icon: "ninjas_quickshot.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.155,
+                range: 80.0,
+                recharge: 2.0,
+                endurance: 4.42,
+                cast: 1.0,
+                damage: {
+                    type: "Lethal",
+                    scale: 1.8599999999999999
+                }
+            }
+        },
+        {
+            name: "Aimed Shot",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Universal Damage Sets"],
+            description: "Though it takes longer to execute, your Aimed Shot deals greater damage than Snap Shot.<br><br><color #fcfc95>Sensei's Guidance:</color><br>Hitting with this power will grant your Ninja Henchman +3% Critical Hit chance for 30 seconds. This does not stack from the same power.",
+            shortHelp: "Ranged, DMG(Lethal)",
+            icon: "ninjas_standardshot.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.155,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 6.5,
+                cast: 1.0,
+                damage: {
+                    type: "Lethal",
+                    scale: 2.26
+                }
+            }
+        },
+        {
+            name: "Train Ninjas",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Train your Ninja Henchmen with more advanced techniques and weaponry. This power permanently bestows new powers and abilities to all of your Ninja Henchman. The powers gained are unique and dependent upon the type of Ninja Henchman. <br><br>Your Ninja Henchman will also become more evasive against all forms of positional attacks and gain 3% more Critical Hit chance. This power only works on your Ninja Henchmen and you can only Train your Ninja Henchmen once with this power.",
+            shortHelp: "Ranged, Train Ninja Henchman",
+            icon: "ninjas_trainninjas.png",
+            powerType: "Click",
+            targetType: "Own Pet (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 6.0,
+                endurance: 11.375,
+                cast: 2.37,
+                buffDuration: 5.0
+            }
+        },
+        {
+            name: "Fistful of Arrows",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You fire a fistful of arrows at foes in a cone in front of you. Good at close range.<br><br><color #fcfc95>Sensei's Guidance:</color><br>Hitting with this power will grant your Ninja Henchman +3% Critical Hit chance for 30 seconds. This does not stack from the same power.",
+            shortHelp: "Ranged (Cone), DMG(Lethal)",
+            icon: "ninjas_fistfullarrows.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.155,
+                range: 40.0,
+                recharge: 8.0,
+                endurance: 10.66,
+                cast: 1.17,
+                damage: {
+                    type: "Lethal",
+                    scale: 1.6225
+                }
+            }
+        },
+        {
+            name: "Call Jounin",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Sleep", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Accurate To-Hit Debuff", "Confuse", "Defense Debuff", "Knockback", "Mastermind Archetype Sets", "Pet Damage", "Recharge Intensive Pets", "Sleep", "Stuns", "Threat Duration", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You can summon one to two highly skilled Jounin Ninja (depending on your level). Jounin Ninja are master assassins and expert swordsmen. They possess superior reflexes and jumping skill. Like all Henchmen, Jounin can be trained in even deadlier Ninjitsu techniques and weapons.<br><br>You may only have 2 Jounin under your control at any given time. If you attempt to summon more Jounin, you can only replace the ones you have lost in battle. If you already have two, the power will fail.<br><br><color #fcfc95>Notes: Call Jounin is unaffected by Recharge Time changes.</color>",
+            shortHelp: "Summon Jounin",
+            icon: "ninjas_calljounin.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 10.0,
+                endurance: 9.62,
+                cast: 1.7
+            }
+        },
+        {
+            name: "Smoke Flash",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: [],
+            description: "You can command one of your Ninja Henchmen to throw down a Smoke Bomb. The Smoke Flash will allow the Ninja to Placate his nearby foes, and thus unable to target the Ninja. The Smoke Flash also makes all your Ninja stealthy and Hidden for 3 seconds, enabling them to perform Critical hits with their next few attacks. You can only use this power on a Ninja Henchmen.",
+            shortHelp: "Hide Ninja",
+            icon: "ninjas_kujikiri.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 1,
+            effects: {
+                accuracy: 1.0,
+                range: 100.0,
+                recharge: 90.0,
+                endurance: 15.0,
+                cast: 1.17,
+                buffDuration: 3.0
+            }
+        },
+        {
+            name: "Oni",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Damage", "Accuracy"],
+            allowedSetCategories: ["Holds", "Immobilize", "Knockback", "Mastermind Archetype Sets", "Pet Damage", "Recharge Intensive Pets", "Universal Damage Sets"],
+            description: "Summons an ancient and powerful Oni. An Oni is a powerful human-like demon warrior. The Oni is a formidable creature who possesses the skill of a warrior and the powers of wind and fire.<br><br>You may only have 1 Oni under your control at any given time. If you attempt to summon another Oni, the power will fail.<br><br><color #fcfc95>Notes: Oni is unaffected by Recharge Time changes.</color>",
+            shortHelp: "Summon Oni",
+            icon: "ninjas_calloni.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 15.0,
+                endurance: 13.18,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Kuji-In Zen",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Kuji-In Zen will permanently bestow the most advanced techniques and powers to all of your Ninja Henchman. The Enlightened Ninja will gain new abilities, powers, and weapons. The powers gained are unique and dependent upon the type of Ninja Henchman that is Enlightened. <br><br>Your Ninja Henchman also gain 3% more Critical Hit chance and the ability to heal themselves periodically with Kuji-In Sha. This power only works on your Ninja Henchmen and you can only Enlighten your Ninja Henchmen once with this power.",
+            shortHelp: "Ranged, Enlighten Ninja Henchman",
+            icon: "ninjas_upgradeequipment.png",
+            powerType: "Click",
+            targetType: "Own Pet (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 10.0,
+                endurance: 11.375,
+                cast: 2.37,
+                buffDuration: 7.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['mastermind/ninjas'] = MASTERMIND_NINJAS_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.MASTERMIND_NINJAS_POWERSET = MASTERMIND_NINJAS_POWERSET;
+}
+
+// ---- js/data/powersets/mastermind/pain-domination.js ----
+;/**
+ * Pain Domination
+ * Character Level: 50
+ * Archetype: mastermind
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const MASTERMIND_PAIN_DOMINATION_POWERSET = {
+    name: "Pain Domination",
+    category: "Unknown",
+    description: "Pain Domination powerset",
+    icon: "pain-domination_set.png",
+    powers: [
+        {
+            name: "Nullify Pain",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Nullify Pain will heal nearby allies for some hit points by numbing the pain caused by their wounds. Nullify Pain is not as potent as Soothe, but can heal multiple targets at once.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "PBAoE, Team +Heal",
+            icon: "paindomination_nullifypain.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 8.0,
+                endurance: 16.25,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Soothe",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You heal an ally by numbing their pain and calming their mind. You cannot use this power on yourself.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ally Heal",
+            icon: "paindomination_soothe.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 16.25,
+                cast: 2.27
+            }
+        },
+        {
+            name: "Share Pain",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Share Pain draws away some of an ally's anguish caused by their wounds, but damages the user. The pain caused by this power causes the user to go into a frenzy, briefly increasing their damage output, however the user cannot be healed and will have their regeneration rate greatly diminished for a short time.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ally Strong Heal, Self Moderate DMG(Special), +DMG",
+            icon: "paindomination_sharepain.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 0.65,
+                cast: 2.27,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Conduit of Pain",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "You revive a fallen ally by becoming a Conduit of Pain and transferring the pain that was inflicted upon them back upon your enemies. This will briefly empower you increasing your damage output, recovery rate, attack rate and chance to hit. After a minute the effect will wear off leaving you weakened for 30 seconds. Your damage, attack rate and chance to hit will all be reduced during this period.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ally Rez, Self +DMG, +Recharge, +Recovery, +To Hit, +Special",
+            icon: "paindomination_conduitofpain.png",
+            powerType: "Click",
+            targetType: "Player Ally (Dead)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 15.0,
+                recharge: 180.0,
+                endurance: 32.5,
+                cast: 3.2,
+                buffDuration: 0.5,
+                tohitBuff: 2.0,
+                tohitDebuff: 2.0
+            }
+        },
+        {
+            name: "Enforced Morale",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: [],
+            description: "Enforced Morale frees an ally from any Disorient, Hold, Sleep, Fear, Confuse and Immobilize effects and leaves them resistant to such effects for a good while. Also, Enforced Morale grants the target clearer Perception to see hidden foes, and a minor recharge and movement speed boost. The Protection and Movement boosts will improve with multiple applications and as you advance in level, although the Recharge and Movement boosts will only apply for the first few applications. If the ally is not damaged, Enforced Morale will cause them some pain before granting its benefits.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ally +Res(Disorient, Hold, Sleep, Immobilize, Fear, Confuse), +Perception, +Recharge, +Speed, Light DMG",
+            icon: "paindomination_enforcedmorale.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 4.0,
+                endurance: 6.5,
+                cast: 1.0,
+                stun: 1.0,
+                stunDuration: 90.0,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Suppress Pain",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "While this power is active all nearby allies will have their regeneration rate increased dramatically.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: PBAoE, Ally +Regeneration",
+            icon: "paindomination_soothingaura.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.975,
+                cast: 1.67,
+                buffDuration: 4.25
+            }
+        },
+        {
+            name: "World of Pain",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge"],
+            allowedSetCategories: ["Resist Damage", "To Hit Buff"],
+            description: "When this power is activated the user and all nearby team members will gain a moderate damage, resistance, and To Hit bonus. Additionally those affected by this power will also be protected from Placate effects.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE Team +To Hit, +DMG, +RES(All DMG, Placate)",
+            icon: "paindomination_worldofpain.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 240.0,
+                endurance: 12.74,
+                cast: 2.03,
+                tohitBuff: 1.0,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Anguishing Cry",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff"],
+            description: "You let out an Anguishing Cry causing a great deal of pain in your foes reducing their resistance and defense to damage for a short time.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE, Foe -RES(All), -DEF(All)",
+            icon: "paindomination_anguishingcry.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 120.0,
+                endurance: 16.25,
+                cast: 1.97,
+                defenseDebuff: 3.0,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Painbringer",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "You transform an ally to pain incarnate turning them into an inexhaustible killing machine. While the character is imbued with this power they will benefit from incredible health regeneration, endurance recovery and improved damage potential for a short time.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Ally, +Regeneration, +Recovery, +DMG",
+            icon: "paindomination_painbringer.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 300.0,
+                endurance: 13.0,
+                cast: 2.27,
+                buffDuration: 90.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['mastermind/pain-domination'] = MASTERMIND_PAIN_DOMINATION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.MASTERMIND_PAIN_DOMINATION_POWERSET = MASTERMIND_PAIN_DOMINATION_POWERSET;
+}
+
+// ---- js/data/powersets/mastermind/poison.js ----
+;/**
+ * Poison
+ * Character Level: 50
+ * Archetype: mastermind
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const MASTERMIND_POISON_POWERSET = {
+    name: "Poison",
+    category: "Unknown",
+    description: "Poison powerset",
+    icon: "poison_set.png",
+    powers: [
+        {
+            name: "Alkaloid",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "When used correctly, poisons can be used to heal, as well as harm. Alkaloid consists of just the right amount of amino acids to safely heal a single targeted ally. The healed target is also left with some resistance to Toxic Damage (This Toxic Damage Resistance cannot be Enhanced). You cannot use this power to heal yourself.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ally Heal, +Res(Toxic)",
+            icon: "poison_alkaloid.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 16.25,
+                cast: 1.53,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 2.0,
+                    ticks: 30
+                },
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Envenom",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff"],
+            description: "You Envenom your foe with a nasty poison, the poison then spreads to nearby foes. The toxin directly attacks the immune system, reducing the affected target's Defense, Damage Resistance and Hit Point Regeneration Rate. The poison is so potent, that the target actually responds less to Healing while affected by the poison. Secondary foes struck by this power will have a lesser effect placed on them while the primary target receives the full effectiveness of the power.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Targeted AoE), Foe -RES, -DEF, -Regen, -Heal",
+            icon: "poison_envenomaoe.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 12.0,
+                endurance: 13.0,
+                cast: 1.33,
+                defenseDebuff: 1.5,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Weaken",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "To Hit Debuff"],
+            description: "You poison a single foe with a venom that significantly Weakens their strength and and that of nearby foes. The affected primary target's chance to hit and Damage output is severely reduced Additionally, the affected targets secondary power effects are all weakened. The targets power effects like Heals, Defense Buffs, Endurance Drains, Disorients, Holds, Immobilizes, Knockbacks and more, are all weakened. Secondary foes struck by this power will have a lesser effect placed on them while the primary target receives the full effectiveness of the power.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Targeted AoE) Foe -DMG -To Hit, -Special",
+            icon: "poison_weakenaoe.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 16.0,
+                endurance: 13.0,
+                cast: 2.07,
+                buffDuration: 30.0,
+                tohitDebuff: 0.75
+            }
+        },
+        {
+            name: "Neurotoxic Breath",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "You can breath a cone of Neurotoxin gas that quickly start to anesthetize any nearby foes. Affected targets may choke on the gas as their movement and attack rate are severely reduced.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Cone), Foe -SPD, -Recharge",
+            icon: "poison_neurotoxicbreath.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 30.0,
+                endurance: 13.0,
+                cast: 2.67,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Elixir of Life",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Resist Damage"],
+            description: "With this Elixir, you can revive a fallen ally and turn him into a killing machine. The revived target has increased damage, chance to hit, Endurance recovery, and attack speed, and gains a resistance to Toxic damage. A brew of this sort is not without its side effects. The revived target will soon become very sick and severely weak after about 90 seconds. All effects of the Elixir will eventually wear off. Elixir of Life can only be used on Players and cannot be used on your Henchmen.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Close, Ally Rez, Special",
+            icon: "poison_elixiroflife.png",
+            powerType: "Click",
+            targetType: "Player Ally (Dead)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 15.0,
+                recharge: 180.0,
+                endurance: 32.5,
+                cast: 1.83,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 2.0,
+                    ticks: 45
+                },
+                buffDuration: 0.5,
+                tohitBuff: 3.0,
+                tohitDebuff: 3.0
+            }
+        },
+        {
+            name: "Antidote",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "This Antidote can free an ally from any Disorient, Hold, Sleep, Slow, Confuse, Fear and Immobilize effects and leaves them resistant to such effects for a good while. The Antidote also grants the target some resistance to Cold and Toxic damage. Some of the effects of this power will improve with Multiple applications and as you advance in level.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ally +Res(Disorient, Hold, Sleep, Immobilize, Confuse, Fear, Slow, Cold, Toxic)",
+            icon: "poison_antidote.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 4.0,
+                endurance: 6.5,
+                cast: 1.53,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Toxic",
+                            scale: 2.0,
+                            ticks: 45
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.0,
+                            ticks: 45
+                        }
+                    ]
+                },
+                stun: 1.0,
+                stunDuration: 90.0,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Paralytic Poison",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Holds"],
+            description: "This Paralytic Poison viciously attacks a foe's nervous system and can leave an affected target completely Held and defenseless.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged Hold",
+            icon: "poison_paralytic.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 16.0,
+                endurance: 9.75,
+                cast: 2.0
+            }
+        },
+        {
+            name: "Poison Trap",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Holds", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You can build a Poison Trap on the ground. Any foes that pass near the Poison Trap will cause it to detonate and release its toxic vapors. The poison is a highly toxic nerve gas, and any foes in the affected area may be drained of much of their Endurance and quickly Held or begin choking while suffering a minor amount of Toxic damage over time. The trap is almost impossible to detect, but it is fragile and may be set off by an enemy's explosion. Even if destroyed, the Trap will detonate.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Place Trap: PBAoE Foe Hold, -END, -Recovery, Chance to Hold, Minor DoT(Toxic)",
+            icon: "poison_poison_trap.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 60.0,
+                endurance: 13.0,
+                cast: 1.0,
+                buffDuration: 260.0
+            }
+        },
+        {
+            name: "Noxious Gas",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: [],
+            description: "You can infect one of your Henchmen, surrounding him with a Noxious Gas. All foes near the infected Henchmen will be overcome with the Noxious Gas. Their Defense, chance to hit, Damage and Damage resistance will all be reduced. Additionally, there is a chance than any affected humanoid enemy will become violently ill. Even the mightiest foe will stop dead in their tracks, and left helpless as they empty the contents of their stomach.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Ranged (Infect Henchman); Foe -RES, -DEF, -To Hit, -Res, +Special",
+            icon: "poison_noxiousgas.png",
+            powerType: "Click",
+            targetType: "Own Pet (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 30.0,
+                recharge: 300.0,
+                endurance: 22.75,
+                cast: 2.07
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['mastermind/poison'] = MASTERMIND_POISON_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.MASTERMIND_POISON_POWERSET = MASTERMIND_POISON_POWERSET;
+}
+
+// ---- js/data/powersets/mastermind/radiation-emission.js ----
+;/**
+ * Radiation Emission
+ * Character Level: 50
+ * Archetype: mastermind
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const MASTERMIND_RADIATION_EMISSION_POWERSET = {
+    name: "Radiation Emission",
+    category: "Unknown",
+    description: "Radiation Emission powerset",
+    icon: "radiation-emission_set.png",
+    powers: [
+        {
+            name: "Radiant Aura",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You can use Radiant Aura to heal some of your wounds, and the wounds of your group. This power has a small radius, so your allies need to be near you if they wish to be affected.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "PBAoE, Ally +Heal",
+            icon: "radiationpoisoning_radiationemission.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 8.0,
+                endurance: 16.25,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Radiation Infection",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Defense Debuff", "To Hit Debuff"],
+            description: "Infects a targeted foe with deadly radiation, severely reducing his Accuracy and Defense. All foes that come near the target will also become infected. The Radiation Infection will last until you deactivate it, or until the original target is defeated.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Ranged (Targeted AoE), Foe -DEF, -To Hit",
+            icon: "radiationpoisoning_enervatingfield.png",
+            powerType: "Toggle",
+            targetType: "Foe",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 8.0,
+                endurance: 0.325,
+                cast: 1.5,
+                tohitDebuff: 2.5,
+                buffDuration: 0.75,
+                defenseDebuff: 2.5
+            }
+        },
+        {
+            name: "Accelerate Metabolism",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Running", "Running & Sprints", "Universal Travel"],
+            description: "Activating this power emits radiation that increases the running speed, attack speed, Endurance recovery, and damage potential of all nearby allies. Affected allies' metabolisms are increased so much that they become resistant to effects such as Sleep, Hold, Disorient, Immobilization and Endurance Drain.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "PBAoE, Ally +SPD, +Recharge, +Recovery, +DMG(All) +Res(Effects)",
+            icon: "radiationpoisoning_acceleratemetabolism.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 422.0,
+                endurance: 19.5,
+                cast: 2.03,
+                buffDuration: 120.0,
+                stun: 1.0,
+                stunDuration: 120.0
+            }
+        },
+        {
+            name: "Enervating Field",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: [],
+            description: "While this power is active, you irradiate a targeted foe, and all foes nearby, with a deadly dose of radiation. This radiation weakens exposed targets, decreasing the damage of their attacks. It also significantly weakens their resistance, so they will take much more damage from other attacks.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Ranged (Targeted AoE), Foe -DMG, -Res",
+            icon: "radiationpoisoning_radiationinfection.png",
+            powerType: "Toggle",
+            targetType: "Foe",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 8.0,
+                endurance: 0.325,
+                cast: 1.5,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Mutation",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "Using a concentrated burst of radiation, you can revive a fallen ally and Mutate them into a killing machine. The Mutated target has increased damage, chance to hit, Endurance recovery, and attack speed and is protected from XP Debt for 90 seconds. The entire experience is very taxing on your ally, and they will soon be severely weakened. All effects of the Mutation will eventually wear off.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Close, Ally Rez, Special",
+            icon: "radiationpoisoning_mutation.png",
+            powerType: "Click",
+            targetType: "Player Ally (Dead)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 15.0,
+                recharge: 180.0,
+                endurance: 32.5,
+                cast: 3.2,
+                buffDuration: 0.5,
+                tohitBuff: 3.0,
+                tohitDebuff: 3.0
+            }
+        },
+        {
+            name: "Lingering Radiation",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "You can emit Lingering Radiation that reduces the attack rate, movement speed, and Regeneration rate of the target, and all nearby foes.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged (Targeted AoE), Foe -Speed, -Recharge, -Regen",
+            icon: "radiationpoisoning_lingeringradiation.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 90.0,
+                endurance: 19.5,
+                cast: 1.5,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Choking Cloud",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Holds"],
+            description: "While active, you generate toxic radioactive gas around yourself. Any nearby foes may be overcome by the gas, leaving them choking and helpless.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Toggle: PBAoE, Foe Hold",
+            icon: "radiationpoisoning_chokingcloud.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 1.625,
+                cast: 1.0
+            }
+        },
+        {
+            name: "Fallout",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Accurate To-Hit Debuff", "Defense Debuff", "Ranged AoE Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "After an ally falls in battle, you can activate this power to extract the energy from their body to deal a massive amount of Energy damage to any nearby foes. All affected foes are extremely weakened by the Fallout, and their Accuracy, Defense, Damage and Damage Resistance is severely reduced.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Post-Defeat: PBAoE, Foe -To Hit, -DEF, -DMG, -Res(All)",
+            icon: "radiationpoisoning_fallout.png",
+            powerType: "Click",
+            targetType: "Leaguemate (Dead)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 300.0,
+                endurance: 26.0,
+                cast: 3.2,
+                buffDuration: 1.0
+            }
+        },
+        {
+            name: "EM Pulse",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Holds"],
+            description: "You can unleash a massive pulse of electromagnetic energy. This EMP can affect machines, and is even powerful enough to affect synaptic brain patterns. It will drain the Endurance, and HP Regeneration of all affected targets and leave them incapacitate and Held for a long while. Additionally, most machines and robots will take moderate high damage. However, this power uses a lot of Endurance and leaves you unable to recover Endurance for a while.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "PBAoE, Foe Hold, -END, -Regen, Special vs. Robots; Self -Recovery",
+            icon: "radiationpoisoning_emppulse.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 300.0,
+                endurance: 26.0,
+                cast: 2.93,
+                damage: {
+                    type: "Energy",
+                    scale: 1.64
+                },
+                buffDuration: 15.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['mastermind/radiation-emission'] = MASTERMIND_RADIATION_EMISSION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.MASTERMIND_RADIATION_EMISSION_POWERSET = MASTERMIND_RADIATION_EMISSION_POWERSET;
+}
+
+// ---- js/data/powersets/mastermind/robotics.js ----
+;/**
+ * Robotics
+ * Character Level: 50
+ * Archetype: mastermind
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const MASTERMIND_ROBOTICS_POWERSET = {
+    name: "Robotics",
+    category: "Unknown",
+    description: "Robotics powerset",
+    icon: "robotics_set.png",
+    powers: [
+        {
+            name: "Battle Drones",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Mastermind Archetype Sets", "Pet Damage", "Recharge Intensive Pets", "Universal Damage Sets"],
+            description: "Construct one to three Battle Drones (depending on your level) to do your bidding. Drones start out with only basic weaponry, but can be upgraded with heavier energy weapons. Drones can Super Leap.<br><br>You may only have 3 Drones under your control at any given time. If you attempt to construct more Drones, you can only replace the ones you have lost in battle. If you already have three, the power will fail.<br><br><color #fcfc95>Notes: Battle Drones is unaffected by Recharge Time changes.</color>",
+            shortHelp: "Summon Battle Drones",
+            icon: "robotics_buildrobotarmy.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 5.0,
+                endurance: 5.46,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Pulse Rifle Blast",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Universal Damage Sets"],
+            description: "This Pulse Rifle can fire a long range laser pulse that deals Energy damage.<br><br><color #fcfc95>Laser Burn:</color><br>Targets struck by this attack will have their Regeneration debuffed for 30 seconds.",
+            shortHelp: "Ranged, DMG(Energy), -Regen",
+            icon: "robotics_laserrifleburst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 6.5,
+                cast: 1.0,
+                damage: {
+                    type: "Energy",
+                    scale: 2.26
+                },
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Pulse Rifle Burst",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "This high powered laser pulse from your Pulse Rifle takes more energy to fire, but causes much more damage than a standard pulse and has a very good chance to send your foes flying.<br><br><color #fcfc95>Laser Burn:</color><br>Targets struck by this attack will have their Regeneration debuffed for 30 seconds.",
+            shortHelp: "Ranged, DMG(Energy), Foe Knockback, -Regen",
+            icon: "robotics_laserrifleblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 10.66,
+                cast: 1.1,
+                damage: {
+                    type: "Energy",
+                    scale: 3.13
+                },
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Equip Robot",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "Equip your Robots with the latest gear and weaponry. This power permanently bestows new powers and abilities to all of your Robot Henchman. The powers gained are unique and dependent upon the type of Robot Henchman that is Equipped.<br><br>Your Robot Henchmen will also become more resistant to damage. This power only works on your Robot Henchmen and you can only Equip your Robot Henchmen once with this power.",
+            shortHelp: "Ranged, Equip Robot Henchman",
+            icon: "robotics_equiprobot.png",
+            powerType: "Click",
+            targetType: "Own Pet (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 6.0,
+                endurance: 11.375,
+                cast: 2.03,
+                buffDuration: 5.6
+            }
+        },
+        {
+            name: "Photon Grenade",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "Launches an Energy Grenade at long range from your Pulse Rifle. The energy from this explosion can Disorient some targets in the affected area and debuffs their regeneration.<br><br><color #fcfc95>Laser Burn:</color><br>Targets struck by this attack will have their Regeneration debuffed for 30 seconds.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Energy), Disorient, -Regen",
+            icon: "robotics_laserriflestungrenade.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 16.0,
+                endurance: 18.98,
+                cast: 1.87,
+                damage: {
+                    type: "Energy",
+                    scale: 1.6213
+                },
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Protector Bots",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Defense Sets", "Knockback", "Mastermind Archetype Sets", "Pet Damage", "Recharge Intensive Pets", "Stuns", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You can summon one to two powerful Protector Bots (depending on your level). Protector Bots can defend your army by placing Force Fields on you and your allies. They can even be equipped to repair your other Robot Henchmen. Make no mistake though, the best defense is a good offense, and Protector Bots are well equipped with energy weapons.<br><br>You may only have 2 Protector Bots under your control at any given time. If you attempt to summon more Protector Bots, you can only replace the ones you have lost in battle. If you already have two, the power will fail.<br><br><color #fcfc95>Notes: Protector Bots is unaffected by Recharge Time changes.</color>",
+            shortHelp: "Summon Protector Bot",
+            icon: "robotics_constructprotectorbot.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 10.0,
+                endurance: 9.62,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Maintenance Drone",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "This sturdy Maintenance Drone serves as a health battery reserve for your machines. As your other drones are hurt, it will use its own health to heal other drones. Once all its health is used up, it will self destruct. Maintenance Drone does not regenerate health, and can't be healed.",
+            shortHelp: "Summon Maintenance Robot",
+            icon: "robotics_maintenancebot.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 120.0,
+                endurance: 16.25,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Assault Bot",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Mastermind Archetype Sets", "Pet Damage", "Recharge Intensive Pets", "Stuns", "Universal Damage Sets"],
+            description: "Builds one massive Assault Bot. Simply put, the Assault Bot is a killing machine. There is nothing subtle about its weaponry.<br><br>You may only have 1 Assault Bot under your control at any given time. If you attempt to summon another Assault Bot, the power will fail.<br><br><color #fcfc95>Notes: Assault Bot is unaffected by Recharge Time changes.</color>",
+            shortHelp: "Summon Assault Bot",
+            icon: "robotics_assembleassaultmech.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 15.0,
+                endurance: 13.18,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Upgrade Robot",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Upgrade Robot will permanently bestow the most powerful and high-tech gear and weaponry to all of your Robot Henchman. The Upgraded Robot will gain new abilities, powers and weapons. The powers gained are unique and dependent upon the type of Robot Henchmen that is Upgraded.<br><br>Your Protector Bot Henchmen will also gain the ability to Repair other Robot Henchmen. This power only works on your Robot Henchmen and you can only Upgrade your Robot Henchman once with this power.",
+            shortHelp: "Ranged, Upgrade Robot Henchman",
+            icon: "robotics_upgraderobot.png",
+            powerType: "Click",
+            targetType: "Own Pet (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 10.0,
+                endurance: 11.375,
+                cast: 2.03,
+                buffDuration: 11.5
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['mastermind/robotics'] = MASTERMIND_ROBOTICS_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.MASTERMIND_ROBOTICS_POWERSET = MASTERMIND_ROBOTICS_POWERSET;
+}
+
+// ---- js/data/powersets/mastermind/shock-therapy.js ----
+;/**
+ * Shock Therapy
+ * Character Level: 50
+ * Archetype: mastermind
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const MASTERMIND_SHOCK_THERAPY_POWERSET = {
+    name: "Shock Therapy",
+    category: "Unknown",
+    description: "Shock Therapy powerset",
+    icon: "shock-therapy_set.png",
+    powers: [
+        {
+            name: "Rejuvenating Circuit",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Create a circuit of healing energy between several nearby allies, healing them for a small amount. Every stack of Static you have will cause this power to chain to additional allies. The first few targets in the chain receive a more potent effect. Rejuvenating Circuit grants 1 stack of Static.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged (Chain), Ally Heal, Self +Static",
+            icon: "shocktherapy_rejuvenatingcircuit.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "Chain",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 16.25,
+                cast: 1.17
+            }
+        },
+        {
+            name: "Shock",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "Strike a single foe with a highly-charged electrical shock, draining some endurance and moderately reducing their recovery, regeneration and damage output.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Foe -DMG, -End, -Recovery, -Regen",
+            icon: "shocktherapy_shock.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 12.0,
+                endurance: 10.66,
+                cast: 2.0,
+                buffDuration: 25.0
+            }
+        },
+        {
+            name: "Discharge",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "Unleash a blast of electrical energy around your target, draining them and all nearby enemies of some endurance. This will also reduce their regeneration, recovery, and damage dealt for a short period of time.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Targeted AoE), Foe -DMG, -End, -Recovery, -Regen",
+            icon: "shocktherapy_discharge.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 20.0,
+                endurance: 19.5,
+                cast: 2.03,
+                buffDuration: 25.0
+            }
+        },
+        {
+            name: "Energizing Circuit",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "Create a circuit of pure energy between several nearby allies, restoring a small amount of their endurance and significantly increasing their attack rate for a short time. Every stack of Static you have will cause this power to chain to additional allies. The first few targets in the chain receive a more potent effect. Energizing Circuit grants 1 stack of Static.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Chain), Ally +End, +Recharge, Self +Static",
+            icon: "shocktherapy_energizingcircuit.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "Chain",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 35.0,
+                endurance: 16.25,
+                cast: 1.67,
+                buffDuration: 5.0
+            }
+        },
+        {
+            name: "Faraday Cage",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "Create a large energy barrier at your location which provides all allies within resistance to all damage except Toxic. They are also protected from status effects, knockbacks, endurance drain, recovery debuffs and recharge debuffs. Casting this power again will move the energy barrier to your location. Standing inside your own Faraday Cage will grant you a stack of Static every 5 seconds.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Location (PBAoE), Team +Res(All DMG but Toxic, Status, Knockback, -Rech, -Rec, -End)",
+            icon: "shocktherapy_faradaycage.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 25.0,
+                recharge: 10.0,
+                endurance: 16.25,
+                cast: 1.07,
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Empowering Circuit",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Create a circuit of empowering energy between several nearby allies, increasing their damage output and chance to hit for a short time. Every stack of Static you have will cause this power to chain to additional allies. The first few targets in the chain receive a more potent effect. Empowering Circuit grants 1 stack of Static.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Chain), Ally +DMG, +Tohit, Self +Static",
+            icon: "shocktherapy_empoweringcircuit.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "Chain",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 16.25,
+                cast: 1.0,
+                buffDuration: 60.0,
+                tohitBuff: 1.2
+            }
+        },
+        {
+            name: "Defibrillate",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Sleep", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Sleep"],
+            description: "Strike a target with a highly-charged jolt of electricity, reviving all nearby allies and draining all nearby foes. Any enemies affected will be drained of some endurance, have their recovery reduced and be put to sleep for a short time. Defibrillate consumes all stacks of Static, and the strength of the offensive component of this power scales with the number of stacks consumed. Allies will always be revived with full health and endurance regardless of the number of Static stacks consumed.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Melee (Targeted AoE), Ally Rez, Foe Sleep, -End, -Recovery",
+            icon: "shocktherapy_defibrillate.png",
+            powerType: "Click",
+            targetType: "Any",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 120.0,
+                endurance: 32.5,
+                cast: 3.3
+            }
+        },
+        {
+            name: "Insulating Circuit",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Create a circuit of protective energy between several nearby allies, granting them a small protective shield. Every stack of Static you have will cause this power to chain to additional allies. The first few targets in the chain receive a more potent effect. Insulating Circuit grants 1 stack of Static.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Chain), Ally +Absorb, Self +Static",
+            icon: "shocktherapy_insulatingcircuit.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "Chain",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 20.0,
+                endurance: 16.25,
+                cast: 1.0,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Amp Up",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: [],
+            description: "Empower an ally with raw energy, causing all of their abilities to unleash chained bolts of electricity at nearby foes. These bolts drain a small amount of endurance and have a chance to knock up the target. Amp Up also moderately increases their attack rate and greatly boosts the secondary effects of their powers. Their power effects like heals, defense debuffs, endurance drains, disorients, holds, immobilizes and more, are all improved.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Ranged, Ally +Special, +Recharge",
+            icon: "shocktherapy_ampup.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 300.0,
+                endurance: 13.0,
+                cast: 2.57,
+                buffDuration: 90.0,
+                stun: 1.0,
+                stunDuration: 90.0,
+                tohitBuff: 3.6,
+                defenseBuff: 3.6
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['mastermind/shock-therapy'] = MASTERMIND_SHOCK_THERAPY_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.MASTERMIND_SHOCK_THERAPY_POWERSET = MASTERMIND_SHOCK_THERAPY_POWERSET;
+}
+
+// ---- js/data/powersets/mastermind/sonic-resonance.js ----
+;/**
+ * Sonic Resonance
+ * Character Level: 50
+ * Archetype: mastermind
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const MASTERMIND_SONIC_RESONANCE_POWERSET = {
+    name: "Sonic Resonance",
+    category: "Unknown",
+    description: "Sonic Resonance powerset",
+    icon: "sonic-resonance_set.png",
+    powers: [
+        {
+            name: "Sonic Barrier",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "This shield dramatically reduces the damage an ally takes from Smashing, Lethal, and Toxic attacks for a limited time. You cannot stack multiple Sonic Barriers on the same target, however the shield can be improved by another ally using the same power. Can also be used in conjunction with your Sonic Haven. You cannot use this power on yourself.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Ranged, Ally +Res(Smash, Lethal, Toxic)",
+            icon: "sonicdebuff_protectphysical.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 2.0,
+                endurance: 9.75,
+                cast: 1.33,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.0,
+                            ticks: 120
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 2.0,
+                            ticks: 120
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 2.0,
+                            ticks: 120
+                        }
+                    ]
+                },
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Sonic Siphon",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: [],
+            description: "By setting up a constant vibration within the body of your foe, you weaken their Damage Resistance. Affected targets will take more damage from successful attacks.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Foe -Res(All)",
+            icon: "sonicdebuff_debuffdamres.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 16.0,
+                endurance: 10.66,
+                cast: 2.17,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Sonic Haven",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "This shield dramatically reduces the damage an ally takes from Fire, Cold, Energy, and Negative Energy attacks for a limited time. You cannot stack multiple Sonic Havens on the same target, however the shield can be improved by another ally using the same power. Can also be used in conjunction with your Sonic Barrier. You cannot use this power on yourself.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Ranged, Ally +Res(Fire, Cold, Energy, Negative Energy)",
+            icon: "sonicdebuff_protectelements.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 2.0,
+                endurance: 9.75,
+                cast: 1.33,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 2.0,
+                            ticks: 120
+                        },
+                        {
+                            type: "Cold",
+                            scale: 2.0,
+                            ticks: 120
+                        },
+                        {
+                            type: "Energy",
+                            scale: 2.0,
+                            ticks: 120
+                        },
+                        {
+                            type: "Negative",
+                            scale: 2.0,
+                            ticks: 120
+                        }
+                    ]
+                },
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Sonic Cage",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: [],
+            description: "Encases the target in an impenetrable field of sonic waves. The target cannot attack or be attacked.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Foe Capture (Special)",
+            icon: "sonicdebuff_hold.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.4,
+                range: 80.0,
+                recharge: 60.0,
+                endurance: 15.6,
+                cast: 1.67,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Disruption Field",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "You set up a constant wave of sonic energy around an ally, weakening the Damage Resistance of all nearby foes.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Ranged (Target Ally AoE), Foe -Res",
+            icon: "sonicdebuff_teamdebuffdamres.png",
+            powerType: "Toggle",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 8.0,
+                endurance: 0.325,
+                cast: 2.7,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Sonic Dispersion",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You create a large field of sonic waves, protecting all allies inside. The Sonic Dispersion gives all allies within increased Resistance against all damage except Psionic. The Sonic Bubble also protects allies from Immobilization, Disorient, and Hold effects.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Toggle: PBAoE, Ally +Res(All DMG except Psionic, Hold, Immobilize, Disorient)",
+            icon: "sonicdebuff_buffdamageres.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 15.0,
+                endurance: 1.3,
+                cast: 2.03,
+                buffDuration: 2.25,
+                stun: 1.0,
+                stunDuration: 2.25
+            }
+        },
+        {
+            name: "Sonic Repulsion",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Knockback"],
+            description: "You create a powerful sonic resonance around an ally, repelling all foes nearby. You will lose endurance for each target repelled.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Ranged (Target Ally AoE), Foe Knockback",
+            icon: "sonicdebuff_teamknockback.png",
+            powerType: "Toggle",
+            targetType: "Leaguemate (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 8.0,
+                endurance: 0.4063,
+                cast: 2.33,
+                buffDuration: 0.5
+            }
+        },
+        {
+            name: "Clarity",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: [],
+            description: "By bouncing a carefully pitched sound wave off an ally's ear drum, you can free him from any Disorient, Hold, Sleep, Confusion, Fear, and Immobilize effects, and leave them resistant to such effects for a good while. Protection will improve with multiple applications and as you advance in level. Clarity also provides your ally's enhanced perception.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ally +Res(Disorient, Hold, Sleep, Immobilize, Fear, Confusion), +Perception",
+            icon: "sonicdebuff_dispel.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 4.0,
+                endurance: 6.5,
+                cast: 1.5,
+                stun: 1.0,
+                stunDuration: 90.0,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Liquefy",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Accurate To-Hit Debuff", "Defense Debuff", "Holds", "Knockback", "Ranged AoE Damage", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You unleash a barrage of sonic waves on the Earth itself, generating a powerful, localized earthquake. Most foes that pass through the location will fall down. The violent shaking also reduces their chance to hit and Defense.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Ranged (Location AoE), Foe Knockback, Hold, -To Hit, -DEF",
+            icon: "sonicdebuff_dropknockback.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 150.0,
+                endurance: 23.4,
+                cast: 2.67,
+                buffDuration: 30.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['mastermind/sonic-resonance'] = MASTERMIND_SONIC_RESONANCE_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.MASTERMIND_SONIC_RESONANCE_POWERSET = MASTERMIND_SONIC_RESONANCE_POWERSET;
+}
+
+// ---- js/data/powersets/mastermind/storm-summoning.js ----
+;/**
+ * Storm Summoning
+ * Character Level: 50
+ * Archetype: mastermind
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const MASTERMIND_STORM_SUMMONING_POWERSET = {
+    name: "Storm Summoning",
+    category: "Unknown",
+    description: "Storm Summoning powerset",
+    icon: "storm-summoning_set.png",
+    powers: [
+        {
+            name: "Gale",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You can call forth a tremendous gust of Gale force winds that knock down foes and deal some Smashing damage in a wide cone area.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged (Cone), Minor DMG(Smash), Foe Knockback",
+            icon: "stormsummoning_gale.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 16,
+            arc: 1.3963,
+            effects: {
+                accuracy: 0.9,
+                range: 50.0,
+                recharge: 8.0,
+                endurance: 9.75,
+                cast: 2.17,
+                damage: {
+                    type: "Smashing",
+                    scale: 0.1
+                }
+            }
+        },
+        {
+            name: "O2 Boost",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Saturates the air around a targeted ally with rich oxygen, healing their wounds. The O2 Boost can protect a targeted ally from Sleep, Stun and Endurance Drain effects as well as increase perception. You cannot use this power on yourself.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ally Heal, +Res(Disorient, Sleep, End Drain), +Perception",
+            icon: "stormsummoning_o2boost.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 16.25,
+                cast: 2.27,
+                buffDuration: 60.0,
+                stun: 1.0,
+                stunDuration: 60.0
+            }
+        },
+        {
+            name: "Snow Storm",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "While active, the chill from this Snow Storm can dramatically Slow the attack and movement speed of the target and all nearby foes. The torrent winds of the Snow Storm are enough to bring down flying foes.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Ranged (Targeted AoE), Foe -Speed, -Recharge, -Fly",
+            icon: "stormsummoning_snowstorm.png",
+            powerType: "Toggle",
+            targetType: "Foe",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 10.0,
+                endurance: 0.325,
+                cast: 2.03,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Steamy Mist",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Resist Damage"],
+            description: "Your mastery of the elements allows you to hide yourself and all nearby allies within a Steamy Mist. Steamy Mist makes you and your allies harder to see and increases your Defense bonus to all attacks, while reducing Fire, Cold, and Energy damage, as well as your Foes ability to Confuse you.",
+            shortHelp: "Toggle: PBAoE, Team Stealth, +DEF(All), +Res(Fire, Cold, Energy, Confuse)",
+            icon: "stormsummoning_fog.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 15.0,
+                endurance: 0.325,
+                cast: 1.87,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Freezing Rain",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "Summons Freezing Rain at a targeted location. Freezing Rain deals minimal Cold damage to anything that passes through the storm. It also Slows the affected foes and severely reduces their Defense and resistance to damage. Many foes may even slip and fall trying to escape the storm.<br><br><color #fcfc95>Damage: Minor(DoT).</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Location AoE), Minor DoT(Cold), Foe -Speed, -Recharge, -DEF -Res",
+            icon: "stormsummoning_freezingrain.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                endurance: 22.75,
+                cast: 2.03,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Hurricane",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Knockback", "To Hit Debuff"],
+            description: "You can summon a Hurricane. The wind and rain from this massive storm reduce the range and chance to hit of nearby foes. The massive winds of this storm continuously force foes away from you.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: PBAoE, Foe -Range, -To Hit, Repel, Knockback",
+            icon: "stormsummoning_hurricane.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.2031,
+                cast: 2.03,
+                buffDuration: 10.0,
+                tohitDebuff: 3.0
+            }
+        },
+        {
+            name: "Thunder Clap",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Stuns"],
+            description: "You can call forth a tremendous Thunder Clap that will Disorient most foes in a large area around you.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE, Foe Disorient",
+            icon: "stormsummoning_thunderclap.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 0.8,
+                recharge: 45.0,
+                endurance: 13.0,
+                cast: 2.37,
+                stun: 2.0
+            }
+        },
+        {
+            name: "Tornado",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Knockback", "Mastermind Archetype Sets", "Pet Damage", "Recharge Intensive Pets", "Stuns", "Universal Damage Sets"],
+            description: "Conjures up a funnel cloud at a targeted location. The Tornado will chase down your foes, tossing them into the air and hurling them great distances. The victims are left Disoriented and with reduced Defense. The Tornado is a menacing sight, and can even cause panic among your foes.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Summon Tornado: PBAoE Minor DMG(Smash), Foe Knockback, Fear, Disorient",
+            icon: "stormsummoning_tornado.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.3,
+                range: 60.0,
+                recharge: 60.0,
+                endurance: 26.0,
+                cast: 1.17,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Lightning Storm",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "You can create a massive Lightning Storm that will strike any foe that approaches you. Lightning from this storm can knock down and damage all nearby foes, and can even instill panic. Lightning bolts will continue to fall as long as the storm remains.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Create Storm: Ranged, High DMG(Energy), Foe -End",
+            icon: "stormsummoning_lightningstorm.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.4,
+                recharge: 90.0,
+                endurance: 39.0,
+                cast: 2.03,
+                buffDuration: 60.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['mastermind/storm-summoning'] = MASTERMIND_STORM_SUMMONING_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.MASTERMIND_STORM_SUMMONING_POWERSET = MASTERMIND_STORM_SUMMONING_POWERSET;
+}
+
+// ---- js/data/powersets/mastermind/thermal-radiation.js ----
+;/**
+ * Thermal Radiation
+ * Character Level: 50
+ * Archetype: mastermind
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const MASTERMIND_THERMAL_RADIATION_POWERSET = {
+    name: "Thermal Radiation",
+    category: "Unknown",
+    description: "Thermal Radiation powerset",
+    icon: "thermal-radiation_set.png",
+    powers: [
+        {
+            name: "Fire Shield",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "Casts a Fire Shield on one of your allies and grants him damage resistance to Lethal, Smashing and Fire damage. Fire Shield also provides minimal resistance to Cold damage. You cannot stack multiple Fire Shields on the same target, however the shield can be improved by another ally using the same power. Can also be used in conjunction with your Plasma Shield. You cannot use this power on yourself.",
+            shortHelp: "Ranged, Ally +Res(Fire, Lethal, Smash, Cold)",
+            icon: "thermalradiation_fireshield.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 2.0,
+                endurance: 9.75,
+                cast: 1.17,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.0,
+                            ticks: 120
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 2.0,
+                            ticks: 120
+                        },
+                        {
+                            type: "Fire",
+                            scale: 2.0,
+                            ticks: 120
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.0,
+                            ticks: 120
+                        }
+                    ]
+                },
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Warmth",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You can use your Warmth to heal some of your wounds, and the wounds of your group. This power has a small radius, so your allies need to be near you if they wish to be affected.",
+            shortHelp: "PBAoE, Team +Heal",
+            icon: "thermalradiation_warmth.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 8.0,
+                endurance: 16.25,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Cauterize",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Heals a single targeted ally by cauterizing their wounds. You cannot use this power to heal yourself.",
+            shortHelp: "Ally Heal",
+            icon: "thermalradiation_cauterize.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 16.25,
+                cast: 2.27
+            }
+        },
+        {
+            name: "Plasma Shield",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "Envelope an ally in pure plasma. The Plasma Shield gives your ally resistance to Energy, Negative Energy, and Fire damage. You cannot stack multiple Plasma Shields on the same target, however the shield can be improved by another ally using the same power. Can also be used in conjunction with your Fire Shield. You cannot use this power on yourself.",
+            shortHelp: "Ranged, Ally +Res(Energy, Negative, Fire)",
+            icon: "thermalradiation_plasmashield.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 2.0,
+                endurance: 9.75,
+                cast: 1.17,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 2.0,
+                            ticks: 120
+                        },
+                        {
+                            type: "Energy",
+                            scale: 2.0,
+                            ticks: 120
+                        },
+                        {
+                            type: "Negative",
+                            scale: 2.0,
+                            ticks: 120
+                        }
+                    ]
+                },
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Power of the Phoenix",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage"],
+            allowedSetCategories: ["Endurance Modification", "Healing", "Ranged AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "Revives a fallen ally. The fiery resurrection blasts nearby foes with an explosion and knocks them down and Disorients them. Your ally will revive with most of their Hit Points and Endurance. He will also be invulnerable for a brief time, as well as protected from XPDebt for 90 seconds.",
+            shortHelp: "Ally Rez, Special",
+            icon: "thermalradiation_phoenix.png",
+            powerType: "Click",
+            targetType: "Player Ally (Dead)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 15.0,
+                recharge: 300.0,
+                endurance: 61.75,
+                cast: 1.67,
+                buffDuration: 0.5
+            }
+        },
+        {
+            name: "Thaw",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "Warms an ally and frees him from any Disorient, Hold, Sleep, Slow, Confuse, Fear and Immobilize effects and leaves them resistant to such effects for a good while. Thaw also grants the target some resistance to Cold damage. Some of the effects of this power will improve with Multiple applications and as you advance in level.",
+            shortHelp: "Ally +Res(Disorient, Hold, Sleep, Immobilize, Confuse, Fear, Cold, Slow)",
+            icon: "thermalradiation_thaw.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 4.0,
+                endurance: 6.5,
+                cast: 2.17,
+                dotDamage: {
+                    type: "Cold",
+                    scale: 1.0,
+                    ticks: 45
+                },
+                stun: 1.0,
+                stunDuration: 90.0,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Forge",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Forge a single ally target into a killing machine. Forge immensely enhances a single ally's Damage and chance to hit.",
+            shortHelp: "Ally +DMG, +To Hit",
+            icon: "thermalradiation_forge.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 60.0,
+                endurance: 13.0,
+                cast: 2.27,
+                tohitBuff: 2.0,
+                buffDuration: 120.0
+            }
+        },
+        {
+            name: "Heat Exhaustion",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: [],
+            description: "Overwhelm a single foe with waves of exhausting heat. The initial effect will drain the target of some Endurance, but the heat is so overwhelming that the affected target will be weakened. His Damage output, Endurance Recovery and Hit Point Regeneration will all be reduced.",
+            shortHelp: "Ranged Foe -DMG, -END, -Recovery, -Regeneration",
+            icon: "thermalradiation_heatexhaustion.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 120.0,
+                endurance: 16.25,
+                cast: 2.07,
+                buffDuration: 40.0
+            }
+        },
+        {
+            name: "Melt Armor",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff"],
+            description: "The searing heat from this power is enough to melt the armor and defenses of all targets in the affected area. Melt Armor significantly weakens the Defense and Damage Resistance of the affected targets.",
+            shortHelp: "Ranged (Targeted AoE), Foe -Res, -DEF",
+            icon: "thermalradiation_meltarmor.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 100.0,
+                endurance: 22.75,
+                cast: 1.5,
+                defenseDebuff: 2.0,
+                buffDuration: 40.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['mastermind/thermal-radiation'] = MASTERMIND_THERMAL_RADIATION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.MASTERMIND_THERMAL_RADIATION_POWERSET = MASTERMIND_THERMAL_RADIATION_POWERSET;
+}
+
+// ---- js/data/powersets/mastermind/thugs.js ----
+;/**
+ * Thugs
+ * Character Level: 50
+ * Archetype: mastermind
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const MASTERMIND_THUGS_POWERSET = {
+    name: "Thugs",
+    category: "Unknown",
+    description: "Thugs powerset",
+    icon: "thugs_set.png",
+    powers: [
+        {
+            name: "Call Thugs",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Mastermind Archetype Sets", "Pet Damage", "Recharge Intensive Pets", "Universal Damage Sets"],
+            description: "Calls forth one to three Thugs (depending on your level) to do your bidding. The third Thug you gain will be an Arsonist. Thugs use Dual Pistols and can be taught additional pistol attacks.<br><br>You may only have 3 Thugs under your control at any given time. If you attempt to call more Thugs, you can only replace the ones you have lost in battle. If you already have three, the power will fail.<br><br><color #fcfc95>Notes: Call Thugs is unaffected by Recharge Time changes.</color><br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Summon Punks",
+            icon: "thugs_hireposse.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 5.0,
+                endurance: 5.46,
+                cast: 1.67
+            }
+        },
+        {
+            name: "Pistols",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Universal Damage Sets"],
+            description: "Quickly fires a round from one of your heavy automatic pistols. Damage is average, but the fire rate is very fast.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Ranged, Light DMG(Lethal)",
+            icon: "thugs_targetedrangedminordmg.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.1,
+                range: 80.0,
+                recharge: 3.0,
+                endurance: 6.5,
+                cast: 1.2,
+                damage: {
+                    type: "Lethal",
+                    scale: 2.3600000000000003
+                }
+            }
+        },
+        {
+            name: "Dual Wield",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Universal Damage Sets"],
+            description: "Fires both pistols at once at a time target. Firing both pistols at once is slower than a single shot, but deals more damage, and the target may get knocked down by the force of the impact.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, Light DMG(Lethal), Foe Knockback",
+            icon: "thugs_targetedrangedheavydmg.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.1,
+                range: 80.0,
+                recharge: 6.0,
+                endurance: 8.58,
+                cast: 1.2,
+                dotDamage: {
+                    type: "Lethal",
+                    scale: 1.4,
+                    ticks: 1
+                },
+                buffDuration: 0.3
+            }
+        },
+        {
+            name: "Equip Thugs",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: [],
+            description: "Equip your Thug Henchmen with better ammo, weapons and training. This power permanently bestows new weapons and abilities to all of your Thug Henchman. The powers gained are unique and dependent upon the type of Thug Henchman.<br><br>This power only works on your Thug Henchmen and you can only Equip your Thug Henchmen once with this power.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, Equip Thug Henchman",
+            icon: "thugs_equipthugs.png",
+            powerType: "Click",
+            targetType: "Own Pet (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 6.0,
+                endurance: 11.375,
+                cast: 1.3,
+                buffDuration: 3.5
+            }
+        },
+        {
+            name: "Empty Clips",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You empty the clips of both your pistols in a arc of suppression fire. This attack can blast multiple foes in the affected cone area, and has a small chance of knocking some foes down.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged (Cone), Minor DMG(Lethal), Knockback",
+            icon: "thugs_conerangedmoderatedmg.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.1,
+                range: 40.0,
+                recharge: 8.0,
+                endurance: 18.98,
+                cast: 1.83,
+                dotDamage: {
+                    type: "Lethal",
+                    scale: 0.569,
+                    ticks: 2
+                },
+                buffDuration: 0.7
+            }
+        },
+        {
+            name: "Call Enforcer",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Defense Sets", "Holds", "Mastermind Archetype Sets", "Pet Damage", "Recharge Intensive Pets", "Stuns", "To Hit Buff", "Universal Damage Sets"],
+            description: "Calls forth one to two Thug Enforcers (depending on your level) to do your bidding. Thug Enforcers carry a Sub-machine Gun, and possess good leadership skills. Their weapon of choice is an UZI, and can be equipped to carry up to 2 at once.<br><br>You may only have 2 Thug Enforcers under your control at any given time. If you attempt to call more Enforcers, you can only replace the ones you have lost in battle. If you already have two, the power will fail.<br><br><color #fcfc95>Notes: Call Enforcer is unaffected by Recharge Time changes.</color><br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Summon Enforcer",
+            icon: "thugs_enlistlieutenant.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 10.0,
+                endurance: 9.62,
+                cast: 1.67
+            }
+        },
+        {
+            name: "Gang War",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Mastermind Archetype Sets", "Pet Damage", "Recharge Intensive Pets", "Universal Damage Sets"],
+            description: "Calls a gang of 10 or so Thug Posse to come to your aid for a brief while. Posse are not like your true Henchman. They cannot be given direct commands, nor will they appear in your pet window. You must select an enemy target to attack first before calling these Thugs. Posse are many, but they are very weak, and are only equipped with the most basic weapons. Although they will follow you, they are not as loyal as your Henchmen, and they will only stick around for a few minutes before taking off.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Summon Posse",
+            icon: "thugs_targetedsummonmob.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 600.0,
+                endurance: 13.0,
+                cast: 1.67
+            }
+        },
+        {
+            name: "Call Bruiser",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Mastermind Archetype Sets", "Pet Damage", "Recharge Intensive Pets", "Universal Damage Sets"],
+            description: "Calls one massive Bruiser. He is strong, tough and has a mean temper. As a Brute, he will generate Fury and deal more damage the longer the combat lasts. His Super Strength powers means he favors hand to hand combat. He has resistance to Lethal and Smashing Damage and some resistance to Fire and Cold Damage.<br><br>You may only have 1 Bruiser under your control at any given time. If you attempt to summon another Bruiser the power will fail.<br><br><color #fcfc95>Notes: Call Bruiser is unaffected by Recharge Time changes.</color><br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Summon Bruiser",
+            icon: "thugs_enlistboss.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 15.0,
+                endurance: 13.18,
+                cast: 1.67
+            }
+        },
+        {
+            name: "Upgrade Equipment",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: [],
+            description: "Permanently Upgrade the most advanced ammo, weapons and training to all of your Thug Henchman. The Upgraded Thug will gain new powers, weapons and abilities. The powers gained are unique and dependent upon the type of Thug Henchman that is Upgraded.<br><br>This power only works on your Thug Henchmen and you can only Upgrade the Equipment of your Thug Henchmen once with this power.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged, Upgrade Thug Henchman",
+            icon: "thugs_upgradeequipment.png",
+            powerType: "Click",
+            targetType: "Own Pet (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 30.0,
+                recharge: 10.0,
+                endurance: 11.375,
+                cast: 1.67,
+                buffDuration: 7.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['mastermind/thugs'] = MASTERMIND_THUGS_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.MASTERMIND_THUGS_POWERSET = MASTERMIND_THUGS_POWERSET;
+}
+
+// ---- js/data/powersets/mastermind/time-manipulation.js ----
+;/**
+ * Time Manipulation
+ * Character Level: 50
+ * Archetype: mastermind
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const MASTERMIND_TIME_MANIPULATION_POWERSET = {
+    name: "Time Manipulation",
+    category: "Unknown",
+    description: "Time Manipulation powerset",
+    icon: "time-manipulation_set.png",
+    powers: [
+        {
+            name: "Temporal Mending",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You mend the wounds of yourself and nearby allies by placing your bodies in a past or future state where they are far less injured. Temporal Mending will immediately heal its targets and continue to heal them for an equal amount over the next 6 seconds. Additionally, affected allies will gain some resistance to slow effects and regeneration debuffs. Allies affected by the Accelerated effect will receive additional healing from this power.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE, Ally +Heal, Heal Over Time, +Res(Slow, Regen Debuff)",
+            icon: "timemanipulation_temporalmending.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 18.0,
+                endurance: 16.25,
+                cast: 2.03,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Time Crawl",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "You're able to dramatically slow the time around a single enemy, reducing their movement speed and attack rate. Time is slowed to such an extreme that their wounds will take longer to heal, reducing their regeneration rate. Time Crawl applies the Delayed effect on its target. Debuff and control effects from other Time Manipulation powers are increased on targets affected by Delayed.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged Foe, -Speed, -Recharge, -Regen, Special",
+            icon: "timemanipulation_timecrawl.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 13.0,
+                cast: 1.6,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Time's Juncture",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Slow Movement", "To Hit Debuff"],
+            description: "You create a time dilation field around you causing enemies who get too close to be slowed to a crawl, their movement speed, damage and chance to hit will be decreased substantially. Enemies affected by Delayed have these affects increased.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: PBAoE Foe (-Damage, -Speed, -To Hit)",
+            icon: "timemanipulation_timesjuncture.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.4875,
+                cast: 0.67,
+                tohitDebuff: 1.5,
+                buffDuration: 1.0
+            }
+        },
+        {
+            name: "Temporal Selection",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You distort time around an ally, selecting a period of time where their abilities are at their highest. Their damage, attack rate and regeneration rates are dramatically increased for a brief period. This power places the Accelerated effect on the target. While this is in effect, the target has any healing and healing over time effects from Temporal Mending or Chrono Shift significantly increased.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ally +Damage, +Recharge, +Regeneration",
+            icon: "timemanipulation_temporalselection.png",
+            powerType: "Click",
+            targetType: "Ally (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 120.0,
+                endurance: 13.0,
+                cast: 2.27,
+                buffDuration: 120.0
+            }
+        },
+        {
+            name: "Distortion Field",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "Slow", "EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Holds", "Slow Movement"],
+            description: "You can choose an area to slow the flow of time down to a crawl. Enemies who enter the field will have their attack rate and speed slowed dramatically. In addition, affected enemies might become held as they are frozen in time. Targets affected by Time Crawl will have the chance to be held increased.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Location AoE), Foe(-Recharge, -Speed), Chance for Hold",
+            icon: "timemanipulation_distortionfield.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 60.0,
+                endurance: 18.2,
+                cast: 2.03,
+                buffDuration: 45.0
+            }
+        },
+        {
+            name: "Time Stop",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Holds"],
+            description: "You trap your target within the flow of time causing them to be held helpless. Even those resistant to the effects of Time Stop's hold will still have their regeneration rate and healing effects reduced for a brief period. Targets affected by Time Crawl will suffer from a more powerful hold, however its benefits are brief.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged Hold, Foe -Regen, -Heal",
+            icon: "timemanipulation_timestop.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 16.0,
+                endurance: 11.05,
+                cast: 2.17,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Farsight",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "To Hit Buff"],
+            description: "You give your allies a brief glimpse of the future and what is to come. This provides you and your team a moderate increase to your chance to hit and defense for a short period of time.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE Team, +To-Hit, +Defense(All), +Perception",
+            icon: "timemanipulation_farsight.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 240.0,
+                endurance: 19.5,
+                cast: 2.03,
+                buffDuration: 120.0,
+                tohitBuff: 1.0
+            }
+        },
+        {
+            name: "Slowed Response",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff"],
+            description: "You manipulate time around a targeted foe causing their reflexes to become slowed and sluggish. This causes them to have decreased defense and damage resistance. A target affected by Time Crawl will suffer from a more powerful effect.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged (Targeted AoE), Foe -Defense, -Resistance",
+            icon: "timemanipulation_slowedresponse.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 90.0,
+                endurance: 19.5,
+                cast: 2.27,
+                buffDuration: 30.0,
+                defenseDebuff: 2.5
+            }
+        },
+        {
+            name: "Chrono Shift",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "You cause nearby allies to act more quickly by allowing them to slip through the time stream seamlessly. When Chrono Shift is activated, you and nearby allies will immediately recover a portion of your health and endurance. Chrono Shift will greatly increase the Recharge Speed of nearby allies for the duration of the power, additionally for a short while the flow of time will constantly undo a portion of your allies' wounds causing them to periodically recover health and recover endurance. An ally affected by Temporal Selection will recover additional health from Chrono Shift.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "PBAoE, Team +Recharge, Moderate Healing over Time",
+            icon: "timemanipulation_chronoshift.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 360.0,
+                endurance: 26.0,
+                cast: 2.03,
+                buffDuration: 30.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['mastermind/time-manipulation'] = MASTERMIND_TIME_MANIPULATION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.MASTERMIND_TIME_MANIPULATION_POWERSET = MASTERMIND_TIME_MANIPULATION_POWERSET;
+}
+
+// ---- js/data/powersets/mastermind/traps.js ----
+;/**
+ * Traps
+ * Character Level: 50
+ * Archetype: mastermind
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const MASTERMIND_TRAPS_POWERSET = {
+    name: "Traps",
+    category: "Unknown",
+    description: "Traps powerset",
+    icon: "traps_set.png",
+    powers: [
+        {
+            name: "Caltrops",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage"],
+            allowedSetCategories: ["Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You toss a handful of Caltrops at a targeted location and spread the tiny metal spikes over a large area. Any enemy that pass over the Caltrops will be forced to move at a slower rate. They will also take some trivial Lethal damage over time.<br><br><color #fcfc95>Damage: Minor(DoT).</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Location AoE), Minor DoT(Lethal), Foe -Speed",
+            icon: "traps_droppedaoedebuffrunspeed.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 25.0,
+                recharge: 45.0,
+                endurance: 9.75,
+                cast: 1.07,
+                buffDuration: 45.0
+            }
+        },
+        {
+            name: "Web Grenade",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Immobilize", "Slow Movement"],
+            description: "Upon impact, the Web Grenade expels a strong, tenuous, and very sticky substance that can Immobilize most targets. This non-lethal device deals no damage and does not prevent targets from attacking, although their attack rate is Slowed. The Web can bring down flying entities and halts jumping.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, Target Immobilize, -Recharge, -Fly",
+            icon: "traps_targetedimmoblize.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 4.0,
+                endurance: 9.75,
+                cast: 1.37,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Triage Beacon",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You can plant a Triage Beacon into the ground. The Beacon is immobile, but it emits a powerful healing aura. The Regeneration Rate of you, or your allies, will be greatly increased as long as you are near the Triage Beacon. The Beacon is invulnerable.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Place Beacon: PBAoE +Regen",
+            icon: "traps_droppedaoebuffregen.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 200.0,
+                endurance: 16.25,
+                cast: 2.77,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Acid Mortar",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "You can place a small Mortar on the ground. If an enemy passes nearby, the Mortar will fire an Acid grenade at the target. The grenade will explodes in a small shower of acid on impact. This acid eats through armor, causing minor damage over time. It reduces the target's Defense as well as their Damage Resistance. The mortar will last up to 60 seconds and will fire up to 10 grenades. It can be destroyed by your foes.<br><br><color #fcfc95>Damage: Minor(DoT).</color><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Place Trap: Ranged (AoE), Minor DoT(Toxic), Foe -Res(All), -DEF",
+            icon: "traps_droppedaoedebuffdefense.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 16.25,
+                cast: 2.77,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Force Field Generator",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "You can build a Force Field Generator Drone. It will generate a Dispersion Bubble that gives all nearby allies increased Defense against all attacks including Psionic. The Dispersion Bubble also protects allies from Immobilization, Disorient, and Hold effects. The Drone will follow you, can be buffed and healed or even destroyed. However, it is not a Henchman and cannot be given commands. Limited to one Force Field Generator.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Place Drone: PBAoE, Team +DEF, +Res(Hold, Immobilize, Disorient)",
+            icon: "traps_droppedaoebuffdefense.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 20.0,
+                recharge: 15.0,
+                endurance: 16.25,
+                cast: 2.03,
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Poison Trap",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Holds"],
+            description: "You can build a Poison Gas Trap on the ground. Any foes that pass near the Poison Trap will cause it to detonate and release its toxic vapors. The poison is a very noxious gas, and any foes in the affected area may start to choke or even vomit. Affected Foes Regeneration rate and attack rate will be reduced as well. The trap is almost impossible to detect, but it is fragile and may be set off by an enemy's explosion. Even if destroyed, the Trap will detonate.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Place Trap: PBAoE Foe Choke, Vomit, -Regen, -Recharge",
+            icon: "traps_droppedaoedebuffattackspeed.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 16.25,
+                cast: 2.77,
+                buffDuration: 260.0
+            }
+        },
+        {
+            name: "Seeker Drones",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Pet Damage", "Ranged AoE Damage", "Stuns", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You create two Seeker Drones. These Seeker Drones will follow you until they detect an enemy and then they will zero in on their targets and detonate on impact. The small explosive flash of energy does only minor damage, but the concussion can weaken foes. Affected targets will have reduced Damage, chance to hit and Perception and may even be Disoriented for a short while. You can only ever have Two Seeker Drones out at one time and they can be destroyed by your foes.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Summon Seekers: Ranged Disorient, -DMG, -To Hit, -Perception, Low DMG(Energy)",
+            icon: "traps_droppedaoedebuffdamage.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.2,
+                range: 60.0,
+                recharge: 90.0,
+                endurance: 19.5,
+                cast: 2.03,
+                buffDuration: 240.0
+            }
+        },
+        {
+            name: "Trip Mine",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You can place a Trip Mine on the ground. Any foes that pass near the Trip Mine will cause it to explode, severely damaging all nearby foes and sending them flying. The Trip Mine is almost impossible to detect, but it is fragile and may be set off by an enemy's explosion. Even if destroyed, the Trip Mine will detonate. Setting a mine is delicate work, and if you are interrupted, you will fail.<br><br><color #fcfc95>Damage: Superior.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Place Mine: PBAoE, Superior DMG(Lethal/Fire), Foe Knockback",
+            icon: "traps_droppedaoedamage.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                recharge: 20.0,
+                endurance: 16.25,
+                cast: 5.0,
+                buffDuration: 260.0
+            }
+        },
+        {
+            name: "Detonator",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "A good Mastermind always plans ahead, but a great one knows when to make a strategic sacrifice. You have equipped all your Henchmen with explosives. When the time is right, select a Henchman and set off the Detonator. <br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Sacrifice Henchman, PBAoE, Extreme DMG(Lethal/Fire), Foe Knockback",
+            icon: "traps_aoemassivedamage.png",
+            powerType: "Click",
+            targetType: "Own Pet (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 100.0,
+                recharge: 300.0,
+                endurance: 16.31,
+                cast: 2.03
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['mastermind/traps'] = MASTERMIND_TRAPS_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.MASTERMIND_TRAPS_POWERSET = MASTERMIND_TRAPS_POWERSET;
+}
+
+// ---- js/data/powersets/mastermind/trick-arrow.js ----
+;/**
+ * Trick Arrow
+ * Character Level: 50
+ * Archetype: mastermind
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const MASTERMIND_TRICK_ARROW_POWERSET = {
+    name: "Trick Arrow",
+    category: "Unknown",
+    description: "Trick Arrow powerset",
+    icon: "trick-arrow_set.png",
+    powers: [
+        {
+            name: "Entangling Arrow",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Immobilize", "Slow Movement"],
+            description: "You entangle a targeted foe causing their reflexes to become slowed and sluggish. This grounds them and causes them to have decreased movement speed and damage resistance. Weaker foes will also be immobilized.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, Target Immobilize, -Res(All), -Fly, Slow",
+            icon: "trickarrow_immobilize.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 80.0,
+                recharge: 4.0,
+                endurance: 6.5,
+                cast: 1.0,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Flash Arrow",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "To Hit Debuff"],
+            description: "This arrow explodes in a dazzling flash of light and sound. The targets are so blinded that they can hardly see a thing. Most foes will not be able to see past normal melee range, although some may have better perception. If the foes are attacked, they will be alerted to your presence, but will suffer a penalty to their chance to hit.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Targeted AoE), Foe -Visibility, -To Hit",
+            icon: "trickarrow_blind.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 15.0,
+                endurance: 9.75,
+                cast: 1.0,
+                tohitDebuff: 0.5,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Glue Arrow",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "This arrow carries a cartridge of intensely sticky glue, which explodes on impact. The glue Slows the movement and attack rates of any foes in the area.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Location AoE), Foe -Speed, -Recharge",
+            icon: "trickarrow_slow.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                endurance: 9.75,
+                cast: 1.16,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Ice Arrow",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "Slow", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Holds", "Slow Movement"],
+            description: "This arrow can freeze a single foe in a block of ice. The target is frozen solid, helpless, and can be attacked. More powerful foes may not be Held, but all affected targets will be Slowed, have their secondary effects weakened, and damage output reduced.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Foe Hold, -SPD, -Recharge, -DMG",
+            icon: "trickarrow_hold.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 18.0,
+                endurance: 10.66,
+                cast: 1.67,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Poison Gas Arrow",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Sleep", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Sleep"],
+            description: "This arrow carries a capsule cloud of poisonous gas, which explodes on impact and weakens all foes in its vicinity. Affected foes damage potential will be severely reduced. Some foes will react badly to the poison and choke for a time, though they will react if attacked.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Targeted AoE), Foe -DMG, Sleep",
+            icon: "trickarrow_debuffdamage.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.5,
+                range: 70.0,
+                recharge: 45.0,
+                endurance: 13.0,
+                cast: 1.16,
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Acid Arrow",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged AoE Damage", "Universal Damage Sets"],
+            description: "This arrow explodes in a small shower of acid on impact. This acid eats through armor, causing damage over time, reducing target's Defense as well as their resistance to debuffs, while making it harder for them to be healed.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged AoE Minor DoT(Toxic), Foe -Res(Special), Res(Heal), -DEF",
+            icon: "trickarrow_debuffdefense.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 20.0,
+                endurance: 9.75,
+                cast: 1.83,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.01,
+                    ticks: 20
+                },
+                buffDuration: 20.0,
+                defenseDebuff: 2.0
+            }
+        },
+        {
+            name: "Disruption Arrow",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "This arrow plants a sonic resonator at a target location. The vibrations of the resonator weaken the Damage Resistance and Recovery rate of all nearby foes.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Location AoE), -Res(All), -MaxEnd",
+            icon: "trickarrow_debuffdamres.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 30.0,
+                endurance: 18.2,
+                cast: 1.16,
+                buffDuration: 45.0
+            }
+        },
+        {
+            name: "Oil Slick Arrow",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage"],
+            allowedSetCategories: ["Defense Debuff", "Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "On impact, this arrow creates an oil slick that Slows foes in the area and may cause them to slip and fall. The oil slick is very flammable and may burst into flames if fire is used near it.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged (Location AoE), Knockdown, -Speed, -DEF, +Special",
+            icon: "trickarrow_knockdown.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 180.0,
+                endurance: 19.5,
+                cast: 1.16,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "EMP Arrow",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Holds"],
+            description: "EMP Arrow unleashes a massive pulse of electromagnetic energy on impact. Allies that enter the field will see an increase to their damage resistances against all damage except Toxic. They are also protected from status effects, knockbacks, endurance drain, recovery debuffs and recharge debuffs. Only one EMP Field can be sustained at once. This EMP will affect enemy machines adversively, and is even powerful enough to affect synaptic brain patterns. It will incapacitate all foes in its radius. Machines and robots are more likely to take high damage.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "AoE, Foe Hold, Special",
+            icon: "trickarrow_stun.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            maxTargets: 16,
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 300.0,
+                endurance: 29.25,
+                cast: 1.83,
+                buffDuration: 240.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['mastermind/trick-arrow'] = MASTERMIND_TRICK_ARROW_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.MASTERMIND_TRICK_ARROW_POWERSET = MASTERMIND_TRICK_ARROW_POWERSET;
+}
+
+// ---- js/data/epics/mastermind/charge_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Electricity Mastery
+ * Archetype: Mastermind
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\charge_mastery
+ */
+
+const EPIC_CHARGE_MASTERY = {
+  "id": "charge_mastery",
+  "name": "Electricity Mastery",
+  "displayName": "Electricity Mastery",
+  "archetype": "mastermind",
+  "description": "You have Mastery over Electrical power to defeat your foes, and to add some much needed armor and defense.",
+  "icon": "charge_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Static Discharge",
+      "fullName": "Epic.Charge_Mastery.Static_Discharge",
+      "rank": 1,
+      "available": 34,
+      "description": "Discharges a cone of Static Electricity that deals damage and drains Endurance from all affected foes in the area.",
+      "shortHelp": "Ranged (Cone), DMG(Energy), -END",
+      "icon": "electrical_mastery_static_discharge.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Mastermind",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 40.0,
+        "recharge": 24.0,
+        "endurance": 18.98,
+        "activationTime": 2.17,
+        "effectArea": "Cone",
+        "radius": 40.0,
+        "arc": 0.7854,
+        "damage": {
+          "type": "Energy",
+          "scale": 1.008,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Electric Shackles",
+      "fullName": "Epic.Charge_Mastery.Electric_Shackles",
+      "rank": 2,
+      "available": 34,
+      "description": "Electric Shackles binds a foes limbs, leaving the target held and helpless. The target is drained of some Endurance and some of that Endurance may be transferred back to you.",
+      "shortHelp": "Ranged, DMG(Energy), Foe Hold, -End",
+      "icon": "electrical_mastery_shocking_bolt.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Mastermind",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "Hold",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Holds",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 2.17,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "hold": 3.0
+        },
+        "damage": {
+          "type": "Energy",
+          "scale": 0.4113,
+          "table": "Melee_PvPDamage"
+        },
+        "recovery": {
+          "scale": -1.0,
+          "table": "Melee_Ones"
+        }
+      }
+    },
+    {
+      "name": "Thunder Strike",
+      "fullName": "Epic.Charge_Mastery.Thunder_Strike",
+      "rank": 3,
+      "available": 37,
+      "description": "A massive attack. You smash your foes with all the power of a lightning bolt. The pummeled victim takes tremendous damage and may be Disoriented. Any nearby foes may be knocked down and take some damage from the shockwave, as well as have some endurance drained. You must be level 38 and have one other Electricity Mastery Powers before selecting this power.",
+      "shortHelp": "Melee (AoE), DMG(Smash, Energy), Foe Disorient, Knockback, -End",
+      "icon": "chargemastery_thunderstrike.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Melee AoE Damage",
+        "Stuns",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 7.0,
+        "recharge": 40.0,
+        "endurance": 23.14,
+        "activationTime": 2.53,
+        "effectArea": "AoE",
+        "radius": 10.0
+      }
+    },
+    {
+      "name": "Surge of Power",
+      "fullName": "Epic.Charge_Mastery.Surge_of_Power",
+      "rank": 4,
+      "available": 40,
+      "description": "When you activate this power, you transform your body into living Electricity and become extremely resistant to all damage but Psionics. However, expending all this energy will leave you exhausted, and drained of all endurance. You must be level 41 and have one other Electricity Mastery Powers before selecting this power.",
+      "shortHelp": "Self, +Res(Special)",
+      "icon": "electrical_mastery_powersurge.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 1000.0,
+        "endurance": 3.25,
+        "activationTime": 1.96,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "smashing": {
+            "scale": 5.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 5.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 5.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 5.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 5.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 6.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 4.0,
+            "table": "Melee_Res_Dmg"
+          }
+        },
+        "recovery": {
+          "scale": -100.0,
+          "table": "Melee_Ones"
+        }
+      }
+    },
+    {
+      "name": "ESD",
+      "fullName": "Epic.Charge_Mastery.EM_Pulse",
+      "rank": 5,
+      "available": 43,
+      "description": "You can unleash a massive pulse of electromagnetic energy. This EMP will drain the endurance and HP regeneration of all affected targets and leave them incapacitated and Disoriented for a while. Additionally, most machines and robots will take moderate high damage. You must be level 44 and have two other Electricity Mastery Powers before selecting this power.",
+      "shortHelp": "PBAoE, Foe Disorient, -END, -Regen, Special vs. Robots; Self -Recovery",
+      "icon": "electrical_mastery_em_pulse.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Recharge",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Stuns"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 180.0,
+        "endurance": 25.225,
+        "activationTime": 2.93,
+        "effectArea": "AoE",
+        "radius": 25.0,
+        "protection": {
+          "stun": 3.0
+        },
+        "regeneration": {
+          "scale": -30.0,
+          "table": "Ranged_Res_Boolean"
+        },
+        "damage": {
+          "type": "Energy",
+          "scale": 1.64,
+          "table": "Ranged_Damage"
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['charge_mastery'] = EPIC_CHARGE_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/mastermind/chill_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Ice Mastery
+ * Archetype: Mastermind
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\chill_mastery
+ */
+
+const EPIC_CHILL_MASTERY = {
+  "id": "chill_mastery",
+  "name": "Ice Mastery",
+  "displayName": "Ice Mastery",
+  "archetype": "mastermind",
+  "description": "You have Mastery over Ice and Cold to control your foes and to add some much needed armor and defense.",
+  "icon": "chill_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Ice Blast",
+      "fullName": "Epic.Chill_Mastery.Ice_Blast",
+      "rank": 1,
+      "available": 34,
+      "description": "Ice Blast hurls shards of ice at foes and Slows their attacks and movement for a time. Slower recharge than Ice Bolt, but more damage.",
+      "shortHelp": "Ranged, DMG(Cold), Foe -Recharge, -SPD",
+      "icon": "ice_mastery_iceblast.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Mastermind",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Ranged Damage",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 8.0,
+        "endurance": 6.5,
+        "activationTime": 1.67,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Cold",
+          "scale": 1.889,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Flash Freeze",
+      "fullName": "Epic.Chill_Mastery.Flash_Freeze",
+      "rank": 2,
+      "available": 34,
+      "description": "You can Flash Freeze a large patch of ground beneath a targeted foe, instantly forming dozens of deadly ice shards that do Cold damage to all enemies in the area. The victims are left trapped within the icicles, but can break free if disturbed. Only targets near the ground can be affected.<br><br><color #fcfc95>Notes:<br>The Sleep component of this power is Auto Hit against regular enemies, but a To Hit check is required to against AVs and players, as well as to make secondary effects apply.</color>",
+      "shortHelp": "Ranged (Targeted AoE), DMG(Cold/Lethal), Foe Sleep",
+      "icon": "ice_mastery_flashfreeze.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Mastermind",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Sleep",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Ranged AoE Damage",
+        "Sleep",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 90.0,
+        "endurance": 19.5,
+        "activationTime": 2.37,
+        "effectArea": "AoE",
+        "radius": 25.0,
+        "protection": {
+          "sleep": 3.0
+        },
+        "damage": {
+          "type": "Cold",
+          "scale": 1.1914,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Hoarfrost",
+      "fullName": "Epic.Chill_Mastery.Hoarfrost",
+      "rank": 3,
+      "available": 37,
+      "description": "Activating this power covers you in a thick layer of Hoarfrost. The frost can absorb the impact from enemy attacks, effectively increasing your maximum Hit Points for a short time. Hoarfrost also grants you resistance to Toxic Damage. You must be level 38 and have one other Ice Mastery Powers before selecting this power.",
+      "shortHelp": "Self Heal, +Max HP, Res(Toxic)",
+      "icon": "ice_mastery_hoarfrost.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge",
+        "Heal"
+      ],
+      "allowedSetCategories": [
+        "Healing",
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 540.0,
+        "endurance": 18.2,
+        "activationTime": 0.73,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "toxic": {
+            "scale": 1.5,
+            "table": "Melee_Res_Dmg"
+          }
+        },
+        "damage": {
+          "type": "Heal",
+          "scale": 3.0,
+          "table": "Melee_HealSelf"
+        }
+      }
+    },
+    {
+      "name": "Frozen Armor",
+      "fullName": "Epic.Chill_Mastery.Snow_Storm",
+      "rank": 4,
+      "available": 40,
+      "description": "While this power is active, you coat yourself in rock hard Frozen Armor. The hardness of the Frozen Armor offers good defense to Smashing and Lethal attack as well as reduces Cold damage. Also, Fire attacks deal slightly less damage. You must be level 41 and have one other Ice Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Self +Def(Smash, Lethal), +Res(Cold, Fire)",
+      "icon": "ice_mastery_frozenarmor.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Defense Sets",
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 0.73,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "cold": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 1.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Hibernate",
+      "fullName": "Epic.Chill_Mastery.Hibernate",
+      "rank": 5,
+      "available": 43,
+      "description": "When you activate this power, you encase yourself in a block of solid ice, making yourself invulnerable, though you are frozen solid and cannot act. While Hibernating within this block of ice, you heal damage and recover endurance at an incredible rate. You can emerge at will by deactivating the power, but you cannot Hibernate for more than 30 seconds. If you activate this power while in the air, you will fall. You must be level 44 and have two other Ice Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Self +Regeneration, +Recovery, Invulnerable; Self Hold",
+      "icon": "ice_mastery_hibernate.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Recharge",
+        "Heal"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Healing"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 240.0,
+        "endurance": 0.1625,
+        "activationTime": 0.07,
+        "effectArea": "SingleTarget",
+        "regeneration": {
+          "scale": 10.0,
+          "table": "Melee_Ones"
+        },
+        "recovery": {
+          "scale": 4.0,
+          "table": "Melee_Ones"
+        },
+        "resistance": {},
+        "protection": {
+          "knockup": 1.0,
+          "knockback": 1.0,
+          "immobilize": 1000.0
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['chill_mastery'] = EPIC_CHILL_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/mastermind/field_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Energy Mastery
+ * Archetype: Mastermind
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\field_mastery
+ */
+
+const EPIC_FIELD_MASTERY = {
+  "id": "field_mastery",
+  "name": "Energy Mastery",
+  "displayName": "Energy Mastery",
+  "archetype": "mastermind",
+  "description": "You have Mastery over Energy and Force to protect yourself and defeat your foes.",
+  "icon": "field_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Temp Invulnerability",
+      "fullName": "Epic.Field_Mastery.Personal_Force_Field",
+      "rank": 1,
+      "available": 34,
+      "description": "When you toggle on this power, you become highly resistant to Smashing and Lethal damage.",
+      "shortHelp": "Toggle: Self +Res(Smash, Lethal)",
+      "icon": "fieldmastery_tempinvulnerability.png",
+      "powerType": "Toggle",
+      "requires": "$archetype == @Class_Mastermind",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 0.67,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "smashing": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "psionic": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 3.0,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Power Blast",
+      "fullName": "Epic.Field_Mastery.Power_Blast",
+      "rank": 2,
+      "available": 34,
+      "description": "A much more powerful, yet slower version of Power Bolt. Power Blast sends a focused beam of energy at a foe that can knock him back.",
+      "shortHelp": "Ranged, DMG(Energy/Smash), Foe Knockback",
+      "icon": "powerblast_powerblast.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Mastermind",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 8.0,
+        "endurance": 10.66,
+        "activationTime": 1.67,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Energy",
+          "scale": 0.3778,
+          "table": "Ranged_PvPDamage"
+        },
+        "protection": {
+          "knockback": 1.0
+        }
+      }
+    },
+    {
+      "name": "Energy Torrent",
+      "fullName": "Epic.Field_Mastery.Energy_Torrent",
+      "rank": 3,
+      "available": 37,
+      "description": "Energy Torrent unleashes a cone of powerful energy that can smash foes and possibly send them flying. You must be level 38 and have one other Energy Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Cone), DMG(Energy/Smash), Foe Knockback",
+      "icon": "primalforcesmastery_energytorrent.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 40.0,
+        "recharge": 24.0,
+        "endurance": 14.82,
+        "activationTime": 1.07,
+        "effectArea": "Cone",
+        "radius": 40.0,
+        "arc": 0.7854,
+        "damage": {
+          "type": "Energy",
+          "scale": 0.6203,
+          "table": "Ranged_PvPDamage"
+        },
+        "protection": {
+          "knockback": 1.0
+        }
+      }
+    },
+    {
+      "name": "Explosive Blast",
+      "fullName": "Epic.Field_Mastery.Repulsion_Bomb",
+      "rank": 4,
+      "available": 40,
+      "description": "You hurl a blast of charged energy that violently explodes on impact, damaging all foes near the target. Explosive Blast may knock targets backwards. You must be level 41 and have one other Energy Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Targeted AoE), DMG(Smash/Energy), Foe Knockback",
+      "icon": "powerblast_explosion.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 32.0,
+        "endurance": 18.98,
+        "activationTime": 1.67,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "damage": {
+          "type": "Energy",
+          "scale": 0.6797,
+          "table": "Ranged_PvPDamage"
+        },
+        "protection": {
+          "knockback": 1.0,
+          "stun": 2.0
+        }
+      }
+    },
+    {
+      "name": "Force of Nature",
+      "fullName": "Epic.Field_Mastery.Foce_of_Nature",
+      "rank": 5,
+      "available": 43,
+      "description": "When you activate this power, you become highly resistant to all damage types except psionics. Your endurance recovery is also increased. Force of Nature costs little endurance to activate, but when it wears off you are left exhausted, and drained of almost all endurance, and unable to recover endurance for a short while. You must be level 44 and have two other Energy Mastery Powers before selecting this power.",
+      "shortHelp": "Self, +Res(All DMG but Psionics)",
+      "icon": "fieldmastery_forceofnature.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 1000.0,
+        "endurance": 3.25,
+        "activationTime": 3.1,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "smashing": {
+            "scale": 5.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 5.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 5.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 5.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 5.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 5.0,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 5.0,
+            "table": "Melee_Res_Dmg"
+          }
+        },
+        "recovery": {
+          "scale": -1.0,
+          "table": "Melee_Ones"
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['field_mastery'] = EPIC_FIELD_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/mastermind/heat_mastery_stalker.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Fire Mastery
+ * Archetype: Mastermind
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\heat_mastery_stalker
+ */
+
+const EPIC_HEAT_MASTERY_STALKER = {
+  "id": "heat_mastery_stalker",
+  "name": "Fire Mastery",
+  "displayName": "Fire Mastery",
+  "archetype": "mastermind",
+  "description": "You have Mastery over Fire and Flame to control your foes and to add some much needed armor and defense.",
+  "icon": "heat_mastery_stalker_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Bonfire",
+      "fullName": "Epic.Heat_Mastery_Stalker.Bonfire",
+      "rank": 1,
+      "available": 34,
+      "description": "You can create a Bonfire that knocks back and burns any foes who try to pass through it. Cannot do critical hits.",
+      "shortHelp": "Ranged (Location AoE), DMG(Fire), Foe Knockback",
+      "icon": "heatmastery_bonfire.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Mastermind",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 70.0,
+        "recharge": 120.0,
+        "endurance": 16.25,
+        "activationTime": 3.07,
+        "effectArea": "Location"
+      }
+    },
+    {
+      "name": "Fire Blast",
+      "fullName": "Epic.Heat_Mastery_Stalker.Fire_Blast",
+      "rank": 2,
+      "available": 34,
+      "description": "Sends a Blast of Fire at a targeted foe and sets the target on fire for a short period of time. Slower recharge rate than Flares, but more damage.",
+      "shortHelp": "Ranged, DMG(Fire)",
+      "icon": "fireblast_fireblast.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Mastermind",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 8.0,
+        "endurance": 6.5,
+        "activationTime": 1.67,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Fire",
+          "scale": 1.889,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Fire Ball",
+      "fullName": "Epic.Heat_Mastery_Stalker.Fire_Ball",
+      "rank": 3,
+      "available": 37,
+      "description": "Hurls an exploding Fireball that consumes a targeted foe, and all nearby enemies. Anyone in that explosion is burned and set ablaze. You must be level 38 and have one other Fire Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Targeted AoE), DMG(Fire/Smash)",
+      "icon": "fireblast_fireball.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 32.0,
+        "endurance": 18.98,
+        "activationTime": 1.0,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "damage": {
+          "type": "Fire",
+          "scale": 0.1,
+          "table": "Ranged_Damage"
+        }
+      }
+    },
+    {
+      "name": "Char",
+      "fullName": "Epic.Heat_Mastery_Stalker.Melt_Armor",
+      "rank": 4,
+      "available": 40,
+      "description": "Incapacitates a distant foe by Charring him with smoldering soot and cinders. The target is left helpless, choking on the soot. The target will take some fire damage from char, but the damage is very trivial. You must be level 41 and have one other Fire Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged, DoT(Fire), Foe Hold",
+      "icon": "pyremastery_soot.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Hold",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Holds",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 1.07,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "hold": 3.0
+        },
+        "damage": {
+          "type": "Fire",
+          "scale": 0.4218,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Rise of the Phoenix",
+      "fullName": "Epic.Heat_Mastery_Stalker.Rise_of_the_Phoenix",
+      "rank": 5,
+      "available": 43,
+      "description": "If you are defeated, you can rise from the ashes. The fiery resurrection blasts nearby foes with an explosion and knocks them down. You will revive with about half of your Hit Points and Endurance. Rise of the Phoenix will actually leave you invulnerable for a brief time and protected from XP Debt for 20 seconds. You must be level 44 and have two other Fire Mastery Powers before selecting this power.",
+      "shortHelp": "Self Rez, Special",
+      "icon": "heatmastery_riseofthephoenix.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "Recharge",
+        "Heal",
+        "Damage"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Healing",
+        "Melee AoE Damage",
+        "Stuns",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 300.0,
+        "activationTime": 1.5,
+        "effectArea": "Location",
+        "damage": {
+          "type": "Heal",
+          "scale": 5.0,
+          "table": "Melee_HealSelf"
+        },
+        "protection": {
+          "immobilize": 50.0
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['heat_mastery_stalker'] = EPIC_HEAT_MASTERY_STALKER;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/mastermind/mastermind_dark_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Dark Mastery
+ * Archetype: Mastermind
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\mastermind_dark_mastery
+ */
+
+const EPIC_MASTERMIND_DARK_MASTERY = {
+  "id": "mastermind_dark_mastery",
+  "name": "Dark Mastery",
+  "displayName": "Dark Mastery",
+  "archetype": "mastermind",
+  "description": "You have Mastery over Darkness to control and blast your foes.",
+  "icon": "sentinel_dark_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Murky Cloud",
+      "fullName": "Epic.Mastermind_Dark_Mastery.Murky_Cloud",
+      "rank": 1,
+      "available": 34,
+      "description": "You create a Murky Cloud enshrouding you. This cloud can absorb all forms of energy, making you more resistant to Fire, Cold, Energy, and Negative Energy attacks.",
+      "shortHelp": "Toggle: Self +Res(Fire, Cold, Energy, Negative)",
+      "icon": "dark_mastery_murkycloud.png",
+      "powerType": "Toggle",
+      "requires": "$archetype == @Class_Mastermind",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 1.17,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "fire": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "smashing": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "psionic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Shadowy Binds",
+      "fullName": "Epic.Mastermind_Dark_Mastery.Shadowy_Binds",
+      "rank": 2,
+      "available": 34,
+      "description": "You take control of your victim's shadow causing it to entangle and bind its owner thus leaving them immobilized and suffering from negative energy damage over time and reducing their chance to hit. Immobilized foes cannot move but can still attack.",
+      "shortHelp": "Ranged, Moderate DoT(Negative), Foe Immobilize, -To Hit, -Fly",
+      "icon": "dark_mastery_penumbralgrasp.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Mastermind",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate To-Hit Debuff",
+        "Immobilize",
+        "Ranged Damage",
+        "To Hit Debuff",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.2,
+        "range": 50.0,
+        "recharge": 8.0,
+        "endurance": 8.405,
+        "activationTime": 1.2,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Negative",
+          "scale": 0.312,
+          "table": "Ranged_PvPDamage"
+        },
+        "protection": {
+          "immobilize": 5.0
+        },
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Dark Pit",
+      "fullName": "Epic.Mastermind_Dark_Mastery.Dark_Pit",
+      "rank": 3,
+      "available": 37,
+      "description": "Envelops a targeted foe and any nearby enemies in a pit of Negative Energy. The attack deals no damage, but Disorients all affected foes for a good while. You must be level 38 and have one other Dark Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Targeted AoE), Foe Disorient",
+      "icon": "dark_mastery_darkpit.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Stuns"
+      ],
+      "effects": {
+        "accuracy": 0.8,
+        "range": 70.0,
+        "recharge": 180.0,
+        "endurance": 25.225,
+        "activationTime": 1.07,
+        "effectArea": "AoE",
+        "radius": 20.0,
+        "protection": {
+          "stun": 3.0
+        }
+      }
+    },
+    {
+      "name": "Possess",
+      "fullName": "Epic.Mastermind_Dark_Mastery.Possess",
+      "rank": 4,
+      "available": 40,
+      "description": "You cause your targeted foe to be possessed by a dark entity from the Netherworld causing them to be confused for a short period of time. While confused they will be unable to tell the difference between friend or foe and will attack nearby allies. Possess will also hinder the target's abilities, lowering their chance ToHit, Damage, Healing, and the strength of their buffs, You must be level 41 and have one other Dark Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged, Target Confuse, -ToHit, -Damage, -Healing, -Special",
+      "icon": "dark_mastery_possess.png",
+      "powerType": "Click",
+      "requires": "Epic.Mastermind_Dark_Mastery.Murky_Cloud + Epic.Mastermind_Dark_Mastery.Shadowy_Binds > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Confuse",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Confuse"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 2.33,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "confuse": 3.0
+        }
+      }
+    },
+    {
+      "name": "Soul Consumption",
+      "fullName": "Epic.Mastermind_Dark_Mastery.Soul_Consumption",
+      "rank": 5,
+      "available": 43,
+      "description": "You consume life and soul from all enemies nearby, thus siginficantly increasing your maximum hitpoints and endurance. The more foes affected, the stronger the effect. You must be level 44 and have two other Dark Mastery Powers before selecting this power.",
+      "shortHelp": "PBAoE Self +Max HP, +Max End, Foe: -Max HP, -Max End",
+      "icon": "dark_mastery_soulconsumption.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Recharge",
+        "Heal",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate Healing",
+        "Endurance Modification",
+        "Healing"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 15.0,
+        "recharge": 600.0,
+        "endurance": 0.65,
+        "activationTime": 1.17,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "regeneration": {
+          "scale": -0.6,
+          "table": "Melee_Ones"
+        },
+        "damage": {
+          "type": "Heal",
+          "scale": 0.4,
+          "table": "Melee_HealSelf"
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['mastermind_dark_mastery'] = EPIC_MASTERMIND_DARK_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/mastermind/mastermind_leviathan_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Leviathan Mastery
+ * Archetype: Mastermind
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\mastermind_leviathan_mastery
+ */
+
+const EPIC_MASTERMIND_LEVIATHAN_MASTERY = {
+  "id": "mastermind_leviathan_mastery",
+  "name": "Leviathan Mastery",
+  "displayName": "Leviathan Mastery",
+  "archetype": "mastermind",
+  "description": "Captain Mako has granted you access to the power of the Leviathan. The Leviathan is an ancient gargantuan entity who slumbers under Sharkhead Isle. Worshiped by the Coralax, the Leviathan has given Captain Mako many abilities and now he has taught you how to harness its power.",
+  "icon": "mastermind_leviathan_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "School of Sharks",
+      "fullName": "Epic.Mastermind_Leviathan_Mastery.School_of_Sharks",
+      "rank": 1,
+      "available": 34,
+      "description": "You can call forth a school of vicious Shark Spirits that will swim out in a cone formation and will encircle your foes, draining their spirit energy. The encircling Shark Spirits will immobilize most foes while they deal negative energy damage over time. Both you and the target must be Near the Ground for this power to activate.",
+      "shortHelp": "Ranged (Cone), DoT(Negative), Foe Immobilize",
+      "icon": "arachnos_patron_coneimmobilize.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Blaster) || ($archetype == @Class_Mastermind))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Immobilize",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 50.0,
+        "recharge": 16.0,
+        "endurance": 10.751,
+        "activationTime": 2.37,
+        "effectArea": "Cone",
+        "radius": 50.0,
+        "arc": 0.5236,
+        "damage": {
+          "type": "Negative",
+          "scale": 0.1102,
+          "table": "Ranged_PvPDamage"
+        },
+        "protection": {
+          "immobilize": 3.0
+        },
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Bile Spray",
+      "fullName": "Epic.Mastermind_Leviathan_Mastery.Chum_Spray",
+      "rank": 2,
+      "available": 34,
+      "description": "Sharks will eat anything, so their stomach acid must be powerful indeed. You can regurgitate this acid and spew a corrosive spray of bile at a foe. Affected foes in the cone area will take toxic damage over time.",
+      "shortHelp": "Ranged (Cone), DoT(Toxic)",
+      "icon": "arachnos_patron_rangedconemoderatedmg.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Blaster) || ($archetype == @Class_Mastermind))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 32.0,
+        "endurance": 18.98,
+        "activationTime": 1.6,
+        "effectArea": "Cone",
+        "radius": 60.0,
+        "arc": 0.5236,
+        "damage": {
+          "type": "Toxic",
+          "scale": 0.0682,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Knockout Blow",
+      "fullName": "Epic.Mastermind_Leviathan_Mastery.Knockout_Blow",
+      "rank": 3,
+      "available": 37,
+      "description": "You can channel the massive strength of the Leviathan into a Knockout Blow. This punch does Superior damage, and has a great chance of Holding your target. You must be level 38 and have one other Leviathan Mastery Powers before selecting this power.",
+      "shortHelp": "Melee, DMG(Smash), Foe Hold",
+      "icon": "arachnos_patron_koblow.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Hold",
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Holds",
+        "Knockback",
+        "Melee Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.2,
+        "range": 13.2,
+        "recharge": 40.0,
+        "endurance": 23.14,
+        "activationTime": 2.23,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Smashing",
+          "scale": 3.561,
+          "table": "Melee_PvPDamage"
+        },
+        "protection": {
+          "hold": 3.0,
+          "knockup": 1.0
+        }
+      }
+    },
+    {
+      "name": "Shark Skin",
+      "fullName": "Epic.Mastermind_Leviathan_Mastery.Shark_Skin",
+      "rank": 4,
+      "available": 40,
+      "description": "The power of the Leviathan Mako has shown you seems to have no end. Shark Skin improves your damage resistance to Lethal, Smashing and cold damage. You must be level 41 and have one other Leviathan Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Self +Res(Smash, Lethal, Cold)",
+      "icon": "arachnos_patron_resistbuff.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 0.67,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "smashing": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "psionic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Spirit Shark Jaws",
+      "fullName": "Epic.Mastermind_Leviathan_Mastery.Spirit_Shark_Jaws",
+      "rank": 5,
+      "available": 43,
+      "description": "You can summon a massive Spirit Shark that will attack your foe from below. The Shark will grip your foe with its massive jaws and attempt to hold the target while it mauls it, dealing lethal Damage over Time. Flying Targets will likely be pulled to the ground. You must be level 44 and have two other Leviathan Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged, DoT(Lethal), Foe Hold, -Fly",
+      "icon": "arachnos_patron_targetedhold.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Hold",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Holds",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 1.87,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "hold": 3.0
+        },
+        "damage": {
+          "type": "Lethal",
+          "scale": 0.2604,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['mastermind_leviathan_mastery'] = EPIC_MASTERMIND_LEVIATHAN_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/mastermind/mastermind_mace_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Mace Mastery
+ * Archetype: Mastermind
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\mastermind_mace_mastery
+ */
+
+const EPIC_MASTERMIND_MACE_MASTERY = {
+  "id": "mastermind_mace_mastery",
+  "name": "Mace Mastery",
+  "displayName": "Mace Mastery",
+  "archetype": "mastermind",
+  "description": "Black Scorpion has granted you access to the advanced technology of the Nullifier Mace. The signature weapon of the Wolf Spider TacOps troops, it is not a typical clumsy mace. The Nullifier Mace is capable of firing a variety of energy projectiles and grenades. It can even be modified to summon and command some or Black Scorpion's RV technologies.",
+  "icon": "mastermind_mace_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Web Envelope",
+      "fullName": "Epic.Mastermind_Mace_Mastery.Web_Envelope",
+      "rank": 1,
+      "available": 34,
+      "description": "The Nullifier Mace can lob a modified Web Grenade. Upon impact, the Web Grenade expels a strong, tenuous, and very sticky substance that can Immobilize most targets in a wide area. This device deals toxic damage over time and does not prevent targets from attacking, although their attack rate is Slowed. The Web can bring down flying entities and halts jumping.",
+      "shortHelp": "Ranged (Targeted AoE) DoT(Toxic), Immobilize, -Recharge, -Fly, -Jump",
+      "icon": "arachnos_patron_rangedaoeimmobilize.png",
+      "powerType": "Click",
+      "requires": "($archetype == @Class_Mastermind) && (Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Immobilize",
+        "Ranged AoE Damage",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 50.0,
+        "recharge": 16.0,
+        "endurance": 10.751,
+        "activationTime": 2.0,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "protection": {
+          "immobilize": 3.0
+        },
+        "damage": {
+          "type": "Toxic",
+          "scale": 0.2503,
+          "table": "Ranged_PvPDamage"
+        },
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Scorpion Shield",
+      "fullName": "Epic.Mastermind_Mace_Mastery.Scorpion_Shield",
+      "rank": 2,
+      "available": 34,
+      "description": "Black Scorpion's technologies are impressive indeed. This energy shield grants you Defense to Lethal, Smashing and Energy attacks, as well as improves your damage resistance to Toxic damage.",
+      "shortHelp": "Toggle: Self, +Def(Smash,Lethal,Energy), +Res(Toxic)",
+      "icon": "arachnos_patron_defensebuff.png",
+      "powerType": "Toggle",
+      "requires": "($archetype == @Class_Mastermind) && (Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Defense Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 2.0,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Mace Beam Volley",
+      "fullName": "Epic.Mastermind_Mace_Mastery.Mace_Beam_Volley",
+      "rank": 3,
+      "available": 37,
+      "description": "Fires a volley of multiple kinetic energy blasts from your Nullifier Mace. These blast spread out in a wide cone and are powerful enough to knock down some foes. You must be level 38 and have one other Mace Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Cone), DMG(Energy), Foe Knockback",
+      "icon": "arachnos_patron_rangedconemoderatedmg.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 50.0,
+        "recharge": 32.0,
+        "endurance": 18.98,
+        "activationTime": 2.0,
+        "effectArea": "Cone",
+        "radius": 50.0,
+        "arc": 0.6109,
+        "damage": {
+          "type": "Energy",
+          "scale": 1.2118,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Power Boost",
+      "fullName": "Epic.Mastermind_Mace_Mastery.Power_Boost",
+      "rank": 4,
+      "available": 40,
+      "description": "Greatly boosts the secondary effects of your powers. Your powers effects like Disorients, Holds, Immobilizes, Heals, Defense Buffs, Endurance Drains, Knockbacks and more, are all improved. The effects of Power Boost last a short while, and only the next couple of attacks will be boosted. You must be level 41 and have one other Mace Mastery Powers before selecting this power.",
+      "shortHelp": "Self +Special",
+      "icon": "arachnos_patron_powerboost.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 120.0,
+        "endurance": 9.75,
+        "activationTime": 1.17,
+        "effectArea": "SingleTarget"
+      }
+    },
+    {
+      "name": "Web Cocoon",
+      "fullName": "Epic.Mastermind_Mace_Mastery.Web_Cocoon",
+      "rank": 5,
+      "available": 43,
+      "description": "The Bane Mace can fire a more powerful version the common web grenade. The sinewy fibers of this grenade are strong enough to completely Hold one target. Targets able to resist the Hold are still likely to have their attack and movement speed dramatically slowed. Web Cocoon can also bring down flying targets and prevent foes from jumping. You must be level 44 and have two other Mace Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged, Foe Hold, -Recharge, -Fly, -Jump, Slow, DoT(Toxic)",
+      "icon": "arachnos_patron_targetedhold.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Hold",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Holds",
+        "Ranged Damage",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 60.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 2.0,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "hold": 3.0
+        },
+        "damage": {
+          "type": "Toxic",
+          "scale": 0.345,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['mastermind_mace_mastery'] = EPIC_MASTERMIND_MACE_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/mastermind/mastermind_mu_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Mu Mastery
+ * Archetype: Mastermind
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\mastermind_mu_mastery
+ */
+
+const EPIC_MASTERMIND_MU_MASTERY = {
+  "id": "mastermind_mu_mastery",
+  "name": "Mu Mastery",
+  "displayName": "Mu Mastery",
+  "archetype": "mastermind",
+  "description": "Scirocco has taught you the ancient powers of the Mu. In their eternal struggle against the Oranbega, the Mu have unlocked many mystical powers, including their very signature crimson lightning. Now you possess their secrets.",
+  "icon": "mastermind_mu_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Static Discharge",
+      "fullName": "Epic.Mastermind_Mu_Mastery.Static_Discharge",
+      "rank": 1,
+      "available": 34,
+      "description": "Hurls multiple bolts of Mu Electricity in an arc that deals damage and drains Endurance from all affected foes in the area.",
+      "shortHelp": "Ranged (Cone), DMG(Energy), -END",
+      "icon": "arachnos_patron_rangedconemoderatedmg.png",
+      "powerType": "Click",
+      "requires": "($archetype == @Class_Mastermind) && (Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 40.0,
+        "recharge": 24.0,
+        "endurance": 18.98,
+        "activationTime": 2.07,
+        "effectArea": "Cone",
+        "radius": 40.0,
+        "arc": 0.7854,
+        "damage": {
+          "type": "Energy",
+          "scale": 1.3147,
+          "table": "Ranged_PvPDamage"
+        },
+        "recovery": {
+          "scale": -1.0,
+          "table": "Ranged_Ones"
+        }
+      }
+    },
+    {
+      "name": "Charged Armor",
+      "fullName": "Epic.Mastermind_Mu_Mastery.Charged_Armor",
+      "rank": 2,
+      "available": 34,
+      "description": "When you toggle on this power, you are surrounded in a charged field that makes you highly resistant to Smashing, Lethal and Energy damage.",
+      "shortHelp": "Toggle: Self +Res(Smash, Lethal, Energy)",
+      "icon": "arachnos_patron_resistbuff.png",
+      "powerType": "Toggle",
+      "requires": "($archetype == @Class_Mastermind) && (Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 0.67,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "smashing": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "psionic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Thunder Strike",
+      "fullName": "Epic.Mastermind_Mu_Mastery.Thunder_Strike",
+      "rank": 3,
+      "available": 37,
+      "description": "A massive attack. You smash your foes with all the power of a lightning bolt. The pummeled victim takes tremendous damage and may be Disoriented. Any nearby foes may be knocked down and take some damage from the shockwave, as well as have some endurance drained. You must be level 38 and have one other Mu Mastery Powers before selecting this power.",
+      "shortHelp": "Melee (AoE), DMG(Smash, Energy), Foe Disorient, Knockback, -End",
+      "icon": "arachnos_patron_meleetargetedaoe.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Knockback",
+        "Melee AoE Damage",
+        "Stuns",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 7.0,
+        "recharge": 40.0,
+        "endurance": 23.14,
+        "activationTime": 2.53,
+        "effectArea": "AoE",
+        "radius": 10.0
+      }
+    },
+    {
+      "name": "Electrifying Fences",
+      "fullName": "Epic.Mastermind_Mu_Mastery.Electrifying_Fences",
+      "rank": 4,
+      "available": 40,
+      "description": "The Electrifying Fences attempts to Immobilize a group of foes in an area. This power deals some energy damage over time as it slowly drains some Endurance. You must be level 41 and have one other Mu Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Targeted AoE), DoT(Energy), Foe Immobilize, -END",
+      "icon": "arachnos_patron_rangedaoeimmobilize.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Immobilize",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 50.0,
+        "recharge": 16.0,
+        "endurance": 10.751,
+        "activationTime": 1.17,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "damage": {
+          "type": "Energy",
+          "scale": 0.0929,
+          "table": "Ranged_PvPDamage"
+        },
+        "protection": {
+          "immobilize": 3.0
+        },
+        "resistance": {},
+        "recovery": {
+          "scale": -1.0,
+          "table": "Ranged_Ones"
+        }
+      }
+    },
+    {
+      "name": "Electric Shackles",
+      "fullName": "Epic.Mastermind_Mu_Mastery.Electric_Shackles",
+      "rank": 5,
+      "available": 43,
+      "description": "Electric Shackles binds a foes limbs, leaving the target held and helpless. The target is drained of some Endurance and some of that Endurance may be transferred back to you. Your access to this Adept is very limited. You must be level 44 and have two other Mu Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged, DMG(Energy), Foe Hold, -End",
+      "icon": "arachnos_patron_targetedhold.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "Hold",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Holds",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 2.17,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "hold": 3.0
+        },
+        "damage": {
+          "type": "Energy",
+          "scale": 0.4113,
+          "table": "Ranged_PvPDamage"
+        },
+        "recovery": {
+          "scale": -1.0,
+          "table": "Ranged_Ones"
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['mastermind_mu_mastery'] = EPIC_MASTERMIND_MU_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/mastermind/mastermind_soul_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Soul Mastery
+ * Archetype: Mastermind
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\mastermind_soul_mastery
+ */
+
+const EPIC_MASTERMIND_SOUL_MASTERY = {
+  "id": "mastermind_soul_mastery",
+  "name": "Soul Mastery",
+  "displayName": "Soul Mastery",
+  "archetype": "mastermind",
+  "description": "Ghost Widow has granted you access to the power of darkness and souls. She has shown you how to use the souls of your victims to destroy your enemies. This has granted you access to powers and abilities you have never had before.",
+  "icon": "mastermind_soul_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Night Fall",
+      "fullName": "Epic.Mastermind_Soul_Mastery.Night_Fall",
+      "rank": 1,
+      "available": 34,
+      "description": "Unleashes a cone shaped burst of particles from the Netherworld. All targets within the modest range of this power take Negative Energy damage and have a reduced Accuracy.",
+      "shortHelp": "Ranged (Cone), DMG(Negative), Foe -ACC",
+      "icon": "arachnos_patron_conedot.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Blaster) || ($archetype == @Class_Mastermind))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate To-Hit Debuff",
+        "Ranged AoE Damage",
+        "To Hit Debuff",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 20.0,
+        "endurance": 16.38,
+        "activationTime": 2.0,
+        "effectArea": "Cone",
+        "radius": 60.0,
+        "arc": 0.3491,
+        "damage": {
+          "type": "Negative",
+          "scale": 0.0938,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Dark Embrace",
+      "fullName": "Epic.Mastermind_Soul_Mastery.Dark_Embrace",
+      "rank": 2,
+      "available": 34,
+      "description": "You tap into the energy of the Netherworld to protect yourself from damage. This Dark Embrace shrouds you and grants resistance to Lethal, Smashing, Negative Energy and Toxic damage.<br><br><color #fcfc95>Recharge: Fast.</color>",
+      "shortHelp": "Toggle: Self +Res(Smash, Lethal, Negative, Toxic)",
+      "icon": "arachnos_patron_resistbuff.png",
+      "powerType": "Toggle",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Blaster) || ($archetype == @Class_Mastermind))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Resistance",
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Resist Damage"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 8.0,
+        "endurance": 0.1625,
+        "activationTime": 0.67,
+        "effectArea": "SingleTarget",
+        "resistance": {
+          "smashing": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "lethal": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "negative": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "toxic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "fire": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "cold": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "energy": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          },
+          "psionic": {
+            "scale": 2.75,
+            "table": "Melee_Res_Dmg"
+          }
+        }
+      }
+    },
+    {
+      "name": "Oppressive Gloom",
+      "fullName": "Epic.Mastermind_Soul_Mastery.Oppressive_Gloom",
+      "rank": 3,
+      "available": 37,
+      "description": "The Netherworld has many mutable properties, such as the Oppressive Gloom. This power allows you to use your own Hit Points to keep enemies near you Disoriented and unable to use any powers. Endurance cost for this is minimal, but the power can be dangerous to use. You must be level 38 and have one other Soul Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: PBAoE, Foe Disorient, Self -HP",
+      "icon": "arachnos_patron_pbaoestun.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Stuns"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 16.0,
+        "endurance": 0.195,
+        "activationTime": 1.17,
+        "effectArea": "AoE",
+        "radius": 12.0,
+        "protection": {
+          "stun": 2.0
+        },
+        "damage": {
+          "type": "Special",
+          "scale": 0.1,
+          "table": "Melee_Damage"
+        }
+      }
+    },
+    {
+      "name": "Soul Tentacles",
+      "fullName": "Epic.Mastermind_Soul_Mastery.Soul_Tentacles",
+      "rank": 4,
+      "available": 40,
+      "description": "You can create a cone shaped rift to the Netherworld that allows the souls of the damned to slip into our reality. These Soul Tentacles will snare all foes within range, Immobilizing them while they drain their life. You must be level 41 and have one other Soul Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Cone), DMG(Negative), Foe Immobilize",
+      "icon": "arachnos_patron_coneimmobilize.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Immobilize",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 50.0,
+        "recharge": 16.0,
+        "endurance": 10.751,
+        "activationTime": 1.67,
+        "effectArea": "Cone",
+        "radius": 50.0,
+        "arc": 0.5236,
+        "damage": {
+          "type": "Negative",
+          "scale": 0.1588,
+          "table": "Ranged_PvPDamage"
+        },
+        "protection": {
+          "immobilize": 3.0
+        },
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Soul Storm",
+      "fullName": "Epic.Mastermind_Soul_Mastery.Soul_Storm",
+      "rank": 5,
+      "available": 43,
+      "description": "Like Ghost Widow, you can summon the souls of your victims to do your bidding. Soul Storm enraptures a single target Holding them while their life-force is drained from their body. You must be level 44 and have two other Soul Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged, DoT(Negative), Foe Hold",
+      "icon": "arachnos_patron_targetedhold.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Hold",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Holds",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 2.17,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "hold": 3.0
+        },
+        "damage": {
+          "type": "Negative",
+          "scale": 0.2879,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['mastermind_soul_mastery'] = EPIC_MASTERMIND_SOUL_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
@@ -0,0 +1,10809 @@
+// ---- js/data/powersets/sentinel/archery.js ----
+;/**
+ * Archery
+ * Character Level: 50
+ * Archetype: sentinel
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const SENTINEL_ARCHERY_POWERSET = {
+    name: "Archery",
+    category: "Unknown",
+    description: "Archery powerset",
+    icon: "archery_set.png",
+    powers: [
+        {
+            name: "Aimed Shot",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "Though it takes longer to execute, your Aimed Shot deals greater damage than Snap Shot.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, Light DMG(Lethal)",
+            icon: "archery_mediumarrow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.155,
+                range: 60.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    type: "Lethal",
+                    scale: 2.26
+                }
+            }
+        },
+        {
+            name: "Snap Shot",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "A quick attack that fires an arrow at your foe after only minimal aiming. Fast, but little damage.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Ranged, Light DMG(Lethal)",
+            icon: "archery_quickarrow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.155,
+                range: 60.0,
+                recharge: 2.0,
+                endurance: 3.54,
+                cast: 1.0,
+                damage: {
+                    type: "Lethal",
+                    scale: 2.02
+                }
+            }
+        },
+        {
+            name: "Fistful of Arrows",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You fire a fistful of arrows at foes in a cone in front of you. Good at close range.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged (Cone), Light DMG(Lethal)",
+            icon: "archery_conearrow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 6,
+            arc: 0.8727,
+            effects: {
+                accuracy: 1.155,
+                range: 40.0,
+                recharge: 8.0,
+                endurance: 8.53,
+                cast: 1.17,
+                damage: {
+                    type: "Lethal",
+                    scale: 1.5373
+                }
+            }
+        },
+        {
+            name: "Stunning Shot",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Sentinel Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "You fire a blunt, weighted arrow at your target's chest. The Stunning Shot inflicts high damage and has a good chance of stunning your foe.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged Disorient, Moderate DMG(Smashing)",
+            icon: "archery_stunarrow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.155,
+                range: 60.0,
+                recharge: 8.0,
+                endurance: 8.53,
+                cast: 1.0,
+                damage: {
+                    type: "Smashing",
+                    scale: 3.0599999999999996
+                },
+                stun: 3.0
+            }
+        },
+        {
+            name: "Aim",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the chance to hit of your attacks for a few seconds. Slightly increases damage and range.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +To Hit, +DMG, +Range",
+            icon: "archery_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.625,
+                damageBuff: 0.425,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Explosive Arrow",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You fire a grenade-tipped arrow at long range. This explosion affects all within the blast radius, and can knock them back.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Targeted AoE), Light DMG(Lethal/Fire), Knockback",
+            icon: "archery_explodingarrow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.155,
+                range: 40.0,
+                recharge: 16.0,
+                endurance: 15.18,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 1.8777
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 1.2976999999999999
+                        }
+                    ],
+                    scale: 3.1754
+                }
+            }
+        },
+        {
+            name: "Blazing Arrow",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You fire a Blazing Arrow at your foe, dealing some Lethal damage and causing them to catch on fire and burn.<br><br><color #fcfc95>Damage: Superior.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged, Superior DMG(Lethal), Minor DoT(Fire)",
+            icon: "archery_flamingarrow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.155,
+                range: 60.0,
+                recharge: 10.0,
+                endurance: 10.19,
+                cast: 1.83,
+                damage: {
+                    type: "Lethal",
+                    scale: 4.041
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.125,
+                    ticks: 4
+                },
+                buffDuration: 4.125
+            }
+        },
+        {
+            name: "Perfect Shot",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "A perfectly aimed and fast shot that blasts your foes.<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, High DMG(Lethal)",
+            icon: "archery_heavy.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.386,
+                range: 60.0,
+                recharge: 12.0,
+                endurance: 11.86,
+                cast: 1.67,
+                damage: {
+                    type: "Lethal",
+                    scale: 4.329
+                }
+            }
+        },
+        {
+            name: "Rain of Arrows",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You unleash a Rain of Arrows on a targeted location, damaging foes within a large area.",
+            shortHelp: "Ranged (Location AoE), Extreme DoT(Lethal)",
+            icon: "archery_rainofarrows.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 2.0,
+                buffDuration: 3.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['sentinel/archery'] = SENTINEL_ARCHERY_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.SENTINEL_ARCHERY_POWERSET = SENTINEL_ARCHERY_POWERSET;
+}
+
+// ---- js/data/powersets/sentinel/assault-rifle.js ----
+;/**
+ * Assault Rifle
+ * Character Level: 50
+ * Archetype: sentinel
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const SENTINEL_ASSAULT_RIFLE_POWERSET = {
+    name: "Assault Rifle",
+    category: "Unknown",
+    description: "Assault Rifle powerset",
+    icon: "assault-rifle_set.png",
+    powers: [
+        {
+            name: "Burst",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "Quickly fires a Burst of rounds at a single target at very long range. Damage is average, but the fire rate is fast. Can also reduce the target's defense.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, DMG(Lethal), Foe -DEF",
+            icon: "assaultweapons_arburst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 60.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                dotDamage: {
+                    type: "Lethal",
+                    scale: 0.69,
+                    ticks: 3
+                },
+                buffDuration: 0.91,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Disorienting Shot",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Sentinel Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "Fires a single non lethal rubber bullet that can seriously Disorient a target. Deals average damage but renders most targets unable to attack for a good while.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, DMG(Smash), Foe Disorient",
+            icon: "assaultweapons_shotgunbeanbag.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 60.0,
+                recharge: 5.0,
+                endurance: 6.032,
+                cast: 0.9,
+                damage: {
+                    type: "Smashing",
+                    scale: 2.3899999999999997
+                },
+                stun: 3.0
+            }
+        },
+        {
+            name: "Buckshot",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "Good at close range. Fires a cone of Buckshot pellets and can knock some foes down.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged (Cone), DMG(Lethal), Foe Knockback",
+            icon: "assaultweapons_shotgunbuckshot.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 6,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.05,
+                range: 40.0,
+                recharge: 8.0,
+                endurance: 8.53,
+                cast: 0.9,
+                damage: {
+                    type: "Lethal",
+                    scale: 1.5350000000000001
+                }
+            }
+        },
+        {
+            name: "Slug",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "Fires a single Slug at a targeted foe. Firing a single Slug is slower than firing a Burst, but deals more damage and can knock down foes.<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged, DMG(Lethal), Foe Knockback",
+            icon: "assaultweapons_shotgunslug.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 60.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.4,
+                damage: {
+                    type: "Lethal",
+                    scale: 3.34
+                }
+            }
+        },
+        {
+            name: "Aim",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the chance to hit of your attacks for a few seconds. Slightly increases damage and range.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +ToHit, +DMG, +Range",
+            icon: "assaultweapons_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.625,
+                damageBuff: 0.425,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "M30 Grenade",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "Launches a Grenade at long range from beneath the barrel of your Assault Rifle. This explosion affects all within the blast radius, and can knock them back.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Targeted AoE), DMG(Fire/Lethal), Foe Knockback",
+            icon: "assaultweapons_arm30grenade.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.05,
+                range: 40.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 1.8944
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 1.8943
+                        }
+                    ],
+                    scale: 3.7887000000000004
+                }
+            }
+        },
+        {
+            name: "Flamethrower",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "Spews forth a cone of flames from underneath the barrel of your assault rifle, setting foes on fire. Very accurate and very deadly at medium range.<br><br><color #fcfc95>Damage: Superior.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Cone), DoT(Fire)",
+            icon: "assaultweapons_arflamethrower.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 6,
+            arc: 0.7854,
+            effects: {
+                accuracy: 1.3,
+                range: 40.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 2.33,
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.6251,
+                    ticks: 4
+                },
+                buffDuration: 4.7
+            }
+        },
+        {
+            name: "Ignite",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "Sprays a target with accelerant from your flamethrower, igniting it and causing extreme damage over time. Also sets the location on fire if the target is grounded, inflicting damage to additional foes that step in the area.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, DoT(Fire), Location AoE, DoT(Fire)",
+            icon: "assaultweapons_dot.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.15,
+                range: 40.0,
+                recharge: 14.0,
+                endurance: 13.52,
+                cast: 2.0,
+                damage: {
+                    type: "Fire",
+                    scale: 1.9077
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.19490000000000002,
+                    ticks: 21
+                },
+                buffDuration: 5.25
+            }
+        },
+        {
+            name: "Full Auto",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "Opens up your assault rifle on Full Auto to lay down a massive spray of bullets at your target. Although very slow to reload, damage from this attack is massive, shredding all targets within the cone of effect. There's a chance you may land a lucky shot for extra damage.<br><br><color #fcfc95>Damage: Superior.</color><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged (Cone), DoT(Lethal), +Special",
+            icon: "assaultweapons_arfullauto.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.35,
+                range: 40.0,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 2.5,
+                dotDamage: {
+                    type: "Lethal",
+                    scale: 0.5086999999999999,
+                    ticks: 10
+                },
+                buffDuration: 2.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['sentinel/assault-rifle'] = SENTINEL_ASSAULT_RIFLE_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.SENTINEL_ASSAULT_RIFLE_POWERSET = SENTINEL_ASSAULT_RIFLE_POWERSET;
+}
+
+// ---- js/data/powersets/sentinel/beam-rifle.js ----
+;/**
+ * Beam Rifle
+ * Character Level: 50
+ * Archetype: sentinel
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const SENTINEL_BEAM_RIFLE_POWERSET = {
+    name: "Beam Rifle",
+    category: "Unknown",
+    description: "Beam Rifle powerset",
+    icon: "beam-rifle_set.png",
+    powers: [
+        {
+            name: "Charged Shot",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "By charging up your Beam Rifle, you're able to launch a concentrated blast of energy at your foe to cause High Energy damage. The impact strikes with such force that it can knock your target off of their feet. Charge Shot causes additional damage if the target is suffering from the Disintegrating effect. In addition, targets already affected by the Disintegrating effect have a chance to spread to 3 nearby targets. This Disintegrate Spread effect can only hit targets that aren't already affected by the Disintegrating effect. Disintegrate Spread causes Energy damage over time.",
+            shortHelp: "Ranged, DMG(Energy), Foe Knockdown, Special",
+            icon: "beamrifle_chargedshot.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 60.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    type: "Energy",
+                    scale: 4.0583
+                }
+            }
+        },
+        {
+            name: "Single Shot",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You fire a single blast from your Beam Rifle which deals Moderate Energy damage and has a chance to knock the target down. If the target is suffering from the Disintegrating effect, Single Shot will reduce the target's regeneration rate slightly. In addition, targets already affected by the Disintegrating effect have a chance to spread to 3 nearby targets. This Disintegrate Spread effect can only hit targets that aren't already affected by the Disintegrating effect. Disintegrate Spread causes Minor Energy damage over time.",
+            shortHelp: "Ranged, DMG(Energy), Foe Knockdown, Special",
+            icon: "beamrifle_singleshot.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 60.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    type: "Energy",
+                    scale: 2.26
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Cutting Beam",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You fire a constant stream of energy from your weapon and sweep it in a broad arc blasting all foes in a wide cone in front of you. Cutting beam deals Moderate Energy damage and reduces the targets' Defense. This power will cause Minor Energy damage over time if the target is suffering from the Disintegrating effect.",
+            shortHelp: "Ranged (Cone), DMG(Energy), Foe -Def(All), Special",
+            icon: "beamrifle_cuttingbeam.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 6,
+            arc: 0.7854,
+            effects: {
+                accuracy: 1.05,
+                range: 40.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.9,
+                damage: {
+                    type: "Energy",
+                    scale: 1.838
+                },
+                dotDamage: {
+                    type: "Energy",
+                    scale: 0.1968,
+                    ticks: 2
+                },
+                buffDuration: 2.1,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Disintegrate",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You fire a stream of energy at your foe which causes them to slowly disintegrate and suffer High Energy damage over time. Even after the damage over time effect wears off the target will have their regeneration rate reduced and suffer from the Disintegration effect for an additional period of time. Using Beam Rifle powers on targets affected by Disintegrate will inflict additional effects. Additionally if Single Shot, Charged Shot, Lancer Shot and Penetrating Ray are used on a target suffering from Disintegrating, they have a chance to cause this effect to spread to up 3 nearby targets that aren't already suffering from Disintegrating. Targets affected by this Disintegrate Spread will also suffer some Energy damage over time.",
+            shortHelp: "Ranged, DoT(Energy), Foe -Regen, Special",
+            icon: "beamrifle_disintegrate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.1,
+                range: 60.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.9,
+                dotDamage: {
+                    type: "Energy",
+                    scale: 0.429,
+                    ticks: 9
+                },
+                buffDuration: 10.5
+            }
+        },
+        {
+            name: "Aim",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the chance to hit of your attacks for a few seconds. Slightly increases damage and range.",
+            shortHelp: "Self +To Hit, +DMG, +Range",
+            icon: "beamrifle_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.625,
+                damageBuff: 0.425,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Lancer Shot",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Sentinel Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "You charge up your Beam Rifle and deliver an incredibly focused ray of energy at a nearby foe that deals Superior Energy damage and will briefly stun the target. Lancer Shot will cause additional damage if the target is suffering from the Disintegrating effect. In addition, targets already affected by the Disintegrating effect have a chance to spread to 3 nearby targets. This Disintegrate Spread effect can only hit targets that aren't already affected by the Disintegration effect. Disintegrate Spread causes Energy damage over time.",
+            shortHelp: "Ranged, DMG(Energy), Foe Stun, Special",
+            icon: "beamrifle_lancershot.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 60.0,
+                recharge: 11.0,
+                endurance: 11.024,
+                cast: 1.9,
+                damage: {
+                    type: "Energy",
+                    scale: 5.148000000000001
+                },
+                stun: 3.0
+            }
+        },
+        {
+            name: "Refractor Beam",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You carefully calibrate your rifle and shoot a refractor beam that will split up on impact, dealing moderate energy damage and reducing the defense of your target and 9 nearby foes. The beam has a high chance to split again off the secondary targets, hitting up to 10 foes. If the target is also suffering from the Disintegrating effect it will suffer additional damage over time.",
+            shortHelp: "Chain, DMG(Energy), Special",
+            icon: "beamrifle_refractorbeam.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.05,
+                range: 40.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.67,
+                damage: {
+                    type: "Energy",
+                    scale: 1.58
+                },
+                dotDamage: {
+                    type: "Energy",
+                    scale: 0.174,
+                    ticks: 2
+                },
+                buffDuration: 3.1,
+                defenseDebuff: 0.5
+            }
+        },
+        {
+            name: "Piercing Beam",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You release a supercharged beam in a narrow cone of energy that pierces through up to 3 enemies. Piercing Beam deals High Energy damage and briefly reduces their damage resistance. If a target struck by Piercing Beam is suffering from the Disintegrating effect it will immediately suffer additional damage.",
+            shortHelp: "Narrow Ranged (Cone), DMG(Energy), Foes -Res, Special",
+            icon: "beamrifle_piercingbeam.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 3,
+            arc: 0.0873,
+            effects: {
+                accuracy: 1.05,
+                range: 60.0,
+                recharge: 14.0,
+                endurance: 13.52,
+                cast: 2.33,
+                damage: {
+                    type: "Energy",
+                    scale: 6.1932
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Overcharge",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged AoE Damage", "Sentinel Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "You overcharge your Beam Rifle and release a massive blast of energy at a group of distant foes causing Extreme Energy damage, causing Minor Energy damage over time, reducing the defense of all affected foes and potentially stunning affected foes. If Overcharge strikes a target suffering from the Disintegrating effect they will be affected by a longer stun.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Energy), Foe Minor DoT (Energy), -Def(All), Disorient, Special",
+            icon: "beamrifle_overcharge.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.4,
+                range: 40.0,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 2.9,
+                damage: {
+                    type: "Energy",
+                    scale: 4.6885
+                },
+                dotDamage: {
+                    type: "Energy",
+                    scale: 0.1,
+                    ticks: 3
+                },
+                buffDuration: 3.1,
+                defenseDebuff: 1.5,
+                stun: 3.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['sentinel/beam-rifle'] = SENTINEL_BEAM_RIFLE_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.SENTINEL_BEAM_RIFLE_POWERSET = SENTINEL_BEAM_RIFLE_POWERSET;
+}
+
+// ---- js/data/powersets/sentinel/bio-organic-armor.js ----
+;/**
+ * Bio Organic Armor
+ * Character Level: 50
+ * Archetype: sentinel
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const SENTINEL_BIO_ORGANIC_ARMOR_POWERSET = {
+    name: "Bio Organic Armor",
+    category: "Unknown",
+    description: "Bio Organic Armor powerset",
+    icon: "bio-organic-armor_set.png",
+    powers: [
+        {
+            name: "Defensive Adaptation",
+            available: -1,
+            tier: 2,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "By activating this power you cause your Bio Armor to spontaneously mutate, causing it to become dense and durable. While active Hardened Carapace grants additional resistance to Lethal, Smashing and Toxic damage, Inexhaustible grants additional Maximum HP, Environmental Adaptation grants additional defense and a small amount of Maximum HP, Ablative Carapace grants additional damage absorption, Rebuild DNA restores additional health, Athletic Regulation will make you more resistant to run and fly speed debuffs, Genomic Evolution will grant a small amount of additional damage resistance, Parasitic Leech grants additional damage absorption and increases the effectiveness of it's damage debuff. Additionally, many of your damaging attacks will heal you for a minor amount of health. However, the bulkiness of this adaptation reduces your damage moderately.<br><br>Defensive Adaptation costs no endurance.",
+            shortHelp: "Toggle: Bio Armor Defensive Mode",
+            icon: "bioorganicarmor_defensiveadaptation.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                cast: 1.0,
+                buffDuration: 1.1
+            }
+        },
+        {
+            name: "Efficient Adaptation",
+            available: -1,
+            tier: 2,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "Efficient Adaptation<br><br>By activating this power you cause your Bio Armor to spontaneously mutate, causing it to become evenly distributed along your body. While active Hardened Carapace grants a minor Endurance Discount, Inexhaustible and Parasitic Leech will grant additional regeneration and recovery, Ablative Carapace grants a bonus to regeneration, Rebuild DNA grants a massive bonus to recovery, Athletic Regulation will increase your run and flight speeds, and Genomic Evolution will increase your maximum endurance.<br><br>Efficient Adaptation costs no endurance.",
+            shortHelp: "Toggle: Bio Armor Efficient Mode",
+            icon: "bioorganicarmor_efficientadaptation.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                cast: 0.67,
+                buffDuration: 1.1
+            }
+        },
+        {
+            name: "Offensive Adaptation",
+            available: -1,
+            tier: 2,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "By activating this power you cause your Bio Armor to spontaneously mutate, causing it to sprout spines and become much lighter. While active Hardened Carapace increases your damage slightly, Environmental Adaptation grants you a moderate to hit buff, Athletic Regulation will increase your run and flight speeds, Genomic Evolution grants a small range buff, and the regeneration debuff from Parasitic Leech will be increased. Additionally, many of your damaging powers will inflict a minor amount of additional Toxic damage. While Offensive Adaptation is active your Defense and Damage Resistance is reduced slightly.<br><br>Offensive Adaptation costs no endurance.",
+            shortHelp: "Toggle: Bio Armor Offensive Mode",
+            icon: "bioorganicarmor_offensiveadaptation.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                cast: 0.67,
+                resistance: {
+                    smashing: -0.075,
+                    lethal: -0.075,
+                    fire: -0.075,
+                    cold: -0.075,
+                    energy: -0.075,
+                    negative: -0.075,
+                    psionic: -0.075,
+                    toxic: -0.075
+                },
+                buffDuration: 1.1
+            }
+        },
+        {
+            name: "Hardened Carapace",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "With a little concentration you can cause your skin to become hard as stone, boosting your constitution to reject toxins. While active, this power will boost your resistance to Lethal, Smashing and Toxic damage, and grant protection to Disorient and Sleep effects.<br><br><color #fac39b>*While Offensive Adaptation is active, this power will grant a minor boost to damage.</color><br><color #9efa9b>*While Defensive Adaptation is active, Hardened Carapace will grant additional resistance to Lethal, Smashing and Toxic damage.</color><br><color #9bfafa>*While Efficient Adaptation is active, Hardened Carapace will grant an Endurance Discount.</color><br><br>Bonuses granted from Adaptations are unenhanceable.",
+            shortHelp: "Self Toggle, +Res(Lethal, Smash, Toxic, Disorient, Sleep), +Special",
+            icon: "bioorganicarmor_hardenedskin.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.67,
+                protection: {
+                    stun: 8.304,
+                    sleep: 8.304
+                },
+                resistance: {
+                    smashing: 0.17500000000000002,
+                    lethal: 0.17500000000000002,
+                    toxic: 0.17500000000000002
+                },
+                buffDuration: 0.75,
+                stun: 1.0,
+                stunDuration: 0.75
+            }
+        },
+        {
+            name: "Inexhaustible",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "Your body constantly evolves and addresses weaknesses. As a result you receive a moderate bonus to maximum hit points, regeneration, and recovery, as well as gaining a measure of Slow and Endurance Drain Resistance. Half of this power's maximum hit point increase is unenhanceable.<br><br><color #fac39b>*This power doesn't grant any bonuses to Offensive Adaptation.</color><br><color #9efa9b>*While Defensive Adaptation is active you gain a small amount of additional maximum hit points.</color><br><color #9bfafa>*While Efficient Adaptation is active, this power grants a small bonus to recovery and regeneration.</color><br><br>Bonuses granted from Adaptations are unenhanceable.<br><br>This power is always active and costs no endurance.",
+            shortHelp: "Auto: +Max HP, +Regen, +Recovery, +Res(Slow, End Drain), +Special",
+            icon: "bioorganicarmor_inexhaustible.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                debuffResistance: {
+                    endurance: 0.5536,
+                    recharge: 0.3,
+                    movement: 0.3
+                },
+                buffDuration: 5.25
+            }
+        },
+        {
+            name: "Environmental Adaptation",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Your body can spontaneously adapt to its surroundings and your mind has learned to shield itself from harmful effects by constant exposure to these dangers. While active you gain moderate defense to Fire, Cold, Energy and Negative Energy damage, and a small amount of defense to Psionic damage. Additionally you are protected against hold, knockdown and immobilize effects.<br><br><color #fac39b>*While Offensive Adaptation is active you'll gain a moderate To Hit bonus.</color><br><color #9efa9b>*While Defensive Adaptation is active you gain a minor amount of Lethal, Smashing, Fire, Cold, Energy, Negative Energy and Psionic defense, as well as a minor amount of maximum hit points.</color><br><color #9bfafa>*This power doesn't grant any bonuses to Efficient Adaptation.</color><br><br>These special bonuses are unenhanceable.",
+            shortHelp: "Self Toggle, +Res(Hold, Knockdown, Immobilize), +Def(Energy, Negative, Fire, Cold, Psionic), +Special",
+            icon: "bioorganicarmor_environmentalmodification.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.73,
+                protection: {
+                    hold: 8.304,
+                    immobilize: 8.304
+                },
+                defense: {
+                    fire: 0.10500000000000001,
+                    cold: 0.10500000000000001,
+                    energy: 0.10500000000000001,
+                    negative: 0.10500000000000001,
+                    psionic: 0.052500000000000005,
+                    smashing: 0.03150000000000001,
+                    lethal: 0.03150000000000001
+                },
+                buffDuration: 0.75,
+                tohitBuff: 0.75
+            }
+        },
+        {
+            name: "Adaptation",
+            available: 9,
+            tier: 3,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "By purchasing this power you gain access to three mutually exclusive toggle powers: Efficient Adaptation, Defensive Adaptation and Offensive Adaptation.<br><br><color #fac39b>While Offensive Adaptation is active you gain bonus damage from Hardened Carapace, additional To Hit from Environmental Adaptation, increased run and flight speeds from Athletic Regulation, small range buff from Genomic Evolution, and increased regeneration debuff from Parasitic Leech.</color><br><br><color #9efa9b>While Defensive Adaptation is active you gain improved damage resistance from Hardened Carapace and Genomic Evolution, additional defense and increased Maximum HP from Environmental Adaptation, additional damage absorption from Ablative Carapace, gain run and fly speed debuff resistance from Athletic Regulation, and increased damage absorption and damage debuff from Parasitic Leech.</color><br><br><color #9bfafa>While Efficient Adaptation is active Hardened Carapace will provide a moderate endurance discount, Inexhaustible and Parasitic Leech has increased Regeneration and Recovery, Ablative Carapace grants additional regeneration, Rebuild DNA grants a massive bonus to recovery, Athletic Regulation increases your run and flight speeds, and Genomic Evolution will increase your max endurance</color>",
+            shortHelp: "Gain Efficient, Defensive and Offensive Adaptations",
+            icon: "bioorganicarmor_adaptation.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0
+            }
+        },
+        {
+            name: "Ablative Carapace",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "When needed, you're able to cause your Bio Armor to gain a thick, but brittle outer layer that will absorb a large amount of damage before breaking off. Ablative Carapace will grant a moderate amount of damage absorption and a high amount of regeneration for a short time.<br><br><color #fac39b>*This power doesn't grant any bonuses to Offensive Adaptation.</color><br><color #9efa9b>*While Efficient Adaptation is active, this power grants a slightly larger regeneration buff.</color><br><color #9bfafa>*While Defensive Adaptation is active, this power grants a bonus to damage absorption.</color><br><br>Bonuses granted from Adaptations are unenhanceable.",
+            shortHelp: "Self, +Absorption, +Regeneration",
+            icon: "bioorganicarmor_ablativecarapace.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 10.4,
+                cast: 2.03,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Rebuild DNA",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "You rebuild your genetic makeup to restore some of your health and endurance.<br><br><color #fac39b>*While Offensive Adaptation is active, this power's will increase your perception.</color><br><color #9efa9b>*While Defensive Adaptation is active, this power will grant bonus health.</color><br><color #9bfafa>*While Efficient Adaptation is active, this power will grant bonus endurance.</color><br><br>Bonuses granted from Adaptations are unenhanceable.",
+            shortHelp: "Self +HP, +End, +Special",
+            icon: "bioorganicarmor_rebuilddna.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 13.0,
+                cast: 0.73,
+                healing: {
+                    scale: 108.42831,
+                    perTarget: true
+                },
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Athletic Regulation",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "Your body is continually regulating your athletic capabilities to best fit your current need. You also gain a small amount of defense debuff resistance.<br><br><color #fac39b>*While Offensive Adaptation is active you gain increased movement speed. </color><br><color #9efa9b>*While Defensive Adaptation is active you are more resistant to run and fly speed debuffs. </color><br><color #9bfafa>*While Efficient Adaptation is active all your run and fly powers have their speeds boosted.</color><br><br>Bonuses granted from Adaptations are unenhanceable.<br><br>This power is always on and permanently increases your movement speed, regardless your Adaptation.",
+            shortHelp: "Auto: Self +SPD, +Special",
+            icon: "bioorganicarmor_athleticaugmentation.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                debuffResistance: {
+                    defense: 0.2076,
+                    movement: 0.4
+                },
+                buffDuration: 2.25
+            }
+        },
+        {
+            name: "Genomic Evolution",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "Your body has evolved to protect you from all damage types. As a result you receive a moderate bonus to damage resistance against all types.<br><br><color #fac39b>*While Offensive Adaptation is active you gain increased range buff.</color><br><color #9efa9b>*While Defensive Adaptation is active you gain a bonus to damage resistance.</color><br><color #9bfafa>*While Efficient Adaptation is active you gain a power bonus to your max endurance.</color><br><br>Bonuses granted from Adaptations are unenhanceable.<br><br>This power is always active and cost no endurance.",
+            shortHelp: "Auto: +Res(All), +Special",
+            icon: "bioorganicarmor_genomicevolution.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Toxic",
+                            scale: 1.3,
+                            ticks: 2
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.975,
+                            ticks: 2
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 0.975,
+                            ticks: 2
+                        },
+                        {
+                            type: "Psionic",
+                            scale: 0.78,
+                            ticks: 2
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.65,
+                            ticks: 2
+                        },
+                        {
+                            type: "Cold",
+                            scale: 0.65,
+                            ticks: 2
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.65,
+                            ticks: 2
+                        },
+                        {
+                            type: "Negative",
+                            scale: 0.65,
+                            ticks: 2
+                        }
+                    ]
+                },
+                resistance: {
+                    smashing: 0.052500000000000005,
+                    lethal: 0.052500000000000005,
+                    fire: 0.035,
+                    cold: 0.035,
+                    energy: 0.035,
+                    negative: 0.035,
+                    psionic: 0.042,
+                    toxic: 0.07
+                },
+                buffDuration: 5.25
+            }
+        },
+        {
+            name: "Parasitic Leech",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Endurance Modification", "Healing"],
+            description: "You release a wave of parasites around you that draw out your enemies' genetic material. These parasites dramatically increase your survivability by gaining damage absorption while boosting your regeneration and recovery rate for a short time. Affected foes will be infected and have reduced regeneration for a short while.<br><br><color #fac39b>*While Offensive Adaptation is active, this power will apply a stronger regeneration debuff.</color><br><color #9efa9b>*While Defensive Adaptation is active, this power will grant a small amount of additional damage absorption and inflict a damage debuff.</color><br><color #9bfafa>*While Efficient Adaptation is active, this power will grant additional regeneration and recovery per target hit.</color>",
+            shortHelp: "PBAoE, Self +Absorb, +Regeneration, +Recovery, Foe -DMG",
+            icon: "bioorganicarmor_parasiticleech.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.5,
+                range: 40.0,
+                recharge: 270.0,
+                endurance: 18.2,
+                cast: 1.87,
+                buffDuration: 45.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['sentinel/bio-organic-armor'] = SENTINEL_BIO_ORGANIC_ARMOR_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.SENTINEL_BIO_ORGANIC_ARMOR_POWERSET = SENTINEL_BIO_ORGANIC_ARMOR_POWERSET;
+}
+
+// ---- js/data/powersets/sentinel/dark-armor.js ----
+;/**
+ * Dark Armor
+ * Character Level: 50
+ * Archetype: sentinel
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const SENTINEL_DARK_ARMOR_POWERSET = {
+    name: "Dark Armor",
+    category: "Unknown",
+    description: "Dark Armor powerset",
+    icon: "dark-armor_set.png",
+    powers: [
+        {
+            name: "Dark Embrace",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You tap into the energy of the Netherworld to protect yourself from damage. This Dark Embrace shrouds you and grants resistance to Lethal, Smashing, Negative Energy and Toxic damage.",
+            shortHelp: "Toggle: Self +Res(Smash, Lethal, Negative, Toxic)",
+            icon: "darkarmor_darkembrace.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.104,
+                cast: 0.67,
+                resistance: {
+                    smashing: 0.21000000000000002,
+                    lethal: 0.21000000000000002,
+                    negative: 0.14,
+                    toxic: 0.14
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Shadow Dweller",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Defense Sets", "Healing"],
+            description: "You are a true Shadow Dweller of the Netherworld. Your affinity for the shadows grants you an inherent bonus to all Defense, as well as an increased regeneration, Perception and a resistance to Immobilization. Your Perception bonus and resistance to Immobilization improves over level. Shadow Dweller is an Auto power. It is always on and costs no Endurance.",
+            shortHelp: "Auto: Self +Regen, +DEF(All but Toxic and Psionic), +Res(Immobilize), +Perception",
+            icon: "darkarmor_selfbuffdefense.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                defense: {
+                    smashing: 0.0175,
+                    lethal: 0.0175,
+                    fire: 0.0175,
+                    cold: 0.0175,
+                    energy: 0.0175,
+                    negative: 0.0175
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Murky Cloud",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You create a Murky Cloud enshrouding you. This cloud can absorb all forms of energy, making you more resistant to Fire, Cold, Energy, and Negative Energy attacks, as well as Endurance Drain effects.",
+            shortHelp: "Toggle: Self +Res(Fire, Cold, Energy, Negative, End Drain)",
+            icon: "darkarmor_defractingcloud.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.104,
+                cast: 1.17,
+                resistance: {
+                    fire: 0.21000000000000002,
+                    cold: 0.21000000000000002,
+                    energy: 0.14,
+                    negative: 0.14
+                },
+                debuffResistance: {
+                    recovery: 0.5536,
+                    endurance: 0.5536
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Obsidian Shield",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You can create a special Obsidian Shield that grants good resistance to Psionic damage. With your mind enshrouded in darkness you are protected from Sleep, Fear, Hold and Disorient attacks.",
+            shortHelp: "Toggle: Self +Res(Psionic, Sleep, Hold, Disorient, Fear)",
+            icon: "darkarmor_obsidianshield.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 1.17,
+                protection: {
+                    hold: 8.304,
+                    stun: 8.304,
+                    sleep: 8.304,
+                    fear: 8.304
+                },
+                resistance: {
+                    psionic: 0.35000000000000003
+                },
+                debuffResistance: {
+                    tohit: 0.3,
+                    defense: 0.3,
+                    recharge: 0.3,
+                    movement: 0.5
+                },
+                buffDuration: 0.75,
+                stun: 1.0,
+                stunDuration: 0.75,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Dark Regeneration",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Healing", "Melee AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You can tap the dark essence of the Netherworld to drain a small amount of life from all enemies nearby, thus healing yourself. The more foes affected, the more you will be healed.<br><br>This power is mutually exclusive from Obscure Sustenance.",
+            shortHelp: "PBAoE DMG(Negative), Self +HP",
+            icon: "darkarmor_darkregeneration.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 30.0,
+                endurance: 33.8,
+                cast: 1.17,
+                damage: {
+                    type: "Negative",
+                    scale: 0.2
+                },
+                healing: {
+                    scale: 361.42769999999996,
+                    perTarget: true
+                }
+            }
+        },
+        {
+            name: "Obscure Sustenance",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You can tap the dark essence of the Netherworld increase your regeneration and recovery rate, as well as making you resistance to -ToHit and -Regeneration debuffs.<br><br>This power is mutually exclusive from Dark Regeneration.",
+            shortHelp: "Self Heal, +Regen, Res(-ToHit, -Regeneration), +Recovery(Special)",
+            icon: "darkarmor_darkregeneration.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 2.0,
+                recharge: 60.0,
+                endurance: 10.4,
+                cast: 1.93,
+                debuffResistance: {
+                    tohit: 0.2076,
+                    regeneration: 0.2076
+                },
+                healing: {
+                    scale: 301.18975,
+                    perTarget: true
+                },
+                buffDuration: 10.0,
+                tohitBuff: 0.75
+            }
+        },
+        {
+            name: "Cloak of Darkness",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "A shroud of Netherworld darkness envelops you, making you difficult to spot at a distance. You can be seen only at close range, or if you attack a target. Even if seen, the Cloak of Darkness grants you a bonus to Defense to all attacks and some protection from Immobilization. This Netherworld Cloak also allows you to see things in a new light, allowing you to better see stealthy foes.",
+            shortHelp: "Toggle: Self Stealth, +DEF(All), +Perception, Res (Immobilize)",
+            icon: "darkarmor_cloakofdarkness.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 1.17,
+                protection: {
+                    immobilize: 8.304
+                },
+                defense: {
+                    smashing: 0.035,
+                    lethal: 0.035,
+                    fire: 0.035,
+                    cold: 0.035,
+                    energy: 0.035,
+                    negative: 0.035,
+                    psionic: 0.035,
+                    toxic: 0.035
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Cloak of Fear",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Fear", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Fear", "To Hit Debuff"],
+            description: "You can wrap yourself in a nightmarish Cloak of Fear. Foes close to you are treated to visions most horrific, lowering their damage ouptupt and forcing them to tremble in terror, only attacking if attacked, and even then, with a reduced chance to hit. Feeding on your enemies fear will increase your protection against knockback effects.<br><br><color #fcfc95>Notes: Mez enhancements on this power enhance its magnitude instead of its duration.</color>",
+            shortHelp: "Toggle: PBAoE Self +Res(Knockback), Foe Fear, -ACC",
+            icon: "darkarmor_fearfulaura.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 0.8,
+                recharge: 4.0,
+                endurance: 0.26,
+                cast: 1.17
+            }
+        },
+        {
+            name: "Oppressive Gloom",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Stuns"],
+            description: "The Netherworld has many mutable properties, such as the Oppressive Gloom. This power allows you to use your own Hit Points to keep enemies near you Disoriented and unable to use any powers. Endurance cost for this is minimal, but the power can be dangerous to use.",
+            shortHelp: "Toggle: PBAoE, Foe Disorient, Self -HP",
+            icon: "darkarmor_oppressivegloom.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 8.0,
+                endurance: 0.156,
+                cast: 1.17,
+                stun: 2.0
+            }
+        },
+        {
+            name: "Soul Transfer",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Endurance Modification", "Healing", "Melee AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "You transfer the souls of nearby enemies into yourself, stunning them while making you able to absorb some damage. This will also make you resistant to control effects, -ToHit debuffs and endurance drain for a short time. You can use this power while concious or after defeat. If used while concious and are defeated soon after, you will automatically bounce back into the fight. If used after defeat, Soul Transfer will also inflict damage as you suck the life force of all foes around you and bring yourself back from the brink of death. This form of the power is much more likely to stun foes.<br><br><color #fcfc95>Notes: This power recharges in <color #FF7F27>10</color> seconds if no foes are hit. Otherwise, it recharges in <color #FF7F27>300</color> seconds.</color>",
+            shortHelp: "Self Rez, +Absorb, +Res(Disorient, Sleep, Hold, Immobilize, Knockback, -ToHit, -Endurance), +Special, Foe Disorient",
+            icon: "darkarmor_soultransfer.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 10.4,
+                cast: 1.17
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['sentinel/dark-armor'] = SENTINEL_DARK_ARMOR_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.SENTINEL_DARK_ARMOR_POWERSET = SENTINEL_DARK_ARMOR_POWERSET;
+}
+
+// ---- js/data/powersets/sentinel/dark-blast.js ----
+;/**
+ * Dark Blast
+ * Character Level: 50
+ * Archetype: sentinel
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const SENTINEL_DARK_BLAST_POWERSET = {
+    name: "Dark Blast",
+    category: "Unknown",
+    description: "Dark Blast powerset",
+    icon: "dark-blast_set.png",
+    powers: [
+        {
+            name: "Dark Blast",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Ranged Damage", "Sentinel Archetype Sets", "To Hit Debuff", "Universal Damage Sets"],
+            description: "A long range blast of dark energy. Deals moderate Negative Energy damage and reduces the target's chance to hit.",
+            shortHelp: "Ranged, DMG(Negative), Foe -To Hit",
+            icon: "darkcast_darkblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    type: "Negative",
+                    scale: 2.26
+                },
+                tohitDebuff: 0.75,
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Gloom",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Ranged Damage", "Sentinel Archetype Sets", "To Hit Debuff", "Universal Damage Sets"],
+            description: "Gloom slowly drains a target of life, while reducing their chance to hit. Slower than Dark Blast, but deals more damage over time.",
+            shortHelp: "Ranged, DoT(Negative), Foe -To Hit",
+            icon: "darkcast_souldrain.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                dotDamage: {
+                    type: "Negative",
+                    scale: 0.4561,
+                    ticks: 7
+                },
+                buffDuration: 3.6,
+                tohitDebuff: 0.75
+            }
+        },
+        {
+            name: "Umbral Torrent",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Knockback", "Ranged AoE Damage", "Sentinel Archetype Sets", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You summon a wave of mire that sweeps away foes within its arc. This attack deals moderate Negative Energy damage to foes, reduces their chance to hit and sends them flying.",
+            shortHelp: "Ranged (Cone), DMG(Negative), Foe -To Hit, Knockback",
+            icon: "darkcast_torrent.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 6,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 1.03,
+                damage: {
+                    type: "Negative",
+                    scale: 2.0768
+                },
+                tohitDebuff: 0.75,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Abyssal Gaze",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Holds", "Ranged Damage", "Sentinel Archetype Sets", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You gaze into your foe's eyes giving them a glimpse into the terrifying netherworld rendering them held, reducing their chance to hit and dealing High Negative Energy damage over the next couple of seconds.",
+            shortHelp: "Ranged, DoT(Negative), Foe Hold, -To Hit",
+            icon: "darkcast_abyssalgaze.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 11.0,
+                endurance: 11.024,
+                cast: 1.67,
+                dotDamage: {
+                    type: "Negative",
+                    scale: 1.3767,
+                    ticks: 2
+                },
+                buffDuration: 2.1,
+                tohitDebuff: 0.75
+            }
+        },
+        {
+            name: "Aim",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the chance to hit of your attacks for a few seconds. Slightly increases damage and range.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +To Hit, +DMG, +Range",
+            icon: "darkcast_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.625,
+                damageBuff: 0.425,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Dark Obliteration",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Ranged AoE Damage", "Sentinel Archetype Sets", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You hurl a large blast of negative energy that violently explodes on impact, exposing the dark power of the Netherworld to all foes near the target. Dark Obliteration can reduce the Accuracy of all affected targets.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Negative), Foe -ACC",
+            icon: "darkcast_darkobliteration.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.0,
+                damage: {
+                    type: "Negative",
+                    scale: 1.4354
+                },
+                tohitDebuff: 0.75,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Antumbral Beam",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Ranged Damage", "Sentinel Archetype Sets", "To Hit Debuff", "Universal Damage Sets"],
+            description: "An extremely focused beam of Negative Energy that deals tremendous damage and reduces the target's chance to hit.",
+            shortHelp: "Ranged, DMG(Negative), Target -To Hit",
+            icon: "darkcast_heavy.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 60.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 2.07,
+                damage: {
+                    type: "Negative",
+                    scale: 5.209
+                },
+                tohitDebuff: 0.75,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Life Drain",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Accurate To-Hit Debuff", "Healing", "Ranged Damage", "Sentinel Archetype Sets", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You can tap the power of the Netherworld to steal some life from a target foe and reduce their chance to hit. Some of that stolen life is transferred to you in the form of Hit Points.",
+            shortHelp: "Ranged, DMG(Negative), Target -To Hit, Self +HP",
+            icon: "darkcast_lifedrain.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.93,
+                damage: {
+                    type: "Negative",
+                    scale: 3.7110000000000003
+                },
+                healing: {
+                    scale: 120.4759,
+                    perTarget: true
+                },
+                tohitDebuff: 0.75,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Blackstar",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Melee AoE Damage", "Sentinel Archetype Sets", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You can unleash a devastating blast of Negative Energy around yourself, dealing massive Negative Energy and Smashing damage and severely reducing affected foes' chance to hit.",
+            shortHelp: "PBAoE, DMG(Negative), Foe -To Hit",
+            icon: "darkcast_blackstar.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.4,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 3.0,
+                damage: {
+                    type: "Negative",
+                    scale: 4.7059999999999995
+                },
+                tohitDebuff: 5.0,
+                buffDuration: 20.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['sentinel/dark-blast'] = SENTINEL_DARK_BLAST_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.SENTINEL_DARK_BLAST_POWERSET = SENTINEL_DARK_BLAST_POWERSET;
+}
+
+// ---- js/data/powersets/sentinel/dual-pistols.js ----
+;/**
+ * Dual Pistols
+ * Character Level: 50
+ * Archetype: sentinel
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const SENTINEL_DUAL_PISTOLS_POWERSET = {
+    name: "Dual Pistols",
+    category: "Unknown",
+    description: "Dual Pistols powerset",
+    icon: "dual-pistols_set.png",
+    powers: [
+        {
+            name: "Chemical Ammunition",
+            available: -1,
+            tier: 2,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "While this toggle is active you will be equipped with 'Chemical Rounds.' Most of your Dual Pistol attacks will have their secondary damage converted to toxic damage and inflict a minor damage debuff effect on the target.<br><br>In order to earn this power, you must purchase the Swap Ammo power.",
+            shortHelp: "Toggle: Ammo Change (Toxic), Special",
+            icon: "dualpistols_chemicalammo.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                cast: 0.63,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Cryo Ammunition",
+            available: -1,
+            tier: 2,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "While this toggle is active you will be equipped with 'Cryo Rounds'. Most of your Dual Pistol attacks will have their secondary damage converted to cold damage and inflict a minor slow effect on the target.<br><br>Cryo Rounds are more aerodynamic, being able to travel a greater distance.<br><br>In order to earn this power, you must purchase the Swap Ammo power.",
+            shortHelp: "Toggle: Ammo Change (Cold), Special",
+            icon: "dualpistols_cryoammo.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                cast: 0.63,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Incendiary Ammunition",
+            available: -1,
+            tier: 2,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "While this toggle is active you will be equipped with 'Incendiary Rounds.' Most of your Dual Pistol attacks will have their secondary damage converted to fire damage and inflict a minor damage over time effect.<br><br>In order to earn this power, you must purchase the Swap Ammo power.",
+            shortHelp: "Toggle: Ammo Change (Fire), Special",
+            icon: "dualpistols_incendiaryammo.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                cast: 0.63,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Dual Pistols",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "You're a master of akimbo pistols, wielding a high caliber firearm in each hand. Your attacks primarily deal lethal damage and you have a wide variety of attacks, however your strength lies within your ability to use your \"Swap Ammo\" power to change out your ammo mid-battle. Doing so can change your secondary damage type and effects making you an incredibly versatile ranged combatant.",
+            shortHelp: "Dual Pistols",
+            icon: "dual_pistols_set.png"
+        },
+        {
+            name: "Dual Wield",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Sentinel Archetype Sets", "Slow Movement", "Universal Damage Sets"],
+            description: "Dual Wield fires both pistols in rapid succession at its desired target. This power is slower than Pistols, but deals more damage, and the target may get knocked back by the force of the impact.<br><br>Changing your ammo type with the 'Swap Ammo' power will change your secondary damage from lethal to cold, fire or toxic.<br><br>Additionally, changing your ammunition type will also change the secondary effect of this attack from Knockback to:<br><br><color #9bfafa>*A minor attack speed and movement speed debuff if 'Cryo Ammo' is loaded.</color><br><color #fac39b>*A minor damage over time effect if 'Incendiary Ammo' is loaded.</color><br><color #9efa9b>*A -damage effect if 'Chemical Ammo' is loaded.</color>",
+            shortHelp: "Ranged, DMG(Lethal/Special), Foe Knockback/Special",
+            icon: "dualpistols_dualwield.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.1,
+                range: 60.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 3.129
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.9387
+                        },
+                        {
+                            type: "Cold",
+                            scale: 0.9387
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 0.9387
+                        }
+                    ],
+                    scale: 5.9451
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.113,
+                    ticks: 3
+                },
+                buffDuration: 3.1
+            }
+        },
+        {
+            name: "Pistols",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "Quickly fires a round from one of your heavy automatic pistols. Damage is average, but the fire rate is very fast. If standard ammo is used, Pistols will also reduce the target's Defense.<br><br>Changing your ammo type with the 'Swap Ammo' power will change your secondary damage from lethal to cold, fire or toxic.<br><br>Additionally, changing your ammunition type will also change the secondary effect of this attack from -Defense to:<br><br><color #9bfafa>*A -minor attack speed and movement speed debuff if 'Cryo Ammo' is loaded.</color><br><color #fac39b>*A -minor damage over time effect if 'Incendiary Ammo' is loaded.</color><br><color #9efa9b>*A -damage debuff effect if 'Chemical Ammo' is loaded.</color>",
+            shortHelp: "Ranged, DMG(Lethal/Special), Foe -Defense",
+            icon: "dualpistols_pistols.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.1,
+                range: 60.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 2.26
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.6779999999999999
+                        },
+                        {
+                            type: "Cold",
+                            scale: 0.6779999999999999
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 0.6779999999999999
+                        }
+                    ],
+                    scale: 4.294
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.075,
+                    ticks: 2
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Empty Clips",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Knockback", "Ranged AoE Damage", "Sentinel Archetype Sets", "Slow Movement", "Universal Damage Sets"],
+            description: "You empty the clips of both your pistols in an arc of suppression fire. This attack can blast multiple foes in the affected cone area, and has a small chance of knocking some foes down. Affected targets will have their defense reduced slightly as well if Standard Ammo is equipped.<br><br>Changing your ammo type with the 'Swap Ammo' power will change your secondary damage from lethal to cold, fire or toxic.<br><br>Additionally, changing your ammunition type will also change the secondary effect of this attack from Knockdown to:<br><br><color #9bfafa>*A minor attack speed and movement speed debuff if 'Cryo Ammo' is loaded.</color><br><color #fac39b>*A minor damage over time effect if 'Incendiary Ammo' is loaded.</color><br><color #9efa9b>*A -damage effect if 'Chemical Ammo' is loaded.</color>",
+            shortHelp: "Ranged (Cone), DMG(Lethal/Special), Foe -Defense, Knockdown/Special",
+            icon: "dualpistols_emptyclips.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 6,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.1,
+                range: 40.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.67,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 0.48790000000000006,
+                            ticks: 3
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.2594,
+                            ticks: 3
+                        },
+                        {
+                            type: "Cold",
+                            scale: 0.1464,
+                            ticks: 3
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 0.1464,
+                            ticks: 3
+                        }
+                    ]
+                },
+                buffDuration: 1.6,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Suppressive Fire",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Holds", "Ranged Damage", "Sentinel Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "Suppressive Fire allows the user to quickly stun their target for a short time and deal a very minor amount of Lethal damage.<br><br>Changing your ammo type with the 'Swap Ammo' power will change your secondary damage from lethal to cold, fire or toxic.<br><br>Additionally, changing your ammunition type will lower the power's base recharge to 8 seconds and change the secondary effect of this attack from Disorient effect to a Hold effect if <color #9bfafa>'Cryo Ammo'</color>, <color #fac39b>'Incendiary Ammo'</color> or <color #9efa9b>'Chemical Ammo'</color> are loaded.<br><br><color #9bfafa>*Significantly higher damage and boss-stopping hold if 'Cryo Ammo' is loaded.</color><br><color #fac39b>*Significantly higher damage and minor hold if 'Incendiary Ammo' is loaded.</color><br><color #9efa9b>*Somewhat increased damage and long duration hold if 'Chemical Ammo' is loaded.</color>",
+            shortHelp: "Ranged, DMG(Lethal/Special), Foe Disorient/Special",
+            icon: "dualpistols_suppressivefire.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.1,
+                range: 60.0,
+                recharge: 20.0,
+                endurance: 10.192,
+                cast: 1.5
+            }
+        },
+        {
+            name: "Swap Ammo",
+            available: 7,
+            tier: 3,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "By purchasing this power, you will be granted the Cryo Ammunition, Incendiary Ammunition and Chemical Ammunition toggles. Activating these toggles will change your secondary damage type on most Dual Pistols attacks from lethal (Standard Rounds) to cold (Cryo Rounds), fire (Incendiary Rounds) or toxic (Chemical Rounds).<br><br>These toggles are mutually exclusive and only one can be active at a time. If no Swap Ammo toggles are active, the player will revert to Standard Ammunition.<br><br>Different ammo types also have different secondary effects. Examine your Dual Pistols powers for more information.",
+            shortHelp: "Change Secondary Damage/Effects",
+            icon: "dualpistols_swapammo.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                buffDuration: 2.25
+            }
+        },
+        {
+            name: "Bullet Rain",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged AoE Damage", "Sentinel Archetype Sets", "Slow Movement", "Universal Damage Sets"],
+            description: "You fire your pistols faster than the human eye can follow, causing your bullet trajectory to arc, dealing moderate Lethal damage and possibly knocking your foes back.<br><br>Changing your ammo type with the 'Swap Ammo' power will change your secondary damage from lethal to cold, fire or toxic.<br><br>Additionally, changing your ammunition type will also change the secondary effect of this attack from Knockback to:<br><br><color #9bfafa>*A minor attack speed and movement speed debuff if 'Cryo Ammo' is loaded.</color><br><color #fac39b>*A minor damage over time effect if 'Incendiary Ammo' is loaded.</color><br><color #9efa9b>*A -damage effect if 'Chemical Ammo' is loaded.</color>",
+            shortHelp: "Ranged (Targeted AoE), DMG(Lethal/Special), Knockback/Special",
+            icon: "dualpistols_explosiveclip.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.1,
+                range: 40.0,
+                recharge: 18.0,
+                endurance: 16.848,
+                cast: 1.67,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 0.5682,
+                            ticks: 2
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.2836,
+                            ticks: 2
+                        },
+                        {
+                            type: "Cold",
+                            scale: 0.1706,
+                            ticks: 2
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 0.1706,
+                            ticks: 2
+                        }
+                    ]
+                },
+                buffDuration: 1.1
+            }
+        },
+        {
+            name: "Executioner's Shot",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Knockback", "Ranged Damage", "Sentinel Archetype Sets", "Slow Movement", "Universal Damage Sets"],
+            description: "Executioner's Shot is a deadly ranged attack. Foes struck by this attack will suffer lethal damage and will likely be knocked back by the impact of this attack. Targets struck by Executioner's Shot while no special ammunition is equipped will have their defenses reduced for a short time.<br><br>Changing your ammo type with the 'Swap Ammo' power will change your secondary damage from lethal to cold, fire or toxic.<br><br>Additionally, changing your ammunition type will also change the secondary effect of this attack from Knockback to:<br><br><color #9bfafa>*A minor attack speed and movement speed debuff if 'Cryo Ammo' is loaded.</color><br><color #fac39b>*A minor damage over time effect if 'Incendiary Ammo' is loaded.</color><br><color #9efa9b>*A -damage effect if 'Chemical Ammo' is loaded.</color>",
+            shortHelp: "Ranged, DMG(Lethal/Special), Foe -Defense, Knockback/Special",
+            icon: "dualpistols_executionersshot.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.25,
+                range: 60.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 3.9290000000000003
+                        },
+                        {
+                            type: "Fire",
+                            scale: 1.1787
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.1787
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 1.1787
+                        }
+                    ],
+                    scale: 7.4651000000000005
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.169,
+                    ticks: 3
+                },
+                defenseDebuff: 1.25,
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Piercing Rounds",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged AoE Damage", "Sentinel Archetype Sets", "Slow Movement", "Universal Damage Sets"],
+            description: "You fire your pistols with deadly precision in a very narrow cone, piercing up to three enemies. Piercing Rounds deals Superior lethal damage and reduces targets' Damage Resistance for a short time.<br><br>Changing your ammo type with the 'Swap Ammo' power will change your secondary damage from lethal to cold, fire or toxic, and a secondary effect will be included in this attack:<br><br><color #9bfafa>*A minor attack speed and movement speed debuff if 'Cryo Ammo' is loaded.</color><br><color #fac39b>*A minor damage over time effect if 'Incendiary Ammo' is loaded.</color><br><color #9efa9b>*A -damage effect if 'Chemical Ammo' is loaded.</color><br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Narrow Ranged (Cone), DMG(Lethal/Special), Foes -Res(All)/Special",
+            icon: "dualpistols_piercingrounds.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 3,
+            arc: 0.0873,
+            effects: {
+                accuracy: 1.1,
+                range: 60.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 2.5,
+                damage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 5.050000000000001
+                        },
+                        {
+                            type: "Fire",
+                            scale: 1.3775
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.3775
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 1.3775
+                        }
+                    ],
+                    scale: 9.182500000000001
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.1725,
+                    ticks: 2
+                },
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Hail of Bullets",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee AoE Damage", "Sentinel Archetype Sets", "Slow Movement", "Universal Damage Sets"],
+            description: "You fire a hail of bullets at all enemies around you dealing Extreme lethal damage. Enemies that are struck have a chance to be knocked down. Having Standard Rounds will dramatically increase this chance to knockdown your foes. If you hit at least one target you will gain a moderate melee, ranged and AoE Defense bonus for a brief period.<br><br>Changing your ammo type with the 'Swap Ammo' power will change your secondary damage from lethal to cold, fire or toxic.<br><br>Additionally, changing your ammunition type will also change the secondary effect of this attack from a guaranteed knockdown effect to:<br><br><color #9bfafa>*A minor attack speed and movement speed debuff if 'Cryo Ammo' is loaded.</color><br><color #fac39b>*A minor damage over time effect if 'Incendiary Ammo' is loaded.</color><br><color #9efa9b>*A -damage effect if 'Chemical Ammo' is loaded.</color>",
+            shortHelp: "PBAoE, DMG(Lethal/Special), Self +Def(Melee, Ranged, AoE), Foe Knockdown/Special",
+            icon: "dualpistols_hailofbullets.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.4,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 2.47,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Lethal",
+                            scale: 0.569,
+                            ticks: 11
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.4646,
+                            ticks: 11
+                        },
+                        {
+                            type: "Cold",
+                            scale: 0.2646,
+                            ticks: 11
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 0.2646,
+                            ticks: 11
+                        }
+                    ]
+                },
+                buffDuration: 2.3
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['sentinel/dual-pistols'] = SENTINEL_DUAL_PISTOLS_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.SENTINEL_DUAL_PISTOLS_POWERSET = SENTINEL_DUAL_PISTOLS_POWERSET;
+}
+
+// ---- js/data/powersets/sentinel/electric-armor.js ----
+;/**
+ * Electric Armor
+ * Character Level: 50
+ * Archetype: sentinel
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const SENTINEL_ELECTRIC_ARMOR_POWERSET = {
+    name: "Electric Armor",
+    category: "Unknown",
+    description: "Electric Armor powerset",
+    icon: "electric-armor_set.png",
+    powers: [
+        {
+            name: "Charged Armor",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "When you toggle on this power, you are surrounded in a charged field that makes you highly resistant to Smashing, Lethal and Energy damage.",
+            shortHelp: "Toggle: Self +Res(Smash, Lethal, Energy)",
+            icon: "electricarmor_selfbuffdefensephysical.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.67,
+                resistance: {
+                    smashing: 0.24500000000000002,
+                    lethal: 0.24500000000000002,
+                    energy: 0.24500000000000002
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Charged Shield",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "When you toggle on this power, you charge up every particle in your body increasing your regeneration rate and increasing your max endurance. <br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Self +Regen, +MaxEnd",
+            icon: "electricarmor_chargedshield.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.104,
+                cast: 0.67,
+                buffDuration: 0.6
+            }
+        },
+        {
+            name: "Conductive Shield",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "When you toggle on this power, you are surrounded in a Conductive Shield that will conduct many sorts of energy away from your body. Conductive Shield grants high resistant to Fire, Cold, and Energy damage, as well as good resistance to Negative Energy damage.",
+            shortHelp: "Toggle: Self +Res(Fire, Cold, Energy, Negative)",
+            icon: "electricarmor_selfresistelements.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.67,
+                resistance: {
+                    fire: 0.24500000000000002,
+                    cold: 0.24500000000000002,
+                    energy: 0.24500000000000002,
+                    negative: 0.14
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Energize",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You can channel a tremendous amount of electricity through your body for a short period of time. Doing so will heal some hit points, reduce the endurance cost of your powers and boost your regeneration for a short time.",
+            shortHelp: "Self Endurance Discount, Heal, +Regen",
+            icon: "electricarmor_energize.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 10.4,
+                cast: 1.17,
+                healing: {
+                    scale: 301.18975,
+                    perTarget: true
+                },
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Static Shield",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You can create a field of Static Electricity around your body. This Static Shield protects you from Hold, Sleep, and Disorient effects as well as Endurance Drain, Recovery DeBuffs and enemy Teleportation. Static Shield can also help normalize your synaptic activity, granting you good resistance to Psionic Damage.",
+            shortHelp: "Toggle: Self +Res(Hold, Sleep, Disorient, End Drain, Recovery DeBuff, Psionic, Toxic, Teleport)",
+            icon: "electricarmor_selfresistmez.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 1.17
+            }
+        },
+        {
+            name: "Grounded",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You are Grounded and naturally very resistant to Energy and Negative Energy damage. You also have added resistance to Endurance Drain effects. Additionally, Grounded provides Immobilize, Knockback protection and the Grounded status, but only for up to 10 seconds after being near the ground. This power is always on and costs no Endurance.",
+            shortHelp: "Auto: Self +Res (All DMG but Toxic and Psionics, End Drain, Immobilize, KB)",
+            icon: "electricarmor_selfresistenergies.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0
+            }
+        },
+        {
+            name: "Lightning Reflexes",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "Your Lightning Reflexes allow you to move faster than normal, as well as resist slow effects. This power is always on and permanently increases your attack rate and movement speed.",
+            shortHelp: "Auto: Self +Recharge, +SPD, Res (Slow)",
+            icon: "electricarmor_selfbuffrunspeed.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                debuffResistance: {
+                    recharge: 0.4,
+                    movement: 0.4
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Power Sink",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "Power Sink leeches energy directly from the bodies of all nearby foes, draining their Endurance. Each foe you draw energy from increases your Endurance and regeneration rate. If there are no foes within range, you will not gain any Endurance.",
+            shortHelp: "PBAoE, Self +End, +Regen, Foe -End",
+            icon: "electricarmor_pbaoeregendrain.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 60.0,
+                endurance: 13.0,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Power Surge",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Healing", "Holds", "Resist Damage"],
+            description: "When you activate this power, you transform your body into living Electricity and become extremely resistant to all damage but Psionics, as well as Disorient, Sleep, Hold, Immobilize, Knockback, End Drain, Recovery DeBuff, and enemy Teleportation. Your Regeneration rate and Endurance recovery are also increased. As Power Surge wears off, the charge in your body explodes in a massive EMP pulse.",
+            shortHelp: "Self +Res(All DMG, but Psionics), +Res(Knockback, Repel, Disorient, Hold, Immobilize, Sleep), +Regen, +Recovery, +Special",
+            icon: "electricarmor_selfbuffdefense.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 350.0,
+                endurance: 2.6,
+                cast: 1.96
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['sentinel/electric-armor'] = SENTINEL_ELECTRIC_ARMOR_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.SENTINEL_ELECTRIC_ARMOR_POWERSET = SENTINEL_ELECTRIC_ARMOR_POWERSET;
+}
+
+// ---- js/data/powersets/sentinel/electrical-blast.js ----
+;/**
+ * Electrical Blast
+ * Character Level: 50
+ * Archetype: sentinel
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const SENTINEL_ELECTRICAL_BLAST_POWERSET = {
+    name: "Electrical Blast",
+    category: "Unknown",
+    description: "Electrical Blast powerset",
+    icon: "electrical-blast_set.png",
+    powers: [
+        {
+            name: "Charged Bolts",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You can quickly hurl small bolts of electricity at foes, dealing some damage and draining some Endurance. Some of this Endurance may transfer back to you. Charged Bolts deals light damage but recharges quickly.",
+            shortHelp: "Ranged, DMG(Energy), Foe -End",
+            icon: "electricalbolt_chargedbolts.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    type: "Energy",
+                    scale: 2.26
+                }
+            }
+        },
+        {
+            name: "Lightning Bolt",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You can send a large blast of electrical energy at a foe, dealing heavy damage and draining some Endurance. Some of this Endurance may transfer back to you. Lightning Bolt deals more damage than Charged Bolts, but recharges more slowly.",
+            shortHelp: "Ranged, DMG(Energy), Foe -End",
+            icon: "electricalbolt_lightningbolt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    type: "Energy",
+                    scale: 3.529
+                }
+            }
+        },
+        {
+            name: "Ball Lightning",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "Hurls a highly charged ball of lightning that explodes on contact. Ball Lightning deals good damage in an area of effect, and drains some Endurance from each target it hits.",
+            shortHelp: "Ranged (Targeted AoE), DoT(Energy), Foe -End",
+            icon: "electricalbolt_balllightning.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.07,
+                damage: {
+                    type: "Energy",
+                    scale: 1.341
+                },
+                dotDamage: {
+                    type: "Energy",
+                    scale: 0.0725,
+                    ticks: 3
+                },
+                buffDuration: 2.2
+            }
+        },
+        {
+            name: "Zapping Bolt",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "A focused electrical blast that can be fired off at a quick speed with high Accuracy. Zapping Bolt drains Endurance.",
+            shortHelp: "Ranged, DMG(Energy), Foe -End",
+            icon: "electricalbolt_heavy.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 60.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.0,
+                damage: {
+                    type: "Energy",
+                    scale: 3.46
+                },
+                buffDuration: 4.0
+            }
+        },
+        {
+            name: "Charge Up",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the chance to hit of your attacks for a few seconds. Slightly increases damage and endurance modification.",
+            shortHelp: "Self +To Hit, +DMG, +Range, +End Mod",
+            icon: "electricalbolt_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 4.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Tesla Cage",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Holds", "Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "Tesla Cage confines the target in an electrical prison. The target is overwhelmed by the electrical charge and is left helpless and can be attacked. The target is drained of some Endurance and some of that Endurance may be transferred back to you.<br><br>Taking this power allows you to build Static with each activation of other electrical blast attacks. As Static builds, you can unleash it with Tesla Cage as electricity will jump off your main target and shock others nearby!",
+            shortHelp: "Ranged, DMG(Energy), Foe Hold, -End",
+            icon: "electricalbolt_telsacage.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Chain",
+            maxTargets: 1,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 2.17,
+                damage: {
+                    type: "Energy",
+                    scale: 4.329
+                },
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Voltaic Sentinel",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Pet Damage", "Recharge Intensive Pets", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You can manifest a polarized electricity field that hovers above the ground and hurls bolts of electricity at nearby foes. Any enemy that passes near this Sentinel risks serious injury. The Sentinel is not alive and cannot be targeted or attacked by enemies. The Sentinel can fly and will follow you.",
+            shortHelp: "Summon Sentinel: Ranged, DMG(Energy), Foe -End",
+            icon: "electricalbolt_voltaicsentinal.png",
+            powerType: "Toggle",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 2.0,
+                range: 40.0,
+                recharge: 10.0,
+                endurance: 0.52,
+                cast: 3.1
+            }
+        },
+        {
+            name: "Short Circuit",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Melee AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "Releases a burst of electrical energy around you, shocking all nearby foes. This highly accurate discharge deals Moderate damage over time, drains a lot of Endurance from the targets and renders them unable to recover Endurance for quite a while. Additionally, Short Circuit deals extra damage to most robots and mechanical foes. Short Circuit is very effective when used with your other Endurance draining powers.",
+            shortHelp: "PBAoE, DoT(Energy), Foe -End, -Recovery",
+            icon: "electricalbolt_shortcircuit.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.3,
+                recharge: 20.0,
+                endurance: 15.6,
+                cast: 2.5,
+                dotDamage: {
+                    type: "Energy",
+                    scale: 0.3275,
+                    ticks: 4
+                },
+                buffDuration: 1.5
+            }
+        },
+        {
+            name: "Thunderous Blast",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You hurl a tremendously powerful bolt of lightning at a target, devastating all nearby foes. Thunderous Blast deals extreme Energy and Smashing damage and drains a lot of Endurance from nearby foes.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Energy), Foe -End, -Recovery",
+            icon: "electricalbolt_thunderouseblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.4,
+                range: 40.0,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 2.93,
+                damage: {
+                    type: "Energy",
+                    scale: 3.7658
+                },
+                buffDuration: 20.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['sentinel/electrical-blast'] = SENTINEL_ELECTRICAL_BLAST_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.SENTINEL_ELECTRICAL_BLAST_POWERSET = SENTINEL_ELECTRICAL_BLAST_POWERSET;
+}
+
+// ---- js/data/powersets/sentinel/energy-aura.js ----
+;/**
+ * Energy Aura
+ * Character Level: 50
+ * Archetype: sentinel
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const SENTINEL_ENERGY_AURA_POWERSET = {
+    name: "Energy Aura",
+    category: "Unknown",
+    description: "Energy Aura powerset",
+    icon: "energy-aura_set.png",
+    powers: [
+        {
+            name: "Kinetic Dampening",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "Your ability to channel energy makes you naturally resistant to Energy, Negative Energy, Lethal, Smashing and Toxic damage. Additionally, the user gains a moderate level of resistance to slow effects. This power is always on and costs no Endurance.",
+            shortHelp: "Auto: Self +Res (Energy, Negative, Toxic, Lethal, Smashing, Slow)",
+            icon: "energyaura_protection.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 1.5,
+                            ticks: 5
+                        },
+                        {
+                            type: "Negative",
+                            scale: 1.25,
+                            ticks: 5
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 1.25,
+                            ticks: 5
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.0,
+                            ticks: 5
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 1.0,
+                            ticks: 5
+                        }
+                    ]
+                },
+                resistance: {
+                    energy: 0.10500000000000001,
+                    negative: 0.08750000000000001,
+                    toxic: 0.08750000000000001,
+                    smashing: 0.07,
+                    lethal: 0.07
+                },
+                debuffResistance: {
+                    recharge: 0.2,
+                    movement: 0.2
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Kinetic Shield",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Kinetic Shield creates a harmonic Energy Aura that can deflect physical attacks. Your Defense to Smashing and Lethal attacks is increased as weapons and powers like bullets, blades and punches tend to deflect off the shield. Kinetic Shield also grants you good resistance to Defense Debuffs. The Energy based nature of Kinetic Shield also offers some minimal Defense to Energy attacks. Kinetic Shield also adds an Elusivity defense bonus to Smashing, Lethal, and Energy Attacks in PVP zones.",
+            shortHelp: "Toggle: Self +DEF(Smashing, Lethal, Energy), Res(DeBuff DEF)",
+            icon: "energyaura_kineticshield.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.13,
+                cast: 0.73,
+                defense: {
+                    smashing: 0.11900000000000001,
+                    lethal: 0.11900000000000001,
+                    energy: 0.0175
+                },
+                debuffResistance: {
+                    defense: 0.1384
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Power Shield",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "This Power Shield creates a Electro-Magnetic shield around you that can deflect non-physical attacks. Your Defense to Fire, Cold, Energy and Negative Energy attacks is increased as these attacks are reflected or refracted off the shield. Power Shield also grants you good resistance to Defense Debuffs. Power Shield also adds Psionic Defense and an Elusivity defense bonus to Fire, Cold, Energy and Psionic Attacks in PVP zones.",
+            shortHelp: "Toggle: Self +DEF(Fire, Cold, Energy, Negative), Res(DeBuff DEF)",
+            icon: "energyaura_powershield.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.13,
+                cast: 1.67,
+                defense: {
+                    fire: 0.14,
+                    energy: 0.14,
+                    cold: 0.14,
+                    negative: 0.14,
+                    psionic: 0.14
+                },
+                debuffResistance: {
+                    defense: 0.1384
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Energize",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You can channel a tremendous amount of energy through your body for a short period of time. Doing so will heal some hit points, reduce the endurance cost of your powers and boost your regeneration for a short time.",
+            shortHelp: "Self Endurance Discount, Heal, +Regen",
+            icon: "energyaura_energize.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 10.4,
+                cast: 1.17,
+                healing: {
+                    scale: 301.18975,
+                    perTarget: true
+                },
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Entropy Shield",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "Entropy Shield diminishes and dampens the energy of controlling type effects. The shield makes you resistant to Knockback, Repel, Disorient, Hold, Sleep, Immobilization, and enemy Teleportation for as long as you can keep this toggle power active. Entropy Shield also grants you good resistance to Defense Debuffs. Additionally, this power grants the user a moderate recharge bonus while active and resistance to endurance drain effects.",
+            shortHelp: "Toggle: Self +Res(Knockback, Repel, Disorient, Hold, Sleep, Immobilize, Teleport, DeBuff DEF), +Rech",
+            icon: "energyaura_entropy.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.13,
+                cast: 0.73,
+                protection: {
+                    hold: 8.304,
+                    stun: 8.304,
+                    sleep: 8.304,
+                    immobilize: 8.304
+                },
+                debuffResistance: {
+                    defense: 0.3,
+                    tohit: 0.3,
+                    recharge: 0.3,
+                    movement: 0.5
+                },
+                buffDuration: 0.75,
+                stun: 1.0,
+                stunDuration: 0.75,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Power Armor",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Healing", "Resist Damage"],
+            description: "Power Armor increases Hit Points and resistance to all damage types. This power is always on and costs no endurance.",
+            shortHelp: "Auto: Self +MaxHP, +Resist(All DMG)",
+            icon: "energyaura_powerarmor.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                resistance: {
+                    smashing: 0.052500000000000005,
+                    lethal: 0.052500000000000005,
+                    fire: 0.052500000000000005,
+                    cold: 0.052500000000000005,
+                    energy: 0.052500000000000005,
+                    negative: 0.052500000000000005,
+                    psionic: 0.052500000000000005,
+                    toxic: 0.052500000000000005
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Repelling Force",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Your innate power over energies manifest itself naturally as a repelling force, increasing your defense against all types. This power is always on and costs no endurance.",
+            shortHelp: "Auto: Self +DEF(Smash, Lethal, Fire, Cold, Energy, Negative, Psionic, Toxic)",
+            icon: "energyaura_repellingforce.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                defense: {
+                    smashing: 0.035,
+                    lethal: 0.035,
+                    fire: 0.035,
+                    cold: 0.035,
+                    energy: 0.035,
+                    negative: 0.035,
+                    psionic: 0.035,
+                    toxic: 0.035
+                },
+                buffDuration: 10.3
+            }
+        },
+        {
+            name: "Power Drain",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "Power Drain leeches energy directly from the bodies of all nearby foes, draining their Endurance. Each foe you draw energy from increases your Endurance. If there are no foes within range, you will not gain any Endurance.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Autohit: PBAoE, Self +End, Foe -End, -Recovery",
+            icon: "energyaura_drain.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 60.0,
+                endurance: 13.0,
+                cast: 2.37,
+                buffDuration: 4.0
+            }
+        },
+        {
+            name: "Overload",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Endurance Modification", "Healing"],
+            description: "You can Overload your Energy Aura and dramatically improve your defense to all attack types. Overload also grants you high resistance to Defense Debuffs. This Energy Aura is so powerful, that it can even absorb some damage, effectively increasing your Max Hit Points. However, when Overload wears off, you are left drained of all Endurance and unable to recover Endurance for a while. Overload also adds a moderate Elusivity defense bonus to all attacks in PVP zones.",
+            shortHelp: "Self +DEF(All), +Recovery, +Max HP, Res(DeBuff DEF), +Special",
+            icon: "energyaura_overload.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 1000.0,
+                endurance: 2.6,
+                cast: 3.0,
+                defense: {
+                    smashing: 0.42000000000000004,
+                    lethal: 0.42000000000000004,
+                    fire: 0.42000000000000004,
+                    cold: 0.42000000000000004,
+                    energy: 0.42000000000000004,
+                    negative: 0.42000000000000004,
+                    psionic: 0.31500000000000006,
+                    toxic: 0.31500000000000006
+                },
+                debuffResistance: {
+                    defense: 0.2768
+                },
+                buffDuration: 180.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['sentinel/energy-aura'] = SENTINEL_ENERGY_AURA_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.SENTINEL_ENERGY_AURA_POWERSET = SENTINEL_ENERGY_AURA_POWERSET;
+}
+
+// ---- js/data/powersets/sentinel/energy-blast.js ----
+;/**
+ * Energy Blast
+ * Character Level: 50
+ * Archetype: sentinel
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const SENTINEL_ENERGY_BLAST_POWERSET = {
+    name: "Energy Blast",
+    category: "Unknown",
+    description: "Energy Blast powerset",
+    icon: "energy-blast_set.png",
+    powers: [
+        {
+            name: "Power Blast",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "A much more powerful, yet slower version of Power Bolt. Power Blast sends a focused beam of energy at a foe that can knock them back.",
+            shortHelp: "Ranged, DMG(Energy/Smash), Foe Knockback",
+            icon: "powerblast_powerblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 2.849
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.64
+                        }
+                    ],
+                    scale: 3.4890000000000003
+                }
+            }
+        },
+        {
+            name: "Power Bolt",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "A quick attack that rapidly hurls small bolts of energy at foes, sometimes knocking them down. Fast, but little damage.",
+            shortHelp: "Ranged, DMG(Energy/Smash), Foe Knockback",
+            icon: "powerblast_powerbolts.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 2.06
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.2
+                        }
+                    ],
+                    scale: 2.2600000000000002
+                }
+            }
+        },
+        {
+            name: "Energy Torrent",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "Energy Torrent unleashes a cone of powerful energy that can smash foes and possibly send them flying.",
+            shortHelp: "Ranged (Cone), DMG(Energy/Smash), Foe Knockback",
+            icon: "powerblast_energytorrent.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 6,
+            arc: 0.7854,
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 1.07,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 1.3445
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.3
+                        }
+                    ],
+                    scale: 1.6445
+                }
+            }
+        },
+        {
+            name: "Power Burst",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "A devastating attack, Power Burst unleashes a massive amount of energy dealing very high damage at short distances. The impact from this burst often knocks back most foes.",
+            shortHelp: "Ranged, DMG(Energy/Smash), Foe Knockback",
+            icon: "powerblast_powerburst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 11.0,
+                endurance: 11.024,
+                cast: 2.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 3.3200000000000003
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.0
+                        }
+                    ],
+                    scale: 4.32
+                }
+            }
+        },
+        {
+            name: "Aim",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the chance to hit of your attacks for a few seconds. Slightly increases damage and range.",
+            shortHelp: "Self +To Hit, +DMG, +Range",
+            icon: "powerblast_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.625,
+                damageBuff: 0.425,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Power Push",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "This ranged attack deals little damage, but sends the target flying for a great distance.",
+            shortHelp: "Ranged DMG(Energy/Smash), Foe High Knockback",
+            icon: "powerblast_powerpush.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.1,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 2.504
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.626
+                        }
+                    ],
+                    scale: 3.13
+                }
+            }
+        },
+        {
+            name: "Explosive Blast",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You hurl a blast of charged energy that violently explodes on impact, damaging all foes near the target. Explosive Blast may knock targets backwards.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Smash/Energy), Foe Knockback",
+            icon: "powerblast_explosion.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 3.2887
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.5
+                        }
+                    ],
+                    scale: 3.7887
+                }
+            }
+        },
+        {
+            name: "Focused Power Bolt",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "A focused and very accurate blast that deals tremendous damage.",
+            shortHelp: "Ranged, DMG(Energy/Smash), Foe Knockback",
+            icon: "powerblast_heavy.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 60.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 2.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 5.244999999999999
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.584
+                        }
+                    ],
+                    scale: 5.828999999999999
+                }
+            }
+        },
+        {
+            name: "Nova",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You can explode in a tremendous blast of energy, sending nearby foes flying. The Nova deals extreme Energy and Smashing damage to all nearby foes.",
+            shortHelp: "PBAoE, DMG(Energy), Foe Knockback",
+            icon: "powerblast_novablast.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.4,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 3.0,
+                damage: {
+                    type: "Energy",
+                    scale: 4.7059999999999995
+                }
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['sentinel/energy-blast'] = SENTINEL_ENERGY_BLAST_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.SENTINEL_ENERGY_BLAST_POWERSET = SENTINEL_ENERGY_BLAST_POWERSET;
+}
+
+// ---- js/data/powersets/sentinel/fiery-aura.js ----
+;/**
+ * Fiery Aura
+ * Character Level: 50
+ * Archetype: sentinel
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const SENTINEL_FIERY_AURA_POWERSET = {
+    name: "Fiery Aura",
+    category: "Unknown",
+    description: "Fiery Aura powerset",
+    icon: "fiery-aura_set.png",
+    powers: [
+        {
+            name: "Fire Shield",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "While this power is active, Fire Shield gives you good resistance to Lethal, Smashing and Fire damage. Fire Shield also provides minimal resistance to Cold damage as well as protection from Disorient effects.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Toggle: Self +Res(Fire, Lethal, Smash, Cold, Disorient)",
+            icon: "flamingshield_flamingshield.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 1.67,
+                protection: {
+                    stun: 8.304
+                },
+                resistance: {
+                    smashing: 0.21000000000000002,
+                    lethal: 0.21000000000000002,
+                    fire: 0.21000000000000002,
+                    cold: 0.07
+                },
+                buffDuration: 0.75,
+                stun: 1.0,
+                stunDuration: 0.75
+            }
+        },
+        {
+            name: "Molten Embrace",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "Molten Embrace superheats your attacks, increasing the damage they inflict. In addition, all your attacks will have a chance to inflict fire damage over time.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: +Dmg, +Special",
+            icon: "flamingshield_fieryembrace.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.208,
+                cast: 0.73,
+                buffDuration: 1.2
+            }
+        },
+        {
+            name: "Phoenix Rising",
+            available: 0,
+            tier: 1,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "If you are defeated, you can rise from the ashes. The fiery resurrection blasts nearby foes with an explosion and knocks them down and Disorients them. You will revive with about half of your Hit Points and Endurance. Gift of the Phoenix will leave you invulnerable for a brief time, and protected from XP Debt for 90 seconds.<br><br>You can also use this power even if you have not been defeated, with weakend effects. The closer you are to being defeated, the stronger the effects will be. You need to be under 75% health to activate this power.",
+            shortHelp: "Self Rez, Special",
+            icon: "flamingshield_temperatureprotection.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                buffDuration: 0.5
+            }
+        },
+        {
+            name: "Healing Flames",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing", "Resist Damage"],
+            description: "You can concentrate for a few moments to heal yourself. The power of the flames can also protect you from Toxic Damage for a while.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Self Heal, +Res(Toxic)",
+            icon: "flamingshield_healingflames.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 40.0,
+                endurance: 10.4,
+                cast: 0.73,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 2.0,
+                    ticks: 30
+                },
+                resistance: {
+                    toxic: 0.14
+                },
+                healing: {
+                    scale: 301.18975,
+                    perTarget: true
+                },
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Temperature Protection",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "Temperature Protection gives you strong resistance to Fire damage, some resistance to Cold damage and slow effects, and grants minor, unenhanceable regeneration as well as provide very minor Knockback Protection. This power is always on and costs no Endurance.",
+            shortHelp: "Auto: Self +Res(Fire, Cold, Slow, Knock), +Regen",
+            icon: "flamingshield_temperatureprotection.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 3.0,
+                            ticks: 5
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.0,
+                            ticks: 5
+                        }
+                    ]
+                },
+                resistance: {
+                    cold: 0.07,
+                    fire: 0.21000000000000002
+                },
+                debuffResistance: {
+                    recharge: 0.2,
+                    movement: 0.2
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Plasma Shield",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "While this power is active, you are surrounded by pure plasma. The Plasma Shield gives you resistance to Energy, Negative Energy, and Fire damage. Plasma Shield also gives your protection from Sleep and Hold effects.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Toggle: Self +Res(Energy, Negative, Fire, Hold, Sleep)",
+            icon: "flamingshield_plasmasheild.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 3.0,
+                protection: {
+                    hold: 8.304,
+                    sleep: 8.304
+                },
+                resistance: {
+                    fire: 0.21000000000000002,
+                    energy: 0.21000000000000002,
+                    negative: 0.21000000000000002,
+                    psionic: 0.21000000000000002
+                },
+                debuffResistance: {
+                    tohit: 0.3,
+                    defense: 0.3,
+                    recharge: 0.3,
+                    movement: 0.5
+                },
+                buffDuration: 0.75,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Consume",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Healing", "Melee AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You can drain body heat from all nearby foes, and even from the air itself, increasing your health, resistance against endurance drain, as well as replenishing your own Endurance. The more foes affected, the more Endurance is gained. Foes suffer minimal Fire damage.<br><br>HP and End Drain resistance do not scale with enemy count, but will be granted even if there are no enemies nearby.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE, DMG(Fire), Self +End, +Max HP",
+            icon: "flamingshield_consume.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 180.0,
+                endurance: 0.52,
+                cast: 2.03,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Burn",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You can ignite the ground beneath you, freeing yourself from Immobilization effects. Foes that enter the flames you leave behind will take damage. You must be near the ground to activate this power.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Location (PBAoE), DoT (Fire), Self Res(Immobilize)",
+            icon: "flamingshield_burn.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                recharge: 25.0,
+                endurance: 5.2,
+                cast: 2.03,
+                damage: {
+                    type: "Fire",
+                    scale: 1.44
+                }
+            }
+        },
+        {
+            name: "Cauterizing Blaze",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "While active, you are surrounded by flames cauterize your wounds healing you a small amount every few seconds.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Self +Heal Over Time",
+            icon: "flamingshield_cauterizing.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.13,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Phoenix Rising",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge", "Damage"],
+            allowedSetCategories: ["Endurance Modification", "Healing", "Melee AoE Damage", "Sentinel Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "If you are defeated, you can rise from the ashes. The fiery resurrection blasts nearby foes with an explosion and knocks them down and Disorients them. You will revive with about half of your Hit Points and Endurance. Gift of the Phoenix will leave you invulnerable for a brief time, and protected from XP Debt for 90 seconds.<br><br>You can also use this power even if you have not been defeated, with weakend effects. The closer you are to being defeated, the stronger the effects will be. You need to be under 75% health to activate this power.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Self Rez, Special",
+            icon: "flamingshield_riseofthephoenix.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 300.0,
+                cast: 2.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['sentinel/fiery-aura'] = SENTINEL_FIERY_AURA_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.SENTINEL_FIERY_AURA_POWERSET = SENTINEL_FIERY_AURA_POWERSET;
+}
+
+// ---- js/data/powersets/sentinel/fire-blast.js ----
+;/**
+ * Fire Blast
+ * Character Level: 50
+ * Archetype: sentinel
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const SENTINEL_FIRE_BLAST_POWERSET = {
+    name: "Fire Blast",
+    category: "Unknown",
+    description: "Fire Blast powerset",
+    icon: "fire-blast_set.png",
+    powers: [
+        {
+            name: "Fire Blast",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "Sends a Blast of Fire at a targeted foe and sets the target on fire for a short period of time. Slower recharge rate than Flares, but more damage.<br><br><color #fcfc95>Damage: Heavy.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, DMG(Fire), DoT(Fire)",
+            icon: "fireblast_fireblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 5.0,
+                endurance: 6.03,
+                cast: 1.2,
+                damage: {
+                    type: "Fire",
+                    scale: 2.5999999999999996
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.15,
+                    ticks: 3
+                },
+                buffDuration: 3.1
+            }
+        },
+        {
+            name: "Flares",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "A quick attack that throws Flares at the target. Little damage, but very fast.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Ranged, DMG(Fire)",
+            icon: "fireblast_flare.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 2.0,
+                endurance: 3.536,
+                cast: 1.0,
+                damage: {
+                    type: "Fire",
+                    scale: 1.8599999999999999
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.15,
+                    ticks: 3
+                },
+                buffDuration: 3.1
+            }
+        },
+        {
+            name: "Fire Ball",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "Hurls an exploding Fireball that consumes a targeted foe, and all nearby enemies. Anyone in that explosion is burned and set ablaze.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Targeted AoE), DMG(Fire/Smash), DoT(Fire)",
+            icon: "fireblast_fireball.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 1.2353999999999998
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.2
+                        }
+                    ],
+                    scale: 1.4353999999999998
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.15,
+                    ticks: 2
+                },
+                buffDuration: 2.1
+            }
+        },
+        {
+            name: "Blaze",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "A devastating flame attack.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged, DMG(Fire), DoT(Fire)",
+            icon: "fireblast_blaze.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.0,
+                damage: {
+                    type: "Fire",
+                    scale: 3.46
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.225,
+                    ticks: 4
+                },
+                buffDuration: 4.1
+            }
+        },
+        {
+            name: "Aim",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the chance to hit of your attacks for a few seconds. Slightly increases damage and range.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +ToHit, +DMG, +Range",
+            icon: "fireblast_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.625,
+                damageBuff: 0.425,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Fire Breath",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You can breathe forth a torrent of fire that burns all foes within its narrow cone. Very accurate and very deadly at medium range.<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Cone), DoT(Fire)",
+            icon: "fireblast_arcoffire.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 6,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.2,
+                range: 40.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 2.67,
+                dotDamage: {
+                    type: "Fire",
+                    scale: 2.0036,
+                    ticks: 2
+                },
+                buffDuration: 2.1
+            }
+        },
+        {
+            name: "Blazing Blast",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "An extremely quick long range beam of fire that blasts your foes and pushes them away.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, DMG(Fire), DoT(Fire), Foe Knockback, Repel",
+            icon: "fireblast_heavy.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 60.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 1.67,
+                damage: {
+                    type: "Fire",
+                    scale: 1.8195999999999999
+                },
+                buffDuration: 0.61
+            }
+        },
+        {
+            name: "Rain of Fire",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "Summons a Rain of Fire over a targeted location, burning foes and reducing their movement speed within a large area.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged (Location AoE), DoT(Fire), Foe -SPD",
+            icon: "fireblast_rainoffire.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 2.0,
+                range: 40.0,
+                recharge: 60.0,
+                endurance: 26.0,
+                cast: 2.03,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Inferno",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "Unleashes a massive fiery explosion to devastate all nearby enemies and set them ablaze. Inferno deals Extreme Fire damage to all nearby foes and inflicts Moderate Fire damage over time.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE, DMG(Fire/Smash), DoT(Fire)",
+            icon: "fireblast_inferno.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.4,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 3.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 3.778
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.928
+                        }
+                    ],
+                    scale: 4.706
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.15,
+                    ticks: 2
+                },
+                buffDuration: 2.1
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['sentinel/fire-blast'] = SENTINEL_FIRE_BLAST_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.SENTINEL_FIRE_BLAST_POWERSET = SENTINEL_FIRE_BLAST_POWERSET;
+}
+
+// ---- js/data/powersets/sentinel/ice-armor.js ----
+;/**
+ * Ice Armor
+ * Character Level: 50
+ * Archetype: sentinel
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const SENTINEL_ICE_ARMOR_POWERSET = {
+    name: "Ice Armor",
+    category: "Unknown",
+    description: "Ice Armor powerset",
+    icon: "ice-armor_set.png",
+    powers: [
+        {
+            name: "Frozen Armor",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "While this power is active, you coat yourself in rock hard Frozen Armor. The hardness of the Frozen Armor offers good defense to Smashing and Lethal attack as well as reduces Cold damage. Also, Fire attacks deal slightly less damage and you can resist Defense DeBuffs.",
+            shortHelp: "Self, +Def(Smash, Lethal), +Res(Cold, Fire, DeBuff DEF)",
+            icon: "icearmor_icearmor.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.73,
+                defense: {
+                    smashing: 0.11900000000000001,
+                    lethal: 0.11900000000000001
+                },
+                resistance: {
+                    cold: 0.21000000000000002,
+                    fire: 0.08750000000000001
+                },
+                debuffResistance: {
+                    defense: 0.11072
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Hoarfrost",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing", "Resist Damage"],
+            description: "Activating this power covers you in a thick layer of Hoarfrost. The frost can absorb the impact from enemy attacks, effectively increasing your maximum Hit Points for a short time. Hoarfrost also grants you resistance to Toxic Damage.<br><br>This power is mutually exclusive from Rime",
+            shortHelp: "Self Heal, +Max HP, Res(Toxic)",
+            icon: "icearmor_hp.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 360.0,
+                endurance: 14.56,
+                cast: 0.73,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 2.0,
+                    ticks: 60
+                },
+                resistance: {
+                    toxic: 0.14
+                },
+                healing: {
+                    scale: 481.9036,
+                    perTarget: true
+                },
+                buffDuration: 120.0
+            }
+        },
+        {
+            name: "Rime",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing", "Resist Damage"],
+            description: "Activating this power covers you in a thick layer of rime. The rime can absorb the impact of a limited number of enemy attacks, the lingering moisture increasing your regeneration rate. Rime also grants you resistance to Toxic Damage.<br><br>This power is mutually exclusive from Hoarfrost",
+            shortHelp: "Self +Regen, +Absorb, Res(Toxic)",
+            icon: "icearmor_rime.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 10.4,
+                cast: 0.73,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 2.0,
+                    ticks: 30
+                },
+                resistance: {
+                    toxic: 0.14
+                },
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Wet Ice",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "When you activate this power, you cover yourself in a thick coating of slick, melting ice. This makes you slippery, leaving you nearly immune to Disorient, Immobilization, Hold, Sleep, Slow and Knockback effects. This power also adds a slight increase to your defense to all attacks. Wet Ice also reduces Cold damage and grants you resistance to Defense DeBuffs.",
+            shortHelp: "Self, +DEF(All), +Res(Cold, Disorient, Immobilize, Hold, Sleep, Slow, Knockback, DeBuff DEF)",
+            icon: "icearmor_wetice.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.73,
+                protection: {
+                    hold: 8.304,
+                    stun: 8.304,
+                    sleep: 8.304,
+                    immobilize: 8.304
+                },
+                defense: {
+                    smashing: 0.007000000000000001,
+                    lethal: 0.007000000000000001,
+                    fire: 0.007000000000000001,
+                    cold: 0.007000000000000001,
+                    energy: 0.007000000000000001,
+                    negative: 0.007000000000000001,
+                    psionic: 0.007000000000000001,
+                    toxic: 0.007000000000000001
+                },
+                resistance: {
+                    cold: 0.21000000000000002
+                },
+                debuffResistance: {
+                    recharge: 0.6,
+                    movement: 0.6,
+                    tohit: 0.3,
+                    defense: 0.3
+                },
+                buffDuration: 0.75,
+                stun: 1.0,
+                stunDuration: 0.75,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Frigid Shield",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "While active, you dramatically lower the temperature around yourself. The air around your body becomes so cold that attacks deflect off of it, granting you absorption.",
+            shortHelp: "Toggle: +Absorb over time, Res(Slow)",
+            icon: "icearmor_absorb.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.73,
+                debuffResistance: {
+                    recharge: 0.1,
+                    movement: 0.1
+                },
+                buffDuration: 20.0
+            }
+        },
+        {
+            name: "Moisture Absorption",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Endurance Modification"],
+            description: "Activating this power draws moisture directly from your target and nearby foes, draining their endurance. The moisture adds to your own Endurance as well as Defense to all types of attacks.",
+            shortHelp: "Close AoE, Self +End, +DEF(All but Psionics), Res (Slow), Foe -End",
+            icon: "icearmor_energyabsorption.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 10.0,
+                recharge: 60.0,
+                endurance: 13.0,
+                cast: 1.93,
+                defense: {
+                    smashing: 0.028000000000000004,
+                    lethal: 0.028000000000000004,
+                    fire: 0.028000000000000004,
+                    cold: 0.028000000000000004,
+                    energy: 0.028000000000000004,
+                    negative: 0.028000000000000004,
+                    psionic: 0.028000000000000004,
+                    toxic: 0.028000000000000004
+                },
+                buffDuration: 100.0
+            }
+        },
+        {
+            name: "Glacial Armor",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "When you activate this power you cover yourself in Glacial ice. The crystalline matrix of the armor has refracting properties that make Energy and Negative Energy attacks less likely to land, and acts as a lens to increase your Perception to see hidden foes. The bitter cold of Glacial Armor also reduces Cold damage and also you to resist Defense DeBuffs.",
+            shortHelp: "Toggle: Self +DEF(Energy, Negative), Res (Cold, DeBuff DEF), +Perception",
+            icon: "icearmor_glacialarmor.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 2.03,
+                defense: {
+                    energy: 0.11900000000000001,
+                    negative: 0.11900000000000001,
+                    psionic: 0.11900000000000001
+                },
+                resistance: {
+                    cold: 0.21000000000000002
+                },
+                debuffResistance: {
+                    defense: 0.11072
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Permafrost",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "Your body temperature permanently lowers to 33 degrees Fahrenheit. Permafrost gives you strong resistance to Cold damage, some resistance to Fire damage and minor Smashing, Lethal, Energy, Negative Energy, Toxic and Psionic resistance as well. You also gain an inherent resistance to Slow effects. This power is always on and does not cost Endurance.",
+            shortHelp: "Auto: Self +Res(All damage, Slow)",
+            icon: "icearmor_permafrost.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 3.0,
+                            ticks: 5
+                        },
+                        {
+                            type: "Fire",
+                            scale: 1.25,
+                            ticks: 5
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.5,
+                            ticks: 5
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 0.5,
+                            ticks: 5
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.5,
+                            ticks: 5
+                        },
+                        {
+                            type: "Negative",
+                            scale: 0.5,
+                            ticks: 5
+                        },
+                        {
+                            type: "Psionic",
+                            scale: 0.5,
+                            ticks: 5
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 0.5,
+                            ticks: 5
+                        }
+                    ]
+                },
+                resistance: {
+                    cold: 0.21000000000000002,
+                    fire: 0.08750000000000001,
+                    smashing: 0.035,
+                    lethal: 0.035,
+                    energy: 0.035,
+                    negative: 0.035,
+                    psionic: 0.035,
+                    toxic: 0.035
+                },
+                debuffResistance: {
+                    recharge: 0.2,
+                    movement: 0.2
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Frost Protection",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Healing"],
+            description: "The lower temperature of your body makes you sturdier to damage increasing your maximum HP. You also become resistant to slow debuffs.",
+            shortHelp: "Auto: +HP, Res (Slow)",
+            icon: "icearmor_hp.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                debuffResistance: {
+                    recharge: 0.1,
+                    movement: 0.1
+                },
+                buffDuration: 10.3
+            }
+        },
+        {
+            name: "Icy Bastion",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing", "Resist Damage"],
+            description: "You encase yourself in a block of solid ice, rendering yourself invulnerable but unable to act. While the power is active you heal damage and recover endurance at an incredible rate. You can remain in this state for up to 30 seconds. Should you deactivate the power earlier, some of the resistance to damage and other effects will remain until the full 30 seconds window is over. <br><br><color #fcfc95>Notes:If you are under the effects of No Phase, this power will instantly deactivate and leave you only with the lingering effects for 30 seconds.</color>",
+            shortHelp: "Toggle: Self +Res(All DMG, but Psionics), +Res(Knockback, Repel, Disorient, Hold, Immobilize, Sleep), +Regen, +Recovery, Invulnerable; Self Hold",
+            icon: "icearmor_hybernate.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 300.0,
+                endurance: 0.1085
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['sentinel/ice-armor'] = SENTINEL_ICE_ARMOR_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.SENTINEL_ICE_ARMOR_POWERSET = SENTINEL_ICE_ARMOR_POWERSET;
+}
+
+// ---- js/data/powersets/sentinel/ice-blast.js ----
+;/**
+ * Ice Blast
+ * Character Level: 50
+ * Archetype: sentinel
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const SENTINEL_ICE_BLAST_POWERSET = {
+    name: "Ice Blast",
+    category: "Unknown",
+    description: "Ice Blast powerset",
+    icon: "ice-blast_set.png",
+    powers: [
+        {
+            name: "Ice Blast",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Sentinel Archetype Sets", "Slow Movement", "Universal Damage Sets"],
+            description: "Ice Blast hurls shards of ice at foes and Slows their attacks and movement for a time. Slower recharge than Ice Bolt, but more damage.",
+            shortHelp: "Ranged, DMG(Cold), Foe -Recharge, -SPD",
+            icon: "iceblast_iceblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.67,
+                damage: {
+                    type: "Cold",
+                    scale: 3.129
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Ice Bolt",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Sentinel Archetype Sets", "Slow Movement", "Universal Damage Sets"],
+            description: "Ice Bolt quickly pelts an enemy with small icy daggers; their chill Slows a foe's attacks and movement for a time. Fast, but little damage.",
+            shortHelp: "Ranged, DMG(Cold), Foe -Recharge, -SPD",
+            icon: "iceblast_bolt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 1.0,
+                damage: {
+                    type: "Cold",
+                    scale: 2.06
+                },
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Frost Breath",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged AoE Damage", "Sentinel Archetype Sets", "Slow Movement", "Universal Damage Sets"],
+            description: "Unleashes a cone of frosty breath that can Slow your opponents' movement and attacks. Very accurate and very deadly at medium range.",
+            shortHelp: "Close (Cone), DoT(Cold), Foe -Recharge, -SPD",
+            icon: "iceblast_frostbreath.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 6,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.2,
+                range: 40.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 2.67,
+                dotDamage: {
+                    type: "Cold",
+                    scale: 2.8278999999999996,
+                    ticks: 1
+                },
+                buffDuration: 0.6
+            }
+        },
+        {
+            name: "Chilling Ray",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Sentinel Archetype Sets", "Sleep", "Slow Movement", "Universal Damage Sets"],
+            description: "Chilling Ray encases your foe in a frail block of ice, holding them helpless in place for a while. The block of ice will break if attacked.<br><br><color #fcfc95>Notes: The Sleep component of this power is Auto Hit against regular enemies, but a To Hit check is required to against AVs and players, as well as to make secondary effects apply.</color>",
+            shortHelp: "Ranged, DMG(Cold), Foe Sleep",
+            icon: "iceblast_freezeray.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    type: "Cold",
+                    scale: 1.889
+                },
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Aim",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the chance to hit of your attacks for a few seconds. Slightly increases damage and range.",
+            shortHelp: "Self +To Hit, +DMG, +Range",
+            icon: "iceblast_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.625,
+                damageBuff: 0.425,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Ice Storm",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged AoE Damage", "Sentinel Archetype Sets", "Slow Movement", "Universal Damage Sets"],
+            description: "Shred your foes with this Ice Storm. This power deals a lot of damage in a large area and can Slow all affected targets movement and attack speed.",
+            shortHelp: "Ranged (Location AoE), Minor DoT(Cold, Lethal), Foe -Recharge, -SPD",
+            icon: "iceblast_freezingrain.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 2.0,
+                range: 40.0,
+                recharge: 60.0,
+                endurance: 15.6,
+                cast: 2.03,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Bitter Ice Blast",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Ranged Damage", "Sentinel Archetype Sets", "Slow Movement", "To Hit Debuff", "Universal Damage Sets"],
+            description: "A slower yet more powerful version of Ice Blast, Bitter Ice Blast deals much more damage and can also reduce your enemy's chance to hit. Like other Ice Blast powers, Bitter Ice Blast can Slow a target's movement and attack speed.",
+            shortHelp: "Ranged, High DMG(Cold), Foe -Recharge, -SPD, -To Hit",
+            icon: "iceblast_bitterfrostblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 1.07,
+                damage: {
+                    type: "Cold",
+                    scale: 3.909
+                },
+                tohitDebuff: 1.0,
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Bitter Freeze Ray",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Holds", "Ranged Damage", "Sentinel Archetype Sets", "Slow Movement", "Universal Damage Sets"],
+            description: "This power can Hold your opponent frozen solid in a block of ice. The victim can be attacked and will remain frozen and helpless. After the ice thaws, the victim emerges chilled and Slowed.",
+            shortHelp: "Ranged, Superior DMG(Cold), Foe Hold",
+            icon: "iceblast_bitterfreezeray.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 2.5,
+                damage: {
+                    type: "Cold",
+                    scale: 5.71
+                },
+                buffDuration: 18.0
+            }
+        },
+        {
+            name: "Blizzard",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Ranged AoE Damage", "Sentinel Archetype Sets", "Slow Movement", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You can conjure a Blizzard that inflicts Extreme Cold and Lethal damage over time and can Slow the attack rate of all your opponents in a large area, reducing their chance to hit and possibly knocking them back.",
+            shortHelp: "Ranged (Location AoE), Extreme DoT(Cold), Foe -To Hit, -SPD, -Recharge, Knockback",
+            icon: "iceblast_blizzard.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 2.0,
+                range: 40.0,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 2.03,
+                buffDuration: 8.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['sentinel/ice-blast'] = SENTINEL_ICE_BLAST_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.SENTINEL_ICE_BLAST_POWERSET = SENTINEL_ICE_BLAST_POWERSET;
+}
+
+// ---- js/data/powersets/sentinel/invulnerability.js ----
+;/**
+ * Invulnerability
+ * Character Level: 50
+ * Archetype: sentinel
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const SENTINEL_INVULNERABILITY_POWERSET = {
+    name: "Invulnerability",
+    category: "Unknown",
+    description: "Invulnerability powerset",
+    icon: "invulnerability_set.png",
+    powers: [
+        {
+            name: "Resist Physical Damage",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You are naturally tough and inherently resistant to Smashing and Lethal damage as well as Defense Debuff effects. This power is always on, and costs no Endurance.",
+            shortHelp: "Auto: Self +Res (Smash, Lethal, DeBuff DEF)",
+            icon: "invulnerability_restophysicaldmg.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 1.0,
+                            ticks: 5
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 1.0,
+                            ticks: 5
+                        }
+                    ]
+                },
+                resistance: {
+                    smashing: 0.07,
+                    lethal: 0.07
+                },
+                debuffResistance: {
+                    defense: 0.25
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Temp Invulnerability",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "When you toggle on this power, you become highly resistant to Smashing and Lethal damage.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Toggle: Self +Res(Smash, Lethal)",
+            icon: "invulnerability_temporaryinvulnerabilty.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.67,
+                resistance: {
+                    smashing: 0.21000000000000002,
+                    lethal: 0.21000000000000002,
+                    psionic: 0.21000000000000002
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Durability",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Endurance Modification", "Healing", "Resist Damage"],
+            description: "Your body is naturally durable, as a result you have higher hit points and endurance, you are also naturally resistant to toxic damage. This power is always on and costs no Endurance.",
+            shortHelp: "Auto: Self +Absorb, +MaxEnd, +Resist(Toxic)",
+            icon: "invulnerability_durability.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.5,
+                    ticks: 5
+                },
+                resistance: {
+                    toxic: 0.035
+                },
+                buffDuration: 25.0
+            }
+        },
+        {
+            name: "Dull Pain",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You can activate this power to increase your maximum Hit Points for a short time.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Self Heal, +MaxHP",
+            icon: "invulnerability_dullpain.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 360.0,
+                endurance: 10.4,
+                cast: 0.73,
+                healing: {
+                    scale: 481.9036,
+                    perTarget: true
+                },
+                buffDuration: 120.0
+            }
+        },
+        {
+            name: "Unyielding",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "When you toggle on this power, you become Unyielding. You are resistant to all damage, as well as Knockback, Sleep, Hold, Immobilize, Disorient effects.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Self +Res(All DMG; Knockback, Sleep, Disorient, Hold, Immobilize)",
+            icon: "invulnerability_unyeildlingstance.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.13,
+                cast: 2.33,
+                protection: {
+                    hold: 8.304,
+                    stun: 8.304,
+                    sleep: 8.304,
+                    immobilize: 8.304
+                },
+                resistance: {
+                    smashing: 0.035,
+                    lethal: 0.035,
+                    psionic: 0.035,
+                    fire: 0.07,
+                    cold: 0.07,
+                    energy: 0.07,
+                    negative: 0.07,
+                    toxic: 0.07
+                },
+                debuffResistance: {
+                    tohit: 0.3,
+                    defense: 0.3,
+                    recharge: 0.3,
+                    movement: 0.5
+                },
+                buffDuration: 0.75,
+                stun: 1.0,
+                stunDuration: 0.75,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Environmental Resistance",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You are naturally resistant to the environmental damage and always take less Fire, Cold, Energy, Negative, Psionic and Toxic Damage as well as Debuff effects which reduce your speed, endurance or recovery. This power is always on and costs no Endurance.",
+            shortHelp: "Auto: Self +Res(Fire, Cold, Toxic, Energy, Negative, Psionic, Slow, Endurance)",
+            icon: "invulnerability_restospecialdmg.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 1.0,
+                            ticks: 5
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.0,
+                            ticks: 5
+                        },
+                        {
+                            type: "Energy",
+                            scale: 1.0,
+                            ticks: 5
+                        },
+                        {
+                            type: "Negative",
+                            scale: 1.0,
+                            ticks: 5
+                        },
+                        {
+                            type: "Psionic",
+                            scale: 1.0,
+                            ticks: 5
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 1.0,
+                            ticks: 5
+                        }
+                    ]
+                },
+                resistance: {
+                    fire: 0.07,
+                    cold: 0.07,
+                    energy: 0.07,
+                    negative: 0.07,
+                    psionic: 0.07,
+                    toxic: 0.07
+                },
+                debuffResistance: {
+                    recharge: 0.2,
+                    movement: 0.2
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Invincible",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "To Hit Buff"],
+            description: "While this power is active you receive a bonus to Defense against all attacks and a bonus to your chance to hit.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Self +DEF(Smash, Lethal, Fire, Cold, Energy, Negative, Psionic, Toxic), +ToHit",
+            icon: "invulnerability_invincibility.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.208,
+                cast: 3.0,
+                defense: {
+                    smashing: 0.07,
+                    lethal: 0.07,
+                    fire: 0.07,
+                    cold: 0.07,
+                    energy: 0.07,
+                    negative: 0.07,
+                    psionic: 0.023331,
+                    toxic: 0.023331
+                },
+                buffDuration: 1.125,
+                tohitBuff: 1.0
+            }
+        },
+        {
+            name: "Tough Hide",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Your thickened skin makes you much tougher to hit and resistant to Defense Debuff effects. This power is always on and costs no Endurance. Tough Hide offers no protection to Psionic or Toxic Attacks.",
+            shortHelp: "Auto: Self +DEF(All but Psionic, Toxic), +Resist(Debuff DEF)",
+            icon: "invulnerability_toughhide.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                defense: {
+                    smashing: 0.035,
+                    lethal: 0.035,
+                    fire: 0.035,
+                    cold: 0.035,
+                    energy: 0.035,
+                    negative: 0.035,
+                    psionic: 0.035,
+                    toxic: 0.035
+                },
+                debuffResistance: {
+                    defense: 0.25
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Unstoppable",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "When you activate this power, you not only become extremely resistant to most damage, but also to Disorient, Immobilization, Hold, Knockback and Sleep effects. Endurance recovery is also increased. Unstoppable costs little Endurance to activate, but when it wears off you are left exhausted, and drained of almost all Health and Endurance.",
+            shortHelp: "Self, +Res(Disorient, Sleep, Hold, Immobilize, Knockback, All DMG)",
+            icon: "invulnerability_unstoppable.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 1000.0,
+                endurance: 2.6,
+                cast: 3.1,
+                dotDamage: {
+                    type: "Psionic",
+                    scale: 4.5,
+                    ticks: 90
+                },
+                resistance: {
+                    smashing: 0.49000000000000005,
+                    lethal: 0.49000000000000005,
+                    fire: 0.49000000000000005,
+                    cold: 0.49000000000000005,
+                    energy: 0.49000000000000005,
+                    negative: 0.49000000000000005,
+                    toxic: 0.49000000000000005,
+                    psionic: 0.31500000000000006
+                },
+                buffDuration: 180.0,
+                stun: 1.0,
+                stunDuration: 180.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['sentinel/invulnerability'] = SENTINEL_INVULNERABILITY_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.SENTINEL_INVULNERABILITY_POWERSET = SENTINEL_INVULNERABILITY_POWERSET;
+}
+
+// ---- js/data/powersets/sentinel/ninjitsu.js ----
+;/**
+ * Ninjitsu
+ * Character Level: 50
+ * Archetype: sentinel
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const SENTINEL_NINJITSU_POWERSET = {
+    name: "Ninjitsu",
+    category: "Unknown",
+    description: "Ninjitsu powerset",
+    icon: "ninjitsu_set.png",
+    powers: [
+        {
+            name: "Danger Sense",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "You become more evasive against ranged and area attacks while you have Danger Sense activated. This will increase your Defense versus ranged and Area of Effect attacks as long as it is active. Your Danger Sense also allow you to perceive stealthy foes and resist Defense DeBuffs.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +DEF(Ranged, AoE), +Perception, Res(DeBuff DEF)",
+            icon: "ninjitsu_dangersense.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.13,
+                cast: 0.83,
+                debuffResistance: {
+                    defense: 0.1384
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Ninja Reflexes",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Activating your Ninja Reflexes enables you to be more evasive to melee attacks. This will increase your Defense versus melee as long as it is active. Ninja Reflexes also grants you resistance to Defense DeBuffs.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +DEF(Melee), Res(DeBuff DEF)",
+            icon: "ninjitsu_ninjareflexes.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.13,
+                cast: 1.53,
+                debuffResistance: {
+                    defense: 0.1384
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Shinobi-Iri",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Shinobi Iri are the ninjitsu techniques of silent movement and avoidance, granting you stealth and defense against all positional attacks. While stealthed, the strength of your next attack will be more powerful; however, you can only attempt this after spending 8 seconds without attacking.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Toggle: Self Stealth, +DEF(Melee, Ranged, AoE), +Special",
+            icon: "ninjitsu_hide.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Kuji-In Rin",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Leaping", "Leaping & Sprints", "Resist Damage", "Running", "Running & Sprints", "Universal Travel"],
+            description: "Kuji-In Rin is the strength of mind and body. By focusing your power on this exercise, you gain a resistance to Disorient, Hold, Sleep, Immobilization, Confusion, and fear, as well as resistance to Psionic damage for a few minutes. Your running speed and jumping height are also increased.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +SPD, +Res(Disorient, Hold, Sleep, Immobilize, Confuse, Fear, Psionics)",
+            icon: "ninjitsu_kujinrin.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 200.0,
+                endurance: 10.4,
+                cast: 1.83,
+                dotDamage: {
+                    type: "Psionic",
+                    scale: 3.0,
+                    ticks: 60
+                },
+                protection: {
+                    hold: 8.304,
+                    stun: 8.304,
+                    sleep: 8.304,
+                    immobilize: 8.304,
+                    fear: 8.304,
+                    confuse: 8.304
+                },
+                resistance: {
+                    psionic: 0.21000000000000002
+                },
+                debuffResistance: {
+                    tohit: 0.3,
+                    defense: 0.3,
+                    recharge: 0.3,
+                    movement: 0.5
+                },
+                stun: 1.0,
+                stunDuration: 120.0,
+                buffDuration: 120.0,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Seishinteki Kyoyo",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "Seishinteki Kyoyo is the spiritual education in Ninjitsu. Your mastery of these spiritual techniques allow you to recover endurance with a short period of meditation.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Self +Endurance",
+            icon: "ninjitsu_recovery.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 60.0,
+                cast: 1.83
+            }
+        },
+        {
+            name: "Kuji-In Sha",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing", "Resist Damage"],
+            description: "Kuji-In Sha invokes the power of Sha, or healing. Focusing your inner power, you can heal your body of its wounds and leave yourself resistant to the effects of Toxic damage for a while.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Self Heal, Res(Toxic)",
+            icon: "ninjitsu_kujinsha.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 60.0,
+                endurance: 10.4,
+                cast: 1.0,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 2.0,
+                    ticks: 30
+                },
+                resistance: {
+                    toxic: 0.14
+                },
+                healing: {
+                    scale: 301.18975,
+                    perTarget: true
+                },
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Bo Ryaku",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "Bō Ryaku is one of the 18 fundamental skills of the Togakure-ryū school of ninjutsu. Alongside more orthodox and mainstream measures, Bō Ryaku includes use of unorthodox strategies and tactics that help you minimize the amount of damage taken in combat. This power is always on and costs no endurance.",
+            shortHelp: "Auto: Self +Res(Knockback, Knockup, All DMG)",
+            icon: "ninjitsu_resistance.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                resistance: {
+                    smashing: 0.07,
+                    lethal: 0.07,
+                    fire: 0.07,
+                    cold: 0.07,
+                    energy: 0.07,
+                    negative: 0.07,
+                    psionic: 0.07,
+                    toxic: 0.07
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Blinding Powder",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Confuse", "To Hit Debuff"],
+            description: "You throw a handful of Blinding powder in a wide arc at your foes. Most foes will be blinded, and unable to see. Some affected targets may be overcome by the powder that they may start attacking their own allies. If you attack the blinded foes, they will be alerted to your presence, but will continue to suffer a penalty to their chance to hit.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged (Cone), Foe -To Hit, Sleep, Confuse, -Perception",
+            icon: "ninjitsu_blindingpowder.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.7854,
+            effects: {
+                accuracy: 1.0,
+                range: 25.0,
+                recharge: 120.0,
+                endurance: 7.8,
+                cast: 1.07,
+                buffDuration: 20.0,
+                tohitDebuff: 1.0
+            }
+        },
+        {
+            name: "Kuji-In Retsu",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Endurance Modification", "Running", "Running & Sprints", "Universal Travel"],
+            description: "Kuji-In Retsu is the mastery of space and time. Focusing your power on Retsu enables you to control your own time to easily defeat your foes. Mastery of this power enables you to avoid almost any attack, be it ranged, melee, or area effect. Your running speed, jumping height and Endurance Recovery are also increased. Retsu also grants you high resistance to Defense DeBuffs. When Retsu wears off, you are left drained of all Endurance and unable to recover Endurance for a while.<br><br><color #fcfc95>Recharge: Extremely Long.</color>",
+            shortHelp: "Self +DEF, +SPD, +Recovery, Res(DeBuff DEF), +Special",
+            icon: "ninjitsu_kujinzen.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 1000.0,
+                endurance: 2.6,
+                cast: 1.83,
+                debuffResistance: {
+                    defense: 0.2768
+                },
+                buffDuration: 180.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['sentinel/ninjitsu'] = SENTINEL_NINJITSU_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.SENTINEL_NINJITSU_POWERSET = SENTINEL_NINJITSU_POWERSET;
+}
+
+// ---- js/data/powersets/sentinel/psionic-armor.js ----
+;/**
+ * Psionic Armor
+ * Character Level: 50
+ * Archetype: sentinel
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const SENTINEL_PSIONIC_ARMOR_POWERSET = {
+    name: "Psionic Armor",
+    category: "Unknown",
+    description: "Psionic Armor powerset",
+    icon: "psionic-armor_set.png",
+    powers: [
+        {
+            name: "Psionic Shield",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "This power generates a psionic shield that dampens most energy and elemental damage types while also reducing the effect of endurance drain effects.",
+            shortHelp: "Toggle: Self +Res(Fire, Cold, Energy, Negative, Toxic, End Drain)",
+            icon: "psionicarmor_psionicshield.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.104,
+                cast: 1.17
+            }
+        },
+        {
+            name: "Psychic Wall",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You focus to create a psychic wall that dampens the smashing, lethal and psionic damage.",
+            shortHelp: "Toggle: Self +Res(Smash, Lethal, Psionic)",
+            icon: "psionicarmor_psychicwall.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.104,
+                cast: 0.67,
+                resistance: {
+                    smashing: 0.21000000000000002,
+                    psionic: 0.21000000000000002,
+                    lethal: 0.14
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Mask Presence",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Mask Presence makes you almost impossible to detect. When you attack or are damaged while using this power, you will be discovered. Even if discovered, you are hard to see and retain some bonus to Defense. While stealthed, the strength of your next attack will be more powerful; however, you can only attempt this after spending 8 seconds without attacking.",
+            shortHelp: "Toggle: Self Stealth, +DEF(Melee, Ranged, AoE)",
+            icon: "psionicarmor_maskpresence.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 0.73
+            }
+        },
+        {
+            name: "Impenetrable Mind",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "When you toggle on this power, it grants protection from Sleep, Disorient, Fear, Immobilize, Confusion, Knockback and Hold effects. Impenetrable Mind also grants moderate resistance to Psionic based attacks.",
+            shortHelp: "Toggle: Self Res (Psionics, Disorient, Hold, Immobilize, Sleep, Fear, Confuse, Knockback)",
+            icon: "psionicarmor_impenetrablemind.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 0.73
+            }
+        },
+        {
+            name: "Devour Psyche",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "You Devour the Psyche of foes in front of you, weakening their Hit Point Regeneration and Endurance Recovery and boosting your own. Hitting any foe with this power will refresh all existing stacks you currently have.<br><br><color #fcfc95>Notes: This power has adaptive recharge. It has a base recharge of <color #FF7F27>5</color> seconds and each affected foe will increase the recharge by <color #FF7F27>5.5</color> seconds for a maximum total of <color #FF7F27>60</color> seconds.</color>",
+            shortHelp: "Cone Foe -Regen, -Heal, -Recovery; Self +Regen, +Recovery",
+            icon: "psionicarmor_devourpsyche.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 90.0,
+                endurance: 10.5,
+                cast: 1.0
+            }
+        },
+        {
+            name: "Psychokinetic Barrier",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You can erect a temporary wall of crystalized psionic energy that will absorb a large amount of damage before breaking off. Psychokinetic Barrier will grant a moderate amount of absorption and reduce the effect debuffs have on you.",
+            shortHelp: "Self, +Absorb, +MaxHP, +Regeneration, +Res(-Regeneration, -Recovery, -Recharge, -Endurance)",
+            icon: "psionicarmor_psychokineticbarrier.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 60.0,
+                endurance: 10.4,
+                cast: 1.17,
+                debuffResistance: {
+                    recharge: 0.2,
+                    regeneration: 0.2,
+                    recovery: 0.2,
+                    endurance: 0.2
+                },
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Precognition",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Precognition allows you to read your enemies' minds, letting you see their attacks before they happen and increasing your perception. This power is always on and costs no Endurance.",
+            shortHelp: "Auto: Self +DEF(Melee, Ranged, AoE, Psionic), Res(DeBuff DEF), +Perception",
+            icon: "psionicarmor_precognition.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                debuffResistance: {
+                    defense: 0.06399616
+                },
+                buffDuration: 10.25,
+                defenseBuff: 0.2312
+            }
+        },
+        {
+            name: "Aura of Madness",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "Sleep", "Recharge", "Fear", "Accuracy"],
+            allowedSetCategories: ["Confuse", "Fear", "Holds", "Sleep", "Stuns"],
+            description: "You emit a powerful psychic aura that causes the minds of those around you to become weak and distracted. Foes may be stunned, held, terrified or even confused in your presence, in addition to suffering a debuff derived from the applied control effect. Those that resist these effects will see their damage reduced. This power allows you to use your own Hit Points to keep enemies near you disabled. The power costs no endurance but can be dangerous to use.<br><br><color #fcfc95>Notes: Mez enhancements on this power enhance its magnitude instead of its duration.</color>",
+            shortHelp: "Toggle: PBAoE, Foe Confuse, Disorient, Sleep, Hold, Fear, -Damage(All), +Special",
+            icon: "psionicarmor_worldofconfusion.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 0.8,
+                recharge: 10.0,
+                cast: 1.67
+            }
+        },
+        {
+            name: "Memento Mori",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge", "Fear"],
+            allowedSetCategories: ["Endurance Modification", "Fear", "Healing"],
+            description: "Terrify your foes projecting images of their own impending demise into their minds. Memento Mori inflicts fear on targets while healing you even if you have been defeated. Each affected foe will increase your maximum hit points and heal you. Using this power while conscious will give you one opportunity to get back up should you be defeated while its effects are active.<br><br><color #fcfc95>Notes: This power recharges in <color #FF7F27>10</color> seconds if no foes are hit. Otherwise, it recharges in <color #FF7F27>300</color> seconds.</color>",
+            shortHelp: "Self Rez, +Max HP, Special",
+            icon: "psionicarmor_mementomori.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.2,
+                recharge: 300.0,
+                endurance: 18.2,
+                cast: 1.33
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['sentinel/psionic-armor'] = SENTINEL_PSIONIC_ARMOR_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.SENTINEL_PSIONIC_ARMOR_POWERSET = SENTINEL_PSIONIC_ARMOR_POWERSET;
+}
+
+// ---- js/data/powersets/sentinel/psychic-blast.js ----
+;/**
+ * Psychic Blast
+ * Character Level: 50
+ * Archetype: sentinel
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const SENTINEL_PSYCHIC_BLAST_POWERSET = {
+    name: "Psychic Blast",
+    category: "Unknown",
+    description: "Psychic Blast powerset",
+    icon: "psychic-blast_set.png",
+    powers: [
+        {
+            name: "Mental Blast",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "This basic attack does moderate Psionic damage, and can slightly reduce a target's attack speed.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, Light DMG(Psionic), Target -Recharge",
+            icon: "psychicblast_mentalblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 75.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.67,
+                damage: {
+                    type: "Psionic",
+                    scale: 2.729
+                },
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Telekinetic Blast",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You can use Telekinesis to Blast a targeted foe with the power of your mind. This attack deals Smashing and Psionic damage, and can knock your opponent back.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Ranged, Light DMG(Smash/Psionic), Foe Knockback",
+            icon: "psychicblast_telekineticblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 75.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Psionic",
+                            scale: 2.34
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.32
+                        }
+                    ],
+                    scale: 2.6599999999999997
+                }
+            }
+        },
+        {
+            name: "Psychic Scream",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "This howl of Psionic energy resonates in the minds of all foes within its conical area of effect, inflicting moderate damage.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Cone), Light DMG(Psionic), Foe -Recharge",
+            icon: "psychicblast_psychicscream.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 6,
+            arc: 1.2217,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 1.87,
+                damage: {
+                    type: "Psionic",
+                    scale: 1.7277
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Will Domination",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Sentinel Archetype Sets", "Sleep", "Universal Damage Sets"],
+            description: "This powerful attack deals Psionic damage, and is so painful it usually renders its target unconscious. The victim is asleep, and will wake if disturbed.<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged, High DMG(Psionic), Foe Sleep",
+            icon: "psychicblast_willdomination.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 75.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.1,
+                damage: {
+                    type: "Psionic",
+                    scale: 3.5300000000000002
+                }
+            }
+        },
+        {
+            name: "Psychic Focus",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the chance to hit of your attacks for a few seconds. Slightly increases damage and range.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +To Hit, +DMG, +Range",
+            icon: "psychicblast_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 5.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Psionic Strike",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "This extremely accurate attack does moderate Psionic damage and can Slow a target's attack rate.<br><br><color #fcfc95>Damage: Superior.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Superior DMG(Psionic), Target -Recharge",
+            icon: "psychicblast_heavy.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 75.0,
+                recharge: 14.0,
+                endurance: 13.52,
+                cast: 2.67,
+                damage: {
+                    type: "Psionic",
+                    scale: 5.429
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Psionic Tornado",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "Unleashes a whirlwind of Psionic energy on a target, tossing nearby foes into the air. The Psionic Tornado damages foes and Slows their attack speed.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Targeted AoE), Moderate DoT(Psionic), Foe Knockback",
+            icon: "psychicblast_psionictornado.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 1.83,
+                dotDamage: {
+                    type: "Psionic",
+                    scale: 0.3021,
+                    ticks: 4
+                },
+                buffDuration: 4.1
+            }
+        },
+        {
+            name: "Scramble Thoughts",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Sentinel Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "Painfully scrambles the synapses of a targeted foe, leaving them dramatically Disoriented for a short duration. Deals a little Psionic Damage.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Extreme DMG(Psionic), Foe Disorient",
+            icon: "psychicblast_scramblethoughts.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 75.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 3.0,
+                damage: {
+                    type: "Psionic",
+                    scale: 6.859999999999999
+                },
+                stun: 3.0
+            }
+        },
+        {
+            name: "Psychic Wail",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee AoE Damage", "Sentinel Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "Psychic Wail is a devastating Psionic attack that wracks the minds of all nearby foes which deals Extreme Psionic damage. Those that survive will have a severely reduced attack rate and may be left Disoriented.<br><br><color #fcfc95>Damage: Superior.</color><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE, Superior DMG(Psionic), Foe Disorient -Recharge",
+            icon: "psychicblast_psychicwail.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.5,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 1.97,
+                damage: {
+                    type: "Psionic",
+                    scale: 3.598
+                },
+                stun: 3.0,
+                buffDuration: 20.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['sentinel/psychic-blast'] = SENTINEL_PSYCHIC_BLAST_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.SENTINEL_PSYCHIC_BLAST_POWERSET = SENTINEL_PSYCHIC_BLAST_POWERSET;
+}
+
+// ---- js/data/powersets/sentinel/radiation-armor.js ----
+;/**
+ * Radiation Armor
+ * Character Level: 50
+ * Archetype: sentinel
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const SENTINEL_RADIATION_ARMOR_POWERSET = {
+    name: "Radiation Armor",
+    category: "Unknown",
+    description: "Radiation Armor powerset",
+    icon: "radiation-armor_set.png",
+    powers: [
+        {
+            name: "Alpha Barrier",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You cloak yourself in a field of protective radiation that grants you a good deal of resistance to Lethal, Smashing and Toxic damage.",
+            shortHelp: "Toggle: Self +Res(Lethal, Smash, Toxic)",
+            icon: "radiationarmor_alphabarrier.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.67,
+                resistance: {
+                    smashing: 0.21000000000000002,
+                    lethal: 0.21000000000000002,
+                    toxic: 0.24500000000000002
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Gamma Boost",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "Gamma Boost grants you a passive boost to both regeneration and recovery. The lower your current health is, the greater the regeneration bonus you'll receive from Gamma Boost. The higher your current health is, the greater the recovery bonus you'll receive from Gamma Boost. This power is always active.",
+            shortHelp: "Auto: Self +Regen, +Recovery, Special",
+            icon: "radiationarmor_gammaboost.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                debuffResistance: {
+                    regeneration: 0.1384
+                },
+                buffDuration: 1.25
+            }
+        },
+        {
+            name: "Proton Armor",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "When active, your body is encased in a shield-like radiation barrier that gives you good resistance to Energy and Fire damage and moderate resistance to Cold and Negative Energy attacks.",
+            shortHelp: "Toggle: Self, +Res(Energy, Fire, Cold and Negative)",
+            icon: "radiationarmor_protonarmor.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.67,
+                resistance: {
+                    energy: 0.28,
+                    fire: 0.21000000000000002,
+                    negative: 0.21000000000000002,
+                    cold: 0.052500000000000005
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Fallout Shelter",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "While active you are protected from recharge, movement, hold, sleep, immobilize, stun and knockdown effects. Additionally Fallout Shelter grants you minor resistance to toxic and psionic damage as well as a measure of resistance against slow effects.",
+            shortHelp: "Toggle: Self +Res(Hold, Sleep, Immobilize, Stun, Knockdown, Toxic, Psi, Slow)",
+            icon: "radiationarmor_falloutshelter.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 0.73,
+                protection: {
+                    hold: 8.304,
+                    stun: 8.304,
+                    sleep: 8.304,
+                    immobilize: 8.304
+                },
+                resistance: {
+                    fire: 0.035,
+                    energy: 0.035,
+                    negative: 0.035,
+                    psionic: 0.10500000000000001,
+                    toxic: 0.10500000000000001
+                },
+                debuffResistance: {
+                    recharge: 0.29064,
+                    movement: 0.29064,
+                    tohit: 0.3
+                },
+                stun: 1.0,
+                stunDuration: 0.75,
+                buffDuration: 0.75,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Proton Therapy",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "You concentrate your energies to harness the healing powers of radiation to mend your wounds. The effects of Proton Therapy also leaves you resistant to Toxic damage and regeneration debuffs for a while, in addition to giving you some endurance over time.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Self Heal, Endurance over time, Res(Toxic, -Regen)",
+            icon: "radiationarmor_protontherapy.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 50.0,
+                endurance: 10.4,
+                cast: 1.03,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 2.0,
+                    ticks: 30
+                },
+                resistance: {
+                    toxic: 0.14
+                },
+                debuffResistance: {
+                    regeneration: 0.2076
+                },
+                healing: {
+                    scale: 301.18975
+                },
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Particle Acceleration",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "Your Particles have been accelerated allowing you to move faster than normal, as well as resist slow effects. This power is always on and permanently increases your attack rate and movement speed.",
+            shortHelp: "Auto: Self +Recharge, +SPD, Res (Slow)",
+            icon: "radiationarmor_particleacceleration.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                debuffResistance: {
+                    recharge: 0.4,
+                    movement: 0.4
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Particle Shielding",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "You channel a tremendous amount of radiation into a barrier around you. For a short time you will have a strong absorption shield in addition to a regeneration and recovery buff.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self, +Absorb, +Regeneration",
+            icon: "radiationarmor_particleshielding.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 120.0,
+                endurance: 10.4,
+                cast: 0.73,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Ground Zero",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Accurate Healing", "Defense Debuff", "Healing", "Melee AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You release a mixture of radiation into the area. Nearby foes will be barraged with harmful radiation and will suffer Moderate Energy damage immediately, followed by moderate toxic damage over time. Affected foes will also have their defense reduced. Nearby allies will be healed for a moderate amount and will recover health over time. This power can affect a total of 30 targets. This includes both friends and foes. Ground Zero has no effect on the caster, only nearby allies and enemies.",
+            shortHelp: "PBAoE, Foe DMG(Energy), DoT (Toxic), -DEF(All), Ally +HP, +Heal over time",
+            icon: "radiationarmor_groundzero.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.2,
+                recharge: 90.0,
+                endurance: 13.0,
+                cast: 3.0
+            }
+        },
+        {
+            name: "Meltdown",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Resist Damage"],
+            description: "After building up a dangerous amount of radiation you release it to both shield and empower yourself. While active you will gain a good amount of damage resistance to all types of damage, recover endurance more quickly and deal more damage for a short time. When this power wears off you will lose a small amount endurance.",
+            shortHelp: "Self, +Res(All), +Recovery, +DMG(All)",
+            icon: "radiationarmor_meltdown.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 480.0,
+                endurance: 2.6,
+                cast: 2.93,
+                resistance: {
+                    smashing: 0.14,
+                    lethal: 0.14,
+                    fire: 0.14,
+                    cold: 0.14,
+                    energy: 0.14,
+                    negative: 0.14,
+                    psionic: 0.14,
+                    toxic: 0.14
+                },
+                debuffResistance: {
+                    recovery: 1.0
+                },
+                buffDuration: 60.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['sentinel/radiation-armor'] = SENTINEL_RADIATION_ARMOR_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.SENTINEL_RADIATION_ARMOR_POWERSET = SENTINEL_RADIATION_ARMOR_POWERSET;
+}
+
+// ---- js/data/powersets/sentinel/radiation-blast.js ----
+;/**
+ * Radiation Blast
+ * Character Level: 50
+ * Archetype: sentinel
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const SENTINEL_RADIATION_BLAST_POWERSET = {
+    name: "Radiation Blast",
+    category: "Unknown",
+    description: "Radiation Blast powerset",
+    icon: "radiation-blast_set.png",
+    powers: [
+        {
+            name: "Neutrino Bolt",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "A very quick, but low damage attack. Neutrino Bolt can reduce the target's Defense.",
+            shortHelp: "Ranged, DMG(Energy), Foe -DEF",
+            icon: "radiationburst_neutrinoblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    type: "Energy",
+                    scale: 2.26
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 3.0
+            }
+        },
+        {
+            name: "X-Ray Beam",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You can emit a beam of X-Ray energy from your eyes, dealing moderate Energy damage. This attack can bypass some defenses and can reduce the target's Defense.",
+            shortHelp: "Ranged, DMG(Energy), Foe -DEF",
+            icon: "radiationburst_xraybeam.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.1,
+                range: 60.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    type: "Energy",
+                    scale: 3.529
+                },
+                defenseDebuff: 2.0,
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Irradiate",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Melee AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You can emit lethal amounts of radiation in all directions, damaging all nearby foes for a short time. Like other Radiation attacks, this power can bypass some of a target's defenses. Irradiate severely reduces the target's Defense.",
+            shortHelp: "Close (AoE), DoT(Energy), Foe -DEF",
+            icon: "radiationburst_irradiate.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.1,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 1.07,
+                dotDamage: {
+                    type: "Energy",
+                    scale: 0.14880000000000002,
+                    ticks: 9
+                },
+                buffDuration: 4.6,
+                defenseDebuff: 3.0
+            }
+        },
+        {
+            name: "Cosmic Burst",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged Damage", "Sentinel Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "Cosmic Burst smashes the target with cosmic particles. The attack is devastating and can leave most targets Disoriented and with reduced Defense.",
+            shortHelp: "Ranged, DMG(Energy), Foe Disorient, -DEF",
+            icon: "radiationburst_cosmicburst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 11.0,
+                endurance: 11.024,
+                cast: 2.07,
+                damage: {
+                    type: "Energy",
+                    scale: 4.409000000000001
+                },
+                stun: 3.0,
+                defenseDebuff: 3.0,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Aim",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the chance to hit of your attacks for a few seconds. Slightly increases damage and range.",
+            shortHelp: "Self +To Hit, +DMG, +Range",
+            icon: "radiationburst_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.625,
+                damageBuff: 0.425,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Electron Haze",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Knockback", "Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "A short range conical blast of free electrons. This attack can bypass some of a target's defenses and reduce the target's Defense. It can also knock some targets down.",
+            shortHelp: "Close, DMG(Energy), Foe -DEF, Knockback",
+            icon: "radiationburst_electronhaze.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 6,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.1,
+                range: 40.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 2.37,
+                damage: {
+                    type: "Energy",
+                    scale: 5.2989999999999995
+                },
+                defenseDebuff: 2.0,
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Proton Stream",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "Hurls a volley of alpha particles at your target. Proton Volley is highly accurate and will reduce the target's Defense.",
+            shortHelp: "Ranged, DMG(Energy), Foe -DEF",
+            icon: "radiationburst_heavy.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 60.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 1.67,
+                dotDamage: {
+                    type: "Energy",
+                    scale: 1.0823,
+                    ticks: 3
+                },
+                buffDuration: 0.41,
+                defenseDebuff: 3.0
+            }
+        },
+        {
+            name: "Neutron Bomb",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "This devastating attack lobs an explosive sphere of deadly radiation, damaging the target and all nearby foes. Neutron Bomb can bypass some of a target's defenses and reduce the target's Defense.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Energy), Foe -DEF",
+            icon: "radiationburst_radiationblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.1,
+                range: 40.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.67,
+                damage: {
+                    type: "Energy",
+                    scale: 1.5796999999999999
+                },
+                defenseDebuff: 2.0,
+                buffDuration: 16.0
+            }
+        },
+        {
+            name: "Atomic Blast",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Melee AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "This attack taps most of your stored energy to deal a devastating Atomic Blast which deals Extreme Energy and Smashing damage. Any foes left standing will have their Defense greatly reduced and may be left helplessly choking on toxic vapors.",
+            shortHelp: "PBAoE, DMG(Energy/Smash), Foe Hold, -DEF",
+            icon: "radiationburst_atomicblast.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.4,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 2.93,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 3.3120000000000003
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.3818000000000001
+                        }
+                    ],
+                    scale: 4.6938
+                },
+                defenseDebuff: 4.0,
+                buffDuration: 20.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['sentinel/radiation-blast'] = SENTINEL_RADIATION_BLAST_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.SENTINEL_RADIATION_BLAST_POWERSET = SENTINEL_RADIATION_BLAST_POWERSET;
+}
+
+// ---- js/data/powersets/sentinel/regeneration.js ----
+;/**
+ * Regeneration
+ * Character Level: 50
+ * Archetype: sentinel
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const SENTINEL_REGENERATION_POWERSET = {
+    name: "Regeneration",
+    category: "Unknown",
+    description: "Regeneration powerset",
+    icon: "regeneration_set.png",
+    powers: [
+        {
+            name: "Fast Healing",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Healing"],
+            description: "You heal Hit Points at a faster rate than normal. This power is always on.",
+            shortHelp: "Auto: Self +Regeneration",
+            icon: "regeneration_fasthealing.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                debuffResistance: {
+                    regeneration: 0.2
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Reconstruction",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing", "Resist Damage"],
+            description: "Through perfect control of your body, you can concentrate for a few moments and heal yourself. The effects of Reconstruction also leaves you resistant to Toxic damage for a while.",
+            shortHelp: "Self Heal, Res(Toxic)",
+            icon: "regeneration_reconstruction.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 60.0,
+                endurance: 10.4,
+                cast: 0.73,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 2.0,
+                    ticks: 30
+                },
+                resistance: {
+                    toxic: 0.14
+                },
+                healing: {
+                    scale: 301.18975,
+                    perTarget: true
+                },
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Quick Recovery",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "You recover Endurance at a faster rate than normal. This power is always on.",
+            shortHelp: "Auto: Self +Recovery",
+            icon: "regeneration_quickrecovery.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                debuffResistance: {
+                    recovery: 0.2
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Ailment Resistance",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Healing"],
+            description: "Your superior immune system makes you resilient to disease and multiple ailments. Healing techniques also become more effective. This power is always on.",
+            shortHelp: "Auto: Self +Max HP, -Res(Heal), Res(-Defense, -Endurance, -Speed, -Regeneration, -Recovery, -Recharge, -Range, -ToHit)",
+            icon: "regeneration_resiststun.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                debuffResistance: {
+                    tohit: 0.2,
+                    defense: 0.2,
+                    recharge: 0.2,
+                    movement: 0.2,
+                    regeneration: 0.2,
+                    recovery: 0.2,
+                    endurance: 0.2
+                },
+                buffDuration: 10.3,
+                tohitBuff: 0.2
+            }
+        },
+        {
+            name: "Integration",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You can Integrate your mind and body, making you resistant to Knockback, Disorient, Hold, Sleep, and Immobilization effects, as well as increase your regeneration rate, for as long as you can keep this toggle power active.",
+            shortHelp: "Toggle: Self +Res(Knockback, Disorient, Hold, Sleep, Immobilize), +Regeneration",
+            icon: "regeneration_integration.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.13,
+                cast: 3.1,
+                protection: {
+                    hold: 8.304,
+                    stun: 8.304,
+                    sleep: 8.304,
+                    immobilize: 8.304
+                },
+                debuffResistance: {
+                    tohit: 0.3,
+                    defense: 0.3,
+                    recharge: 0.3,
+                    movement: 0.5
+                },
+                buffDuration: 0.75,
+                stun: 1.0,
+                stunDuration: 0.75,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Resilience",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You are more Resilient. This power allows you to build up a resistance to Disorientation effects. You tend not to get Disoriented, and if you do, it wears off quickly. This resistance to Disorientation gets stronger as you go up in level. Resilience also grants some resistance to all types of damage. This power is always on.",
+            shortHelp: "Auto: Self +Res(Disorient, All DMG)",
+            icon: "regeneration_resist.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                protection: {
+                    stun: 4.152
+                },
+                resistance: {
+                    smashing: 0.08750000000000001,
+                    lethal: 0.08750000000000001,
+                    fire: 0.08750000000000001,
+                    cold: 0.08750000000000001,
+                    energy: 0.08750000000000001,
+                    negative: 0.08750000000000001,
+                    psionic: 0.08750000000000001,
+                    toxic: 0.08750000000000001
+                },
+                stun: 1.0,
+                stunDuration: 10.25,
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Reactive Regeneration",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "When you activate this power, you can regenerate your health at an astounding rate. This boost becomes stronger every time you take damage, as it scales you also become resistant to regeneration and recovery debuffs as well as endurance drain.",
+            shortHelp: "Toggle: Self +Regeneration, +Res(-Regeneration, -End, -Recovery)",
+            icon: "regeneration_instanthealing.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.52,
+                cast: 1.17
+            }
+        },
+        {
+            name: "Second Wind",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "When you use this power you will recover a percentage of your missing health, in addition to increasing your maximum hit points. Should you fall in battle after using this power, you can stand up and fight again. If used while defeated, you will enter stand back up and be protected from XP Debt for 90 seconds and immune to most damage for 15 seconds.<br><br><color #fcfc95>Note: the self resurect granted if this power is activated while alive can not be enhanced.</color>",
+            shortHelp: "Self +Max HP, Rez(Special)",
+            icon: "regeneration_dullpain.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 360.0,
+                endurance: 10.4,
+                cast: 0.73
+            }
+        },
+        {
+            name: "Moment of Glory",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Endurance Modification", "Resist Damage"],
+            description: "When you activate this power, you deal increased damage, recover Endurance more quickly, gain Resistance and Defense to all damage types, and are highly resistant to Knock Back, Sleep, Disorient, Immobilization, and Hold effects.",
+            shortHelp: "Self +DMG, +Res(All DMG, Knock Back, Repel, Stun, Hold, Sleep, Immobilize), +DEF(All DMG), +Recovery",
+            icon: "regeneration_momentofglory.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 240.0,
+                endurance: 2.6,
+                cast: 1.5
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['sentinel/regeneration'] = SENTINEL_REGENERATION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.SENTINEL_REGENERATION_POWERSET = SENTINEL_REGENERATION_POWERSET;
+}
+
+// ---- js/data/powersets/sentinel/seismic-blast.js ----
+;/**
+ * Seismic Blast
+ * Character Level: 50
+ * Archetype: sentinel
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const SENTINEL_SEISMIC_BLAST_POWERSET = {
+    name: "Seismic Blast",
+    category: "Unknown",
+    description: "Seismic Blast powerset",
+    icon: "seismic-blast_set.png",
+    powers: [
+        {
+            name: "Encase",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "Encase a foe in stone for a short moment, dealing damage and lowering their defense. The enemy will also become heavy, limiting their ability to jump and fly for a short time. <br><br>Encase grants two stacks of Seismic Pressure.",
+            shortHelp: "Ranged, DMG(Smash), Foe -Jump, -Fly, -DEF",
+            icon: "seismicblast_shatter.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.0,
+                damage: {
+                    type: "Smashing",
+                    scale: 2.26
+                },
+                defenseDebuff: 0.5,
+                buffDuration: 3.0
+            }
+        },
+        {
+            name: "Seismic Shockwaves",
+            available: 0,
+            tier: 1,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "While on the ground, nearby enemies might be knocked down and some of your attacks are empowered.<br><br>This power is only for short periods of times after being triggered by Seismic Pressure.",
+            shortHelp: "Foe Knock Down, Self Special",
+            icon: "seismic_power.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 1,
+            effects: {
+                accuracy: 0.8
+            }
+        },
+        {
+            name: "Shatter",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "Cover a foe in stone shards and shatter them, inflicting light damage and lowering their defense. They will also become heavy, limiting their ability to jump and fly for a short time. <br><br>Shatter grants two stacks of Seismic Pressure.",
+            shortHelp: "Ranged, DMG(Smash), Foe -Jump, -Fly, -DEF",
+            icon: "seismicblast_encase.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 7.0,
+                endurance: 7.696,
+                cast: 1.33,
+                damage: {
+                    type: "Smashing",
+                    scale: 3.091
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Rock Shards",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You launch a volley of stone shards at your target in a sweeping cone. These shards stab into the target, causing lethal damage. They will also continue to suffer additional lethal damage over time.<br><br>If affected by Seismic Shockwaves, this power will halt the shockwaves, the up front damage will be increased and damage over time accelerated, foes will be knocked down, range will be increased to 60ft and arc to 40 degrees.<br><br>Rock Shards grants two stacks of Seismic Pressure.",
+            shortHelp: "Ranged Cone, DMG(Smash), -Defense, Special",
+            icon: "seismicblast_rockshards.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 6,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.07
+            }
+        },
+        {
+            name: "Entomb",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "Entomb foes in a giant boulder, dealing high damage and lowering their defense. They will also become heavy, limiting their ability to jump and fly for a short time. <br><br>Entomb grants two stacks of Seismic Pressure.",
+            shortHelp: "Ranged, DMG(Smash), Foe -Jump, -Fly, -DEF",
+            icon: "seismicblast_entomb.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 11.0,
+                endurance: 11.024,
+                cast: 2.07,
+                damage: {
+                    type: "Smashing",
+                    scale: 4.409000000000001
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 12.0
+            }
+        },
+        {
+            name: "Seismic Force",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases your attacks' chance to hit for a few seconds. Slightly increases damage and range.<br><br>If affected by Seismic Shockwaves, this power will halt the shockwaves and will decrease the cooldown of all recharging Seismic Blast attacks by a moderate amount.",
+            shortHelp: "Self +To Hit, +DMG, +Range, +Special",
+            icon: "seismicblast_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 5.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Upthrust",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Knockback", "Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You channel seismic energy into the earth, causing a micro-fault to erupt under your target. This causes a shard of rock to thrust upward out of the ground, dealing smashing damage and lowering their defense. Affected foes will become heavy, limiting their ability to jump and fly for a short time. The force of the eruption can knockback enemies.<br><br>Upthrust grants two stacks of Seismic Pressure.",
+            shortHelp: "Targeted AoE, DMG(Smash), -Fly, -Defense, Chance to Knockback",
+            icon: "seismicblast_upthrust.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.2,
+                damage: {
+                    type: "Smashing",
+                    scale: 2.7785
+                },
+                defenseDebuff: 0.7,
+                buffDuration: 16.0
+            }
+        },
+        {
+            name: "Gravestone",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "Create a giant pillar of stone, creating a Gravestone around your target, dealing extreme damage and limiting their ability to jump and fly for a short time.<br><br>Gravestone grants two stacks of Seismic Pressure.",
+            shortHelp: "Ranged, DMG(Smash), Foe -Jump, -Fly",
+            icon: "seismicblast_gravestone.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 60.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 1.67,
+                damage: {
+                    type: "Smashing",
+                    scale: 4.329
+                },
+                buffDuration: 16.0
+            }
+        },
+        {
+            name: "Stalagmite",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Sentinel Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "You can cause a Stalagmite to erupt under an enemy dealing minimal Lethal damage, and Disorienting them for a good while. You must be on the ground to activate this power.<br><br>If affected by Seismic Shockwaves, this power will halt the shockwaves and deal extreme damage.<br><br>Stalagmite grants two stacks of Seismic Pressure.",
+            shortHelp: "Ranged, DMG(Smash), Foe Disorient, Special",
+            icon: "seismicblast_stalagmite.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 8.0,
+                endurance: 10.192,
+                cast: 1.0
+            }
+        },
+        {
+            name: "Meteor",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You call down a meteor strike from the sky at a specified location. All targets within 25' are caught in the blast radius, taking extreme damage and being knocked back.",
+            shortHelp: "Ranged (Location AoE), DMG(Smash/Fire), Foe Knockback",
+            icon: "seismicblast_meteor.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 2.57,
+                buffDuration: 10.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['sentinel/seismic-blast'] = SENTINEL_SEISMIC_BLAST_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.SENTINEL_SEISMIC_BLAST_POWERSET = SENTINEL_SEISMIC_BLAST_POWERSET;
+}
+
+// ---- js/data/powersets/sentinel/sonic-attack.js ----
+;/**
+ * Sonic Attack
+ * Character Level: 50
+ * Archetype: sentinel
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const SENTINEL_SONIC_ATTACK_POWERSET = {
+    name: "Sonic Attack",
+    category: "Unknown",
+    description: "Sonic Attack powerset",
+    icon: "sonic-attack_set.png",
+    powers: [
+        {
+            name: "Scream",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "Your Scream can cause serious damage to a target.",
+            shortHelp: "Ranged, Moderate DoT(Smashing/Energy), -Res",
+            icon: "sonicblast_medium.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.47,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 0.4658,
+                            ticks: 4
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.132,
+                            ticks: 4
+                        }
+                    ]
+                },
+                buffDuration: 1.05
+            }
+        },
+        {
+            name: "Shriek",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You let forth a quick Shriek, damaging your target.",
+            shortHelp: "Ranged, Light DMG(Smashing/Energy), Foe -Resist",
+            icon: "sonicblast_quick.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 1.64
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.42
+                        }
+                    ],
+                    scale: 2.06
+                },
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Howl",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "A short ranged sonic attack that can hit multiple enemies in an arc in front of you.",
+            shortHelp: "Ranged Cone, Minor DMG(Smashing/Energy), Foe -Res(All)",
+            icon: "sonicblast_cone.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 6,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.6,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 2.9257
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.3347
+                        }
+                    ],
+                    scale: 3.2603999999999997
+                },
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Shout",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You blast your foe with a tremendous Shout, damaging them.",
+            shortHelp: "Ranged, High DMG(Smashing/Energy), Foe -Res(All)",
+            icon: "sonicblast_heavy.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 11.0,
+                endurance: 11.024,
+                cast: 2.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 3.3000000000000003
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.06
+                        }
+                    ],
+                    scale: 4.36
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Amplify",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Ranged Damage", "To Hit Buff"],
+            description: "Greatly increases your chance to hit with attacks for a few seconds. Slightly increases damage.",
+            shortHelp: "Self +To Hit, +DMG, +Range",
+            icon: "sonicblast_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 5.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Shockwave",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You can call forth a tremendous Shockwave that knocks back foes and deals Smashing damage in a wide cone area.",
+            shortHelp: "Ranged (Cone), Light DMG(Smashing/Energy), Foe Knockback, -Res(All)",
+            icon: "sonicblast_knockback.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 6,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 11.0,
+                endurance: 11.024,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 1.2526
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.4326
+                        }
+                    ],
+                    scale: 1.6852
+                }
+            }
+        },
+        {
+            name: "Sirens Song",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged AoE Damage", "Sentinel Archetype Sets", "Sleep", "Universal Damage Sets"],
+            description: "You send forth a subsonic pulse which causes your foes to fall unconscious and take energy damage. Your foes will remain unconscious for a good while, but will awaken if disturbed.<br><br><color #fcfc95>Notes: The Sleep component of this power is Auto Hit against regular enemies, but a To Hit check is required against AVs and players, as well as to make secondary effects apply.</color>",
+            shortHelp: "Ranged (Cone), Minor DMG(Energy), Foe Sleep",
+            icon: "sonicblast_sleep.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.8727,
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.86,
+                damage: {
+                    type: "Energy",
+                    scale: 0.9546
+                }
+            }
+        },
+        {
+            name: "Screech",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Sentinel Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "By bursting forth with this hypersonic Screech, you can inflict high damage and disorient a target.",
+            shortHelp: "Ranged, High DMG(Smashing/Energy), Foe Disorient, -Res(All)",
+            icon: "sonicblast_stun.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 1.5,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.105
+                        },
+                        {
+                            type: "Energy",
+                            scale: 2.105
+                        }
+                    ],
+                    scale: 4.21
+                },
+                stun: 3.0,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Dreadful Wail",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee AoE Damage", "Sentinel Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "Your Dreadful Wail is so strong that most foes will be defeated by being subjected to it. Dreadful Wail deals Extreme Smashing and Energy damage to all nearby foes in addition to disorienting them for a good while.",
+            shortHelp: "PBAoE, Superior DMG(Energy/Smash), Foe Disorient, -Res(All)",
+            icon: "sonicblast_massivedamage.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.4,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 1.97,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 3.5981
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.928
+                        }
+                    ],
+                    scale: 4.5261000000000005
+                },
+                stun: 3.0,
+                buffDuration: 20.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['sentinel/sonic-attack'] = SENTINEL_SONIC_ATTACK_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.SENTINEL_SONIC_ATTACK_POWERSET = SENTINEL_SONIC_ATTACK_POWERSET;
+}
+
+// ---- js/data/powersets/sentinel/stone-armor.js ----
+;/**
+ * Stone Armor
+ * Character Level: 50
+ * Archetype: sentinel
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const SENTINEL_STONE_ARMOR_POWERSET = {
+    name: "Stone Armor",
+    category: "Unknown",
+    description: "Stone Armor powerset",
+    icon: "stone-armor_set.png",
+    powers: [
+        {
+            name: "Rock Armor",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Your skin becomes stone while this power is active. Rock Armor protects you from Smashing and Lethal attacks. They are less likely to land and affect you. Stone Armor also grants you resistance to Defense DeBuffs.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +DEF(Lethal, Smash), Res(DeBuff DEF)",
+            icon: "stonearmor_stonearmor.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 0.73,
+                debuffResistance: {
+                    defense: 0.11072
+                },
+                buffDuration: 0.75,
+                defenseBuff: 0.4
+            }
+        },
+        {
+            name: "Stone Skin",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Defense Sets", "Resist Damage"],
+            description: "Your tough skin is naturally resistant to most types of damage. This power is always on and costs no Endurance.",
+            shortHelp: "Auto: Self +Res(All but Psionics), +DEF(All but Psionics)",
+            icon: "stonearmor_stoneskin.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                dotDamage: {
+                    type: "Psionic",
+                    scale: 1.0,
+                    ticks: 5
+                },
+                resistance: {
+                    smashing: 0.07,
+                    lethal: 0.07,
+                    fire: 0.07,
+                    cold: 0.07,
+                    energy: 0.07,
+                    negative: 0.07,
+                    toxic: 0.07,
+                    psionic: 0.07
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Earth's Embrace",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing", "Resist Damage"],
+            description: "You are so connected to the Earth, you can draw upon its power to add to your health. Activating this power increases your maximum Hit Points and grants you resistance to Toxic Damage.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +HP, Res(Toxic)",
+            icon: "stonearmor_earthsembrace.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 120.0,
+                endurance: 10.4,
+                cast: 1.0,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 2.0,
+                    ticks: 30
+                },
+                resistance: {
+                    toxic: 0.14
+                },
+                healing: {
+                    scale: 162.64246500000002,
+                    perTarget: true
+                },
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Terra Firma",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Being on solid ground allows you to more carefully aim your attack for optimal range. This power increases your chance to hit, accuracy, and range of your attacks and makes you more resistant to To-Hit debuffs, but only applies when you are near the ground.",
+            shortHelp: "Auto: Self +To Hit, +ACC, +Range, Res(ToHit)",
+            icon: "stonearmor_terrafirma.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                debuffResistance: {
+                    tohit: 0.2768
+                },
+                tohitBuff: 1.0,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Rooted",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "While this power is active, you merge with the Earth and draw forth its power to become resistant to Knockback, Sleep, Hold, Disorient and Endurance Drain effects, and increase your Hit Point Regeneration rate. Rooted also grants you resistance to Defense DeBuffs.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +Res(Knockback, Sleep, Disorient, Hold, End Drain, DeBuff DEF), +Regeneration",
+            icon: "stonearmor_rooted.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 1.17,
+                protection: {
+                    hold: 8.304,
+                    stun: 8.304,
+                    sleep: 8.304,
+                    immobilize: 8.304
+                },
+                debuffResistance: {
+                    defense: 0.3,
+                    tohit: 0.3,
+                    recharge: 0.3,
+                    movement: 0.5
+                },
+                buffDuration: 0.75,
+                defenseBuff: 0.3,
+                stun: 1.0,
+                stunDuration: 0.75,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Crystal Armor",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Endurance Modification"],
+            description: "While this power is active, your skin becomes encrusted in various quartz crystals. Crystal Armor makes Energy and Negative Energy attacks less likely to hit. This power also grants you an Endurance recovery buff and resistance to Defense DeBuffs.<br><br>Crystal Armor also adds an Elusivity defense bonus to Energy and Negative Energy Attacks in PVP zones.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +Recovery, +DEF(Energy, Negative), Res(DeBuff DEF)",
+            icon: "stonearmor_crystalarmor.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 1.0,
+                debuffResistance: {
+                    defense: 0.11072
+                },
+                buffDuration: 0.75,
+                defenseBuff: 0.4
+            }
+        },
+        {
+            name: "Brimstone Armor",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "While this power is active, your skin becomes encrusted in cracked magma. Brimstone Armor makes you highly resistant to Fire, Cold and Toxic damage, and helps your attacks set enemies on fire, delivering damage over time.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +Res(Fire, Cold, Toxic), +Special",
+            icon: "stonearmor_magmaarmor.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 0.73,
+                resistance: {
+                    fire: 0.21000000000000002,
+                    cold: 0.21000000000000002,
+                    toxic: 0.14
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Minerals",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Activating this power summons several rare earth rock Minerals to orbit around you. These Minerals can disperse thought patterns and make Psionic attacks less likely to hit. They also bring clarity of the mind reducing the recharge time of your powers, increasing your Perception, and making you resistant to Confusion.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +Recharge, +DEF(Psionic), Res(Confuse, Perception), +Perception",
+            icon: "stonearmor_mineralcrust.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 0.73,
+                protection: {
+                    confuse: 30.0
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Geode",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "When you activate this power, you encase yourself in various protective mineral layers that can absorb incoming damage while you heal and recover endurance at an incredible rate. You can emerge at will by deactivating the power, but you cannot stay in this Geode for more than 30 seconds. If enemies inflict enough damage, they can break you out of this effect.<br><br>If Brimstone Armor is owned, this power will also grant Geothermal Power every 5 seconds, increasing the damage inflicted by Brimstone's Fire by 8% per stack.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Toggle: Self +Regeneration, +Recovery, Invulnerable; Self Hold",
+            icon: "stonearmor_geode.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 180.0,
+                endurance: 0.026,
+                cast: 0.07,
+                buffDuration: 0.2
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['sentinel/stone-armor'] = SENTINEL_STONE_ARMOR_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.SENTINEL_STONE_ARMOR_POWERSET = SENTINEL_STONE_ARMOR_POWERSET;
+}
+
+// ---- js/data/powersets/sentinel/storm-blast.js ----
+;/**
+ * Storm Blast
+ * Character Level: 50
+ * Archetype: sentinel
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const SENTINEL_STORM_BLAST_POWERSET = {
+    name: "Storm Blast",
+    category: "Unknown",
+    description: "Storm Blast powerset",
+    icon: "storm-blast_set.png",
+    powers: [
+        {
+            name: "Gust",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You create a chaotic change in atmospheric pressure, causing a sudden gust of wind to deliver a small amount of Smashing damage and knock your foe out of the sky. <br><br>While in a <color #fcfc95>Storm Cell</color>, targets experience additional Smashing damage over time.",
+            shortHelp: "Ranged, DMG(Smash), -Fly",
+            icon: "stormblast_gust.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.17,
+                damage: {
+                    type: "Smashing",
+                    scale: 2.379
+                },
+                buffDuration: 4.0
+            }
+        },
+        {
+            name: "Hailstones",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You cause the air around the foe to rapidly condense, causing hailstones to crash down, dealing Cold damage. There is a chance that an especially large chunk of hail will form, knocking the target down. <br><br>While in a <color #fcfc95>Storm Cell</color>, targets are much more likely to get knocked down by large chunks of hail.",
+            shortHelp: "Ranged, DMG(Cold), Chance for Knockdown",
+            icon: "stormblast_hailstones.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    type: "Cold",
+                    scale: 2.529
+                },
+                dotDamage: {
+                    type: "Cold",
+                    scale: 0.25,
+                    ticks: 3
+                },
+                buffDuration: 1.0
+            }
+        },
+        {
+            name: "Jet Stream",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You call forth a cone of rapidly moving air that repels enemies, causing Smashing damage. <br><br>Enemies who are within a <color #fcfc95>Storm Cell</color> will not be repelled, but instead will be knocked down.",
+            shortHelp: "Ranged (Cone), DMG(Smashing), Foe Knockdown or Repel",
+            icon: "stormblast_jetstream.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 6,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.0,
+                range: 50.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.67,
+                damage: {
+                    type: "Smashing",
+                    scale: 1.6037
+                }
+            }
+        },
+        {
+            name: "Storm Cell",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Knockback", "Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You conjure a storm in the area that defines the boundaries of your stormy powers. Rain from this power will slightly lower a foe's movement and chance to hit. <br><br>The use of your Storm Blast attacks may create high winds and lightning within the storm cell, delivering stronger debuffs and causing damage. Additionally, Storm Blast attacks will be enhanced when used against foes victimized by Storm Cell.",
+            shortHelp: "Ranged (Location AoE), Foe -Recharge, -SPD, +Wet, Special",
+            icon: "stormblast_stormcell.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 60.0,
+                endurance: 15.6,
+                cast: 2.03,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Intensify",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the chance to hit of your attacks, and slightly increases damage and range for a few seconds. Moderately increases the chance for Storm Blast powers to summon high winds and lightning from your Storm Cell and Category Five while active.",
+            shortHelp: "Self +To Hit, +DMG, +Range, Special",
+            icon: "stormblast_aim.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 5.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Lightning Strike",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You channel your storm powers into a direct hit, jolting the enemy with a bolt of lightning that deals Energy damage and saps some endurance.<br><br>While in a <color #fcfc95>Storm Cell</color>, targets have a chance to be stunned.",
+            shortHelp: "Ranged, DMG(Energy), Foe -End, Special",
+            icon: "stormblast_lightningstrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 60.0,
+                recharge: 12.0,
+                endurance: 14.352,
+                cast: 1.33,
+                damage: {
+                    type: "Energy",
+                    scale: 4.3289
+                }
+            }
+        },
+        {
+            name: "Chain Lightning",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "Calls a bolt of lightning from the clouds to strike your target, which then chains outward to additional enemies. Creatures unfortunate enough to be struck will be dealt Energy damage and be sapped of some endurance.<br><br>While in a <color #fcfc95>Storm Cell</color>, the main target of Chain Lightning will experience additional endurance drain over time.",
+            shortHelp: "Ranged Chain, DoT(Energy), Foe -End",
+            icon: "stormblast_chainlightning.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Chain",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.15,
+                range: 40.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.17,
+                damage: {
+                    type: "Energy",
+                    scale: 1.324
+                },
+                dotDamage: {
+                    type: "Energy",
+                    scale: 0.08,
+                    ticks: 3
+                },
+                buffDuration: 2.1
+            }
+        },
+        {
+            name: "Cloudburst",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "Unleashes a cloud that drops a torrent of freezing rain on your target, causing Cold damage. <br><br>While in a <color #fcfc95>Storm Cell</color>, targets experience Recharge, ToHit, and Movement speed debuffs.",
+            shortHelp: "Ranged, DoT(Cold), +Wet, Special",
+            icon: "stormblast_cloudburst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 11.0,
+                endurance: 11.024,
+                cast: 1.67,
+                dotDamage: {
+                    type: "Cold",
+                    scale: 0.4285,
+                    ticks: 9
+                },
+                buffDuration: 2.9
+            }
+        },
+        {
+            name: "Category Five",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "Summons a severe storm that begins light, but grows in power until it becomes a raging engine of destruction. Left on its own, the Category Five storm is capable of delivering moderate damage. As it grows in power, foes may begin to fling through the air. <br><br>In addition, each use of your Storm Blast powers is capable of delivering lightning attacks within the Category Five storm, delivering energy damage.",
+            shortHelp: "Ranged (Location AoE), DoT(Energy), +Wet",
+            icon: "stormblast_categoryfive.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 2.0,
+                range: 40.0,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 2.5,
+                buffDuration: 20.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['sentinel/storm-blast'] = SENTINEL_STORM_BLAST_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.SENTINEL_STORM_BLAST_POWERSET = SENTINEL_STORM_BLAST_POWERSET;
+}
+
+// ---- js/data/powersets/sentinel/super-reflexes.js ----
+;/**
+ * Super Reflexes
+ * Character Level: 50
+ * Archetype: sentinel
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const SENTINEL_SUPER_REFLEXES_POWERSET = {
+    name: "Super Reflexes",
+    category: "Unknown",
+    description: "Super Reflexes powerset",
+    icon: "super-reflexes_set.png",
+    powers: [
+        {
+            name: "Focused Fighting",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "You become more evasive to melee attacks while you have Focused Fighting activated. This will increase your Defense versus melee as long as it is active. Your Focus also offers you resistance to Confuse effects and DeBuffs to Defense. If you own Master Brawler you will also gain resistance to Knockback and Immobilization powers. Focused Fighting also adds an Elusivity defense bonus to Melee Attacks in PVP zones.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +DEF(Melee), Res(Confuse, DeBuff DEF)",
+            icon: "superreflexes_focusedfighting.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.13,
+                cast: 0.67,
+                protection: {
+                    confuse: 8.304,
+                    immobilize: 8.304
+                },
+                debuffResistance: {
+                    defense: 0.11072
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Focused Senses",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "You become more evasive against ranged attacks while you have Focused Senses activated. This will increase your Defense versus ranged attacks as long as it is active. Your Improved Senses also allow you to perceive stealthy foes as well as resist Defense DeBuffs. If you own Master Brawler you will also gain resistance to Disorient, Hold, Sleep powers. Focused Senses also adds an Elusivity defense bonus to Ranged Attacks in PVP zones.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +DEF(Ranged), +Perception, Res(DeBuff DEF)",
+            icon: "superreflexes_focusedsenses.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.13,
+                cast: 2.03,
+                protection: {
+                    hold: 8.304,
+                    stun: 8.304,
+                    sleep: 8.304
+                },
+                debuffResistance: {
+                    defense: 0.11072
+                },
+                buffDuration: 0.75,
+                stun: 1.0,
+                stunDuration: 0.75
+            }
+        },
+        {
+            name: "Agile",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "You become innately more Agile, and are able to naturally avoid some ranged attacks and resist Defense DeBuffs. Your Agility also grants you minor Damage Resistance to all damage except Toxic and Psionic. This Damage Resistance is only available as you lose Health but it improves as your HP declines. This power is always on, and will permanently increase your Defense versus ranged attacks.",
+            shortHelp: "Auto: Self +DEF(Ranged), Res(DeBuff DEF), Res(DMG, Special)",
+            icon: "superreflexes_agile.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                resistance: {
+                    smashing: 0.0,
+                    lethal: 0.0,
+                    fire: 0.0,
+                    cold: 0.0,
+                    energy: 0.0,
+                    negative: 0.0,
+                    toxic: 0.0
+                },
+                debuffResistance: {
+                    defense: 0.05536
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Master Brawler",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Your are a master brawler, as such you have learned when its best to block an attack and absorb damage the most effectively. Using this power when you have the highest amount of endurance but the lowest amount of health will result in the most powerful effect possible. Owning this power will also improve your Focused Fighting and Focused Senses abilities. This power can not be taken if you take Practiced Brawler.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Self +Absorb +Special",
+            icon: "superreflexes_block.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 60.0,
+                endurance: 5.2,
+                cast: 1.53,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Practiced Brawler",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "Your training has allowed you to become a Practiced Brawler, tuning you into a perfect fighting machine. You gain a resistance to Knockback, Disorient, Hold, Sleep, and Immobilization powers for a short duration. This power can not be taken if you take Master Brawler.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +Res(Knockback, Disorient, Hold, Sleep, Immobilize)",
+            icon: "superreflexes_practicedbrawler.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 200.0,
+                endurance: 10.4,
+                cast: 1.53,
+                protection: {
+                    hold: 8.304,
+                    stun: 8.304,
+                    sleep: 8.304,
+                    immobilize: 8.304
+                },
+                debuffResistance: {
+                    tohit: 0.3,
+                    defense: 0.3,
+                    recharge: 0.3,
+                    movement: 0.5
+                },
+                buffDuration: 120.0,
+                stun: 1.0,
+                stunDuration: 120.0,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Enduring",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Defense Sets", "Endurance Modification"],
+            description: "You become innately more Enduring, and are able to make your endurance last longer in battle. You also manage to avoid some psionic attacks and resist Defense DeBuffs. Your Enduring determination also grants you minor Damage Resistance to all damage except Toxic and Psionic. This Damage Resistance is only available as you lose Health but it improves as your HP declines. This power is always on, and will permanently increase your endurance recovery and Defense versus psionic attacks.",
+            shortHelp: "Auto: Self +Recovery, +DEF(Psionic), Res(DeBuff DEF), Res(DMG, Special)",
+            icon: "superreflexes_endure.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                defense: {
+                    psionic: 0.07
+                },
+                resistance: {
+                    smashing: 0.0,
+                    lethal: 0.0,
+                    fire: 0.0,
+                    cold: 0.0,
+                    energy: 0.0,
+                    negative: 0.0,
+                    toxic: 0.0
+                },
+                debuffResistance: {
+                    defense: 0.05536,
+                    tohit: 0.3,
+                    recharge: 0.3,
+                    movement: 0.5
+                },
+                buffDuration: 0.75,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Dodge",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "You have the ability to innately Dodge some melee attacks and you resist Defense DeBuffs. Dodge also grants you minor Damage Resistance to all damage except Toxic and Psionic. This Damage Resistance is only available as you lose Health but it improves as your HP declines. This power is always on, and will permanently increase your Defense versus melee attacks.",
+            shortHelp: "Auto: Self +DEF(Melee), Res(DeBuff DEF), Res(All DMG, Special)",
+            icon: "superreflexes_dodge.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                resistance: {
+                    smashing: 0.0,
+                    lethal: 0.0,
+                    fire: 0.0,
+                    cold: 0.0,
+                    energy: 0.0,
+                    negative: 0.0,
+                    toxic: 0.0
+                },
+                debuffResistance: {
+                    defense: 0.05536
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Quickness",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "Your Quick reflexes allow you to move faster than normal, as well as resist slow effects. This power is always on and permanently increases your attack rate and movement speed.",
+            shortHelp: "Auto: Self +Recharge, +SPD, Res (Slow)",
+            icon: "superreflexes_quickness.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                debuffResistance: {
+                    recharge: 0.4,
+                    movement: 0.4
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Evasion",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "You are Evasive against area effect and cone shaped attacks. This power increases your Defense versus such attacks as long as it is active. Evasion also helps you resist Defense DeBuffs. Evasion also adds an Elusivity defense bonus to AOE Attacks in PVP zones.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +DEF(vs. AoE), Res(DeBuff DEF)",
+            icon: "superreflexes_evasion.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.13,
+                cast: 3.0,
+                debuffResistance: {
+                    defense: 0.11072
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Elude",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Endurance Modification", "Running", "Running & Sprints", "Universal Travel"],
+            description: "You can improve your reflexes, making yourself so quick you can Elude almost any attack, be it ranged, melee, or area effect. Your running speed and jumping height and Endurance Recovery are also increased. Elude also grants you high resistance to Defense DeBuffs. When Elude wears off, you are left drained of all Endurance and unable to recover Endurance for a while.<br><br><color #fcfc95>Recharge: Extremely Long.</color>",
+            shortHelp: "Self +DEF, + SPD, +Recovery, Res(DeBuff DEF), +Special",
+            icon: "superreflexes_elude.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 1000.0,
+                endurance: 2.6,
+                cast: 2.0,
+                debuffResistance: {
+                    defense: 0.2768
+                },
+                buffDuration: 180.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['sentinel/super-reflexes'] = SENTINEL_SUPER_REFLEXES_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.SENTINEL_SUPER_REFLEXES_POWERSET = SENTINEL_SUPER_REFLEXES_POWERSET;
+}
+
+// ---- js/data/powersets/sentinel/water-blast.js ----
+;/**
+ * Water Blast
+ * Character Level: 50
+ * Archetype: sentinel
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const SENTINEL_WATER_BLAST_POWERSET = {
+    name: "Water Blast",
+    category: "Unknown",
+    description: "Water Blast powerset",
+    icon: "water-blast_set.png",
+    powers: [
+        {
+            name: "Aqua Bolt",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You strike your foe with a rapid blast of freezing cold water causing Cold and Smashing damage as well as reducing their defense. Aqua Bolt builds 1 Tidal Power.",
+            shortHelp: "Ranged, DMG(Cold/Smash), Foe -Def, +Wet, Self +Tidal Power",
+            icon: "waterblast_aquabolt.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 1.4474
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.6126
+                        }
+                    ],
+                    scale: 2.06
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Hydro Blast",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Sentinel Archetype Sets", "Slow Movement", "Universal Damage Sets"],
+            description: "You briefly focus before releasing an intense blast of chilling water at your foe that causes Cold and Smashing damage. Affected foes will have their movement speed reduced briefly and have a chance to be knocked down. Hydro Blast builds 1 Tidal Power.",
+            shortHelp: "Ranged, DMG(Cold/Smash), Foe -Speed, Knockdown, +Wet, Self +Tidal Power",
+            icon: "waterblast_hydroblast.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 7.0,
+                endurance: 7.696,
+                cast: 1.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 2.22
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.1096
+                        }
+                    ],
+                    scale: 3.3296
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Water Burst",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged AoE Damage", "Sentinel Archetype Sets", "Slow Movement", "Universal Damage Sets"],
+            description: "You cause water to violently explode from beneath your target's feet blasting all foes nearby with freezing cold water. Affected targets will suffer Cold and Smashing damage, have their movement speed reduced and may be knocked down by the force of the blast. Water Burst consumes all Tidal Power. It will deal additional cold damage and have a greater chance to knockdown for each stack of Tidal Power. If you have 3 stacks of Tidal Power Water Burst will have a 100% chance to knock the targets into the air.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Cold/Smash), Foe -Speed, Knockdown, +Wet, Self -Tidal Power",
+            icon: "waterblast_waterburst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.73,
+                damage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 1.7941
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.46740000000000004
+                        }
+                    ],
+                    scale: 2.2615
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Dehydrate",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Accurate Healing", "Defense Debuff", "Healing", "Ranged Damage", "Sentinel Archetype Sets", "Slow Movement", "Universal Damage Sets"],
+            description: "You rapidly dehydrate your target, causing Cold and Smashing damage, reducing their movement speed and defense as well as causing a measure of Cold damage over time. You are then healed over time for a moderate amount of health. Dehydrate grants 1 stack of Tidal Power if you have 2 or less. Dehydrate will consume all stacks of Tidal Power if you have 3, but the power's heal over time effect is increased by 50%.",
+            shortHelp: "Ranged, DMG(Cold/Smash), Foe -Speed, -Defense, DoT(Cold), Self +Heal Over Time, +/- Tidal Power",
+            icon: "waterblast_dehydrate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.87,
+                damage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 2.2718
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.7572
+                        }
+                    ],
+                    scale: 3.029
+                },
+                dotDamage: {
+                    type: "Cold",
+                    scale: 0.2819,
+                    ticks: 4
+                },
+                healing: {
+                    scale: 49.756546699999994,
+                    perTarget: true
+                },
+                buffDuration: 4.1,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Tidal Forces",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "You draw tidal energies into yourself thus boosting your chance to hit significantly, slightly boosting your damage, range and granting yourself +3 Tidal Power.",
+            shortHelp: "Self +To Hit, +DMG, +Range, +Special",
+            icon: "waterblast_tidalforces.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 5.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Whirlpool",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged AoE Damage", "Sentinel Archetype Sets", "Slow Movement", "Universal Damage Sets"],
+            description: "You create a violent whirlpool at the target location causing Cold damage over time, reducing the targets' speed and defense for a short time. Whirlpool grants 1 stack of Tidal Power.",
+            shortHelp: "Ranged (Location AoE), DoT(Cold), -Speed, -Defense, +Wet, Self +Tidal Power",
+            icon: "waterblast_whirlpool.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 2.0,
+                range: 40.0,
+                recharge: 60.0,
+                endurance: 15.6,
+                cast: 2.03,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Water Jet",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged Damage", "Sentinel Archetype Sets", "Slow Movement", "Universal Damage Sets"],
+            description: "You spray a concentrated torrent of water toward your target that causes Cold and Smashing damage as well as reducing your target's movement speed. If you have 2 or less Tidal Power, you will gain a stack of Tidal Power. If you have 3 Tidal Power and you activate this power, it will have an enhanced effect causing Water Jet to cast slightly faster and immediately reset the recharge of Water Jet. Water Jet's enhanced effect can be used once every 8 seconds.",
+            shortHelp: "Ranged, DMG(Cold/Smash), Foe -Speed, Self +/-Tidal Power",
+            icon: "waterblast_waterjet.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.43
+            }
+        },
+        {
+            name: "Steam Spray",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Ranged AoE Damage", "Sentinel Archetype Sets", "Universal Damage Sets"],
+            description: "You spray scalding hot steam in a cone in front of you badly burning affected targets. Steam Spray causes Fire damage, Fire damage over time and reduces the target's Defense slightly. Steam Spray grants 1 stack of Tidal Power.",
+            shortHelp: "Ranged (Cone), DMG(Fire), Foe -Defense, DoT(Fire), +Wet, Self +Tidal Power",
+            icon: "waterblast_steamspray.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 6,
+            arc: 0.8727,
+            effects: {
+                accuracy: 1.2,
+                range: 40.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 2.53,
+                dotDamage: {
+                    type: "Fire",
+                    scale: 3.0260000000000002,
+                    ticks: 1
+                },
+                buffDuration: 0.6,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Geyser",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged AoE Damage", "Sentinel Archetype Sets", "Slow Movement", "Stuns", "Universal Damage Sets"],
+            description: "You cause the earth to erupt beneath your target's feet as a Geyser of scalding hot water burns your foes and tosses them violently into the air. Geyser causes Fire and Smashing damage before causing Fire damage over time as well as reducing their movement speed. Geyser consumes all Tidal Power. Both the initial damage and damage over time portions of this power will be increased and have a scaling chance to disorient for each stack of Tidal Power. If you have 3 stacks of Tidal Power, Geyser will have a 100% chance to disorient affected targets.",
+            shortHelp: "Ranged (Targeted AoE), DMG(Fire/Smash), Foe DoT(Fire), -Speed, Knock Up, Disorient, +Wet, Self -Tidal Power",
+            icon: "waterblast_geyser.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.4,
+                range: 40.0,
+                recharge: 90.0,
+                endurance: 15.6,
+                cast: 2.93,
+                damage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 2.8202000000000003
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.3818000000000001
+                        }
+                    ],
+                    scale: 4.202
+                },
+                stun: 3.0,
+                buffDuration: 10.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['sentinel/water-blast'] = SENTINEL_WATER_BLAST_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.SENTINEL_WATER_BLAST_POWERSET = SENTINEL_WATER_BLAST_POWERSET;
+}
+
+// ---- js/data/powersets/sentinel/willpower.js ----
+;/**
+ * Willpower
+ * Character Level: 50
+ * Archetype: sentinel
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const SENTINEL_WILLPOWER_POWERSET = {
+    name: "Willpower",
+    category: "Unknown",
+    description: "Willpower powerset",
+    icon: "willpower_set.png",
+    powers: [
+        {
+            name: "High Pain Tolerance",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Healing", "Resist Damage"],
+            description: "You have a greater tolerance to pain than others. You are also slightly resistant to all types of damage. This power is always on and costs no Endurance.",
+            shortHelp: "Auto: Self +Res (All), +MaxHealth",
+            icon: "willpower_highpaintolerance.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                resistance: {
+                    smashing: 0.052500000000000005,
+                    lethal: 0.052500000000000005,
+                    fire: 0.052500000000000005,
+                    cold: 0.052500000000000005,
+                    energy: 0.052500000000000005,
+                    negative: 0.052500000000000005,
+                    psionic: 0.052500000000000005,
+                    toxic: 0.052500000000000005
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Mind Over Body",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "When you toggle on this power, you empower your Mind Over Body to become highly resistant to Smashing, Lethal and Psionic damage.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Toggle: Self +Res(Smash, Lethal, Psionics)",
+            icon: "willpower_mindoverbody.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.104,
+                cast: 0.67,
+                resistance: {
+                    smashing: 0.15750000000000003,
+                    lethal: 0.15750000000000003,
+                    psionic: 0.14
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Fast Healing",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Healing"],
+            description: "You heal Hit Points at a faster rate than normal. This power is always on.",
+            shortHelp: "Auto: Self +Regeneration",
+            icon: "willpower_fasthealing.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                debuffResistance: {
+                    regeneration: 0.2076
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Indomitable Will",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "When you toggle on this power, it grants protection from Sleep, Disorient, Fear, Immobilize, Confusions, Repel, Knockback and Hold effects. Indomitable Will also grants a moderate defense to Psionic based attacks.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self Res (Disorient, Hold, Immobilize, Sleep, Fear, Confuse, Repel, Knockback). DEF(Psionics)",
+            icon: "willpower_indomitablewill.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 0.73,
+                protection: {
+                    hold: 8.304,
+                    stun: 8.304,
+                    sleep: 8.304,
+                    fear: 8.304,
+                    confuse: 8.304,
+                    immobilize: 8.304
+                },
+                defense: {
+                    psionic: 0.07
+                },
+                debuffResistance: {
+                    tohit: 0.3,
+                    defense: 0.3,
+                    recharge: 0.3,
+                    movement: 0.5
+                },
+                stun: 1.0,
+                stunDuration: 0.75,
+                buffDuration: 0.75,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Up to the Challenge",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "Regardless of the odds against you, you are determined to go on. Your ability to regenerate health is greatly increased at all times.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Self +Regen",
+            icon: "willpower_risetothechallenge.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.208,
+                cast: 3.0,
+                buffDuration: 1.125
+            }
+        },
+        {
+            name: "Quick Recovery",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "You recover Endurance at a faster rate than normal. This power is always on.",
+            shortHelp: "Auto: Self +Recovery",
+            icon: "willpower_quickrecovery.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Heightened Senses",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "You become more aware of your environment and its hazards while this power is activated. This will increase your Defense versus environmental damage as long as it is active. Your Heightened Senses also allow you to perceive stealthy foes and resist Defense DeBuffs.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Toggle: Self +DEF(Smash, Lethal, Fire, Cold, Energy, Negative Energy), +Per",
+            icon: "willpower_heightenedsenses.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.104,
+                cast: 0.67,
+                defense: {
+                    smashing: 0.023100000000000002,
+                    lethal: 0.023100000000000002,
+                    fire: 0.09100000000000001,
+                    cold: 0.09100000000000001,
+                    energy: 0.09100000000000001,
+                    negative: 0.09100000000000001
+                },
+                debuffResistance: {
+                    defense: 0.1384
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Resurgence",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "Should you fall in battle, you can Revive yourself from the brink of death. You will revive with most of your Hit Points and half your Endurance and be protected from XP Debt for 90 seconds. Additionally, for 90 seconds, your damage and chance to hit will be improved, then for another 45 seconds, your damage and chance to hit will be diminished. You will also have 15 seconds of immunity to most damage.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Self Rez, Special",
+            icon: "willpower_resurgence.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 300.0,
+                cast: 1.5,
+                buffDuration: 0.5,
+                tohitBuff: 3.0,
+                tohitDebuff: 3.0
+            }
+        },
+        {
+            name: "Strength of Will",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "When you activate this power, you not only become extremely resistant to most damage, but also to Disorient, Immobilization, Hold, Knockback, Repel and Sleep effects. Strength of Will costs little Endurance to activate and increases your recovery for its duration, but when it wears off you are left exhausted, and substantially drained of Endurance.<br><br><color #fcfc95>Notes: Strength of Will is unaffected by Recharge Time changes.</color><br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Self, +Res(Disorient, Sleep, Hold, Immobilize, Repel, Knockback, All DMG), +Recovery",
+            icon: "willpower_strengthofwill.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 300.0,
+                endurance: 2.6,
+                cast: 3.1,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.5,
+                            ticks: 60
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 2.5,
+                            ticks: 60
+                        },
+                        {
+                            type: "Fire",
+                            scale: 1.25,
+                            ticks: 60
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.25,
+                            ticks: 60
+                        },
+                        {
+                            type: "Energy",
+                            scale: 1.25,
+                            ticks: 60
+                        },
+                        {
+                            type: "Negative",
+                            scale: 1.25,
+                            ticks: 60
+                        },
+                        {
+                            type: "Psionic",
+                            scale: 1.25,
+                            ticks: 60
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 1.25,
+                            ticks: 60
+                        }
+                    ]
+                },
+                protection: {
+                    stun: 13.84,
+                    sleep: 13.84,
+                    immobilize: 13.84,
+                    hold: 13.84
+                },
+                resistance: {
+                    smashing: 0.17500000000000002,
+                    lethal: 0.17500000000000002,
+                    fire: 0.08750000000000001,
+                    cold: 0.08750000000000001,
+                    energy: 0.08750000000000001,
+                    negative: 0.08750000000000001,
+                    psionic: 0.08750000000000001,
+                    toxic: 0.08750000000000001
+                },
+                buffDuration: 120.0,
+                stun: 1.0,
+                stunDuration: 120.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['sentinel/willpower'] = SENTINEL_WILLPOWER_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.SENTINEL_WILLPOWER_POWERSET = SENTINEL_WILLPOWER_POWERSET;
+}
+
+// ---- js/data/epics/sentinel/sentinel_dark_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Dark Mastery
+ * Archetype: Sentinel
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\sentinel_dark_mastery
+ */
+
+const EPIC_SENTINEL_DARK_MASTERY = {
+  "id": "sentinel_dark_mastery",
+  "name": "Dark Mastery",
+  "displayName": "Dark Mastery",
+  "archetype": "sentinel",
+  "description": "You have Mastery over Darkness to control and blast your foes.",
+  "icon": "sentinel_dark_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Netherworld Tentacles",
+      "fullName": "Epic.Sentinel_Dark_Mastery.Netherworld_Tentacles",
+      "rank": 1,
+      "available": 34,
+      "description": "You can create a cone shaped rift to the Netherworld that allows its native creatures to slip their oily Tentacles into our reality. These creatures will snare all foes within range, Immobilizing them while the Tentacles drain their life and reduce their chance to hit.",
+      "shortHelp": "Ranged (Cone), DoT(Negative), Foe Immobilize, -To Hit, -Fly",
+      "icon": "darknesscontrol_livingshadows.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Sentinel",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate To-Hit Debuff",
+        "Immobilize",
+        "Ranged AoE Damage",
+        "To Hit Debuff",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 50.0,
+        "recharge": 16.0,
+        "endurance": 10.751,
+        "activationTime": 1.67,
+        "effectArea": "Cone",
+        "radius": 50.0,
+        "arc": 0.5236,
+        "damage": {
+          "type": "Negative",
+          "scale": 0.2166,
+          "table": "Ranged_PvPDamage"
+        },
+        "protection": {
+          "immobilize": 3.0
+        },
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Smite",
+      "fullName": "Epic.Sentinel_Dark_Mastery.Smite",
+      "rank": 2,
+      "available": 34,
+      "description": "You wrap your fists with Negative Energy channeled from the Netherworlds, then perform a Smite that deals more damage than Shadow Punch, but has a longer recharge time. Smite clouds the target's vision, lowering their chance to hit for a short time.",
+      "shortHelp": "Melee, DMG(Smash/Negative), Foe -To Hit",
+      "icon": "darknesscontrol_punch.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Sentinel",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate To-Hit Debuff",
+        "Melee Damage",
+        "To Hit Debuff",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 7.0,
+        "recharge": 12.0,
+        "endurance": 8.58,
+        "activationTime": 0.97,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Negative",
+          "scale": 1.1693,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Netherworld Grasp",
+      "fullName": "Epic.Sentinel_Dark_Mastery.Netherworld_Grasp",
+      "rank": 3,
+      "available": 37,
+      "description": "Mastery over the forces of the Netherworld allows you to summon dark tentacles to render your target helpless and inflicting moderate negative energy damage. Even if the target is powerful enough to resist the power's hold effect they will have their chance to hit reduced. You must be level 38 and have one other Dark Mastery Powers before selecting this power.<br>",
+      "shortHelp": "Ranged, DMG(Negative), Foe Hold, -To Hit",
+      "icon": "darknesscontrol_darkgrasp.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Hold",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate To-Hit Debuff",
+        "Holds",
+        "Ranged Damage",
+        "To Hit Debuff",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 2.07,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "hold": 4.0
+        },
+        "damage": {
+          "type": "Negative",
+          "scale": 2.809,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Engulfing Darkness",
+      "fullName": "Epic.Sentinel_Dark_Mastery.Engulfing_Darkness",
+      "rank": 4,
+      "available": 40,
+      "description": "You release a burst of negative energy to foes around you dealing moderate Negative Energy damage, reducing their chance to hit and sapping their health over time. You must be level 41 and have one other Dark Mastery Powers before selecting this power.",
+      "shortHelp": "PBAoE, DMG(Negative), Foe -To Hit, DoT(Negative)",
+      "icon": "darknesscontrol_pbaoe.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate To-Hit Debuff",
+        "Melee AoE Damage",
+        "To Hit Debuff",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 36.0,
+        "endurance": 21.06,
+        "activationTime": 2.0,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "damage": {
+          "type": "Negative",
+          "scale": 0.9969,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Darkest Night",
+      "fullName": "Epic.Sentinel_Dark_Mastery.Darkest_Night",
+      "rank": 5,
+      "available": 43,
+      "description": "While active, you channel Negative Energy onto a targeted foe. Darkest Night decreases the damage potential and chance to hit of the target, and all foes nearby, as long as you keep the power active. You must be level 44 and have two other Dark Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Ranged (Targeted AoE), Foe -DMG -To Hit",
+      "icon": "darknesscontrol_debuff.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "To Hit Debuff"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 70.0,
+        "recharge": 20.0,
+        "endurance": 0.325,
+        "activationTime": 3.17,
+        "effectArea": "AoE",
+        "radius": 15.0
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['sentinel_dark_mastery'] = EPIC_SENTINEL_DARK_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/sentinel/sentinel_electricity_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Electricity Mastery
+ * Archetype: Sentinel
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\sentinel_electricity_mastery
+ */
+
+const EPIC_SENTINEL_ELECTRICITY_MASTERY = {
+  "id": "sentinel_electricity_mastery",
+  "name": "Electricity Mastery",
+  "displayName": "Electricity Mastery",
+  "archetype": "sentinel",
+  "description": "You have advance Mastery over Electricity and are able to control your foes and aid your allies with it.",
+  "icon": "sentinel_electricity_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Chain Fences",
+      "fullName": "Epic.Sentinel_Electricity_Mastery.Chain_Fences",
+      "rank": 1,
+      "available": 34,
+      "description": "You can immobilize multiple foes in a chain of electricity, dealing minor damage to all foes in range and draining some endurance. This power also reduces Flight capacity in targets.",
+      "shortHelp": "Ranged AoE, DMG(Energy), Foe Immobilize, -End, -Fly",
+      "icon": "electriccontrol_chainfences.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Sentinel",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Immobilize",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 50.0,
+        "recharge": 16.0,
+        "endurance": 10.751,
+        "activationTime": 1.17,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "protection": {
+          "immobilize": 3.0
+        },
+        "damage": {
+          "type": "Energy",
+          "scale": 0.338,
+          "table": "Ranged_PvPDamage"
+        },
+        "recovery": {
+          "scale": -1.0,
+          "table": "Ranged_Ones"
+        },
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Havoc Punch",
+      "fullName": "Epic.Sentinel_Electricity_Mastery.Havok_Punch",
+      "rank": 2,
+      "available": 34,
+      "description": "The Havoc Punch is a slower attack than Charged Brawl, but makes up for it with a greater damage. Havoc Punch can may knock down targets, drain some Endurance from your target, or even overload their synapses, leaving them writhing for a moment. A portion of the drained Endurance may be given back to you. Disturbing an overloaded target will disperse the electrical charge and release them.",
+      "shortHelp": "Melee, DMG(Smash/Energy), Foe Sleep, -End, Knock back",
+      "icon": "electriccontrol_havokpunch.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Sentinel",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Sleep",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Knockback",
+        "Melee Damage",
+        "Sleep",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 7.0,
+        "recharge": 28.0,
+        "endurance": 16.9,
+        "activationTime": 1.5,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Energy",
+          "scale": 2.57,
+          "table": "Melee_PvPDamage"
+        },
+        "protection": {
+          "sleep": 3.0,
+          "knockback": 1.0
+        },
+        "recovery": {
+          "scale": -1.0,
+          "table": "Melee_Ones"
+        }
+      }
+    },
+    {
+      "name": "Paralyzing Jolt",
+      "fullName": "Epic.Sentinel_Electricity_Mastery.Paralyzing_Jolt",
+      "rank": 3,
+      "available": 37,
+      "description": "You strike an enemy with a powerful jolt of electricity, disorienting him, draining some endurance and causing moderate damage over time. You must be level 38 and have one other Electricity Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged, DMG(Energy), Foe Stun, -End",
+      "icon": "electriccontrol_teslacage.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Ranged Damage",
+        "Stuns",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 16.0,
+        "endurance": 10.66,
+        "activationTime": 2.07,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "stun": 4.0
+        },
+        "damage": {
+          "type": "Energy",
+          "scale": 2.489,
+          "table": "Ranged_PvPDamage"
+        },
+        "recovery": {
+          "scale": -1.0,
+          "table": "Ranged_Ones"
+        }
+      }
+    },
+    {
+      "name": "Shocking Field",
+      "fullName": "Epic.Sentinel_Electricity_Mastery.Lightning_Field",
+      "rank": 4,
+      "available": 40,
+      "description": "While active, you emit a storm of electricity that constantly damages all nearby foes. Enemies shocked by this field will continue to take electric damage over time for a while. You must be level 41 and have one other Electricity Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: PBAoE, DoT(Energy), Foe -End",
+      "icon": "electriccontrol_lightningfield.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Healing",
+        "Melee AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 20.0,
+        "endurance": 1.3,
+        "activationTime": 2.03,
+        "effectArea": "AoE",
+        "radius": 10.0,
+        "damage": {
+          "type": "Energy",
+          "scale": 0.17,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Rehabilitating Circuit",
+      "fullName": "Epic.Sentinel_Electricity_Mastery.Rehabilitating_Circuit",
+      "rank": 5,
+      "available": 43,
+      "description": "You can use your Rehabilitating Circuit to heal the wounds of your group. Although you can be healed by this power, you need to use it against an ally for the chain to affect you. You must be level 44 and have two other Electricity Mastery Powers before selecting this power.",
+      "shortHelp": "Chain, Team +Heal",
+      "icon": "electriccontrol_heal.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Heal"
+      ],
+      "allowedSetCategories": [
+        "Healing"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 32.0,
+        "endurance": 16.25,
+        "activationTime": 1.0,
+        "effectArea": "Chain",
+        "radius": 20.0,
+        "damage": {
+          "type": "Heal",
+          "scale": 1.0,
+          "table": "Ranged_Heal"
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['sentinel_electricity_mastery'] = EPIC_SENTINEL_ELECTRICITY_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/sentinel/sentinel_fire_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Fire Mastery
+ * Archetype: Sentinel
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\sentinel_fire_mastery
+ */
+
+const EPIC_SENTINEL_FIRE_MASTERY = {
+  "id": "sentinel_fire_mastery",
+  "name": "Fire Mastery",
+  "displayName": "Fire Mastery",
+  "archetype": "sentinel",
+  "description": "You have Mastery over Fire and Flame to blast your foes and control your foes.",
+  "icon": "sentinel_fire_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Fire Cages",
+      "fullName": "Epic.Sentinel_Fire_Mastery.Fire_Cages",
+      "rank": 1,
+      "available": 34,
+      "description": "Immobilizes a group of foes in Fire Cages, dealing Fire damage over time. More resilient foes may require multiple Fire Cages to Immobilize. Fire Cages is slower and less damaging than Ring of Fire, but can capture multiple targets.",
+      "shortHelp": "Ranged (Targeted AoE), DoT(Fire), Foe Immobilize",
+      "icon": "firetrap_firecage.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Sentinel",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Immobilize",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 50.0,
+        "recharge": 16.0,
+        "endurance": 10.751,
+        "activationTime": 1.03,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "damage": {
+          "type": "Fire",
+          "scale": 0.1067,
+          "table": "Ranged_PvPDamage"
+        },
+        "protection": {
+          "immobilize": 5.0
+        },
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Cremate",
+      "fullName": "Epic.Sentinel_Fire_Mastery.Cremate",
+      "rank": 2,
+      "available": 34,
+      "description": "A slow but devastating attack. Cremate clobbers your foes with a massive 2 handed fiery smash that leaves your foe set on fire.",
+      "shortHelp": "Melee, DMG(Smash/Fire)",
+      "icon": "firetrap_punch.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Sentinel",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Melee Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 7.0,
+        "recharge": 16.0,
+        "endurance": 10.66,
+        "activationTime": 1.5,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Fire",
+          "scale": 2.09,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Char",
+      "fullName": "Epic.Sentinel_Fire_Mastery.Char",
+      "rank": 3,
+      "available": 37,
+      "description": "Incapacitates a distant foe by Charring him with smoldering soot and cinders. The target is left helpless, choking on the soot. The target will take some fire damage from char, but the damage is very trivial. You must be level 38 and have one other Fire Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged, DoT(Fire), Foe Hold",
+      "icon": "firetrap_hold.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Hold",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Holds",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 1.07,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "hold": 3.0
+        },
+        "damage": {
+          "type": "Fire",
+          "scale": 0.4218,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Fire Sword Circle",
+      "fullName": "Epic.Sentinel_Fire_Mastery.Fire_Sword_Circle",
+      "rank": 4,
+      "available": 40,
+      "description": "Mastery of your Fire Sword has enabled you to make an attack on every foe within melee distance. This will slash and burn your enemies, dealing moderate damage and setting them ablaze. You must be level 41 and have one other Fire Mastery Powers before selecting this power.",
+      "shortHelp": "PBAoE Melee, DMG(Fire/Lethal)",
+      "icon": "firetrap_pbaoe.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Melee AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 40.0,
+        "endurance": 23.14,
+        "activationTime": 2.67,
+        "effectArea": "AoE",
+        "radius": 10.0,
+        "damage": {
+          "type": "Fire",
+          "scale": 1.5476,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Warmth",
+      "fullName": "Epic.Sentinel_Fire_Mastery.Warmth",
+      "rank": 5,
+      "available": 43,
+      "description": "You can use your Warmth to heal some of your wounds, and the wounds of your group. This power has a small radius, so your allies need to be near you if they wish to be affected. You must be level 44 and have two other Fire Mastery Powers before selecting this power.",
+      "shortHelp": "PBAoE, Team +Heal",
+      "icon": "firetrap_heal.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Heal"
+      ],
+      "allowedSetCategories": [
+        "Healing"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 32.0,
+        "endurance": 16.25,
+        "activationTime": 2.03,
+        "effectArea": "AoE",
+        "radius": 25.0,
+        "damage": {
+          "type": "Heal",
+          "scale": 1.0,
+          "table": "Ranged_Heal"
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['sentinel_fire_mastery'] = EPIC_SENTINEL_FIRE_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/sentinel/sentinel_ice_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Ice Mastery
+ * Archetype: Sentinel
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\sentinel_ice_mastery
+ */
+
+const EPIC_SENTINEL_ICE_MASTERY = {
+  "id": "sentinel_ice_mastery",
+  "name": "Ice Mastery",
+  "displayName": "Ice Mastery",
+  "archetype": "sentinel",
+  "description": "You have Mastery over Ice and snow to blast your foes and control your foes.",
+  "icon": "sentinel_ice_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Frostbite",
+      "fullName": "Epic.Sentinel_Ice_Mastery.Frostbite",
+      "rank": 1,
+      "available": 34,
+      "description": "Immobilizes a group of foes in icy traps. Deals minimal Cold damage over time and slightly Slows the targets. Slower and less damaging than Chilblain, but can capture multiple targets. More resilient foes may only be Slowed.",
+      "shortHelp": "Ranged (Targeted AoE), DoT(Cold), Foe Immobilize, -SPD, -Recharge",
+      "icon": "ice_mastery_frostbite.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Sentinel",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Immobilize",
+        "Ranged AoE Damage",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 50.0,
+        "recharge": 16.0,
+        "endurance": 10.751,
+        "activationTime": 2.07,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "damage": {
+          "type": "Cold",
+          "scale": 0.2553,
+          "table": "Ranged_PvPDamage"
+        },
+        "protection": {
+          "immobilize": 5.0
+        },
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Ice Sword",
+      "fullName": "Epic.Sentinel_Ice_Mastery.Ice_Sword",
+      "rank": 2,
+      "available": 34,
+      "description": "You create a blade of solid ice that deals higher damage then Frozen Fists. Being hit by this Ice Sword will Slow a target's movement and attack speed, due to the intense chill.",
+      "shortHelp": "Melee, DMG(Cold/Lethal), Foe -Recharge, -SPD",
+      "icon": "ice_mastery_icesword.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Sentinel",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Melee Damage",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 7.0,
+        "recharge": 20.0,
+        "endurance": 12.74,
+        "activationTime": 1.33,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Cold",
+          "scale": 2.131,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Block of Ice",
+      "fullName": "Epic.Sentinel_Ice_Mastery.Block_of_Ice",
+      "rank": 3,
+      "available": 37,
+      "description": "You can freeze a single foe in a Block of Ice. The target is frozen solid, helpless, and can be attacked. More powerful foes may not be held, but all affected targets will be Slowed. You must be level 38 and have one other Ice Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged, Foe Hold, -SPD, -Recharge",
+      "icon": "ice_mastery_blockofice.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Hold",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Holds",
+        "Ranged Damage",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 1.87,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "hold": 3.0,
+          "knockup": 1.0,
+          "knockback": 1.0
+        },
+        "damage": {
+          "type": "Cold",
+          "scale": 2.669,
+          "table": "Melee_PvPDamage"
+        },
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Frozen Aura",
+      "fullName": "Epic.Sentinel_Ice_Mastery.Frozen_Aura",
+      "rank": 4,
+      "available": 40,
+      "description": "Your mastery of cold enables you to dramatically lower the temperature immediately around you. When you perform a Frozen Aura, nearby foes will be frozen within a fragile casing of ice and suffer a moderate amount of cold damage. These frozen foes will break free if attacked. Frozen Aura deals moderate damage. You must be level 41 and have one other Ice Mastery Powers before selecting this power.<br><br><color #fcfc95>Notes: The Sleep component of this power is Auto Hit against regular enemies, but a To Hit check is required to against AVs and players, as well as to make secondary effects apply.</color>",
+      "shortHelp": "PBAoE, DMG(Cold), Foe Sleep",
+      "icon": "ice_mastery_frozenaura.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Sleep",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Melee AoE Damage",
+        "Sleep",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 40.0,
+        "endurance": 23.14,
+        "activationTime": 2.1,
+        "effectArea": "AoE",
+        "radius": 10.0,
+        "damage": {
+          "type": "Cold",
+          "scale": 1.388,
+          "table": "Melee_PvPDamage"
+        },
+        "protection": {
+          "sleep": 2.0
+        }
+      }
+    },
+    {
+      "name": "Snow Storm",
+      "fullName": "Epic.Sentinel_Ice_Mastery.Snow_Storm",
+      "rank": 5,
+      "available": 43,
+      "description": "While active, the chill from this Snow Storm can dramatically Slow the attack and movement speed of the target and all nearby foes. The torrent winds of the Snow Storm are enough to bring down flying foes. You must be level 44 and have two other Ice Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Ranged (Targeted AoE), Foe -Speed, -Recharge, -Fly",
+      "icon": "ice_mastery_snowstorm.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Slow Movement"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 20.0,
+        "endurance": 0.325,
+        "activationTime": 2.03,
+        "effectArea": "AoE",
+        "radius": 25.0
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['sentinel_ice_mastery'] = EPIC_SENTINEL_ICE_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/sentinel/sentinel_leviathan_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Leviathan Mastery
+ * Archetype: Sentinel
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\sentinel_leviathan_mastery
+ */
+
+const EPIC_SENTINEL_LEVIATHAN_MASTERY = {
+  "id": "sentinel_leviathan_mastery",
+  "name": "Leviathan Mastery",
+  "displayName": "Leviathan Mastery",
+  "archetype": "sentinel",
+  "description": "Captain Mako has granted you access to the power of the Leviathan. The Leviathan is an ancient gargantuan entity who slumbers under Sharkhead Isle. Worshiped by the Coralax, the Leviathan has given Captain Mako many abilities and now he has taught you how to harness its power.",
+  "icon": "sentinel_leviathan_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "School of Sharks",
+      "fullName": "Epic.Sentinel_Leviathan_Mastery.School_of_Sharks",
+      "rank": 1,
+      "available": 34,
+      "description": "You can call forth a school of vicious Shark Spirits that will swim out in a cone formation and will encircle your foes, draining their spirit energy. The encircling Shark Spirits will immobilize most foes while they deal negative energy damage over time. Both you and the target must be Near the Ground for this power to activate.",
+      "shortHelp": "Ranged (Cone), DoT(Negative), Foe Immobilize",
+      "icon": "arachnos_patron_coneimmobilize.png",
+      "powerType": "Click",
+      "requires": "($archetype == @Class_Sentinel) && (Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Immobilize",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 50.0,
+        "recharge": 16.0,
+        "endurance": 10.751,
+        "activationTime": 2.37,
+        "effectArea": "Cone",
+        "radius": 50.0,
+        "arc": 0.5236,
+        "damage": {
+          "type": "Negative",
+          "scale": 0.1102,
+          "table": "Ranged_PvPDamage"
+        },
+        "protection": {
+          "immobilize": 3.0
+        },
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Knockout Blow",
+      "fullName": "Epic.Sentinel_Leviathan_Mastery.Knockout_Blow",
+      "rank": 2,
+      "available": 34,
+      "description": "You can channel the massive strength of the Leviathan into a Knockout Blow. This punch does Superior damage, and has a great chance of Holding your target.",
+      "shortHelp": "Melee, DMG(Smash), Foe Hold",
+      "icon": "arachnos_patron_koblow.png",
+      "powerType": "Click",
+      "requires": "($archetype == @Class_Sentinel) && (Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Hold",
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Holds",
+        "Knockback",
+        "Melee Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.2,
+        "range": 13.2,
+        "recharge": 40.0,
+        "endurance": 23.14,
+        "activationTime": 2.23,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Smashing",
+          "scale": 3.561,
+          "table": "Melee_PvPDamage"
+        },
+        "protection": {
+          "hold": 3.0,
+          "knockup": 1.0
+        }
+      }
+    },
+    {
+      "name": "Spirit Shark Jaws",
+      "fullName": "Epic.Sentinel_Leviathan_Mastery.Spirit_Shark_Jaws",
+      "rank": 3,
+      "available": 37,
+      "description": "You can summon a massive Spirit Shark that will attack your foe from below. The Shark will grip your foe with its massive jaws and attempt to hold the target while it mauls it, dealing lethal Damage over Time. Flying Targets will likely be pulled to the ground. You must be level 38 and have one other Leviathan Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged, DoT(Lethal), Foe Hold, -Fly",
+      "icon": "arachnos_patron_targetedhold.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Hold",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Holds",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 1.87,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "hold": 3.0
+        },
+        "damage": {
+          "type": "Lethal",
+          "scale": 0.2604,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Arctic Breath",
+      "fullName": "Epic.Sentinel_Leviathan_Mastery.Arctic_Breath",
+      "rank": 4,
+      "available": 40,
+      "description": "Sharks will eat anything, so their stomach acid must be powerful indeed. You can regurgitate this freezing acid and spew a corrosive spray of bile at a foe. Affected foes in the cone area will take cold damage over time, and have their Defense, movement rate, and recharge rate reduced. This ice will stick to foes, causing them to fall down occasionally. You must be level 41 and have one other Leviathan Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Cone), DoT(Cold), Foe -Speed, -Recharge, -DEF, knock down",
+      "icon": "arachnos_patron_coneslow.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate Defense Debuff",
+        "Defense Debuff",
+        "Ranged AoE Damage",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 32.0,
+        "endurance": 18.98,
+        "activationTime": 2.33,
+        "effectArea": "Cone",
+        "radius": 60.0,
+        "arc": 0.5236,
+        "damage": {
+          "type": "Cold",
+          "scale": 0.1208,
+          "table": "Ranged_PvPDamage"
+        },
+        "protection": {
+          "knockback": 1.0
+        },
+        "resistance": {
+          "smashing": {
+            "scale": -1.5,
+            "table": "Melee_Debuff_Res_Dmg"
+          },
+          "lethal": {
+            "scale": -1.5,
+            "table": "Melee_Debuff_Res_Dmg"
+          },
+          "fire": {
+            "scale": -1.5,
+            "table": "Melee_Debuff_Res_Dmg"
+          },
+          "cold": {
+            "scale": -1.5,
+            "table": "Melee_Debuff_Res_Dmg"
+          },
+          "energy": {
+            "scale": -1.5,
+            "table": "Melee_Debuff_Res_Dmg"
+          },
+          "negative": {
+            "scale": -1.5,
+            "table": "Melee_Debuff_Res_Dmg"
+          },
+          "psionic": {
+            "scale": -1.5,
+            "table": "Melee_Debuff_Res_Dmg"
+          },
+          "toxic": {
+            "scale": -1.5,
+            "table": "Melee_Debuff_Res_Dmg"
+          }
+        },
+        "defense": {
+          "all": {
+            "scale": 1.0,
+            "table": "Ranged_Debuff_Def"
+          }
+        }
+      }
+    },
+    {
+      "name": "Summon Coralax",
+      "fullName": "Epic.Sentinel_Leviathan_Mastery.Summon_Coralax",
+      "rank": 5,
+      "available": 43,
+      "description": "Captain Mako has shown you how to summon a Coralax Blue Hybrid to do your bidding. The Coralax are humans who have been infected with living coral. Your access to this Hybrid is very limited. You can only summon it once every 15 minutes and it will leave after 4 minutes, or if you exit a zone or mission. You must be level 44 and have two other Leviathan Mastery Powers before selecting this power.",
+      "shortHelp": "Summon Hybrid: Ranged DMG(Lethal)",
+      "icon": "arachnos_patron_summononepet.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Pet Damage",
+        "Recharge Intensive Pets",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 900.0,
+        "endurance": 26.0,
+        "activationTime": 3.2,
+        "effectArea": "Location"
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['sentinel_leviathan_mastery'] = EPIC_SENTINEL_LEVIATHAN_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/sentinel/sentinel_mace_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Mace Mastery
+ * Archetype: Sentinel
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\sentinel_mace_mastery
+ */
+
+const EPIC_SENTINEL_MACE_MASTERY = {
+  "id": "sentinel_mace_mastery",
+  "name": "Mace Mastery",
+  "displayName": "Mace Mastery",
+  "archetype": "sentinel",
+  "description": "Black Scorpion has granted you access to the advanced technology of the Executioner's Mace. The signature weapon of the Bane Spider Executioner, it is not a typical clumsy mace. The Executioner's Mace is capable of firing a variety of energy projectiles and grenades. It can even be modified to summon and command some or Black Scorpion's RV technologies.",
+  "icon": "sentinel_mace_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Web Envelope",
+      "fullName": "Epic.Sentinel_Mace_Mastery.Web_Envelope",
+      "rank": 1,
+      "available": 34,
+      "description": "The Executioner's Mace can lob a modified Web Grenade. Upon impact, the Web Grenade expels a strong, tenuous, and very sticky substance that can Immobilize most targets in a wide area. This device deals toxic damage over time and does not prevent targets from attacking, although their attack rate is Slowed. The Web can bring down flying entities and halts jumping.",
+      "shortHelp": "Ranged (Targeted AoE) DoT(Toxic), Immobilize, -Recharge, -Fly, -Jump",
+      "icon": "arachnos_patron_rangedaoeimmobilize.png",
+      "powerType": "Click",
+      "requires": "($archetype == @Class_Sentinel) && (Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Immobilize",
+        "Ranged AoE Damage",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 50.0,
+        "recharge": 16.0,
+        "endurance": 10.751,
+        "activationTime": 2.0,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "protection": {
+          "immobilize": 3.0
+        },
+        "damage": {
+          "type": "Toxic",
+          "scale": 0.2503,
+          "table": "Ranged_PvPDamage"
+        },
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Pulverize",
+      "fullName": "Epic.Sentinel_Mace_Mastery.Pulverize",
+      "rank": 2,
+      "available": 34,
+      "description": "You are capable of Pulverizing a foe with your Nullifier Mace dealing high damage, causing toxic damage over time. Pulverize will occasionally disorient foes as well.",
+      "shortHelp": "Melee, High DMG(Smash), Minor DoT(Toxic), Foe Disorient",
+      "icon": "arachnos_patron_pulverize.png",
+      "powerType": "Click",
+      "requires": "($archetype == @Class_Sentinel) && (Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Melee Damage",
+        "Stuns",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 7.0,
+        "recharge": 16.0,
+        "endurance": 10.66,
+        "activationTime": 1.5,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Smashing",
+          "scale": 2.09,
+          "table": "Melee_PvPDamage"
+        },
+        "protection": {
+          "stun": 2.0
+        }
+      }
+    },
+    {
+      "name": "Web Cocoon",
+      "fullName": "Epic.Sentinel_Mace_Mastery.Web_Cocoon",
+      "rank": 3,
+      "available": 37,
+      "description": "The Bane Mace can fire a more powerful version the common web grenade. The sinewy fibers of this grenade are strong enough to completely Hold one target. Targets able to resist the Hold are still likely to have their attack and movement speed dramatically slowed. Web Cocoon can also bring down flying targets and prevent foes from jumping. You must be level 38 and have one other Mace Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged, Foe Hold, -Recharge, -Fly, -Jump, Slow, DoT(Toxic)",
+      "icon": "arachnos_patron_targetedhold.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Hold",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Holds",
+        "Ranged Damage",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 60.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 2.0,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "hold": 3.0
+        },
+        "damage": {
+          "type": "Toxic",
+          "scale": 0.345,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Coordinated Targeting",
+      "fullName": "Epic.Sentinel_Mace_Mastery.Focused_Accuracy",
+      "rank": 4,
+      "available": 40,
+      "description": "When this power is activated, the Villain and allies focus their offensive to dramatically improve their accuracy. Additionally, Coordinated Targeting increases the team's Perception, allowing to better see stealthy foes. It also grants resistance to powers that DeBuff Accuracy. Coordinated Targeting is a toggle power and must be activated and deactivated manually. Like all toggle powers, while active, Coordinated Targeting drains Endurance while active. You must be level 41 and have one other Mace Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Team +To Hit, +ACC, +Perception, Res(DeBuff To Hit)",
+      "icon": "arachnos_patron_teamtohitbuff.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "To Hit Buff"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 10.0,
+        "endurance": 0.39,
+        "activationTime": 1.17,
+        "effectArea": "AoE",
+        "radius": 25.0,
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Summon Tarantula",
+      "fullName": "Epic.Sentinel_Mace_Mastery.Summon_Tarantula",
+      "rank": 5,
+      "available": 43,
+      "description": "Black Scorpion has granted you an Toxic Tarantula for you to command. Weaver One developed the Tarantula Exoskeleton Armor, which so radically transforms an Arachnos troop that hardly anything human is recognizable. Your access to this Tarantula is very limited. You must be level 44 and have two other Mace Mastery Powers before selecting this power.",
+      "shortHelp": "Summon Tarantula: Ranged Moderate DMG(Toxic)",
+      "icon": "arachnos_patron_summononepet.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate Defense Debuff",
+        "Defense Debuff",
+        "Immobilize",
+        "Pet Damage",
+        "Recharge Intensive Pets",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 900.0,
+        "endurance": 26.0,
+        "activationTime": 3.03,
+        "effectArea": "Location"
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['sentinel_mace_mastery'] = EPIC_SENTINEL_MACE_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/sentinel/sentinel_mu_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Mu Mastery
+ * Archetype: Sentinel
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\sentinel_mu_mastery
+ */
+
+const EPIC_SENTINEL_MU_MASTERY = {
+  "id": "sentinel_mu_mastery",
+  "name": "Mu Mastery",
+  "displayName": "Mu Mastery",
+  "archetype": "sentinel",
+  "description": "Scirocco has taught you the ancient powers of the Mu. In their eternal struggle against the Oranbega, the Mu have unlocked many mystical powers, including their very signature crimson lightning. Now you possess their secrets.",
+  "icon": "sentinel_mu_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Electrifying Fences",
+      "fullName": "Epic.Sentinel_Mu_Mastery.Electrifying_Fences",
+      "rank": 1,
+      "available": 34,
+      "description": "The Electrifying Fences attempts to Immobilize a group of foes in an area. This power deals some energy damage over time as it slowly drains some Endurance.",
+      "shortHelp": "Ranged (Targeted AoE), DoT(Energy), Foe Immobilize, -END",
+      "icon": "arachnos_patron_rangedaoeimmobilize.png",
+      "powerType": "Click",
+      "requires": "($archetype == @Class_Sentinel) && (Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Immobilize",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 50.0,
+        "recharge": 16.0,
+        "endurance": 10.751,
+        "activationTime": 1.17,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "damage": {
+          "type": "Energy",
+          "scale": 0.0929,
+          "table": "Ranged_PvPDamage"
+        },
+        "protection": {
+          "immobilize": 3.0
+        },
+        "resistance": {},
+        "recovery": {
+          "scale": -1.0,
+          "table": "Ranged_Ones"
+        }
+      }
+    },
+    {
+      "name": "Thunder Strike",
+      "fullName": "Epic.Sentinel_Mu_Mastery.Thunder_Strike",
+      "rank": 2,
+      "available": 34,
+      "description": "A massive attack. You smash your foes with all the power of a lightning bolt. The pummeled victim takes tremendous damage and may be Disoriented. Any nearby foes may be knocked down and take some damage from the shockwave, as well as have some endurance drained.",
+      "shortHelp": "Melee (AoE), DMG(Smash, Energy), Foe Disorient, Knockback, -End",
+      "icon": "arachnos_patron_thunderstrike.png",
+      "powerType": "Click",
+      "requires": "($archetype == @Class_Sentinel) && (Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Knockback",
+        "Melee AoE Damage",
+        "Stuns",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 7.0,
+        "recharge": 40.0,
+        "endurance": 23.14,
+        "activationTime": 2.53,
+        "effectArea": "AoE",
+        "radius": 10.0
+      }
+    },
+    {
+      "name": "Electric Shackles",
+      "fullName": "Epic.Sentinel_Mu_Mastery.Electric_Shackles",
+      "rank": 3,
+      "available": 37,
+      "description": "Electric Shackles binds a foes limbs, leaving the target held and helpless. The target is drained of some Endurance and some of that Endurance may be transferred back to you. You must be level 38 and have one other Mu Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged, DMG(Energy), Foe Hold, -End",
+      "icon": "arachnos_patron_targetedhold.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "Hold",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Holds",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 2.17,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "hold": 3.0
+        },
+        "damage": {
+          "type": "Energy",
+          "scale": 0.4113,
+          "table": "Ranged_PvPDamage"
+        },
+        "recovery": {
+          "scale": -1.0,
+          "table": "Ranged_Ones"
+        }
+      }
+    },
+    {
+      "name": "Static Discharge",
+      "fullName": "Epic.Sentinel_Mu_Mastery.Static_Discharge",
+      "rank": 4,
+      "available": 40,
+      "description": "Hurls multiple bolts of Mu Electricity in an arc that deals damage and drains Endurance from all affected foes in the area. You must be level 41 and have one other Mu Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Cone), DMG(Energy), -END",
+      "icon": "arachnos_patron_rangedconemoderatedmg.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 40.0,
+        "recharge": 24.0,
+        "endurance": 18.98,
+        "activationTime": 2.07,
+        "effectArea": "Cone",
+        "radius": 40.0,
+        "arc": 0.7854,
+        "damage": {
+          "type": "Energy",
+          "scale": 1.1803,
+          "table": "Ranged_PvPDamage"
+        },
+        "recovery": {
+          "scale": -1.0,
+          "table": "Ranged_Ones"
+        }
+      }
+    },
+    {
+      "name": "Summon Adept",
+      "fullName": "Epic.Sentinel_Mu_Mastery.Summon_Adept",
+      "rank": 5,
+      "available": 43,
+      "description": "Scirocco has shown you how to call upon a mystical Mu Adept to assist you. The Mu pulse with the blood of their slaughtered ancestors in their veins, and are well practiced in the dark arts. Your access to this Adept is very limited. You must be level 44 and have two other Mu Mastery Powers before selecting this power.",
+      "shortHelp": "Summon Mu Adept: Ranged DMG(Energy)",
+      "icon": "arachnos_patron_summononepet.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "Hold",
+        "EnduranceReduction",
+        "Sleep",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Healing",
+        "Holds",
+        "Pet Damage",
+        "Recharge Intensive Pets",
+        "Sleep",
+        "Stuns",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 900.0,
+        "endurance": 26.0,
+        "activationTime": 1.17,
+        "effectArea": "Location"
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['sentinel_mu_mastery'] = EPIC_SENTINEL_MU_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/sentinel/sentinel_ninja_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Weapon Mastery
+ * Archetype: Sentinel
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\sentinel_ninja_mastery
+ */
+
+const EPIC_SENTINEL_NINJA_MASTERY = {
+  "id": "sentinel_ninja_mastery",
+  "name": "Weapon Mastery",
+  "displayName": "Weapon Mastery",
+  "archetype": "sentinel",
+  "description": "A Ninja is a master of many tools and weapons, from the deadly Ninja Blade to deadly Tashibishi, in addition to various poisons.",
+  "icon": "sentinel_ninja_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Tashibishi",
+      "fullName": "Epic.Sentinel_Ninja_Mastery.Caltrops",
+      "rank": 1,
+      "available": 34,
+      "description": "You toss a handful of Caltrops at a targeted location and spread the tiny metal spikes over a large area. Any villains that pass over the Caltrops will be forced to move at a slower rate. They will also take some trivial Lethal damage over time.",
+      "shortHelp": "Ranged (Location AoE), DoT(Lethal), Foe -Speed",
+      "icon": "ninjatools_slow.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Sentinel",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage"
+      ],
+      "allowedSetCategories": [
+        "Ranged AoE Damage",
+        "Sentinel Archetype Sets",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 25.0,
+        "recharge": 45.0,
+        "endurance": 9.75,
+        "activationTime": 1.07,
+        "effectArea": "Location"
+      }
+    },
+    {
+      "name": "Sting of the Wasp",
+      "fullName": "Epic.Sentinel_Ninja_Mastery.Sting_of_the_Wasp",
+      "rank": 2,
+      "available": 34,
+      "description": "You perform a standard attack with your Ninja Blade. This attack is slower than Gambler's Cut, but deals more lethal damage. Sting of the Wasp can reduce a target's Defense, making them easier to hit.",
+      "shortHelp": "Melee, DMG(Lethal), Foe -Def",
+      "icon": "ninjatools_katanalight.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Sentinel",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate Defense Debuff",
+        "Defense Debuff",
+        "Melee Damage",
+        "Sentinel Archetype Sets",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 7.0,
+        "recharge": 10.0,
+        "endurance": 7.54,
+        "activationTime": 1.17,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Lethal",
+          "scale": 1.619,
+          "table": "Melee_PvPDamage"
+        },
+        "defense": {
+          "all": {
+            "scale": 1.0,
+            "table": "Melee_Debuff_Def"
+          }
+        }
+      }
+    },
+    {
+      "name": "Paralyzing Dart",
+      "fullName": "Epic.Sentinel_Ninja_Mastery.Paralizing_Dart",
+      "rank": 3,
+      "available": 37,
+      "description": "Paralyzing Darts do minor toxic damage over time and incapacitate your foe. You must be level 38 and have one other Weapon Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged, DoT(Toxic), Foe Hold",
+      "icon": "ninjatools_hold.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Hold",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Holds",
+        "Ranged Damage",
+        "Sentinel Archetype Sets",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 1.5,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "hold": 3.0
+        },
+        "damage": {
+          "type": "Toxic",
+          "scale": 0.6025,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "The Lotus Drops",
+      "fullName": "Epic.Sentinel_Ninja_Mastery.The_Lotus_Drops",
+      "rank": 4,
+      "available": 40,
+      "description": "You perform The Lotus Drops maneuver, attacking all foes in melee range. This attack wounds your opponents, causing them to take moderate damage over time and reduces their Defense. You must be level 41 and have one other Weapon Mastery Powers before selecting this power.",
+      "shortHelp": "PBAoE Melee, DMG(Lethal), Foe -Def",
+      "icon": "ninjatools_katanaaoe.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate Defense Debuff",
+        "Defense Debuff",
+        "Melee AoE Damage",
+        "Sentinel Archetype Sets",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "recharge": 28.0,
+        "endurance": 16.25,
+        "activationTime": 1.83,
+        "effectArea": "AoE",
+        "radius": 8.0,
+        "damage": {
+          "type": "Lethal",
+          "scale": 1.2732,
+          "table": "Melee_PvPDamage"
+        },
+        "defense": {
+          "all": {
+            "scale": 1.0,
+            "table": "Melee_Debuff_Def"
+          }
+        }
+      }
+    },
+    {
+      "name": "Kemuridama",
+      "fullName": "Epic.Sentinel_Ninja_Mastery.Kemuridama",
+      "rank": 5,
+      "available": 43,
+      "description": "You activate a kemuridama smoke bomb at your feet. The resulting flash of light and smoke can briefly distract your foes and Placate them so they can no longer find or target you. A mixture of toxins in the smoke also weaken your foes, reducing how much damage they inflict in addition to lowering their chance to hit. You must be level 44 and have two other Weapon Mastery Powers before selecting this power.<br>",
+      "shortHelp": "PBAoE, Foe Placate -DMG -To Hit",
+      "icon": "ninjatools_placate.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate To-Hit Debuff",
+        "Threat Duration",
+        "To Hit Debuff"
+      ],
+      "effects": {
+        "accuracy": 1.4,
+        "recharge": 120.0,
+        "endurance": 19.5,
+        "activationTime": 1.83,
+        "effectArea": "AoE",
+        "radius": 20.0
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['sentinel_ninja_mastery'] = EPIC_SENTINEL_NINJA_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/sentinel/sentinel_psionic_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Psionic Mastery
+ * Archetype: Sentinel
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\sentinel_psionic_mastery
+ */
+
+const EPIC_SENTINEL_PSIONIC_MASTERY = {
+  "id": "sentinel_psionic_mastery",
+  "name": "Psionic Mastery",
+  "displayName": "Psionic Mastery",
+  "archetype": "sentinel",
+  "description": "You have advance Mastery over your Psionic abilities and are able to control your foes and aid your allies with them.",
+  "icon": "sentinel_psionic_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Mass Hypnosis",
+      "fullName": "Epic.Sentinel_Psionic_Mastery.Mass_Hypnosis",
+      "rank": 1,
+      "available": 34,
+      "description": "Hypnotizes a group of foes at a distance and puts them to Sleep. The targets will remain asleep for some time, but will awaken if attacked. This power deals no damage, but if done discreetly, the targets will never be aware of your presence.<br><br><color #fcfc95>Notes:<br>The Sleep component of this power is Auto Hit against regular enemies, but a To Hit check is required to against AVs and players, as well as to make secondary effects apply.</color>",
+      "shortHelp": "Ranged (Targeted AoE), Foe Sleep",
+      "icon": "mentalcontrol_masshypnosis.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Sentinel",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Sleep",
+        "Recharge",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Sleep"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 90.0,
+        "endurance": 19.5,
+        "activationTime": 2.03,
+        "effectArea": "AoE",
+        "radius": 25.0,
+        "protection": {
+          "sleep": 4.0
+        }
+      }
+    },
+    {
+      "name": "Mind Probe",
+      "fullName": "Epic.Sentinel_Psionic_Mastery.Mind_Probe",
+      "rank": 2,
+      "available": 34,
+      "description": "Grip the minds of your foe with a Mind Probe. You must be in close proximity to pull off this attack that wreaks havoc on your foes synapses, dealing high Psionic Damage while reducing their attack speed.",
+      "shortHelp": "Melee, DMG(Psionic), Target -Recharge",
+      "icon": "mentalcontrol_mindprobe.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Sentinel",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Melee Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 7.0,
+        "recharge": 20.0,
+        "endurance": 12.74,
+        "activationTime": 1.17,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Psionic",
+          "scale": 2.019,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Dominate",
+      "fullName": "Epic.Sentinel_Psionic_Mastery.Dominate",
+      "rank": 3,
+      "available": 37,
+      "description": "Painfully tears at the mind of a single foe. Dominate deals Psionic damage and renders a foe helpless, lost in their own mind and unable to defend themselves. You must be level 38 and have one other Psionic Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged, DMG(Psionic), Foe Hold",
+      "icon": "mentalcontrol_command.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Hold",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Holds",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 1.1,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "hold": 4.0
+        },
+        "damage": {
+          "type": "Psionic",
+          "scale": 2.13,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Psychic Shockwave",
+      "fullName": "Epic.Sentinel_Psionic_Mastery.Psychic_Shockwave",
+      "rank": 4,
+      "available": 40,
+      "description": "Psychic Shockwave is a devastating Psionic attack that wracks the minds of all nearby foes. Affected foes may have a reduced attack rate and may be left Disoriented. You must be level 41 and have one other Psionic Mastery Powers before selecting this power.",
+      "shortHelp": "PBAoE, DMG(Psionic), Foe Disorient -Recharge",
+      "icon": "mentalcontrol_psionicshockwave.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Melee AoE Damage",
+        "Stuns",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 40.0,
+        "endurance": 23.14,
+        "activationTime": 1.97,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "damage": {
+          "type": "Psionic",
+          "scale": 0.7935,
+          "table": "Melee_PvPDamage"
+        },
+        "protection": {
+          "stun": 2.0
+        }
+      }
+    },
+    {
+      "name": "Link Minds",
+      "fullName": "Epic.Sentinel_Psionic_Mastery.Link_Minds",
+      "rank": 5,
+      "available": 43,
+      "description": "Your Mind Link Power will enable you to link the minds of all your teammates who are near you for the next 90 seconds. This shared link improves your team's chance to hit foes, your defensive abilities and reduces psionic damage. You must be level 44 and have two other Psionic Mastery Powers before selecting this power.",
+      "shortHelp": "PBAoE Team +To Hit, +DEF (All), +RES (Psionic)",
+      "icon": "mentalcontrol_mindlink.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [],
+      "allowedSetCategories": [
+        "Defense Sets",
+        "To Hit Buff"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 300.0,
+        "endurance": 15.288,
+        "activationTime": 3.67,
+        "effectArea": "AoE",
+        "radius": 35.0,
+        "resistance": {
+          "psionic": {
+            "scale": 2.0,
+            "table": "Ranged_Res_Dmg"
+          }
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['sentinel_psionic_mastery'] = EPIC_SENTINEL_PSIONIC_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/sentinel/sentinel_soul_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Soul Mastery
+ * Archetype: Sentinel
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\sentinel_soul_mastery
+ */
+
+const EPIC_SENTINEL_SOUL_MASTERY = {
+  "id": "sentinel_soul_mastery",
+  "name": "Soul Mastery",
+  "displayName": "Soul Mastery",
+  "archetype": "sentinel",
+  "description": "Ghost Widow has granted you access to the power of darkness and souls. She has shown you how to use the souls of your victims to destroy your enemies. This has granted you access to powers and abilities you have never had before.",
+  "icon": "sentinel_soul_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Soul Tentacles",
+      "fullName": "Epic.Sentinel_Soul_Mastery.Soul_Tentacles",
+      "rank": 1,
+      "available": 34,
+      "description": "You can create a cone shaped rift to the Netherworld that allows the souls of the damned to slip into our reality. These Soul Tentacles will snare all foes within range, Immobilizing them while they drain their life.",
+      "shortHelp": "Ranged (Cone), DMG(Negative), Foe Immobilize",
+      "icon": "arachnos_patron_coneimmobilize.png",
+      "powerType": "Click",
+      "requires": "($archetype == @Class_Sentinel) && (Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Immobilize",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 50.0,
+        "recharge": 16.0,
+        "endurance": 10.751,
+        "activationTime": 1.67,
+        "effectArea": "Cone",
+        "radius": 50.0,
+        "arc": 0.5236,
+        "damage": {
+          "type": "Negative",
+          "scale": 0.1588,
+          "table": "Ranged_PvPDamage"
+        },
+        "protection": {
+          "immobilize": 3.0
+        },
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Midnight Grasp",
+      "fullName": "Epic.Sentinel_Soul_Mastery.Midnight_Grasp",
+      "rank": 2,
+      "available": 34,
+      "description": "Mastery over the forces of the Netherworld allows you to create dark tentacles that can Immobilize a foe, reduce their chance to hit and continuously drain their life force.",
+      "shortHelp": "Melee, DMG(Negative), Foe Immobilize, -To Hit",
+      "icon": "arachnos_patron_midnightgrasp.png",
+      "powerType": "Click",
+      "requires": "($archetype == @Class_Sentinel) && (Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate To-Hit Debuff",
+        "Immobilize",
+        "Melee Damage",
+        "To Hit Debuff",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 7.0,
+        "recharge": 30.0,
+        "endurance": 14.95,
+        "activationTime": 2.07,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Negative",
+          "scale": 2.499,
+          "table": "Melee_PvPDamage"
+        },
+        "protection": {
+          "immobilize": 3.0
+        }
+      }
+    },
+    {
+      "name": "Soul Storm",
+      "fullName": "Epic.Sentinel_Soul_Mastery.Soul_Storm",
+      "rank": 3,
+      "available": 37,
+      "description": "Like Ghost Widow, you can summon the souls of your victims to do your bidding. Soul Storm enraptures a single target Holding them while their life-force is drained from their body. You must be level 38 and have one other Soul Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged, DoT(Negative), Foe Hold",
+      "icon": "arachnos_patron_targetedhold.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Hold",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Holds",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 2.17,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "hold": 3.0
+        },
+        "damage": {
+          "type": "Negative",
+          "scale": 0.2879,
+          "table": "Ranged_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Darkest Night",
+      "fullName": "Epic.Sentinel_Soul_Mastery.Darkest_Night",
+      "rank": 4,
+      "available": 40,
+      "description": "While active, you channel Negative Energy onto a targeted foe. Darkest Night decreases the damage potential and chance to hit of the target, and all foes nearby, as long as you keep the power active. You must be level 41 and have one other Soul Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Ranged (Targeted AoE), Foe -DMG -To Hit",
+      "icon": "arachnos_patron_aoedamagedebuff.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "To Hit Debuff"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 70.0,
+        "recharge": 20.0,
+        "endurance": 0.325,
+        "activationTime": 2.37,
+        "effectArea": "AoE",
+        "radius": 15.0
+      }
+    },
+    {
+      "name": "Summon Mistress",
+      "fullName": "Epic.Sentinel_Soul_Mastery.Summon_Mistress",
+      "rank": 5,
+      "available": 43,
+      "description": "Ghost Widow has assigned a Fortunata Mistress for you to command. Arguably, the most powerful of the Fortunatas, these rare few have mastered numerous psychic abilities and risen to the top of Lord Recluse's beautiful Black Widows. Your access to this Fortunata is very limited. You can only summon her once every 15 minutes and she will leave after 4 minutes, or if you exit a zone or mission. You must be level 44 and have two other Soul Mastery Powers before selecting this power.",
+      "shortHelp": "Summon Fortunata Mistress: Ranged DMG(Psionic)",
+      "icon": "arachnos_patron_summononepet.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Sleep",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Immobilize",
+        "Knockback",
+        "Pet Damage",
+        "Recharge Intensive Pets",
+        "Sleep",
+        "Stuns",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 900.0,
+        "endurance": 26.0,
+        "activationTime": 3.2,
+        "effectArea": "Location"
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['sentinel_soul_mastery'] = EPIC_SENTINEL_SOUL_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
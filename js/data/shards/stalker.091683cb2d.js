@@ -0,0 +1,10691 @@
+// ---- js/data/powersets/stalker/bio-organic-armor.js ----
+;/**
+ * Bio Organic Armor
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_BIO_ORGANIC_ARMOR_POWERSET = {
+    name: "Bio Organic Armor",
+    category: "Unknown",
+    description: "Bio Organic Armor powerset",
+    icon: "bio-organic-armor_set.png",
+    powers: [
+        {
+            name: "Defensive Adaptation",
+            available: -1,
+            tier: 2,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "By activating this power you cause your Bio Armor to spontaneously mutate, causing it to become dense and durable. While active Hardened Carapace grants additional resistance to Lethal, Smashing and Toxic damage, Boundless Energy grants additional Maximum HP, Environmental Modification grants additional defense and also grants a small amount of Maximum HP, Ablative Carapace grants additional damage absorption, DNA Siphon grants additional health per target hit and Parasitic Aura grants additional damage absorption per target hit. Genetic Corruption will also grant a small amount of additional damage resistance and increase the potency of the power's damage debuff. Additionally, many of your damaging attacks will heal you for a minor amount of health. However, the bulkiness of this adaptation reduces your damage moderately. Defensive Adaptation costs no endurance.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Bio Armor Defensive Mode",
+            icon: "bioorganicarmor_defensiveadaptation.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                cast: 1.0,
+                buffDuration: 1.1
+            }
+        },
+        {
+            name: "Efficient Adaptation",
+            available: -1,
+            tier: 2,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "By activating this power you cause your Bio Armor to spontaneously mutate, causing it to become evenly distributed along your body. While active Hardened Carapace grants a minor Endurance Discount, Boundless Energy grants additional regeneration and recovery, Ablative Carapace grants a bonus to regeneration and both DNA Siphon and Parasitic Aura grant increased regeneration and recovery and Genetic Corruption grants a minor regeneration buff. Efficient Adaptation costs no endurance.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Bio Armor Efficient Mode",
+            icon: "bioorganicarmor_efficientadaptation.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                cast: 0.67,
+                buffDuration: 1.1
+            }
+        },
+        {
+            name: "Offensive Adaptation",
+            available: -1,
+            tier: 2,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "By activating this power you cause your Bio Armor to spontaneously mutate, causing it to sprout spines and become much lighter. While active Hardened Carapace increases your damage slightly, Environmental Modification grants you a moderate to hit buff, and debuff effects from DNA Siphon and Parasitic Aura are increased moderately. Genetic Corruption will have its chance to put enemies to sleep increased. Additionally, many of your damaging powers will inflict a minor amount of additional Toxic damage. While Offensive Adaptation is active your Defense and Damage Resistance is reduced slightly. Offensive Adaptation costs no endurance.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Bio Armor Offensive Mode",
+            icon: "bioorganicarmor_offensiveadaptation.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                cast: 0.67,
+                resistance: {
+                    smashing: -0.075,
+                    lethal: -0.075,
+                    fire: -0.075,
+                    cold: -0.075,
+                    energy: -0.075,
+                    negative: -0.075,
+                    psionic: -0.075,
+                    toxic: -0.075
+                },
+                buffDuration: 1.1
+            }
+        },
+        {
+            name: "Hardened Carapace",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "With a little concentration you can cause your skin to become hard as stone, boosting your constitution to reject toxins and recovering from wounds more quickly. While active, this power will boost your resistance to Lethal, Smashing and Toxic damage, grant a minor amount of regeneration, and protection from Disorient and Sleep effects. If Efficient Adaptation is active, Hardened Carapace will grant an Endurance Discount. If Defensive Adaptation is active, Hardened Carapace will grant additional resistance to Lethal, Smashing and Toxic damage. While Offensive Adaptation is active, this power will grant a minor boost to damage. Bonuses granted from Adaptations are unenhanceable.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Self Toggle, +Res(Lethal, Smash, Toxic, Disorient, Sleep), +Special",
+            icon: "bioorganicarmor_hardenedskin.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.67,
+                protection: {
+                    stun: 10.379999999999999,
+                    sleep: 10.379999999999999
+                },
+                resistance: {
+                    smashing: 0.1875,
+                    lethal: 0.1875,
+                    toxic: 0.1875
+                },
+                buffDuration: 0.75,
+                stun: 1.0,
+                stunDuration: 0.75
+            }
+        },
+        {
+            name: "Hide",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Hide makes you almost impossible to detect. When properly 'Hidden\", a Stalker can pull off Critical hits with his attacks, and even land a massive 'Assassins Strike' with an Assassins power. When you attack or are damaged while using this power, you will be discovered. Even if discovered, you are hard to see and retain some bonus to Defense. Unlike most stealth powers, Hide can be used at the same time as other Concealment powers, giving you even greater stealth capability. No Endurance cost.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Toggle: Self Stealth, +DEF(Melee, Ranged, AoE)",
+            icon: "bioorganicarmor_hide.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                cast: 0.73,
+                defense: {
+                    smashing: 0.0375,
+                    lethal: 0.0375,
+                    fire: 0.0375,
+                    cold: 0.0375,
+                    energy: 0.0375,
+                    negative: 0.0375,
+                    psionic: 0.0375,
+                    toxic: 0.0375
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Boundless Energy",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "Your body constantly evolves and addresses weaknesses. As a result you receive a moderate bonus to maximum hit points, regeneration, recovery as well as gaining a measure of Slow and Endurance Drain Resistance. Half of this power's maximum hit point increase is unenhanceable. While Efficient Adaptation is active, this power grants a small bonus to recovery and regeneration. While Defensive Adaptation is active you gain a small amount of additional maximum hit points. This power doesn't grant any bonuses to Offensive Adaptation. These special bonuses are unenhanceable. Boundless Energy is always active.",
+            shortHelp: "Auto: +Max HP, +Regen, +Recovery, +Res(Slow, End Drain), +Special",
+            icon: "bioorganicarmor_inexhaustible.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                debuffResistance: {
+                    endurance: 0.692,
+                    recharge: 0.3,
+                    movement: 0.3
+                },
+                buffDuration: 5.25
+            }
+        },
+        {
+            name: "Environmental Modification",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Your body can spontaneously adapt to its surroundings and your mind has learned to shield itself from harmful effects by constant exposure to these dangers. While active you gain moderate defense to Fire, Cold, Energy and Negative Energy damage, and a small amount of defense to Psionic damage. Additionally you are protected against hold, knockdown and immobilize effects. While Defensive Adaptation is active you gain a minor amount of Lethal, Smashing, Fire, Cold, Energy, Negative Energy and Psionic defense, as well as a minor amount of maximum hit points. If Offensive Adaptation is active you'll gain a moderate To Hit bonus. These special bonuses are unenhanceable.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Self Toggle, +Res(Hold, Knockdown, Immobilize), +Def(Energy, Negative, Fire, Cold, Psionic), +Special",
+            icon: "bioorganicarmor_environmentalmodification.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.73,
+                protection: {
+                    hold: 10.379999999999999,
+                    immobilize: 10.379999999999999
+                },
+                defense: {
+                    fire: 0.11249999999999999,
+                    cold: 0.11249999999999999,
+                    energy: 0.11249999999999999,
+                    negative: 0.11249999999999999,
+                    psionic: 0.056249999999999994,
+                    smashing: 0.03375,
+                    lethal: 0.03375
+                },
+                buffDuration: 0.75,
+                tohitBuff: 0.75
+            }
+        },
+        {
+            name: "Adaptation",
+            available: 15,
+            tier: 4,
+            maxSlots: 0,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "By purchasing this power you gain access to three mutually exclusive toggle powers: Efficient Adaptation, Defensive Adaptation and Offensive Adaptation. If Defensive Adaptation is active you gain improved damage resistance from Hardened Carapace and Genetic Corruption, additional defense from Environmental Modification, and increased Maximum HP from Environmental Modification and Boundless Energy. If Offensive Adaptation is active you gain bonus damage from Hardened Carapace, additional To Hit from Environmental Modification, empowered debuff effects from DNA Siphon, and Parasitic Aura and increased sleep chance from Genetic Corruption. While Efficient Adaptation is active Hardened Carapace will provide a moderate endurance discount, Boundless Energy has increased Regeneration and Recovery, Genetic Corruption grants additional regeneration, DNA Siphon grants additional regeneration and recovery for each defeated target and Parasitic Aura grants additional regeneration and recovery for each nearby target.",
+            shortHelp: "Gain Efficient, Defensive and Offensive Adaptations",
+            icon: "bioorganicarmor_adaptation.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0
+            }
+        },
+        {
+            name: "Ablative Carapace",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "When needed, you're able to cause your Bio Armor to gain a thick, but brittle outer layer that will absorb a large amount of damage before breaking off. Ablative Carapace will grant a moderate amount of damage absorption and a high amount of regeneration for a short time. While Efficient Adaptation is active, this power grants a slightly larger regeneration buff. While Defensive Adaptation is active, this power grants a bonus to damage absorption.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self, +Absorption, +Regeneration",
+            icon: "bioorganicarmor_ablativecarapace.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 10.4,
+                cast: 2.03,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "DNA Siphon",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Endurance Modification", "Healing", "Melee AoE Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You can siphon genetic material from nearby enemies, causing a minor amount of Lethal damage and a minor amount of Toxic damage over time. Living enemies will provide the user with a small boost to health and endurance. These foes will have their regeneration rate reduced for a short period of time. Defeated enemies provide a weaker sample of material and thus will boost recovery and regeneration for a short while. While Efficient Adaptation is active, this power will grant bonus regeneration and recovery per defeated target hit. While Defensive Adaptation is active, this power will grant bonus health per living target hit. While Offensive Adaptation is active this power's regeneration debuff is increased in effectiveness.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Click, PBAoE Minor DMG(Lethal/Toxic) Foe -Regen, Taunt, Self +HP, +End, +Special",
+            icon: "bioorganicarmor_dnasiphon.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 13.0,
+                cast: 1.67,
+                damage: {
+                    type: "Lethal",
+                    scale: 0.2
+                },
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.1,
+                    ticks: 2
+                },
+                healing: {
+                    scale: 45.178462499999995,
+                    perTarget: true
+                },
+                buffDuration: 2.0
+            }
+        },
+        {
+            name: "Genetic Corruption",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Sleep", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Sleep"],
+            description: "Your Bio Armor is capable of corrupting the genetic code of nearby foes, reducing the damage they deal. Lesser foes may be put to sleep for a short time. While Efficiency Adaptation is active, this power grants a moderate bonus to Regeneration. While Defensive Adaptation is active you gain a minor bonus to all types of damage resistance and increase the potency of this power's damage debuff. If Offensive Adaptation is active enemies are more likely to fall asleep. These special bonuses are unenhanceable.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: PBAoE, Foe Sleep, -Damage(All), Self +Special",
+            icon: "bioorganicarmor_geneticcorruption.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 2.08,
+                cast: 1.07,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 1.0,
+                            ticks: 2
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.0,
+                            ticks: 2
+                        },
+                        {
+                            type: "Energy",
+                            scale: 1.0,
+                            ticks: 2
+                        },
+                        {
+                            type: "Negative",
+                            scale: 1.0,
+                            ticks: 2
+                        },
+                        {
+                            type: "Psionic",
+                            scale: 1.0,
+                            ticks: 2
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.75,
+                            ticks: 2
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 0.75,
+                            ticks: 2
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 0.75,
+                            ticks: 2
+                        }
+                    ]
+                },
+                resistance: {
+                    smashing: 0.056249999999999994,
+                    lethal: 0.056249999999999994,
+                    toxic: 0.056249999999999994,
+                    fire: 0.075,
+                    cold: 0.075,
+                    energy: 0.075,
+                    negative: 0.075,
+                    psionic: 0.075
+                },
+                buffDuration: 4.25
+            }
+        },
+        {
+            name: "Parasitic Aura",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Endurance Modification", "Healing"],
+            description: "You release a cloud of parasites around you that draw out your enemies' genetic material. These parasites dramatically increase your survivability by gaining damage absorption while boosting your regeneration and recovery rate for a short time. Affected foes will be infected and deal reduced damage for a short while. While Efficient Adaptation is active, this power will grant additional regeneration and recovery per target hit. While Defensive Adaptation is active, this power will grant a small amount of additional damage absorption and increase the effectiveness of this power's damage debuff.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "PBAoE, Self +Absorb, +Regeneration, +Recovery, Foe -DMG",
+            icon: "bioorganicarmor_parasiticaura.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.5,
+                recharge: 270.0,
+                endurance: 18.2,
+                cast: 1.87,
+                buffDuration: 45.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/bio-organic-armor'] = STALKER_BIO_ORGANIC_ARMOR_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_BIO_ORGANIC_ARMOR_POWERSET = STALKER_BIO_ORGANIC_ARMOR_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/brawling.js ----
+;/**
+ * Brawling
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_BRAWLING_POWERSET = {
+    name: "Brawling",
+    category: "Unknown",
+    description: "Brawling powerset",
+    icon: "brawling_set.png",
+    powers: [
+        {
+            name: "Heavy Blow",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You strike your foe with a powerful punch dealing Moderate Smashing damage. Heavy Blow has a fair chance to knock the target off its feet. Heavy Blow is a Combo Builder and adds 1 Combo Level.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Melee, Moderate DMG(Smash), Foe Knockdown, Combo Builder",
+            icon: "brawling_heavyblow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 5.0,
+                endurance: 6.032,
+                cast: 1.07
+            }
+        },
+        {
+            name: "Initial Strike",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "You deliver a pair of lightning fast blows to your opponent in an effort to throw them off balance. Initial Strike deals Light Smashing damage and has a small chance to disorient your target. Initial Strike is a Combo Builder and adds 1 Combo Level.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Melee, Light DMG(Smash), Foe Disorient, Combo Builder",
+            icon: "brawling_initialstrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 0.8
+            }
+        },
+        {
+            name: "Sweeping Cross",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee AoE Damage", "Stalker Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "You execute a sweeping right hook that can strike multiple targets in your frontal arc. Sweeping Cross deals High Smashing damage and can disorient foes. Sweeping Cross is a Finisher and sets your current Combo Level to 0. It will deal additional damage and have a greater chance to disorient dependent upon the current Combo Level. At Combo Level 3, Sweeping Cross will also have a chance to knock down the affected targets. Critical damage is unaffected by your Combo Level.<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Melee (Cone), High DMG(Smash), Foe Disorient, Finisher",
+            icon: "brawling_sweepingcross.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 1.309,
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67
+            }
+        },
+        {
+            name: "Assassin's Strike",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "A signature Stalker attack. This attack does superior smashing damage on its own as a frontal attack and cannot be interrupted. However, if it is executed while you are Hidden, this attack will do tremendous damage, as you waylay your unsuspecting foe. This attack may be interrupted if you move or are attacked while executing this power and are hidden. Using this power while not hidden has a chance to critically hit equal to 33.3% times the number of stacks of Assassin's Focus. Assassin's Strike builds 2 Combo Levels. Using Assassin's Strike when not hidden will remove all stacks of Assassin's Focus regardless if you critically hit or not.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee, Extreme DMG(Smash), Combo Builder",
+            icon: "brawling_assassinsstrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 3.17
+            }
+        },
+        {
+            name: "Build Up",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your chance to hit.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "brawling_combatreadiness.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Placate",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Allows you to trick a foe to no longer attack you. A Successful Placate will also Hide you. This Hide is very brief, and offers no Defense bonus, but it will allow you to deliver a Critical Hit or an Assassins Blow. However, if you attack a Placated Foe, he will be able to attack you back.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Foe Placate, Self Stealth/Hide",
+            icon: "brawling_placate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                cast: 0.8,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Spinning Strike",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged AoE Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You execute a spinning attack that first strikes with your fist and finally your heel hitting your foe and all enemies immediately nearby. Spinning Strike deals Heavy Smashing damage and has a high chance to knockdown foes. Spinning Strike is a Finisher and sets your current Combo Level to 0. It will deal additional damage and have a greater chance to knockdown dependent upon the current Combo Level. At Combo Level 3, Spinning Strike also has a moderate chance to briefly inflict Terrorize in nearby foes. Critical damage is unaffected by your Combo Level.<br><br><color #fcfc95>Damage: High.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee (Targeted AoE), High DMG(Smash), Foe Knockdown, Finisher",
+            icon: "brawling_spinningstrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.8
+            }
+        },
+        {
+            name: "Shin Breaker",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Defense Debuff", "Melee Damage", "Slow Movement", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You execute a quick but powerful kick targeting your foe's leg in an attempt to cripple their movement. Shin Breaker deals Superior Smashing damage and moderately reduces your target's movement speed and defense for a short time. Shin Breaker is a Combo Builder and adds 1 Combo Level.<br><br><color #fcfc95>Damage: Superior.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Melee, Superior DMG(Smash), Foe -Speed, -Defense, Combo Builder",
+            icon: "brawling_lowkick.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.33,
+                buffDuration: 8.0,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Crushing Uppercut",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Holds", "Knockback", "Melee Damage", "Stalker Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "You perform a jaw breaking Crushing Uppercut on your target inflicting Extreme Smashing damage and knocking them into the air. Crushing Uppercut will leave the target disoriented for a short time. Crushing Uppercut is a Finisher and will set your Combo Level to 0. It will deal additional damage and have a longer disorient duration dependent upon the current Combo level. At Combo Level 3, Crushing Uppercut will have its disorient effect upgraded to a Hold effect. Critical damage is unaffected by your Combo Level.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee, Extreme DMG(Smash), Foe Knock Up, Disorient, Finisher",
+            icon: "brawling_crushinguppercut.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 13.0,
+                recharge: 25.0,
+                endurance: 14.352,
+                cast: 2.17
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/brawling'] = STALKER_BRAWLING_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_BRAWLING_POWERSET = STALKER_BRAWLING_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/broad-sword.js ----
+;/**
+ * Broad Sword
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_BROAD_SWORD_POWERSET = {
+    name: "Broad Sword",
+    category: "Unknown",
+    description: "Broad Sword powerset",
+    icon: "broad-sword_set.png",
+    powers: [
+        {
+            name: "Hack",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You Hack your opponent for a high amount of damage. This attack can reduce a target's Defense, making him easier to hit.",
+            shortHelp: "Melee, DMG(Lethal), Foe -DEF",
+            icon: "sword_hack.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.33,
+                damage: {
+                    type: "Lethal",
+                    scale: 3.291
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Slash",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You perform a quick Slash that can reduce a target's Defense, making him easier to hit. This attack causes moderate damage, but has a quick recharge time.",
+            shortHelp: "Melee, DMG(Lethal), Foe -DEF",
+            icon: "sword_slash.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 1.33,
+                damage: {
+                    type: "Lethal",
+                    scale: 2.491
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Slice",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Melee AoE Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You Slice your sword in a wide arc, attacking all enemies in front of you. Slice does less damage than Hack but can hit multiple foes and reduce their defense.",
+            shortHelp: "Melee (Cone), DMG(Lethal), Foe -DEF",
+            icon: "sword_slice.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 2.2689,
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 2.0,
+                damage: {
+                    type: "Lethal",
+                    scale: 2.8306
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Assassin's Slash",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "A signature Stalker attack. This attack does superior lethal damage on its own as a frontal attack and cannot be interrupted. However, if it is executed while you are Hidden, this attack will do tremendous damage, as you impale your unsuspecting foe. This attack may be interrupted if you move or are attacked while executing this power and are hidden. Using this power while not hidden has a chance to critically hit equal to 33.3% times the number of stacks of Assassin's Focus. Using Assassin's Strike when not hidden will remove all stacks of Assassin's Focus regardless if you critically hit or not.",
+            shortHelp: "Melee, DMG(Lethal)",
+            icon: "sword_assassinsslash.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 3.67
+            }
+        },
+        {
+            name: "Build Up",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your chance to hit.",
+            shortHelp: "Self +DMG, +To-hit",
+            icon: "sword_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Placate",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Allows you to trick a foe to no longer attack you. A successful Placate will also Hide you. This Hide is very brief, and offers no Defense bonus, but it will allow you to deliver a Critical Hit or an Assassin's Slash However, if you attack a Placated Foe, he will be able to attack you back.",
+            shortHelp: "Ranged, Foe Placate, Self Stealth/Hide",
+            icon: "sword_placate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                cast: 0.8,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Parry",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Defense Sets", "Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You can use this power to Parry incoming melee attacks. The Parry itself does minor damage, but every successful hit will increase your Defense against melee and lethal attacks for a short while.",
+            shortHelp: "Melee, DMG(Lethal), Self +DEF(Melee,Lethal)",
+            icon: "sword_parry.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 1.33,
+                damage: {
+                    type: "Lethal",
+                    scale: 2.291
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Disembowel",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Knockback", "Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You perform a powerful Disemboweling maneuver that deals a great amount of damage, and can knock a target up into the air. This attack can reduce a target's Defense, making him easier to hit.",
+            shortHelp: "Melee, DMG(Lethal), Knockup, Foe -DEF",
+            icon: "sword_disembowel.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.8,
+                damage: {
+                    type: "Lethal",
+                    scale: 4.02
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Head Splitter",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Knockback", "Melee AoE Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You perform a devastating Head Splitter attack that deals a massive amount of damage and can even knock a foe down to the ground and reduce its Defense. This attack has an exceptionally good critical hit capability, better than other Broadsword attacks, that can sometimes deal double damage. The power of this attack can actually extend a short distance through multiple foes.",
+            shortHelp: "Melee, DMG(Lethal), Foe Knockback, -DEF",
+            icon: "sword_headsplitter.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 0.3491,
+            effects: {
+                accuracy: 1.05,
+                range: 10.0,
+                recharge: 14.0,
+                endurance: 13.52,
+                cast: 2.33,
+                damage: {
+                    type: "Lethal",
+                    scale: 5.191000000000001
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 10.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/broad-sword'] = STALKER_BROAD_SWORD_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_BROAD_SWORD_POWERSET = STALKER_BROAD_SWORD_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/claws.js ----
+;/**
+ * Claws
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_CLAWS_POWERSET = {
+    name: "Claws",
+    category: "Unknown",
+    description: "Claws powerset",
+    icon: "claws_set.png",
+    powers: [
+        {
+            name: "Strike",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You perform a deadly Strike with your claws. This is a basic attack that deals a moderate amount of lethal damage.",
+            shortHelp: "Melee, DMG(Lethal)",
+            icon: "claws_clawsstrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 3.2,
+                endurance: 4.16,
+                cast: 1.17,
+                damage: {
+                    type: "Lethal",
+                    scale: 2.427
+                }
+            }
+        },
+        {
+            name: "Swipe",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "A quick Swipe with your claws. Does minor lethal damage, but has a quick recharge rate.",
+            shortHelp: "Melee, DMG(Lethal)",
+            icon: "claws_clawsswipe.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 1.7,
+                endurance: 2.912,
+                cast: 0.83,
+                damage: {
+                    type: "Lethal",
+                    scale: 1.809
+                }
+            }
+        },
+        {
+            name: "Slash",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You Slash at your foe with your claws, dealing a good amount of lethal damage, but with a longer recharge rate than Swipe or Strike . This attack can reduce a target's Defense, making them easier to hit.",
+            shortHelp: "Melee, DMG(Lethal), Foe -DEF",
+            icon: "claws_slash.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 4.8,
+                endurance: 5.4912,
+                cast: 1.33,
+                damage: {
+                    type: "Lethal",
+                    scale: 2.843
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Assassin's Claw",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "A signature Stalker attack. This attack does superior lethal damage on its own as a frontal attack and cannot be interrupted. However, if it is executed while you are Hidden, this attack will do tremendous damage, as you impale your unsuspecting foe. This attack may be interrupted if you move or are attacked while executing this power and are hidden. Using this power while not hidden has a chance to critically hit equal to 33.3% times the number of stacks of Assassin's Focus. Using Assassin's Strike when not hidden will remove all stacks of Assassin's Focus regardless if you critically hit or not.",
+            shortHelp: "Melee, DMG(Lethal)",
+            icon: "claws_assassinclaw.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 3.0
+            }
+        },
+        {
+            name: "Build Up",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your chance to hit.",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "claws_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 72.0,
+                endurance: 4.16,
+                cast: 0.73,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Placate",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Allows you to trick a foe to no longer attack you. A Successful Placate will also Hide you. This Hide is very brief, and offers no Defense bonus, but it will allow you to deliver a Critical Hit or an Assassins Claw. However, if you attack a Placated Foe, he will be able to attack you back.",
+            shortHelp: "Ranged, Foe Placate, Self Stealth/Hide",
+            icon: "claws_placate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                cast: 0.8,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Focus",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "Projects a burst of Focused power over a short distance. Focus deals high lethal damage and can possibly knock down your foe.",
+            shortHelp: "Ranged, DMG(Lethal), Knockback",
+            icon: "claws_focus.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 6.4,
+                endurance: 6.8224,
+                cast: 1.17,
+                damage: {
+                    type: "Lethal",
+                    scale: 2.865
+                }
+            }
+        },
+        {
+            name: "Eviscerate",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You spin and slash violently at the foe in front of you. This attack deals exceptional damage, and has a high chance of landing a critical hit even while not hidden.",
+            shortHelp: "Melee, DMG(Lethal), +Special",
+            icon: "claws_stalkereviscerate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 8.867,
+                endurance: 8.8749,
+                cast: 2.33,
+                damage: {
+                    type: "Lethal",
+                    scale: 4.6157
+                }
+            }
+        },
+        {
+            name: "Shockwave",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged AoE Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "Projects a Shockwave of focused power that can travel a short distance. Shockwave travels in a wide arc in front of you dealing moderate lethal damage and, possibly knocking back foes. If executed while hidden, all affected targets have a chance to be hit with a Critical for extra damage.",
+            shortHelp: "Ranged (Cone), DMG(Lethal), Foe Knockback",
+            icon: "claws_wave.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.0,
+                range: 30.0,
+                recharge: 12.1,
+                endurance: 11.5648,
+                cast: 1.0,
+                damage: {
+                    type: "Lethal",
+                    scale: 1.6661000000000001
+                }
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/claws'] = STALKER_CLAWS_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_CLAWS_POWERSET = STALKER_CLAWS_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/dark-armor.js ----
+;/**
+ * Dark Armor
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_DARK_ARMOR_POWERSET = {
+    name: "Dark Armor",
+    category: "Unknown",
+    description: "Dark Armor powerset",
+    icon: "dark-armor_set.png",
+    powers: [
+        {
+            name: "Dark Embrace",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You tap into the energy of the Netherworld to protect yourself from damage. This Dark Embrace shrouds you and grants resistance to Lethal, Smashing, Negative Energy and Toxic damage.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +Res(Smash, Lethal, Negative, Toxic)",
+            icon: "darkarmor_darkembrace.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.104,
+                cast: 0.67,
+                resistance: {
+                    smashing: 0.22499999999999998,
+                    lethal: 0.22499999999999998,
+                    negative: 0.15,
+                    toxic: 0.15
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Hide",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Hide makes you almost impossible to detect. When properly 'Hidden\", a Stalker can pull off Critical hits with his attacks, and even land a massive 'Assassins Strike' with an Assassins power. When you attack or are damaged while using this power, you will be discovered. Even if discovered, you are hard to see and retain some bonus to Defense. Unlike most stealth powers, Hide can be used at the same time as other Concealment powers, giving you even greater stealth capability. No Endurance cost.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Toggle: Self Stealth, +DEF(Melee, Ranged, AoE)",
+            icon: "darkarmor_stealth.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                cast: 0.73,
+                defense: {
+                    smashing: 0.0375,
+                    lethal: 0.0375,
+                    fire: 0.0375,
+                    cold: 0.0375,
+                    energy: 0.0375,
+                    negative: 0.0375,
+                    psionic: 0.0375,
+                    toxic: 0.0375
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Murky Cloud",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You create a Murky Cloud enshrouding you. This cloud can absorb all forms of energy, making you more resistant to Fire, Cold, Energy, and Negative Energy attacks, as well as Endurance Drain effects.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +Res(Fire, Cold, Energy, Negative, End Drain)",
+            icon: "darkarmor_defractingcloud.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.104,
+                cast: 1.17,
+                resistance: {
+                    fire: 0.22499999999999998,
+                    cold: 0.22499999999999998,
+                    energy: 0.15,
+                    negative: 0.15
+                },
+                debuffResistance: {
+                    recovery: 0.692,
+                    endurance: 0.692
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Shadow Dweller",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Defense Sets", "Healing"],
+            description: "You are a true Shadow Dweller of the Netherworld. Your affinity for the shadows grants you an inherent bonus to all Defense, as well as an increased regeneration, Perception and a resistance to Immobilization. Your Perception bonus and resistance to Immobilization improves over level. Shadow Dweller is an Auto power. It is always on and costs no Endurance.",
+            shortHelp: "Auto: Self +Regen, +DEF(All), +Res(Immobilize), +Perception",
+            icon: "darkarmor_selfbuffdefense.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                protection: {
+                    immobilize: 4.0
+                },
+                defense: {
+                    smashing: 0.01875,
+                    lethal: 0.01875,
+                    fire: 0.01875,
+                    cold: 0.01875,
+                    energy: 0.01875,
+                    negative: 0.01875
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Obsidian Shield",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You can create a special Obsidian Shield that grants good resistance to Psionic damage. With your mind enshrouded in darkness you are protected from Sleep, Fear, Hold and Disorient attacks.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +Res(Psionic, Sleep, Hold, Disorient, Fear)",
+            icon: "darkarmor_obsidianshield.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 1.17,
+                protection: {
+                    hold: 10.379999999999999,
+                    stun: 10.379999999999999,
+                    sleep: 10.379999999999999,
+                    fear: 10.379999999999999
+                },
+                resistance: {
+                    psionic: 0.375
+                },
+                debuffResistance: {
+                    tohit: 0.3,
+                    defense: 0.3,
+                    recharge: 0.3,
+                    movement: 0.5
+                },
+                buffDuration: 0.75,
+                stun: 1.0,
+                stunDuration: 0.75,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Dark Regeneration",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Healing", "Melee AoE Damage", "Universal Damage Sets"],
+            description: "You can tap the dark essence of the Netherworld to drain a small amount of life from all enemies nearby, thus healing yourself. The more foes affected, the more you will be healed.<br><br>This power is mutually exclusive from Obscure Sustenance.",
+            shortHelp: "PBAoE DMG(Negative), Self +HP",
+            icon: "darkarmor_darkregeneration.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 30.0,
+                endurance: 33.8,
+                cast: 1.17,
+                damage: {
+                    type: "Negative",
+                    scale: 0.2
+                },
+                healing: {
+                    scale: 361.42769999999996,
+                    perTarget: true
+                }
+            }
+        },
+        {
+            name: "Obscure Sustenance",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You can tap the dark essence of the Netherworld increase your regeneration and recovery rate, as well as making you resistance to -ToHit and -Regeneration debuffs.<br><br>This power is mutually exclusive from Dark Regeneration.",
+            shortHelp: "Self Heal, +Regen, Res(-ToHit, -Regeneration), +Recovery(Special)",
+            icon: "darkarmor_darkregeneration.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 2.0,
+                recharge: 60.0,
+                endurance: 10.4,
+                cast: 1.93,
+                debuffResistance: {
+                    tohit: 0.25949999999999995,
+                    regeneration: 0.25949999999999995
+                },
+                healing: {
+                    scale: 301.18975,
+                    perTarget: true
+                },
+                buffDuration: 10.0,
+                tohitBuff: 0.75
+            }
+        },
+        {
+            name: "Cloak of Fear",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Fear", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Fear", "To Hit Debuff"],
+            description: "You can wrap yourself in a nightmarish Cloak of Fear. Foes close to you are treated to visions most horrific, lowering their damage ouptupt and forcing them to tremble in terror, only attacking if attacked, and even then, with a reduced chance to hit. Feeding on your enemies fear will increase your protection against knockback effects.<br><br><color #fcfc95>Notes: Mez enhancements on this power enhance its magnitude instead of its duration.</color>",
+            shortHelp: "Toggle: PBAoE Self +Res(Knockback), Foe Fear, -ACC",
+            icon: "darkarmor_fearfulaura.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 0.8,
+                recharge: 4.0,
+                endurance: 0.26,
+                cast: 1.17
+            }
+        },
+        {
+            name: "Oppressive Gloom",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Stuns"],
+            description: "The Netherworld has many mutable properties, such as the Oppressive Gloom. This power allows you to use your own Hit Points to keep enemies near you Disoriented and unable to use any powers. Endurance cost for this is minimal, but the power can be dangerous to use.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: PBAoE, Foe Disorient, Self -HP",
+            icon: "darkarmor_oppressivegloom.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 8.0,
+                endurance: 0.156,
+                cast: 1.17,
+                stun: 2.0
+            }
+        },
+        {
+            name: "Soul Transfer",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Endurance Modification", "Healing", "Melee AoE Damage", "Stuns", "Universal Damage Sets"],
+            description: "You transfer the souls of nearby enemies into yourself, stunning them while making you able to absorb some damage. This will also make you resistant to control effects, -ToHit debuffs and endurance drain for a short time. You can use this power while concious or after defeat. If used while concious and are defeated soon after, you will automatically bounce back into the fight. If used after defeat, Soul Transfer will also inflict damage as you suck the life force of all foes around you and bring yourself back from the brink of death. This form of the power is much more likely to stun foes.<br><br><color #fcfc95>Notes: This power recharges in <color #FF7F27>10</color> seconds if no foes are hit. Otherwise, it recharges in <color #FF7F27>300</color> seconds.</color>",
+            shortHelp: "Self Rez, +Absorb, +Res(Disorient, Sleep, Hold, Immobilize, Knockback, -ToHit, -Endurance), +Special, Foe Disorient",
+            icon: "darkarmor_soultransfer.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 10.4,
+                cast: 1.17
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/dark-armor'] = STALKER_DARK_ARMOR_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_DARK_ARMOR_POWERSET = STALKER_DARK_ARMOR_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/dark-melee.js ----
+;/**
+ * Dark Melee
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_DARK_MELEE_POWERSET = {
+    name: "Dark Melee",
+    category: "Unknown",
+    description: "Dark Melee powerset",
+    icon: "dark-melee_set.png",
+    powers: [
+        {
+            name: "Shadow Punch",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Melee Damage", "Stalker Archetype Sets", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You wrap your fists with Negative Energy channeled from the Netherworlds, then perform a quick punch that deals minor damage. Shadow Punches cloud the target's vision, lowering their chance to hit for a short time.",
+            shortHelp: "Melee, DMG(Smash/Negative), Foe -To Hit",
+            icon: "shadowfighting_shadowpunch.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 0.83,
+                damage: {
+                    types: [
+                        {
+                            type: "Negative",
+                            scale: 1.1606
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.7804
+                        }
+                    ],
+                    scale: 1.941
+                },
+                tohitDebuff: 0.75,
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Smite",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Melee Damage", "Stalker Archetype Sets", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You wrap your fists with Negative Energy channeled from the Netherworlds, then perform a Smite that deals more damage than Shadow Punch, but has a longer recharge time. Smite clouds the target's vision, lowering their chance to hit for a short time.",
+            shortHelp: "Melee, DMG(Smash/Negative), Foe -To Hit",
+            icon: "shadowfighting_smite.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 0.97,
+                damage: {
+                    types: [
+                        {
+                            type: "Negative",
+                            scale: 1.9891999999999999
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.6496999999999999
+                        }
+                    ],
+                    scale: 2.6388999999999996
+                },
+                tohitDebuff: 0.75,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Shadow Maul",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Melee AoE Damage", "Stalker Archetype Sets", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You wrap your entire arms with Negative Energy channeled from the Netherworlds, then perform a series of blows that deal a lot of damage over a short period of time to multiple targets in front of you. These blows cloud your target's vision, lowering their chance to hit for a short time.",
+            shortHelp: "Melee (Cone), DoT(Smash/Negative), Foe -To Hit",
+            icon: "shadowfighting_shadowmaul.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 2.0944,
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 11.0,
+                endurance: 11.024,
+                cast: 2.37,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 0.44079999999999997,
+                            ticks: 3
+                        },
+                        {
+                            type: "Negative",
+                            scale: 0.44079999999999997,
+                            ticks: 3
+                        }
+                    ]
+                },
+                buffDuration: 2.0,
+                tohitDebuff: 0.75
+            }
+        },
+        {
+            name: "Assassin's Eclipse",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "A signature Stalker attack. This attack does superior smashing and negative damage on its own as a frontal attack and cannot be interrupted. However, if it is executed while you are Hidden, this attack will do tremendous damage, as you waylay your unsuspecting foe. This attack may be interrupted if you move or are attacked while executing this power and are hidden. Using this power while not hidden has a chance to critically hit equal to 33.3% times the number of stacks of Assassin's Focus. Using Assassin's Strike when not hidden will remove all stacks of Assassin's Focus regardless if you critically hit or not.",
+            shortHelp: "Melee, DMG(Smashing, Negative)",
+            icon: "shadowfighting_assassinstrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 3.0
+            }
+        },
+        {
+            name: "Build Up",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your chance to hit.",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "shadowfighting_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Placate",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Allows you to trick a foe to no longer attack you. A Successful Placate will also Hide you. This Hide is very brief, and offers no Defense bonus, but it will allow you to deliver a Critical Hit or an Assassins Blow. However, if you attack a Placated Foe, he will be able to attack you back.",
+            shortHelp: "Ranged, Foe Placate, Self Stealth/Hide",
+            icon: "shadowfighting_placate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                cast: 0.8,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Siphon Life",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Accurate To-Hit Debuff", "Healing", "Melee Damage", "Stalker Archetype Sets", "To Hit Debuff", "Universal Damage Sets"],
+            description: "You tap the power of the Netherworld and create a life transferring conduit between a foe and yourself. This will transfer Hit Points from your enemy to yourself. Foes Siphoned in this manner have their chance to hit reduced.",
+            shortHelp: "Melee, DMG(Negative), Foe -To Hit, Self +HP",
+            icon: "shadowfighting_siphonlife.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.93,
+                damage: {
+                    type: "Negative",
+                    scale: 4.1109
+                },
+                healing: {
+                    scale: 120.4759,
+                    perTarget: true
+                },
+                tohitDebuff: 0.75,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Touch of Fear",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Fear", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Fear", "Melee AoE Damage", "Stalker Archetype Sets", "To Hit Debuff", "Universal Damage Sets"],
+            description: "The Netherworld is one scary place, and with but a touch, you can give your enemy a glimpse into this dark world. This will cause them to helplessly tremble in Fear. Foes in this state of panic have their chance to hit reduced.",
+            shortHelp: "Melee (Targeted AoE), DMG(Negative), Fear, Foe -To Hit",
+            icon: "shadowfighting_touchoffearaoe.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.97
+            }
+        },
+        {
+            name: "Midnight Grasp",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Immobilize", "Melee Damage", "Stalker Archetype Sets", "To Hit Debuff", "Universal Damage Sets"],
+            description: "Mastery over the forces of the Netherworld allows you to create dark tentacles that can Immobilize a foe and continuously drain their life force as well as reducing their chance to hit.",
+            shortHelp: "Melee, DMG(Negative), Foe Immobilize, -To Hit",
+            icon: "shadowfighting_midnightgrasp.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 15.0,
+                endurance: 11.96,
+                cast: 2.07,
+                damage: {
+                    type: "Negative",
+                    scale: 4.1167
+                },
+                dotDamage: {
+                    type: "Negative",
+                    scale: 0.11,
+                    ticks: 4
+                },
+                tohitDebuff: 0.75,
+                buffDuration: 20.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/dark-melee'] = STALKER_DARK_MELEE_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_DARK_MELEE_POWERSET = STALKER_DARK_MELEE_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/dual-blades.js ----
+;/**
+ * Dual Blades
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_DUAL_BLADES_POWERSET = {
+    name: "Dual Blades",
+    category: "Unknown",
+    description: "Dual Blades powerset",
+    icon: "dual-blades_set.png",
+    powers: [
+        {
+            name: "Nimble Slash",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "A quick swipe with your blades. Does minor lethal damage, but has a quick recharge rate. This attack is needed for the Attack Vitals combination attack.<br><br><color #ff7f00>Attack Vitals: Power Slice > Nimble Slash > Vengeful Slice.</color>",
+            shortHelp: "Melee, Light DMG(Lethal)",
+            icon: "dualblades_lightopening.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 1.03,
+                dotDamage: {
+                    type: "Lethal",
+                    scale: 1.0405,
+                    ticks: 1
+                },
+                buffDuration: 0.5
+            }
+        },
+        {
+            name: "Power Slice",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You perform a deadly Strike with your blades. This is a basic attack that deals a moderate amount of lethal damage. This power begins the Attack Vitals combination attack and is needed for the Weaken combination attack.<br><br><color #ff7f00>Attack Vitals: Power Slice > Nimble Slash > Vengeful Slice.</color><br><color #ff7f00>Weaken: Sweeping Strike > Power Slice > One Thousand Cuts.</color>",
+            shortHelp: "Melee, Light DMG(Lethal)",
+            icon: "dualblades_moderateopening.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 5.0,
+                endurance: 6.032,
+                cast: 1.4,
+                dotDamage: {
+                    type: "Lethal",
+                    scale: 0.9128000000000001,
+                    ticks: 2
+                },
+                buffDuration: 1.0
+            }
+        },
+        {
+            name: "Ablating Strike",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You Slash at your foe with your blades, dealing a good amount of lethal damage. This attack can reduce a target's Defense, making them easier to hit. This power is the finishing move of the Sweep combination attack.<br><br><color #ff7f00>Sweep: Build Up > Assassin’s Blades > Ablating Strike.</color>",
+            shortHelp: "Melee, DMG(Lethal), Foe -DEF",
+            icon: "dualblades_moderatebridge.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.03,
+                dotDamage: {
+                    type: "Lethal",
+                    scale: 1.3405,
+                    ticks: 1
+                },
+                buffDuration: 0.6,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Assassin's Blades",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "A signature Stalker attack. This attack does superior lethal damage on its own as a frontal attack and cannot be interrupted. However, if it is executed while you are Hidden, this attack will do tremendous lethal damage, as you impale your unsuspecting foe. This attack may be interrupted if you move or are attacked while executing this power and are hidden. Using this power while not hidden has a chance to critically hit equal to 33.3% times the number of stacks of Assassin's Focus. This power is needed for the Empower and Sweep combination attacks. Using Assassin's Strike when not hidden will remove all stacks of Assassin's Focus regardless if you critically hit or not.<br><br><color #ff7f00>Empower: Build Up > Assassin’s Blades > Placate.</color><br><color #ff7f00>Sweep: Build Up > Assassin’s Blades > Ablating Strike.</color>",
+            shortHelp: "Melee, DMG(Lethal)",
+            icon: "dualblades_assassinblades.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 3.0
+            }
+        },
+        {
+            name: "Build Up",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your chance to hit. This power is the opening move for the Empower and Sweep combination attacks.<br><br><color #ff7f00>Empower: Build Up > Assassin’s Blades > Placate.</color><br><color #ff7f00>Sweep: Build Up > Assassin’s Blades > Ablating Strike.</color>",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "dualblades_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Placate",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Allows you to trick a foe to no longer attack you. A successful Placate will also Hide you. This Hide is very brief, and offers no Defense bonus, but it will allow you to deliver a Critical Hit or Assassination. However, if you attack a Placated Foe, he will be able to attack you back. This power is the finishing move in the Empower combination attack.<br><br><color #ff7f00>Empower: Build Up > Assassin’s Blades > Placate.</color>",
+            shortHelp: "Ranged, Foe Placate, Self Stealth/Hide",
+            icon: "dualblades_placate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                cast: 0.8,
+                buffDuration: 10.0,
+                tohitBuff: 1.0
+            }
+        },
+        {
+            name: "Vengeful Slice",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "Unleashes a series of strong attacks on your foe, dealing high lethal damage and knocking them down. This power is the finishing move for the Attack Vitals combination attack.<br><br><color #ff7f00>Attack Vitals: Power Slice > Nimble Slash > Vengeful Slice.</color>",
+            shortHelp: "Melee, DMG(Lethal), Knockdown",
+            icon: "dualblades_special1.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 2.43,
+                damage: {
+                    type: "Lethal",
+                    scale: 4.0607999999999995
+                },
+                dotDamage: {
+                    type: "Lethal",
+                    scale: 0.2,
+                    ticks: 4
+                },
+                buffDuration: 4.1
+            }
+        },
+        {
+            name: "Sweeping Strike",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee AoE Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You make a sweeping strike with your blades, hitting all foes in a cone in front of you and dealing moderate lethal damage to each. This power is the opening move for the Weaken combination attack.<br><br><color #ff7f00>Weaken: Sweeping Strike > Power Slice > One Thousand Cuts.</color>",
+            shortHelp: "Melee (Cone), DMG(Lethal)",
+            icon: "dualblades_special2.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 11.0,
+                endurance: 11.024,
+                cast: 1.23,
+                damage: {
+                    type: "Lethal",
+                    scale: 3.0553999999999997
+                }
+            }
+        },
+        {
+            name: "One Thousand Cuts",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee AoE Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "Unleashes a flurry of attacks on all foes in a cone in front of you, dealing moderate lethal damage to each foe hit. This power is the finishing move for the Weaken combination attack.<br><br><color #ff7f00>Weaken: Sweeping Strike > Power Slice > One Thousand Cuts.</color>",
+            shortHelp: "Melee (Cone), DMG(Lethal), Foe Knockback",
+            icon: "dualblades_highlow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.0,
+                range: 10.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 3.3,
+                damage: {
+                    type: "Lethal",
+                    scale: 1.1702
+                },
+                dotDamage: {
+                    type: "Lethal",
+                    scale: 0.322,
+                    ticks: 10
+                },
+                buffDuration: 2.05,
+                defenseDebuff: 1.0,
+                tohitDebuff: 1.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/dual-blades'] = STALKER_DUAL_BLADES_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_DUAL_BLADES_POWERSET = STALKER_DUAL_BLADES_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/electric-armor.js ----
+;/**
+ * Electric Armor
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_ELECTRIC_ARMOR_POWERSET = {
+    name: "Electric Armor",
+    category: "Unknown",
+    description: "Electric Armor powerset",
+    icon: "electric-armor_set.png",
+    powers: [
+        {
+            name: "Charged Armor",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "When you toggle on this power, you are surrounded in a charged field that makes you highly resistant to Smashing, Lethal and Energy damage.",
+            shortHelp: "Toggle: Self +Res(Smash, Lethal, Energy)",
+            icon: "electricarmor_selfbuffdefensephysical.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.67,
+                resistance: {
+                    smashing: 0.2625,
+                    lethal: 0.2625,
+                    energy: 0.2625
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Hide",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Hide makes you almost impossible to detect. When properly 'Hidden\", a Stalker can pull off Critical hits with his attacks, and even land a massive 'Assassin's Strike' with an Assassin's power. When you attack or are damaged while using this power, you will be discovered. Even if discovered, you are hard to see and retain some bonus to Defense. Unlike most stealth powers, Hide can be used at the same time as other Concealment powers, giving you even greater stealth capability. No Endurance cost.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Toggle: Self Stealth, +DEF(Melee, Ranged, AoE)",
+            icon: "electricarmor_hide.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                cast: 0.73,
+                defense: {
+                    smashing: 0.0375,
+                    lethal: 0.0375,
+                    fire: 0.0375,
+                    cold: 0.0375,
+                    energy: 0.0375,
+                    negative: 0.0375,
+                    psionic: 0.0375,
+                    toxic: 0.0375
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Conductive Shield",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "When you toggle on this power, you are surrounded in a Conductive Shield that will conduct many sorts of energy away from your body. Conductive Shield grants high resistant to Fire, Cold, and Energy damage, as well as good resistance to Negative Energy damage.",
+            shortHelp: "Toggle: Self +Res(Fire, Cold, Energy, Negative)",
+            icon: "electricarmor_selfresistelements.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.67,
+                resistance: {
+                    fire: 0.2625,
+                    cold: 0.2625,
+                    energy: 0.2625,
+                    negative: 0.15
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Static Shield",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You can create a field of Static Electricity around your body. This Static Shield protects you from Hold, Sleep, and Disorient effects as well as Endurance Drain, Recovery DeBuffs and enemy Teleportation. Static Shield can also help normalize your synaptic activity, granting you good resistance to Psionic Damage.",
+            shortHelp: "Toggle: Self +Res(Hold, Sleep, Disorient, End Drain, Recovery DeBuff, Psionic, Toxic, Teleport)",
+            icon: "electricarmor_selfresistmez.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 1.17
+            }
+        },
+        {
+            name: "Grounded",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You are Grounded and naturally very resistant to Energy and Negative Energy damage. You also have added resistance to Endurance Drain effects. Additionally, Grounded provides Immobilize, Knockback protection and the Grounded status, but only for up to 10 seconds after being near the ground. This power is always on and costs no Endurance.",
+            shortHelp: "Auto: Self +Res (All DMG but Toxic and Psionics, End Drain, Immobilize, KB)",
+            icon: "electricarmor_selfresistenergies.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0
+            }
+        },
+        {
+            name: "Lightning Reflexes",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "Your Lightning Reflexes allow you to move faster than normal, as well as resist slow effects. This power is always on and permanently increases your attack rate and movement speed.",
+            shortHelp: "Auto: Self +Recharge, +SPD, Res (Slow)",
+            icon: "electricarmor_selfbuffrunspeed.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                debuffResistance: {
+                    recharge: 0.4,
+                    movement: 0.4
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Energize",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You can channel a tremendous amount of electricity through your body for a short period of time. Doing so will heal some hit points, reduce the endurance cost of your powers and boost your regeneration for a short time.",
+            shortHelp: "Self Endurance Discount, Heal, +Regen",
+            icon: "electricarmor_energize.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 120.0,
+                endurance: 10.4,
+                cast: 1.17,
+                healing: {
+                    scale: 301.18975,
+                    perTarget: true
+                },
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Power Sink",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "Power Sink leeches energy directly from the bodies of all nearby foes, draining their Endurance. Each foe you draw energy from increases your Endurance and regeneration rate. If there are no foes within range, you will not gain any Endurance.",
+            shortHelp: "PBAoE, Self +End, +Regen, Foe -End",
+            icon: "electricarmor_pbaoeregendrain.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 60.0,
+                endurance: 13.0,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Power Surge",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Healing", "Holds", "Resist Damage"],
+            description: "When you activate this power, you transform your body into living Electricity and become extremely resistant to all damage but Psionics, as well as Disorient, Sleep, Hold, Immobilize, Knockback, End Drain, Recovery DeBuff, and enemy Teleportation. Your Regeneration rate and Endurance recovery are also increased. As Power Surge wears off, the charge in your body explodes in a massive EMP pulse.",
+            shortHelp: "Self +Res(All DMG, but Psionics), +Res(Knockback, Repel, Disorient, Hold, Immobilize, Sleep), +Regen, +Recovery, +Special",
+            icon: "electricarmor_selfbuffdefense.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 350.0,
+                endurance: 2.6,
+                cast: 1.96
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/electric-armor'] = STALKER_ELECTRIC_ARMOR_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_ELECTRIC_ARMOR_POWERSET = STALKER_ELECTRIC_ARMOR_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/electrical-melee.js ----
+;/**
+ * Electrical Melee
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_ELECTRICAL_MELEE_POWERSET = {
+    name: "Electrical Melee",
+    category: "Unknown",
+    description: "Electrical Melee powerset",
+    icon: "electrical-melee_set.png",
+    powers: [
+        {
+            name: "Charged Brawl",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Melee Damage", "Sleep", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "Your fists become electrically charged and deliver a powerful punch. Charged Brawl can drain some Endurance from the target and may overload their synapses, leaving them writhing for a moment. A portion of drained Endurance may be returned to you. Disturbing an overloaded target will disperse the electrical charge and release him.",
+            shortHelp: "Melee, DMG(Smash/Energy), Target Sleep, -End",
+            icon: "electricmelee_targetedminordmg.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 0.83,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 1.1606
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.7804
+                        }
+                    ],
+                    scale: 1.941
+                },
+                buffDuration: 2.0
+            }
+        },
+        {
+            name: "Havoc Punch",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Melee Damage", "Sleep", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "The Havoc Punch is a slower attack than Charged Brawl, but makes up for it with a greater damage. Havoc Punch can drain some Endurance from your target and may overload their synapses, leaving them writhing for a moment. A portion of the drained Endurance may be given back to you. Disturbing an overloaded target will disperse the electrical charge and release him.",
+            shortHelp: "Melee, DMG(Smash/Energy), Foe Sleep, -End",
+            icon: "electricmelee_targetedmoderatedmg.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.5,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 1.814
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.1960000000000002
+                        }
+                    ],
+                    scale: 3.0100000000000002
+                },
+                buffDuration: 4.0
+            }
+        },
+        {
+            name: "Jacobs Ladder",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Melee AoE Damage", "Sleep", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You are able to generate a strong current between your arms and snap a powerful bolt of electricity in an arc in front of you. This melee attack can electrocute all foes within the arc dealing High energy damage. Jacobs Ladder can drain some Endurance from your target and may overload their synapses, leaving them writhing for a moment. Disturbing an overloaded target will disperse the electrical charge and release him.",
+            shortHelp: "Melee (Cone), DMG(Energy), Foe Sleep, -End",
+            icon: "electricmelee_conemoderatedmg.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 0.8727,
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                damage: {
+                    type: "Energy",
+                    scale: 3.0986000000000002
+                },
+                buffDuration: 2.0
+            }
+        },
+        {
+            name: "Assassin's Shock",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "A signature Stalker attack. This attack does superior energy and smashing damage on its own as a frontal attack and cannot be interrupted. However, if it is executed while you are Hidden, this attack will do tremendous damage, as you waylay your unsuspecting foe. This attack may be interrupted if you move or are attacked while executing this power and are hidden. Using this power while not hidden has a chance to critically hit equal to 33.3% times the number of stacks of Assassin's Focus. Using Assassin's Strike when not hidden will remove all stacks of Assassin's Focus regardless if you critically hit or not.",
+            shortHelp: "Melee, DMG(Energy)",
+            icon: "electricmelee_assassinstrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 3.0
+            }
+        },
+        {
+            name: "Build Up",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your chance to hit.",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "electricmelee_selfbuffdmg.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Placate",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Allows you to trick a foe to no longer attack you. A Successful Placate will also Hide you. This Hide is very brief, and offers no Defense bonus, but it will allow you to deliver a Critical Hit or an Assassins Strike. However, if you attack a Placated Foe, he will be able to attack you back.",
+            shortHelp: "Ranged, Foe Placate, Self Stealth/Hide",
+            icon: "electricmelee_placate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                cast: 0.8,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Chain Induction",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "This Electric Melee attack deals moderate Smashing and Energy damage and may drain some of the targets Endurance. However, this attack also induces an unstable electric charge that may jump to another enemy target. The charge will jump to the closest enemy in range that has not been previously hit, until it inevitably dissipates. Enhancements will boost the effectiveness of the initial attack as well as the jumping charge.",
+            shortHelp: "Melee, DMG(Energy), Foe -End +Special",
+            icon: "electricmelee_targetedchaininduction.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 14.0,
+                endurance: 10.192,
+                cast: 1.0,
+                damage: {
+                    type: "Energy",
+                    scale: 2.98
+                },
+                buffDuration: 2.0
+            }
+        },
+        {
+            name: "Thunder Strike",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee AoE Damage", "Stalker Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "A massive attack. You smash your foes with all the power of a lightning bolt. The pummeled victim takes tremendous damage and may be Disoriented. Any nearby foes may be knocked down and take some damage from the shockwave as well as have some endurance drained.",
+            shortHelp: "Melee (AoE), DMG(Energy), Foe Disorient, Knockback, -End",
+            icon: "electricmelee_targetedaoeheavydmg.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 2.53
+            }
+        },
+        {
+            name: "Lightning Rod",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee AoE Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You can polarize your body and become a living Lightning Rod. This power calls forth a massive lightning bolt from the sky to strike you. You can then ride this bolt and instantly Teleport a short distance. You rematerialize in a massive bolt of electricity, dealing massive damage and knocking down all nearby foes. Damage from the lightning bolt is superior.",
+            shortHelp: "PBAoE, Foe Knockback; Self Teleport;",
+            icon: "electricmelee_pbaoeteleport.png",
+            powerType: "Click",
+            targetType: "Location (Teleport)",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 90.0,
+                endurance: 13.52,
+                cast: 2.57,
+                buffDuration: 4.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/electrical-melee'] = STALKER_ELECTRICAL_MELEE_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_ELECTRICAL_MELEE_POWERSET = STALKER_ELECTRICAL_MELEE_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/energy-aura.js ----
+;/**
+ * Energy Aura
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_ENERGY_AURA_POWERSET = {
+    name: "Energy Aura",
+    category: "Unknown",
+    description: "Energy Aura powerset",
+    icon: "energy-aura_set.png",
+    powers: [
+        {
+            name: "Hide",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Hide makes you almost impossible to detect. When properly 'Hidden\", a Stalker can pull off Critical hits with his attacks, and even land a massive 'Assassin's Strike' with an Assassin's power. When you attack or are damaged while using this power, you will be discovered. Even if discovered, you are hard to see and retain some bonus to Defense. Unlike most stealth powers, Hide can be used at the same time as other Concealment powers, giving you even greater stealth capability. No Endurance cost.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Toggle: Self Stealth, +DEF(Melee, Ranged, AoE)",
+            icon: "energyaura_cloak.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                cast: 0.73,
+                defense: {
+                    smashing: 0.0375,
+                    lethal: 0.0375,
+                    fire: 0.0375,
+                    cold: 0.0375,
+                    energy: 0.0375,
+                    negative: 0.0375,
+                    psionic: 0.0375,
+                    toxic: 0.0375
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Kinetic Shield",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Kinetic Shield creates a harmonic Energy Aura that can deflect physical attacks. Your Defense to Smashing and Lethal attacks is increased as weapons and powers like bullets, blades and punches tend to deflect off the shield. Kinetic Shield also grants you good resistance to Defense Debuffs. The Energy based nature of Kinetic Shield also offers some minimal Defense to Energy attacks. Kinetic Shield also adds an Elusivity defense bonus to Smashing, Lethal, and Energy Attacks in PVP zones.",
+            shortHelp: "Toggle: Self +DEF(Smashing, Lethal, Energy), Res(DeBuff DEF)",
+            icon: "energyaura_kineticshield.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.13,
+                cast: 0.73,
+                defense: {
+                    smashing: 0.165,
+                    lethal: 0.165,
+                    energy: 0.02625
+                },
+                debuffResistance: {
+                    defense: 0.173
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Power Shield",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "This Power Shield creates a Electro-Magnetic shield around you that can deflect non-physical attacks. Your Defense to Fire, Cold, Energy and Negative Energy attacks is increased as these attacks are reflected or refracted off the shield. Power Shield also grants you good resistance to Defense Debuffs. Power Shield also adds Psionic Defense and an Elusivity defense bonus to Fire, Cold, Energy and Psionic Attacks in PVP zones.",
+            shortHelp: "Toggle: Self +DEF(Fire, Cold, Energy, Negative), Res(DeBuff DEF)",
+            icon: "energyaura_powershield.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.13,
+                cast: 1.67,
+                defense: {
+                    fire: 0.165,
+                    cold: 0.165,
+                    energy: 0.165,
+                    psionic: 0.165,
+                    negative: 0.1275
+                },
+                debuffResistance: {
+                    defense: 0.173
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Entropy Shield",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "Entropy Shield diminishes and dampens the energy of controlling type effects. The shield makes you resistant to Knockback, Repel, Disorient, Hold, Sleep, Immobilization, and enemy Teleportation for as long as you can keep this toggle power active. Entropy Shield also grants you good resistance to Defense Debuffs. Additionally, this power grants the user a moderate recharge bonus while active and resistance to endurance drain effects.",
+            shortHelp: "Toggle: Self +Res(Knockback, Repel, Disorient, Hold, Sleep, Immobilize, Teleport, DeBuff DEF), +Rech",
+            icon: "energyaura_entropy.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.13,
+                cast: 0.73,
+                protection: {
+                    hold: 10.379999999999999,
+                    stun: 10.379999999999999,
+                    sleep: 10.379999999999999,
+                    immobilize: 10.379999999999999
+                },
+                debuffResistance: {
+                    defense: 0.3,
+                    tohit: 0.3,
+                    recharge: 0.3,
+                    movement: 0.5
+                },
+                buffDuration: 0.75,
+                stun: 1.0,
+                stunDuration: 0.75,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Kinetic Dampening",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "Your ability to channel energy makes you naturally resistant to Energy, Negative Energy, Lethal, Smashing and Toxic damage. Additionally, the user gains a moderate level of resistance to slow effects. This power is always on and costs no Endurance.",
+            shortHelp: "Auto: Self +Res (Energy, Negative, Toxic, Lethal, Smashing, Slow)",
+            icon: "energyaura_protection.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 1.5,
+                            ticks: 5
+                        },
+                        {
+                            type: "Negative",
+                            scale: 1.25,
+                            ticks: 5
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 1.25,
+                            ticks: 5
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.0,
+                            ticks: 5
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 1.0,
+                            ticks: 5
+                        }
+                    ]
+                },
+                resistance: {
+                    energy: 0.11249999999999999,
+                    negative: 0.09375,
+                    toxic: 0.09375,
+                    smashing: 0.075,
+                    lethal: 0.075
+                },
+                debuffResistance: {
+                    recharge: 0.2,
+                    movement: 0.2
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Disrupt",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Stuns"],
+            description: "This Toggle power creates a field that periodically sends out waves of intense energy that overload nearby enemy senses leaving them briefly stunned. Disrupt drains a small amount of endurance for each foe it attempts to stun.",
+            shortHelp: "Toggle: PBAoE, Foe Disorient",
+            icon: "energyaura_disrupt.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                recharge: 8.0,
+                endurance: 0.78,
+                cast: 1.67,
+                stun: 2.0
+            }
+        },
+        {
+            name: "Energy Drain",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Endurance Modification"],
+            description: "Energy Drain leeches energy directly from the bodies of all nearby foes, draining their Endurance. Each foe you draw energy from increases your Endurance and Defense. If there are no foes within range, you will not gain any Endurance or Defense.",
+            shortHelp: "PBAoE, Self +End, +Def, Foe -End",
+            icon: "energyaura_drain.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 60.0,
+                endurance: 13.0,
+                cast: 2.37
+            }
+        },
+        {
+            name: "Energize",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You can channel a tremendous amount of energy through your body for a short period of time. Doing so will heal some hit points, reduce the endurance cost of your powers and boost your regeneration for a short time.",
+            shortHelp: "Self Endurance Discount, Heal, +Regen",
+            icon: "energyaura_energize.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 120.0,
+                endurance: 10.4,
+                cast: 1.17,
+                healing: {
+                    scale: 301.18975,
+                    perTarget: true
+                },
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Overload",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Endurance Modification", "Healing"],
+            description: "You can Overload your Energy Aura and dramatically improve your defense to all attack types. Overload also grants you high resistance to Defense Debuffs. This Energy Aura is so powerful, that it can even absorb some damage, effectively increasing your Max Hit Points. However, when Overload wears off, you are left drained of all Endurance and unable to recover Endurance for a while. Overload also adds a moderate Elusivity defense bonus to all attacks in PVP zones.",
+            shortHelp: "Self +DEF(All), +Recovery, +Max HP, Res(DeBuff DEF), +Special",
+            icon: "energyaura_overload.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 1000.0,
+                endurance: 2.6,
+                cast: 3.0,
+                defense: {
+                    smashing: 0.44999999999999996,
+                    lethal: 0.44999999999999996,
+                    fire: 0.44999999999999996,
+                    cold: 0.44999999999999996,
+                    energy: 0.44999999999999996,
+                    negative: 0.44999999999999996,
+                    psionic: 0.33749999999999997,
+                    toxic: 0.33749999999999997
+                },
+                debuffResistance: {
+                    defense: 0.346
+                },
+                buffDuration: 180.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/energy-aura'] = STALKER_ENERGY_AURA_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_ENERGY_AURA_POWERSET = STALKER_ENERGY_AURA_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/energy-melee.js ----
+;/**
+ * Energy Melee
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_ENERGY_MELEE_POWERSET = {
+    name: "Energy Melee",
+    category: "Unknown",
+    description: "Energy Melee powerset",
+    icon: "energy-melee_set.png",
+    powers: [
+        {
+            name: "Barrage",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "You perform a quick punch that deals moderate damage. Coupled with other energy punches, Barrage can Disorient a foe. This power will have a 100% chance to stun and weaken the target's secondary effects and regeneration rate if used while in Energy Focus mode.",
+            shortHelp: "Melee, DMG(Smash/Energy), Foe Disorient, Special",
+            icon: "powerpunch_quick.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.33,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 0.9713,
+                            ticks: 1
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.47419999999999995,
+                            ticks: 1
+                        }
+                    ]
+                },
+                buffDuration: 0.3
+            }
+        },
+        {
+            name: "Energy Punch",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "You perform a powerful Energy Punch that deals moderate damage. When used with other Energy Melee attacks, Energy Punch can Disorient your opponent.",
+            shortHelp: "Melee, DMG(Smash/Energy), Foe Disorient",
+            icon: "powerpunch_energypunch.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 5.0,
+                endurance: 6.032,
+                cast: 0.83,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 1.6387
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.7022999999999999
+                        }
+                    ],
+                    scale: 2.341
+                }
+            }
+        },
+        {
+            name: "Bone Smasher",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "This melee attack deals a good amount of damage and has a good chance to Disorient the target.",
+            shortHelp: "Melee, DMG(Smash/Energy), Disorient",
+            icon: "powerpunch_bonesmasher.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.27,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 1.9654
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.2835999999999999
+                        }
+                    ],
+                    scale: 3.2489999999999997
+                }
+            }
+        },
+        {
+            name: "Assassin's Strike",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "A signature Stalker attack. This attack does superior energy and smashing damage on its own as a frontal attack and cannot be interrupted. However, if it is executed while you are Hidden, this attack will do tremendous damage, as you waylay your unsuspecting foe. This attack may be interrupted if you move or are attacked while executing this power and are hidden. Using this power while not hidden has a chance to critically hit equal to 33.3% times the number of stacks of Assassin's Focus. Using Assassin's Strike when not hidden will remove all stacks of Assassin's Focus regardless if you critically hit or not.",
+            shortHelp: "Melee, DMG(Smash/Energy)",
+            icon: "powerpunch_assassinstrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 3.0
+            }
+        },
+        {
+            name: "Build Up",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your chance to hit.",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "powerpunch_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Placate",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Allows you to trick a foe to no longer attack you. A Successful Placate will also Hide you. This Hide is very brief, and offers no Defense bonus, but it will allow you to deliver a Critical Hit or an Assassins Strike. However, if you attack a Placated Foe, he will be able to attack you back.",
+            shortHelp: "Ranged, Foe Placate, Self Stealth/Hide",
+            icon: "powerpunch_placate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                cast: 0.8,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Power Crash",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee AoE Damage", "Stalker Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "You focus your internal energy on your fists and release it once you hit your target unleashing an energy wave that hurts and disorients multiple enemies. This power will hit up to 5 additional foes if used while in Energy Focus mode.<br><br><color #fcfc95>Notes: Power Crash is unaffected by Arc changes.</color>",
+            shortHelp: "Melee (Cone), DMG(Smash/Energy), Foe Disorient, Special",
+            icon: "powerpunch_powercrash.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 2.0944,
+            effects: {
+                accuracy: 1.0,
+                range: 10.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.8,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 2.0237
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.4655
+                        }
+                    ],
+                    scale: 3.4892
+                }
+            }
+        },
+        {
+            name: "Total Focus",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "Total Focus is complete mastery over Energy Melee. This melee attack is a very slow, but incredibly devastating attack that can knock out most opponents, leaving them Disoriented. Due to the exhausting nature of Total Focus, recharge time is very long. This power will enter Energy Focus mode. Total Focus Criticals do not result in double damage, instead it grants double Energy Focus.",
+            shortHelp: "Melee, DMG(Smash/Energy), Foe DisorientMelee, Extreme(Energy/Smash), Foe Disorient, +Energy Focus",
+            icon: "powerpunch_totalfocus.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 2.53,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 4.699
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.8319
+                        }
+                    ],
+                    scale: 6.5309
+                },
+                stun: 3.0
+            }
+        },
+        {
+            name: "Energy Transfer",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "Mastery of Energy Melee culminates with the ability to transfer your own Hit Points into a punch that deals extreme damage. Energy Transfer has a good chance of Disorienting the target. This power will execute extremely quickly if under Energy Focus mode.",
+            shortHelp: "Melee, DMG(Energy), Foe Disorient, Self -HP, Special",
+            icon: "powerpunch_energytransfer.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 10.0,
+                cast: 2.67
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/energy-melee'] = STALKER_ENERGY_MELEE_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_ENERGY_MELEE_POWERSET = STALKER_ENERGY_MELEE_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/fiery-aura.js ----
+;/**
+ * Fiery Aura
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_FIERY_AURA_POWERSET = {
+    name: "Fiery Aura",
+    category: "Unknown",
+    description: "Fiery Aura powerset",
+    icon: "fiery-aura_set.png",
+    powers: [
+        {
+            name: "Fire Shield",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "While this power is active, Fire Shield gives you good resistance to Lethal, Smashing and Fire damage. Fire Shield also provides minimal resistance to Cold damage as well as protection from Disorient effects.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Toggle: Self +Res(Fire, Lethal, Smash, Cold, Disorient)",
+            icon: "flamingshield_flamingshield.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 1.67,
+                protection: {
+                    stun: 10.379999999999999
+                },
+                resistance: {
+                    smashing: 0.22499999999999998,
+                    lethal: 0.22499999999999998,
+                    fire: 0.22499999999999998,
+                    cold: 0.075
+                },
+                buffDuration: 0.75,
+                stun: 1.0,
+                stunDuration: 0.75
+            }
+        },
+        {
+            name: "Hide",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Hide makes you almost impossible to detect. When properly 'Hidden\", a Stalker can pull off Critical hits with his attacks, and even land a massive 'Assassin's Strike' with an Assassin's power. When you attack or are damaged while using this power, you will be discovered. Even if discovered, you are hard to see and retain some bonus to Defense. Unlike most stealth powers, Hide can be used at the same time as other Concealment powers, giving you even greater stealth capability. No Endurance cost.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Toggle: Self Stealth, +DEF(Melee, Ranged, AoE)",
+            icon: "flamingshield_hide.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                cast: 0.73,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Healing Flames",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing", "Resist Damage"],
+            description: "You can concentrate for a few moments to heal yourself. The power of the flames can also protect you from Toxic Damage for a while.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Self Heal, +Res(Toxic)",
+            icon: "flamingshield_healingflames.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 40.0,
+                endurance: 10.4,
+                cast: 0.73,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 2.0,
+                    ticks: 30
+                },
+                resistance: {
+                    toxic: 0.15
+                },
+                healing: {
+                    scale: 301.18975,
+                    perTarget: true
+                },
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Temperature Protection",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "Temperature Protection gives you strong resistance to Fire damage, some resistance to Cold damage and slow effects, and grants minor, unenhanceable regeneration as well as provide very minor Knockback Protection. This power is always on and costs no Endurance.",
+            shortHelp: "Auto: Self +Res(Fire, Cold, Slow, Knock), +Regen",
+            icon: "flamingshield_temperatureprotection.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 3.0,
+                            ticks: 5
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.0,
+                            ticks: 5
+                        }
+                    ]
+                },
+                resistance: {
+                    cold: 0.075,
+                    fire: 0.22499999999999998
+                },
+                debuffResistance: {
+                    recharge: 0.2,
+                    movement: 0.2
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Plasma Shield",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "While this power is active, you are surrounded by pure plasma. The Plasma Shield gives you resistance to Energy, Negative Energy, and Fire damage. Plasma Shield also gives your protection from Sleep and Hold effects.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Toggle: Self +Res(Energy, Negative, Fire, Hold, Sleep)",
+            icon: "flamingshield_plasmasheild.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 3.0,
+                protection: {
+                    hold: 10.379999999999999,
+                    sleep: 10.379999999999999
+                },
+                resistance: {
+                    fire: 0.22499999999999998,
+                    energy: 0.22499999999999998,
+                    negative: 0.22499999999999998,
+                    psionic: 0.22499999999999998
+                },
+                debuffResistance: {
+                    tohit: 0.3,
+                    defense: 0.3,
+                    recharge: 0.3,
+                    movement: 0.5
+                },
+                buffDuration: 0.75,
+                tohitBuff: 0.3,
+                defenseBuff: 0.3
+            }
+        },
+        {
+            name: "Consume",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Endurance Modification", "Healing", "Melee AoE Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You can drain body heat from all nearby foes, and even from the air itself, increasing your health, resistance against endurance drain, as well as replenishing your own Endurance. The more foes affected, the more Endurance is gained. Foes suffer minimal Fire damage.<br><br>HP and End Drain resistance do not scale with enemy count, but will be granted even if there are no enemies nearby.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE, DMG(Fire), Self +End, +Max HP",
+            icon: "flamingshield_consume.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 180.0,
+                endurance: 0.52,
+                cast: 2.03,
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Burn",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee AoE Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You can ignite the ground beneath you, freeing yourself from Immobilization effects. Foes that enter the flames you leave behind will take damage. You must be near the ground to activate this power.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Location (PBAoE), DoT (Fire), Self Res(Immobilize)",
+            icon: "flamingshield_burn.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                recharge: 25.0,
+                endurance: 5.2,
+                cast: 2.03,
+                damage: {
+                    type: "Fire",
+                    scale: 1.44
+                }
+            }
+        },
+        {
+            name: "Cauterizing Blaze",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "While active, you are surrounded by flames cauterize your wounds healing you a small amount every few seconds.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Self +Heal Over Time",
+            icon: "flamingshield_cauterizing.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.13,
+                cast: 2.03
+            }
+        },
+        {
+            name: "Phoenix Rising",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge", "Damage"],
+            allowedSetCategories: ["Endurance Modification", "Healing", "Melee AoE Damage", "Stalker Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "If you are defeated, you can rise from the ashes. The fiery resurrection blasts nearby foes with an explosion and knocks them down and Disorients them. You will revive with about half of your Hit Points and Endurance. Gift of the Phoenix will leave you invulnerable for a brief time, and protected from XP Debt for 90 seconds.<br><br>You can also use this power even if you have not been defeated, with weakend effects. The closer you are to being defeated, the stronger the effects will be. You need to be under 75% health to activate this power.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Self Rez, Special",
+            icon: "flamingshield_riseofthephoenix.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 300.0,
+                cast: 2.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/fiery-aura'] = STALKER_FIERY_AURA_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_FIERY_AURA_POWERSET = STALKER_FIERY_AURA_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/fiery-melee.js ----
+;/**
+ * Fiery Melee
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_FIERY_MELEE_POWERSET = {
+    name: "Fiery Melee",
+    category: "Unknown",
+    description: "Fiery Melee powerset",
+    icon: "fiery-melee_set.png",
+    powers: [
+        {
+            name: "Fire Sword",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "Through concentration, you can create a Sword of Fire that sets foes ablaze. Successful attacks from the Fire Sword will cut through your target defenses and ignite them, dealing damage over time.",
+            shortHelp: "Melee, DMG(Fire), -Defense",
+            icon: "fieryfray_firesword.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.33,
+                damage: {
+                    type: "Fire",
+                    scale: 2.891
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.1,
+                    ticks: 3
+                },
+                buffDuration: 1.6,
+                defenseDebuff: 0.5
+            }
+        },
+        {
+            name: "Scorch",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "This power engulfs your hands in flames, and can ignite the target of your Scorching attack. Once on fire, the target will suffer damage over time.",
+            shortHelp: "Melee, DMG(Fire)",
+            icon: "fieryfray_targetedlightmelee.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 1.0,
+                damage: {
+                    type: "Fire",
+                    scale: 2.06
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.1,
+                    ticks: 2
+                },
+                buffDuration: 1.1
+            }
+        },
+        {
+            name: "Cremate",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "A slow but devastating attack. Cremate clobbers your foes with a massive 2 handed fiery smash knocks down and leaves your foe on fire.",
+            shortHelp: "Melee, DMG(Fire), Knockup",
+            icon: "fieryfray_scorch.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.5,
+                damage: {
+                    type: "Fire",
+                    scale: 3.41
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.1,
+                    ticks: 3
+                },
+                buffDuration: 1.6
+            }
+        },
+        {
+            name: "Assassin's Blaze",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "A signature Stalker attack. This attack does superior fire damage on its own as a frontal attack and cannot be interrupted. However, if it is executed while you are Hidden, this attack will do tremendous damage, as you waylay your unsuspecting foe. This attack may be interrupted if you move or are attacked while executing this power and are hidden. Using this power while not hidden has a chance to critically hit equal to 33.3% times the number of stacks of Assassin's Focus. Using Assassin's Blaze when not hidden will remove all stacks of Assassin's Focus regardless if you critically hit or not.",
+            shortHelp: "Melee, DMG(Fire)",
+            icon: "fieryfray_assassin.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 3.67
+            }
+        },
+        {
+            name: "Build Up",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your chance to hit.",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "fieryfray_followup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Placate",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Allows you to trick a foe to no longer attack you. A Successful Placate will also Hide you. This Hide is very brief, and offers no Defense bonus, but it will allow you to deliver a Critical Hit or an Assassins Strike. However, if you attack a Placated Foe, he will be able to attack you back.",
+            shortHelp: "Ranged, Foe Placate, Self Stealth/Hide",
+            icon: "fieryfray_placate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                cast: 0.8,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Breath of Fire",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged AoE Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "This allows you to spew forth fire from your mouth, burning all foes within its narrow cone. This is a very accurate attack that can deal good damage at a close range.",
+            shortHelp: "Close (Cone) DoT (Fire)",
+            icon: "fieryfray_breathingfire.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.5236,
+            effects: {
+                accuracy: 1.2,
+                range: 15.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 2.67,
+                dotDamage: {
+                    type: "Fire",
+                    scale: 1.8491,
+                    ticks: 1
+                },
+                buffDuration: 0.6
+            }
+        },
+        {
+            name: "Fire Sword Circle",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Melee AoE Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "Mastery of your Fire Sword has enabled you to make an attack on every foe within melee distance. This will slash burn and cut through the defenses of your enemies, dealing moderate damage and setting them ablaze.",
+            shortHelp: "PBAoE Melee, DMG(Fire), -Defense",
+            icon: "fieryfray_fireswordcircle.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 2.67,
+                damage: {
+                    type: "Fire",
+                    scale: 2.6516
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.1,
+                    ticks: 3
+                },
+                buffDuration: 1.6,
+                defenseDebuff: 0.5
+            }
+        },
+        {
+            name: "Greater Fire Sword",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "Your mastery of fire allows you to create an enhanced Sword of Fire that can set foes ablaze and cut through their defenses. Successful attacks from the Greater Fire Sword will ignite your target, dealing damage over time.",
+            shortHelp: "Melee, DMG(Fire), -Defense",
+            icon: "fieryfray_greaterfiresword.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 13.0,
+                endurance: 12.688,
+                cast: 1.37,
+                damage: {
+                    type: "Fire",
+                    scale: 4.319
+                },
+                dotDamage: {
+                    type: "Fire",
+                    scale: 0.2,
+                    ticks: 4
+                },
+                buffDuration: 2.1,
+                defenseDebuff: 0.5
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/fiery-melee'] = STALKER_FIERY_MELEE_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_FIERY_MELEE_POWERSET = STALKER_FIERY_MELEE_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/ice-armor.js ----
+;/**
+ * Ice Armor
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_ICE_ARMOR_POWERSET = {
+    name: "Ice Armor",
+    category: "Unknown",
+    description: "Ice Armor powerset",
+    icon: "ice-armor_set.png",
+    powers: [
+        {
+            name: "Frozen Armor",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Activating this power covers you in a thick layer of Hoarfrost. The frost can absorb the impact from enemy attacks, effectively increasing your maximum Hit Points for a short time. Hoarfrost also grants you resistance to Toxic Damage.<br><br>This power is mutually exclusive from Rime",
+            shortHelp: "Self, +Def(Smash, Lethal), +Res(Cold, Fire, DeBuff DEF)",
+            icon: "icearmor_icearmor.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.73,
+                defense: {
+                    smashing: 0.1275,
+                    lethal: 0.1275
+                },
+                resistance: {
+                    cold: 0.22499999999999998,
+                    fire: 0.09375
+                },
+                debuffResistance: {
+                    defense: 0.1384
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Hide",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Hide makes you almost impossible to detect. When properly 'Hidden\", a Stalker can pull off Critical hits with his attacks, and even land a massive 'Assassins Strike' with an Assassins power. When you attack or are damaged while using this power, you will be discovered. Even if discovered, you are hard to see and retain some bonus to Defense. Unlike most stealth powers, Hide can be used at the same time as other Concealment powers, giving you even greater stealth capability. No Endurance cost.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Toggle: Self Stealth, +DEF(Melee, Ranged, AoE)",
+            icon: "icearmor_hide.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                cast: 0.73,
+                defense: {
+                    smashing: 0.0375,
+                    lethal: 0.0375,
+                    fire: 0.0375,
+                    cold: 0.0375,
+                    energy: 0.0375,
+                    negative: 0.0375,
+                    psionic: 0.0375,
+                    toxic: 0.0375
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Hoarfrost",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing", "Resist Damage"],
+            description: "Activating this power covers you in a thick layer of Hoarfrost. The frost can absorb the impact from enemy attacks, effectively increasing your maximum Hit Points for a short time. Hoarfrost also grants you resistance to Toxic Damage.",
+            shortHelp: "Self Heal, +Max HP, Res(Toxic)",
+            icon: "icearmor_hoarfrost.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 360.0,
+                endurance: 14.56,
+                cast: 0.73,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 2.0,
+                    ticks: 60
+                },
+                resistance: {
+                    toxic: 0.15
+                },
+                healing: {
+                    scale: 481.9036,
+                    perTarget: true
+                },
+                buffDuration: 120.0
+            }
+        },
+        {
+            name: "Rime",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing", "Resist Damage"],
+            description: "Activating this power covers you in a thick layer of rime. The rime can absorb the impact of a limited number of enemy attacks, the lingering moisture increasing your regeneration rate. Rime also grants you resistance to Toxic Damage.<br><br>This power is mutually exclusive from Hoarfrost",
+            shortHelp: "Self +Regen, +Absorb, Res(Toxic)",
+            icon: "icearmor_rime.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 10.4,
+                cast: 0.73,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 2.0,
+                    ticks: 30
+                },
+                resistance: {
+                    toxic: 0.15
+                },
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Wet Ice",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "When you activate this power, you cover yourself in a thick coating of slick, melting ice. This makes you slippery, leaving you nearly immune to Disorient, Immobilization, Hold, Sleep, Slow and Knockback effects. This power also adds a slight increase to your defense to all attacks. Wet Ice also reduces Cold damage and grants you resistance to Defense DeBuffs.",
+            shortHelp: "Self, +DEF(All), +Res(Cold, Disorient, Immobilize, Hold, Sleep, Slow, Knockback, DeBuff DEF)",
+            icon: "icearmor_wetice.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.73,
+                protection: {
+                    hold: 10.379999999999999,
+                    stun: 10.379999999999999,
+                    sleep: 10.379999999999999,
+                    immobilize: 10.379999999999999
+                },
+                defense: {
+                    smashing: 0.0075,
+                    lethal: 0.0075,
+                    fire: 0.0075,
+                    cold: 0.0075,
+                    energy: 0.0075,
+                    negative: 0.0075,
+                    psionic: 0.0075,
+                    toxic: 0.0075
+                },
+                resistance: {
+                    cold: 0.22499999999999998
+                },
+                debuffResistance: {
+                    recharge: 0.6,
+                    movement: 0.6,
+                    tohit: 0.3,
+                    defense: 0.3
+                },
+                buffDuration: 0.75,
+                stun: 1.0,
+                stunDuration: 0.75,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Chilling Embrace",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Slow Movement"],
+            description: "While active, you dramatically lower the temperature around yourself, Slowing the attack rate of all nearby foes, as well as their movement speed and damage.",
+            shortHelp: "Toggle: PBAoE, Foe -Recharge, -Speed, -DMG",
+            icon: "icearmor_chillingembrace.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.73,
+                buffDuration: 5.0
+            }
+        },
+        {
+            name: "Permafrost",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "Your body temperature permanently lowers to 33 degrees Fahrenheit. Permafrost gives you strong resistance to Cold damage, some resistance to Fire damage and minor Smashing, Lethal, Energy, Negative Energy, Toxic and Psionic resistance as well. You also gain an inherent resistance to Slow effects. This power is always on and does not cost Endurance.",
+            shortHelp: "Auto: Self +Res(All damage, Slow)",
+            icon: "icearmor_permafrost.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 3.0,
+                            ticks: 5
+                        },
+                        {
+                            type: "Fire",
+                            scale: 1.25,
+                            ticks: 5
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.5,
+                            ticks: 5
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 0.5,
+                            ticks: 5
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.5,
+                            ticks: 5
+                        },
+                        {
+                            type: "Negative",
+                            scale: 0.5,
+                            ticks: 5
+                        },
+                        {
+                            type: "Psionic",
+                            scale: 0.5,
+                            ticks: 5
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 0.5,
+                            ticks: 5
+                        }
+                    ]
+                },
+                resistance: {
+                    cold: 0.22499999999999998,
+                    fire: 0.09375,
+                    smashing: 0.0375,
+                    lethal: 0.0375,
+                    energy: 0.0375,
+                    negative: 0.0375,
+                    psionic: 0.0375,
+                    toxic: 0.0375
+                },
+                debuffResistance: {
+                    recharge: 0.2,
+                    movement: 0.2
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Glacial Armor",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "When you activate this power you cover yourself in Glacial ice. The crystalline matrix of the armor has refracting properties that make Energy and Negative Energy attacks less likely to land, and acts as a lens to increase your Perception to see hidden foes. The bitter cold of Glacial Armor also reduces Cold damage and also you to resist Defense DeBuffs.",
+            shortHelp: "Toggle: Self +DEF(Energy, Negative), Res (Cold, DeBuff DEF), +Perception",
+            icon: "icearmor_glacialarmor.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 2.03,
+                defense: {
+                    energy: 0.1275,
+                    negative: 0.1275,
+                    psionic: 0.1275
+                },
+                resistance: {
+                    cold: 0.22499999999999998
+                },
+                debuffResistance: {
+                    defense: 0.1384
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Energy Absorption",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Endurance Modification"],
+            description: "Activating this power draws moisture directly from the bodies of all nearby foes, draining their Endurance. Each foe you draw moisture from adds to your own Endurance as well as Defense to all attacks. The first foe you absorb grants the highest Defense bonus, and you can absorb up to 10 foes. In addition to Defense, Energy Absorption also grants you resistance to Slow effects. If there are no foes within range, this power will fail.",
+            shortHelp: "PBAoE, Self +End, +DEF(All), Res (Slow), Foe -End",
+            icon: "icearmor_energyabsorption.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 60.0,
+                endurance: 13.0,
+                cast: 1.33
+            }
+        },
+        {
+            name: "Icy Bastion",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing", "Resist Damage"],
+            description: "You encase yourself in a block of solid ice, rendering yourself invulnerable but unable to act. While the power is active you heal damage and recover endurance at an incredible rate. You can remain in this state for up to 30 seconds. Should you deactivate the power earlier, some of the resistance to damage and other effects will remain until the full 30 seconds window is over. <br><br><color #fcfc95>Notes:If you are under the effects of No Phase, this power will instantly deactivate and leave you only with the lingering effects for 30 seconds.</color>",
+            shortHelp: "Toggle: Self +Res(All DMG, but Psionics), +Res(Knockback, Repel, Disorient, Hold, Immobilize, Sleep), +Regen, +Recovery, Invulnerable; Self Hold",
+            icon: "icearmor_hybernate.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 300.0,
+                endurance: 0.1085
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/ice-armor'] = STALKER_ICE_ARMOR_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_ICE_ARMOR_POWERSET = STALKER_ICE_ARMOR_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/ice-melee.js ----
+;/**
+ * Ice Melee
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_ICE_MELEE_POWERSET = {
+    name: "Ice Melee",
+    category: "Unknown",
+    description: "Ice Melee powerset",
+    icon: "ice-melee_set.png",
+    powers: [
+        {
+            name: "Frozen Fists",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Slow Movement", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "Frozen Fists encrusts your hands in ice, giving them the ability to quickly inflict minor damage on villains. The foe's attack and movement speed is Slowed, due to the chills caused by the cold blows.",
+            shortHelp: "Melee, DMG(Cold/Smash), Foe -Recharge, -SPD",
+            icon: "icyonslaught_frozenfist.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 1.33,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 0.9511000000000001,
+                            ticks: 1
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.27449999999999997,
+                            ticks: 1
+                        }
+                    ]
+                },
+                buffDuration: 0.3
+            }
+        },
+        {
+            name: "Ice Sword",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Slow Movement", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You create a blade of solid ice that deals good damage. Being hit by this Ice Sword will Slow a target's movement and attack speed, due to the intense chill.",
+            shortHelp: "Melee, DMG(Cold/Lethal), Foe -Recharge, -SPD",
+            icon: "icyonslaught_icesword.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.33,
+                damage: {
+                    types: [
+                        {
+                            type: "Cold",
+                            scale: 1.794
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 1.0974
+                        }
+                    ],
+                    scale: 2.8914
+                },
+                buffDuration: 8.0
+            }
+        },
+        {
+            name: "Frost",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged AoE Damage", "Slow Movement", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You create a short cone of Frost in front of you that can deal some damage and Slow a foe's speed, due to their uncontrollable shivering.",
+            shortHelp: "Close (Cone), DoT(Cold), Foe -Recharge, -SPD",
+            icon: "icyonslaught_frost.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.0,
+                range: 10.0,
+                recharge: 11.0,
+                endurance: 11.024,
+                cast: 2.27,
+                dotDamage: {
+                    type: "Cold",
+                    scale: 0.5575,
+                    ticks: 5
+                },
+                buffDuration: 1.1
+            }
+        },
+        {
+            name: "Assassin's Ice Sword",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "A signature Stalker attack. This attack does cold damage on its own as a frontal attack and cannot be interrupted. However, if it is executed while you are Hidden, this attack will do tremendous cold damage, as you impale your unsuspecting foe. This attack may be interrupted if you move or are attacked while executing this power and are hidden. Using this power while not hidden has a chance to critically hit equal to 33.3% times the number of stacks of Assassin's Focus. Using Assassin's Strike when not hidden will remove all stacks of Assassin's Focus regardless if you critically hit or not.",
+            shortHelp: "Melee, DMG(Cold)",
+            icon: "icyonslaught_assassin.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 3.67
+            }
+        },
+        {
+            name: "Placate",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Allows you to trick a foe to no longer attack you. A Successful Placate will also Hide you. This Hide is very brief, and offers no Defense bonus, but it will allow you to deliver a Critical Hit or an Assassins Strike. However, if you attack a Placated Foe, he will be able to attack you back.",
+            shortHelp: "Ranged, Foe Placate, Self Stealth/Hide",
+            icon: "icyonslaught_placate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                cast: 0.8,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Build Up",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Burmal lowers the temperature of your hands even further, making all your icy attacks do additional cold damage over time. It also greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your Accuracy.",
+            shortHelp: "Self +DMG, +To Hit, +Special",
+            icon: "icyonslaught_followup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Ice Patch",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "You emanate a Patch of Ice around you. Foes that step onto the Ice Patch will slip and fall down. This effect lasts until the ice melts. You must be near the ground to activate this power.",
+            shortHelp: "Location (PBAoE), Foe Knockdown",
+            icon: "icyonslaught_icepatch.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 2.0,
+                recharge: 35.0,
+                endurance: 10.4,
+                cast: 1.57,
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Freezing Touch",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Holds", "Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "This Freezing Touch will encase a single foe in a block of ice. This will deal high damage over time, as well as freezing him in his tracks, leaving him cold and helpless.",
+            shortHelp: "Melee, DoT(Cold), Foe Hold",
+            icon: "icyonslaught_freezingtouch.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 16.0,
+                endurance: 10.192,
+                cast: 1.0,
+                dotDamage: {
+                    type: "Cold",
+                    scale: 0.4227,
+                    ticks: 10
+                },
+                buffDuration: 2.6
+            }
+        },
+        {
+            name: "Frozen Aura",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Sleep", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee AoE Damage", "Sleep", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "Your mastery of cold enables you to dramatically lower the temperature immediately around you. When you perform a Frozen Aura, nearby foes will be frozen within a fragile casing of ice and suffer a moderate amount of cold damage. These frozen foes will break free if attacked. Frozen Aura deals moderate damage.<br><br><color #fcfc95>Notes: The Sleep component of this power is Auto Hit against regular enemies, but a To Hit check is required to against AVs and players, as well as to make secondary effects apply.</color>",
+            shortHelp: "PBAoE, DMG(Cold), Foe Sleep",
+            icon: "icyonslaught_frozenaura.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 2.1,
+                damage: {
+                    type: "Cold",
+                    scale: 1.068
+                }
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/ice-melee'] = STALKER_ICE_MELEE_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_ICE_MELEE_POWERSET = STALKER_ICE_MELEE_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/invulnerability.js ----
+;/**
+ * Invulnerability
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_INVULNERABILITY_POWERSET = {
+    name: "Invulnerability",
+    category: "Unknown",
+    description: "Invulnerability powerset",
+    icon: "invulnerability_set.png",
+    powers: [
+        {
+            name: "Hide",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Hide makes you almost impossible to detect. When properly 'Hidden\", a Stalker can pull off Critical hits with his attacks, and even land a massive 'Assassin's Strike' with an Assassin's power. When you attack or are damaged while using this power, you will be discovered. Even if discovered, you are hard to see and retain some bonus to Defense. Unlike most stealth powers, Hide can be used at the same time as other Concealment powers, giving you even greater stealth capability. No Endurance cost.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Toggle: Self Stealth, +DEF(Melee, Ranged, AoE)",
+            icon: "invulnerability_hide.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                cast: 0.73,
+                defense: {
+                    smashing: 0.0375,
+                    lethal: 0.0375,
+                    fire: 0.0375,
+                    cold: 0.0375,
+                    energy: 0.0375,
+                    negative: 0.0375,
+                    psionic: 0.0375,
+                    toxic: 0.0375
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Resist Physical Damage",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You are naturally tough and inherently resistant to Smashing and Lethal damage as well as Defense Debuff effects. This power is always on, and costs no Endurance.",
+            shortHelp: "Auto: Self +Res (Smash, Lethal, DeBuff DEF)",
+            icon: "invulnerability_restophysicaldmg.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 1.0,
+                            ticks: 5
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 1.0,
+                            ticks: 5
+                        }
+                    ]
+                },
+                resistance: {
+                    smashing: 0.075,
+                    lethal: 0.075
+                },
+                debuffResistance: {
+                    defense: 0.25
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Temp Invulnerability",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "When you toggle on this power, you become highly resistant to Smashing and Lethal damage.",
+            shortHelp: "Toggle: Self +Res(Smash, Lethal)",
+            icon: "invulnerability_temporaryinvulnerabilty.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.67,
+                resistance: {
+                    smashing: 0.22499999999999998,
+                    lethal: 0.22499999999999998,
+                    psionic: 0.22499999999999998
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Dull Pain",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You can activate this power to increase your maximum Hit Points for a short time.",
+            shortHelp: "Self Heal, +Max HP",
+            icon: "invulnerability_dullpain.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 360.0,
+                endurance: 10.4,
+                cast: 0.73,
+                healing: {
+                    scale: 481.9036,
+                    perTarget: true
+                },
+                buffDuration: 120.0
+            }
+        },
+        {
+            name: "Unyielding",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "When you toggle on this power, you become Unyielding. You are resistant to all damage, as well as Knockback, Sleep, Hold, Immobilize, Disorient effects.",
+            shortHelp: "Toggle: Self +Res(All DMG; Knockback, Sleep, Disorient, Hold, Immobilize)",
+            icon: "invulnerability_unyeildlingstance.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.13,
+                cast: 2.33,
+                protection: {
+                    hold: 10.379999999999999,
+                    stun: 10.379999999999999,
+                    sleep: 10.379999999999999,
+                    immobilize: 10.379999999999999
+                },
+                resistance: {
+                    smashing: 0.0375,
+                    lethal: 0.0375,
+                    psionic: 0.0375,
+                    fire: 0.075,
+                    cold: 0.075,
+                    energy: 0.075,
+                    negative: 0.075,
+                    toxic: 0.075
+                },
+                debuffResistance: {
+                    tohit: 0.3,
+                    defense: 0.3,
+                    recharge: 0.3,
+                    movement: 0.5
+                },
+                buffDuration: 0.75,
+                stun: 1.0,
+                stunDuration: 0.75,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Environmental Resistance",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You are naturally resistant to the environmental damage and always take less Fire, Cold, Energy, Negative, Psionic and Toxic Damage as well as Debuff effects which reduce your speed, endurance or recovery. This power is always on and costs no Endurance.",
+            shortHelp: "Auto: Self +Res(Fire, Cold, Toxic, Energy, Negative, Psionic, Slow, Endurance)",
+            icon: "invulnerability_restospecialdmg.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 1.0,
+                            ticks: 5
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.0,
+                            ticks: 5
+                        },
+                        {
+                            type: "Energy",
+                            scale: 1.0,
+                            ticks: 5
+                        },
+                        {
+                            type: "Negative",
+                            scale: 1.0,
+                            ticks: 5
+                        },
+                        {
+                            type: "Psionic",
+                            scale: 1.0,
+                            ticks: 5
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 1.0,
+                            ticks: 5
+                        }
+                    ]
+                },
+                resistance: {
+                    fire: 0.075,
+                    cold: 0.075,
+                    energy: 0.075,
+                    negative: 0.075,
+                    psionic: 0.075,
+                    toxic: 0.075
+                },
+                debuffResistance: {
+                    recharge: 0.2,
+                    movement: 0.2
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Invincible",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "To Hit Buff"],
+            description: "While this power is active you receive a bonus to Defense against all attacks and a bonus to your chance to hit.",
+            shortHelp: "Toggle: Self +DEF(All), +To Hit",
+            icon: "invulnerability_invincibility.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.208,
+                cast: 3.0,
+                defense: {
+                    smashing: 0.075,
+                    lethal: 0.075,
+                    fire: 0.075,
+                    cold: 0.075,
+                    energy: 0.075,
+                    negative: 0.075,
+                    psionic: 0.0249975,
+                    toxic: 0.0249975
+                },
+                buffDuration: 1.125,
+                tohitBuff: 1.0
+            }
+        },
+        {
+            name: "Tough Hide",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Your thickened skin makes you much tougher to hit and resistant to Defense Debuff effects. This power is always on and costs no Endurance. Tough Hide offers no protection to Psionic Attacks.",
+            shortHelp: "Auto: Self +DEF(All but Psionics), +RES (Debuff DEF)",
+            icon: "invulnerability_toughhide.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                defense: {
+                    smashing: 0.0375,
+                    lethal: 0.0375,
+                    fire: 0.0375,
+                    cold: 0.0375,
+                    energy: 0.0375,
+                    negative: 0.0375,
+                    psionic: 0.0375,
+                    toxic: 0.0375
+                },
+                debuffResistance: {
+                    defense: 0.25
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Unstoppable",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "When you activate this power, you not only become extremely resistant to most damage, but also to Disorient, Immobilization, Hold, Knockback and Sleep effects. Endurance recovery is also increased. Unstoppable costs little Endurance to activate, but when it wears off you are left exhausted, and drained of almost all Health and Endurance.",
+            shortHelp: "Self, +Res(Disorient, Sleep, Hold, Immobilize, Knockback, All DMG)",
+            icon: "invulnerability_unstoppable.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 1000.0,
+                endurance: 2.6,
+                cast: 3.1,
+                dotDamage: {
+                    type: "Psionic",
+                    scale: 4.5,
+                    ticks: 90
+                },
+                resistance: {
+                    smashing: 0.525,
+                    lethal: 0.525,
+                    fire: 0.525,
+                    cold: 0.525,
+                    energy: 0.525,
+                    negative: 0.525,
+                    toxic: 0.525,
+                    psionic: 0.33749999999999997
+                },
+                buffDuration: 180.0,
+                stun: 1.0,
+                stunDuration: 180.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/invulnerability'] = STALKER_INVULNERABILITY_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_INVULNERABILITY_POWERSET = STALKER_INVULNERABILITY_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/kinetic-attack.js ----
+;/**
+ * Kinetic Attack
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_KINETIC_ATTACK_POWERSET = {
+    name: "Kinetic Attack",
+    category: "Unknown",
+    description: "Kinetic Attack powerset",
+    icon: "kinetic-attack_set.png",
+    powers: [
+        {
+            name: "Body Blow",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "A much more powerful, yet slower version of Quick Strike. Body Blow is capable of stunning an opponent occasionally.",
+            shortHelp: "Melee, DMG(Smash/Energy), Foe Disorient",
+            icon: "kineticattack_bodyblow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 5.0,
+                endurance: 6.032,
+                cast: 1.07,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 1.8143
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.6947
+                        }
+                    ],
+                    scale: 2.509
+                },
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 0.75,
+                            ticks: 2
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 0.75,
+                            ticks: 2
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.75,
+                            ticks: 2
+                        },
+                        {
+                            type: "Cold",
+                            scale: 0.75,
+                            ticks: 2
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.75,
+                            ticks: 2
+                        },
+                        {
+                            type: "Negative",
+                            scale: 0.75,
+                            ticks: 2
+                        }
+                    ]
+                },
+                buffDuration: 5.0
+            }
+        },
+        {
+            name: "Quick Strike",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "A quick attack that sometimes knock foes down. Fast, but low damage.",
+            shortHelp: "Melee, DMG(Smash/Energy), Foe -DMG, Knockdown",
+            icon: "kineticattack_quickstrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 0.83,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 1.4007
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.5403
+                        }
+                    ],
+                    scale: 1.941
+                },
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 0.75,
+                            ticks: 2
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 0.75,
+                            ticks: 2
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.75,
+                            ticks: 2
+                        },
+                        {
+                            type: "Cold",
+                            scale: 0.75,
+                            ticks: 2
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.75,
+                            ticks: 2
+                        },
+                        {
+                            type: "Negative",
+                            scale: 0.75,
+                            ticks: 2
+                        }
+                    ]
+                },
+                buffDuration: 4.0
+            }
+        },
+        {
+            name: "Smashing Blow",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "Smashing Blow is a slow attack, but makes up for it with a good amount of damage. Has a greater chance to stun than body blow.",
+            shortHelp: "Melee, DMG(Smash/Energy), Foe Disorient",
+            icon: "kineticattack_smashingblow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 7.0,
+                endurance: 7.696,
+                cast: 1.2,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.1399999999999997
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.86
+                        }
+                    ],
+                    scale: 2.9999999999999996
+                },
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 0.75,
+                            ticks: 2
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 0.75,
+                            ticks: 2
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.75,
+                            ticks: 2
+                        },
+                        {
+                            type: "Cold",
+                            scale: 0.75,
+                            ticks: 2
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.75,
+                            ticks: 2
+                        },
+                        {
+                            type: "Negative",
+                            scale: 0.75,
+                            ticks: 2
+                        }
+                    ]
+                },
+                buffDuration: 5.0
+            }
+        },
+        {
+            name: "Assassin's Strike",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "A signature Stalker attack. This attack does superior energy and smashing damage on its own as a frontal attack and cannot be interrupted. However, if it is executed while you are Hidden, this attack will do tremendous damage, as you waylay your unsuspecting foe. This attack may be interrupted if you move or are attacked while executing this power and are hidden. Using this power while not hidden has a chance to critically hit equal to 33.3% times the number of stacks of Assassin's Focus. Using Assassin's Strike when not hidden will remove all stacks of Assassin's Focus regardless if you critically hit or not.",
+            shortHelp: "Melee, DMG(Smashing, Energy)",
+            icon: "kineticattack_assassinsstrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 2.67
+            }
+        },
+        {
+            name: "Build Up",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your chance to hit.",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "kineticattack_powersiphon.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Placate",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Allows you to trick a foe to no longer attack you. A Successful Placate will also Hide you. This Hide is very brief, and offers no Defense bonus, but it will allow you to deliver a Critical Hit or an Assassins Strike. However, if you attack a Placated Foe, he will be able to attack you back.",
+            shortHelp: "Ranged, Foe Placate, Self Stealth/Hide",
+            icon: "kineticattack_placate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                cast: 0.8,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Burst",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee AoE Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "By focusing your energy into the muscles in your arms, you can launch a dizzying flurry of attacks against every foe in melee range. Some foes may be hit hard enough to be knocked down as well.",
+            shortHelp: "PBAoE Melee, DMG(Smash/Energy), Foe Knockdown",
+            icon: "kineticattack_burst.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 2.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 1.7281
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.8260000000000001
+                        }
+                    ],
+                    scale: 2.5541
+                },
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 1.5,
+                            ticks: 3
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 1.5,
+                            ticks: 3
+                        },
+                        {
+                            type: "Fire",
+                            scale: 1.5,
+                            ticks: 3
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.5,
+                            ticks: 3
+                        },
+                        {
+                            type: "Energy",
+                            scale: 1.5,
+                            ticks: 3
+                        },
+                        {
+                            type: "Negative",
+                            scale: 1.5,
+                            ticks: 3
+                        }
+                    ]
+                },
+                buffDuration: 7.0
+            }
+        },
+        {
+            name: "Focused Burst",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "Projects a burst of focused power over a short distance. Focused Burst deals high damage and can possibly knock down your foe.",
+            shortHelp: "Ranged, DMG(Smash/Energy), Foe Knockdown",
+            icon: "kineticattack_focusedburst.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 2.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.714
+                        },
+                        {
+                            type: "Energy",
+                            scale: 1.046
+                        }
+                    ],
+                    scale: 3.76
+                },
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 0.75,
+                            ticks: 3
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 0.75,
+                            ticks: 3
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.75,
+                            ticks: 3
+                        },
+                        {
+                            type: "Cold",
+                            scale: 0.75,
+                            ticks: 3
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.75,
+                            ticks: 3
+                        },
+                        {
+                            type: "Negative",
+                            scale: 0.75,
+                            ticks: 3
+                        }
+                    ]
+                },
+                buffDuration: 7.0
+            }
+        },
+        {
+            name: "Concentrated Strike",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "Concentrated Strike is a slow, but incredibly devastating attack that can knock out most opponents, leaving them Disoriented. Due to the exhausting nature of Concentrated Strike, its recharge time is very long. Concentrated Strike Criticals do not result in extra damage, instead they instantly recharge the Build Up power.",
+            shortHelp: "Melee, DMG(Energy/Smash), Foe Disorient, +Special",
+            icon: "kineticattack_totalfocus.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 2.83,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 4.7867
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.9543
+                        }
+                    ],
+                    scale: 6.741
+                },
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 0.75,
+                            ticks: 4
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 0.75,
+                            ticks: 4
+                        },
+                        {
+                            type: "Fire",
+                            scale: 0.75,
+                            ticks: 4
+                        },
+                        {
+                            type: "Cold",
+                            scale: 0.75,
+                            ticks: 4
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.75,
+                            ticks: 4
+                        },
+                        {
+                            type: "Negative",
+                            scale: 0.75,
+                            ticks: 4
+                        }
+                    ]
+                },
+                buffDuration: 8.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/kinetic-attack'] = STALKER_KINETIC_ATTACK_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_KINETIC_ATTACK_POWERSET = STALKER_KINETIC_ATTACK_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/martial-arts.js ----
+;/**
+ * Martial Arts
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_MARTIAL_ARTS_POWERSET = {
+    name: "Martial Arts",
+    category: "Unknown",
+    description: "Martial Arts powerset",
+    icon: "martial-arts_set.png",
+    powers: [
+        {
+            name: "Storm Kick",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You can unleash a roundhouse kick that pummels your foe for moderate damage. Storm Kick has a greater then average chance to score a critical hit.",
+            shortHelp: "Melee, DMG(Smashing)",
+            icon: "martialarts_stormkick.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 0.83,
+                damage: {
+                    type: "Smashing",
+                    scale: 2.5410000000000004
+                }
+            }
+        },
+        {
+            name: "Thunder Kick",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "You can perform a strong Thunder Kick that hits so hard it can Disorient your target.",
+            shortHelp: "Melee, DMG(Smashing), Minor Disorient",
+            icon: "martialarts_thunderkick.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 0.83,
+                damage: {
+                    type: "Smashing",
+                    scale: 1.9409999999999998
+                }
+            }
+        },
+        {
+            name: "Crippling Axe Kick",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Immobilize", "Melee Damage", "Slow Movement", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You can perform a Crippling Axe Kick that deals moderate smashing damage, reduces the targets defense, may Immobilize, and Slowing their run speed. Crippling Axe Kick may also knock some flying entities out of the sky.",
+            shortHelp: "Melee, DMG(Smashing), Foe Immobilize, -SPD, -Fly, -DEF",
+            icon: "martialarts_cripplinghookkick.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 11.0,
+                endurance: 11.024,
+                cast: 1.6,
+                damage: {
+                    type: "Smashing",
+                    scale: 4.0799
+                },
+                buffDuration: 8.0,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Assassin's Blow",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "A signature Stalker attack. This attack does superior smashing damage on its own as a frontal attack and cannot be interrupted. However, if it is executed while you are Hidden, this attack will do tremendous damage, as you waylay your unsuspecting foe. This attack may be interrupted if you move or are attacked while executing this power and are hidden. Using this power while not hidden has a chance to critically hit equal to 33.3% times the number of stacks of Assassin's Focus. Using Assassin's Strike when not hidden will remove all stacks of Assassin's Focus regardless if you critically hit or not.",
+            shortHelp: "Melee, DMG(Smashing)",
+            icon: "martialarts_assassinstrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 3.0
+            }
+        },
+        {
+            name: "Focus Chi",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Tapping into your inner Chi greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your chance to hit.",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "martialarts_focuschi.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 2.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Placate",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Allows you to trick a foe to no longer attack you. A Successful Placate will also Hide you. This Hide is very brief, and offers no Defense bonus, but it will allow you to deliver a Critical Hit or an Assassins Blow. However, if you attack a Placated Foe, he will be able to attack you back.",
+            shortHelp: "Ranged, Foe Placate, Self Stealth/Hide",
+            icon: "martialarts_placate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                cast: 0.8,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Cobra Strike",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "Using intense martial arts focus, you can perform a Cobra Strike that deals minor damage, but has a great chance of Disorienting your target.",
+            shortHelp: "Melee, DMG(Smashing), Foe Disorient",
+            icon: "martialarts_cobrastrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 1.67,
+                damage: {
+                    type: "Smashing",
+                    scale: 3.9290000000000003
+                }
+            }
+        },
+        {
+            name: "Crane Kick",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You can perform a slow, high smashing damage kick that will likely knock your target back.",
+            shortHelp: "Melee, DMG(Smashing), Knockback",
+            icon: "martialarts_cranekick.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 10.0,
+                endurance: 11.856,
+                cast: 1.67,
+                damage: {
+                    type: "Smashing",
+                    scale: 3.9289
+                }
+            }
+        },
+        {
+            name: "Eagles Claw",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "You can perform a devastating smashing damage kick that can severely Disorient most opponents. Eagle's Claw has an exceptionally good critical hit capability. In addition to the normal Critical from attacking while Hidden, there is also a small chance you may land a Critical hit even if you are not Hidden.",
+            shortHelp: "Melee, DMG(Smashing), Foe Minor Disorient, +Special",
+            icon: "martialarts_eaglesclaw.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 2.53,
+                damage: {
+                    type: "Smashing",
+                    scale: 5.731
+                },
+                stun: 3.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/martial-arts'] = STALKER_MARTIAL_ARTS_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_MARTIAL_ARTS_POWERSET = STALKER_MARTIAL_ARTS_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/ninja-sword.js ----
+;/**
+ * Ninja Sword
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_NINJA_SWORD_POWERSET = {
+    name: "Ninja Sword",
+    category: "Unknown",
+    description: "Ninja Sword powerset",
+    icon: "ninja-sword_set.png",
+    powers: [
+        {
+            name: "Gambler's Cut",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You perform a quick slash with your Ninja Blade. This attack is very fast, but deals only minor lethal damage. This attack can reduce a target's Defense, making them easier to hit.",
+            shortHelp: "Melee, DMG(Lethal), Foe -Def",
+            icon: "katana_slash.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 0.67,
+                dotDamage: {
+                    type: "Lethal",
+                    scale: 0.9145,
+                    ticks: 1
+                },
+                buffDuration: 0.3,
+                defenseDebuff: 1.0
+            }
+        },
+        {
+            name: "Sting of the Wasp",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You perform a standard attack with your Ninja Blade. This attack is slower than Gambler's Cut, but deals more lethal damage. Sting of the Wasp can reduce a target's Defense, making them easier to hit.",
+            shortHelp: "Melee, DMG(Lethal), Foe -Def",
+            icon: "katana_hack.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 5.0,
+                endurance: 6.032,
+                cast: 1.17,
+                damage: {
+                    type: "Lethal",
+                    scale: 2.5789999999999997
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Flashing Steel",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Melee AoE Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You swing your Ninja Blade in a wide arc in front of you, slicing multiple foes with lethal damage. This attack can reduce a target's Defense, making them easier to hit. If executed while hidden, all affected targets have a chance to be hit with a Critical for extra damage.",
+            shortHelp: "Melee (Cone), DMG(Lethal), Foe -Def",
+            icon: "katana_slice.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 2.2689,
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 6.0,
+                endurance: 6.032,
+                cast: 1.17,
+                damage: {
+                    type: "Lethal",
+                    scale: 2.0884
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Assassin's Blade",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "A signature Stalker attack. This attack does superior lethal damage on its own as a frontal attack and cannot be interrupted. However, if it is executed while you are Hidden, this attack will do tremendous damage, as you impale your unsuspecting foe. This attack may be interrupted if you move or are attacked while executing this power and are hidden. Using this power while not hidden has a chance to critically hit equal to 33.3% times the number of stacks of Assassin's Focus. Using Assassin's Strike when not hidden will remove all stacks of Assassin's Focus regardless if you critically hit or not.",
+            shortHelp: "Melee, DMG(Lethal)",
+            icon: "katana_assassinblade.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 3.67
+            }
+        },
+        {
+            name: "Build Up",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your chance to hit.",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "katana_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Placate",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Allows you to trick a foe to no longer attack you. A Successful Placate will also Hide you. This Hide is very brief, and offers no Defense bonus, but it will allow you to deliver a Critical Hit or an Assassins Blade. However, if you attack a Placated Foe, he will be able to attack you back.",
+            shortHelp: "Ranged, Foe Placate, Self Stealth/Hide",
+            icon: "katana_placate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                cast: 0.8,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Divine Avalanche",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Defense Sets", "Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You can use your Ninja Blade to parry incoming melee attacks and then quickly return the favor. Divine Avalanche does minor damage, but every successful hit will increase your Defense against melee and lethal attacks for a short while.",
+            shortHelp: "Melee, DMG(Lethal), Self +DEF (Melee, Lethal)",
+            icon: "katana_parry.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 1.33,
+                damage: {
+                    type: "Lethal",
+                    scale: 2.291
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Soaring Dragon",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Knockback", "Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You perform a powerful Soaring Dragon maneuver that deals a great amount of lethal damage, and can knock a target up into the air. This attack can reduce a target's Defense, making them easier to hit.",
+            shortHelp: "Melee, DMG(Lethal), Foe Knockup, -DEF",
+            icon: "katana_disembowel.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 7.0,
+                recharge: 9.0,
+                endurance: 9.36,
+                cast: 1.33,
+                damage: {
+                    type: "Lethal",
+                    scale: 3.491
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Golden Dragonfly",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Knockback", "Melee AoE Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You perform a devastating Golden Dragonfly attack that deals a massive amount of lethal damage and can even knock a foe down to the ground and reduce their Defense. The power of this attack can actually extend a short distance through multiple foes. If executed while hidden, only some affected targets may be hit with a Critical, however, there is a chance you may land a Critical hit with Golden Dragonfly even if you are not Hidden.",
+            shortHelp: "Melee, High DMG(Lethal), Foe Knockback, -DEF",
+            icon: "katana_headsplitter.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 0.3491,
+            effects: {
+                accuracy: 1.05,
+                range: 10.0,
+                recharge: 12.0,
+                endurance: 11.856,
+                cast: 1.83,
+                damage: {
+                    type: "Lethal",
+                    scale: 4.440899999999999
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 10.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/ninja-sword'] = STALKER_NINJA_SWORD_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_NINJA_SWORD_POWERSET = STALKER_NINJA_SWORD_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/ninjitsu.js ----
+;/**
+ * Ninjitsu
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_NINJITSU_POWERSET = {
+    name: "Ninjitsu",
+    category: "Unknown",
+    description: "Ninjitsu powerset",
+    icon: "ninjitsu_set.png",
+    powers: [
+        {
+            name: "Hide",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Hide makes you almost impossible to detect. When properly 'Hidden\", a Stalker can pull off Critical hits with his attacks, and even land a massive 'Assassin's Strike' with an Assassin's power. When you attack or are damaged while using this power, you will be discovered. Even if discovered, you are hard to see and retain some bonus to Defense. Unlike most stealth powers, Hide can be used at the same time as other Concealment powers, giving you even greater stealth capability. No Endurance cost.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Toggle: Self Stealth, +DEF(Melee, Ranged, AoE)",
+            icon: "ninjitsu_hide.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                cast: 0.73,
+                defense: {
+                    smashing: 0.0375,
+                    lethal: 0.0375,
+                    fire: 0.0375,
+                    cold: 0.0375,
+                    energy: 0.0375,
+                    negative: 0.0375,
+                    psionic: 0.0375,
+                    toxic: 0.0375
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Ninja Reflexes",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Activating your Ninja Reflexes enables you to be more evasive to melee attacks. This will increase your Defense versus melee as long as it is active. Ninja Reflexes also grants you resistance to Defense DeBuffs.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +DEF(Melee), Res(DeBuff DEF)",
+            icon: "ninjitsu_ninjareflexes.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.13,
+                cast: 1.53,
+                debuffResistance: {
+                    defense: 0.173
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Danger Sense",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "You become more evasive against ranged and area attacks while you have Danger Sense activated. This will increase your Defense versus ranged and Area of Effect attacks as long as it is active. Your Danger Sense also allow you to perceive stealthy foes and resist Defense DeBuffs.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +DEF(Ranged, AoE), +Perception, Res(DeBuff DEF)",
+            icon: "ninjitsu_dangersense.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.182,
+                cast: 0.83,
+                debuffResistance: {
+                    defense: 0.173
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Caltrops",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage"],
+            allowedSetCategories: ["Ranged AoE Damage", "Slow Movement", "Universal Damage Sets"],
+            description: "You toss a handful of Caltrops at a targeted location and spread the tiny metal spikes over a large area. Any enemy that passes over the Caltrops will be forced to move at a slower rate. They will also take some trivial Lethal damage over time.<br><br><color #fcfc95>Damage: Minor(DoT).</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged (Location AoE), Minor DoT(Lethal), Foe -Speed",
+            icon: "ninjitsu_caltrops.png",
+            powerType: "Click",
+            targetType: "Location",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 25.0,
+                recharge: 45.0,
+                endurance: 7.8,
+                cast: 1.07,
+                buffDuration: 45.0
+            }
+        },
+        {
+            name: "Kuji-In Rin",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Leaping", "Leaping & Sprints", "Resist Damage", "Running", "Running & Sprints", "Universal Travel"],
+            description: "Kuji-In Rin is the strength of mind and body. By focusing your power on this exercise, you gain a resistance to Disorient, Hold, Sleep, Immobilization, Confusion, and fear, as well as resistance to Psionic damage for a few minutes. Your running speed and jumping height are also increased.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +SPD, +Res(Disorient, Hold, Sleep, Immobilize, Confuse, Fear, Psionics)",
+            icon: "ninjitsu_kujinrin.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 200.0,
+                endurance: 10.4,
+                cast: 1.83,
+                dotDamage: {
+                    type: "Psionic",
+                    scale: 3.0,
+                    ticks: 60
+                },
+                protection: {
+                    hold: 10.379999999999999,
+                    stun: 10.379999999999999,
+                    sleep: 10.379999999999999,
+                    immobilize: 10.379999999999999,
+                    fear: 10.379999999999999,
+                    confuse: 10.379999999999999
+                },
+                resistance: {
+                    psionic: 0.22499999999999998
+                },
+                debuffResistance: {
+                    tohit: 0.3,
+                    defense: 0.3,
+                    recharge: 0.3,
+                    movement: 0.5
+                },
+                stun: 1.0,
+                stunDuration: 120.0,
+                buffDuration: 120.0,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Kuji-In Sha",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing", "Resist Damage"],
+            description: "Kuji-In Sha invokes the power of Sha, or healing. Focusing your inner power, you can heal your body of its wounds and leave yourself resistant to the effects of Toxic damage for a while.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Self Heal, Res(Toxic)",
+            icon: "ninjitsu_kujinsha.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 60.0,
+                endurance: 10.4,
+                cast: 1.0,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 2.0,
+                    ticks: 30
+                },
+                resistance: {
+                    toxic: 0.15
+                },
+                healing: {
+                    scale: 301.18975,
+                    perTarget: true
+                },
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Smoke Flash",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge", "Accuracy"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "You throw a smoke bomb at your feet. The resulting flash of light and smoke can briefly distract your foes and Placate them so they can no longer find or target you. Combined with Hide, Smoke Flash is the perfect distraction to get out of a bad situation.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE, Foe Placate",
+            icon: "ninjitsu_smokeflash.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.4,
+                recharge: 120.0,
+                endurance: 2.6,
+                cast: 1.83
+            }
+        },
+        {
+            name: "Blinding Powder",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Accurate To-Hit Debuff", "Confuse", "To Hit Debuff"],
+            description: "You throw a handful of Blinding powder in a wide arc at your foes. Most foes will be blinded, and unable to see. Some affected targets may be overcome by the powder that they may start attacking their own allies. If you attack the blinded foes, they will be alerted to your presence, but will continue to suffer a penalty to their chance to hit.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Ranged (Cone), Foe -To Hit, Sleep, Confuse, -Perception",
+            icon: "ninjitsu_blindingpowder.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 0.7854,
+            effects: {
+                accuracy: 1.0,
+                range: 25.0,
+                recharge: 120.0,
+                endurance: 7.8,
+                cast: 1.07,
+                buffDuration: 20.0,
+                tohitDebuff: 1.0
+            }
+        },
+        {
+            name: "Kuji-In Retsu",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Endurance Modification", "Running", "Running & Sprints", "Universal Travel"],
+            description: "Kuji-In Retsu is the mastery of space and time. Focusing your power on Retsu enables you to control your own time to easily defeat your foes. Mastery of this power enables you to avoid almost any attack, be it ranged, melee, or area effect. Your running speed, jumping height and Endurance Recovery are also increased. Retsu also grants you high resistance to Defense DeBuffs. When Retsu wears off, you are left drained of all Endurance and unable to recover Endurance for a while.<br><br><color #fcfc95>Recharge: Extremely Long.</color>",
+            shortHelp: "Self +DEF, +SPD, +Recovery, Res(DeBuff DEF), +Special",
+            icon: "ninjitsu_kujinzen.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 1000.0,
+                endurance: 2.6,
+                cast: 1.83,
+                debuffResistance: {
+                    defense: 0.346
+                },
+                buffDuration: 180.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/ninjitsu'] = STALKER_NINJITSU_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_NINJITSU_POWERSET = STALKER_NINJITSU_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/psionic-armor.js ----
+;/**
+ * Psionic Armor
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_PSIONIC_ARMOR_POWERSET = {
+    name: "Psionic Armor",
+    category: "Unknown",
+    description: "Psionic Armor powerset",
+    icon: "psionic-armor_set.png",
+    powers: [
+        {
+            name: "Hide",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Hide makes you almost impossible to detect. When properly 'Hidden\", a Stalker can pull off Critical hits with his attacks, and even land a massive 'Assassins Strike' with an Assassins power. When you attack or are damaged while using this power, you will be discovered. Even if discovered, you are hard to see and retain some bonus to Defense. Unlike most stealth powers, Hide can be used at the same time as other Concealment powers, giving you even greater stealth capability. No Endurance cost.",
+            shortHelp: "Toggle: Self Stealth, +DEF(Melee, Ranged, AoE)",
+            icon: "psionicarmor_hide.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                cast: 0.73,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Psychic Wall",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You focus to create a psychic wall that dampens the smashing, lethal and psionic damage.",
+            shortHelp: "Toggle: Self +Res(Smash, Lethal, Psionic)",
+            icon: "psionicarmor_psychicwall.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.104,
+                cast: 0.67,
+                resistance: {
+                    smashing: 0.22499999999999998,
+                    psionic: 0.22499999999999998,
+                    lethal: 0.15
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Psionic Shield",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "This power generates a psionic shield that dampens most energy and elemental damage types while also reducing the effect of endurance drain effects.",
+            shortHelp: "Toggle: Self +Res(Fire, Cold, Energy, Negative, Toxic, End Drain)",
+            icon: "psionicarmor_psionicshield.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.104,
+                cast: 1.17
+            }
+        },
+        {
+            name: "Impenetrable Mind",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "When you toggle on this power, it grants protection from Sleep, Disorient, Fear, Immobilize, Confusion, Knockback and Hold effects. Impenetrable Mind also grants moderate resistance to Psionic based attacks.",
+            shortHelp: "Toggle: Self Res (Psionics, Disorient, Hold, Immobilize, Sleep, Fear, Confuse, Knockback)",
+            icon: "psionicarmor_impenetrablemind.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 0.73
+            }
+        },
+        {
+            name: "Devour Psyche",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "You Devour the Psyche of foes in front of you, weakening their Hit Point Regeneration and Endurance Recovery and boosting your own. Hitting any foe with this power will refresh all existing stacks you currently have.<br><br><color #fcfc95>Notes: This power has adaptive recharge. It has a base recharge of <color #FF7F27>5</color> seconds and each affected foe will increase the recharge by <color #FF7F27>5.5</color> seconds for a maximum total of <color #FF7F27>60</color> seconds.</color>",
+            shortHelp: "Cone Foe -Regen, -Heal, -Recovery; Self +Regen, +Recovery",
+            icon: "psionicarmor_devourpsyche.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 60.0,
+                endurance: 10.5,
+                cast: 1.0
+            }
+        },
+        {
+            name: "Psychokinetic Barrier",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You can erect a temporary wall of crystalized psionic energy that will absorb a large amount of damage before breaking off. Psychokinetic Barrier will grant a moderate amount of absorption and reduce the effect debuffs have on you.",
+            shortHelp: "Self, +Absorb, +MaxHP, +Regeneration, +Res(-Regeneration, -Recovery, -Recharge, -Endurance)",
+            icon: "psionicarmor_psychokineticbarrier.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 60.0,
+                endurance: 10.4,
+                cast: 1.17,
+                debuffResistance: {
+                    recharge: 0.2,
+                    regeneration: 0.2,
+                    recovery: 0.2,
+                    endurance: 0.2
+                },
+                buffDuration: 30.0
+            }
+        },
+        {
+            name: "Precognition",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Precognition allows you to read your enemies' minds, letting you see their attacks before they happen and increasing your perception. This power is always on and costs no Endurance.",
+            shortHelp: "Auto: Self +DEF(Melee, Ranged, AoE, Psionic), Res(DeBuff DEF), +Perception",
+            icon: "psionicarmor_precognition.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                debuffResistance: {
+                    defense: 0.07999519999999999
+                },
+                buffDuration: 10.25,
+                defenseBuff: 0.2312
+            }
+        },
+        {
+            name: "Aura of Madness",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "Sleep", "Recharge", "Fear", "Accuracy"],
+            allowedSetCategories: ["Confuse", "Fear", "Holds", "Sleep", "Stuns"],
+            description: "You emit a powerful psychic aura that causes the minds of those around you to become weak and distracted. Foes may be stunned, held, terrified or even confused in your presence, in addition to suffering a debuff derived from the applied control effect. Those that resist these effects will see their damage reduced. This power allows you to use your own Hit Points to keep enemies near you disabled. The power costs no endurance but can be dangerous to use.<br><br><color #fcfc95>Notes: Mez enhancements on this power enhance its magnitude instead of its duration.</color>",
+            shortHelp: "Toggle: PBAoE, Foe Confuse, Disorient, Sleep, Hold, Fear, -Damage(All), +Special",
+            icon: "psionicarmor_worldofconfusion.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 0.8,
+                recharge: 10.0,
+                cast: 1.67
+            }
+        },
+        {
+            name: "Memento Mori",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge", "Fear"],
+            allowedSetCategories: ["Endurance Modification", "Fear", "Healing"],
+            description: "Terrify your foes projecting images of their own impending demise into their minds. Memento Mori inflicts fear on targets while healing you even if you have been defeated. Each affected foe will increase your maximum hit points and heal you. Using this power while conscious will give you one opportunity to get back up should you be defeated while its effects are active.<br><br><color #fcfc95>Notes: This power recharges in <color #FF7F27>10</color> seconds if no foes are hit. Otherwise, it recharges in <color #FF7F27>300</color> seconds.</color>",
+            shortHelp: "Self Rez, +Max HP, Special",
+            icon: "psionicarmor_mementomori.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.2,
+                recharge: 300.0,
+                endurance: 18.2,
+                cast: 1.33
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/psionic-armor'] = STALKER_PSIONIC_ARMOR_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_PSIONIC_ARMOR_POWERSET = STALKER_PSIONIC_ARMOR_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/psionic-melee.js ----
+;/**
+ * Psionic Melee
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_PSIONIC_MELEE_POWERSET = {
+    name: "Psionic Melee",
+    category: "Unknown",
+    description: "Psionic Melee powerset",
+    icon: "psionic-melee_set.png",
+    powers: [
+        {
+            name: "Mental Strike",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You project psionic energy around your fist and strike at your foe dealing light Psionic and Smashing damage. Affected foes will have their recharge rate reduced. Mental Strike has a small chance to grant you Insight. While you have Insight, Mental Strike will deal additional minor psionic damage over time.",
+            shortHelp: "Melee, DMG(Psionic/Smash), Foe -Rech; Self +Insight",
+            icon: "psionicmelee_mentalstrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 1.0,
+                damage: {
+                    types: [
+                        {
+                            type: "Psionic",
+                            scale: 1.545
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.515
+                        }
+                    ],
+                    scale: 2.06
+                },
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Psi Blade",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You lash at your foe's mind with a mentally projected blade of psychic energy to deal moderate Psionic and Lethal damage. Affected foes will have their recharge rate reduced. Psi Blade has a moderate chance to grant you Insight. While you have Insight, Psi Blade will deal additional minor psionic damage over time.",
+            shortHelp: "Melee, DMG(Psionic/Lethal), Foe -Rech, Self +Insight",
+            icon: "psionicmelee_psiblade.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 5.0,
+                endurance: 5.928,
+                cast: 1.33,
+                damage: {
+                    types: [
+                        {
+                            type: "Psionic",
+                            scale: 2.0032
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 0.6677
+                        }
+                    ],
+                    scale: 2.6709
+                },
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Telekinetic Blow",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You project telekinetic energy around your fist before delivering a shattering uppercut to your foe dealing high Psionic and Smashing damage and sending them flying into the air. Telekinetic Blow has a high chance of granting you Insight. While you have Insight, Telekinetic Blow will deal additional minor psionic damage over time.",
+            shortHelp: "Melee, DMG(Psionic/Smash), Foe Knock Up, Self +Insight",
+            icon: "psionicmelee_telekineticblow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 9.0,
+                endurance: 9.36,
+                cast: 1.47,
+                damage: {
+                    types: [
+                        {
+                            type: "Psionic",
+                            scale: 2.6917
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.8972
+                        }
+                    ],
+                    scale: 3.5888999999999998
+                }
+            }
+        },
+        {
+            name: "Assassin's Psi Blade",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "A signature Stalker attack. This attack does superior psionic and smashing damage on its own as a frontal attack and cannot be interrupted. However, if it is executed while you are Hidden, this attack will do tremendous damage, as you waylay your unsuspecting foe. This attack may be interrupted if you move or are attacked while executing this power and are hidden. Using this power while not hidden has a chance to critically hit equal to 33.3% times the number of stacks of Assassin's Focus. Using Assassin's Psi Blade has a good chance to grant Insight if used while not hidden and a very high chance to grant Insight if used while hidden. Using Assassin's Strike when not hidden will remove all stacks of Assassin's Focus regardless if you critically hit or not.",
+            shortHelp: "Melee, DMG(Psionic/Smash), +Insight",
+            icon: "psionicmelee_assassinspsiblade.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 3.0
+            }
+        },
+        {
+            name: "Concentration",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly boosts your attacks for a few seconds. Slightly increases chance to hit.",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "psionicmelee_concentration.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 2.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Placate",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Allows you to trick a foe to no longer attack you. A Successful Placate will also Hide you. This Hide is very brief, and offers no Defense bonus, but it will allow you to deliver a Critical Hit or an Assassins Blow. However, if you attack a Placated Foe, he will be able to attack you back.",
+            shortHelp: "Ranged, Foe Placate, Self Stealth/Hide",
+            icon: "psionicmelee_placate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                cast: 0.8,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Boggle",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Accuracy"],
+            allowedSetCategories: ["Confuse"],
+            description: "You flood your foe's mind with doubt causing them to become confused for a brief time. Confused foes will attack their allies. Boggle will also place the \"Boggled\" effect on your target for a short time. Attacking a Boggled target will increase your chance of gaining Insight.",
+            shortHelp: "Short Ranged, Target Confuse, +Special",
+            icon: "psionicmelee_boggle.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 20.0,
+                endurance: 7.8,
+                cast: 2.0
+            }
+        },
+        {
+            name: "Greater Psi Blade",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Holds", "Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You focus and create a more powerful Psi Blade projection before slashing at your foe to deal superior Psionic and Lethal damage. The affected foe will have their recharge reduced moderately and be left held for a short time. Greater Psi Blade will cause additional damage and cause this power's hold to last for a longer duration if you have Insight. Using this power removes Insight.",
+            shortHelp: "Melee, DMG(Psionic/Lethal), Foe -Rech, Hold; Self -Insight",
+            icon: "psionicmelee_greaterpsiblade.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 2.5,
+                damage: {
+                    types: [
+                        {
+                            type: "Psionic",
+                            scale: 4.0649999999999995
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 1.3775
+                        }
+                    ],
+                    scale: 5.442499999999999
+                },
+                buffDuration: 6.0
+            }
+        },
+        {
+            name: "Mass Levitate",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee AoE Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You build up a large amount of telekinetic energy and release it causing nearby foes to be flung into the air. Affected foes will suffer high Smashing damage. If the caster has Insight when this power is used Mass Levitate will also cause a moderate amount of Psionic damage over time.",
+            shortHelp: "PBAoE, DMG(Smash), Foe Knock Up, +Insight",
+            icon: "psionicmelee_masslevitate.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 20.0,
+                endurance: 18.512,
+                cast: 2.5,
+                damage: {
+                    type: "Smashing",
+                    scale: 2.5999999999999996
+                }
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/psionic-melee'] = STALKER_PSIONIC_MELEE_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_PSIONIC_MELEE_POWERSET = STALKER_PSIONIC_MELEE_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/radiation-armor.js ----
+;/**
+ * Radiation Armor
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_RADIATION_ARMOR_POWERSET = {
+    name: "Radiation Armor",
+    category: "Unknown",
+    description: "Radiation Armor powerset",
+    icon: "radiation-armor_set.png",
+    powers: [
+        {
+            name: "Alpha Barrier",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You cloak yourself in a field of protective radiation that grants you a good deal of resistance to Lethal, Smashing and Toxic damage.",
+            shortHelp: "Toggle: Self +Res(Lethal, Smash, Toxic)",
+            icon: "radiationarmor_alphabarrier.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.67,
+                resistance: {
+                    smashing: 0.22499999999999998,
+                    lethal: 0.22499999999999998,
+                    toxic: 0.2625
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Hide",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Hide makes you almost impossible to detect. When properly 'Hidden\", a Stalker can pull off Critical hits with his attacks, and even land a massive 'Assassins Strike' with an Assassins power. When you attack or are damaged while using this power, you will be discovered. Even if discovered, you are hard to see and retain some bonus to Defense. Unlike most stealth powers, Hide can be used at the same time as other Concealment powers, giving you even greater stealth capability. No Endurance cost.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Toggle: Self Stealth, +DEF(Melee, Ranged, AoE)",
+            icon: "radiationarmor_hide.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                cast: 0.73,
+                defense: {
+                    smashing: 0.0375,
+                    lethal: 0.0375,
+                    fire: 0.0375,
+                    cold: 0.0375,
+                    energy: 0.0375,
+                    negative: 0.0375,
+                    psionic: 0.0375,
+                    toxic: 0.0375
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Gamma Boost",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "Gamma Boost grants you a passive boost to both regeneration and recovery. The lower your current health is, the greater the regeneration bonus you'll receive from Gamma Boost. The higher your current health is, the greater the recovery bonus you'll receive from Gamma Boost. This power is always active.",
+            shortHelp: "Auto: Self +Regen, +Recovery, Special",
+            icon: "radiationarmor_gammaboost.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                debuffResistance: {
+                    regeneration: 0.173
+                },
+                buffDuration: 1.25
+            }
+        },
+        {
+            name: "Proton Armor",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "When active, your body is encased in a shield-like radiation barrier that gives you good resistance to Energy and Fire damage and moderate resistance to Cold and Negative Energy attacks.",
+            shortHelp: "Toggle: Self, +Res(Energy, Fire, Cold and Negative)",
+            icon: "radiationarmor_protonarmor.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.13,
+                cast: 0.67,
+                resistance: {
+                    energy: 0.3,
+                    fire: 0.22499999999999998,
+                    negative: 0.22499999999999998,
+                    cold: 0.056249999999999994
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Fallout Shelter",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "While active you are protected from recharge, movement, hold, sleep, immobilize, stun and knockdown effects. Additionally Fallout Shelter grants you minor resistance to toxic and psionic damage as well as a measure of resistance against slow effects.",
+            shortHelp: "Toggle: Self +Res(Hold, Sleep, Immobilize, Stun, Knockdown, Toxic, Psi, Slow)",
+            icon: "radiationarmor_falloutshelter.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 0.73,
+                protection: {
+                    hold: 10.379999999999999,
+                    stun: 10.379999999999999,
+                    sleep: 10.379999999999999,
+                    immobilize: 10.379999999999999
+                },
+                resistance: {
+                    fire: 0.0375,
+                    energy: 0.0375,
+                    negative: 0.0375,
+                    psionic: 0.11249999999999999,
+                    toxic: 0.11249999999999999
+                },
+                debuffResistance: {
+                    recharge: 0.3633,
+                    movement: 0.3633,
+                    tohit: 0.3
+                },
+                stun: 1.0,
+                stunDuration: 0.75,
+                buffDuration: 0.75,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Radiation Therapy",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Healing", "Endurance Modification", "Healing", "Melee AoE Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You channel a tremendous amount of radiation into a barrier around you. For a short time you will have a strong absorption shield in addition to a regeneration and recovery buff.<br><br><br><color #fcfc95>Notes: This power has adaptive recharge. It has a base recharge of <color #FF7F27>15</color> </color> seconds and each affected foe will increase the recharge by a varying amount. First target adds <color #FF7F27>12</color> seconds for a maximum total of <color #FF7F27>60</color> seconds.</color>",
+            shortHelp: "PBAoE, DMG(Energy), DoT(Toxic), Foe -Regen, Self +HP, +End, Res(-Regen)",
+            icon: "radiationarmor_radiationtherapy.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.2,
+                recharge: 60.0,
+                endurance: 13.0,
+                cast: 1.03
+            }
+        },
+        {
+            name: "Particle Shielding",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You channel a tremendous amount of radiation into a barrier around you. For a short time you will have a strong absorption shield in addition to a regeneration and recovery buff.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self, +Absorb, +Regeneration",
+            icon: "radiationarmor_particleshielding.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 120.0,
+                endurance: 10.4,
+                cast: 0.73,
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Ground Zero",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Healing", "Melee AoE Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You release a mixture of radiation into the area. Nearby foes will be barraged with harmful radiation and will suffer Moderate Energy damage immediately, followed by moderate toxic damage over time. Affected foes will also have their defense reduced. Nearby allies will be healed for a moderate amount and will recover health over time. This power can affect a total of 30 targets. This includes both friends and foes. Ground Zero has no effect on the caster, only nearby allies and enemies.",
+            shortHelp: "PBAoE, Foe DMG(Energy), DoT (Toxic), -DEF(All), Ally +HP, +Heal over time",
+            icon: "radiationarmor_groundzero.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.2,
+                recharge: 90.0,
+                endurance: 13.0,
+                cast: 3.0
+            }
+        },
+        {
+            name: "Meltdown",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Resist Damage"],
+            description: "After building up a dangerous amount of radiation you release it to both shield and empower yourself. While active you will gain a good amount of damage resistance to all types of damage, recover endurance more quickly and deal more damage for a short time. When this power wears off you will lose a small amount endurance.",
+            shortHelp: "Self, +Res(All), +Recovery, +DMG(All)",
+            icon: "radiationarmor_meltdown.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 480.0,
+                endurance: 2.6,
+                cast: 2.93,
+                resistance: {
+                    smashing: 0.15,
+                    lethal: 0.15,
+                    fire: 0.15,
+                    cold: 0.15,
+                    energy: 0.15,
+                    negative: 0.15,
+                    psionic: 0.15,
+                    toxic: 0.15
+                },
+                debuffResistance: {
+                    recovery: 1.0
+                },
+                buffDuration: 60.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/radiation-armor'] = STALKER_RADIATION_ARMOR_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_RADIATION_ARMOR_POWERSET = STALKER_RADIATION_ARMOR_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/radiation-melee.js ----
+;/**
+ * Radiation Melee
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_RADIATION_MELEE_POWERSET = {
+    name: "Radiation Melee",
+    category: "Unknown",
+    description: "Radiation Melee powerset",
+    icon: "radiation-melee_set.png",
+    powers: [
+        {
+            name: "Contaminated Strike",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You charge your fist with harmful radioactive particles and quickly strike your foe dealing Light Energy and Smashing damage as well as reducing their defense. Affected enemies have a small chance to be affected by the Contaminated effect. Hitting Contaminated foes with single target Radiation Melee powers cause a small burst of damage to foes near the target.",
+            shortHelp: "Melee, DMG(Energy/Smash), Foe -Def, Special",
+            icon: "radiationmelee_contaminatedstrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 0.83,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 1.4557
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.48519999999999996
+                        }
+                    ],
+                    scale: 1.9409
+                },
+                defenseDebuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Radioactive Smash",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Knockback", "Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You channel a greater amount of radiation into your fists and deliver a hard hitting blow that deals Moderate Energy and Smashing damage to the target as well as reducing their Defense for a short time. Affected targets also have a chance to be knocked down and have a moderate chance to be affected by the Contaminated effect. Hitting Contaminated foes with single target Radiation Melee powers cause a small burst of damage to foes near the target.",
+            shortHelp: "Melee, DMG(Energy/Smash), Foe -Def, Knockdown, Special",
+            icon: "radiationmelee_radioactivesmash.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 7.0,
+                endurance: 7.696,
+                cast: 1.5,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 2.4075
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 0.8025
+                        }
+                    ],
+                    scale: 3.21
+                },
+                defenseDebuff: 1.5,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Proton Sweep",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Melee AoE Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You release a cloud of deadly radioactive particles in front of you inflicting Moderate Energy and Toxic damage over a short time as well as reducing the targets' defense. Affected enemies have a moderate chance to be affected by the Contaminated effect. Hitting Contaminated foes with single target Radiation Melee powers cause a small burst of damage to foes near the target.",
+            shortHelp: "Melee Cone, DoT(Energy/Toxic), Foe -Def, Special",
+            icon: "radiationmelee_protonsweep.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 1.309,
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.67,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Toxic",
+                            scale: 0.5566,
+                            ticks: 3
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.1856,
+                            ticks: 3
+                        }
+                    ]
+                },
+                buffDuration: 3.1,
+                defenseDebuff: 1.2
+            }
+        },
+        {
+            name: "Assassin's Corruption",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "A signature Stalker attack. This attack does superior energy and smashing damage on its own as a frontal attack and cannot be interrupted. However, if it is executed while you are Hidden, this attack will do tremendous damage, as you waylay your unsuspecting foe. This attack may be interrupted if you move or are attacked while executing this power and are hidden. Using this power while not hidden has a chance to critically hit equal to 33.3% times the number of stacks of Assassin's Focus. Using Assassin's Strike when not hidden will remove all stacks of Assassin's Focus regardless if you critically hit or not. Assassin's Corruption also has a very high chance to inflict Contaminated while hidden and a high chance while unhidden. Hitting Contaminated foes with single target Radiation Melee powers cause a small burst of damage to foes near the target.",
+            shortHelp: "Melee, DMG(Smashing, Energy)",
+            icon: "radiationmelee_assassinsstrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 3.0
+            }
+        },
+        {
+            name: "Build Up",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your chance to hit.",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "radiationmelee_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Placate",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Allows you to trick a foe to no longer attack you. A Successful Placate will also Hide you. This Hide is very brief, and offers no Defense bonus, but it will allow you to deliver a Critical Hit or an Assassins Strike. However, if you attack a Placated Foe, he will be able to attack you back.",
+            shortHelp: "Ranged, Foe Placate, Self Stealth/Hide",
+            icon: "radiationmelee_placate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                cast: 0.8,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Radiation Siphon",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Accurate Healing", "Defense Debuff", "Healing", "Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You pummel your foe with a deadly smashing attack dealing High Energy and Smashing damage and reducing their defense. Hitting Contaminated targets will also heal you for a large amount of health over 3 seconds and remove the Contaminated effect from the target. However, uncontaminated targets have a moderate chance to be affected by the Contaminated effect. Hitting Contaminated foes with single target Radiation Melee powers cause a small burst of damage to foes near the target.",
+            shortHelp: "Melee, DMG(Energy/Smash), Foe, -Def, -Contaminated, Special",
+            icon: "radiationmelee_radiationsiphon.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 10.0,
+                endurance: 10.192,
+                cast: 2.23,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 3.2407
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.0802
+                        }
+                    ],
+                    scale: 4.3209
+                },
+                healing: {
+                    scale: 80.32128252999999,
+                    perTarget: true
+                },
+                defenseDebuff: 1.5,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Devastating Blow",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Melee Damage", "Stalker Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "You hammer your foe with a brutal smashing attack charged with a lethal dose of radiation. Your target will suffer Extreme Energy and Smashing damage, will have its defense reduced and will be disoriented for a short time. Affected enemies will be affected by the Contaminated effect. Hitting Contaminated foes with single target Radiation Melee powers cause a small burst of damage to foes near the target.",
+            shortHelp: "Melee, DMG(Energy/Smash), Foe -Def, Disorient, Special",
+            icon: "radiationmelee_devastatingblow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 17.0,
+                endurance: 16.016,
+                cast: 2.67,
+                damage: {
+                    types: [
+                        {
+                            type: "Energy",
+                            scale: 4.5217
+                        },
+                        {
+                            type: "Smashing",
+                            scale: 1.5072
+                        }
+                    ],
+                    scale: 6.0289
+                },
+                defenseDebuff: 2.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Atom Smasher",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Melee AoE Damage", "Stalker Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "You charge up a dangerously unstable amount of radioactive energy into a single fist before driving it into the ground and causing a small explosion. Foes caught in the blast will suffer High Energy and Toxic damage and have their defense reduced. Enemies also have a moderate chance to be disoriented for a short time. Affected enemies have a small chance to be affected by the Contaminated effect. Hitting Contaminated foes with single target Radiation Melee powers cause a small burst of damage to foes near the target.",
+            shortHelp: "PBAoE, DMG(Energy/Toxic), Foe -Def, Disorient, Special",
+            icon: "radiationmelee_atomsmasher.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 22.0,
+                endurance: 20.176,
+                cast: 2.93,
+                damage: {
+                    types: [
+                        {
+                            type: "Toxic",
+                            scale: 2.1618
+                        },
+                        {
+                            type: "Energy",
+                            scale: 0.7206
+                        }
+                    ],
+                    scale: 2.8824
+                },
+                defenseDebuff: 1.2,
+                buffDuration: 10.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/radiation-melee'] = STALKER_RADIATION_MELEE_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_RADIATION_MELEE_POWERSET = STALKER_RADIATION_MELEE_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/regeneration.js ----
+;/**
+ * Regeneration
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_REGENERATION_POWERSET = {
+    name: "Regeneration",
+    category: "Unknown",
+    description: "Regeneration powerset",
+    icon: "regeneration_set.png",
+    powers: [
+        {
+            name: "Hide",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Hide makes you almost impossible to detect. When properly 'Hidden\", a Stalker can pull off Critical hits with his attacks, and even land a massive 'Assassins Strike' with an Assassins power. When you attack or are damaged while using this power, you will be discovered. Even if discovered, you are hard to see and retain some bonus to Defense. Unlike most stealth powers, Hide can be used at the same time as other Concealment powers, giving you even greater stealth capability. No Endurance cost.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Toggle: Self Stealth, +DEF(Melee, Ranged, AoE)",
+            icon: "regeneration_hide.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                cast: 0.73,
+                defense: {
+                    smashing: 0.0375,
+                    lethal: 0.0375,
+                    fire: 0.0375,
+                    cold: 0.0375,
+                    energy: 0.0375,
+                    negative: 0.0375,
+                    psionic: 0.0375,
+                    toxic: 0.0375
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Reconstruction",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing", "Resist Damage"],
+            description: "Through perfect control of your body, you can concentrate for a few moments and heal yourself. The effects of Reconstruction also leaves you resistant to Toxic damage for a while.",
+            shortHelp: "Self Heal, Res(Toxic)",
+            icon: "regeneration_reconstruction.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 60.0,
+                endurance: 10.4,
+                cast: 0.73,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 2.0,
+                    ticks: 30
+                },
+                resistance: {
+                    toxic: 0.15
+                },
+                healing: {
+                    scale: 301.18975,
+                    perTarget: true
+                },
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Fast Healing",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "You heal Hit Points and recovery Endurance at a faster rate than normal. This power is always on.",
+            shortHelp: "Auto: Self +Regeneration, +Recovery",
+            icon: "regeneration_fasthealing.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                debuffResistance: {
+                    regeneration: 0.2,
+                    recovery: 0.2
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Ailment Resistance",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Healing"],
+            description: "Your superior immune system makes you resilient to disease and multiple ailments. Healing techniques also become more effective. This power is always on.",
+            shortHelp: "Auto: Self +Max HP, -Res(Heal), Res(-Defense, -Endurance, -Speed, -Regeneration, -Recovery, -Recharge, -Range, -ToHit)",
+            icon: "regeneration_resiststun.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 360.0,
+                debuffResistance: {
+                    tohit: 0.2,
+                    defense: 0.2,
+                    recharge: 0.2,
+                    movement: 0.2,
+                    regeneration: 0.2,
+                    recovery: 0.2,
+                    endurance: 0.2
+                },
+                buffDuration: 10.3,
+                tohitBuff: 0.2
+            }
+        },
+        {
+            name: "Integration",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "You can Integrate your mind and body, making you resistant to Knockback, Disorient, Hold, Sleep, and Immobilization effects, as well as increase your regeneration rate, for as long as you can keep this toggle power active.",
+            shortHelp: "Toggle: Self +Res(Knockback, Disorient, Hold, Sleep, Immobilize), +Regeneration",
+            icon: "regeneration_integration.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.13,
+                cast: 3.1,
+                protection: {
+                    hold: 10.379999999999999,
+                    stun: 10.379999999999999,
+                    sleep: 10.379999999999999,
+                    immobilize: 10.379999999999999
+                },
+                debuffResistance: {
+                    tohit: 0.3,
+                    defense: 0.3,
+                    recharge: 0.3,
+                    movement: 0.5
+                },
+                buffDuration: 0.75,
+                stun: 1.0,
+                stunDuration: 0.75,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Resilience",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "You are more Resilient. This power allows you to build up a resistance to Disorientation effects. You tend not to get Disoriented, and if you do, it wears off quickly. This resistance to Disorientation gets stronger as you go up in level. Resilience also grants some resistance to all types of damage. This power is always on.",
+            shortHelp: "Auto: Self +Res(Disorient, All DMG)",
+            icon: "regeneration_resist.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                protection: {
+                    stun: 5.1899999999999995
+                },
+                resistance: {
+                    smashing: 0.09375,
+                    lethal: 0.09375,
+                    fire: 0.09375,
+                    cold: 0.09375,
+                    energy: 0.09375,
+                    negative: 0.09375,
+                    psionic: 0.09375,
+                    toxic: 0.09375
+                },
+                stun: 1.0,
+                stunDuration: 10.25,
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Instant Healing",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "When you activate this power, you can regenerate your health at an astounding rate. This boost to your Regeneration Rate lasts about a minute and takes a long time to recharge once used.<br><br>This power is mutually exclusive from Reactive Regeneration.",
+            shortHelp: "Click: Self +Regeneration",
+            icon: "regeneration_instanthealing.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 650.0,
+                endurance: 10.4,
+                cast: 1.17,
+                buffDuration: 90.0
+            }
+        },
+        {
+            name: "Reactive Regeneration",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "When you activate this power, you can regenerate your health at an astounding rate. This boost becomes stronger every time you take damage, as it scales you also become resistant to regeneration and recovery debuffs as well as endurance drain.<br><br>This power is mutually exclusive from Instant Healing.",
+            shortHelp: "Toggle: Self +Regeneration, +Res(-Regeneration, -End, -Recovery)",
+            icon: "regeneration_instanthealing.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.52,
+                cast: 1.17
+            }
+        },
+        {
+            name: "Second Wind",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "When you use this power you will recover a percentage of your missing health, in addition to increasing your maximum hit points. Should you fall in battle after using this power, you can stand up and fight again. If used while defeated, you will enter stand back up and be protected from XP Debt for 90 seconds and immune to most damage for 15 seconds.<br><br><color #fcfc95>Note: the self resurect granted if this power is activated while alive can not be enhanced.</color>",
+            shortHelp: "Self +Max HP, Rez(Special)",
+            icon: "regeneration_dullpain.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 360.0,
+                endurance: 10.4,
+                cast: 0.73
+            }
+        },
+        {
+            name: "Moment of Glory",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Endurance Modification", "Resist Damage"],
+            description: "When you activate this power, you deal increased damage, recover Endurance more quickly, gain Resistance and Defense to all damage types, and are highly resistant to Knock Back, Sleep, Disorient, Immobilization, and Hold effects.",
+            shortHelp: "Self +DMG, +Res(All DMG, Knock Back, Repel, Stun, Hold, Sleep, Immobilize), +DEF(All DMG), +Recovery",
+            icon: "regeneration_momentofglory.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 240.0,
+                endurance: 2.6,
+                cast: 1.5
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/regeneration'] = STALKER_REGENERATION_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_REGENERATION_POWERSET = STALKER_REGENERATION_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/savage-melee.js ----
+;/**
+ * Savage Melee
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_SAVAGE_MELEE_POWERSET = {
+    name: "Savage Melee",
+    category: "Unknown",
+    description: "Savage Melee powerset",
+    icon: "savage-melee_set.png",
+    powers: [
+        {
+            name: "Maiming Slash",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Slow Movement", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You execute a savage slash at your foe's lower body causing moderate lethal damage and minor damage over time. The foe will also have their movement speed reduced moderately. Maiming Slash grants 1 stack of Blood Frenzy.",
+            shortHelp: "Melee, DMG(Lethal), DoT (Lethal), Foe -Speed), Self +1 Blood Frenzy",
+            icon: "savagemelee_maimingslash.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 5.0,
+                endurance: 6.03,
+                cast: 1.17,
+                damage: {
+                    type: "Lethal",
+                    scale: 2.5785
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Savage Strike",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You quickly tear at your foe dealing minor lethal damage and causing minor lethal damage over time. Savage Strikes grants you 1 stack of Blood Frenzy.",
+            shortHelp: "Melee, DMG(Lethal), Foe DoT (Lethal), Self +1 Blood Frenzy",
+            icon: "savagemelee_savagestrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 2.5,
+                endurance: 3.95,
+                cast: 0.8,
+                dotDamage: {
+                    type: "Lethal",
+                    scale: 0.9104,
+                    ticks: 1
+                },
+                buffDuration: 0.4
+            }
+        },
+        {
+            name: "Shred",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Melee AoE Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You rapidly slash at your foes several times causing a moderate amount of damage to all enemies in front of you and reduce their defense. Shred also causes minor lethal damage over time. This power grants 1 stack of Blood Frenzy.",
+            shortHelp: "Melee (Cone), DMG(Lethal), Foe DoT (Lethal), -Def(All), Self +1 Blood Frenzy",
+            icon: "savagemelee_shred.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 1.3963,
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 7.5,
+                endurance: 8.11,
+                cast: 2.17,
+                dotDamage: {
+                    type: "Lethal",
+                    scale: 0.5091,
+                    ticks: 5
+                },
+                buffDuration: 2.0,
+                defenseDebuff: 1.2
+            }
+        },
+        {
+            name: "Assassin's Frenzy",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "A signature Stalker attack. This attack does superior lethal damage on its own as a frontal attack and cannot be interrupted. However, if it is executed while you are Hidden, this attack will do tremendous damage, as you waylay your unsuspecting foe. This attack may be interrupted if you move or are attacked while executing this power and are hidden. Using this power while not hidden has a chance to critically hit equal to 33.3% times the number of stacks of Assassin's Focus. Using Assassin's Frenzy will grant 2 stacks of Blood Frenzy if used while not hidden and will grant 3 stacks if hidden. Using Assassin's Strike when not hidden will remove all stacks of Assassin's Focus regardless if you critically hit or not. Assassin's Frenzy grants 2 stacks of Blood Frenzy.",
+            shortHelp: "Melee, DMG(Lethal)), Self +1 Blood Frenzy",
+            icon: "savagemelee_assassinstrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 15.0,
+                endurance: 14.35,
+                cast: 3.0
+            }
+        },
+        {
+            name: "Build Up",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your chance to hit.",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "savagemelee_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Placate",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Allows you to trick a foe to no longer attack you. A Successful Placate will also Hide you. This Hide is very brief, and offers no Defense bonus, but it will allow you to deliver a Critical Hit or an Assassins Claw. However, if you attack a Placated Foe, he will be able to attack you back.",
+            shortHelp: "Ranged, Foe Placate, Self Stealth/Hide",
+            icon: "savagemelee_placate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                cast: 0.8,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Rending Flurry",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee AoE Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You wildly slash at nearby foes to deal moderate lethal damage and cause minor lethal damage over time. This power consumes all Blood Frenzy and will deal additional damage per stack of Blood Frenzy consumed. If you have 5 stacks of Blood Frenzy while activating this power, its radius is greatly increased, but causes you to become Exhausted for a short time. While exhausted you cannot gain Blood Frenzy.",
+            shortHelp: "PBAoE, DMG(Lethal), Foe DoT (Lethal), -Blood Frenzy",
+            icon: "savagemelee_rendingflurry.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 14.0,
+                endurance: 13.52,
+                cast: 2.17
+            }
+        },
+        {
+            name: "Hemorrhage",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You viciously tear at your foe causing a light amount of lethal damage. Additionally, the target will suffer from lethal damage over time. Hemorrhage consumes all stacks of Blood Frenzy. This power's damage over time effect will scale with the number of stacks of Blood Frenzy. Using this power with 5 stacks of Blood Frenzy causes you to become Exhausted for a short time, but the duration of Hemorrhage's damage over time effect is increased. While exhausted you cannot gain Blood Frenzy.",
+            shortHelp: "Melee, DMG(Lethal), Foe Special DoT (Lethal), -Blood Frenzy",
+            icon: "savagemelee_hemorrhage.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 14.0,
+                endurance: 13.52,
+                cast: 2.0,
+                damage: {
+                    type: "Lethal",
+                    scale: 1.4498
+                }
+            }
+        },
+        {
+            name: "Savage Leap",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee AoE Damage", "Stalker Archetype Sets", "Teleport", "Universal Damage Sets", "Universal Travel"],
+            description: "You throw yourself at your distant foes while slashing and tearing wildly dealing moderate lethal damage and causing your foes to suffer from additional minor lethal damage over time. The damage of this power can increase based on how far away you leap from, with up to double damage dealt at its strongest. Savage Leap build 1 stacks of Blood Frenzy for every 20 ft in between your target and you, up to 3 stacks.",
+            shortHelp: "PBAoE, DMG(Lethal), Foe DoT (Lethal), 1 to 3 Blood Frenzy, Self Teleport",
+            icon: "savagemelee_savageleap.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 70.0,
+                recharge: 40.0,
+                endurance: 17.58,
+                cast: 1.17
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/savage-melee'] = STALKER_SAVAGE_MELEE_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_SAVAGE_MELEE_POWERSET = STALKER_SAVAGE_MELEE_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/shield-defense.js ----
+;/**
+ * Shield Defense
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_SHIELD_DEFENSE_POWERSET = {
+    name: "Shield Defense",
+    category: "Unknown",
+    description: "Shield Defense powerset",
+    icon: "shield-defense_set.png",
+    powers: [
+        {
+            name: "Deflection",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Resist Damage"],
+            description: "Your mastery of the shield allows you to easily deflect melee attacks, and attacks that do get through your ironclad defenses tend to do less damage. While Deflection is active the user will gain defense to melee attacks and some minor resistance to lethal and smashing damage.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +DEF(Melee), +Res(Lethal, Smashing)",
+            icon: "shielddefense_activedefense.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 1.5,
+                defense: {
+                    psionic: 0.11249999999999999
+                },
+                resistance: {
+                    smashing: 0.11249999999999999,
+                    lethal: 0.11249999999999999
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Hide",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Hide makes you almost impossible to detect. When properly 'Hidden\", a Stalker can pull off Critical hits with his attacks, and even land a massive 'Assassins Strike' with an Assassins power. When you attack or are damaged while using this power, you will be discovered. Even if discovered, you are hard to see and retain some bonus to Defense. Unlike most stealth powers, Hide can be used at the same time as other Concealment powers, giving you even greater stealth capability. No Endurance cost.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Toggle: Self Stealth, +DEF(Melee, Ranged, AoE)",
+            icon: "shielddefense_hide.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                cast: 0.73,
+                defense: {
+                    smashing: 0.0375,
+                    lethal: 0.0375,
+                    fire: 0.0375,
+                    cold: 0.0375,
+                    energy: 0.0375,
+                    negative: 0.0375,
+                    psionic: 0.0375,
+                    toxic: 0.0375
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Battle Agility",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Your incredible agility allows you to position your shield to protect yourself from incoming ranged damage. While Battle Agility is active you will benefit from increased Ranged and AoE defense as well as some moderate protection from Defense Debuffs.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +DEF(Ranged, AoE), +Res(Defense Debuff)",
+            icon: "shielddefense_deflection.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 1.5,
+                debuffResistance: {
+                    defense: 0.1384
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "True Grit",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Healing", "Resist Damage"],
+            description: "Your intense training has left you tougher than even the hardiest of heroes. You gain additional hit points and resistance to fire, cold, energy, negative energy and toxic damage sources. This power is always on and costs no Endurance.",
+            shortHelp: "Auto: Self +Res (Cold, Energy, Fire, Negative Energy, Toxic), +MaxHealth",
+            icon: "shielddefense_truegrit.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Fire",
+                            scale: 1.5,
+                            ticks: 5
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.5,
+                            ticks: 5
+                        },
+                        {
+                            type: "Energy",
+                            scale: 1.5,
+                            ticks: 5
+                        },
+                        {
+                            type: "Negative",
+                            scale: 1.5,
+                            ticks: 5
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 1.5,
+                            ticks: 5
+                        }
+                    ]
+                },
+                resistance: {
+                    fire: 0.11249999999999999,
+                    cold: 0.11249999999999999,
+                    energy: 0.11249999999999999,
+                    negative: 0.11249999999999999,
+                    toxic: 0.11249999999999999
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Active Defense",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "When you activate this power, it grants protection from Sleep, Disorient, Fear, Immobilize, Confusion, Repel, Knockback, Hold and Defense Debuff effects for a short duration.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self Res (Disorient, Hold, Immobilize, Sleep, Fear, Confuse, Repel, Knockback, Defense Debuff)",
+            icon: "shielddefense_battleagility.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 200.0,
+                endurance: 10.4,
+                cast: 1.5,
+                protection: {
+                    hold: 10.379999999999999,
+                    stun: 10.379999999999999,
+                    sleep: 10.379999999999999,
+                    immobilize: 10.379999999999999,
+                    fear: 10.379999999999999,
+                    confuse: 10.379999999999999
+                },
+                debuffResistance: {
+                    tohit: 0.3,
+                    defense: 0.3,
+                    recharge: 0.3,
+                    movement: 0.5
+                },
+                stun: 1.0,
+                stunDuration: 120.0,
+                buffDuration: 120.0,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Against All Odds",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "The harder pressed you are in combat the greater your offensive abilities become. Each enemy that stands toe-to-toe with you in combat will grant you a damage bonus. The first foe you engage in melee grants the highest damage bonus, and up to 10 foes can contribute to this effect. Each foe in melee range also suffers from reduced damage as your shield deflects a portion of their damage.<br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Toggle: Self +DMG, Foe -DMG",
+            icon: "shielddefense_againstallodds.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.208,
+                cast: 2.5,
+                buffDuration: 1.25
+            }
+        },
+        {
+            name: "Grant Cover",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "You are able to use your shield to defend nearby allies. Any teammates who remain nearby gain a bonus to their defense. As a stalker, you can also provide stealth to your teammates if you too are hidden. Additionally, while this power is active, the user and his team mates will gain some resistance to defense and recharge rate debuffs.<br><br><color #fcfc95>Notes: The defense bonus from this power is only applied to nearby team mates, but not yourself.</color><br><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "PBAoE, Team (but not self) +DEF(All but Psionic), Team +RES(Defense Debuff, Recharge Debuff)",
+            icon: "shielddefense_grantcover.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 255,
+            effects: {
+                accuracy: 1.0,
+                recharge: 10.0,
+                endurance: 0.312,
+                cast: 2.5,
+                buffDuration: 2.25
+            }
+        },
+        {
+            name: "Shield Charge",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee AoE Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You can throw all of your might behind your shield and charge through ranks of foes in the blink of an eye. Using this power allows you to teleport to a selected area to deal significant smashing damage to all foes near the location you teleport to, most foes that are struck by your Shield Charge will be knocked down.<br><br><color #fcfc95>Damage: Superior.</color><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "PBAoE Superior DMG(Smashing), Foe Knockdown; Self Teleport",
+            icon: "shielddefense_shieldcharge.png",
+            powerType: "Click",
+            targetType: "Location (Teleport)",
+            effectArea: "Location",
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 90.0,
+                endurance: 13.52,
+                cast: 1.5,
+                buffDuration: 4.0
+            }
+        },
+        {
+            name: "One with the Shield",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction"],
+            allowedSetCategories: ["Endurance Modification", "Healing", "Resist Damage"],
+            description: "When you activate this power, you gain strong resistance against most types of damage and also to Disorient, Immobilization, Hold, Knockback, Repel and Sleep effects. One with the Shield costs little Endurance to activate and increases your recovery and maximum hit points for its duration, but when it wears off you are left exhausted, and substantially drained of Endurance.<br><br><color #fcfc95>Notes: One with the Shield is unaffected by Recharge Time changes.</color><br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Self, +Res(Disorient, Sleep, Hold, Immobilize, Repel, Knockback, All DMG but Psi), +Recovery, +Max HP",
+            icon: "shielddefense_onewiththeshield.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 360.0,
+                endurance: 2.6,
+                cast: 2.5,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 3.0,
+                            ticks: 60
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 3.0,
+                            ticks: 60
+                        },
+                        {
+                            type: "Fire",
+                            scale: 1.5,
+                            ticks: 60
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.5,
+                            ticks: 60
+                        },
+                        {
+                            type: "Energy",
+                            scale: 1.5,
+                            ticks: 60
+                        },
+                        {
+                            type: "Negative",
+                            scale: 1.5,
+                            ticks: 60
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 1.5,
+                            ticks: 60
+                        }
+                    ]
+                },
+                protection: {
+                    hold: 17.299999999999997,
+                    stun: 17.299999999999997,
+                    sleep: 17.299999999999997,
+                    immobilize: 17.299999999999997
+                },
+                resistance: {
+                    smashing: 0.22499999999999998,
+                    lethal: 0.22499999999999998,
+                    fire: 0.11249999999999999,
+                    cold: 0.11249999999999999,
+                    energy: 0.11249999999999999,
+                    negative: 0.11249999999999999,
+                    toxic: 0.11249999999999999
+                },
+                buffDuration: 120.0,
+                stun: 1.0,
+                stunDuration: 120.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/shield-defense'] = STALKER_SHIELD_DEFENSE_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_SHIELD_DEFENSE_POWERSET = STALKER_SHIELD_DEFENSE_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/spines.js ----
+;/**
+ * Spines
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_SPINES_POWERSET = {
+    name: "Spines",
+    category: "Unknown",
+    description: "Spines powerset",
+    icon: "spines_set.png",
+    powers: [
+        {
+            name: "Barb Swipe",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Slow Movement", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "Shred your opponent with several quick Swipes from your Spines. Barb Swipe deals Light Lethal damage and a minor amount of additional Toxic damage over time and Slows affected foes.",
+            shortHelp: "Melee, DMG(Lethal), DoT(Toxic), -SPD, -Recharge",
+            icon: "quills_swipe.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 0.83,
+                damage: {
+                    type: "Lethal",
+                    scale: 1.9409999999999998
+                },
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.1,
+                    ticks: 2
+                },
+                buffDuration: 2.1
+            }
+        },
+        {
+            name: "Lunge",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Slow Movement", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You Lunge forward, stabbing and poisoning a foe with the large Spine on your arm. Lunge deals moderate lethal damage. Spine poison deals additional Toxic damage and Slows affected foes.",
+            shortHelp: "Melee, DMG(Lethal), DoT(Toxic) -SPD, -Recharge",
+            icon: "quills_lunge.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.63,
+                damage: {
+                    type: "Lethal",
+                    scale: 3.101
+                },
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.1,
+                    ticks: 3
+                },
+                buffDuration: 3.1
+            }
+        },
+        {
+            name: "Spine Burst",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee AoE Damage", "Slow Movement", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You can fling dozens of Spines in all directions. These Spines only travel a short distance, but they can deal moderate lethal damage and poison any target close to you. Spine poison deals additional Toxic damage and Slows affected foes. If executed while hidden, all affected targets have a chance to be hit with a Critical Hit for extra damage.",
+            shortHelp: "PBAoE Melee, DMG(Lethal), DoT(Toxic), -SPD, -Recharge",
+            icon: "quills_flingquills.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 3.0,
+                damage: {
+                    type: "Lethal",
+                    scale: 1.8662
+                },
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.1,
+                    ticks: 3
+                },
+                buffDuration: 3.1
+            }
+        },
+        {
+            name: "Assassin's Impaler",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "A signature Stalker attack. This attack does superior lethal damage on its own as a frontal attack and cannot be interrupted. However, if it is executed while you are Hidden, this attack will do tremendous damage, as you impale your unsuspecting foe. This attack may be interrupted if you move or are attacked while executing this power and are hidden. Using this power while not hidden has a chance to critically hit equal to 33.3% times the number of stacks of Assassin's Focus. Using Assassin's Strike when not hidden will remove all stacks of Assassin's Focus regardless if you critically hit or not.",
+            shortHelp: "Melee, DMG(Lethal)",
+            icon: "quills_assassinstrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 3.0
+            }
+        },
+        {
+            name: "Build Up",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your chance to hit.",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "quills_bristle.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 0.73,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Placate",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Allows you to trick a foe to no longer attack you. A Successful Placate will also Hide you. This Hide is very brief, and offers no Defense bonus, but it will allow you to deliver a Critical Hit or an Assassins Impaler. However, if you attack a Placated Foe, he will be able to attack you back.",
+            shortHelp: "Ranged, Foe Placate, Self Stealth/Hide",
+            icon: "quills_placate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                cast: 0.8,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Impale",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Immobilize", "Ranged Damage", "Slow Movement", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You can throw a single large Spine at a targeted foe. This Spine does only moderate lethal damage, but carries a large amount of the Spine toxin. A successful attack can completely Immobilize most foes, as well as Slowing them and dealing Toxic poison damage. Impale can also bring down flying entities.",
+            shortHelp: "Ranged, DMG(Lethal), DoT(Toxic), Immobilize, -Recharge, -Fly",
+            icon: "quills_impale.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 40.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 2.43,
+                damage: {
+                    type: "Lethal",
+                    scale: 4.061
+                },
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.1,
+                    ticks: 4
+                },
+                buffDuration: 4.1
+            }
+        },
+        {
+            name: "Ripper",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee AoE Damage", "Slow Movement", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You can unleash a spectacular slashing maneuver that attacks all foes in a wide arc in front of you. Ripper deals massive lethal damage and poisons multiple targets. It can even knock foes down. Spine poison Slows affected targets and deals additional Toxic damage. If executed while hidden, all affected targets have a chance to be hit with a Critical Hit for extra damage.",
+            shortHelp: "Melee (Cone), DMG(Lethal), DoT(Toxic), Knockback, -SPD, -Recharge",
+            icon: "quills_bonesword.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 11.0,
+                endurance: 11.024,
+                cast: 2.33,
+                damage: {
+                    type: "Lethal",
+                    scale: 3.6689
+                },
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.2,
+                    ticks: 4
+                },
+                buffDuration: 4.1
+            }
+        },
+        {
+            name: "Throw Spines",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Slow", "EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Ranged AoE Damage", "Slow Movement", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You can throw dozens of Spines in a wide cone in front of you, impaling foes caught within the range. Spine throwing deals moderate lethal damage, and poisons any targets it hits. Spine poison deals additional Toxic damage and Slows affected foes. If executed while hidden, all affected targets have a chance to be hit with a Critical Hit for extra damage.",
+            shortHelp: "Ranged (Cone), DMG(Lethal), DoT(Toxic), -SPD, -Recharge",
+            icon: "quills_quillthrowing.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 10,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.0,
+                range: 30.0,
+                recharge: 12.0,
+                endurance: 13.0,
+                cast: 1.63,
+                damage: {
+                    type: "Lethal",
+                    scale: 1.8888
+                },
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 0.1,
+                    ticks: 4
+                },
+                buffDuration: 4.1
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/spines'] = STALKER_SPINES_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_SPINES_POWERSET = STALKER_SPINES_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/staff-fighting.js ----
+;/**
+ * Staff Fighting
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_STAFF_FIGHTING_POWERSET = {
+    name: "Staff Fighting",
+    category: "Unknown",
+    description: "Staff Fighting powerset",
+    icon: "staff-fighting_set.png",
+    powers: [
+        {
+            name: "Mercurial Blow",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Accurate Defense Debuff", "Defense Debuff", "Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You strike your foe with a lightning fast blow from your staff dealing Smashing damage. The attack is so unexpected that the target's defenses are reduced slightly for a short time. This power grants one stack of Perfection of Body.",
+            shortHelp: "Melee, DMG(Smash), Foe -Def",
+            icon: "stafffighting_mercurialblow.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 9.0,
+                recharge: 3.0,
+                endurance: 4.368,
+                cast: 1.0,
+                damage: {
+                    type: "Smashing",
+                    scale: 1.68
+                }
+            }
+        },
+        {
+            name: "Precise Strike",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "You attempt to daze your foe with a heavy staff blow to their head. Precise Strike has a higher chance to hit than normal, deals Smashing damage, and has a small chance to disorient the target briefly. This power grants one stack of Perfection of Body.",
+            shortHelp: "Melee, Liht DMG(Smash), Foe Disorient",
+            icon: "stafffighting_precisestrike.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.1,
+                range: 9.0,
+                recharge: 6.0,
+                endurance: 6.864,
+                cast: 1.13
+            }
+        },
+        {
+            name: "Guarded Spin",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Defense Sets", "Melee AoE Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You spin your staff like a propeller in front of you dealing Smashing damage to enemies in your frontal arc and deflecting any incoming attacks, thus boosting your Melee and Lethal defense briefly. This power grants one stack of Perfection of Body.",
+            shortHelp: "Melee (Cone), DMG(Smash), Self +Def(Melee, Lethal)",
+            icon: "stafffighting_guardedspin.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "Cone",
+            maxTargets: 5,
+            arc: 1.5708,
+            effects: {
+                accuracy: 1.05,
+                range: 9.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.83,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Assassin's Staff",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "A signature Stalker attack. This attack does superior smashing damage on its own as a frontal attack and cannot be interrupted. However, if it is executed while you are Hidden, this attack will do tremendous damage, as you waylay your unsuspecting foe. This attack may be interrupted if you move or are attacked while executing this power and are hidden. Using this power while not hidden has a chance to critically hit equal to 33.3% times the number of stacks of Assassin's Focus. This power grants one stack of Perfection of Body. Using Assassin's Strike when not hidden will remove all stacks of Assassin's Focus regardless if you critically hit or not.",
+            shortHelp: "Melee, DMG(Smash)",
+            icon: "stafffighting_assassinsstaff.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 9.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 3.0
+            }
+        },
+        {
+            name: "Build Up",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your chance to hit.",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "stafffighting_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Placate",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Allows you to trick a foe to no longer attack you. A Successful Placate will also Hide you. This Hide is very brief, and offers no Defense bonus, but it will allow you to deliver a Critical Hit or an Assassin's Staff. However, if you attack a Placated Foe, he will be able to attack you back.",
+            shortHelp: "Ranged, Foe Placate, Self Stealth/Hide",
+            icon: "stafffighting_placate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                cast: 0.8,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Eye of the Storm",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee AoE Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "With a lightning fast series of spins of your staff you strike at all nearby foes dealing damage with a chance of knocking foes down. This power will build one stack of Perfection of Body if the user has two or less stacks, if the user has three stacks of Perfection of Body it will consume them and gain some benefit. 3 stacks of Perfection of Body will cause additional smashing damage and reduce damage resistance slightly for a short time.",
+            shortHelp: "PBAoE Melee, DMG(Smash), Foe Knockdown, Consumes Perfection",
+            icon: "stafffighting_eyeofthestorm.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.05,
+                recharge: 17.0,
+                endurance: 16.016,
+                cast: 2.57
+            }
+        },
+        {
+            name: "Serpent's Reach",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You fully extend your staff and release a burst of energy to lash out at a distant target and deal Smashing damage with a good chance to knock your target down. This power builds one level of Perfection of Body.<br><br><color #fcfc95>Notes: Serpent's Reach is unaffected by Range changes.</color>",
+            shortHelp: "Ranged, DMG(Smash), Foe Knockdown",
+            icon: "stafffighting_serpentsreach.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 40.0,
+                recharge: 9.0,
+                endurance: 9.36,
+                cast: 1.77
+            }
+        },
+        {
+            name: "Sky Splitter",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee Damage", "Stalker Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "You leap into the air and hammer your foe with an overhead bash from your staff. Sky Splitter deals Smashing damage, will knock the target into the air and will briefly disorient your target. This power will build one stack of Perfection of Body if the user has two or less stacks, if the user has three stacks of Perfection of Body it will consume them and gain some benefit. 3 Levels of Perfection of Body will cause additional smashing damage and grant the user a bonus to damage resistance a short time. Critical Hit damage isn't enhanced by levels of Perfection.",
+            shortHelp: "Melee, DMG(Smash), Foe Knock Up, Disorient, -Fly, Consumes Perfection",
+            icon: "stafffighting_skysplitter.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.05,
+                range: 9.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 2.83
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/staff-fighting'] = STALKER_STAFF_FIGHTING_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_STAFF_FIGHTING_POWERSET = STALKER_STAFF_FIGHTING_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/stone-armor.js ----
+;/**
+ * Stone Armor
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_STONE_ARMOR_POWERSET = {
+    name: "Stone Armor",
+    category: "Unknown",
+    description: "Stone Armor powerset",
+    icon: "stone-armor_set.png",
+    powers: [
+        {
+            name: "Hide",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Hide makes you almost impossible to detect. When properly 'Hidden\", a Stalker can pull off Critical hits with his attacks, and even land a massive 'Assassins Strike' with an Assassins power. When you attack or are damaged while using this power, you will be discovered. Even if discovered, you are hard to see and retain some bonus to Defense. Unlike most stealth powers, Hide can be used at the same time as other Concealment powers, giving you even greater stealth capability. No Endurance cost.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Toggle: Self Stealth, +DEF(Melee, Ranged, AoE)",
+            icon: "stonearmor_hide.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                cast: 0.73,
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Rock Armor",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Your skin becomes stone while this power is active. Rock Armor protects you from Smashing and Lethal attacks. They are less likely to land and affect you. Stone Armor also grants you resistance to Defense DeBuffs.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +DEF(Lethal, Smashing), Res(DeBuff DEF)",
+            icon: "stonearmor_stonearmor.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 0.73,
+                debuffResistance: {
+                    defense: 0.1384
+                },
+                buffDuration: 0.75,
+                defenseBuff: 0.4
+            }
+        },
+        {
+            name: "Stone Skin",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Defense Sets", "Resist Damage"],
+            description: "Your tough skin is naturally resistant to most types of damage. This power is always on and costs no Endurance.",
+            shortHelp: "Auto: Self +Res(All but Psionics), +DEF(All but Psionics)",
+            icon: "stonearmor_stoneskin.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                dotDamage: {
+                    type: "Psionic",
+                    scale: 1.0,
+                    ticks: 5
+                },
+                resistance: {
+                    smashing: 0.075,
+                    lethal: 0.075,
+                    fire: 0.075,
+                    cold: 0.075,
+                    energy: 0.075,
+                    negative: 0.075,
+                    toxic: 0.075,
+                    psionic: 0.075
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Earth's Embrace",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing", "Resist Damage"],
+            description: "You are so connected to the Earth, you can draw upon its power to add to your health. Activating this power increases your maximum Hit Points and grants you resistance to Toxic Damage.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +HP, Res(Toxic)",
+            icon: "stonearmor_earthsembrace.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 120.0,
+                endurance: 10.4,
+                cast: 1.0,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 2.0,
+                    ticks: 30
+                },
+                resistance: {
+                    toxic: 0.15
+                },
+                healing: {
+                    scale: 162.64246500000002,
+                    perTarget: true
+                },
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Rooted",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing"],
+            description: "While this power is active, you merge with the Earth and draw forth its power to become resistant to Knockback, Sleep, Hold, Disorient and Endurance Drain effects, and increase your Hit Point Regeneration rate. Rooted also grants you resistance to Defense DeBuffs.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +Res(Knockback, Sleep, Disorient, Hold, End Drain, DeBuff DEF), +Regeneration",
+            icon: "stonearmor_rooted.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 1.17,
+                protection: {
+                    hold: 10.379999999999999,
+                    stun: 10.379999999999999,
+                    sleep: 10.379999999999999,
+                    immobilize: 10.379999999999999
+                },
+                debuffResistance: {
+                    defense: 0.3,
+                    tohit: 0.3,
+                    recharge: 0.3,
+                    movement: 0.5
+                },
+                buffDuration: 0.75,
+                defenseBuff: 0.3,
+                stun: 1.0,
+                stunDuration: 0.75,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Crystal Armor",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Endurance Modification"],
+            description: "While this power is active, your skin becomes encrusted in various quartz crystals. Crystal Armor makes Energy and Negative Energy attacks less likely to hit. This power also grants you an Endurance recovery buff and resistance to Defense DeBuffs.<br><br>Crystal Armor also adds an Elusivity defense bonus to Energy and Negative Energy Attacks in PVP zones.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +Recovery, +DEF(Energy, Negative), Res(DeBuff DEF)",
+            icon: "stonearmor_crystalarmor.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 1.0,
+                debuffResistance: {
+                    defense: 0.1384
+                },
+                buffDuration: 0.75,
+                defenseBuff: 0.4
+            }
+        },
+        {
+            name: "Brimstone Armor",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "While this power is active, your skin becomes encrusted in cracked magma. Brimstone Armor makes you highly resistant to Fire, Cold and Toxic damage, and helps your attacks set enemies on fire, delivering damage over time.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +Res(Fire, Cold, Toxic), +Special",
+            icon: "stonearmor_magmaarmor.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 0.73,
+                resistance: {
+                    fire: 0.22499999999999998,
+                    cold: 0.22499999999999998,
+                    toxic: 0.15
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Minerals",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Activating this power summons several rare earth rock Minerals to orbit around you. These Minerals can disperse thought patterns and make Psionic attacks less likely to hit. They also bring clarity of the mind reducing the recharge time of your powers, increasing your Perception, and making you resistant to Confusion.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +Recharge, +DEF(Psionic), Res(Confuse), +Perception",
+            icon: "stonearmor_mineralcrust.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 0.73,
+                protection: {
+                    confuse: 30.0
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Geode",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification", "Healing"],
+            description: "When you activate this power, you encase yourself in various protective mineral layers that can absorb incoming damage while you heal and recover endurance at an incredible rate. You can emerge at will by deactivating the power, but you cannot stay in this Geode for more than 30 seconds. If enemies inflict enough damage, they can break you out of this effect.<br><br>If Brimstone Armor is owned, this power will also grant Geothermal Power every 5 seconds, increasing the damage inflicted by Brimstone's Fire by 8% per stack.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Toggle: Self +Regeneration, +Recovery, Invulnerable; Self Hold",
+            icon: "stonearmor_geode.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 180.0,
+                endurance: 0.026,
+                cast: 0.07,
+                buffDuration: 0.2
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/stone-armor'] = STALKER_STONE_ARMOR_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_STONE_ARMOR_POWERSET = STALKER_STONE_ARMOR_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/stone-melee.js ----
+;/**
+ * Stone Melee
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_STONE_MELEE_POWERSET = {
+    name: "Stone Melee",
+    category: "Unknown",
+    description: "Stone Melee powerset",
+    icon: "stone-melee_set.png",
+    powers: [
+        {
+            name: "Stone Fist",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "Your stone covered fists attack swiftly for moderate damage, and may Disorient your opponent.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Melee Light DMG(Smashing), Foe Minor Disorient",
+            icon: "stonemelee_stonefist.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 4.0,
+                endurance: 5.2,
+                cast: 0.83,
+                damage: {
+                    type: "Smashing",
+                    scale: 2.141
+                }
+            }
+        },
+        {
+            name: "Stone Mallet",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "Your control over the earth allows you to form a mallet of solid stone. This Stone Mallet deals heavy damage, and can knock down weak foes.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Melee, Moderate DMG(Smashing), Knockback",
+            icon: "stonemelee_stonemallet.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 8.0,
+                endurance: 8.528,
+                cast: 1.61,
+                damage: {
+                    type: "Smashing",
+                    scale: 3.487
+                }
+            }
+        },
+        {
+            name: "Fault",
+            available: 1,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged AoE Damage", "Stalker Archetype Sets", "Stuns", "Universal Damage Sets"],
+            description: "This powerful stomp can cause a seismic disturbance. This will crack the Earth itself and send a Fault towards a targeted foe, throwing him and nearby enemies into the air and possibly Disorienting them. Fault has a chance of dealing damage to foes in between you and your target.<br><br><color #fcfc95>Damage: Minor.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Close (Targeted AoE), Minor DMG(Smashing), Foe Knockback, Disorient",
+            icon: "stonemelee_fault.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 0.8,
+                range: 20.0,
+                recharge: 20.0,
+                endurance: 10.192,
+                cast: 2.1
+            }
+        },
+        {
+            name: "Assassin's Smash",
+            available: 5,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["InterruptReduction", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "A signature Stalker attack. This attack does superior smashing damage on its own as a frontal attack and cannot be interrupted. However, if it is executed while you are Hidden, this attack will do tremendous damage, as you waylay your unsuspecting foe. This attack may be interrupted if you move or are attacked while executing this power and are hidden. Using this power while not hidden has a chance to critically hit equal to 33.3% times the number of stacks of Assassin's Focus. Using Assassin's Smash when not hidden will remove all stacks of Assassin's Focus regardless if you critically hit or not.<br><br><color #fcfc95>Damage: Extreme.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee, Extreme DMG(Smash)",
+            icon: "stonemelee_assassinate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.2,
+                range: 7.0,
+                recharge: 15.0,
+                endurance: 14.352,
+                cast: 3.17
+            }
+        },
+        {
+            name: "Build Up",
+            available: 7,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["To Hit Buff"],
+            description: "Greatly increases the amount of damage you deal for a few seconds, as well as slightly increasing your chance to hit.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +DMG, +To Hit",
+            icon: "stonemelee_buildup.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 90.0,
+                endurance: 5.2,
+                cast: 1.17,
+                tohitBuff: 0.20,
+                damageBuff: 1.0,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Placate",
+            available: 11,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Range", "Recharge"],
+            allowedSetCategories: ["Threat Duration"],
+            description: "Allows you to trick a foe to no longer attack you. A Successful Placate will also Hide you. This Hide is very brief, and offers no Defense bonus, but it will allow you to deliver a Critical Hit or an Assassins Blow. However, if you attack a Placated Foe, he will be able to attack you back.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Ranged, Foe Placate, Self Stealth/Hide",
+            icon: "stonemelee_placate.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "AoE",
+            maxTargets: 5,
+            effects: {
+                accuracy: 1.0,
+                range: 60.0,
+                recharge: 60.0,
+                cast: 0.8,
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Seismic Mallet",
+            available: 17,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Hold", "EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Holds", "Knockback", "Melee Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "A more impressive form of Stone Mallet, the Seismic Mallet deals more damage, but is slower to swing. It has a greater chance of knocking down opponents, in addition to a chance for hold.<br><br><color #fcfc95>Damage: Superior.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Melee, Superior DMG(Smashing), Knockback, Hold",
+            icon: "stonemelee_heavymallet.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 7.0,
+                recharge: 16.0,
+                endurance: 15.184,
+                cast: 1.63,
+                damage: {
+                    type: "Smashing",
+                    scale: 5.101
+                }
+            }
+        },
+        {
+            name: "Hurl Boulder",
+            available: 21,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Range", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Ranged Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You are able to tear up a chunk of ground beneath your feet and Hurl it at an enemy. This attack deals high damage, and can knock foes back and even drop them out of the air if they are flying.<br><br><color #fcfc95>Damage: Moderate.</color><br><color #fcfc95>Recharge: Moderate.</color>",
+            shortHelp: "Ranged, Moderate DMG(Smashing), Foe Knockback, -Fly",
+            icon: "stonemelee_hurlboulder.png",
+            powerType: "Click",
+            targetType: "Foe (Alive)",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                range: 80.0,
+                recharge: 8.0,
+                endurance: 9.36,
+                cast: 2.5,
+                damage: {
+                    type: "Smashing",
+                    scale: 4.11
+                },
+                buffDuration: 15.0
+            }
+        },
+        {
+            name: "Tremor",
+            available: 25,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge", "Damage", "Accuracy"],
+            allowedSetCategories: ["Knockback", "Melee AoE Damage", "Stalker Archetype Sets", "Universal Damage Sets"],
+            description: "You can cause a localized earthquake immediately around you. This will deal moderate damage to every foe in melee range, while knocking them down.<br><br><color #fcfc95>Damage: Light.</color><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "PBAoE, Light DMG(Smashing), Knockback",
+            icon: "stonemelee_tremor.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "AoE",
+            maxTargets: 10,
+            effects: {
+                accuracy: 1.0,
+                recharge: 14.0,
+                endurance: 13.52,
+                cast: 2.53,
+                damage: {
+                    type: "Smashing",
+                    scale: 2.1324
+                }
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/stone-melee'] = STALKER_STONE_MELEE_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_STONE_MELEE_POWERSET = STALKER_STONE_MELEE_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/super-reflexes.js ----
+;/**
+ * Super Reflexes
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_SUPER_REFLEXES_POWERSET = {
+    name: "Super Reflexes",
+    category: "Unknown",
+    description: "Super Reflexes powerset",
+    icon: "super-reflexes_set.png",
+    powers: [
+        {
+            name: "Focused Fighting",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "You become more evasive to melee attacks while you have Focused Fighting activated. This will increase your Defense versus melee as long as it is active. Your Focus also offers you resistance to Confuse effects and DeBuffs to Defense. Focused Fighting also adds an Elusivity defense bonus to Melee Attacks in PVP zones.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +DEF(Melee), Res(Confuse, DeBuff DEF)",
+            icon: "superreflexes_focusedfighting.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.13,
+                cast: 0.67,
+                protection: {
+                    confuse: 10.379999999999999
+                },
+                debuffResistance: {
+                    defense: 0.1384
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Hide",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Hide makes you almost impossible to detect. When properly 'Hidden\", a Stalker can pull off Critical hits with his attacks, and even land a massive 'Assassin's Strike' with an Assassin's power. When you attack or are damaged while using this power, you will be discovered. Even if discovered, you are hard to see and retain some bonus to Defense. Unlike most stealth powers, Hide can be used at the same time as other Concealment powers, giving you even greater stealth capability. No Endurance cost.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Toggle: Self Stealth, +DEF(Melee, Ranged, AoE)",
+            icon: "superreflexes_hide.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                cast: 0.73,
+                defense: {
+                    smashing: 0.0375,
+                    lethal: 0.0375,
+                    fire: 0.0375,
+                    cold: 0.0375,
+                    energy: 0.0375,
+                    negative: 0.0375,
+                    psionic: 0.0375,
+                    toxic: 0.0375
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Focused Senses",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "You become more evasive against ranged attacks while you have Focused Senses activated. This will increase your Defense versus ranged attacks as long as it is active. Your Improved Senses also allow you to perceive stealthy foes as well as resist Defense DeBuffs. Focused Senses also adds Psionic Defense and an Elusivity defense bonus to Psionic and Ranged Attacks in PVP zones.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +DEF(Ranged), +Perception, Res(DeBuff DEF)",
+            icon: "superreflexes_focusedsenses.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.13,
+                cast: 2.03,
+                defense: {
+                    psionic: 0.13875
+                },
+                debuffResistance: {
+                    defense: 0.1384
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Agile",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "You become innately more Agile, and are able to naturally avoid some ranged attacks and resist Defense DeBuffs. Your Agility also grants you minor Damage Resistance to all damage except Toxic and Psionic. This Damage Resistance is only available as you lose Health but it improves as your HP declines. This power is always on, and will permanently increase your Defense versus ranged attacks.",
+            shortHelp: "Auto: Self +DEF(Ranged), Res(DeBuff DEF), Res(DMG, Special)",
+            icon: "superreflexes_agile.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                resistance: {
+                    smashing: 0.0,
+                    lethal: 0.0,
+                    fire: 0.0,
+                    cold: 0.0,
+                    energy: 0.0,
+                    negative: 0.0,
+                    toxic: 0.0
+                },
+                debuffResistance: {
+                    defense: 0.0692
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Practiced Brawler",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: [],
+            description: "Your training has allowed you to become a Practiced Brawler, tuning you into a perfect fighting machine. You gain a resistance to Knockback, Disorient, Hold, Sleep, and Immobilization powers for a short duration.<br><br><color #fcfc95>Recharge: Long.</color>",
+            shortHelp: "Self +Res(Knockback, Disorient, Hold, Sleep, Immobilize)",
+            icon: "superreflexes_practicedbrawler.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 200.0,
+                endurance: 10.4,
+                cast: 1.53,
+                protection: {
+                    hold: 10.379999999999999,
+                    stun: 10.379999999999999,
+                    sleep: 10.379999999999999,
+                    immobilize: 10.379999999999999
+                },
+                debuffResistance: {
+                    tohit: 0.3,
+                    defense: 0.3,
+                    recharge: 0.3,
+                    movement: 0.5
+                },
+                buffDuration: 120.0,
+                stun: 1.0,
+                stunDuration: 120.0,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Dodge",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "You have the ability to innately Dodge some melee attacks and you resist Defense DeBuffs. Dodge also grants you minor Damage Resistance to all damage except Toxic and Psionic. This Damage Resistance is only available as you lose Health but it improves as your HP declines. This power is always on, and will permanently increase your Defense versus melee attacks.",
+            shortHelp: "Auto: Self +DEF(Melee), Res(DeBuff DEF), Res(All DMG, Special)",
+            icon: "superreflexes_dodge.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                resistance: {
+                    smashing: 0.0,
+                    lethal: 0.0,
+                    fire: 0.0,
+                    cold: 0.0,
+                    energy: 0.0,
+                    negative: 0.0,
+                    toxic: 0.0
+                },
+                debuffResistance: {
+                    defense: 0.0692
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Quickness",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: [],
+            description: "Your Quick reflexes allow you to move faster than normal, as well as resist slow effects. This power is always on and permanently increases your attack rate and movement speed.",
+            shortHelp: "Auto: Self +Recharge, +SPD, Res (Slow)",
+            icon: "superreflexes_quickness.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                debuffResistance: {
+                    recharge: 0.4,
+                    movement: 0.4
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Evasion",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "You are Evasive against area effect and cone shaped attacks. This power increases your Defense versus such attacks as long as it is active. Evasion also helps you resist Defense DeBuffs. Evasion also adds an Elusivity defense bonus to AOE Attacks in PVP zones.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self +DEF(vs. AoE), Res(DeBuff DEF)",
+            icon: "superreflexes_evasion.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.13,
+                cast: 3.0,
+                debuffResistance: {
+                    defense: 0.1384
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Elude",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets", "Endurance Modification", "Running", "Running & Sprints", "Universal Travel"],
+            description: "You can improve your reflexes, making yourself so quick you can Elude almost any attack, be it ranged, melee, or area effect. Your running speed and jumping height and Endurance Recovery are also increased. Elude also grants you high resistance to Defense DeBuffs. When Elude wears off, you are left drained of all Endurance and unable to recover Endurance for a while.<br><br><color #fcfc95>Recharge: Extremely Long.</color>",
+            shortHelp: "Self +DEF, + SPD, +Recovery, Res(DeBuff DEF), +Special",
+            icon: "superreflexes_elude.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 1000.0,
+                endurance: 2.6,
+                cast: 2.0,
+                debuffResistance: {
+                    defense: 0.346
+                },
+                buffDuration: 180.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/super-reflexes'] = STALKER_SUPER_REFLEXES_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_SUPER_REFLEXES_POWERSET = STALKER_SUPER_REFLEXES_POWERSET;
+}
+
+// ---- js/data/powersets/stalker/willpower.js ----
+;/**
+ * Willpower
+ * Character Level: 50
+ * Archetype: stalker
+ * Extracted from raw_data_homecoming with archetype modifiers applied
+ */
+
+const STALKER_WILLPOWER_POWERSET = {
+    name: "Willpower",
+    category: "Unknown",
+    description: "Willpower powerset",
+    icon: "willpower_set.png",
+    powers: [
+        {
+            name: "Hide",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "Hide makes you almost impossible to detect. When properly 'Hidden\", a Stalker can pull off Critical hits with his attacks, and even land a massive 'Assassins Strike' with an Assassins power. When you attack or are damaged while using this power, you will be discovered. Even if discovered, you are hard to see and retain some bonus to Defense. Unlike most stealth powers, Hide can be used at the same time as other Concealment powers, giving you even greater stealth capability. No Endurance cost.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Toggle: Self Stealth, +DEF(Melee, Ranged, AoE)",
+            icon: "willpower_hide.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                cast: 0.73,
+                defense: {
+                    smashing: 0.0375,
+                    lethal: 0.0375,
+                    fire: 0.0375,
+                    cold: 0.0375,
+                    energy: 0.0375,
+                    negative: 0.0375,
+                    psionic: 0.0375,
+                    toxic: 0.0375
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "High Pain Tolerance",
+            available: 0,
+            tier: 1,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Healing", "Resist Damage"],
+            description: "You have a greater tolerance to pain than others. You are also slightly resistant to all types of damage. This power is always on and costs no Endurance.",
+            shortHelp: "Auto: Self +Res (All), +MaxHealth",
+            icon: "willpower_highpaintolerance.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                resistance: {
+                    smashing: 0.056249999999999994,
+                    lethal: 0.056249999999999994,
+                    fire: 0.056249999999999994,
+                    cold: 0.056249999999999994,
+                    energy: 0.056249999999999994,
+                    negative: 0.056249999999999994,
+                    psionic: 0.056249999999999994,
+                    toxic: 0.056249999999999994
+                },
+                buffDuration: 10.25
+            }
+        },
+        {
+            name: "Reconstruction",
+            available: 3,
+            tier: 2,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Healing", "Resist Damage"],
+            description: "Through perfect control of your body, you can concentrate for a few moments and heal yourself. The effects of Reconstruction also leaves you resistant to Toxic damage for a while.<br><br><color #fcfc95>Recharge: Slow.</color>",
+            shortHelp: "Self Heal, Res(Toxic)",
+            icon: "willpower_reconstruction.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 60.0,
+                endurance: 10.4,
+                cast: 0.73,
+                dotDamage: {
+                    type: "Toxic",
+                    scale: 2.0,
+                    ticks: 30
+                },
+                resistance: {
+                    toxic: 0.15
+                },
+                healing: {
+                    scale: 301.18975,
+                    perTarget: true
+                },
+                buffDuration: 60.0
+            }
+        },
+        {
+            name: "Mind Over Body",
+            available: 9,
+            tier: 3,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "When you toggle on this power, you empower your Mind Over Body to become highly resistant to Smashing, Lethal and Psionic damage.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Toggle: Self +Res(Smash, Lethal, Psionics)",
+            icon: "willpower_mindoverbody.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.104,
+                cast: 0.67,
+                resistance: {
+                    smashing: 0.16874999999999998,
+                    lethal: 0.16874999999999998,
+                    psionic: 0.15
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Indomitable Will",
+            available: 15,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "When you toggle on this power, it grants protection from Sleep, Disorient, Fear, Immobilize, Confusions, Repel, Knockback and Hold effects. Indomitable Will also grants a moderate defense to Psionic based attacks.<br><br><color #fcfc95>Recharge: Fast.</color>",
+            shortHelp: "Toggle: Self Res (Disorient, Hold, Immobilize, Sleep, Fear, Confuse, Repel, Knockback). DEF(Psionics)",
+            icon: "willpower_indomitablewill.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 4.0,
+                endurance: 0.104,
+                cast: 0.73,
+                protection: {
+                    hold: 10.379999999999999,
+                    stun: 10.379999999999999,
+                    immobilize: 10.379999999999999,
+                    sleep: 10.379999999999999,
+                    fear: 10.379999999999999,
+                    confuse: 10.379999999999999
+                },
+                defense: {
+                    psionic: 0.075
+                },
+                debuffResistance: {
+                    tohit: 0.3,
+                    defense: 0.3,
+                    recharge: 0.3,
+                    movement: 0.5
+                },
+                stun: 1.0,
+                stunDuration: 0.75,
+                buffDuration: 0.75,
+                tohitBuff: 0.3
+            }
+        },
+        {
+            name: "Heightened Senses",
+            available: 19,
+            tier: 4,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Defense Sets"],
+            description: "You become more aware of your environment and its hazards while this power is activated. This will increase your Defense versus environmental damage as long as it is active. Your Heightened Senses also allow you to perceive stealthy foes and resist Defense DeBuffs.<br><br><color #fcfc95>Recharge: Very Fast.</color>",
+            shortHelp: "Toggle: Self +DEF(Smash, Lethal, Fire, Cold, Energy, Negative Energy), +Per",
+            icon: "willpower_heightenedsenses.png",
+            powerType: "Toggle",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 2.0,
+                endurance: 0.104,
+                cast: 0.67,
+                defense: {
+                    smashing: 0.02475,
+                    lethal: 0.02475,
+                    fire: 0.0975,
+                    cold: 0.0975,
+                    energy: 0.0975,
+                    negative: 0.0975
+                },
+                debuffResistance: {
+                    defense: 0.173
+                },
+                buffDuration: 0.75
+            }
+        },
+        {
+            name: "Fast Healing",
+            available: 23,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["Damage", "Accuracy", "Recharge", "EnduranceReduction"],
+            allowedSetCategories: ["Healing"],
+            description: "You heal Hit Points at a faster rate than normal. This power is always on.",
+            shortHelp: "Auto: Self +Regeneration",
+            icon: "willpower_fasthealing.png",
+            powerType: "Auto",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                debuffResistance: {
+                    regeneration: 0.25949999999999995
+                },
+                buffDuration: 10.0
+            }
+        },
+        {
+            name: "Resurgence",
+            available: 27,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction", "Recharge"],
+            allowedSetCategories: ["Endurance Modification"],
+            description: "Should you fall in battle, you can Revive yourself from the brink of death. You will revive with most of your Hit Points and half your Endurance and be protected from XP Debt for 20 seconds. Additionally, for 90 seconds, your damage, attack rate, endurance recovery and chance to hit will be improved, then for another 45 seconds, your damage and chance to hit will be diminished. You will also have 15 seconds of immunity to most damage.<br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Self Rez, Special",
+            icon: "willpower_resurgence.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 300.0,
+                cast: 1.5,
+                buffDuration: 0.5,
+                tohitBuff: 3.0,
+                tohitDebuff: 3.0
+            }
+        },
+        {
+            name: "Strength of Will",
+            available: 29,
+            tier: 5,
+            maxSlots: 6,
+            allowedEnhancements: ["EnduranceReduction"],
+            allowedSetCategories: ["Resist Damage"],
+            description: "When you activate this power, you not only become extremely resistant to most damage, but also to Disorient, Immobilization, Hold, Knockback, Repel and Sleep effects. Strength of Will costs little Endurance to activate and increases your recovery for its duration, but when it wears off you are left exhausted, and substantially drained of Endurance.<br><br><color #fcfc95>Notes: Strength of Will is unaffected by Recharge Time changes.</color><br><br><color #fcfc95>Recharge: Very Long.</color>",
+            shortHelp: "Self, +Res(Disorient, Sleep, Hold, Immobilize, Repel, Knockback, All DMG), +Recovery",
+            icon: "willpower_strengthofwill.png",
+            powerType: "Click",
+            targetType: "Self",
+            effectArea: "SingleTarget",
+            effects: {
+                accuracy: 1.0,
+                recharge: 300.0,
+                endurance: 2.6,
+                cast: 3.1,
+                dotDamage: {
+                    types: [
+                        {
+                            type: "Smashing",
+                            scale: 2.5,
+                            ticks: 60
+                        },
+                        {
+                            type: "Lethal",
+                            scale: 2.5,
+                            ticks: 60
+                        },
+                        {
+                            type: "Fire",
+                            scale: 1.25,
+                            ticks: 60
+                        },
+                        {
+                            type: "Cold",
+                            scale: 1.25,
+                            ticks: 60
+                        },
+                        {
+                            type: "Energy",
+                            scale: 1.25,
+                            ticks: 60
+                        },
+                        {
+                            type: "Negative",
+                            scale: 1.25,
+                            ticks: 60
+                        },
+                        {
+                            type: "Psionic",
+                            scale: 1.25,
+                            ticks: 60
+                        },
+                        {
+                            type: "Toxic",
+                            scale: 1.25,
+                            ticks: 60
+                        }
+                    ]
+                },
+                protection: {
+                    stun: 17.299999999999997,
+                    sleep: 17.299999999999997,
+                    immobilize: 17.299999999999997,
+                    hold: 17.299999999999997
+                },
+                resistance: {
+                    smashing: 0.1875,
+                    lethal: 0.1875,
+                    fire: 0.09375,
+                    cold: 0.09375,
+                    energy: 0.09375,
+                    negative: 0.09375,
+                    psionic: 0.09375,
+                    toxic: 0.09375
+                },
+                buffDuration: 120.0,
+                stun: 1.0,
+                stunDuration: 120.0
+            }
+        }
+    ]
+};
+
+// Register to POWERSETS
+if (typeof POWERSETS !== 'undefined') {
+    POWERSETS['stalker/willpower'] = STALKER_WILLPOWER_POWERSET;
+} else if (typeof window !== 'undefined') {
+    window.STALKER_WILLPOWER_POWERSET = STALKER_WILLPOWER_POWERSET;
+}
+
+// ---- js/data/epics/stalker/body_mastery_stalker.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Energy Mastery
+ * Archetype: Stalker
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\body_mastery_stalker
+ */
+
+const EPIC_BODY_MASTERY_STALKER = {
+  "id": "body_mastery_stalker",
+  "name": "Energy Mastery",
+  "displayName": "Energy Mastery",
+  "archetype": "stalker",
+  "description": "You have Mastery over Body to increase your power and even hurl energy at your foes.",
+  "icon": "body_mastery_stalker_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Superior Conditioning",
+      "fullName": "Epic.Body_Mastery_Stalker.Conserve_Power",
+      "rank": 1,
+      "available": 34,
+      "description": "Your Superior Condition has increased your maximum endurance by 5%.",
+      "shortHelp": "Self +Endurance",
+      "icon": "bodymastery_conservepower.png",
+      "powerType": "Auto",
+      "requires": "$archetype == @Class_Stalker",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 10.0,
+        "effectArea": "SingleTarget"
+      }
+    },
+    {
+      "name": "Focused Accuracy",
+      "fullName": "Epic.Body_Mastery_Stalker.Focused_Accuracy",
+      "rank": 2,
+      "available": 34,
+      "description": "When this power is activated, the Hero focuses his senses to dramatically improve his accuracy. Additionally, Focused Accuracy increase your Perception, allowing you to better see stealthy foes. It also grants you resistance to powers that DeBuff your Accuracy. Focused Accuracy is a toggle power and must be activated and deactivated manually. Like all toggle powers, while active, Focused Accuracy drains Endurance while active.",
+      "shortHelp": "Toggle: Self +To Hit, +ACC, +Perception, Res(DeBuff To Hit)",
+      "icon": "gadgets_targetingdrone.png",
+      "powerType": "Toggle",
+      "requires": "$archetype == @Class_Stalker",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "To Hit Buff"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 10.0,
+        "endurance": 0.195,
+        "activationTime": 1.17,
+        "effectArea": "SingleTarget",
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Laser Beam Eyes",
+      "fullName": "Epic.Body_Mastery_Stalker.Laser_Beam_Eyes",
+      "rank": 3,
+      "available": 37,
+      "description": "You can emit Laser Beams from your eyes, dealing moderate Energy damage. This attack can not miss and will reduce the target's Defense. Damage inflicted will fluctuate the current hit roll. You must be level 38 and have one other Energy Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged, DMG(Energy), Foe -DEF",
+      "icon": "bodymastery_laserbeameyes.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate Defense Debuff",
+        "Defense Debuff",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 8.0,
+        "endurance": 6.5,
+        "activationTime": 1.67,
+        "effectArea": "SingleTarget"
+      }
+    },
+    {
+      "name": "Physical Perfection",
+      "fullName": "Epic.Body_Mastery_Stalker.Physical_Perfection",
+      "rank": 4,
+      "available": 40,
+      "description": "By achieving perfect harmony of body, mind and spirit you are able to regenerate health and endurance slightly faster than normal. This power is always active and consumes no endurance. You must be level 41 and have one other Energy Mastery Powers before selecting this power.",
+      "shortHelp": "Auto: Self, +Regeneration, +Recovery",
+      "icon": "bodymastery_physicalperfection.png",
+      "powerType": "Auto",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "Heal"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Healing"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "effectArea": "SingleTarget",
+        "regeneration": {
+          "scale": 0.2,
+          "table": "Melee_Ones"
+        },
+        "recovery": {
+          "scale": 0.125,
+          "table": "Melee_Ones"
+        }
+      }
+    },
+    {
+      "name": "Energy Torrent",
+      "fullName": "Epic.Body_Mastery_Stalker.Energy_Torrent",
+      "rank": 5,
+      "available": 43,
+      "description": "Energy Torrent unleashes a cone of powerful energy that can smash foes and possibly send them flying. You must be level 44 and have two other Energy Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Cone), DMG(Energy/Smash), Foe Knockback",
+      "icon": "bodymastery_energytorrent.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 40.0,
+        "recharge": 24.0,
+        "endurance": 14.82,
+        "activationTime": 1.07,
+        "effectArea": "Cone",
+        "radius": 40.0,
+        "arc": 0.7854,
+        "damage": {
+          "type": "Energy",
+          "scale": 0.958,
+          "table": "Melee_InherentDamage"
+        },
+        "protection": {
+          "knockback": 1.0
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['body_mastery_stalker'] = EPIC_BODY_MASTERY_STALKER;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/stalker/stalker_leviathan_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Leviathan Mastery
+ * Archetype: Stalker
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\stalker_leviathan_mastery
+ */
+
+const EPIC_STALKER_LEVIATHAN_MASTERY = {
+  "id": "stalker_leviathan_mastery",
+  "name": "Leviathan Mastery",
+  "displayName": "Leviathan Mastery",
+  "archetype": "stalker",
+  "description": "Captain Mako has granted you access to the power of the Leviathan. The Leviathan is an ancient gargantuan entity who slumbers under Sharkhead Isle. Worshiped by the Coralax, the Leviathan has given Captain Mako many abilities and now he has taught you how to harness its power.",
+  "icon": "stalker_leviathan_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Spirit Shark",
+      "fullName": "Epic.Stalker_Leviathan_Mastery.Spirit_Shark",
+      "rank": 1,
+      "available": 34,
+      "description": "You are empowered with the Spirit of the Mako Shark. You can project this spirit to attack and maul your opponent. The Shark Spirit will manifest and attack your foe, quickly dealing heavy lethal damage over time. The damage over time increases the more hunger stacks you have. All hunger Leviathan Hunger stacks are consumed when you successfully hit an enemy with this power. When you own this power, most actions that cost endurance will have a chance of granting a Leviathan Hunger stack.",
+      "shortHelp": "Ranged, DoT(Lethal), Foe Knockback, -Leviathan Hunger",
+      "icon": "arachnos_patron_targetedrangedmoddmg.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Scrapper) || ($archetype == @Class_Stalker))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 13.0,
+        "endurance": 9.1,
+        "activationTime": 2.0,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Lethal",
+          "scale": 1.0694,
+          "table": "Melee_PvPDamage"
+        },
+        "protection": {
+          "knockback": 1.0
+        }
+      }
+    },
+    {
+      "name": "Water Spout",
+      "fullName": "Epic.Stalker_Leviathan_Mastery.Water_Spout",
+      "rank": 2,
+      "available": 34,
+      "description": "Conjures up a Water Spout at a targeted location. The Water Spout will chase down your foes, tossing them into the air and hurling them great distances. The victims are left Disoriented and with reduced Defense. The Water Spout is a menacing sight, and can even cause panic among your foes.",
+      "shortHelp": "Summon Water Spout: PBAoE DMG(Smash), Foe Knockback, Fear, Disorient, +Wet",
+      "icon": "arachnos_patron_dropknockback.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Scrapper) || ($archetype == @Class_Stalker))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage"
+      ],
+      "allowedSetCategories": [
+        "Defense Debuff",
+        "Knockback",
+        "Ranged AoE Damage",
+        "Stuns",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.3,
+        "range": 60.0,
+        "recharge": 180.0,
+        "endurance": 26.0,
+        "activationTime": 1.17,
+        "effectArea": "Location"
+      }
+    },
+    {
+      "name": "Hibernate",
+      "fullName": "Epic.Stalker_Leviathan_Mastery.Hibernate",
+      "rank": 3,
+      "available": 37,
+      "description": "When you activate this power, you encase yourself in a block of solid ice, making yourself invulnerable, though you are frozen solid and cannot act. While Hibernating within this block of ice, you heal damage and recover endurance at an incredible rate. You can emerge at will by deactivating the power, but you cannot Hibernate for more than 30 seconds. If you activate this power while in the air, you will fall. You must be level 38 and have one other Leviathan Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Self +Regeneration, +Recovery, Invulnerable; Self Hold",
+      "icon": "arachnos_patron_selfbuffresistancephysical.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Recharge",
+        "Heal"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Healing"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 240.0,
+        "endurance": 0.1625,
+        "activationTime": 0.07,
+        "effectArea": "SingleTarget",
+        "regeneration": {
+          "scale": 10.0,
+          "table": "Melee_Ones"
+        },
+        "recovery": {
+          "scale": 4.0,
+          "table": "Melee_Ones"
+        },
+        "resistance": {},
+        "protection": {
+          "knockup": 1.0,
+          "knockback": 1.0,
+          "immobilize": 1000.0
+        }
+      }
+    },
+    {
+      "name": "Spirit Shark Jaws",
+      "fullName": "Epic.Stalker_Leviathan_Mastery.Spirit_Shark_Jaws",
+      "rank": 4,
+      "available": 40,
+      "description": "You can summon a massive Spirit Shark that will attack your foe from below. The Shark will grip your foe with its massive jaws and attempt to hold the target while it mauls it, dealing lethal Damage over Time. Flying Targets will likely be pulled to the ground. You must be level 41 and have one other Leviathan Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged, DoT(Lethal), Foe Hold, -Fly",
+      "icon": "arachnos_patron_targetedhold.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Hold",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Holds",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 1.87,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "hold": 3.0
+        },
+        "damage": {
+          "type": "Lethal",
+          "scale": 0.2604,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Summon Guardian",
+      "fullName": "Epic.Stalker_Leviathan_Mastery.Summon_Guardian",
+      "rank": 5,
+      "available": 43,
+      "description": "Captain Mako has shown you how to summon a Coralax Guardian Warder to do your bidding. These creatures are composed of living coral made from the sea-goddess Merulina. Your access to this Guardian is very limited. You can only summon it once every 15 minutes and it will leave after 4 minutes, or if you exit a zone or mission. You must be level 44 and have two other Leviathan Mastery Powers before selecting this power.",
+      "shortHelp": "Summon Warder: Ranged DMG(Smashing)",
+      "icon": "arachnos_patron_summononepet.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Hold",
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Holds",
+        "Knockback",
+        "Pet Damage",
+        "Recharge Intensive Pets",
+        "Slow Movement",
+        "Stuns",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 900.0,
+        "endurance": 26.0,
+        "activationTime": 3.2,
+        "effectArea": "Location"
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['stalker_leviathan_mastery'] = EPIC_STALKER_LEVIATHAN_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/stalker/stalker_mace_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Mace Mastery
+ * Archetype: Stalker
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\stalker_mace_mastery
+ */
+
+const EPIC_STALKER_MACE_MASTERY = {
+  "id": "stalker_mace_mastery",
+  "name": "Mace Mastery",
+  "displayName": "Mace Mastery",
+  "archetype": "stalker",
+  "description": "Black Scorpion has granted you access to the advanced technology of the Nullifier Mace. The signature weapon of the Bane Spider Commandos, it is not a typical clumsy mace. The Bane Mace is capable of firing a variety of energy projectiles and grenades. It can even be modified to summon and command some or Black Scorpion's RV technologies.",
+  "icon": "stalker_mace_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Mace Blast",
+      "fullName": "Epic.Stalker_Mace_Mastery.Mace_Blast",
+      "rank": 1,
+      "available": 34,
+      "description": "The Bane Mace is capable of firing a bolt of kinetic energy. The blast is powerful enough that it may knockback some foes. Arachnos Bane Spider Troopers call this the Power Blast. The Arbiters who invented it scoff at this simple term.",
+      "shortHelp": "Ranged, DMG(Energy), Foe Knockback",
+      "icon": "arachnos_patron_targetedrangedmoddmg.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Scrapper) || ($archetype == @Class_Stalker))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 80.0,
+        "recharge": 12.0,
+        "endurance": 8.58,
+        "activationTime": 2.0,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Energy",
+          "scale": 2.16,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Mace Beam",
+      "fullName": "Epic.Stalker_Mace_Mastery.Mace_Beam",
+      "rank": 2,
+      "available": 34,
+      "description": "Fires an extremely long range and accurate beam of kinetic Energy from the Bane Mace that deals tremendous damage and knocks the target back.This is a sniper attack, and like most sniper attacks, is best fired from a distance as it can be interrupted. If you are engaged in battle this attack becomes instant-cast. If you are not engaged, it will do bonus damage.",
+      "shortHelp": "Sniper, DMG(Energy), Foe Knockback",
+      "icon": "arachnos_patron_targetedrangedsnipe.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Scrapper) || ($archetype == @Class_Stalker))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "InterruptReduction",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged Damage",
+        "Sniper Attacks",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 150.0,
+        "recharge": 24.0,
+        "endurance": 17.94,
+        "activationTime": 2.0,
+        "effectArea": "SingleTarget"
+      }
+    },
+    {
+      "name": "Disruptor Blast",
+      "fullName": "Epic.Stalker_Mace_Mastery.Disruptor_Blast",
+      "rank": 3,
+      "available": 37,
+      "description": "Fires a tremendous charge of kinetic energy from your Executioner's Mace. This charge is so powerful it will explode on impact, blasting all nearby foes. Some affected foes may be knocked back by the force of the blast. You must be level 44 and have two other Mace Mastery powers before selecting this power. You must be level 38 and have one other Mace Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Targeted AoE), DMG(Smashing/Energy), Foe Knockback",
+      "icon": "arachnos_patron_rangedaoemoderatedmg.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Knockback",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 80.0,
+        "recharge": 32.0,
+        "endurance": 18.98,
+        "activationTime": 2.0,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "damage": {
+          "type": "Energy",
+          "scale": 0.9477,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Web Cocoon",
+      "fullName": "Epic.Stalker_Mace_Mastery.Web_Cocoon",
+      "rank": 4,
+      "available": 40,
+      "description": "The Bane Mace can fire a more powerful version the common web grenade. The sinewy fibers of this grenade are strong enough to completely Hold one target. Targets able to resist the Hold are still likely to have their attack and movement speed dramatically slowed. Web Cocoon can also bring down flying targets and prevent foes from jumping. You must be level 41 and have one other Mace Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged, Foe Hold, -Recharge, -Fly, -Jump, Slow, DoT(Toxic)",
+      "icon": "arachnos_patron_targetedhold.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Hold",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Holds",
+        "Ranged Damage",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.05,
+        "range": 60.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 2.0,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "hold": 3.0
+        },
+        "damage": {
+          "type": "Toxic",
+          "scale": 0.345,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Summon Spiderlings",
+      "fullName": "Epic.Stalker_Mace_Mastery.Summon_Spiderlings",
+      "rank": 5,
+      "available": 43,
+      "description": "Black Scorpion has granted you access to a small squadron of Arachnobot Spiderlings. Three Spiderlings that are one level less than you will show up when summoned. Your access to these Arachnobots is very limited. You must be level 44 and have two other Mace Mastery Powers before selecting this power.",
+      "shortHelp": "Summon Spiderlings: Ranged DMG(Lethal)",
+      "icon": "arachnos_patron_summononepet.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate Defense Debuff",
+        "Defense Debuff",
+        "Pet Damage",
+        "Recharge Intensive Pets",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 900.0,
+        "endurance": 26.0,
+        "activationTime": 3.03,
+        "effectArea": "Location"
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['stalker_mace_mastery'] = EPIC_STALKER_MACE_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/stalker/stalker_mu_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Mu Mastery
+ * Archetype: Stalker
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\stalker_mu_mastery
+ */
+
+const EPIC_STALKER_MU_MASTERY = {
+  "id": "stalker_mu_mastery",
+  "name": "Mu Mastery",
+  "displayName": "Mu Mastery",
+  "archetype": "stalker",
+  "description": "Scirocco has taught you the ancient powers of the Mu. In their eternal struggle against the Oranbega, the Mu have unlocked many mystical powers, including their very signature crimson lightning. Now you possess their secrets.",
+  "icon": "stalker_mu_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Mu Bolts",
+      "fullName": "Epic.Stalker_Mu_Mastery.Mu_Bolts",
+      "rank": 1,
+      "available": 34,
+      "description": "You can quickly hurl small bolts of Mu electricity at foes, dealing some damage and draining some Endurance. Some of this Endurance may transfer back to you. Mu Bolts deals light damage but recharges quickly.",
+      "shortHelp": "Ranged, DMG(Energy), Foe -End",
+      "icon": "arachnos_patron_targetedrangedmoddmg.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Scrapper) || ($archetype == @Class_Stalker))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 8.0,
+        "endurance": 6.5,
+        "activationTime": 1.17,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Energy",
+          "scale": 1.459,
+          "table": "Melee_PvPDamage"
+        },
+        "recovery": {
+          "scale": -1.0,
+          "table": "Melee_Ones"
+        }
+      }
+    },
+    {
+      "name": "Zapp",
+      "fullName": "Epic.Stalker_Mu_Mastery.Zapp",
+      "rank": 2,
+      "available": 34,
+      "description": "A focused blast of Mu electrical energy that can travel great distances with high Accuracy. Zapp drains Endurance, some of which may transfer back to you.This is a sniper attack, and is best fired from a distance as it can be interrupted. If you are engaged in battle this attack becomes instant-cast.",
+      "shortHelp": "Sniper, DMG(Energy), Foe -End",
+      "icon": "arachnos_patron_targetedrangedsnipe.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Scrapper) || ($archetype == @Class_Stalker))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "InterruptReduction",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Ranged Damage",
+        "Sniper Attacks",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 150.0,
+        "recharge": 24.0,
+        "endurance": 17.94,
+        "activationTime": 1.33,
+        "effectArea": "SingleTarget"
+      }
+    },
+    {
+      "name": "Ball Lightning",
+      "fullName": "Epic.Stalker_Mu_Mastery.Ball_Lightning",
+      "rank": 3,
+      "available": 37,
+      "description": "Hurls a highly charged ball of Mu lightning that explodes on contact. Ball Lightning deals good damage in an area of effect, and drains some Endurance from each target it hits. You must be level 38 and have one other Mu Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged (Targeted AoE), DoT(Energy), Foe -End",
+      "icon": "arachnos_patron_rangedaoemoderatedmg.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 32.0,
+        "endurance": 18.98,
+        "activationTime": 1.07,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "damage": {
+          "type": "Energy",
+          "scale": 0.1046,
+          "table": "Melee_PvPDamage"
+        },
+        "recovery": {
+          "scale": -1.0,
+          "table": "Melee_Ones"
+        }
+      }
+    },
+    {
+      "name": "Electric Shackles",
+      "fullName": "Epic.Stalker_Mu_Mastery.Electric_Shackles",
+      "rank": 4,
+      "available": 40,
+      "description": "Electric Shackles binds a foes limbs, leaving the target held and helpless. The target is drained of some Endurance and some of that Endurance may be transferred back to you. You must be level 41 and have one other Mu Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged, DMG(Energy), Foe Hold, -End",
+      "icon": "arachnos_patron_targetedhold.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "Hold",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Holds",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 2.17,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "hold": 3.0
+        },
+        "damage": {
+          "type": "Energy",
+          "scale": 0.4113,
+          "table": "Melee_PvPDamage"
+        },
+        "recovery": {
+          "scale": -1.0,
+          "table": "Melee_Ones"
+        }
+      }
+    },
+    {
+      "name": "Summon Adept",
+      "fullName": "Epic.Stalker_Mu_Mastery.Summon_Adept",
+      "rank": 5,
+      "available": 43,
+      "description": "Scirocco has shown you how to call upon a mystical Mu Adept to assist you. The Mu pulse with the blood of their slaughtered ancestors in their veins, and are well practiced in the dark arts. Your access to this Adept is very limited. You must be level 44 and have two other Mu Mastery Powers before selecting this power.",
+      "shortHelp": "Summon Mu Adept: Ranged DMG(Energy)",
+      "icon": "arachnos_patron_summononepet.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "Hold",
+        "EnduranceReduction",
+        "Sleep",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Holds",
+        "Pet Damage",
+        "Recharge Intensive Pets",
+        "Sleep",
+        "Stuns",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 900.0,
+        "endurance": 26.0,
+        "activationTime": 1.17,
+        "effectArea": "Location"
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['stalker_mu_mastery'] = EPIC_STALKER_MU_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/stalker/stalker_soul_mastery.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Soul Mastery
+ * Archetype: Stalker
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\stalker_soul_mastery
+ */
+
+const EPIC_STALKER_SOUL_MASTERY = {
+  "id": "stalker_soul_mastery",
+  "name": "Soul Mastery",
+  "displayName": "Soul Mastery",
+  "archetype": "stalker",
+  "description": "Ghost Widow has granted you access to the power of darkness and souls. She has shown you how to use the souls of your victims to destroy your enemies. This has granted you access to powers and abilities you have never had before.",
+  "icon": "stalker_soul_mastery_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Dark Blast",
+      "fullName": "Epic.Stalker_Soul_Mastery.Dark_Blast",
+      "rank": 1,
+      "available": 34,
+      "description": "A long range blast of dark energy. Deals moderate Negative Energy damage and reduces the target's Accuracy.",
+      "shortHelp": "Ranged, DMG(Negative), Foe -ACC",
+      "icon": "arachnos_patron_targetedrangedmoddmg.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Scrapper) || ($archetype == @Class_Stalker))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate To-Hit Debuff",
+        "Ranged Damage",
+        "To Hit Debuff",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 8.0,
+        "endurance": 6.5,
+        "activationTime": 1.0,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Negative",
+          "scale": 0.8575,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Moonbeam",
+      "fullName": "Epic.Stalker_Soul_Mastery.Moonbeam",
+      "rank": 2,
+      "available": 34,
+      "description": "An extremely long range and accurate beam of Negative Energy that deals tremendous damage and reduces the target's Accuracy.This is a sniper attack, and like most sniper attacks, is best fired from a distance as it can be interrupted. If you are engaged in battle this attack becomes instant-cast.",
+      "shortHelp": "Sniper, DMG(Negative), Target -ACC",
+      "icon": "arachnos_patron_targetedrangedsnipe.png",
+      "powerType": "Click",
+      "requires": "(Owned?(Beta_AutoLevel50) || Owned?(BloodInTheWaterPatron) || Owned?(MiragePatron) || Owned?(SpidersKissPatron) || Owned?(TheStingerPatron)) && (($archetype == @Class_Scrapper) || ($archetype == @Class_Stalker))",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "InterruptReduction",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate To-Hit Debuff",
+        "Ranged Damage",
+        "Sniper Attacks",
+        "To Hit Debuff",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 150.0,
+        "recharge": 24.0,
+        "endurance": 17.94,
+        "activationTime": 1.33,
+        "effectArea": "SingleTarget"
+      }
+    },
+    {
+      "name": "Shadow Meld",
+      "fullName": "Epic.Stalker_Soul_Mastery.Shadow_Meld",
+      "rank": 3,
+      "available": 37,
+      "description": "Your mastery over the shadows allows you to become a living shadow entity for a short time, increasing your defense to all attacks. You must be level 35 and have Dark Blast or Moonbeam before selecting this power. You must be level 38 and have one other Soul Mastery Powers before selecting this power.",
+      "shortHelp": "Self: +Def(All)",
+      "icon": "arachnos_patron_selfbuffresistancephysical.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "Defense Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 90.0,
+        "endurance": 5.2,
+        "activationTime": 3.0,
+        "effectArea": "SingleTarget"
+      }
+    },
+    {
+      "name": "Soul Storm",
+      "fullName": "Epic.Stalker_Soul_Mastery.Soul_Storm",
+      "rank": 4,
+      "available": 40,
+      "description": "Like Ghost Widow, you can summon the souls of your victims to do your bidding. Soul Storm enraptures a single target Holding them while their life-force is drained from their body. You must be level 41 and have one other Soul Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged, DoT(Negative), Foe Hold",
+      "icon": "arachnos_patron_targetedhold.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "Hold",
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Holds",
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 24.0,
+        "endurance": 10.66,
+        "activationTime": 2.17,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "hold": 3.0
+        },
+        "damage": {
+          "type": "Fire",
+          "scale": 0.0495,
+          "table": "Melee_Damage"
+        }
+      }
+    },
+    {
+      "name": "Summon Widow",
+      "fullName": "Epic.Stalker_Soul_Mastery.Summon_Widow",
+      "rank": 5,
+      "available": 43,
+      "description": "Ghost Widow has assigned a beautiful but deadly Blood Widow assassins for you to command. Their weapons of choice include wrist retractable mounted razors and darts, all tipped in deadly poison. Your access to this Blood Widow is very limited, and you can only summon her once every 15 minutes and she will leave after 4 minutes, until defeated, or until you leave a zone or mission. You must be level 44 and have two other Soul Mastery Powers before selecting this power.",
+      "shortHelp": "Summon Night Widow: Melee DMG(Lethal)",
+      "icon": "arachnos_patron_summononepet.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Accurate To-Hit Debuff",
+        "Pet Damage",
+        "Recharge Intensive Pets",
+        "To Hit Debuff",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 60.0,
+        "recharge": 900.0,
+        "endurance": 26.0,
+        "activationTime": 3.2,
+        "effectArea": "Location"
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['stalker_soul_mastery'] = EPIC_STALKER_SOUL_MASTERY;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
+
+// ---- js/data/epics/stalker/weapon_mastery_stalker.js ----
+;/**
+ * City of Heroes: Homecoming - Epic Power Pool
+ * Pool: Weapon Mastery
+ * Archetype: Stalker
+ * 
+ * Auto-generated from game data
+ * Source: C:\Projects\Raw Data Homecoming\powers\epic\weapon_mastery_stalker
+ */
+
+const EPIC_WEAPON_MASTERY_STALKER = {
+  "id": "weapon_mastery_stalker",
+  "name": "Weapon Mastery",
+  "displayName": "Weapon Mastery",
+  "archetype": "stalker",
+  "description": "Devices are equipment you have constructed for use in combat. By using them strategically, you can gain a great tactical advantage. Traps, non-lethal munitions, and demolitions are available in this power set.",
+  "icon": "weapon_mastery_stalker_set.png",
+  "requires": "",
+  "minLevel": 35,
+  "powers": [
+    {
+      "name": "Web Grenade",
+      "fullName": "Epic.Weapon_Mastery_Stalker.Web_Grenade",
+      "rank": 1,
+      "available": 34,
+      "description": "Upon impact, the Web Grenade expels a strong, tenuous, and very sticky substance that can Immobilize most targets. This non-lethal device deals no damage and does not prevent targets from attacking, although their attack rate is Slowed. The Web can bring down flying entities and halts jumping.",
+      "shortHelp": "Ranged, Target Immobilize, -Recharge, -Fly",
+      "icon": "gadgets_webgrenade.png",
+      "powerType": "Click",
+      "requires": "$archetype == @Class_Stalker",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Immobilize",
+        "Ranged Damage",
+        "Slow Movement",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 50.0,
+        "recharge": 8.0,
+        "endurance": 6.5,
+        "activationTime": 1.37,
+        "effectArea": "SingleTarget",
+        "protection": {
+          "immobilize": 3.0
+        },
+        "damage": {
+          "type": "Smashing",
+          "scale": 1.679,
+          "table": "Melee_PvPDamage"
+        },
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Physical Perfection",
+      "fullName": "Epic.Weapon_Mastery_Stalker.Caltrops",
+      "rank": 2,
+      "available": 34,
+      "description": "By achieving perfect harmony of body, mind and spirit you are able to regenerate health and endurance slightly faster than normal. This power is always active and consumes no endurance.",
+      "shortHelp": "Auto: Self, +Regeneration, +Recovery",
+      "icon": "bodymastery_physicalperfection.png",
+      "powerType": "Auto",
+      "requires": "$archetype == @Class_Stalker",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceModification",
+        "Heal"
+      ],
+      "allowedSetCategories": [
+        "Endurance Modification",
+        "Healing"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "effectArea": "SingleTarget",
+        "regeneration": {
+          "scale": 0.2,
+          "table": "Melee_Ones"
+        },
+        "recovery": {
+          "scale": 0.125,
+          "table": "Melee_Ones"
+        }
+      }
+    },
+    {
+      "name": "Shuriken",
+      "fullName": "Epic.Weapon_Mastery_Stalker.Shuriken",
+      "rank": 3,
+      "available": 37,
+      "description": "A classic small throwing weapon, you can throw Shurikens at a pretty fast rate of fire. You must be level 38 and have one other Weapon Mastery Powers before selecting this power.",
+      "shortHelp": "Ranged, DMG(Lethal)",
+      "icon": "weaponmastery_shuriken.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Ranged Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 70.0,
+        "recharge": 6.0,
+        "endurance": 5.46,
+        "activationTime": 1.07,
+        "effectArea": "SingleTarget",
+        "damage": {
+          "type": "Lethal",
+          "scale": 1.389,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    },
+    {
+      "name": "Targeting Drone",
+      "fullName": "Epic.Weapon_Mastery_Stalker.Targeting_Drone",
+      "rank": 4,
+      "available": 40,
+      "description": "When this device is activated, the small Targeting Drone hovers around your head and emits targeting laser sights. The lasers can dramatically improve your chance to hit and increase your perception, allowing you to better see stealthy foes. Targeting Drone also grants you resistance to powers that debuff your chance to hit. This is a toggle power and must be activated and deactivated manually. Like all toggle powers, Targeting Drone costs endurance while active. You must be level 41 and have one other Weapon Mastery Powers before selecting this power.",
+      "shortHelp": "Toggle: Self +To Hit, +ACC, +Perception, Res(DeBuff To Hit)",
+      "icon": "weaponmastery_targetingdrone.png",
+      "powerType": "Toggle",
+      "requires": "ownPowerNum?(Epic) > 0",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Recharge"
+      ],
+      "allowedSetCategories": [
+        "To Hit Buff"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "recharge": 20.0,
+        "endurance": 0.195,
+        "activationTime": 1.17,
+        "effectArea": "SingleTarget",
+        "resistance": {}
+      }
+    },
+    {
+      "name": "Exploding Shuriken",
+      "fullName": "Epic.Weapon_Mastery_Stalker.Exploding_Shuriken",
+      "rank": 5,
+      "available": 43,
+      "description": "This small throwing star is rigged to explode on impact. You must be level 44 and have two other Weapon Mastery Powers before selecting this power.<br>",
+      "shortHelp": "Ranged (Targeted AoE), DMG(Lethal)",
+      "icon": "weaponmastery_explodingshuriken.png",
+      "powerType": "Click",
+      "requires": "ownPowerNum?(Epic) > 1",
+      "maxSlots": 6,
+      "allowedEnhancements": [
+        "EnduranceReduction",
+        "Range",
+        "Recharge",
+        "Damage",
+        "Accuracy"
+      ],
+      "allowedSetCategories": [
+        "Ranged AoE Damage",
+        "Universal Damage Sets"
+      ],
+      "effects": {
+        "accuracy": 1.0,
+        "range": 80.0,
+        "recharge": 32.0,
+        "endurance": 18.98,
+        "activationTime": 1.0,
+        "effectArea": "AoE",
+        "radius": 15.0,
+        "damage": {
+          "type": "Lethal",
+          "scale": 0.7323,
+          "table": "Melee_PvPDamage"
+        }
+      }
+    }
+  ]
+};
+
+// Register epic pool
+if (typeof EPIC_POOLS !== 'undefined') {
+    EPIC_POOLS['weapon_mastery_stalker'] = EPIC_WEAPON_MASTERY_STALKER;
+} else {
+    console.error('EPIC_POOLS registry not found. Make sure epic-pools.js is loaded first.');
+}
@@ -13,10 +13,9 @@ function debugFireFire() {
     // 1. Set Archetype
     const archetypeSelect = document.getElementById('archetypeSelect');
     archetypeSelect.value = 'blaster';
-    onArchetypeChange();
     
-    // 2. Set Primary (Fire Blast)
-    setTimeout(() => {
+    // 2. Set Primary (Fire Blast) once the blaster powersets are loaded
+    onArchetypeChange().then(() => {
         const primarySelect = document.getElementById('primarySelect');
         primarySelect.value = 'fire-blast';
         onPrimaryChange();
@@ -55,7 +54,7 @@ function debugFireFire() {
                 }, 100);
             }, 100);
         }, 100);
-    }, 100);
+    });
 }
 
 // Add Fire Blast and Fire Manipulation to POWERSETS if they're loaded
@@ -10,7 +10,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"Endurance": 0.275, "Recovery": 0.275}, "strengthIgnoresDiminishing": {"Endurance": 0.055, "Recovery": 0.055}},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -20,7 +21,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"Endurance": 0.22, "Recovery": 0.22, "RechargeTime": 0.22}, "strengthIgnoresDiminishing": {"Endurance": 0.11, "Recovery": 0.11, "RechargeTime": 0.11}},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -30,7 +32,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"Endurance": 0.22, "Recovery": 0.22, "Ranged": 0.1333, "Melee": 0.1333, "Area": 0.1333, "Smashing": 0.1333, "Lethal": 0.1333, "Fire": 0.1333, "Cold": 0.1333, "Energy": 0.1333, "Negative_Energy": 0.1333, "Psionic": 0.1333, "Toxic": 0.1333, "Base_Defense": 0.1333}, "strengthIgnoresDiminishing": {"Endurance": 0.11, "Recovery": 0.11, "Ranged": 0.0667, "Melee": 0.0667, "Area": 0.0667, "Smashing": 0.0667, "Lethal": 0.0667, "Fire": 0.0667, "Cold": 0.0667, "Energy": 0.0667, "Negative_Energy": 0.0667, "Psionic": 0.0667, "Toxic": 0.0667, "Base_Defense": 0.0667}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -40,7 +43,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Endurance": 0.15, "Recovery": 0.15, "RechargeTime": 0.11, "Ranged": 0.0667, "Melee": 0.0667, "Area": 0.0667, "Smashing": 0.0667, "Lethal": 0.0667, "Fire": 0.0667, "Cold": 0.0667, "Energy": 0.0667, "Negative_Energy": 0.0667, "Psionic": 0.0667, "Toxic": 0.0667, "Base_Defense": 0.0667}, "strengthIgnoresDiminishing": {"Endurance": 0.3, "Recovery": 0.3, "RechargeTime": 0.22, "Ranged": 0.1333, "Melee": 0.1333, "Area": 0.1333, "Smashing": 0.1333, "Lethal": 0.1333, "Fire": 0.1333, "Cold": 0.1333, "Energy": 0.1333, "Negative_Energy": 0.1333, "Psionic": 0.1333, "Toxic": 0.1333, "Base_Defense": 0.1333}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -50,7 +54,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Endurance": 0.165, "Recovery": 0.165, "RechargeTime": 0.165, "Ranged": 0.1, "Melee": 0.1, "Area": 0.1, "Smashing": 0.1, "Lethal": 0.1, "Fire": 0.1, "Cold": 0.1, "Energy": 0.1, "Negative_Energy": 0.1, "Psionic": 0.1, "Toxic": 0.1, "Base_Defense": 0.1}, "strengthIgnoresDiminishing": {"Endurance": 0.165, "Recovery": 0.165, "RechargeTime": 0.165, "Ranged": 0.1, "Melee": 0.1, "Area": 0.1, "Smashing": 0.1, "Lethal": 0.1, "Fire": 0.1, "Cold": 0.1, "Energy": 0.1, "Negative_Energy": 0.1, "Psionic": 0.1, "Toxic": 0.1, "Base_Defense": 0.1}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -60,7 +65,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Endurance": 0.11, "Recovery": 0.11, "RechargeTime": 0.11, "Ranged": 0.0667, "Melee": 0.0667, "Area": 0.0667, "Smashing": 0.0667, "Lethal": 0.0667, "Fire": 0.0667, "Cold": 0.0667, "Energy": 0.0667, "Negative_Energy": 0.0667, "Psionic": 0.0667, "Toxic": 0.0667, "Base_Defense": 0.0667, "JumpingSpeed": 0.11, "JumpHeight": 0.11, "RunningSpeed": 0.11, "FlyingSpeed": 0.11}, "strengthIgnoresDiminishing": {"Endurance": 0.22, "Recovery": 0.22, "RechargeTime": 0.22, "Ranged": 0.1333, "Melee": 0.1333, "Area": 0.1333, "Smashing": 0.1333, "Lethal": 0.1333, "Fire": 0.1333, "Cold": 0.1333, "Energy": 0.1333, "Negative_Energy": 0.1333, "Psionic": 0.1333, "Toxic": 0.1333, "Base_Defense": 0.1333, "JumpingSpeed": 0.22, "JumpHeight": 0.22, "RunningSpeed": 0.22, "FlyingSpeed": 0.22}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -70,7 +76,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Endurance": 0.165, "Recovery": 0.165, "RechargeTime": 0.0825, "Ranged": 0.1, "Melee": 0.1, "Area": 0.1, "Smashing": 0.1, "Lethal": 0.1, "Fire": 0.1, "Cold": 0.1, "Energy": 0.1, "Negative_Energy": 0.1, "Psionic": 0.1, "Toxic": 0.1, "Base_Defense": 0.1, "RunningSpeed": 0.165}, "strengthIgnoresDiminishing": {"Endurance": 0.165, "Recovery": 0.165, "RechargeTime": 0.0825, "Ranged": 0.1, "Melee": 0.1, "Area": 0.1, "Smashing": 0.1, "Lethal": 0.1, "Fire": 0.1, "Cold": 0.1, "Energy": 0.1, "Negative_Energy": 0.1, "Psionic": 0.1, "Toxic": 0.1, "Base_Defense": 0.1, "RunningSpeed": 0.165}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -80,7 +87,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Endurance": 0.225, "Recovery": 0.225, "RechargeTime": 0.165}, "strengthIgnoresDiminishing": {"Endurance": 0.225, "Recovery": 0.225, "RechargeTime": 0.165}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -90,7 +98,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Endurance": 0.165, "Recovery": 0.165, "RechargeTime": 0.0825, "Ranged": 0.1, "Melee": 0.1, "Area": 0.1, "Smashing": 0.1, "Lethal": 0.1, "Fire": 0.1, "Cold": 0.1, "Energy": 0.1, "Negative_Energy": 0.1, "Psionic": 0.1, "Toxic": 0.1, "Base_Defense": 0.1, "JumpingSpeed": 0.165, "JumpHeight": 0.165}, "strengthIgnoresDiminishing": {"Endurance": 0.165, "Recovery": 0.165, "RechargeTime": 0.0825, "Ranged": 0.1, "Melee": 0.1, "Area": 0.1, "Smashing": 0.1, "Lethal": 0.1, "Fire": 0.1, "Cold": 0.1, "Energy": 0.1, "Negative_Energy": 0.1, "Psionic": 0.1, "Toxic": 0.1, "Base_Defense": 0.1, "JumpingSpeed": 0.165, "JumpHeight": 0.165}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -102,7 +111,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"EnduranceDiscount": 0.275}, "strengthIgnoresDiminishing": {"EnduranceDiscount": 0.055}},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -112,7 +122,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"EnduranceDiscount": 0.22, "Range": 0.1333}, "strengthIgnoresDiminishing": {"EnduranceDiscount": 0.11, "Range": 0.0667}},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -122,7 +133,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"EnduranceDiscount": 0.22, "Smashing_Dmg": 0.1333, "Lethal_Dmg": 0.1333, "Fire_Dmg": 0.1333, "Cold_Dmg": 0.1333, "Energy_Dmg": 0.1333, "Negative_Energy_Dmg": 0.1333, "Psionic_Dmg": 0.1333, "Toxic_Dmg": 0.1333}, "strengthIgnoresDiminishing": {"EnduranceDiscount": 0.11, "Smashing_Dmg": 0.0667, "Lethal_Dmg": 0.0667, "Fire_Dmg": 0.0667, "Cold_Dmg": 0.0667, "Energy_Dmg": 0.0667, "Negative_Energy_Dmg": 0.0667, "Psionic_Dmg": 0.0667, "Toxic_Dmg": 0.0667}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -132,7 +144,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"EnduranceDiscount": 0.15, "Range": 0.0667, "Smashing_Dmg": 0.0667, "Lethal_Dmg": 0.0667, "Fire_Dmg": 0.0667, "Cold_Dmg": 0.0667, "Energy_Dmg": 0.0667, "Negative_Energy_Dmg": 0.0667, "Psionic_Dmg": 0.0667, "Toxic_Dmg": 0.0667}, "strengthIgnoresDiminishing": {"EnduranceDiscount": 0.3, "Range": 0.1333, "Smashing_Dmg": 0.1333, "Lethal_Dmg": 0.1333, "Fire_Dmg": 0.1333, "Cold_Dmg": 0.1333, "Energy_Dmg": 0.1333, "Negative_Energy_Dmg": 0.1333, "Psionic_Dmg": 0.1333, "Toxic_Dmg": 0.1333}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -142,7 +155,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"EnduranceDiscount": 0.165, "Range": 0.1, "Smashing_Dmg": 0.1, "Lethal_Dmg": 0.1, "Fire_Dmg": 0.1, "Cold_Dmg": 0.1, "Energy_Dmg": 0.1, "Negative_Energy_Dmg": 0.1, "Psionic_Dmg": 0.1, "Toxic_Dmg": 0.1}, "strengthIgnoresDiminishing": {"EnduranceDiscount": 0.165, "Range": 0.1, "Smashing_Dmg": 0.1, "Lethal_Dmg": 0.1, "Fire_Dmg": 0.1, "Cold_Dmg": 0.1, "Energy_Dmg": 0.1, "Negative_Energy_Dmg": 0.1, "Psionic_Dmg": 0.1, "Toxic_Dmg": 0.1}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -152,7 +166,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"EnduranceDiscount": 0.11, "Range": 0.0667, "Smashing_Dmg": 0.0667, "Lethal_Dmg": 0.0667, "Fire_Dmg": 0.0667, "Cold_Dmg": 0.0667, "Energy_Dmg": 0.0667, "Negative_Energy_Dmg": 0.0667, "Psionic_Dmg": 0.0667, "Toxic_Dmg": 0.0667, "Sleep": 0.11, "Afraid": 0.11, "Terrorized": 0.11, "Absorb": 0.11}, "strengthIgnoresDiminishing": {"EnduranceDiscount": 0.22, "Range": 0.1333, "Smashing_Dmg": 0.1333, "Lethal_Dmg": 0.1333, "Fire_Dmg": 0.1333, "Cold_Dmg": 0.1333, "Energy_Dmg": 0.1333, "Negative_Energy_Dmg": 0.1333, "Psionic_Dmg": 0.1333, "Toxic_Dmg": 0.1333, "Sleep": 0.22, "Afraid": 0.22, "Terrorized": 0.22, "Absorb": 0.22}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -162,7 +177,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"EnduranceDiscount": 0.165, "Range": 0.05, "Smashing_Dmg": 0.1, "Lethal_Dmg": 0.1, "Fire_Dmg": 0.1, "Cold_Dmg": 0.1, "Energy_Dmg": 0.1, "Negative_Energy_Dmg": 0.1, "Psionic_Dmg": 0.1, "Toxic_Dmg": 0.1, "Afraid": 0.165, "Terrorized": 0.165}, "strengthIgnoresDiminishing": {"EnduranceDiscount": 0.165, "Range": 0.05, "Smashing_Dmg": 0.1, "Lethal_Dmg": 0.1, "Fire_Dmg": 0.1, "Cold_Dmg": 0.1, "Energy_Dmg": 0.1, "Negative_Energy_Dmg": 0.1, "Psionic_Dmg": 0.1, "Toxic_Dmg": 0.1, "Afraid": 0.165, "Terrorized": 0.165}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -172,7 +188,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"EnduranceDiscount": 0.225, "Range": 0.1}, "strengthIgnoresDiminishing": {"EnduranceDiscount": 0.225, "Range": 0.1}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -182,7 +199,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"EnduranceDiscount": 0.165, "Range": 0.05, "Smashing_Dmg": 0.1, "Lethal_Dmg": 0.1, "Fire_Dmg": 0.1, "Cold_Dmg": 0.1, "Energy_Dmg": 0.1, "Negative_Energy_Dmg": 0.1, "Psionic_Dmg": 0.1, "Toxic_Dmg": 0.1, "Sleep": 0.165}, "strengthIgnoresDiminishing": {"EnduranceDiscount": 0.165, "Range": 0.05, "Smashing_Dmg": 0.1, "Lethal_Dmg": 0.1, "Fire_Dmg": 0.1, "Cold_Dmg": 0.1, "Energy_Dmg": 0.1, "Negative_Energy_Dmg": 0.1, "Psionic_Dmg": 0.1, "Toxic_Dmg": 0.1, "Sleep": 0.165}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -194,7 +212,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"Held": 0.275}, "strengthIgnoresDiminishing": {"Held": 0.055}},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -204,7 +223,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"Held": 0.22, "Ranged": 0.22, "Melee": 0.22, "Area": 0.22, "Smashing": 0.22, "Lethal": 0.22, "Fire": 0.22, "Cold": 0.22, "Energy": 0.22, "Negative_Energy": 0.22, "Psionic": 0.22, "Toxic": 0.22, "Base_Defense": 0.22}, "strengthIgnoresDiminishing": {"Held": 0.11, "Ranged": 0.11, "Melee": 0.11, "Area": 0.11, "Smashing": 0.11, "Lethal": 0.11, "Fire": 0.11, "Cold": 0.11, "Energy": 0.11, "Negative_Energy": 0.11, "Psionic": 0.11, "Toxic": 0.11, "Base_Defense": 0.11}},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -214,7 +234,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"Held": 0.22, "Range": 0.1333}, "strengthIgnoresDiminishing": {"Held": 0.11, "Range": 0.0667}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -224,7 +245,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Held": 0.15, "Ranged": 0.11, "Melee": 0.11, "Area": 0.11, "Smashing": 0.11, "Lethal": 0.11, "Fire": 0.11, "Cold": 0.11, "Energy": 0.11, "Negative_Energy": 0.11, "Psionic": 0.11, "Toxic": 0.11, "Base_Defense": 0.11, "Range": 0.0667}, "strengthIgnoresDiminishing": {"Held": 0.3, "Ranged": 0.22, "Melee": 0.22, "Area": 0.22, "Smashing": 0.22, "Lethal": 0.22, "Fire": 0.22, "Cold": 0.22, "Energy": 0.22, "Negative_Energy": 0.22, "Psionic": 0.22, "Toxic": 0.22, "Base_Defense": 0.22, "Range": 0.1333}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -234,7 +256,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Held": 0.165, "Ranged": 0.165, "Melee": 0.165, "Area": 0.165, "Smashing": 0.165, "Lethal": 0.165, "Fire": 0.165, "Cold": 0.165, "Energy": 0.165, "Negative_Energy": 0.165, "Psionic": 0.165, "Toxic": 0.165, "Base_Defense": 0.165, "Range": 0.1}, "strengthIgnoresDiminishing": {"Held": 0.165, "Ranged": 0.165, "Melee": 0.165, "Area": 0.165, "Smashing": 0.165, "Lethal": 0.165, "Fire": 0.165, "Cold": 0.165, "Energy": 0.165, "Negative_Energy": 0.165, "Psionic": 0.165, "Toxic": 0.165, "Base_Defense": 0.165, "Range": 0.1}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -244,7 +267,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Held": 0.11, "Ranged": 0.11, "Melee": 0.11, "Area": 0.11, "Smashing": 0.11, "Lethal": 0.11, "Fire": 0.11, "Cold": 0.11, "Energy": 0.11, "Negative_Energy": 0.11, "Psionic": 0.11, "Toxic": 0.11, "Base_Defense": 0.11, "Range": 0.0667, "ToHit": 0.0667, "Smashing_Dmg": 0.11, "Lethal_Dmg": 0.11, "Fire_Dmg": 0.11, "Cold_Dmg": 0.11, "Energy_Dmg": 0.11, "Negative_Energy_Dmg": 0.11, "Psionic_Dmg": 0.11, "Toxic_Dmg": 0.11, "RunningSpeed": 0.11, "FlyingSpeed": 0.11, "JumpingSpeed": 0.11}, "strengthIgnoresDiminishing": {"Held": 0.22, "Ranged": 0.22, "Melee": 0.22, "Area": 0.22, "Smashing": 0.22, "Lethal": 0.22, "Fire": 0.22, "Cold": 0.22, "Energy": 0.22, "Negative_Energy": 0.22, "Psionic": 0.22, "Toxic": 0.22, "Base_Defense": 0.22, "Range": 0.1333, "ToHit": 0.1333, "Smashing_Dmg": 0.22, "Lethal_Dmg": 0.22, "Fire_Dmg": 0.22, "Cold_Dmg": 0.22, "Energy_Dmg": 0.22, "Negative_Energy_Dmg": 0.22, "Psionic_Dmg": 0.22, "Toxic_Dmg": 0.22, "RunningSpeed": 0.22, "FlyingSpeed": 0.22, "JumpingSpeed": 0.22}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -254,7 +278,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Held": 0.165, "Ranged": 0.0825, "Melee": 0.0825, "Area": 0.0825, "Smashing": 0.0825, "Lethal": 0.0825, "Fire": 0.0825, "Cold": 0.0825, "Energy": 0.0825, "Negative_Energy": 0.0825, "Psionic": 0.0825, "Toxic": 0.0825, "Base_Defense": 0.0825, "Range": 0.1, "Smashing_Dmg": 0.165, "Lethal_Dmg": 0.165, "Fire_Dmg": 0.165, "Cold_Dmg": 0.165, "Energy_Dmg": 0.165, "Negative_Energy_Dmg": 0.165, "Psionic_Dmg": 0.165, "Toxic_Dmg": 0.165}, "strengthIgnoresDiminishing": {"Held": 0.165, "Ranged": 0.0825, "Melee": 0.0825, "Area": 0.0825, "Smashing": 0.0825, "Lethal": 0.0825, "Fire": 0.0825, "Cold": 0.0825, "Energy": 0.0825, "Negative_Energy": 0.0825, "Psionic": 0.0825, "Toxic": 0.0825, "Base_Defense": 0.0825, "Range": 0.1, "Smashing_Dmg": 0.165, "Lethal_Dmg": 0.165, "Fire_Dmg": 0.165, "Cold_Dmg": 0.165, "Energy_Dmg": 0.165, "Negative_Energy_Dmg": 0.165, "Psionic_Dmg": 0.165, "Toxic_Dmg": 0.165}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -264,7 +289,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Held": 0.225, "Ranged": 0.165, "Melee": 0.165, "Area": 0.165, "Smashing": 0.165, "Lethal": 0.165, "Fire": 0.165, "Cold": 0.165, "Energy": 0.165, "Negative_Energy": 0.165, "Psionic": 0.165, "Toxic": 0.165, "Base_Defense": 0.165}, "strengthIgnoresDiminishing": {"Held": 0.225, "Ranged": 0.165, "Melee": 0.165, "Area": 0.165, "Smashing": 0.165, "Lethal": 0.165, "Fire": 0.165, "Cold": 0.165, "Energy": 0.165, "Negative_Energy": 0.165, "Psionic": 0.165, "Toxic": 0.165, "Base_Defense": 0.165}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -274,7 +300,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Held": 0.165, "Ranged": 0.0825, "Melee": 0.0825, "Area": 0.0825, "Smashing": 0.0825, "Lethal": 0.0825, "Fire": 0.0825, "Cold": 0.0825, "Energy": 0.0825, "Negative_Energy": 0.0825, "Psionic": 0.0825, "Toxic": 0.0825, "Base_Defense": 0.0825, "Range": 0.1, "ToHit": 0.1}, "strengthIgnoresDiminishing": {"Held": 0.165, "Ranged": 0.0825, "Melee": 0.0825, "Area": 0.0825, "Smashing": 0.0825, "Lethal": 0.0825, "Fire": 0.0825, "Cold": 0.0825, "Energy": 0.0825, "Negative_Energy": 0.0825, "Psionic": 0.0825, "Toxic": 0.0825, "Base_Defense": 0.0825, "Range": 0.1, "ToHit": 0.1}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -286,7 +313,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"Smashing_Dmg": 0.275, "Lethal_Dmg": 0.275, "Fire_Dmg": 0.275, "Cold_Dmg": 0.275, "Energy_Dmg": 0.275, "Negative_Energy_Dmg": 0.275, "Psionic_Dmg": 0.275, "Toxic_Dmg": 0.275}, "strengthIgnoresDiminishing": {"Smashing_Dmg": 0.055, "Lethal_Dmg": 0.055, "Fire_Dmg": 0.055, "Cold_Dmg": 0.055, "Energy_Dmg": 0.055, "Negative_Energy_Dmg": 0.055, "Psionic_Dmg": 0.055, "Toxic_Dmg": 0.055}},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -296,7 +324,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"Smashing_Dmg": 0.22, "Lethal_Dmg": 0.22, "Fire_Dmg": 0.22, "Cold_Dmg": 0.22, "Energy_Dmg": 0.22, "Negative_Energy_Dmg": 0.22, "Psionic_Dmg": 0.22, "Toxic_Dmg": 0.22, "Immobilized": 0.22}, "strengthIgnoresDiminishing": {"Smashing_Dmg": 0.11, "Lethal_Dmg": 0.11, "Fire_Dmg": 0.11, "Cold_Dmg": 0.11, "Energy_Dmg": 0.11, "Negative_Energy_Dmg": 0.11, "Psionic_Dmg": 0.11, "Toxic_Dmg": 0.11, "Immobilized": 0.11}},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -306,7 +335,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"Smashing_Dmg": 0.22, "Lethal_Dmg": 0.22, "Fire_Dmg": 0.22, "Cold_Dmg": 0.22, "Energy_Dmg": 0.22, "Negative_Energy_Dmg": 0.22, "Psionic_Dmg": 0.22, "Toxic_Dmg": 0.22, "Ranged": 0.22, "Melee": 0.22, "Area": 0.22, "Smashing": 0.22, "Lethal": 0.22, "Fire": 0.22, "Cold": 0.22, "Energy": 0.22, "Negative_Energy": 0.22, "Psionic": 0.22, "Toxic": 0.22, "Base_Defense": 0.22}, "strengthIgnoresDiminishing": {"Smashing_Dmg": 0.11, "Lethal_Dmg": 0.11, "Fire_Dmg": 0.11, "Cold_Dmg": 0.11, "Energy_Dmg": 0.11, "Negative_Energy_Dmg": 0.11, "Psionic_Dmg": 0.11, "Toxic_Dmg": 0.11, "Ranged": 0.11, "Melee": 0.11, "Area": 0.11, "Smashing": 0.11, "Lethal": 0.11, "Fire": 0.11, "Cold": 0.11, "Energy": 0.11, "Negative_Energy": 0.11, "Psionic": 0.11, "Toxic": 0.11, "Base_Defense": 0.11}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -316,7 +346,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Smashing_Dmg": 0.15, "Lethal_Dmg": 0.15, "Fire_Dmg": 0.15, "Cold_Dmg": 0.15, "Energy_Dmg": 0.15, "Negative_Energy_Dmg": 0.15, "Psionic_Dmg": 0.15, "Toxic_Dmg": 0.15, "Immobilized": 0.11, "Ranged": 0.11, "Melee": 0.11, "Area": 0.11, "Smashing": 0.11, "Lethal": 0.11, "Fire": 0.11, "Cold": 0.11, "Energy": 0.11, "Negative_Energy": 0.11, "Psionic": 0.11, "Toxic": 0.11, "Base_Defense": 0.11}, "strengthIgnoresDiminishing": {"Smashing_Dmg": 0.3, "Lethal_Dmg": 0.3, "Fire_Dmg": 0.3, "Cold_Dmg": 0.3, "Energy_Dmg": 0.3, "Negative_Energy_Dmg": 0.3, "Psionic_Dmg": 0.3, "Toxic_Dmg": 0.3, "Immobilized": 0.22, "Ranged": 0.22, "Melee": 0.22, "Area": 0.22, "Smashing": 0.22, "Lethal": 0.22, "Fire": 0.22, "Cold": 0.22, "Energy": 0.22, "Negative_Energy": 0.22, "Psionic": 0.22, "Toxic": 0.22, "Base_Defense": 0.22}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -326,7 +357,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Smashing_Dmg": 0.165, "Lethal_Dmg": 0.165, "Fire_Dmg": 0.165, "Cold_Dmg": 0.165, "Energy_Dmg": 0.165, "Negative_Energy_Dmg": 0.165, "Psionic_Dmg": 0.165, "Toxic_Dmg": 0.165, "Immobilized": 0.165, "Ranged": 0.165, "Melee": 0.165, "Area": 0.165, "Smashing": 0.165, "Lethal": 0.165, "Fire": 0.165, "Cold": 0.165, "Energy": 0.165, "Negative_Energy": 0.165, "Psionic": 0.165, "Toxic": 0.165, "Base_Defense": 0.165}, "strengthIgnoresDiminishing": {"Smashing_Dmg": 0.165, "Lethal_Dmg": 0.165, "Fire_Dmg": 0.165, "Cold_Dmg": 0.165, "Energy_Dmg": 0.165, "Negative_Energy_Dmg": 0.165, "Psionic_Dmg": 0.165, "Toxic_Dmg": 0.165, "Immobilized": 0.165, "Ranged": 0.165, "Melee": 0.165, "Area": 0.165, "Smashing": 0.165, "Lethal": 0.165, "Fire": 0.165, "Cold": 0.165, "Energy": 0.165, "Negative_Energy": 0.165, "Psionic": 0.165, "Toxic": 0.165, "Base_Defense": 0.165}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -336,7 +368,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Smashing_Dmg": 0.11, "Lethal_Dmg": 0.11, "Fire_Dmg": 0.11, "Cold_Dmg": 0.11, "Energy_Dmg": 0.11, "Negative_Energy_Dmg": 0.11, "Psionic_Dmg": 0.11, "Toxic_Dmg": 0.11, "Immobilized": 0.11, "Ranged": 0.11, "Melee": 0.11, "Area": 0.11, "Smashing": 0.11, "Lethal": 0.11, "Fire": 0.11, "Cold": 0.11, "Energy": 0.11, "Negative_Energy": 0.11, "Psionic": 0.11, "Toxic": 0.11, "Base_Defense": 0.11, "Endurance": 0.11, "Recovery": 0.11, "ToHit": 0.0667, "RunningSpeed": 0.11}, "strengthIgnoresDiminishing": {"Smashing_Dmg": 0.22, "Lethal_Dmg": 0.22, "Fire_Dmg": 0.22, "Cold_Dmg": 0.22, "Energy_Dmg": 0.22, "Negative_Energy_Dmg": 0.22, "Psionic_Dmg": 0.22, "Toxic_Dmg": 0.22, "Immobilized": 0.22, "Ranged": 0.22, "Melee": 0.22, "Area": 0.22, "Smashing": 0.22, "Lethal": 0.22, "Fire": 0.22, "Cold": 0.22, "Energy": 0.22, "Negative_Energy": 0.22, "Psionic": 0.22, "Toxic": 0.22, "Base_Defense": 0.22, "Endurance": 0.22, "Recovery": 0.22, "ToHit": 0.1333, "RunningSpeed": 0.22}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -346,7 +379,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Smashing_Dmg": 0.165, "Lethal_Dmg": 0.165, "Fire_Dmg": 0.165, "Cold_Dmg": 0.165, "Energy_Dmg": 0.165, "Negative_Energy_Dmg": 0.165, "Psionic_Dmg": 0.165, "Toxic_Dmg": 0.165, "Immobilized": 0.0825, "Ranged": 0.165, "Melee": 0.165, "Area": 0.165, "Smashing": 0.165, "Lethal": 0.165, "Fire": 0.165, "Cold": 0.165, "Energy": 0.165, "Negative_Energy": 0.165, "Psionic": 0.165, "Toxic": 0.165, "Base_Defense": 0.165, "ToHit": 0.1}, "strengthIgnoresDiminishing": {"Smashing_Dmg": 0.165, "Lethal_Dmg": 0.165, "Fire_Dmg": 0.165, "Cold_Dmg": 0.165, "Energy_Dmg": 0.165, "Negative_Energy_Dmg": 0.165, "Psionic_Dmg": 0.165, "Toxic_Dmg": 0.165, "Immobilized": 0.0825, "Ranged": 0.165, "Melee": 0.165, "Area": 0.165, "Smashing": 0.165, "Lethal": 0.165, "Fire": 0.165, "Cold": 0.165, "Energy": 0.165, "Negative_Energy": 0.165, "Psionic": 0.165, "Toxic": 0.165, "Base_Defense": 0.165, "ToHit": 0.1}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -356,7 +390,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Smashing_Dmg": 0.225, "Lethal_Dmg": 0.225, "Fire_Dmg": 0.225, "Cold_Dmg": 0.225, "Energy_Dmg": 0.225, "Negative_Energy_Dmg": 0.225, "Psionic_Dmg": 0.225, "Toxic_Dmg": 0.225, "Immobilized": 0.165}, "strengthIgnoresDiminishing": {"Smashing_Dmg": 0.225, "Lethal_Dmg": 0.225, "Fire_Dmg": 0.225, "Cold_Dmg": 0.225, "Energy_Dmg": 0.225, "Negative_Energy_Dmg": 0.225, "Psionic_Dmg": 0.225, "Toxic_Dmg": 0.225, "Immobilized": 0.165}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -366,7 +401,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Smashing_Dmg": 0.165, "Lethal_Dmg": 0.165, "Fire_Dmg": 0.165, "Cold_Dmg": 0.165, "Energy_Dmg": 0.165, "Negative_Energy_Dmg": 0.165, "Psionic_Dmg": 0.165, "Toxic_Dmg": 0.165, "Immobilized": 0.0825, "Ranged": 0.165, "Melee": 0.165, "Area": 0.165, "Smashing": 0.165, "Lethal": 0.165, "Fire": 0.165, "Cold": 0.165, "Energy": 0.165, "Negative_Energy": 0.165, "Psionic": 0.165, "Toxic": 0.165, "Base_Defense": 0.165, "Endurance": 0.165, "Recovery": 0.165}, "strengthIgnoresDiminishing": {"Smashing_Dmg": 0.165, "Lethal_Dmg": 0.165, "Fire_Dmg": 0.165, "Cold_Dmg": 0.165, "Energy_Dmg": 0.165, "Negative_Energy_Dmg": 0.165, "Psionic_Dmg": 0.165, "Toxic_Dmg": 0.165, "Immobilized": 0.0825, "Ranged": 0.165, "Melee": 0.165, "Area": 0.165, "Smashing": 0.165, "Lethal": 0.165, "Fire": 0.165, "Cold": 0.165, "Energy": 0.165, "Negative_Energy": 0.165, "Psionic": 0.165, "Toxic": 0.165, "Base_Defense": 0.165, "Endurance": 0.165, "Recovery": 0.165}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -378,7 +414,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"Accuracy": 0.275}, "strengthIgnoresDiminishing": {"Accuracy": 0.055}},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -388,7 +425,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"Accuracy": 0.22, "Held": 0.22}, "strengthIgnoresDiminishing": {"Accuracy": 0.11, "Held": 0.11}},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -398,7 +436,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"Accuracy": 0.22, "Ranged": 0.1333, "Melee": 0.1333, "Area": 0.1333, "Smashing": 0.1333, "Lethal": 0.1333, "Fire": 0.1333, "Cold": 0.1333, "Energy": 0.1333, "Negative_Energy": 0.1333, "Psionic": 0.1333, "Toxic": 0.1333, "Base_Defense": 0.1333}, "strengthIgnoresDiminishing": {"Accuracy": 0.11, "Ranged": 0.0667, "Melee": 0.0667, "Area": 0.0667, "Smashing": 0.0667, "Lethal": 0.0667, "Fire": 0.0667, "Cold": 0.0667, "Energy": 0.0667, "Negative_Energy": 0.0667, "Psionic": 0.0667, "Toxic": 0.0667, "Base_Defense": 0.0667}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -408,7 +447,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Accuracy": 0.15, "Held": 0.11, "Ranged": 0.0667, "Melee": 0.0667, "Area": 0.0667, "Smashing": 0.0667, "Lethal": 0.0667, "Fire": 0.0667, "Cold": 0.0667, "Energy": 0.0667, "Negative_Energy": 0.0667, "Psionic": 0.0667, "Toxic": 0.0667, "Base_Defense": 0.0667}, "strengthIgnoresDiminishing": {"Accuracy": 0.3, "Held": 0.22, "Ranged": 0.1333, "Melee": 0.1333, "Area": 0.1333, "Smashing": 0.1333, "Lethal": 0.1333, "Fire": 0.1333, "Cold": 0.1333, "Energy": 0.1333, "Negative_Energy": 0.1333, "Psionic": 0.1333, "Toxic": 0.1333, "Base_Defense": 0.1333}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -418,7 +458,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Accuracy": 0.165, "Held": 0.165, "Ranged": 0.1, "Melee": 0.1, "Area": 0.1, "Smashing": 0.1, "Lethal": 0.1, "Fire": 0.1, "Cold": 0.1, "Energy": 0.1, "Negative_Energy": 0.1, "Psionic": 0.1, "Toxic": 0.1, "Base_Defense": 0.1}, "strengthIgnoresDiminishing": {"Accuracy": 0.165, "Held": 0.165, "Ranged": 0.1, "Melee": 0.1, "Area": 0.1, "Smashing": 0.1, "Lethal": 0.1, "Fire": 0.1, "Cold": 0.1, "Energy": 0.1, "Negative_Energy": 0.1, "Psionic": 0.1, "Toxic": 0.1, "Base_Defense": 0.1}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -428,7 +469,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Accuracy": 0.11, "Held": 0.11, "Ranged": 0.0667, "Melee": 0.0667, "Area": 0.0667, "Smashing": 0.0667, "Lethal": 0.0667, "Fire": 0.0667, "Cold": 0.0667, "Energy": 0.0667, "Negative_Energy": 0.0667, "Psionic": 0.0667, "Toxic": 0.0667, "Base_Defense": 0.0667, "Confused": 0.11, "Taunt": 0.11, "Placate": 0.11, "FlyingSpeed": 0.11}, "strengthIgnoresDiminishing": {"Accuracy": 0.22, "Held": 0.22, "Ranged": 0.1333, "Melee": 0.1333, "Area": 0.1333, "Smashing": 0.1333, "Lethal": 0.1333, "Fire": 0.1333, "Cold": 0.1333, "Energy": 0.1333, "Negative_Energy": 0.1333, "Psionic": 0.1333, "Toxic": 0.1333, "Base_Defense": 0.1333, "Confused": 0.22, "Taunt": 0.22, "Placate": 0.22, "FlyingSpeed": 0.22}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -438,7 +480,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Accuracy": 0.165, "Held": 0.0825, "Ranged": 0.1, "Melee": 0.1, "Area": 0.1, "Smashing": 0.1, "Lethal": 0.1, "Fire": 0.1, "Cold": 0.1, "Energy": 0.1, "Negative_Energy": 0.1, "Psionic": 0.1, "Toxic": 0.1, "Base_Defense": 0.1, "Taunt": 0.165, "Placate": 0.165}, "strengthIgnoresDiminishing": {"Accuracy": 0.165, "Held": 0.0825, "Ranged": 0.1, "Melee": 0.1, "Area": 0.1, "Smashing": 0.1, "Lethal": 0.1, "Fire": 0.1, "Cold": 0.1, "Energy": 0.1, "Negative_Energy": 0.1, "Psionic": 0.1, "Toxic": 0.1, "Base_Defense": 0.1, "Taunt": 0.165, "Placate": 0.165}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -448,7 +491,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Accuracy": 0.225, "Held": 0.165}, "strengthIgnoresDiminishing": {"Accuracy": 0.225, "Held": 0.165}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -458,7 +502,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Accuracy": 0.165, "Held": 0.0825, "Ranged": 0.1, "Melee": 0.1, "Area": 0.1, "Smashing": 0.1, "Lethal": 0.1, "Fire": 0.1, "Cold": 0.1, "Energy": 0.1, "Negative_Energy": 0.1, "Psionic": 0.1, "Toxic": 0.1, "Base_Defense": 0.1, "Confused": 0.165}, "strengthIgnoresDiminishing": {"Accuracy": 0.165, "Held": 0.0825, "Ranged": 0.1, "Melee": 0.1, "Area": 0.1, "Smashing": 0.1, "Lethal": 0.1, "Fire": 0.1, "Cold": 0.1, "Energy": 0.1, "Negative_Energy": 0.1, "Psionic": 0.1, "Toxic": 0.1, "Base_Defense": 0.1, "Confused": 0.165}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -470,7 +515,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"Smashing_Dmg": 0.1667, "Lethal_Dmg": 0.1667, "Fire_Dmg": 0.1667, "Cold_Dmg": 0.1667, "Energy_Dmg": 0.1667, "Negative_Energy_Dmg": 0.1667, "Psionic_Dmg": 0.1667, "Toxic_Dmg": 0.1667}, "strengthIgnoresDiminishing": {"Smashing_Dmg": 0.0333, "Lethal_Dmg": 0.0333, "Fire_Dmg": 0.0333, "Cold_Dmg": 0.0333, "Energy_Dmg": 0.0333, "Negative_Energy_Dmg": 0.0333, "Psionic_Dmg": 0.0333, "Toxic_Dmg": 0.0333}},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -480,7 +526,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"Smashing_Dmg": 0.1333, "Lethal_Dmg": 0.1333, "Fire_Dmg": 0.1333, "Cold_Dmg": 0.1333, "Energy_Dmg": 0.1333, "Negative_Energy_Dmg": 0.1333, "Psionic_Dmg": 0.1333, "Toxic_Dmg": 0.1333, "ToHit": 0.1333}, "strengthIgnoresDiminishing": {"Smashing_Dmg": 0.0667, "Lethal_Dmg": 0.0667, "Fire_Dmg": 0.0667, "Cold_Dmg": 0.0667, "Energy_Dmg": 0.0667, "Negative_Energy_Dmg": 0.0667, "Psionic_Dmg": 0.0667, "Toxic_Dmg": 0.0667, "ToHit": 0.0667}},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -490,7 +537,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"Smashing_Dmg": 0.1333, "Lethal_Dmg": 0.1333, "Fire_Dmg": 0.1333, "Cold_Dmg": 0.1333, "Energy_Dmg": 0.1333, "Negative_Energy_Dmg": 0.1333, "Psionic_Dmg": 0.1333, "Toxic_Dmg": 0.1333, "Immobilized": 0.22}, "strengthIgnoresDiminishing": {"Smashing_Dmg": 0.0667, "Lethal_Dmg": 0.0667, "Fire_Dmg": 0.0667, "Cold_Dmg": 0.0667, "Energy_Dmg": 0.0667, "Negative_Energy_Dmg": 0.0667, "Psionic_Dmg": 0.0667, "Toxic_Dmg": 0.0667, "Immobilized": 0.11}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -500,7 +548,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Smashing_Dmg": 0.11, "Lethal_Dmg": 0.11, "Fire_Dmg": 0.11, "Cold_Dmg": 0.11, "Energy_Dmg": 0.11, "Negative_Energy_Dmg": 0.11, "Psionic_Dmg": 0.11, "Toxic_Dmg": 0.11, "ToHit": 0.0667, "Immobilized": 0.11}, "strengthIgnoresDiminishing": {"Smashing_Dmg": 0.22, "Lethal_Dmg": 0.22, "Fire_Dmg": 0.22, "Cold_Dmg": 0.22, "Energy_Dmg": 0.22, "Negative_Energy_Dmg": 0.22, "Psionic_Dmg": 0.22, "Toxic_Dmg": 0.22, "ToHit": 0.1333, "Immobilized": 0.22}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -510,7 +559,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Smashing_Dmg": 0.1, "Lethal_Dmg": 0.1, "Fire_Dmg": 0.1, "Cold_Dmg": 0.1, "Energy_Dmg": 0.1, "Negative_Energy_Dmg": 0.1, "Psionic_Dmg": 0.1, "Toxic_Dmg": 0.1, "ToHit": 0.1, "Immobilized": 0.165}, "strengthIgnoresDiminishing": {"Smashing_Dmg": 0.1, "Lethal_Dmg": 0.1, "Fire_Dmg": 0.1, "Cold_Dmg": 0.1, "Energy_Dmg": 0.1, "Negative_Energy_Dmg": 0.1, "Psionic_Dmg": 0.1, "Toxic_Dmg": 0.1, "ToHit": 0.1, "Immobilized": 0.165}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -520,7 +570,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Smashing_Dmg": 0.0667, "Lethal_Dmg": 0.0667, "Fire_Dmg": 0.0667, "Cold_Dmg": 0.0667, "Energy_Dmg": 0.0667, "Negative_Energy_Dmg": 0.0667, "Psionic_Dmg": 0.0667, "Toxic_Dmg": 0.0667, "ToHit": 0.0667, "Immobilized": 0.11, "Absorb": 0.11, "Stunned": 0.11, "Taunt": 0.11, "Placate": 0.11}, "strengthIgnoresDiminishing": {"Smashing_Dmg": 0.1333, "Lethal_Dmg": 0.1333, "Fire_Dmg": 0.1333, "Cold_Dmg": 0.1333, "Energy_Dmg": 0.1333, "Negative_Energy_Dmg": 0.1333, "Psionic_Dmg": 0.1333, "Toxic_Dmg": 0.1333, "ToHit": 0.1333, "Immobilized": 0.22, "Absorb": 0.22, "Stunned": 0.22, "Taunt": 0.22, "Placate": 0.22}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -530,7 +581,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Smashing_Dmg": 0.1, "Lethal_Dmg": 0.1, "Fire_Dmg": 0.1, "Cold_Dmg": 0.1, "Energy_Dmg": 0.1, "Negative_Energy_Dmg": 0.1, "Psionic_Dmg": 0.1, "Toxic_Dmg": 0.1, "ToHit": 0.05, "Immobilized": 0.165, "Stunned": 0.165}, "strengthIgnoresDiminishing": {"Smashing_Dmg": 0.1, "Lethal_Dmg": 0.1, "Fire_Dmg": 0.1, "Cold_Dmg": 0.1, "Energy_Dmg": 0.1, "Negative_Energy_Dmg": 0.1, "Psionic_Dmg": 0.1, "Toxic_Dmg": 0.1, "ToHit": 0.05, "Immobilized": 0.165, "Stunned": 0.165}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -540,7 +592,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Smashing_Dmg": 0.165, "Lethal_Dmg": 0.165, "Fire_Dmg": 0.165, "Cold_Dmg": 0.165, "Energy_Dmg": 0.165, "Negative_Energy_Dmg": 0.165, "Psionic_Dmg": 0.165, "Toxic_Dmg": 0.165, "ToHit": 0.1}, "strengthIgnoresDiminishing": {"Smashing_Dmg": 0.165, "Lethal_Dmg": 0.165, "Fire_Dmg": 0.165, "Cold_Dmg": 0.165, "Energy_Dmg": 0.165, "Negative_Energy_Dmg": 0.165, "Psionic_Dmg": 0.165, "Toxic_Dmg": 0.165, "ToHit": 0.1}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -550,7 +603,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Smashing_Dmg": 0.1, "Lethal_Dmg": 0.1, "Fire_Dmg": 0.1, "Cold_Dmg": 0.1, "Energy_Dmg": 0.1, "Negative_Energy_Dmg": 0.1, "Psionic_Dmg": 0.1, "Toxic_Dmg": 0.1, "ToHit": 0.05, "Immobilized": 0.165, "Absorb": 0.165}, "strengthIgnoresDiminishing": {"Smashing_Dmg": 0.1, "Lethal_Dmg": 0.1, "Fire_Dmg": 0.1, "Cold_Dmg": 0.1, "Energy_Dmg": 0.1, "Negative_Energy_Dmg": 0.1, "Psionic_Dmg": 0.1, "Toxic_Dmg": 0.1, "ToHit": 0.05, "Immobilized": 0.165, "Absorb": 0.165}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -562,7 +616,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"RechargeTime": 0.275}, "strengthIgnoresDiminishing": {"RechargeTime": 0.055}},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -572,7 +627,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"RechargeTime": 0.22, "Stunned": 0.22}, "strengthIgnoresDiminishing": {"RechargeTime": 0.11, "Stunned": 0.11}},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -582,7 +638,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"RechargeTime": 0.22, "Heal_Dmg": 0.22, "HitPoints": 0.22, "Regeneration": 0.22}, "strengthIgnoresDiminishing": {"RechargeTime": 0.11, "Heal_Dmg": 0.11, "HitPoints": 0.11, "Regeneration": 0.11}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -592,7 +649,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"RechargeTime": 0.15, "Stunned": 0.11, "Heal_Dmg": 0.11, "HitPoints": 0.11, "Regeneration": 0.11}, "strengthIgnoresDiminishing": {"RechargeTime": 0.3, "Stunned": 0.22, "Heal_Dmg": 0.22, "HitPoints": 0.22, "Regeneration": 0.22}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -602,7 +660,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"RechargeTime": 0.165, "Stunned": 0.165, "Heal_Dmg": 0.165, "HitPoints": 0.165, "Regeneration": 0.165}, "strengthIgnoresDiminishing": {"RechargeTime": 0.165, "Stunned": 0.165, "Heal_Dmg": 0.165, "HitPoints": 0.165, "Regeneration": 0.165}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -612,7 +671,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"RechargeTime": 0.11, "Stunned": 0.11, "Heal_Dmg": 0.11, "HitPoints": 0.11, "Regeneration": 0.11, "ToHit": 0.0667, "RunningSpeed": 0.11, "FlyingSpeed": 0.11, "JumpingSpeed": 0.22, "JumpHeight": 0.11}, "strengthIgnoresDiminishing": {"RechargeTime": 0.22, "Stunned": 0.22, "Heal_Dmg": 0.22, "HitPoints": 0.22, "Regeneration": 0.22, "ToHit": 0.1333, "RunningSpeed": 0.22, "FlyingSpeed": 0.22, "JumpingSpeed": 0.44, "JumpHeight": 0.22}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -622,7 +682,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"RechargeTime": 0.165, "Stunned": 0.0825, "Heal_Dmg": 0.165, "HitPoints": 0.165, "Regeneration": 0.165, "RunningSpeed": 0.165, "FlyingSpeed": 0.165, "JumpingSpeed": 0.165}, "strengthIgnoresDiminishing": {"RechargeTime": 0.165, "Stunned": 0.0825, "Heal_Dmg": 0.165, "HitPoints": 0.165, "Regeneration": 0.165, "RunningSpeed": 0.165, "FlyingSpeed": 0.165, "JumpingSpeed": 0.165}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -632,7 +693,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"RechargeTime": 0.225, "Stunned": 0.165}, "strengthIgnoresDiminishing": {"RechargeTime": 0.225, "Stunned": 0.165}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -642,7 +704,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"RechargeTime": 0.165, "Stunned": 0.0825, "Heal_Dmg": 0.165, "HitPoints": 0.165, "Regeneration": 0.165, "ToHit": 0.1}, "strengthIgnoresDiminishing": {"RechargeTime": 0.165, "Stunned": 0.0825, "Heal_Dmg": 0.165, "HitPoints": 0.165, "Regeneration": 0.165, "ToHit": 0.1}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -654,7 +717,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"Heal_Dmg": 0.275, "HitPoints": 0.275, "Regeneration": 0.275}, "strengthIgnoresDiminishing": {"Heal_Dmg": 0.055, "HitPoints": 0.055, "Regeneration": 0.055}},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -664,7 +728,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"Heal_Dmg": 0.22, "HitPoints": 0.22, "Regeneration": 0.22, "Accuracy": 0.22}, "strengthIgnoresDiminishing": {"Heal_Dmg": 0.11, "HitPoints": 0.11, "Regeneration": 0.11, "Accuracy": 0.11}},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -674,7 +739,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"Heal_Dmg": 0.22, "HitPoints": 0.22, "Regeneration": 0.22, "EnduranceDiscount": 0.22}, "strengthIgnoresDiminishing": {"Heal_Dmg": 0.11, "HitPoints": 0.11, "Regeneration": 0.11, "EnduranceDiscount": 0.11}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -684,7 +750,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Heal_Dmg": 0.15, "HitPoints": 0.15, "Regeneration": 0.15, "Accuracy": 0.11, "EnduranceDiscount": 0.11}, "strengthIgnoresDiminishing": {"Heal_Dmg": 0.3, "HitPoints": 0.3, "Regeneration": 0.3, "Accuracy": 0.22, "EnduranceDiscount": 0.22}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -694,7 +761,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Heal_Dmg": 0.165, "HitPoints": 0.165, "Regeneration": 0.165, "Accuracy": 0.165, "EnduranceDiscount": 0.165}, "strengthIgnoresDiminishing": {"Heal_Dmg": 0.165, "HitPoints": 0.165, "Regeneration": 0.165, "Accuracy": 0.165, "EnduranceDiscount": 0.165}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -704,7 +772,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Heal_Dmg": 0.11, "HitPoints": 0.11, "Regeneration": 0.11, "Accuracy": 0.11, "EnduranceDiscount": 0.11, "Confused": 0.11, "Sleep": 0.11, "Afraid": 0.11, "Terrorized": 0.11}, "strengthIgnoresDiminishing": {"Heal_Dmg": 0.22, "HitPoints": 0.22, "Regeneration": 0.22, "Accuracy": 0.22, "EnduranceDiscount": 0.22, "Confused": 0.22, "Sleep": 0.22, "Afraid": 0.22, "Terrorized": 0.22}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -714,7 +783,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Heal_Dmg": 0.165, "HitPoints": 0.165, "Regeneration": 0.165, "Accuracy": 0.0825, "EnduranceDiscount": 0.165, "Sleep": 0.165}, "strengthIgnoresDiminishing": {"Heal_Dmg": 0.165, "HitPoints": 0.165, "Regeneration": 0.165, "Accuracy": 0.0825, "EnduranceDiscount": 0.165, "Sleep": 0.165}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -724,7 +794,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Heal_Dmg": 0.225, "HitPoints": 0.225, "Regeneration": 0.225, "Accuracy": 0.165}, "strengthIgnoresDiminishing": {"Heal_Dmg": 0.225, "HitPoints": 0.225, "Regeneration": 0.225, "Accuracy": 0.165}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -734,7 +805,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}, "strength": {"Heal_Dmg": 0.165, "HitPoints": 0.165, "Regeneration": 0.165, "Accuracy": 0.0825, "EnduranceDiscount": 0.165, "Confused": 0.165}, "strengthIgnoresDiminishing": {"Heal_Dmg": 0.165, "HitPoints": 0.165, "Regeneration": 0.165, "Accuracy": 0.0825, "EnduranceDiscount": 0.165, "Confused": 0.165}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -749,6 +821,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"current": {"Endurance": 0.5}, "strength": {"RechargeTime": 0.7}},
         damageType: 'None'
       },
       't2_core': {
@@ -759,6 +832,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"current": {"Endurance": 0.5, "Recovery": 8.0}, "strength": {"RechargeTime": 0.7}},
         damageType: 'None'
       },
       't2_radial': {
@@ -769,6 +843,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"current": {"Endurance": 0.5}, "strength": {"RechargeTime": 0.7}, "resistance": {"Ranged:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Melee:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Area:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Smashing:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Lethal:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Fire:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Cold:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Energy:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Negative_Energy:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Psionic:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Toxic:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Base_Defense:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Endurance:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "ToHit:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "RunningSpeed:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "FlyingSpeed:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "PerceptionRadius:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Regeneration:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Recovery:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Accuracy:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "RechargeTime:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}}},
         damageType: 'None'
       },
       't3_core_1': {
@@ -778,7 +853,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {"current": {"Endurance": 1.0, "Recovery": 8.0}, "strength": {"RechargeTime": 0.7}},
         damageType: 'None'
       },
       't3_core_2': {
@@ -788,7 +864,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {"current": {"Endurance": 0.75, "Recovery": 8.0}, "strength": {"RechargeTime": 0.7}},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -798,7 +875,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {"current": {"Endurance": 1.0}, "strength": {"RechargeTime": 0.7}, "resistance": {"Ranged:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Melee:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Area:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Smashing:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Lethal:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Fire:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Cold:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Energy:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Negative_Energy:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Psionic:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Toxic:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Base_Defense:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Endurance:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "ToHit:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "RunningSpeed:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "FlyingSpeed:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "PerceptionRadius:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Regeneration:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Recovery:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Accuracy:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "RechargeTime:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}}},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -808,7 +886,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {"current": {"Endurance": 0.75}, "strength": {"RechargeTime": 0.7}, "resistance": {"Ranged:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Melee:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Area:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Smashing:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Lethal:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Fire:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Cold:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Energy:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Negative_Energy:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Psionic:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Toxic:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Base_Defense:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Endurance:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "ToHit:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "RunningSpeed:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "FlyingSpeed:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "PerceptionRadius:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Regeneration:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Recovery:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Accuracy:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "RechargeTime:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}}},
         damageType: 'None'
       },
       't4_core': {
@@ -818,7 +897,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {"current": {"Endurance": 0.75, "Recovery": 8.0}, "strength": {"RechargeTime": 0.7}},
         damageType: 'None'
       },
       't4_radial': {
@@ -828,7 +908,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {"current": {"Endurance": 0.75}, "strength": {"RechargeTime": 0.7}, "resistance": {"Ranged:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Melee:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Area:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Smashing:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Lethal:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Fire:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Cold:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Energy:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Negative_Energy:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Psionic:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Toxic:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Base_Defense:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Endurance:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "ToHit:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "RunningSpeed:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "FlyingSpeed:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "PerceptionRadius:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Regeneration:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Recovery:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "Accuracy:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}, "RechargeTime:Ranged_ArchVillain_Res": {"scale": 1.0, "table": "Ranged_ArchVillain_Res"}}},
         damageType: 'None'
       },
     },
@@ -841,6 +922,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"current": {"Ranged": 0.9, "Melee": 0.9, "Area": 0.9, "Smashing": 0.9, "Lethal": 0.9, "Fire": 0.9, "Cold": 0.9, "Energy": 0.9, "Negative_Energy": 0.9, "Psionic": 0.9, "Toxic": 0.9}, "resistance": {"Smashing_Dmg": 0.9, "Lethal_Dmg": 0.9, "Fire_Dmg": 0.9, "Cold_Dmg": 0.9, "Energy_Dmg": 0.9, "Negative_Energy_Dmg": 0.9, "Psionic_Dmg": 0.9, "Toxic_Dmg": 0.9}},
         damageType: 'None'
       },
       't2_core': {
@@ -851,6 +933,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"current": {"Ranged": 0.9, "Melee": 0.9, "Area": 0.9, "Smashing": 0.9, "Lethal": 0.9, "Fire": 0.9, "Cold": 0.9, "Energy": 0.9, "Negative_Energy": 0.9, "Psionic": 0.9, "Toxic": 0.9}, "resistance": {"Smashing_Dmg": 0.9, "Lethal_Dmg": 0.9, "Fire_Dmg": 0.9, "Cold_Dmg": 0.9, "Energy_Dmg": 0.9, "Negative_Energy_Dmg": 0.9, "Psionic_Dmg": 0.9, "Toxic_Dmg": 0.9}},
         damageType: 'None'
       },
       't2_radial': {
@@ -861,6 +944,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"current": {"Ranged": 0.9, "Melee": 0.9, "Area": 0.9, "Smashing": 0.9, "Lethal": 0.9, "Fire": 0.9, "Cold": 0.9, "Energy": 0.9, "Negative_Energy": 0.9, "Psionic": 0.9, "Toxic": 0.9}, "resistance": {"Smashing_Dmg": 0.9, "Lethal_Dmg": 0.9, "Fire_Dmg": 0.9, "Cold_Dmg": 0.9, "Energy_Dmg": 0.9, "Negative_Energy_Dmg": 0.9, "Psionic_Dmg": 0.9, "Toxic_Dmg": 0.9}},
         damageType: 'None'
       },
       't3_core_1': {
@@ -870,7 +954,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {"current": {"Ranged": 0.9, "Melee": 0.9, "Area": 0.9, "Smashing": 0.9, "Lethal": 0.9, "Fire": 0.9, "Cold": 0.9, "Energy": 0.9, "Negative_Energy": 0.9, "Psionic": 0.9, "Toxic": 0.9}, "resistance": {"Smashing_Dmg": 0.9, "Lethal_Dmg": 0.9, "Fire_Dmg": 0.9, "Cold_Dmg": 0.9, "Energy_Dmg": 0.9, "Negative_Energy_Dmg": 0.9, "Psionic_Dmg": 0.9, "Toxic_Dmg": 0.9}},
         damageType: 'None'
       },
       't3_core_2': {
@@ -880,7 +965,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {"current": {"Ranged": 0.9, "Melee": 0.9, "Area": 0.9, "Smashing": 0.9, "Lethal": 0.9, "Fire": 0.9, "Cold": 0.9, "Energy": 0.9, "Negative_Energy": 0.9, "Psionic": 0.9, "Toxic": 0.9}, "resistance": {"Smashing_Dmg": 0.9, "Lethal_Dmg": 0.9, "Fire_Dmg": 0.9, "Cold_Dmg": 0.9, "Energy_Dmg": 0.9, "Negative_Energy_Dmg": 0.9, "Psionic_Dmg": 0.9, "Toxic_Dmg": 0.9}},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -890,7 +976,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {"current": {"Ranged": 0.9, "Melee": 0.9, "Area": 0.9, "Smashing": 0.9, "Lethal": 0.9, "Fire": 0.9, "Cold": 0.9, "Energy": 0.9, "Negative_Energy": 0.9, "Psionic": 0.9, "Toxic": 0.9}, "resistance": {"Smashing_Dmg": 0.9, "Lethal_Dmg": 0.9, "Fire_Dmg": 0.9, "Cold_Dmg": 0.9, "Energy_Dmg": 0.9, "Negative_Energy_Dmg": 0.9, "Psionic_Dmg": 0.9, "Toxic_Dmg": 0.9}},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -900,7 +987,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {"current": {"Ranged": 0.9, "Melee": 0.9, "Area": 0.9, "Smashing": 0.9, "Lethal": 0.9, "Fire": 0.9, "Cold": 0.9, "Energy": 0.9, "Negative_Energy": 0.9, "Psionic": 0.9, "Toxic": 0.9}, "resistance": {"Smashing_Dmg": 0.9, "Lethal_Dmg": 0.9, "Fire_Dmg": 0.9, "Cold_Dmg": 0.9, "Energy_Dmg": 0.9, "Negative_Energy_Dmg": 0.9, "Psionic_Dmg": 0.9, "Toxic_Dmg": 0.9}},
         damageType: 'None'
       },
       't4_core': {
@@ -910,7 +998,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {"current": {"Ranged": 0.9, "Melee": 0.9, "Area": 0.9, "Smashing": 0.9, "Lethal": 0.9, "Fire": 0.9, "Cold": 0.9, "Energy": 0.9, "Negative_Energy": 0.9, "Psionic": 0.9, "Toxic": 0.9}, "resistance": {"Smashing_Dmg": 0.9, "Lethal_Dmg": 0.9, "Fire_Dmg": 0.9, "Cold_Dmg": 0.9, "Energy_Dmg": 0.9, "Negative_Energy_Dmg": 0.9, "Psionic_Dmg": 0.9, "Toxic_Dmg": 0.9}},
         damageType: 'None'
       },
       't4_radial': {
@@ -920,7 +1009,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {"current": {"Ranged": 0.9, "Melee": 0.9, "Area": 0.9, "Smashing": 0.9, "Lethal": 0.9, "Fire": 0.9, "Cold": 0.9, "Energy": 0.9, "Negative_Energy": 0.9, "Psionic": 0.9, "Toxic": 0.9}, "resistance": {"Smashing_Dmg": 0.9, "Lethal_Dmg": 0.9, "Fire_Dmg": 0.9, "Cold_Dmg": 0.9, "Energy_Dmg": 0.9, "Negative_Energy_Dmg": 0.9, "Psionic_Dmg": 0.9, "Toxic_Dmg": 0.9}},
         damageType: 'None'
       },
     },
@@ -933,6 +1023,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"current": {"Confused": -36.0, "Terrorized": -36.0, "Held": -36.0, "Immobilized": -36.0, "Stunned": -36.0, "Sleep": -36.0, "Knockup": -18.0, "Knockback": -18.0}, "resistance": {"Repel": 1.2, "Taunt": 0.6, "Placate": 0.6, "Confused:Ranged_Res_Boolean": {"scale": 3.6, "table": "Ranged_Res_Boolean"}, "Terrorized:Ranged_Res_Boolean": {"scale": 3.6, "table": "Ranged_Res_Boolean"}, "Held:Ranged_Res_Boolean": {"scale": 3.6, "table": "Ranged_Res_Boolean"}, "Immobilized:Ranged_Res_Boolean": {"scale": 3.6, "table": "Ranged_Res_Boolean"}, "Stunned:Ranged_Res_Boolean": {"scale": 3.6, "table": "Ranged_Res_Boolean"}, "Sleep:Ranged_Res_Boolean": {"scale": 3.6, "table": "Ranged_Res_Boolean"}}},
         damageType: 'None'
       },
       't2_core': {
@@ -943,6 +1034,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"current": {"Confused": -30.0, "Terrorized": -30.0, "Held": -30.0, "Immobilized": -30.0, "Stunned": -30.0, "Sleep": -30.0, "Knockup": -15.0, "Knockback": -15.0}, "resistance": {"Repel": 1.0, "Taunt": 0.5, "Placate": 0.5, "Confused:Ranged_Res_Boolean": {"scale": 3.0, "table": "Ranged_Res_Boolean"}, "Terrorized:Ranged_Res_Boolean": {"scale": 3.0, "table": "Ranged_Res_Boolean"}, "Held:Ranged_Res_Boolean": {"scale": 3.0, "table": "Ranged_Res_Boolean"}, "Immobilized:Ranged_Res_Boolean": {"scale": 3.0, "table": "Ranged_Res_Boolean"}, "Stunned:Ranged_Res_Boolean": {"scale": 3.0, "table": "Ranged_Res_Boolean"}, "Sleep:Ranged_Res_Boolean": {"scale": 3.0, "table": "Ranged_Res_Boolean"}}},
         damageType: 'None'
       },
       't2_radial': {
@@ -953,6 +1045,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"current": {"Confused": -36.0, "Terrorized": -36.0, "Held": -36.0, "Immobilized": -36.0, "Stunned": -36.0, "Sleep": -36.0, "Knockup": -18.0, "Knockback": -18.0}, "resistance": {"Repel": 1.2, "Taunt": 0.6, "Placate": 0.6, "Confused:Ranged_Res_Boolean": {"scale": 3.6, "table": "Ranged_Res_Boolean"}, "Terrorized:Ranged_Res_Boolean": {"scale": 3.6, "table": "Ranged_Res_Boolean"}, "Held:Ranged_Res_Boolean": {"scale": 3.6, "table": "Ranged_Res_Boolean"}, "Immobilized:Ranged_Res_Boolean": {"scale": 3.6, "table": "Ranged_Res_Boolean"}, "Stunned:Ranged_Res_Boolean": {"scale": 3.6, "table": "Ranged_Res_Boolean"}, "Sleep:Ranged_Res_Boolean": {"scale": 3.6, "table": "Ranged_Res_Boolean"}}, "strength": {"Heal_Dmg": 0.6, "Absorb": 0.6, "Endurance": 0.6, "RunningSpeed": 0.6, "FlyingSpeed": 0.6, "Confused": 0.6, "Terrorized": 0.6, "Held": 0.6, "Immobilized": 0.6, "Stunned": 0.6, "Sleep": 0.6, "Range": 0.6, "Ranged": 0.6, "Melee": 0.6, "Area": 0.6, "Smashing": 0.6, "Lethal": 0.6, "Fire": 0.6, "Cold": 0.6, "Energy": 0.6, "Negative_Energy": 0.6, "Psionic": 0.6, "Toxic": 0.6, "Base_Defense": 0.6, "ToHit": 0.6}},
         damageType: 'None'
       },
       't3_core_1': {
@@ -962,7 +1055,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {"current": {"Confused": -30.0, "Terrorized": -30.0, "Held": -30.0, "Immobilized": -30.0, "Stunned": -30.0, "Sleep": -30.0, "Knockup": -15.0, "Knockback": -15.0}, "resistance": {"Repel": 1.0, "Taunt": 0.5, "Placate": 0.5, "Confused:Ranged_Res_Boolean": {"scale": 3.0, "table": "Ranged_Res_Boolean"}, "Terrorized:Ranged_Res_Boolean": {"scale": 3.0, "table": "Ranged_Res_Boolean"}, "Held:Ranged_Res_Boolean": {"scale": 3.0, "table": "Ranged_Res_Boolean"}, "Immobilized:Ranged_Res_Boolean": {"scale": 3.0, "table": "Ranged_Res_Boolean"}, "Stunned:Ranged_Res_Boolean": {"scale": 3.0, "table": "Ranged_Res_Boolean"}, "Sleep:Ranged_Res_Boolean": {"scale": 3.0, "table": "Ranged_Res_Boolean"}}},
         damageType: 'None'
       },
       't3_core_2': {
@@ -972,7 +1066,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {"current": {"Confused": -30.0, "Terrorized": -30.0, "Held": -30.0, "Immobilized": -30.0, "Stunned": -30.0, "Sleep": -30.0, "Knockup": -15.0, "Knockback": -15.0}, "resistance": {"Repel": 1.0, "Taunt": 0.5, "Placate": 0.5, "Confused:Ranged_Res_Boolean": {"scale": 3.0, "table": "Ranged_Res_Boolean"}, "Terrorized:Ranged_Res_Boolean": {"scale": 3.0, "table": "Ranged_Res_Boolean"}, "Held:Ranged_Res_Boolean": {"scale": 3.0, "table": "Ranged_Res_Boolean"}, "Immobilized:Ranged_Res_Boolean": {"scale": 3.0, "table": "Ranged_Res_Boolean"}, "Stunned:Ranged_Res_Boolean": {"scale": 3.0, "table": "Ranged_Res_Boolean"}, "Sleep:Ranged_Res_Boolean": {"scale": 3.0, "table": "Ranged_Res_Boolean"}}},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -982,7 +1077,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {"current": {"Confused": -36.0, "Terrorized": -36.0, "Held": -36.0, "Immobilized": -36.0, "Stunned": -36.0, "Sleep": -36.0, "Knockup": -18.0, "Knockback": -18.0}, "resistance": {"Repel": 1.2, "Taunt": 0.6, "Placate": 0.6, "Confused:Ranged_Res_Boolean": {"scale": 3.6, "table": "Ranged_Res_Boolean"}, "Terrorized:Ranged_Res_Boolean": {"scale": 3.6, "table": "Ranged_Res_Boolean"}, "Held:Ranged_Res_Boolean": {"scale": 3.6, "table": "Ranged_Res_Boolean"}, "Immobilized:Ranged_Res_Boolean": {"scale": 3.6, "table": "Ranged_Res_Boolean"}, "Stunned:Ranged_Res_Boolean": {"scale": 3.6, "table": "Ranged_Res_Boolean"}, "Sleep:Ranged_Res_Boolean": {"scale": 3.6, "table": "Ranged_Res_Boolean"}}, "strength": {"Heal_Dmg": 0.8, "Absorb": 0.8, "Endurance": 0.8, "RunningSpeed": 0.8, "FlyingSpeed": 0.8, "Confused": 0.8, "Terrorized": 0.8, "Held": 0.8, "Immobilized": 0.8, "Stunned": 0.8, "Sleep": 0.8, "Range": 0.8, "Ranged": 0.8, "Melee": 0.8, "Area": 0.8, "Smashing": 0.8, "Lethal": 0.8, "Fire": 0.8, "Cold": 0.8, "Energy": 0.8, "Negative_Energy": 0.8, "Psionic": 0.8, "Toxic": 0.8, "Base_Defense": 0.8, "ToHit": 0.8}},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -992,7 +1088,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {"current": {"Confused": -36.0, "Terrorized": -36.0, "Held": -36.0, "Immobilized": -36.0, "Stunned": -36.0, "Sleep": -36.0, "Knockup": -18.0, "Knockback": -18.0}, "resistance": {"Repel": 1.2, "Taunt": 0.6, "Placate": 0.6, "Confused:Ranged_Res_Boolean": {"scale": 3.6, "table": "Ranged_Res_Boolean"}, "Terrorized:Ranged_Res_Boolean": {"scale": 3.6, "table": "Ranged_Res_Boolean"}, "Held:Ranged_Res_Boolean": {"scale": 3.6, "table": "Ranged_Res_Boolean"}, "Immobilized:Ranged_Res_Boolean": {"scale": 3.6, "table": "Ranged_Res_Boolean"}, "Stunned:Ranged_Res_Boolean": {"scale": 3.6, "table": "Ranged_Res_Boolean"}, "Sleep:Ranged_Res_Boolean": {"scale": 3.6, "table": "Ranged_Res_Boolean"}}, "strength": {"Heal_Dmg": 0.6, "Absorb": 0.6, "Endurance": 0.6, "RunningSpeed": 0.6, "FlyingSpeed": 0.6, "Confused": 0.6, "Terrorized": 0.6, "Held": 0.6, "Immobilized": 0.6, "Stunned": 0.6, "Sleep": 0.6, "Range": 0.6, "Ranged": 0.6, "Melee": 0.6, "Area": 0.6, "Smashing": 0.6, "Lethal": 0.6, "Fire": 0.6, "Cold": 0.6, "Energy": 0.6, "Negative_Energy": 0.6, "Psionic": 0.6, "Toxic": 0.6, "Base_Defense": 0.6, "ToHit": 0.6}},
         damageType: 'None'
       },
       't4_core': {
@@ -1002,7 +1099,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {"current": {"Confused": -30.0, "Terrorized": -30.0, "Held": -30.0, "Immobilized": -30.0, "Stunned": -30.0, "Sleep": -30.0, "Knockup": -15.0, "Knockback": -15.0}, "resistance": {"Repel": 1.0, "Taunt": 0.5, "Placate": 0.5, "Confused:Ranged_Res_Boolean": {"scale": 3.0, "table": "Ranged_Res_Boolean"}, "Terrorized:Ranged_Res_Boolean": {"scale": 3.0, "table": "Ranged_Res_Boolean"}, "Held:Ranged_Res_Boolean": {"scale": 3.0, "table": "Ranged_Res_Boolean"}, "Immobilized:Ranged_Res_Boolean": {"scale": 3.0, "table": "Ranged_Res_Boolean"}, "Stunned:Ranged_Res_Boolean": {"scale": 3.0, "table": "Ranged_Res_Boolean"}, "Sleep:Ranged_Res_Boolean": {"scale": 3.0, "table": "Ranged_Res_Boolean"}}},
         damageType: 'None'
       },
       't4_radial': {
@@ -1012,7 +1110,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {"current": {"Confused": -36.0, "Terrorized": -36.0, "Held": -36.0, "Immobilized": -36.0, "Stunned": -36.0, "Sleep": -36.0, "Knockup": -18.0, "Knockback": -18.0}, "resistance": {"Repel": 1.2, "Taunt": 0.6, "Placate": 0.6, "Confused:Ranged_Res_Boolean": {"scale": 3.6, "table": "Ranged_Res_Boolean"}, "Terrorized:Ranged_Res_Boolean": {"scale": 3.6, "table": "Ranged_Res_Boolean"}, "Held:Ranged_Res_Boolean": {"scale": 3.6, "table": "Ranged_Res_Boolean"}, "Immobilized:Ranged_Res_Boolean": {"scale": 3.6, "table": "Ranged_Res_Boolean"}, "Stunned:Ranged_Res_Boolean": {"scale": 3.6, "table": "Ranged_Res_Boolean"}, "Sleep:Ranged_Res_Boolean": {"scale": 3.6, "table": "Ranged_Res_Boolean"}}, "strength": {"Heal_Dmg": 0.8, "Absorb": 0.8, "Endurance": 0.8, "RunningSpeed": 0.8, "FlyingSpeed": 0.8, "Confused": 0.8, "Terrorized": 0.8, "Held": 0.8, "Immobilized": 0.8, "Stunned": 0.8, "Sleep": 0.8, "Range": 0.8, "Ranged": 0.8, "Melee": 0.8, "Area": 0.8, "Smashing": 0.8, "Lethal": 0.8, "Fire": 0.8, "Cold": 0.8, "Energy": 0.8, "Negative_Energy": 0.8, "Psionic": 0.8, "Toxic": 0.8, "Base_Defense": 0.8, "ToHit": 0.8}},
         damageType: 'None'
       },
     },
@@ -1025,6 +1124,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"current": {"Teleport": 3.1}, "resistance": {"Heal_Dmg": -0.3}},
         damageType: 'None'
       },
       't2_core': {
@@ -1035,6 +1135,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"current": {"Teleport": 3.1}, "resistance": {"Heal_Dmg": -0.5}},
         damageType: 'None'
       },
       't2_radial': {
@@ -1045,6 +1146,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"current": {"Teleport": 3.1, "Translucency": 0.85, "StealthRadius_PVE": 28.0, "StealthRadius_PVP": 311.2}, "resistance": {"Heal_Dmg": -0.4}},
         damageType: 'None'
       },
       't3_core_1': {
@@ -1054,7 +1156,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {"current": {"Teleport": 3.1}, "resistance": {"Heal_Dmg": -0.8}},
         damageType: 'None'
       },
       't3_core_2': {
@@ -1064,7 +1167,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {"current": {"Teleport": 3.1}, "resistance": {"Heal_Dmg": -0.5}},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -1074,7 +1178,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {"current": {"Teleport": 3.1, "Translucency": 0.8, "StealthRadius_PVE": 35.0, "StealthRadius_PVP": 389.0, "RunningSpeed": 0.35, "FlyingSpeed": 0.35, "JumpHeight": 0.35, "PerceptionRadius:Ranged_Res_Boolean": {"scale": 2.0, "table": "Ranged_Res_Boolean"}}, "resistance": {"Heal_Dmg": -0.6}},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -1084,7 +1189,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {"current": {"Teleport": 3.1, "Translucency": 0.8, "StealthRadius_PVE": 35.0, "StealthRadius_PVP": 389.0}, "resistance": {"Heal_Dmg": -0.5}},
         damageType: 'None'
       },
       't4_core': {
@@ -1094,7 +1200,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {"current": {"Teleport": 3.1}, "resistance": {"Heal_Dmg": -0.7}},
         damageType: 'None'
       },
       't4_radial': {
@@ -1104,7 +1211,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {"current": {"Teleport": 3.1, "Translucency": 0.8, "StealthRadius_PVE": 20.0, "StealthRadius_PVP": 222.0, "Combat_Phase": 24.0, "Intangible": 12.0}, "resistance": {"Heal_Dmg": -0.5}},
         damageType: 'None'
       },
     },
@@ -1117,6 +1225,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Heal_Dmg:Ranged_Tempdamage": {"scale": -5.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't2_core': {
@@ -1127,6 +1236,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Heal_Dmg:Ranged_Tempdamage": {"scale": -6.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't2_radial': {
@@ -1137,6 +1247,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Heal_Dmg:Ranged_Tempdamage": {"scale": -6.0, "table": "Ranged_Tempdamage"}}, "current": {"Regeneration": 16.0}},
         damageType: 'None'
       },
       't3_core_1': {
@@ -1146,7 +1257,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {"absolute": {"Heal_Dmg:Ranged_Tempdamage": {"scale": -8.0, "table": "Ranged_Tempdamage"}}, "maximum": {"HitPoints:Ranged_Tempdamage": {"scale": -3.5, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't3_core_2': {
@@ -1156,7 +1268,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {"absolute": {"Heal_Dmg:Ranged_Tempdamage": {"scale": -7.0, "table": "Ranged_Tempdamage"}}, "maximum": {"HitPoints:Ranged_Tempdamage": {"scale": -3.5, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -1166,7 +1279,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {"absolute": {"Heal_Dmg:Ranged_Tempdamage": {"scale": -8.0, "table": "Ranged_Tempdamage"}}, "current": {"Regeneration": 16.0}},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -1176,7 +1290,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {"absolute": {"Heal_Dmg:Ranged_Tempdamage": {"scale": -7.0, "table": "Ranged_Tempdamage"}}, "current": {"Regeneration": 16.0}},
         damageType: 'None'
       },
       't4_core': {
@@ -1186,7 +1301,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {"absolute": {"Heal_Dmg:Ranged_Tempdamage": {"scale": -7.0, "table": "Ranged_Tempdamage"}}, "maximum": {"HitPoints:Ranged_Tempdamage": {"scale": -3.5, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't4_radial': {
@@ -1196,7 +1312,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {"absolute": {"Heal_Dmg:Ranged_Tempdamage": {"scale": -7.0, "table": "Ranged_Tempdamage"}}, "current": {"Regeneration": 16.0}},
         damageType: 'None'
       },
     },
@@ -1210,7 +1327,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"Smashing_Dmg": 0.025, "Lethal_Dmg": 0.025, "Fire_Dmg": 0.025, "Cold_Dmg": 0.025, "Energy_Dmg": 0.025, "Negative_Energy_Dmg": 0.025, "Psionic_Dmg": 0.025, "Toxic_Dmg": 0.025}},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -1220,7 +1338,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"Smashing_Dmg": 0.05, "Lethal_Dmg": 0.05, "Fire_Dmg": 0.05, "Cold_Dmg": 0.05, "Energy_Dmg": 0.05, "Negative_Energy_Dmg": 0.05, "Psionic_Dmg": 0.05, "Toxic_Dmg": 0.05}},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -1230,7 +1349,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"Smashing_Dmg": 0.05, "Lethal_Dmg": 0.05, "Fire_Dmg": 0.05, "Cold_Dmg": 0.05, "Energy_Dmg": 0.05, "Negative_Energy_Dmg": 0.05, "Psionic_Dmg": 0.05, "Toxic_Dmg": 0.05}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -1240,7 +1360,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"Smashing_Dmg": 0.1, "Lethal_Dmg": 0.1, "Fire_Dmg": 0.1, "Cold_Dmg": 0.1, "Energy_Dmg": 0.1, "Negative_Energy_Dmg": 0.1, "Psionic_Dmg": 0.1, "Toxic_Dmg": 0.1}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -1250,7 +1371,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"Smashing_Dmg": 0.075, "Lethal_Dmg": 0.075, "Fire_Dmg": 0.075, "Cold_Dmg": 0.075, "Energy_Dmg": 0.075, "Negative_Energy_Dmg": 0.075, "Psionic_Dmg": 0.075, "Toxic_Dmg": 0.075}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -1260,7 +1382,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"Smashing_Dmg": 0.1, "Lethal_Dmg": 0.1, "Fire_Dmg": 0.1, "Cold_Dmg": 0.1, "Energy_Dmg": 0.1, "Negative_Energy_Dmg": 0.1, "Psionic_Dmg": 0.1, "Toxic_Dmg": 0.1}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -1270,7 +1393,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"Smashing_Dmg": 0.075, "Lethal_Dmg": 0.075, "Fire_Dmg": 0.075, "Cold_Dmg": 0.075, "Energy_Dmg": 0.075, "Negative_Energy_Dmg": 0.075, "Psionic_Dmg": 0.075, "Toxic_Dmg": 0.075}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -1280,7 +1404,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"Smashing_Dmg": 0.075, "Lethal_Dmg": 0.075, "Fire_Dmg": 0.075, "Cold_Dmg": 0.075, "Energy_Dmg": 0.075, "Negative_Energy_Dmg": 0.075, "Psionic_Dmg": 0.075, "Toxic_Dmg": 0.075}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -1290,7 +1415,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"Smashing_Dmg": 0.075, "Lethal_Dmg": 0.075, "Fire_Dmg": 0.075, "Cold_Dmg": 0.075, "Energy_Dmg": 0.075, "Negative_Energy_Dmg": 0.075, "Psionic_Dmg": 0.075, "Toxic_Dmg": 0.075}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -1302,7 +1428,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"resistance": {"Confused": 0.1, "Terrorized": 0.1, "Held": 0.1, "Immobilized": 0.1, "Stunned": 0.1, "Sleep": 0.1}},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -1312,7 +1439,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"resistance": {"Confused": 0.2, "Terrorized": 0.2, "Held": 0.2, "Immobilized": 0.2, "Stunned": 0.2, "Sleep": 0.2}},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -1322,7 +1450,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"resistance": {"Confused": 0.2, "Terrorized": 0.2, "Held": 0.2, "Immobilized": 0.2, "Stunned": 0.2, "Sleep": 0.2}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -1332,7 +1461,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"resistance": {"Confused": 0.4, "Terrorized": 0.4, "Held": 0.4, "Immobilized": 0.4, "Stunned": 0.4, "Sleep": 0.4}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -1342,7 +1472,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"resistance": {"Confused": 0.3, "Terrorized": 0.3, "Held": 0.3, "Immobilized": 0.3, "Stunned": 0.3, "Sleep": 0.3}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -1352,7 +1483,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"resistance": {"Confused": 0.4, "Terrorized": 0.4, "Held": 0.4, "Immobilized": 0.4, "Stunned": 0.4, "Sleep": 0.4}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -1362,7 +1494,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"resistance": {"Confused": 0.3, "Terrorized": 0.3, "Held": 0.3, "Immobilized": 0.3, "Stunned": 0.3, "Sleep": 0.3}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -1372,7 +1505,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"resistance": {"Confused": 0.3, "Terrorized": 0.3, "Held": 0.3, "Immobilized": 0.3, "Stunned": 0.3, "Sleep": 0.3}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -1382,7 +1516,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"resistance": {"Confused": 0.3, "Terrorized": 0.3, "Held": 0.3, "Immobilized": 0.3, "Stunned": 0.3, "Sleep": 0.3}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -1394,7 +1529,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"strength": {"EnduranceDiscount": 0.025}},
+        affectedStats: {"strength": {"Smashing_Dmg": 0.02, "Lethal_Dmg": 0.02, "Fire_Dmg": 0.02, "Cold_Dmg": 0.02, "Energy_Dmg": 0.02, "Negative_Energy_Dmg": 0.02, "Psionic_Dmg": 0.02, "Toxic_Dmg": 0.02}, "current": {"Melee": 0.02, "Smashing": 0.02, "Lethal": 0.02}},
         damageType: 'None'
       },
     },
@@ -1409,6 +1545,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -1419,6 +1556,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -1429,6 +1567,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -1439,6 +1578,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -1449,6 +1589,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -1459,6 +1600,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -1469,6 +1611,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -1479,6 +1622,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -1489,6 +1633,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -1501,6 +1646,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -1511,6 +1657,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -1521,6 +1668,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -1531,6 +1679,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -1541,6 +1690,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -1551,6 +1701,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -1561,6 +1712,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -1571,6 +1723,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -1581,6 +1734,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -1593,6 +1747,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -1603,6 +1758,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -1613,6 +1769,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -1623,6 +1780,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -1633,6 +1791,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -1643,6 +1802,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -1653,6 +1813,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -1663,6 +1824,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -1673,6 +1835,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -1685,6 +1848,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -1695,6 +1859,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -1705,6 +1870,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -1715,6 +1881,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -1725,6 +1892,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -1735,6 +1903,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -1745,6 +1914,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -1755,6 +1925,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -1765,6 +1936,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -1777,6 +1949,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -1787,6 +1960,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -1797,6 +1971,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -1807,6 +1982,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -1817,6 +1993,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -1827,6 +2004,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -1837,6 +2015,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -1847,6 +2026,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -1857,6 +2037,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -1869,6 +2050,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -1879,6 +2061,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -1889,6 +2072,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -1899,6 +2083,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -1909,6 +2094,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -1919,6 +2105,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -1929,6 +2116,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -1939,6 +2127,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -1949,6 +2138,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -1961,6 +2151,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -1971,6 +2162,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -1981,6 +2173,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -1991,6 +2184,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -2001,6 +2195,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -2011,6 +2206,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -2021,6 +2217,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -2031,6 +2228,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -2041,6 +2239,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -2053,6 +2252,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -2063,6 +2263,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -2073,6 +2274,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -2083,6 +2285,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -2093,6 +2296,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -2103,6 +2307,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -2113,6 +2318,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -2123,6 +2329,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -2133,6 +2340,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -2147,6 +2355,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Cold_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't2_core': {
@@ -2157,6 +2366,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Cold_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't2_radial': {
@@ -2167,6 +2377,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Cold_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}, "strength": {"JumpHeight": -0.5, "RechargeTime": -0.5}, "current": {"RunningSpeed": -0.5, "FlyingSpeed": -0.5, "JumpingSpeed": -0.5}},
         damageType: 'None'
       },
       't3_core_1': {
@@ -2177,6 +2388,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Cold_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't3_core_2': {
@@ -2187,6 +2399,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Cold_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}, "strength": {"JumpHeight": -0.5, "RechargeTime": -0.5}, "current": {"RunningSpeed": -0.5, "FlyingSpeed": -0.5, "JumpingSpeed": -0.5}},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -2197,6 +2410,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Cold_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}, "strength": {"JumpHeight": -0.5, "RechargeTime": -0.5}, "current": {"RunningSpeed": -0.5, "FlyingSpeed": -0.5, "JumpingSpeed": -0.5}},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -2207,6 +2421,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Cold_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}, "strength": {"JumpHeight": -0.5, "RechargeTime": -0.5}, "current": {"RunningSpeed": -0.5, "FlyingSpeed": -0.5, "JumpingSpeed": -0.5}},
         damageType: 'None'
       },
       't4_core': {
@@ -2217,6 +2432,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Cold_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't4_radial': {
@@ -2227,6 +2443,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Cold_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}, "strength": {"JumpHeight": -0.5, "RechargeTime": -0.5}, "current": {"RunningSpeed": -0.5, "FlyingSpeed": -0.5, "JumpingSpeed": -0.5}},
         damageType: 'None'
       },
     },
@@ -2239,6 +2456,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Energy_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't2_core': {
@@ -2249,6 +2467,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Energy_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't2_radial': {
@@ -2259,6 +2478,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Energy_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}, "Endurance": -10.0}, "current": {"Recovery": -1.0, "Endurance": -0.35}},
         damageType: 'None'
       },
       't3_core_1': {
@@ -2269,6 +2489,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Energy_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't3_core_2': {
@@ -2279,6 +2500,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Energy_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}, "Endurance": -10.0}, "current": {"Recovery": -1.0, "Endurance": -0.35}},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -2289,6 +2511,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Energy_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}, "Endurance": -10.0}, "current": {"Recovery": -1.0, "Endurance": -0.35}},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -2299,6 +2522,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Energy_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}, "Endurance": -10.0}, "current": {"Recovery": -1.0, "Endurance": -0.35}},
         damageType: 'None'
       },
       't4_core': {
@@ -2309,6 +2533,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Energy_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't4_radial': {
@@ -2319,6 +2544,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Energy_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}, "Endurance": -10.0}, "current": {"Recovery": -1.0, "Endurance": -0.35}},
         damageType: 'None'
       },
     },
@@ -2331,6 +2557,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Smashing_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't2_core': {
@@ -2341,6 +2568,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Smashing_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't2_radial': {
@@ -2351,6 +2579,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Smashing_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't3_core_1': {
@@ -2361,6 +2590,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Smashing_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't3_core_2': {
@@ -2371,6 +2601,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Smashing_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -2381,6 +2612,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Smashing_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}, "current": {"Knockup": 40.0}},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -2391,6 +2623,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Smashing_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't4_core': {
@@ -2401,6 +2634,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Smashing_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't4_radial': {
@@ -2411,6 +2645,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Smashing_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}, "current": {"Knockup": 40.0}},
         damageType: 'None'
       },
     },
@@ -2423,6 +2658,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Fire_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't2_core': {
@@ -2433,6 +2669,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Fire_Dmg:Ranged_Tempdamage": {"scale": 4.25, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't2_radial': {
@@ -2443,6 +2680,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Fire_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't3_core_1': {
@@ -2453,6 +2691,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Fire_Dmg:Ranged_Tempdamage": {"scale": 5.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't3_core_2': {
@@ -2463,6 +2702,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Fire_Dmg:Ranged_Tempdamage": {"scale": 4.375, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -2473,6 +2713,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Fire_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -2483,6 +2724,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Fire_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't4_core': {
@@ -2493,6 +2735,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Fire_Dmg:Ranged_Tempdamage": {"scale": 4.75, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't4_radial': {
@@ -2503,6 +2746,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Fire_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
     },
@@ -2515,6 +2759,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Negative_Energy_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't2_core': {
@@ -2525,6 +2770,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Negative_Energy_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't2_radial': {
@@ -2535,6 +2781,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Negative_Energy_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}, "strength": {"Smashing_Dmg": -0.5, "Lethal_Dmg": -0.5, "Fire_Dmg": -0.5, "Cold_Dmg": -0.5, "Energy_Dmg": -0.5, "Negative_Energy_Dmg": -0.5, "Psionic_Dmg": -0.5, "Toxic_Dmg": -0.5}},
         damageType: 'None'
       },
       't3_core_1': {
@@ -2545,6 +2792,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Negative_Energy_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't3_core_2': {
@@ -2555,6 +2803,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Negative_Energy_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}, "current": {"Knockback": 20.0}},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -2565,6 +2814,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Negative_Energy_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}, "strength": {"Smashing_Dmg": -0.5, "Lethal_Dmg": -0.5, "Fire_Dmg": -0.5, "Cold_Dmg": -0.5, "Energy_Dmg": -0.5, "Negative_Energy_Dmg": -0.5, "Psionic_Dmg": -0.5, "Toxic_Dmg": -0.5}},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -2575,6 +2825,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Negative_Energy_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}, "strength": {"Smashing_Dmg": -0.5, "Lethal_Dmg": -0.5, "Fire_Dmg": -0.5, "Cold_Dmg": -0.5, "Energy_Dmg": -0.5, "Negative_Energy_Dmg": -0.5, "Psionic_Dmg": -0.5, "Toxic_Dmg": -0.5}, "current": {"Knockback": 20.0}},
         damageType: 'None'
       },
       't4_core': {
@@ -2585,6 +2836,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Negative_Energy_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't4_radial': {
@@ -2595,6 +2847,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Negative_Energy_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}, "strength": {"Smashing_Dmg": -0.5, "Lethal_Dmg": -0.5, "Fire_Dmg": -0.5, "Cold_Dmg": -0.5, "Energy_Dmg": -0.5, "Negative_Energy_Dmg": -0.5, "Psionic_Dmg": -0.5, "Toxic_Dmg": -0.5}},
         damageType: 'None'
       },
     },
@@ -2607,6 +2860,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Smashing_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't2_core': {
@@ -2617,6 +2871,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Smashing_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}, "Lethal_Dmg:Ranged_Tempdamage": {"scale": 0.25, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't2_radial': {
@@ -2627,6 +2882,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Smashing_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't3_core_1': {
@@ -2637,6 +2893,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Smashing_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}, "Lethal_Dmg:Ranged_Tempdamage": {"scale": 1.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't3_core_2': {
@@ -2647,6 +2904,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Smashing_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}, "Lethal_Dmg:Ranged_Tempdamage": {"scale": 0.375, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -2656,7 +2914,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Base_Defense": 0.3}},
+        affectedStats: {"absolute": {"Smashing_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -2667,6 +2926,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Smashing_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't4_core': {
@@ -2677,6 +2937,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {"absolute": {"Smashing_Dmg:Ranged_Tempdamage": {"scale": 3.5, "table": "Ranged_Tempdamage"}, "Lethal_Dmg:Ranged_Tempdamage": {"scale": 1.25, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
       't4_radial': {
@@ -2686,7 +2947,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Base_Defense": 0.15}},
+        affectedStats: {"absolute": {"Smashing_Dmg:Ranged_Tempdamage": {"scale": 4.0, "table": "Ranged_Tempdamage"}}},
         damageType: 'None'
       },
     },
@@ -2701,6 +2963,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -2711,6 +2974,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -2721,6 +2985,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -2730,7 +2995,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -2740,7 +3006,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -2750,7 +3017,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -2760,7 +3028,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -2770,7 +3039,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -2780,7 +3050,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -2793,6 +3064,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -2803,6 +3075,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -2813,6 +3086,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -2822,7 +3096,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -2832,7 +3107,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -2842,7 +3118,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -2852,7 +3129,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -2862,7 +3140,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -2872,7 +3151,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -2885,6 +3165,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -2895,6 +3176,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -2905,6 +3187,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -2914,7 +3197,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -2924,7 +3208,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -2934,7 +3219,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -2944,7 +3230,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -2954,7 +3241,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -2964,7 +3252,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -2977,6 +3266,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -2987,6 +3277,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -2997,6 +3288,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -3006,7 +3298,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -3016,7 +3309,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -3026,7 +3320,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -3036,7 +3331,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -3046,7 +3342,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -3056,7 +3353,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -3069,6 +3367,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -3079,6 +3378,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -3089,6 +3389,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -3098,7 +3399,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -3108,7 +3410,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -3118,7 +3421,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -3128,7 +3432,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -3138,7 +3443,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -3148,7 +3454,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -3161,6 +3468,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -3171,6 +3479,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -3181,6 +3490,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -3190,7 +3500,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -3200,7 +3511,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -3210,7 +3522,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -3220,7 +3533,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -3230,7 +3544,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -3240,7 +3555,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -3253,6 +3569,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -3263,6 +3580,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -3273,6 +3591,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -3282,7 +3601,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -3292,7 +3612,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -3302,7 +3623,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -3312,7 +3634,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -3322,7 +3645,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -3332,7 +3656,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -3345,6 +3670,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -3355,6 +3681,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -3365,6 +3692,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -3374,7 +3702,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -3384,7 +3713,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -3394,7 +3724,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -3404,7 +3735,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -3414,7 +3746,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -3424,7 +3757,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -3437,6 +3771,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -3447,6 +3782,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -3457,6 +3793,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -3466,7 +3803,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -3476,7 +3814,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -3486,7 +3825,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -3496,7 +3836,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -3506,7 +3847,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -3516,7 +3858,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -3529,6 +3872,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -3539,6 +3883,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -3549,6 +3894,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -3558,7 +3904,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -3568,7 +3915,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -3578,7 +3926,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -3588,7 +3937,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -3598,7 +3948,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -3608,7 +3959,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -3621,6 +3973,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -3631,6 +3984,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -3641,6 +3995,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -3650,7 +4005,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -3660,7 +4016,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -3670,7 +4027,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -3680,7 +4038,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -3690,7 +4049,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -3700,7 +4060,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -3713,6 +4074,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -3723,6 +4085,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -3733,6 +4096,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -3742,7 +4106,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -3752,7 +4117,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -3762,7 +4128,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -3772,7 +4139,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -3782,7 +4150,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -3792,7 +4161,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -3805,6 +4175,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -3815,6 +4186,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -3825,6 +4197,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -3834,7 +4207,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -3844,7 +4218,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -3854,7 +4229,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -3864,7 +4240,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -3874,7 +4251,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -3884,7 +4262,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -3897,6 +4276,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -3907,6 +4287,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -3917,6 +4298,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -3926,7 +4308,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -3936,7 +4319,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -3946,7 +4330,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -3956,7 +4341,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -3966,7 +4352,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -3976,7 +4363,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -3989,6 +4377,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -3999,6 +4388,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -4009,6 +4399,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -4018,7 +4409,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -4028,7 +4420,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -4038,7 +4431,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -4048,7 +4442,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -4058,7 +4453,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -4068,7 +4464,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -4081,6 +4478,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -4091,6 +4489,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -4101,6 +4500,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -4110,7 +4510,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -4120,7 +4521,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -4130,7 +4532,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -4140,7 +4543,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -4150,7 +4554,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -4160,7 +4565,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -4173,6 +4579,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -4183,6 +4590,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -4193,6 +4601,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -4202,7 +4611,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -4212,7 +4622,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -4222,7 +4633,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -4232,7 +4644,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -4242,7 +4655,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -4252,7 +4666,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -4265,6 +4680,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -4275,6 +4691,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -4285,6 +4702,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -4294,7 +4712,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -4304,7 +4723,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -4314,7 +4734,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -4324,7 +4745,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -4334,7 +4756,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -4344,7 +4767,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -4357,6 +4781,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -4367,6 +4792,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -4377,6 +4803,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -4386,7 +4813,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -4396,7 +4824,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -4406,7 +4835,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -4416,7 +4846,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -4426,7 +4857,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -4436,7 +4868,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -4449,6 +4882,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -4459,6 +4893,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -4469,6 +4904,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -4478,7 +4914,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -4488,7 +4925,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -4498,7 +4936,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -4508,7 +4947,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -4518,7 +4958,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -4528,7 +4969,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
@@ -4541,6 +4983,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_core': {
@@ -4551,6 +4994,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't2_radial': {
@@ -4561,6 +5005,7 @@ const IncarnatePowerInfo = {
         arc: '0',
         effects: [],
         baseStats: {},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_1': {
@@ -4570,7 +5015,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_core_2': {
@@ -4580,7 +5026,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_1': {
@@ -4590,7 +5037,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't3_radial_2': {
@@ -4600,7 +5048,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_core': {
@@ -4610,7 +5059,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
       't4_radial': {
@@ -4620,7 +5070,8 @@ const IncarnatePowerInfo = {
         radius: '0',
         arc: '0',
         effects: [],
-        baseStats: {},
+        baseStats: {"current": {"Level_Shift": 1.0}},
+        affectedStats: {},
         damageType: 'None'
       },
     },
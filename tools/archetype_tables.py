@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Archetype Modifier Table Store
+Loads every archetype's named modifier tables once and serves indexed
+lookups by level.
+
+Tables are kept as contiguous array('d') columns behind a case-insensitive
+index, so a lookup is two dict hits and an array index. Stores are plain
+data and pickle cleanly, so a store loaded before a process pool forks is
+shared read-only by every worker.
+"""
+import json
+from array import array
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Highest character level the planner models
+MAX_LEVEL = 50
+
+# One store per tables directory, shared by every converter in the process
+_STORES = {}
+
+
+class ArchetypeTableStore:
+    """Case-insensitive index of every archetype's named modifier tables"""
+
+    def __init__(self, tables_dir):
+        self.tables_dir = Path(tables_dir)
+        # archetype -> {table name (lowercase): array('d')}, None if missing
+        self._archetypes = {}
+        # Column lookups served, reported by --profile
+        self.lookups = 0
+
+    def load_all(self):
+        """Load every archetype JSON in the tables directory"""
+        for archetype_file in sorted(self.tables_dir.glob("*.json")):
+            self.archetype(archetype_file.stem)
+        return self
+
+    def archetypes(self):
+        """Names of the archetypes loaded so far"""
+        return sorted(name for name, tables in self._archetypes.items() if tables is not None)
+
+    def archetype(self, archetype):
+        """Return the table index for an archetype, loading it on first use"""
+        if archetype in self._archetypes:
+            return self._archetypes[archetype]
+
+        archetype_file = self.tables_dir / f"{archetype}.json"
+        tables = None
+
+        if not archetype_file.exists():
+            print(f"Warning: Archetype table not found: {archetype_file}")
+        else:
+            try:
+                with open(archetype_file, 'r', encoding='utf-8') as f:
+                    named_tables = json.load(f).get('named_tables', {})
+                tables = {}
+                for name, values in named_tables.items():
+                    if not isinstance(values, list):
+                        continue
+                    # First spelling wins, matching the old linear scan
+                    tables.setdefault(name.lower(), array('d', values))
+            except Exception as e:
+                print(f"Error loading archetype tables: {e}")
+                tables = None
+
+        self._archetypes[archetype] = tables
+        return tables
+
+    def reload(self, archetype):
+        """Drop an archetype's tables and read them from disk again"""
+        self._archetypes.pop(archetype, None)
+        return self.archetype(archetype)
+
+    def column(self, archetype, table_name):
+        """Return the modifier column for a table, or None if unknown/empty"""
+        self.lookups += 1
+        tables = self.archetype(archetype)
+        if not tables:
+            return None
+        values = tables.get(table_name.lower())
+        return values if values else None
+
+    def lookup(self, archetype, table_name, level):
+        """Modifier for a single level, or None if the table is unknown"""
+        values = self.column(archetype, table_name)
+        if values is None:
+            return None
+        # Index into table (0-indexed, so level-1), clamped to valid range
+        return values[max(0, min(len(values) - 1, level - 1))]
+
+    def levels(self, archetype, table_name, count=MAX_LEVEL):
+        """Modifiers for levels 1..count (clamped like lookup), or None"""
+        values = self.column(archetype, table_name)
+        if values is None:
+            return None
+        if len(values) >= count:
+            return values[:count]
+        return values + array('d', [values[-1]]) * (count - len(values))
+
+    def scaled(self, archetype, table_name, scale, count=MAX_LEVEL):
+        """scale x modifier for levels 1..count as one vector multiply.
+
+        Unknown tables scale by 1.0, matching apply_archetype_modifier.
+        Returns a NumPy array when NumPy is installed, else a list.
+        """
+        values = self.levels(archetype, table_name, count)
+        if np is not None:
+            if values is None:
+                return np.full(count, scale, dtype=float)
+            return np.frombuffer(values, dtype=float) * scale
+        if values is None:
+            return [scale] * count
+        return [scale * v for v in values]
+
+
+def get_store(tables_dir):
+    """Return the shared store for a tables directory"""
+    key = str(tables_dir)
+    store = _STORES.get(key)
+    if store is None:
+        store = _STORES[key] = ArchetypeTableStore(tables_dir)
+    return store
+
+
+def lookup_count():
+    """Total column lookups served by every store in this process"""
+    return sum(store.lookups for store in _STORES.values())
@@ -0,0 +1,462 @@
+#!/usr/bin/env python3
+"""
+City of Heroes: Homecoming - Batch Converter
+Converts every powerset, pool and epic pool in-process across a worker pool
+
+Usage:
+    python batch_convert.py [--raw=<raw_data_dir>] [--tables=<tables_dir>] [--output=<js_data_dir>]
+                            [--archetype=<at>[,<at>...]] [--category=primary,secondary,pool,epic]
+                            [--level=<level>] [--levels=all] [--workers=<n>]
+                            [--manifest=<path>] [--force] [--cache[=<cache_file>]] [--compact] [--columnar] [--shared]
+    Example: python batch_convert.py --archetype=tanker,brute --category=primary,secondary
+
+Each worker imports the converters once and loads the archetype tables once,
+so a full run pays interpreter startup per core instead of per powerset.
+Results are reported in job order regardless of which worker finished first.
+Jobs whose inputs, tables, parameters and converter version match the build
+manifest are skipped; --force rebuilds everything. With --cache, raw files
+are preparsed into the raw record cache before the pool starts and every
+worker reads them from the shared memory-mapped store. --compact writes
+interned, minified files (see compact_data.py); --columnar writes
+--levels=all values as Float32 columns (see level_columns.py). --shared
+converts a powerset that several archetypes have in one job, written as a
+base under powersets/base plus a delta per archetype (see
+powerset_deltas.py); it cannot be combined with --columnar.
+"""
+import contextlib
+import io
+import os
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import convert_epic
+import convert_lore_pets
+import convert_pool
+import convert_powerset
+import parse_incarnate_data
+import powerset_deltas
+import raw_cache
+import raw_loader
+from archetype_tables import get_store
+from build_manifest import DEFAULT_MANIFEST, BuildManifest, json_inputs
+
+# Paths
+RAW_DATA_DIR = Path(r"C:\Projects\Raw Data Homecoming")
+TABLES_DIR = Path(r"C:\Projects\Raw Data Homecoming\tables")
+OUTPUT_DIR = Path(r"C:\Projects\CoH-Planner\js\data")
+
+# Raw powers subdirectory for each archetype's primaries and secondaries
+ARCHETYPE_CATEGORIES = {
+    'tanker': {'primary': 'tanker_defense', 'secondary': 'tanker_melee'},
+    'scrapper': {'primary': 'scrapper_melee', 'secondary': 'scrapper_defense'},
+    'blaster': {'primary': 'blaster_ranged', 'secondary': 'blaster_support'},
+    'brute': {'primary': 'brute_melee', 'secondary': 'brute_defense'},
+    'stalker': {'primary': 'stalker_melee', 'secondary': 'stalker_defense'},
+    'sentinel': {'primary': 'sentinel_ranged', 'secondary': 'sentinel_defense'},
+    'defender': {'primary': 'defender_buff', 'secondary': 'defender_ranged'},
+    'controller': {'primary': 'controller_control', 'secondary': 'controller_buff'},
+    'corruptor': {'primary': 'corruptor_ranged', 'secondary': 'corruptor_buff'},
+    'dominator': {'primary': 'dominator_control', 'secondary': 'dominator_assault'},
+    'mastermind': {'primary': 'mastermind_summon', 'secondary': 'mastermind_buff'}
+}
+
+CATEGORIES = ('primary', 'secondary', 'pool', 'epic')
+
+
+def powerset_job(raw_dir, archetype, powerset_name, output_root, category='primary'):
+    """Job for one archetype powerset"""
+    output_filename = powerset_name.replace('_', '-') + '.js'
+    return {
+        'kind': 'powerset',
+        'category': category,
+        'archetype': archetype,
+        'name': powerset_name,
+        'source': str(Path(raw_dir) / powerset_name),
+        'output': str(Path(output_root) / 'powersets' / archetype / output_filename)
+    }
+
+
+def discover_jobs(raw_root, output_root, archetypes=None, categories=CATEGORIES):
+    """List conversion jobs for the requested archetypes and categories"""
+    raw_root = Path(raw_root)
+    powers_dir = raw_root / 'powers'
+    jobs = []
+
+    for archetype, subdirs in ARCHETYPE_CATEGORIES.items():
+        if archetypes and archetype not in archetypes:
+            continue
+        for category in ('primary', 'secondary'):
+            if category not in categories:
+                continue
+            category_dir = powers_dir / subdirs[category]
+            if not category_dir.is_dir():
+                print(f"Warning: Raw directory not found: {category_dir}")
+                continue
+            for powerset_dir in sorted(p for p in category_dir.iterdir() if p.is_dir()):
+                jobs.append(powerset_job(category_dir, archetype, powerset_dir.name, output_root, category))
+
+    for category, subdir in (('pool', 'pool'), ('epic', 'epic')):
+        if category not in categories:
+            continue
+        category_dir = powers_dir / subdir
+        if not category_dir.is_dir():
+            print(f"Warning: Raw directory not found: {category_dir}")
+            continue
+        for pool_dir in sorted(p for p in category_dir.iterdir() if p.is_dir()):
+            jobs.append({
+                'kind': category,
+                'category': category,
+                'archetype': None,
+                'name': pool_dir.name,
+                'source': str(pool_dir),
+                'output': str(Path(output_root) / ('pools' if category == 'pool' else 'epics'))
+            })
+
+    return jobs
+
+
+def share_powersets(jobs, output_root):
+    """Replace powerset jobs that several archetypes share with one shared job each.
+
+    The shared job takes the place of its first member, so job order is kept.
+    """
+    groups = {}
+    for job in jobs:
+        if job['kind'] == 'powerset':
+            groups.setdefault(job['name'], []).append(job)
+
+    shared = []
+    for job in jobs:
+        members = groups.get(job['name']) if job['kind'] == 'powerset' else None
+        archetypes = {m['archetype'] for m in members} if members else set()
+        if not members or len(members) < 2 or len(archetypes) != len(members):
+            shared.append(job)
+        elif job is members[0]:
+            output_filename = job['name'].replace('_', '-') + '.js'
+            shared.append({
+                'kind': 'shared',
+                'category': 'shared',
+                'archetype': None,
+                'name': job['name'],
+                'members': members,
+                'source': members[0]['source'],
+                'output': str(Path(output_root) / 'powersets' / powerset_deltas.BASE_DIR / output_filename)
+            })
+    return shared
+
+
+def incarnate_job(raw_dir, output_file):
+    """Job for the incarnate power info file"""
+    return {
+        'kind': 'incarnate',
+        'category': 'incarnate',
+        'archetype': None,
+        'name': 'incarnate-power-info',
+        'source': str(raw_dir),
+        'output': str(output_file)
+    }
+
+
+def lore_pets_job(raw_dir, output_file):
+    """Job for the lore pet dataset"""
+    return {
+        'kind': 'lore-pets',
+        'category': 'incarnate',
+        'archetype': None,
+        'name': 'lore-pets',
+        'source': str(raw_dir),
+        'output': str(output_file)
+    }
+
+
+def job_sources(job):
+    """Raw directories a job reads"""
+    if job['kind'] == 'shared':
+        return [member['source'] for member in job['members']]
+    return [job['source']]
+
+
+def job_inputs(job):
+    """Raw files a job reads"""
+    if job['kind'] == 'shared':
+        return [f for member in job['members'] for f in job_inputs(member)]
+    if job['kind'] == 'incarnate':
+        return [f for folder in parse_incarnate_data.ingest_folders(job['source'])
+                for f in json_inputs(Path(job['source']) / folder)]
+    if job['kind'] == 'lore-pets':
+        return [f for folder in convert_lore_pets.input_folders(job['source'])
+                for f in json_inputs(Path(job['source']) / folder)]
+    return json_inputs(job['source'])
+
+
+def job_key(job):
+    """Stable manifest key for a job"""
+    if job['kind'] == 'powerset':
+        return f"powersets/{job['archetype']}/{job['name']}"
+    if job['kind'] == 'shared':
+        return f"powersets/{powerset_deltas.BASE_DIR}/{job['name']}"
+    if job['kind'] in ('incarnate', 'lore-pets'):
+        return job['name']
+    return f"{job['kind']}s/{job['name']}"
+
+
+def job_digest(manifest, job, tables_dir, level, levels, compact=False, columnar=False):
+    """Digest of everything a job's output depends on"""
+    inputs = job_inputs(job)
+    if job['kind'] == 'powerset':
+        params = {'archetype': job['archetype'], 'level': level, 'levels': levels}
+        if tables_dir:
+            inputs.append(Path(tables_dir) / f"{job['archetype']}.json")
+            params['tables'] = True
+        version = convert_powerset.CONVERTER_VERSION
+    elif job['kind'] == 'shared':
+        params = {'archetypes': [m['archetype'] for m in job['members']], 'level': level, 'levels': levels}
+        if tables_dir:
+            inputs.extend(Path(tables_dir) / f"{m['archetype']}.json" for m in job['members'])
+            params['tables'] = True
+        version = convert_powerset.CONVERTER_VERSION
+    elif job['kind'] == 'pool':
+        params = {}
+        version = convert_pool.CONVERTER_VERSION
+    elif job['kind'] == 'incarnate':
+        params = {}
+        version = parse_incarnate_data.CONVERTER_VERSION
+    elif job['kind'] == 'lore-pets':
+        params = {}
+        version = convert_lore_pets.CONVERTER_VERSION
+    else:
+        params = {}
+        version = convert_epic.CONVERTER_VERSION
+    params['kind'] = job['kind']
+    if compact and job['kind'] not in ('incarnate', 'lore-pets'):
+        params['compact'] = True
+    if columnar and job['kind'] == 'powerset':
+        params['columnar'] = True
+    return manifest.digest(inputs, params, version)
+
+
+# Settings shared by every job in a worker, set once by _init_worker
+_WORKER = {}
+
+
+def _init_worker(tables_dir, level, levels, cache_path=None, compact=False, columnar=False):
+    """Load the archetype tables once per worker process"""
+    _WORKER.update(tables_dir=tables_dir, level=level, levels=levels, compact=compact, columnar=columnar)
+    if tables_dir:
+        get_store(tables_dir).load_all()
+    if cache_path:
+        # The parent already filled the cache; workers only read it
+        raw_cache.enable(cache_path, writable=False)
+
+
+def run_job(job):
+    """Convert one job, capturing its console output. Returns (ok, log, outputs)"""
+    log = io.StringIO()
+    outputs = []
+    cache = raw_loader.active_cache()
+    if cache is not None:
+        cache.refresh()
+    try:
+        with contextlib.redirect_stdout(log):
+            if job['kind'] == 'powerset':
+                result = convert_powerset.convert_powerset(
+                    job['source'], job['output'], job['archetype'],
+                    _WORKER.get('level', 50), _WORKER.get('tables_dir'), _WORKER.get('levels'),
+                    _WORKER.get('compact', False), _WORKER.get('columnar', False)
+                )
+                if result is not None:
+                    outputs = [job['output']]
+            elif job['kind'] == 'shared':
+                members = [(m['source'], m['output'], m['archetype']) for m in job['members']]
+                outputs = convert_powerset.convert_shared_powerset(
+                    members, job['output'], _WORKER.get('level', 50), _WORKER.get('tables_dir'),
+                    _WORKER.get('levels'), _WORKER.get('compact', False)
+                ) or []
+            elif job['kind'] == 'pool':
+                source = Path(job['source'])
+                result = convert_pool.convert_pool(source.name, source.parent, job['output'],
+                                                   _WORKER.get('compact', False))
+                if result:
+                    outputs = [str(result)]
+            # These jobs already run in a pool worker, so they must not start pools of their own
+            elif job['kind'] == 'incarnate':
+                if parse_incarnate_data.build_incarnate_info(job['source'], job['output'], workers=1):
+                    outputs = [job['output']]
+            elif job['kind'] == 'lore-pets':
+                convert_lore_pets.convert_lore_pets(job['source'], job['output'], workers=1)
+                outputs = [job['output']]
+            else:
+                source = Path(job['source'])
+                result = convert_epic.convert_epic_pool(source.name, source.parent, job['output'],
+                                                        _WORKER.get('compact', False))
+                if result:
+                    outputs = [str(result)]
+    except Exception:
+        log.write(traceback.format_exc())
+        outputs = []
+    return bool(outputs), log.getvalue(), outputs
+
+
+def run_jobs(jobs, tables_dir=None, level=50, levels=None, workers=None, verbose=False,
+             manifest=None, force=False, cache_path=None, compact=False, columnar=False):
+    """Run jobs across a process pool. Returns a list of (job, ok, log) in job order
+
+    With a manifest, jobs that are already up to date are skipped (unless
+    force is set) and the manifest is updated and saved afterwards. With a
+    cache_path, the raw files of the remaining jobs are cached up front.
+    """
+    digests = {}
+    if manifest is not None:
+        pending = []
+        for job in jobs:
+            digest = job_digest(manifest, job, tables_dir, level, levels, compact, columnar)
+            if not force and manifest.is_current(job_key(job), digest):
+                continue
+            digests[job_key(job)] = digest
+            pending.append(job)
+        print(f"{len(jobs) - len(pending)} up to date, {len(pending)} to convert")
+        jobs = pending
+
+    if cache_path and jobs:
+        raw_cache.build_cache(sorted({source for job in jobs for source in job_sources(job)}), cache_path)
+
+    workers = workers or os.cpu_count() or 1
+    workers = max(1, min(workers, len(jobs) or 1))
+    results = []
+
+    if workers == 1:
+        _init_worker(tables_dir, level, levels, cache_path, compact, columnar)
+        outcomes = map(run_job, jobs)
+        results = _report(jobs, outcomes, verbose)
+        if cache_path:
+            raw_loader.use_cache(None)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(tables_dir, level, levels, cache_path, compact, columnar)) as executor:
+            # map() yields in submission order, so the log stays readable
+            outcomes = executor.map(run_job, jobs, chunksize=max(1, len(jobs) // (workers * 4)))
+            results = _report(jobs, outcomes, verbose)
+
+    if manifest is not None:
+        for job, ok, _, outputs in results:
+            if ok:
+                manifest.record(job_key(job), digests[job_key(job)], outputs)
+            else:
+                manifest.forget(job_key(job))
+        manifest.save()
+
+    return [(job, ok, log) for job, ok, log, _ in results]
+
+
+def job_label(job):
+    """Short name for progress lines"""
+    return f"{job['archetype']}/{job['name']}" if job['archetype'] else f"{job['kind']}/{job['name']}"
+
+
+def _report(jobs, outcomes, verbose):
+    """Print progress lines in job order and collect results"""
+    results = []
+    for index, (job, (ok, log, outputs)) in enumerate(zip(jobs, outcomes), 1):
+        print(f"[{index}/{len(jobs)}] {job_label(job)} - {'OK' if ok else 'FAILED'}")
+        if verbose or not ok:
+            for line in log.rstrip().splitlines():
+                print(f"    {line}")
+        results.append((job, ok, log, outputs))
+    return results
+
+
+def print_summary(results):
+    """Print the end-of-run summary"""
+    failed = [job for job, ok, _ in results if not ok]
+    print(f"\n{'='*60}")
+    print("CONVERSION SUMMARY")
+    print(f"{'='*60}")
+    print(f"Total jobs: {len(results)}")
+    print(f"Succeeded: {len(results) - len(failed)}")
+    print(f"Failed: {len(failed)}")
+    for job in failed:
+        print(f"  - {job['archetype'] or job['kind']}/{job['name']}")
+    print(f"{'='*60}")
+
+
+def main():
+    raw_dir = RAW_DATA_DIR
+    tables_dir = TABLES_DIR
+    output_dir = OUTPUT_DIR
+    archetypes = None
+    categories = CATEGORIES
+    level = 50
+    levels = None
+    workers = None
+    verbose = False
+    manifest_path = DEFAULT_MANIFEST
+    force = False
+    cache_path = None
+    compact = False
+    columnar = False
+    shared = False
+
+    # Parse arguments
+    for arg in sys.argv[1:]:
+        if arg.startswith('--raw='):
+            raw_dir = Path(arg.split('=', 1)[1])
+        elif arg.startswith('--tables='):
+            tables_dir = Path(arg.split('=', 1)[1])
+        elif arg.startswith('--output='):
+            output_dir = Path(arg.split('=', 1)[1])
+        elif arg.startswith('--archetype='):
+            archetypes = set(arg.split('=', 1)[1].lower().split(','))
+        elif arg.startswith('--category='):
+            categories = tuple(arg.split('=', 1)[1].lower().split(','))
+        elif arg.startswith('--level='):
+            level = int(arg.split('=', 1)[1])
+        elif arg.startswith('--levels='):
+            levels = arg.split('=', 1)[1]
+            if levels != convert_powerset.ALL_LEVELS:
+                print(f"Error: Unsupported --levels value: {levels} (only '{convert_powerset.ALL_LEVELS}')")
+                sys.exit(1)
+        elif arg.startswith('--workers='):
+            workers = int(arg.split('=', 1)[1])
+        elif arg.startswith('--manifest='):
+            manifest_path = Path(arg.split('=', 1)[1])
+        elif arg == '--force':
+            force = True
+        elif raw_cache.cache_arg(arg):
+            cache_path = raw_cache.cache_arg(arg)
+        elif arg == '--compact':
+            compact = True
+        elif arg == '--columnar':
+            columnar = True
+        elif arg == '--shared':
+            shared = True
+        elif arg == '--verbose':
+            verbose = True
+        else:
+            print(__doc__)
+            sys.exit(1)
+
+    unknown = [c for c in categories if c not in CATEGORIES]
+    if unknown:
+        print(f"Error: Unknown category: {', '.join(unknown)} (valid: {', '.join(CATEGORIES)})")
+        sys.exit(1)
+    if shared and columnar:
+        print("Error: --shared cannot be combined with --columnar")
+        sys.exit(1)
+
+    jobs = discover_jobs(raw_dir, output_dir, archetypes, categories)
+    if shared:
+        jobs = share_powersets(jobs, output_dir)
+    print(f"Found {len(jobs)} conversion jobs")
+
+    manifest = BuildManifest(manifest_path)
+    results = run_jobs(jobs, tables_dir, level, levels, workers, verbose, manifest, force, cache_path, compact, columnar)
+    print_summary(results)
+
+    if not all(ok for _, ok, _ in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
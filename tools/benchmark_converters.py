@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Converter Benchmark
+Measures throughput and peak memory of each stage of the conversion pipeline
+
+Usage:
+    python benchmark_converters.py [--raw=<raw_dir>] [--tables=<tables_dir>] [--archetype=<at>]
+                                   [--scale=<n>] [--repeat=<n>] [--stage=<name>[,<name>...]]
+                                   [--baseline=<file>] [--save-baseline] [--tolerance=<fraction>]
+                                   [--json=<file>]
+    Example: python benchmark_converters.py --scale=20 --save-baseline
+
+Runs against the checked-in incarnate_raw_data by default; point --raw at
+the powers/ directory of a generate_synthetic_data.py tree or a full raw
+dump to measure at catalog scale. --scale=N repeats the loaded records N
+times for the in-memory stages.
+
+Each stage reports items/sec, MB/sec of input (output for to_js_literal)
+and peak traced memory. Timings are the best of --repeat runs; peak memory
+is measured in a separate traced run so tracing does not skew the timings.
+With a baseline, stages slower than baseline by more than --tolerance are
+flagged and the exit status is 1.
+"""
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import convert_powerset
+import parse_incarnate_data
+import parse_recipes
+from build_manifest import CACHE_DIR
+from raw_loader import load_json
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+RAW_DIR = REPO_DIR / "incarnate_raw_data"
+DEFAULT_BASELINE = CACHE_DIR / "benchmark-baseline.json"
+
+# extract_* stages: name -> callable(power record, archetype, level, tables_dir)
+EXTRACT_STAGES = {
+    'extract_mez_protection': lambda p, at, lvl, td: convert_powerset.extract_mez_protection(p.get('effects', []), at, lvl, td),
+    'extract_typed_defense': lambda p, at, lvl, td: convert_powerset.extract_typed_defense(p.get('effects', []), at, lvl, td),
+    'extract_debuff_resistance': lambda p, at, lvl, td: convert_powerset.extract_debuff_resistance(p.get('effects', []), at, lvl, td),
+    'extract_healing': lambda p, at, lvl, td: convert_powerset.extract_healing(p.get('effects', []), at, lvl, td),
+    'extract_damage_info': lambda p, at, lvl, td: convert_powerset.extract_damage_info(p.get('effects', [])),
+    'extract_debuffs': lambda p, at, lvl, td: convert_powerset.extract_debuffs(p.get('effects', []), p.get('target_type', 'Foe')),
+}
+
+STAGES = ('load', 'convert_power') + tuple(EXTRACT_STAGES) + ('to_js_literal', 'parse_slot_folder', 'parse_recipes')
+
+
+def power_files(raw_dir):
+    """Every power JSON under raw_dir, excluding index files"""
+    return [f for f in sorted(Path(raw_dir).rglob("*.json")) if f.name.lower() != 'index.json']
+
+
+def measure(func, repeat):
+    """Best wall time of repeat runs, then peak traced memory of one more run"""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+class Corpus:
+    """Inputs shared by the stages, loaded once"""
+
+    def __init__(self, raw_dir, scale, archetype, level, tables_dir):
+        self.raw_dir = Path(raw_dir)
+        self.archetype = archetype
+        self.level = level
+        self.tables_dir = tables_dir
+        self.files = power_files(raw_dir)
+        self.file_bytes = sum(f.stat().st_size for f in self.files)
+        base = [load_json(f, convert_powerset.POWER_FIELDS) for f in self.files]
+        self.scale = scale
+        self.records = base * scale
+        self.record_bytes = self.file_bytes * scale
+        self.converted = [self.convert(r) for r in base] * scale
+
+    def convert(self, record):
+        return convert_powerset.convert_power(record, self.archetype, self.level, self.tables_dir)
+
+
+def stage_jobs(corpus):
+    """name -> (callable, items, input bytes) for every stage"""
+    jobs = {}
+    jobs['load'] = (
+        lambda: [load_json(f, convert_powerset.POWER_FIELDS) for f in corpus.files],
+        len(corpus.files), corpus.file_bytes
+    )
+    jobs['convert_power'] = (
+        lambda: [corpus.convert(r) for r in corpus.records],
+        len(corpus.records), corpus.record_bytes
+    )
+    for name, extract in EXTRACT_STAGES.items():
+        jobs[name] = (
+            lambda extract=extract: [extract(r, corpus.archetype, corpus.level, corpus.tables_dir)
+                                     for r in corpus.records],
+            len(corpus.records), corpus.record_bytes
+        )
+
+    # to_js_literal is measured by the bytes it produces
+    js_bytes = sum(len(convert_powerset.to_js_literal(p).encode('utf-8')) for p in corpus.converted)
+    jobs['to_js_literal'] = (
+        lambda: [convert_powerset.to_js_literal(p) for p in corpus.converted],
+        len(corpus.converted), js_bytes
+    )
+
+    slot_dirs = [(slot, corpus.raw_dir / slot) for slot in parse_incarnate_data.SLOTS if (corpus.raw_dir / slot).is_dir()]
+    if slot_dirs:
+        slot_files = [f for _, d in slot_dirs for f in d.glob("*.json")]
+
+        def parse_slots():
+            for slot, folder in slot_dirs:
+                parse_incarnate_data.parse_slot_folder(slot, str(folder))
+
+        jobs['parse_slot_folder'] = (parse_slots, len(slot_files),
+                                     sum(f.stat().st_size for f in slot_files))
+
+    recipe_files = sorted(corpus.raw_dir.glob("*.recipe"))
+    if recipe_files:
+        jobs['parse_recipes'] = (
+            lambda: [parse_recipes.parse_recipe_file(f) for f in recipe_files],
+            sum(len(parse_recipes.parse_recipe_file(f)) for f in recipe_files),
+            sum(f.stat().st_size for f in recipe_files)
+        )
+    return jobs
+
+
+class _Quiet:
+    """Swallow converter progress prints while timing"""
+
+    def write(self, text):
+        pass
+
+    def flush(self):
+        pass
+
+
+def run_benchmarks(corpus, stages=STAGES, repeat=3):
+    """Run the selected stages. Returns {stage: metrics}"""
+    results = {}
+    jobs = stage_jobs(corpus)
+    for name in stages:
+        if name not in jobs:
+            continue
+        func, items, nbytes = jobs[name]
+        stdout = sys.stdout
+        sys.stdout = _Quiet()
+        try:
+            seconds, peak = measure(func, repeat)
+        finally:
+            sys.stdout = stdout
+        seconds = max(seconds, 1e-9)
+        results[name] = {
+            'items': items,
+            'bytes': nbytes,
+            'seconds': seconds,
+            'items_per_sec': items / seconds,
+            'mb_per_sec': nbytes / seconds / 1e6,
+            'peak_mb': peak / 1e6,
+        }
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Return {stage: current/baseline throughput} and the regressed stage names"""
+    ratios = {}
+    regressions = []
+    for name, metrics in results.items():
+        base = baseline.get(name)
+        if not base or not base.get('items_per_sec'):
+            continue
+        ratio = metrics['items_per_sec'] / base['items_per_sec']
+        ratios[name] = ratio
+        if ratio < 1 - tolerance:
+            regressions.append(name)
+    return ratios, regressions
+
+
+def print_report(results, ratios, regressions):
+    print(f"{'stage':<28}{'items':>9}{'items/s':>12}{'MB/s':>9}{'peak MB':>9}{'vs base':>9}")
+    print('-' * 76)
+    for name, m in results.items():
+        ratio = f"{ratios[name]:.2f}x" if name in ratios else '-'
+        flag = '  REGRESSION' if name in regressions else ''
+        print(f"{name:<28}{m['items']:>9}{m['items_per_sec']:>12.0f}{m['mb_per_sec']:>9.1f}"
+              f"{m['peak_mb']:>9.1f}{ratio:>9}{flag}")
+
+
+def main():
+    raw_dir = RAW_DIR
+    tables_dir = None
+    archetype = None
+    level = 50
+    scale = 1
+    repeat = 3
+    stages = STAGES
+    baseline_path = DEFAULT_BASELINE
+    save_baseline = False
+    tolerance = 0.15
+    json_path = None
+
+    # Parse arguments
+    for arg in sys.argv[1:]:
+        if arg.startswith('--raw='):
+            raw_dir = Path(arg.split('=', 1)[1])
+        elif arg.startswith('--tables='):
+            tables_dir = arg.split('=', 1)[1]
+        elif arg.startswith('--archetype='):
+            archetype = arg.split('=', 1)[1]
+        elif arg.startswith('--scale='):
+            scale = int(arg.split('=', 1)[1])
+        elif arg.startswith('--repeat='):
+            repeat = int(arg.split('=', 1)[1])
+        elif arg.startswith('--stage='):
+            stages = tuple(arg.split('=', 1)[1].split(','))
+        elif arg.startswith('--baseline='):
+            baseline_path = Path(arg.split('=', 1)[1])
+        elif arg == '--save-baseline':
+            save_baseline = True
+        elif arg.startswith('--tolerance='):
+            tolerance = float(arg.split('=', 1)[1])
+        elif arg.startswith('--json='):
+            json_path = Path(arg.split('=', 1)[1])
+        else:
+            print(__doc__)
+            sys.exit(1)
+
+    unknown = [s for s in stages if s not in STAGES]
+    if unknown:
+        print(f"Error: Unknown stage: {', '.join(unknown)} (valid: {', '.join(STAGES)})")
+        sys.exit(1)
+
+    corpus = Corpus(raw_dir, scale, archetype, level, tables_dir)
+    print(f"Corpus: {len(corpus.files)} power files ({corpus.file_bytes / 1e6:.1f} MB) "
+          f"from {raw_dir}, scale x{scale}\n")
+
+    results = run_benchmarks(corpus, stages, repeat)
+    config = {'raw': str(raw_dir), 'scale': scale, 'archetype': archetype,
+              'tables': bool(tables_dir), 'level': level}
+
+    baseline = {}
+    if baseline_path.exists() and not save_baseline:
+        with open(baseline_path, 'r', encoding='utf-8') as f:
+            stored = json.load(f)
+        if stored.get('config') == config:
+            baseline = stored.get('results', {})
+        else:
+            print(f"Baseline {baseline_path} was recorded with different inputs; not comparing\n")
+
+    ratios, regressions = compare(results, baseline, tolerance)
+    print_report(results, ratios, regressions)
+
+    report = {'config': config, 'results': results}
+    if json_path:
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    if save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(baseline_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved baseline to {baseline_path}")
+
+    if regressions:
+        print(f"\n{len(regressions)} stage(s) regressed by more than {tolerance:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
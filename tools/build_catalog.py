@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+City of Heroes: Homecoming - Catalog Builder
+Builds the whole planner dataset (powersets, pools, epics, incarnate power
+info and lore pets) in one run
+
+Usage:
+    python build_catalog.py [--raw=<raw_data_dir>] [--tables=<tables_dir>] [--output=<js_data_dir>]
+                            [--incarnate-raw=<incarnate_raw_dir>] [--incarnate-output=<js_file>]
+                            [--archetype=<at>[,<at>...]] [--category=primary,secondary,pool,epic,incarnate]
+                            [--level=<level>] [--levels=all] [--workers=<n>]
+                            [--manifest=<path>] [--force] [--cache[=<cache_file>]] [--compact] [--columnar] [--bundle]
+                            [--shared] [--dist[=<output_dir>]] [--verbose]
+    Example: python build_catalog.py --cache --bundle
+
+Every category runs in one process pool whose workers load the archetype
+tables once. Work is scheduled as a dependency graph: with --cache, the raw
+files that are missing from the raw record cache are parsed in chunks on the
+same pool, and each conversion job starts as soon as the chunks holding its
+inputs are in the store, so parsing one category overlaps converting
+another. Only this process writes the cache; workers map it read-only and
+pick up each appended chunk on their next job. Jobs that are up to date in
+the build manifest are skipped, and the slowest jobs are started first so
+the wall time stays close to the longest single job. --shared writes
+powersets that several archetypes have as one base plus per-archetype
+deltas (see batch_convert.py).
+
+A successful build then packs the per-archetype data shards the app loads
+on demand (build_shards.py), and with --bundle runs the script bundler
+over index.html. --dist then writes content-hashed .gz/.br copies of the
+generated files for static hosting (precompress_assets.py).
+"""
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+import batch_convert
+import build_shards
+import bundle_scripts
+import convert_lore_pets
+import parse_incarnate_data
+import precompress_assets
+import raw_cache
+from build_manifest import DEFAULT_MANIFEST, BuildManifest
+from convert_powerset import ALL_LEVELS
+
+CATEGORIES = batch_convert.CATEGORIES + ('incarnate',)
+
+# Raw files parsed per cache task
+CACHE_CHUNK = 400
+
+
+def discover_jobs(raw_dir, output_dir, incarnate_raw, incarnate_output, archetypes=None,
+                  categories=CATEGORIES, shared=False):
+    """Every conversion job for the requested archetypes and categories"""
+    jobs = batch_convert.discover_jobs(raw_dir, output_dir, archetypes,
+                                       [c for c in categories if c != 'incarnate'])
+    if shared:
+        jobs = batch_convert.share_powersets(jobs, output_dir)
+    if 'incarnate' in categories:
+        if Path(incarnate_raw).is_dir():
+            jobs.append(batch_convert.incarnate_job(incarnate_raw, incarnate_output))
+            jobs.append(batch_convert.lore_pets_job(incarnate_raw, Path(output_dir) / convert_lore_pets.OUTPUT_NAME))
+        else:
+            print(f"Warning: Raw directory not found: {incarnate_raw}")
+    return jobs
+
+
+def input_bytes(job):
+    """Total size of a job's raw inputs, used to start the slowest jobs first"""
+    return sum(os.path.getsize(f) for f in batch_convert.job_inputs(job))
+
+
+def cache_tasks(jobs, cache):
+    """Split the jobs' uncached raw files into parse chunks.
+
+    Returns ({chunk name: [paths]}, {job index: {chunk names}}).
+    """
+    chunks = {}
+    needs = {}
+    by_group = {}
+    for index, job in enumerate(jobs):
+        group = f"{job['archetype']}/{job['category']}" if job['archetype'] else job['category']
+        files = cache.stale(batch_convert.job_inputs(job))
+        if files:
+            by_group.setdefault(group, []).append((index, files))
+
+    for group, members in by_group.items():
+        count = 0
+        for index, files in members:
+            for path in files:
+                name = f"cache:{group}:{count // CACHE_CHUNK}"
+                chunks.setdefault(name, []).append(path)
+                needs.setdefault(index, set()).add(name)
+                count += 1
+    return chunks, needs
+
+
+def timed_job(job):
+    """Run one job in a worker. Returns (ok, log, outputs, seconds)"""
+    started = time.perf_counter()
+    ok, log, outputs = batch_convert.run_job(job)
+    return ok, log, outputs, time.perf_counter() - started
+
+
+def build(jobs, tables_dir=None, level=50, levels=None, workers=None, verbose=False,
+          manifest=None, force=False, cache_path=None, compact=False, columnar=False):
+    """Run every job as one dependency graph. Returns a list of (job, ok, log, seconds)"""
+    digests = {}
+    if manifest is not None:
+        pending = []
+        for job in jobs:
+            digest = batch_convert.job_digest(manifest, job, tables_dir, level, levels, compact, columnar)
+            if not force and manifest.is_current(batch_convert.job_key(job), digest):
+                continue
+            digests[batch_convert.job_key(job)] = digest
+            pending.append(job)
+        print(f"{len(jobs) - len(pending)} up to date, {len(pending)} to convert")
+        jobs = pending
+
+    if not jobs:
+        return []
+
+    cache = None
+    chunks, needs = {}, {}
+    if cache_path:
+        cache = raw_cache.RawRecordCache(cache_path)
+        chunks, needs = cache_tasks(jobs, cache)
+        print(f"{sum(len(paths) for paths in chunks.values())} raw files to cache in {len(chunks)} chunks")
+
+    # Dependency graph: each job waits on the cache chunks holding its inputs
+    waiting = {index: len(needs.get(index, ())) for index in range(len(jobs))}
+    dependents = {}
+    for index, names in needs.items():
+        for name in names:
+            dependents.setdefault(name, []).append(index)
+
+    # Start the biggest jobs first so the longest one is not left for last
+    sizes = {index: input_bytes(job) for index, job in enumerate(jobs)}
+
+    workers = workers or os.cpu_count() or 1
+    workers = max(1, min(workers, len(jobs) + len(chunks)))
+    results = {}
+    started = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=batch_convert._init_worker,
+                             initargs=(tables_dir, level, levels, cache_path, compact, columnar)) as executor:
+        running = {}
+
+        def submit_ready(indices):
+            for index in sorted(indices, key=lambda i: -sizes[i]):
+                running[executor.submit(timed_job, jobs[index])] = index
+
+        for name, paths in chunks.items():
+            running[executor.submit(raw_cache.parse_records, paths)] = name
+        submit_ready([index for index, count in waiting.items() if count == 0])
+
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            parsed = []
+            for future in done:
+                task = running.pop(future)
+                if isinstance(task, str):
+                    # A cache chunk finished; its entries are written below
+                    try:
+                        cache.add(future.result())
+                    except Exception as e:
+                        print(f"Error caching {task}: {e}")
+                    parsed.append(task)
+                    continue
+
+                try:
+                    ok, log, outputs, seconds = future.result()
+                except Exception as e:
+                    ok, log, outputs, seconds = False, f"{type(e).__name__}: {e}\n", [], 0.0
+                results[task] = (ok, log, outputs, seconds)
+                job = jobs[task]
+                print(f"[{len(results)}/{len(jobs)}] {batch_convert.job_label(job)} - "
+                      f"{'OK' if ok else 'FAILED'} ({seconds:.2f}s)")
+                if verbose or not ok:
+                    for line in log.rstrip().splitlines():
+                        print(f"    {line}")
+
+            if parsed:
+                # Append before releasing dependents so workers see the records.
+                # A failed chunk still releases its jobs; they parse from disk.
+                cache.flush()
+                ready = []
+                for name in parsed:
+                    for index in dependents.get(name, ()):
+                        waiting[index] -= 1
+                        if waiting[index] == 0:
+                            ready.append(index)
+                submit_ready(ready)
+
+    wall = time.perf_counter() - started
+    if cache is not None:
+        if chunks:
+            # Drop the superseded indexes and records flush() left behind
+            cache.compact()
+        cache.close()
+
+    ordered = [(jobs[index], *results[index]) for index in range(len(jobs))]
+    if manifest is not None:
+        for job, ok, _, outputs, _ in ordered:
+            key = batch_convert.job_key(job)
+            if ok:
+                manifest.record(key, digests[key], outputs)
+            else:
+                manifest.forget(key)
+        manifest.save()
+
+    slowest = max(ordered, key=lambda result: result[4])
+    print(f"\nWall time: {wall:.2f}s, slowest job: {batch_convert.job_label(slowest[0])} "
+          f"({slowest[4]:.2f}s)")
+    return [(job, ok, log, seconds) for job, ok, log, _, seconds in ordered]
+
+
+def main():
+    raw_dir = batch_convert.RAW_DATA_DIR
+    tables_dir = batch_convert.TABLES_DIR
+    output_dir = batch_convert.OUTPUT_DIR
+    incarnate_raw = Path(parse_incarnate_data.BASE_PATH)
+    incarnate_output = None
+    archetypes = None
+    categories = CATEGORIES
+    level = 50
+    levels = None
+    workers = None
+    verbose = False
+    manifest_path = DEFAULT_MANIFEST
+    force = False
+    cache_path = None
+    bundling = False
+    dist_dir = None
+    compact = False
+    columnar = False
+    shared = False
+
+    # Parse arguments
+    for arg in sys.argv[1:]:
+        if arg.startswith('--raw='):
+            raw_dir = Path(arg.split('=', 1)[1])
+        elif arg.startswith('--tables='):
+            tables_dir = Path(arg.split('=', 1)[1])
+        elif arg.startswith('--output='):
+            output_dir = Path(arg.split('=', 1)[1])
+        elif arg.startswith('--incarnate-raw='):
+            incarnate_raw = Path(arg.split('=', 1)[1])
+        elif arg.startswith('--incarnate-output='):
+            incarnate_output = Path(arg.split('=', 1)[1])
+        elif arg.startswith('--archetype='):
+            archetypes = set(arg.split('=', 1)[1].lower().split(','))
+        elif arg.startswith('--category='):
+            categories = tuple(arg.split('=', 1)[1].lower().split(','))
+        elif arg.startswith('--level='):
+            level = int(arg.split('=', 1)[1])
+        elif arg.startswith('--levels='):
+            levels = arg.split('=', 1)[1]
+            if levels != ALL_LEVELS:
+                print(f"Error: Unsupported --levels value: {levels} (only '{ALL_LEVELS}')")
+                sys.exit(1)
+        elif arg.startswith('--workers='):
+            workers = int(arg.split('=', 1)[1])
+        elif arg.startswith('--manifest='):
+            manifest_path = Path(arg.split('=', 1)[1])
+        elif arg == '--force':
+            force = True
+        elif raw_cache.cache_arg(arg):
+            cache_path = raw_cache.cache_arg(arg)
+        elif arg == '--compact':
+            compact = True
+        elif arg == '--columnar':
+            columnar = True
+        elif arg == '--shared':
+            shared = True
+        elif arg == '--bundle':
+            bundling = True
+        elif arg == '--dist':
+            dist_dir = precompress_assets.DIST_DIR
+        elif arg.startswith('--dist='):
+            dist_dir = Path(arg.split('=', 1)[1])
+        elif arg == '--verbose':
+            verbose = True
+        else:
+            print(__doc__)
+            sys.exit(1)
+
+    unknown = [c for c in categories if c not in CATEGORIES]
+    if unknown:
+        print(f"Error: Unknown category: {', '.join(unknown)} (valid: {', '.join(CATEGORIES)})")
+        sys.exit(1)
+    if shared and columnar:
+        print("Error: --shared cannot be combined with --columnar")
+        sys.exit(1)
+
+    # incarnate-power-info.js sits beside js/data
+    incarnate_output = incarnate_output or Path(output_dir).parent / "incarnate-power-info.js"
+    jobs = discover_jobs(raw_dir, output_dir, incarnate_raw, incarnate_output, archetypes, categories,
+                         shared)
+    print(f"Found {len(jobs)} conversion jobs")
+
+    manifest = BuildManifest(manifest_path)
+    results = build(jobs, tables_dir, level, levels, workers, verbose, manifest, force, cache_path, compact, columnar)
+    batch_convert.print_summary([(job, ok, log) for job, ok, log, _ in results])
+
+    if not all(ok for _, ok, _, _ in results):
+        sys.exit(1)
+
+    try:
+        if {'primary', 'secondary', 'epic'} & set(categories):
+            build_shards.build_shards(output_dir)
+        if bundling:
+            # index.html sits two levels above js/data
+            bundle_scripts.bundle(Path(output_dir).parent.parent / "index.html")
+        if dist_dir:
+            precompress_assets.precompress(Path(output_dir).parent.parent, dist_dir, workers)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
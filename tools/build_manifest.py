@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Build Manifest
+Records a content hash of everything each generated js/data file was built
+from, so re-runs can skip outputs that are already up to date.
+
+An output's digest covers its raw input JSONs, the archetype table file it
+used, its conversion parameters and the converter version. Input file hashes
+are cached by (mtime, size), so an unchanged tree is checked with stat calls
+instead of re-reading every file.
+
+write_if_changed() is shared by the generators: an output whose bytes are
+unchanged keeps its mtime, so the watcher, shard and bundle steps and
+downstream caches only see files whose content really changed.
+write_tokens_if_changed() does the same for streamed output without ever
+holding the whole file in memory.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+
+MANIFEST_VERSION = 1
+
+# Build metadata lives outside js/data so it is never served
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".build-cache"
+DEFAULT_MANIFEST = CACHE_DIR / "manifest.json"
+
+
+class BuildManifest:
+    """Output digests plus a stat-keyed cache of input file hashes"""
+
+    def __init__(self, path=DEFAULT_MANIFEST):
+        self.path = Path(path)
+        self.outputs = {}
+        self.files = {}
+        self.dirty = False
+
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == MANIFEST_VERSION:
+                    self.outputs = data.get('outputs', {})
+                    self.files = data.get('files', {})
+            except Exception as e:
+                print(f"Warning: Ignoring unreadable manifest {self.path}: {e}")
+
+    def file_hash(self, path):
+        """Content hash of a file, reusing the cached hash while mtime/size match"""
+        key = str(path)
+        stat = os.stat(path)
+        cached = self.files.get(key)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        h = hashlib.blake2b(digest_size=16)
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                h.update(chunk)
+        digest = h.hexdigest()
+        self.files[key] = [stat.st_mtime_ns, stat.st_size, digest]
+        self.dirty = True
+        return digest
+
+    def digest(self, inputs, params, converter_version):
+        """Digest of input files, parameters and converter version"""
+        h = hashlib.blake2b(digest_size=16)
+        h.update(str(converter_version).encode('utf-8'))
+        h.update(json.dumps(params, sort_keys=True, default=str).encode('utf-8'))
+        for path in sorted(str(p) for p in inputs):
+            h.update(path.encode('utf-8'))
+            h.update(self.file_hash(path).encode('utf-8') if os.path.exists(path) else b'-')
+        return h.hexdigest()
+
+    def is_current(self, key, digest):
+        """True if key was last built from digest and its outputs still exist"""
+        entry = self.outputs.get(key)
+        if not entry or entry.get('digest') != digest:
+            return False
+        return all(os.path.exists(p) for p in entry.get('outputs', []))
+
+    def record(self, key, digest, outputs):
+        """Remember that key was built from digest into outputs.
+
+        Other keys that wrote any of the same files are dropped, since those
+        files no longer hold what they built.
+        """
+        outputs = [str(p) for p in outputs]
+        claimed = set(outputs)
+        for other in [k for k, entry in self.outputs.items()
+                      if k != key and claimed.intersection(entry.get('outputs', ()))]:
+            del self.outputs[other]
+        self.outputs[key] = {'digest': digest, 'outputs': outputs}
+        self.dirty = True
+
+    def forget(self, key):
+        """Drop a key so its next run rebuilds"""
+        if self.outputs.pop(key, None) is not None:
+            self.dirty = True
+
+    def save(self):
+        """Write the manifest if anything changed"""
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'outputs': self.outputs, 'files': self.files},
+                      f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+
+def json_inputs(directory):
+    """Every raw JSON file in a directory, in stable order"""
+    directory = Path(directory)
+    if not directory.is_dir():
+        return []
+    return sorted(directory.glob("*.json"))
+
+
+def write_if_changed(path, text):
+    """Write text to path unless the file already holds exactly that. Returns True if written"""
+    path = Path(path)
+    data = text.encode('utf-8')
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write beside the target and swap, so readers never see a partial file
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def _file_digest(path, size):
+    """SHA-256 of a file if it is size bytes long, else None"""
+    try:
+        if path.stat().st_size != size:
+            return None
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 16), b''):
+                digest.update(chunk)
+        return digest.digest()
+    except FileNotFoundError:
+        return None
+
+
+def write_tokens_if_changed(path, tokens):
+    """Stream string tokens to path unless the file already holds exactly them. Returns True if written
+
+    Tokens go to a temp file beside the target while being hashed; the
+    temp file replaces the target only when its digest differs.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with open(tmp_path, 'wb', buffering=1 << 16) as f:
+            for token in tokens:
+                data = token.encode('utf-8')
+                f.write(data)
+                digest.update(data)
+                size += len(data)
+        if _file_digest(path, size) == digest.digest():
+            os.remove(tmp_path)
+            return False
+        os.replace(tmp_path, path)
+    except BaseException:
+        if tmp_path.exists():
+            os.remove(tmp_path)
+        raise
+    return True
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Archetype Data Shards
+Packs each archetype's powersets and epic pools into one lazily loaded shard
+plus a generated manifest
+
+Usage:
+    python build_shards.py [--data=<js_data_dir>]
+    Example: python build_shards.py --data=../js/data
+
+Reads the converted files under js/data/powersets/<archetype>/ and
+js/data/epics/<archetype>/ and writes js/data/shards/<archetype>.<hash>.js
+for each archetype, plus js/data/shards/manifest.js:
+
+    const DATA_SHARDS = {
+        blaster: {file, bytes, powersets: [ids], epics: [ids], requires: [files]},
+        ...
+    };
+
+Ids are read from each file's POWERSETS[...] / EPIC_POOLS[...]
+registration. Shared powerset bases (js/data/powersets/base/, written by
+batch_convert.py --shared) go into base.<hash>.js shards, one for each set
+of archetypes that uses the same bases, and an archetype's requires lists
+the base shards its deltas need. js/data/load-shards.js looks the selected
+archetype up in DATA_SHARDS and loads only its base shards and shard. Shard
+names carry a content hash, so they can be cached indefinitely; shards from
+earlier runs are removed.
+"""
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+from build_manifest import write_if_changed
+from bundle_scripts import Script, bundle_text, check_redeclarations
+from powerset_deltas import BASE_DIR
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+DATA_DIR = REPO_DIR / "js" / "data"
+
+POWERSET_ID_RE = re.compile(r"POWERSETS\['([^']+)'\]\s*=[^=]")
+EPIC_ID_RE = re.compile(r"EPIC_POOLS\['([^']+)'\]\s*=[^=]")
+
+
+def shard_sources(data_dir):
+    """{archetype: [powerset files] + [epic files]} in stable order"""
+    sources = {}
+    for kind in ('powersets', 'epics'):
+        kind_dir = data_dir / kind
+        if not kind_dir.is_dir():
+            continue
+        for archetype_dir in sorted(p for p in kind_dir.iterdir() if p.is_dir() and p.name != BASE_DIR):
+            files = sorted(archetype_dir.glob("*.js"))
+            if files:
+                sources.setdefault(archetype_dir.name, []).extend(files)
+    return sources
+
+
+def write_shard(shard_dir, name, members, root):
+    """Write one content-hashed shard. Returns (path relative to root, bytes)"""
+    data = bundle_text(members).encode('utf-8')
+    digest = hashlib.blake2b(data, digest_size=5).hexdigest()
+    path = shard_dir / f"{name}.{digest}.js"
+    if not path.exists():
+        path.write_bytes(data)
+    return path.relative_to(root).as_posix(), len(data)
+
+
+def build_shards(data_dir=DATA_DIR):
+    """Write every archetype shard and the manifest. Returns the manifest dict"""
+    data_dir = Path(data_dir)
+    # Script paths are relative to the site root, two levels above js/data
+    root = data_dir.parent.parent
+    shard_dir = data_dir / "shards"
+    shard_dir.mkdir(parents=True, exist_ok=True)
+
+    sources = shard_sources(data_dir)
+    scripts = {
+        archetype: [Script(i, f.relative_to(root).as_posix(), root) for i, f in enumerate(files)]
+        for archetype, files in sources.items()
+    }
+    base_files = sorted((data_dir / "powersets" / BASE_DIR).glob("*.js"))
+    bases = [Script(i, f.relative_to(root).as_posix(), root) for i, f in enumerate(base_files)]
+    # Shards share one global scope, so names must be unique across all of them
+    check_redeclarations(bases + [s for members in scripts.values() for s in members])
+
+    # Group the bases by the archetypes whose deltas use them
+    groups = {}
+    for base in bases:
+        users = tuple(archetype for archetype, members in scripts.items()
+                      if any(base.declares.keys() & s.uses for s in members))
+        if users:
+            groups.setdefault(users, []).append(base)
+    requires = {archetype: [] for archetype in scripts}
+    written = []
+    for users, members in groups.items():
+        path, size = write_shard(shard_dir, "base", members, root)
+        written.append((path, size))
+        for archetype in users:
+            requires[archetype].append(path)
+
+    manifest = {}
+    for archetype, members in scripts.items():
+        path, size = write_shard(shard_dir, archetype, members, root)
+        written.append((path, size))
+        manifest[archetype] = {
+            'file': path,
+            'bytes': size,
+            'powersets': [m for s in members for m in POWERSET_ID_RE.findall(s.text)],
+            'epics': [m for s in members for m in EPIC_ID_RE.findall(s.text)],
+            'requires': requires[archetype],
+        }
+
+    keep = {Path(path).name for path, _ in written} | {'manifest.js'}
+    for old in shard_dir.glob("*.js"):
+        if old.name not in keep:
+            old.unlink()
+
+    js_content = f"""/**
+ * City of Heroes: Homecoming - Data Shard Manifest
+ *
+ * Auto-generated by tools/build_shards.py
+ * One shard per archetype holding its powersets and epic pools;
+ * requires lists the shared base shards to load first
+ */
+
+const DATA_SHARDS = {json.dumps(manifest, indent=2)};
+"""
+    write_if_changed(shard_dir / "manifest.js", js_content)
+
+    total = sum(size for _, size in written)
+    shared = f" and {len(groups)} base shards" if groups else ""
+    print(f"Wrote {len(manifest)} shards{shared} ({total / 1e6:.2f} MB) to {shard_dir}")
+    return manifest
+
+
+def main():
+    data_dir = DATA_DIR
+
+    for arg in sys.argv[1:]:
+        if arg.startswith('--data='):
+            data_dir = Path(arg.split('=', 1)[1])
+        else:
+            print(__doc__)
+            sys.exit(1)
+
+    try:
+        build_shards(data_dir)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
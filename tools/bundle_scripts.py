@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Script Bundler
+Collapses index.html's local <script> tags into a few content-hashed bundles
+
+Usage:
+    python bundle_scripts.py [--index=<index.html>] [--restore] [--check]
+    Example: python bundle_scripts.py
+
+Scripts are taken from index.html in document order. Load order is worked
+out from what the files declare and use:
+- a file that registers into a registry (POWERSETS[...] = ..., POWER_POOLS,
+  EPIC_POOLS) loads after the file that declares the registry
+- a file that mentions a top-level name declared by an earlier file keeps
+  loading after it
+Files with no such tie are free to move, so js/data scripts are gathered
+into a data bundle and the rest into an app bundle. If a data file needs
+an app script first, the bundles are split at that point instead.
+
+Only the local script tags are replaced: the first one becomes the bundle
+tags and the others are removed, while comments and other markup between
+them stay where they are. Inline or remote <script> tags among the local
+ones would no longer load in the same order, so they are an error.
+
+The original and bundled tag blocks are saved in js/bundles/bundles.json,
+so re-running rebuilds from the original list and --restore puts the
+individual tags back for development. --check reports the bundle plan
+without writing.
+"""
+import hashlib
+import heapq
+import json
+import re
+import sys
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+INDEX_HTML = REPO_DIR / "index.html"
+# Relative to the directory holding index.html
+BUNDLE_DIR = Path("js") / "bundles"
+BUNDLE_MANIFEST = "bundles.json"
+
+BUNDLE_START = '<!-- bundle:start -->'
+BUNDLE_END = '<!-- bundle:end -->'
+
+SCRIPT_RE = re.compile(r'<script\b[^>]*\bsrc="([^"]+)"[^>]*>\s*</script>')
+SCRIPT_OPEN_RE = re.compile(r'<script\b', re.I)
+# Top-level declarations start in column 0 in every file this repo ships
+DECLARATION_RE = re.compile(r'^(?:async\s+)?(const|let|var|class|function\*?)\s+([A-Za-z_$][\w$]*)', re.M)
+REGISTRATION_RE = re.compile(r'\b([A-Z][A-Z0-9_]*)\[[^\]\n]+\]\s*=[^=]')
+IDENTIFIER_RE = re.compile(r'[A-Za-z_$][\w$]*')
+
+# Bundle groups, in preferred load order
+GROUPS = ('data', 'app')
+
+
+class Script:
+    """One local script and the names it declares and uses"""
+
+    def __init__(self, index, src, root):
+        self.index = index
+        self.src = src
+        self.path = src.split('?', 1)[0]
+        self.text = (root / self.path).read_text(encoding='utf-8')
+        self.group = 'data' if self.path.startswith('js/data/') else 'app'
+        self.declares = {}
+        for kind, name in DECLARATION_RE.findall(self.text):
+            self.declares.setdefault(name, kind)
+        self.registers = set(REGISTRATION_RE.findall(self.text)) - set(self.declares)
+        self.uses = set(IDENTIFIER_RE.findall(self.text)) - set(self.declares)
+
+
+def local_scripts(html):
+    """(start, end, src) of every local <script src> tag"""
+    return [(m.start(), m.end(), m.group(1)) for m in SCRIPT_RE.finditer(html)
+            if '://' not in m.group(1) and not m.group(1).startswith('//')]
+
+
+def read_manifest(root):
+    """The saved bundle manifest"""
+    with open(root / BUNDLE_DIR / BUNDLE_MANIFEST, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def source_block(html, root):
+    """The original tag block: from the saved manifest if already bundled
+
+    Raises ValueError if the block holds a script tag that is not local.
+    """
+    if BUNDLE_START in html:
+        return read_manifest(root)['source_block']
+    tags = local_scripts(html)
+    if not tags:
+        return None
+    block = html[line_start(html, tags[0][0]):tags[-1][1]]
+    # Any <script> left once the local tags are cut out is inline or remote
+    residue = block
+    for start, end, _ in reversed(local_scripts(block)):
+        residue = residue[:start] + residue[end:]
+    if SCRIPT_OPEN_RE.search(residue):
+        raise ValueError("index.html has inline or remote <script> tags among its local ones; "
+                         "bundling would change their load order")
+    return block
+
+
+def line_start(html, pos):
+    """Position of the first character of pos's line"""
+    return html.rfind('\n', 0, pos) + 1
+
+
+def tag_span(block, start, end):
+    """(start, end) covering a tag and the spaces after it, or its whole line when nothing else is on it"""
+    first = line_start(block, start)
+    newline = block.find('\n', end)
+    if block[first:start].strip() or block[end:len(block) if newline < 0 else newline].strip():
+        return start, end + len(block[end:]) - len(block[end:].lstrip(' \t'))
+    if newline < 0:
+        # Last line of the block: take the line break before it instead
+        return max(first - 1, 0), len(block)
+    return first, newline + 1
+
+
+def bundled_block(block, replacement):
+    """block with its first local tag replaced and the other local tags removed"""
+    parts = []
+    pos = 0
+    for i, (start, end, _) in enumerate(local_scripts(block)):
+        if i == 0:
+            parts.append(block[pos:line_start(block, start)])
+            parts.append(replacement)
+            pos = end
+        else:
+            start, end = tag_span(block, start, end)
+            parts.append(block[pos:start])
+            pos = end
+    parts.append(block[pos:])
+    return ''.join(parts)
+
+
+def unbundle(html, root):
+    """html with its bundled block swapped back for the original tags
+
+    Raises ValueError if the bundled block was edited since bundling.
+    """
+    manifest = read_manifest(root)
+    bundled = manifest['bundled_block']
+    if bundled not in html:
+        raise ValueError(f"The bundled script block in index.html changed since bundling; "
+                         f"restore it from {BUNDLE_DIR / BUNDLE_MANIFEST} by hand")
+    return html.replace(bundled, manifest['source_block'], 1)
+
+
+def load_order(scripts):
+    """Scripts reordered to gather groups, keeping every dependency.
+
+    Raises ValueError if the dependencies form a cycle.
+    """
+    declared_by = {}
+    for script in scripts:
+        for name in script.declares:
+            declared_by.setdefault(name, script)
+
+    after = {script.index: set() for script in scripts}
+    for script in scripts:
+        for name in script.registers:
+            owner = declared_by.get(name)
+            if owner is not None and owner is not script:
+                after[script.index].add(owner.index)
+        for name in script.uses:
+            owner = declared_by.get(name)
+            if owner is not None and owner.index < script.index:
+                after[script.index].add(owner.index)
+
+    waiting = {index: len(deps) for index, deps in after.items()}
+    dependents = {index: [] for index in after}
+    for index, deps in after.items():
+        for dep in deps:
+            dependents[dep].append(index)
+
+    by_index = {script.index: script for script in scripts}
+    rank = {group: i for i, group in enumerate(GROUPS)}
+    ready = [(rank[by_index[i].group], i) for i, count in waiting.items() if count == 0]
+    heapq.heapify(ready)
+    order = []
+    while ready:
+        _, index = heapq.heappop(ready)
+        order.append(by_index[index])
+        for dependent in dependents[index]:
+            waiting[dependent] -= 1
+            if waiting[dependent] == 0:
+                heapq.heappush(ready, (rank[by_index[dependent].group], dependent))
+
+    if len(order) != len(scripts):
+        stuck = sorted(by_index[i].path for i, count in waiting.items() if count)
+        raise ValueError(f"Circular script dependencies: {', '.join(stuck)}")
+    return order
+
+
+def plan_bundles(order):
+    """Split the load order into runs of one group. Returns [(name, [scripts])]"""
+    runs = []
+    for script in order:
+        if runs and runs[-1][1][0].group == script.group:
+            runs[-1][1].append(script)
+        else:
+            runs.append((script.group, [script]))
+
+    counts = {}
+    bundles = []
+    for group, members in runs:
+        counts[group] = counts.get(group, 0) + 1
+        total = sum(1 for g, _ in runs if g == group)
+        bundles.append((group if total == 1 else f"{group}-{counts[group]}", members))
+    return bundles
+
+
+def check_redeclarations(members):
+    """Raise ValueError if two files in one bundle declare the same lexical name.
+
+    Separate scripts only lose the second file; one bundle would fail whole.
+    """
+    lexical = ('const', 'let', 'class')
+    seen = {}
+    for script in members:
+        for name, kind in script.declares.items():
+            if name in seen and (kind in lexical or seen[name][1] in lexical):
+                raise ValueError(f"{name} is declared by both {seen[name][0]} and {script.path}")
+            seen.setdefault(name, (script.path, kind))
+
+
+def bundle_text(members):
+    """Concatenate scripts, each introduced by its source path"""
+    parts = []
+    for script in members:
+        # Leading ';' guards against a previous file ending mid-expression
+        parts.append(f"// ---- {script.path} ----\n;{script.text.rstrip()}\n")
+    return '\n'.join(parts)
+
+
+def write_bundles(bundles, root):
+    """Write content-hashed bundle files. Returns their paths relative to root"""
+    bundle_dir = root / BUNDLE_DIR
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+    for name, members in bundles:
+        text = bundle_text(members)
+        digest = hashlib.blake2b(text.encode('utf-8'), digest_size=5).hexdigest()
+        path = bundle_dir / f"{name}.{digest}.js"
+        if not path.exists():
+            path.write_text(text, encoding='utf-8')
+        written.append(path.relative_to(root).as_posix())
+
+    # Remove bundles from earlier runs
+    keep = {Path(p).name for p in written}
+    for old in bundle_dir.glob("*.js"):
+        if old.name not in keep:
+            old.unlink()
+    return written
+
+
+def bundle(index_html=INDEX_HTML, check=False):
+    """Bundle index.html's scripts and rewrite it. Returns [(name, [scripts])]"""
+    index_html = Path(index_html)
+    root = index_html.parent
+    html = index_html.read_text(encoding='utf-8')
+    block = source_block(html, root)
+    if block is None:
+        print(f"No local scripts found in {index_html}")
+        return []
+
+    indent = block[:len(block) - len(block.lstrip(' \t'))]
+    scripts = [Script(i, src, root) for i, (_, _, src) in enumerate(local_scripts(block))]
+    bundles = plan_bundles(load_order(scripts))
+    for _, members in bundles:
+        check_redeclarations(members)
+
+    for name, members in bundles:
+        size = sum(len(s.text.encode('utf-8')) for s in members)
+        print(f"{name}: {len(members)} scripts, {size / 1e6:.2f} MB")
+    if check:
+        return bundles
+
+    if BUNDLE_START in html:
+        html = unbundle(html, root)
+    paths = write_bundles(bundles, root)
+    tags = '\n'.join(f'{indent}<script src="{p}"></script>' for p in paths)
+    replacement = f"{indent}{BUNDLE_START}\n{tags}\n{indent}{BUNDLE_END}"
+    new_block = bundled_block(block, replacement)
+    start = html.index(block)
+    html = html[:start] + new_block + html[start + len(block):]
+
+    with open(root / BUNDLE_DIR / BUNDLE_MANIFEST, 'w', encoding='utf-8') as f:
+        json.dump({
+            'source_block': block,
+            'bundled_block': new_block,
+            'bundles': {p: [s.src for s in members] for p, (_, members) in zip(paths, bundles)}
+        }, f, indent=2)
+    index_html.write_text(html, encoding='utf-8')
+    print(f"{len(scripts)} script tags -> {len(paths)} bundles in {index_html}")
+    return bundles
+
+
+def restore(index_html=INDEX_HTML):
+    """Put the original script tags back into index.html"""
+    index_html = Path(index_html)
+    html = index_html.read_text(encoding='utf-8')
+    if BUNDLE_START not in html:
+        print(f"{index_html} is not bundled")
+        return
+    block = read_manifest(index_html.parent)['source_block']
+    html = unbundle(html, index_html.parent)
+    index_html.write_text(html, encoding='utf-8')
+    print(f"Restored {len(local_scripts(block))} script tags in {index_html}")
+
+
+def main():
+    index_html = INDEX_HTML
+    restoring = False
+    check = False
+
+    for arg in sys.argv[1:]:
+        if arg.startswith('--index='):
+            index_html = Path(arg.split('=', 1)[1])
+        elif arg == '--restore':
+            restoring = True
+        elif arg == '--check':
+            check = True
+        else:
+            print(__doc__)
+            sys.exit(1)
+
+    try:
+        if restoring:
+            restore(index_html)
+        else:
+            bundle(index_html, check)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
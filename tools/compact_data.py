@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Compact Data Encoding
+Interned, minified encoding for generated js/data files
+
+encode() turns a converted object into a packed form:
+
+    {"strings": [...], "lists": [[string index, ...], ...],
+     "fields": {key: "s" | "l"}, "data": ...}
+
+A key is interned when every value it holds anywhere in the object is a
+string ("s") or a list of strings ("l") and at least one value repeats.
+Its values in data are replaced by an index into strings or lists. Floats
+are rounded to FLOAT_DIGITS significant digits. to_js() wraps the packed
+form in a decodeCompactData(...) call; js/data/compact-decoder.js restores
+the original object shape when the file loads.
+"""
+import json
+
+# Significant digits kept for floats; the planner displays at most 2 decimals
+FLOAT_DIGITS = 6
+
+# Skip keys whose values are too short to gain anything from an index
+MIN_INTERN_LENGTH = 3
+
+
+def quantize(value, digits=FLOAT_DIGITS):
+    """Round a float to digits significant digits, keeping ints as they are"""
+    if isinstance(value, float):
+        rounded = float(f"{value:.{digits}g}")
+        return int(rounded) if rounded.is_integer() and abs(rounded) < 1e15 else rounded
+    if isinstance(value, list):
+        return [quantize(item, digits) for item in value]
+    if isinstance(value, dict):
+        return {key: quantize(item, digits) for key, item in value.items()}
+    return value
+
+
+def _field_kinds(obj):
+    """{key: (kind, occurrences, distinct values)} for keys that could be interned"""
+    stats = {}
+
+    def visit(value):
+        if isinstance(value, list):
+            for item in value:
+                visit(item)
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                if isinstance(item, str):
+                    kind, hashable = 's', item
+                elif isinstance(item, list) and all(isinstance(v, str) for v in item):
+                    kind, hashable = 'l', tuple(item)
+                else:
+                    kind, hashable = None, None
+                entry = stats.setdefault(key, [kind, 0, set(), 0])
+                if entry[0] != kind:
+                    entry[0] = None
+                if entry[0] is not None:
+                    entry[1] += 1
+                    entry[2].add(hashable)
+                    entry[3] += len(item) if kind == 's' else sum(len(v) for v in item)
+                visit(item)
+
+    visit(obj)
+    fields = {}
+    for key, (kind, count, distinct, chars) in stats.items():
+        if kind is None or count <= len(distinct):
+            continue
+        if chars / count < MIN_INTERN_LENGTH:
+            continue
+        fields[key] = kind
+    return fields
+
+
+def encode(obj, digits=FLOAT_DIGITS):
+    """Packed form of obj; see the module docstring"""
+    obj = quantize(obj, digits)
+    fields = _field_kinds(obj)
+    strings = []
+    string_index = {}
+    lists = []
+    list_index = {}
+
+    def intern_string(value):
+        index = string_index.get(value)
+        if index is None:
+            index = string_index[value] = len(strings)
+            strings.append(value)
+        return index
+
+    def intern_list(value):
+        key = tuple(value)
+        index = list_index.get(key)
+        if index is None:
+            index = list_index[key] = len(lists)
+            lists.append([intern_string(v) for v in value])
+        return index
+
+    def pack(value):
+        if isinstance(value, list):
+            return [pack(item) for item in value]
+        if isinstance(value, dict):
+            packed = {}
+            for key, item in value.items():
+                kind = fields.get(key)
+                if kind == 's':
+                    packed[key] = intern_string(item)
+                elif kind == 'l':
+                    packed[key] = intern_list(item)
+                else:
+                    packed[key] = pack(item)
+            return packed
+        return value
+
+    data = pack(obj)
+    return {'strings': strings, 'lists': lists, 'fields': fields, 'data': data}
+
+
+def to_js(obj, digits=FLOAT_DIGITS):
+    """JavaScript expression that evaluates to obj via decodeCompactData"""
+    packed = json.dumps(encode(obj, digits), separators=(',', ':'), ensure_ascii=False)
+    return f"decodeCompactData({packed})"
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Lore Pet Converter
+Resolves the Lore slot's pets and their attacks into a compact dataset with
+per-tier aggregates
+
+Usage:
+    python convert_lore_pets.py [--raw=<incarnate_raw_dir>] [--output=<js_file>] [--workers=<n>]
+                                [--profile[=<report.json>]]
+    Example: python convert_lore_pets.py --raw=../incarnate_raw_data --output=../js/data/lore-pets.js
+
+Each Lore tier (lore/<faction>_<tier>_ally.json) summons pets through
+Create_Entity templates; an entity such as IncarnatePets_Lore_Banished_LT
+uses the powers of lore_pet_banished_lt. The lore_pet_* folders are
+converted in parallel, one task per folder, following each power's grants
+(power_grants.py). Every pet power gets:
+
+    damage    {table: {type: scale}} per activation, DoTs counted per tick
+    buffs     stat templates that land on the pet or its allies
+    debuffs   stat templates that land on foes
+
+Buffs and debuffs use the baseStats layout of incarnate-power-info.js
+(parse_incarnate_data.sum_stat_templates). Scales on a pet class table
+(Ranged_Damage, ...) are kept with the table name for the browser to look
+up. Each tier then lists its pets and sums damage, buffs and debuffs over
+every power of every pet it summons, as if each fired once.
+
+Writes js/data/lore-pets.js in compact form (compact_data.py) as LORE_PETS:
+
+    {pets: {pet id: {powers: [...]}}, lore: {power: {tier: {pets, damage, buffs, debuffs}}}}
+"""
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import compact_data
+import power_grants
+import profiling
+from build_manifest import write_if_changed
+from convert_powerset import iter_damage_templates
+from effect_rules import DAMAGE_TYPE_MAP
+from parse_incarnate_data import (BASE_PATH, LORE_PET_PREFIX, REPO_DIR, SILENT_SUFFIX, TIER_MAPPINGS,
+                                  power_files, split_tier, sum_stat_templates)
+from raw_loader import fields, load_json
+
+# Bump when the generated output changes so incremental builds redo it
+CONVERTER_VERSION = 2
+
+OUTPUT_NAME = "lore-pets.js"
+OUTPUT_PATH = REPO_DIR / "js" / "data" / OUTPUT_NAME
+
+LORE_FOLDER = 'lore'
+
+# Entity definitions the Lore powers summon: IncarnatePets_Lore_<Faction>_<Role>[_<Variant>]
+ENTITY_PREFIX = 'IncarnatePets_Lore_'
+
+# Full name -> path of every power a pet's grants may reach (set by init_worker)
+_INDEX = {}
+
+# Raw fields read from each pet power; effects are what the grant resolver reads
+INDEX_FIELDS = fields('power_names')
+PET_POWER_FIELDS = fields('full_name', 'display_name', 'target_type', 'activation_time', 'recharge_time',
+                          'endurance_cost', 'range', 'radius', 'effect_area', 'max_targets_hit',
+                          effects=power_grants.GRANT_FIELDS['effects'])
+
+
+def input_folders(raw_dir):
+    """Folders the converter reads: lore, the silent folders and every lore_pet_* folder"""
+    raw_dir = Path(raw_dir)
+    folders = [LORE_FOLDER]
+    folders += sorted(p.name for p in raw_dir.glob("*" + SILENT_SUFFIX) if p.is_dir())
+    folders += sorted(p.name for p in raw_dir.glob(LORE_PET_PREFIX + "*") if p.is_dir())
+    return folders
+
+
+def pet_id(entity_def, pet_ids):
+    """Pet id (lore_pet_* folder suffix) whose powers an entity uses, or None
+
+    Trailing variant words are dropped until a folder matches, trying the
+    singular of the last word too: Banished_Boss_Buff -> banished_boss,
+    Banished_Support_Attacks -> banished_support_attack.
+    """
+    if not entity_def.startswith(ENTITY_PREFIX):
+        return None
+    parts = entity_def[len(ENTITY_PREFIX):].lower().split('_')
+    for n in range(len(parts), 0, -1):
+        name = '_'.join(parts[:n])
+        for candidate in (name, name[:-1] if name.endswith('s') else None):
+            if candidate in pet_ids:
+                return candidate
+    return None
+
+
+def split_damage(templates):
+    """(damage templates, everything else); damage is an Absolute *_Dmg template"""
+    damage, other = [], []
+    for template in templates:
+        if template.get('aspect') == 'Absolute' and DAMAGE_TYPE_MAP.keys() & set(template.get('attribs') or []):
+            damage.append(template)
+        else:
+            other.append(template)
+    return damage, other
+
+
+def sum_damage(templates):
+    """{table: {damage type: scale}} per activation; a DoT counts once per tick"""
+    damage = {}
+    for template, damage_type, ticks in iter_damage_templates(templates):
+        by_type = damage.setdefault(template.get('table', ''), {})
+        value = template.get('scale', 0.0) * template.get('magnitude', 1.0) * max(ticks, 1)
+        by_type[damage_type] = round(by_type.get(damage_type, 0.0) + value, 6)
+    return damage
+
+
+def split_targets(record, templates):
+    """(buff templates, debuff templates) of a power's stat templates"""
+    on_foe = record.get('target_type', '').startswith('Foe')
+    buffs, debuffs = [], []
+    for template in templates:
+        if on_foe and template.get('target') != 'Self':
+            debuffs.append(template)
+        else:
+            buffs.append(template)
+    return buffs, debuffs
+
+
+def power_templates(record, resolver):
+    """(damage, buff, debuff) templates of a pet power, grants followed"""
+    damage, other = split_damage(resolver.templates(record['full_name']))
+    buffs, debuffs = split_targets(record, other)
+    return damage, buffs, debuffs
+
+
+def convert_pet_power(record, resolver):
+    """Planner entry for one pet power"""
+    power = {'name': record.get('display_name', 'Unknown')}
+    for key, field in (('cast', 'activation_time'), ('recharge', 'recharge_time'),
+                       ('endurance', 'endurance_cost'), ('range', 'range'), ('radius', 'radius'),
+                       ('maxTargets', 'max_targets_hit')):
+        if record.get(field, 0) > 0:
+            power[key] = record[field]
+    if record.get('effect_area'):
+        power['effectArea'] = record['effect_area']
+
+    damage, buffs, debuffs = power_templates(record, resolver)
+    for key, value in (('damage', sum_damage(damage)), ('buffs', sum_stat_templates(buffs)),
+                       ('debuffs', sum_stat_templates(debuffs))):
+        if value:
+            power[key] = value
+    return power
+
+
+def pet_records(folder_path):
+    """Power records of a pet folder in the order its index.json lists them"""
+    index_file = Path(folder_path) / "index.json"
+    order = load_json(index_file, INDEX_FIELDS).get('power_names', []) if index_file.exists() else []
+    rank = {name.lower(): i for i, name in enumerate(order)}
+    records = [load_json(path, PET_POWER_FIELDS) for path in power_files(folder_path)]
+    records = [record for record in records if record.get('full_name')]
+    return sorted(records, key=lambda record: rank.get(record['full_name'].lower(), len(rank)))
+
+
+def init_worker(index):
+    """Pool initializer: keep the grant index each worker resolves against"""
+    global _INDEX
+    _INDEX = index
+
+
+def convert_pet(folder_path):
+    """Convert one lore_pet_* folder. Runs in pool workers; returns (pet id, pet, templates)
+
+    templates holds each power's (damage, buff, debuff) templates for the
+    tier aggregates.
+    """
+    with profiling.stage('load'):
+        records = pet_records(folder_path)
+    resolver = power_grants.GrantResolver(dict(_INDEX, **{record['full_name']: record for record in records}))
+    with profiling.stage('extract'):
+        powers = [convert_pet_power(record, resolver) for record in records]
+        templates = [power_templates(record, resolver) for record in records]
+    profiling.count('powers', len(powers))
+    return Path(folder_path).name[len(LORE_PET_PREFIX):], {'powers': powers}, templates
+
+
+def aggregate_tier(summoned, templates):
+    """Tier entry: its pets plus damage, buffs and debuffs summed over all their powers"""
+    damage, buffs, debuffs = [], [], []
+    for pet in summoned:
+        for power_damage, power_buffs, power_debuffs in templates.get(pet, []):
+            damage.extend(power_damage)
+            buffs.extend(power_buffs)
+            debuffs.extend(power_debuffs)
+    tier = {'pets': summoned}
+    for key, value in (('damage', sum_damage(damage)), ('buffs', sum_stat_templates(buffs)),
+                       ('debuffs', sum_stat_templates(debuffs))):
+        if value:
+            tier[key] = value
+    return tier
+
+
+def convert_lore_pets(raw_dir=BASE_PATH, output_path=OUTPUT_PATH, workers=None):
+    """Convert every lore pet and Lore tier and write the dataset. Returns True if the file changed
+
+    Pet folders are converted across a process pool; workers=1 converts
+    them in this process.
+    """
+    raw_dir = Path(raw_dir)
+    with profiling.stage('discover'):
+        index = power_grants.scan_index([raw_dir / folder for folder in input_folders(raw_dir)])
+        pet_folders = [raw_dir / folder for folder in input_folders(raw_dir) if folder.startswith(LORE_PET_PREFIX)]
+    if not pet_folders:
+        raise ValueError(f"No {LORE_PET_PREFIX}* folders found in {raw_dir}")
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(pet_folders)))
+    if workers == 1:
+        init_worker(index)
+        converted = [convert_pet(folder) for folder in pet_folders]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(index,)) as pool:
+            converted = list(pool.map(convert_pet, pet_folders))
+    pets = {pet: data for pet, data, _ in converted}
+    templates = {pet: pet_templates for pet, _, pet_templates in converted}
+    print(f"Converted {len(pets)} pets ({sum(len(pet['powers']) for pet in pets.values())} powers)")
+
+    # Tiers: the pets each Lore power summons
+    resolver = power_grants.GrantResolver(index)
+    sorted_suffixes = sorted(TIER_MAPPINGS[LORE_FOLDER].items(), key=lambda x: len(x[0]), reverse=True)
+    lore = {}
+    unmatched = set()
+    for path in power_files(raw_dir / LORE_FOLDER):
+        record = load_json(path, power_grants.GRANT_FIELDS)
+        power_name, tier = split_tier(Path(path).stem, sorted_suffixes)
+        if not tier or not record.get('full_name'):
+            print(f"Warning: Could not determine tier for {Path(path).name}")
+            continue
+        summoned = []
+        for template in resolver.templates(record['full_name']):
+            if 'Create_Entity' not in (template.get('attribs') or []):
+                continue
+            entity_def = (template.get('params') or {}).get('entity_def') or ''
+            pet = pet_id(entity_def, pets)
+            if pet is None:
+                unmatched.add(entity_def)
+            else:
+                summoned.append(pet)
+        lore.setdefault(power_name, {})[tier] = aggregate_tier(summoned, templates)
+    for entity_def in sorted(unmatched):
+        print(f"Warning: No {LORE_PET_PREFIX}* folder for entity {entity_def}")
+
+    with profiling.stage('emit'):
+        dataset = {
+            'pets': dict(sorted(pets.items())),
+            'lore': {name: dict(sorted(tiers.items())) for name, tiers in sorted(lore.items())}
+        }
+        js_content = f"""/**
+ * City of Heroes: Homecoming - Lore Pets
+ * Lore pets, their powers and per-tier aggregate stats
+ *
+ * Auto-generated from game data
+ * Source: {raw_dir.name}/{LORE_FOLDER}, {raw_dir.name}/{LORE_PET_PREFIX}*
+ */
+
+const LORE_PETS = {compact_data.to_js(dataset)};
+
+// Make available globally
+window.LORE_PETS = LORE_PETS;
+"""
+
+    with profiling.stage('write'):
+        written = write_if_changed(output_path, js_content)
+    if written:
+        profiling.count('bytes_written', len(js_content.encode('utf-8')))
+    else:
+        profiling.count('unchanged')
+
+    print(f"{'Generated' if written else 'Unchanged'} {output_path}")
+    print(f"Lore powers: {len(lore)}, tiers: {sum(len(tiers) for tiers in lore.values())}")
+    return written
+
+
+def main():
+    raw_dir = BASE_PATH
+    output_path = OUTPUT_PATH
+    workers = None
+    profile_path = None
+
+    for arg in sys.argv[1:]:
+        if profiling.profile_arg(arg, 'convert_lore_pets'):
+            profile_path = profiling.profile_arg(arg, 'convert_lore_pets')
+            profiling.start('convert_lore_pets')
+        elif arg.startswith('--raw='):
+            raw_dir = Path(arg.split('=', 1)[1])
+        elif arg.startswith('--output='):
+            output_path = Path(arg.split('=', 1)[1])
+        elif arg.startswith('--workers='):
+            workers = int(arg.split('=', 1)[1])
+        else:
+            print(__doc__)
+            sys.exit(1)
+
+    try:
+        convert_lore_pets(raw_dir, output_path, workers)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    if profile_path:
+        profiling.finish(profile_path)
+
+
+if __name__ == "__main__":
+    main()
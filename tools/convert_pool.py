@@ -3,7 +3,7 @@ City of Heroes: Homecoming - Power Pool Converter
 Extracts and converts power pool data from raw JSON to planner format
 
 Usage:
-    python convert_pool.py <pool_name>
+    python convert_pool.py <pool_name> [--compact] [--cache[=<cache_file>]] [--watch] [--profile[=<report.json>]]
     Example: python convert_pool.py fighting
 
 Input:  C:\Projects\Raw Data Homecoming\powers\pool\{pool_name}\
@@ -15,6 +15,27 @@ import sys
 import os
 from pathlib import Path
 
+import compact_data
+import profiling
+import raw_cache
+from build_manifest import write_if_changed
+from effect_rules import POOL_RULES, apply_pool_templates
+from raw_loader import fields, load_json
+from watch import watch
+
+# Raw fields read by this converter; everything else is dropped at load time
+INDEX_FIELDS = fields('display_name', 'display_help', 'icon', 'requires', 'available_level',
+                      'power_names', 'power_display_names', 'power_short_helps')
+POWER_FIELDS = fields(
+    'display_name', 'display_help', 'display_short_help', 'icon', 'type', 'requires',
+    'max_boosts', 'boosts_allowed', 'allowed_boostset_cats', 'accuracy', 'range',
+    'recharge_time', 'endurance_cost', 'activation_time', 'effect_area', 'radius', 'arc',
+    effects=fields(templates=fields('attribs', 'aspect', 'scale', 'table', 'duration', 'magnitude'))
+)
+
+# Bump when the generated output changes so incremental builds redo it
+CONVERTER_VERSION = 2
+
 # Paths
 RAW_DATA_DIR = Path(r"C:\Projects\Raw Data Homecoming\powers\pool")
 OUTPUT_DIR = Path(r"C:\Projects\CoH-Planner\js\data\pools")
@@ -75,153 +96,10 @@ def extract_effects(power_data, power_name):
 def extract_effect_templates(effect_group, effects, power_name):
     """Extract data from effect templates"""
     templates = effect_group.get('templates', [])
+    profiling.count('templates', len(templates))
     
-    for template in templates:
-        attribs = template.get('attribs', [])
-        aspect = template.get('aspect', '')
-        scale = template.get('scale', 0)
-        table_name = template.get('table', '')
-        duration = template.get('duration', '0 seconds')
-        magnitude = template.get('magnitude', 0)
-        
-        # Damage
-        if aspect == 'Absolute' and any(dmg in a for a in attribs for dmg in ['_Dmg']):
-            if 'damage' not in effects:
-                effects['damage'] = {}
-            
-            for attr in attribs:
-                if '_Dmg' in attr:
-                    dmg_type = attr.replace('_Dmg', '').lower()
-                    if dmg_type == 'special': 
-                        dmg_type = 'special'
-                    elif dmg_type == 'negative_energy':
-                        dmg_type = 'negative'
-                    
-                    effects['damage']['type'] = dmg_type.title()
-                    effects['damage']['scale'] = scale
-                    effects['damage']['table'] = table_name
-                    break
-        
-        # Defense
-        elif aspect == 'Defense' or (aspect == 'Current' and 'Base_Defense' in attribs):
-            if 'defense' not in effects:
-                effects['defense'] = {}
-            
-            # Typed defense
-            defense_types = {
-                'Smashing_Def': 'smashing',
-                'Lethal_Def': 'lethal',
-                'Fire_Def': 'fire',
-                'Cold_Def': 'cold',
-                'Energy_Def': 'energy',
-                'Negative_Energy_Def': 'negative',
-                'Psionic_Def': 'psionic',
-                'Toxic_Def': 'toxic'
-            }
-            
-            for attr in attribs:
-                if attr in defense_types:
-                    def_type = defense_types[attr]
-                    effects['defense'][def_type] = {
-                        'scale': scale,
-                        'table': table_name
-                    }
-                elif attr == 'Base_Defense':
-                    effects['defense']['all'] = {
-                        'scale': scale,
-                        'table': table_name
-                    }
-        
-        # Resistance
-        elif aspect == 'Resistance':
-            if 'resistance' not in effects:
-                effects['resistance'] = {}
-            
-            resistance_types = {
-                'Smashing_Dmg': 'smashing',
-                'Lethal_Dmg': 'lethal',
-                'Fire_Dmg': 'fire',
-                'Cold_Dmg': 'cold',
-                'Energy_Dmg': 'energy',
-                'Negative_Energy_Dmg': 'negative',
-                'Psionic_Dmg': 'psionic',
-                'Toxic_Dmg': 'toxic'
-            }
-            
-            for attr in attribs:
-                if attr in resistance_types:
-                    res_type = resistance_types[attr]
-                    effects['resistance'][res_type] = {
-                        'scale': scale,
-                        'table': table_name
-                    }
-        
-        # Healing
-        elif aspect == 'Absolute' and any('Heal' in a or 'HitPoints' in a for a in attribs):
-            if 'healing' not in effects:
-                effects['healing'] = {}
-            effects['healing']['scale'] = scale
-            effects['healing']['table'] = table_name
-        
-        # Recovery
-        elif 'Recovery' in attribs:
-            if 'recovery' not in effects:
-                effects['recovery'] = {}
-            effects['recovery']['scale'] = scale
-            effects['recovery']['table'] = table_name
-        
-        # Regeneration
-        elif 'Regeneration' in attribs:
-            if 'regeneration' not in effects:
-                effects['regeneration'] = {}
-            effects['regeneration']['scale'] = scale
-            effects['regeneration']['table'] = table_name
-        
-        # Movement speeds
-        elif 'RunningSpeed' in attribs or 'SpeedRunning' in attribs:
-            if 'runSpeed' not in effects:
-                effects['runSpeed'] = {}
-            effects['runSpeed']['scale'] = scale
-            effects['runSpeed']['table'] = table_name
-        
-        elif 'FlyingSpeed' in attribs or 'SpeedFlying' in attribs:
-            if 'flySpeed' not in effects:
-                effects['flySpeed'] = {}
-            effects['flySpeed']['scale'] = scale
-            effects['flySpeed']['table'] = table_name
-        
-        elif 'JumpingSpeed' in attribs or 'JumpSpeed' in attribs:
-            if 'jumpSpeed' not in effects:
-                effects['jumpSpeed'] = {}
-            effects['jumpSpeed']['scale'] = scale
-            effects['jumpSpeed']['table'] = table_name
-        
-        elif 'JumpHeight' in attribs:
-            if 'jumpHeight' not in effects:
-                effects['jumpHeight'] = {}
-            effects['jumpHeight']['scale'] = scale
-            effects['jumpHeight']['table'] = table_name
-        
-        # Mez protection (magnitude-based)
-        elif aspect in ['Cur', 'Current'] and magnitude > 0:
-            mez_types = {
-                'Held': 'hold',
-                'Stunned': 'stun',
-                'Sleep': 'sleep',
-                'Immobilized': 'immobilize',
-                'Terrorized': 'fear',
-                'Confused': 'confuse',
-                'Knockback': 'knockback',
-                'Knockup': 'knockup',
-                'Repel': 'repel'
-            }
-            
-            for attr in attribs:
-                if attr in mez_types:
-                    if 'protection' not in effects:
-                        effects['protection'] = {}
-                    mez_type = mez_types[attr]
-                    effects['protection'][mez_type] = magnitude
+    # Each template takes the first matching rule in the shared rule table
+    apply_pool_templates(POOL_RULES, templates, effects)
 
 def get_allowed_enhancements(power_data):
     """Extract allowed enhancement types"""
@@ -263,9 +141,11 @@ def get_allowed_enhancements(power_data):
     
     return simplified
 
-def convert_pool(pool_name):
-    """Convert a single power pool"""
-    pool_dir = RAW_DATA_DIR / pool_name
+def convert_pool(pool_name, raw_dir=None, output_dir=None, compact=False):
+    """Convert a single power pool; compact writes it interned and minified (compact_data)"""
+    raw_dir = Path(raw_dir) if raw_dir else RAW_DATA_DIR
+    output_dir = Path(output_dir) if output_dir else OUTPUT_DIR
+    pool_dir = raw_dir / pool_name
     index_file = pool_dir / "index.json"
     
     if not index_file.exists():
@@ -277,8 +157,8 @@ def convert_pool(pool_name):
     print(f"{'='*60}")
     
     # Load pool index
-    with open(index_file, 'r', encoding='utf-8') as f:
-        pool_index = json.load(f)
+    with profiling.stage('discover'):
+        pool_index = load_json(index_file, INDEX_FIELDS)
     
     pool_data = {
         'id': pool_name,
@@ -307,12 +187,15 @@ def convert_pool(pool_name):
             print(f"  ⚠ Power file not found: {power_file_name}")
             continue
         
-        with open(power_file, 'r', encoding='utf-8') as f:
-            power_raw = json.load(f)
+        with profiling.stage('load'):
+            power_raw = load_json(power_file, POWER_FIELDS)
         
         display_name = power_display_names[i] if i < len(power_display_names) else power_raw['display_name']
         short_help = power_short_helps[i] if i < len(power_short_helps) else power_raw.get('display_short_help', '')
         
+        with profiling.stage('classify'):
+            effects = extract_effects(power_raw, display_name)
+        
         power = {
             'name': display_name,
             'fullName': full_name,
@@ -326,27 +209,27 @@ def convert_pool(pool_name):
             'maxSlots': power_raw.get('max_boosts', 6),
             'allowedEnhancements': get_allowed_enhancements(power_raw),
             'allowedSetCategories': power_raw.get('allowed_boostset_cats', []),
-            'effects': extract_effects(power_raw, display_name)
+            'effects': effects
         }
         
         pool_data['powers'].append(power)
         print(f"  [OK] {display_name} (Rank {power['rank']})")
     
-    # Create output directory
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    
     # Generate JavaScript file
-    output_file = OUTPUT_DIR / f"{pool_name}.js"
+    output_file = output_dir / f"{pool_name}.js"
+    
+    with profiling.stage('emit'):
+        pool_json = compact_data.to_js(pool_data) if compact else json.dumps(pool_data, indent=2)
     
     js_content = f"""/**
  * City of Heroes: Homecoming - Power Pool
  * Pool: {pool_data['name']}
  * 
  * Auto-generated from game data
- * Source: {pool_dir}
+ * Source: {raw_dir.parent.name}/{raw_dir.name}/{pool_name}
  */
 
-const POOL_{pool_name.upper().replace('-', '_')} = {json.dumps(pool_data, indent=2)};
+const POOL_{pool_name.upper().replace('-', '_')} = {pool_json};
 
 // Register pool
 if (typeof POWER_POOLS !== 'undefined') {{
@@ -356,17 +239,21 @@ if (typeof POWER_POOLS !== 'undefined') {{
 }}
 """
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(js_content)
+    with profiling.stage('write'):
+        written = write_if_changed(output_file, js_content)
+    if written:
+        profiling.count('bytes_written', len(js_content.encode('utf-8')))
+    else:
+        profiling.count('unchanged')
     
-    print(f"\n[SUCCESS] Converted to: {output_file}")
+    print(f"\n[SUCCESS] Converted to: {output_file}{'' if written else ' (unchanged)'}")
     print(f"  Powers: {len(pool_data['powers'])}")
     
-    return True
+    return output_file
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python convert_pool.py <pool_name>")
+        print("Usage: python convert_pool.py <pool_name> [--compact] [--cache[=<cache_file>]] [--watch] [--profile[=<report.json>]]")
         print("\nAvailable pools:")
         print("  experimentation, fighting, fitness, flight, force_of_will,")
         print("  gadgetry, invisibility, leadership, leaping, manipulation,")
@@ -374,12 +261,33 @@ def main():
         return
     
     pool_name = sys.argv[1].lower().replace(' ', '_')
+    cache = None
+    watching = False
+    compact = False
+    profile_path = None
+    for arg in sys.argv[2:]:
+        if profiling.profile_arg(arg, 'convert_pool'):
+            profile_path = profiling.profile_arg(arg, 'convert_pool')
+            profiling.start('convert_pool')
+        elif raw_cache.cache_arg(arg):
+            cache = raw_cache.enable(raw_cache.cache_arg(arg))
+        elif arg == '--watch':
+            watching = True
+        elif arg == '--compact':
+            compact = True
     
     print("City of Heroes: Homecoming - Pool Power Converter")
     print("="*60)
     
     # Convert pool
-    success = convert_pool(pool_name)
+    success = convert_pool(pool_name, compact=compact)
+    if success and watching:
+        # A pool is a handful of powers, so any change reconverts the whole pool
+        watch([RAW_DATA_DIR / pool_name], lambda changed, removed: convert_pool(pool_name, compact=compact))
+    if profile_path:
+        profiling.finish(profile_path)
+    if cache:
+        raw_cache.disable(cache)
     
     if success:
         print("\n" + "="*60)
@@ -6,10 +6,42 @@ Compatible with the CoH Planner architecture
 """
 import json
 import sys
+from itertools import chain
 from pathlib import Path
 
-# Global archetype modifier tables cache
-ARCHETYPE_TABLES = {}
+import compact_data
+import level_columns
+import powerset_deltas
+import profiling
+import raw_cache
+from archetype_tables import MAX_LEVEL, get_store
+from build_manifest import write_tokens_if_changed
+from effect_rules import (DAMAGE_ATTRS, DAMAGE_TYPE_MAP, DEBUFF_RESISTANCE_ATTRS, MEZ_ATTRS,
+                          POWERSET_RULES, TYPED_DAMAGE_TYPES)
+from raw_loader import fields, load_json
+from watch import watch
+
+# Bump when the generated output changes so incremental builds redo it
+CONVERTER_VERSION = 2
+
+# Pass as the level to compute one value per level (1..MAX_LEVEL)
+ALL_LEVELS = 'all'
+
+# Powerset category written to every file (not known from the raw data)
+CATEGORY = "Unknown"
+
+COMPACT_NOTE = "Compact encoding: decoded by decodeCompactData (js/data/compact-decoder.js)"
+
+# Raw fields read by convert_power; everything else is dropped at load time
+TEMPLATE_FIELDS = fields('attribs', 'aspect', 'target', 'table', 'scale', 'duration',
+                         'magnitude', 'type', 'stack', 'application_period')
+POWER_FIELDS = fields(
+    'name', 'display_name', 'display_help', 'display_short_help', 'icon', 'type',
+    'available_level', 'max_boosts', 'boosts_allowed', 'allowed_boostset_cats',
+    'target_type', 'effect_area', 'max_targets_hit', 'arc', 'accuracy', 'range',
+    'recharge_time', 'endurance_cost', 'activation_time', 'archetypes',
+    effects=fields(templates=TEMPLATE_FIELDS)
+)
 
 # Map raw boost types to our enhancement categories
 BOOST_MAP = {
@@ -33,109 +65,133 @@ BOOST_MAP = {
     "Reduce Interrupt Time": "InterruptReduction"
 }
 
+# Extractors effect_rules.POWERSET_RULES routes templates to
+EXTRACTORS = ('damage', 'protection', 'typed', 'debuffResistance', 'healing', 'debuffs')
+
+def iter_templates(effects):
+    """Yield every effect template in document order"""
+    for effect in effects:
+        if 'templates' in effect:
+            yield from effect['templates']
+
+def classify_templates(effects):
+    """Visit every template once and route it to each extractor that uses it.
+
+    Returns a dict of extractor name -> templates in document order.
+    Healing keeps effect-group boundaries (a list of template lists) since
+    only the first heal in each group counts.
+    """
+    routed = {name: [] for name in EXTRACTORS}
+    rules = POWERSET_RULES
+    cache = rules.route_cache
+
+    for effect in effects:
+        if 'templates' not in effect:
+            continue
+        profiling.count('templates', len(effect['templates']))
+
+        heal_group = None
+        for template in effect['templates']:
+            aspect = template.get('aspect', '')
+            target = template.get('target', '')
+            names = set()
+            for attr in template.get('attribs', []):
+                routes = cache.get((aspect, target, attr))
+                if routes is None:
+                    routes = rules.resolve_routes(aspect, target, attr)
+                names.update(routes)
+
+            # Buff/debuff durations come from any timed template
+            if template.get('duration', '0 seconds') != '0 seconds':
+                names.add('debuffs')
+
+            for name in names:
+                if name == 'healing':
+                    if heal_group is None:
+                        heal_group = []
+                        routed['healing'].append(heal_group)
+                    heal_group.append(template)
+                else:
+                    routed[name].append(template)
+
+    return routed
+
 def load_archetype_tables(tables_dir, archetype):
     """Load archetype modifier tables from the tables directory"""
-    global ARCHETYPE_TABLES
-    
-    # Use cached if already loaded
-    if archetype in ARCHETYPE_TABLES:
-        return ARCHETYPE_TABLES[archetype]
-    
-    tables_path = Path(tables_dir)
-    archetype_file = tables_path / f"{archetype}.json"
-    
-    if not archetype_file.exists():
-        print(f"Warning: Archetype table not found: {archetype_file}")
-        return None
-    
-    try:
-        with open(archetype_file, 'r', encoding='utf-8') as f:
-            tables_data = json.load(f)
-            ARCHETYPE_TABLES[archetype] = tables_data.get('named_tables', {})
-            return ARCHETYPE_TABLES[archetype]
-    except Exception as e:
-        print(f"Error loading archetype tables: {e}")
-        return None
+    return get_store(tables_dir).archetype(archetype)
 
 def apply_archetype_modifier(scale, table_name, archetype, level, tables_dir):
     """Apply archetype modifier to a scale value"""
     if not archetype or not table_name:
         return scale
     
-    # Load tables if needed
-    tables = load_archetype_tables(tables_dir, archetype)
-    if not tables:
+    # Case-insensitive, clamped lookup in the shared table store
+    # Missing tables like "Melee_Ones" are just 1.0 multipliers anyway
+    modifier = get_store(tables_dir).lookup(archetype, table_name, level)
+    if modifier is None:
         return scale
     
-    # Get the specific modifier table (case-insensitive lookup)
-    modifier_table = None
-    table_name_lower = table_name.lower()
-    for key, value in tables.items():
-        if key.lower() == table_name_lower:
-            modifier_table = value
-            break
-    
-    if not modifier_table:
-        # Silently return scale without modifier if table not found
-        # (Many tables like "Melee_Ones" are just 1.0 multipliers anyway)
-        return scale
-    
-    # Index into table (0-indexed, so level-1)
-    # Clamp level to valid range
-    level_idx = max(0, min(len(modifier_table) - 1, level - 1))
-    modifier = modifier_table[level_idx]
-    
     # Apply modifier
     return scale * modifier
 
+def scale_value(scale, table_name, archetype, level, tables_dir):
+    """Archetype-scaled value at one level, or a per-level vector for ALL_LEVELS"""
+    if level == ALL_LEVELS:
+        if table_name and archetype:
+            return get_store(tables_dir).scaled(archetype, table_name, scale)
+        return [scale] * MAX_LEVEL
+    if table_name and archetype:
+        return apply_archetype_modifier(scale, table_name, archetype, level, tables_dir)
+    return scale
+
+def _vmax(a, b):
+    """max() that also works elementwise on per-level vectors"""
+    if isinstance(a, (int, float)):
+        return max(a, b)
+    return [max(x, y) for x, y in zip(a, b)]
+
+def _vabs(value):
+    """abs() that also works elementwise on per-level vectors"""
+    if isinstance(value, (int, float)):
+        return abs(value)
+    return [abs(x) for x in value]
+
+def _level_list(value):
+    """Plain list of Python floats for a per-level vector"""
+    return [float(x) for x in value]
+
 def extract_mez_protection(effects, archetype, level, tables_dir):
     """Extract mez protection information with archetype modifiers applied"""
     if not effects:
         return None
-    
+    return collect_mez_protection(iter_templates(effects), archetype, level, tables_dir)
+
+def collect_mez_protection(templates, archetype, level, tables_dir):
+    """Mez protection from an iterable of templates"""
     protection = {}
     
-    # Mez attribute mapping
-    mez_attrs = {
-        'Held': 'hold',
-        'Stunned': 'stun',
-        'Sleep': 'sleep',
-        'Immobilized': 'immobilize',
-        'Terrorized': 'fear',
-        'Confused': 'confuse'
-    }
-    
-    for effect in effects:
-        if 'templates' not in effect:
-            continue
+    for template in templates:
+        aspect = template.get('aspect', '')
+        target = template.get('target', '')
         
-        for template in effect['templates']:
-            aspect = template.get('aspect', '')
-            target = template.get('target', '')
+        # Look for mez protection (negative magnitude on self)
+        if aspect == 'Current' and target == 'Self':
+            attribs = template.get('attribs', [])
+            scale = template.get('scale', 0.0)
+            table_name = template.get('table', '')
             
-            # Look for mez protection (negative magnitude on self)
-            if aspect == 'Current' and target == 'Self':
-                attribs = template.get('attribs', [])
-                scale = template.get('scale', 0.0)
-                table_name = template.get('table', '')
-                
-                # Must have a negative scale for protection
-                if scale >= 0:
-                    continue
-                
-                # Apply archetype modifier if we have a table
-                if table_name and archetype:
-                    final_magnitude = apply_archetype_modifier(
-                        scale, table_name, archetype, level, tables_dir
-                    )
-                else:
-                    final_magnitude = scale
-                
-                # Extract protections
-                for attr, prot_name in mez_attrs.items():
-                    if attr in attribs:
-                        # Store as positive magnitude (remove negative sign)
-                        protection[prot_name] = abs(final_magnitude)
+            # Must have a negative scale for protection
+            if scale >= 0:
+                continue
+            
+            # Apply archetype modifier (per-level vector for ALL_LEVELS)
+            final_magnitude = scale_value(scale, table_name, archetype, level, tables_dir)
+            
+            # Extract protections
+            for attr, prot_name in MEZ_ATTRS.items():
+                if attr in attribs:
+                    # Store as positive magnitude (remove negative sign)
+                    protection[prot_name] = _vabs(final_magnitude)
     
     return protection if protection else None
 
@@ -143,80 +199,52 @@ def extract_typed_defense(effects, archetype, level, tables_dir):
     """Extract typed defense/resistance with archetype modifiers"""
     if not effects:
         return None
+    return collect_typed_defense(iter_templates(effects), archetype, level, tables_dir)
 
+def collect_typed_defense(templates, archetype, level, tables_dir):
+    """Typed defense/resistance from an iterable of templates"""
     typed_defense = {}
     typed_resistance = {}
 
-    # Damage type mapping
-    damage_types = {
-        'Smashing': 'smashing',
-        'Lethal': 'lethal',
-        'Fire': 'fire',
-        'Cold': 'cold',
-        'Energy': 'energy',
-        'Negative_Energy': 'negative',
-        'NegativeEnergy': 'negative',
-        'Psionic': 'psionic',
-        'Toxic': 'toxic',
-        # Also check _Dmg variants for resistance
-        'Smashing_Dmg': 'smashing',
-        'Lethal_Dmg': 'lethal',
-        'Fire_Dmg': 'fire',
-        'Cold_Dmg': 'cold',
-        'Energy_Dmg': 'energy',
-        'Negative_Energy_Dmg': 'negative',
-        'Psionic_Dmg': 'psionic',
-        'Toxic_Dmg': 'toxic'
-    }
+    for template in templates:
+        aspect = template.get('aspect', '')
+        temp_type = template.get('type', '')
+        target = template.get('target', '')
+        attribs = template.get('attribs', [])
+        scale = template.get('scale', 0.0)
+        table_name = template.get('table', '')
 
-    for effect in effects:
-        if 'templates' not in effect:
+        # Skip if not self-targeted
+        if target != 'Self':
             continue
 
-        for template in effect['templates']:
-            aspect = template.get('aspect', '')
-            temp_type = template.get('type', '')
-            target = template.get('target', '')
-            attribs = template.get('attribs', [])
-            scale = template.get('scale', 0.0)
-            table_name = template.get('table', '')
+        # Apply archetype modifier (per-level vector for ALL_LEVELS)
+        final_value = scale_value(scale, table_name, archetype, level, tables_dir)
 
-            # Skip if not self-targeted
-            if target != 'Self':
-                continue
+        # Defense (type=Magnitude, aspect=Current)
+        # Defense buffs typically have type=Magnitude targeting specific damage types
+        # Check for Buff_Def tables which indicate defense buffs
+        is_defense_buff = ('Buff_Def' in table_name or 'buff_def' in table_name.lower())
+        if is_defense_buff and temp_type == 'Magnitude' and aspect == 'Current':
+            for attr in attribs:
+                if attr in TYPED_DAMAGE_TYPES:
+                    dmg_type = TYPED_DAMAGE_TYPES[attr]
+                    # Aggregate if multiple templates provide same type
+                    if dmg_type in typed_defense:
+                        typed_defense[dmg_type] = _vmax(typed_defense[dmg_type], final_value)
+                    else:
+                        typed_defense[dmg_type] = final_value
 
-            # Apply archetype modifier if applicable
-            if table_name and archetype:
-                final_value = apply_archetype_modifier(
-                    scale, table_name, archetype, level, tables_dir
-                )
-            else:
-                final_value = scale
-
-            # Defense (type=Magnitude, aspect=Current)
-            # Defense buffs typically have type=Magnitude targeting specific damage types
-            # Check for Buff_Def tables which indicate defense buffs
-            is_defense_buff = ('Buff_Def' in table_name or 'buff_def' in table_name.lower())
-            if is_defense_buff and temp_type == 'Magnitude' and aspect == 'Current':
-                for attr in attribs:
-                    if attr in damage_types:
-                        dmg_type = damage_types[attr]
-                        # Aggregate if multiple templates provide same type
-                        if dmg_type in typed_defense:
-                            typed_defense[dmg_type] = max(typed_defense[dmg_type], final_value)
-                        else:
-                            typed_defense[dmg_type] = final_value
-
-            # Resistance (aspect=Resistance)
-            if aspect == 'Resistance':
-                for attr in attribs:
-                    if attr in damage_types:
-                        dmg_type = damage_types[attr]
-                        # Aggregate if multiple templates provide same type
-                        if dmg_type in typed_resistance:
-                            typed_resistance[dmg_type] = max(typed_resistance[dmg_type], final_value)
-                        else:
-                            typed_resistance[dmg_type] = final_value
+        # Resistance (aspect=Resistance)
+        if aspect == 'Resistance':
+            for attr in attribs:
+                if attr in TYPED_DAMAGE_TYPES:
+                    dmg_type = TYPED_DAMAGE_TYPES[attr]
+                    # Aggregate if multiple templates provide same type
+                    if dmg_type in typed_resistance:
+                        typed_resistance[dmg_type] = _vmax(typed_resistance[dmg_type], final_value)
+                    else:
+                        typed_resistance[dmg_type] = final_value
 
     result = {}
     if typed_defense:
@@ -230,74 +258,42 @@ def extract_debuff_resistance(effects, archetype, level, tables_dir):
     """Extract resistance to debuffs (not damage resistance)"""
     if not effects:
         return None
-    
+    return collect_debuff_resistance(iter_templates(effects), archetype, level, tables_dir)
+
+def collect_debuff_resistance(templates, archetype, level, tables_dir):
+    """Debuff resistance from an iterable of templates"""
     debuff_res = {}
     
-    # Map attribute names to debuff resistance types
-    debuff_attrs = {
-        'ToHit': 'tohit',
-        'Base_Defense': 'defense',
-        'Defense': 'defense',
-        'RechargeTime': 'recharge',
-        'Recharge': 'recharge',
-        'RunningSpeed': 'movement',
-        'FlyingSpeed': 'movement',
-        'JumpingSpeed': 'movement',
-        'JumpHeight': 'movement',
-        'Regeneration': 'regeneration',
-        'Recovery': 'recovery',
-        'Endurance': 'endurance',
-        'MaxEndurance': 'endurance',
-        'Heal': 'healing',
-        'Damage': 'damage'
-    }
-    
-    # Damage type attributes (NOT debuff resistance)
-    damage_attrs = {'Smashing_Dmg', 'Lethal_Dmg', 'Fire_Dmg', 'Cold_Dmg', 
-                    'Energy_Dmg', 'Negative_Energy_Dmg', 'Psionic_Dmg', 'Toxic_Dmg'}
-    
-    # Mez attributes (handled by mez protection extraction)
-    mez_attrs = {'Held', 'Stunned', 'Sleep', 'Immobilized', 'Terrorized', 'Confused'}
-    
-    for effect in effects:
-        if 'templates' not in effect:
+    for template in templates:
+        aspect = template.get('aspect', '')
+        target = template.get('target', '')
+        attribs = template.get('attribs', [])
+        scale = template.get('scale', 0.0)
+        table_name = template.get('table', '')
+        
+        # Must be resistance aspect on self with positive scale
+        if aspect != 'Resistance' or target != 'Self' or scale <= 0:
             continue
         
-        for template in effect['templates']:
-            aspect = template.get('aspect', '')
-            target = template.get('target', '')
-            attribs = template.get('attribs', [])
-            scale = template.get('scale', 0.0)
-            table_name = template.get('table', '')
-            
-            # Must be resistance aspect on self with positive scale
-            if aspect != 'Resistance' or target != 'Self' or scale <= 0:
-                continue
-            
-            # Skip if it's damage resistance
-            if any(attr in damage_attrs for attr in attribs):
-                continue
-            
-            # Skip if it's mez resistance (already handled by protection)
-            if any(attr in mez_attrs for attr in attribs):
-                continue
-            
-            # Apply archetype modifier if available
-            if table_name and archetype:
-                final_value = apply_archetype_modifier(
-                    scale, table_name, archetype, level, tables_dir
-                )
-            else:
-                final_value = scale
-            
-            # Extract debuff resistances
-            for attr, res_type in debuff_attrs.items():
-                if attr in attribs:
-                    # Aggregate if we see the same type multiple times
-                    if res_type in debuff_res:
-                        debuff_res[res_type] = max(debuff_res[res_type], final_value)
-                    else:
-                        debuff_res[res_type] = final_value
+        # Skip if it's damage resistance
+        if any(attr in DAMAGE_ATTRS for attr in attribs):
+            continue
+        
+        # Skip if it's mez resistance (already handled by protection)
+        if any(attr in MEZ_ATTRS for attr in attribs):
+            continue
+        
+        # Apply archetype modifier (per-level vector for ALL_LEVELS)
+        final_value = scale_value(scale, table_name, archetype, level, tables_dir)
+        
+        # Extract debuff resistances
+        for attr, res_type in DEBUFF_RESISTANCE_ATTRS.items():
+            if attr in attribs:
+                # Aggregate if we see the same type multiple times
+                if res_type in debuff_res:
+                    debuff_res[res_type] = _vmax(debuff_res[res_type], final_value)
+                else:
+                    debuff_res[res_type] = final_value
     
     return debuff_res if debuff_res else None
 
@@ -305,37 +301,33 @@ def extract_healing(effects, archetype, level, tables_dir):
     """Extract healing information with archetype modifiers"""
     if not effects:
         return None
-    
+    groups = [effect['templates'] for effect in effects if 'templates' in effect]
+    return collect_healing(groups, archetype, level, tables_dir)
+
+def collect_healing(template_groups, archetype, level, tables_dir):
+    """Healing from per-effect-group template lists"""
     healing_info = {}
     
-    for effect in effects:
-        if 'templates' not in effect:
-            continue
-        
-        for template in effect['templates']:
+    for templates in template_groups:
+        for template in templates:
             aspect = template.get('aspect', '')
             target = template.get('target', '')
             attribs = template.get('attribs', [])
             scale = template.get('scale', 0.0)
             table_name = template.get('table', '')
             stack_type = template.get('stack', '')
-            
+        
             # Look for healing (Absolute aspect on Self with Heal_Dmg attribute)
             if aspect == 'Absolute' and target == 'Self' and 'Heal_Dmg' in attribs:
-                # Apply archetype modifier if available
-                if table_name and archetype:
-                    final_value = apply_archetype_modifier(
-                        scale, table_name, archetype, level, tables_dir
-                    )
-                else:
-                    final_value = scale
-                
+                # Apply archetype modifier (per-level vector for ALL_LEVELS)
+                final_value = scale_value(scale, table_name, archetype, level, tables_dir)
+            
                 healing_info['scale'] = final_value
-                
+            
                 # Check if it stacks (per-target healing like Dark Regeneration)
                 if stack_type == 'Stack':
                     healing_info['perTarget'] = True
-                
+            
                 break
     
     return healing_info if healing_info else None
@@ -344,72 +336,74 @@ def extract_damage_info(effects):
     """Extract all damage info including types, scales, and DoTs"""
     if not effects:
         return None
-    
+    return collect_damage_info(iter_templates(effects))
+
+def dot_ticks(template):
+    """Ticks of a template: 0 when it applies once, None for a DoT too short to tick"""
+    duration = template.get('duration', '0 seconds')
+    if duration == '0 seconds':
+        return 0
+    try:
+        dur_value = float(duration.split()[0])
+        app_period = template.get('application_period', 2.0)
+        if app_period <= 0:
+            app_period = 2.0
+        ticks = int(dur_value / app_period) if dur_value > 0 else 0
+    except (ValueError, TypeError, IndexError, AttributeError):
+        return None
+    return ticks if ticks > 0 else None
+
+def iter_damage_templates(templates):
+    """Yield (template, damage_type, ticks) for every damage entry.
+
+    ticks is 0 for instant damage and the tick count for DoTs.
+    """
+    for template in templates:
+        attribs = template.get('attribs', [])
+        scale = template.get('scale', 0.0)
+        target = template.get('target', '')
+        aspect = template.get('aspect', '')
+        
+        if scale <= 0:
+            continue
+        
+        # Skip self-buffs
+        if target == 'Self' and aspect == 'Strength':
+            continue
+        
+        # Skip if this has ALL damage types (procs)
+        dmg_count = len([a for a in attribs if '_Dmg' in a])
+        if dmg_count >= 7:
+            continue
+        
+        for attr_name, damage_type in DAMAGE_TYPE_MAP.items():
+            if attr_name in attribs:
+                ticks = dot_ticks(template)
+                if ticks is not None:
+                    yield template, damage_type, ticks
+
+def collect_damage_info(templates):
+    """Damage info from an iterable of templates"""
     damage_info = {}
     
-    # Map attribute names to damage types
-    damage_type_map = {
-        'Smashing_Dmg': 'Smashing',
-        'Lethal_Dmg': 'Lethal',
-        'Fire_Dmg': 'Fire',
-        'Cold_Dmg': 'Cold',
-        'Energy_Dmg': 'Energy',
-        'Negative_Energy_Dmg': 'Negative',
-        'Psionic_Dmg': 'Psionic',
-        'Toxic_Dmg': 'Toxic'
-    }
-    
     # Aggregate damage by type
     instant_damage_by_type = {}
     dot_damage_by_type = {}
     
-    for effect in effects:
-        if 'templates' in effect:
-            for template in effect['templates']:
-                attribs = template.get('attribs', [])
-                scale = template.get('scale', 0.0)
-                duration = template.get('duration', '0 seconds')
-                target = template.get('target', '')
-                aspect = template.get('aspect', '')
-                
-                if scale <= 0:
-                    continue
-                
-                # Skip self-buffs
-                if target == 'Self' and aspect == 'Strength':
-                    continue
-                
-                # Skip if this has ALL damage types (procs)
-                dmg_count = len([a for a in attribs if '_Dmg' in a])
-                if dmg_count >= 7:
-                    continue
-                
-                for attr_name, damage_type in damage_type_map.items():
-                    if attr_name in attribs:
-                        if duration == '0 seconds':
-                            # Instant damage
-                            if damage_type in instant_damage_by_type:
-                                instant_damage_by_type[damage_type] += scale
-                            else:
-                                instant_damage_by_type[damage_type] = scale
-                        else:
-                            # DoT
-                            try:
-                                dur_value = float(duration.split()[0])
-                                app_period = template.get('application_period', 2.0)
-                                if app_period <= 0:
-                                    app_period = 2.0
-                                ticks = int(dur_value / app_period) if dur_value > 0 else 0
-                                if ticks > 0:
-                                    if damage_type in dot_damage_by_type:
-                                        dot_damage_by_type[damage_type]['scale'] += scale
-                                    else:
-                                        dot_damage_by_type[damage_type] = {
-                                            'scale': scale,
-                                            'ticks': ticks
-                                        }
-                            except:
-                                pass
+    for template, damage_type, ticks in iter_damage_templates(templates):
+        scale = template['scale']
+        if not ticks:
+            if damage_type in instant_damage_by_type:
+                instant_damage_by_type[damage_type] += scale
+            else:
+                instant_damage_by_type[damage_type] = scale
+        elif damage_type in dot_damage_by_type:
+            dot_damage_by_type[damage_type]['scale'] += scale
+        else:
+            dot_damage_by_type[damage_type] = {
+                'scale': scale,
+                'ticks': ticks
+            }
     
     # Process instant damage
     if instant_damage_by_type:
@@ -446,66 +440,122 @@ def extract_damage_info(effects):
     
     return damage_info if damage_info else None
 
+def collect_damage_levels(templates, archetype, tables_dir):
+    """(instant, DoT) damage per type for every level (scale x damage table)
+
+    DoT values are per tick, like effects.dotDamage; its ticks apply.
+    """
+    instant_by_type = {}
+    dot_by_type = {}
+    
+    for template, damage_type, ticks in iter_damage_templates(templates):
+        damage_by_type = dot_by_type if ticks else instant_by_type
+        values = scale_value(template['scale'], template.get('table', ''),
+                             archetype, ALL_LEVELS, tables_dir)
+        if damage_type in damage_by_type:
+            damage_by_type[damage_type] = [a + b for a, b in zip(damage_by_type[damage_type], values)]
+        else:
+            damage_by_type[damage_type] = values
+    
+    return instant_by_type or None, dot_by_type or None
+
+def collect_level_values(routed, archetype, tables_dir):
+    """Every table-scaled value as per-level arrays (index 0 = level 1)"""
+    per_level = {}
+    
+    damage, dot_damage = collect_damage_levels(routed['damage'], archetype, tables_dir)
+    if damage:
+        per_level['damage'] = damage
+    if dot_damage:
+        per_level['dotDamage'] = dot_damage
+    
+    protection = collect_mez_protection(routed['protection'], archetype, ALL_LEVELS, tables_dir)
+    if protection:
+        per_level['protection'] = protection
+    
+    typed_stats = collect_typed_defense(routed['typed'], archetype, ALL_LEVELS, tables_dir)
+    if typed_stats:
+        per_level.update(typed_stats)
+    
+    debuff_res = collect_debuff_resistance(routed['debuffResistance'], archetype, ALL_LEVELS, tables_dir)
+    if debuff_res:
+        per_level['debuffResistance'] = debuff_res
+    
+    healing_info = collect_healing(routed['healing'], archetype, ALL_LEVELS, tables_dir)
+    if healing_info:
+        per_level['healing'] = healing_info['scale']
+    
+    # Normalise vectors (list or NumPy) to plain float lists
+    for key, value in per_level.items():
+        if isinstance(value, dict):
+            per_level[key] = {k: _level_list(v) for k, v in value.items()}
+        else:
+            per_level[key] = _level_list(value)
+    
+    return per_level if per_level else None
+
 def extract_debuffs(effects, target_type='Foe'):
     """Extract debuff and buff information"""
-    stats = {}
     if not effects:
         return None
+    return collect_debuffs(iter_templates(effects), target_type)
+
+def collect_debuffs(templates, target_type='Foe'):
+    """Debuff and buff stats from an iterable of templates"""
+    stats = {}
     
-    for effect in effects:
-        if 'templates' in effect:
-            for template in effect['templates']:
-                attribs = template.get('attribs', [])
-                duration = template.get('duration', '0 seconds')
-                scale = template.get('scale', 0.0)
-                magnitude = template.get('magnitude', 0.0)
-                table = template.get('table', '')
-                
-                # Determine buff vs debuff
-                is_debuff_table = 'Debuff' in table or 'DeBuff' in table
-                is_buff_table = 'Buff' in table
-                
-                if not is_debuff_table and not is_buff_table:
-                    is_debuff_table = (target_type == 'Foe')
-                    is_buff_table = (target_type in ['Self', 'Friend', 'Ally'])
-                
-                # ToHit buff/debuff
-                if 'ToHit' in attribs and duration != '0 seconds':
-                    if is_debuff_table:
-                        stats['tohitDebuff'] = abs(scale)
-                    elif is_buff_table:
-                        stats['tohitBuff'] = abs(scale)
-
-                # Defense buff/debuff - SKIP, handled by extract_typed_defense()
-                # Defense buffs are extracted with proper damage type breakdown
-                # in extract_typed_defense() function instead of as a single value
-
-                # Damage buff/debuff
-                if 'Damage' in attribs and duration != '0 seconds':
-                    if is_debuff_table:
-                        stats['damageDebuff'] = abs(scale)
-                    elif is_buff_table:
-                        stats['damageBuff'] = abs(scale)
-                
-                # Stun (magnitude-based)
-                if 'Stunned' in attribs or any('Stun' in a for a in attribs):
-                    if magnitude > 0:
-                        stats['stun'] = magnitude
-                        try:
-                            dur_value = float(duration.split()[0])
-                            if dur_value > 0:
-                                stats['stunDuration'] = dur_value
-                        except:
-                            pass
-                
-                # Duration
-                if duration != '0 seconds' and (scale != 0 or magnitude != 0):
-                    try:
-                        dur_value = float(duration.split()[0])
-                        if dur_value > 0 and 'buffDuration' not in stats:
-                            stats['buffDuration'] = dur_value
-                    except:
-                        pass
+    for template in templates:
+        attribs = template.get('attribs', [])
+        duration = template.get('duration', '0 seconds')
+        scale = template.get('scale', 0.0)
+        magnitude = template.get('magnitude', 0.0)
+        table = template.get('table', '')
+        
+        # Determine buff vs debuff
+        is_debuff_table = 'Debuff' in table or 'DeBuff' in table
+        is_buff_table = 'Buff' in table
+        
+        if not is_debuff_table and not is_buff_table:
+            is_debuff_table = (target_type == 'Foe')
+            is_buff_table = (target_type in ['Self', 'Friend', 'Ally'])
+        
+        # ToHit buff/debuff
+        if 'ToHit' in attribs and duration != '0 seconds':
+            if is_debuff_table:
+                stats['tohitDebuff'] = abs(scale)
+            elif is_buff_table:
+                stats['tohitBuff'] = abs(scale)
+
+        # Defense buff/debuff - SKIP, handled by extract_typed_defense()
+        # Defense buffs are extracted with proper damage type breakdown
+        # in extract_typed_defense() function instead of as a single value
+
+        # Damage buff/debuff
+        if 'Damage' in attribs and duration != '0 seconds':
+            if is_debuff_table:
+                stats['damageDebuff'] = abs(scale)
+            elif is_buff_table:
+                stats['damageBuff'] = abs(scale)
+        
+        # Stun (magnitude-based)
+        if 'Stunned' in attribs or any('Stun' in a for a in attribs):
+            if magnitude > 0:
+                stats['stun'] = magnitude
+                try:
+                    dur_value = float(duration.split()[0])
+                    if dur_value > 0:
+                        stats['stunDuration'] = dur_value
+                except:
+                    pass
+        
+        # Duration
+        if duration != '0 seconds' and (scale != 0 or magnitude != 0):
+            try:
+                dur_value = float(duration.split()[0])
+                if dur_value > 0 and 'buffDuration' not in stats:
+                    stats['buffDuration'] = dur_value
+            except:
+                pass
     
     return stats if stats else None
 
@@ -517,8 +567,12 @@ def map_enhancements(boosts_allowed):
             mapped.append(BOOST_MAP[boost])
     return mapped if mapped else ["Damage", "Accuracy", "Recharge", "EnduranceReduction"]
 
-def convert_power(power_json, archetype=None, level=50, tables_dir=None):
-    """Convert a single power from raw format to our format"""
+def convert_power(power_json, archetype=None, level=50, tables_dir=None, levels=None):
+    """Convert a single power from raw format to our format
+
+    With levels=ALL_LEVELS, effects also carry a perLevel object holding
+    every table-scaled value for levels 1..MAX_LEVEL.
+    """
     # Handle available_level (might be int or list)
     available_level = power_json.get('available_level', 1)
     if isinstance(available_level, list):
@@ -590,8 +644,12 @@ def convert_power(power_json, archetype=None, level=50, tables_dir=None):
     if power_json.get('activation_time', 0) != 0:
         effects['cast'] = power_json['activation_time']
     
+    # Route every template to its extractors in a single pass
+    with profiling.stage('classify'):
+        routed = classify_templates(power_json.get('effects', []))
+    
     # Damage and DoT
-    damage_info = extract_damage_info(power_json.get('effects', []))
+    damage_info = collect_damage_info(routed['damage'])
     if damage_info:
         if 'damage' in damage_info:
             effects['damage'] = damage_info['damage']
@@ -600,131 +658,208 @@ def convert_power(power_json, archetype=None, level=50, tables_dir=None):
     
     # Archetype-specific effects if tables available
     if tables_dir and archetype:
-        # Mez Protection
-        protection = extract_mez_protection(
-            power_json.get('effects', []), 
-            archetype, 
-            level, 
-            tables_dir
-        )
-        if protection:
-            effects['protection'] = protection
-        
-        # Typed defense/resistance
-        typed_stats = extract_typed_defense(
-            power_json.get('effects', []),
-            archetype,
-            level,
-            tables_dir
-        )
-        if typed_stats:
-            effects.update(typed_stats)
-        
-        # Debuff Resistance
-        debuff_res = extract_debuff_resistance(
-            power_json.get('effects', []),
-            archetype,
-            level,
-            tables_dir
-        )
-        if debuff_res:
-            effects['debuffResistance'] = debuff_res
-        
-        # Healing
-        healing_info = extract_healing(
-            power_json.get('effects', []),
-            archetype,
-            level,
-            tables_dir
-        )
-        if healing_info:
-            effects['healing'] = healing_info
+        with profiling.stage('scale'):
+            # Mez Protection
+            protection = collect_mez_protection(routed['protection'], archetype, level, tables_dir)
+            if protection:
+                effects['protection'] = protection
+            
+            # Typed defense/resistance
+            typed_stats = collect_typed_defense(routed['typed'], archetype, level, tables_dir)
+            if typed_stats:
+                effects.update(typed_stats)
+            
+            # Debuff Resistance
+            debuff_res = collect_debuff_resistance(routed['debuffResistance'], archetype, level, tables_dir)
+            if debuff_res:
+                effects['debuffResistance'] = debuff_res
+            
+            # Healing
+            healing_info = collect_healing(routed['healing'], archetype, level, tables_dir)
+            if healing_info:
+                effects['healing'] = healing_info
     
     # Buffs/Debuffs/Stats
     target_type = power_json.get('target_type', 'Foe')
-    stats = extract_debuffs(power_json.get('effects', []), target_type)
+    stats = collect_debuffs(routed['debuffs'], target_type)
     if stats:
         effects.update(stats)
     
+    # Every table-scaled value for all levels in one pass
+    if levels == ALL_LEVELS and tables_dir and archetype:
+        with profiling.stage('scale'):
+            per_level = collect_level_values(routed, archetype, tables_dir)
+        if per_level:
+            effects['perLevel'] = per_level
+    
     if effects:
         result['effects'] = effects
     
     return result
 
-def to_js_literal(obj, indent=0):
-    """Convert Python dict to JavaScript object literal (unquoted keys)"""
+def iter_js_literal(obj, indent=0):
+    """Yield the JavaScript literal for obj (unquoted keys) as string tokens"""
     if obj is None:
-        return "null"
+        yield "null"
     elif isinstance(obj, bool):
-        return "true" if obj else "false"
+        yield "true" if obj else "false"
     elif isinstance(obj, (int, float)):
-        return str(obj)
+        yield str(obj)
     elif isinstance(obj, str):
         # Escape quotes and newlines
         escaped = obj.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
-        return f'"{escaped}"'
+        yield f'"{escaped}"'
     elif isinstance(obj, list):
         if not obj:
-            return "[]"
-        items = [to_js_literal(item, indent + 4) for item in obj]
-        if all(isinstance(item, str) for item in obj):
-            # Simple string array on one line
-            return "[" + ", ".join(items) + "]"
+            yield "[]"
+        elif all(isinstance(item, (str, int, float)) for item in obj):
+            # Simple string or number array (e.g. perLevel) on one line
+            yield "["
+            for i, item in enumerate(obj):
+                if i:
+                    yield ", "
+                yield from iter_js_literal(item, indent + 4)
+            yield "]"
         else:
             # Multi-line array
             spaces = " " * (indent + 4)
-            inner = (",\n" + spaces).join(items)
-            return "[\n" + spaces + inner + "\n" + (" " * indent) + "]"
+            yield "[\n" + spaces
+            for i, item in enumerate(obj):
+                if i:
+                    yield ",\n" + spaces
+                yield from iter_js_literal(item, indent + 4)
+            yield "\n" + (" " * indent) + "]"
     elif isinstance(obj, dict):
         if not obj:
-            return "{}"
-        spaces = " " * (indent + 4)
-        lines = []
-        for key, value in obj.items():
-            val_str = to_js_literal(value, indent + 4)
-            lines.append(f"{spaces}{key}: {val_str}")
-        return "{\n" + ",\n".join(lines) + "\n" + (" " * indent) + "}"
+            yield "{}"
+        else:
+            yield "{\n"
+            yield from iter_js_members(obj, indent)
+            yield "\n" + (" " * indent) + "}"
     else:
-        return str(obj)
+        yield str(obj)
 
-def convert_powerset(powerset_dir, output_file=None, archetype=None, level=50, tables_dir=None):
-    """Convert an entire powerset directory to a JavaScript file"""
-    powerset_path = Path(powerset_dir)
-    
-    if not powerset_path.exists():
-        print(f"Error: Directory not found: {powerset_dir}")
+def iter_js_members(obj, indent=0):
+    """Yield the body of a dict literal: one "key: value" line per item, no braces"""
+    spaces = " " * (indent + 4)
+    for i, (key, value) in enumerate(obj.items()):
+        if i:
+            yield ",\n"
+        yield f"{spaces}{key}: "
+        yield from iter_js_literal(value, indent + 4)
+
+def to_js_literal(obj, indent=0):
+    """Convert Python dict to JavaScript object literal (unquoted keys)"""
+    return "".join(iter_js_literal(obj, indent))
+
+def iter_powerset_registration(constant_name, registration_key):
+    """Yield the POWERSETS registration that ends every powerset file"""
+    yield "\n"
+    yield "// Register to POWERSETS\n"
+    yield "if (typeof POWERSETS !== 'undefined') {\n"
+    yield f"    POWERSETS['{registration_key}'] = {constant_name};\n"
+    yield "} else if (typeof window !== 'undefined') {\n"
+    yield f"    window.{constant_name} = {constant_name};\n"
+    yield "}"
+
+def iter_powerset_header(powerset_name, level, archetype=None, levels=None, notes=()):
+    """Yield the comment block that starts every powerset file"""
+    yield "/**\n"
+    yield f" * {powerset_name}\n"
+    yield f" * Character Level: {level}\n"
+    if archetype:
+        yield f" * Archetype: {archetype}\n"
+    if levels == ALL_LEVELS:
+        yield f" * Per-level values: effects.perLevel (levels 1-{MAX_LEVEL})\n"
+    for note in notes:
+        yield f" * {note}\n"
+    yield " * Extracted from raw_data_homecoming with archetype modifiers applied\n"
+    yield " */\n"
+    yield "\n"
+
+def powerset_object(powers, powerset_name, powerset_key, category):
+    """The powerset object a file defines"""
+    return {
+        'name': powerset_name,
+        'category': category,
+        'description': f"{powerset_name} powerset",
+        'icon': f"{powerset_key}_set.png",
+        'powers': powers
+    }
+
+def iter_powerset_js(powers, powerset_name, powerset_key, constant_name, registration_key,
+                     category, level, archetype=None, levels=None, compact=False, columnar=False):
+    """Yield the whole powerset JavaScript file as string tokens"""
+    columns = None
+    if columnar:
+        powers, columns = level_columns.extract_columns(powers)
+    
+    notes = []
+    if columns is not None:
+        notes.append("Per-level values packed as Float32 columns: decoded by decodeLevelColumns")
+    if compact:
+        notes.append(COMPACT_NOTE)
+    yield from iter_powerset_header(powerset_name, level, archetype, levels, notes)
+    if compact:
+        powerset = powerset_object(powers, powerset_name, powerset_key, category)
+        expression = compact_data.to_js(powerset)
+        if columns is not None:
+            expression = level_columns.wrap_js(expression, columns)
+        yield f"const {constant_name} = {expression};\n"
+        yield from iter_powerset_registration(constant_name, registration_key)
         return
+    if columns is not None:
+        yield f"const {constant_name} = decodeLevelColumns({{\n"
+    else:
+        yield f"const {constant_name} = {{\n"
+    yield f'    name: "{powerset_name}",\n'
+    yield f'    category: "{category}",\n'
+    yield f'    description: "{powerset_name} powerset",\n'
+    yield f'    icon: "{powerset_key}_set.png",\n'
+    yield "    powers: [\n"
     
-    # Read all JSON files, excluding index.json
-    all_json_files = sorted(powerset_path.glob("*.json"))
-    json_files = [f for f in all_json_files if f.name.lower() != 'index.json']
+    for i, power in enumerate(powers):
+        is_last = (i == len(powers) - 1)
+        # Emit the power body directly at its final indentation
+        yield "        {\n"
+        yield from iter_js_members(power, 8)
+        yield "\n        }" + ("" if is_last else ",") + "\n"
+    
+    yield "    ]\n"
+    if columns is not None:
+        yield f'}}, "{level_columns.encode_columns(columns)}", {MAX_LEVEL});\n'
+    else:
+        yield "};\n"
+    yield from iter_powerset_registration(constant_name, registration_key)
 
-    if not json_files:
-        print(f"Error: No JSON files found in {powerset_dir}")
-        return
+def powerset_files(powerset_path):
+    """Power JSON files in a powerset directory, excluding index.json"""
+    all_json_files = sorted(Path(powerset_path).glob("*.json"))
+    return [f for f in all_json_files if f.name.lower() != 'index.json']
 
-    print(f"Found {len(json_files)} power files (excluding index.json)")
-    
-    # Auto-detect archetype from first power if not specified
-    if not archetype:
-        with open(json_files[0], 'r', encoding='utf-8') as f:
-            first_power = json.load(f)
-            archetypes = first_power.get('archetypes', [])
-            if archetypes:
-                archetype = archetypes[0]
-                print(f"Auto-detected archetype: {archetype}")
-    
-    powers = []
-    for json_file in json_files:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            power_data = json.load(f)
-            converted = convert_power(power_data, archetype, level, tables_dir)
-            powers.append(converted)
-    
-    # Sort by available level, then by name
-    powers.sort(key=lambda p: (p['available'], p['name']))
-    
-    # Determine powerset name and category from directory
+
+def detect_archetype(json_file):
+    """First archetype listed by a power file, or None"""
+    archetypes = load_json(json_file, POWER_FIELDS).get('archetypes', [])
+    return archetypes[0] if archetypes else None
+
+
+def convert_power_file(json_file, archetype=None, level=50, tables_dir=None, levels=None):
+    """Load and convert a single power file"""
+    with profiling.stage('load'):
+        power_data = load_json(json_file, POWER_FIELDS)
+    with profiling.stage('convert'):
+        return convert_power(power_data, archetype, level, tables_dir, levels)
+
+
+def power_order(power):
+    """Sort key for a powerset's powers: available level, then name"""
+    return (power['available'], power['name'])
+
+
+def powerset_names(powerset_path, archetype=None):
+    """(display name, key, constant name, POWERSETS key) for a powerset directory"""
+    powerset_path = Path(powerset_path)
     powerset_name = powerset_path.name.replace('_', ' ').title()
     powerset_key = powerset_path.name.replace('_', '-')
     
@@ -735,69 +870,187 @@ def convert_powerset(powerset_dir, output_file=None, archetype=None, level=50, t
     else:
         constant_name = powerset_path.name.replace('-', '_').upper() + "_POWERSET"
         registration_key = powerset_key
+    return powerset_name, powerset_key, constant_name, registration_key
+
+
+def write_output(output_file, tokens):
+    """Stream a generated file's tokens to disk unless the file is unchanged"""
+    with profiling.stage('write'):
+        written = write_tokens_if_changed(output_file, tokens)
+    if written:
+        profiling.count('bytes_written', Path(output_file).stat().st_size)
+        print(f"Wrote {output_file}")
+    else:
+        profiling.count('unchanged')
+        print(f"Unchanged {output_file}")
+
+
+def write_powerset(powerset_path, powers, output_file=None, archetype=None, level=50, levels=None,
+                   compact=False, columnar=False):
+    """Sort converted powers and stream the powerset file to output_file or stdout"""
+    powerset_path = Path(powerset_path)
     
-    # Guess category (should be parameterized)
-    category = "Unknown"
-    
-    # Generate JavaScript
-    output = []
-    output.append("/**")
-    output.append(f" * {powerset_name}")
-    output.append(f" * Character Level: {level}")
-    if archetype:
-        output.append(f" * Archetype: {archetype}")
-    output.append(" * Extracted from raw_data_homecoming with archetype modifiers applied")
-    output.append(" */")
-    output.append("")
-    output.append(f"const {constant_name} = {{")
-    output.append(f'    name: "{powerset_name}",')
-    output.append(f'    category: "{category}",')
-    output.append(f'    description: "{powerset_name} powerset",')
-    output.append(f'    icon: "{powerset_key}_set.png",')
-    output.append("    powers: [")
+    powers.sort(key=power_order)
+    powerset_name, powerset_key, constant_name, registration_key = powerset_names(powerset_path, archetype)
     
-    for i, power in enumerate(powers):
-        is_last = (i == len(powers) - 1)
-        power_js = to_js_literal(power, 8)
-        # Remove outer braces and add proper indentation
-        power_lines = power_js.split('\n')
-        output.append("        {")
-        for line in power_lines[1:-1]:  # Skip first { and last }
-            output.append(line)
-        output.append("        }" + ("" if is_last else ","))
-    
-    output.append("    ]")
-    output.append("};")
-    output.append("")
-    output.append("// Register to POWERSETS")
-    output.append("if (typeof POWERSETS !== 'undefined') {")
-    output.append(f"    POWERSETS['{registration_key}'] = {constant_name};")
-    output.append("} else if (typeof window !== 'undefined') {")
-    output.append(f"    window.{constant_name} = {constant_name};")
-    output.append("}")
-    
-    result = "\n".join(output)
+    # Stream the JavaScript straight to its destination
+    tokens = iter_powerset_js(powers, powerset_name, powerset_key, constant_name, registration_key,
+                              CATEGORY, level, archetype, levels, compact, columnar)
     
     # Write to file or print
     if output_file:
-        # Ensure output directory exists
-        output_path = Path(output_file)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(result)
-        print(f"Wrote {output_file}")
+        write_output(output_file, tokens)
     else:
-        print(result)
+        sys.stdout.writelines(tokens)
+        print()
+
+
+def convert_powerset(powerset_dir, output_file=None, archetype=None, level=50, tables_dir=None, levels=None,
+                     compact=False, columnar=False):
+    """Convert an entire powerset directory to a JavaScript file
+
+    With compact, the file is written interned and minified (compact_data).
+    With columnar, per-level arrays are written as Float32 columns
+    (level_columns).
+    Returns the converted powers, or None if the directory has no powers.
+    """
+    powerset_path = Path(powerset_dir)
+    
+    if not powerset_path.exists():
+        print(f"Error: Directory not found: {powerset_dir}")
+        return
+    
+    # Read all JSON files, excluding index.json
+    with profiling.stage('discover'):
+        json_files = powerset_files(powerset_path)
+
+    if not json_files:
+        print(f"Error: No JSON files found in {powerset_dir}")
+        return
+
+    print(f"Found {len(json_files)} power files (excluding index.json)")
+    
+    # Auto-detect archetype from first power if not specified
+    if not archetype:
+        archetype = detect_archetype(json_files[0])
+        if archetype:
+            print(f"Auto-detected archetype: {archetype}")
+    
+    powers = [convert_power_file(f, archetype, level, tables_dir, levels) for f in json_files]
+    
+    write_powerset(powerset_path, powers, output_file, archetype, level, levels, compact, columnar)
     
     print(f"\nConverted {len(powers)} powers at level {level}")
     if archetype:
         print(f"Applied {archetype} archetype modifiers")
-    return result
+    return powers
+
+
+def convert_shared_powerset(members, base_output, level=50, tables_dir=None, levels=None, compact=False):
+    """Convert one powerset for several archetypes as a shared base plus deltas
+
+    members is [(powerset_dir, output_file, archetype)]. The view that gives
+    the smallest deltas (powerset_deltas.split) is written to base_output as
+    <NAME>_BASE_POWERSET; each archetype's file rebuilds its own view from it
+    with applyPowersetDelta and registers it as usual. Returns the files
+    written, or None if a member has no powers.
+    """
+    views = {}
+    names = {}
+    for powerset_dir, output_file, archetype in members:
+        powerset_path = Path(powerset_dir)
+        with profiling.stage('discover'):
+            json_files = powerset_files(powerset_path)
+        if not json_files:
+            print(f"Error: No JSON files found in {powerset_dir}")
+            return None
+        
+        powers = [convert_power_file(f, archetype, level, tables_dir, levels) for f in json_files]
+        powers.sort(key=power_order)
+        names[archetype] = powerset_names(powerset_path, archetype)
+        powerset_name, powerset_key, _, _ = names[archetype]
+        view = powerset_object(powers, powerset_name, powerset_key, CATEGORY)
+        # Diff the values compact mode will write, so deltas stay exact
+        views[archetype] = compact_data.quantize(view) if compact else view
+        print(f"Converted {len(powers)} {archetype} powers")
+    
+    with profiling.stage('delta'):
+        base_archetype, deltas = powerset_deltas.split(views)
+    
+    base_path = Path(base_output)
+    base_name = base_path.stem.replace('-', '_').upper() + "_BASE_POWERSET"
+    powerset_name = names[base_archetype][0]
+    notes = [f"Shared base for: {', '.join(sorted(views))} (the {base_archetype} view)",
+             "Archetype files rebuild their view with applyPowersetDelta (js/data/compact-decoder.js)"]
+    if compact:
+        notes.append(COMPACT_NOTE)
+    base = views[base_archetype]
+    with profiling.stage('emit'):
+        expression = compact_data.to_js(base) if compact else to_js_literal(base)
+    write_output(base_output, chain(iter_powerset_header(powerset_name, level, None, levels, notes),
+                                    (f"const {base_name} = ", expression, ";\n")))
+    written = [str(base_output)]
+    
+    base_file = f"powersets/{powerset_deltas.BASE_DIR}/{base_path.name}"
+    for powerset_dir, output_file, archetype in members:
+        powerset_name, _, constant_name, registration_key = names[archetype]
+        delta = deltas[archetype]
+        with profiling.stage('emit'):
+            literal = json.dumps(delta, separators=(',', ':')) if compact else to_js_literal(delta)
+        write_output(output_file, chain(
+            iter_powerset_header(powerset_name, level, archetype, levels, [f"Delta from {base_name} ({base_file})"]),
+            (f"const {constant_name} = applyPowersetDelta({base_name}, ", literal, ");\n"),
+            iter_powerset_registration(constant_name, registration_key)))
+        written.append(str(output_file))
+    
+    total = sum(Path(f).stat().st_size for f in written)
+    print(f"\nShared {len(members)} archetypes from the {base_archetype} view ({total / 1e3:.1f} KB)")
+    return written
+
+
+def watch_powerset(powerset_dir, output_file, archetype=None, level=50, tables_dir=None, levels=None,
+                   compact=False, columnar=False):
+    """Convert a powerset, then keep output_file in sync with its raw files.
+
+    Converted powers are kept per source file; a change reconverts only the
+    files that changed and re-emits the powerset from the kept powers, in
+    file name order so the output matches a full conversion byte for byte. A
+    change to the archetype's table file reloads the tables and reconverts
+    every power, since every scaled value may have moved.
+    """
+    powerset_path = Path(powerset_dir)
+    if not archetype:
+        json_files = powerset_files(powerset_path)
+        archetype = detect_archetype(json_files[0]) if json_files else None
+    
+    converted = {f: convert_power_file(f, archetype, level, tables_dir, levels)
+                 for f in powerset_files(powerset_path)}
+    write_powerset(powerset_path, list(converted.values()), output_file, archetype, level, levels,
+                   compact, columnar)
+    
+    table_file = Path(tables_dir) / f"{archetype}.json" if tables_dir and archetype else None
+    
+    def on_change(changed, removed):
+        if table_file in changed or table_file in removed:
+            get_store(tables_dir).reload(archetype)
+            changed = powerset_files(powerset_path)
+            print(f"Tables changed, reconverting {len(changed)} powers")
+        for f in removed:
+            converted.pop(f, None)
+        for f in changed:
+            if f == table_file or f.name.lower() == 'index.json':
+                continue
+            converted[f] = convert_power_file(f, archetype, level, tables_dir, levels)
+            print(f"Reconverted {f.name}")
+        write_powerset(powerset_path, [converted[f] for f in sorted(converted)], output_file, archetype,
+                       level, levels, compact, columnar)
+    
+    watch([powerset_path, table_file], on_change, list_files=powerset_files)
+
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: python convert_powerset.py <powerset_directory> [output_file] [--archetype=<at>] [--level=<level>] [--tables=<tables_dir>]")
+        print("Usage: python convert_powerset.py <powerset_directory> [output_file] [--archetype=<at>] [--level=<level>] [--tables=<tables_dir>] [--levels=all] [--compact] [--columnar] [--cache[=<cache_file>]] [--watch] [--profile[=<report.json>]]")
         print("Example: python convert_powerset.py 'C:/Raw Data/powers/tanker_defense/dark_armor' dark-armor.js --archetype=tanker --level=50 --tables='C:/Raw Data/tables'")
         sys.exit(1)
     
@@ -806,16 +1059,48 @@ if __name__ == "__main__":
     archetype = None
     level = 50
     tables_dir = None
+    levels = None
+    cache = None
+    watching = False
+    compact = False
+    columnar = False
+    profile_path = None
     
     # Parse arguments
     for arg in sys.argv[2:]:
-        if arg.startswith('--archetype='):
+        if profiling.profile_arg(arg, 'convert_powerset'):
+            profile_path = profiling.profile_arg(arg, 'convert_powerset')
+            profiling.start('convert_powerset')
+        elif raw_cache.cache_arg(arg):
+            cache = raw_cache.enable(raw_cache.cache_arg(arg))
+        elif arg.startswith('--archetype='):
             archetype = arg.split('=', 1)[1]
         elif arg.startswith('--level='):
             level = int(arg.split('=', 1)[1])
         elif arg.startswith('--tables='):
             tables_dir = arg.split('=', 1)[1]
+        elif arg.startswith('--levels='):
+            levels = arg.split('=', 1)[1]
+            if levels != ALL_LEVELS:
+                print(f"Error: Unsupported --levels value: {levels} (only '{ALL_LEVELS}')")
+                sys.exit(1)
+        elif arg == '--watch':
+            watching = True
+        elif arg == '--compact':
+            compact = True
+        elif arg == '--columnar':
+            columnar = True
         elif not arg.startswith('--'):
             output_file = arg
     
-    convert_powerset(powerset_dir, output_file, archetype, level, tables_dir)
+    if watching:
+        if not output_file:
+            print("Error: --watch needs an output file")
+            sys.exit(1)
+        watch_powerset(powerset_dir, output_file, archetype, level, tables_dir, levels, compact, columnar)
+    else:
+        convert_powerset(powerset_dir, output_file, archetype, level, tables_dir, levels, compact, columnar)
+    if profile_path:
+        profiling.finish(profile_path)
+    if cache:
+        raw_cache.disable(cache)
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Effect Template Rules
+Declarative attribute-matching rules shared by the powerset, pool and epic
+converters
+
+A rule names an outcome and the templates it applies to: a set of aspects,
+a set of targets, and either exact attribute names, a substring every
+matching attribute contains, or None to match on aspect/target alone. An
+optional `when` predicate checks the rest of the template.
+
+RuleTable compiles its rules once into dicts keyed by (aspect, target,
+attrib). Lookups for attribute spellings not seen before are resolved once
+and cached, so after warm-up a template is classified with dict hits only:
+- routes() returns every outcome matching one attribute (the powerset
+  converter routes a template to each interested extractor)
+- first() returns the highest-priority rule matching a whole template, in
+  rule order (the pool converters' one-outcome-per-template behaviour)
+"""
+from collections import namedtuple
+
+# Matches any aspect or target
+ANY = '*'
+
+# Mez attribute mapping (protection and debuff resistance)
+MEZ_ATTRS = {
+    'Held': 'hold',
+    'Stunned': 'stun',
+    'Sleep': 'sleep',
+    'Immobilized': 'immobilize',
+    'Terrorized': 'fear',
+    'Confused': 'confuse'
+}
+
+# Damage type mapping for typed defense/resistance
+TYPED_DAMAGE_TYPES = {
+    'Smashing': 'smashing',
+    'Lethal': 'lethal',
+    'Fire': 'fire',
+    'Cold': 'cold',
+    'Energy': 'energy',
+    'Negative_Energy': 'negative',
+    'NegativeEnergy': 'negative',
+    'Psionic': 'psionic',
+    'Toxic': 'toxic',
+    # Also check _Dmg variants for resistance
+    'Smashing_Dmg': 'smashing',
+    'Lethal_Dmg': 'lethal',
+    'Fire_Dmg': 'fire',
+    'Cold_Dmg': 'cold',
+    'Energy_Dmg': 'energy',
+    'Negative_Energy_Dmg': 'negative',
+    'Psionic_Dmg': 'psionic',
+    'Toxic_Dmg': 'toxic'
+}
+
+# Map attribute names to debuff resistance types
+DEBUFF_RESISTANCE_ATTRS = {
+    'ToHit': 'tohit',
+    'Base_Defense': 'defense',
+    'Defense': 'defense',
+    'RechargeTime': 'recharge',
+    'Recharge': 'recharge',
+    'RunningSpeed': 'movement',
+    'FlyingSpeed': 'movement',
+    'JumpingSpeed': 'movement',
+    'JumpHeight': 'movement',
+    'Regeneration': 'regeneration',
+    'Recovery': 'recovery',
+    'Endurance': 'endurance',
+    'MaxEndurance': 'endurance',
+    'Heal': 'healing',
+    'Damage': 'damage'
+}
+
+# Damage type attributes (NOT debuff resistance)
+DAMAGE_ATTRS = {'Smashing_Dmg', 'Lethal_Dmg', 'Fire_Dmg', 'Cold_Dmg',
+                'Energy_Dmg', 'Negative_Energy_Dmg', 'Psionic_Dmg', 'Toxic_Dmg'}
+
+# Map attribute names to damage types
+DAMAGE_TYPE_MAP = {
+    'Smashing_Dmg': 'Smashing',
+    'Lethal_Dmg': 'Lethal',
+    'Fire_Dmg': 'Fire',
+    'Cold_Dmg': 'Cold',
+    'Energy_Dmg': 'Energy',
+    'Negative_Energy_Dmg': 'Negative',
+    'Psionic_Dmg': 'Psionic',
+    'Toxic_Dmg': 'Toxic'
+}
+
+# Pool/epic typed defense attributes
+DEFENSE_TYPES = {
+    'Smashing_Def': 'smashing',
+    'Lethal_Def': 'lethal',
+    'Fire_Def': 'fire',
+    'Cold_Def': 'cold',
+    'Energy_Def': 'energy',
+    'Negative_Energy_Def': 'negative',
+    'Psionic_Def': 'psionic',
+    'Toxic_Def': 'toxic'
+}
+
+# Pool/epic typed resistance attributes
+RESISTANCE_TYPES = {
+    'Smashing_Dmg': 'smashing',
+    'Lethal_Dmg': 'lethal',
+    'Fire_Dmg': 'fire',
+    'Cold_Dmg': 'cold',
+    'Energy_Dmg': 'energy',
+    'Negative_Energy_Dmg': 'negative',
+    'Psionic_Dmg': 'psionic',
+    'Toxic_Dmg': 'toxic'
+}
+
+# Pool/epic mez protection attributes (knockback family included)
+MEZ_TYPES = {
+    'Held': 'hold',
+    'Stunned': 'stun',
+    'Sleep': 'sleep',
+    'Immobilized': 'immobilize',
+    'Terrorized': 'fear',
+    'Confused': 'confuse',
+    'Knockback': 'knockback',
+    'Knockup': 'knockup',
+    'Repel': 'repel'
+}
+
+
+class Rule(namedtuple('Rule', 'name aspects targets attribs contains when')):
+    """One matching rule; see the module docstring"""
+
+
+def rule(name, aspects=ANY, targets=ANY, attribs=None, contains=None, when=None):
+    """Build a Rule. aspects/targets take one value or a tuple; attribs any iterable"""
+    if isinstance(aspects, str):
+        aspects = (aspects,)
+    if isinstance(targets, str):
+        targets = (targets,)
+    if attribs is not None:
+        attribs = frozenset(attribs)
+    return Rule(name, tuple(aspects), tuple(targets), attribs, contains, when)
+
+
+class RuleTable:
+    """Rules compiled into (aspect, target, attrib) lookups, in priority order"""
+
+    def __init__(self, rules):
+        self.rules = tuple(rules)
+        self._exact = {}
+        self._open = {}
+        self._contains = []
+        for index, r in enumerate(self.rules):
+            if r.contains is not None:
+                self._contains.append(index)
+                continue
+            for aspect in r.aspects:
+                for target in r.targets:
+                    if r.attribs is None:
+                        self._open.setdefault((aspect, target), []).append(index)
+                    else:
+                        for attr in r.attribs:
+                            self._exact.setdefault((aspect, target, attr), []).append(index)
+
+        # Resolved lookups, filled on first sight
+        self.route_cache = {}
+        self._attrib_cache = {}
+        self._template_cache = {}
+
+    def triples(self):
+        """Every exact (aspect, target, attrib) key, wildcards left in place"""
+        return sorted(self._exact)
+
+    def _matches(self, index, aspect, target):
+        r = self.rules[index]
+        return ((ANY in r.aspects or aspect in r.aspects) and
+                (ANY in r.targets or target in r.targets))
+
+    def attrib_rules(self, aspect, target, attr):
+        """Indices of rules matching one attribute, wildcards included"""
+        key = (aspect, target, attr)
+        found = self._attrib_cache.get(key)
+        if found is not None:
+            return found
+        indices = set()
+        for a in (aspect, ANY):
+            for t in (target, ANY):
+                indices.update(self._exact.get((a, t, attr), ()))
+        for index in self._contains:
+            if self.rules[index].contains in attr and self._matches(index, aspect, target):
+                indices.add(index)
+        found = self._attrib_cache[key] = tuple(sorted(indices))
+        return found
+
+    def resolve_routes(self, aspect, target, attr):
+        """Outcome names for one attribute; cached in route_cache"""
+        routes = tuple({self.rules[index].name for index in self.attrib_rules(aspect, target, attr)})
+        self.route_cache[(aspect, target, attr)] = routes
+        return routes
+
+    def routes(self, aspect, target, attr):
+        """Every outcome name matching one attribute"""
+        routes = self.route_cache.get((aspect, target, attr))
+        if routes is None:
+            routes = self.resolve_routes(aspect, target, attr)
+        return routes
+
+    def candidates(self, aspect, target, attribs):
+        """Rules matching a template's aspect, target and attributes, by priority"""
+        key = (aspect, target, tuple(attribs))
+        found = self._template_cache.get(key)
+        if found is not None:
+            return found
+        indices = set()
+        for a in (aspect, ANY):
+            for t in (target, ANY):
+                indices.update(self._open.get((a, t), ()))
+        for attr in attribs:
+            indices.update(self.attrib_rules(aspect, target, attr))
+        found = self._template_cache[key] = tuple(self.rules[i] for i in sorted(indices))
+        return found
+
+    def first(self, template):
+        """Highest-priority rule matching template, or None"""
+        for r in self.candidates(template.get('aspect', ''), template.get('target', ''),
+                                 template.get('attribs', [])):
+            if r.when is None or r.when(template):
+                return r
+        return None
+
+
+# Powerset converter: (aspect, target, attrib) -> interested extractors.
+# Every extractor still applies its own checks, so a route only has to be a
+# superset of what the extractor uses.
+POWERSET_RULES = RuleTable([
+    rule('damage', attribs=DAMAGE_TYPE_MAP),
+    rule('protection', 'Current', 'Self', MEZ_ATTRS),
+    rule('typed', 'Current', 'Self', TYPED_DAMAGE_TYPES),
+    rule('typed', 'Resistance', 'Self', TYPED_DAMAGE_TYPES),
+    rule('debuffResistance', 'Resistance', 'Self', DEBUFF_RESISTANCE_ATTRS),
+    rule('healing', 'Absolute', 'Self', ['Heal_Dmg']),
+    # Stun detection matches any attribute containing 'Stun'
+    rule('debuffs', contains='Stun'),
+])
+
+
+def _magnitude_positive(template):
+    return template.get('magnitude', 0) > 0
+
+
+# Pool converter: the first matching rule decides a template's outcome
+_POOL_RULE_LIST = [
+    rule('damage', 'Absolute', contains='_Dmg'),
+    rule('defense', 'Defense'),
+    rule('defense', 'Current', attribs=['Base_Defense']),
+    rule('resistance', 'Resistance'),
+    rule('healing', 'Absolute', contains='Heal'),
+    rule('healing', 'Absolute', contains='HitPoints'),
+    rule('recovery', attribs=['Recovery']),
+    rule('regeneration', attribs=['Regeneration']),
+    rule('runSpeed', attribs=['RunningSpeed', 'SpeedRunning']),
+    rule('flySpeed', attribs=['FlyingSpeed', 'SpeedFlying']),
+    rule('jumpSpeed', attribs=['JumpingSpeed', 'JumpSpeed']),
+    rule('jumpHeight', attribs=['JumpHeight']),
+    # Mez protection (magnitude-based)
+    rule('protection', ('Cur', 'Current'), when=_magnitude_positive),
+]
+POOL_RULES = RuleTable(_POOL_RULE_LIST)
+
+# Epic pools do not report movement speeds
+MOVEMENT_EFFECTS = ('runSpeed', 'flySpeed', 'jumpSpeed', 'jumpHeight')
+EPIC_RULES = RuleTable(r for r in _POOL_RULE_LIST if r.name not in MOVEMENT_EFFECTS)
+
+
+def _apply_damage(effects, template, attribs):
+    effects.setdefault('damage', {})
+    for attr in attribs:
+        if '_Dmg' in attr:
+            dmg_type = attr.replace('_Dmg', '').lower()
+            if dmg_type == 'negative_energy':
+                dmg_type = 'negative'
+            effects['damage']['type'] = dmg_type.title()
+            effects['damage']['scale'] = template.get('scale', 0)
+            effects['damage']['table'] = template.get('table', '')
+            break
+
+
+def _apply_defense(effects, template, attribs):
+    defense = effects.setdefault('defense', {})
+    for attr in attribs:
+        if attr in DEFENSE_TYPES:
+            defense[DEFENSE_TYPES[attr]] = {'scale': template.get('scale', 0), 'table': template.get('table', '')}
+        elif attr == 'Base_Defense':
+            defense['all'] = {'scale': template.get('scale', 0), 'table': template.get('table', '')}
+
+
+def _apply_resistance(effects, template, attribs):
+    resistance = effects.setdefault('resistance', {})
+    for attr in attribs:
+        if attr in RESISTANCE_TYPES:
+            resistance[RESISTANCE_TYPES[attr]] = {'scale': template.get('scale', 0), 'table': template.get('table', '')}
+
+
+def _apply_protection(effects, template, attribs):
+    for attr in attribs:
+        if attr in MEZ_TYPES:
+            effects.setdefault('protection', {})[MEZ_TYPES[attr]] = template.get('magnitude', 0)
+
+
+def _apply_scaled(effects, template, name):
+    entry = effects.setdefault(name, {})
+    entry['scale'] = template.get('scale', 0)
+    entry['table'] = template.get('table', '')
+
+
+_POOL_ACTIONS = {
+    'damage': _apply_damage,
+    'defense': _apply_defense,
+    'resistance': _apply_resistance,
+    'protection': _apply_protection,
+}
+
+
+def apply_pool_templates(rules, templates, effects):
+    """Fold templates into a pool/epic effects dict using rules"""
+    for template in templates:
+        r = rules.first(template)
+        if r is None:
+            continue
+        action = _POOL_ACTIONS.get(r.name)
+        if action is None:
+            _apply_scaled(effects, template, r.name)
+        else:
+            action(effects, template, template.get('attribs', []))
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Synthetic Raw Data Generator
+Builds a Homecoming-shaped raw data tree at any size for load testing
+
+Usage:
+    python generate_synthetic_data.py <output_dir> [--powers=<n>] [--seed=<n>] [--workers=<n>]
+                                      [--proto=<raw_dir>] [--lean]
+    Example: python generate_synthetic_data.py C:/synthetic --powers=100000
+
+Writes the layout the converters and batch_convert.py read:
+    <output_dir>/powers/<archetype>_<category>/<powerset>/index.json + <power>.json
+    <output_dir>/powers/pool/<pool>/...
+    <output_dir>/powers/epic/<at>_<pool>/...
+    <output_dir>/tables/<archetype>.json
+
+Power and index files are cloned from real records in the checked-in
+incarnate_raw_data, so they carry the full ~130-key schema and realistic
+parse cost. Effect templates mix real incarnate templates with templates
+built from the shared powerset rule table, so every extractor sees work.
+--lean keeps only raw_loader.RECORD_FIELDS for very large trees.
+
+Output is deterministic for a given --seed and --powers; each powerset is
+generated from its own seeded RNG, so --workers does not change the result.
+"""
+import copy
+import json
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from batch_convert import ARCHETYPE_CATEGORIES
+from effect_rules import POWERSET_RULES
+from raw_loader import RECORD_FIELDS, load_json, project
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+PROTO_DIR = REPO_DIR / "incarnate_raw_data"
+
+# Powers per set, matching the live game
+POWERSET_SIZE = 9
+POOL_SIZE = 5
+EPIC_SIZE = 5
+
+# Share of generated powers that go to pools and epics
+POOL_SHARE = 0.10
+EPIC_SHARE = 0.05
+
+# Epic pool directory prefixes convert_epic maps back to an archetype
+EPIC_PREFIXES = {
+    'blaster': 'blaster_', 'controller': 'controller_', 'defender': 'defender_',
+    'scrapper': 'scrapper_', 'tanker': 'tank_', 'brute': 'brute_', 'stalker': 'stalker_',
+    'dominator': 'dominator_', 'corruptor': 'corruptor_', 'mastermind': 'mastermind_',
+    'sentinel': 'sentinel_'
+}
+
+POWER_LEVELS = (1, 1, 2, 6, 8, 12, 18, 26, 32)
+POWER_TYPES = ('Click', 'Click', 'Click', 'Toggle', 'Auto')
+TARGET_TYPES = ('Foe', 'Foe', 'Self', 'Ally', 'Location')
+EFFECT_AREAS = ('SingleTarget', 'SingleTarget', 'Sphere', 'Cone')
+BOOST_SETS = (
+    ('Enhance Damage', 'Enhance Accuracy', 'Enhance Recharge Speed', 'Reduce Endurance Cost'),
+    ('Enhance Defense Buff', 'Reduce Endurance Cost', 'Enhance Recharge Speed'),
+    ('Enhance Resistance Buff', 'Reduce Endurance Cost'),
+    ('Enhance Healing', 'Reduce Endurance Cost', 'Enhance Recharge Speed'),
+    ('Enhance Hold', 'Enhance Accuracy', 'Enhance Damage', 'Enhance Range'),
+)
+SET_CATEGORIES = (
+    ('Melee AoE Damage', 'Universal Damage Sets'),
+    ('Defense Sets',),
+    ('Resist Damage',),
+    ('Healing',),
+    ('Holds', 'Ranged Damage', 'Universal Damage Sets'),
+)
+TEMPLATE_TABLES = ('Melee_Damage', 'Ranged_Damage', 'Melee_Buff_Def', 'Melee_Res_Dmg',
+                   'Melee_Heal', 'Melee_Res_Boolean', 'Melee_Mez', 'Melee_Debuff_Def', 'Melee_Ones')
+
+
+def dispatch_routes():
+    """Concrete (aspect, target, attrib) triples from the powerset rule table"""
+    routes = []
+    for aspect, target, attrib in POWERSET_RULES.triples():
+        routes.append((
+            'Current' if aspect == '*' else aspect,
+            'Self' if target == '*' else target,
+            attrib
+        ))
+    return routes
+
+
+def load_prototypes(proto_dir):
+    """Real power records, index records and templates to clone from"""
+    powers = []
+    indexes = []
+    templates = []
+    table_names = set(TEMPLATE_TABLES)
+    for json_file in sorted(Path(proto_dir).rglob("*.json")):
+        record = load_json(json_file)
+        if not isinstance(record, dict):
+            continue
+        if json_file.name.lower() == 'index.json':
+            if 'power_names' in record:
+                indexes.append(record)
+            continue
+        if 'effects' not in record:
+            continue
+        powers.append(record)
+        for effect in record['effects']:
+            for template in effect.get('templates', []):
+                templates.append(template)
+                if template.get('table'):
+                    table_names.add(template['table'])
+    if not powers or not indexes:
+        raise ValueError(f"No prototype powers and indexes found under {proto_dir}")
+    return {'powers': powers, 'indexes': indexes, 'templates': templates,
+            'tables': sorted(table_names), 'routes': dispatch_routes()}
+
+
+def make_template(rng, protos):
+    """One effect template: a real one, or one built from a dispatch route"""
+    template = copy.deepcopy(rng.choice(protos['templates']))
+    if rng.random() < 0.5:
+        return template
+    aspect, target, attrib = rng.choice(protos['routes'])
+    timed = rng.random() < 0.3
+    template.update(
+        attribs=[attrib],
+        aspect=aspect,
+        target=target,
+        table=rng.choice(TEMPLATE_TABLES),
+        scale=round(rng.uniform(0.05, 3.0), 4),
+        duration=f"{rng.choice((4, 8, 10, 30))} seconds" if timed else '0 seconds',
+        magnitude=1.0,
+        application_period=rng.choice((0.0, 0.0, 1.0, 2.0)),
+    )
+    return template
+
+
+def make_power(rng, protos, full_name, display_name, archetype, available_level):
+    """A power record cloned from a prototype with randomized stats and effects"""
+    power = copy.deepcopy(rng.choice(protos['powers']))
+    kind = rng.randrange(len(BOOST_SETS))
+    short_name = full_name.split('.')[-1]
+    power.update(
+        name=short_name,
+        full_name=full_name,
+        short_name=short_name,
+        display_name=display_name,
+        display_fullname=full_name.replace('_', ' '),
+        display_short_help=f"{display_name}: synthetic power",
+        display_help=f"{display_name} is a generated power used for converter load tests.",
+        icon=f"{short_name.lower()}.png",
+        type=rng.choice(POWER_TYPES),
+        target_type=rng.choice(TARGET_TYPES),
+        effect_area=rng.choice(EFFECT_AREAS),
+        max_targets_hit=rng.choice((1, 1, 5, 10, 16)),
+        radius=rng.choice((0.0, 8.0, 15.0)),
+        arc=rng.choice((0.0, 0.0, 0.7854)),
+        accuracy=rng.choice((1.0, 1.0, 1.2)),
+        range=rng.choice((0.0, 7.0, 40.0, 80.0)),
+        recharge_time=round(rng.uniform(2.0, 240.0), 1),
+        endurance_cost=round(rng.uniform(0.0, 20.0), 3),
+        activation_time=rng.choice((1.0, 1.17, 1.5, 2.0)),
+        available_level=available_level,
+        max_boosts=6,
+        boosts_allowed=list(BOOST_SETS[kind]),
+        allowed_boostset_cats=list(SET_CATEGORIES[kind]),
+        archetypes=[f"Class_{archetype.title()}"] if archetype else [],
+        requires=f"@Class_{archetype.title()} eq" if archetype else '',
+    )
+
+    effects = []
+    for _ in range(rng.randint(1, 4)):
+        proto = rng.choice(rng.choice(protos['powers'])['effects'] or [{}])
+        effect = {key: copy.deepcopy(value) for key, value in proto.items() if key != 'templates'}
+        effect['templates'] = [make_template(rng, protos) for _ in range(rng.randint(1, 6))]
+        effects.append(effect)
+    power['effects'] = effects
+    return power
+
+
+def make_index(rng, protos, set_name, full_names, display_names, levels):
+    """Powerset/pool index.json cloned from a real index"""
+    index = copy.deepcopy(rng.choice(protos['indexes']))
+    display = set_name.replace('_', ' ').title()
+    index.update(
+        name=set_name,
+        display_name=display,
+        display_fullname=display,
+        display_help=f"{display} is a generated set used for converter load tests.",
+        display_short_help=display,
+        icon=f"{set_name}_set.png",
+        available_level=list(levels),
+        power_names=list(full_names),
+        power_display_names=list(display_names),
+        power_short_helps=[f"{name}: synthetic power" for name in display_names],
+    )
+    return index
+
+
+def write_json(path, record, lean):
+    if lean:
+        record = project(record, RECORD_FIELDS)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(record, f, indent=2)
+
+
+# Prototypes loaded once per worker by _init_worker
+_PROTOS = {}
+
+
+def _init_worker(proto_dir):
+    _PROTOS.update(load_prototypes(proto_dir))
+
+
+def generate_set(job):
+    """Write one powerset, pool or epic pool. Returns the number of powers"""
+    kind, set_dir, archetype, size, seed, lean = job
+    set_dir = Path(set_dir)
+    rng = random.Random(f"{seed}:{kind}:{set_dir.parent.name}/{set_dir.name}")
+    set_dir.mkdir(parents=True, exist_ok=True)
+
+    category = 'Pool' if kind == 'pool' else 'Epic' if kind == 'epic' else archetype.title()
+    levels = POWER_LEVELS[:size] if kind == 'powerset' else sorted(rng.choice(POWER_LEVELS) for _ in range(size))
+    if kind == 'epic':
+        levels = [35, 35, 38, 41, 44][:size]
+
+    full_names = []
+    display_names = []
+    for i in range(size):
+        short_name = f"{set_dir.name.title()}_Power_{i + 1}"
+        full_names.append(f"{category}.{set_dir.name}.{short_name}")
+        display_names.append(short_name.replace('_', ' '))
+
+    for full_name, display_name, level in zip(full_names, display_names, levels):
+        power = make_power(rng, _PROTOS, full_name, display_name, archetype, level)
+        write_json(set_dir / f"{full_name.split('.')[-1].lower()}.json", power, lean)
+
+    write_json(set_dir / "index.json",
+               make_index(rng, _PROTOS, set_dir.name, full_names, display_names, levels), lean)
+    return size
+
+
+def plan_jobs(output_dir, powers, seed, lean):
+    """Split a power budget into powerset, pool and epic jobs"""
+    powers_dir = Path(output_dir) / 'powers'
+    pool_count = max(1, round(powers * POOL_SHARE / POOL_SIZE))
+    epic_count = max(1, round(powers * EPIC_SHARE / EPIC_SIZE))
+    powerset_count = max(1, (powers - pool_count * POOL_SIZE - epic_count * EPIC_SIZE) // POWERSET_SIZE)
+
+    jobs = []
+    slots = [(at, category, subdir) for at, subdirs in ARCHETYPE_CATEGORIES.items()
+             for category, subdir in subdirs.items()]
+    for i in range(powerset_count):
+        archetype, _, subdir = slots[i % len(slots)]
+        jobs.append(('powerset', str(powers_dir / subdir / f"synthetic_{i:06d}"), archetype,
+                     POWERSET_SIZE, seed, lean))
+    for i in range(pool_count):
+        jobs.append(('pool', str(powers_dir / 'pool' / f"synthetic_pool_{i:05d}"), None,
+                     POOL_SIZE, seed, lean))
+    archetypes = list(EPIC_PREFIXES)
+    for i in range(epic_count):
+        archetype = archetypes[i % len(archetypes)]
+        name = f"{EPIC_PREFIXES[archetype]}synthetic_{i:05d}_mastery"
+        jobs.append(('epic', str(powers_dir / 'epic' / name), archetype, EPIC_SIZE, seed, lean))
+    return jobs
+
+
+def generate_tables(output_dir, table_names, seed):
+    """Archetype modifier tables covering every table name the templates use"""
+    tables_dir = Path(output_dir) / 'tables'
+    tables_dir.mkdir(parents=True, exist_ok=True)
+    for archetype in sorted(set(ARCHETYPE_CATEGORIES) | set(EPIC_PREFIXES)):
+        rng = random.Random(f"{seed}:tables:{archetype}")
+        named_tables = {}
+        for name in table_names:
+            base = rng.uniform(0.05, 2.0)
+            # Tables grow with level like the real ones
+            named_tables[name] = [round(base * (0.3 + 0.7 * lvl / 54), 4) for lvl in range(55)]
+        named_tables['Melee_Ones'] = [1.0] * 55
+        with open(tables_dir / f"{archetype}.json", 'w', encoding='utf-8') as f:
+            json.dump({'name': archetype, 'named_tables': named_tables}, f, indent=2)
+
+
+def generate(output_dir, powers=10000, seed=1, workers=None, proto_dir=PROTO_DIR, lean=False):
+    """Generate a synthetic raw tree. Returns the number of powers written"""
+    protos = load_prototypes(proto_dir)
+    generate_tables(output_dir, protos['tables'], seed)
+
+    jobs = plan_jobs(output_dir, powers, seed, lean)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        _PROTOS.update(protos)
+        written = sum(map(generate_set, jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(str(proto_dir),)) as executor:
+            written = sum(executor.map(generate_set, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+    return written, len(jobs)
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1].startswith('--'):
+        print(__doc__)
+        sys.exit(1)
+
+    output_dir = Path(sys.argv[1])
+    powers = 10000
+    seed = 1
+    workers = None
+    proto_dir = PROTO_DIR
+    lean = False
+
+    # Parse arguments
+    for arg in sys.argv[2:]:
+        if arg.startswith('--powers='):
+            powers = int(arg.split('=', 1)[1])
+        elif arg.startswith('--seed='):
+            seed = int(arg.split('=', 1)[1])
+        elif arg.startswith('--workers='):
+            workers = int(arg.split('=', 1)[1])
+        elif arg.startswith('--proto='):
+            proto_dir = Path(arg.split('=', 1)[1])
+        elif arg == '--lean':
+            lean = True
+        else:
+            print(__doc__)
+            sys.exit(1)
+
+    written, sets = generate(output_dir, powers, seed, workers, proto_dir, lean)
+    print(f"Generated {written} powers in {sets} sets under {output_dir}")
+    print(f"Convert with: python batch_convert.py --raw={output_dir} --tables={output_dir / 'tables'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Per-Level Float32 Columns
+Moves the per-level arrays in effects.perLevel out of the JSON and into one
+base64 Float32 blob per file
+
+Each per-level array (MAX_LEVEL floats) becomes a column index; the columns
+are packed back to back as little-endian float32 and base64 encoded. In the
+browser, decodeLevelColumns (js/data/compact-decoder.js) decodes the blob
+into a single Float32Array and replaces each index with a subarray view,
+so the numbers are never parsed as JSON text.
+"""
+import base64
+from array import array
+
+from archetype_tables import MAX_LEVEL
+
+
+def extract_columns(powers, length=MAX_LEVEL):
+    """Copy powers with perLevel arrays replaced by column indices.
+
+    Returns (powers, columns) where columns is an array('f') holding every
+    column back to back, or (powers, None) if no power has per-level values.
+    """
+    columns = array('f')
+    count = 0
+
+    def take(values):
+        nonlocal count
+        if len(values) != length:
+            raise ValueError(f"Per-level array has {len(values)} values, expected {length}")
+        columns.extend(values)
+        count += 1
+        return count - 1
+
+    result = []
+    for power in powers:
+        per_level = power.get('effects', {}).get('perLevel')
+        if not per_level:
+            result.append(power)
+            continue
+        packed = {}
+        for key, value in per_level.items():
+            if isinstance(value, dict):
+                packed[key] = {k: take(v) for k, v in value.items()}
+            else:
+                packed[key] = take(value)
+        effects = dict(power['effects'], perLevel=packed)
+        result.append(dict(power, effects=effects))
+
+    if not count:
+        return powers, None
+    return result, columns
+
+
+def encode_columns(columns):
+    """base64 text of columns as little-endian float32"""
+    columns = array('f', columns)
+    if columns.itemsize != 4:
+        raise ValueError("array('f') is not 32-bit on this platform")
+    if array('H', [1]).tobytes() != b'\x01\x00':
+        columns.byteswap()
+    return base64.b64encode(columns.tobytes()).decode('ascii')
+
+
+def wrap_js(expression, columns, length=MAX_LEVEL):
+    """JavaScript expression that restores expression's perLevel columns"""
+    return f'decodeLevelColumns({expression}, "{encode_columns(columns)}", {length})'
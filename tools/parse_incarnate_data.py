@@ -1,11 +1,86 @@
 #!/usr/bin/env python3
-"""Parse incarnate power JSON files and generate incarnate-power-info.js"""
+"""
+Parse incarnate power JSON files and generate incarnate-power-info.js
+
+Usage:
+    python parse_incarnate_data.py [--raw=<incarnate_raw_dir>] [--output=<js_file>] [--workers=<n>]
+                                   [--cache[=<cache_file>]] [--watch] [--profile[=<report.json>]]
+    Example: python parse_incarnate_data.py --raw=../incarnate_raw_data --output=../js/incarnate-power-info.js
+
+Every slot folder, its _silent folder and the lore_pet_* folders are parsed
+in one ingest spread over a process pool, keeping only the projected
+fields. With --cache, files missing from the raw record cache are parsed by
+the pool and stored, then every record is projected from the store.
+"""
 
 import json
 import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import power_grants
+import profiling
+import raw_cache
+import raw_loader
+from build_manifest import write_if_changed
+from convert_powerset import dot_ticks
+from raw_loader import fields, load_json
+from watch import watch
+
+# Bump when the generated output changes so incremental builds redo it
+CONVERTER_VERSION = 3
+
+# Paths
+REPO_DIR = Path(__file__).resolve().parent.parent
+BASE_PATH = REPO_DIR / "incarnate_raw_data"
+OUTPUT_PATH = REPO_DIR / "js" / "incarnate-power-info.js"
+
+# Slot folders and their display names
+SLOTS = {
+    'alpha': 'Alpha',
+    'hybrid': 'Hybrid',
+    'interface': 'Interface',
+    'judgement': 'Judgement',
+    'destiny': 'Destiny',
+    'lore': 'Lore'
+}
+
+# Raw fields read from each incarnate power file; effects are what the grant resolver reads
+POWER_FIELDS = fields('full_name', 'display_name', 'display_help', 'display_short_help',
+                      'target_type', 'effect_area', effects=power_grants.GRANT_FIELDS['effects'])
+
+# Silent folders hold the powers slot powers grant; pets are in lore_pet_*
+SILENT_SUFFIX = '_silent'
+LORE_PET_PREFIX = 'lore_pet_'
+
+# Files per pool task
+INGEST_CHUNK = 64
+
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Template attribs that spawn or toggle things rather than change a stat
+NON_STAT_ATTRIBS = {'Create_Entity', 'Execute_Power', 'Set_Mode', 'Null', 'Global_Chance_Mod'}
+
+# baseStats group for each template aspect
+ASPECT_GROUPS = {
+    'Strength': 'strength',
+    'Current': 'current',
+    'Resistance': 'resistance',
+    'Absolute': 'absolute',
+    'Maximum': 'maximum',
+}
+
+# Template targets that are the incarnate's owner. These sum into baseStats;
+# templates on whatever the power affects (allies in a Destiny aura, foes hit
+# by Judgement) sum into affectedStats. A power that only targets its owner
+# affects nothing else, so all of its templates count as the owner's
+CASTER_TARGETS = {'Self', 'SelfAndPets'}
+
+# Enhancement (Strength) templates carrying this flag bypass diminishing returns
+IGNORES_DIMINISHING_FLAG = 'BoostIgnoreDiminishing'
+
 # Mapping of file prefixes to tier names - different for each slot
 TIER_MAPPINGS = {
     'alpha': {
@@ -82,7 +157,7 @@ def extract_stat_from_help(help_text):
         return None
     
     # Remove HTML tags
-    help_text = re.sub(r'<[^>]+>', '', help_text)
+    help_text = HTML_TAG_RE.sub('', help_text)
     help_text = help_text.strip()
     
     return help_text
@@ -90,20 +165,145 @@ def extract_stat_from_help(help_text):
 def parse_power_file(filepath):
     """Parse a single incarnate power JSON file"""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with profiling.stage('load'):
+            data = load_json(filepath, POWER_FIELDS)
         
-        return {
-            'name': data.get('display_name', 'Unknown'),
-            'desc': extract_stat_from_help(data.get('display_help', '')),
-            'short': data.get('display_short_help', ''),
-        }
+        with profiling.stage('extract'):
+            return {
+                'fullName': data.get('full_name', ''),
+                'name': data.get('display_name', 'Unknown'),
+                'desc': extract_stat_from_help(data.get('display_help', '')),
+                'short': data.get('display_short_help', ''),
+                'targetType': data.get('target_type', ''),
+                'effectArea': data.get('effect_area', ''),
+                'effects': data.get('effects', []),
+            }
     except Exception as e:
         print(f"Error parsing {filepath}: {e}")
         return None
 
-def parse_slot_folder(slot_name, folder_path):
-    """Parse all power files in a slot folder"""
+def ingest_folders(base_path):
+    """Every folder the ingest reads: slots, the silent folders, then lore pets"""
+    base_path = Path(base_path)
+    folders = list(SLOTS)
+    folders += sorted(p.name for p in base_path.glob("*" + SILENT_SUFFIX) if p.is_dir())
+    folders += sorted(p.name for p in base_path.glob(LORE_PET_PREFIX + "*") if p.is_dir())
+    return folders
+
+def power_files(folder_path):
+    """Power JSON files in a folder, excluding index.json, in stable order"""
+    if not os.path.isdir(folder_path):
+        return []
+    return [os.path.join(folder_path, f) for f in sorted(os.listdir(folder_path))
+            if f.endswith('.json') and f != 'index.json']
+
+def parse_power_files(paths):
+    """Parse a chunk of power files. Runs in pool workers; returns [(path, record)]"""
+    return [(path, parse_power_file(path)) for path in paths]
+
+def ingest(base_path, folders=None, workers=None):
+    """Parse every power file in folders. Returns {folder: {file name: record or None}}
+
+    Files are split into chunks across a process pool (workers=1 parses in
+    this process). With an active raw record cache, the pool only fills in
+    the records the cache is missing and everything is then projected from
+    the store.
+    """
+    folders = ingest_folders(base_path) if folders is None else folders
+    with profiling.stage('discover'):
+        paths = [path for folder in folders for path in power_files(os.path.join(base_path, folder))]
+    chunks = [paths[i:i + INGEST_CHUNK] for i in range(0, len(paths), INGEST_CHUNK)]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(chunks)))
+    
+    cache = raw_loader.active_cache()
+    if workers == 1 or cache is not None:
+        if cache is not None and cache.writable and workers > 1:
+            stale = cache.stale(paths)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for entries in pool.map(raw_cache.parse_records, [stale[i:i + INGEST_CHUNK]
+                                                                  for i in range(0, len(stale), INGEST_CHUNK)]):
+                    cache.add(entries)
+        parsed = parse_power_files(paths)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parsed = [item for chunk in pool.map(parse_power_files, chunks) for item in chunk]
+    
+    records = {folder: {} for folder in folders}
+    for path, record in parsed:
+        records[os.path.basename(os.path.dirname(path))][os.path.basename(path)] = record
+    return records
+
+def grant_resolver(records):
+    """GrantResolver over every ingested power, keyed by full name"""
+    return power_grants.GrantResolver({record['fullName']: record
+                                       for files in records.values()
+                                       for record in files.values() if record and record['fullName']})
+
+def sum_stat_templates(templates):
+    """Sum stat templates into {group: {attrib: value}}
+
+    Groups follow the template aspect; enhancement templates that ignore
+    diminishing returns go to strengthIgnoresDiminishing. Values are scale
+    times magnitude summed over every template, i.e. the peak when all of
+    them apply; Absolute templates that repeat (DoTs, heals over time)
+    count once per tick. *_Ones tables are 1.0 at every level, so those
+    values are plain numbers under the attrib; values on any other table
+    are {scale, table} under "attrib:table" for the browser to multiply by
+    the archetype's table entry.
+    """
+    totals = {}
+    for template in templates:
+        attribs = template.get('attribs') or []
+        group = ASPECT_GROUPS.get(template.get('aspect'))
+        if group is None or NON_STAT_ATTRIBS.intersection(attribs):
+            continue
+        if group == 'strength' and any(flag.startswith(IGNORES_DIMINISHING_FLAG)
+                                       for flag in template.get('flags') or []):
+            group = 'strengthIgnoresDiminishing'
+        ticks = dot_ticks(template) if group == 'absolute' else 0
+        if ticks is None:
+            continue
+        table = template.get('table', '')
+        if table.lower().endswith('_ones'):
+            table = None
+        value = template.get('scale', 0.0) * template.get('magnitude', 1.0) * max(ticks, 1)
+        for attrib in attribs:
+            key = (group, attrib, table)
+            totals[key] = totals.get(key, 0.0) + value
+    
+    base_stats = {}
+    for (group, attrib, table), value in totals.items():
+        stats = base_stats.setdefault(group, {})
+        value = round(value, 6)
+        if table is None:
+            stats[attrib] = value
+        else:
+            stats[f"{attrib}:{table}"] = {'scale': value, 'table': table}
+    return base_stats
+
+def collect_stats(record, resolver):
+    """(baseStats, affectedStats) of a tier: its stat templates, grants followed, summed by target"""
+    caster, affected = [], []
+    for power in resolver.powers(record['fullName']):
+        data = resolver.record(power)
+        self_only = data.get('targetType') == 'Self' and data.get('effectArea') == 'SingleTarget'
+        for template in resolver.own_templates(power):
+            (caster if self_only or template.get('target') in CASTER_TARGETS else affected).append(template)
+    return sum_stat_templates(caster), sum_stat_templates(affected)
+
+def split_tier(base_name, sorted_suffixes):
+    """(power name, tier) for a file name without .json; tier is None if no suffix matches"""
+    for suffix, tier_id in sorted_suffixes:
+        if base_name.endswith(suffix):
+            return base_name[:-len(suffix)], tier_id
+    return base_name, None
+
+def parse_slot_folder(slot_name, folder_path, records=None, resolver=None):
+    """Build a slot's powers from its folder's parsed records (parsed here if not given)
+
+    resolver (see grant_resolver) follows grants into the silent powers; with
+    no resolver only the tier's own templates count.
+    """
     powers = {}
     
     if not os.path.isdir(folder_path):
@@ -116,45 +316,37 @@ def parse_slot_folder(slot_name, folder_path):
         print(f"Warning: No tier mapping for slot '{slot_name}'")
         return powers
     
-    # Get all JSON files
-    json_files = sorted([f for f in os.listdir(folder_path) if f.endswith('.json')])
+    if records is None:
+        records = {os.path.basename(path): record
+                   for path, record in parse_power_files(power_files(folder_path))}
+    json_files = sorted(records)
     
     # Sort suffixes by length (longest first) to match longer suffixes before shorter ones
     sorted_suffixes = sorted(tier_mapping.items(), key=lambda x: len(x[0]), reverse=True)
     
     for json_file in json_files:
-        # Skip index.json
-        if json_file == 'index.json':
-            continue
-        
-        filepath = os.path.join(folder_path, json_file)
-        
         # Extract power name and tier
         base_name = json_file.replace('.json', '')
         
         # Find matching tier suffix
-        tier = None
-        power_name = base_name
-        
-        for suffix, tier_id in sorted_suffixes:
-            if base_name.endswith(suffix):
-                tier = tier_id
-                power_name = base_name[:-len(suffix)]
-                break
+        power_name, tier = split_tier(base_name, sorted_suffixes)
         
         if not tier:
             print(f"Warning: Could not determine tier for {json_file}")
             continue
         
-        # Parse the file
-        power_data = parse_power_file(filepath)
+        power_data = records[json_file]
         if not power_data:
             continue
         
+        profiling.count('powers')
+        
         # Add to powers dict
         if power_name not in powers:
             powers[power_name] = {}
         
+        base_stats, affected_stats = collect_stats(power_data, resolver or power_grants.GrantResolver(
+            {power_data['fullName']: power_data}))
         powers[power_name][tier] = {
             'desc': power_data['desc'],
             'targets': 'Self',
@@ -162,70 +354,133 @@ def parse_slot_folder(slot_name, folder_path):
             'radius': '0',
             'arc': '0',
             'effects': [],
-            'baseStats': {}
+            'baseStats': base_stats,
+            'affectedStats': affected_stats
         }
     
     return powers
 
-def main():
-    base_path = r"C:\Projects\CoH-Planner\incarnate_raw_data"
-    
-    slots = {
-        'alpha': 'Alpha',
-        'hybrid': 'Hybrid',
-        'interface': 'Interface',
-        'judgement': 'Judgement',
-        'destiny': 'Destiny',
-        'lore': 'Lore'
-    }
+def write_incarnate_info(all_data, output_path):
+    """Generate incarnate-power-info.js from parsed slot data. Returns True if the file changed"""
+    with profiling.stage('emit'):
+        js_output = "// Auto-generated from raw incarnate power JSON files\n\n"
+        js_output += "const IncarnatePowerInfo = {\n"
+        
+        for slot_key, powers_dict in sorted(all_data.items()):
+            js_output += f"  {slot_key}: {{\n"
+            
+            for power_name, tiers in sorted(powers_dict.items()):
+                js_output += f"    '{power_name}': {{\n"
+                
+                for tier_id, tier_data in sorted(tiers.items()):
+                    js_output += f"      '{tier_id}': {{\n"
+                    js_output += f"        desc: {json.dumps(tier_data['desc'])},\n"
+                    js_output += f"        targets: 'Self',\n"
+                    js_output += f"        range: '0',\n"
+                    js_output += f"        radius: '0',\n"
+                    js_output += f"        arc: '0',\n"
+                    js_output += f"        effects: [],\n"
+                    js_output += f"        baseStats: {json.dumps(tier_data['baseStats'])},\n"
+                    js_output += f"        affectedStats: {json.dumps(tier_data['affectedStats'])},\n"
+                    js_output += f"        damageType: 'None'\n"
+                    js_output += f"      }},\n"
+                
+                js_output += f"    }},\n"
+            
+            js_output += f"  }},\n"
+        
+        js_output += "};\n"
     
+    # Write output file
+    with profiling.stage('write'):
+        written = write_if_changed(output_path, js_output)
+    if written:
+        profiling.count('bytes_written', len(js_output.encode('utf-8')))
+    else:
+        profiling.count('unchanged')
+    return written
+
+def parse_slot(all_data, base_path, folder_name, records=None, resolver=None):
+    """Parse one slot folder into all_data, dropping the slot if it is empty"""
+    powers = parse_slot_folder(folder_name, os.path.join(base_path, folder_name), records, resolver)
+    if powers:
+        all_data[folder_name] = powers
+    else:
+        all_data.pop(folder_name, None)
+    return powers
+
+def build_incarnate_info(base_path=BASE_PATH, output_path=OUTPUT_PATH, workers=None, records=None):
+    """Ingest every incarnate folder and write incarnate-power-info.js. Returns the parsed slots
+
+    records ({folder: {file name: record}}) keeps an earlier ingest; folders
+    missing from it are ingested and added to it.
+    """
     all_data = {}
     
-    for folder_name, display_name in slots.items():
-        folder_path = os.path.join(base_path, folder_name)
+    records = {} if records is None else records
+    missing = [folder for folder in ingest_folders(base_path) if folder not in records]
+    records.update(ingest(base_path, missing, workers))
+    print(f"Ingested {sum(len(records[folder]) for folder in missing)} files from {len(missing)} folders")
+    resolver = grant_resolver(records)
+    
+    for folder_name, display_name in SLOTS.items():
         print(f"Parsing {display_name} slot...")
         
-        powers = parse_slot_folder(folder_name, folder_path)
+        powers = parse_slot(all_data, base_path, folder_name, records[folder_name], resolver)
         if powers:
-            all_data[folder_name] = powers
             print(f"  Found {len(powers)} powers")
     
-    # Generate JavaScript output
-    js_output = "// Auto-generated from raw incarnate power JSON files\n\n"
-    js_output += "const IncarnatePowerInfo = {\n"
+    written = write_incarnate_info(all_data, output_path)
     
-    for slot_key, powers_dict in sorted(all_data.items()):
-        js_output += f"  {slot_key}: {{\n"
-        
-        for power_name, tiers in sorted(powers_dict.items()):
-            js_output += f"    '{power_name}': {{\n"
-            
-            for tier_id, tier_data in sorted(tiers.items()):
-                js_output += f"      '{tier_id}': {{\n"
-                js_output += f"        desc: {json.dumps(tier_data['desc'])},\n"
-                js_output += f"        targets: 'Self',\n"
-                js_output += f"        range: '0',\n"
-                js_output += f"        radius: '0',\n"
-                js_output += f"        arc: '0',\n"
-                js_output += f"        effects: [],\n"
-                js_output += f"        baseStats: {{}},\n"
-                js_output += f"        damageType: 'None'\n"
-                js_output += f"      }},\n"
-            
-            js_output += f"    }},\n"
-        
-        js_output += f"  }},\n"
+    print(f"\n{'Generated' if written else 'Unchanged'} {output_path}")
+    print(f"Total slots: {len(all_data)}")
+    print(f"Total powers: {sum(len(powers) for powers in all_data.values())}")
+    return all_data
+
+def main():
+    base_path = BASE_PATH
+    output_path = OUTPUT_PATH
+    workers = None
     
-    js_output += "};\n"
+    cache = None
+    watching = False
+    profile_path = None
+    for arg in sys.argv[1:]:
+        if profiling.profile_arg(arg, 'parse_incarnate_data'):
+            profile_path = profiling.profile_arg(arg, 'parse_incarnate_data')
+            profiling.start('parse_incarnate_data')
+        elif raw_cache.cache_arg(arg):
+            cache = raw_cache.enable(raw_cache.cache_arg(arg))
+        elif arg.startswith('--raw='):
+            base_path = Path(arg.split('=', 1)[1])
+        elif arg.startswith('--output='):
+            output_path = Path(arg.split('=', 1)[1])
+        elif arg.startswith('--workers='):
+            workers = int(arg.split('=', 1)[1])
+        elif arg == '--watch':
+            watching = True
+        else:
+            print(__doc__)
+            sys.exit(1)
     
-    # Write output file
-    output_path = r"C:\Projects\CoH-Planner\js\incarnate-power-info.js"
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(js_output)
+    records = {}
+    build_incarnate_info(base_path, output_path, workers, records)
     
-    print(f"\nGenerated {output_path}")
-    print(f"Total slots: {len(all_data)}")
-    print(f"Total powers: {sum(len(powers) for powers in all_data.values())}")
+    if watching:
+        def on_change(changed, removed):
+            # Reingest only the folders that saw a change; a silent power can feed any slot
+            touched = {Path(p).relative_to(base_path).parts[0] for p in changed + removed}
+            for folder_name in sorted(touched & records.keys()):
+                records.pop(folder_name)
+                print(f"Reingesting {folder_name}")
+            build_incarnate_info(base_path, output_path, workers, records)
+        
+        watch([os.path.join(base_path, folder_name) for folder_name in records], on_change)
+    
+    if profile_path:
+        profiling.finish(profile_path)
+    if cache:
+        raw_cache.disable(cache)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Power Grant Resolver
+Follows Grant_Power / Revoke_Power chains through a raw power tree
+
+Many powers do their work through other powers: incarnate slot powers
+(alpha/agility_boost.json) grant silent powers such as
+Incarnate.Alpha_Silent.Recovery_Uncommon, which hold the real effect
+templates. GrantResolver indexes every power by full name once and
+resolves a power to the ordered set of powers it ends up running (itself
+first, each granted power once) and their flattened templates.
+
+Both results are memoized per power, so converters can follow grants from
+any number of powers without rescanning or reparsing files. A grant that
+leads back to a power already on the chain is reported once as a cycle and
+not followed again. Grants of unknown powers are reported once and skipped.
+
+Only effects that always apply while the power is active are followed:
+effect groups that fire on a chance or PPM (procs) are left out, and so are
+grants of powers whose effect groups all carry a tag the granting power sets
+a chance for through Global_Chance_Mod (Interface grants its DoT powers at
+chance 1.0 and makes them procs that way).
+
+Revoke_Power templates applied when the power turns off only undo the
+power's own grants, so they are ignored. Any other Revoke_Power removes the
+revoked power from the resolved set.
+"""
+from pathlib import Path
+
+from raw_loader import fields, load_json
+
+GRANT_ATTRIB = 'Grant_Power'
+REVOKE_ATTRIB = 'Revoke_Power'
+CHANCE_MOD_ATTRIB = 'Global_Chance_Mod'
+
+# Revokes applied when the granting power shuts off (cleanup of its own grants)
+CLEANUP_APPLICATIONS = {'OnDisable', 'OnDeactivate'}
+
+# Raw fields the resolver reads (raw effects nest one level of children)
+TEMPLATE_FIELDS = fields('attribs', 'aspect', 'target', 'table', 'scale', 'magnitude', 'duration',
+                         'application_period', 'flags', 'params', 'application_type')
+EFFECT_FIELDS = fields('chance', 'ppm', 'tags', templates=TEMPLATE_FIELDS)
+GRANT_FIELDS = fields('full_name', effects=dict(EFFECT_FIELDS, child_effects=EFFECT_FIELDS))
+
+
+def scan_index(roots):
+    """Full name -> path for every power JSON under roots"""
+    index = {}
+    for root in roots:
+        for path in sorted(Path(root).rglob("*.json")):
+            if path.name == 'index.json':
+                continue
+            try:
+                record = load_json(path, fields('full_name'))
+            except Exception as e:
+                print(f"Error parsing {path}: {e}")
+                continue
+            if isinstance(record, dict) and record.get('full_name'):
+                index[record['full_name']] = path
+    return index
+
+
+def is_proc(effect):
+    """True for an effect group that only fires on a chance or PPM"""
+    return effect.get('chance', 1.0) < 1.0 or effect.get('ppm', 0.0) > 0
+
+
+class GrantResolver:
+    """Memoized resolution of grant chains over a full name index"""
+
+    def __init__(self, index):
+        # Lowercase full name -> raw record or path to load it from
+        self.index = {name.lower(): value for name, value in index.items()}
+        # Lowercase full name -> (grants, revokes, templates) of the power itself
+        self._own = {}
+        # Lowercase full name -> resolved full names / templates
+        self._powers = {}
+        self._templates = {}
+        self.cycles = set()
+        self.missing = set()
+
+    @classmethod
+    def scan(cls, roots):
+        """Resolver over every power JSON under roots"""
+        return cls(scan_index(roots))
+
+    def __contains__(self, full_name):
+        return full_name.lower() in self.index
+
+    def record(self, full_name):
+        """Raw record of a power, loaded on first use (None if unknown)"""
+        key = full_name.lower()
+        value = self.index.get(key)
+        if value is not None and not isinstance(value, dict):
+            value = self.index[key] = load_json(value, GRANT_FIELDS)
+        return value
+
+    def _split(self, key):
+        """Grants, revokes and stat templates of one power, read once"""
+        if key in self._own:
+            return self._own[key]
+
+        grants, revokes, templates = [], [], []
+        chance_tags = set()
+
+        def visit(effects):
+            for effect in effects:
+                if is_proc(effect):
+                    continue
+                for template in effect.get('templates', []):
+                    attribs = template.get('attribs') or []
+                    params = template.get('params') or {}
+                    names = [name.lower() for name in params.get('power_names', [])]
+                    if GRANT_ATTRIB in attribs:
+                        grants.extend(names)
+                    elif CHANCE_MOD_ATTRIB in attribs:
+                        chance_tags.update(params.get('tags') or [])
+                    elif REVOKE_ATTRIB in attribs:
+                        if template.get('application_type') not in CLEANUP_APPLICATIONS:
+                            revokes.extend(names)
+                    else:
+                        templates.append(template)
+                visit(effect.get('child_effects') or [])
+
+        visit((self.record(key) or {}).get('effects', []))
+        grants = [name for name in grants if not self._gated(name, chance_tags)]
+        self._own[key] = (grants, revokes, templates)
+        return self._own[key]
+
+    def _gated(self, key, chance_tags):
+        """True if every effect group of a power carries one of chance_tags (a proc)"""
+        effects = (self.record(key) or {}).get('effects', [])
+        return bool(chance_tags and effects) and all(chance_tags.intersection(effect.get('tags') or [])
+                                                     for effect in effects)
+
+    def _walk(self, key, stack):
+        """Resolve key below stack. Returns (powers, index of the highest cycle head or None)"""
+        if key in self._powers:
+            return self._powers[key], None
+        if key in stack:
+            cycle = tuple(stack[stack.index(key):] + [key])
+            if cycle not in self.cycles:
+                self.cycles.add(cycle)
+                print(f"Warning: Grant cycle: {' -> '.join(cycle)}")
+            return (), stack.index(key)
+        if key not in self.index:
+            if key not in self.missing:
+                self.missing.add(key)
+                print(f"Warning: Granted power not found: {key}")
+            return (), None
+
+        grants, revokes, _ = self._split(key)
+        stack.append(key)
+        powers = [key]
+        head = None
+        for granted in grants:
+            resolved, cycle_head = self._walk(granted, stack)
+            powers.extend(power for power in resolved if power not in powers)
+            if cycle_head is not None:
+                head = cycle_head if head is None else min(head, cycle_head)
+        stack.pop()
+
+        powers = tuple(power for power in powers if power not in revokes)
+        # Powers inside a cycle that started further up only have a partial set
+        if head is not None and head < len(stack):
+            return powers, head
+        self._powers[key] = powers
+        return powers, None
+
+    def powers(self, full_name):
+        """Lowercase full names a power runs: itself first, then each granted power once"""
+        return self._walk(full_name.lower(), [])[0]
+
+    def grants(self, full_name):
+        """Lowercase full names a power grants directly"""
+        return tuple(self._split(full_name.lower())[0])
+
+    def own_templates(self, full_name):
+        """Stat templates of a power itself, grants not followed"""
+        return tuple(self._split(full_name.lower())[2])
+
+    def templates(self, full_name):
+        """Flattened stat templates of a power and everything it grants"""
+        key = full_name.lower()
+        if key not in self._templates:
+            self._templates[key] = tuple(template for power in self.powers(key)
+                                         for template in self._split(power)[2])
+        return self._templates[key]
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Shared Powerset Deltas
+Stores a powerset that several archetypes share as one base definition plus
+a small delta per archetype
+
+Archetypes that share a powerset (dark_armor for brutes, scrappers,
+stalkers, tankers and sentinels) get near-identical files: the powers are
+the same apart from archetype-scaled magnitudes, set categories, unlock
+levels and a few powers only some archetypes have. split() picks the
+archetype view that makes the deltas smallest as the base and describes
+every other view as changes to it. A delta is JSON:
+
+    scalar                      replaces the value
+    {"$set": value}             replaces the value (objects and arrays)
+    {"$edit": [p, text, s]}     keeps the first p and last s characters of the
+                                base string and puts text between them
+    {"$list": [i | str, ...]}   string list: base items by index, or new strings
+    {"$items": [...]}           powers (any list of uniquely named objects):
+                                i keeps base[i], [i, delta] changes it and an
+                                object is a new item
+    {"$scale": r, "$del": [keys], key: delta, ...}
+                                object: multiplies every non-integer number
+                                below it by r, drops keys, changes or adds keys
+
+Archetype modifiers scale whole effect groups, so "$scale" usually replaces
+every magnitude in a group. apply() rebuilds a view exactly; the browser
+does the same with applyPowersetDelta (js/data/compact-decoder.js).
+"""
+import json
+from collections import Counter
+
+# Shared bases are written to js/data/powersets/<BASE_DIR>/
+BASE_DIR = 'base'
+
+# Strings shorter than this are replaced rather than edited
+MIN_EDIT_LENGTH = 32
+
+_SAME = object()
+
+
+def _size(value):
+    return len(json.dumps(value, separators=(',', ':'), ensure_ascii=False))
+
+
+def _same(a, b):
+    """Equal values of the same types all the way down (1 and 1.0 differ)"""
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return list(a) == list(b) and all(_same(a[k], b[k]) for k in a)
+    if isinstance(a, list):
+        return len(a) == len(b) and all(_same(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def _scalable(value):
+    """Numbers $scale multiplies: non-integer floats, as Number.isInteger sees them"""
+    return isinstance(value, float) and not value.is_integer()
+
+
+def _scale(value, ratio):
+    if isinstance(value, dict):
+        return {key: _scale(item, ratio) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_scale(item, ratio) for item in value]
+    return value * ratio if _scalable(value) else value
+
+
+def _keyed(value):
+    """True for a non-empty list of objects with unique names (e.g. powers)"""
+    if not isinstance(value, list) or not value:
+        return False
+    if not all(isinstance(item, dict) and isinstance(item.get('name'), str) for item in value):
+        return False
+    return len({item['name'] for item in value}) == len(value)
+
+
+def _ratios(a, b, counts):
+    """Count b/a for every pair of differing numbers at the same place"""
+    if isinstance(a, dict) and isinstance(b, dict):
+        for key, item in a.items():
+            if key in b:
+                _ratios(item, b[key], counts)
+    elif isinstance(a, list) and isinstance(b, list) and len(a) == len(b) and not _keyed(a):
+        for x, y in zip(a, b):
+            _ratios(x, y, counts)
+    elif _scalable(a) and isinstance(b, float) and a != b:
+        counts[b / a] += 1
+
+
+def _replace(value):
+    return {'$set': value} if isinstance(value, (dict, list)) else value
+
+
+def _object_diff(a, b):
+    if any(key.startswith('$') for key in b):
+        raise ValueError(f"Keys starting with '$' are reserved for deltas: {list(b)}")
+    kept = [key for key in a if key in b]
+    # Rebuilt objects keep base order and append new keys; anything else is replaced
+    if list(b) != kept + [key for key in b if key not in a]:
+        return {'$set': b}
+    delta = {}
+    removed = [key for key in a if key not in b]
+    if removed:
+        delta['$del'] = removed
+    for key, value in b.items():
+        if key not in a:
+            delta[key] = _replace(value)
+            continue
+        change = _diff(a[key], value)
+        if change is not _SAME:
+            delta[key] = change
+    return delta
+
+
+def _string_edit(a, b):
+    if len(a) < MIN_EDIT_LENGTH or len(b) < MIN_EDIT_LENGTH:
+        return None
+    # JavaScript indexes strings by UTF-16 unit; keep to characters where that matches
+    if max(map(ord, a + b)) > 0xFFFF:
+        return None
+    shortest = min(len(a), len(b))
+    prefix = 0
+    while prefix < shortest and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < shortest - prefix and a[-1 - suffix] == b[-1 - suffix]:
+        suffix += 1
+    return {'$edit': [prefix, b[prefix:len(b) - suffix], suffix]}
+
+
+def _diff(a, b):
+    """Delta turning a into b, or _SAME"""
+    if _same(a, b):
+        return _SAME
+
+    if isinstance(a, dict) and isinstance(b, dict):
+        best = _object_diff(a, b)
+        counts = Counter()
+        _ratios(a, b, counts)
+        if counts:
+            ratio, count = counts.most_common(1)[0]
+            if count > 1:
+                scaled = _object_diff(_scale(a, ratio), b)
+                if '$set' not in scaled:
+                    scaled = {'$scale': ratio, **scaled}
+                    if _size(scaled) < _size(best):
+                        best = scaled
+        return best
+
+    if _keyed(a) and _keyed(b):
+        index = {item['name']: i for i, item in enumerate(a)}
+        items = []
+        for item in b:
+            i = index.get(item['name'])
+            if i is None:
+                items.append(item)
+                continue
+            change = _diff(a[i], item)
+            items.append(i if change is _SAME else [i, change])
+        return {'$items': items}
+
+    candidates = [_replace(b)]
+    if isinstance(a, str) and isinstance(b, str):
+        edit = _string_edit(a, b)
+        if edit:
+            candidates.append(edit)
+    elif isinstance(a, list) and isinstance(b, list) and all(isinstance(v, str) for v in a + b):
+        index = {item: i for i, item in enumerate(a)}
+        candidates.append({'$list': [index.get(item, item) for item in b]})
+    return min(candidates, key=_size)
+
+
+def diff(base, view):
+    """Delta that rebuilds view from base ({} if they are the same)"""
+    change = _diff(base, view)
+    return {} if change is _SAME else change
+
+
+def apply(base, delta):
+    """Rebuild a view from base and its delta; base is not modified"""
+    if not isinstance(delta, dict):
+        return delta
+    if '$set' in delta:
+        return json.loads(json.dumps(delta['$set']))
+    if '$edit' in delta:
+        prefix, text, suffix = delta['$edit']
+        return base[:prefix] + text + base[len(base) - suffix:]
+    if '$list' in delta:
+        return [base[item] if isinstance(item, int) else item for item in delta['$list']]
+    if '$items' in delta:
+        return [_scale(base[item], 1) if isinstance(item, int)
+                else apply(base[item[0]], item[1]) if isinstance(item, list)
+                else apply(None, {'$set': item})
+                for item in delta['$items']]
+
+    source = _scale(base, delta.get('$scale', 1))
+    removed = set(delta.get('$del', ()))
+    view = {}
+    for key, value in source.items():
+        if key not in removed:
+            view[key] = apply(value, delta[key]) if key in delta else value
+    for key, change in delta.items():
+        if not key.startswith('$') and key not in source:
+            view[key] = apply(None, change)
+    return view
+
+
+def split(views):
+    """Pick a base among {archetype: view}. Returns (base archetype, {archetype: delta})
+
+    Every delta is checked to rebuild its view exactly; ValueError if not.
+    """
+    best = None
+    for candidate, base in views.items():
+        deltas = {archetype: diff(base, view) for archetype, view in views.items()}
+        total = sum(_size(delta) for delta in deltas.values())
+        if best is None or total < best[0]:
+            best = (total, candidate, deltas)
+
+    _, base_archetype, deltas = best
+    base = views[base_archetype]
+    for archetype, delta in deltas.items():
+        if not _same(apply(base, delta), views[archetype]):
+            raise ValueError(f"Delta for {archetype} does not rebuild its powerset")
+    return base_archetype, deltas
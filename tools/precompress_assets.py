@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Precompressed Asset Emitter
+Writes content-hashed, precompressed copies of the generated data files and
+script bundles for static hosting
+
+Usage:
+    python precompress_assets.py [--root=<site_dir>] [--dist=<output_dir>] [--workers=<n>]
+    Example: python precompress_assets.py --dist=../dist
+
+Every file under js/data and js/bundles, plus js/incarnate-power-info.js, is
+written to the dist directory under a content-hashed name, e.g.
+
+    js/data/io-sets.js  ->  dist/js/data/io-sets.<hash>.js
+                            dist/js/data/io-sets.<hash>.js.gz
+                            dist/js/data/io-sets.<hash>.js.br
+
+Shards and bundles already carry a hash and keep their names. The .br
+variant is written only when the brotli module is installed, and a variant
+is skipped when it would not be smaller than the file itself. The mapping
+from logical to hashed names is saved as dist/asset-manifest.json, and
+dist/index.html is a copy of index.html whose script tags point at the
+hashed names.
+
+Copy dist/ over the site root when deploying. Hashed names never change
+content, so they can be served with "Cache-Control: immutable", and
+servers with gzip_static / brotli_static send the precompressed bytes
+as they are. Files already in dist are reused; stale ones are removed.
+"""
+import gzip
+import hashlib
+import json
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from bundle_scripts import INDEX_HTML, SCRIPT_RE
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+DIST_DIR = REPO_DIR / "dist"
+ASSET_MANIFEST = "asset-manifest.json"
+
+# Generated assets, relative to the site root
+ASSET_SOURCES = ("js/data", "js/bundles", "js/incarnate-power-info.js")
+
+# Names written by build_shards.py / bundle_scripts.py: <name>.<10 hex>.js
+HASHED_NAME_RE = re.compile(r'\.[0-9a-f]{10}\.js$')
+
+COMPRESSORS = {'.gz': lambda data: gzip.compress(data, compresslevel=9, mtime=0)}
+if brotli:
+    COMPRESSORS['.br'] = lambda data: brotli.compress(data, quality=11)
+
+
+def asset_files(root):
+    """Logical paths (relative to root) of every generated asset, sorted"""
+    found = set()
+    for source in ASSET_SOURCES:
+        path = root / source
+        if path.is_dir():
+            found.update(p for p in path.rglob("*.js") if p.is_file())
+        elif path.is_file():
+            found.add(path)
+    return sorted(p.relative_to(root).as_posix() for p in found)
+
+
+def hashed_name(logical, data):
+    """Content-hashed path for logical; names that already carry a hash are kept"""
+    if HASHED_NAME_RE.search(logical):
+        return logical
+    digest = hashlib.blake2b(data, digest_size=5).hexdigest()
+    stem, dot, suffix = logical.rpartition('.')
+    return f"{stem}.{digest}.{suffix}" if dot else f"{logical}.{digest}"
+
+
+def emit_asset(root, dist_dir, logical):
+    """Write one asset and its compressed variants. Returns (logical, hashed, sizes)"""
+    data = (Path(root) / logical).read_bytes()
+    hashed = hashed_name(logical, data)
+    target = Path(dist_dir) / hashed
+    sizes = {'': len(data)}
+    if not target.exists():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(data)
+    for suffix, compress in COMPRESSORS.items():
+        variant = target.with_name(target.name + suffix)
+        if variant.exists():
+            sizes[suffix] = variant.stat().st_size
+            continue
+        packed = compress(data)
+        if len(packed) < len(data):
+            variant.write_bytes(packed)
+            sizes[suffix] = len(packed)
+    return logical, hashed, sizes
+
+
+def rewrite_index(index_html, mapping):
+    """index.html text with script sources swapped for their hashed names"""
+    def swap(match):
+        src = match.group(1)
+        path, query, rest = src.partition('?')
+        if path not in mapping:
+            return match.group(0)
+        return match.group(0).replace(f'"{src}"', f'"{mapping[path]}{query}{rest}"', 1)
+
+    return SCRIPT_RE.sub(swap, Path(index_html).read_text(encoding='utf-8'))
+
+
+def remove_stale(dist_dir, keep):
+    """Delete files in dist_dir that are not in keep (paths relative to dist_dir)"""
+    for path in sorted(dist_dir.rglob("*"), reverse=True):
+        if path.is_file() and path.relative_to(dist_dir).as_posix() not in keep:
+            path.unlink()
+        elif path.is_dir() and not any(path.iterdir()):
+            path.rmdir()
+
+
+def precompress(root=REPO_DIR, dist_dir=DIST_DIR, workers=None):
+    """Emit every generated asset into dist_dir. Returns {logical: hashed}"""
+    root = Path(root)
+    dist_dir = Path(dist_dir)
+    # Stale files are deleted, so dist must not hold the site itself
+    if root.resolve() == dist_dir.resolve() or dist_dir.resolve() in root.resolve().parents:
+        raise ValueError(f"Output directory {dist_dir} contains the site root {root}")
+    logicals = asset_files(root)
+    if not logicals:
+        raise ValueError(f"No generated assets found under {root}")
+    dist_dir.mkdir(parents=True, exist_ok=True)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(emit_asset, [root] * len(logicals), [dist_dir] * len(logicals),
+                                logicals, chunksize=16))
+
+    mapping = {logical: hashed for logical, hashed, _ in results}
+    keep = {ASSET_MANIFEST, 'index.html'}
+    for _, hashed, sizes in results:
+        keep.update(hashed + suffix for suffix in sizes)
+    remove_stale(dist_dir, keep)
+
+    with open(dist_dir / ASSET_MANIFEST, 'w', encoding='utf-8') as f:
+        json.dump(mapping, f, indent=2)
+    index_html = root / INDEX_HTML.name
+    if index_html.exists():
+        (dist_dir / 'index.html').write_text(rewrite_index(index_html, mapping), encoding='utf-8')
+
+    for suffix in [''] + list(COMPRESSORS):
+        total = sum(sizes.get(suffix, sizes['']) for _, _, sizes in results)
+        print(f"  {suffix or 'raw':>4}: {total / 1e6:.2f} MB")
+    if not brotli:
+        print("  brotli is not installed; skipped .br variants")
+    print(f"Wrote {len(mapping)} assets to {dist_dir}")
+    return mapping
+
+
+def main():
+    root = REPO_DIR
+    dist_dir = DIST_DIR
+    workers = None
+
+    for arg in sys.argv[1:]:
+        if arg.startswith('--root='):
+            root = Path(arg.split('=', 1)[1])
+        elif arg.startswith('--dist='):
+            dist_dir = Path(arg.split('=', 1)[1])
+        elif arg.startswith('--workers='):
+            workers = int(arg.split('=', 1)[1])
+        else:
+            print(__doc__)
+            sys.exit(1)
+
+    try:
+        precompress(root, dist_dir, workers)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Converter Profiling
+Per-stage wall time and counters behind the converters' --profile flag
+
+The converters wrap their stages (discover, load, classify, scale, emit,
+write) in profiling.stage() and bump counters with profiling.count(). Both
+are no-ops until start() installs a Profile, so unprofiled runs pay one
+attribute lookup per call. Stages may nest; a nested stage's time is also
+included in its parent's.
+
+finish() adds the table-lookup and raw-cache counters kept by the shared
+stores and writes everything to a JSON report.
+"""
+import json
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+
+import archetype_tables
+import raw_loader
+from build_manifest import CACHE_DIR
+
+
+class Profile:
+    """Accumulated stage timings and counters for one converter run"""
+
+    def __init__(self, tool):
+        self.tool = tool
+        self.started = time.perf_counter()
+        self.stages = {}
+        self.counters = {}
+        self._lookups = archetype_tables.lookup_count()
+
+    @contextmanager
+    def stage(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            entry = self.stages.get(name)
+            if entry is None:
+                entry = self.stages[name] = {'seconds': 0.0, 'calls': 0}
+            entry['seconds'] += time.perf_counter() - started
+            entry['calls'] += 1
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def report(self):
+        """Machine-readable summary of the run so far"""
+        counters = dict(self.counters)
+        counters['table_lookups'] = archetype_tables.lookup_count() - self._lookups
+        cache = raw_loader.active_cache()
+        if cache is not None:
+            counters['cache_hits'] = cache.hits
+            counters['cache_misses'] = cache.misses
+        return {
+            'tool': self.tool,
+            'json_backend': raw_loader.JSON_BACKEND,
+            'wall_seconds': time.perf_counter() - self.started,
+            'stages': self.stages,
+            'counters': dict(sorted(counters.items())),
+        }
+
+
+class _NoProfile:
+    """Stand-in used while profiling is off"""
+
+    def stage(self, name):
+        return nullcontext()
+
+    def count(self, name, n=1):
+        pass
+
+
+_ACTIVE = _NoProfile()
+
+
+def stage(name):
+    """Context manager timing a stage of the active profile"""
+    return _ACTIVE.stage(name)
+
+
+def count(name, n=1):
+    """Add n to a counter of the active profile"""
+    _ACTIVE.count(name, n)
+
+
+def start(tool):
+    """Begin profiling a converter run"""
+    global _ACTIVE
+    _ACTIVE = Profile(tool)
+    return _ACTIVE
+
+
+def finish(path):
+    """Write the active profile's report to path and stop profiling"""
+    global _ACTIVE
+    profile = _ACTIVE
+    _ACTIVE = _NoProfile()
+    if not isinstance(profile, Profile):
+        return None
+    report = profile.report()
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Profile written to {path}")
+    return report
+
+
+def profile_arg(arg, tool):
+    """Report path for a --profile or --profile=<path> argument, else None"""
+    if arg == '--profile':
+        return CACHE_DIR / f"profile-{tool}.json"
+    if arg.startswith('--profile='):
+        return Path(arg.split('=', 1)[1])
+    return None
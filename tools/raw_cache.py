@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Raw Record Cache
+Preparsed binary store of normalized raw power records
+
+Usage:
+    python raw_cache.py <raw_dir> [<raw_dir> ...] [--cache=<cache_file>]
+    Example: python raw_cache.py "C:/Raw Data Homecoming/powers" ../incarnate_raw_data
+
+Every raw JSON is parsed once, cut down to raw_loader.RECORD_FIELDS and
+marshalled into a single file keyed by resolved path, mtime and size. Later runs
+memory-map the file and unmarshal only the records they ask for, so a warm
+converter run skips JSON parsing entirely. Stale entries (changed mtime or
+size) and files that can no longer be read are treated as misses; stale
+entries are replaced on the next save.
+
+File layout: MAGIC, 8-byte little-endian index offset, record blobs, then a
+marshalled index {key: (offset, length, mtime_ns, size)}.
+"""
+import marshal
+import mmap
+import os
+import struct
+import sys
+from pathlib import Path
+
+import raw_loader
+from build_manifest import CACHE_DIR
+
+MAGIC = b'CoHRAW6\n'
+HEADER = struct.Struct('<Q')
+DEFAULT_CACHE = CACHE_DIR / "raw-records.bin"
+
+
+def cache_key(path):
+    """Index key for a raw file: its resolved path, however it was reached"""
+    return str(Path(path).resolve())
+
+
+class RawRecordCache:
+    """Memory-mapped store of normalized raw records"""
+
+    def __init__(self, path=DEFAULT_CACHE, writable=True):
+        self.path = Path(path)
+        self.writable = writable
+        self.index = {}
+        self.pending = {}
+        self.hits = 0
+        self.misses = 0
+        self._file = None
+        self._map = None
+        self._stamp = None
+        self._open()
+
+    def _open(self):
+        if not self.path.exists():
+            return
+        try:
+            stat = os.stat(self.path)
+            self._stamp = (stat.st_mtime_ns, stat.st_size)
+            self._file = open(self.path, 'rb')
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if self._map[:len(MAGIC)] != MAGIC:
+                raise ValueError("bad magic")
+            (index_offset,) = HEADER.unpack_from(self._map, len(MAGIC))
+            self.index = marshal.loads(self._map[index_offset:])
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable raw cache {self.path}: {e}")
+            self.close()
+            self.index = {}
+
+    def close(self):
+        """Release the memory map"""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def refresh(self):
+        """Reopen the store if another process has rewritten it"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return
+        if (stat.st_mtime_ns, stat.st_size) != self._stamp:
+            self.close()
+            self.index = {}
+            self._open()
+
+    def stale(self, paths):
+        """The paths whose cached record is missing or out of date"""
+        result = []
+        for path in paths:
+            entry = self.index.get(cache_key(path))
+            if entry is not None:
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    stat = None
+                if stat is not None and stat.st_mtime_ns == entry[2] and stat.st_size == entry[3]:
+                    continue
+            result.append(path)
+        return result
+
+    def get(self, path):
+        """Cached record for path, or None if missing or stale"""
+        key = cache_key(path)
+        pending = self.pending.get(key)
+        entry = self.index.get(key) if self._map is not None else None
+        if pending is not None or entry is not None:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                stat = None
+            if stat is not None:
+                current = (stat.st_mtime_ns, stat.st_size)
+                if pending is not None and pending[:2] == current:
+                    self.hits += 1
+                    return marshal.loads(pending[2])
+                if entry is not None and entry[2:] == current:
+                    offset, length = entry[:2]
+                    self.hits += 1
+                    return marshal.loads(self._map[offset:offset + length])
+
+        self.misses += 1
+        return None
+
+    def put(self, path, record):
+        """Queue a freshly parsed record for the next save"""
+        if not self.writable:
+            return
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+        self.pending[cache_key(path)] = (stat.st_mtime_ns, stat.st_size, marshal.dumps(record))
+
+    def add(self, entries):
+        """Queue (path, mtime_ns, size, blob) entries made by parse_records"""
+        if not self.writable:
+            return
+        for path, mtime_ns, size, blob in entries:
+            self.pending[path] = (mtime_ns, size, blob)
+
+    def save(self):
+        """Rewrite the store with existing plus pending records"""
+        if not self.writable or not self.pending:
+            return
+        self.compact()
+
+    def flush(self):
+        """Append pending records to the store in place.
+
+        Existing records keep their offsets, so processes that still have
+        the store mapped keep reading valid data and pick up the new index
+        on refresh(). The header is written last, so an interrupted flush
+        leaves the previous index in effect. Replaced records and old
+        indexes stay in the file until the next save() or compact().
+        """
+        if not self.writable or not self.pending:
+            return
+        if self._map is None:
+            self.compact()
+            return
+
+        index = dict(self.index)
+        self.close()
+        with open(self.path, 'r+b') as f:
+            offset = f.seek(0, os.SEEK_END)
+            for key, (mtime_ns, size, blob) in self.pending.items():
+                f.write(blob)
+                index[key] = (offset, len(blob), mtime_ns, size)
+                offset += len(blob)
+            f.write(marshal.dumps(index))
+            f.flush()
+            f.seek(len(MAGIC))
+            f.write(HEADER.pack(offset))
+
+        self.pending = {}
+        self._open()
+
+    def compact(self):
+        """Rewrite the store with only live records"""
+        if not self.writable:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        index = {}
+        with open(tmp_path, 'wb') as f:
+            f.write(MAGIC)
+            f.write(HEADER.pack(0))
+            offset = len(MAGIC) + HEADER.size
+
+            # Carry over records that were not replaced
+            for key, (old_offset, length, mtime_ns, size) in self.index.items():
+                if key in self.pending or self._map is None:
+                    continue
+                f.write(self._map[old_offset:old_offset + length])
+                index[key] = (offset, length, mtime_ns, size)
+                offset += length
+
+            for key, (mtime_ns, size, blob) in self.pending.items():
+                f.write(blob)
+                index[key] = (offset, len(blob), mtime_ns, size)
+                offset += len(blob)
+
+            f.write(marshal.dumps(index))
+            f.seek(len(MAGIC))
+            f.write(HEADER.pack(offset))
+
+        self.close()
+        os.replace(tmp_path, self.path)
+        self.pending = {}
+        self._open()
+
+
+def parse_records(paths):
+    """Parse raw files into (path, mtime_ns, size, blob) cache entries.
+
+    Runs in worker processes; the parent adds the entries to its cache, so
+    only one process ever writes the store.
+    """
+    entries = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            record = raw_loader.read_json(path, raw_loader.RECORD_FIELDS)
+        except Exception as e:
+            print(f"Error parsing {path}: {e}")
+            continue
+        entries.append((cache_key(path), stat.st_mtime_ns, stat.st_size, marshal.dumps(record)))
+    return entries
+
+
+def enable(path=None, writable=True):
+    """Open a cache and make raw_loader read through it"""
+    cache = RawRecordCache(path or DEFAULT_CACHE, writable)
+    raw_loader.use_cache(cache)
+    return cache
+
+
+def disable(cache):
+    """Stop reading through cache and persist anything it parsed"""
+    raw_loader.use_cache(None)
+    cache.save()
+    cache.close()
+
+
+def cache_arg(arg):
+    """Cache path for a --cache or --cache=<path> argument, else None"""
+    if arg == '--cache':
+        return DEFAULT_CACHE
+    if arg.startswith('--cache='):
+        return Path(arg.split('=', 1)[1])
+    return None
+
+
+def build_cache(raw_dirs, cache_path=DEFAULT_CACHE):
+    """Cache stage: preparse every raw JSON under raw_dirs"""
+    cache = enable(cache_path)
+    count = 0
+    for raw_dir in raw_dirs:
+        for json_file in sorted(Path(raw_dir).rglob("*.json")):
+            try:
+                raw_loader.load_record(json_file)
+                count += 1
+            except Exception as e:
+                print(f"Error parsing {json_file}: {e}")
+    disable(cache)
+    print(f"Cached {count} records ({cache.misses} parsed, {cache.hits} already current)")
+    print(f"Cache: {cache.path}")
+    return cache
+
+
+def main():
+    cache_path = DEFAULT_CACHE
+    raw_dirs = []
+    for arg in sys.argv[1:]:
+        if cache_arg(arg):
+            cache_path = cache_arg(arg)
+        elif not arg.startswith('--'):
+            raw_dirs.append(arg)
+
+    if not raw_dirs:
+        print(__doc__)
+        sys.exit(1)
+
+    build_cache(raw_dirs, cache_path)
+
+
+if __name__ == "__main__":
+    main()
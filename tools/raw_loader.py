@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Raw Data Loader
+Projected JSON loading for the raw power dumps
+
+A raw power file carries ~130 top-level keys plus large fx and message
+blobs, while the converters read about 20 of them. Each converter declares
+the fields it needs as a projection; records are cut down to that shape
+right after parsing so the unused subtrees are freed file by file.
+
+Uses orjson when it is installed and falls back to the stdlib json module.
+When a raw_cache.RawRecordCache is active (see use_cache), files are read
+from the preparsed store as RECORD_FIELDS records and projected from there.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON_BACKEND = 'orjson' if orjson else 'json'
+
+# Active RawRecordCache, or None to always parse
+_CACHE = None
+
+
+def fields(*names, **nested):
+    """Build a projection: plain names keep the whole value, keywords recurse
+
+    Example: fields('display_name', effects=fields(templates=fields('scale')))
+    """
+    projection = dict.fromkeys(names)
+    projection.update(nested)
+    return projection
+
+
+def project(obj, projection):
+    """Return obj reduced to the fields named in projection.
+
+    A projection maps field name -> None (keep as is) or a nested projection,
+    which is applied to a dict value or to every dict in a list value.
+    """
+    if projection is None:
+        return obj
+    if isinstance(obj, list):
+        return [project(item, projection) for item in obj]
+    if not isinstance(obj, dict):
+        return obj
+
+    result = {}
+    for key, sub in projection.items():
+        if key in obj:
+            value = obj[key]
+            result[key] = value if sub is None else project(value, sub)
+    return result
+
+
+# Union of every converter's projection; the shape records are cached in.
+# A projection that asks for more than this bypasses the cache.
+RECORD_FIELDS = fields(
+    'name', 'display_name', 'display_help', 'display_short_help', 'icon', 'type',
+    'requires', 'available_level', 'max_boosts', 'boosts_allowed', 'allowed_boostset_cats',
+    'target_type', 'effect_area', 'max_targets_hit', 'radius', 'arc', 'accuracy', 'range',
+    'recharge_time', 'endurance_cost', 'activation_time', 'archetypes',
+    'power_names', 'power_display_names', 'power_short_helps', 'full_name',
+    effects=fields('chance', 'ppm', 'tags',
+                   templates=fields('attribs', 'aspect', 'target', 'table', 'scale', 'duration',
+                                    'magnitude', 'type', 'stack', 'application_period', 'flags',
+                                    'params', 'application_type'),
+                   child_effects=fields('chance', 'ppm', 'tags',
+                                        templates=fields('attribs', 'aspect', 'target', 'table', 'scale',
+                                                         'duration', 'magnitude', 'application_period',
+                                                         'flags', 'params', 'application_type')))
+)
+
+
+def covers(outer, inner):
+    """True if every field kept by projection inner is kept by outer"""
+    if outer is None:
+        return True
+    if inner is None:
+        return False
+    for key, sub in inner.items():
+        if key not in outer or not covers(outer[key], sub):
+            return False
+    return True
+
+
+def use_cache(cache):
+    """Route load_json through a RawRecordCache (None to disable)"""
+    global _CACHE
+    _CACHE = cache
+
+
+def active_cache():
+    """The RawRecordCache load_json reads through, or None"""
+    return _CACHE
+
+
+def parse_json(data):
+    """Parse JSON bytes with the fastest available backend"""
+    if data[:3] == b'\xef\xbb\xbf':
+        data = data[3:]
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json(path, projection=None):
+    """Parse a JSON file from disk, keeping only the projected fields"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return project(parse_json(data), projection)
+
+
+def load_record(path):
+    """RECORD_FIELDS record for path, from the active cache when possible"""
+    record = _CACHE.get(path)
+    if record is None:
+        record = read_json(path, RECORD_FIELDS)
+        _CACHE.put(path, record)
+    return record
+
+
+def load_json(path, projection=None):
+    """Load a JSON file, keeping only the projected fields"""
+    if _CACHE is None or not covers(RECORD_FIELDS, projection):
+        return read_json(path, projection)
+    return project(load_record(path), projection)
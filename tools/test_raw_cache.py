@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Raw record cache tests
+
+Run from tools/: python -m pytest -q test_raw_cache.py
+"""
+import json
+import os
+
+import raw_cache
+
+
+def write_power(path, display_name, mtime_ns=None):
+    path.write_text(json.dumps({'full_name': 'Test.Set.Power', 'display_name': display_name}),
+                    encoding='utf-8')
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_pending_record_goes_stale_when_file_changes(tmp_path):
+    path = tmp_path / "power.json"
+    write_power(path, "Old", 1_000_000_000)
+    cache = raw_cache.RawRecordCache(tmp_path / "rc.bin")
+    cache.put(path, {'display_name': "Old"})
+    assert cache.get(path) == {'display_name': "Old"}
+
+    write_power(path, "Renamed", 2_000_000_000)
+    assert cache.get(path) is None
+
+
+def test_stored_record_goes_stale_when_file_changes(tmp_path):
+    path = tmp_path / "power.json"
+    write_power(path, "Old", 1_000_000_000)
+    cache = raw_cache.RawRecordCache(tmp_path / "rc.bin")
+    cache.add(raw_cache.parse_records([path]))
+    cache.save()
+
+    cache = raw_cache.RawRecordCache(tmp_path / "rc.bin")
+    assert cache.get(path)['display_name'] == "Old"
+    write_power(path, "Renamed", 2_000_000_000)
+    assert cache.get(path) is None
+
+
+def test_missing_file_is_a_miss(tmp_path):
+    path = tmp_path / "power.json"
+    write_power(path, "Old")
+    cache = raw_cache.RawRecordCache(tmp_path / "rc.bin")
+    cache.put(path, {'display_name': "Old"})
+    path.unlink()
+    assert cache.get(path) is None
+    assert cache.stale([path]) == [path]
+
+
+def test_relative_and_absolute_paths_share_an_entry(tmp_path, monkeypatch):
+    path = tmp_path / "power.json"
+    write_power(path, "Old")
+    cache = raw_cache.RawRecordCache(tmp_path / "rc.bin")
+    cache.put(path, {'display_name': "Old"})
+    monkeypatch.chdir(tmp_path)
+    assert cache.get("power.json") == {'display_name': "Old"}
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Watch mode tests
+
+Run from tools/: python -m pytest -q test_watch.py
+"""
+import json
+import os
+
+import pytest
+
+import convert_powerset
+import generate_synthetic_data
+import raw_cache
+from watch import PollWatcher
+
+
+@pytest.fixture
+def synthetic_tree(tmp_path):
+    generate_synthetic_data.generate(tmp_path / "raw", powers=20, workers=1)
+    return tmp_path / "raw"
+
+
+def capture_watch(monkeypatch):
+    """Replace watch() with a stub that records its arguments instead of polling"""
+    captured = {}
+
+    def fake_watch(paths, on_change, pattern="*.json", interval=None, list_files=None):
+        captured.update(paths=paths, on_change=on_change, pattern=pattern, list_files=list_files)
+    monkeypatch.setattr(convert_powerset, 'watch', fake_watch)
+    return captured
+
+
+def rename_power(path, display_name):
+    """Rewrite a power file with a new display name and a later mtime"""
+    record = json.loads(path.read_text(encoding='utf-8'))
+    record['display_name'] = display_name
+    stat = path.stat()
+    path.write_text(json.dumps(record), encoding='utf-8')
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.mark.parametrize('cached', [False, True])
+def test_watch_rebuild_writes_edited_power(synthetic_tree, tmp_path, monkeypatch, cached):
+    powerset_dir = synthetic_tree / "powers" / "tanker_defense" / "synthetic_000000"
+    output_file = tmp_path / "out.js"
+    captured = capture_watch(monkeypatch)
+    cache = raw_cache.enable(tmp_path / "rc.bin") if cached else None
+    try:
+        convert_powerset.watch_powerset(powerset_dir, output_file, 'Class_Tanker',
+                                        tables_dir=synthetic_tree / "tables")
+        assert 'name: "Synthetic 000000 Power 2"' in output_file.read_text(encoding='utf-8')
+
+        watcher = PollWatcher(captured['paths'], captured['pattern'], captured['list_files'])
+        edited = powerset_dir / "synthetic_000000_power_2.json"
+        rename_power(edited, "Renamed Power")
+        changed, removed = watcher.poll()
+        assert changed == [edited] and removed == []
+
+        captured['on_change'](changed, removed)
+        text = output_file.read_text(encoding='utf-8')
+        assert 'name: "Renamed Power"' in text
+        assert 'name: "Synthetic 000000 Power 2"' not in text
+    finally:
+        if cache is not None:
+            raw_cache.disable(cache)
+
+
+def test_watcher_ignores_subdirectories(synthetic_tree):
+    powerset_dir = synthetic_tree / "powers" / "tanker_defense" / "synthetic_000000"
+    watcher = PollWatcher([powerset_dir], list_files=convert_powerset.powerset_files)
+    (powerset_dir / "notes").mkdir()
+    (powerset_dir / "notes" / "draft.json").write_text("{}", encoding='utf-8')
+    assert watcher.poll() == ([], [])
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Polling File Watcher
+Drives the converters' --watch modes
+
+Polls raw data and table files by (mtime, size) and hands the changed and
+removed paths to a rebuild callback. Polling is plain stat calls, so it
+behaves the same on Windows, network drives and editors that save by
+renaming, and a powerset directory is rescanned in well under a
+millisecond.
+
+A watched directory is listed the way the converters read it: its own
+files matching the pattern, not subdirectories, unless the caller passes
+the converter's own listing.
+"""
+import time
+import traceback
+from pathlib import Path
+
+# Seconds between polls
+POLL_INTERVAL = 0.2
+
+
+class PollWatcher:
+    """Snapshot of watched files, diffed on each poll"""
+
+    def __init__(self, paths, pattern="*.json", list_files=None):
+        self.paths = [Path(p) for p in paths if p]
+        self.list_files = list_files or (lambda directory: directory.glob(pattern))
+        self.snapshot = self.scan()
+
+    def scan(self):
+        """Map every watched file to its (mtime_ns, size)"""
+        snapshot = {}
+        for path in self.paths:
+            if path.is_dir():
+                files = self.list_files(path)
+            elif path.exists():
+                files = [path]
+            else:
+                continue
+            for f in files:
+                try:
+                    stat = f.stat()
+                except OSError:
+                    # Deleted between listing and stat
+                    continue
+                snapshot[f] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def poll(self):
+        """Return (changed, removed) paths since the previous poll"""
+        current = self.scan()
+        changed = sorted(p for p, stamp in current.items() if self.snapshot.get(p) != stamp)
+        removed = sorted(p for p in self.snapshot if p not in current)
+        self.snapshot = current
+        return changed, removed
+
+
+def watch(paths, on_change, pattern="*.json", interval=POLL_INTERVAL, list_files=None):
+    """Call on_change(changed, removed) whenever watched files change.
+
+    list_files(directory) overrides how watched directories are listed.
+    Runs until interrupted. Errors raised by on_change are printed and the
+    watch continues, so a half-saved file does not end the session.
+    """
+    watcher = PollWatcher(paths, pattern, list_files)
+    print(f"Watching {len(watcher.snapshot)} files (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(interval)
+            changed, removed = watcher.poll()
+            if not changed and not removed:
+                continue
+            started = time.perf_counter()
+            try:
+                on_change(changed, removed)
+            except Exception:
+                traceback.print_exc()
+                continue
+            elapsed = (time.perf_counter() - started) * 1000
+            print(f"Rebuilt {len(changed)} changed, {len(removed)} removed in {elapsed:.0f} ms")
+    except KeyboardInterrupt:
+        print("\nStopped watching")